@@ -0,0 +1,46 @@
+import os
+import zipfile
+
+# 打包的资源：包内名称 -> 源文件（相对于项目根目录）
+ASSETS = {
+    "icon.ico": "icon.ico",
+    "startup.png": "backupsrc/startup.png",
+    "cp2.png": "backupsrc/cp2.png",
+}
+
+# 固定的文件时间，使相同的资源生成完全相同的资源包
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def build_resource_pack(root, output_file):
+    """
+    将资源文件打包为不压缩的zip资源包（func/assets.py按需读取）
+    
+    Args:
+        root: 项目根目录
+        output_file: 输出资源包路径
+    """
+    try:
+        output_dir = os.path.dirname(output_file)
+        # 如果输出目录不是空字符串，则创建目录
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        # 图片本身已经压缩，资源包不再压缩，读取时无需解压
+        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_STORED) as pack:
+            for name, source in sorted(ASSETS.items()):
+                with open(os.path.join(root, source), "rb") as f:
+                    data = f.read()
+                pack.writestr(zipfile.ZipInfo(name, FIXED_DATE_TIME), data)
+                print(f"  {name}: {len(data)} bytes")
+        
+        print(f"Successfully built {output_file}")
+    
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    # 生成func/resources.pack
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    build_resource_pack(project_root, os.path.join(project_root, "func", "resources.pack"))
@@ -0,0 +1,903 @@
+import asyncio
+import math
+import os
+import random
+import sys
+import threading
+import time
+import timeit
+import tracemalloc
+
+from func.core import parse_heart_rate_measurement, HeartRateMonitorTask
+from func.session_store import SessionStore
+from func.sources import HeartRateSample
+
+
+def _legacy_parse(data):
+    """旧版解析方式：十六进制字符串分割（仅适用于标志位为0x06的数据）"""
+    return int(data.hex().split('06')[1], 16)
+
+
+def bench_notification_decode(number=200000):
+    """心率通知解析耗时对比"""
+    payloads = {
+        "uint8": bytearray(b"\x06\x48"),
+        "uint16+energy+rr": bytearray(b"\x19\x48\x00\x10\x00\x00\x04\x10\x04"),
+    }
+    print("== 心率通知解析 ==")
+    for name, data in payloads.items():
+        cost = timeit.timeit(lambda: parse_heart_rate_measurement(data), number=number)
+        print(f"  struct解析 [{name}]: {cost / number * 1e9:.0f} ns/次")
+    legacy = payloads["uint8"]
+    cost = timeit.timeit(lambda: _legacy_parse(legacy), number=number)
+    print(f"  hex分割   [uint8]: {cost / number * 1e9:.0f} ns/次")
+
+
+def bench_multi_device(device_count=16, rate_hz=4.0, duration=5.0):
+    """
+    多设备压力测试：在真实的BLE服务线程（BleServiceThread）事件循环中模拟多个设备的心率通知，
+    样本经跨线程的排队连接送达GUI线程；延迟从收到通知（解析之前）计算到GUI线程的槽函数开始执行
+    """
+    app = _qt_app()
+    from PyQt5.QtCore import QObject, QEventLoop, QTimer, Qt, pyqtSlot
+    from func.core import BleServiceThread
+    
+    class Receiver(QObject):
+        """GUI线程中的样本接收方（与主窗口接收样本的方式相同）"""
+        
+        def __init__(self):
+            super().__init__()
+            self.latencies = []
+        
+        @pyqtSlot(object)
+        def on_sample(self, sample):
+            self.latencies.append(sample.latency_ns() / 1e9)
+    
+    service = BleServiceThread()
+    service.start()
+    receiver = Receiver()
+    tasks = [HeartRateMonitorTask(service, f"SIM:{i:02d}") for i in range(device_count)]
+    for task in tasks:
+        task.sample_received.connect(receiver.on_sample, Qt.QueuedConnection)
+    
+    async def simulate(task, index):
+        # 错开各设备的起始相位
+        await asyncio.sleep(index / device_count / rate_hz)
+        payload = bytearray(b"\x16\x48\x00\x04")
+        end = time.perf_counter() + duration
+        while time.perf_counter() < end:
+            await asyncio.sleep(1 / rate_hz)
+            task._handle_notification(payload)
+    
+    async def run_all():
+        await asyncio.gather(*(simulate(task, i) for i, task in enumerate(tasks)))
+    
+    # GUI线程运行事件循环处理送达的样本，直到服务线程中的模拟结束且队列处理完毕
+    loop = QEventLoop()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    future = service.submit(run_all())
+    future.add_done_callback(lambda _: QTimer.singleShot(0, loop.quit))
+    loop.exec_()
+    app.processEvents()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    future.result()
+    service.shutdown()
+    
+    latencies = sorted(receiver.latencies)
+    print(f"== 多设备压力测试（{device_count}个设备，{rate_hz:g} Hz，BLE服务线程 -> GUI线程）==")
+    print(f"  通知总数: {len(latencies)}")
+    print(f"  CPU占用（进程，两个线程合计）: {cpu / wall * 100:.2f}%")
+    print(f"  通知到GUI线程的延迟 p50: {latencies[len(latencies) // 2] * 1e6:.1f} us, "
+          f"p99: {latencies[int(len(latencies) * 0.99)] * 1e6:.1f} us, 最长 {latencies[-1] * 1e6:.1f} us")
+
+
+def bench_session_store(hours=1.0, rate_hz=1.0):
+    """会话存储内存占用：类型数组列存储 vs 原先各图表各自保存的Python列表"""
+    count = int(hours * 3600 * rate_hz)
+    rng = random.Random(0)
+    samples = [HeartRateSample.now("SIM", i, rng.randint(50, 180), (rng.randint(400, 1200),))
+               for i in range(count)]
+    
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    store = SessionStore()
+    for sample in samples:
+        store.append(sample)
+    store_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    
+    # 原先的做法：趋势图历史列表 + 点值副本 + 时间戳（每个样本一个float）
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    history, point_values, timestamps = [], [], []
+    for sample in samples:
+        history.append(sample.bpm)
+        point_values.append(sample.bpm)
+        timestamps.append(float(sample.recv_ns))
+    list_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    
+    print(f"== 会话存储（{hours:g} 小时，{rate_hz:g} Hz，{count} 个样本）==")
+    print(f"  类型数组: {store_bytes / count:.1f} 字节/样本（含RR间期）")
+    print(f"  Python列表: {list_bytes / count:.1f} 字节/样本（不含RR间期和QPoint）")
+
+
+_app = None
+
+
+def _qt_app():
+    """
+    创建（或获取）用于图表基准测试的QApplication，无显示环境时使用offscreen平台
+    应用对象在进程内保持存活：销毁后共享帧时钟等无父对象的QObject也会随之失效
+    """
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    if _app is None:
+        _app = QApplication.instance() or QApplication(sys.argv[:1])
+    return _app
+
+
+def _refresh_callback(chart):
+    """图表在帧时钟上订阅的刷新回调：动态折线图由其数据模型刷新"""
+    model = getattr(chart, "model", None)
+    return model.refresh if model is not None else chart.draw_chart
+
+
+def _step(chart):
+    """刷新一次图表；动态折线图按模拟时间前进一个时间片，不依赖真实时间的流逝"""
+    model = getattr(chart, "model", None)
+    if model is not None:
+        model.refresh((model.last_column + 2) * model.COLUMN_NS)
+    else:
+        chart.draw_chart()
+
+
+def _legacy_shift(points, values, value):
+    """旧版滚动方式：逐个QPoint前移一位"""
+    for i in range(len(points) - 1):
+        points[i].setY(points[i + 1].y())
+        values[i] = values[i + 1]
+    points[-1].setY(value)
+    values[-1] = value
+
+
+def bench_chart_tick(widths=(400, 3840), number=2000):
+    """动态折线图每次滚动（tick）的耗时：环形缓冲区 vs 逐点前移"""
+    app = _qt_app()
+    from PyQt5.QtCore import QPoint
+    from func.interfaces.heart_rate_interface.dynamic_line_chart import DynamicLineChart
+    
+    print("== 动态折线图滚动耗时 ==")
+    for width in widths:
+        store = SessionStore()
+        chart = DynamicLineChart(store=store)
+        chart.frame_clock.unsubscribe(chart.model.refresh)
+        chart.resize(width, 200)
+        for i in range(number):
+            store.append(HeartRateSample.now("SIM", i, 60 + i % 40))
+        
+        cost = timeit.timeit(lambda: _step(chart), number=number)
+        points = [QPoint(x, 200) for x in range(width + 1)]
+        values = [0] * (width + 1)
+        legacy = timeit.timeit(lambda: _legacy_shift(points, values, 100), number=number // 10) * 10
+        print(f"  宽度 {width:>4} px: 环形缓冲区 {cost / number * 1e6:.1f} us/次, "
+              f"逐点前移 {legacy / number * 1e6:.1f} us/次")
+        chart.deleteLater()
+    app.processEvents()
+
+
+def _legacy_update_y_range(chart, points, raw_values_count=100):
+    """旧版Y轴范围计算方式：拼接可见点和最近原始值后求最大值，并重新计算所有点的Y坐标"""
+    model = chart.model
+    total = len(model.store)
+    tail_start = max(0, min(model.read_index, total - raw_values_count))
+    values = list(model.ordered_values()) + list(model.store.bpm[tail_start:])
+    max(values)
+    sum(values)
+    for point, value in zip(points, model.ordered_values()):
+        point.setY(model.normalize_value_to_y(value, chart.height()))
+
+
+def bench_y_range(rates=(1, 10, 100), width=400, ticks=1200, measured=200):
+    """动态折线图Y轴范围计算耗时：以2 Hz刷新、不同采样率持续输入（模拟10分钟）"""
+    app = _qt_app()
+    from PyQt5.QtCore import QPoint
+    from func.interfaces.heart_rate_interface.dynamic_line_chart import DynamicLineChart
+    
+    print(f"== 动态折线图Y轴范围计算（宽度 {width} px，2 Hz刷新，最后{measured}次刷新）==")
+    for rate in rates:
+        chart = _prepare_chart(DynamicLineChart, width, 200, count=0)
+        store = chart.store
+        points = [QPoint(x, 200) for x in range(len(chart.model.point_values))]
+        rng = random.Random(0)
+        per_tick = rate / 2
+        pending = 0.0
+        new_cost = legacy_cost = 0.0
+        for tick in range(ticks):
+            pending += per_tick
+            while pending >= 1:
+                pending -= 1
+                store.append(HeartRateSample.now("SIM", len(store), round(90 + 25 * math.sin(len(store) / 120 / rate)
+                                                                         + rng.uniform(-3, 3))))
+            if tick < ticks - measured:
+                _step(chart)
+                continue
+            start = time.perf_counter()
+            _step(chart)
+            new_cost += time.perf_counter() - start
+            start = time.perf_counter()
+            _legacy_update_y_range(chart, points)
+            legacy_cost += time.perf_counter() - start
+        print(f"  {rate:>3} Hz: 滑动窗口 {new_cost / measured * 1e6:.1f} us/次, "
+              f"拼接求最大值并重算所有点 {legacy_cost / measured * 1e6:.1f} us/次")
+        chart.close()
+        chart.deleteLater()
+    app.processEvents()
+
+
+def bench_trend_length(hours=(1, 4, 12), width=400, number=10):
+    """趋势图每次刷新（重新计算坐标+绘制）的耗时随会话长度的变化（1 Hz采样）"""
+    app = _qt_app()
+    from PyQt5.QtGui import QPixmap
+    from func.interfaces.heart_rate_interface.trend_line_chart import TrendLineChart
+    
+    print(f"== 趋势图刷新耗时（宽度 {width} px，1 Hz）==")
+    for hour in hours:
+        count = int(hour * 3600)
+        chart = _prepare_chart(TrendLineChart, width, 200, count=count)
+        target = QPixmap(chart.size())
+        
+        def refresh():
+            chart.draw_chart()
+            chart.render(target)
+        
+        decimated = timeit.timeit(refresh, number=number) / number
+        
+        # 不抽稀：为每个历史样本生成一个点
+        def refresh_full():
+            chart._update_y_range()
+            with chart.store.bpm_view() as all_values:
+                chart._build_points(all_values, len(all_values), width)
+            chart.render(target)
+        
+        full = timeit.timeit(refresh_full, number=number) / number
+        print(f"  {hour:>2} 小时（{count}个样本）: 金字塔抽稀 {decimated * 1e3:.2f} ms "
+              f"（{len(chart.pyramid.decimate(width)) if count > 2 * width else count}点）, "
+              f"全部样本 {full * 1e3:.2f} ms")
+        chart.close()
+        chart.deleteLater()
+    app.processEvents()
+
+
+def bench_tray_idle(duration=600.0, rate_hz=1.0):
+    """隐藏到托盘时的CPU占用：设备已连接，心率界面和独立窗口都已隐藏，持续接收1 Hz心率"""
+    app = _qt_app()
+    from PyQt5.QtCore import QEventLoop, QTimer
+    from func.interfaces.heart_rate_interface import HeartRateInterface
+    from func.interfaces.heart_rate_window import HeartRateWindow
+    from func.render_scheduler import RenderScheduler
+    
+    print(f"== 托盘空闲CPU占用（{duration:g} 秒，{rate_hz:g} Hz）==")
+    for label, scheduled in (("始终刷新", False), ("渲染调度", True)):
+        scheduler = RenderScheduler()
+        scheduler.set_connected(True)
+        store = SessionStore()
+        interface = HeartRateInterface(None, None, store, scheduler)
+        window = HeartRateWindow(None, store, scheduler)
+        for widget in (interface, window):
+            widget.show()
+            app.processEvents()
+            widget.hide()
+        if not scheduled:
+            # 不使用调度：与之前一样，所有图表的定时器始终运行
+            for view in list(scheduler.views):
+                view.removeEventFilter(scheduler)
+                scheduler.views.remove(view)
+                view.resume()
+        
+        def feed():
+            sample = HeartRateSample.now("SIM", len(store), round(75 + 10 * math.sin(len(store) / 60)))
+            store.append(sample)
+            interface.update_heart_rate(sample)
+            window.update_heart_rate(sample)
+        
+        feeder = QTimer()
+        feeder.timeout.connect(feed)
+        feeder.start(int(1000 / rate_hz))
+        loop = QEventLoop()
+        QTimer.singleShot(int(duration * 1000), loop.quit)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        loop.exec_()
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        feeder.stop()
+        print(f"  {label}: CPU {cpu:.2f} 秒（{cpu / wall * 100:.3f}%）")
+        interface.deleteLater()
+        window.deleteLater()
+        app.processEvents()
+
+
+def bench_ingest_latency(rate_hz=50.0, minutes=5.0, width=400, stall_every=60.0, stall=3.0):
+    """
+    高采样率输入时动态折线图的显示延迟（模拟时间）：刷新时刻与最右侧点包含的最新样本之间的时间差
+    以50 Hz持续输入，每隔stall_every秒界面卡顿stall秒，延迟应保持恒定，待显示的样本数不随时间增长
+    """
+    app = _qt_app()
+    from func.interfaces.heart_rate_interface.dynamic_line_chart import DynamicLineChart
+    
+    print(f"== 动态折线图显示延迟（{rate_hz:g} Hz输入，模拟 {minutes:g} 分钟，每 {stall_every:g} 秒卡顿 {stall:g} 秒）==")
+    chart = _prepare_chart(DynamicLineChart, width, 200, count=0)
+    model = chart.model
+    store = chart.store
+    rng = random.Random(0)
+    sample_period = round(1e9 / rate_hz)
+    ticks_per_stall = round(stall_every / model.REFRESH_INTERVAL)
+    stalled_ticks = round(stall / model.REFRESH_INTERVAL)
+    
+    boundary = (model.last_column + 1) * model.COLUMN_NS
+    next_sample = boundary
+    legacy_index = 0  # 旧版：每次刷新从队列中取出一个样本
+    latencies = []
+    report_ticks = {round(seconds / model.REFRESH_INTERVAL) for seconds in (10, 60, minutes * 60)}
+    for tick in range(1, round(minutes * 60 / model.REFRESH_INTERVAL) + 1):
+        # 帧时钟在时间片边界之后的几毫秒内刷新
+        boundary += model.COLUMN_NS
+        now = boundary + rng.randrange(5_000_000)
+        while next_sample < now:
+            bpm = round(90 + 25 * math.sin(len(store) / 120 / rate_hz) + rng.uniform(-3, 3))
+            store.append(HeartRateSample(next_sample, time.time(), len(store), "SIM", bpm))
+            next_sample += sample_period
+        if tick % ticks_per_stall >= ticks_per_stall - stalled_ticks:
+            # 界面卡顿，本次不刷新
+            continue
+        
+        model.refresh(now)
+        legacy_index = min(legacy_index + 1, len(store))
+        latency = now - store.timestamps[model.read_index - 1]
+        latencies.append(latency)
+        if tick in report_ticks:
+            legacy_latency = now - store.timestamps[legacy_index - 1]
+            print(f"  {tick * model.REFRESH_INTERVAL:>5g} 秒: 时间轴 延迟 {latency / 1e6:.1f} ms, "
+                  f"待显示 {len(store) - model.read_index} 个样本; "
+                  f"逐个出队 延迟 {legacy_latency / 1e9:.1f} 秒, 待显示 {len(store) - legacy_index} 个样本")
+    
+    spread = max(latencies) - min(latencies)
+    print(f"  延迟范围 {min(latencies) / 1e6:.1f} ~ {max(latencies) / 1e6:.1f} ms")
+    assert spread <= model.COLUMN_NS, f"显示延迟不恒定（波动 {spread / 1e6:.1f} ms）"
+    chart.close()
+    chart.deleteLater()
+    app.processEvents()
+
+
+def _legacy_draw_grid(painter, width, height, grid_space=10, x_offset=0):
+    """旧版网格绘制方式：每帧填充背景并逐条绘制所有网格线"""
+    from PyQt5.QtGui import QColor, QPen
+    painter.fillRect(0, 0, width, height, QColor(255, 255, 255))
+    painter.setPen(QPen(QColor(220, 220, 220)))
+    for i in range(width // grid_space + 2):
+        x_pos = grid_space * i - x_offset
+        painter.drawLine(x_pos, 0, x_pos, height)
+    for i in range(height // grid_space + 1):
+        painter.drawLine(0, grid_space * i, width, grid_space * i)
+
+
+def _prepare_chart(chart_class, width, height, count=4000):
+    """创建指定尺寸并填充了数据的图表"""
+    from PyQt5.QtCore import Qt
+    store = SessionStore()
+    chart = chart_class(store=store)
+    chart.frame_clock.unsubscribe(_refresh_callback(chart))
+    chart.resize(width, height)
+    chart.setAttribute(Qt.WA_DontShowOnScreen, True)
+    chart.show()
+    rng = random.Random(0)
+    for i in range(count):
+        # 缓慢波动的心率加少量抖动
+        bpm = round(90 + 25 * math.sin(i / 120) + rng.uniform(-3, 3))
+        store.append(HeartRateSample.now("SIM", i, bpm))
+        if hasattr(chart, "draw_chart") or hasattr(chart, "model"):
+            _step(chart)
+    return chart
+
+
+def _frame_time(chart, number):
+    """将图表完整绘制到离屏图像上，返回每帧耗时（秒）"""
+    from PyQt5.QtGui import QPixmap
+    target = QPixmap(chart.size())
+    chart.render(target)
+    return timeit.timeit(lambda: chart.render(target), number=number) / number
+
+
+def _legacy_draw_line(painter, points, width, height):
+    """旧版折线绘制方式：逐点构建填充路径并逐段调用drawLine"""
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QBrush, QColor, QPainterPath, QPen
+    fill_path = QPainterPath()
+    fill_path.moveTo(points[0])
+    for i in range(1, len(points)):
+        fill_path.lineTo(points[i])
+    fill_path.lineTo(width, height)
+    fill_path.lineTo(0, height)
+    fill_path.closeSubpath()
+    painter.setBrush(QBrush(QColor(255, 143, 143, 50)))
+    painter.setPen(Qt.NoPen)
+    painter.drawPath(fill_path)
+    painter.setPen(QPen(QColor(220, 9, 9)))
+    for i in range(len(points) - 1):
+        painter.drawLine(points[i], points[i + 1])
+
+
+def bench_chart_paint(sizes=((400, 200), (3840, 600)), number=20):
+    """折线图每帧绘制耗时：折线（批量绘制 vs 逐段绘制）和网格（缓存贴图 vs 逐条绘制）"""
+    app = _qt_app()
+    from PyQt5.QtCore import QPoint
+    from PyQt5.QtGui import QPainter, QPixmap
+    from func.interfaces.heart_rate_interface.dynamic_line_chart import DynamicLineChart
+    from func.interfaces.heart_rate_interface.trend_line_chart import TrendLineChart
+    from func.interfaces.heart_rate_interface.polyline import draw_filled_polyline, polygon_from_coordinates
+    
+    print("== 折线图绘制耗时 ==")
+    for width, height in sizes:
+        for chart_class in (DynamicLineChart, TrendLineChart):
+            chart = _prepare_chart(chart_class, width, height)
+            _step(chart)
+            frame = _frame_time(chart, number)
+            
+            target = QPixmap(width, height)
+            painter = QPainter(target)
+            painter.setRenderHint(QPainter.Antialiasing)
+            coordinates = chart.snapshot().coordinates
+            batched = timeit.timeit(lambda: draw_filled_polyline(painter, coordinates, width, height),
+                                    number=number) / number
+            points = [QPoint(point) for point in polygon_from_coordinates(coordinates)]
+            legacy = timeit.timeit(lambda: _legacy_draw_line(painter, points, width, height),
+                                   number=number) / number
+            print(f"  {chart_class.__name__} {width}x{height}（{len(points)}点）: 整帧 {frame * 1e3:.2f} ms, "
+                  f"折线批量绘制 {batched * 1e3:.2f} ms, 逐段绘制 {legacy * 1e3:.2f} ms")
+            
+            if chart_class is DynamicLineChart:
+                layer = chart._grid_layer(width, height)
+                cached = timeit.timeit(lambda: painter.drawImage(-3, 0, layer), number=number) / number
+                legacy = timeit.timeit(lambda: _legacy_draw_grid(painter, width, height, x_offset=3),
+                                       number=number) / number
+                print(f"    网格缓存贴图 {cached * 1e3:.3f} ms, 逐条绘制网格 {legacy * 1e3:.3f} ms")
+            painter.end()
+            chart.close()
+            chart.deleteLater()
+    app.processEvents()
+
+
+def _legacy_paint_gauge(gauge):
+    """旧版仪表盘绘制方式：每帧重新创建画笔、渐变、字体和箭头路径并绘制所有图层"""
+    from PyQt5.QtCore import Qt, QPoint
+    from PyQt5.QtGui import QPainter, QPen, QColor, QFont, QBrush, QLinearGradient, QPainterPath
+    painter = QPainter(gauge)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.HighQualityAntialiasing)
+    width, height = gauge.width(), gauge.height()
+    center_x, center_y = width // 2, height // 2
+    radius = min(center_x, center_y) - 30
+    background_pen = QPen(QColor(230, 230, 230))
+    background_pen.setWidth(18)
+    background_pen.setCapStyle(Qt.RoundCap)
+    painter.setPen(background_pen)
+    diameter = min(width, height) - 60
+    x = (width - diameter) // 2
+    y = (height - diameter) // 2 + 30
+    painter.drawArc(x, y, diameter, diameter, 180 * 16, -180 * 16)
+    angle = -int((gauge.animated_value / (gauge.max_value - gauge.min_value)) * 180 * 16)
+    gradient = QLinearGradient(x, y, x + diameter, y)
+    gradient.setColorAt(0.0, QColor(0, 180, 255))
+    gradient.setColorAt(0.5, QColor(255, 255, 0))
+    gradient.setColorAt(1.0, QColor(255, 80, 80))
+    painter.setPen(QPen(gradient, 18, Qt.SolidLine, Qt.RoundCap))
+    painter.drawArc(x, y, diameter, diameter, 180 * 16, angle)
+    painter.setPen(QColor(32, 32, 32))
+    painter.setFont(QFont("Segoe UI", 30, QFont.Bold))
+    value_text = str(int(gauge.animated_value))
+    text_rect = painter.boundingRect(0, 0, width, height, Qt.AlignCenter, value_text)
+    painter.drawText(0, 0, width, height, Qt.AlignCenter, value_text)
+    painter.setFont(QFont("Segoe UI", 14, QFont.Medium))
+    painter.setPen(QColor(100, 100, 100))
+    painter.drawText(0, text_rect.bottom() - 5, width, 20, Qt.AlignCenter, "BPM")
+    if gauge.average_value > 0:
+        outer_radius = radius + 20
+        outer_path = QPainterPath()
+        outer_path.moveTo(center_x - outer_radius, center_y + 30)
+        outer_path.arcTo(center_x - outer_radius, center_y + 30 - outer_radius,
+                         outer_radius * 2, outer_radius * 2, 180, -180)
+        value_ratio = gauge.average_value / (gauge.max_value - gauge.min_value)
+        root_point = outer_path.pointAtPercent(value_ratio)
+        root_x, root_y = int(root_point.x()), int(root_point.y())
+        outer_path.pointAtPercent(min(1.0, value_ratio + 0.02))  # 旧版计算但未使用的箭头尖端
+        if 0 < root_x < width and 0 < root_y < height:
+            painter.save()
+            painter.translate(root_x, root_y)
+            painter.rotate(math.atan2(center_y + 30 - root_y, center_x - root_x) * 180 / math.pi + 90)
+            painter.setPen(QPen(QColor(255, 100, 100), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            painter.setBrush(QBrush(QColor(255, 100, 100)))
+            painter.drawPolygon([QPoint(0, -7), QPoint(-7, 7), QPoint(7, 7)])
+            painter.restore()
+    painter.end()
+
+
+def bench_gauge_paint(frames=3000):
+    """仪表盘动画每帧绘制的CPU耗时：静态图层缓存 vs 每帧重建所有绘制资源"""
+    app = _qt_app()
+    from PyQt5.QtGui import QPixmap
+    from func.interfaces.heart_rate_interface.radial_gauge import RadialGauge
+    
+    class LegacyGauge(RadialGauge):
+        def paintEvent(self, event):
+            _legacy_paint_gauge(self)
+    
+    print(f"== 仪表盘动画绘制（{frames} 帧）==")
+    for label, gauge_class in (("每帧重建", LegacyGauge), ("静态图层缓存", RadialGauge)):
+        gauge = gauge_class()
+        gauge.set_average_value(92)
+        target = QPixmap(gauge.size())
+        gauge.render(target)
+        start = time.process_time()
+        for frame in range(frames):
+            # 模拟动画过程中的显示值
+            gauge._animated_value = 60 + 60 * (frame % 30) / 30
+            gauge.render(target)
+        cpu = time.process_time() - start
+        print(f"  {label}: {frames / (cpu * 1000):.2f} 帧/CPU毫秒（{cpu / frames * 1e6:.0f} us/帧）")
+        gauge.deleteLater()
+    app.processEvents()
+
+
+def bench_raster_render(sizes=((400, 200), (3840, 600)), duration=5.0, rate_hz=50.0):
+    """
+    直接绘制 vs 后台栅格渲染：图表和仪表盘由帧时钟驱动实时刷新，另一线程以50 Hz发送信号（模拟心率监测线程），
+    统计GUI线程每帧的绘制耗时、信号送达延迟，以及后台渲染的渲染耗时和排队延迟
+    """
+    app = _qt_app()
+    from PyQt5.QtCore import QEventLoop, QObject, QTimer, Qt, pyqtSignal
+    from func.frame_clock import FrameClock
+    from func.raster_renderer import RasterRenderer
+    from func.interfaces.heart_rate_interface import dynamic_line_chart, trend_line_chart, radial_gauge
+    
+    class Emitter(QObject):
+        sample = pyqtSignal(float)
+    
+    modules = (dynamic_line_chart, trend_line_chart, radial_gauge)
+    original_paint = {module: module.paint_view for module in modules}
+    paint_times = []
+    
+    def timed_paint_view(view):
+        start = time.perf_counter()
+        original_paint[sys.modules[type(view).__module__]](view)
+        paint_times.append(time.perf_counter() - start)
+    
+    print(f"== 直接绘制 vs 后台渲染（每种 {duration:g} 秒，{rate_hz:g} Hz跨线程信号）==")
+    for module in modules:
+        module.paint_view = timed_paint_view
+    clock = FrameClock.shared()
+    try:
+        for width, height in sizes:
+            for label, threaded in (("直接绘制", False), ("后台渲染", True)):
+                renderer = RasterRenderer() if threaded else None
+                clock.set_raster_renderer(renderer)
+                line_chart = _prepare_chart(dynamic_line_chart.DynamicLineChart, width, height, count=0)
+                trend_chart = _prepare_chart(trend_line_chart.TrendLineChart, width, height, count=4000)
+                gauge = radial_gauge.RadialGauge()
+                gauge.setAttribute(Qt.WA_DontShowOnScreen, True)
+                gauge.show()
+                store = line_chart.store
+                clock.subscribe(line_chart.model.refresh, line_chart.model.REFRESH_INTERVAL)
+                clock.subscribe(trend_chart.draw_chart, trend_chart.REFRESH_INTERVAL)
+                
+                delays = []
+                
+                def on_sample(sent_at):
+                    delays.append(time.perf_counter() - sent_at)
+                    store.append(HeartRateSample.now("SIM", len(store), 80 + len(store) % 30))
+                    if len(delays) % 25 == 0:
+                        gauge.set_value(store.bpm[-1])
+                
+                emitter = Emitter()
+                emitter.sample.connect(on_sample)
+                running = True
+                
+                def emit_samples():
+                    while running:
+                        emitter.sample.emit(time.perf_counter())
+                        time.sleep(1 / rate_hz)
+                
+                sender = threading.Thread(target=emit_samples, daemon=True)
+                paint_times.clear()
+                loop = QEventLoop()
+                QTimer.singleShot(int(duration * 1000), loop.quit)
+                sender.start()
+                loop.exec_()
+                running = False
+                sender.join()
+                
+                delays.sort()
+                print(f"  {width}x{height} {label}: GUI线程绘制 {len(paint_times)} 次, "
+                      f"平均 {sum(paint_times) / len(paint_times) * 1e3:.2f} ms, 最长 {max(paint_times) * 1e3:.2f} ms; "
+                      f"信号送达延迟 平均 {sum(delays) / len(delays) * 1e3:.2f} ms, "
+                      f"P99 {delays[int(len(delays) * 0.99)] * 1e3:.2f} ms, 最长 {delays[-1] * 1e3:.2f} ms")
+                if renderer is not None:
+                    stats = renderer.stats.as_dict()
+                    print(f"    后台渲染 {stats['frame_count']} 帧, 渲染耗时 平均 {stats['average_render_time'] * 1e3:.2f} ms, "
+                          f"排队延迟 平均 {stats['average_queue_latency'] * 1e3:.2f} ms, "
+                          f"最长 {stats['max_queue_latency'] * 1e3:.2f} ms, 被替换的快照 {stats['superseded']}")
+                    clock.set_raster_renderer(None)
+                    renderer.shutdown()
+                for chart in (line_chart, trend_chart):
+                    clock.unsubscribe(_refresh_callback(chart))
+                for widget in (line_chart, trend_chart, gauge):
+                    widget.close()
+                    widget.deleteLater()
+                app.processEvents()
+    finally:
+        for module in modules:
+            module.paint_view = original_paint[module]
+
+
+def bench_shared_model(view_sizes=((400, 160), (240, 60), (800, 200)), ticks=600):
+    """
+    多个动态折线图视图的每次刷新耗时：每个视图独立维护滚动状态 vs 共享同一个数据模型
+    共享模型时滚动和Y轴范围只计算一次，每增加一个视图只增加其高度对应的坐标换算和绘制开销
+    """
+    app = _qt_app()
+    from PyQt5.QtCore import Qt
+    from func.interfaces.heart_rate_interface.dynamic_chart_model import DynamicChartModel
+    from func.interfaces.heart_rate_interface.dynamic_line_chart import DynamicLineChart
+    
+    print(f"== 多视图动态折线图刷新耗时（{ticks}次刷新，不含绘制）==")
+    for count in range(1, len(view_sizes) + 1):
+        results = {}
+        for label, shared in (("独立模型", False), ("共享模型", True)):
+            store = SessionStore()
+            model = DynamicChartModel(store) if shared else None
+            views = []
+            for width, height in view_sizes[:count]:
+                view = DynamicLineChart(store=store, model=model)
+                view.resize(width, height)
+                view.setAttribute(Qt.WA_DontShowOnScreen, True)
+                view.show()
+                views.append(view)
+            models = list({id(view.model): view.model for view in views}.values())
+            for item in models:
+                item.frame_clock.unsubscribe(item.refresh)
+            app.processEvents()
+            
+            rng = random.Random(0)
+            start = time.perf_counter()
+            for tick in range(ticks):
+                store.append(HeartRateSample.now("SIM", tick, round(90 + 25 * math.sin(tick / 60) + rng.uniform(-3, 3))))
+                for item in models:
+                    item.refresh((item.last_column + 2) * item.COLUMN_NS)
+                for view in views:
+                    view.snapshot()
+            results[label] = (time.perf_counter() - start) / ticks
+            for view in views:
+                view.close()
+                view.deleteLater()
+            app.processEvents()
+        print(f"  {count} 个视图: " + ", ".join(f"{label} {cost * 1e6:.1f} us/次" for label, cost in results.items()))
+
+
+def _legacy_update_heart_rate(interface, sample):
+    """旧版心率界面更新方式：每个样本对所有页面的标签直接调用setText"""
+    heart_rate = sample.bpm
+    store = interface.session_store
+    interface.line_chart_page.left_label.setText(f"HR  {heart_rate}")
+    interface.line_chart_page.top_right_label.setText(f"{int(interface.line_chart_page.chart.MAX_Y)}")
+    interface.line_chart_page.bottom_right_label.setText("0")
+    interface.big_number_page.current_hr_label.setText(str(heart_rate))
+    avg_hr = store.average_heart_rate
+    interface.big_number_page.average_hr_label.setText(f"平均: {round(avg_hr) if avg_hr > 0 else 0} BPM")
+    interface.big_number_page.minmax_hr_label.setText(f"最高: {store.max_bpm} BPM | 最低: {store.min_bpm} BPM")
+    interface.dashboard_page.dashboard_gauge.set_value(heart_rate)
+    interface.dashboard_page.dashboard_gauge.set_average_value(round(avg_hr) if avg_hr > 0 else 0)
+    interface.trend_chart_page.top_right_label.setText(f"{int(interface.trend_chart_page.trend_chart.MAX_Y)}")
+
+
+def _create_all_pages(interface):
+    """创建心率界面的全部子页面（与之前启动时一次性创建的状态一致），之后回到默认页面"""
+    for name in ("big_number", "dashboard", "trend_chart", "line_chart"):
+        interface._show_page(name)
+
+
+def bench_label_updates(samples=2000, samples_per_frame=(1, 3)):
+    """
+    心率界面每个样本的GUI线程耗时（更新标签、处理由此产生的布局和绘制事件）：
+    逐个setText vs 每帧合并为一次、只更新可见页面、文本不变时跳过setText
+    """
+    app = _qt_app()
+    from func.frame_clock import FrameClock
+    from func.interfaces.heart_rate_interface import HeartRateInterface
+    clock = FrameClock.shared()
+    
+    def end_frame(interface):
+        # 帧边界：执行心率界面订阅的帧回调（代替帧时钟的定时器），再处理布局和绘制事件
+        if clock.is_subscribed(interface._update_visible_pages):
+            interface._update_visible_pages()
+        app.processEvents()
+    
+    print(f"== 心率界面标签更新耗时（{samples} 个样本，离屏平台）==")
+    scenarios = [(f"折线图页面可见，每帧 {count} 个样本", True, count) for count in samples_per_frame]
+    scenarios.append(("隐藏到托盘", False, 1))
+    for name, visible, per_frame in scenarios:
+        results = {}
+        for label, update in (("逐个setText", _legacy_update_heart_rate),
+                              ("每帧合并更新可见页面", HeartRateInterface.update_heart_rate)):
+            store = SessionStore()
+            interface = HeartRateInterface(None, None, store)
+            _create_all_pages(interface)
+            interface.resize(800, 500)
+            interface.show()
+            app.processEvents()
+            if not visible:
+                interface.hide()
+                app.processEvents()
+            rng = random.Random(0)
+            start = time.perf_counter()
+            for i in range(samples):
+                sample = HeartRateSample.now("SIM", i, round(75 + 10 * math.sin(i / 60) + rng.uniform(-2, 2)))
+                store.append(sample)
+                update(interface, sample)
+                if (i + 1) % per_frame == 0:
+                    # 一帧结束
+                    end_frame(interface)
+            results[label] = (time.perf_counter() - start) / samples
+            interface.deleteLater()
+            app.processEvents()
+        print(f"  {name}: " + ", ".join(f"{label} {cost * 1e6:.0f} us/样本" for label, cost in results.items()))
+
+
+def bench_startup(repeat=7):
+    """
+    心率界面和小组件界面的可交互时间（创建、显示并处理完首次绘制）和创建的控件数：
+    首次显示时创建页面和解码图片 vs 启动时全部创建
+    """
+    app = _qt_app()
+    from PyQt5.QtWidgets import QWidget
+    from func.interfaces import HeartRateInterface, WidgetsInterface
+    
+    def start(eager):
+        store = SessionStore()
+        for i in range(600):
+            store.append(HeartRateSample.now("SIM", i, 70 + i % 30))
+        begin = time.perf_counter()
+        window = QWidget()
+        heart_rate_interface = HeartRateInterface(window, None, store)
+        widgets_interface = WidgetsInterface(window)
+        if eager:
+            _create_all_pages(heart_rate_interface)
+            widgets_interface._load_card2_image()
+        heart_rate_interface.resize(500, 400)
+        widgets_interface.hide()
+        window.show()
+        app.processEvents()
+        elapsed = time.perf_counter() - begin
+        widgets = len(window.findChildren(QWidget))
+        window.deleteLater()
+        app.processEvents()
+        return elapsed, widgets
+    
+    print(f"== 界面可交互时间（心率界面+小组件界面，{repeat}次取中位数）==")
+    start(True)  # 预热：导入模块、加载字体和样式
+    results = {False: [], True: []}
+    for _ in range(repeat):
+        for eager in (True, False):
+            results[eager].append(start(eager))
+    for eager, label in ((True, "启动时全部创建"), (False, "首次显示时创建")):
+        times = sorted(elapsed for elapsed, _ in results[eager])
+        print(f"  {label}: {times[len(times) // 2] * 1e3:.1f} ms, 控件 {results[eager][0][1]} 个")
+
+
+def bench_assets(number=1000):
+    """资源包：导入模块、首次读取并解码各资源的耗时，以及之后从进程内缓存获取的耗时"""
+    _qt_app()
+    import importlib
+    
+    print("== 资源包 ==")
+    start = time.perf_counter()
+    assets = importlib.import_module("func.assets")
+    print(f"  导入func.assets: {(time.perf_counter() - start) * 1e3:.2f} ms")
+    for name, load in (("startup.png", assets.read_asset), ("cp2.png", assets.get_pixmap), ("icon.ico", assets.get_icon)):
+        start = time.perf_counter()
+        load(name)
+        first = time.perf_counter() - start
+        cached = timeit.timeit(lambda: load(name), number=number) / number
+        print(f"  {name} ({load.__name__}): 首次 {first * 1e3:.2f} ms, 再次 {cached * 1e6:.2f} us")
+
+
+def _outermost_spans(spans, category):
+    """时间线中指定类别的最外层区间（嵌套导入已计入外层导入的耗时）"""
+    outermost = []
+    end = -1.0
+    for event in sorted((event for event in spans if event["cat"] == category),
+                        key=lambda event: (event["ts"], -event["dur"])):
+        if event["ts"] >= end:
+            outermost.append(event)
+            end = event["ts"] + event["dur"]
+    return outermost
+
+
+def bench_time_to_first_window(budget=2.0, repeat=3, timeout=30.0):
+    """
+    冷启动到主窗口首次绘制的耗时（离屏平台、合成数据源，启用启动分析器），超过预算时失败
+    同时列出启动时间线中耗时最长的模块导入
+    """
+    import json
+    import subprocess
+    import tempfile
+    
+    print(f"== 启动到主窗口首次绘制（离屏平台，{repeat}次取中位数，预算 {budget:g} 秒）==")
+    root = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for run in range(repeat):
+            trace_path = os.path.join(directory, f"startup-{run}.json")
+            process = subprocess.Popen(
+                [sys.executable, "main.py", "--source=synthetic:5", f"--profile-startup={trace_path}"],
+                cwd=root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            trace = None
+            deadline = time.perf_counter() + timeout
+            try:
+                # 分析器在首次绘制后写出时间线
+                while time.perf_counter() < deadline and process.poll() is None:
+                    if os.path.exists(trace_path):
+                        with open(trace_path, encoding="utf-8") as f:
+                            trace = json.load(f)
+                        if "first paint" in trace["otherData"]["milestones"]:
+                            break
+                    time.sleep(0.05)
+            finally:
+                process.kill()
+                process.wait()
+            assert trace is not None and "first paint" in trace["otherData"]["milestones"], "主窗口未在超时前完成首次绘制"
+            results.append(trace)
+    
+    results.sort(key=lambda trace: trace["otherData"]["milestones"]["first paint"])
+    median = results[len(results) // 2]
+    for name, seconds in sorted(median["otherData"]["milestones"].items(), key=lambda item: item[1]):
+        print(f"  {name}: {seconds * 1e3:.0f} ms")
+    spans = [event for event in median["traceEvents"] if event["ph"] == "X"]
+    for category in ("import", "widget", "resource"):
+        # 导入只列出最外层的（嵌套导入已计入外层导入的耗时）
+        candidates = (_outermost_spans(spans, category) if category == "import"
+                      else [event for event in spans if event["cat"] == category])
+        top = sorted(candidates, key=lambda event: -event["dur"])[:5]
+        print(f"  {category}: " + ", ".join(f"{event['name']} {event['dur'] / 1e3:.1f} ms" for event in top))
+    first_paint = median["otherData"]["milestones"]["first paint"]
+    assert first_paint <= budget, f"启动到主窗口首次绘制耗时 {first_paint:.2f} 秒，超过预算 {budget:g} 秒"
+
+
+BENCHMARKS = {
+    "decode": bench_notification_decode,
+    "multi": bench_multi_device,
+    "store": bench_session_store,
+    "tick": bench_chart_tick,
+    "paint": bench_chart_paint,
+    "yrange": bench_y_range,
+    "trend": bench_trend_length,
+    "idle": bench_tray_idle,
+    "latency": bench_ingest_latency,
+    "gauge": bench_gauge_paint,
+    "raster": bench_raster_render,
+    "views": bench_shared_model,
+    "labels": bench_label_updates,
+    "startup": bench_startup,
+    "assets": bench_assets,
+    "first_window": bench_time_to_first_window,
+}
+
+
+if __name__ == "__main__":
+    """运行全部或指定的基准测试，例如: python benchmark.py decode"""
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
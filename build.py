@@ -29,6 +29,7 @@ c = (
     '--include-package=winrt.windows ' \
     '--include-package=func ' \
     '--include-data-files=icon.ico=icon.ico ' \
+    '--include-data-files=func/resources.pack=func/resources.pack ' \
     'main.py'
 )
 
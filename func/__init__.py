@@ -1 +1,6 @@
-from .http_server import HeartRateHTTPServer
+def __getattr__(name):
+    # 按需导入：导入func下的任何模块时都不会先加载HTTP服务器（启动分析器需要在其他模块之前导入）
+    if name == "HeartRateHTTPServer":
+        from .http_server import HeartRateHTTPServer
+        return HeartRateHTTPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
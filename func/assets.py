@@ -0,0 +1,44 @@
+import os
+import threading
+import zipfile
+from func import startup_profiler
+
+# 资源包（由backupsrc/build_resource_pack.py生成的不压缩zip），首次读取资源时才打开
+PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources.pack")
+
+_pack = None
+_pack_lock = threading.Lock()
+_icons = {}    # 资源名称 -> QIcon（进程内缓存，每个资源只解码一次）
+_pixmaps = {}  # 资源名称 -> QPixmap
+
+
+def read_asset(name):
+    """读取资源包中的原始数据（不依赖Qt，闪屏等在QApplication创建前也可使用）"""
+    global _pack
+    with _pack_lock, startup_profiler.span(f"read {name}", "resource"):
+        if _pack is None:
+            _pack = zipfile.ZipFile(PACK_PATH)
+        return _pack.read(name)
+
+
+def get_pixmap(name):
+    """获取资源对应的QPixmap，首次调用时解码并缓存（需在GUI线程调用）"""
+    pixmap = _pixmaps.get(name)
+    if pixmap is None:
+        from PyQt5.QtGui import QPixmap
+        data = read_asset(name)
+        pixmap = QPixmap()
+        with startup_profiler.span(f"decode {name}", "resource"):
+            if not pixmap.loadFromData(data):
+                print(f"Error decoding asset: {name}")
+        _pixmaps[name] = pixmap
+    return pixmap
+
+
+def get_icon(name):
+    """获取资源对应的QIcon，首次调用时解码并缓存（需在GUI线程调用）"""
+    icon = _icons.get(name)
+    if icon is None:
+        from PyQt5.QtGui import QIcon
+        icon = _icons[name] = QIcon(get_pixmap(name))
+    return icon
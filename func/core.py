@@ -1,118 +1,606 @@
 import asyncio
-from PyQt5.QtCore import QThread, pyqtSignal
+import concurrent.futures
+import random
+import struct
+import time
+from collections import namedtuple
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
 from bleak import BleakClient, BleakScanner
 from bleak.backends.characteristic import BleakGATTCharacteristic
+from .gatt_cache import GattCache
+from .sources import HeartRateSource, SyntheticHeartRateSource, ReplayHeartRateSource
 
 # 最大连接超时时间
 timeout = 10
+# 停止监测任务时等待其结束的最长时间（秒），超时后强制取消
+stop_timeout = 3.0
 
-# 设备扫描线程
-class DeviceScanThread(QThread):
-    scan_finished = pyqtSignal(list)
-    scan_error = pyqtSignal(str)
+# 心率测量特征（0x2A37）标志位
+HR_FLAG_UINT16 = 0x01           # 心率值为uint16（否则为uint8）
+HR_FLAG_CONTACT_DETECTED = 0x02 # 传感器接触状态
+HR_FLAG_CONTACT_SUPPORTED = 0x04  # 支持接触检测
+HR_FLAG_ENERGY = 0x08           # 包含能量消耗字段
+HR_FLAG_RR = 0x10               # 包含RR间期字段
+
+_UINT16 = struct.Struct("<H")
+# 需要按偏移解析的字段（uint16心率、能量消耗、RR间期），都不存在时只需读取第二个字节
+_HR_FLAGS_EXTENDED = HR_FLAG_UINT16 | HR_FLAG_ENERGY | HR_FLAG_RR
+
+# 已知设备（上次成功连接的设备），用于跳过扫描直接连接
+KnownDevice = namedtuple("KnownDevice", ["address", "name"])
+
+# 心率服务UUID（0x180D）
+HEART_RATE_SERVICE_UUID = "0000180d-0000-1000-8000-00805f9b34fb"
+# 心率测量特征UUID（0x2A37）
+HEART_RATE_MEASUREMENT_UUID = "00002a37-0000-1000-8000-00805f9b34fb"
+# 电池服务（0x180F）和电量特征（0x2A19）
+BATTERY_SERVICE_UUID = "0000180f-0000-1000-8000-00805f9b34fb"
+BATTERY_LEVEL_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
+# 设备信息服务（0x180A）
+DEVICE_INFORMATION_SERVICE_UUID = "0000180a-0000-1000-8000-00805f9b34fb"
+
+
+def resolve_gatt_entry(services):
+    """
+    遍历GATT服务表，解析心率测量特征及相关服务，返回可缓存的条目
+    按标准UUID匹配，不依赖各后端不同的特征描述文字
+    """
+    entry = {}
+    for service in services:
+        service_uuid = service.uuid.lower()
+        if service_uuid == DEVICE_INFORMATION_SERVICE_UUID:
+            entry["device_information_service"] = service_uuid
+        for characteristic in service.characteristics:
+            characteristic_uuid = characteristic.uuid.lower()
+            if characteristic_uuid == HEART_RATE_MEASUREMENT_UUID and "hr_measurement_uuid" not in entry:
+                entry["hr_measurement_uuid"] = characteristic_uuid
+                entry["hr_measurement_handle"] = characteristic.handle
+            elif characteristic_uuid == BATTERY_LEVEL_UUID and service_uuid == BATTERY_SERVICE_UUID:
+                entry["battery_level_uuid"] = characteristic_uuid
+                entry["battery_level_handle"] = characteristic.handle
+    return entry if "hr_measurement_uuid" in entry else None
+
+def parse_heart_rate_measurement(data):
+    """
+    按蓝牙规范解析心率测量特征（0x2A37）的通知数据，返回(心率, RR间期元组)，RR间期单位为1/1024秒
+    按标志位确定心率宽度（uint8/uint16）并跳过能量消耗字段，直接按偏移读取字节（struct.unpack_from不复制缓冲区）
+    结果随即用于创建HeartRateSample，因此返回普通元组，不构造中间的记录对象
+    """
+    size = len(data)
+    if size < 2:
+        raise ValueError(f"数据长度不足: {size}")
+    
+    flags = data[0]
+    
+    # 最常见的情况：uint8心率，无能量和RR字段
+    if not flags & _HR_FLAGS_EXTENDED:
+        return data[1], ()
+    
+    # 心率值：uint8或uint16
+    if flags & HR_FLAG_UINT16:
+        if size < 3:
+            raise ValueError(f"数据长度不足: {size}")
+        bpm = _UINT16.unpack_from(data, 1)[0]
+        offset = 3
+    else:
+        bpm = data[1]
+        offset = 2
+    
+    # 能量消耗（跳过）
+    if flags & HR_FLAG_ENERGY:
+        if size < offset + 2:
+            raise ValueError("能量消耗字段不完整")
+        offset += 2
+    
+    # RR间期（数量由剩余字节数决定）
+    if flags & HR_FLAG_RR:
+        count = (size - offset) // 2
+        if count:
+            return bpm, struct.unpack_from(f"<{count}H", data, offset)
+    return bpm, ()
+
+# BLE服务线程
+class BleServiceThread(QThread):
+    """
+    常驻的BLE服务线程，持有唯一的asyncio事件循环
+    扫描、连接、通知等操作以协程形式提交到该循环，避免每次操作都新建和销毁事件循环
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.loop = asyncio.new_event_loop()
+        self.scanner = None  # 复用的扫描器（保留后端适配器状态）
+        self.detection_handler = None  # 当前扫描任务的广播回调
     
     def run(self):
+        asyncio.set_event_loop(self.loop)
         try:
-            devices = asyncio.run(self.scan_devices())
-            self.scan_finished.emit(devices)
-        except Exception as e:
-            self.scan_error.emit(str(e))
+            self.loop.run_forever()
+        finally:
+            # 取消尚未完成的任务并关闭事件循环
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.close()
     
-    async def scan_devices(self):
-        devices = await BleakScanner.discover()
-        return devices
+    def submit(self, coro):
+        """提交协程到服务循环，返回concurrent.futures.Future"""
+        if not self.isRunning():
+            self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def call_soon(self, callback, *args):
+        """在服务循环中执行回调（线程安全）"""
+        self.loop.call_soon_threadsafe(callback, *args)
+    
+    def get_scanner(self):
+        """获取复用的扫描器，仅在服务循环中调用"""
+        if self.scanner is None:
+            self.scanner = BleakScanner(detection_callback=self._on_detection)
+        return self.scanner
+    
+    def _on_detection(self, device, advertisement_data):
+        """将扫描器的广播回调转发给当前扫描任务"""
+        if self.detection_handler is not None:
+            self.detection_handler(device, advertisement_data)
+    
+    def shutdown(self):
+        """停止服务循环并等待线程退出"""
+        if self.isRunning():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.wait()
+
 
-# 心率监测线程
-class HeartRateMonitorThread(QThread):
-    heart_rate_updated = pyqtSignal(int)
-    connection_status = pyqtSignal(str)
-    error_occurred = pyqtSignal(str)
+# 设备扫描任务
+class DeviceScanTask(QObject):
+    scan_finished = pyqtSignal(list)
+    scan_error = pyqtSignal(str)
+    device_found = pyqtSignal(object, int)  # (设备, RSSI)，每个设备只发送一次
+    
+    # 扫描窗口时长（秒）
+    scan_duration = 5.0
     
-    def __init__(self, device):
+    def __init__(self, service, preferred_addresses=(), filter_heart_rate=True):
         super().__init__()
+        self.service = service
+        self.preferred_addresses = {address.upper() for address in preferred_addresses}
+        self.filter_heart_rate = filter_heart_rate
+        self.found_devices = {}  # 地址 -> 设备
+        self.future = None
+        self._stop_event = None
+    
+    def start(self):
+        self.future = self.service.submit(self.scan_devices())
+        self.future.add_done_callback(self._on_done)
+    
+    def _on_done(self, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.scan_error.emit(str(error))
+        else:
+            self.scan_finished.emit(future.result())
+    
+    def isRunning(self):
+        return self.future is not None and not self.future.done()
+    
+    def stop(self):
+        if self.future:
+            self.future.cancel()
+    
+    def wait(self, timeout=None):
+        if self.future:
+            concurrent.futures.wait([self.future], timeout=timeout)
+    
+    def _on_detection(self, device, advertisement_data):
+        """处理一条广播：按心率服务过滤、去重，并立即发出结果"""
+        address = device.address.upper()
+        if address in self.found_devices:
+            return
+        if self.filter_heart_rate:
+            service_uuids = advertisement_data.service_uuids or ()
+            if HEART_RATE_SERVICE_UUID not in (uuid.lower() for uuid in service_uuids):
+                return
+        
+        self.found_devices[address] = device
+        self.device_found.emit(device, advertisement_data.rssi)
+        
+        # 发现首选设备时提前结束扫描
+        if address in self.preferred_addresses:
+            self._stop_event.set()
+    
+    async def scan_devices(self):
+        self._stop_event = asyncio.Event()
+        scanner = self.service.get_scanner()
+        self.service.detection_handler = self._on_detection
+        try:
+            async with scanner:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), self.scan_duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.service.detection_handler = None
+        return list(self.found_devices.values())
+
+# 无法通过重连恢复的错误（如设备不提供心率测量特征）
+class FatalMonitorError(Exception):
+    pass
+
+
+# 按已知地址连接时未找到设备（从未连接成功过，重试没有意义）
+class DeviceNotFoundError(FatalMonitorError):
+    pass
+
+
+# 重连统计
+class ReconnectMetrics:
+    """记录单个设备的重连次数、中断时长和恢复耗时"""
+    
+    def __init__(self):
+        self.reconnect_count = 0          # 成功恢复的次数
+        self.stall_count = 0              # 因数据停滞判定失败的次数
+        self.total_downtime = 0.0         # 累计数据中断时长（秒）
+        self.last_time_to_recover = None  # 最近一次从检测到故障到恢复数据的耗时（秒）
+        self.max_time_to_recover = 0.0    # 最长恢复耗时（秒）
+    
+    def record_recovery(self, downtime, time_to_recover):
+        self.reconnect_count += 1
+        self.total_downtime += downtime
+        self.last_time_to_recover = time_to_recover
+        self.max_time_to_recover = max(self.max_time_to_recover, time_to_recover)
+    
+    def as_dict(self):
+        return {
+            "reconnect_count": self.reconnect_count,
+            "stall_count": self.stall_count,
+            "total_downtime": self.total_downtime,
+            "last_time_to_recover": self.last_time_to_recover,
+            "max_time_to_recover": self.max_time_to_recover,
+        }
+
+
+# 心率监测任务（蓝牙数据源）
+class HeartRateMonitorTask(HeartRateSource):
+    """
+    单个蓝牙设备的心率监测任务，内置重连监督：
+    连接断开或数据停滞时按带抖动的指数退避自动重连，直到用户停止
+    """
+    is_bluetooth = True
+    device_not_found = pyqtSignal(str)  # 按已知地址未找到设备，任务已结束（设备ID）
+    
+    # 预期通知间隔（秒）和停滞判定倍数：超过 倍数×间隔 未收到数据视为故障
+    expected_interval = 1.0
+    stall_factor = 5
+    # 重连退避参数（秒）
+    backoff_base = 0.5
+    backoff_max = 30.0
+    
+    def __init__(self, service, device, gatt_cache=None):
+        # 数据流标识：使用设备地址区分多个设备
+        super().__init__(service, getattr(device, "address", str(device)), getattr(device, "name", None))
         self.device = device
-        self.running = False
+        self.gatt_cache = gatt_cache
         self.client = None
+        self.metrics = ReconnectMetrics()
+        self._disconnected = False
+        self._last_sample_time = None  # 最近一次收到数据的时间（monotonic）
+        self._subscribed_at = None     # 本次会话订阅成功的时间（monotonic）
+        self._session_sample_count = 0 # 本次会话收到的样本数
+        self._down_since = None        # 数据中断起始时间（monotonic），正常时为None
+        self._failure_detected_at = None
+        self._connect_task = None      # 进行中的查找/连接操作，停止时直接取消
+        self._ever_connected = False   # 是否连接成功过（之后的未找到视为暂时离开范围，继续重连）
     
-    def run(self):
+    def _handle_notification(self, data):
+        """解析一条心率通知并按设备ID分发"""
+        # 接收时间在解析之前记录，端到端延迟包含解析耗时
+        recv_ns = time.monotonic_ns()
         try:
-            self.running = True
-            asyncio.run(self.monitor_heart_rate())
+            bpm, rr_intervals = parse_heart_rate_measurement(data)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            # 单条数据异常不中断监测
+            print(f"[Monitor] {self.device_id} 解析心率数据出错: {e}")
+            return
+        
+        now = recv_ns / 1e9  # 与time.monotonic()为同一时钟
+        self._last_sample_time = now
+        self._session_sample_count += 1
+        if self._down_since is not None:
+            # 数据恢复：报告缺失时段，而不是用0填充
+            downtime = now - self._down_since
+            self.metrics.record_recovery(downtime, now - self._failure_detected_at)
+            self._down_since = None
+            self.data_gap.emit(self.device_id, downtime)
+            print(f"[Supervisor] {self.device_id} 已恢复，数据中断 {downtime:.1f} 秒，"
+                  f"恢复耗时 {self.metrics.last_time_to_recover:.1f} 秒，累计重连 {self.metrics.reconnect_count} 次")
+        
+        self._publish(bpm, rr_intervals, recv_ns)
     
-    def stop(self):
-        self.running = False
-        # 移除嵌套的asyncio.run调用，只设置running为False
-        # 线程中的while循环会自动退出，然后在monitor_heart_rate方法中正常断开连接
+    def _request_stop(self):
+        super()._request_stop()
+        # 查找设备和建立连接可能耗时数十秒，停止时取消而不是等待其超时
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+    
+    async def _connecting(self, coro):
+        """执行一次查找/连接操作，期间的停止请求会取消该操作"""
+        self._connect_task = asyncio.ensure_future(coro)
+        try:
+            return await self._connect_task
+        finally:
+            self._connect_task = None
+    
+    def _next_backoff(self, attempt):
+        """带抖动的指数退避：在[d/2, d]内随机，d = base × 2^attempt"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
     
     async def monitor_heart_rate(self):
-        def notification_handler(characteristic: BleakGATTCharacteristic, data: bytearray):
+        """监督循环：会话失败后退避重连，直到用户停止或遇到不可恢复的错误"""
+        self._wake_event = asyncio.Event()
+        attempt = 0
+        
+        while not self._stop_requested:
             try:
-                value = int(data.hex().split('06')[1], 16)
-                self.heart_rate_updated.emit(value)
+                await self._run_session()
+            except DeviceNotFoundError as e:
+                print(f"[Supervisor] {self.device_id} {e}，停止连接")
+                self.connection_status.emit("未找到设备")
+                self.device_not_found.emit(self.device_id)
+                return
+            except FatalMonitorError as e:
+                self.error_occurred.emit(str(e))
+                return
+            except asyncio.CancelledError:
+                # 停止请求取消了进行中的查找/连接；其他取消（服务循环关闭）继续向上传递
+                if self._stop_requested:
+                    return
+                raise
             except Exception as e:
-                self.error_occurred.emit(f"解析心率数据出错: {e}")
+                reason = str(e) or e.__class__.__name__
+            else:
+                reason = "设备已断开连接"
+            if self._stop_requested:
+                return
+            
+            # 记录中断起点：从最后一个样本算起，中断时段作为缺失数据报告
+            now = time.monotonic()
+            if self._down_since is None:
+                self._down_since = self._last_sample_time if self._last_sample_time is not None else now
+                self._failure_detected_at = now
+                self.stream_interrupted.emit(self.device_id)
+            
+            # 上次会话收到过数据则重置退避
+            if self._session_sample_count:
+                attempt = 0
+            delay = self._next_backoff(attempt)
+            attempt += 1
+            print(f"[Supervisor] {self.device_id} {reason}，{delay:.1f} 秒后第 {attempt} 次重连")
+            self.connection_status.emit("正在重新连接...")
+            if await self._sleep(delay):
+                return
+    
+    @property
+    def stall_timeout(self):
+        return self.expected_interval * self.stall_factor
+    
+    async def _wait_until_session_ends(self):
+        """等待停止、断开或数据停滞；停滞和断开以异常形式抛出"""
+        while True:
+            idle = time.monotonic() - self._last_activity
+            remaining = self.stall_timeout - idle
+            if remaining > 0:
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            if self._stop_requested:
+                return
+            if self._disconnected:
+                raise ConnectionError("设备已断开连接")
+            if time.monotonic() - self._last_activity >= self.stall_timeout:
+                self.metrics.stall_count += 1
+                raise TimeoutError(f"超过 {self.stall_timeout:.0f} 秒未收到心率数据")
+    
+    @property
+    def _last_activity(self):
+        # 订阅后尚未收到数据时，从订阅时刻开始计算停滞
+        if self._last_sample_time is None or self._last_sample_time < self._subscribed_at:
+            return self._subscribed_at
+        return self._last_sample_time
+    
+    async def _run_session(self):
+        """执行一次连接会话：连接、订阅并等待会话结束"""
+        def notification_handler(characteristic: BleakGATTCharacteristic, data: bytearray):
+            self._handle_notification(data)
+        
+        if self._stop_requested:
+            return
+        self._wake_event.clear()
+        self._disconnected = False
+        self._session_sample_count = 0
         
         try:
             self.connection_status.emit("正在连接设备...")
             
             def disconnected_callback(client):
                 self.connection_status.emit("设备已断开连接")
-                self.running = False
+                self._disconnected = True
+                self._wake_event.set()
             
-            async with BleakClient(self.device, disconnected_callback=disconnected_callback, timeout=timeout) as client:
+            target = self.device
+            if isinstance(target, KnownDevice):
+                # 已知地址：定向查找该设备，无需等待完整扫描
+                target = await self._connecting(
+                    BleakScanner.find_device_by_address(self.device.address, timeout=timeout))
+                if self._stop_requested:
+                    return
+                if target is None:
+                    if not self._ever_connected:
+                        raise DeviceNotFoundError(f"未找到设备: {self.device.address}")
+                    raise ConnectionError(f"未找到设备: {self.device.address}")
+            
+            connect_start = time.perf_counter()
+            client = BleakClient(target, disconnected_callback=disconnected_callback, timeout=timeout)
+            await self._connecting(client.connect())
+            try:
                 self.client = client
+                self._ever_connected = True
+                connected_at = time.perf_counter()
+                if self._stop_requested:
+                    return
                 self.connection_status.emit("设备连接成功")
                 
-                self.connection_status.emit("正在查找心率测量特征...")
-                hr_measurement_uuid = None
-                for service in client.services:
-                    for characteristic in service.characteristics:
-                        if "Heart Rate Measurement" in characteristic.description:
-                            hr_measurement_uuid = characteristic.uuid
-                            break
-                    if hr_measurement_uuid:
-                        break
+                # 优先使用缓存的特征句柄直接订阅，失败时清除缓存并重新解析
+                entry = self.gatt_cache.get(target.address) if self.gatt_cache else None
+                from_cache = entry is not None
+                hr_measurement = None
+                if entry:
+                    try:
+                        hr_measurement = entry["hr_measurement_handle"]
+                        await client.start_notify(hr_measurement, notification_handler)
+                    except Exception as e:
+                        print(f"[GATT] 缓存特征订阅失败，重新解析: {e}")
+                        self.gatt_cache.invalidate(target.address)
+                        entry = None
+                        hr_measurement = None
                 
-                if hr_measurement_uuid:
-                    self.connection_status.emit("开始心率监测")
-                    await client.start_notify(hr_measurement_uuid, notification_handler)
-                    
-                    while self.running:
-                        await asyncio.sleep(0.1)
-                    
-                    await client.stop_notify(hr_measurement_uuid)
-                else:
-                    self.error_occurred.emit("未找到心率测量特征")
-        except Exception as e:
-            self.error_occurred.emit(f"连接失败: {e}")
+                if entry is None:
+                    self.connection_status.emit("正在查找心率测量特征...")
+                    entry = resolve_gatt_entry(client.services)
+                    if entry is None:
+                        raise FatalMonitorError("未找到心率测量特征")
+                    hr_measurement = entry["hr_measurement_handle"]
+                    await client.start_notify(hr_measurement, notification_handler)
+                    if self.gatt_cache:
+                        self.gatt_cache.set(target.address, entry)
+                
+                subscribed_at = time.perf_counter()
+                self._subscribed_at = time.monotonic()
+                print(f"[GATT] {target.address} 连接 {(connected_at - connect_start) * 1000:.0f} ms, "
+                      f"特征解析及订阅 {(subscribed_at - connected_at) * 1000:.0f} ms "
+                      f"({'缓存命中' if from_cache else '服务表遍历'})")
+                self.connection_status.emit("开始心率监测")
+                self.monitoring_started.emit(target)
+                
+                # 等待停止请求、设备断开或数据停滞，不再轮询
+                await self._wait_until_session_ends()
+                
+                if client.is_connected:
+                    await client.stop_notify(hr_measurement)
+            finally:
+                await client.disconnect()
+        finally:
+            self.client = None
 
 # 心率监测器核心类
 class HeartRateMonitorCore:
     """
     心率监测器的核心功能类，处理设备连接和数据监控逻辑
+    支持同时监测多个设备，所有连接共享同一个BLE服务事件循环
     """
     def __init__(self):
         self.devices = []
         self.selected_device = None
-        self.monitor_thread = None
-        self.scan_thread = None
+        self.monitor_tasks = {}  # 设备ID -> HeartRateMonitorTask
+        self.scan_task = None
+        self.heart_rate_devices = {}  # 广播心率服务的设备：地址 -> RSSI
+        self.preferred_addresses = set()  # 扫描到即可提前结束扫描的设备地址
+        self.gatt_cache = GattCache()
+        self.ble_service = BleServiceThread()
+    
+    @property
+    def monitor_task(self):
+        """主设备（最先连接的设备）的监测任务"""
+        return next(iter(self.monitor_tasks.values()), None)
     
     def is_device_supported(self, device):
         """
         检查设备是否支持心率监测
-        实际使用时可以根据设备名称或其他特征进行判断
+        以扫描时是否在广播中声明心率服务（0x180D）为准
+        """
+        return getattr(device, "address", str(device)).upper() in self.heart_rate_devices
+    
+    def is_device_monitored(self, device):
+        """检查设备是否已在监测中"""
+        return getattr(device, "address", str(device)) in self.monitor_tasks
+    
+    def create_scan_task(self):
+        """创建在BLE服务循环中运行的扫描任务"""
+        self.heart_rate_devices.clear()
+        self.scan_task = DeviceScanTask(self.ble_service, self.preferred_addresses)
+        self.scan_task.device_found.connect(self._on_device_found)
+        return self.scan_task
+    
+    def _on_device_found(self, device, rssi):
+        self.heart_rate_devices[device.address.upper()] = rssi
+    
+    def add_source(self, source):
+        """登记一个心率数据源，所有数据源共享BLE服务事件循环"""
+        self.monitor_tasks[source.device_id] = source
+        return source
+    
+    def create_monitor_task(self, device):
+        """创建在BLE服务循环中运行的心率监测任务（每个设备一个，不额外占用线程）"""
+        return self.add_source(HeartRateMonitorTask(self.ble_service, device, self.gatt_cache))
+    
+    def create_source_from_spec(self, spec):
+        """
+        按描述创建非蓝牙数据源：
+        "synthetic[:频率Hz]" 合成数据；"replay:<会话文件>[@速度]" 回放已记录的会话
         """
-        # 这里简化处理，实际可能需要更复杂的判断逻辑
-        return True
+        kind, _, argument = spec.partition(":")
+        if kind == "synthetic":
+            rate_hz = float(argument) if argument else 1.0
+            return self.add_source(SyntheticHeartRateSource(self.ble_service, rate_hz=rate_hz))
+        if kind == "replay":
+            path, _, speed = argument.rpartition("@")
+            if not path:
+                path, speed = argument, ""
+            return self.add_source(ReplayHeartRateSource(self.ble_service, path, float(speed) if speed else 1.0))
+        raise ValueError(f"未知的数据源: {spec}")
+    
+    def stop_monitor_task(self, device_id):
+        """停止并移除指定设备的监测任务"""
+        task = self.monitor_tasks.pop(device_id, None)
+        if task:
+            self._stop_tasks([task])
+    
+    def stop_all_monitor_tasks(self):
+        """停止所有设备的监测任务"""
+        tasks = list(self.monitor_tasks.values())
+        self.monitor_tasks.clear()
+        self._stop_tasks(tasks)
+    
+    @staticmethod
+    def _stop_tasks(tasks):
+        """
+        停止任务并等待其结束，总等待时间不超过stop_timeout，超时的任务强制取消，
+        避免断开按钮和关闭窗口被卡住的连接操作阻塞
+        """
+        # 先统一发出停止请求，再等待，使多个设备并行断开
+        for task in tasks:
+            task.stop()
+        deadline = time.monotonic() + stop_timeout
+        for task in tasks:
+            if not task.wait(max(0.0, deadline - time.monotonic())):
+                print(f"[Monitor] {task.device_id} 未在 {stop_timeout:.0f} 秒内停止，强制取消")
+                task.cancel()
+    
+    def get_reconnect_metrics(self):
+        """获取所有设备的重连统计：{设备ID: 统计字典}"""
+        return {device_id: task.metrics.as_dict() for device_id, task in self.monitor_tasks.items()}
     
     def cleanup(self):
         """
-        清理资源，停止所有线程
+        清理资源，停止所有任务和BLE服务线程
         """
-        if self.monitor_thread:
-            self.monitor_thread.stop()
-            self.monitor_thread.wait()
-        if self.scan_thread and self.scan_thread.isRunning():
-            self.scan_thread.wait()
\ No newline at end of file
+        self.stop_all_monitor_tasks()
+        if self.scan_task and self.scan_task.isRunning():
+            self.scan_task.stop()
+            self.scan_task.wait()
+        self.ble_service.shutdown()
@@ -0,0 +1,172 @@
+import math
+import time
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+
+class FrameStats:
+    """帧时钟统计：帧数、迟到帧、丢帧和每帧处理耗时"""
+    
+    def __init__(self):
+        self.frame_count = 0           # 已执行的帧数
+        self.late_frames = 0           # 晚于计划帧边界执行的帧数
+        self.dropped_frames = 0        # 因迟到而跳过的帧数
+        self.total_frame_time = 0.0    # 累计处理耗时（秒）
+        self.max_frame_time = 0.0      # 最长单帧处理耗时（秒）
+    
+    def record(self, late_by, frame_time):
+        self.frame_count += 1
+        if late_by > 0:
+            self.late_frames += 1
+            self.dropped_frames += late_by
+        self.total_frame_time += frame_time
+        self.max_frame_time = max(self.max_frame_time, frame_time)
+    
+    def as_dict(self):
+        return {
+            "frame_count": self.frame_count,
+            "late_frames": self.late_frames,
+            "dropped_frames": self.dropped_frames,
+            "average_frame_time": self.total_frame_time / self.frame_count if self.frame_count else 0.0,
+            "max_frame_time": self.max_frame_time,
+        }
+
+
+class FrameClock(QObject):
+    """
+    统一帧时钟：所有图表和仪表盘订阅同一个定时器，在共同的帧边界上被调用，
+    同一帧内标记为需要重绘的控件只集中刷新一次；没有到期的订阅者时时钟不唤醒
+    """
+    DEFAULT_FPS = 30
+    _shared = None
+    
+    @classmethod
+    def shared(cls):
+        """进程内共享的帧时钟"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+    
+    def __init__(self, fps=DEFAULT_FPS, parent=None):
+        super().__init__(parent)
+        self.frame_interval = 1.0 / fps
+        self.subscribers = {}  # 回调 -> [间隔（秒，None表示每帧）, 间隔帧数, 下次执行的帧序号]
+        self.dirty = {}        # 本帧需要重绘的控件（保持标记顺序）
+        self.stats = FrameStats()
+        self.scheduled_frame = None  # 已计划执行的帧序号
+        self.in_frame = False
+        self.raster_renderer = None  # 后台栅格渲染器，为None时在GUI线程直接绘制
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._run_frame)
+    
+    @property
+    def fps(self):
+        return 1.0 / self.frame_interval
+    
+    def _current_frame(self):
+        return int(time.monotonic() / self.frame_interval)
+    
+    def _interval_frames(self, interval):
+        if interval is None:
+            return 1
+        return max(1, round(interval / self.frame_interval))
+    
+    @staticmethod
+    def _next_aligned(frame, interval_frames):
+        """frame之后第一个是interval_frames整数倍的帧序号，使相同间隔的订阅者总在同一帧、同一时间相位被调用"""
+        return (frame // interval_frames + 1) * interval_frames
+    
+    def set_fps(self, fps):
+        """设置目标帧率，订阅者的间隔按新的帧长重新换算"""
+        self.frame_interval = 1.0 / max(1, fps)
+        current = self._current_frame()
+        for entry in self.subscribers.values():
+            entry[1] = self._interval_frames(entry[0])
+            entry[2] = self._next_aligned(current, entry[1])
+        self._schedule()
+    
+    def subscribe(self, callback, interval=None):
+        """
+        订阅帧回调：每隔interval秒（取整到帧）调用一次callback()，None表示每帧调用
+        调用时刻对齐到间隔的整数倍（例如30fps下0.5秒的订阅者总在每个整0.5秒的帧被调用）
+        """
+        interval_frames = self._interval_frames(interval)
+        self.subscribers[callback] = [interval, interval_frames, self._next_aligned(self._current_frame(), interval_frames)]
+        self._schedule()
+    
+    def unsubscribe(self, callback):
+        self.subscribers.pop(callback, None)
+    
+    def is_subscribed(self, callback):
+        return callback in self.subscribers
+    
+    def set_raster_renderer(self, renderer):
+        """启用（传入RasterRenderer）或停用（传入None）后台栅格渲染"""
+        self.raster_renderer = renderer
+    
+    def mark_dirty(self, widget):
+        """标记控件需要重绘，在下一帧结束时统一刷新"""
+        self.dirty[widget] = None
+        self._schedule()
+    
+    def _schedule(self):
+        """计划下一帧：对齐到帧边界，只在有到期的订阅者或待重绘的控件时唤醒"""
+        if self.in_frame:
+            # 帧结束时会重新计划
+            return
+        if not self.subscribers and not self.dirty:
+            self.timer.stop()
+            self.scheduled_frame = None
+            return
+        
+        current = self._current_frame()
+        if self.dirty:
+            frame = current + 1
+        else:
+            frame = max(current + 1, min(entry[2] for entry in self.subscribers.values()))
+        if self.scheduled_frame is not None and self.timer.isActive() and self.scheduled_frame <= frame:
+            return
+        self.scheduled_frame = frame
+        delay = frame * self.frame_interval - time.monotonic()
+        self.timer.start(max(0, math.ceil(delay * 1000)))
+    
+    def _run_frame(self):
+        start = time.perf_counter()
+        current = self._current_frame()
+        late_by = max(0, current - self.scheduled_frame) if self.scheduled_frame is not None else 0
+        self.scheduled_frame = None
+        
+        self.in_frame = True
+        try:
+            # 调用所有到期的订阅者（回调中可能取消订阅）
+            for callback, entry in list(self.subscribers.items()):
+                if entry[2] > current or self.subscribers.get(callback) is not entry:
+                    continue
+                owner = getattr(callback, "__self__", None)
+                if isinstance(owner, QObject) and sip.isdeleted(owner):
+                    # 控件已销毁但未取消订阅
+                    del self.subscribers[callback]
+                    continue
+                entry[2] += entry[1]
+                if entry[2] <= current:
+                    # 错过的帧不补调用
+                    entry[2] = self._next_aligned(current, entry[1])
+                callback()
+            
+            # 统一刷新本帧内标记的所有控件：支持快照的图表在启用后台渲染时提交到渲染线程
+            dirty, self.dirty = self.dirty, {}
+            for widget in dirty:
+                if sip.isdeleted(widget):
+                    continue
+                if self.raster_renderer is not None and hasattr(widget, "snapshot"):
+                    self.raster_renderer.submit(widget)
+                else:
+                    widget.update()
+        finally:
+            self.in_frame = False
+        
+        self.stats.record(late_by, time.perf_counter() - start)
+        self._schedule()
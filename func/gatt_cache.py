@@ -0,0 +1,51 @@
+import json
+import os
+
+
+class GattCache:
+    """GATT特征缓存，按设备地址保存已解析的心率测量特征等信息，重连时无需遍历服务表"""
+    
+    def __init__(self):
+        # 与设置文件保存在同一目录
+        self.cache_dir = os.path.join(os.path.expanduser("~"), ".heartrate_monitor")
+        self.cache_file = os.path.join(self.cache_dir, "gatt_cache.json")
+        
+        # 确保缓存目录存在
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        
+        # 加载缓存
+        self.entries = self.load_cache()
+    
+    def load_cache(self):
+        """加载缓存"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            return {}
+        except Exception as e:
+            print(f"加载GATT缓存失败: {e}")
+            return {}
+    
+    def save_cache(self):
+        """保存缓存"""
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=4, ensure_ascii=False)
+        except Exception as e:
+            print(f"保存GATT缓存失败: {e}")
+    
+    def get(self, address):
+        """获取设备的缓存条目，不存在时返回None"""
+        return self.entries.get(address.upper())
+    
+    def set(self, address, entry):
+        """保存设备的缓存条目"""
+        self.entries[address.upper()] = entry
+        self.save_cache()
+    
+    def invalidate(self, address):
+        """删除设备的缓存条目（订阅失败时调用）"""
+        if self.entries.pop(address.upper(), None) is not None:
+            self.save_cache()
@@ -1,5 +1,7 @@
 from http.server import HTTPServer, BaseHTTPRequestHandler
+import json
 import threading
+from urllib.parse import unquote
 
 # HTTP 请求处理器
 class HeartRateHTTPRequestHandler(BaseHTTPRequestHandler):
@@ -62,7 +64,8 @@ class HeartRateHTTPRequestHandler(BaseHTTPRequestHandler):
             try {
                 let response = await fetch('/heartrate');
                 let heartRate = await response.json();
-                document.getElementById('heart-rate-number').textContent = heartRate;
+                // 数据中断时服务器返回null，显示为"--"
+                document.getElementById('heart-rate-number').textContent = heartRate === null ? '--' : heartRate;
             } catch (err) {
                 console.error(err);
             }
@@ -78,7 +81,25 @@ class HeartRateHTTPRequestHandler(BaseHTTPRequestHandler):
             self.send_header('Content-type', 'application/json')
             self.end_headers()
             heart_rate = self.server.get_heart_rate()
-            self.wfile.write(str(heart_rate).encode('utf-8'))
+            self.wfile.write(json.dumps(heart_rate).encode('utf-8'))
+        elif self.path == '/devices':
+            # 所有设备的心率：{设备ID: 心率}
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps(self.server.get_device_heart_rates()).encode('utf-8'))
+        elif self.path.startswith('/heartrate/'):
+            # 指定设备的心率：/heartrate/<设备ID>（设备ID按URL编码，如 %3A 表示 :）
+            device_id = unquote(self.path[len('/heartrate/'):])
+            heart_rates = self.server.get_device_heart_rates()
+            if device_id in heart_rates:
+                self.send_response(200)
+                self.send_header('Content-type', 'application/json')
+                self.end_headers()
+                self.wfile.write(json.dumps(heart_rates[device_id]).encode('utf-8'))
+            else:
+                self.send_response(404)
+                self.end_headers()
         else:
             self.send_response(404)
             self.end_headers()
@@ -93,17 +114,28 @@ class HeartRateHTTPServer:
         self.server = None
         self.server_thread = None
         self.current_heart_rate = 0
+        self.device_heart_rates = {}  # 设备ID -> 心率
     
     def get_heart_rate(self):
         return self.current_heart_rate
     
+    def get_device_heart_rates(self):
+        return dict(self.device_heart_rates)
+    
     def update_heart_rate(self, heart_rate):
         self.current_heart_rate = heart_rate
     
+    def update_device_heart_rate(self, device_id, heart_rate):
+        self.device_heart_rates[device_id] = heart_rate
+    
+    def remove_device(self, device_id):
+        self.device_heart_rates.pop(device_id, None)
+    
     def start(self):
         if self.server is None:
             self.server = HTTPServer(('127.0.0.1', self.port), HeartRateHTTPRequestHandler)
             self.server.get_heart_rate = self.get_heart_rate
+            self.server.get_device_heart_rates = self.get_device_heart_rates
             self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
             self.server_thread.start()
     
@@ -1,8 +0,0 @@
-import base64
-
-# Base64 encoded icon
-# Generated by encode_icon.py
-
-ICON_ICO = """
-AAABAAEAAAAAAAEAIAD9XAcAFgAAAIlQTkcNChoKAAAADUlIRFIAAAIAAAACAAgGAAAA9HjU+gAAAAlwSFlzAAAOxAAADsQBlSsOGwAAIABJREFUeJzsvXnsbVlW3/dZa59z7vib31hTd1V10UBBt8ANLQfs2BCkgA0SIoggQCQOCUpETFAUy0ocdXUsKwkWwYljJRJWII6VGGJiUJA8JBBDGwithp7pseZ60++99xvveM7Ze+WPtc+59xUkcSaRrq7bUr9f/YZ799ln772+6/v9rnWEt1//v3v93q/9lK3mJ7QIo0HFanbJqBJi03KwNyEUcHJ2QYqB0c4uoJSDgvV6jSIUUhBC4PTkAUdHV5kvZ0BLvV4jyRhPBjw4OWVvZ4yIsZxdMhyPiJYI7JJYMh5PKXSChsR6uaAYjRiMKs5PTzm8cY3Z2SmL+SXVYML85B5H126wjivqxZyrNx/j7t27VFXFennOYDBivbgkFBU0wmiyQ0pCTInR/oT1fEGKUA4HrGYXDHamxFVLXbeEsGYyusJydQkpUY5KVAZIWxPjGnRATCuCTJEysFoYoSpp2iV70z0sFNx97bNMD/eZzc8ZDiYs5xes6siNq0/QhgHzi1sMh7uUogzHU9bzC2qUqC2KUKUh1VhYzi8QCkajCevVJaGYwHBEWQYGVWA+q0nNBSEEggjVcEhbr0FLmvWC0WSfgshyVRNTQ7RAalp2p3vU64hWS1glqr1riBac3L/NeHKEDivaOmJxyaCqWNczhIKiKDh/+JDdK0c0zYqUEkrBaDJmMT+jaSJVqIhEiiahIdI2S8pywmz9kKADytEAicZwtIOI0tRLQllQlUPalKibc5pZpByWhHLKaj6jmk45PX6NarBDvWopB4FyqKRVSRmMSKJuW0aDAU3TkkiEUCA0pCYxPdghNcrp2V2KUhlOxliE1arFzNg7GEPdUNeRaneXtl6wbgLD4ZCmaRCUs/v3ODy8QV1fYK2gg8CD+yc8du0qrRir8wWTnTF1s0AI6KBkftmys7dLnNcs1yvW7YKjo2ss1mekqEgItGtDNDIYTlEME8VUaNc1SEupFW0SEkJkzaC4SmyXNDFRVcq6EQZlYFCNGY2GPDx+g0ERWLVz6vWCshhSaEltK5aLhqPDHYLsMBgl6romaMRM0GJCEQY08Ry1ipgaLAlaCvWyYTCaMr+sGQ6H1M2CqqpY1JGUIEnNeDggtQmLKwqBsppSjiuW83N2dq8yny8YDCrWixVHR1c5P5tTjZXZ2QllAScnJzz23PPce/mT7O5dYT47Zfdwl7atsUao18b+4T73bt3msetPcf/4FfavX2e+nFEMDxjujHhw6yHDg+vs7z7xwbZNLBYrrr3zPRw9/v4Pqqr9UZ+zb7+g+KMewJfT69WP/+ILy+UrHzh78BpXDies5w+xZk0xmnB+64Kbzz7JYFpxducLXL8yQAksFifE4YKD/avcvj0j1FCFPSZBKAcDaBeYRdbzGY899TQvf/6zFFXFwe4+2pwiTaK9nFNVFUfjPZLVCIF3XL/C8cWM6U7FsNxndrmmrEoGw4DFMbOzC8bDBZPDHZanF1zbH3H/7mt+UErN5cNTDq7sklYzLlpF45KdwZC7d49JBysKE/YGhzycr6jCmNF4yPG9c6QasHNlj7sv32IyHhBZYk0ipRXr2DDZ2eHi3iWH128SqFnMT1hxia5hcuWAFBvMEuvFimJQUUnJclQQZMTi9B7TyQ73j9/g4OpNLu9+nmo6pSAxlCHlsGU+q6lS4PDwKeaXJ+zuFywWgcHOBOolZ8fHFApSVVRNYPfmFdqzY2ZnDZOhsVguiJawZs3u/jXW7SW2rri8OGcQ9khNZDKdcnzrLleu3yAt56hB0JKB1tx57TbT3T3iekVtAyY3rzE7v029jOzpNWb1BUU7p24D01HF/PSYye4OVieCJFQKWLQMJhUglK0hMVJpSVNfUg1K1pcz2vMzJgeHnNy5xeTKAWUYYBij6T7rxQXSKrt7e6xWK0IoObl7zJWrN7DaGA9H3Lt3h6vXH2N5sWJydJ3mouXi4X0OD/e4OL5P0RRoSOxVxjKVtOczQlhRja4xO3vA/sERd+68zNVr17A0AGB2ecnh4VXmszn7+9eY1AdM966yXp5wcjrn5jufoF1G6nrJ3njC5fkdDq/vcn52QQgF69MZUVqeeOIrIM2QELm2/xR3Xn2dg6MDdoeHJF0ytpKWJYNQUIQRIiPu37/F1YMbzOaXpLZh52BMNVcWixllKKjF2N+ZcP/8DXavXWMy2eXOyy9zdO0q88WKSRVoEwQSQY2h7tBgRC5oV5dMBhMG5ZTLu/cZXB0yLCvOL17l2tUjZucPUEsMQsFo75DKljw8jVzb3aNtFoymY+azB5SDEWoDVvOa6c2KxfmM2NZMd8ZMpkecPHhIS2Kyd8jq8oxyUNCsZ0hMLC/nDHZLTs7PuHHzJrPTh4wHQ4a7R5wdv8EAYTG/pCiVVC8ZFkpqatLqgocPZgxKoW7GDEZj2nrJXjlgffcV9sYHtMsV49Ee87M108NDUtmwNxmyrNdcO7jC8fEDYEhZ7mDnM6rhCls1hMUSaz+HcfwBDQV75Yj69ovcuvPLH/jUP/gRlssl9fmMlimPPfNuLpuSg8NnPvj0133fC3+U5/SX00v+qAfwVnx98nf/mxfq+7//AdZLUvOA0X7F3nSH47sNTz73BFIveOPFl3nqyXdy784bDEdT7t45YXQAl/dbJjtjiCuG4yGSlkz2x5zdP2d0cI35yQVUFZNRwWLVENcBLZXU1pTDAYiQEgT1sagUWGvEtAStGA1Kqp0dZrMzynLEYnmGpcDhwTUWiwXr5RzTyGhnB5WCZt0iJJo6MtotWc5XLOcrBpMB40K4vLxkNL1KaC/Y2R1x9/acwWRIWcB8OWf3cJfZ6RoVIWmgLMbEes1wOGR2ecZo95DVbI6WQrNec+WxmyxmM5bnMybTKevFJePDQzQ1zM8vKMsSSy3l3i5CxYM7L7M32aXaH9Ccr5jsXufi8iGSIsNByYOTY46uHLBeLkhJGYz3iKK88eKLPPnMU7Rty3g85cH9E8ajEtoKWLBsa3aODoixZHl+Bx2OmVQjaCOtDhhVA1arBaZCTGsm04rLywZNRjEIxLTGTJgeXCXVJ8wvjUKN6e4+1kaWdc3F3Zqjx0YUwxExCvPZQwbDPerzM648/hzz8zOq8YjV7CEyKFkuLhgODwjacnL/jP3dPdb1JWU1JaWWoorUqzXj0QHtakZDYhhK5otzqmpISi3DySFNu8LaSFVVxJhYNi2xqRkf7KJtpCiHVBJZtlBpYhmFMinruCCZsjMcU9c1xXCCNRc0YYfl6X3KnQG0a3aOrvHKp7/Alas3GQyF+eWCK088xe1XvsB4Z4IBo5ES28CDBzMOdsZEBRFjenjI7PyUUTXATDl/eJ/rTz/Lxel99g92ubyYg3i2XErF5eUl4/EYktHWS7QYEcQYDsbM5qeUwShH+5w9OIVK2dvdodjZ59ZLnyWUQ7QIjKxEBwEtC5p5Yr48ZjwZIuUQTCkYsFrPsAittOzuHNDWK8SgjYH1uiGIMhgKdWOQjGXTUmpLORpSDSdcPDxnZ1qxbFpEAtouqFujUpDRlBCXoAOqwYj7d47ZubJPwghJiZoYjQYsz+ccXX+KNi158OrrHDzxGMvLMw6Ojji78wbRKspQYJJICWRsjAa7PHxwm6oYoBKoQkVDYrWYc3BwwMN797h+/QYXl0vGuwPWswW7h1eomyWXJ/fYufYY9ewcJbBuVly5+S7uvPo5hpMraIpUA6MZ7bK+cwcplXpVMxgLhYyRKjCohty7/TKT8QGDnQmLecNqueRwf0pMJW3bMpyUSLmLtGfEZMQ04Oz8hOn+lLodwmiXwytf+8Gnv/Z7XvgjPNbfkq+3AcD/C69P/+bPvjCQkw+8+pkP8fi7nmV+ccnBziEXD46RYoAMlgyLIXdvnTGZDrj62BXK8QGzh69SDaecPLykEGU8XXN04ykevP46tneVX/3Hn+Sffd87Wc+V++fnTA/3+dxnbvP173me2fwht+/VxGiEYYFQsW5XHI3GrJdzokZCMWAxb5hOA6vFCimnxPmCclzQLlYM9/ao13OqsEtMC4rpdW4/vMf+eMxkd496tqQaTjmdz1nGJXuFMhyXvPrGQ472jxC9YGcy5ZO/f49v+JprtPWceZ0YDXewpqYsA5cXFyyk4HxdM60Krh1c58Hpa+xOryLNisZg0Sw5OjiE1FAMKqxJmAltqXC+QCdD0rxmbi3lzj7r8xWrNKdeQ2xXVKFifzxmeXGCDEo0CsvlKZNyj2qn4OR0yWVS9sIAK2t2p9d4484DbuyNCdOS1WLJdHeH5XzFcG9MjDVqJct1y3A0YnmyAi6Z7N3g+MHrTA4OKetTykIoRnsASEwkFaJ6cBoXu7xxfJdnr15htp6TKGipGcQdLuSUnfERr7/+OkdH+0RbULLHrD5hf3STi/nr7B5eIaw9oBVSsHtwhdnpfarBhKQV5/MZwzBgsTilGk3BVtTzlnU9YzA4oiw8+J+fPcREYFgxKsaYCYWssJRoi4IiTIgY7fKC4XSH0C4od3a4fXyfajpBVpfs7l3l/PQue0c7DMMOrx2/yNHuYywWC7RNhL0DTu7cY+/oBs3FkmKyx/r0BAuJahgodYQEpV41lNqwOxrQtBfs7lzllXsnHO7ucXBlxBt3bnN45YBJpaTFjFU9ZJ1WWKwZT65yMTunmk5ZXJ4gbQGDimYxo9ydsF+OePjwlN3dKa3NGMqIVEZSK+ig5MHDmjqu2BnuMtgJhFWNDZVpOeZTL77B/uEV1ud3eOzaO3h4fpcwHjNKNRb2uH9yj8du3CQRWa1WaAM6KCnaFYmC4XjA8eUFA60IdeRkVjO8OoVZZGdaQxhz6/iEG9evUNma2WyGSYGEIUNbszM95O6DE8LhHswbhuMBIoGL00sGQSkLJUnFRX3OqAxgJdRKLBLaNAgV1s5ZizGpdpg3Zxwc3OT87IwwGbJTKev5JeXeHqcP7nBwcJN2vWRnvMvFxSmFNAx29rk8u2TVNByOD9gZwf2HD9l//CppLZQEtFjx0vGCg+mI87M5AxuR4gnT63vce/ke1x6/SmhnXLl+g9/+nRf51m96L8o90MDNx68g5Zj79+5SyYD1/AFNnZhO9omc0a4SAWF+ec7+zSeYTCa8/tJtdvZ3uLioGY1GhEFivjplevUxhpOv++DT7/2Bt6WE/4evtwHA/41XSkl+6xf+pbS/UzCc3mA+P2UYBiSpGIwDL37iM9x49gkee+c1Pvu/fpynnn4KHcJ8fsn5qqUq9rgX9/nQ732MMHyOv/M/fph28BjNbEFdBKxWolVQltTUlBESQoGxkooUa1QLVBWRCJKwVtEyEtoSE1CFGA1VSOrZqMUhJgklEJKQMESEFBLBIMSSJImkAUmGkEgYRYIYhDo2KC1CiYWAkTBrUBmRmhmgBC1JyQhaYimRssikqqBgyXVeMUWSYQYEJZEQS5RJUQm0ofTfk4BZJEjEghKjMUhCFMVofPxiqEEqFDM8+9EWlQEkQSwhoXDPgEREAsmMUgtSikgCkr9HlJYCI1KiBrUIgUDUhKWWVhQ0UFmBiVBQIMlIQYBIkG7chuiQJi0IQIpGURSklEjm445BoA2IGilFHy8LopaEaIgFjNYnMLYQCswMU0HFMJSAgQqiipmiKrQSaa1GraAw3+K1KGpgKoi1Pm8oIoIkQ6Miapjin1EkUv5baSJlOUBiS4qCFGNMElBjgCZAC7RtEUvE2EBQWmpAie2SIghYgQkUUUCFiJHEPKBJoqAAEhYbVJUo0CIgiZAKQoIkIBppkq9diYbfQAgWaMUQw/dAMIyAml+LaIGlFiUQpfE1E0ELwUwoxWjymgNFVUkpEbVFxOclIAQpSalFk8ceMyNp8Pky//zChJQSVoARCcWQGCMhJf8drRBLNLSIRUSEFkOLEiGiCJL8+k0iJHztWkDE70siERL+35IBaAsq0LSRgQRfOxKRoEQzCAWDVjAStYrPYcjrEn8vVYVYAwmNipkRBYIqUjQkGVKKsI4tIQlGDRRgQigUS6A2pLUVbQMaa1INYVhDUbK3Z+zKmoNJ4P3v3uddzw547sohy7tf4Pmn9zh6/Cu58+InWTYDRpXx4PSYYTnl5vVrfOHFL7J/dMhgOGW5fMiiWVLXBV/5x3/sg9ef/qYX/r858d+6r7cBwD/l6/VP/uIL87PPfGB++iLT/Sc5efASj914N3de+yIUgeGognaNitOsk+s7rMNVXrt3yc/9wj/hw68sOb04YNWOiALVoKAIFSYrClNMjCQJyee9poihRImUKI1GSJEQSogtGoTYJqQqnPJPQICVCSVGiyGUCAlJ5kE2JUQEExDDA4clGi0IBkkchTchoaaQDEgEAmaGiqExICSiJIzCx6mBRCQEoU3RzUpiJAxNIFIS8IO1yQdkIiGiSIwQ8L9PBVFrRAJiiln0MYpgqSUkhVKoDdSUQhRSSxBHGS3++2YC1qBSIElIIUI2bomYH+ytODixQMIwS6gIagKmPhcC0UDMD3pVJUUQNfwMFlJeH8E8IDU4xYsJJkZIDqZSaQ4MKBDJSUuKqAYHH+oBw2GEERQaxKWTmA9qMRQDBAtCHpYHgGSIgrQJRfF3SkSNaHTwpWLEJPm+GiEEoiVIEAMorhsFESQKSRMQ0VRiFA64VDMoSWgKPt9iWMwzIYkGcQ2qbRAKiDWiBWIBxYjSzVpCxEFYkYRaHZCUAskCkhoSCdUSrCaZEIMSzCBpf30Ahvr/UvIxhEARIYXkQCe2aBGQ2hD867AWpFLWNIgprSYUYZBKsOhB3twECBtgbIUSktJKRAiUMRI1EU0IYkRRNGZwoOLAEgfj0VrA95aJA2/FAS19MltQRd+rEUEtOQA1QWNEFForMvBJDpJUCDFiUmIW0WSoFgSMOiRAkZhQzfsK/1dVAYPkHx/V1xdANKFQJVEQrMZISCSDbiUlKCwgIdFaogoVta0BJUlELFKkIRZb2pAQSv/cECAFqlDQasJao44tSklgyZVhw7WDS77zT34Nz+2OeObxMaN0j93phJdfeYm9vR20bVkulzz+9Fdx++UXKff2GQ4aXrt1wv47vpn3ftOPvx3b/ileb0/S/8nr1ssfeuGNT/ydD1y/NkTkkE9/4iN85fNfz/1bn6Ya7LOYnTHemXLlyWcIRB4uI7/4P53yt/+XT3PcTDGpGFYjJLaeCYRASg2YYUHRZPlQjWDahxSznNlZ3nApIUFJUfE9a/RbVTxAA5j4MR5JfabQv58I27dcRDyws2EDTMgBSfPfeYDwM6v1AGZkBLH1HjlbyoPww0u6vxU0f25OKkmtZz2KEC31P+/e1xD//3wNZkaBEHPgtRxwOyDT/XdK0YGFdN8Lnq3mjLH7noOQDDBMMUn9XHfvFcWDv7CZX5FHvyZFUjAk5Ws0I0nOtDM48nG1DqQkEFKDpYDjhIRZyPc0+mcHsCT5czYBKDwyDvPPykFp+150P08CksTHktfQ5t6bA5NH5srZgA5sRDzzK1vJDEfyrFk8eASk/4zuPY2ImJLMwKIHfs0AQQKWWvwCHVxiCVPdZO353nYg1UzQUJKk9QCUABki1tDQUJHXnWbAquJrFgiiWB+IAyF6BixWZ4CEr3sMNcFEkJiwUGHW9GNwtiQhJs4eYTlDN0wNI5FsszZCyO8jnmn7ilWMhJrQ5k/v1rakiGqmypL5OIQM2LVnHySDytYSmj/Lun0ugsW8B9QoGiUqPhbzygzNmy+Jvemed0HdPLnQAmsFgrN1iYAGIyVPELpEArRfJwABB7Pba8VMSJIcknZ7NW7WH6XvRdpALBTTkiSQNFCtDIktImu+4ZnEv/DPPMefet8+T77jnXzyt/8e46pgOJryxquv8c73fAsP3vgs08kupyfH6ChQt0d8w3f+1Nsx7v/g9fbk/CGvW5/85RcuTz78gePXPsv1J57h4nROIlJoZGc0xMYTJqMdYnvMvHiWX/+HH+HvfuqUj79cwWCHMChp6zVtNaBolkg+kCwItAnE0JAPc3MAoPkQMDMsBwJH6x0lmfrDHTaHh5kf4t33JEUSAemo3Bz4FWcZPHgmVEMOvP7effDIoMNfW/JaF2At0/ZbwXkznu7wzQAgtqgGzDygdONPKfUAwz839e+/+WQBS4iGreCe0CJgMeU5Acv06WaYm8NNVXN2bwTR/nPNEkYgKI+AjzfPbx+EKNA8nxGfY/+MHPTFQ0ISCJZ6OrcLqN1BSRLQgEpDsnwAOy+/GXvOAlWKDLjCI2sBHFxs5lQIOdvfvvYkUEiRx7z5/vYrIP3hLSI5uHdUd75X4gd7ayl/zmbOzfyw1+hrNEnqAUQ/1kw7q0FKWXrYvi4xPH57Rr8JLnk9ixBjBhIiGNHBEy1YohUhiLjUI+JZLYKJksgZbqa3O3Dha9wD6vaaiZYQoQ+0/ZrMgNZI/dfJnHkQtAcRBh6wMWIyCu1kskfn5M33ogPP29ftwdP6+9Hd6zev8z/wMh+nSunBObVoKJAYN5+ZHcIpnz9hC1CbRQd1FBmw+Bro1pezCg5owZmNQjRLU6Efd8d8YNHlAwNss4YlKJEI4qtKkidEYkLI+y6KEHUAZaBoPfkxm1NxwXseF77lfTf5/vdfYXdSo6ngYx/9KKqwtztBJleZVMrscsndh/f40z/0S/q2X+APvt4GAPmVUpIP/dKfT0cjY3d/j9e/eMx4b0hhDWfzS46mY65ce4Kz1SUvH0/5ud/4PB/61JJzdhh0h7g6VZ1S8s0fG0fzecPJI0HB6eUgOKJX+sOze20fHN1hmFJCgwdRE9epBdc4U9b+zbKuq1kT30L8EQ+G28HahBwgIxIyIs+B0w/AbbbhTYFEUndC9MEaS5ADbhDdsAs9S9Fld48CDsHy+3fX3v2rj9yrbfCDdpTCmw/EDFRy9ktymh8pCDmYd5kcljxDk44ezX+f2QYJpcssWK6z9q+tDwyN+yJyVvvme9hl8Gqas7VIioKpOcWaaVUV8XlW88NOhYD5QQmA6/geLH1+e6AjQGz7ddKDv+AehQ4EqG3WVRdcNmyPUcgGOHa/o6ZEGnzh+Xv4NaZHgEiX6aXoY9QMGP29NyBQRByypLafQ8mSkTMuDj2jGQWaKW8jE18906MacgDxcSBCsiYHegddHr8FiwkVB5Z+fSmLBh1TAkkFwTLItc09MesXrctR+NfZQ9EzKx0rhoL4+wj0QbSTAnyNhJ7x397fPT2v8kgwlSzHueigfq5Y2gJ3ETVFi5KYWhCX5yTLWB1TICn2oK4Df7BZz6bWs0bOGDjjINlnYya9jCBkBiuDr+59yewJltcA0fcfxaMMZ14HZEmhnwOCVy/ZGizQSV9mRiwrn89ygCSjWLU8Obzka75C+dFvf5bnritp3fLq6y9zcjFjb2cf1Ni7/jjzs/ucrow/9T0/+zYYyK8vewDwmd/4y3Z6//M889Vfzfy04e7rLzEd7UGqWc0e8vQzz3A5eZL/7lc/xc///bu8NgMpD4AZZTHKi7tBpaRNDUHc6NQFkhBKUhvRkLOMNmehGVEHFNPUHwbb2TG8OSvdMAGeNeRsTV0DfXOmp+qGnC5Q+r85wzE/kToa3mnUTQZiWYOULhPM2ang9K0f7I9Slf04DWI2Yz0SrLOxqk1Nzro96+szHwxEM0OhxOgZWbdMN4CgQMwNioab15zSd3MhpI3PgY3s4Jlh1juz3hzND7CgOB2NYHiG2n1uMo8QmjPqzf3Y0PROZ9tWtr4xGxJyMEo5oJKQfACHPMg2QaGQcpDvDlSnmTf3NPSMjf+9JEOKrE13EkJeJ5C156xjb2eNXVBKKWVZKm0xTgIxg1KRHADcTGcqXnmC9UxEMKf3I/ERgLG9fnvw2oGNXo5IWz+Tfi2Z+T30TFawWDs4TK57o4JKCeb0u6pu7lOGEJ1sRuruLfm9rV+nm33oQc9wsOii3KPSVg/G0UdArAbp91n3NdCzcB74I8mUss+ylUdDUOoDvarS2hYr4+gzrzPeBAxiZgAzPa8FlmIPtgLOzHTBm5DvcQbMMQfWIu/fjunpwYHrMm46TeqnjG3OCfeV5Pube4yIhP7zO2ajTx56H5LLcj0DIOJ7OVT9vBNbOm2ok9JM3RSsWkBMxKJwWbJVikIZLE5519UV/+6PfDXvORpy997vcHD4bh6ePaSeL7n+zud5+OAlLk+OOXzX+3j+/R/4so6BX7YX/4nf/E9N6y+wnl1QVQdczh5ACkwHA4a7+0zKwIdeHvHv/de/yen6AGSEFDWWAmpOf3UbSjrqUgvXPU2zE996DbJ/dWJnavpFreYmGjWFsDn0u0CwCewbzdA32TYlG2hSk99vWzcuSN3BmjPibuyi+ajMZrvu1fkCukzLs3TXP6M1iCiaNoHVsyZc481oP+VNLJ2ZUDeZoFnMOnBH124OVy1C7w/ori9hmeLtHN5+4OlWFqOWcgbvdGlPO26BjC4L7V7uDLdea+7ByHawkE0QezMtv2FlNhlxJKKAJgcBVpZ9EFB12rPL/roMfOM/6PwCiVLLnhky2wRv1+3pKfo+wFuEoAQ2AXuTbef7snV/PZAFly+2rmXjA8gHuCTQQEjOMvRrLgmdY7UDNg56E4HS75p2Dnyfs5QNel1mGFNCJZFUCU2LBTd/dp9jmsFOErAGkUAbI0ENCaGXAkzM1wxAOcjrAVKst5R+9fVmPkJytm9091cIZv0acrNiAGvRHNGTAFY6y5EzfNXQA80u6/dVp72M8Ah7YF1glp4NUC3ccKhFNoJqBg/OBqh55q+qWyyCr3mV7FWJ+fwh+fpIHtBjli62JR7X/D3YY0LRV/7495NAjBENwXGtGJbcdyAZBHaMQ2ckjBiSk55tZrKbGttidrp/O3ZFxOejRZBQ5XPFTZHS1H5/iiEaSj9LykBs3cSqKRKtRTvfjAwy62ek0wu+7Xn4N7/9JvsHNfXFHaLscnDlMU6rhkQeAAAgAElEQVTv3Wb62Du4f3yLVEz4pn/+P/myZAW+7ADAr//Cv2ZXD6dcPLxFNd7j/u3bjMohg72K597x1ZzO4K/84uf45c8KgZKmnhGKihRLzOYUCK0oQtwgWwAp8oEmPcJVPJM2AYlZN9VMHWeaUC09Qtdu9L6NthaxrL9usuxOT1Vxx79a4RpsztR8M4XulxHxYJyIdNp+j8pFcuYMXeaISqbVt7O4LR3aOVxQdQpw6++8JW03M5ZHn+i2fx9Q3xT8nXaXR5gDet97F6jIJqk3SRHZQGlCP57toL/tTeiuyT+rO5g343ByZONZcGwTXObJAUyy+1q3/BMmQjDFci2WpYiGKoOJvFbU+izfh+3ZdpfxY26a60FhNof1FK/mg5uNhu/mwI7ald4T4n9nYOru9C3K9xEmI2eRGrpszPp5E4vuas/rLxF7sNJJACFn2105HsnBZcKd6gFzLTjRly9uDp6UAU4LCJpNcEk9kATEQXFbg0kPLJN6qZ7FNQXaA+oUDclZrgp5bjcShcimxLXzbWwoeqG1SCF4wC1GpLjGUtzyRHRyXmbx2DpERXyfxVxSZ6nPuDvmoNvzXUB3LV17f8XGUOfj9SWTwWSnsXdMXS975b2RzaxkQB9iQdSOadF+7rv1ZNqBV8tJxzYwdZAeTHqwE7IkINJl9iGfCW1OgKzPb8hX1UtqUmYDqO/Nnq2TjrUJiESiDvNYc5VDin5GaJG9JNmRDKgWtCn1xuUiMy4kI1RGU4OUFbaCq/U53/F18KPf9zU0q1cZlLss1i2T3ausFsfMFnDv8pjv+L7/9ssKCHzZAIDf/Qf/sSVeY3V+zGhwyHg65qUvfJ53fcVzaD3HyiN+8tcu+B/+ySVSubalUSgSNFZjVhJCwGyNFEWf0Yi1WZkrMuXeZVWdOU1JakgT+/prC2UGAXFjKCMSKXtasqOoO113W0MUCSgtWNHTvqUojYQsRwitBB9P3hyG191LKViMJNW+jrmTBbb1dP9+1ueTl4S5ocrRf+9HyiAhy6KZPi/6azfA65dzPvCIEz0zJVtswvbndmP3gL0ZZwcQojwKANgyp735fcQ68sVyVULRMx+6Fegdh6StuQ89fW6q9EamkPsY5Mx6w1b497GYKW0PSJhnclIMttgY62nxzkyVRPvqge5nIUEreaxxIwl0ckPHCnQegW35QMQDTdv6tSTcYxA64InmFrctFOVm/tQo7FGKuGOiuiDasRmSnBbuM8PklQxY0RvIxOKmEqDTmc02mRsRkptTLXkY1FCRxINjWs8JwQMWQbEsxyhxc4Nxc6cbM80BOYpYi6WEBXVN2RJCIiYPpoJSqNAmAYl9kEmhRGODWdwK2J6hB8lGT1fVHLRYlxToFoDyDh69j2NrzW57fIJllqKTREQzK+B+j0LUzZD4dYR8/iQEUTxZiIkogrByIJlXJCoQQw8ODPX7RvLyQ9y8mszrh0z9niYNlLk6IgYhtGsHTRnsSaYLROwPGIp9PymYIRJJFhyAmDMW2pUY51LUnk2zErcoFbSYG1nVzYeYl3O2YpR5fxBc+ilD4fOz1TckRiNo9Gec6JgEjFa3+LHveoof/uYnuHPnRcaTHW7dm3PjHU9T6JxXvvAST73n2z/43Nf98Av/u8HkLfR6ywOAlJJ8/B/+eIrzY1J1wN1br3Dt6j4DmXDtyWf48Me+yH/x22s++uoAo/EFTaBQvAsZBcE7nXhmGbrMOeTf9yYufv6W9O70VPeL1kv8WvfGmVOqCSGo0ZohqQBWfSbXH+A5y1JTUi6VEmvpdOcua+lQeaQzKHmJVqcTe006ucqgzeNX1wrRbWKB7SXRB148cIo8CgDEXNOPGf13mp5nXxttvNfJuyw4RZK0qBWIWc72JJu3OraiAwWbHKv7mY8tz3OmsDdlfjkjEv+eA6miz0TebKrss7McpLvsyZL412zGoVn7xdx30OYsKKVEIfqIKaozaia8rr7T13vTXQZvSCJR9E7+1GVPxiPX2WVl27nJNs0fiY8ElO7vtjX5mGUcsYZGCt5/9Yy/9W99A8/9xY9TCiBDH5ukP0A3d2V/QM9IuUSQx5sbN1lq/Wep9XunipDr6rOFzRdVegT0eYGKl4CJNVmHd9BoKSJxhWjlVLWWzggAFoKb97RyEJJatPNwxAzQVSkQGuvo9gZN3hsiSMTbJHRskZvQfE/nksXuLCGDB1EvmcuLIztA+uDeAbiOTUtRCNJ5MjbSVrceO8klnyJ/oNpCTElha61KJ+1UflYQSSlSFlNn+Jq5ryaTbMLN4CMoFpvsb9GNudAiSQWk6MFXgdBa6wE4lCQVQrPyZkbZc+RnUOobGXUZfZsDukaBkKs2ZAN2t6UgZw00s1mRVA4cpGlnQM6HUyj69dxJC76nOj+TPrKfgdzgyBs/BWuBmtgqWio2X/GDX2/8pX/9/Zzd+iTLuXF+egFBOTjc4/RixdWv+o4PPvve73+Bt/DrLQsAUkry23/vX007MkfEaFUZDf2JZ8XRDT7/+Rl/7Vdu8VtvGKGAsmmxokKCkGrrdaTYtFiAgbiW7nRoQqIhue+2xdSj3W7Tiwi0bQ7cigTDouRy5YgUgVg3ThFbRMUPjpgVWxWjMd+IvY7WZegx9RsniiLWbeqOUs5aX24yY51BqAsiOavwXMAb03i7lLzZMv1vElGClwxmWlss9zFQzzg6Y52JEKTI3eOysUqSa6La6Y+CpQbMx+qHfqYUJXuyO5rfXD/VEEjJ580E2pQogD9gBOwDoELWNnuPgoF3MOlAg6CaSyOtoyPB2ATbgJBi43Rydjn3FHd+DyDr036AapYGEoZJoMh8iCQjFLLl9re+PFG6MW8FGjYhZYvWz4G86z73SCngm6pEMk28qc/fVICIVqS4hlb59E9fQ+uGv/p3G/7mx5Yo3gXRTYuhP6Ah95ZP0SsU6CoD3MSY6MClbej01PocmQOjmNkvyVIJpiRrCKHA6oBVBlL2Ug9pTUgOBCRFahHKcuRgUwosrR0wB69MiMEz3MAQ4tyvOUWsKKA1p5KDELQkti1YS8C74wm1A/lQUaXUe2acffCsVfM8mySSlQSBJFkC8QvO7E13fzZgLCVydUX+79yzoMiiu/s46J3wah3wjtkLpFsST/C/l+CNq1Ik4l0JfY26tyaKWzSkSI5pVYmxwUIn423YIp+rFqtGrq2n1tdXUpSmB6/9nFiWuGLl+2rL2a/iVKUDaOtBfxQXkCwJqqX3JUiNS5nlGGKiCEIkeOWKBJLVlDLwM0TazFxkGS9LOEEqNxWr7xsvR217SdTnMmYpRBk20Ko3lWpag3rGD//Zp/nBr6rY2V9w7eA5ZosLTuYnnN+5x/7hIdWNP/7Bd/+xH3jh/0r8+VJ5vSUBwEd+5S/YE9NLbt87I5TCfH5KCFOe/WPv56f/1mf4md98SGsVSZJTXBqwbPDq2nxAdsCbZHt2lx3gdbSpRVvXHS2jWqey1c/yfBB0pU3YxhktMZsIAQslklundgc2+S8hU91bNGzaMrq5lunWM5Oyp3yTei0y+XOSKKIBiQ0mBW5Rapxa26Jp+6Y4b5pPCaGnbz2z8GBS5IQ55QZHlqSva+8P8s5vYFmbtojR5ow9IF2YFAMpPMOzuCkTxFAte6mjq+Fmq3mMxQiEvla/MzF6npD9BpLpaS2Ipqh0bEK+Xmuz9g+25U3YjIP+d7ta/biVaUsyp0U7mYHuYM33nLjxGTyS+fq1+ILIVRLWZvc2vSsc6IN4F+C3M37gkQzdfyc88rMmRYyamPb56X+x4huvvky5ew0prvJv/FcXfOTOmpDWiAghZ/RdfX73+d3XmnX+7vO6LDDlzFBTg5vssueio4UzWwPOuqQ25v0yQXPL2iY1OVg0zphZ6XvQvB9DkxokJihKAMrYuvvdIhaqHDANY42YoZnO7ipIOqqd2GZXu/WSQlfelyxSSpYnJPVO+85Nb+J6vnUGUHEZ5A/T8rv96msmSxIaHvm5qeTun50foXvfTZldB+pMxRd+Z5LUgtSuKfC5jI0bBJO39/QWyB1Y7NgA60pHQYq8TvLZEiySrMUk9JKJZmPt9pmDjDLQ6zL6jV/FNHjrZhw0StuStHQpJRQ5eYi97ylY7QZMHUDhJX6W1miooDNwhk1PkWStM6LZI9OdO30Fig4hZQNhZuO810BFESNRvPvjQBPLuEaWyo9891P86Le+m8WtX2V+4efH5eKc8XhMHa7xJ773r7/l/AFvKQDw23//L1s5+wyVNpye3+fas0+xpwOGk4pP3H2M7/0P/zFtuIqQfJFLwrRC2+i0fAINEbVAoiCl2h/mg2eyRQhYarCc/WKJUJS5Bt9pLGvXdCV3fX19rDGp+iwp0lDkg6kNBRqXfcblWmr0znLi72HSOcm91CwS0LApAVLLkkMoSck1O1LzSDkhBDDvzZ40gHTNQISgbuTpTH4q9IeBH9RZjybAtsaeD6euRC4lwBrXvsG5jJQQSd6lLHjWTmqIooQukGVpxMqAhCHWrHqq0A2UWWhF+rntwpLzJa3rvln+6I1pGvosxIecS/RScofzluRi1nWT8/pqC14/rdn4J+6WcngoAwcy4uV8Hmxi3/PAYsREKIoC2kRSkM7l7b2Fc/c711xB+gqSrmfCdjDtaOI/TCJobVO+t20slJQP/+DacWUVq1IgXPLtz435Gz/2Dj7yG79Dair2n7zKlf0n+DN/7YvcuQyUTUC1AQmEEGglV2t0GX5n+OqYhS0gFIweUPUVBlr04KeTiegraTJAFKE7jkScjekCYIoFQp0BRYB25fe2Y9ckN/rpugFaImrhrWxSJEqgNCNphLZECi+NI3eks+RmM3IZbyM4KDVvpkQyWumMuJ1MlcEhmT7HS243zEDWr1Pd9+gIIeTb3WYjqOZ52Rjb/JpbUn7GROcP6SQiZ+68OkA0EMwbM0suwXRBoHQd31be4tsKJAf+lOU5Q0nqzxUp8ppKKVGEQBtdFiCXlyZRb+ssuZ1xHCDa9hKZl4cGb9/cVT50xsQtBs2y4bErP/bvhd5b4rUqkoO+w23Tkkh0ia2TvOjYSDcaJjLT0JkgUwZo5mvYW6F7ImS5esDaNSHk0u3gUkkTE3F+xg998wH/9rfd5Hj2OnvVAa/fvsPVJ6+xFjg5qfnnvv9vvmXi5lviQj76Wz9r6fLjtPNzrt844PVP/R5HV6bsvftPcuuLp/zAz3yWhxcVZfADU3Tg1FPwA6Ojz2I+jFTVNxCdDpcNf5I3pKXcsKRzMBtBiz7jNBGo130AjqJO9fcZWUJi41SwZS0+4P0CtCOAtddr05ZIr0Yf2Bz0GtZ2XcnyQaKWg27XKKXeuH3Fv9cBFo+tTjWKlvlT7JGDudeQk/QHEt2osi+i+/2OJA854HY13f62uewKb3us2WXe6XxJQIoKUvLWyaEAHqXyu6w05hJC2LQm7bv8iRssLWkvoIhkZ/pWZUN3/7vWq9ud4fqxy+a/IbMP2RNu6uxOn3UAdAYpij5Q+LxYP95tdgE2IKyr7HDQ10kCm8Dgh/Gmbn0TDDZtgjeeAMstXV3yqdOcddrnm55t+Jl/ZReLKy4vA5/9/H2+9t2P8eDslN2bT/Hdf/UVTtZCZaEvWwwhbNbBVqe/SPQufNnn4vfF6Faw7xEvC9Uw3HQCxFBxw153aHfdKTHN2nOFScDiOpcKFlm/LhEavxcxkkJJlMKBZ98lMrNu4L0bUgI170yJYqHr56DQrrYMkQ2YPwrK70OJUKB4d01IG6NfrzfH/DyMQS6R28yRADEMSOqP/w3WNexK7n+hJYo7231eQjYA430YCG4U3aLP+70fKp/P2FAUVf9eMUa0GNFaoiBCs9xIX91DvroST63ojMhJCzS5P8hlq+xI6GQlyU2dMsvVnTPk/hMuf/n7dP4ASBtWrHPux9rNmP1Ds/Ke01wBEgpMc5lx3usmYKGgyElG54HoPyMzhnQVVlq438Uaz/oFLJt+Vcm9JNwIHcSluaCa/R1CLFrkfMZ/8EPP8me/7iq3X/oo08Mj5lFYnp+zTgXV/nP8iT/zl77k4+eX/AV8+H/+aZOzL1IN11zOV3zFe7+Su7//KYrRDv/Zh0f84q+9yqw6ZCfW1G1EygKjoIjrTCk7PSzrFqkKmmycUYXUuo4pITeNiY6KiUoRkpvAci11f9BnnTfGZe645+K1YsSulEUhNqv+yWS437V37XZ1/Il8uGRzW2fM6srDXENucL+bt5g18yxdpMFSfrpalzX2t1vd0qb5oTFuq88/67Lsrvd5zo47SaQL6H2Q2zBiKq7zdwFd8LF7K4GN8SdZ25uulBaSkKSgUKEpBr6J2yUifm/i1tiDCrFvINK1jvWMsqs03tYIydQmWP/1tl7udKFsstNuFgRS7i1P9gikDFpg86CijgEhywogtKnNT4xrctfVzm/hneWiKUXw38Py+jHtKfUOIHU6f+fABwgSSZF+PUQ2B/rGPGb5X7+u1hK0gXHV8o/+4jO89LnfYe/aLh/5xEN+7RMX/Ed/7hv53Mtf5Kve94185jjwL/+NV9wUiFO4xVY7585U6BeWcn/4XPki4tR8ZoDMxHu/meVgEvqHUpk1iEIwl6RiWuOKu5LEzWfRAlqaSwExP4woFSSp3YuSK0400//de/tCjLkrnTvp20j/EJ8mNZRBaFJBkRaQ2pzlR0oqotWYBFQrMG9Nm/JTLEMhxOxhSdEDVIhrd9Ob5Xu4cfPHYkqqSsLyfLNfxQ2Z2zR/t/42YNeZupRab9SE5c5+glCSwoiUajRXICVaJBsSYzVG44q2bii3HpaURP1Jl7kSR7UgipCiGzexDgyE/LXRqFcIuHHZwUqKTV6TzkpIipt+BJZcZpQun3fAYuJdQS2/rxXFFuPpF62pcZYsdA8nczalSAErBhtAkFkM1Pquk5K8ioT8BEh/mJQRpKZFQQaIxMxIWt/11Pe6G787/0YoEjUQm4Lnd5f85J+7xrUrFbNX7vFw1lLtNAzGu1yuRvzp7/3Pv6Rj6Jf04H/zl37cFvOHTDHK3SGPvfN5Zrd/j9+9fci//7fvcBaGpLYliJvlem0w1R7Uu2wu+iGR2jWqJRSh79XeNavpGmBsN+fxjn5d+YojfkvNhhruMxyctrI2P2xk0+PfNdHaF2iXQXRO+hR7Q423+S0whGDRTTs5k+x0Zi+l8oMvUeTP7cBJ6hsMAf1BE6RwI2GnkeJZeq9L53cGLx/sEbt0QTlntOYaftcISLTwx952aoGn3TnTogvVjj1iREN+9GlROR3erPLf5bKe3KWt6+6mCafWrWMrOoCyeZ6C/z0bA5d1unUHFJRNY6TEppKALYoyl6Tl+ekMg9slk/amXdSBQrpWvdKVvAVili8kywXdA2ze3HGu76CWpYBHqfKNLu9jz41U8lw7xZkzcoFVU/D49CEf+evfxd27L/Hr/+jXedc7bvJTvzXkxcWEn/i2Q77n6wOvvvIKg8EBHz3b58//lx9DiwkSH+0i2K0l0H49+XMOEmiROxK+KbPDs0DP1NWl67bBtPK1j7JpKpQ7+4Uyl0LW9I/njescXLxyQqzJ8+vyiWV2j+xjMPEH/7h5rGPjipzdum8kxZUHoQRBW4SKlBqEFgtD3zcUub2u7/GeOdPCyxuz5Nbdm67GXpL4WRKjG+fE6exNJz/rmZu+2iOzJJ1Lv+OOumZcXZtBkyq3koY2+dwURNoUkTCAtpsDfwpfEsX7EES/Vdb5GvLXKTduSs0jFSi1NRSZ3nes69fiBlCcZdPkT83sKmLyGdKV6UGRy6pzYyP1BxW92VyryMa7Egr3ZcTaH62s6ubAMMDimlCIszVmvu5ii6Ua77PgYKrrB+Fnhj/C2YmITX8CDQOXubKXw2gIKVduSZkZg5YffN8uP/ED+9z59KcZjK5y/OCc/ckOdXnON37Xl27vgC9JAPDpj//3dvz5D1Fg3Lyyy+3XP8/zX//NfOGLv8Nf+fnIbxwXFLamkCmJBqwihkBglWuw81OsoqPrkAKNeLCXpkWryh9CEdcUJGJQuuZ1TnkJWL3JzCRgYeDleqlGabL2lrXnovRH1VKgcU3IjTNCEFqpsFQTbEiUuqcWgayLCV33vA0ACZu6YhKaqUHpegbkB3WIVmjW290kU2KaNbvOTCMdXZ/69wNIYbhFgW+eSuZBSnLTG3eAp2wqFPDsP1N1oTBS2z4iI1hqEc1983WTdXfNVjpwVQp9m16KEgmBGCOlQSNGQSB1RskQ+kAs5pruxsBGZkQUrO01diwg5G5uRfCgT9w0McpmSZeAoPNHuFdA+ukKeVx92WGxebZ6IZVnrTkDciNpgT+rMZ9Fqr2PoHvOA2yYpO7Vaf9dqaNLAm5qbFL3ZL5NuSriz4qP65of++5n+He+dciv/sav8Ox7n2fVCD/58y0fm+1ycOMmt9+4x0985w7fMr3gYnbM/dmanWee5y/83Ou88dDBTEr+CF3NWZ/nuYEmB6Ryy3DYsWUa6BmfIIJROnAuBOqWQgONZIajrZ1hqJcAxHJAlJJCIJUDrI1IWmLiDJokf6gQ+JrUIpu+kpfcuawwIKh7LDZ7aEhMa4pM1ffmMBxMmEwyo+NtnoI4BPAHem2CZlfb7sxGZsVUIQZU4uZhQbnvhOQadtRok/p84Sxdyv6Cbu/6Y7lLTF0idLNszMlGACIS234sVlQU7bqn/a3r6ZFr9JFAbFfZ2Okkf5TC17gld+BnM2QSPPCl6I8ZljYbMSuUmqjq8uT/Rt2bhmt2XfWdv7X3Pue999atWVWlUkkqzZIly5IsTxiMAdOABwI4mPAAoaGZmrEDcTrQNEMHmjgdP4YwNJgpgTiEwQmBJA4YAzFgLMsDtmRZlqyxqlQqVamqVMMd3nP23qs/rLXPeyv92bZcH3h4VK573+Gcs9f6j1qQnH0wj9OwAlC1EFptcIg0e2dX5tOyNIgJTe0fDEQBSKa1QpkszDja6feBxN6qsJkZ/eQoVEqJnAfQYjoU7y+oLJIbF8JJuyZKUULsCN3Crt0o2pQSNQ8+KPbM4ip1/Tg//90v5nD/IMNmZpZmzEtmbSzM9tzA57/upz7nztPPuRf84AffrmePfpg8RvYf3MWRj7yPm+/+Au57vPBt/+aTFF1lFjIj0eBnForl5sGVaocxOjfOMPTQCeQCeZNUofTdItPb1caTxzSagK14LKk2gRTi6t6FUl9rNqVz6oixo+RNUp4DDnHF3q08ixuobQAiMin5bdNqivNy6aG6xXonGqkymIBG/Jc0OK7a9iQOo5l4r58efgsrYXSo3N+zq2+b9cjgUOeGq3h+uOcihIBUL2jxvO8pp8WnaTRwiTYAcfgcuymD96nH4ipsswWp1Al5aO95+rymKti2kTtcPX2ezvODc5mtT51J+EdYoBk6sSLOybv+AY9nrc4TM9EELDbfSWdgIr/G6wfEhpNglIQW471t8wgGdW8pT2p/JprFN+wW+jNt2f6/KSh9gSHYdjxeGPjXP3QVL78eHn7wU8x2HuTY08/x3x+LvOdTHZe96A5SFE4/c5pzjzzEz7zpSl58xToxdhx7+ggve/Gr+Ppff5T3P7BBRyGq2yLFlPYizb+u0+HV4mxjNDdHNX3thGKESRuACSGximBRbKDTYjbX2Jv32+kVpE5iw2lLLHNDVIJdH61uOFYfpBuHXlonx8akmwETx1nYwQg1o/SEuGyDQh2aTta+15RoIU9as6FwIQK9KdKlYnHF5sZpgyERQwlCb69VelO312K6CUkUNZ1BcbZKpEzfb8UG90YpGCqZaRkhosXDxzJBzOIZtFLiMiEKYTR6Qvw6mbj8ScDHFvrMaZ1Stjg8bJiIlcWA6dZhKdl0R63NMhQb8ByxWaT9RX/ubqDt+qZzjZVO73crxC90BJmDUwRFLPxINEAnlGDXoLmPBhR3MxXPOalikH+UacAOLZ2yrEMIBO0MXwmYG8HdBjF0lyRbSi1ozGjYBgW+8qYLfOerthE4xYH9N/HA/Q9y+Lr9nDx9mitv+3Kuv/O7PmfO1c+ZF1prlXv+85trn+DE8ae55bYbWN1zDefPHON1/+z9nN24jJQg6CajJt8yi/n6a6XKElECUjdN+BJmFLU0PbQQS2aKGcWiSIMsIVIodaCriewq2AnulzqJtVo6mgliqmUEjAOFTNRMJkI3Q2KijCbekTqYxc4DWlrmuDFnDtuLYGrWzjfj1rU+XiLsC0Wp0QSBGgRkZv/eVcERU8RaU1ezVDk37SpefOMXwQ8nv7FFoFUVE8yyqKMNTKE3Hh87jsX1AvbHoXgv26maMHX4grIQxSBWtak8AbkqMZgNSUgGkav1MBArtQaITfDVYGk7tBe/1z3JADisGgTRZBYmP9AVFgMKTBB/jMn5ZKae9bZ9LcR27fOxoaHSNvQ6qeZF2oPc/ps9XCNNq9DoC5VF0FDNmZDSBG+ryoT4BF1Euo5e+tJ+TojLzLWSxsgVq8/xH9/yanae/hT/4V1/zfUvfxE7lnbxBx/O/N77znLF7TczrmynF4hj5ezjT7J56in+j6+9iZtXnmD/NYd53/vez+ve+EZ+/Z2f5G3vPmeuBizlMlQhpmTXQvHMd4ebt9ITbUu3F58QzY76CCkYND3PG3RiMG/IJrRrGyndMlJGSre0uMeCT5N1AP88m3DShr9q0dtVndoSRCrFD2d0IJSAMrhafkToIc7s2iAgwdAgigvHQvIqb3t2VDKqEKqL4WCiiBLeA4AjR/TEYO+7Sg86B5SqA6GIwd1O+cQY7ZtusdO12pPAr2UbIkfT8BCQOkex76FUE79SB6dXACnEMkeDa2uoLoa1zyn4QlTK6EVGJoAummnFWjbOJ6iDqf8tZMSXAV8oanEK0HUZCHmyr/r97y4AjQkpg7lDKFvqpO3v7f/v7WdV4/ujZmpcMtGzmmLKHCoBaw+0bmTMv9YAACAASURBVAnVOUESksWGr5imzgn1wV9aYBmJ0NtCEIiOFMCUyeHW4xrENTGepkpHiOf58dce5u+9Gh5634fYd9Mr2Jg/x3zjJGn1Jl7ypT/5OXG2fk68yA+951/q6SMfYt/lBzl14mlmyzvYu1N49ydmvPVdp8gsQz1PlY6WRd9JMl+pVAqJFE1QE4pN31V6ksNtmeg97hYfiUTK8jZEOmIefCIFGoQtdiiKgsbeEAUtWDOZQgiodAsvdNlApYOwbJC7FOronJ3MFlC02I0FpiWImm2QUNsWTRW/5aYsZs2pGl0x3KxJfthPjVudbfliW1mQ3rlIV98HoQX7qAseQzXltYhxuJW0QA7Af7Y5JCibVA/mIXSTJ76oWFBMLfawage/LhrfQi2UmOzzqQNBrfvdIlfrxN9OyYBt+6kD0Qtz2gY+ef81bDlcceGe6wmQCSGgNi2Ds9rt89PFoS6ho8XUVhYH+gR3t9e15f9vyIHRRS6gdDSltdMFwQFOR44aQul5FM35YZuT/YKtNADFA2uKZfX3SzNknrg4P8pPf/1tvO7wEU5unmN1xyEOXHkdzzx9njf/8qc4ejGzcuudhJXt0/cRJSDjJmePHmP9qUf4zjdczysOrjE/f5blbSvcfMvVnNfL+Oa33Mcjpyt939NppLCOCITamQBP6pYwpAVKNVExfqhpqZPWJASzYrVAJKvhGaDYNS6xB7GyqTbEaRXjlh3ybehQjTP/7qM/vEdTlhPM606PFNOWlOrcdjVHDmoKdHtDgaKGaYlmG4x966WOqHbGrYsfxm4rlcaTU8xRo0olswjbsmuzhf4URoP664L6M+uw8f1NpGzvpViIkyZC9OFIHWmr/vctB0RslFYstljrpl1XW8R7JsxsPQnRQ54qWROoEnRB3anfKBK2pEBKchtlcZeCmhhRLWsk+rNQ3VmkUs1loFAkTsmb6q9jakNtdmpVC/SJs0uQNKTa0lHNhmsJgD7kmTrWn1PiMcFqw3zosOxnG+iMouynKOSAUUqtZyKyJfq5DTrKtOxoGdDZLq7lGf7dD+5FxpELm7A5JHKsDJJ49Vf/0vP+fH3ev8CH3vcLyvAk3epejj/2AAcOX8OuK27jd//jf+fH//AEMcx8Wu8sWKRWokQkCtTgB6vlXE/FO3UTggVC5GjQV+PlRSx5q/TLxquPxkmGaCl34hMoLmCyWlcxrlKztVfF5NuwHyBlQMsGkrahMRGwyb6WOUGW7YFnrLFvh1DLMCXANXi9QWOLB61z2u63Z0ppS0YZaBNaJSRkWrtY9VKZFnRUU5q2YNECbglCkvGMLuATKbRO78ZpFwmkOlCD3fRN2dtEXY0331ok1DwCllHu/mQ/jJIPBMH/ranmM1YLG1EGam4Z+MU2AgkTfQE2nAV1aqaOiA8yWrM1itFg9balMwXV2GuzA0XUFMVWNeubqxsLwD8v3/ingXDLcAET2HHJ0GDv3pwf9ndNKLqI9m3lNS1cpvGzEw1lv8UyHOIONtee5csPrvFT3/sK8vhx6oXAiVMXufb22zh25Cx/+KGBP/rISfZcfTPl8CGSWo1v0zyECHWunH3g4+QLJ3nTy/bzPV/3AnJ+luMPPMRlV+9j+fKX8wu/9af8wQciGytLREnIkN37PloaYrHNrLbWSGnhMAtao4W4VC9LCiFQyzhxvVoGu2+D+eQ1Jh9aB0NnRH0jndu2KZ7LLy1Fr2lJigUBtWvDy2osMx6Q3oY0BqRkC7sJ3cRpB6qFTGkrdTKI2AKjvADJ3RiG8DiloBlt15xE6xMgotEzOwouzqsgHejAIoTKLp0YOhsu2tYatnzvDXX0dE7Ug8i2cNgmDHWnTBMZ6mhJnVPRD1uQJbv6axD7uXXuvHukaX8UIYlYoidN4Bp9qaloNQSg+uE5ZQiALwou0nNNQPs8210HCweUkZYmaM7+fYjYNVvEQ6/Urxk1seN0rWHIJOpIrioaV+x1BF3QqmJnRsBqwe37EKMPgi1O7Uaeki5RtIyGYsicMAo3XR35pe96IWnjCCOJteNPsXPfPo4+d5HXfM2vPq/P2Of1i/uL33yT7j+4B2arbJw5znyYsf+6W/mut7yX+y/ssemc7AfAwnddsU2K6HCPmhCOmgmSCGUkB0iVKXs8V+hCZ4dynE38XcxW8SppGZIJYJriOtTRbsDQU/Omq6+bqjn4ttIZ/Fc2qdKb3oCmurVNziD4QovIDWXuCVdNeFYcXo0Tl1dDtO0mKBQxcR/ZBo/aQlQyGpZNUQbTJK9iU7dBndGm49RByZMnuj1wDP438Vcpo73+MvdBxvPOa4ZgkcatEnQxNbtynuQRuIZKtHjh1iBmb1wm4VLzxkP2rIIWXuSaApId7r5DB/83uM6jFfHQ5EPBbHqT9U8DrQ3QXm9waqcshiFvAGxJd7EJAeXSAw1YaEA8Whg8h71ucU4453upot8HCtdpWFDRQlNQJdi2L9UqXoOwoUJPhA6qbvIle9b5xR/+AsLsAo899DjrFzKre/YgF+cczz0/8JuPsbRjFb3sMLv2X0lNjfqBWgopBRuehwzrc04+9DHS5jqX71W+9/XXM5sf4wXXHWI+nOaKq64jLe3jTf/o3/LhM9cTV1dIgOoIOpLs5jNKI8RJPKuqpNh7yp/fn44GtPhaux7tUJgCkVxrUFWocZGdkCRRdaAF6rRheBrMXYthQ8aSoWIwaQ4Ah6LtoV/rJrGYvz7TDlt1jQa0UqeGPtRhc7J4tv4Ns2x6MmJIiLsekNFog7zhE2E0sVtK1Bos+CsPE/onIZleyS2DQiQrdEEY1ToQEp0NpSF5SE+j4NRb97yQK2cX3gbjyl0zYc+WsWEELmD26wyBOvoQlqbsDLB6YemWCON80tNIs/y3YbiJDcXSDYEpwdQaTkea/a9pR6Jxqv7sLCa8jMH6BKhoSltaR+sl917TQ9Rg1s1FU6pVAxvN1yFBzQ1WWwlbB5Hp+mtOHZs6vagsmEB1sTgIQp6e4T0BTTPGus47fujlXLb+3zhw8CYe/uRxDhzcx4kTJ/nib/yd5+05+7x9Yff92Q+rlJGTzxxj21Jg294D/O1j2/h/fud+zrDKTEZq7Cdvtk2TlokFgZDENsXYFNYQYqWM2bKu/XA3aN5FQbVC6u3wkWpWpfaCUu8Pf3WmGsxrL/4Ez3bR+6EqEillJHaJkjcsbCgsmYI1Jgv9qcUhPhffNW5azHM8JbupWwJjoKoJfgiWlmU3mcXSBs2enV8nuGyC4b1lyyJ1TRQZYk/xxMCiVscpxfztNsUb50uIVE/QmtrrmpdY1OBeNauPORHwEJ66RQAo0zCgEkjZ+OuCPyh8YLCtzx58SrLvN4JU55mRLUEuEN2e1TYz8a2nTJSDHcZTGIlYJG87zDNK8ljhaiMSsW32/tordbIBAtP7AJloBwdJmNoASp22C/tHzkHqggppmgH7mfwPrWg9WsbpMEFNla01McjInnia7/28q3jjF+7m0NU7+Mg9H6PqJg89eoqXv/zldDtW+L6ffR/H1w8wriyxcuAQ8cBBQ5+AUNrDPYMqMcr0WvI459zRx9g8eYrV3PFldx/gTV+wkz3bLnD/h59g7+4LbNuxkxfc/kre+o77+NX3nmVjZRddgVmzuNYt5UQO30r0nvgtsa1mOa/YYOeCLcrEP9slHieoVtWvQ0/Um4RjgrkeNKLMCahnMZj9rtbshVV2/USaJdWEpkGUkAsaI0WBYMiBtvKtEEzD4AODOrqgIg6vDxQRc9QEuye1HUiSkSqIGrKBH2466YZ0QWW4nRFJ1h/hjhKJCbSnymDX51imnAghe9jNDGFOyCMl9DQLs9ZNz+IQG9RCpGpn22wLn6qBEBUtm/bdsfj8qx/uIsFpkg7J69TQEzT7XYOhIa4jgC2hSQTbtIKAlzO1NsPJVirq1spgAU8O7SdfRIqa70REacFM5rCIPiRaAFC2j9/GGu/Y0KCgySqxhYX+R4weMd0K9nk7n2c0MYuDvzTHkYsjy+hDhhIZ0TqQ83Zeti/z699/E8eO3sPqzquZbd/Bkccf5fO//h3PS6vg824AOPrQH/zksPbYT6T5RXbuOsAzpx6j77bz6398ml/562eR5Qw6s1IZEaJ0zqFv4WKrZ2qlbnrQqPP/djAXn76b6KRQotl/auP68mj8U82Wr+2c4HTDYLaRKMkTuUzurC6S0tQTsl3YbcqVuGSwXoyoRoJu+gPPBIsNwquqxBAmf64dK5lFZ7dzd6FZWZYM/ZhgZW+pMxMrAEHFN97qN5e/hyBTk1st42Qns2neBFLqTVxUIUaDy6YHbxXz34LZDnXwbanzXIVIS3lrhyxqw1qo6tyxQfVJvWwp2u/aCpiD6Qqag6C6K2JqhcPg8Fxsi24Ih9I2E2gBRqbmb0fhFni+ViTGaWDR0tCMhSJ7qx9etdqh7wmEC6vgIm2wDQAL+NaFXFs2mJabMDrkG0XIxeBkKZn5bJl+/Ry3X93xTV+wj6988fXMVs9w7MiTrM8T5888g4a9XHlFR799P295+0d575Ogu3aBdKzcfDtdv2z4kA9KvSextU0GP1iLZmLX2QB4+iLnHv8YAJ2s8fM//CZ2nv0Y508/yd69+zh34mnuetVLeOgj97H9wEu4OOzhH77tnTx6YR8r2zpmXmWVyyZW0arT5o/3HtRaTSCGTteXClPAi1IMXK/VhKJSgeYQMJQoj0Z/2bZp9wpBvObYt0Mxii2ik+c9omZXFLcI1hGk98OhglqUb0CoKfg9ix3oDQHSsEgzDEqoFXWKrbh2IGEHfIO8J0FiCFDmBOmhblA0+UFmQ3dpdArN22/VxCpMtdDtmYAr8oVi9uM4M2+8Fo/7DeQqbrfDDsdaTIwnXj9cIDDQHH05dpS0SkyKrJ2zYb8Wy/JXRdLMxIMNNXR7ssHzhqAohupZL5na8xATIUYLEkCx39+cEBbpXJxeWFwnjQZKwWuD/XuLsbNnr4qjwvb9KhaKZp0RyZ+PhgYE8NCiauFsbdlqn6k2lBTMxeBLmtuxGy03UQTVszhqoI6n+ZMfu4N+43EunF9h36HA00eO89xm4nXf+u+eV2fu8+rFfPTdP6mnj36cffuv5sLF06zu3s9YnuP/fOc69x7PhCJICXYzYj5nywNXt/wFQkiEOpoqtXirFZ0d6mUTqQlJlZqtjSvHmQlK0hJZAqEM1hPQL1P9cLGgkbzlYW+iPEnq026js4snd3VkiaTmIyoZfMgIdYSYTLhX1u3i0uRBRaY3MMWTc1XeO9+kaqGlrqnS0vBaqIXZoKwcBBkQOopE2+Q1u3xn9Onebj4rEzeBjGBiveav19iZlQsMLgOkzCEYtB2jpbVV50tRUyWLW3KqjiSJiFRydacDDYa392lOiuQ35Fae06F8+63237DkvHZ2qmIPS3DkxAawRb2q38jBxKGq1YenuLAo2q7oW6lBpzhl0aySwIQgCEwISNtkWxpf2GJFbLHF6gNgEHUmRqaAkkt8857i0wqAivQM88JlK8/wTa84zLe8eg/7r1jlox/6CNtWEkdOrDMMiasPH2Tvzl186KOP87sPdzx6YmCjCJJmrF59HWXvLlSVWUwwqkGepU7oTimFrusopZitNS1SEcWFfRtHjxDOnKXOR7pu5Lv+/gs4HM+ymk8T68DGvBK6gbte+gK27b+NU48d4y/uPck7Pnae9z2hLEXxHovRKRclpc488xGmutqGKhGoTTconR0wdZwoA0kdgTQNpi14qWi2g7EMlicv0fjymu1zFbG/l8pQlV6MTw5+3yYJaNdTizldDHlrA6bdaxISJQ/ELnmErL3i5ggStQbNWr29LnVTj0P7vm2znE35+iZ4bXHe9rus4tihej+RYzbhJ9O1U4mi5JLokrkWNDcLZEAk2QFNE/NZEJm9huQIwKbfS9E+x7JuaF1RchCk20WlEOfn/Vr1wTZEiiRMaFmn653UOhFMD9Du0zaITweONyiaDTNhrYLQOkjaUBLaM9fdBTVEJHUUFzyGmiEtUdW3cS1TfgCxI6rf62JngNmaLeApiA1lKh1WdT5Oug0TL4M6TdmcAVYm5nZWkel3xephRzpn7HqW1gPv+IFDXLN0jI0qHD21xjUHr+XZjRO8/HW//Lw5d583L+S+v/znmsaTbN+3j2MP3MvhW1/G2rDO1/7E33FqvsoYoIoJsrQUSKZCpXU+Bzv8dRxo6Xmt8a0UBYrxwAg6ztFkm4JZyzpqC6uQiuYGNvtBaAy40QA1UqMQ8jqC95OLUoe5bxItPrhbHNJB0c018yLHGdlz1kMtaN0gqjB6YEVQC95oh3rj7NqFJhKnSFBgUvOaQr4B0uGS/2YTrk/FQSb/uU3fdtiGtGQDUx2nXPoQm0p2gRhQ1imaiJKdj7XtSLRx6PmS71X8oajNG1zzdCO2gziKFdYE8Gm/WOpZwHlkl83XShGhc7xdkwuAtBCKc7xeoFKrV5C6kGzyIufBIEGvOxXUdSBb7ISCfbeSXVzVIND/f0Jfg7S3HugAVtVcDYNw21tTsW9N/Bvb+0bQAhuyRFef4598Ycd3vP5uzg9HGceRnDs++eAD7Dl4mOVYyNqzd9c2huWOf/Vfj/GJp7bzxKNPEVhn58FbkBuvR0JHiApjq4Bm2l7s2vH7Rkw0WsfsEav2Wi0MxQ+0YYO1E0cIGxd47tQ5dly2xC996x1ctXqUp5+B9WdPsHtn4Mx65NSpM9x5xxWUzUS3+w7+7P6z/Ox/+gin5h2zZJ7yEOL0mqRLhKoULzaaxJAO2VfVLYMwE1XEZMP1n+P3RR0HQuoMQWouGl1QEjCxfogIedxEqCQxCLmIXbcRmXh2izvOFtDUhtguIdUHPt/ag6MGEgMZS+20YdsS81SZrpsWldtonlAG0GrbOkqNs8mmpxTTLIzj4oCnmsdfomeb4FkSAnk0mJzB6T1BSktFtDwKqa1iWCY0tG20pVpc95R14X8MZfXIYdHp70KIVOMZaLXeOt3Pfr2DH6R1Wj4mq26tnpNgTqLqGgZph7ILRjXExd9Fp32btkrnRh+4CNEohzTpQ6oa3jrldqTZpKmCYAJDCtItGULVhra6WAQ09Pbfayb6YjGVM4n//GzX2jwL7/hfr+fGfQ+zcbanpMIVh67hkcc/xSu+6jeeF2fv8+JFPP7Rf69c+BQXLpzkwnMn2b5zN7sPX8mXf989PJ120I0DkpaxAE/j3iR2vsWwmN4LCz7f6yybd1iC5aubuC9YKlYeoW6AuMI3ddRiN1oqo99MCVXzZVcxcYsdJBtoWqYSrRKzblDo3S9aTSTYcqsDVsU7ZmqK0G1HywjjunHRLpOzaNFqVhpVg7Y88avBXfbm3K5SsJAiT0DbyrcGMTFMQhiDc2cKOXWLA2cK4gHSknGb4+Cbt9MR0ZSw6pt+FLWhSedAszTh6l21bAXbz+ylOm8HYXJRTKJE1x2Ac+H+oGgTuDUUJhs0PO+/SPSHKtTU+b8rkD39MAbn3+OklrYDwIJBQhk95CMissglUPXtpg0DU3NjcbwkTsOmvSv7v2kLN63BBU1+gFlewsIOB1u4fqLxxlWQZIFK66XjVXvO8ws/8mKG9ZOcPXmWD33sSZa391xz1WVI6Lnrrht5+sjjvOt+5U/veYTjZ7axWbaxUddZ2bGTbQeuJOzfSVxaRktwIZVaCZYPYi2opiFJwR+o2T9DYphU3CV4ZTYjWiN54yLnHn6IzXPn2LGceM0XXs0rrtnFa+/s2HfZFdx37wcZh4usbNvNA/c/zotfdhvXXn8dz5wS/u17PsWP/tEDbE/bHfGxJEWJgaidw/QW2lPK6HRbdN4c5/7HSTfTBoiFdcxQDAHzustCvd2S3hb0jU6beamjeffLADFRXMHfKpRJnaGPoeV8mHhSOhtAI15P2/XUrHTBwrGqmhnPbxCzcbrQNUmw5LpoSEyL5w2ihl6SYbZKzYUu2Pu27b93tM2svk2g2kKKqPPplhZ60A17ToR2kLmOR+y9tAHGYHNBMq5pMXGfjlvuT3AoX0DjZMsFQy2gToJAQzbtdWSxzz0qLq5bDMDi9w5NRONGQw2dJz7as0MZIJgTCJEtYWX+XaI+/Nv1gDakrcV/u4CvjnbhUdG0grkwRmLoKC1CWo0WbSgYWoyWVdDYW3R8rLaApg6VaOcNttSZjiFT6jpJd/B7b97PDftnXDh5lG5lD088/giXX/tKbnrl93/Wz9/P+gv4u3f/S+3jSTbOniGGgT37DxBXdvP6H/9rTqztBhlM7DdWs8jJlmYycc+r2zpi7Gzry5lKRbqZ1T+GSi2ZGmdufcrQBYIKMg7OjVU0LXm06jhdaEFHZBwo0rlHPpqwcJijqYM0M4irjlMegLWw2SZtrLxBzbU6lJmWLFO7DtM2rUGpxXktBhNoiVjQCWGKIgXbHAwij0iGElo/HdNEP6pl43cErzL19DWCtXG5GbbBeVvRCisqCViMrXHnVoi08O5aTGmkxkgaByQZvJ9RYk22RZFBlFrMkkRs+fdN8ORpiS5UtNdvWd6CVba2psaKurVvwaPT/OUOvVdZWPykQbetezyYmn4qKJGCVk80m0RMrad9IUZrf7baDIEplrl1t7fP3spx/LpUV/270Gyq0C2VXAueLE0Ogcs2zvKOn3s9V+xa41ff+nb2Xn6Yvft6XvlFr2RFhdWdy/yL33of7/7oGseeHkirB8iY0HRl916Wr7qauDyz7yEEyjj3z9Ben6Ro71+VFF3s5DW6TbjWHDSd5ytY+54NCk0A2nUdZcywvsbGxganjz1JLImZZC7bJtxxdeEnv/3lrB97kM1zc1b37+XBTz5C30Xufumt3PNw5p1/8Ry/87GTrOiyBVT5vRu65KmSMtEvhgbY4T5JOtt9X2W6BIyGiRMfXf0kirFzC5v9sea+eMkAYLy5oXzSbLGOKkSFHNvPtS16soW6jsGAZPenx+iWUT94dIQCMc7IIfqwblRCqDaMTrn8ERQL6JI8d7Grq9PBnj9loU0Au3cJRiEZ1Td4W6l3aKgL38Z1RLrpOpy6MlysSUPlnL4LeXStht0rTRUvzq9Ltd9bdSRgYruqI03JHzDFft1ywqjD9PhzCM9YsPtLrUnQnwnRr10j9fopd2GRLdFyXtQGdq+fbsFZjcLREIhhRq1G9ySMIgI8Vri/5KAHu180pum50vRObEGRmv6DYG6GUNSuG3/WiBakblo7Zt3Gu35oL9v0KLsPXIv2uznx+Ccp2/Zy5xf+xGf1DP6s/vKPvPstmrjI3l3LPPbQB7ny8A08dHYn3/rWe9nol+mxOtMSHdKpTLyfRVgWtBZKVWIMxklLII6bNsl7pKVlhSeDqesInkktSdBiQSMhCdURgkRA3RIoIVHqYPKhkiE1T7ldLCV1EBKpCca6nrEWUrZNkdTZzVGK35D2IGn5BKEquSqh9wtOrfUsYBe1+WUdZdBm4al2jJnnz/K2S5vqDU7U1Nu2pNkogxiQXCmpR1KaDjito8GT3Wx60EZxv3QFNJswrla0n01QtwY1PrXZ+3x7t1MxTnYu0WKWvCLTg7O1G7abOXlO/4g9DKN0TNawYDXN9iAzuqVpA6aWRIzPLxIWUbSORFR/rdEPXnXtATC5CaKol4G0oh6/uWELRLrYWlpSYytWEodprSDKFtTsH4c1DpSJPkDDBNN2EhhPPMd3vPEGfvA7b+Cp+/+S93/wMa654Q5KXefaW17A6TXlV37vPt734EDo97CeCikuUYqy/aqDdLt30wZDQm+vrxSjk0KAXF3AZoIy8QChVoVMzaQgCwW2W7jMRVMmqBr/vGN0flQwRODiedaOP8Pm+pyimZwzKzHwwis7XnPzCt/w5XuQ9cw9HzrCTEYOX7+H5b1LfOCxffyjX/wAG5s9XSiE5L3uIdDH3gaQ9qDPlvcgdUEFTA9lHDiKdsC076P1IUxCvaBTal0LmWoi0aCjaYhqtetEOoODg2lqLNdgMYRYJLbfa7VVaVvQToidXbfSuR3PDj3Nripv0ds+xIoWOzSqUvsl2/LzSGzIEVbslQI+2PggonZva/Ux3//eLI7qr2FhJQ5lwyB/NWogxtn0mijZUTqmRELLNQiEmg3iVssKMRhepqULt81SLGFzoXnAB4WRiUJUrzbWOrl+NPamI1CjXezfNTV3JLpotGRrYtyqd2quAMsqCR6u5fZbSRA8vRAfOKhUtf4X05a45maLrkpVDdp33YB1gej0vLIUb7uWYuqnGGyrHU727K3ZQ8UK5DkaK8x38zUvOMMPvWnGrp3XcOqpp0jddh4/forXfOPbP2vn8GftF//tH/9TjcNZVrevcPr0UQ4c2s89n1S+99+fZjkugW5SpfNwFYt5nYIeplYn821b8I17OWMiuuiHUu1g7DtqNWgtJpueS1Er5JAEdaTG2SIJqj3sx4EaZyb+KaNd3LEnq6f55WwiRJHJ311DZ9D/sAaoPZtj8q3DuWrntwWbwGuDvKSYylaEqm5VE4fkFOPBJE7TOqV6FKsFiah0gFuOumWDo53/NO3AnNKtGE+n5pwIwTdBtZzskMQPqWrv0XlCNPqWk3x7zBYEU9XEQK3FzIVxoRbQTI0GFwIT1CgxmcoX7IG3pS8ggMFqJSPSUattXHb7JpiERU5H+IMk+I2o1YRrTaWtThe17gDR4pbJluhTpnKiFjyycBvIJfSG+r9rgrJL/9QJNjcURX2g2lLTSyHXSu+2qvXzx/mr33wjOzcf5qnjpzl64hTXXLmX62+6nR//lfu458icZze208161uYDqV9iZXUbcfs26o6dREk404xQGYvx1c3f0NAG6S7NlEiSkBTJ2SxlMQolu1ecZOUonopYSpksgpPewu+RPgVqVka15M0y3yRfvEBe2+Ds+Qv0oSLPPc03fPFNXLPrAl/16sPc/+CTzC+e4e67b+OZs3N++6+E4/9YbwAAIABJREFUt/+Xh+hniaWuI6sVKrXPuV037fdD9QTLOmUZtKFP3fON0xqtVvl//K6a9bUNCareoDm5XwwBI7W0TZkOnBCCBwkZNE0MHuEdPJMDO/ClOi3XoXWdBV0WPOPC31cIaN4ktfIdxGxl0pm+J4KF8dh9Ut3bLmWw114bjG7DvAnmonPsCfJAUQ/qGTd90w6gvQ9FGarFg5vLwbP0xWOrBR8m7PfUOHMdjE7Jg2CaFw32LItqOqSWczLplYKjSRUXdYYFjVu2BHZpgdgb2hei2aodw4muW5oChoIhk20RUbeCa+wX373rjpqVtgvmLmj9HoE8Hf6kzpIdAyDdJU6AhsYQPfTMv60a7foIdcpe9GeuIx7F6MI+znj9XSf53153iJUNZbMq62vHmOt+7n7Dz35WzuLPyi/94H/9Eb24dobL9+1iuHiMcT5w78lD/NgfnCJGkGKxnEVHqM5XR1NnireGSegc6mK6aVMywZ+IkmsmpQ6pmVLMjhKDTFG9UrNvFAbXl27JtvYQKK3sBgsiqX3yB2nv22Wl+qEhIUzWkeChQ80iSLJWrTpkzwMYofNe6xZGUrbATAjCMAmbJDn/XdXev7rvGFztGycRoKetAFxS9VlFbKIlgLhAsVRC7Mg5E7reLvZsqENRE8dM76NmkluaRISQDUqbFPFaKcFeY4OJW0tiCwWyv3bLId7E1RwSjbezoAYP4AmGtoTokZ/+/UqgRt/kfXNXnVzINuT4AxrnPBtX37aFduPmWsAFeupctOUAOHTsuoM2FLYAmEaVND96+8y3/rFt5lKVfysXqdmGsaULp/nz3/h80vwop46eIKad3PgFX8Zv/PZ7+cMPnuPY2i5EAvO1UxQ69txwC+xYNtqjMGlDrJCptbjZgRA8jEiiCepaW5odknZwhRQJHnNdFEQrqZ8RxGD4vl8iewpe23xKUVr9bdqCrGlZdKvnnElEuppYO/0sz50+jtRI3hi589Amb/mOl5FPPcjxZ54jxcpdd1zPL/7pyNv+wydZ3rZidJNC7DqLes5+KAdFsy62w8lNYu+nQcbt857+FB8M2hBB44ONqpuEvlsGRhMYRsijCwLNblibliTFCY2gVKNd/AC3Aas1ICZH0QqCxXEzwcdNCKtTkE/LG6jjBiEuGZrjNjh71tn3KXUDK40yiL5KINTBliS3/lYN/uywsB/qSMsakFou+ezMXSOXbMo0t1Ku9uhQz/FIM/P+q+t6PDhoqhN2GqXx+q0iWIO5DIwUNUW/ku1JKdbBkLb8zBB6JASyC0ODmJUvisW3S7sfica9i8PzLZDMnU0aLhU/TvcjW8rA7D+aiLuKDV3+s0SagDQiWs0S3kbuEI1ujjLpaAxFskVnrBb2JN4gG+KcWFZ5zTXwg685Q79zL6mfU9bXuThf5s7X/eJn/Dz+jP/CD/yXn9BtKxdZO3OawibbVjo+duQA3/v7j9HrjJQitcypzAjBeDYtSkgdtXFmPgCg9gWH6lYPWmZ/8MIMEwHWJhz0vwM1RECgSzNKHdFScRDLxHI6IKEnxt7g+jK3Q9Wzre1QqExNWhIXIiWHjtoDQl34FjVQYmv0c5guzezirJsYZe4qdY8FtgdDcETc1PBaij241Fuuoh+ELQhhCzza8vsldM5dWSRnQxZUOhLFvP2t2EWiZ3m7fa2lBVJJZcNuOq1YKxw2+ddK9GHE0A6giSAnQaCnjklHdvFQJF4C+VWnZ5BugmbtT7CHNmw58IWWbti62SsLz34TGzaFr6mUw4Q42N6Gb/b2KNFgvHoXOgsf8UCYIpYEOI7jBAEHyagsTdtnDDbcNeGfJdhl134IMQljUS7rnuOP/sUXM//UX/PQU+dY3q7sue21/OTb7+XBp2bMVraxgbJtx15W9u2lJocjs0HHDeaPXiRluQJ2bVTfQO2/BWpQQ4SqQ7Up0gJnFmJQd5WEiDqNEGqBLvqAtsWa5ehYVNvBm/gsdYGx6IR4eBwSOhZ0c5P1c2cp59c5tGcHh+Q43/IVh1iqTwNww4texv/1ix/h9z/0HEspEGNv9dzgDoXoZTWdZWtosUCc1EMN02dh268NRaMG33wbND4Yj0+rfI5T9kK7L4z79cE09FCzUw8yDRF9TN5Y6UNrbAl3foBLpdTOw6tK81ugOjPO25GkWgqdtM29EGIkVytTilHItHCsgdZ0GGqhaCTo3G/zOqFX1pER0GoDQkvek2LJpLYUuMYAodQNomD6J62mmYrurHLR3eK56u8tzdA898+5WniQmIBZaNTZALKdWjcsjl07iyGvjpxtcTCBIQf2YY1IjZToTiWiBfqII3cSpwhztNIMwu1+UFVCCgi9ifLQhc1PBcoGGnpDEBrvL4YABTUaVVz5X4PYMuctsFVAstl+tQUagaehCtRqdLLqdC02HVAtOH2z0BOl1PPifc/yyz/wMh770J/Qr+4hSGWz9rzijf/6M3omf0Z/2Sfu/W1dP3s/508+zp5dOwkR0v6X8BX/6M+Z90IJHTVXYifUQUm9bfmhQp0EGA4FEZGYrE+cSvGtFt8cpcydMza+XmJvEFZ2mMy0KmgRuzCkmO+zDhOXVNuhWQZETEBUJBiMroFU1mFcs5KOfobSW6dAMd4rxC2d1nUBMVU1RayoUQwZIamQyqZFVbSpl0whGQePbaNTIl5wtTtl4kQ1RGvJ8+hKY0FMIRvTjJznxK6jJV8VbCOImil2HTs85hdHHpBayASk6+3gKHMkzgyad+eBMHqCgBjs3yx1kwtCPI40YbKulhVvN7eqiRKVhIRi1H8IVtLiFAEetgNb7HjRk97a9RCq6SlSRyiLHAAw6JAAecg2MLnRXASGCtrFCd2ILhZVLE+hYnqSiaaInfHhLIKkUi1MmeIiENIEFYsqFNMI6LjEe37udvaORzn6xNNsrA1sP3Atb/7945w4v41KIXSrLN1wvX0W0pHzYMp9WipaneghsP1XyzghVBULuirD3A5J/6POQbeeBst3MDFXKHaIZ402t5aySDL0+wiMxlAv6kHtf2NKcaerUpjQINHCkO03Jc3kM6fZPP8curbJC/fAt3/FIebPfJQbb72RfvsOvv4tT3DsWVdiO+3gyC0kQzmyBoIsuRo9MNPKfBwZ1QV+KRBzNU1HhVoGZkvbzOGwFOikh75HamYoc6i2sQuVSEemGDTuYrwm8CyBCW0Uz42YukPCwqJon2qaHA1W5GQHmBQX+46DBwi4BqHMiWrvuYbeLcnWkhcZXLPgHSHBWj6Dzm2Q9W6OoiOiTSBtG3p0YXJBkGobqx32ES3rSADB+PLqdMlC2+ChZ0TUkwZr8OwANepFJq2BC2cVJGQqy0A1aBwTFLbyL5FAkURsuhL1roZWAhY6avKt3p1I4rorilERIZhLpKEdNrjZey9hNuUxJHx5qSA0+7FM4tFKmLh+wAaGKpN+ZhBxWsI0StLQKOw9W+uqDWZURZM9U0LsXGzaxJnRFjuNhADLWrkwBN78qmW+5tXnuXBmjYvn19i2cycb4x5e8dVv/Yydy5+xX1RrlXv/+PvqgasPs3HhGUK3wvLKNdz6v/8nlvIuZkEYyugCNRfguWWvqHnS6zjatjr5QC0RTPK6TdLMaCleWopD9cm56A6tHSFWdD6foPYkgTpbpY7rBJnZRTGuE0OmOHdtlJpN20GSPRx0TskjfRBKSORk27B5SZU4jlNkbO2XqdKRglmOOl08PFSdUpBgG33bhmOy/vI0MwEOBagGF8ZA8UM2SXDF9kCMLnSkuHvAuF6hIEWpKVC1J+iIcdbNAiSo2OZWtNkh58bP5WGCSRPCPERiUUoXCNn58y2Z/GYrc7EP9j0NmumwQ76Cq3dNUyAiFIf30WKK5Qbp1gypkrJNa1kHs296uEmW5AItD4DxrIdpYyN4NLEFdtSazR9eDN0oAZZrIMsIz55Flip7Zxf5B6++BuanuPv22yn6NEvhALv3zshhzpPH1rg4bufYiQt84vhFjp2uPHF2YL45I+zsmaXt1PGiNUzOlZAGxqJkIl09z5cemvG279nP448do8SRePhL+a6fvZeNcUbNhXjV1XSrq/5wW2wUTShGaJoMy8MwQZNPb65VEBeLJVeCazJ9R6MsTPRvB1fxvnSkTrn7GpPZamum1dxI11snQVRDiUolMhjqUW3oy5hoT2KgjEY7SLaAHqRaadDmwLlnjrMyDty6C9723Xfy4Q+9hyuvuIpdhw7xJf/4/aytr1LSnCjQd8uUogxV7d4d58yLckXY5K5bLuPzb0u86q6bOXHkk1yxe4UDlwlD3caeXYL0Kyztu5pzj36CEycGth/azZMPr7Oxsp13vuch3v3B06zFVYYhEvsO6W3wKTGyNAjadwYRjZVpUXXxrFR1kZmFdVnmvw+E7nIpbkUTCZQ8pyPYAC2evKd2fFMyJdrhVCTQh2gW5egbPc3REYBMliW7PjYv0tVCxRaTTiy6uDkpqJY4WcpAqGotgtX0M0KxkLCtdKEKVos7TAMPpRIYUempMSK5uZECNNi9HdbSo8livmstlM40XKHaGmSVwc77V6sv71QmIV2tpufIfW+vQzdB00I4GCHX4M/EbAOJiyrR5JSXi0e1UtOyDd9VPazMItPTRE+a7z/FFZTOlpK4iPyOreY8eGRzEJDk7ZHFY+a9sC101JyJ0fNJhkxLJK2xd8QMqNXOMJSNKnzPl834X+4Uzh1/ktLNuGzXQU6u9dz9hv/7M3I2f0Z+Sa1VHr73rXV1qfD4/R/j4BV7eTy+kO//qT/njCwZNOtqTylWGGOBP2ZPSQK5mgJc89yEH/3KBMFJGc2u5zeJYptKIKIVQrKfVWL0qRLqOEdESdLb9hsCoUQ0WRa9idQSoQ7GV6sV4Wg0Pl109C10Rshm2yvJSjyiVrQYVFZFCWEJjTPIm9QyJ/qhWzzpiojRAx46EtyaY6lTmUhvPLtzc7GoxQk3URKCjHNIYfLM17yGpCV0aSeycZrQrDxpZYoXDtEg9yT2unVKP7Nts0qlDoM/xMTCulw7p2ICwly3IDKOaEyRnf4+tB0uuG0uBCpx4kpVPLSFYYI0J9td6y6QJkBL1DpArcQwmzha/DsXbSIt+90pGDRtTXCBWAobwxpJlnjh7srrXnsDN+26wCvuvJbd2xPPPPUkF8+d5tzZTa697kpOnD5HLgM33HoLD3zww2zfuYf1c6e4+trLGYfArp0r9Lt3Ey6u8fiFXTz81Bo/+v9+mAuzXawPK3SOrgTdZGO98q4fO0g5dh/9tp1s23+Yr3zbp6jjKmG2yrbrryR3yw7Bu5K6LHhKEUVHi6ZW56gbF60+OBGSFbUEvSQkR2MwiJcW2yrQLU9IgmqdFPaNymrVqI0SiNjQpGobT9/itEumECEEo+oKrovBxGguvgx43/3aeS6cOM145jSvum033/ZFy5w99ig7d+2FbdfzDW/9S8awi6KVWVFyLly+WvjWL9rL177281ldOU2oa4wqPPvoA+y87Eoee/gB5kPixDNn2bFrO+sXN7jpun1szNe5eLEjzSLz8SKHr7+B7Tt7VuIS4/oFVnbt4MxJeCKv8mO/9hCfOHqOufT0KzPGGumqUYGkHmjbnG/7QRaZ8U2g7Pd9E5VJnNlo3Ox2bIGsq13PWUaoSqJS3auftdJFG44tZ8QcDJkAcdmEnnmOaDbnks+ANri7BEYSWt1D77ReaZRPqGaDDZlaWupmsf+9dASGiUZohzseLdwEedPw3+6/OHNXxYCUlpbXuhUwMbAs6nWtQtlsyvYzgjlzgNhSPV1saOmJS7aJE0wk6DkvWuaG4DS6SBpSY0NxpT1L7TVpzTY4iPVgmCzGkTFZZHhMlr8qtNyFSmua9decR+jiFlTEW0Ic6Q1bKEdRLynTbHXXITMfAl90OPHPvrmn3xSeO/sMy9uWGWd38MJXf8+n/Xz+tP+CWqv87Z/8YL3isit59MH3cujQTWysHuaLf+wDdBWiT8nGk5aFYrpLaHbuu2aHuyphKJQUCd0KVaqBdsN8EuaoJAQ/tCUhFDfKW952rZYTXrNOF3CSQE0dIRdKNMW5FIuYlLxJDpk0BrTvLfNpIqEtrcucBVYGZGIp6xFAbfKUNLOtYL6BSsECOgZCcK6qGj+ODs7VG+JQQiJ2ySDQYlsUIU1Wtlg8QkhkofiPph4OjBYgFHtzMIhQdSDI8qQL0JjQvGmHRlw2eqR6Y5mqNQXWMon7ShVS5wesmoSnBxMouv91LkIqAmlGYU6MM0K+SCVOPL2KLA4s35aCYsLKmqFTQrWhJJBtk6rG6VECJTgE7jdYm/inFrY8QopQYD4q2g3Gbc4rr7xB+JUfeik7to9s33WAk0ce5S/f9QH6nfshPsfOHdt49PjAOIfPu3s321YO8YlHP8k1h/byzIlNTj+3wTVXbkNE+MRDJ7nl2h08+eSznF8r3Pniazl81S62zXrmm5Unh1386K99kg8+mUml8I/fcIjXXP0QGxmuvesl/P0fvp9jFyOzPavMrrqBIGoFUmmJqCbOag4EimHaOgx2uLY4YwI1j6TOhIoaLSimjIM9gJsDIkWDvouFyIQQKP0KkQR5c4K9Y3QhVoiOPIzeagixsyRHPFbYKIlN6ryYtkBtCI7ROgCK1/62iOouKmTLXy/zgXxxg2ePPsYr9g988+dtZyMnrjww47998Fl++QMFzj3Nb/3Im7jjJmXXSs/G2hFkc+Rd//lvOHjNbrZH5cTJOfuv2E6Oy9x44y2cPn2aoyef5aZrb2TnjsCTT62TtbJ7KbK2AU8+cZQDBxPPnd3g+FPnmaV1brnpAFdcfQ27V3tCPMCxp5/jR//Nffztw8L5tIps72B9g5koJSmhCCH1pl8RQwQa5zs9WP2A0CaCo3H+6oI0tQ1ddUqSbKE0SayBTn0gs0hcO7jUYWuV6A1+ToHVTK5CquueR2GoRGSgBDW6LmAHvLYEwEhtmQgYdRSkt5Q7raj21DD44JIslQ9ABC2bNuxX0yIlydQmfm6fgaht8GD2SvVHS3PnBKNZSmj6gTQdvkHF0UKIrmmqrmtBLAgoFCUko1kV0xOY/sN+H2Dx4MHSXyWakDXFJn5sOoKIo/dQbVGMxdIXrYgrUluqkdTJch2iZWLULhDUIsSj4WBmV1dbuuwL6ky7VgylrNk7JlAiM776jjN898sDSyvbOHNhJHXCbNdhbv68f/ppPaM/7QPAX/3+9+nacyfplwqXX34FF9P1vOGn30/oeuOwRUz80rjttp3ESArGf7agBlVFxmze6sS0bRMKld5ukpjsbVXx6E2f5orRAaEWiwIOCtLTCmLQYNUl0bvJuxm1WGhOP79AjgK5GN+fImHcBCpltgvpltBhzZrpdMFfEtKkdpdqxS6SIjUPU+FMdG5MiYQy9xIL+xNqQf1zUnXFtbQWLffEb2knMwEa4ENBEypKiBQMKmuCJ8mbmLVvpKZEwS5Q61OXyZKoGrxK1AuIauvgdmGfQkjRVnsqKgWIVl5S52iYTQ8FE8xkE9dUyyavwdL0RCJjbVaeQqRzR8Z88VkIi0AdbT5dC/1p3m0kMuomJW6jqwPD2pzPuzHxz9/8Sq7onyWVgQ//zftY3X2Q+z7+MC+7+zbOzSNnz29w120H2Lmyg0dOVN75N09w681X0++8jI1nHmf9orDRLaHnzvAP33AraxfW+NuPPsRrv+BFhHiWTz12lqXV3Tz+yKfo4jJPP32WW190gKsv38+4tJc//pOHeP1LZpw+d55rb7qBf/BP/pxH1rextO8qwhVXo0SiCKXx/dEezhYFq9N3pyVP/mUAicnDmopt3yFSh7npRiZL29y6J3qzqNZivmvtOqqL5lrgS3soa4sQdpqmuq89iqLdMriDgOKdCNmV3mlLWJdveTbcV4IjMVZ7DOPGiFw4z/yZk7z1m67m2iuVP3vXB7jzjps5sRa4+WBifu4kD99/lOVdS1x3OHDDzbfx1KNPsLTzMPd+8lEee0rIO/bz3vtPkbavsrkeOLWWWb8wsLpkaOKYlMuXl1haDrzsup1841e+knz+HI8++XFefesBNs6s8d57HiGGJ3jZ3Xey9/JDnHr6EfbvuYpHLu7ip3/zSd5933F0eRchFrrG9YYwIVWLaimm7Ah7nBlPrl44Y7ZCFwKGzgPAy7SJttS8gNVvJ0cKm/vIrJDFBuXYGXqmxVxFFbRa8VKQ3rQ0uO6gNheMVS3j0DVxxVwFLvbMDdzQFjrmToNuBnnDoGwVtM4nIbb4EGEq+hEkmdAOvJdlDrEn1EglTwLlEhMxWPZBe3a1qvKgRm0VLQSvIzfq0PtQwJFFf7IEr93yA1/UrJRSCzV0RM0mABXTUEQv3gpx5q/VBeWjV53XQulnrmeyvhlcP1bcYaPVaJCYTds1OUYUWoWyxEjN5qTKBKK7QOqk0wiEssk6y/zMV23nJVcdZc/KQU4efxIJmbu+9nc/rS2Cn9YB4E9+89v04DUHOP7og9x88y2sh8IX/sxTdKPBMq0lDoDqjXnKVAcZBUatJK0Ql8z2lOcglRoXGQFBpKUxm+BPzO4XJVJ1jvpGVaupyqV6GmAw738Ki3TBUiHqJoVE6pZcQFPcE1stWjfNkDwn1EwLFBFXyxONY7bUwI6QB9p42YpJJgiMhT0uSSCPc0tEK/Mp79psbs1L6xG/PmDUcTBkYGnmLoamLcByAFQIZcMg+2TtYCEtMVSlq3MbHGq2/G2xXgMryWlBMCa6NM+3kHXJRJK1INEEVpp6+9xLcV6/TGrkKtnjPzOalmwAQl3XASkEcq0TbBy6ZGI2MURhKinyAce63O3B1Db+ilXZ6lBNNxGUcWMdCZkf+Z/v4mteMmMXz7B+bpOjR5/g/o8e47oXHebOF16LcoAjZ89x6uwyf/bx5/iLjz7BU6cD47jCysHLSEUJfUUGJXTKOA5ImMGwiY5zhhjRtXPs6AsrofKGL76Rl96ynRddPiJ1ZPtKxz1/9nHSjp6d+7ZRSoSs3Hr7rbz0+/4G2bGbcuBGlpdbPnpHiCNZA13wQJ9JeOaqejWffEWmqGfR6la+NowVtOug2hZf/NCRkqFfog5rhNAbooJSQk9YWqKUQp9m1Jrpoiv+U2clQMmhVLc/qRaqtjIqq4ROWSc+WYOQUk8t7gKJuOfckKI6DrR8is3TF7h+xyl+/k2XceTRI5xfO8feXUv83UfP8HVvfCmxn/Hhjx/h2XoZf/fkM9zzxApn6g4uhBmzmRLDMrPOwpz6INS5hd6EtMy27SsM4xrzi5vM19bZGMzbT8kMdYOrZoE3vPoGbt9zjv/prps4+fQneOzJE4zrheHicQ7fciMzOcf2q+/i0RP7+fa3vIunx13MukoXDPXQMGB9AcZjm23RwnLMDJMmxE2aNkiydyXC6IuJxRfbc0GLi9tSQLol8vp5umK8d9swQxko1T7rLs/9+eX3Rxv0ZAZSJjdSi/+1rAI1hqZtt5hAcBLeSgeSvdXU31vNrkFyC7YCkx3WyoVC2mYah+r3v4hb5ZataySKZYcAsRp6ZId4nOyOIUZqnoNX+gatk2VboxDzCEHNFZGEyMx6AvIGIUYLbKv2c5U5GnrA7htR8/lHdWpFKllcPxaUqskdMqYDaxZhtHjuSZhirGuzSLb8ENQE6SEQK1RRNCqBhKqdH8U1YClYOJsGpcpIGGb83LdHXhDm7Lnqeo4deQhi5e6/92uftnP60/aDP/in/0ovHP8wB6+9EhFh/cwRfu4ve/7445ssC9Y0ZUujZ0r7g6PmaaoUNatarB4HDKRi6VeytEyuAWHucI8/MFM0m5wEa4YKWIpU9DAUXMmslYptjQaJ28QtfSKMAyrJwjO8t74SLepRrHdcy6bF1IYwJVHZ5m3vI2NZ/pIHA7KT++9xb6yq0RMspt8QPQBILVCiBQARZFKgtyxxu69MQFTRyedtAS5qk2dh4rJi6qnzdUgzV7YqJQ/Ow48E6cyxkGZTDbGAvb9GIQTj3GLO1FgmCDOWArGSPQzDsrHFOhdE0WKByC32VcWCZgJu0XSoVDxkxvoa7JpokcHtsGu8XCkm4lnUG0fyUNi/ssnXfdlNfMuXXA6nHmFl1y7u+/AHiHGdW154O2dOj2RZYengIX76HQ/xRx94htjvZHV5N7IkdHnj/6PtzeO1y666zu9ae+/zPPfed6i35jFJJSQEMycgitISg83g1NIOLd1EHOhWccAPbbfQ+CGg0ijoh6Y/Nt2IIigKAjaK2AQZBEw6A5EpCRWSVIqq1Fz1zvfe5zl7WP3HWufc8r8OifVXUvWOz3PO3mv9RnRzBxS30w0M2c9YSaQeEbTiCM4oBa0zZQjXjk/oecYu75jyCa+cHuVvf+Pvo370V3nuivHc5Uqdr/KG172Cf/sLV/n2dw3OveiVjIuXSN0jdq0bZcrU0Kf4wFb+U64zDp6mDuWK4TxkdDycNZm5RqLiaXTOZYYdNhoRNQujKyKzX06T6w+s7ta+ejdcRfKbOofvLdfdha1JHHKNkpoldtcP0+RhW2YePNQ7tO71v6M5KodR5x3HTz/On3ngo9x/2NgcneM1n34PJ5v7eObpj/PR4w3f9e+uc3z7izjanneOewr7ZTtFJZOm2KUtlN4W1tSwyEptnFy/wflLl5zDBXb9lN2pcXrlJlef+hBf9IY7+PLPv5PP+rRXUfp1Pvyen+VqO2SzOeXihXPccuv9TBfO89e+5wn+5fsuM5lS1D8XSy5IgxCyWTujpcJpMyx5GygRkjNciLy2/llEiSfvJFlcH5Yy9D1EmqgkX0x0Pg6Ba/QRDAJmH3RTJoZ/N+b9Hn2x9A0lR5Ofv09B8akvUWpLqNLEkgMho67LkMVC4sgThGcKtEAMFYLD/V6WswmhZCCjbhcAwk4qhkpa484tbaLnJPIIo+SMsDCPPCE10lyT01UeDqUM8f4IsYoKMBboAAAgAElEQVTogX83kaKatPjl3d3PL2PHkIN4H/yMNRWnTsRWysVScR1UDUG0RFBZ/N6rS6t5Ww3Zn/m8uJcWijTWxYWS9TPP/LYwI6UNF+0m3/MX7oYrH+aWu17KfneN566d8jv/8D/6z3JX/2f5RccY8uP/+MvHy1/+ch77yHu4dPttvOf5c3zNP7yJTHsPdRAX4xGWDNFMq5WU8G1bE0scpfURlMGO1AZMW2pv5HLgQrUBue39slNvk8vqfl3R7Nz3MmgQ9pakYAWkYh2GCDlNbheyBtvzyP4UzS7EgYDxnYlidCPL7C9dmkA3IVAERJHa6ElImyN635PbYEzTGv3p4T9RdhMH9NIMl0Sg78OmEhabF1TILn7zhpEcS0WmbWzLKQSLwUEt7XPRjsgisgsKwSfxSiHHdrBAhAMtxTvVl0zwXOiSod5Eh5GBIa5VkBHBQaKIbrGxI41Gt0HWQleNLIaI0UiJGe8Jp3u18CKm8lrlQUmJgca0zBqlu2QFLGp/LDPazJd/wZ287b97BcxP8Mxjz/LhR36Dfd0y0XjZKz+Np9o5vufnr/HPf+Ixatlyx/YWpmykw1sZuXGYDznuN2FuyEbQMpGGMm7ewCbcJqiDtIeacSGPwZAtmqJatg0kd2r356UeP8fr803+9O8bvPbT7uXpm1v+xLd/hH7bSyl33cepZg6n7BLh0LkUGbTdccC/QD6AXGIQ7WRzq2YW10NIrahlRnKoucTh6lyoi/yahhWyR6S05GjV9F76RIIp09sgZXfRSN7G3w9HsvAGOJWMJgJJSj5kW/PNrblAU1LBNJEXhG/K7mOpoaA2VkuhjspuVt4wP8P/+qX38kvvewdX0p387GMT77xxKzIdcNSPGeduxwf9RjejKIzdDacINxssH1A00espQ41kSkpearO/dpNSCuPgYHW1TGlC2DD6KaMfo4e3c/2xq1x9+kO85TNfzOfe+Sx/5As+jQ+8+6P0G9c4unvDlecv8/IHX8rRxQv8rr/+fp7cX2QbA9LQqJWmoelgOQtdgDZOoTvXbFEqZQsaEs9wFlf0j7DB6vD8Asy99ss/Cw0g++NoNd0wLKrLY6getkFtBrz1r6tGtXEsBDqF0NM3XrPOUM/oGPG9kDeebmcG/raSKNg4dTi+DzRFoRa+BAmgkcRq4u19nq9hIBvXRC3bPx5ClYoL5YY5NJ60kFRd9iLC2kmSsj/ngGhHemXoWeKfqK2LR+6VQXaBHgmJltgu3jypOYPtsD6hOnuDX3YLoUcUnUWMIyMsijme7dBhNFz4qkKPGGMXqjudIm3ni2TJ9MgBSOIZKktWyfIsSgPRSu/neXAz891/7R4uf/DdlHMb0sEBbfNK3vR5f/VTfl//ZxkAfvr7vsLuvuN2rl5/AjPlpF/kv/3O50liVASZHApbLnivHHUQwCJeFjyYYrSKFL8IZHcjqjKFUop3zOsZD+2KVXCrU0IxRlwcoWtboZo2vChkqSBlCDafULQyDHq56C+oDWadmNSgnvpBnTJaJvoYpH4KKE0nz6renQLOfbkQzl8qYUT2vDgvFp5Yw7fxkdyLLaPTVFfo26E6Vs7dbY6FOndHK0YNv6tnIGgCay3SrIKPtRbdA+Iwm4T4pley5EjWCq1E3a+0jA4PxRjq0axqDUtCC+jXw/aaw2Va6H12F8XIJKtIO3XvVNmuFcQudnIf7dC8Bv04mpJduChGH3uSlSjn8fhXt++5EhkgF6Ed7/mf/8yreOvvusQjv/CL7GxQjx/nscvC737DA9z32t/O9//oB/jbb7/CRx475uDokK0csjk0xrlLJH1BXnwCq42UPKjIQzw81rh2c/1CVLMuNNOCVvXe2eRMq35glM3k1riTy9j2HNtZycdPcNCe52m5g82LXulNi32H5ETeHhANqcjpdVLvSFFMJjoCJbz46n407b5VL7B6NvMhK4X6OLuSP+UJM8ije7hOUq/MHoaUCP6JtDJpO88PEA9E8U0o0yXKVsw3UPIm7IklLgfBavX8gOrxwmsLW0l+kG83FE20uSKRYzDGYNjs5UJAvXlCvvEhbjkQrqX72B7eS9rsmccGy1EZvQhYccpof3zCwfAEQt0kUvEt3AN8zgKq+vEOthNycEBOZ6Etkv3dTDljXSkRFNTTEc9deZb9R97Pn/5td/Nfvfkcr7zvJTz0gV/m1371V3jFpz/Aq1772/nB99zkm3/ggzx30/VImgVTRyccynbLKeZK/Ubw2X3PUlXsllyP2F5SRf2Z9IFAqsf+OgK4YbS96zbGTGuNEsmPaKGPhATStiSMju6v4RKMtdYqC46gIfH7VzSEpDL2WLcXNOl5noghZ6LEOCfEGirF7YIo/iOdtkULhE3Ys/6Hnz8pR6qrOFSQMk0KWVgjnh2ZaKtuybsVEmh2xK+fUHRpKw10Ls5ydGnvc9vSUnq0pGeOJVY6kgOx6g4BncAKIjWE5MkH7CVAKy5uSopcAKW1Gh0x0bQpSqWtQkS6kGXEzw16Zi2OCwsp4o2xAsgRb77/Ot/8p+/j197z8xwdXkATfOYf+9TrAT7lA8B7fvSr7PzROR59+GEu3Sqc6L289ds+wD7dHqE4hEgjmtI6UAJ+Fy+1SRmY5zPhy8GhQ/F9Zql8rJb9sMK5vjEgJ0H63lu3zH3l7iwICD9tQxQjfsFao+fiAJoKzCfIvEOnDV19O+jiDpbeTihtDwwoB2sWgYk3f3n2/fCDUTP02b3p28JIB/6QTRPahv9YImkvGYPiL0HzQ2KWxGfedcrjl2/wXL1E7Q1JXrJRNLEn8/rpCf7cHzrP3337ng9dv43cXaHbNSFjDn1rwItWz9APgyzCbN73zmggW4bt/Of0jmS3zICjEf6/lZwn/566Ow6G6poeKHJI7zcZKhTdYNZpVCbxsKaIPFnFai+0+jkc2mJLKGhkn7c2B1Tph7K3KrraeT6uvOkVynf/T7+NcvMZHnn64zz1yEMcXnox5ye4+6Vv4G/84If5oQ9eo+zOccvBEencAWOa0MMNOg8QhzU3FBozvflwNgi7oeDTPEJW16P0sSebR0R3G0y5UFmUwRMcbBnJPNltdgrpYJrQC0ecnhzT2sxRS+ys03NhyoZI9tbInMk50XfHTvUkfPDiTBiaVNe+es/u97fKu+Q7sEE3IbzrkKbNGuxjuAgta6H2hk4bEI3GvObCVk3roS/gOow0udK9df9OhodIkTJSNtR5T6qnMJJvkeobruLKbEvKyJkiUyjex7op1b4ja0FHpcnGkTAmbrMbnEwT1QZ0vxRsPmXSLVXMm9wEkhp2eoq2GdlsqN2pkzwVTI3JwKhYUygZykQK1XkP0agXTKWgTYzR/YKQ0tBxwOnuBk//2oe4O9/gW778ZXzOA3fwxBMf5PrNU+6+9z7Krffyl//ZR/nJd1ym6AYV9+XLkuUgUAZUJToovF9hjBEIgcPXi+aHQABZqYGKNWPqM00n0NAb2eQCTzoyBox5pQc9C8Dfr0ynjhpuHgW820Q1FPMp0UdE5VpdtRlL8JnD0wXGKViJ87Oh+XDNNfBLPSymeCHSKAWJ8JtFm+UV09mjetsesYyyRyRT80TBVtGjKsjYe/ZA3iLi54MtQuK2d5oBcXql7yFPqx5LNDPyhLXqlkvzM19QRtp6PkYnRJcLXSOOUI+6CsrFQNuJD9yy8dAz9e/RB21ClbvzBSbsfk6JWRREtVUQqpLXHBggvn/PYhl9j/aE6iFf+IrE3/pDlfc/9Ovcff/Lef7qo/yOP/IDn9I7+1P6i73jR7/Brj79ELdd2EJOvOpVr+IV//07qNvJhRWthSCmr7x/Tn64LXG8i+VM8GQ+6TNpKJIGXguJ88OSkR4tYSusHVC9uBjQ+YSzNDiHptwaN5Ksqk6TRFtgvOHlKIjD3xtxwaC/0K4ETWsP9aDFxWjzyZlVD4eyK1F8kQoqzpHngPP7C1rslnRArHvwTilctGfQ+Zir+UUrUpDzxL4dY2XDb73tWb7zzz3F9/z4i/i777nIpg2ExlJ1ahplOR3ngNV5QY2gHI8cPvOoWtk6gjI8A8GzumT1+UpK9Mgnt1bRtouN1NMSWxTzpLTxwBibEVKEDnnoiKUJHRVJEZkblIqmEql93VXtjdAueAYAva0Jga1lmD/C//ttv5f7bz/gp37qpzl/Trhw8UHuvqS88+E9//e7nuftv9LYbLZMBwU9dwcyKal4C2KrYW1rcyT6ZVJyON1O3FNsJYHlUHArvVaH0GOrXGJCXTMBQ2fnKlNBig+gokYNa+sS8GTVt4eGMZVCqoMmePtb9mefeUcqeW2S9Ge3Y9Pkz6gJebN1nnm5NADanqzFL4iB6wJSFGHpiI6FgZye+OdcHKUY4s+8R2BDIUReKaO9R5jUYHQPR2mzK6VT2mAqNCDvKrOFkC0EvFKHW54w/+yTV2rT/BlzV4E7GebR2aQXWDt7ODraKan36G4IuG/KEaENMu/g5HSFVMGVPlYKm83GYd9WGVlJOpHx920Rumku1Hrqm6S6MK6H8HLSRN0NNtvCCYbdnHnq1x/i9edP+et/8h7uTJXHP/Zh7nnJg9x64X7+5bue5Wt/4COoHaHqOqCcDn2oEqO3HUuRkkZT3Rpb60kaYWX1y2UMAt2L77j7MIO648npOufMGTNSm/93U68iH3VNL/RNOjHE209lnELzRtKRN2gXmkVpTh9o8lAwGUukudN9kjI2JMJsZB1e1HzASfg2L6Nj+dBFw8szEPqRlHxrJ+g9ifKkxBb6KZTDeFd2K/fvWQQDmEA6ag3I9HTk2/v+JiRPwrRSfFmJDX7x7OfhW/1AKTaz2GNXR5N41sBSle2hPeEMw1EQTyj1VlFLweEvBWHW/VyPFFMNJ4So0WsjpbMmymXYE9IZqiUE5e1OiUrjR//sa7jvrif54C+8lynfRtsIn/ff/ONP2b39KfuFfvJHvs7S5Y9x98se4PLzT/HS++/lC77pXTx14yXAoKo/jMU7JbFEXPAO6wjDPyQBGy5O25l4+x0gOtbDkGnjEKjNDEm0JGhP7knvs7ddETRABOUAkc091pd/KdqAQR/q1pC1nlJpqaDtBNTtVdIH2mZGzuskmjViRyVBPYZWydk3F8nJ+a5IvWu6IVPXA8CsU5gYUhniFq1W95Qk7oMfgyydeTSQDPmATkW0M40Np6Mhp7A5qM4k9T2iG85a02ZMN/53FxAtzouBbwuwHhRajly1q/G91H0IwYL1GNmzyWWEX91Y/GgpEUKoQDumjJ2eoK0hEjDsYm2S4Dyj2U+HrcVKqYSYr3ly4JrTPhyurbbnv37tfXzjl7+MTbnJxx97hMtXrvPqN76Rn3rvE3ztd7+XK3IvkxSOLhyRj867mEkKUswV2JLwLDC8c717CU41F+kUG8zzHK1g6nECAqlk6ryDvW/QsvGhkYMt01D6iNjk/UyaCmXaUmuPbHlBWw0bkq41xKqeEqdTobe998YrTFFCQ5pgU/y5U3zrg7OK3lygeuyvc67g4oO2+ry7uL4mbSeofplQd6wRrODbWCSzIf7OqET98hw2zDIFD22005vuNpADbBJsP5PHBPXU0ZC4PEfrDFPIS+56BjramzftDaWUxN4Wj3yEUWWw0+Yq7OZVzuybi8Kaw/8tOdxv+1M2tUbQV3QhFEW2ZW0ETDljxQfVnCfaGBR12+u+7qLXYQSdoeSAmAeZJgbtlCkO82HG6bVjnnj/O/nWL30zr77to7z/fb/E6z7n1bzijV/Ix56Bz/mz38fhdOTfkWVIS3GSC3h9OOwwKmoTPblQbUm/XEKc1sUlbdyRkyMPpTn9l4Z3U0zM9BD4DpUI8+EM0RiQxYfIWiY/9ntdB/ClKEfa/myEMo+2lTrTFLRnTKMXAnUaM2eaZbI63VpNyHnZ0AZEgiso0vc+BCf31WsIeVPONHNLXxpOVTRLJJmwdoMkyUOmrHsaZdtheg6VU2zIavHTtqOPgUyH9HKAohG/K2SEtugzQvuiNLoOVLaxeDoFIsNWD7+RPFJ96dEIPVXRiWbVh9tWyZrWASGJfz7WnDYwhxEjulrc0jg8XnyhaLw8aQSN7Q6QJLja7HTHz33trTz7sQ+zvXQnh4eHPHPlOr/zj/yfn5K7+1M2APz4P/0T9srPeDWPPfwQL/n0B3nne5/mK/7FsxxWolRF3GKXoued4LUX4lPlDMaqsQ3lzDAllYLVujaPWSgodVikojn/vdY44vJUn6LUhU7z7BeYyprvTYJhafUru50pkyJcyG/DPeStH6x5gb+g4PWbo0wOc5phfY+1maQTSYS2dHoPXDGatm69Gq66b+Iq/0XstWToS1h20gKFh3hLwmu6WARTbTBmL+RIroJe2ubcJ18RKVF2kfHKTPd6995RiV6ugPkwC+1A9ktkqd5ekZXksci2wFu+9SYZNBHSyIzDLWw2yI0bKI02/K0uKH34xWaBhCxCGw+rMcpmyzzPcRg1FzaZJ0TaSHzaPZUf+6a38N6f+H5e9cbP4/q15xnzzM88XPmm73+YOh1Rju6ilA1pM6GTrja6EYepAKNGJ3gnRKL+/1Fl3u0oSam4b13Et/U8bbDqFsgBvjl2Y9o63UGrwfM6otRLdnV6Fubw7jPM6RwSSQdNi7fq5QTWXDE/XKFss5fApGnjlijxwUxteElP7chmg9Tuu5gYPTmHatEpbyEKzZMPM6mkQCSMufuBi7g2JUUt69ovEAVHEhcO4tqdPoTUTl3PY2Db88h+x5h7bHkuBGstPtM+kOLq66xQ93uEaJjEKNsD2skO2RRPiwznj47OaFFTK/H3EUVaCyFucQh33rORRG1trfNFBZ02pDJ50mUpvhVqiiEqLrDkz9ayeRPhLGFm9Uhv0RDgnqVzWqswZT7+3nfy1V90H1/ypvt58uF/z0te9DIu3vdifuI/nuet3/zjHJQjpPQVlSM2vyRhX7MBEnXg5kr+JZPET7GODmj6giY781hv3xgjunk+cYg7JXqevAkwBgAVWQWEHmHrAxQLdRdVyjBCFLjoNzwhVfu8RhuPPjvX3WAkcb6+HPrQ2PdrqqfmA/91PGgX794bTs0CWMQBt72/j7q4A6LYSLOjl/OxIz64xsvPxwps/Wg2oelEVqHVY5ZqYclbt3tbtFemaH3sA3Lkz2ggKDqRh8c/C4MxPDK7287THUPJj3hddAawQOqSb/9uhV0aSpMPX82F5mIO7cfFRBLfsEyXrANCW+MBUUmWoLWOsSenc/z+B7f8xT+458aTT1AOb+Xa5af4nV/2Q58SPcCnZAB4+z/583bnxYmr169x7mCitT1f/L9fYbs5ZK/iBw3CGrNoFuEy/iGp+AYz5l2EXTiEJ+ZIgZmQW8VKppuQ7CyghlE9Mc/CAkeit5kiLl6z5JWcWep6oSVVxAZtNJg2zmlKJGSNhvaO1RPIBzFgHCHsV0W6iJCtuyc1b1f6YRHHjF79MEuePZBSvGQ2kJxR80l0BPft8b+GlcRoZ01jzr1Fo2H1i9FS9sumN58Y84E3flmjS/KSIQcSg2vNSDIqB2Qd7h02LxdZPNySlD4KJXlMaLcUoiGP9LSA93UA08RSE5yWAQcfDMRsDd/Q5Jy5YKi5k8KSB2EsL7WLnrxtLaWylodYbys/KknRNnjj/YXv+rrXITeu8tRTz3DLRvnITfiT3/oh9kf3sDm8QJkSaeOTtWeMd48L7h363hv5SqZ2xwA8Mlg8pUz8WgEi96Csf74XBi9Zr35Yi3PbJkrO8SyPjtWBaUPKQfQ0tBi4ljhQ1qyFXLbY6AElthW61jKdDcIi2OTPWMIvoIYF9zu53zj7EGOLLbP48+bftZDLJlT4tkYMe8aA+8YsEiZdxEQIZi0SB/1CHK0hU6Z1KHVPb+2sS6ARELdbDrULQmNe7KcIOmXa7AOUFnUd6KiMUqKgZgnFinfJhHF6g7zZspcIEcIHrx7vAq37Z2YJyUsSn8d0J1F0U9YQK3LxgaRMIfodDKAITvfZiMAk80jZJdFuoch6DwAyUVIiNW/DvH46o4+8g+//ms/l47/4H7jl4hGf8eYv45/+mw/wtf/wp5B0IT7DxJgOEAGddyxFVRpInAT16QtSxoY3dqqE992MwPMRE4Y036RHg4glz63Tp4M4B5YziTNdgZ2JAAWH2Ed2WszLugZmXiJG0HvW9v49xfLWdaDdn0kde1raet14PUVodJmQeF5RryK3MXx4Tp6a6OiGrFXWnUoyRfLWe18WB1OUTvWIShZxx00KzUbvTnk1JNwQeX12vY3xrHJ5Cc7S6Lvo4qFjwxTHpSLSeAmHg1g4R+Q29LUYaLRO1sKwPWOx8umZnsAHi7CEtyXIqEc3RIolLxodNa33omp0fuRErzV+/oz0wb/9q5+F7N7L4flL3HzmCWo54E2//zs+6fv7k/4Fxhjyk//orePchfNcfvpxbn/RHfzl73qYj9y4nWyJqsW56VHP1K25OByYIiyCJQiir6rVXBSaZ1dLFJxU82tr6Zv3vH+HlZcQHE8NPGuMc9W0R9DSuxc1WCLrYKk2pSeHF4cfhPSxFtyk1qhlg+mE9r2He5TJhX+p02dDrbkHXs8OsK4G1QU+koRUDdPqHFwEX3ifvXPzeYGG6xwQ4NnhJVEFbGZI2Qba4b747ukcoJPD2rpA3eJMB867KsVfLumxxYSiW3wYGAHBaljCWsTDLjBq5Gw5F6vZCzWInH5NzpONuAx79S3YKvoCH+9Qp3+WFwXxQ1iGrP9fSFiU2CCNOma+6HUHfOOXv5Zf/8l/xgOv+RymUvmq73mCn3/YuHDxNrbnLjiMmQopuxVIxYOSBm5Zo3kX+2g+VL3wsxaSV7xOBW2VqtAtIX0iJ3d5pLLxVEoVkmQXDfWObIpfshjJfDvd7/duR8tTxFNHrK4odT97cEkJasrUedOFmelQNhmrDRLe05AziG91Fj57USNttti+MsbsOf/DkypVddXUuHXUxUpSto4m6EBn30gX8axrXJKLtYb5wbcpbo8S7xHIDK9DNq+8Tqb0+dQ3ytkb40QM23uRzZDYaCwqVjWc0Lmg5k6ZJThIsyBtKXzBdSQhDNZUMCqjOV2k5kJenSO/IPhUKwXJfkYseiJJOGee8OEkuSfdVfQtUD9lyq7Qlz4zWj9770bw3OKZHdKGXzbm1OEQZZTClQ/+DD/9Vb+Phz7879nsn+e1/+WX8Pb/8DR/6dvexdADpu0m6nBtzebwKiB/pqThbXTiz55rdaK6WMwHRbOzFEhzXY9aqOa9B5quBQmN0lBBakMWTY4I6BTxwcOV6c3z/1WVhgcHyUIHWY4lwQeHJdteQsmPCDl7xwkhO7aSGeZCRdcC+N9X6glYFEyl4shaZLCkcCQtCEBS134ttKvE85xFGGlDH14SZaNGHoXTYwvluywmHfOzUv17X35tz07xRcFzDja+zfcKqcRw6NB8EnWUhL3nmejkxT/DKcM+ZiQlUjSGDnOBdDdz5Lr7EjP6zFJVvVA7SQcyPGvDbCAlx8KFw309ouWlMcZz/NSfupUnPv446XDi3jsvwe1v4NM/+89+Unf4Jz0AvPOH/optJ7h27RqXLt3GB58wvvIHniH3Gz7xMMXWfwpDkDKRckQsRr+yX/D+6y1xim5Bm2I78FrURcU5YotcEvIU511c7dx8W40pX7U4dOUKixgIJmh7LBt0WaMfvXjFv/iRM1b3DM3uU20daw0zh9UpG1L1JDyGeOLgmJ2v6x0t3g6laYuNPX2+iZZzlJTp5lximTxO0luoJhD3etsIseQQTMZZlW4StOKw7VKPPHzatZHiJTYvRhqDhFGni6RxwlIyNOeCdShaIjZ0Ud6Lq4nxKbn3imQXHrkNp7rffdQYusZqBVI0pmOhiQcEec5Ci/axhOqIB9sv+7awjeoDguc5+LQtw3+t2oy/8UdfxBf81j1P/uqv8Gvvf5rP/ZLfy5f97XfyG/sHODgsjAsXURtMJfmllMShfYkAkHnAaK4nUOcrrXqYCKN7OmFxcan3vCvW4Q99ceZHftxIk19g7r0f64/zC8SdHbROkeEoR+/ksJKNCIhJprQQkY65kbIgOTGTOdREtxZNekopJZTczo/WWknbyZsCJ4c2Fd8MOx3C8tlqRRLktF23+2ZCTmGR62Fd6o3dY4+jquQHXxyXiqIlKIA2kPhxZkLWRFMXMeq++sXYA40yWa1rfX+C7mf6jZt+WR1t0enCarkbhOVuhNhzUkYzpogy7jpCLFkcyt6f+OZ+ukOTMKtb1VI00jl9NjwKu2ydQ95O8d0IoJ441zs6bfy1V0/VE4kM+e7boTfWCdWaD4WEMl+WdDei3ti3x9YaWqYIzOp0ZlRu4cYH3s13/Jnb2P3Gh7nnvhdx34tfyv/1Y0/yzf/6UaZp+k/gdUZHxi4GGB94E+5cMHzQ0zY7UhnIIcNcXEaiiZG7t3qa+kAr2Xvux3CI2/DtdHTP9xA11NznP4QQNDv6Mqy4LgFYGkW9TM1T/FJ4/RsS4U7hdEgu5hITL1vLYY9jcVhE8+HwwjRHbmZMD8J2Fwr+nM+Kdeoc73F9gVbFUTM2R17qowrD7Ydmju4tddjIWLUKwvCFUTTOyei3HGDqXTEjqIMUaAwqwOR/B5+QGXONvjpPKExToQ5I5g2McZgF7YYX/jCRqGscfNLJbb/inynDFyw/zw1bzicz/x6lQRc6M50Nf/TVd/JXftcTXL9ynd3IHB5ueP0f+ORQgE/qJ7/rJ77D7Or7uPL8VV7yis9g6A3e/A0fBL3ND34aSx+2Q0LFLWAQ4ryOjrHCXxoiI5PY4NG1ztUEh2kHFDOH/hGH1CP8wvusBXDVsAsykguaFr9/d3hcioc6+MZOBFt0h+fBbYAxlYwxPDs/HmjnrQ5c3Tl2JIz/5UtmHv7la/yTh+4maWwLmtFN4W9+8Ql/7Hc8woN/6faGxcsAACAASURBVOVI2pHTkcNagOZpnexttDOhVyrQotAnku5Wjq71tRBmUelac22BqGsnFP9vQ3yTsJTJ1qj5ELV9qKzLuj1pnz2dMCdGDQFjn8Mf7F3xoxMvhQuzOs3zwCX5ZRRimByWv4G38+XwxXrphkNoa582Yx0yhjVSdJPva+EPf17hf3ijce2ZRzl/932cu/c+vuxvvpvn9T4YmbSZ/PDPymacKahzSvQWkHutzkcvXum8wYY7FJIIrfnAuPQydIVU4d47djx55TaQSqWx0cm36lDS5+D0mvjv1+Y9Scy36blGzSq+cWU//LsN8m5mbLILSc2bxZr5IZUULE+O2PTuNI8YMh045F68H4FAtpIII/78KSldxPnTtoM00ff7lbLyfovM8Qff74K7PthdOCJtjji8+26KTiwxvRWv8h09OheitCrt9z4U5Mx+d+JbfMn02SkpGZ16coz1Qa0zRRPp0q2YqA+NYb/T7gmdi+Nnk/yZGHTy5NuVSfJI5zVBzZimiX0199oHVMrspTmpTA5np0QyBZyyyIvo1Dy3AElImfzPEQrw0QJpYGC90arDs3kqfqasxZTD46qb6x1ExEOuAqmYdzd47vFH+dmv+mw+/O4f5sJdd3LXS1/JF37V23mWB9zZ0SqS3HFA3UUKIH5uiSNxvRkpC2M+xWxQJNHVURBPBIQlF2BBBES9CU/jXV+QSAsP/AhNgIi7DWinqOCFt+INpz1oD/8sWrzvYPh3VRluAVaPi5ZcsLz1P/+YGbL17zC79mLRVqwaCxREoqa9IG2/2iXNzMW1anFhDo8sVrc0SvceiiEbRzumA39ep4mxP47lJzRUJFTjTsnJ75TIEyBSSJd+GcIivi5S7Yx6GaahZ1ySD80H8ZToo54FNjWnhyVcLEM1KCP1pNlAo61MpL7UNYddVnP4/xPrp71GMYfwvfoQujfjx776QS60X+f0OqQ8uNkLv+NL/v5v+h7/pAaAX/ixv2JXn73MbXfdAir8Hz/4KD/y0XPIOA5RW1o5fa+B9QAI51j8sYDhsMsS92hthZU9ASv4sRYhIGTGOEH3O0/YyhOaD1Y42/rwAY5IWMoTvZ01biVRaD6x9eCkszX26Zx7NEeFEBSRCrIIvyLYJemCaCw1twZWmebL5LLlhlxYo3itdzaS2ewfZrudeGbcQ05KM4eFSzykpsHIa6hdQ5iTlkhOcaFjCt7aQsgovUXRUY2L1ydzKds1E7yo0xk2sgewZKWPSLpKxTUHOUW6nsPzKRuti7dyjU5WFyotL3JWF7nYaM5zl4xZYRI/LEa8wA66BDwrS0phCA5D7LT2HQhOtwyHcl9zaebv/Klz5PmEXc3ccu+r+Ypv+nkeyy9mkplxy+0MGiXCQUQWEc9YRZ5LO5m1iuwbuvUehJSWTnfnql0QmUETaYQzYhJsB7mEL5moeZYUEG74d5N6ul0G2bkn2lW8tqapsfHOib6vpHaKdiNtJ5pMjE1AqUt083aCXCgSm3udoWyw5Fyl88jG2J0go5Oyuzxc0NZxeGkwckHoqAl1vydlz9rYf+gjyLxjR0dHZrMtHA/hwoMvJk8FmVy70MfZQbRwolI7ls/cO2qDMQ/f1BY4fTSoobFoe+o82Bxs4PyFVVS3BLroJjFunqLzMeP6CeREuucu8uE5rA/ajZtIb/TdiQ9d2wPYur3LK4vVqZTeY7uMzTA77SibA1esa1ApyZBJPa9huMiS0eNCmei1rVA6eI5CxrwCGfx9xb/XnLNraYKmSyJoO+VmO+SWR36F7/6ql/Dss89z/fEPcN9rvoDf/TU/SZsvkQ42K/+/hN4kHN2oo2LkVQi29NEzlqIvXxDScK3SYnuUGPyyZOrYkyXKbQI5FfXyr0UPJQxknr07Y7n0SY48TYI1wWir4FFE/HkKUWDriZwzlsTLdZJ6URDeHTAkdARtF70V6rqGpSqZ7n+POrC8WaF4TQXpc5zpzocveiONeyTn7WppLEVQbdTToCRU156CF+pJVmGoS16QJKHxiOhm8Wfdeo//HmeUTkjkHIyw9frSCGZ+Po/BGgsMPoR7K2s6i/w11yxYoCWWvNPGXQyut5Klg6FVp6GzlwgpGoVvXndfTq/w7V92wKVxwpM39tx+yyF3vuaLvuEzXvfH3/abucPzb+YnAbzvZ/7B23ZPvguScvm5Z7jSLvKjH5sdwhZAJj8/his41Vx44hOvB1eY+aZrsaGILFWZuGBuhIJ2uG7AwmcvhH6gVTSFuCn+XF5sk/2NDVW8K2H9wLYhmCrSZhc3JaFaqO7bcA7U5X601h0iE98MZAxsSozu9haT4jbTebAv97GjEmoZAIYqs8F+ejHXhnqngU5IKu5gEHGeTI0xls774OIlNpPhmz65+kRqHY3azKQ52rLEuaPiG86wjgYUPlAsBC9qRm8jRDIxnYe+AMsM26MpM+QITcfUVNhIo/cQaSXxmtpyQJcZ+i4+84TpoHWHEXUJnhnmQ5SFcl7977dwoCrL5eLJh0Mg6Y66b3zDV7yea4/8DOdvexlMmW//gffxkFxi206Qw0MYe0STi/xGpfXGFC/Q6D4IjBI+eDJp8g0hB8S6aBucinLdBxppY+eOYLd3Xh3D2s4PHhG/fM15zV4rao4wjRoXRhp063TN6JQ9tnYIuTvPrUPpvaEnO9j4CmfbjSNVGeZ5JpnRJo8l1WkTCJjQakOmSjud0e4HhYmtsHoWpepAs29J825Pv3Kddv0acpjRbh7ko0Kug7zN7OaGjMbJxz7G9va7me6Y2I9KwhwKTgK9kVT99+rg6Z3+PCrQhzFmL5eSpHQarfmQr1mopzsanenSHcytUVSw4xv0qzN9v6PvTx212Rk8+STT4XlGm+m7mZKVNndKMubakLpFDw5doCbDi5NydhFfoIoihZIKfYTbw7zdUFOB2ITTotmJZj4PfFqCbDzoyWKJYIwVhZPRzhoPnXjExMW+I2/JZnz8ngf5xSc6n3n3eU4uF84f7PgLX/wK/t6/uYJF/4ZporNEwirxVAbCt/fCsgVGNyP54Uk31yXIMDR74YxpprnSKnI4fHCQ7JXkSwCNdPwSDKsl3ZvuVluuVKSbI1NByamkuCB11UwtPLZXrze0gQ1DkrlGJfWIi86LlDLE3oFY2fBhQfv6XcDSGbEh98aItNJRWzhTFFX/RoZmpHlwT+9711Koux2W8x4xNGlotlIwCGG/poe40yLj4Ix+1EBTJavTNDFmCQbN0WmsIdXPNIlzrA3PDlFzBK71gSg0iRTA3vw9LeEskARqZFU6YKarQBdiwCiZXjskH166VOpmw7/8gPK1n387+yee5/Zb7+DRX/rXXw+87Tdzj/+mEYCf+d632tG5i5zcvMItd97OW7/lIR7RWyl9RvDL30gvsF855GwhBqLt3VdJdjXycD4LCSsUChKvhTqMM1RDIFbJfc9oFcoRXZTSXdjiUbQOOTKqX37hFli4Hg9E6W5xWTb67MKV3vYrTz1EorciY33nkHJ0eLWyxXplkw9dTNRd/U3vNHNuZ/XYAl08rlV6Y+Stc+2qzh9J9kEgFKQ2nONXVXqI10RLTNo1Povs/u7YBnpKSD7EspJOr6PA6B2bNg6JLT7ZcuAPX9u7ayHgty5Knve06SJveYnyFZ//UfTWz+RL/tYTHKb9mdBSxeuPBQ9oae5vFhs0za6qHhYcovPEFi+esxV+4AxsdQMsSX+eWWZ86ZsGf/5zB488fZVX/pbX8f/8/LN87U837rwwsTu8lTI5ZxtVaA6Tix9yfT87AqBe3CSp0PdzQJMu1JEyMebqzXEQ4lFPW7Sw1GXxQa1hEPzlQL3BMJT9GnTGsOZe83mPtuZe5+3W09Xa3kVvGvaePvzZN9+C2BSnJTrodvJ2tD5IR0f0UeHadQ8bOjp09Ayln95wJiBN6OTQ/bh5HT06xDZb2rPPY7sT6uUrzi2r0nWCeU/vJ07LmaswesDa/s+GdP48B7fdyna7Zd9xZ8gIwWbrlJKoIpQxaHUw2uyf6+6YpbhmoUBMwOaGCNR5Ry4b8vnztGeeotTK3D05rWzO+cJQhG6eRWFEXPXpMVaKt8qpX4BSJjjcki9c9AuE2CBV/ZJPREmLUjZTOF1cByBlCpGvCyeHeLmXN9ctOpUYTvGtz+aGKaQlv2GxpC2CyXy2bTIG22o8+cQjfN+few3jiZ/lsceu8lseeClv/tZfZy53k7q7ZFxzUwKabrTh/Q42n6zQO9MmwmMS0uY1Na6HDiPZ8PPEBg1Xnqst4lffYEfoqlJrnrmRfIlJbbe6bcgb/2yqIwUMd5UoXtLVy7Smqq6X5nTgg4iYn0mwJpZ2LDZ6H5gs/KVjdurBZAqxI6DJh2/zJUNHo282yOnpOnRobMVtDNIiBDVjsdYIoZMihf0OxuhRXz25xizoZl86ZPXpW/ZBgeF26WwVW+yRS5Oj/zauwdgfM1JmDHVthDTQiSbFNUABNUhvjMlbUMnFx0XD2ztFEeuk+N7QaQ3q8jwXXf9dC+vrBsW00m/AD37lPZzfHHPl6jPccfclygOf9w0ve/kffNsneo//pgaAn/2hr7fXv/pO3v2Od/KSF72E7/x3v8r3vOscKbtgZVGLLtusZy87AqCEfzVYoTFsDcWJdcKRAHVFJFlJfXhQS/ZDYW4h/ouAHFe+z+sHPcTzqJMtvr+AumqI3FLy7bfNLnsLjyflAAkrk395By5uA3rkNGctkeO9iX/fz+wsvfomEw+tqEP2hFfeSGEPEXR4VrrQXdQyQOLPLsPpjG6JJGdteaOrq9zb7MK1kbwUowW83me/1IPLguHBQPHwNlzwJ2ULbe98ocnaBdBI3JJP+Mjf73z0oY9x230v5gu/5ZBHLhdSRIgigzQdMqy5Ijq24RGVymM4nz2ENelw4UsXL/PCly1WRy+EMSQN0vF1fuybXslzv/E497z4xfzzd13j7/3bj3Dx9k/nlqkwH3khUSFBWyxUMFo0Iva6Hmo5Z2pzFfUYw9txWsW2hWzRKDhmdPhB3yR7c/MwdOMvbN5kD/SB+LzsLFxKIhxqckHZNJw/FhK2OXDufN6TrNFzXhvOmB3K1eLagGX4G8O9yqoeDrS/fpl0skc3E/MwtnfdS2uV3FzZLKrsr1/1P8fJTdKmMJ/s0auX6ZttiFo9va3uOiW5urrZwKonHn7Nl34W3/J9P818+Ar2u2tsD9zGlQ/Psbl0CyRlWyZqrasljazIvHMofkBPiUmFfauMfXW9jCV63ZN06UwwmGe0nWBmlLsfoD31tMcmk2ijex9CdvhYp6Dc6i4stI68DFEfOPY7mNzCJjnRT05IWdCDA1LZIhcP0c0h5A2bTaF1I8viCU9oCuQpbH7MXhaTUvGKaqurzsDCzijhLBEbq05JR1+ffVGjN1CbOd7Ds488zLe+eebQOpf0WX7hxmt52w8/yqZ4DoSfER6HnpIn3fXm26Y7Muqq0I+3iBTDskhyC2ZkcmjfO91BokeHBL2R1Wi9o+qU0LCweI5KmqtfvjZjeFKnqWGydSQsRMHDjGxeduWpfEqi0tLEwJ/dIgOjYRZ5DglaCAeLptAyTYz5FGknjLRB86EH7iW4/95DHjjXePeHb2D5yJe9ebeeGaGHo6SEDVBrfieox5a748MbZHtot9KyOAVEL0mR7uJxK5PnfIQQ3bNAlNHP+lfE+efIP5hgNJhd7O16hrSeCejkeRe9kevpGivs0H/QIITWyHpQZp6vQAhql3yPZM11HDKhKpDClTOWyOqZBy7OfO8fL3z40ctMmy16BG/5o9/7Cd/nvykK4ECe4ufe/l5e/9mfzVOP3uAf/qKSc6d3GMlFHcM8hCJjjLbzCEnz/87oPikCYrNf5FoYw7ddj9F1by+ASXc4x6DXRtHgKGGlBCx5/rQ2h7Etb1xdKh5da+pQXbLhgqqpMFLyrms13/7GCyobxQtQzBKkjXMxCyQYUHwbylQ8uY5FuQ+MPrsVJ36W6XCRoQ2S69/8/2uCKDgRTd6cZcNhTC2kPtC4eM0p6lWIyNywKeCq7spyFLIKlU4XYZIprMOJNh0gbR+fx349TBfuK2mm90TbP8W47dO47967eO6pZ7hp95LkgCGzD26Gp3E5hEExXaFxNUGzMmSKrR7/DOkonvhFKKyt4yiPhZrbKrtZ+I6vewunT/17ajvg44+f8l0//Bi33Xs/lMbu8IiNZqgVC8udiNDnHpxwpYY/XVVp3V/CVn3SFrrDfnOjEtazgbswcPUxkz8zDaNopu/noLRSVOJGmEzY61xvZqTRqUmRcojaoOKwqW62rpA3fBA4nV2AqsC88wtvLL0HgBl9d5PdU0+69e7+FyEH59lceZ7TRz/GdNttmMHumacxBO2esDmsM98c5BYH/ukJ4Or+uvNiEqs75jaDFV5738SX/u4LfNGbrvGWN3w+X/m//Sq//FRU9p6eMgTq8Q3y9oB+6RIHGw+GSVloHRf0inOdOoReZ4aNKKhK1NNTF6jlgrVORhlJ6TvQzZZ0yy0wEvXaFUc8Nu7vz0dHjGnrsP1ocLBhVLcQ57JxlXjrpOLBTLkItjkkTYf0jFup9nvqo4+zuet28q13MI/siXji/LnJoHff5jzYSj01PBT0KRVfPlKnt6Wwxe1yTkN61diCZC2XlOGaBGNiate59dZb+fnLwl/6Ly6yv/Zh3nr/PXzbv/kA8ziPWKKnEORpoIYUknS6mBfypAkZM9K6P2/TRB3JcxRaPItmPpwvDhWRVa/izhrPoR+jImWD7I7RPoe2Shg2Y0mQDqlXminoHu3Nn1eJvMhhkHOI2nwcUfP+E9UEugk43/DX2hc77z4YYfuLsjK2ISztccZmHnv8Bo/ZPlxUFanmrobQS4iGSHp4XLs7zHygzeoplS5sjqA36SBlPYstwo6Sw7jQZs8CCD2YL3Mjcjoyijn1azVyUrz5k5yQlrG5kYoy1GPlU90zRnD8KGpORWryimKT4ul+wzBrjqR2IqobRBrsTp2qTRtqdjuvi4FD9ynieStj8PHrG37hIw9wz4VjLt5xO4c6+NgH3v62B1/1BW/7RO7yT3hieN9PvM3y8ZPUkZjrCX/nR57n5545h1DdiiaC4FGURguY15XeKZ0pv00iez4sEH7rRtiCLS8Wwed3T2OD9eBd/bTTgXNVo8H+FCnTmTc2ldUyokQ/QNu7SE7Do9qO0ercvg23Z7lz4KyVqolbkzQCNxyq94lc8MAUM0gmL5g+ldGb23dghVFluMhRDZgiTz6awHSYf8G90s052CXsaERQxGIX0x7e3DFg4+lWPmMmsnY6ritAF0/uAczhe18hOk/DM43UP2kYhzy4/w3+2le/jp/7D0/xfb9cKNI85Cdlh/QIxETMfcNW1ylXxFiSAj3zwbO/6/GxC13WWmNHiUaIx1prJOn88Fe/mNsOZq489xzf9u+e4h1XPp2DgwMOxNgnRSie4WAuarMx/OIMFcgIsWGLDIYxe6Rxb1HOFHComcD+BOZd+PkPSGFF0rxBzx/RB5Qcv64toSJnNh1U3A7UBpN64l8hkr4OtlRVch2M7mr8dPPYlfkbp3NK9na8nAtsC/3GDZIop88+GeU+SlNlc8fd9JMKdeeNbZKcHtMCo/kFUIRWZ6RZCIj23lNhiVGKw977PTf3p/yeN97HV/6BU87lxMOPC4c68ZIXXeInP3TC3/yhpzh3/pB23JAiyHAq5eDoHP3oPOcubrC0xeYGdQdl68/6vGdEK2IyaLtjqHunO+MQt4A8xUDPnSfdcgmrxuZQOH3yOaxVD9w82jqcW12otiT46eHB+tkLA2tu+XO9qnqAkilpKtjpDdr1Z9DNEZt77yHliaZKEX9GzlIx3ZI3EPLwS9XEh2LN2QNu5MzmSp/DRx8WuFYdNcDQ5gU+LS6feX/KYw8/wk995YP82s/+C970Wa/ni7/lWa7US8iopOkgsgFemMdxlvrn//jFRY3qbDVqd9GwmNNdDQUd3uQXEc5FWJNFc93R8H8/iWGteu4HeoZm9Yb0GUsusiuijH7iHvXhLgXLzrOnkWkpUSIoqsUmTqjsLWyCnmXg6arIWF1Vfj5snCob1bl580s9Kx4URMdkcqF46whKsw6qnEtbTnplkzcwDuh2lR69CilNKDVyYhJ59FUQ60I7DUGgD4QuRHfCxd00aRUFD9HVDeG3ZSCLrTFyIZ9eY04HvrFPmdG9RXMM8HZBF1+TtiDdS4aY3a1A8vrnMfwZxM8JL+YayHSAdSNLo4/QhpSCVf8M0thx+6Ut/+Iv3srpM1eh3uBYE7/t935itsBP6Af/2rv/+dvq8+/4+t0etlPhoSeu8ee/9wqSzCehMVDLHsQz5tW2JzGVWdjMxDrNEkvt7BidrJmxcMxDKCrRobwk2vkFikQnczuFfOCCvpQY+z1JekTbTlg7dQW2eFmJSChXW/BKaRtlQIK1nT+c3T2yKQsd752eENryoA+YNHjTaeN+VvOa3WEurvE0POcCl/AcRWgMn5jDhpJgheNS8q4BxuzCqyiOWWo7Df/Srbu1cSxTsZ3FG3jtqlMFuc2MNPnDvCRPmXcdVBthORyoZNqokDKpuRd9JKHoEWM+IU/uShi1uf3JPCsgLXWxqgxL8XJLVLwuhU9n0H8XSF1Wq+ZywLVFKd8HUoz7z53wdW+uPPPUE3zWG9/C7/nOy1y66zbnGENgJsO75NtQF5jNs1dD2wjuVkLjUD0W2fqaokiPkh8iNOfmVdq892/I7Q++OZ07hx6cc69/8im9t7YqdW00V8FLpk/F7VARRW1mFC0McEh+HzbWfso4OcH2O7QNZLNhXL9M3R2vschJJ9KFQ+ZrN/yJGTiECR441HuIVNVbErNBjVrrRXE8quvKA7p0WFI4PZk54jL/4x98Cb/1VTfYt/P8q/94jfeffAZXbzzKP/hjL+XyjUe5tn8p3/7TH+OhR4/RfOQcfMChpRQyht5+O5gwrl0lpcR0663I4UW3TGPUWj1lbo7talSWuFmaq+5HhoNbL6F1MD/zHH0+oR4cUBYx2NEF0uEBPZ6vnCashBdfDWr3YaO4an5YY5QNOm1dkT88uW/UnX8/o5LPn0ejlMhxNX+GvNwlrI5LvkMktTHMRbZLkYvhUHMM4NLnKCSbSOYsU02e1ZC68cxzz/HZF3d8xasq56eZr/tXlXd/7NiHTTOnMUwjDfMsHyMFwOnlP9HaGXF2QncEa9E0hQsoiSK9M3JyRMvcwZCbOxsshthknbEUctHXrom5HqM9LpsxYuUKCq2r0yEqLhJUfz7JnvyZUvHaaJ3ij+nD1BKTLiHENjMfTnTD6J60ySLi1sRgkHMJei7S/8bAKOR+Si2F03rA9vgK5BPa4Z1MnCAUUinhCHFxI1igduGqitwV4jx3q19dnV1DBt1gMrcDL+evLLkeRG5E7UjZeHKtRPBZ8hrtYkvctyPL2hqmh6jsaHKw2ofHaBHH3M70I8s/0VDrNnMP6hq1MaZNaAgcrdn1DV/6+sf5A78lsZkS5zeXeOrmCZ//x7/z//e9/glRALp/6OtlFO667QKntfKvfukKPU9ka6GAju5vxB8YxX31mrBhDpeaYeb1nxIZ9RpZ01hs/dZphDJ0VNKooZosjOwpb54LXp3nNRcNWhK0D4zhKWwhuJCUYrKrwQnVsGgMukyoTgxpiCipVhiK6CARD++o0JUpF1exRx+AMDDxTTuV7f/H2rtHW5eV5Z2/951zrrX3Pud816r66n6jCii5lICK0cYLmkgwqMR7tBk6NK2ORFtNbI1xNCSgBqPY3tJ2WjGdYVRUTLfaGBCNtIIgCMq9CqmiqPt3/85l773WmnO+/cc79/5gtLce3fxTA6r46ux91pqX532e3+P5zjJgoffoUHEp3/KItNy+/x+TY4pbPLFk7x1QcZey4ZKeVpesnYSFw1w63+TJk8dyTFCZGHPwuWmlOW4LYslP2ybUOmD4ZlIwYnUuuAaB0g5eVGItCEdYbD3iEr26tHhBTjDHJvvLY774FfGXTHwhMBoESN01bk0Ol+LGJzZjDa4eKEoNvOgOWC4f52u+4WX82C+8FVYdoQgy68mMqBkpdth6TVBz6b+2HvCqLdrTcv0SQCsybpCrlWlagczdvZ3ztnYUXFYrWn1cNKwpRweMbcE8fv3NHuXLnid2Nr5/gjoOpBCoU2kya0cpA9rNW6lRYVRFlx4n6i0y5iOKZsbVkqBGbo5mrYXxgteOlrIpYmjUucmRor7ZtJiYBUhKNTxXP7bnsAxuUgwzpE6sDibuueGI/+Ef38Ox5eNc5DZ+9Z2HfDB9IdOt11P1Xn7gbR/k+//u7fDEg7zipdfzU2+8xO996DIhFGJJEKFYhiGjjz+Bdd6sp1YYL1/AREna+2bbIrfOOGny67imdsmz1ADLNdPho9Rx5RQ3FWS1ZkqJEH2cVyZIvaCamLYtdH7ASNrGeyZoCtSxEspErO7vmQT/eVpPSDg8RMYJO+lRPNph3d3chZB8BCeaGmJWKVZIMbaDfkHUkdVmuPoi1RG2IlQxikUkCbEapI46M45Np3ikPsmZ05W3vv1DnOmuY0ruH+pVmfKaKpGgc7K5yc5s0wAo23URcQyvlEwYDxF6SJ78qdq5EbZ43l/zxBQM1c5TPu1wLO2dKDmjNoLNXSoPMJWCxh2krpE8YaEg+O3eRFEtgEFp+fXG/VCjjVQcmGM1txm6r/NmHgm1BtQpNVDrRKYSk/domLhhWdshppQMFYI0ZHVbu1OcMVngKac/zv/5w9dxw8lzvPI3lvzMfw0sBIYNYVQVwW/5ObqiHKI0umCP1uAFYJsyslzcXy3inJJSfd+olRLU9yGF0EBxOfiIAI3o6ojaOaqdlFriKiGa25hTCFqpVT1h0EZJok4AVNVto2AgU9XxxNa+MwmRkqtfGkVQU6yOXoAXVrzl2ijEYAAAIABJREFUgRP8wFffzYf+/I/ZvfEWrt2d/t9s6X97BaDWKh/9v/5llTTn3KOPcLCGr/qPh8Rh8Maz4GQvRdEg5FIQUbpuRs7ODo+CuzmqgBSsemOZmyESVr3PuVTcaaq9z22r3ySCGISeTDN4NGqXiFBT7x+n8Z+1ObxVorupNXp0qo5Qi+NuQ/CHuW6awGjRtDY+KJ6zLvg/r2UitxpYJxA2B211Z7DUipWh5ZTnWwONNfnJZ2RN7gq6jTcGMmXKSDffft/eNOhyXdZZAxx5cYtUc6JUHiD5CERC/0lFRzUEogVniodIwOs+tTW/MQxA3SYBSq0YzlAHthK9uWbuFLHqRUwbrKZ3ljvJz0JsUp57G8Qmd+y2JIUvaq3tbEMtnI4YNXBNXPOdL7mWl33uaR49f8jB/pKXvupB7MxN7F5zBonOQKhmzeHrWV+yf9+gSGqucfNYo03rxiAfvJAj+0nbUyjB//t6SV2t2gjHb391HNGZ0/1yNaIKJXXs3XYH4ziiU9kaDUMzHdXoETGtTu8bJSB9TzQHDWGFcPmK1+W26lM9WFPzCkp1xDBskwIbo+FVmdZNshoTVozQd64YmN/SplrQceUz3mY6CnkkTmu+8PnClz5vh9tPGR955IiL6xP8h8dvY//UrXQ698VZhZAD+cpj3HX0Dr7zxbchy5F3P7LPhe5O/qfXvgfroRZl3ieGqRCkkPodSpm2EdwE5HlP2tlD+x2/2Q4rqgp5dUBYLl1GrnVrqg3Fb/KGOgVNvF8hiENquq5DdnaJJ06RD5ZevhTc7Jm6zvGrVUmzADrzEZNUkriFLYQWkzzcd6G3CnLT9XTRe0VIjveVELfffxLHEPsCGdB65JeV4F6DXD0mTJlclZzcg5JxZkeYLRiLo4Q5usKF84d8z97vc+5oydd+yd/j7fu7vPpXH+Pxc4dY8xj4Rj+5PC2xvXeZirpC2OA/lo/Q8QgJCyx21K7zJI7hqabmzZF2sK2mgK/F2m6q5AktK0pMiC781m3+HEr1NI3hqmlpt141yCERmMDaBkcgxAXVSmP2e7TNJLTZv38ex5RHzFr9+oZsSmxKsa9f/qw788VkQ+X0m3essO7mHMsXeegnz7F6+KNcPH8aCQ/wij/9e/zn952gq8U37FwIwTkNGtJWKaVxW4JVNyGqksWJh5ubOOoIZSubxtZGYy3+HUteg/oo1ASkrsEiIQ/kEKlx7vtQHgm2prZ69BBdRTE1LC6820bNUcUhotq1ddfBbjpNflhIC79Ekn3dImKMze+WmUrPr37LGe6663ru+8PXcfM9z2Xob+WZn/Etf6u9/W99APjD13+XHesiDz9wP/c8++m8+jce43XvXRMJ0Awm/gFaJKRMhBRRXbgMx9hypRF33mRn6Ftth4B2m6zm8rgIU7+DtsrIWq/Ob6Mqk+CRKoxQXL7VWlrUrae2hyGIouPgD7J5EcVVSEtAslJ7o47QB2Uolaj+C7duhhVXJaRbeOuWb/tb92hqXgHPuzvzWTZjidELe3KDaUiriqRkNDj6swSF0RkIJc2w0Hm0pGZPGmTvXrcy+sbd9X77LoPLkNI8BmWEvvPvpI1TJPTItHSDo5U2x1dknHz2rrEVn4A1KBHRHfJVpoYMFnIQ7w7XhghtvgyfT/ptPohslQFrJUdbmmPdyGtKbAVQy3Eglsin3xX4yW+9jssf+zBPPrHmmc98Ov/ujY/y83/Us3dqTjh9mhhji/XgiFBxI6mZePFT8kPZOI6ErqdMI6zXbcbijYShHQrq4RFlb0GYKtP+JQzaIc+I1SiWfaPQphqZP3P93nHGtXdBhGPHPTrX0MF5Gkl7C+xwwGYJ6fpWDiT+jJVKXq49lRIqthrI62Ub4whTKzWhGtNwtI2AebOa+E1LXBUQxfPmoaeWld8ybHTTUq3kVWaREp/36R3/7QsX9NNlLpUzPPSxR/mVw+ewP7uNPnX0M3+nqgLFCKVSuo71auS6y+/nxbfvc2y8xNNuP8NFuZbf+9DIG/7Le3lyisxmC8TWbqAUo9MdhnLEvJuT10uCRmbX3YAujqFd75v9ch8bDqiHS3KLs20SIFRBtFCjwuTjtERmMKOPnvfXFodLwcjVCX8iRhld7ZC+p7/lDkQ70mLWzGvez1Bnu4DHa8PBFT+wnTxNrL5JVxSL0VGt4xKlRf2yz2DreOQhN3WnvMbeo47BEKInfGqmbKKLocURAV1f4dGLR7zs9CN8xXOucPnCFbrjN/CMp93L1/3Eg7z5Qwf06n0omZXfHqWVB20hYa2ISj2dlGt2LHdyFbHT4ofAMqHF49Jqo1d2g5MPQ1MHyyGaG3G0JU5yCFjxwh2PZLcAs+vybDpIptCRiuPDY63QdQzaO155feg5/c1YQqM3HYg1HkFxAiTWxodx2xHildW9R+xU/feh1Q9rrXxHMcR2eOU3HvDNt78H6wxkgv5aVtzCzd+dmYdjfqumYCER88Q061qRlH+mIIIVvyDSEh5i+MFoKm45mzJiEyV0LWZcG5JJiXlC8whm5DbqFhKmBcviZMwybfHm4JdcPzgELPVMBPq8wkrxXhhJlNS3NMfYoEdt7RAvkaqtltsJlurQKoSaKjfqktd+bWZn9wSrnCmp494Xvub/vwNArVXue8u/rMuhcuXsWY5ds+Alr/o4JUWydGwIfNs5hgRfxMwt72qtzQocnIFuf1G5EZWCOZPZITifkL1UL58hbVymgmbffCwqm35nl3AcmuE89m3QcGv6EnVzYsbNQGXKju21tHWrFyIxeE7e0GZaazQnDYg0LwMVUQfNTDYSqn+ZVVpjX0Mga86udhRvDlTp8J7q0nDDoaEx240bhTI0Vzvbf7+IQR49P6/B3bLVJUFthgIT89jQBm7S/AEZbRy/iVrad2dGyoWcOkSbB6FxCyLmMb+tQ9U/i2wSHKU0M422dEMjsDUUczGfu20NgdVvM2WTBc4jQ4h81dOVf/uNN/KffulN3HDTcT7niz6L9//pJb7kNR/k+M4Os1uejuzM3PQYA3l9RMw+1wyxAxWm6uqK2OZzCXlYE8ZWJVuyc7nHAZkm6rTGlit3E7cRgGhsn22DB20uZtrvve88bjRl58x3HZJm1HEgr1fOd9hdoLmisSPvzglLP6VLN3NZ9vCIcX1AELZeiqjJy5Vw1ULwmzHFewl1k9+XxkIPnXcwBKOOk3PyNTLmwi3XCE+7sXDj8cA3v/Rp5MuP8a6Hj3jdB05x8fTddPMbqYtdyEcEc6xrikpdV2KvrkI0XgFxxsH5A3Ye+UO+90uu5+jyOT7tKTdQY+Ty/hGXjvY4jHv83OvexQOPH7I/RSRFum5GXV5BY0+YMnF3h/mnPh9NC8rBEethn/VD9zFbHm6b+0x9vglu7EzifRa0uWiIPloCN4f1J2+i39vxzbFm8uEV6mofWRdyqKTYU/qe3dvupjt+jDwWQpeI88Q0ur+nrpfEEJCY/N+bC6F3Z7rzQ8ar65Wqj/BC8Ol8nXxkqe4lsM1su/qIRgQspKYCundgvHKeC08+wb/+rMSn3rLibX90H8dm8MxnP4Wz5Tm8+Ed+n52iW+PsRpVDpLVuegTOn0tv1ZQq7oPa1Km3S4NfDtwn43XOxTPq6t6FMKwAfEQqAq2boE5LpKw9ktnWk01bJG7kR7u5R6zN8cIae0pI2xhiNcPazdqhbn4YqEEItbaIs7lvopshtam0qluoDm0dcVhPbSTXEcmVoMINs/t4y78y+mUmh0ipmdfddy/f++uVGSNWe5fNrToULgsyS2yJlq3eV4MBM8TWrpKooObHEymeNiD2bXQilOKVxsW8XAmbCFUZ0myLtNa250UbXbkIM7/INZOfqLMlTAIhH1JrI2O2BJibpN37ECVuiZm1m1HLRGwjHgvRD5hVCawYxhP83g9dz9l3/A4nrj3Ncpnpb3g+z/v87/wb9/e/1QHgT37zuy2JcuH849xxxx384jvP8prfOku3YUgHP7lUnNwUY+f1nOaEv9By2NrMTrEUj/N4tqGZl6K3W5UVRRy3U1WwuHAfQEiwqcwUv/nJbAcbPWMdykgQJefJX/LiMnoQh224BB2RlhqQ6tKwlAkhexNYqxU2EwcNYdTQUVJHAq83DcljYxW067cHH28bbLJhmDXsqcGwpsTkMSP6VqTiRsIYOypeqqEIsdZGCPONKOSJ2m4SG8iK1gK14TbFM/whVy8KapKZWqRodo775K72WiYvWArm37t5RavmNlZQZ8B7B7a4lGfeV2a1NZYJtK3JqWnNES+bmXvbPCuGSodRCNXZEOCmmsnWmEY+88YZr/m263jPf/19nnbvvVx/LPFDv/IBfuGdu5y48XpmGrE+gkZi9KZD2kHDVLwVTgPWuO1WMjE7LyJqYFyv/Scp1f0SefTZmYEeLrHhkMm0IXZ9PjrVTb0xoKGNQyqydwzWk6coohvuDCfuheBxJtXoXfUSkMXc/RMBdyLvdqyfPEu1Qide/lNFie1g6VFMN1VVipsXaXJ1CgiRGGBoz6aOE1M94lm3Gy970Q0857Y5OsvcdPJmVnGXX//1t/GHZ2/g7E2fTZgvWI6FuWUyE2PJLGIkr9shM5u/v0oDZhmpW1BtZJLA/kEkDR/ku56hlHLAwbmzvPBzns764CIfe3jJU+64ht154K2PneTVr34T5+MxgkKSipaJsNgjzOaszp7FFh3HT51mde4spEBCWZdCHRyMFKIf9mwaqbt7DrTJm43I3+Nw8hTdtddz/PQZrjz5GH2nrK+sqXnt6lseoE6UYcnshqfQX3uGOOvJ/Zy0Qeuqkaq7qw1FQ6XGeWuNhNQFprGQcH+A1Yw05r2vD4MzHTYGW22mMdOt4qNWKdEPlosuMZpy5fAI/cAf8LNff5r9Jy9wuIJnPP0a3r6+h+99zfsx1kzDyg+80rWGTn+2HEal1MnN0JuGPopL0FYzlBHrFk2+l3YJc8kbU2rq0NLWFJ15KiM3pz8+ThPTbfyvVlcAa/XLVlRhCB1aHbUcqeS0aHHq3Jj+gVBXlDR3GmYuRClbKI7lBu3K7omR0DNRCdUd97m915XqhjoLVPI2gre0xEvvPMerXlbZnS7x2nfdzA/9ltJF859DvM0v4DE/bzYdifiN2gFhnpYIuoDpoF3YDEnuM5Hs/IFibuaswRDz9czq5MmiWiD2zQTYTNotryfkNkJQpE/kEgjaIXlJCc2MPq2pqSdLcIjdcOQqdgMA+WM6UFvXitYJ27yrITg8TGgdB4Xn3hz5iS8+RHdv5OjKEZeOjvjsL/9f/r8fAGqt8oe/+M11tV5z59PuJmjP83/gHbg7Xwjak7k659Y2S7Hgt3PVtllL2zjq1H5wuXpTDR2Yz4+kTG3e7VEbo91oW7yrNgBDqAM5Lbbzs5xHkiiS1xRNWynKxF/aTQmDdAtneBtXud/TaitrF1EvZBHQDRcgtlpHMUfhVp87uzO9FYqgaPW5kMa5O87VFQjvIPAUQcArJENDiZoKtdshtOYrVLzON3iDVZDoEllQx19uMrY4DtTntxmLzdBmsXUFuDxfizO6q7hZh9x8E3HOZJVUCrGha4uoO1DFD1qRRmLcKAybzardjjYNjuAyo9O+riouHvesmAU0jxRRSlVOdkf8yU9/Hm/4336WZ3zKvcyPD/zMryz5T/fN2b3+GIvjJ7FZTx7WaAaJ4uyEGgih934Mc7+GrH1EUiuQVzBmRo1u4ppGbFwRykCZWv+DVY//LVft56kNbbqJJfri6hhgf5kpgSrTttio4KTHEpzsZVwtttnAP2qtaNJmygQbJkJqnRbi7l4Rp5BpdZu9mVEmB4S48UuQxsTo+55cVkgeeNqpif/+G5/O087s8OBfPMBbnpjz3ifgynSK7vRTWB+/gWgDRZ12Pk5G6hUrY6uBNldyRPx5K41v0Se36ESnWIbgfRGpTCw5jvRzsDWs12j+OPLkk9ygF/mHzz/Bc269hjR8nN//YM9/edc+b/nIIYHiUnGI1DwRh6U7vXd3SYtdpnFAV/7ce3siyKwn7uxhKoznzhOkGSTVa5MDRu4Sx++8h/H8OfLBZVcBg8JswWyx8O+xjMgwEGtBT51ifsdTCLMFml2GpjZwWMlOlJwt/HfXYGIhdX4jKwOW12wLWtR7SsQ8HhZj8kNll8DMEy8N4+opAx8lTSWTJLEeDpF3/xG/9M+fxaOP7POG//wG/sGL7uXKqc/hq175JlLzuVirxtUoqF0lVFYLV+N0BUIdfPxn/q6KKZYiWf0mG0KgjGPrGonbC5dIal6Kwcl14+BeqSrbyKNWn0PXWgn9LjkmP/iXSu0WW7WCXIniypWFGVU8CSTVEC0UcXSvNi/BKM2/YsVHKm0d2fw7iwVX+ao2DLCPG0ppyaMuwBCY756mGwfy+nGKdBQcRW7mt21M3TOzqT0PgO5SpTSPmCuHDV3go8IU/fM1jv2GCaPZzYrS4pKgVGKrP3bvVShHziqQHrFCXwfWgKZdLPTEOlIETCJEV1C9BtqwsvYxCdU9E+abfYwduhpcBZANVM4N72KQ6+S9UkPirf/iWg7Ofohrb7mZ/QsPI9d+6b+653lf/oq/bn//G1MA73jzD9aT1+0wnVeW6yVPXFpSssLcjVK0KI5lw8IG+9o1d6dRctnGACv+cBWrBI2YegQsYG6mqQXEvKyh+kOfqEw+vfGH1vxmrQZxGrHgf26fdshlwNRz2Kr+sORcsRQZRWEciYM7yGszt1V6z2GG6IUZsWvZ4IwFoVTZymm1nfR8FKBonlylECXit0lPtUzu3m6UMK0ThngRUBW0m3lGP0TEBqSqHyhST8lrYgx+nNLki0+c+2EoOi/aKN7UB5TcAEI1ILbyU2uT0FQ8ruSd9+IpgDBDWp+7ULGkTDX6PNS5PH6omPfY6KagIuKu1wbfMDaVy9aKb8S5/w1Tapu+huo44Cx+w6zZewV+5p/cw0fe805uu/1GZtfv8oM/+yi/++CC09ceJxw7w9R5IZPUQmixI2VGVV8Ec/bikDp5FwTVEM3kYSRgJIM6Vb8JhIBZ590I4+Dfmb/b7jlph0SMbSOdVxRXskEUsDyham5LppWBSIHs3H+V6LhO8TpkrQEUB/L40osQyaMrREbdzoijBsZaiCJbA+C2QMSUSqCfzcm4KfArPvcMX/y84xztH/LvH1EeWn4qD9XrqTfMUIwQKjttkdU8UWLCZGI5VHoSoWRq8OQEolg1kjhL3wYjRfVnq3Oj56qusLjDTKDogf9cO5FJ7mK++1QeWx7xmnd/kBcOxqmzxpc87xjPvjXyllc/TskLYnL/hp9phIlMOlxSxSCLw5f6hb//uSBDZqxrQl4SxhU66yi5EtOcmgdX04gsL16kjiO2SfNUcR9DBZt19IvTrMfzFFljVw6Yzl4k3brnz+h41LLigVQjJXjHiGrCpuBO/+bCD6kjWyZZwx7PPHpsllCplFY9TIu3aa2e89ZAraDV/PcbnOLZT3s8duu9fOVPfZif+Mo5n/HsO7lw6TJPvfkjnNjb53B1iiQ9U21toS1towRQv2FWc95EUXe8F535gTMkormS1IH/nGMzPpdCDO66rwKkGWjnZudpjdbqf2ZQ3xyLb9zWVI7SjHSWcWxwNYwRJfm7XSpqbXNsl5GAtRK34Oje2rL2G1+BuWcr4R0O1RRpBWNuTPYRCkUpBLoYIK8JSyMEww4/TimQY6KOFYkez63mvhlqblAndyt5UVzxquTGpzEEDUo29Z8xj3hLp3cGBPEOkRDcOOxYZfVio+BJNbEKpdVXSwL8wuDIcO9CMWhNomWbtpqIftlVBXG8erGMVKWXyTWW4hA497N5GqFYaSbLiGrzwPXCr78TvvH513L/n7+N3Rtu4fDjv/ty/oaOgL9RAbjvLf/C9i8eOWI3wbf95H08dJgwccncWjOTd3k70WzjiN7AILY1jRt6X1Cw4AthLb4RtypY5/IHRHYwhoa+dIraxiFZ8S9N8VrJTcRF6+SRInOKlDv0/eS5YTtHcZhFrnnTBeWkprjwfL24OSZp63e3st1IgKtsaokedQvOGpCWe/WscDM2tvz+JuYheITO2lw/IFhdo2GOUMmqdHVkVF800YCWQg3hk7Ckn5ir9QY8f4bCNIC1mmX1W7FaJW82m9pqK+sAEikhQoOBbP5aaybMdzwVsVyhoVJs017WakYByNue69i+60DYOpf9Z2p/HoHRJqajwtd93g4/8DVP5Vd/7hf4lE+5jo+eu5ZXvD2xpx3s7aC7x7ZekrJaOWgldtB1aPJmx2C58bHZcsbrNGLnzm4hR6HhnmvqsFwokklrx8pmVerhoTedVYFGWNwoG9v5/4ZbYOafl9bCGL3V0FssvU0w9ZFqGZWOPPhtQ0WIoSNPa/dF1AZzKbnN2nuKCGmTMRchj5MvYuIjk6qChMh118/5p3/3FPfe1fG79wm/ffGplN0zzMuSEjrWyxVpPmuVqX5oqZPHZD2xUSFFQsnuBskDISUqfvDQpNRhootuwqLroAoWvP7XRyJ+2A5ByUOhS8pQCtEmRI+RlodcN7yHf/qFxwirie/+qfu573IljetPkKwriQaVmi0o4o7r/Al4b8+vVyQdb2mhsWGaW9Nn6Jh1HYVIySN9Cgyrta8BwTfwsJh5FawoQZWwPkSvu46dW++k5jXJpCmX0/YWJt28GT/djxEISNooaw31Hf2dEdVWPJWRrlXiqje3mbbPFxyV7Oobjc3g4wMdA/HRD/Bvvwg+9hePc8d1SxbPfQlf/F1v4krZIeSxZe4jMUayGDr5uLKW3KTNuHXpB517NC9Prji0noKgYNPgVcHmteaiaZu8KpSmFnpqQroFddOQGLttPbmUCWK35blsAEKbNkTqSKR5E2Sght43YnP8MhbRmLwLgIkqrmzUUJyk2fDhnobwPcH6HXIuSIrE7OU7HoT3ch+q3/Qdojb5WJBWEtd1WCnb90pj9MM/SpDsCbNqLQpOU3A9ikieqDF6vNKqe4gaAMjMqbJSCzUbdDNXLTCkDP7vDwvErjYBahm8MCrMfFQrrrD4JaoZHWt1Jk3L/zuIKrjyWrNfTJuy7ups84IUP92IrDhY9/zGNxxyx5lbGadzrA4f5d6XvP6v3eP/2r9Za5V3vO4b6uX1wM5sj3c9sORVv7ki9C5FVfWmqNBoWqU5R10Smfw2Ws2lfdt8yFa1GJPH4epANGtz77jl2lusFGsblyha1mTFzVjZfK49HaIx+SapvTt+NVCj+sacJ1corMX8QvSsZjY/BTZDS6je7reRwHPORLeDegGHOaWJ4tAVC5HSDgTapDULEcUPDQHxru/kiwV1Qhp4SAJk7bcLBnnlERBJFHUVRK15VkOLhrRZIFO7zYfkBhs1GBx4ZNMasQyxI5SCxR6juBRYo3cGLC9vpbnS91jzEQDueq4QzdyYWdXlu6pIFLS4XFxtpJhTwLJdhf6o+T+Xc/afv40BamtPs7Hyxc87yT97MVx8/Ekevv8+7vzCF/HlL/8Qde8Ee8eu9d+5JpIopoVkoTlqHRrURTclVlHqmJupppnqyoCdO++/Yw3k6hlfb4dzbno4HEAyU/GWx+nI0Zt5Wyfb+gHYVBc3Q16DnVhLMGxIYaodU5OvZ70yjJlZgDM3zvn4A4egwUmUMRL6zp+WWjYTVzZlSOCHu4L4s9z+fD+PGKduOsmrvuYk153c4/vfcpyjE88i1HP++4o+ItL1ytnwMRGjL8RltdqWcsXgzA0rIyyPvMdBvYaWWcB05u+iBnJ2KTTNZwSDsf13ivMxUPO5cfPqbMBbNXWUCWaH5/jq03/GZzz3Obz0lW9geUXogjq5T5RcPBGUNDHuzB2raoWpuF11pGJrkFC5++aez733FmbzkfHgiDM33MKv//Zb+Kznfxbve/IJ3vm+i4TFscZK9f6HFHs3nKXEbNFRS6Cfz2AciLfczPzYCbBKrSNB/H2qNvoBtu/9QJcSdRqJuNtcJJGre10U8Q4DVe+jyOUqyhtjiu4fiW1c4ZcfodSJqEKQSDiCS4dLnrn8IN/2ggUf+sA7Wcw7ntx7Bt//8w+TuoqIIsHXCmk44k1MbxpXpG4HwZ9tP1w29aH4ZUlD32R97zIoCDYtiWUgmVHoqDZCmBGKE/ksLnxdaYjySmiFSb4J1Ub+xKbWDOkQnxLEJXd1s6Q21ddwIFcIgcm848Km0SujYybrwtc6s3ZlEl+/yNSQvDo3LrxDIPRUxb1S0rXtvFJRB60hRO3ItoaiaFNKLXSOim+uenfk96gVRHs/ONXBL0v4nrYFBplSpHgL5Lh2Jbji/h1xRxRqWN0Ufk2N5udGaK1CsdFpnKbEaeXJHglYN/OLsJh/n9GR89SrWOdgNMCcY4ytGeVFWxdCQzTXkpmk8A+eMuMf3/UQE+c5c90pjuY387wv+KsTAX/tAeDtv/WdFlZHrHPi2LUzvuJH3sv54bhHsSxsTziN5OBwjQbS8vmTnzS3M2MJzV/mPVg+GvBmLqo/JFajb8LTEVGi073q5DM3AlU6grrJIgQvEaE2hOMmAliaCqG0G3khiJexlBScbS1upqkmSOhas1ymJDcibRrDtFZCLZR2Evb/qwAuT23m/wH/84AW28veC22O8C3i86yIufwZ3AXr0JTii2gz+mHFjXSNoKZpx7cJa8Y+aIN5fMMQXGaqntevXCWJ1egxmEIhTGukjqCR0u044CO4v8Hn/O5c82KavHXAWnFWfpWGG96mA8xdrkDQ5AvMZo7VFoNaM+SBtXW880eexXR0jo9/4E+569OfxZe96i84CDcSdhJhtuu3q+Ivckids9ar1wTHUrZzfMwjgJtbu5TsjvCLF2C19Jetb5jV9eQvqAZsWG3xntPhkd+SNwmGTZp94wSmVYSKQfaImpTsMassxGORT73zJF/5+Tdy594+87lw6ZIQdSLOlN0Vrct7AAAgAElEQVQ+sVh4be3jlwY+9sSK5WT8q1/5KJmTzGWkGKhFqmRqMbQLjthtCyJAOrbDv/u2T+O6vRXf/scnkZ3ryIirwWXFvOvbeMqnkrVMMLXDT9S2gTVPQi0+YqpQxgnpfHxSQvKFeRgwCl3XiqaSwGxGkOiz0jbOqFj7fTdyHuK3xuCH/6ALuPgxfvALLvDYx87zP//2Be47p8RxyVD8Nh21/TxEcuyp40jJ8Oynz3jh04/ztV90GweXnuDKlcR8tuLShQmZzTh5bM56veZwCJzYXbDo5lzSxI/+yns4e7nj4SsV5jMW6oRGukTX91gZ0WFNUKV79jOIFhrHoXiiI0/bi0oQVyHBlQHy2GLO7hkhxDZaKh4TbUmm0rgQat7BUMUPq6EhX2OMzQzti2Q+OmL/4pIXhbfzVZ/1VC6f+yCnbrqVr/rRD3NhuoY+KJMpMbnZOlsmlanFQf3Psq7bHl5zLWgeCYM3rTogDazrtxcTiQmb1sTJM+pWGqmS6iM+q0gUZ7F0vaeWqJ6awegktE2ybMu4grrfi8YNcIVyM9gPjoy2CiE0RkAzNZcRNLV9wqAO+LDRi2+stoy8JLJEL8sRv8lHCUyULWNERJrEXrc3Zyz7JVCSJwOCex+oIxpnV5W4puKFRpydakFT75cMy019lqaWeMKhNlCXitcF09ZvTdH/ld0MGfdd5U07DfRViaxaW2nPmLrWpOjPCTG670wDNTtQSQgUcmO5tD6ZEBtcLrqC1hDK0zRCNt76w09l/2PvZ1xdpKbKZ7zkV//Kff6v9QDM8mWeOBi5466n8Y53vY8nxlN0ZhgZpAfzWUoKTlwiGzYsCdGd8lX8NCihnfqsmVK0zYfrdBUIEV3+oEkcGgRpSFyLC+q0IhhoGKi1c2xmadJ/8A0rWKVM/kCaKrkUOlVqY33TefWw4P3dorG51f3hwYSuZmoRqIP//CEhmGMmG1ubaUCt+IEkhgZowB3LMRCyN4W7Kza3cJ1zx4tE39jNTZBVkwOETNBQyC3mESo+n1I/iNgmY08zRG7oieB/r7bIJR6n9BHXuG031BiwuOdzKauEqbnAq0v5WtoNw/wWoTFBNDTOyMtDP3A1uJJHk9THKtJwu5bdBa3W5mstKphHkJ4v/9y7OHj4T3jfhx/h4YdXPLD/MS6mG1l0PXrsGmKobKpWrbQgQmiKT5089yoNMFVaxW3JIAnVSG4o3NLP3PG8WuHRMoMCWZWQEmE9kOvoEl4VtJU0bfq363rEgm3VKkobBVTDSsdzPusEP/JVd9FzljAKb3vfk1yWGXvHdxhWj3M5V+4+fQuPXVqzOnvIUa7MEYbDczzvqTfy+u+6h0tZ+fFfei/vPnuSPhVscGWhDv4ZqEJMiUmUlz7nNI8++ue8+uIL2FlczzokJK+YbIVMwjANdLN+a7bVPGHDQEnJvSDrFbningkZsclvctuxQIu+1XFysmZVjExW6GXmh7DiACvEKFkIM8dxW8UlWhHM8z0u5a4PKXs38Zo3HvI9X3AtL3mB8O7/+Ci7oSASiVIAJ6EVC8x3C9/z1c/j0685x6ljeyztkI8++DGOz44x3+042L9Ef+1TuHjxAhauY2lHzBfCheWS+x98AI0r/s03fgpRhb94bM4r3/QQj52t7HUdVZVpHOmSEtOccX1At1yie8fcUCiJEJRggRrcwCmIqwNtY9M+MeFGT50mHy8GZ+IHPN5qEwSJkECn6pXPae7GxWYycaiPNIRxIO0tSBV+/8Iz+fruCu9/38Pc3e3ySz/+j3jJd/wWw6TEftc3G3GUuBgEFXI/c5OiZvcFTBlNTmINMfqNWDy6KlVIBiq5zbGVMlv4gRZpI9kWv6sec/NmvIy2hjtQ+uBth6gbjKWfMRX3O0AlZIeXVQPT6P0CdUDMWnlP7y786iRNMaf8Wc1uig1zN2FapUpwPLy6v0hTQhCKOPskY6gEl81XRyATVffa/tGomSVQu45orl5GNQfSVSi2djXLHPluoafYiEwDSSJTLhDdRFhGT+XEmn2fqAnRzt3+ApTSGDON2Bo6rCyJzawsZSThY9dRF4SyJtURrYEce1fh8rC9tOZa6ZIfZgpGHFtEWNyvMFn1cZy1HgGJlGlJMGHVJT78eOYW9riyfz/XX389tVZR3VgtP/k/f+XJ4MH3vO4V+4++9eWmhXEo/I//+8O869G97QNCy6FrLW6W0N4l9bp0adlbZqB1aEv1m2pAsOBsbuepd9symSx9k9UOiGUkp4XXAuM0p2IZLYPTw6JgoclHzW8QGue+NjmuhfZbblfJ0dG4nbq0DA5ikaCU1EMuxOkQ8IpTwbn9Wb3jelPesIn7Ofe9tcOptpa42GZykGtpbXwtJhh60I4g5g+GNjd2NTR1fiONPdI40VsiXG1jkeLOfHfAl+3PgDaaWZpRx5V/5+IjBhvHNidvRDTKNk64AfWo0Spprblir/K7a3P9f6J/wyX/dopXf7m8etZd8q4OFLKBSWaclF982Q578yXL8w9z9zNv5WtfO/LoOGfn5LUk4lZNYZPeaPEnbd9TXY2UYe2o0ZAooY0Y1muXwaiMwxpWI3VaE4zm6RCfnaXAVMxTGPiiYctLfjPSvn0XLq+KCHV0wqWNUFU5eVL4nR/9IvYf+TPSzine+e7HOXnKOMo3845HDzjGnOnkCd7wBx/kOc++jT//6AHj/hEvvDfyvNuOc/s1HcKSg/0VC4Wbr0msF9fz8p97P2+/f3TUciOqSd9TEVJd8vof/jR+68Fb+J3LO3R5xpAnL53JhXG1pus6tOvRPkEeqMMRkkF6LxWJ40BpzAYH6XinurTEi+7MIAdfDJdHDcXqErhFpdvZ9d+z6NYHUxqwpVjw0cDWh6IwVUQrY8loDTzlytv4jhfdw4+95T7+8HfPE7WwKhO7kjjqlFd/6wt41uw+1mKc//gFztx6HQdcz6XL+7z50cD9F5SDsGBYReI1p5DR58v7+0sW9TJ//3l3sbP/53zabTdj++9ltrNgeXnkot7C9/8fT3JclbiY+djGIFIJN9/A7PQ1vv5odJUKCF3vMm1qXAQJHkcOm+4Nn71m3fhmPOIhMTDlSpxWBE1M6gqJxcbG2LxrvmqTxNeGWiudRo72V7xoeg//zW0HaF4Sju/wH97e8Zvv8ahcKEZtqgPT2hfu+d52XJVzJmkbIZEp0+izeCrkTJ7NGnSH7YjWVHzTGdZt1t+ww+1dFm1Qo7wmgT9DBUKaezIizinWzNue5vcLigDTklRyqx+PvnZZ2fINBDfoUQeMzaEr+LgyL0mlIDEwxh2/CKgnv/zUUJAt5UVd2q8Turri5rx+h4KPTiS3g3XjkqhGV0/qylNUNkGYO44+t828uslXMfc+SSuGqoUgPqo27TFrMT8rvv4UH8FWUU+BNaO1+UKM5SMIC2qYozai5QjRRJ4d889vDnqLzcNG9AulhOAHGoSIpyZqe2b9suRj6amMiEGsxpmdJ/i173g+lx56K7pYcHZf+IKv/Pm/dK//KxWAD733jS9/6u2nuHBQiHsdDz5w1jePWQO8FDdhbX4dG6bzZrMO5u5xWm7dBEJw2YWcqVSiRnciZ/MTZfAojbaHTWtTEapT3aTBK/Js5tCV5j5F1GURq9Q8NERuopL8lxoiVLDJa4Bz4xCQm1mOQsiZqokSe2/iEyFKRBvaN1rxhzUkrN12pTUZOjt7U3JTwSpTq6JVKtXUo2gtdpVrbOqGtSiiNSNWasYUcUxwnTDr/J9t/7vPjidPJRGRxt6uaOu0DlRp5ps2F/XsiXsxMJpsVqgkAu0Fs9pe6IKabAtmrMV3EB8BWGtMcwZj9Qxccfl8A/TYxIBCyf4ZJXP3LYEPvv88tz/lHu574ALnL55g5+ReMw4GSpMiA5WqgYB7NRA3gepsRsUoq4mQJyASYmjGIGXKLXnQB6K6xO0gKScvWlbmfWQ9FgJg/Yxp3Tl1smV2fQLZRlgpYkXRNHB6PvDa7//7HJz9COuDFecPz3OwewO/dn/HQx87YL8/RYxKfWhJf/O9vD/vEW7PBJ140+PnefMHLzNc+ji3nJz4wr9zE8+5cYe/OHuW2e5Ffuqfv4Czjwa+5JWvZxj7tkh7/O/Ga67h1ltv4W2/F2FPWeY1Wgvr9UiyTLTayn+UMvn4xw1qLUaIA198xrkxoYGaOeY4CnU1XlVuzMhBSSKUYuh8BrM5dcp0SZgOl26OnDI1BVJwj4ME3yiLVY83CaSiUDMf6Z/H+w6NL3rqGf7oDw6peUWqgeG6BS9/6XO499iDPPzoWXbmu9z8jGfxroeWvPWJwoNH13NZ5ix2BlK3oDseiMHQxXGCKDec2KHoCf7kyYH983fya/c9yZfedYJ7lvDcZ14P6Rif/YGHeP8Dc1+jZjuU5SFjivSrJdO4JGnfSmdcNvY+qIlpUkJMTZUZQPwzoYEagt94m4JkYqQq9KFzvoO1cVh0/DY4Ajs0imY0v7lRmgWxVNIs8Y6jM3zTM+/mQ3/6JnbDKZb7l4lynFzWXkY268ECpOSjTqvoNHhsL3qqI5h32yEJixWtkdwHNHq80wvPvNlTJVCyIf2s4cVbBFIEi549F/X1warH3jT5Z5DgN/MQk1PzPkF6rxq9MVEM3ZT5NGk9WMY0uXEyKIKPr2SaWhfL3E8oZfJyua5HM57gIWMZV1LFeSnSDLVJlKk7Rg2KWnAjKY1EWiYkiGPDO66qvu3C4uthaRfG2rgwUKs2s68jyFHB1JNpPkJua53jf6hph1DW0BIOpu0ATkFq8v9vdQaMaaSmY4D54Y6BokKKgZrbnlJd2e2sUjRSo1JroFZrwDFt0WUvdPOLZsLKioeunGK9fIwL5/eZ7+atz+sv+89f+ncufPSNr7j/Xb/88kuX9iF0PMoe/+yXD5ibMrXbaSjlk9nvJfsMjfaltUpIMc+WqnqcZXMaFBGfy1aaNLPGdI6mDlkf4PKtR9lqf8x778UIDZxDye6CVfVZu3hFr6oXSARCM63UhpANPnPCTThuCgTGZnACSqut9BMtLqnb2E6EXL3lj0NrANzMj/HTnDVGuLaTMGwVAB1XnqTo5i0qIj4/stKcs7Z1wboi0mHNy+DTXb+BbGb/tBHAJqcrGUi+AWzVd8s+s08tJtTmc+BngWx1G7nBDAs0xzuYuJFlM+fXONtm40vDhvptuiGG289pUrd8AKUy2MQX3Zn4zheueOs7P8q9z76RV75R+Gi+nX6xQ+g9QRD7zr0GG7KY+cZexsk3tiG3LvgJRh+LVBNv6dOITSN5WKHmtaXTMHoZSMPOhqqULqCpp4wD5eAAnQamcbjqUaG6L0MEZIS1cs9t1/K933Qj99w48bZ3H/C//nng/mmPE+k0i+MLpG957aRMqzWz2cyzyLUVkGTPRo/TIeP+Bc49coGbdJ8f+uYzLM9e5HAN937KbYy24Gu+782cLXuk4hCeT731Gq6983reP7udmI3JCnW5IoiRxwkdJsLunBqEvu+9NCVnZAOT6Wc+Wyw+PqnjgHaJMvhoSGKAbtYSJ+Lu6RhgzGgUwnXXIHGODEvK+ogwthTOpiciOIJ3mjKzrvNDoVVqNe9BmNaMFoirJ3n+8QN+4+3n0Ko890zPd3/5zYxP/Amz7iS71xivfqPwXv0U0vFdutmMflhSwowoEznnbeJllrqGaXYz1uY9JQ8s1xm9tOLLnvU4n3fLEWeuPc2Hz97It/zYO5lddwMxKtkGTtx+2/a5CyFRppEagqse4+iQor6jmsfXpJpfGKL/ri0boRXACNUvAzFseQUyFW+dlOCbU0s6bUZJAT+s5Xy14S8vC18xeyt/5/Qhjz70CHvP/3y+5hUfJs53nVo4m7Ub4dV12vLU1kXf6DRnrJEnLTdaqTh9DmnEw5Zz96qBulUpQnD3fSk+SpTQb+maG8+Nil+WRAtMQkg9Voat+VFCT9aAlMEvCg2BTtrFpqWvZxra+tdSL+bSeq04WnlwpglA7Xe3KiVSsaq+V7RuFgte9GMoVidKCkhuxtg6QWmjT1q8tnjdexX18ah5mkvq0MamviZLbspm4yAEgykkpNvD8hFhcsmfWqjdzNcZX/2ubqwhQs4E1tvn1FULoUqPBq+njrHzw1wwSp28u0CkHRCbL6nBwBzUNW0VOVpSY1O1jbnZe8jKT3+18cxF5nD/EbJmTj/lC3nac7/1/7Hf/6UHgD/6tW+1k3Pj4XNrrr3xJr7vF9/Hex7e9XznNPjGWMtWwra4i0qlFvNfkHhpAWV0UwmtaEESFpzeJlQvlVHZboK0qJDmwZG6mqCMoDMkJaq1mEuLZdC+rJL6li+FUg3MT15Zouf1o8ue4AYONTftTeIPRtyciDcSkwFx1mBFox8H8oZt7xYxrFBjhE8ozXH0ruNv/bzgWNNgSsyDb/AxYv2Oz9toLwiNOGftwaluLnL+dYu/aIIWpaybG0ur+dwgbM0+uZ/Ai3caLIhmblHPeSNuvqmCV6SOjif2mImParztkHYqp/Hva4seubO5ygb8Y9tEgC8aEWNiyvCKz32YO073FF1w422388X//gonji3Q3T3Hk/qxGMSVk9DaGz1G5A/8hna4XQSrUMaBOmVsGrFhzabyt+CHB5ZrLCjZzFWn6oS2KpVysGzMbSNPPg6ioau9PbHwOZ95kh/7xru4dGHJ6978AX7u/ru55fbbsJM7RCp9UPK0oguR5bBuxrBKP59vYz1K9MrZ7MrGMI2wXHLhygEnH72fH/snz+CZd+/xq7/8Bu753C/hW179O5y/6Cra8d2eO7/gxTyymlgPS2bFsNWSabX2yNUwUIPRpRm1cyOfNANV2OkgzXwcM03+DISrffMyDa2U0YEiMu/c/1AyfUpMpRB356SdHerFC4SqTPim4ekPRXd3HEk9TmhS9+REPyRGYFqv3C8y77ErV9i/cpHb5QLf8KkDN57Z5YMfOsdaF/zyxeei196AqdFHmKwQ6sC0HrYbqpt9fSNWVfoY/AAbXWKmlbdQjYOceMbq3Xz7CxOXL695y4eFn3/HwGJvQWcRO7HL4tRxx1Zo9ErhkHy2apXQJS/Y0U2jqeKIwORjvJq3I4BP3GxD0i3sS8WTTrkIMdjWNLs5bKJCHaZtrNZQwoffxs/+o6ezeuz3SKev4b/76RUfPdpDpVBD57XXpRVHtVbCPBwh0xppSmSJCWLC+0Bkm7DSqRmKG9/BVcbMptTK2kbqcLbSMuZNVaSZaK0Zk2N030hlG3erqHcC1OK+pqDU9dpla3Oa6Ma46NWxyaE6EsgtqmljRuyIasl9Xf0uUpSwaZcM0WE94WocOiJMwd3yVdzBXxt9y8l84v5ElyKguh8rm/MHsgY/9GYcWtZG0zTonIRwtdWVjJZxa1SuFOh2fZ0CwnTFo7Ox91ZFgVqCH5iaMqB19Atz2sVSR62F0PxohBmExkoQV9okRRhXWEpI6FpyrbTP0Qy8rYxurAZ5QOOMG+oRv/uqT+O+9/wap07fzUcfe4QXfd0v/+0OAG957dfbejxiNj9NPXGML3vNR4h6jE11qxgNh9tui+qbWAjBW9i6OTYVgvoDVnE5TMS2D52kGUKrNY3tr5UWQVk3k5JCSkidKHFGmJbuQN5uthFTazl3bQ9be7hjj2xnlqUtehlL0RkGlr0UI7RfXjGYJkQ9LlX7XZ+HN/nENrGY6vXCspkPtc0vtL9aiFu3tI8+mqGuzffd4S2kINRNX7bU7XcvhrO5zd3gG7yvtYWb6hu7f/7goIzJs6mVCarzGWgbs/s0Jj/MpEgp/oJ7VM/nl2hjdRdHLsXQfVJD3jRNn3QrFxHvvN74Gz5BYtp6DTRgNhHCijd800ne9icf4pY7dnhkeYp//Y7jHD9+nJqSx81CYzY0JK4rGF6mYUJTFDZNbf4C5NIKp1oSpA6T5/olIONIHieSKMP6yA9Omx6C1QG53frzMLqaRSAbSJ28AlSMG7rMG37y87jw4J/x5sdO8GPv7Ljm9Blmi2OuGMmmHiRcreeNQp4qIYqfJdQXtlyKS57tu6rTSKnKOK65fPFhPlMu811fcxfj5XNMXeSbfvwBlnqKWJekO5/GiZtvog4Tw9ESGQfy+ggOl65gpkiaLxDt6PvkRMzFArS1CLaYndXsB9/FnLxeuxQcg3ebi5E1ogo2+KZbxBvYJBo6tvFTm8eWYXSFIwRKFCQ7jjt2vX8XbVkpZUL2j5iefJzl8jK3H1vwD5+zz4tf8DT++M8e5fXvrfzFzc9lL80IaeEtaLWyXB6iUuiJLVbqkKcahJKNrikAQy70s9lWjUu9F96o9CzznOenP+Nln7bPhYPMv3n9xMPr45AHV7CC0M3c+9Fdc5p47DizY8cI0XzTVh+bGbixt0z+jMSGvC51i77evCcyefudbRrp4sxVp1wp4+DlPSH6LHnK1KnJs1YoWjl44hzfd8sRL3hmZbnYoS7u4nO+/fdQW1I1ERqnoNZMmfx9iQJ5WDs7ooyIRCwFQpq7kz9P7upvkKxsG6ZJu69uk0q4kmIGXcOBl/xJ+0JoXI9KIeHEUStje98VnZ9wZSrQNndPIgTEEx+leKS2ZC+/GdeudLaUSgqCDoeYRO8u0A40EanUvHY2f1BXPULnazjiCPPGZdh4wCQGsnjUnBSQsbQ11JC8dOR6/b8Je/Noy9KyzPP3fsPe59x7I+LGnBlTjuScQAIpClKgiBTOirpasZpubNFSV69SLO2qtlpLLZClZVMuusuyWnBoW9sBtVUsBYGSKYEEMpOcp8ghMmMebkTcc87e3/D2H+93bjqtVfEX5FoRceOcvb/vHZ7n99BWx2pTEAqFATA7OsEYIhqc/Sw6mm4C7P2hUBoPhwaPkzISxJEd5qTRZG4E6ZrQvDQLbA8Y74NgLgXnO3NyBdnKs7HJnIUGibfVzBLNvpVuqoAGW3WXzFhGOhf5y38+o3cdk24Xx08+yB1f/37398WA/0ADUGuVu3//u7n65ls5c27grqOCq9sQZ7uPSsWJw4XOdje1bqEcadYsSWPbj4NDrEmtxdLNHObabAISLxUZF7jY24it2M68c0Khmp/ee8Pd+mhhM9UOaxMFmv8VxVS8CqoByQOlNFgL2PheKi6NNkYXG8NJGiH0VB+A0nZl9mCri3ja3lts3+NCsO4IAbXPwvyiUEVMBb20DXpD0uZq3HiLsg2tCChNbGPxttJGq7JU0TtLGquNvidqYkecUaqEipa208N+BjBCoS4v4uUh5UIbp492CKnZhnCCICYUKskmO85TampTjHaxiaJYYkKogdKgQb4BLEw8o1uH0wu/HDfshmF2nN0Hd7CyfoA/+Uxh+2TNPpvQ4YN9PgRHSBXnPcZNbFVwG1eqF5sCjDamllKZ+MioFqpTvD03NvKEfhJJCLiJiTtdR0kLUhqM7IeRGUspVB2tGBVPFetSfvQ7dnDumUf562f38N4HruSavRPm27fhdIG4Qk5L/LXaWJVCLRYkVRuCNdcM1SYAWhR1tnZxzuNdZTVuo3dHeDjdzk/+zsf5xbdey+mnnuLf/fCt/Mh7T0C3xnjyFBc2B0IXKXlB3VxYrPWlSzaWdgHdlon79pjANXqKD/hiK51Sqk14BnBdg9wsD/ZsdlN7wio1VYO11Nq6jYJfpOb6sZVd0Wp0vlQZS8Gn9vLPR8qY0ZXOVmyLGfOTJ9HNyzitxCj8yzdfyW3XvIij9z/Jrz24l/nuq9g2WQHnKa5AyuRieOq0mDOGYDqdKITVnpIKXnNb2wQ67ynDSKVSaiVXexZcF5iUM3yq3sj8c0f5iTuP89ZXrvLuj15mcB0giItc3NhkbWWVy08/h5fjLNbX6A5dybadewjBNSAQDcQSkLrEkdulbXklHl8tIlopxGosi+I83lfTuuWBEFx73wsply0Og7QpTCSwb9/VvP/Jj3Hd9BTnN2f4XY/RJ2ERLVkPKqlWggR8dNYMSDW2iQWsGgk1K8U162FslErnyGXYErkRTBSoIgRv+RTiG8gomWDPu5aUJ9jFrx34lqmgjlyM2oeoIctzQbw3Qqi0NMVgFuvqHLJcpzRhZI5TnCghlxYQO5JwBB+Q5ZRRZ+au8jYB1uqboK9FBbfmq+ry/LGGoaYR6TukJGoRFOu+TfA9sewQMF2h2PTK7NQdroAXS1hUUYI4NA1UUbwzm7Z6O5t9VcCbQl9pnIDmaEOwKGRvQKgCFd8mtEb/dE6ppSGHnYnlNdnqwngjHhfNiSMut/WHUvGI2CQCAtXRSIRmNc/a8aF7NnjdkTkb/hHmFxNPP/D7P8XfIwP+gwLgi3/5rnryVGVzfoxBM7/7yQ183IZS28qhQ4ohfhEbGYkzUZHtMhwyLpZ5MpS4gqvZLiwdKFWsMGidt1YTE7KYgZhWQNslr76DOrcYT7E9Ef2qISWJ+DSnaEEWC3yM5Krm0XW2CjA/ehtJF4HQwVK054QqJsarJdnIrnW4lEyoCe3WKFUJYsFGljCkbWRtBYxp62z0K2DBExK2dA5o6/x8y3Q3pZEJ6BrSWNv+FSeWuuV7tNkAFTWxW25rD/vU7KJzRjqrLXXPcsPLlpLdR0/OTZjkhSrSug5vo/5U2htgil3vlKy2zVpCf60CVcM2Y0E8LCcRbXLh2tjevOgOcZBLJlN5yz+5Et9vEOoxPvnwcR66tIeV3RZB7LCcgLA0bEjF7hMlq+LE4Rt1L5ViKwjvsBRkJXmPb520z22C0JS0OWe0jsQ4pQZhPl4ibmzYFEgFl0ZqPyEtBiaTRED4lle/lOmunsvHn+Yb71znx37/Eh/eXGPvvjVq8PSa8CHgs4CXpqa3tYKLkdSEqUtbaIjR0uh8sJUN4OuIEw+0jIfJhOl0wfGVl/HeP7+Pd3zj1aQnnuLqKzZ5brGXkhx14yyLham/XVUGCt2SmSCFxalT5NUp012rphUO0S7NWimpoFJMSaxuK5HtdcMAACAASURBVKREm4NHcqVOzWLlvKcWm/IVKhk1reyifWbR1kB5bLthKlmV0PXUPGdx7gL5iQ00G2AnV6gu4XPgO182sHL2br54MvC/n7mRzatuYuqbfx0M3TwuDB1bC85Bmm1CKaTR4XNvRbB37WcYycUKq64zCIsuEhqVedG2Tsh8sd7CH52Y8IaDT3L7tlN8/kRPTnPW13eBLkhjYtSe1UkgXzjHbOM8mzv2sfuW64lrKzAfibHfGr1LOyd8O3CVNinD1h8pmfbE0baUJeNDaIr9ZcGgaBDccowd+5aQmUj+KlYPXYl//h7WrtqHlyeQuA6pJXj6FhI0jFsIa0fjQEggp4yScLm2S9pWXh6hamwnfrVMBLGEz1LBxYld8iUZ7rjYRa2NL+KaIyJ7Bd+hw2AtQU64EPFdz5JNqtVCfvAFQdDWrdeabYLshZQGomsXKeCrGG9BQMY5obckT9QKpaqW3VBdJcSekmaIU4Koddqu+fHb9MkrpDQYHG1UJHqzRZZWlPuI+oKkhY3XnUMlbK1Vq2ATBVFytsmXK8U0Tq4l0AYTRiPOvu8QcdVTQtOJ1GSashAtkVWzIfBzxXsla8Fjn5tzmH0Z0xeUbM+NNrdOCE1wGz2k3BpdG49WZ8+G3TtCFujqnPfds8mr919k8/Im05UVjj34yf92AdBNNjlw+AhjmtGtbOOxR45T1iY4H/DRDn4V8NVEZogpWZdcPC0JbXYXvMEhRIrhQwotTc8uZUu2M6iF90pVZ+rjLlLUtTqnfTBqvsw638R3/dZOSuQFf6cDs5NU868C1iGLoN7eSMUeZrN5JFQCzhvOETF7RRUDGi0dCVqNyqXBUZbj/mI2FLeMCSUAy7+r2VS0mGpTpHXdHgltGqJ2geda7UJwtiJxDW6jMZrtZinccy1Wt1Sk79urVqhFzJ9fK7WabU9SRcWAQCy74pwslKUkYxgUS1mrPuCJeBktxUwEsFhRsGmGRNuDVTBxzXI/iLbEvLYKUoM5lVIQbDx36dkn2Zxs59DVV3H01C54wBL5+rYr1rZPKy0AyTV/fwgdmkaKN6aB10qpDpxHUyI660BqLmbFJJlfOJlAxlYkQhrmhiq+fJk8blLbFOUycGXI/Nh3v4S3ftOL+L0P/CWveXnPdHXK0UcLF09f4u5jHduP7DGBozcRWs5GvnROcNlQrzk3/LMzz3Ro2d5VbPhiz2mbLDXeRG56g9hNKCmxFqd88eSNfPaR57iyj/z3X/lifuq376bs2gOatzoigkPUig/fVjyh72DMSN9R2iRGRey7jRFmMwJQhgVhMmVcYpSL6QXyYjTmvTTSKoVARGNkLFbo02J7dWyMgbpEQsN8GBhPnyOdv2B5FeKMD+AKLldiX7nzyHZ8KHz69CFyvA2ZxIZlBZLhaOswUIeR6hWKmhe9VsqQIRWqd4RJb0TOiq0HnHXqzkdisHjeUhJePDXNWSmbfOTZg7z6hmf58v2Rn3z77Tzy8DNMuyn7D38Z73n/BznBPh54agNZjaxOV5idOofWB9n3spcy6TtqTnZBUIy10Gig4oyH4MTZ5AjFuWjW4i6gJbUy11lX3M4TiQHNGW2K79xsguIqYxfJw0WeenKDK+ZHWV+pXG76GN8UgDVlm96IRewGgTLO8C4SLKbUGigswMrWVB7nM4JH1YFv6Z454X0FbNztKGiyItVmDsYyCS3tU5wj54wvuVnA7Z1NVXHe2PaiNBYIpjGInpIUZJlBEfCd/TucCLmRWsV5G2RS7ZmgGLOimY3ER6L4NvWs7Uyy5suL2bFrGZFiFVpsAsVQs0VNBEd1nREomjhcfYekEeMGjs0W2r5H31a/3qFKa0S1OdjMTuniqkW5L11aTSfmg28ib7buKaTl4EQPZTSnietMSJmTFSkhmM2yVixvwnx2Jip25GITi1pz00IADfNcc2luNFvNHb+wk8vDBuvb9zJZ60gbF//+df+PrADSyMXLZ9l78DBP6SrD2q429qCNl7WNuyveear14tYR12IHD9EsM642SwWgzeJVm2o7J9uPC9RkBDLnJggJTSa6cLFDW/wlgDhvCXV5QZvdoFjMr1ZTayINsKOW1Ge7eEuIcppQieAh5USstdGjEqV1SN7B6Lw9AK3TVYxPpbkgTsht/x28twxsaepRDWiIVtFilS2CHd4N5lEaCUtaHoJQ7GUR2mHRQnYSL4gnnQUhgUO8UpxvXWTFMdjvr01U+bdG8CXlJlA0DUFVUz2bHalaShZT5pqIwZPwprMIRvpyOaCd4vwKzttnXtMcrQ2XqYlCo8SJJ0polh+P8z158yJf/ZrbOfHE09z64sP87uMb+NUJk9hRUGJzFeQxmSAP8756r9RxgGAuB9doYEqhpoIrFiKi2VYgJQQEZ8FAwyau65FSSJ2nE1icOolc2iC1XIG1MPLOt7+Yr7q14//7i89y/+fn7Nm7j6MbwqXHn+Slt93Gb3zqFOOBK1kVUzhrNiudj8EgVxmq2tgw+GhjYjX9RNaKa1Co2vQWKgouEP0UXWZ7t2mQm1p6ZL12D7/4kaf4z99zgFdu3+Q//o/XcPDQdfzWnz7M73z+GcJ0O6txSllctAmOCF4D7NpBXJ2a6tgBo1Cjt4Q6KpIKSXMjAVacySTN9hk9IRVURyQEA0GpMzgVCl7QrrOCeG6kMdFCHpUQAuNsk8W5c4wzwyprGlkCrKRaV7U+SZw7fpwrbr6OPy+72bESWVVTcY/jaN/hfE6Zz8xZU5t2pdhY324qkFIoMtrznAvL+GIdCzkNlM54HzVnvHQolnB5arxI2XkzX/eNaywuHGd2MdHtHLl4/Ev8D/90H9ccPsDpS/Cj7/0Sx0dldTLl4qnTTJ9+nu66q0zM26BUjKNdZDiq+La6qxA73DhCWELJin0/ITDW0p51o0s6sWLaxxZNa5J8yxpY38GgsLpvF89cHLjxuh2cfDwgoV2+LdPeoqvtzKqSKf3EzkKNOBdJ6vFuJEgmqaI6x7m+uaSSNQL9Opa1oNaRk5trJGEIlPZeRahJkWQWQoqtCAQTI5IE11W8azo7sfG0OG/ap3EZ05xxIaAN9qUeNI1EGnnQ+RaBrAgTPINNnrzptipqK5O8sAYlTFDfk9MCKQOVCeIcLlR0yKZ5Em/fSbG1poTYztxm+SXiXaAMCyuoG9eEYWGNictN82YQHtHWuDrDxuvyjkijXfw+tud1IHsPxZIPl5ZB5zCIWynWCEe714xRUNufBz5MrDkmI/0KlptXjOMhFp9EmxpoqaYF8Tahqk5t5TFdpbvqTuKZL3Dx/CX8P6L4+zv/6Uuf/k8/zeLpnzrx7HN0Pfy/n5zxgXugxIZqxMR3Fo3brHXJon41WXiFSsXXYDhWcWhq4/ViPnsnBSnJAA7ddgNb5JkR7NRZB9u6wjH0hPZlV802qmnxsK5mu5BUqbG3SrT5MKvv7OVS442R24EnNLKcmtc5z5rtLpuYo0Xoeh+pbTwJVtuotICYuoSHVPuil5AV9QQvW1HDwdkXnlGCcybSwH52TQuz5kkw4Zl4nGsV6XKX1dIELQdAWmHTRHI1GyBiqR/QapOXlgom3hTKWrCHErMchWDirlo8Cx3pJ6u8eheshbPcfu1Onnn6eb71qw+ye6fnmWc3ueHwCg8eH/jofSPDGHj8wsBjp4QkUP2EldAxpkLvSqs+wwtdgYeQLvOB71/j6ecucd3163z3722QwzW4bT3e9VuiSteihmuFiHH/t1wNS5dEADdPW7Y2aKrqoRjdsAq179DZ3D7DlEmdYzhxinrpvKGCJfL6lx7gB19f8EG56+4nqJMj/NUzhQePjczp2b17D2OIxN6xsraOWaIdwTmkLPkQ5reuzlwZqXU7vvNsiWGLFb/Fm1jOqXVDJmJK1k24yOA8XdfQsosF8034N6+bImfu45brbmDz5BPsPXIdR48+i67s4Zc/8Hk++sAFJiu78TVRaybs2sPk4FWElalxKvKAL2rP2mKElCiujTHVtXH10kWiFOfMtteS7ZbgKvEejZEynxOKXbKunQGlKOPmnHzmHIMW02fI0n5a6cqM61fn/MBXH+aVN55k5ib80ed28wfdK9geIovQEVsHWhcLahkoi5GSM2Uc8LnYedIueq1s6U3EC3hvcK5uYnGoeUAE4mSyZWUDhw8mhj1z/jJHVkf84FiMiasP7WA4c5zX3r6fA9PHWGHOoV0HubT7Fv7nn/kIz9bdhGlk9aojHHjREUqLBBYFCkhDVWsaTSnvIq6PZrVTW5/gGsu9ZEoXCSovUPFELRimTehKyjjM2vxtFz/Nt72i43Nf+CzH3Bt4519fMPGis6ldHsbmKChI6FmwyoBjx+Yx9u6AKYkbD6zyFS9aYfP0U7zhdbdx3z33cu3VN/DwQ8d4xatezG/8wef5wvHIpW4fT29USihM/Iqp5seLdpbFnlKd2SPTiGtaB2kWUFRNGF7aORVXbIonNn3NadGeNfv9kheo2mTJ3vkCku1yT9UgOKR2vwjoQO22myUx2VmtTtFxYUUBzsSRsaeW2ZbTZmlh1NiRil2agHX6zlZvtetxi4U1taqUOtq5oV1bbbazp+kWHK0RlWhpmc5twZO0TWakIUw1Brv3MJ2Q86ar0VLpnJCLBVdRi8X6+mhT1W5C1rF19rFNXKwxisS2cq42F3eyhYUv4rbOUmjEypwovuOf7B/5mTecZFxssP/aVzKuXP9v91/3QkTw3ykA7v7QuzSUDcZS2cyX+d7/dJSL8x22Gl8S/VDbO1ezTHhpuyL+Vs54VSodEqp9KW38WV20/Z42+8dkzQ6c4TKujNTC1v4liIk13LhpI3g1EJBZ3mg4SWO4J2+2E80mkHAukIO3vUw2UETJiy3hmxOL+HTVXlZtKmjvexsvxQ6yjYkKYhVb7KwCTclUx01pahALh4bO+ndVU2DbTwK+NhdCNG8w7gX1fCuZxTsYZxQJLWfBWPikZNa3agcrqViE7ZZv3W95Zi3S3eGcORSKeHRYUMhEIKljzJmDe1e4ff8FfuX7bue+h57gur2V0wvl6BOXmWxf4/YbVhjqdv74b45zzQHHiRMbnLysfOfrrqL2azz9+AnuuPUwf/HZU7z/45eYjR1ncmVYFCiekC8j/SpBCkO5zEfevp3PPnqel734IF//GzPW9l1D72nixHZjVKt8vbqWmqe4ouQ0x8eO4r2JTouhODVlE1GZFos6GjGttrVCHbNlUlzeZPb0k5Q6El3kzpv384NvGPCx59lzK/zcBx5l2HEtk91XEqdCP1mzHW+cQJqh2uhbzlsiWzaUbtd1dghPOsMM69IW1pwaTm2tJcEs6k0JvcyTLyW1VYtdJMuRsg9CSZU0Vsr8EmdPPc/KxhO87sA2fuBbb+H5Zx5k3/ouxn4f/+v77+Whk4XYreByxa9uxx8+hEyndFS7VMcBl1vB6sSEhNjBG8Uu/bFZiGxdYVjgnI0yJt5vPfNSmnBVFXJhMZszP3WOmguCFRKLIhxamfHmL7uaG664xHp/hsnqGk8/seCWl1/Pz36q5/jqdXQhmp4mV0pN1GFozoLcAFgZXcztUCqZWsWU6dkiq7E72JIOfWhMgEooJgZ0bT2oTZ/ko1n3FKNwehGkt5335UWimz3OG6/fwTfd6kESe1b2883v/RLHLq2wY3XCwTtfwXSlo6h9t1toaMGcRgV8TeSu31K/L7MEqLq1qlHvzJK51D6IWuKg0oJlKhOBLzvzWb7njo4L557l8vY7+c73PmHe9jTD14FSlEHXyFygX1nlR14+4ZteewVr64muczx892d58Z23cd/dR7nhRTvx1ZNGo+ztPnyARx54gGtuu4N69gQiq3zic0/Cnhv57Q89yqcfHri8bQ8rfkIuI14zLleq7yjV3EDmwbdsAt80EKpN8Oed2f2y2cRVC7U4w8UPmzhsauq7voHGBBebqyIYzZKWcQ+V1G+ziWkZmzfedu6iJgyWfs2QMG2SK9QtCx/BVmGuVmtetbbu2jp61RZ1XjzEFlymajHvOA7unXDm9CUyUyvSyibiOmtyus4KA2dThKKFqJbit2xOLCHVQGYlBCsM1UTwWm1ds6U/UG0TCtOLeRdt3ewd6hS0CRy9NZyiBpEzFoLdMcsESt3KBRlZKYm733kDT939QdavvYVR9nPdne/Yuvf/TgHwsd/9Ye37nmFxkfXd1/P6n/lMK6Q7G8k7GrHNxspb6FLxLQa4HWrFBh7LA0OauGHZHRkS0ryvS4Soaktuai8KYntUKWMrIEzVLk2QZ3v2bOI6iWj7UJSCL2qsaOe2QiW2KqZiu1xph4YTG9PSRv6ak1WsaheBiPnhq9j+WVqeM7itKEznnOUbONn6UqjScgcsbhICGvotB5E43VoxeC9ULFpz+YUoDslzqC9EWpq/N5o6tFkbNZj32flI0WzFUvVQL1ma1uBxE/jyPRf4oa9Z5Yp9hX2riaeen+H6a/jNz1xktnaQ+4cVnEyZloE+rsDqNoIXXrTXc98zl8nDBiFdZn9M3LF7kzsOB3aFgcNX7eXTD8x531+d5pPPZgg9vauECtvWC3/4z7Zz3xPP8cqXHeFbf7tyye2mj4G8Ff7kCdGZIK7hjgGCq+TNcQtpXJwVTSwSvoukwSrlVFrB0HaTFqlbiF7ZfOxxShMWvfk1V/BtL93gymuu55d+6xh/cqKya++19NuniO9xMuC6ro3RA2N5AdLkilIchOAYFosGFsK+52gciFwL0Vt8qDpvgkWw/y9sTXCqE+pitAmVt6jXlCtEIcYmdMv2rBaJSHO2DBsb9M9/nH/1NQc4dfI4t992M584OuMXfu0obvsK3lXoV3Dr6/Tr2yhFCUMBXVCxgBsLVrFDIjeUaai0TtKYEJRq7g4s2GTJtrAJUiBXRTcvMzt2nFSNW141sRZG3nRN5I0v67n15p187JHzPHlhN+cXZ7jnsZET3VXsPfIiupVtjDrgUFwFSTPSYk4piuTKqMUO+pQNOT8u2qjVoR5qXk64FCqELsJkYs99u3xrMotyjLbuqtJB74gqaKNl4jy+FFwQ5qlS5sr66Xt493ddyY4d29i5Yy9f9667OJGuYPsV6+y46Xr78xoDQIpZcVW8FQXFQpL61igtu0LLBNEGSgvmXGquHKc2ASmtg+6cUOuMI1/8ID/yFfD408/hjnwt3/cHG2ap9IF5ylzhL/DOr3O86auv5uzzT9OtH+CLd93LrE45P72NT8wOcimsUvMKGhLTOjArYoXacIlQK1fKc+zK57nhyCov3i/ccs3V3H/vZ3jRzS/jvieP8et/eJw/fVao/XY6nVOqTRfJCb88K9Wal4LBjWjx7wRLvrNifMAH88yXlAmabCZpEP1mpY42KajNleICTiql2DTVx2DvuesaDtf0FfY5R3uHFEJrNHMa8HhqN2n01WVwXbEQqDI3PXdvWF1LT1RKNt2aGzdBE6+6cZ17nrrAXNdMC9BFtAqdZpLYmRUVarV02YoaTdJ7gzJRqCoEzdSGx18GCbmlDDrGxmnxWw2CxM74Gd434mFLhW33qQMs3cbh2nTFSaB0L8CxvDhqHpir44Gf2MekG3jm/k/j1q7g1q/71X+8APjsn/+47r/yCIvN5/ni0QU/9P7jiDPS1RJXQRt7mli7iVeKXbAVZ6E/0LyJRgcsTUUpTdAmzooAj0XKSpwANtr1NdkkQGrbebU9k1iKVnVCyCPZOfOqxq4dwHag1ZzNQrjEI7pgeyivhnZ1IMX46BFHUtvbLLMKpL2MrsU1SqP6aZs2LLt2qNASm7SNZKoYytjTLCXO7HrVWQKVxAm10LzsqY2RomUbOFOxbyUborickWbnWYqJDOCztOqZ80KqmBLYFwsGcR0OYaED33aD8o5vP8Tmsw+xsqPw0HNTfuMLPQ+MU45cfz3FdZSc6fuemgthmRsg0gwU1rEM2bLsPTay6uqM7Zee4vUHB+68qnJom3I2rPHbf3Ge/+ezF5m7Ketc4MM/ehUf/8LTuA7+t3tvJqxMTOwYbO8lamuK0HVkhVoMxOQUNDjSsLAUxaEgHvyQScEKQIoVZtE1VsF8RiqKW9vG/NhTcPYspWZu2B/49++4BTdk/uRjD/Kb51/B2voanRbzAnd2IDkJltwmVqXlsdlcvQnOQrTvd7w0sz2z94TpCkwiXbtUpV0IvmFDqWqUw6Vn1wXIbU/e9VZA+qahEWn/HjFRlbM5EoCEHsrIxsmn2bvxIP/2zS/DyTnOz3bw9nd9gbpqNtPYrRAOHsStrVoc8DBaR0FznHhn1LvmI67CFgnTssuN4+CCtFFtokhoE5rKYrHg0lPHDIxFZZ4r3/Xyjre8dpX1fpNji1388l+c4vN6gPX91zDp14i+wb5IOBdwPmxNEMti08boQ4IxU7Sgpdm+hnnzP3vqmGEypaQR518QVnmAfrLFJLFkPKWWseVVYFqINhFwCCFEnJqLpevN850ynDt3jsPlCX7hrVehJ0/xhWMr/PiH5+zcu5+9L3kxrosEWQLBDHWsfilmbQd2SRAswVSlt7Uj2bzvzalj3SZbHWRpPADxjq4LfH/3CV5xqOe5h+/j0s47+ZbfGHB5kzdeNfKT33SIGJ9mnC944uRuPvz4Ksd3H2FcO8DqWseF82fpuo4gbTUYQouotYJkGAzkRrZLSFTRJPQn/oZ//spd3HrNhKOPPMq2XevsWVvhP3zwHL/9Xy+RpzsI1c52FW8Ti1awO28ivdBCktClfdg1vRZb3ATLKjDgUvUBiRN7N8ZNJI8QLdymxmihRNqIeKrGmGgToGXRbzAyWqic2bTruDAdmHTQWXEgy7My22WJVDyeFHpcGa1zd0IRj6/m96++NYAutnwWW/F0Tqxp9MZ0EQzRa2Lp2oSDHVIHC1bLhk8PpTEoHIh6S6tsgUgClCVsSezd82EZJ6+o97C8azChrjEPnFkjfRMZtxU9ztszODre9z+tcSDdy57DL+P0cw9x65vev3Xvb4kAa63yyCd+lmGc4bodfPSuo/agiCUuL8fOTrHxixMUad51G207reTWsWnz/QN4X+wDayhbA+coqbZow1INsFGydXrLIqP5eikjREetpvNHjHClQMkFDU0F2iIdU6uCxFnIhEpBVHDBlPGuNO8ubE0CRNreHBtLV+dN0UpToIpvthtHJduYse+oaY5Tkwna2zy0U6dHQzD/Zos71jLivP0eL1YtirMoTqftUHFtlzoOragK2PNvbG2LCm5+5Frw3rUJg/Hb8T1OKlMK/+JNe/mqa05y/uh93P2c55Ss8cELt+OvXGXv5gXKfEDMrUMZ7OEMrrPuKBhUokgkhkCpRkSspTB1ldCvclZv4vdOLPjrk8/yDTc57tj+DN/zqp6XHO75zx9f5XOPbXDh8iWmfc/pRWeOiWGO6/rlM9dWAGougBDxAiUnXOjt+WidBmIpjRpMdMjStplG0lY3AmzOLMJ54zyDKLnAV94kLM4eZ1On/M6XHHtv3k2SORlH7FtMswQ0a7NeFktCozaRVrWI3FwaTS3gRVoimVLSSNbW1flmQRznZnVtkKBlFCxBkXa42UPa4EAmACGEF0JbrEAupkkZ54QQ2HXgWuaTK3jPn32Kf/WWF6PP3s/bvuVqfuW/nKTvjcOQL56nn/Z0k96ssSlRnbHLKeY/ztIuI+eNvNdUxI62Syye6uy9UWcHWp0P5GdP46oytuPjNXvP8qNvfglpfpkvPr2Df3+PUva+moOr2+gCONfhvVKKFdt1zHZeaKXksb2vYnz4aorrXHOjZnrGsARrJRO6btmx7G11PlBU7X8rEHxjjHSUXAgmSUdzNeU7kIcB78D3HcOY6X2gW+25QrbxxLHr+POPznnpdat8+Z1X8xWnjvPQqY7h3EX6XdspHWblarttqYqWwUauVQyW40E1WlcsplXCBUKp7RBfxqBXYwpY4hUBQUbPRSZM19bREEkL4RW7B/bWp3nP217ChWfu454TO/mb8hU8HnczuWkVxszEZbpSWEEp44zqrSDUNNJHT27R14FCTokYvV2G3jGJ27l44NX8/EMbrD1wmpWTl3j32+/gC5/4JD/8puv4vq85zFve+SjPuF2IG5HxItUHnOvaSsS6/yxKDH3TM7T3tuuoQzHwmUAqHTFUtCyQLpALeIEQp61YCtSwZOebzkqKxfJCh8M3l4e26bFpEUoe8S7CMiOmhSHVrFg6cCWocTuKYBq09kubDqsKUDO43t5rH0FsMoV3pj2ILYisSEsE9GadpFJH04rZysccDr5Zp2uzndNcY+YIEaRAEWvY8OCTpdACbf1sd5udSvYcaRNimuC8NDy0ORVQO8tKm4b4ruOekyvcftMtbBx/mOPPHONvpwNuVQL3f+I/6IXnv4hUR17dww/8X89w7qIjO0vMW/rcWY75aQeYE0jmPS8Cropl1HtpbGXboVOH1qmL+UjBxjm1hew0q4vyQhKd6Ajq8VLJYohLr+YkUN9ZAlP15A6kmEDEVQM3ZCm4FjQjJdseVqtVX7jm4aXZTsQKgeXH4TzVd60DEwtjcNH83qJtDGgjXNM9NIV1WEUwkZ69AGJsZ0wh6nKBrrfxYM0E5ykSqCSLEs2GhFSTmJngSGIjLVoVXTXjuqlBb0qL0CUbPTH2VE1csWPgV7/3NrbrM9z7XOV9T+7k6Us7Wd0WWOlW6RwshsvWeVYhdp6cKkqh66d00ZOyPcAh2osYamRTB7MdFbu0fIBxzAzDJgHPntWd/MjND7HOcZKO/O6nPN/+isOceP4kX/aGm/iqf/c8rK2be8IZIdF2dE1M5GMbCYIkGyeOqRDF1NM5JbMdzsc2XlOcKsUHXBcNHXviJMPsPCoRKcqB1ZP8+rvexGNHL/GePzzGc3uvYSVMDJnqHZ13rGxbYxxH8mC2Qh+ElJchGm21oGw972lzk+LAh45ODE1bOyFoRMXW/6+/igAAIABJREFUIE5Hats7hs6eJXENAuUDyxQ6J2o2tqL4SUfJSvDmdkkY5UwUOh+a88KU5YvFgs3HPsUvftf1XLXieeev38dfPR7w04ikRFjfiezYaXG0LbdDccTYU7RSvTkWBLbASLSdpG+COzft8clByJTouPTwk6Q8R0YTt37VLY53fv81uM2LvOvPCx/Va+lXV5kWCH2POKgIPgbKMNj4Pi1ofg+bzKVEqR42L5GLxbjWaoVH1YJKG6mHgO87clGLw2hMjqCCm1iegeVdtJWRmKVVc7EVYGrCwCgGvtJKN4n0/ZRptJ38WBbMF5VxXPCWfWd55ZE5xy56fuKu3WzrOlZ2rTI5chARs7/W0Ih5kgkp25rCqRHrYCsro9Y2Fm5EziLBdto0LZA08bAorpvymkf/iO+4fYNF2cafffxRvvFrr2X79u1c9gf42YcOs+nXiM6iiQtK7CakcUbXT8lpIOdG31uuzYAYAvP5jCXMvFabiKy4yFhL031YsZXHQr10hre/8jL58S9w6IqdXLljlV/4wDH+8qFVNtu/r68jOXRm5wudvbex21oP4JomppE3l1HXlq5ozqFOLUjapq9LLQ1INeaAz22VTMa7Ca4MqPeU9vk7bZkpZJYI9uqEiTpGLehklYynK4stS7jDM3YRSQW6DjcmVCz9T1StCG6rCC3gpFC8IHmB10z1K6gI0QEYnjenGT6I3TejxdmXMjQLuFKLs2JJ2joCWy8GUps+tqm6d/ZniEA3xWgwAeqc6nvT5rRQL7uqKlqjBbCpkXFt/S44Elo7VseTfOQdq5x57ixuJTK4K7jjjT/bFtPLX+Uce/ccpEbhdDrE8dOP47oOrz3OQ0oLvBdT9itYZnbGF3votXq8JkSty5aS8c6QqNV5ILZwnxa2ooUibW+utKCeRkjyrtGbQisKbKTna7Y/OxpmFqBqJmaPku2wwOJefTZVOMWq7OhsTEOuqKvWVfytSF2j7/mmyjUvc2kEK9f2frUpoAm2C3IKJbdO3Xk8I6SWkeDFEq1EcLURAIOJnFxNBFcYl4hH6Q2CobnZr6wIKeJMBKKWVLXEH9th1i7AmlAN1M6zWCj/9Lqz/Pxbr+bsheN8+N7L/PLJI2xb38vuncESCfPATCq+qkESl+EujRpXSml+2tIOBMiCqVO1tlGrCdUWc9vj+6Ysn+WRf/3p3XzdvoFvfOkm3l1Cy0XSMOPyw18Ct2dLMATmaBAftngCqubf1TZ2r6USdMRltbGwFhulSjaraLWkrppaTre378MRG2Fx5OU3XQOssHu64PR0L3FlOz54pl1HGkeqKikVNKvtWQVycSwxybXaZxKDI402JvQx2HRJlPnsPK544q4d5Kh27Nds40gPwXdbKmApCUI0986y68aB68z6WYUQmlBUzO7VhfhC/kLjMtT2XWy/6uW8+8NP8Z43Tfmh77ieL7znMc6pg+hJm5fpuh7Ztp3shDpWYlhqKTy+mIZHgxUwmi3oRzAPseZi8BlnBzWnL5LHSvATxjCjG+Fd33sr6flT/Me7hLsWB9i3Y8JcIhKr2dSyErtAXixshYIlf7oglGJrtVKbkr4ktJq7QETMlhs78xBXtXTR5rmnVkLoLEyn5aarUzuXlnoivE1fsPWk6wJaLQ454XAFgpoAbzabWaJhF3FuYPtkwqeOL3jDzY7XvuQm4ofugyuu5uLZ87hdO1lZXbXvsWAFXBWLD1fwmD1TaqEWG8GHYPkbZUy40DXmiF38LkRrVtQRSkEXiVe+5CZOPf/XnDp/gkOHj/DE8z13nXsRD4xHmOBZ08TmYqTvI14xEJYzOn0QR3WVPsZm0zMypbYKNmfjfYTJlL5bITjHfPOy8SJyRtpaxPf7+fVHdpJm+7hjfh/f97Xb+dFv2Mlbv/0GvvnnH6DvtpGLUnS5FnTN7mpTr+Dt3bH8hg6Sxd2KGEPGUlXVeBExmLMmRLLvCWmGMOLprNF0xoipYk4ur832XHKbTnlrIlOLEJfAWAwXrDkzYaCoBzdFywKo+JzI3jWibEFdJNYFmdA6ddp0u1DVLKmWSBsMsOXsvCSahiA4D3nEGCqeoq4B3xrRz1lzZ1kvBkBTLyAGRStSEU1sLf18QFPGd87Ww9Lji4H2arsTWYoHW/hYCaUBgtSyFEokKFzWXbj9t7OW7mEomwwbx7au/a0CYNg4w1ACWs/xnFuhukAJgtdE1YBb4nMbfUgxT7mmBc5HRsb28C+V6vaiCrR9ScRJtF29pi07nlcbweDUugWtaPGos8vZF5sseG8BKUUrksvWRSLeVhRoy7EmgkvW5aua6EYqtRpYSIJsdRehKin0ECaQNunERnuWX5BMmBEjSbytItoFhbYORcxx4Fv1SLXyw3Z9UyuSitVwvQ5kUapMLEehJETMFona2LLUBq0IhpI03KVBTdBquEc6yy3QRCUgfkTzJep8Bz/82g1+8Otv5u6jjl/6L8/zbLiCffuvIpQZY834forPCak0roEiYqCfvlsxaqA3wZc5Fyw4KXSF0QXIStDMuBjNx6uV1PzgNRVmZQNXCx/auJbf++PTzO4/yxtvSbzocGH7oSsZXSD6xiB3JnpcBq6MLbFOqhDG1DQmDcSEIHWkKlYwZJsAaBMAVufhuWfJi5mtlzrPWGxqcM3hXfzJBz/Nh87sZT49xA6JdJ11fL7vKPORNJ+1iFWr0vuuJ6VkU5Bq062xCt7DMCZCVNIzz7I4cQptiuKowhiF1ZVtDA52X30Dftd2O5zUUshoCWZeFXWBLI7QRXtWS8ZLMaFqE3wGzVvi0JKSpTWKUkZQlDCdsCnX8CufeYY331j5lR//Cr775/6MMjmEDpnFufMEUaKb2Gg9m4DXN6WwOlv/ZCqaMy5Vm/Y1D7hScOYOp5w4QQh2eK3ohD/5xVfx5IMf5a6NG/nI0CPrey3SlNrGkAaaKUOyMWXKlGDiO5W20xxy2837ttssaErU4BDnSc6h85kp5Ttbm+RaiZ2Q09wEudIhi002T54iF9hx6AA6ndo+ugy2CxdPriDOmoau6yiW2kOuCRVHrJYg2bdo27P9YdZX4LnHH+Llhzz3LYTJZI301LPoLTfb2ogmKhRBfEcpidJwugRnBzyeKkpczHCzgbxjp9kFKzg1kpyTYAUgpgN5+J772esH9u1dZ9UX/s9TN+L2HKSXOUpHiXbxa4NguRha+qJpeKbesi26YGRMEYd3Qt8FsnYUX5hEmyjlWumdkRRLW4fW0aA0feyY7pzySHkN//q3vsi//NrK/m0b/NrbXsqP/e5jXKwTojfffa214YObHqpd/o4GJ4st70MFzXMqAV89NXpCs/VGhFwXjaNg+ihxth4V1yHVzoXqIpIGm7YR7b2qpp5P4nDSUbtMTCNaBEKbSPhCSI7c24q5K5nqPY5CUtN4BSoUm1JpbXg7HUyHEKd2v0ljxGjB5UKQQpIAYcX0QupxeWz27NJIkCCdCSljTdZAdPGFwjtEmJcmvu2MpRAMIKc+2oTDOTIgLStFxZO10Km5UWzNXvASDIqGkqOwmQof+PADvGr9EU6enrHn4M5/WAAED5OVnqI7+L0/fJh+ZTulzpvXUa0AyBYYI2L71qL2oZdSiC5aRa665X8UCS/Y6MRGvKh1R2YpNArUVuUIVLUBjMdgPirBpgraxiPFKpzlP7QshUwIUhJjEFxylDrHl0Tw9sWWJma0tDdTPRfx+G6Fop6AXSaldUS2b6zUEohBKEMieiHTFPlUcG1PXgwMoT6gbtLQqy2dDBMxlnFOxSOdKcdrrjjJ1FHRSbSuxlUbZ5cmJCwL62KkWMxtqVRJ4CNSjPQ1VihlFz/86jN891eucf+Dx/nZj3jyvpeylxlSZ/hJwJdMzSPB23eGCjpmgg+4lRVAiVNjvKfFBrEUtKEoL1/YtEPr0pwyX0AXTeWeTbCSFwM4ZyFNCMPF86zvvIJz7mF2ru7i7HNPkeo+Qr+69dR5b9a6osJYRnwF5164/LTac7HsDNV7gjNiILTRqWvAGm3CQTPdmE/dHhFuu2aVOr2Z/+M3T9PtSnhv1tMYAzpaJGhe2MHSBlKmylYlOgOUGMM7Iamy+fgTlLKJjpWuN/5DrZXizM8929zEh57z93+JuH8nu267Hecaa71heKtrscnO2d7dqXnFAd/Z7riUQlaxHbZUs7JWS5yLzjGOmVJh0vd88twebn36Qb755ut522uv5f2fWTArI31R5OJl8jaHJLPD2bjW2/sABmkZBivAi6ns1TtCdKZ3mVTK+YvMUbwP5LLglv0z6rn7yeEgv/n4lB3b16h1pIgnBrvclr5nLSOSq8GDUgu4IhqOexwp803DzjYWhHpvtMtSkDrHYQXqQhx9P2GyucmZz9yFLIXFYiN1cxY6zp49BSGy/brrift2GUBKwPuK154QZWscXUohKHgVEPuZa+zI44JN9fzqR+/l1VcJB7Yf4nNnzuN3r+Nib2ErEsliP6crBaVlA2g19021kiYH68x1OjWI0mIGGm3a0QRvyzG9d46xFF7/xtfx6Gf/lENXH+H8ymGkXoH3SogTmxrWjG8ujuyMkpkFXAy2kU0mNEujvWclZ2IMhtDNalS/pSMrFbwTxhb45Z0QQm92O1NyE7wwu/olvPuP/itvf/UjHDmkvOHgef7oxF6kQM5i6w8KrljE+3Ky2hbwpr1yHitdI5JGW9mqFX5gxZ3UFjrkLMTMYFsOp3O0tnOQ3NbIzhJn7W+zd9gHqle8GhmQOjK4FWs0aqWGhJQJGk1Xo+KsCayVKh0+X7YJaJWtBbnKFGW0LIjQW3Bp08KBGJTML9HzAeqIekGzOUA0DUSxaHLvogkl273kJBGLomVs2gdDhhNsElDUpkfLIKBlSJyI2QqRQNJs+RAVCB21OJSF3Z9U+hC598lLfM1r17lu3zWUtPF3C4CzR//ip5/4wh+zuhLxfpWPfeko2u3DO7MaINJwqE3cVhMsgzIa3ELTwvadQFvFYPjSVt1qNQWk2g7P+M22r6/8rR2rgGpT2jtnmr+q1h1kg8ZkB0v+slexg1KV0XX0w4K3vX7C13/tlXz/zz3FU5srrDpHF4RcxOxSivEKGuCi61bIftXG82SqDkR1jUq3SSbgQm/6gbYXdlLJJZswT5qv1MYdSE4QOxutY17X4qfGCaimiq1i6NXeVXSxSXZQfG974RAZxAJCqpf2+xXUb+2UinNo9kgWvuXLRr7tVT1nzpzhf/nwbtLea9lGQuMEJFHpCBpQzaaViB6Hw/XOBDu1EPqecTY31XoIjLUSgqfrV0iXZoyzyxQt0Nv6w3jUZo2kmjDRUW3HnDLDxbPI3j38zVMjbnM36/U8Oi90u66D5fqm2jMScfY8SdvPihUWZLNpFW3Eu80Z4iPF25TF4hkK2gnJG2K1zOcmPEPQOmP/4b08+dgxQnAggYuzTULtWMnBgFIeaucgG4NbtU14MBuS85F+LXD58ac5+/xRJrHDjYp2Dh3FInjrQJJETULvOopmqofx9DlWnjvJ9PBBe/FJlhXvLJa1SLU1lxOzH/kKw0DtvMFUtDSbqh2IMVjnkZJNp0oayV3Ptj1X8LGNE9xx9Aleen1kctcGYzehZtDFnE5825eaKCsvKlIaHjoIZXP2wjsbO8KkoySsuB0GuvMbhNhR85yRgXf/iztJF87w+48lNF/GsQIqBMLWCN85oSim7m9nAbmp4cfBhFBpQR7GrV12bbhrCTam99pASzj63rPx6KOk558EF+zfjwWveFFSNriR1IhTx/jUMYo4dh86hEolD0oZFmSEED2SK06LJZDHACIGZEIIO7bRzxLf8DX/hNnjn+TUpQXTbfvQKkwO7CGoxaHXYOs5UbMBqleonQnHRBEvpknAk8IKsuKtK22WasSUVFIFEQtIiymT50c5cnAndz9wjP97dpBth7ehjCzGRIyh5ZqYTqeTsJRlGcNCbMKRSyJRCAm6PtrlW5XYedIio9FEw7Vm+umUzMKioKdTxmFZdJvATgR6KZy99uX8m4/dxfveVvmRt+zhuscP8p4/PErxu/C6iarHB29jfWVrmuq9txH6OGwxEFzoELFn2ObJ0WJ7nQmOXTWrJaGzwrd4s5K3NXJta57qPFnHVnwpkrOp4EXN/uojXVa8DFQdUTdBarbVUzTRoDZHmqpSXbQ1tLOJrPNQq8MTqa2YcVLxpSK+2hpbenxOZs9z5QUHkNpk2E+n1EX7GevStmxBULV6sqs46XEqFCdbLrSlPV4lIFXwmiEEm3xIMHG8D/gkWw0F4nFeqTW0KOMZ1Tv+5hn4uatv5uyzR7l8eeTpR37/p6+68Tt+OgCcOPXkT63v2MHRx+7hyPU3EFd3kLC/VGpFnX1plrdcG6fYHgwTaFhSYGh4yNowotJsTMZ5tq7MrCHW9VR1DV271Nov3VBGAbOZr6DOoS2hzkA3ZpkzcJ9phEdfKLlw440Lfvy/W2Vx/iSf/KXI4xt7ePU7TrMuEekCNSUrKnAWaOEdJTtct0qhEMtgDoE6tPzphGs51AJIHsyn2WrO6g1ggxqVT72tP9w4g2DM/iomCLRRZFMyiyMopGphMV0p5C4YvKhUfNe1n9UhmhDMg6zBViEuFcZYObw25Z+9+BznZxu8794d5NWrWevMm9t1lhmeUqJTIeeB6o1m5UVJJeFrIW1cIEXbNYcQzCqUKzVvcraeQxctiKg9Bz4ESk1Gx/PLbAX7lUphstIz5sq+q45wVhdsK6e46fCEW8/u5rHzlu+wpamL9jyUamPj6sQSxoppIbSAbwmFLniqd+jQtFfSVjoixL4jVcWLp6SMj4FZVR669xGmqzuoQyZIpetWiGL57ZTG5i8mQur7zjrvogTAhcBYlfmF81w6cZwgjrFkauisYJlMUBUTD7nOmOEUS1NzPdF5Lj7+OCVUplcegRCQrKiY4NK5Zhta5jUkuzhyLv8/U28ebdl5lnf+3m/Y+5xz53urSjWoJJVUlm1ZAwbbEgYE2LjBcZicBGiWO6SBQNPYEJqErKxOY4ZFkmatTkMTCAkh0ECTuMlqY7DBIzZtu21jTdYslWTVPN/5nmHvb+o/3u9eRf9Jy75V95y9v+8dnuf34KzFhERE/cfGqBUq7nMopGCrYMq6yIXZEn3peO1dt3P6yFN85VohpnG1au0fHPq55lTwAkTVpKhISds2Q09vMsU2mKKAm76b4ucWCH7EEddw8/nHWVu7lScnLcuHDqtINmdsiq9CqCo0RgE2gZC008w11KaURIza+ZWuoxhw7YBkrGodQg+NsjNkNmb3ynnk6jVsOyDHQq9RRdQPgIymuxWjqY7NsKG7dIUrJXP89CnieIJvLMWI0uG8I4VCVkEG1hgljqpykZnAlYtXOHboGM9dvMx08TCryytkZ4ipx2SrtmJUxOlsQzQaDa2NriXVxiUbUWcTPaUkaNVXrivV6gm3DX3qYbzHE59/grtPLfLmN9/BH3/oPPn2OxQNLtqZGqvPi9qF5QA+UwpgrSZ71mImocj2Pug0VHLBNjqtNVYpfxi10vYh0s36upbTnf4+YS4VYX4woLnrTfz2Bz/GP/rv3sDff+syjz6ywyfPjVQ3ZZ1e0rUpUuuhaJAZ4LzutXFCcrqGksZpBLVkxKvIU2xDkH3OjHLuNVdCrXyJynyx2uFacSSo2qH99SxovK9etEkcIqrFcd5UK6cDow4tU4RiLTkrDCunjDFKLjSmIUnBYPXOM6J3YH1WshQVQRZUQxM7qgFc2f5oL6tT71z72qzvXHV6FRHEqTAYUTFmRu8+smbDhBwPCgN1vdY7yTcqiiZB6A+ix1Xk3iJENiaJbvsi452brB2/ndnOzVcnADsbFzmyMMetd55mmoaEXpW/xbSUMoPQKWjHmDpo0a48S8TnSCwQqxgkFPDGqfUGo/YMa8hRVakKZqhJWLl/tfMvAcRXsV2mxIA1A3JNVjNF8cNqWdIY22jAOkF6xS2uDXr++qdPcOals0zaVUaTKbcd2uInvj3zR58uuFiT0EpWQWK9YIzMCAWMKXrgpqSiuBxBPNJNMWaK+jScfh5Niy2WZFRR60skhllVcKrCtvRTFcfYFokd2YKhAduQUlGRpAi9Ed2lZc0c99aSctVS6ONYWQCZFCcgLS1TxtuG//FvN7jZFb64+Voe3zrG6kpLtA7vbT0APEagRF2BSCjk0pNzwnslw5kEsTId+kmvVbRkZlH3TNmKetO7Ma3RICZvW8So/SrWaN5ArlhboWkstghPnb3Og4s9kxlcuLAOC0sHt79RogXOtOADKWec1ajf3DiSAV9ELS1GEBySCqZ1eCPQGZKJ0M0Q63GtAEKYTYlJQ2t84+jGO0ijl3uoIBmTDHbgkD7gXIMUQ4iZZjgk1s6qGMFaYXzuLNk2SCyEMKui0cjETLDSY80AiRHnDV3fY53BhI4+NrRkps++zODwCdr5gY4v8SSUSqZdgUZDe6MiQjKUrL5xhzpbjHHE+nInCtb5A3ZACgmzdJLd8RbT6csM5Dp9WcU5q04TEs5qIegHHhsTNJ7o1CFj7P4kp+ZIdBnX7AskZ3jryZOOWdfxP/23R1g6cZg/fXyP3XSKUVGtQsmJbD05ZIReffZQMckJkyJhqkVB7jsVTIVZHb2CzYY01feqZLUoFmPpLn4VWd8Gm+msw4lFWp18WR3c0GfNJzBShcUkdrd6fDvEXr7B5PgtkCAYkD5gvApP29YTgvI0rNXEzd4Y2lLwKXHH7ccZpRscPRboh2sM5uchB9xA/dnOAMZrF1qnmcnoxE5vz4LLhiTanTZuiCEQidhKzCu5BrukyCLwgL/BA284yQvPPc/yrccIK7fR5qhx4qmQc8DicNboqqZp6SbTg8s69IVRawhVtFaMfu9GIHQB4xyNc/qOaUgLZdbjGy3inNOkUo1ErxocgYEfUeKUhbVjPGe/jw998qMcHzzDO+5b5S+fn1BGA1zS7xeDxvEWbUAMiZwjyTR69mfVh5iSScaSXYtolho+B5IYMOBMU1euliIDkusgu3oJorbykijOkHF6yWYFEdkciQIeo5HARp1H1kAqDhun2Lalr0mmxBqw5B0mDrWQIKs1VTSMCxMpxoEMCFawucfaQsnKMyF3SNJVWaFQxOGLEFOgNJoLsJ92K6nDlkIvXsmzOeOKJe47wHKPEV81DSqaFimqnaoTZ3Ft9f5bJFHJi1m7I9XPU/A4l9kbjlg8dBc7W9usX3oFWZp7P6ATADfeYX3nHDnD2OyCccp/rqp7vUE0DKLUTOVMrrGh2r2LFErONKKpbWKguBE4R4odYjMlgzOWkFUEJTlXsUL12KMPj2SjvuOsqnhsQ7G2BjFU6AEGVwopFbyz5JRJ7XV2Y+Do7SeZTc6Q2+M88+QLvO2hb+UPPnVO1cyisYqmFjPFQs4Rn6e6B93nKqeIFci5pzivPl9UsCc5Aa2ObWM91Kxg+gglIM6STB3NxZmGa+RCMXP6wvURGTbkoGMsn4WSewLoaLEWDIjulzw6mi7ZIs0IEwPFzvPz7xbeee+Yj/xVx/99bcjCWgO+0ejIlCqYRm2cCb2sFXVZKFYPCe8bjVhNastKJmMGnjieqv4gRIiBmbE0wxG4hsH8HH3fY2u0KQayLQzallJ0D+pJzMYdt59a4W33LDG59hyH2zEXSiJKorGeWDLeV8dB7TpE6n4sZ/ygpUyjalCSQ1oLsylG1IaUXEFSwRlPkITQqD0yJ8ws0Zohp08t8+JLr3BoOMeNutabTjvKoKFNopnsWT+bxvmDkWVfLZy+Kdxc38bmngdfZ3nfu+7ivrvm6LYTl3d2mV9Y5v/5zA5nty1/9tdncXagF1GKOBPorBC7wM1Hv8jyPfcwWFgGC21OdCGRGk8JGhBTSjXXGjBJR9tJtPAla5ZDF/sDLLc2AZkcEsk7fu+vnuJH33mYX/jxt/POn/8Mxq5Ubn+E6QznPHGivIXUaf57aRqKV4x1mYrSJEvEJ68Y7ZCZhhnD4QJ3LBXe9ZajXDjzFR6d3YNrDLn0GpeaMyEHvPf0s6DBXCUdaDZiCNgYNCwqBkpX14gx6BnitfsuqLMn+yEy2SSvb5DreylWixmThD4nHn79HP/g249x8tAS6+ubHFpzrO8G/r8zHR/+m12ubxbmlw9BEPBqC/RNo1RH75CQGDaOvmgSpat/vgxaTLfJ5OyXyKsrXHdD2sUh2dfiwXi8Qac3XlkpApWkGNVei3rRsQYJEWsK6eCi0rVPDAlbrcZCZLK9zf1HDJdeeIxv+OY38+WzO8jhhzAi9DHgayiOFaVPYtRJY4zR+FgRxCYNi7G6is19xDXKAWiqvinGRGMsyjPxZKcXqWmEkLO67Z0lSCbuhy5ZoXFql52bK3x250Hef/8zXLiyx/u/Z4Vf+WhCMMTYUVLG+oZS3TkpJv1+Y1+t4K9e7hxw/7UxjCgu3mYoTtQ1Ygo5RgSPWCXpacKsNlel6ESAGpEtqcMUnQzoXKuC2IqyAXBq85Yu0BqIKRPR1ZNLgAQtWsxAwToVuZ5zxGIg9+oqs0PVgThNly2pVTdYrKLBwYguR3yd0ASr3zfGkqzFisGlUCfkhl5QR5gI2biqcysgbeWlWLUcVoYARnNFpPQU0URFW/VTJdfG0eoKqrWOc089wdb2Jqfvf5CXXzn76gSgyA5HT76BKJEzl3tMe50Qxwge2wwAVYY6ySpEyEl97omDwBqxDkPSy1+kKpv3cG5EGnjthglQwxmSWCgRazKJoGQkNRiQSsKaRlNICxSjYkKXAkFn5BXgExDjtZOSjks7tzCJi+y8fJbR4irjeJMHvv5OHv7p52jSiL6NuFwXDkXZhpKLjtZKwWbVCEQEbwyp1DEtBvwcpQRsDhjfaM52CXijo6CYFQySo3pXjQR9Qb2HkLF5SsgZ8UNKHOMnGlZjo5CdV/ypGyDe0vWdMvD1DnQbAAAgAElEQVSzwTaOPkvFier6JVlL5zr+7sOH2Hj+KZ5t30BnLUPJiPegf2OwFuJ/ZTnaH3OWoH73tiE5Q2MdXTfB1JyEEiLJexpj6acz1JApxC5jXCDV3WY31b1htomFwWL9HoRoMn3IxFnHJLTk9cc4e/4c33bfA/zuIxE30rGz85WjYBSMgnUH3wdWJ0hYxSkz0AvJjUaU6Yw8nSI1aEeGnthBocfYRDDV7WwMv/fhK3zL3Zm3393we4/ssLi4zFzrMG2FHZVCP51hTB131r1lOxqSQiQXx11f9wBvyo/jBf6PT2wy+vh1TtxxgutX1nnra+Z5y+kJ77nrCN9672F+9c9nrF+J1Q6bscVRfCbc2GPr84/hb13l0L336qXpLalkyFELZrE1etpiHUS0C9ORuXZL++ElRhQJbZ06Orx0TG+5i6XBiOvnnsU2iWma0pah5gGI0RWad+QErU30pShJLfTYxtcduo5nkinYkiizCU0zIIeepcOFr774ApO8xks7SwybSOgz2JbS6QXSTWd1BZjJs17zCIzR0Wkto9XCpeKtVPfGKUScH1RIi0GuXKK7ehn181jIgVSERiwnj075o5/9Js7fuMK59Y5HX9ng2cuB40ca1jfHPHTnHP/yh47zTz84Yc/OY6qqfa71GK924Nj1lJwIkmv4yn6XlQi7U77+yJjt6ZTf/sgYFr6V+XZIbBLW5Go9zZi2or+LsE9hIyT9jqzDSqZPkYGx5NKTKhcl9UFx0WZf5mSJoaOb9Dz/xPN89713srV9g4uzUzhTGR3GE2OPcy1i0XF7ndqVnKBEQtQC0hXH+eeeo9+ZMjc/z8qtxxmNGqxvsCLYrMpWZ+WAg6JdqShnI2ZmMSrB0hotT2IiE5mlQOM9Zvkw//4LI77/Ps+3nBryv39sg53osYB1DoMWlwrO8qT6HcSux7uW3I9J0tBQbcfFYioGPlXuiekDzidKyJSsKOpEg3hFD0opSA5gFOQmRYtnsCTvkRgxMdA5Q5MywVrarLCsLJbWWAIZU7HFJatOxRhTiYYBKQ5bemJISDNHjD3etzp5KIIRjykRYzRXwFGwAnEwIsWshVavAj8rVq30lXSbcj5Y42VMRVPrXSQohMwk9CzMdcdPqpQCo5H0zunqOakGgawY8ZIj2StAyIjBe8vL02VOzO2xtbvByMurBcC8s2zfuMTuZJ3PvtxQwgBbo1iLtEg2WG+I3Qy3r0gvRVWR6Og/ox2nsY4Se4x1uNiRiyEl1WdbsWTviX5UgQwZgqpl90VIKQX9s2tGtioxc62olQyH1bEwxio5riQyDaNBy93vO8d/+rkl3nGiZSMc4hd++wYXt1cYmAk2Kla0SKRKRqlVDFmKxhsn/VKCGMR4YspYlOdv3YDUqV9bTMLHvtpLNPgFYyjSq+XLeNKsxxgNQepNUvRsPyUL5BzIYYAvgS5GWmMoqSdmrfBjzNjSs2QjphkTJ4ZDq57ZZMqYQ3zX6W3CpXOsl1v5wtYhVm45RrYZ6wy5V2uTNZaYA9aqdz9bTwq6shl47XZNKiqCMoZud5tZ6LGmxXvL1vUbMJ4iNWPAZEsvhZJfJmVdC8QYcM7T1fATP2cxK4uMFpcwqfCJTz/Dj/zcrfiXLvOaxR3CxOBWjqmjwepDbYuOwtN+SqSoQ0RSorR179kFbKPxrsZ6cpuR0On0IVl8Y4jGUmKkzcJkdxfrhvzRlzb44b/3zQxfeIzu7kN8eP06aX6JpfkljNWLR7xDkuoIUkw0XnUW1jV6uTrh+b076OYPUU44rke42jfMRnfwwlehBMu7Nzf5nvtW+MDPzPPzf3yBzz2+qRbanGn9HMH0iBO665v00xmNa2vqpcG4hpwCKYpaeEQhQDlnfBVvZQMm67hynwIpJSnzX4Y4W7g2gy888iRvPL3EIK6qyIseV5HDRRScZK3oiJiso/gcKbP6Dho5OJQYDtSjnxP4Ae991zFid4m93mNX5/G9oorSPkY1paqTCcRuelBk55gONB0mJXIfiTFjvLpzjPMKdymqqp9Np4Qr57WbcjUFzQwQiXznm47w3u8+ymMvXOS3n15mi1sorcEvwgYNcd5w/twuJ8OQuLrHyOg6LISk68liSCUobVME6xplyYeOPGhJnXDLYIsf+brEk8/AzUOvwa0sgmlobSDUxFAvkIPmr+u+tyDiwTsV1tb1jBXoRfMlTP0MnHM1OXFfOZNpXYNZmuO7v+5Opuc/y3C4whe3E2ZNSfs2J5xvgFzdHJqTIUWY7Oxy7fxl+r5HQmQ4N2Lj+jUkJ9avXebGzWsMl5ZYW1mlEY+xmZ3xDifvOoW6ATJ9Xwu/FBWdHPUis95rYxCUvtmgrIo4m/LC0gOcNxfZff4MdyxuEewqx5YWOHdxnZ1px8qq4+K1MV1sibbF2wWKa+loK70OehxG57lgdBWGqwFJTlkUYozCeYpSXW0RMB4xQsoOYqpnHGortQUpAzIzihd8UeyzSYpYL9JgTKYLAedbpXbmfUZNBgbqkVXmNMUZbNBQLEogFU0iNEaLqZx7cqtdukH9/TmDQy2YpRniYoe4hmxVh2KywUmhSJ1eiOjlv5/7kqsQ2ut/s3WFAUYnpqLrQpMKRXQFXnJUfZzz2BQpuYrIc8Lnlpeu3GBpaQ8zaIjd9NUCYGNzj+G8Z27tJNPnHOJ3yaLkvBS08qKAaTw5W4WwiOZikxLZaCftjVcRjVXnQBLt6KxkSIVCVcASkW4MoQM0sSlnzX3XD73aRXJGjGBCV78YFd5J2Q/+0crBOU8uFglj5gZr/P3fbDFhTIk7WLfMsE2k5GjEE1ImW4ur4hZT0YrOCLEYjElka7F2SMwR54qKhHJPyUbpeECOCnXJZGxOVfOgu78ihhJE9Qkh1PAVmBkVdnnvydUrk9sGl6BH6HLh9Yd63nF8ne986yHC5iZ3nlwgxTkuXr7K0WOHOHt2lxPHO6wRJs0Kn7h0AjM4ijjD0DWEag8SEUIslBQIQbSaD1HHSqUo28FrrsBkZ5e9KzeIe2MkJLpei4aSItE4XGN1zOaEmBJuMISU6EpkMLcEOdL3vY6B9yLl5iYy2mZzd4c47njiTMPIwe1HV/m7Dx7jQ68k2nZfpCL4QYudX8BMd9VK2mcltokKDPEDKBOFr2RLMQE3GhE7Q9kb40QIOWEkY9qGADj10tAMFnnfv/giv/XeQ/zjNx7iK7/2Muf6Ea7rmW8GGOPwLRjaCpfLdCnjEHWaDHTtcvI1qzTS8ejZCT4bdvI6driMHQSYO8afXz/Fk3/yCD/z32zxr378a3n4H30CY0akWU8Xepwz9F1H41rStevko7dohCzKF8dXKmIV0YnzmkoWOz0MnGZBmIoW1jx0QGdxhJhJfoFDt97N6sqE47dscuayR6xyo5xxSAYaQx91X+5KzbOvsd04X4mFVSSVEqadw/Zj5o6sMdm+zoodMB2sMV86khuQUsbux4XHRJqOyV2g9EltV6JUsn3rXe5mCgkTBVA1riEWowRIqxeBM5lgW1rviblogR8L/+F/eZg7mm2efvE6v/rMEaw/znzbM6FgTN3n4+hax5V+wPw8pKjTsySGVAApOHFIq0FIs6wxtN639CFQ1tf5htvX+fgnvsoZ+0YuD9/M4iipCNVYmqzxq6FknKn48yoEztVXbp1XXoO1elCnrNaxmrxYnF4UQlXul4pav/4Ke+YrjOYXWLzlTl5+epW1DMUmTIatC+f1ktjbJVI4dOQQr7x8gS4WjG3197NOE+5GI8LOhOHyGn7gaEzD1VfOE2xDP55CKdy4cB0xkdtO3c3K0cOkXBg0DX3OWExtloQuBXxRWI21li70tE3Lkh3ysaeX+MHjwvu/5yij0YhDyytcuZJYWVtgVO3OLTOiLTzy9E2eu5R4cW/EXzzRke1QL38jiPSEOklxRZkV1vtX7eaFmh9TY4Rtc4DSxak+KNfzRAPWpuDqCiCpvTinDJKwKZJyTc7rOopRF1q2jlwcUhsmWwRjUsXNN2RxFNdoc1AyWE9xggme0oNva9InloZE9EJOgm0cYdhiY8GkmWKgrYWikDnFEpd6IWcImdQakIZg1X1nixzkoyCeHANGGhVCG6l6eUVdI0L2+6wJ1PJIoe/muO9Nb+X6+lfZGY/JOYtqAPwCOSU8keevXCSZFUx9KVXkoHvIVDKu7mhz0c5EKjjDSQ3FkOpNzJHGWh35JUH8CEXeGmK3h6Sgo5IS9IMwQi6BIg2lVIwnpU4GSiUcgYiBSqnLGZLUQIuSlQRoVHhhh8ukOKlWH03/C2XfmaD/WKMfezFabaUC2Q1qGiAYKYQMXnQ0WqRgxBKLjluKCLYZkmPQy5WslKoUMX5An8zBPt5aXz+HhmnoGDYGWzLbM8tKuMn3fv0c33WH5fYj22Bh2q9zPiTOnFHwy7MXPHdevEnILS9fn/DWtyzzyTNDPn5pwOJRvSyLNXp5GqvuC1MIYkEiqa/YUFHFdCERI0ynY/bOXSJPAsk5TE6IsdXrmrR4mSpKdhICtmmZ7o6xVkWYu/0OC9YQQmLoGhUXyYztoFGypoWnr0/4nlvX6DZ22Nvchub1AIgxtKM5ZQJIJhino0nnlIddOkU4G8F4r0JNSRRjyEYrcwYNedZB7JAiWMlkJ7RzC+xMthEzx1NXJnz2yhL39+f4ye8y/K8f3GHcWnI2BKOEMe+V6EZFBO9nAkxmHYY5dnZv8P2v2eOxv9khHLsTU1pEUXCV6T7hycW7+bfPXuHvXfkUH/qX7+ad//hjjGp87D77O5Qe2qFOi0wDYnQsSCHFTKrpjjmoUKyIUi/zvo6k8VRvLF5qR1MRusXN2Jlu40cLLAxaaAwSM02rqu/GWrp6+Zoa9VsCOG8U/mNrqot16hxA/clSYPPyBUbNISTv8odP9KQjC6R+DOj/T4oKMvvdqMAWTfTCFHMQh5xiqpAY1OIpVvf7qceNRoSoF2ha38M4q8mDpoAbcPuKcMSdx1r4wM1D5MEi0QeovvFZP0WcxRIPKHjiG2ZxwqJbwMSeTKC1DbZR6E9vCx6lWwqGEjLfdGSDh+4MfOXaPXzyS5HFe2GYDdE6FSd6tVOG0OkhYupYH6O26awOj2ydqtCLVUlLipX6KeQ+Yuy+wE4LFI/lnoUpJ04d47Of+jwnZZUuz9OIxfaRFx79EjKe0ozmmOxss3R4jas3dnDDEdPxmH62g8UQOouPgTKeqMCXRMqe6SzQLi3R7YzpZhPauXmSd0yvrPPi7nPcbgwrayvq1MogXvUCfa+hZXiFgomxtFnPZOsK4+VVdtMiV87dYOHoMtf2Ak+/Elm6nrj39JC/eeoiD5wacmoV7n3dMl97b4uxgX/ytw/xqSfH/PpHXmRcjmGCxVtPqUI4X/3w2djqGktK28OqaM6YChnSAjgZUWurVYBVrJHizihATaghURlK7JWMaJ3asnN14cSA9Q2xWLx1kDpiyjjnCaKXr3FNnZR01REnOg1orK7sRFdpsSh0y3sVR7sExlXngSj62YsjFiodUGmKqTiKUwwxzqq4U6p90OqshApWUjR8Je/GXmFCZt/7UNcNRldOAzF0baILW4SuZ35xgc1XPvR+N91+9Bee+8zvk2Z7YITNLYfTO5uMKvfJihq0UkN+iibzGcmk7Kq6P1f+eg9isRIJ6MhKfNF0JXEIU0zqddRhWoyJ5KKLBCsqICtVdGisq4dH7f2lqGXDuYoFVY48dn/XYdV7n1XRuc/Rl30SlKilkYrvxQwq6S3T24H+POte/d39EFeFTN6p5SibBur+RfGugHhwCkDaD3UpKeBqle+tENRQgKUnNENmqXDvkQ3+9Q9YFq0Q54VLV3f52JmOl8preXlrmTM7htO3nyAJTBcDny8ZE6eU4TwfeLTn2l7Pyq1DLYZipOt6BhU7WyhKAhsMKLMe54WQdGrSSEO3tcvO9U0tDEyu4qxEih1dn1md8yy2m9x1fIGRixxaSLzjwTWeffE6t524lUs3x7hyjW948CF+8d89yhOXB2zMpsybIW3r1Upo1Gv88S+v81Pf8vVcPPciP/Qdr+VT/9c2bmUN4wc6Ni6Z6WyqI1PrddedC2YwogFSKRQcXkTXG8OhuhiMo2S0U8maTZ7EYActnHS0Z2fEEGhNw8/+zhm+/b41fvp7b+GfvH2T3/jMDhN/D+MUWVld1EIzBXBQUlEFsQjJtfgy5TuOXmXvyiaXuxVuyZnWOLpuRjNocb7FmJ6VssQT68LbRzcZP/Zx1lZhuufJSS2ypST8cEC3tc1weQlsrIr+llxxolIgxYgzQt731FuvqxyB3Nddn/HQVHxyEaw1LI2O82ePXMDvXCaGFUye0swv0568g9jt0V28VLtW9P0plkYyMalbPees0a1dwNjqbTeCDAcsFkeTI5OdLeYO3Uc/U+eMQ3M8UkrkGPACXYjVU62jY1ODaHLJGPRQ2nczaNiJOVCgp0os3Le44S0S4Ce+bZ7DgyU++Ng1zu6cxrWW7AypV9Knt06V9m2DbTzjnV1iBjqYzxeYDG4Bv0BrNKK1HajtNefIeDbh1rzJT9y5zqHhFMyQP3w04U69DjdS55JEHViHULvUmFUZ7rzCa8gQjfr5G4/3ntgHvBNK1H2/WNU52ST1MooQBeNgNi38wJ07IIHb71zjQ48cwuYhly4/Bn6It/MkJ0xKQxrMs9tDPnuWeSa86w1HOLTQcHjQ8Q33rrKw2HLtYibLiPM3N7i8OeNmbPjYk1eZ9i1N67Eu6+h8cZVsDV997iVG83OcvPsUq4vzeOuqXVK7R3JG6rvhnKOLGt0+HA34wORNbG7epLGHsGJolu+n6yMfP2MYLb6Jjz55jTC9jnQ3WUtb/Mjbljg8iLzrfsv3vfUBnvyq41f/5BEev7mKa5exBbUBGquTuMZBUehasSqZzH3Qjt9Zim2VjudytZXrpFZZHYqJztYhNSo+MajZDImMU45+zHin7ivvDLlEdMvsdTJsG6U91vA77zStQydbRlHQ0uJtrNqcgfInalpgkUBKauE0uVRreKqWPsHVaQtSuTuoO0YKZFefGzHVplp1ayZAKkqsddVeawumeL3zUqRkr1O+bLlwKTJd3yBOI9I6dnYu4uJkh+WlOTa6CZs3b3B1mikWbK1ISsqaslQ6SjfTnV0ukEsN/9FKNoQOsTWikHxw4arFJ1FiwNm+CpoEX4ELkoDaiUtFQrB/5RuL5CoOKPWgqCM1V0EYzlpiRG01okAgaRS6QkoVkuEPUKwaU2lREL6of9+PKNZTiqbAiTV1J9VQ4kQtQqlocl/savcqmDpjSSnhBELSh0GyqFgyBWzJdDKgsT2YzCwbfvRhx4+9ZYMrly4yt3KCMxuWf/U7GXvPO+giZJsYznmODwPb69doBq12y81Qvfg+UUrD0bUBXewwTlQBG5OCcaSAqdV6SYSRKHClCmSmkz02rl3HFIglE8c9oesYypQ33j3i77z5FhbabdZWlliYG7KxU/jKy9coIjSjVc7dWGdp9QSxL7x08Qrf+c0LfL/0PHD6Pv7TR1/gQ4/tsmdH5AzzrWHSCx9/4jq3hEvszLZ45+k38LmNpgoSldW+H3hkLGqPrNkOxhhymGHqw2+sVSuUqNMkFrUzmXag3WxrtXssMMtBx37DBZaM5zNP94zDJX7yXUf5le8Vntq8wn9+vOPm1nGyn2d5MCQ7i/OFGBK5W+eh4y1vKq8Qd3f4tUdWWT1xgrlG9TGN1RF4SbUT9R3LCw3/8cyIX3poyj/9wTv4xT++gos9dFNo5kjGEGdTYsw4G7HW04Uebw3JqBVUSq7BOAovAqN0tJxwxun7lTpVPFuno8iSCVI4fWqe7/q2U/ze448S/ICyu0O4epGlpSVC6yl9rAhti0gmFKpNN+l/Mx5nRbUxJRGtqpGX52DSb1JKYXU25pqZU5FkilhXSDFiTCb0qgNwNaIZqUWx/haU3B/sOY31GGc1N6AyPsxwiJy4hb2vjmnEU0xhfkF4+E0n+fSXXuF3zp9kNPAQAq6ogjtVYJipAsmUEs1oSImFubLOe+96hTNb53lutsaVuMp2GIFEbDfhVF7nHUfO8y0P3clLl66y4+7lZz9whtED7+KWUUvx+0p1FWemUld+RieAJWtRo0RC1aBZgdAnXUOFpKuNyu9IKapdkIIzipRLKbHSXcF3HZthwuETx/jyk1N20hhnLP3OLilPkZ0pX3NykcF8z5vvcrz7oTtYWfZcvnaNa3sNj77S8fjlLfzuYZ5/eUY0M+5asbzu9BoLvufOlTne9ubXsrub+L2PP8MHz4BjCcTgvCPOplx++TxXnbB19Tpf/60PU+aGpKipoxqdktTaaQQKZMm0gzluO71AF7sayNThbCaGzLgb0yw4hmu349wpcnT8zqVMGEeaySv8+LckXnv8Cr/6w2s8/dUV/vWHt7mWFzDSksuMhMXKUC1utjqGRLCtFljalWkzqD5AhfdoBIQjtYItaCR77EhEpG0wGO38rU50YptftT3mSHFGbXZZUb3FGaI69is0SG8rIw3ZJajphQmDOLASiDGTiq6c9O+WMJW74bD6c2OPsT3JtEqtLLUwEIW26dWn69JSRekGIYKmUlr0zsxGmwKqOyXqtLyYgseBBB672TGbRbrOc+LoIWKK75crz/3hL1x89K/eT2M4cvutvOXnXyLYUbWPKXxCciKHCdLPXlW7VkRhMTX1ru60Sw76QhaLkzr6QsfpKhxMFembDyxYWPXDYpStXURFH/XUoOR9dHCqSk9T1wReHww0vpeh4mmlGFKY4ozFYgklq4oej5qsdTgmVNxsMwCnnb2kTqvIYpEKjJDYkaXBGEdKPQfozgKxaVCGatYvOaG78hjJJWGNst9j6zhqA3/2iw9w9ok/4/ChO/iNLwQu9YfZmD9N067Qd+AGka6P5FjXJLay6/d3ezkj1ipVyZtKlbK1aBFFvdqqHseASxpikzM2JXavbhCmE2azGd10ojG8cY//8L4HWUkXuXBjg+2p8NL0CH/5Yo8MFhiMFolmACVUa02B5Jl1e1grHB4ZfuwbR+xsXCBKwzfeZdmbwh//1XX+3zM9k9DwwNJ1fvk9x9nLLec35vlnf36dQ294M0lqwmG97MnxIChEGkeZzWp3GjkIC4qJ1KWaQ25IXU+ejGmcYxoTrm2QxtFP9th87jkktyrmNJqE59MW/+DdX8Ob7/TcsTDkk19+kcW1eZ6/OuVNdx/h439zkfd++yph6zp+kPjImUX+7edbllcXWTmxQqkAn31IinFWRW0lI3nKzo2e33rbdb74zJRff8SQck+7u0scNJiYWb7n9bihp2k84j3WNUhb9+h91FhrifpSO4P1Dqoo0DoHVpSKKaoGFzsk5kDqet53/xYnd5/lH36gsGtGuCKUXvkUWQAxCt1xXlNoXRXfiWCNdgtqFYvkoCz9FHtmfcdvfN9hjs1t8MXuNH/44jLSOGTWkSgVMNQpf3bakVJSgaWOG0ixxxl1LphSPerOYbwjsr9WBGOEbnubON7V9yzBd72x5cHlbT62eRePl8NI9vhWJz7W6s8UJ5U/4RFr8dZCr0FG288/wnvuN9x32HD06BLzvjDb3mCSp1y7sc1tp++gsyv8yP95nq2jD3BsaYm82DAvun/eF1gZJ/XSUaCONAaMI0qp52TAmOZg+uFIuqIpemlYYygYnaSKHuhOMr7z3Pvyf+ZrVy6T9jY5ev/b+YH/ojCphsxt9jo/9PBJ3npyTNv0bPUtT12b47c+fZHjR1eJfpHN1JAGa/jhHCV0jAYNcazW0VIK519+nqU45d0PznPvrZavXlpnXoZc3h7zF892XJgtsLSyzNzcHLnRKdVsd5PbT9/G4m0nMVntxNYaLezQ1ZEp+u9SA6R01QXdbEbTDskCfac6MgOkcSa7pE4AW+j2ZrzGb/Cjbz9OvvQ5pF3ll373ST5744gq3QvagEquIrhaZFmrPJdcV56laMNlqxjVtJVGqfeSJF0VZ9sijaF0M2hazGyiFkDfQpphktrSaTwRteJmlC0g+x37fkFbszGkAE1DErUgkyJWMkm82gOL4Iwq/VPJijSvE2RnFCyUizICsjiNEUcnNMbaKhh19bOtVmmzTy40OmGr61Pl3KiewBhN7ZSkToflcJMP//dTzp7f4OixI1zfKchzn/vVkq+dgdGQrb0tvvu3C/1wgE/KWD942IkQOs1iz0mpSnF6oFgUUSECRaNyqWM9pGYD5Exu5yFHbDfWn1v31vXz1N1zVf8LTl+SKr4poggV4+eQbozkjPGeaC0kFWUkMYpYBr2kjDv44BCBGA5oTKKB4Pq/TQHTzuloMsVXBUthqkCSIljn6XNRRGTSy96KYmoNGVLQosLo/rGITkFyTpAcD91t+LX3rLCxdZ4n+7v500ducNPcg11aIHVBI2ENmBSJqebdV1iP9U7xvLFgrSF1AaPLIVIxDJuWfaJSBnLWA8eIkFKk7wOEyN54B5MK4xs3me1Omc22+MP3PcCqv8GljcinX4p8+tKI6NZoR0NaEdxooAd4CnivqGKMZt5bpwlrg+EcxmZmPQyS5TXz1/im+xquXrmBb1b53NMTXDnHr3zHgEceu8j8ydfyb77iubF4L67MMJVMZm0VtziLcw19P6s44H3feyIXq1jfUAg5UGLR6ct0op1a4w52rcSEyYlue5fN588QEUI7h0lqBUrjG9xzepXTx2e8/U13cHKpYbw74YOffJo3fc0xzmzAJx7d41w8xvKReU7ecZIY+32TpT6ztRgsRYOscgpIzLxn8Nf80A9/M6f/4VMMF+YJ23vKai+RpdeeVkSTazXEwwjSOIzVsbQtGULU5D5rtJsWdC/pajcp1SPtDdaNMBT2xlu8e/AMt3KTn/l4S+sHytBIPTFGfKWSidfLf/+QYJ8cJpC7gB1ofHHuAin35JhIYr+BaHwAACAASURBVPiTn7qHmy99lg+8tMRzq99IP53qAdbrRS856cXfd6TJWEed+8ElSa2nIpr+dwAA857iNd7UDhpi1zO9uo4fWEpK9KnjD37sOONZ4n9+/nW40pH7ToWj1AvB6xoy54z1lvnRHH0MxJgoYnEGxtMAO9uMyoTJxjluPdQyt3CUM1cj/dwa0c5x5PZbkOxIYZ1k9fB2VWuk/V9dkwwaSq90TNc6kqlArZJJWLypWQPm1eeDkDBZ+Rv7Tg7IDAncvHCd33/oCn6u5fwLT/IHTyzwlzfnef0S/K21Te6/x7I3d5rf//RFwtIdbJU5hsZj3IBs1coZsxYUpVRmgESFBZVC2w7o+54+azha7hJlPOEOOcv/8I4lNq/c5MNn5/j0sz1+5TCHbjnKNAVaa5hevQH0vObBB1UDhRxMWXKlmnqrMJoUOrUt5kSpFkVjHDlVy1ldHaSUaarLTFKkGSww6xIPjS7yg197ifF65E8+t8VvfcqQrANXm8P6uVm7r5YvB/h1VT3Fg7/f/ruZnQfjFD6FruIAVceHHp8SESFScK2HLuodZxzJusqGSAfnCc3w1eJO6pJXIikKxqqLBVNDr4paHMU4TIqVAVEputZRwkztf745+O5U6KyiQ5v/q7uopo/qA6/n2z7PRlKk+AZJqfrlKoUxleo4SwxEsLObfP69me29wOVLN5hfOoJzYtjphe2NM5y6/81keYUS+gM4j+ynHuR9IZ5R1XXRqklBFLCfACEi7OdyY7QiTNap1S91iBuRW6+HXpxiUqiXtHpZ7cEOW8VeFKMPXhZktKBhCSnhUqAUq51xKZASjkKqxYjRk0cjXnNBfKsqUlFMpGKAVExhU6SETn9XaxDbUuJU7UnFYEqqUwTFZkqcVtGgICVCEYxviejfo9RpgBFHBP7Z9xzjHacvkYaFP/j4LXxhZxV79C5ygdKNa2hDUqdErJoHY3S0WiKmeLppr3vDpJVvSuq5t4Laf0Q98cWonaSPGRsjcTJlMplgu4j3wnhDL/8mbfHrP/k1uHSVf/f5MZ/bOMRo4VYGazq+LZJxVaDlva8AilyF50VV7SXgxGk4Sva0thBs5rnpCi8+NmDFH+XocuK20xPOvdTzux95msM+cmzuAu+853X8+6c2WFxZPFCJaw6CerKT0T0whQNQkDUDfaBDVJjQYEjolMznFhcgQU6KcC6lKFvcDhjMzbM6sOydfYV+c4uQG0w7h6wc48y65cXrLR99QgMyxM3AneKjF8Hbhq73nDzWsnLbIXAWV+ltfa/K4VgSg6Yll0woGW893WyXbuUkZ89cobVVtDM3pJ0f0oxGlJQZzI3IRidX1lZEbuzUG18De5wYcsxkZ2hHAw0PSirMlAimMZATYbqHaS3H+k1ef0pYmL8d+cxOHesnjHdYp1hWixCTPl+uvh/UsaYe5o7kBjTWMCuFuDuj8Q4TZzz17BnuOb7IO0a38cy5RNM0GvJjI6nvscUciGNLpYFaS70QBOeVNpfE4L3BpOr+ocE1TpX1TYspkZQ9zglzI8uRVc+1y5Em7dFni28HWC9461T9ngKmMZgIKfZMJppt4H11WGCYax0cX4NylKVT97BpLdPiGK0l3GRMTh1xZ4t2ZZWU1EtN1SNQhc0kdE8cC6ZpKQJdibRW48ZTKpTYI0k7PACGKh504vA+0xfqJEuV3bMw5C35DBfPv4yxsDdZ4drKKX7pba/liWee5NLJr+OvLhuKePLJU6SQ8bM9xiEzspWZX7viGGd17ac252nfaQETd/T96hIj32BHjs56bsQH+Lm/3OVo2uWXv3eZbz2V+ed/eoWbpWH56ArtwhxGBshsk/HuBqOFeQq+khMd1qIi5xwwYhDnCF2vnALj6PueQePAGqy3pJgYNI4QUi0+Hc4NMCQsHV/eu5UvfXDK+99meM93eAZymX/zGcO4hgiZyjNRJLw5aN5cnRwDmpZX3SyK2m0QKViv90TMUac1RVMbe8lIjLSuIc/UHSGmBgqliDhHKQasVRFf7inWa5InZd8Ip64lHLF28qVoHLGpU4okmaYCjbIYqFZUJxU2ZyzFeSgaclaynofiB5rZYWpkfdOqRZEMVqcL0rQ6gTNSJ+TVdWMNElWM2+UeKYvc2LhKSoHBsKHvIy6Xwmg0wi7eTt9NVLntGhXtRc1XVixkAvRFjoomU8+msbrXsgbj58hlhnRRd+9V3V8wFGvxOZNyT2nnwbdI77DdmJxARIE6WasO1QOIV6tT6l9VD+eERyNgTU6UHt2llUw2BrB1gpAOuNm5MpOdGN3TGQtxVhP1KhBIB1R6GVUYCxXBm41BjKo/Q9GkQvVpFkpGRza2xeZIEu3eHZngIw/fs8A777kOwxX++R/c4PHB3aweXsCnjk6EmJOG4SCUJNpRJIUrxQp/2KfTlZK0aKge4pSUklWkKCO9FHJMusuqu1djjKpYpx39+g7deIadXOY3f+otdLuv8L/9dcOlhduZX15kOBzQj7dw80MKlsYbprNOhXZFyCXqp1UgpkLjmgOhTM4F6yySCk3bYq2hK4ELE8+CHbBy1xu59uJN/taDc6xffoXXzXekm+eIy2/AFO2OZD8lqxRMUgFYEaHEfSKkOkGw4LCaiVKnAynt54o3ZAretYqfrVbW0dpRBvOLpAsX2b54gelsHeM8wXik7jFnoeDaOXLfaQ54t8Hy2gkOv+Y11QJZKMVijBwQDK3RP08seN/QTabk1kAMHD5yFCM7OGkwdWfp50FSIOaRTg4qDU1tJwrMQdQvnrOOB63T0bF3jsirax+sjg5pBYvjba+f475T8/yXv3gZKYcRqxyBmOsPc+rKcQZiieQK7cqlkGIBr0K1IyduQVJm/coVihtQSk8OkS+eKzz42iVWLryCySrijLGAsTr1S5EYOh1Vekeu763BaD55UIFW4+uEpoD1A0W/lozznm481jcxZ/39pondjTFfPjsluQGtqB3MOcEaS6HivaNOywRHKVk5EqhwLaeiK4EYScxIM83UiEZjfI2NuALZJPowUXR3jsphECjisN6RJRHzvnyoAptKDW2pPnRb9l0/NTimWPZv6JD1vXWiQVPZC/14l4eP9Fy5vEW70PLYpQFHbl/lUtfy8vAe3I5nWpSdYEVx2TkWDJE+6SrVVuBXSllvwKDR2bkkSoYu9WoblUyfenzvaf2IWQ64oef67CRfeOEyt64k3vPwKv/xs9cxNnPLoVuY2EhvIpdfucJdrzmNHSj1VEfZaqUTHDFELQq8aiD2L6EY6+okogjiUhg0jj7u8yMKXQjaMLlEPnInv/XZl/ihr+n4O+86zTOXnucjL69VSJyO8bGZrL5KDLw6kjdKc0z60WN8g5RIyvvph0YDrkshFMF6geKRqOsDE3stpAaejFUxIIpTltgfdN5gMEZZHKVOWkuu43hnyREteMQqe8YkyIYoyhbQrBmrrptcMOIodkBAOS4xKatDgiWiFmBB3QK5FDSC2lQrbbXDGzlwyJE1GIts9J2OEeMaui7TukSfhENry1y9vodLOdLPJkxlDze3BKVRNGod36vNqdS9uydLryJAo69YQS/ALA7jHCYNyW5Kir1eqoXaFUB2HidANyaHGYImYIkVrXzEUyiwX8V4vXSLUWmgc41a7HJQEpozmJgwpf6cXKBEVVAa3d0LXrOXY6/IU6P7H8lRLUZ1Z5UsFGkpMWElVFuI5gXgWshd3UepKKqIVZqeVbJYykE/l/qgTfDctTrgl9/lme5GfvOTPWeX38LhoSWlTnfG9XAUEVKO+H3Nwf/P1ZuGXXad5Zn3u4a99xm+oeYqVak025IHyZItD8E0NuZiNmNDIMQkTE1CmgBpCFwdIBBCJ31BQxMIgeBAY8KQhjRgwMbYxhMeZGPLsmTJllSqkmqe65vOOXuvqX+863xF9y/LVkk+017rHZ7nfrwjRd1f2pQRksa3WtUhCFn3cCljjCIl1epqVNBTIqkKAofFghIS3aRj68ZVpv0p/suP3MZHn3qB3/z0Kv7gccYmqaJcIqM9Kyr8FBj6oNa1flHFMYUAxDBgWqV7ucZjUiHbwjBoFgDomsU1DcZZLm/N2AgLpisv5vJwmode+iKeePY83/qKF/F/P3eOyf4j5Br3GmPFbdpa6Tctvm0xUb9ThSQ5vGRiRU5nKzS1aCqinHQJmhpZMjgrii7Olnz8FvbefpCdMxe5+vxZxiVgYsTRUcwCN9vAtVNW7r6Lbt9Ed8ySIVVaWCUX6l4eXOPqjk/UCjkaMb9eaMsWf/ruT+Oaw4grlHkEm1TT0HTkGuHJcp0gtasptbuMqfp7q8q/8YSqN1DxXyGlykrIEYPnsx96Jy/tR/zV84coDNA6Qqy46bYh5gRJca/OWI1MJmGNVc6AFNIwcPGFF5hMJqSoXUjKkWw873l2i1funfH6uzy3Xj7LGXcvvnHMw0xpfkO/u69NqQZ6VWeN5IJ0DoaoIUzOkl3RoKPavSAwXl9j88a27nm9ozQjnj+/TSsNEwd9/VyMW2YGqCVSnTl5d+xsK4LWOIuVKno0dULhIIdATupyatuW0tQJ2lL4LKodoujFkkV/Z9YKiUSDxYhhYRJRBBmK+vWtTkmHGGstG7HLyF9jlLaIQM7EGdx65hEOveIaK3e/hs+e3OL05DipPcJ7Tl3mwHgvi9BThlnVhRQWfWClG7Mz18lXDrpvFi8MubDihCwtgUReBBqBFDM49bMn1LJrrCUGzaV3jedtJ27jlQcHHlp9jpetzjmRD3Dq5AlW9+4hI6yu7OfC2bMcvP043jha6ynGEKJOPJ1odR5zxjSNUjudIxuFCYWgLqXGWYbqKjB1Jx7r7toZDVfa2H8nv/qI4V99yXl+6BvXOP4h4Zc/HpCga8iSnU4ZsCQiGF2RahDPUqemTarg8ZJJJZNj1ObN1ilTtEgR7apzJpN1kmEcriSyCBhHGXSyknOGplF4mjGUEvUZXeqyQl+DeJxevjmRjOByqqFjapcvtl76pWjUu1ULvKmx1JiKkvdAvBl4JtXrb8QhOZCzTsilaEKg2X3f1Okf+lwZdRdYMUgqILoanK57nKQB3xjm2wUzWgUu4xOVs6zjK8lBOwgxam8gqU94icnNC8URDrNqgzM6co9BG3gxSNshfkScb2rsqTGQVQRFVK9pyjVZoJ6JJei402oLQ2ozkCoFLWu62u5ehKpcVneCK1qcEAdE2B0b5ZAxRSMoTfFkEtmOIIOhV5qcbTBhUZG3gsSFjvut0WhG32rKlINcA4wkBbAKFwnW8Ko9if/0P9/N4upj/PkLR/n4dJ2p8RC0i3dOxZUl32RJ12UjYjxN54izSF8KtkRMcaoEL6pBWCZtqbrfYIqQXcVJRN3Flhj18stCJmJnC77m/hU+8PnCWz85Yf3YrZq7bT2OQkyD5jqWRA6achbraqdNYEjgPNNuoqFMrU4XiiS8qCLVGDAYNm/c4OjRo/QCk6kWFZvTA/zGUwt+LFzjqaee4i3f83U88psf5lw+QrOEaFi3O3lZrgYQqXQy3cU1rYHiVEw2VMBKLkoSXFoIjX5X5EweenLqySkjWSiuY3LnvRy+68WYfoerl6+wdttxZDQmbG3TWsOAYFEkqL4Wg7P6eqzT2FtrPda3pBCIuRBzgF5XSQ+9bD8HbtnDz39kg9J2NDbSb29qx7YyRkSLWYWtWMR6jGjUaC7gnScS8aOWptWJjLGV0mctQwUEeefUgrSY8W1f8TDjdIUnr/R4P4Ig2gRYS0nob8VZTFWz6wRCL5HiLCSDdQ2lT9yY36gPoU7FmtawOUuc3+iYSeabXr6XX/5cILjqjV8EStF/nwVKHT2m5T6WCipx6u8WdHcvIanmwDVYr5/35O7b2Hr6JEUsTWs4cHSNh1/S8gd/tYlM91NKpO+D8t6tpe28FivlpqUQIMZIZ+okpRYkpXZK1gJRalgSaiNrHQntRi3aTQ5ZOyzn9BLv+15dOTqHpMlWL/PUK0ugGAWAGbVuESvBz1YOfxpITYNbbDN7+lm++8E5e/ffxfOff5T3bLyKjUN3cu3iJVb27MVZsOJwXiFHw9Az6jrd8TtYxEjj9Nykz7vwpuRqwbeYs9PP9KzLBVs7V4D5Qi81go65m1HHE1srjEaJX/rhhn/wU5+l2fewOppyxo5bWreX7e0Z6+vrgNVoYtBpRs4Yb+vkQxuI5ecWQ1DdQ8rEIWpXa/T6LsbijDqyUirYnIgCw9G7+Mk/3eYnv3bK17/mGkfuvJWf+N1TSLaIRGIpFN9hTKPpgqVgnGClgUINECtQQ4GW0xrSoO4xSSSiOsKA4BzWTohVnCm1sSoxUIwmD4oYQgZHJMVcNUua6mhjQPpexeiN3jfi2jptHkhLR1NlBQDYHMFaCo0WtSSUmaex8brGbFQYX0TX1ilXp6DoRMSqe26pNVmGN5Wcd4usIoachGgWrO9b5ZFPPMnRw3tYBIPr+8B0MsH3M7Yun8Iax9BYPFZz360iYGOpivn6AyqimeIYQXKHsZ4UFyoQLEJuGlxOMPSYdkw0mpjkJ+s6bgQkzpAwp9iGLC2YhKS+3mJgG1eznZNe0POtuutQL7OkWMeghVR0J27UL4EGdMSqLaj2oMX2rvCQXHSa0YxIxejlZpWrTI46llxaS7Ls/lBStTiWnBQYlIvu3sRCVjSuNMIv/pMXMUmn+E+P7eeDOxNWRh2l6Bhbd58q1nO2eqB9o6Mb47WyyxGkofWJHAdEDHEedA9VMiI1DY6ikcJDwOSa8V2pSSVkQtIK/PqFS3zx3TdI++/nNz52g/3Hj2K7ETlrZkHfD7TGMSx6rZyTjtbazhOicgWwhTQE+lIIIeBC5OTJ5/GNMN5/gOvnzrPv0GHikJhfvcLZz3+etWO3cHjfAcTCzvY28xuJPxut8Zav+hJOffi/8b9+zRfwT//0BvnAAQRl82cRRXQmrWoB0rA8RPRhWHbM2TqcBIUEWYdDATdiDA7HMOiDZAska3aV7+TMTom4boXJ8XWiCM0iIK6lX65eyCpO804LUwwiTbUgZhXkAabzhAidtWymnmbrBYZzp/mvf3MVNznGEBNRNIbVWksoQuO0+xCrnuVsNLAJ4zQaedzg3ZhindoDa1GQsz78vlUdQKZgrOeLDlzm+PoOf/zuC2RzOyXNdQSatTN0VPGfmF0hp7YKhaEMNLRI0xDnW+qisJawmCHGY71lMd9h2qzy9hOeb/1yy63XL7OYW8x0FecMqR1pwmcY6IcFLtUQp6qSNgXUrWRxIw088W3LkCKubXV/btDVjSRGTasXs/P8lz94mu/72mP0s1WalawreSPVGgpDVHKj99V/H+MuHCzGakk2Rm1R2artUQp2rJwRKaIfRw4426gLWdQp1NScghITkWVqYMG6m02FmIYhZbxoloCXjuSghAXJNpV1nzEx04hOo65uLHjL/qdZn3RcOvFxLlw/zl8/E9m/9hzWWra255g965z4208A0EynbF+4hHEG047od2ZMD+wl9ANN0zDdt4/NS1dYvfNOFmTmlzYrbEnPKahWW/3p07at6hsqfjaEnkFmvPO5wsMrT/L9X7nOL3xijt8n2K5TFkcqSIz0szllPCKWWIXGCdd4YlZhYCqFxlhiSlibaLqOUgqhFExWpwc5KTcGwbU3izYyuqcPA3LHy/mNt/8t3/BQ4X7/FLfvSbwwW9MJY6lTBPN3wt1SVCCQWGwOWuyLwYj+ZhS6pBknGi7UsGT4S0HXRqIXvQiayFoR8bGoPdmQda1VUPhYFRUWsZSmIVVnWfEaw5tjwRTBxaiQMT1I0BFG1MYRwNQgNdGVwnL6brCqQTOGXAm7pt531FTdTFRUcK7xw0VwZrmiF9WsGGFMx4lTT3L//S/j4vnnWFk5iMuzHW70FwjZ4PYdJZWL2KJqwmWqFcYjcdBxjhhImhJojEamitXLT/wYYq/KyBp7mL1+UbYkrHPEZDEuQx/AjzRbPfRY6t4PfWPEAmmhogz0MDYlk2xWJ5+xilGs61NX7Q/J1GFAjlqsiCBZMEYV+SJGL3yLBqGUQXsWqwWPI5FqxoEOFTLRCNY0kHX9YcSRTSBnjdIVZwgpKj3Rj/mxN+1DbjzL255b44Pba+RmhbxQxnZJ6v8tOeqDUKzSusKAaSdENJa1JAVtZLFIO6kdp/qtnTXEoVcPshF8aUgSCdlgUC9qSZGSAtY6JEQmm1d5/Ze9mp95xzmmRw/BpCMlXRUYIxhrWcSg5ETAWQdWuygRYdEHxML8xg2GGxsMG1skFvrMbgtbG1fpcGyefb7614XWNsxOn+b5s2cxoxE5Z7qu46+fK7xifc7s6sDOqT/nLS95I//91Hni+jFGVvkOKej7xwret3WEWjBNo1OTYnQ/7i399S0V+QwRkUi2WohZ3zKajElGSE2Hxh1v0Y1Gav2J1U5D1veLFns1IwjJTf3rpCr6yQSX1dZFVo1ISoGSrQKkUmbSrHB8dJ77XvkqfvhDzxME2tGIuKWWSzMd0YwmGDLFeUQSpVgab8lFQ2Q6UdKhM74GgGg3k6pPOecIXrUIgmePNdzrT/DhT3veeekofedoQwskGAKhmWJLZt73dNM17CxydL9lT5doTOYrH76Ht/7Z4xy95RhPPh/ZCBZbKgEuBg3n6hpimHFx4fjD9845Ol5wz6HbeGHu8dawU+bY6UQjmkm6FhJwWfMKxJhqo7KEnNVVEzNN21CKMPKq6Sgp0xhhp/PqoIlw38sPs3c18M8fWPC7Z26wE9exjYqyDCoazaJ7/lTZHzElfKNBOoqHjRjntVtMUUe6xihxTsCK+tbFxHp+1c+dRMyJBkGswzaWHOr0JGWG3IMkRpW2mIs6EqyziB0zSNGiMwtihAWR2dU5Xzs8zYNH19m4dIJ+ejf/+aMNo1K4+vnPQdJV01lUzZ1FiLM5kjWUrZ9rnPLWqR2SwCIVrj//Ah544tIlXvamL+TKhZlOBCzkWWQ0GhGN4tpr2aipl/W9UKAVRzNe4xcfPcbXHn+WvXkNsWs6mau4ZzFG80JSA8lgrAr6ch9IZKyoqiqI/lkNSku6s/Zeg42oKZFGSXn9Yrip5ajTTVOTGU/e+gp+/ZGP8dPfdC8/+VXn+YE/vsrWsEcvuCo4L7aQsdiqlM8ApiGVQQOtsLsFYS5KR1w6wbKMkBLwOaj923q1qC4thyVTosF51YZZEZ2KU0mkRVNrIVOsqzVMXX3HRLJVkW/UdUB1MFgvNfa4VLdMrHoKUb2TEb3bTHVbOI+I07TOpFZpoYY45XzTiZd0IqEvnl09WbGOQGD/3nWe/fyzHD68yub2JvKpt/+T0gAijmt94ut+zREnAa+fIqVUjG0JEIqO2fX637VhZMBJo8VACTpyde2uaEKk1JQsVbvn2hVYyTo2FEEqBtQMPZIGPeDrOKbYRj888m6KFinrGL7uQBXdmlVsUHeOaqEoNwMWqmjPVp95MaLIXGspplHngLdUQjKSdJpBO9I40soAUEGgVh5SgUiIdqb3Hmx563d0/N7Hb/DuK3fA+j5SVrVqzpnGul3ftDgDqeCNvsZYHK5tdv+8o9IP63tyAiEOWFE8ZrFq4bJ4FciBjsKL0O9sQ440TcPizFm+/VWOt356zvjgnXRNzRK3mvYXhwHvnHb1wm7XXcKAr2mQ50++gMwXDGGuP/Q+YLwh9gNYtQINCC0KvCgYpHEVvGTwozHZWdquozDmNXdN+f6/t00nyjB6bFjl372/4NZuwY5avejigPdWO/6sugKLCouccxjTqH6jXxAzSEmEPuIaj5Ss3bIFsTpy00NbraCt7ygl6bjNWTzLbAij/PFU8NVHHIaq9UAV5bbxu78pJfFp8ZmLZef8eX73K8/y8b95lv/9mbsw01UWg4J7xr5lfOgQubEQc6WHFVrrNMvCJGLONE1DO2oqKa/gfate60I9tLT4tnFgaD13X/wEP/FVjl/74H5+86PXMQwUSSyS0MVrfNv9t3Nw71W+51tezbve+VH+3ssPM5td48SzM+Ykxiw4cGgveV44P99mNN7DlW3YvLzFgTtv52fe9iQvzAy2G+GssL9c4Re/Qvjs5j380qVDHDywXlXvWYW5KRNmO8hCuf/F6CVtiq51rBVyM9LVFRnbNtph1RWLE8NsZ4etk+fwozEv3rvDz3xZYn19nX/8B9e4Mnkpo70ruMbXdLV80wZYeSMGqedHJucCQ6BIpp1M1dXijLowKtUx6WiIVv04+oyi/zxGyIi6MsRgjSeXQTPZgUXqaZ3H2UaFxUVjg8dtRx8T8zCoAJpMDsKDmx/le1++g81jrlw7zfe//xaubjbMrl/CW1G0+NLFsBiwbaPAJeuUgYGGOg3bM7000bMtRnVkLVPqZDxi9ZbDGK9wsmZ1uhv0FOt5nPNNUXEuhc4aZjnzs1+ceOxU4Q9Perxv6aYTcHpBe+toRx2+VT1SrLjgpbXUN46M0HqlCaYcMFbT8IYhahBQX9ks3pKD7sHFOgoRkr6+pmlIMeDnwluOfIgj+1e4YNb4ll84p2FaJSBW1w5FdB+uITl6P+3GaVd3SigK8lmuFnWkvgRj1cs7RlwuOu0punqOUml+FRYnvqtWQVNBRQZL1CwRp9oEqjNA022zus2Kal18P6eYUmObW0oeqtXPUxDN3olDDS4CjNMAPiM6lM4JI55oIvhWo7dFatMqNQZeYBnOlzXhttkJfPC7TnDtGmASiyHjjFlKJjPu4BGCu8IIjcJVAYxyiFXyp5eOZL3IC+rdd8WQbamfewedrQlZOqotMajKPxdM6nUt0LT1dJbdw1lKVr9j1h/1TbiQQoOSEVxR65AYqyIMrCp/0Up0qWqmSF0BaJGg1j+qXz5XfLB+OaolVgH6YJr6gCsKUlOVivKZbe2sc6y89KRwolTAqQXuX/6P9zEaP88jO8eIoxV81mQ7ta2UXXCFoNI4hQAAIABJREFUsaUKIA0xaYXniqUMsdIOo96MRStIoVSspNl9nzqmNqqgrTa0HEulyen3k4ow37zCI6f3kfw6DYamadQTnBJN4ykxQso0YkmuUPpIIkGIxGGLrWs36h49YCsLm65Tj3WnVb1NhunEU2IBiQyR3ShT0wp9P8ckT58Srsn87bOGX7M9P/B6wzDb5ODVMzzc7OPTiwPYlU51Xd7pZ5ELeI/re+LQq84gGnKrV7JrvCZ+ZUOzLO5Sxjh9aOyu6RykHSFFk86KazBVV2DQy14hR/randOAF9PqLtYko1nyovhQFW8minU449m8uM3heB4n23xq6xiMpwyLHtO2qgg+uJ++bRmrWQWpEymK7j1d2+JFD05cxkaLcdRC1pKL5gMYKsAHgx/gzfcUTl7x/PZHzrIVM6vNKqujnu99aC9HzBXe8AUtH33fOZ791Ic5sneNZ589h4xWeezKFuOVVcbtlJNnPLNhg7sPr3HHYYe/eJFb/JypOcXPftMhnttq+NX3X+PC1W1m3SGOvthz73Qv/+d/OEnMx7ArU9VZeAvR4Lx2mmZe3SOSMaKaIam59MZ5qM+ocegOOWoxNVpZZT7dxuSBT5yzvPOTc770gQt8+wMr/NxnrzGwqjC6IeFa7UI6r0VTCUOdmKG6D73yyAmIgVjXL42pFuOloNnoimK5Py2FCoJRkWSJma61Klilpc+az7DuWg0As1Jja33t3PVi7ZxlmBe2xHFg83n2n32cctt+7Jrwl5sP8czV06z3M8ZdowRB1yDeKfbZNcQh4VuvaxIxKq5LAZmMCGHADFq4JpPJy+fOJOzQs3XlAiuHDjPMF5SSmKxO6BMaf26XYTlFBdxFe+MRhR/9ry/ww1+3Qv50wRy6s2LaUbBQ0BWgLRnTml1LXowR3zUkLJ1TYmdrLfNssVUf4pzaUBNCY1W4LA16NwiAOrcwhj4MSEnYace7L4349gOeW4YNRtNC7vU7E2sAV9dBRaFixlQQmq6CTU6IdRWvrZOYZaGmMLoq7kUj7Ys1IPoZUfUTJhdiVpGfsjoSAVO1XANRZfrYHKBYPR8KlNKomqhkUhZMRomGUhTykzRjgSrYsxhiChRnMRh8igQErF7wpQDikJIxttG7SZa3ghauy2ZXwXVKpzWlMM/CaG0fFx9/jMOHDyC5xwmexCbWjJhate8FqTGeLmMzlQmQya7uQk3G4JXOJjq688XUD1xHlakGgAiZGGMlaTloppjRlJAypn64JFXdSxFSCbpfNa1ebmEBtoFSsEnV+5qBrX55kVxtiUsCkqIfk0RVVdZLX/9aD/qimSRkQacL1iM0qvbOhVyCXgp+wmD7unuu/7RxFPTyTVYZ9TAQY+LogTmvPX6RP/qbC5yV1zL1llAtG3lp3Up1lREHVZInXTkmKlrSiHaEFnVWGI0OFRGNzM1JX4PoBENSppRAskaTjS2Vj9CCwHD1GnbnCh/7bGTl9lWStcwWsdoqi2aDW6vq3VJIIVNSIgwLvXgBaRqcbei3bhCygp6kGNzKmCINbrFF8p5GhDRWhe44Sd3J6UM9GbWKfAW68QTbWv7m/EH2fOQaL13b5pBr+L5Xj/jFT7zAJ2/cxshbZNziMbvErWSyXprGklsdtZqshVTOmabpGPo53jaUpNkH1VeC9x4wpOrzNV53+rno9CKWTOc8MZVdDkUq0I5H+CGQssZOe9+Qo3YYUGiajkUMbF3fIV58lH/xxsALlw2PbO6l5IAdtZQEe2+9g+JVsW6tq1oW7ZTI0HoDTt0ExekqwreW5fVlbT0ojEYGxxzI3Yi7zz3C3Q94fvx3L7FHDK+/u/CmV8Ab7uv4209+hsVsThhmhH2v4Rv+46c4cHiFYXobi9wwxH2MmjFGIqb15JBZv7yH8KmTpNmUu9Y2ec3Ba1w69xx37lvnl79pL5PJKu9+zwv83ju2+IdfPeUnXr/KL56I2Hl9bhFcY/F+Qs4jaHtsFXXKbFDVNCrYEm8QO0ZCUEpe0rWTryu1lcN72Tx7nrXVMe8643n4ngu86q6Wb7ox44+2I61vsG09ZZyieItkCp4UZ0i1OaaScdZjdmOAoelaClCGsjumldrxW2sqRrzyDCg6xWqsio/jQPGWEpS0F3Nm5DxGYCEZEaerMzSlr/SbzBL4557kp1/+FP7YMTYunecvTt/H7382snfcEoe+rkoKxXkdZ7eWfjZH0kCMVP967bLHa5QQcD6QZa7df7Hga/MEhByQ3rGzucV4dY0YBmY7A6ZRoZzUEbGxyjYoLmnnmjLdnpYH79jHgdXCLAZiNuRBm5IhRkY40qhhmBu68Yj59hZ2SMx2thmtrVKkVVV863G+xtY6S5+KhkLlgTAI4gq+9XVaUwgh4b1ayzGCsx2EzIV4N5/8xDtYXfO8Yn0/nzw/qYmuejnenPLa5Q4YrFf6nxNtCLKuh0quU2k8kLT5xeqeHRVk21xXCYhOkYwmVZZcmz0U2GPSgmw8NpeqVStgYm06nNJgrUZyGu/raloniDYp3RZbSbZYdeVYS6zNabaK/pUUKdaprT5Hsuj/nkVFgEvwnrW2TgBM/UxUtybGYlu4cu4F7nzxnQiGnUvXcCFFWjpaO2YrJjIFWzwiEV/U57h0JyxDnE3NSVa7Q9j1zBeju3eMBvOQIsy0ineuIzpPlspRB3JOWlkagb4nG483LaF4cJ2q5E2v6WLWAR2aP95r7n0VqtlSFBokut0qOWOkvj50nC6mrgCK6gFKWqiKOxeScZjOk/oFzlSGv3fkYV4Pg4wT7fRKdirQiz2mdmZJCqHAr3736xiaLd554x5GVmlziCKD1aJXiGhnYZxGEzdVqFFC0J2k8/pexSjbP2es1wMlVz1DIZBEuQE26CjZooVGzJmCxUtiZ9hh9syTjBKsTB3DlavYtT36HkPCVmCIlYxrxsRrV9nY2MQ0gnUtDD2pX5CM+v79yhphyLhhILWWUjyRzGi8qibnxtFORzjbaJLifIc+RzrRbs+NVzCjlpXRiFQKdmebP35+lXT7S3nDocdJ8/N83wMr/PfPDfz5xjpjdwu5CMkEfEmaG1CV1fQLpGoqTHVROJYrqYRtPGkYKDjtxozQLJGhMVEGnTZZKZANjZVqC0s4a3dzCjTlsWDFg0tagDYjFVyWBbE4rl3ZZOfkk/z2t4640+3w44+M2TATmrYwS4U9t6xjPRTraWyir4ps3xhKHxiM0ImQF0H33uOIp1F1d9PUEK6oKGh93PHWEa9e4Lu/MLN5fYMvf9Dwoy+ecGzPnCcffYYPfNTy3nO38RdPBEZPjDl6YMqx174JmxJjHRRqop0IxTT6DLs541GkTI6x0844LYd5+lxmWGxw4Llz/OtX38L2VuDL3zjj/Nkj/Lc/+SBvfv0reekzl3hajuCyw8aW3FXkr3cY48lF8CGR26BOg9ZD41RFjcFaR8o9TsU86r+3jnbfGiHCsLXFxSycC3fxomaDr7hrziPvfZST7cPsLR2+U7a+kZoEl2q8awWSmTzguzGRjO/WcB5a54mlYJrKEhBF2lqr7pyYs1oVi64ISikaoOQEbwUnllKhVZ3zyo0wDufaas0D7w05FDYWiT1nPsK/un+BbJzFHjjIu7if339+nZXpAnfgNvqVG6R+0E7cWGbbW/SbO0p6NCMVthb1tpdSKH1fd9WF7DQPwialKqYhkY3B0uNsR+NXGHYWuFFDyAs8CUtLyhErgsgyQtywKAOtRLbCiH6Aq2HAtiu4vsc1Df18UYueQtmaI6OGfitSkp6BKQvbl6/RjjucbWnHa5ADkUIeUg1gyuCMZm8NlYLqdDLZSAsGfIJQTJ0EGvrRGtfsMV7z4BF++OV7+eaffxYjOmlOqdfnWMlfyi2Rm2P+jK71MlpEGaPhdjmDyZki6howus2jSEM2Sik0CMUkUtGxey7K7bBEsvPaUMQeccpCKcZWkJU2jKqJqPoAcVgz6FTKaHKh8v4rwKdOyVLRBtzZhlwKPg1EbzGVXJukIZek0xGs6tqS1NRJzUoQuAkOc0IO0BehHa0wbAeGsiCSkEfe/s+L27nB5myHvbfdyxf93BZmpA/qrt2gQm+yURX2cmSaxeiYI+uID6PJYDq215hLLbnU55lC1D1PyljR9LDiW40TTnPMMCcjRCziGrAt0m8gsSYjVZ//UsWs6l5LSYNS4nJEzHJkKpovQN7VBixHI7lqB1wdpZcaMVmsHvpWFLyiRU/FSTqvBVBY6KpCTT/6nzmx6gz/4ot2uOX24/zbp47rWkH0EHKiX0SSgqtLi7z7o5NaRAz6AxGn7oKkClIr9QHPmoNtqzArzIPqApwhoFY+Eb0Is4Gys83WE4+RNy6rtWwo+Jc9TNl/FE/Uoq5AMB63dR27eYXbD4955e1rXD73NG987X2c+Nyz7Dt2N3/4108y2/FcKpnNxRhrA0UcrXNqxykFN2rp2jFrq6vEVBjSgKRASbq7bn2HnYz0Rx8CyRRshlAKi8XAAW/45nsv8BI5wf0Pv5yPPLfCv3xfYHzbYVo7BV8IwwK/nPQkEDLeWtUWON3rShWFDX1fcyecri2qNXAp/jT1tx1LriAm/a6yrbvenJXuNeghMJBpxGNJLOouOG1tcPrCNdb7TX78dZu8cs9Vfvupe3jbcxaXI8Y3TA4cxI187RbVCRNSxFv93pz3xKJdlzP6+8oZmukY03gNJCnczLwIA7gMw4TvWf8496ye4uOPbfHiF6+Q9t3Du973Wf7i1JQb+TbGh/ayMlahlTe2MhFU0ChV4JuCaiJUE1OYTFfp+1ChU4KIozCQh0a95zsb/KM3HONLV07xqece4wvvvY0nnrnKL53cz/W0F9uOcStjTKmRH8Iusrf0oXrGHXkywlV7lmprVByVRZ8XZ/VQHGZzzp++zMgKbmXKK/Jlfu3HVnjqYxf4mQ9M+ExzC346ZurUXZCGgA8LrDFIqx2g2qIi3gimbXHdCLzHK3WJMMx1HIhaE0H/a0oaS0ulOYbQ0zmvBEJn1UIY1GMuVsPAcoGRNPQsiAj9InPXmXfxQ/dv4X1gdjHwb564l0fNHvabhlGnhYQYg8sq8Oz7HmuEPBu4fuE8O5tbVT9RMI0jxaKZHBU/XsqCxZBVlJ0HrIFDvufr33iEC6dP8MDde7jzriM8fSry0Uc/x4tefh+nro/52EWjBSZKP11aycKskkWvPseGrLN+/DaaVgjzgcZqwEwpwmjUYpwnxkG71MYxzBc0NVgqFfB7Vpjs3UvuE5IGctSzOTIARieJtbjx05ZSJ8HkQkiRHBONs4SUaLdO84MvOcP82gZ//886yFNcRtfJWS3jpZL0ljokUtxF7eaY/j82dhHV9RSrQWqmCp5TnbgSdRJcRD39JQR17WTAGUJRoW4uAWyjzgSjCHtbMhgHeQDfLefzdUJbMGlOqfkzxbdQlHuyXLNrUZBvWge9Fjs14LlO14GiOgDlpNVVYZ2SLzVNy/VGmEUe+c7HOXNqg9F0Dd92yMf//MeKm28w2T9lc3vBG38lMm5MBQosVccKIwDdNZel199UfvFSFFh3qIJXwYNkZSQ32kWXOqFRa5+/KRajBirEuXob51t6kYsj2oYSYxVnNfph72zo7qiuJlSyvey49Qe0/CGVUupfZ4ptMXXMtlTgF3QEVpwjS4M3iSEXbDPR0SG6osC0RKvxprqvsbsuAiMd/+bvH+Do6Bx/cu4OPrOzhl1OSlImRGWf+1FHCHn38ikl43IiiyNojhSlmEr5U8691KmFs8qDLkMkkKFfMG47Ns+eZXL8VvobN4ibGww7O+As5foNZLHFMAxM2oZgPPahN+E7i0FTyULY5OG256tfNfCFt+1gZZ1LF8+Spwe5ev0MRw8cZfvieaKN3L5vlTObhU1zK//hT67x2KzFMWJue1ZzwTcdZX1Fkc1WOQwWtWaFminfNUppazAsJJNyoYuF7DzXtrahNbzl0AZ+8TTf/MY7CGaNH337Bk/nI+y/5RYGm8lxoUob0d+EreKNxjZaJHqn+8aiXAAxTi+ZaEjoAxxCojGCbdT5UZKmCxrndWyaBe9USZ5zZtS0DDGQjTCWzDx55oNw5cx5RpdP8G//oeVFcoOffuZBHn1yRohz3HiKTDr2Tqe6Gy4BgyUbRafmIkoPBR17VrulFE3PNE4obUvTjbDG60qiYnRdhluvfpSf+qKWdz96CTtZ5WOXVvjLz/UwXWVaPH7sEd/StKIC3uLq9E53okl0Z+sqIc6YamUSkAipMsszesghdvcwWSwW9FHYf/nT/LPXNRwdD3zkqTlvvXKE6bG7aLKQjWYmeD+CGKCt6vlFQLqbjiElHELB6ZpmUFZBTgFiJBuh35qx8fxF7N49mG6dl/kL/G+vP8250zP+6MYd/Om5Ncy0YWwmSH+dZqXFtCs0bYv3I6xLlLpyk1jAG4xYmtaTwnIdVkfIOWnqpHfkELWQFUvbeopkrG0ZuSrQFEOnXDCGlHFloPcjhsWcmAty/SrfPH2MV4+fwuQR7z9/mLdduYvN+QortseMRlgb9fc1DAr0SglJiWEIxKwW6KEXrjz9OaxA6y1RHNsl0OWEZ0ywha2NHf6Xrz/Kg7df5SUHE1cWhjMXC5dnPa9+8G4+8MnrHNqzjyPrV1hbXWUv27zrM4EnL+znHU/uUNb3MOo6zfwQGGY7hPkckwVfAnkyQqI+z2bPVF0eix6/MsH6dhfLbZwQZ4Oq7a2K6sRajF9hZf+E0Ed86ypltp51NQfFOwdRw+B815KjjtVzrsmJ88AXbP85zM7xa589xvXhMMWozdwas3vpgWp2iqmEP6PTVCU2LrHzOi0yWAYnyDBgYq7sgJtFgZXMYBR2VrKSAqXoxZvFgPEgQUOG8Li0IDeNrhyKOi2SGJwksngSC/1zeUG2nlIsy6AuYx0pznVi6VrI5e9kF0DBVihVrutAh5RQhbVLB4zex8sJyLLJkSykvvCx73mBMOu4fvUkO4Mgn3j3TxU/u8bQX2dt/Riv+rkNXB1BsiT+/R2hXsmxehGhqjZ2uydFBkfENPpB6t/RDiYXYomI6UAyUmrlXMCL0YMdbu6dKRq84jodCSYdgUoKSFB+/u5rsnoZi7r0KabF+5a02NSHO2k7ItUqsVQiJ3E3X6dpkIqqpBTwyvqWFKhbS8U/GquFBzpGipKQwfJdD13jja87wC888xK2oxY3UmNWAUqqHSCGFHv1YReLWtJL9QprkqHUiGGq593kRJ8i1hjCziY+FbZPnSD1C8ZNy1wFqTTOMSwCbjSmDDv085n6fZ1n9KKHYTxmCAvIwpfdtcF3PZTYWgTOXnY8dtXx2A3Lpj/EdO0gfcqYPiJlxt42Ei98hm95/RH2L06ytWM4dusB/t17A588NWK80tF1nYpYSq6+40znVOW+tIG1ohnvjREiiSFHXDJkp/YqWQQ2Bo/MbvDPXnOJB5oL3H58Hx8+t4cfecc19t/7ALGA9y3GZEIujEetBrNYQ+cbvG81ardtmM93WIbmSAUvxf+fNsVITSlLAd/piE2qZVcJvQorsdaqBScazjzxWULKvGLPJj/2hpZh5xK/9ZnbeNdlz6gxrEzXkM7imgYvysIX66t/vyEMC4XvGKH01QfctoRcaJ0npUAz6jC+wblGp0HGIkZ57usbj/PvX7fNp5+4wkeu7OEvH13g7ngxawdXMcWwPZ9T+gWjcYttu93R+LCY15HvTUBPSQnrPV3X4bxha3uGzYZAJPTKKO/alhB6rKshQSlRmlViv8mxC5/i37/lHlw6z/nNvfzgB2aY1eP655x2eNZkpB6uBTC+o+m8qqZLIcZM44U0KJVR3buiRboRbCrMtxNXr93Al0Q7HTMdFnzna6/xCn+Dp66t8zufMnx+cgsTL/imgPN0q+uapFk84qpiPAlIwDaqrHdGu0DxDXHR45uGlEOlDFoShdgPjEYjpm3DPAwEEX2uTXVwACPfEOKcmYyJ1ze48/oH+Y57odt4gu19L+ZX3rvFk5M3U8IVOq/TF4vFN6r7MFSh8yJqsyKa8VFS1TVcuc6Vyxcp2VGc4NyYkrbYDPDV9/X84NccYbh2kov+dj7wzCpP54NsyzqlsaR+TtMYwqBJkLlEbFzgd+Z896sH7j1wlT/8RMfbP9PTTleIiwHrR6SdLWbb21jvGBYDXoRcGxS7pNeJw3UO6TpGKyvYrlHrWdZzKxuLK5bcz+g7z2S6CmTaqU6JXNfq7ykGXb31KswrjVcXQCqaNDio7uzB4eN86csS7/jAZX75kT00XT2/neJ+NZvG1BwbS0lx1xmiiZPVRVYdboWb7gX1lWmxLaFHSiE6h0l6XgTlvmOTCsmXgvhsVewuSw9/LvhSWTI5UXxbG+IGpCeaBp8yUhK5ovKNFJL1FNfglzwFp2m2RdIun0ATAaWibtyu6yMLuy4bLRDqezIKYHLOsNja4j3f+DTiJmxuXGHWO5xFKFFtRdvz66glsCGjVC2WlUTtnBHdQWaTIVc6UVFCWV5q7tKyqq6jFGyF0+RakVFV+UJZMtZto25/q35h7b1VdGgaT+qpnHh0Z1/HHFCFIGRNCwQE3cFArh21U5WvJLJRVX4hU0zRS7WA9a3ifYeZ8r9TAK8j26LpFvol1BxnQtQpRATrF7zhFXcw8YbLO4lJZ8lF37sS+xQ2oUpbZciLGIqFPESyr0TFOFBsguy1cy2ZPmq2gM2GG489ip1tY1YnuJyJ7QrbfU/rhQwshgEZjcjOk3NHmbSYyQQ5dA/9yhqu34Fk+bqX9nzXg5ETJy7yf51/KRv2ENJMSHu3maAH0lgi12Ng7EdsBJBbX89bnwjc2lpW+2t86y2F/+n+xGNHen7n2a4mZBW8VwCI2vSgkQbbCCGp3gMcoSp1XWkpJpLzDDuzBGcYr03oref/eF/DD3zJF/DEJz/CHXuu870vOszVW/fwnsdOwtHbMc7gs4Y02XaKq4+vsZ7WK2u8G68x9D22M9WmViov3lJSwHVq10nUAJBqwYtSiCmSitC0LTEO5GSJsznzS5cZTVd4eHyOr7/3MqPVY/zW5+7gb7fX2L9myGPNGu8ai7Ha3XTNiL7vwTtSP5D6qLqOQZkZQ1S0b9uozci5hhSF7Cq+1FatQoB926f55jt6Tjz+GU671/G2j5zk2Ku+iH1jRxFLKD2mhJoaqKujPs2h6m0wGuqUa7fgrK5MFkNPi6NpGk2LS1bTH5fPtGiH4VyDM55iCqsrazw1f5Bf+dBV/vEXjymnnuC77z7Mb71wndzuU6GfaNEt1bLqi17sQx9pOvUyG6sFshSQpELcYg1JhLE0iM2wapj0E4bZBiUGrrk1Nsb72bf/We5JZ3nbdxzmh37/ET7tHyYzpkGFx/3M0k3UDhuzFqfOGmJlbRnb6M52SJq2aA2uNNjWEEOidRbTaOeLHynIJmnomM11opMKczGUecvm2cd5rTnHVx0tWB9I+V7e9Td7WIRXIvY8KXUMYnBNh+vnlCQ0riEXR+wDoFNUS8V7l0LqZ4Rxh19ZI+3sgMlEm4mp45+++QDfcfwkL1x5juenb+TXPxxZP3A7WMNaieyUbWxj8KKyorazpGTII0uzusrvvtBx3wXhO1/XE3rDey94BbDVyw9riWJxS/opUZ0KzYh+EWltYTEfcNuDagJspp2sQtdiu5YhDmA7knc6/clz/GREXGRGXUPoM95qPxRSApMg1rWoTYAjhkJjoKQ5zy48b86Oh+7dQ/vBBck1iDdYhFTdVEqV1fjzIuXmGioXxKhry7hGaZhSp8DG4ZMwoHdCMcpfACHbjC8Gk7RxRQxGVC9pUyJXC6FNFZbUGPoMriScTaiBvboliqXEQnJCzqbqChI4iyn6HqKo+8SjwmNEvzwxjZIJS9ldvWMURa4OOrWCW2sribOKpI2wyJaEpx82ibMMyTIaeeSTf/mvS3/1JJLnjI/ewxt+9hplRTTZy9zsmtX/r/8HQtb84gpnIWr1kUU7JqliQcFzM5lIX7CEnmVUoogl2waTdIeUUtDAg5xrFWzq7ltHkUtRhsSBnAf10lcB4u4aoAQMWrjo69FRdEL/vnrJVWldTEMJUfd+1uqXRKj2wzoyFUt0Gkpj6nTCVJxpCQPZNfhwnb/4keOY6SG+6z3rNDawjKU0zigZsUJ7Qoj1QFUFP0YFqyow/Du7m2IIWSvU4cIZFhfP4UNPDdLScCbb1k52wDWWVAwUxyzLLrxmsr6f24+vcW5W+IaHxvyjBxqmnOFPTh/kA+fvIo11dN42jcJ+nNW4VoEQ1HamBbZgTEZMRwgWs/kM3/uqxPp8k8cu7OX3Xmho/Ih5JfY5WeaeV9CINXUvVitl7K4PP6fqeCgRE6GMxprEaIW1+SW+/I51tref5ay5nUdDx9AewjZWVwn9FhahyUolG3UrhNAjjaksCKGPPU4cziRyEu1kLcRhoGkd8/kcxGq+gGvJ/ZzOa5o7CUrfc/7506xOx/wPB2Z82R0XWWsdM3uAn/6zCzzXHOeABxmvY2zGVoT0cgS3jE9WyxUoKz9A1nx516goLqUq9HIWO5lgnCWlgGsdJgZuu/p5vvPuMzRBeFwO87N/scXe40dp1g5iKmciJ1SvQ+16YiCVm1bIZTxu6Ad2E8NqDHG2ZZc1IFZFtlTOQR56bNdgXaM2Pmur6NKxM4vkrSf4nW88xIfe/whn7WHevXmc1K7TTjXsR4p2crkP6lsm70YgDykiix56ddzEfsCP1Y5rjVLrcmUMhFSY39jCmsAiWe4+sJeD5SRfeWfmpXtO8uz8bn7qI0fYGXum7USdMl7wo462bRlKwsWB7FXPZCVjQyYmKC4hoTBqPCkscLlnERPWdLhmTGHQS9omdoJnViJdO6GxGZs8bF3n6w8+z/rWc7THHuD333sG9r2ex7sFO/0N2q2WdiK0oL7sUhi1f4dzUSeGIoW4UIE9M58LAAAgAElEQVRmDEGBQ8OCsD0jWkvo5xzoCj/55glH0jP89ZVbePvlBxh1HZ4dsmsQo8Jhb4rmEninWRCVXWCt0a8Wg+SGsvkC/+Dup0kE/uqTt9Avdpg0G9x16CBb4RzrKy/hbe97nN7txzlwRlkdmKSZIGKwRgjzbRXXmUx36CDtyh4dQ0vR4jIW/LjBr60jOeETGF8oQddwmErvywUzGu0+Q9bquX/t/Fm+rf0Yn3jiWf6faw9jRmvV7pZq8ex219KFpOx90UlSSbqq9lYYisGVgWwbQlYhMaFOe61TF1vSZybvTst67ciXmhnrNGQp9VQQRWUHVJ1Z1SSYap3OuQZJlUSgpn1icSWRrJBNo+AiqzRTL2qltwjZVX1DfY4NFkokGsHX9qfY5uY9XV/jUm9WSiRtRT7z/dc58ewZLXgne5D3/eEPltsOrHPmxJOMjx7hTT8XMKtWEZ4iSNbqqJRCidq9Sy5glcWexFG46QSQNJCk0Yu67vsVmVuVuSTdx1R3AcbpnrEIJQ/qvzU155qILAKm3ybZapargR9LfG/9juqoxFOoO5F6AKpNwis0YnmgVhEXTYNE/aEYr0pbJzr6FVsFjiLQtNpBZrUuat6zo0gmRijhGn/y/cc5cdXw6xdfRONUjblk+Bhu7qZIeRdCZHIhxIzzQsyyu2ONQRPbAG489mmk38GaEb1J6sePQXdiQKQQhgLe8sDde/iqBzNf+7pDPPWpZ+j2NBzb0zHrMx/+xFXuu2eNuOcgP//RCWHvq5j6LbLrGMJcU8xK1IsZ7Q6XhZNzBhGLbxrCfEHwHh8SEz/h2tkn+b7X9bz/kU0+Mr8N37VKaEtFudwSKaA+/qyHfzY30+2GYdCEs0wdszuiUXRv9pk9MueAd+zdeIz77zzAtLnB7MKcO19+gIN+wrXNHdb3tpQbO6RJYdE3TPeO2bh0g337D3P6mee474EHadwVPv/0jFMXthgdvY3Hz82Q9g5O9IYzQ8OQhfHU0mfDuIU0n0Ofsa5w48o2L169wA984WHOnP48o3IXv/P4CT4YX8S+tqUddRib1BaETspyDQ/yrWMYIrFEvLHMa9efBdJWwLY6AVvmTjRdSyyR0oxxzuBtS7sofOf/S9qbRll2XXWevzPd+4aYMzIjclZKqZRkSbZsy8YTnjBghqYYDDQYirGgqV70arrXoqi1KLpXNdUMBUVRBWZYQINXQdMMBR4YbHAXtrFly7Isa1ZKylTOmTEPb7r3nqE/7PNeREpy03Q9fQllvHgv4t1zz9n7v//DybOcCI9iD5zh9z814K8uFXQWT6JoaHXa1MHjkPjaRIPCifoleKK1gmolsbL1tcDXwjw2E826jwGXxFBGyEnSiSWETKtEU4RxwqrWtkVhISRDEw3dzTX+47dEehcf4trgOL/yTIve1ElSq8BaSayrmpp2q0B5sfDVhaACvq4Iuz2C0mhfoW1Bq9USK2olRVXhXO6KFU3w+NEIg2MQRqjWLK/XX+Sfv3mW3tpFPl+/mj+5vkAspiEOsWWBcZaiNmwNr3PAWA6xQ6t/jXfc1uauwyWrV5/l9JFbqZtV5o7dT2ofJGx+hhvPPktrStGMGrqtA/S2V5ieWWZt1Me1Zlhf2+LYiQWu3bA8d/Uqq9OLXHw2cT3Ncn32BGsUVLttdGuH1HjmmxbeDOnaKMhnEM7JMARoQg4RCqSsAooKQlUTtWJYjeiGml9693V0aPOB87fwmarD3NR0RkG1cItQNCGCkaREya1P1FUDKtGkKDRnnVCFJekuS8UW33fkKhtXHuLMMcXqimZtc8hdp5bwUVGUFdPTXR58apWHrh7mQ8+0JlwpFSV4qekPsEmKAcjjwK6jnJ4VKNwYwqhH0Z2m1Slpd2cJqpGOetSgu6XIN6PIIQs0yqmcsKjY2d7gh2ce5nX3HOfHfuc8n7wxh1Ki6x4nMIoJkIwfVJPASREbjFjyBoX4AqDxiZxPIQZMY1RZ5MaiGFJNIKkoe2ETSE7snYmKpCJu3HyGBpVqTEiEsi0Fv4qUKdKYLoqxf0w1kSxGVciIIyW0coIuI+ektpqYHC7WeCWmVxEZbzgsDXVuzgyhbhA8H4kPjoKseVRG7T1hFx78Z1cY7Y7AOna2AuqBD/1UKqpVzFSJ1lO89Re20C3RehuyH0CugMjzFRUTqCgd83jWoOJNFQrIAamy7z51nfWNYylehvp9yOoB6fp1/gMDFlKDykQsFTxahZxJFFFB5xjRhoToOKNMJTJzMweDINaN2ogpTkohe6QLO1gVJfgoG1RM2a9AEdPY+SlN5rcpO/9JIREywRB+7Jvu5i7zBZ5sTvIXvVvQTZWhf0QHOg61YV9OeJDscqUUwShM1Hs3e5QZ9O61q4TnnxX0Illsex6/u0IyGh0Vgypw8kjif/mhV+J6K1x45jKnjkzRTI04fuJWqrjI337ksxy97QTPnL+OXjjK8+oO1uwhYjOidCXeZwtMmBQgY86HUmIRPHZljJmymaKHpGlixGmH3d3mh+9f52f/ugXdGQkYygzwllOk2oscT4sjlXOO5BU1A5I3IoXRIxbSiLnmBe46NMtts+u89RVdTGmZnpphc+VJiu7reOHpj3Po5B1cPHeWVoy0F2bprQ/pbe8wt9glDBXEmqm5eYbDIXUKtG0BtiH0A9u9hlvuOIlRNTppBtWIdrvDhe2ambnT9Nwcn3xshSdG01wLJTu7hla3xeJolakjq/RWT7FGm44u2bGSK2FoxNs/+H2fnXT9KeWNMWQ2eh0xhXwPH6jrWjoFXYhBUwrC29ASpHKKS/zorTd4/qG/5553fhM/9YfP8vjoCN1DcygcrlWKL0Xj83rMJN0oCNt49ildnyFVQ7RJDG6sYqemKWZnSI2QWYOCsuxSNw3OaupRRas7JSMyHUlegoNQnsJ1BEK1hm6rTUqaTnJcWnuO7791naPpGW47czu//onEw/EQbu6QEK8UwlK2TgicXnTQIUb0aCi+FtFTlG20RnIJkswwYx7wuUIkeynmkYb3oqbAMG2XWB1cp0hDdFFi/C5nmhu85VbFkRnNPTNbeNOl2fW0Zgc88/BztDsl7YOH2HzuHLpdcOTW01y+8DSz3Sn6Ow0zizP0dvrcuLxCZ26GoydPce25R5k7eIDhzgDVsnRcpLt8jMHKGnNHpoA5NlcVC1MLPNOcY2dhlktbhs984hhXncTsGusFUUkald3gjHOEoFChzgW+ItYNxmnSqKFvLN9z8GHuv3uK33r4IDfsHXTsgFh2kMx4yU2xWgkR0WiaypOSJ9bN5KAcDStx33MalJ34ZChXQK9m2l5iNqxzfnOBpfltXjM94vj8Bm79AstHzmD8RYb9Fp9/XvGnzx9mK3bFVVCLSVDyAasNyo/Aamh1aM/OoDoladRgfCQMR8zedUrGbElQZFOUqBgIXqzTJf1vHOQ2pBr1+Td3Xeb6pc/wk3+xyGUO4JQVTos2YpKU97MxOS4ieTDj+xIjY2qvLUWOFQ4hYEJDsK3szdEISV0BPoohXO7IXRREI1iLVgrTVNLIRrkfxuF2WAcxCkVey8wpmmJCrNc6+xDkh9aSC9IYM1HpiCpBZwdD0fMnIjrfSxLzlt01c48ppiWNoIDjswtLqho++73PkdQCa2sraDuN+uSf/WSaMX3WVs9z4NAp3vWrEVoCQwlTOUsqJjDIGBlIROXzlF6g3SYouVF9nckUUomYFMW4JsefptTkKkc4BKbxoiiwLXyWGloUMWiSzs5KQaqzmAwwkvkOWrThWdaVHa5F8qGlkrNKZp6aiDKOlPKBi0KrJKZAxuROXTrdZDQRL5p/g9iburb87UaIILGOoBMjH3jLndP8xFuHPLJziD9ZPy1/i29yoQPeR2QE6qibkSyUZCliw8j7ibZ3TAzzox6xP2Ln+XNyCPuRzAV1h9hsU0fNG+7u8lM/+FZG1x6ncLucX4FPb5zghjvKhXqOahSZNj2SmaFxJW1dolQf1SRKG2hUmhQjKgE6YY2hqQPO5M5/7MGfN5IxrKQ1qKRpUkBhYZR4fbzAF7YD19QBnC2wKma5GTiTdaqqZhAiSbWYAw66Db78UI+3nq5Yv3yO++45AlXi+fNXOXL3PZx9+FGW5yyNPsKNq0/QKefojYTY2FIthkqzOF0y7A0Z+BqPIVWBECoUUBZtppeW2N7YzoElLQ50u/SqHQZbPVTbYqsBy7ccp9+rGPWvsnxsnu2dIWdecT/PPbPKo8+t0jt6K3919gRPuYrD/n5SRzOwz2MbWWulFbJsrCuUMbSMJmSXyhjF0MMZzcB74mgEWAlhqQZUKeBsiY/CTwihgU6b42rAq+J5vv/NLc5dfoGz/QP87t/tsDl7D/OtNrEtmm9Fom48NoqJTUiy+RUKKo/AribRhBG7jz/O6Nnn0S4nhEXpApNvMFZTx0hRdvGFw1hFuXSEI/e/WdzmVKKuPVZ7KQK8xpZS5BdFi8K2CSEQVaQOlu9aeprXHdggYtnYDfyn52Y5a0+ItNEIiFnXnqnC0uQxo1KJQhliqjFarF5jCJQma7sLMYQCJbHRzhBiQllHUBaH5kBX8abhg3zFq6fZOv8Ut99+O379Kr3G0ltZodaKartmYXaKut7AtZYY1hVJ7RCGXYb0OTA/Ra83pE6alm0xavpC+Ot2SFWNKabReIqihR/uEgrFcKNHE2taLbHObrUW6B6cprrRJwTH4vIs69fO4srA7OFFDhx9DR9+ZJUPPrvIVd+lKUrKsgXeE2jynqmltWlyoJGqOaF2+blv2OW3P3eCTw66zNoWvm2pY58iuck9bXL6YERUG1ordIA6iVlNXdcYozPZ0mCKNpSOFCqSc5ghDELEqRz13UBbt2n6faabbW5tPsT3vPM2Vs+dJdU9Lg/u4+ceqjBuQdDfnKeSfBD01wu/pplqTQ47FzVzd9+K005QihQYJTApiIqoVRBKCY4yCYrSUK/2+LrmP+FHhl/+7FE22zPiJYMWGD+/dsxR0CChOFFDkSwhuz3qKAohcZl16CRIZSDJXJ8EUZDI5EUiC/KzMoOXM2bPnEmjdSRgSbFBhwqtjJwnMk0WMnEQfpuy49cRm2RJSCyyw22SQ9/pCSkeLaqyJkVcgqjE20RHsSdPY1JCJpPGGHOTazBK0WhohpFH/nmfc08/zdLBeVZWd1FPffLfp40XPostHE37EN/4voo4pdCN2KXKfD2gkpD8UvTYJBr/MD4QAJsNFaIWpz1y4pPKxj9JkeVbURjxWhOVm+QHyEVy4tPfDOQ16xG+aBGSyP1S8FhVEPwIQ4XKjmxJK2JS+SLZMUdfdPGJXAwo8LVIU1z7pqoL70nGYIx0XhpFbHzO9k7oQoJsUgriPmcdKUBTjUArvI+8/72O5wYlf9S/j0IHidFMQdLJglS0RjuaeiQ2tBFJ8TMGfKBJ0hn1Vq5TPfMkzrXwjIMnhMnaKEMYNLz7NYofec+XcfHSs6wODZ9bP8g1dxe+05HuKghHw1nNsIm02w6TxAtbBS8e3IgcDcT4xlqJfhYrTbG7RVtBQyIZFpYwKE9Ex6wEMZo6RK5fvcGMdcRWW2x/VUGhIqlqiKYgKcUd5YCvOH6ZEwcU3c2n6HRblK0FKmXZvnaNQR3pdkvm5pe4cfEiUzNdhqEhRUcIFS5Y6uCZWTqIKg9RtNts3rjA0q2v5fCp+7j46CdIxZBOZ5G5heNcPvsIMwe6nH38MywfvoVRf4PB6ja66+gWXYajHWa6i9T9HaZmC4bDSFANni6qWUM5ix+MmF+E6blbuXGlT3nsjXy0f4nPnvVc7N1D7RLTpsFaLelgRgPCkoZ8jfPcsAkBX9d476nrWmxVU8geERqvAseLgq85NuAtU09zdPkAz93Y5ANf1Hxk6xRlZxpKJywWJZ7hTSOFsUqSkBbywSH3VyJsrrP+hU+RhhJ0UyWF006kiNlLQTlL8kk23MZjNRgk/CrMHuDuf/J1NP2KYAxhWFEFT8sahsM+1ha0y07ufiR5smsU/QRL2+d4w4F1lspNppwhdA/xu88tcKmZJhlLOc41CAnXaQlMbTQlkToq2k4zqoYoNNaMiZzyuUYfqICFEHnt9AYnDgw5jGbJPM31SyvcetttXL96nkJ3Ma0CFx3NaIgqp/GhIpmENW161Q7t1gyx6LJ4YJn1zRdYXDiJL1ocWDhJ3fQp3QE6h06TAoR6m6q3gXE11y+dpdWeZ27K8MinPsKpY0e4cuUSyl/DuYMMhg0LJxYYDSqs1WjvmTt0gqi2IAw4/9Tz3PeWd7PbX2Vt9yAP7CzxwNNb3NAz+KJAmzbRN6KnL4U0WjbbvOtMi4/fOER3uiX7q4rEKCFGySeBgoO414njqKGuArYw+KbJfCtP7RuMMmLIpKR7N8bJyC4lWR86gXKT36MsS0bNiCIaChWxVx/in712lTuOdNi4uMZvPDDPxze6FMlhtcOrIK6KRFJVSX6D0xO4fuF1r0VFScoM1YhYNRK8U1XibNrtoF2Jti1UqBlEza/c9in04QW++V9fYlXNCvkuj5O1NRLmlkcSY7GY9nHCBZBDOxJ0gSFMnESNkfMIn/0VMpJAFOR5zF8aj85iLrZhbGGvJK8hNuJ5IDZUOB0IusiFhzi5TgiJupggDtZKgYJ26KSJqULbUgp1Z6XTT3LPpmxTjJKm1SdhC5icfSOXMJ+DWn4Pas+nvusyw511rm7sMLt4DPXYJ34h+bXz9LevMnfLvbz95zYJ7YRNWkxlMrlqorHUSebFQRirMh3M7PvcLaZMRBDvfNkMQ4r4CFZpEkE0jMbKh5K9BVSOHFbB440h+aE4OiollX8zkvFDNmmMSmf3JplTJovEt+pMPgta/J+jz05MOTM7aZHfKTshJCbn0FFnUqPo6lTKPghll1QPJ53wGFr1vsaHxL23LPATb1rnWrPIr924k6lOXnT579JG/MUbH9Fe0up0kk248R6dAymatS3Wzj45WYwojwoCw1vVsDvq89Pfcxf3nexy8cY6D1yf5/HdQ2yVXZFxFYVEcnpJICtKS5MApyiCXK2ilHmiQvIIfE4DNLniDGGcBmiwptjLjU9JJFNRxjp13VAow9DXDAcVfjigaM/jhxWRQGMVoakIseDV5gbfdNcGX3ZondAMcK3jPH32AjOHjnL5wtMcXj5Ie2aR/tYOdVWxMxrQLjsE3eLkmXcQQuD6xWe47RVvQnc6zMzegu4sYXRBNbhB0VpA6ZJEI6oAnDB1U5A0RQI+eQo0TbWGwTAarDNYPcuoP2L9xmN0S8/uxhaUI0YDQ3sG6lFid61icc4xChXb9S63H7qLqZkOdrHFH3zsOtN3vpX//PgaTbGE0UK8NDnYRKTLgmbVdT0xNyFp6mooI7IsJwpVxRs7G7xz5gZvv1/zxedqvJ3ig89O8+D2IdLsLESFK2Dkg8jOmgatckBJikQfcc7SKE3LRW48/Sj185dQcYjPZkckceDzqRaik7JZ5eOxrswy18g46CsFj21gu6k59brXc+C++xhubAri4RtCkJGOLTKapi3WWtquoPawffk53nKy4VXpWb7qHae4dsXyO4/0eMwcZhjaoAyFViJ5VDrbne6xl8sYqMd+GHiikUjkg2Gb27pb/MAra1yo0H6NUa0YVIn1yz2cqzBa/BvK6TmqqqYawbHTr2Rju8ex46/i0G1voKm2SNpQTB9DeNeIGikh/vKIJHmMgGo1dl0fb/1I1K+qSKFHqHcJvXWeeuhjFEVDHA6pB+uUZoCiofGKztw0ANtbA46duYO1q1/AxJqlo6dZ29pmvbmVPzu3yKMjg1FT4vCWDM4i6aVuiqJdUGgh1vkgsbTjQ3VsABNVNo7KM21RtyRUFLJc5QVhKawcfCEkbE7T8yQ5kKLwmcSvxIhEr1HSzQcoO4549SrvXvwCb1l4ngP3fQM/8r9/mkvNYXTZJvhKCG3GCmk6NJRzi7TnZ3EH5oU/kxsJXzc4opAVfYNFk9ptAgrjSkpjqbZu8DvvfJ4//9wa/+tfThOcQ2PEoEdrIXorJW6uWeEiyK2EHY05bRAlsjcm8cnIjxDlc4zNKJ9hAu2nkDVmJkvYGBO5s5xXG4L4DGd0uoGsQNOJTDoXxr/SJje+OSpbGVCZFK/l3E1KlAhktMyQJD45NUQljYNFEbSg2o5GxrmJrIIQbkMCyMFxtVd8/r3n2FrbJNkW26OIevbB/5CuP/kg3ekOo1aHb/hVSIUXVN8ICTDGHKk5JgLtM/3R+eZI+5nGKafwoeXwzmlpqihyRnQ2PkhZi6nV5Ouxuj+J9Z9sQHVF9JU4CqaY07AkmCVpYT4KjJKLBQQOBfHETtmCSdKmxBVQZyOPmAsVb1sYDNpE8FKIxCDGMb4o0d5PIHCBzSxNNaImYqqa//wvTqMH1/nJZ16N7RQ0PuKsJTa1wF0tyXv21YimCRBFWxrqhhg9wVdc/sxnMX4ExQyt7jxptIWKDX5UESL86r/8eo6oz/D4VpcPnFvgIstMd+doOUs1Gky6Tomrla91IWzgUDV0ZqYk2hNFUVrR+qdIWYi7GTplMl7+WQxNjqnUCGO9KGVT8D7k+GaBqQY7fXQxTTXqM6gjh9MGX3V8yHvu7qFdpNq6wY1Lm5gCyqkjJFdSlo66qhjsjrBa0XjNyfvfw1R3mWFdsXDkLlIq8wxr7yZNSRCM/z+PmzwtsjukJ/eVqcbUK2xurhB6a5z94p/TaSva01PEnYg2kY2dbZQR1zbfRE7ctgSxze9/Ysj2iVt4ZmPErjpIu3AoagKGwWiIMo66rol1Qxr2ic7gfUPbBl4zV/GeW0bM9R6mu3ycj31xwJ9fXmKrfZTQmpmkD6IUJIlbVQlC9CTtsDoRgoy4VL3DztmnGZ6/ALYB08mqmoBWovggSBFKshnVshgjxLrCloAiaLEaVTipqvNGEtqzvOJbv55qc4Qi4BSMgnw2RmlclvMqlSjLNk1GmoZrO7x56iL/9PU1K5fOsXT0MJ87P8UfXnCsuBad9jFaTsYl3rXQ3kMKtBVUIRGJxGqXAzbwnbcH7ipfYGZ6kQvnnmB6eprVyxskK8iVmXKUxQzDQUN74SgzS69h+fY3URbTKKyw3yMonf8uFSdd703rSsXJ7JixmmWyeF7m38f/hkFl9DRJOYHfuYDvXWdnbY3e5mNsr11G2yEMPZ1D04y2B+z2Njh++qQY/nRbDLcGPHmtxZ9eP8iWn2dop1HdDs45SgO61cIkj42SzBrGnvjIHtU0YvU7rGucNlKEKkOhoB4PTLMpWd0EiaTOaY5jflOMSdJPg+QeNFGKWfF8QQyroiK4KU70P81P3f8C2+Uif/3ALu9/7ICEj5VtmroWflj0LN7zCmzRwZYi241B/ASSEvKtVZGmqtGtgui6tIrs5Nn0mWaD94Q/5VceOMHj/ogoQ5RFGY2xRfajyVytFMA6OYsiWaoc8KnAOkWIhqQTKjQQBaFNeiyhy6q2xucGLiOrIGTGzIXSIRGNINBymAsx3WojhPRoZBQRAygne35ZSliVFeUTAbG2JyvorM1SajnborFCME4QrRVSbhKTopCkuANIoRbDIqXx2RdBGj3ERKyJfPK9K4z6PYaDDdozC6gnP/WLaXDlSZrRBvbInXz9LwxpOhEXwadGoOAkMIkwF0WnO2HxxzAhyIHoVikKOcCz9CsmNZl5jA2DxvC83HdJ5AvZzjFEnUcNCZ/AZiSCIH9S7bcFAk2GYET/PCYfGqUk2EbfXKmbbE2pVA4OjhGFxTj5+WALdPY40MGTmhEhS9nGEhKdLXpF2igHSR0bYjD86Os8X3ef40c/PsvUmXtz8ITM9dX49zM6p+UFmjrPUsWwgGZ7m2sPfgpVdGkfOUKoEqm3DU0fG3t8+5vm+K53n+Yjz9T8wcUT2GIKCk0KlcBy/cHENWo8p3eFxThH0xtQVTWtbpvgJQglllKZFpkEVOR8ea0SRjupwmESPhJSkk0tpkm+t1Kauq5IBDb6jk5/na8/scJXzm8z6D3E7MwSuxs3CCrS7R6mffhOWt0Znnj0KZJd5o577iOlNgvHX0Fn6iDQIiX5rFJSWV0iBeR4o51wUcZV+MRw6qWP/W5Ye/yFm9eFAGnj2I88Kso3TqQSqDAMiSFx8cm/JqydZXPlObQpaLen2e33mTu0hDPQ7k6DS/zx363wwsHTPLvZwRRdKXhjpAqR0e4OTVOx0AnMr5/nX39FwOizFEuv5Zf/wvDI8ABV6wg+9sUVsNUhpkBIkmbnjBCLxnnnKSVKXUh2xnCdC1/4HHrzOkE52eyCsN9jkE5M+binjtEF1jphCVtN8A3GWqIHV+buqQ4YKwW8tZbgR8SgKY8e4dib34CqZT1oX4/Bebm3taQ0GqUJKqMy0VBt9Rle/Bw/861zzHc0V549y713T/HoxnH+/RNLxHIK5xXJKRpfU6chC6OGH7zX8triKdpLx3jswc9Rlg3adBg2XkaLrTY7uzWn7/0a5o/cy8zCKdnAKVCpvumAVmNEM+1JcvdWw16BuPf/L/73Fz/2r8Gbny9WvRImlD+d/F/DcP0ZtI889eiHMeECw/6A+fmDXDn/DG3XojMzxeyRgxnh2uaDzx7kA5cNqXOMliknUdlFpw1+lyYqSuNwOUwmBeFe1Y0nNBFDoIFsziQJgAkI3gsKFYK4L/pI6ayQCJXo852RgyfkcaZvcvBMFNKq0gFDweHeRf7HN11gZ/06f/HCDB96eAZ0MWkqCJHpW4/TmZ+TpNkkiJEONXUMGGeIgx4mOXS7Be0WKRpKp/CV5r7Lf8S3fFnBD/5Jh3MbDl2K66wybgL3ixXwXrOmnJUMFWPE2M0amiRIz8TyPuS1oK042CZA5+c3ufkIgDMEne3sc2M5Jp6biHBwUsp0aS8ImwJsjvoFagUuJpIRQp+k1VpxnCYJUoCQzU01JFg3iX0f2wAnY4VgqaT7U04AACAASURBVDTEhpTHjJJiKe6q4985GYtSgVTD33/3RWigV/UFzX78k7+U9PYV+sMN2ofv4Mt/7ipaC0NaK0la05JdKofjpMMO2elJ/P8Fis/pfmVXZj95K41JigEdhUyotBW2r86UdyPIe4rifDWGTMaBHtHXkCRzOSSD1pE4rkKNEK20NZPXT/uY2JJRkO1gUyBl2EbYsI6gS0iNBMNETXQyX4wkikymGFdvjBeUksjh2NR4X9Oxmh/7xtex1HyQp6t7+ETxKlpabhbjtFTIviZ5yb2OXlinUlQYmkFNtbPO6MIVZk/dy9b2GnH1GnU9xPV2+Xf/3XFOnznCHz5wnb+8fJTYNjhEhzuOVg11k0ORZTNyzmZeg54Qg7TWqOAJIdBamKftSupRRdEqaHXaWCPEl9hIZ98kKfZcYagbkWCOWa6WxKiBWgXmd6/x7XOP8u7XHWdYrbIRDtExfa6cvwLWcO3CFWYPTGPn7uXOV7+b6BaYWbwzr6N0c6cFL+222Dv4QSyeIzcf/PolP6H2NoSxUoV9hSvkLm2fXv9F7zUpPtCTIsKrhtFgla5RPPx//wHF6AKjGFlbXWfu4EFSqGm1IlPzC2w1bd73ucDazJ0ipQU2+33eNr3CD70pMtpe4cpKl7+/ovjo5mGRUJYdaNKEmVxkh8CiKBjUFSmBU4omw+K6KAnGsHn2CZpHHsK1Cxol9qLk7PLURJlLEgmRCQQqyIDIrJJrC3pmDdrn5EVtSUF8zbVJNKNhNsqROenxb34PcwcWqdd3CNRiZ9zvZ8jXYDJkKgFdipY19PtDBtWIsLtNqwn40SY/+TWzrKxdYvvoO/jI00K+i8lyUo/4lqMv8PYzjqeffhKnS2xpuXz+MnMHl4nak4plDt/x9Rw6ejeBEmsskO1ec7MyMQ3d9/X42o+lui9ZPfn748P8xWvkv+oxWes6j4EUdf85qvVrRL/OE5/7KIcWp1m/ep3ubIuZxQX6vYvMH3wlB+a6XN02/NoD61yMx6k6i8y0LbENWhWEUcBYyWHTyRMRK9gYxR8iKMk4sE1k9fIVfGyYWVhk+sA8oWnoD3bpdrsorWnqWlQKPlHZJB1wLZa6de2zEw4T6J0U0LS5s/UM3//GA6j1z/Obf1fwkfMtus5Q15I6ObO8xOLRIyLFJu4jSwuEjQ+o0Yhy6aCQIDNBtKkVP9j6EBtPPcIvPn03V9M8hZYOO2SfeVs4IWlntJjgJU3WaMGDYyPocelItcfqFzWZCHs/GSPe/yqh9udluJIQE04gODFHskZI8ZnUrpWs96iaPHITMmLQGoWMuBSJGJIo2kz2KsBkS+5xUZpQ2uEjOJPwUTwMAIKy6CBjabLFcfBiv0zw+LSXweFRWO2oG89D37vKlQvnaBfSrKinHviFtPPCFzEqoKaW+Mr3eWIr4JIkz8nkWOAM2f+zvC0zEJMppALTeq+iti2RL4CwQVV2acpRhmMrXkE1RbeplMqZyU1ObPOoqiY6BUEIhzZv3jFGTBRP+FgIoS8JnZ8IGCvwJgixThPBlowDR1wKYuGrC4FSjRBhSAqjxBY2ToJZsiOi1aSYq6xMWlRG42Ogw4D3//BRujuP8vvX7uXx6deTI42oo8BuJoj/AUpuyHHKnK8FWkrA7qUrqGSoe1v4akjo9fmZ7zvFYrnGwxdL/mjjFDYTruqdbUpXkJyllZmyKo81vG/EBKQsKJ1lcH0F4zSb11YIOwOp3LW47sVsHRmVWOnG6GkvznH8llOYqTYaQ6waknGEKJr95EeY4Q1epZ/mXYcSR2ehvTDLpesjRpdeYOpAm6Jj2Rq20VMnuPXVX8nM7GlwB6UgJDB2kESFmw9c+Wrfgb/3kIM8s3H3dWcTYs7eM2VNqIyG7Pt/yehOkxtsf6Ew+emX2ejHY4ekdO7gIgGoejcYrZ3jkQc/yEKrT7czy/XVderhADvVZmlpitWdKf5q5yTPbpYMS8c7inO89ZYWP//pARtTd1LWFclN4eMWSWclgBH2sXbSeUkBAj5FCiPz/8JJnPHKQw8S1lZIhfhSTJAgXRLCEHwlktik0EULrzXK16I7zn+bLZw45RlNoRwNMvox2hF8DaMhpiwJjTgTohVmOGKgAne+7StgflpUH42QmWJSlFqhW04KtqxwGSt5vPcYVZB0ouU1FA271lH6EYd7K/xPX16y+uD/xW2vv5/VS1v0ti+h3BTtbputQZu73vCtTC+eoewcloM0jR0+x03GvgUxPvjHNuP7Lm9SarJGkrp5HY6lu3vFwJd6jN/r5uf8o4qGJIdoCAlrFGn9PBef+DCDsEE9WKHqVXRnC5QZcfv9P8wjn/9zjh2Y4rlei996zFLN3UPpxB/EZ2VIVNBs9whWY7RGK8twc4P1lVV81VC6QvwUhpXMwpsgs2/rcO0W3nsO33KU9pEFrGnhhzVawaCRUW0zGMlsHU3pnMy0jYW6Zj72+aevvM7J5Rl+/Pee5fmNKaw2mE6X6BPLr7pdSHe+QWflhGqCkFEtVLu76KkuZavLZAZee2658THetHSZhZmDdJZv47t/7Rm2mwWMK9C2EI6DIaOuQsRmjDiPc22UpPapUOeiOBMAx4FxuShR+fmTBiVJQ6ysg1oUTsQgxkvjNaijFDBKslskWEgUX0FpknFimmcU2mdPmozYWGtzo9mgTXaMNQqtSvZ4b+S9fry2xfguKifEfC+jj5Qk00JlVNtjoNF8/NvPY2NNe26Rpgmoz/3VTya3e41R2KV99C7e+W93MapP1E4qfRUFBVAqk/tk3qRcIR2VFj4AIIS6MfM+hL3bQmlUPrgnt8n4JiNkeDBMnASNCqIkiImUD2Gd85aVh6gkDVCX3XwgZy1nShPTIqxG4UQeGEKGlcc3ZK5YISfGaZQrCft03KCgGQp05uwkWjFhiEFS6XpVxW9/32Fu1c9wY+MGz7Vfze9v3sNiZ5FoQg5hkPf1TQMhSjhObDKZEeEA9EfoqS6DtU1G169SVYE46HHarvLz/8Mr+ePH4W+utoitFi44qmpESonCWFyrxLQKqmqIM0UedUT0dp+Vy5eJvUpmWDqRijxzqxtaU11BWbSVzY8clhE89W6PQODYiZMcvOsM2nZpYoMe7lLVG9xdvcD33uu55RV3c/nyFWLdsH7pAqZs0ZrusrFbcOTWN3Li3q/NM9d9m/Gku385uJWXFAN7oyU5sF96iOefzl+ON20Yx0yNR+dpnzuf3ntPvTc2GXeDLx4d3LSJ75/9pjGsK1G029ee5Pq5T2HUGjTrNCPFtasrLB2ZpuUj3eVX8NEvXOT9l26ndewwNgwZ1hFjFYO6EX+E/H7NcDDZuFJKmLIgZGMXpw3Jlbi6x9kPf4iWltkgtiDkTcyERtLKYiBaJ5Cls0RTiIlXbGgq8fUQ++YapTXalGhbkojipaEdUSnSsCfpjglM2SL6QNmyhBBJ2nDwjjMkHVlYXCIYsfptlVbGcagcvxszeVD2EVe0IIxoakjUvKl9g287PaSTrtGvarY2FVNTFlTD1tounfnDzCy/muX7vn2SCrl//LgfORpfT1EjZQ31i9bL3sE/LgJeigbsX4eybvav2y/19T/8+JLrKhd7IdUoCiIjts99jp3rX2Br9XlUHEHLERvDwmKbuh6xMH+I9z/c8GA8TefgYUL0NKM+jVc03rO9s0V1fQMz8oxqhe4q4f8EIVY6UzLa7VO2O1TDASZF6rqmNIZR3VAnz5GjyzQqceiW4yjtqKsROimaGHI6oTD5VQ74idpx0t7gu45e4tp2wy/+jWVUtHHOUfsGOzPNybvvEPVCJnYWNntnqEjKh6iQoRXOWkKMeBWYPv8Fvv/1O5TbF9iq5vi5jxmeHCxSaAWFzYd1QGVb4DEnLUUva8EJcdZMtiWNjg0kT9B2D7ZHC3+NRlATLYotn5kdyrXEzts4yATscbOhQyLZcTsvKZFmnJ2jLIrMO8hR30pboi3AlZA8qAJlxyNzg41hEtAXtZ2cX/J7i2lSihFCRKuEjx4dIegWShtQCV9pPvltj7F+fROlLTOHllFPfOJnkxn12Fh9mpnOQd71m23qso9R4lufclJTVNltL0f7Yh0x7UUDi+Wrnpg2qBxgEmOSezBKzybMzH2bstbClB/DtEkcr2yUQ9p7SeNKviJGT5FtdWOhiMmhvEc7LSYUSdKTkt2L8x3Pk8kz+RAS2skmmJLAOyoGYinRjNnRkXEcJGOHQ6UmBQBVj5F3/MBXzfLNJ59gVA/5+M49fGz7JMweoqsN0RhiVYlUKwZ0lHQ658ToomkaAolUBXT06LLNxsWr+MuXia2SIu7wvu85xheevsCf9e+jUZpYK3wzkqx1ZSXRrmyTrEZbTQqRQiu2r6+zeeGquNDFgCZSFm0xHtIW5dKEJVqUWRKpEynm7HMTsSmhU8PcmduYWV6C3oDC7/Imu8JXnVmn9oaYHNPzC7Q6bW48f47esKJ99I3c8/pvI1JicvWdciF5c6f0Ymh1r0jYXwRMNvLx98YFgHCDJ//+0qHBTdutvN74nNhXAIxNOvYXAC/3uOmg4aUoQUqJhJXitBny2N/8KtVwhaK5zsZmH60cx44voVVirfs6/uCLgS+OSkwh/Y2xloBI++q6FuiSPaWLchalLJrEqB5hfOTSx/+W0lh0zmdXrgBtJHY71RK9mxLBtQj54FY+ShiMLQj1EK0FxSpyHoV2HbzK0cnWQOPByD6QBjtikJ3NTMbk2kIrfG9I1e9z/MvupzyxTPRRpKVB+Dgm52ooo6krLzBp7mZaaYcfOVXzipnn6c4eYeXqs8SR58aNbabmp6nTIve964dJ7VPoJG6hSrubeCEvHuGMr/Vkvag0OfBlvey/lnpSAEysy19UgO6tm3/cQf+Peuwbg+1nEqRsYb5z5QHOPfQn1MMtWp0WW5t9FpeO0D54gKm0zYp5M//bp54gLN4DjKCBmBIbm+u0eo6ts0+gnKVJimFXYRrJRLFW0NI0aiYKAlAMRnVGgUDVDVbB7JkTzM8dwEdRvPhs+BOzDFwyQLSgC37EV5WX6PS/yMeuHuWJnTmMiuDk+cu3nmTq6GE5V4LIrHGSGlna7P5XZBlcEnKy1hLOs332M9wdHuc73nWMy7sH+cHfWUeVpRDKdR4B5etpjJm4/I1RAIoiN2G5WFAJkwJeG9CFOMIGIcjGUIkzqcyaIXqIAa8tRoEKkWAM2ozROzlbbFJoIxy4oLVwCrLnhcneOlrJ2FVZJ2eGkaZVKQd4ISWmgPZBOBshQFFmPxwvY3jFBK0X/sF4fBnxShRoymlSH/7yax5iZW3E3EyHmaVDqMc//jMpbl2hnO6SphZ5y7+6hpoSyRLJZLa8AqdQyCw9xQpRAjQyX49CKhoTrKK1qEY2/0BCRXKCUcrXRNAEgSfEzCRFIUCgaplZRAjZrMToIt8gog0VIp4k52lrSFUlfuPGTn6HEGO21BQoRymVHdLEJx3rSE0tbGM8UZcYN/biFllH0ib7BFQkZLAWgsyQ3nF3mx9/+wtc2Cj5wMXjPF6eZqq7QKEDTRTLVVXXggIUGh3y7CZ5qGVzDyFbIqMpyi7rL1ykvnGNajDkR95e8PbXT/NrD3R5dDCNGTVop7BoRlWDK4x0bo3wH5oYCEHY1sMrV0EXJK0wBHRUGKdpbMIHRaoH3Hu0y8bWNocX53jh0gr33n6Itu3yyefO4csDTM/MMbswT3QFi1OK4+Y6/+2dNXfecpJzj32ehKEJll6vR9GZ5+Cdb+aWe74axUK+zvlInhz8L940vzR576ZHRkpePM9P7GVTZBHqvte9+b0yeX7y7BcfFrlUzO+R1/t+crd6mQJgX7GwxxXY/54GYsXnP/rzXH7u85w+tczWjRtQtplpG8qywzPxFfzKExWbapYpW5L8EDt7gBgkKtpYRfBCHjVREZ1mcOkya5//DEZHrC3QtssoJbQVtrYxhTC5U5A/OkuqkrFyX0aF0eOZcCAGIeuJh4fBFF0pfJGCcExgRClUPULFhmSLjK6IvKsJotZRscEPa47e+0rm7jxFSmoiK4sxEnPWhCYxrGpWe6u894Tiqxev4PwqpnuYy2efZXahQ0hdmD7IXW98L6Z7u4z/xpv6fo7IeO+5CbWJN12fyb4zOfz31oQEfEl6XVIIISw/+6WjqZuu8MuutS+1Bl/yjC81HnjROtp7ZGSAiB9d57lP/wFh5zJV6NOZLdm4scWJ03cQa8V299X8zEeeo3fsGPXqCjsv9ElTT/F1t0yztFyxctlzKi5wZXsVdcjx2MPbbPoOW9HQ9zMo7Wmim8y1UYnGB0onSX+lsyycPoaxZY5TZsJNqYMHpTFGU7Ycsd7kl98ZGDSKH/g/ruDVFISItSWmZTj5xvvxo4rCOnF0LMRjxWi5xsaJ335M0i3HvCabOrG9ssZ7jj7IG5YdH3u2y7/54A10d5EiJaJ2KLw0fYmJtE5bi46KqJMgYdmNL6osIwyeZK2si6aSUW8uKJVK1EpSOfHZ4h65h1RMWIJ8Xq6QJtJYUhxlQyYrJECjhbCHz42MQhUmI1VyTsYsHSRJLLEZ8+0QQjooUb8BxJqonRgCJSFw6ky4T2YPfdUaBj3F2X+RqEcSxPXCc4+hnvz0zya3u8KFc09x8OgZ3vUbmtgReAgEehXLSFkQIeS4zsSka1fZCGGyqMsWKYeN6LGzEQk9WfQyV4sKcYDSiFJA7zn5iRbXocl+2GNpWkjobLKQlBYWt86BCTHKhxcjKY4QQxaRUI1zoFUjLluNEu27So3M3bQTy+Ns/pOU2GKqqCFUmb1riHXFbbcYfvvbRqw+f5FfuPYaNjq3oTqLFHGIVypnR+dZaRAfc5+kOo7NOOJTLrBKoGyJryuu/f2DuJZj1u7y899Y8Hh/gfdfXESFsZ1joCzaopdtWZqQCDl8p97ps72xRdzeyaMUYW3HUBF1SafZ4VVnDvL6U/DOt9/NnNvBlQf54iOPU7gODC9w9+nbeWp9QGHu4vee6XG+SnzjUo+3LqxzZCpx4cIFWsHSQ3gc0XYws7dz5zu+j7ZeAF+BLV9+o/4HN8P9X4ufuay/8f63j8k/numnNIFy97r6f/Dd5HXzTD1vrfKdffvxiw/4l0MlXg4unhxCCIm1UoEyJi48/EGefvSjLB2CsLtDbzTkzJn7WFu/wRX7Zt73mRe4UixzaGGBGvFkiE0zuV9sp8Xu8+fZeuzzkpyW779kSmx7SgpNW5JCTQxCgErKZm5NLcTWGFFle0KWxUoqosKgWm3G8d4mxAkCYYzJ9zaigc6E0liNxLdDi5JGa4mvbSpPGRN9PG/+b/4JmwwhSCHQDCv6o02K2OKrj27zxgNrLJst1m5sMHfgEL4ZktpTUC5xx5v+Z4I2WLKb25gsys2H5+S6jInKKU7Wzx4K8HKcknxIJy2jxRdd43Hg2cTa+SWIggJFVo58qWL25kJz/No3/RYvVwi8uAjI4yal8nhPibQwjTY498SH2bx2HhfWcC2D9j3mDy3Ta72K//J3j/Cx3dM8m6aYv/AhfuErvhWtttg4uk1Y2ODSX17krV+zSMt0aMKQhUOzbFxo+OADV/k/P97jagOd6QVoErbo0vgRKgrBOOjIkTvvQBJeEyF6lJaAIYWQViFiXIfvXn6G1xzZ4bce7PLXzzpZU0GY9Sde+0q6U1OTQ1rrrBzTBp2RKGVkVAlAXaOdIXpPGA4Z9Cu+49BjvPZoyeW0zHe976KgzFFhCkne0yoRYo02EhQkB7IU6dpZoraMPWyMirmjlsJSELUaR4CQvWwKR6oqYqsrAXbKoH2NaQQx8doK8RAIgsNT4sFAgwHr0FFaX1/I86w2pChkw7E6w2SCe8rZKGS1BsoKIp8iKDcJ+woEyTCIKYf1SbMbtCgVUl/zyW9/hN72iKVb7mBl7QLq8U/8dFLra1DUDNB87a9bfEdc3oyyaJVQMRKUwuxjbBstH9I4Xz3pcVdvCEYgnfGYVGfYXjupSHRKGVZMCB9ZqihjFTHkOYeKkB3PVJ7/hySxjzpUpBQQyZiMH1RIYnyhjdgTJ5nVoAw6mxOp2GAakQQFV8iGmc2NbI6FDcbk1L8oKIEPgiLEhqQ9BYkP/ugxhluP877HZ3ly4R0saJEx1EGYsRYFJubcAlE/kI0wtDEEsod802RiVsm5j/4tOvaxpsV7Xtviu7/5Vn7iL1qs1gpGQ7yPuHaOLM5ELI3CKwjBs332eZJyODSj4RDtxFluyTW8+86Sr/nqQ8wWbX7pz57kcn8ebw7QtA4wKLokn1jQDc5ErtcDdlLBNywHvvPuLrcf3+TKs89Tqja9wa6gIm6RqTNv5eCxL8PZmTxbD/+fD/z/98feDH9v/p+/o/ZDsuPDdgz5qkknsp/gN+4IX64jm2y8KcPZAoJPNvnxgTj5zSaHy8sjAePX3O9TME7GBIjNDs88+tdsnHuYbnuHstB0pudoRkNMp8OHHlnk/S8MmT9yCmcs0WoaEt2ixaWHP4ff2pDiz1jCuDhwBdEojO2gWx1CNUBVg8l7+yQFaN0ESTfLVbs1EtusrMMqLUidgWScQLpeuh+dgE4HRo1wRsQoAusrmqqmaLWhPZUNkAw0FfWgj0Pj5g8y98qTlKPAoOlhilnm/GW+/7Yhp+bX6V9epTt9kO2tLTqLC3RPfBWLx0/TnTqJZOaNP/ebC0r5/F9cyN28VsZrSLHfbf3mx4sPZeF/iYpowgeIwqwW2en4Qgt7f/9Aa4+YdXP3v/+A35NAv/z3X/oL6pvvqf1+9vsfseLJv/8DRpuPUFFxcEpT9So6Zpem/DL+46N9hptvor7y13S4Rn/Gcm5mgVb7BE0zS6091eYat7d2eNsdFW977TRx4yLtA3fx07/3GJ8/N4/qtvGhEtWWdlhAd1vMH1veG+WmMZK7V8O0EjRYvmnqkxw7doT/8DcNq6qFSXaSunfylXfRanVQpRESaSlkPuckDXLMNdOTfUGWcUyB2gdG2zt8rfoUB/QL/PEL9/DAeYNul8L2J/PWtCi5hKgnCjePwaUkyJhSjDNpTFPJ+LrVwSeDirU0lXUt517wJGVkBJD3GJoB3ha5kPCgC3RsCAp0sEQniMK4oBaXQomZH6soYmgmCLZI7o0kdcaaScCdShIglAKKgFei2lFG9nuiwimQDIKENsIL0kSqETzw3kepmg5lS9OZvgX19Kd/NuntVTa2rjG7fJJ3/tuKZtZiUXgVMClhx0EH45ss1BMjHmMU0SuilipEByXxuTHKTAVhnxJzpxqEHa+dkwo7V/c6yYVVVmaSKim0hRTzrk4SmVtEDlQVBbbLPtMYLUSozPQXSGpshehQvsY0A9nUlKJBQ9lGPqus1U/ZF1rJovGIZDBmTXpded73I3dyeOOjfHpziQ/Fd2E6hhaR0naompE4mEntIrrpHFMJsrFYLZI6rTXbl64wc2iZelSx/sVHGfR2OTat+aEv71MsLPPrz95DikMxmqgaXFkQ497BaJ14YO+urFNfX2OYPMoK0W+GEd/7rjPcd+s1RmmRf/e7j9KbfQXezhDbsskrpdBuCmsa6uCpa83CVODNc9f479+2zFyxy8UnH2dQyadf1Zbbvvx7mV1+rYyCstvVGJ34r33sbcg3/9uYABhftLnmZ+Tnydfjjnn/42Yi14tmvLB3asQESk9++uV+bvKaL+IljP8tcvOGLrWI3A9aO1ANoPj8f/kdqo3nGQ0v4UzN0VvuxZUzfOHcJX7js4qVg3fT6c4wOz3DpS88gqkH1KO+MLX9CGlALZRtdDlLVF7eux7mIBZLtC1CqCawqfLCLQjWSriID8TCkJqEaeXch6CYKDNCwiSRjqnCSYcE4KyEDxkDIZBaLawrZT5LQnoRSzEzQxrt0j0wR7WzybfdYfiO+6Y5+9AHOHTkNgiW9c0Nlm9/AwdOvI3uwTOQ0iQLQD77lxaWN3fzLw+37xUJXxqKf7kCYO8ayrx/XODtLzwn76sVBDmk9xeTiviSsdE/xCF5+V9QTxou+aG9r19SBCSoR9f5zF/+Jm21grKewWaPUwsHaZaf4vqV7+SPPvscW+sDbtg2aeZutNMMO0OCNzR4nCog1fgqkcKArz29yXvfUtPfhR/8mWfotZYBsW9WwdOamqa7dABbFnIfRSapqZkRhksaXxj+1ds3Oah7XN5Z5sc/vI4LIg8v0BRHF5k/fhRTjWi320SjJBPCij9J9EFeN0RUrsy0G7v8BZJXuP5Vfv4rFVcvXuBf/tE2T1WLMlKOEV24ySg4oCY5CT5EXB6XReT7Go9OoqP37v9h7c3DLUurMs/f+r5v733OuXPMOUVERs7zDMmQCAgISAsIrQhdqKVdUlSDc2PpY9tUa+mjqDjQXQNYrQ9aFlpPqZCoCIpMSZIzJElm5BzzeCPiTuecvb+h/1jfPvfcGzcyE9v9PJARN849e/7WWu961/t2lEcTg0rDt0VBDCNnwVj2SM0gq96iMaSoVIcBQ+VrMEKQSEEkxgTlJA35nUxpVbEwV/9RipGYVsqVPFlSH1eoMqMYkq+JzkIgt4e0ALcIPnktrpO2TZwrGS7V3PW+FWSYWDn5BGcGDnn4738lrRz5FnPbdzAoOnzHbyxiJxwmmqxrHrFGob84WugyZCaCFbXmjXFtABBjGcYGQmJP9yQr/cS83a42jahmcwxJZXt9ACv6X9EMU6QNzFn5yDfYqO5qGMGIkqZaFaTWuSlKqZMI2XZYRFmTRlCIGrDNULNPUyCxAecURsmIA6HO/UCHjwLNkCYMeMlVW/iNt1r2HTrMv3v6esreFuUZCJAcrRiRcy67vTWjjN+WjuSjrhcCITnmepPc918/QVcig9CH5Pjh113E7upp7jHXcM+JzToSKajDVHYn9FHolI6UIj5Fzjx7gHolYMQTS+H8mYKff8MU521z3PmVJf7ysYL+5FZ6DpwpVZn2HAAAIABJREFUsMbTBCUG1nWNTQMWYoft4RC/870zVMMn2HreZRx48gl61TYW68TMRTew45LvwBTbOIty989S+a/dWtb2+KJ5Foq75vOJtWvq2UnAeOBvx2Pa3wXU9VDfJu0pZzXK8e8Y//z4967f19nHJqMFXcjyvX7A3Z/9MLZ/nOgGzM1MslJ7qu3X8+efP8zf7RPqakL195eXNKHOC4UkP9LtpzurY7IGHbMdDpRFPTGjC3Erz90MVYY0NrRSokPJPhACVlQFTVAZXolkJK9BihLT7YwWEyEirkNqamVeN5IVCz1SVTo/jufEmT67ppb5re/bxe7efqR7EcePHOXANx9lbuuV7HjRW9i85Ypz39h1zP5xhKit/tuWzOp1T+uf0G9je/7+/ca/NkbgGx9BTKsJwrmem/WJ5rm+d71exmiiad22ePwZjjz8Fyyfepjh0pDbbtjF8uJTdMo385FPLvGV413OzK0wnOwxGAxwlQbS2Hi1lo0JT4MwyWv2LPGaq0+xePIIv/dnNUfDHMEPMSHhEc678hJcr4OvvSqOZvdWZ5QH0BKot8kRfu67LCcPDviZv51GVfLUpbWam2b6gotojh3FOMumiy/EJZtNqyB6nw1/RJMAUcTZOTdCqs8Mat4+fRe7hg/T2341P/BRz6CsMNLC+yq53V4vU1aIscS6JoWIK1DBn6iyucGUSAwqx+tKVQtsBlq1Rw/G4WJN4yY0UIuDUKsld5m1OKL27h1Rre6NZE2aYoQ4tFw441WbJub92aSj7+LUQE+ImOiJWG1TZPnjFBuSqGJgcpUO7YeaQMDkZDSa7OfSRP7mdfcSBCarabrTW5Fv/cMHU1o5pep9JnHH7zTIlMVk1b0RS99IFuvxqgFgXA7QqhcQJY4EeQBSSFhX8oqdz/KHP9Fw4IlJXvR7W6hsSQgKhbQQW4oBEU0ijLOjkmr0wrQIgK+JvtFxQ6cVS8uChBZis4QoWBNUN9krkzPkmUgwmEE/O/4l7TfZEisqhdvUA0zZ1Ywq6o0LeYb/V15fcPslQz66/3zukxvoNgOSMzp+0qhykxTqOVD3B0ijdsemzPrUuZVy4N576TaBM0dO0u2UDGKkKEumGfDz75zgyltfyr/4wyUKHzBWLVFBITHvvbq/ocY8df8Mp546RCw7FMYxM2H59Xdvpiw7fPS/Ps49XEhhOyBC2Yk4HLZQIQ8RoY5CMxjyQ1ce5T1v3MmJgwfZNDfHIw99AycTrBRbufGVP0bVu2C1GlsPTf4zbqvL7yrScXb19UK+ZfXza6p92h6vSuoqXN/+WvaQICcD7QJt2uRiXd9ZNk5KzpUojF83ybrzMdUsHNzL3gf/hE5nyJljh7lo98WYskNd7uQX/vRJnhpOkhpPXQ9wZQ9xXQbDZfBDytgQXaH9PimUDtkMic4xSInKuLyA6vGkplYfjCTZ+CRArLWyKCvE6/mmbCglJkKtkqcy2VW5VdPOVatqmlQVUmsiXlmHDwOCK5lfWOIX7hBu33WK2c52ju17mOgnkDDBytQF3Pad76YqNpNkY87IRgGxTQIkna3fkKLyiEaIzboEbqNtbeK40fO1UdaZn6uURceSOaciZXtM7fs/3gLYKCF43nbARv9lHSIQIcQ+zz7wCWThCY4f+hYzrmbHbsvM7t08c2gPv/TxJU7NXMigWmG5UVpa4QzBi6qABo+hS4yGEBr+8/cnuucZ3v1TX+RMeQGm0HZQOTNFb3pK9QdizA6Tah7Wtt+6VYemP+SDL9vPRGX54KdKDoSCsFJjy2LU57fWUBUVMtNlx2V7cI1eL59l2G1ZjNp7bduhV3Vp/IC69pw+tcwv7f4Se598jDv33sJdKx0K182OsTq6B5EYDBQCrlKJ3XYyIDW4oOixN1YRZ3FZHniYheTUcCeFSKhKXN2AK7Sl7PU7hIgXR0HANxExKSdDeuzBlOqZ4ft5dDdii0p5EK0SkNVWQsSMWQOPtaWM/sz5FRpTYMThs0JtO4XXTrb42JCKgrgcuef9fax3hDjP8aMeVzfLdC009QrDqqMQHK1WviWiYyFatap8YZESMUStqlNeso2qGJmgnzHJ40l85snN/C8fXOLhU6q6lGKtME7Moh0oJO9EdARDcsIh+YSx6tgkaihk2llp1Cgn2JRHNVAJyAiViTQpEMVpBlUPEMCUjpClZr205jb5ZZRIahqVBkahR2NKom8ojXDbZVNcvX3I3iPH+PLKbcxVK7iO9qp8oxzPptHjtpLy4pB0/EK0fxPEYENkajigf+o0PVcSCPSqLrUkBovzPPjgKQ7Gg+Anoeljip4qwpXFKLu2KiWlc+GmhE4PW1iWBgN++c03Iv40v/Y/nuTRMEuVoOwkko0UtiISGPZrDJrpmoHnHVdEvufqBZYO7mVm4ny++dADUG1nx/VvYfb8Gyhk9uyF6Dm3f2IVNfZbbS+/XSNtvv/P/b3tflcrRGQ1yJsRNyDzA8b/Fiy4Vqg179+cg7g1Oor2G84+4w1JX2uqWYXrjJTMXngtN8z9FM/c/8dMdBuefew+zr9oD6HZz7+6vcd//JrwVJyjqoSwvEzoGkynwtYe8QmJHlMUBCCKBQPRlvTEkJoB1jqCQGo8RVERQq0wri10nM5nDkATchWiY4VVUSpp1VmMk0zy0h5jSGA6JSZ4GHiksjSANSWJIf35Bf79Gzu8YvcSaXGFhcP7qewcaXYHm3a/jh27r4fkMuKybn5/rDremLyXYfrxK57JfG0rSEmDY3D9Rm0CUPGf/KxlXbr2ZgFt7TX+s1Wuwej5Iq5pQY1rBrTc1Db4b3xO56j+x7f2Go0IgUIaSwLa5ykfNNZ02X3bu6mPPciR+d+lmd7KvsePsevUDBddOcEH3zLPu/7qOJ1qliotIwKTUjBwCaSERosWHzyNH/C+PzjKL7/pOB/6wA289/dP6To6EYjDgK8VUcVqVR69VyJbSiqPGxuMAzs7zbOPfY0rtt/M4UMFqWP0QmYvijSsacoSWaqpj83j5mZJJrdSo1cl1ZwwjOS1fTY7EqGam+XrJzZxxaVX8/2bA3d9tsCHFaytss5Sia+HGJdF53yjyLVxRAI2RILJuv8ZbRMBQpMXhJQRMCXhlTHSiKLLkiK1gDMV1g/p4Em+wVEgWROn5SlZ8SScknkFEJdRdZMF74AUidZB0liihXZQM6yc0CCBaA0uJoL1mFRk8m7mzhlHDA2u6JGSUBshnH6aA0dPsuPSS5ia6eFcqdn7yRPzbDlvDjL72rQz1ilmFm0WeIgqkysGhWRQ1zUTVTMwiNUH3xlMqinsJF9enCIKuFiTnJBiy+IgOyEpeYTYgJTaX05eYaKk4hIhQ4+t6EoiELMiWYhgJKKiQlrZYQSXg3vMBJ2Y44cYh3NGvZudUEQIIiSX7TBTvgEZ4ej3G952jWDsEie3XU+32YZzimKYFIgma7Q3DaGpiQmcNWD0hpqYiMGTxHDi699kcOoMEcFm/X2t6mu+/3VX8prbNvGhf6hxtqQslGdRlgUxqq+Az9C4sUogGTQe2+1AbJibchRL+/ny0/BsPUtlC7rdEo+nkIrGe2zUZGK5SZilJT70hgGXdZ7l0P4hh4eBHduFELZy2a0/yuyWa0A4i4T1/Nu3Gfw3SCpkzeKde4tmdQHeeB+rv9OS9TTwt/92NkHLCIoE2DRKHZSbsjGU3x7b+r23C7jGk7Th74x/Thnrq5VbNbGFy1/+fg5+478zeTiycHqRxTMnOe+CS/jw2xyf/objI188DiJIABMnia4HTkhNQzB5ciZmYl9saJohJnpCdwprCiQMdKwoJ9zR5FHb5JDoKY2hbhqM6VCiTnJOjNppZ/KSSCLUnigBFyu8KRDTYKWgqhdY8J4Jt8h/+/HL2LZ4D4cOzjM1fT6TUz2Wwvlc/cofAlTZLInP9+jbkdodS7rWBNKw7jPP8y0t8iMprxiSF2mz5jhWpw8sq89enj5hHALK0ylpLWYwei7W8EI2VrrcSM/grOMePTtj78xYEqCfySIxJDrbbuIlb/0we+/6A+Z7J/nW8jcoH7iX3ZdcwUfebvmtzwmH7DSkPrasmJQEPhAplDgKFCROm2keXd7Edc8+yB1be3zp5GZMMYmd7KhWi3XEJpAK7bHb9lgzQmvEcs+3+rz6hptZmevyuZMdihhHUw3gcQ6ahdPYToeThyLV5hmiCE4g+qwjg6IA9WCANY6i1OS1cCVTOP56fhf9Q59k985N9GJi2VbanipcXkMsYkULxuBpBeJsTBqbSNiAImNAsLlYEIMxBTZ4om9IVt8740pM9CQiJU4LK4mEmKAoSVKQkqr7ifarMDESTYNPRu1981QCMWlcSknjImrzjTWkeog4Sww+E/A9pKjxVkrKekBdhhFagK91usFkoaFkcLGmmNlEdyFSz5+iMQXOifoX9yamkK7DFB4xHb1xWJR7KUrSixFrtKcuvs4whLINlT/lcUkIWXpT/Yk9yasKUiCxKqmYodAQSM7gDcoM9bVmk+iIg415fJAciNpxvoRCOtGTUqXazRFCy3JGLYBjjJiyBO8JMak1MUqqEGux9YAYa6ToIc4SpMQmTxMt2BIJS7g0ZNe2Kb7y0IN8bvYmer2AkUJHIr3HYagb5RcUOTMdZfxehW/FOvy+/fQPPIOzJeJKYqqh6BFW+hTGcsNNV7Lv2F0slzfhcCPyljGG5BtC05BiwlUqxDIcDjFRCE2Nm57kX794lt17Sn7z/iMEmaJnA0OT6BYlZdCRx35hCDYyvXCKD709sskfR8ouZtLxxDP7aaau4obX/a9MT+3KC5D/pxbzL3gTsTSZqToiY+Jpe/EhxcxH0ZdEjDKzVslZ6w9wdUJARpXg6kK9urVIQBrxN0CFrTAbE89WA7lmkylmj3ATxr66XTTWcxhWA9doIWe1JSAiXHj924lXfyf33fmrbNo+xanDj2Nd4E3X9Vg5/Awff+wCGjONqQcUSTkl0Va6GJUVMQyRssD0l3ExYKzKRZME152iCYlKDPha38uOhWSwydGkiJRtFWvUc4OkYl7WYCMqOlRU2n9tGugU2LKDrCyBePbIaT72k1dy8Btf4KjvsP/JQ7zqbd/FscFFXHnJK3LSo8l624gZXaOoVdZ43JOk48KSP2fFEmQ1aXjuTcm8KanmgTAmQjZKOGNGGkWLHiEH2HyvZBxTiqutHFomzOoxtH9fDeLC2udt9Tk4VxKw/lk557+z+rydnaiuTQRwM1x+x0+ycPBhnrr345w49CjLS0+wfVvF7739Ij505xR3L5/PmeUlql5F03higl7PsdKPuLKLW1niN/56yO9/3xV8z8sP86XPGMzEDCVQ+0bbTEbH28ToU50ajxQOkyKFwJePbeG6A4d45v5HKXkZQSLGOeVxRfBORwRdPSRY4egT+9h5+SXY0jAIuha2qI4aIUWGjZLoPBEjA07LZr7rzbfxzQe+wi2bJvja6Q5B9N76pKJF4hWdFldo2ueToqG2IDQ11kITdWrGSIE3hmQFxJKsZD8a8BIRCUTAU2QLZsFG9exoig62EYJJOFOCjxAGJONwPihSF7328V0HGxuVzk+iPLgmImVJkyKFUcS3Sl5V/8QQMpdAjMW7LsmrJoMAqSiQlKfxTAILy5Vl2DeUvSmcaagHQ1xTD1g+eZSJLbvww4TYLqFpxux/NSOO+YG1KakVsLHKsDQa6A0ByS+GSapgpu9Sayup0HhsGqL6JupL0y42mT0sIpigSYCPhmSSzjVb7fubmJTYIClXa1a/KrbjiOryF2OZq7hEMoZkKsrhEJLX/Se0WrIGYzrKrg8RipoUs2ucKGx/9UWBHdu63P7y1/HpZy5kwhkdWzQW8eMSw9r7arXHbRJK5xg0DQnD6fvvJxLwpqQQg9hJIoKrHIN+wz2f+3tuufZ85gfCZFVTlCUxqZynQaiKCk/UUcAs+9j0+7hOh8my4KUXLPHgQ/McWerQm9CJiMpVJD+EiQrXBAaDyOX1YT7yIz263S7INvbvfQhTd3npK3+UPbe8AwQiDbIBweifbRstogGRgBOb++5BNRiSUye+FEcjRtCygE1e6FaJYBvugrx6pzFEYLzCGvu/FrLVz8TxT4y2tRCuZAg5f3/+6HhfeqPgf87qL09UgEHsLLe9+dfY98Bf8OyBw7iTx5g/fppXXjPJ7bdeyq9/ch9PDucYlLn/W3awCSWydqYIoVGlPxswRYfKdiF6mhRxeGJREGKgtBYvCkvSaIIvRjTgOvKCV2JDTQqemIlLUuoIV50Eu7hAcJ5mULB5Yp7/8p7dLDx+P2dONMzMWm55+TsxxYvZdeEVo8DUToy0RcDoGox3SzTHU8QvSZ67F0IK2CQj06vVa7v6LLS3WIAk6haYm3AkE0nZJ2R1d3rdR2ZR60mdrdMaJids7d4tq0H+bISpvd/Pdf+fq+rfaIrg+ZOe1W19IjB5/rVc89r38sVPfpSl4WNMDLvIUwv89GuEP7n7IH97dI5aOni/oNyjoosdQjDaGi0d/M6fPM6H37eFS/A8fXoe36moJiYJqueshY9VTooU7X3T1u5KEI4cPcOt12/iL75Q47rKzofWEl4tbLENaaVPqI+yvPN8yrIk5Vl2m2WdcYK1Dgmog2yjngYTcz3+y+fO8IHvvZ4n953gH0/OUtlIaPrZ3CoSrVm9p1awLmjby3usswyTYHXQHhsDMhwQyy6hskr+CyknACUxNpShxllNBJJYGtSFtTsY0i8qjCuww76uZ0UBtiDklnUU5c3pdOUEITVInnCQssT4Rh0SU6F+MtZo+00MBQ0+FiA6dWMdStZPHox6DgQJ6kFApFMLw+VDpKakzwBjN+GmNs+S+ltYOHWU7vQWHYcoSmg8xrbGJy1cKqTk1ZYwZrZwFFwcEqxV7kCsSWK0r2ZUuEKz9UgUS5QwYnJiVTTGJIUurSiQFq0yLR0NyRRZG7pBi0CTWf6iimVOvZID2ru0ZFlLkyikwCdBRG0wQ9VRm96omgApCDh98cWV0NS4kK1SlTZJlIKXXNhj/zMH+fpJkOlb8H6FolU9LFTe0QahHYI1xmCyoEQTdMJh+eBhhiFhigLT6RCyKpUghEate7/nzbdz/NQBJm0HCkcdPYVo0lXHoCpuE12MOIZNjTE1djhg6AoGK57HHz/Kgyd3UJgEUlOXFTYlpjol/WGDRM/7dz/KW2+/kLs+/yVe9oqX8M0Hvoib2cPVr/tZup3zddFoF9GzhFfaAPn/MzFIajEtxmApORMCf/r5b/Bn//gYR8/0mZwpeMtN1/K+N15NrxJSMHgbKeLaisrkIGyM6HhN3kYLqqj6o8jYwprlPxWWXFuNGYUM2oNcc8jtV44HGyBLebbVoU5mKPnmbJLa8xK9RElKShAULrjhezn/0lu562/+M7NTfYpJy4WbhV96wwK/+fc1D/W3UNBB6gFNGGC6c9iqQwg1PjqKkBeXYR9TqAOnK9Tlsez28EErn9JaalYogtqYpuD1PIzepxQC1jqiuDyP7RiurOAixDhkZWWR337jLFecZ1mcP8KR40tMTPeIczew/ZYfQavws8f5zg6GLVs+0jbP22mNlBLtcH7I8Peqvn9b6bf9+RZdMblfrolmlpoh88nz91tiapsAZFRJCVvj+pKSxXdWVSfT6BkZVxg0uS3QGgu1XJbRFtPIdrw9vzY5Wb+tCfYxjY5vo60tns6tJJhJ6L2dvPr7/0/m993LI/d+Aj88wtFvnuLNN8zxlslZPvgX85ycnmEwqDGDZVyRW6VTk9j5RYZz27jnrofYdPnr2feUOknGzhyl6xPzmLXIqu22zf19UzeUXc9tt5zH4pkjSNPQl2VK11OPFAM+RkrnIKrmTJyewdd9Or2OFmfWUlihGdbQCD4lJjoVde2pioJhTHQl8PW4mzv/7PMUs5fkwCyq6RIiMTZYcURTUkgkUNDYMpMBwXiPkYKYpYjFGcRpAim2VJ2AWOvNtgYXtci1zQrOFdRGEFEVQm87FAghqqtgMDYTzg3Rtt4A2m4Rk1vVpsjH6/CmwCZ9Wo0k5ezQqAIvHmm0hYFUGKmJMek7LoIPUQnpXu2DrSlYMg2bL7wCHyqGZ06yMljB1cERU6AzOYEtZxB/GkEVvrQ3rx1Na7K6li1UVzn38AGiKUjBY23MrQDRhWMMnm0DiE0QCqtBPzSaHBhdqJJvMCap5KFY5QKA2vQaHYFQd74sc2hLXErqSdAen+hLDhEvXg0gjMMmg3EJfCSV+tILFlKjb1XwGCf4TDAJdYOpLDIQXnRph1OLns88WmBu9FSlGwVBa1Oe9ddrIynpaB2JFNS+MazULH/rWxTTm4gxqr92qT2pKAbX6TBYHvD0t/YSSNiqgzWJGrBVQayHFNGQTNTeP0rE8p0uZtt2uiHQX5jn2ivO448/WbNp2wUsLCwRxbFpuqNT2QuWD95+mCu3B2Q4j6Xgga/dy+YLXsrVr/5JsN3VXv+6rb13Cmufc3059zZGVhLJMCuOlQQv/7GP8MB8B1wHig40FRwJ3Ld3Lz/35w9z244+d/7bt7J5y0yuJLI3d1xVAWyTkpb1vSoXfLZiHBnZaseBNMBoW0oRg3P1kscDf36m24rPAMmO6aindenDuSv/DS9Xvg/WCEzt5CVv/VmevvuPOLL/Lobzx8DX/Pq7buK379zHZw93oDMFAw9VQSgqTPI419XRLlCmdQLT6apkr1fjn8J7vI94q0EpOm2vGZ8RuryAmKQ8GylRI5T+EkVUfYy6Kfj1t/Z48R7H/r3zPPXkAa67/hrsju9m1/Wvzdc6bpBMnnXWo3fqrIo4mdwayGE6y0uvGelMY7mbnJW+MRr/itlgiUBMuVAZ43ToLVoL4asuAKPoK+uD+th+RoTBc8DzmXSy/obr8Y3pCYxaEO2I09iUwci0KjF6B56LPzH+XrfmUpt2voidiwMOPvVX2ImTnFkIbJED/MYbZviZLy3zTJjW8y46DJsh3d40LjV0+vPcduu13Pnne2nkSiampxlgdDY+BFxAK1KrU0vOOXwMVGVF0xT8yZ338+rrhxRVhN4cDIeK6KIQvE8RJ1Hbs8Oa5cOHmJiZw5Ulvokq7GMSUlj8oKEflRjoM0fINR4vXS675mK+9skDOLmMiCa2xhhMGFIPh9gKGlNSkqWAjRB9g5cSayLBByqnhYVHsBHcYKAjgll5z4YGJOZ2gsNgKQSiBBKJSI3D4uqGJgmFjcpzK0qsX52YSOJVgMwVGvdCpPCexiSMSYq0i5AkYXyjI+GFIxnVybSxpklG+Q3J04ihiJ7Gh8xpU6JwRwaceOYQPiTmtsyRrMWJCL2pWfYdeJKLdu8AU2SYJUCyiNFxs5ilQQGMNWqzKxZL1BfJWGJsiKbSnmqWG7VW8HFssTWCsS47gmUlN1HmPdGTEJyhtTkmREGcIFFnjK0kTHb+QxwxJGJRIMGrf0Bhs2RpqQzUVg/ZClEsqVCJVqLXlz85jAhCQYhDrXRixGAIzYBUQ710gl27LuJys5MnJ3qkekmh6oSOd+Tq01ggWcqyxHuvzP1mQGENdmqGsLIC2YYzpKQPORBTonAVk90OfbGsEOgkfQmaZKg6EzRpoJae1lAPI8FbTAGVq1gcnKLTnaC0jgt3CE+cWKSby/hmcYmQHC8aPsTLLtvDsX0neeLos1gTmD7/Oq5+7Y8D3cxZOOcSMrbIfDuErXbVWTu/DOAFdr/zVznRn4GwgkiHNDcDbhKGK6SFQ3BmhXtW4IKf/kue/fAPcN5cSUp2tFCOerIwSgJyQ/c5hVi0B60iG9ImBEaTxvZ8NYqMkxPb/bT7XkXGNPAYILC2on0e2P9c17HdZ9KqwLlpdt/4Nk6fWWRqepGV+hQhzvOBt+7g6Y/v47GVCynLSRgMCdHhRLX2XZFH4awjNOp+lkD1JES0vRaD+nTkah9x2pu1uZI1oq5mEWzwhNpjOhNECfja8t5rLHfstiwO+5jpkqm5OebTxdx83Xdo77JFX0agzLmen7V/X3O9RtdjFKaBOHb/2kQujRCDdVd69U+yNj3b8Pq3Y32jY1htM60mC2lNEFZOkqw5zNxpPGtfa6r48fciKV9hQ17LuBgQq8nOmiSADKE/jwpC2xK46JpXMFVGvnnPn7LQXyY1i8xs9XzgxZv5uc87FqtZpBnSKyKDwTKunGait5U//vRerrviRh55tsfywhmKyQpnrbaIRMdHyfc4oq3V1CuJ9YArb7iCo6fvx7pJfJGIg0Dyqr9vrcU6QwpCPajpdiLDYY0ZNgQ/INmSJmTZXAxEwQ89TizGKoIQXIGpulx19aX8cHcTn/zYgKooaBIUZYFPWnSK5NaOJEhBW8pOFWFT06dwJSlq8mRFe/6t/oYqGOoNKGOicY4mlVgRDEOc94Sip7lerDGoWyI+ZXfaCDRQJ5xFJxxGlsKqKuujIskBGfFPXVTzn2QFiRGf3V99anTiLYGxFY6gyUJu2RES3kAtFdEZpO4zf2g/bmYrbriyQFg4zdbtF7NcD/A2ISZgo9r8tvD9ah829xpbdcDkMckTg8FYNfqII6MfiD5pf9+aHFgjyWd4MXgkGhU4MJJfukCMECXifcBYQ0hBRwXzshvzpICkANYiITOgswaBi4mI8hTEtroCetHW2NGKUXZzEvUVMJWOPAJSGqRxpGLI7p3bwdQcCJ7QBIxYDJHQ1IioqJGIEMIqmcwkNe4QV9DIUMmLKDcidnpITJj8Uvs4YLnwbNq6DVP2sfv0PK1zBB/zsCTaTmlUr9pZnTVtmj6u06U+PM+//IMD/OZ7buArn1IRFyEyKBzvmHqcf3lzwUNffZCl2LBwekg1dRU3vPrnSaiIxDjkv27lGVu81sPjLzAJGDGr1bXxFAP2vOP3WVqsSFNzsPtKUmW1hZKAbgc/OwceePrrNIeOcf57/4B7P/i93HL53Bh8qtW3a+SMAAAgAElEQVS2QvDKITHS9mlXJYDjWMAZ9W6jBhBMK9LTns5YkFlzPZImxOOlomRERFTLQn/cVqzjhLFVIZh2SmA9M/ysS9Z+f4ogQjFxHre98QPc99nfZenA05jlAdUVN/M7b+3wa5+d5wuHJrASaPpDUtFF332HsZE6BMoiHwfgSNQhgjOq1NZfGl2jFEMWO0uYkP3dxSIWgo+YqqDvl5HQ5V03LvPD372duz77KWa2zLJwesiVL/1Jdlz1Mh0jTloHMd6CGT8/zpEcxbTm0Woh8hZxMQiIEPMosREN6WYs+GmAYCOdnHyP873M2g8Ca4LsSGcgJkU0c0WS0lj6kFbJiKkNKmOnMp4gkNsKIyQkjj9nlvGgPWpJtfPpo2My69CDtrAaRx02Dv6SleTGeQGJxOxlr+RKN8Mj9/0hR+b3snX7FfR4ll+8UfjFuz2LpstgAL3ZKc4sDnjPazvsMC/nB/+Hp3IV3ZkSCoiDOHKILJ0hpEgIqhxZOXWvSw5YfJbtm6YpTaIZJKTqIayQvEAJPgqlrahKIfR6bNl5odqnh2X8ELqzWxSWN4ZOr1LOFRGC0fG8wZCqO8Ff/OV/Y+fWWUy8iCYo8ui9JxUFdizBW/VWUG2bQILokKTPfxLJ7HvUhS8EcFr4ppQYDrWKdyapxG90eAtVbPApklypiEAAWwjeJ2wzRFKdW+pZVyAGwBJcy4VziFeibzSZYJgT9/YJL40lRnXdFUTReQmEZLECJnhSTFjrdL0L0Ol4iskLWF4+hulO4KyFYm47p08co5iZpshECbEGK0b7INKORmkQNSaAKUmp0ZG8mFSa0esDZtxqNm5EVIQnZzTS1KRoMTaplK/NiULwlM4SkhoOOTHgVPdeVQMjIh0ckEJfezoIEvpKRGzHFEUrMV0rPCEZjC2JPqhSWVCSnhY4efbXqm2xRdSpStAbZQpsWOH0/AqfufsICze8AqkbjGuQBIVYWq/xKJppBYlYTS+JjUecZaIzxeGVAaHfVxU1o5LaoXVlKzqUacjdDz3B1moFx3bKsostSgahprAO49II7k5W2dguQDM3jRw7SbljmpN2O//pi4tM9aYIdcFiv+YVsp9//fo59u09ROxto/QL7L7uZVx1x3vQN7I5R+A/9zYOg7+wz6+KlJyoG3a97cMMaoM57xLYcUleNXMQTgnQEUechz03wunD8MxT3PrBv+KzH/guXn39RRlVyEHajJHw2umSETIwVnXSfkZG56AfWx/sx7Y141YNbQ94bUIEYsbIiEn/L+XzEYwmN89xydZXxas8hjzyRSDFyC3f+V6OPX4jj3/1T0l7v86Jk4f51Xe+nV/844f59DOzmEpwwyVkclbPu2kU0i8LVR5DWx4uNYQQaUKj7b1GnS5tUSDWYTHa6vMRHNgmEqoOMdYYn/hXN1pevO1xDh4rlOltN3P9a97N7Pm3kZInrkdnErkqscQUNzjXNHYdQMbhdIlnweYK6baL4WpPX0NOACRXdy9wvn78R+t69IrEsJokjJT9NNxKfp42avCM0ACjqIW0P1ijMRFGyUfKz7VpVeLGAQLG0tOxx++FvInr23sphZzvWrbsvonbNs/yyJf+jIe/cT8uHuH6V13Lz8Uj/F93X0Sc7LFy5gQTnU0cecbyM/94gjQ9R294jGFZIStC4RSqts6RrEUaGZn4JCuEIMz2LBdcegEPfO0RlqJgrVGCdlGRSiVxhyxg00TPpTdcg4RE3/cpqq3EwXGc0/NOPoAxFK5DIGZvDEdROPoYCtdl09x5kEodUXc60xZb4aQYVGbeapGgfhhCNFELPGvxRuV/UxPUgTA0ek51TRSd27dOVBa/UFGhJJEiGaL3iFOzOpOle5sQcCKkoiRhdHLBR6QoiWKU90DCuIKARUJGyE3EYDHek5wmwMEKDAeqj2IrJSumQEwJYwstug3Zwh6S0wmY2W17OPLM05x32Y0cP3EYJ2KIgz7BDyjrWUKyFE4DZpCUiQoZ7swnaKO+XPrQq2uTzsxrspCS1TnKApqQMK5Udn6TTRVK7SkmEWyAJKrF34SAxVKIQ0KgQSjIugGo0Ecj5EVEEGuRKOp6loJqMjshiFWHwGhVqMRoQhPbtoSzWe5AWxlEjzVutIDHpL2XRITeBP1mhR944yU8dfgEvrwQGwN4rwz2lHWcY8xJT/YWdxYJhuA9/eXTSL9WydUsHmRFcCgFRMWQSrZtdlwyF5l4YkAtUwQfkdLReHXfIwaIAUEfpqJTMVtYFjbNkBpPjJGvneoRwoByostP3J74n2b7LJ7ucHIpMjtTsuxezFV3vBtErSzPXj7WgJbr/v2FV/4JRlMhLWfq4/c9wnt/69PEYYDtlxM379GFLzHWJsg2tl7HALEJNm8FJpAn7uU1H/o7PvX+V/Ddt1yaoXzdwfqAvGbH+VjaxTxlFreMZvHH2wgy9rusawGM66/rcpyiKKxHWL0qRtsLbbBIyWRSmIy+dpUvkL/9+YJUMlooUrL5spczseVCDj30R/RWlnj6ibv5xR+4mf7HD/HVgwt4O4WJiWZwisJUWKffH0VlROu6wYi25xAh9SPGGZIH8ZEotValKSBFqchWaZHgWU6G990xzY++ZhsPfL6gOXWc6dldXPP6f4ezc4jJyMq69gs5qI/zMs6+V9Dmlm3yBOMIgX4mkvKoaBZ3Sll9NHt4KCGwTTKEFg3akLyaDCKtfXA7T68BeJSUsmp2g6znHqScWLXVf1oN8owFdYCoomD6HGaV1SzgMyIBRp051+Pyo2NsTz+11Wsca6VE4Tn6d8+5taBXZ+pibn79T3Hv332E4YkvMX/gMeyJp/jImy/m33/yCIe7Wxiywl/NX4ifPsVkvUQzO4MLRiWom0aTEqt8sISiu0kSQQpcGLA9HqCzfIJLd04TDxusy+9k0aEi0fi+ptcpUhjHga99hQtvfwm9YAjDhmrLJuoQKUQnoLyx2K7FJB2VruuGJniaxWUmJyqOHd8H9jKkKJQdX6Cy2Pn5EhuxKZKcJXhljpEaRbskAAWxsITQqLqsS4RkkLJQ2WA8ErW/bvxybm17rDUslwXOlToNRlAOjc1z+SKILdEWmydgMFWlFsZ5iszEBpxWirZlSVhDCmHEN1CEW8W8EozcGC0CSSWAXXbDtQnCZKB/5iDzR59hZtsFUNe44aDPVKcD0rB1ZgbLEj5k8oJRRnBOffOLkd31/DALBImy8l2BjxaX9ZOjrREKVa2L+nhr4K5hEJFehxSMZsJJTwynhiNYdGY/ejUcSg1IkSu9gASHlYh43XeizdQdxnui8hcVfciZdDSOIgSF9ERH6fQh0AtkRIO3xEQ0Rh8AnyAGyrJkanIT54lwoE5QOmyhJkgp5fHBvBgZBJ8i0Qet3AvLyUcOIgUglY6RmLZStVhbIg4siX94dIUrXt3hqknPA31DlTULEui5Z/OR0Kihkgw9tW+weFJh8MMGVxlKmeQd5QP8z1du5sGvPsmg7lHu2EGYvYrrXvQOYnQYGW+H6P19gcvFC15Yxiv/T339Md7za3/L8pkaueBq2HQB4mR1cWxjdUsSTIy4FUQHMx3S5bfDN+7lbb/9Rf7yfZbX3X5x7pu1DPOzj28c+m9NWjY61dUgs0H/dc0HW0Qgi8PkJEQX/xzoYhaXMWtn2hmDj823cS31RFoSXcDiqGYuZeqSN3H8mf/EYHKRpcVT/O/feZqvfGuOD92n+3I+4KYmSUUiDhvE9wlRWwDWFGpliiWVTpnMWevfosE/RlHkDMEYS9NE3nTBkB962SwP3/dFim6PxVhwzet/HlvMroHpx6/rxgnWmou67h7kqho5B6CdIX4yCpTalkrKgd7lBKH9bTMK/i3CkPfS/nMuMlalhEeJR4sUtZ/NuP74ubSkwJiTPEmJZBwSVD1Rx0rNyGqc1ECeVlo9plW519WtoB1/1XMOGWlqExFdRyS3RJ5rAmCjrSUEkvU3EMNtr30/D/1DTTM8ydEjgQu2f4F/cavjP3xzjjPFVh7b9wTOCG5qEyKRqlMSGg+p0AKxVqW8WhwmaCtXGs/AdLhp6wT3Pvg5no7XY2s9HwpB0OLMBp3sSCHQWEvZCH7Qx2F10iso/wwsRVVR+wZqjysqGkm4TkGztEKyjuFgmZtvvZbiMwr9m8Ip0Ceiy4rLZnRJiCFlL5oGkwl3wRiciaRoMMkQDSQpSSix3BUCdfusBGzTaOILROPo2i7eRqJoi5ukEL8xks9BCK3lsfdQ90kugK00uNNgKZRD0baCRFF0fI0YR2OVdFgK1OKIPnt9BJXUN3mNStZgKEiNw0xu59Kbd3LywOMEW+FiLFlaOsbWXVdyZmmRADhKzYpFSXsKv6OqYCEpazj3cyW7I+EDxliVHI1a0arKVkvgSdmMoUL8UC1+0QpsNDISGiKGFOxI6lGCB2M0IwoBMU7lf2NUhcAUVX7YlCQbEVNgyIYnAhhHCp4iX0DJHgYYXdRifgFing02JhMeE0jhGAblJDxwz9c4XlSEuZ2kuIxzaokZUu44i6gzleifJRNFjHGszB9jOOxTlBZT9ki2JMU8MZE8IqoU9eVHFrhtS2Jb0yf2zlfRpeTAlEjw2stx2Va51utiS6MiF3Wf4Eq8D7x2ei/vum6Rez77JJfecDsnTy5SzbyIS257m3IDTFgXAzeqnP8J2zhcngwI+JD44uGTvPOXP8XyInD+daRN20f91NVKWzJ/KY00IhD02UoGTAmbLFx3E/7hL/KG//vzvPveJ/nYv3mljvXELMazwabJSFolBrbyz2O9+XFNgXMWU2sW2HbBXvfhUc93LKCZBDFfG6PBTYvFb49M2WoUpKQ8120XvQj3phkO3P27PHrPF+h2J3nZVbMcOLXEf3+qw0AcKazgqmmKwuC94EwkNnHUEkmj4GnyeUcdl2rnpAtFT2of+cD3TPOSmaMcfOwhjjz5LBddchOX3v6/0XE7SMnn0cfUZkMjnsN6EaWN71C+eIx+/Xk2QS+mrBbqmDza6TPbvr1feUBvhBboFIEBkvH5T7mHL7A6jbDO+llkBN23qn/tL7VtGiOOJMpGwEbq4TJHn76L/Y99lrmpKZYXjzJ/8hTdTsHU5CxnFuYZLg0opidIAitLy+y47Fa63c2cf/GLmdl6CUKliz9tK0uTn5T3t3qOG12msfdx3XbW1E/SUcfrXvk+Pv2HP8PVt93EcoQdJvGTNzzBL99tqCYmSVIwwDDVsfiYSIVFGJJ81BhgoHCOpvZUtkOwsOIX2TPzTU51ruPPPtMhzmhla5IikW1xGeoam8CEhmLHTspuh9R4KCplxANJDN4YiqIgRlUJtYXD+0BVzbClf5CX3Xwpn/jUXrxcqkz41iXWGE0uYxbiCeBSrY56Mce7BNY3UJba808Nrih10i0lTB4RTFYVcFId1Rkz+wo0KeL8MkZUdVMVbtHJhayzYaTIBX4idStICes9ySZiSqpc6PuYoKY+ZYo0rgBjiFH5DlbUiyKmRJGJvDEIplRFUisleaZOLeRDwAxOUVUX0Ns0h8gMbnpmEyfnD8H8UTq2h0mOREPKWVHrR2xyANWgpEp+BqsvgTXKG0iMhH9UQcuA0czESCImg7hCTUhy/11k1SQjpuxAGD0xtqOACnsHU+CUjLAKL0aF0rH6Uksm/sWQ+0tRGaNRWH1xnJIGY9IxIM18o04nsEq+QQwherqdCZ54dh+vvvVavvJMzRP1qrlDiAlnVxe5oG/VqhtgNjxaXjpDKTouaCRSGKsyO9mMJcSETR5fzVHPbufluzx/85WjDKe3g43aVyoLLMoOdc7QdrRDXeOHNWUxSQzHOS8ucsfEY1Q7Xk51sGZYn+boYJZXv/QtwLlFbtatBO3q8RyfOdevtounBshTTeLdv/QJFuf7sOcWHf2xeXFOSbUclLGmQX6sRs7ZCq3bk0RHmukSLrkeHrmLPw2R11zzFO961eVjEO3GC+HGlq6MAnG7vbB+8Zpu7OjPq8FOFGFJuY+9ChFo35E40gl4oRMVG00RCLBl6xWcOP87CCc+yenF41yxaSff+4r9PHL0MA/HrYQm4aLPbH/Tfhkp+ayHgV77nHhFH7A5GfApkAYWOgV3nN9w48STNHYWj+PSK67kgtt+jO7cbkVWMllxw8v2vAiAXse1hMCNn89WF32t7XImyJksoNL210k5qI21WoiaT6Y2U2t95iGt2ef6e8qav496+3kNFLH4ZDF4/OAo9/3DR2lWnsKKZXJyGrO8l027XkXyQ4rtjoneHP3lM1g7ZPflFzKoh0gMNJOWzb2GU/MPcNfX72Ri9gKqufPYfekt7Nh5O8lMZsTBrr1EG1X/365hV16zxXR48Rt+nCPf+gQmLtOdnqP/8Od4x7Wb+f1Hp6iqDtI0hKqD9R6bwIcGyoLUaK89icEWjpg8KVh2xtxmXkz4uV3ZebIhNEOl+5DwocbGiGqnGrZffjF+oLwb03MQIEZP4QrFhqzVZC2qRr9xhmF/mR3FPMePPMt5F1/H8OEFKrRQdU51aZTSH5RQTVIiOq1WhI6fWyAOa3Xya2WORRNvajXHi0mfGR1Lt0SfCFYwRUeFh0JEYiQZixNLEz3GdRXFiXouyWkMMtYQM7JkCFA3uDZBa5VljdNqvtCiDxfwjb63NgaNl07hfz1WR4g1oPbJ4gUfukgakgIs1ydxPkUu3LmbpeECvi+IKAxCAl832CKN5hWJNV50Tp5UADEH6/ywtfCWcRBV4z/gMbaAEDEWUgjqRjZU6dxUqPxjCGk0Xqj2x5kBbRwp1tgU8WIxJiv+2YqAhZTdCfOrTAqYwhGiUROhiEpTJqU/EVQdLUWvL7zog2SN0cXPGaLP2gfZofCaF92A+KNcNR14bGjoVCUhqEpdyr3l0UKRkxlnC3wKGOfYsnM3i08+iqkFVgbIzCSltfpyiMVaQwyW3kTB//vpr/PmD97O+1/W47fuN1QpS7wCKdRUpaNpGnUeFF3gbFVi3DKzK2f4lZsfZtvO6zl66DjTmyfYd3KC17zt59FXrGF81Xjuyuy5gtK5E4SW7U+CQ2HIS/7N/8OBJ08jF99Cmt2qHwo6PYKPbOUEK6efoe5eSKg2E6tZWrvNtV+cyXBJYMd2sC9luPer/OjHCoZEfvCOPdpzy6z7jRa/NklYPd9cDT5vAN6oLdD+bC3cTUv+y0qYRudeVo8hw8SjttUL3NZ8duQoqHu47Mbvww8M9szfszT/dZ595Bl+6i3fwb/9xEkOpZLh0QXixCSuUolvnVgJGYRWj3JrICG4MsPO6oqMrSKT8QTve+MlhJOHWDyzn7JpOO/F72Fy0+U5+OeRoxd8DudOPpVXpDwQOYtzwbqgnx1F2157u2AmUHa/6Jok5AJEr51pkYMMVmQFiLP5Hxtd+7GfCUUGFzwheR7621/l9NFvsWPHLCzWeG/Zvn2KTrdHJ5zHmeNPsXD6OL6B/uISTR2ZmnEc2/84nWoCV9Y0TWTlZIcwXODSKy7HOMvy/FM89oWv8tT0H1FO3Mitr/oRkptGUY3MN1mPAKx//jcYxR3f1qgGJtiy/TLS8K0ceeJOVpohW3ZczGXbz3DyzBKfONRloipYkYZuUZHqiPS6uKEnmZTN44TaOCrvOWMdL585gnjD3qUplmvBUFOWpVrsDhrqGHHSEEKgEsP5117NsFshMWBDoBl6NQFqFfvEEEPAFgkxqgarxEDh5i2befTx/dy9dB5VZwadLtKWlrahPQTVtgkp0IjREe6QlCgYm1zRoy3umD0DrNXWTjKEGLAmT7N5oK4RV2FNSYh6fCYXp0nA2xKTtXFMAIwSx42xme9kQeyqCZ5xpEYdDL3LqratXT2JQMA2QmH13qcYEGcxKam2jBH1DRCTkXNBLExt38bx/YeZ2bGLwTP7cUuLK2D6FL0u05OTmOEhwoShMDJKBFxRELzHYhU2y2pPKQnROmzwCKJ9fuPwSdn/Igmb1IygzbgwiVBHzW5SIkZlZhoRpGm0ciITcSJEK2BLpatly1NSQ5QKCQ3JOg2EIarJQ6yzqE+BiLYkJKqAjkl5qiF4lMnrRgQLMtEnhJBbBTq50LHCx+58gO85f5GDC1PES2oAnVm12l+KANklKoRA9BGsoUjqQbBpzx5Wnn4aKYUwXMHlIGTz7GyMkbIzQao9zdw1/PLvf5lXXLOVktshOYKvqVyFcSWIUJTao22aIU4sAQ/Lp/nA9Y/x1CPPsrQ0yXA4ZLmc5TXv+j80QTP1ah9ztMxl0tNZi+tzbedYvEfyvAqlHhz0efn7/pB9e0/AnheTNm/LfTDdMxSwssCxj76JWjw//R//hv/wlceJvZ3Q3UbW+NT/JVndrVFNiLRlG0x8F8P7P8d7PxYwwA+96soRjD/ejtiw8jRJx96FNZ/59jQO1lb/a/YVNbGItFMJ5nkSrufZU2p7vrnPnAOlYDCSuOYlb+Nrnz3C4olvMrV9G6efvZ+f/c7z+IW/jpwWQ5dEYR1NqEcExMYnnDFISkQTkaick5gShCFiCoq4xG+9s0tn4SEOPH2A3uwMU9f/IJsuuiMHDXmO6/w8fIqzzi8xIvFl9ovmSz7/rAXzLa1Z2SpLwDBerbdeAxhGhMwW3k/tWDCMyMyrh/kcx9uiW+hiHCMYjvPVv/soy8e/wWRZ0uv12L59F014kri8wtEjQyZmHZ7zmJ7ew67Lr6LoTDE3dwEDv8yRx7/BFIapyTkOH93LlrLD0YP34pfPsLTyJKWJdKYm6U1vZlA7As/w4N/9LHZyD9e99CdItkBUt3ktSvRPtOxu/elFDFt3XU09WOL0s5/n5PxxTpya5/tvfglH6ye5q38l0jgCnmQi3aqHxxPIjqViVLq2sEwPTnDTjUvsO7GDTz1qKGxCKkcdPMWwJvSXlQMmgnQrYlnSTzWblpbV7KbjKBLEoH12YwukVAI5sYX/PS4MCSFy8Jn7eONlL/7/eHvvcNuuut77M8qcc63dy6n79JycnJzkpAMJIQmhhFAiItgrJYhYuPCoPCheEDsoCl68FBUV9b4gIlwVLoZmCoH0TnpOr/vsvlebc44x3j9+Y6619ikJ3vd53vnPSfZqs47xG9/ft/DBz4JPHMamVH4fwTtCUWITMQ9S1pA5T15Km9sFJ+FDIeB1dCR0nmA0Rkk7WXhcFuWCLASNAl2LltUGq0OciwSZSowlNwpUJkE+QcykldYEhxD1XBmNZBASqdWCZgeP0XW8DrhQkiLzqourfKWsIN1pJhHFIUp3fejycZQRENV3HJ1WwejkGlS+TOE6qMe/+5Ewt/9hhgdrNBy85jMZPnSwNiU1NqbkiUSBwnWrIbwEOZQlmCiPUsRVrbG9lbwO4tevIRQluszBCNkuaJEkBdWDRYFuVa+VhUTJWBrvbY9I+JROCVEDaWOAkFOgTSon0hUkcdD1OkR/eckjKKr2hRIz2aqA1sZ0f8g7SYorXBvas9z8rlFOLC9w462b2HLWbtLaANrElkcI+DJ6HygpkCpPAKMgdzB71wM4HG5hjqI+JAWEEpmMI+BUoGZTXF5QUwv8w3/bxoOHMz756Do6y9MUWlMfGqaWJgQHuW8TSkdeOLLlkl/bfRdXXfl8Cr+ao0/fzXJzlJ1Xv5E0mQRd9D/idElF3QFD9/TKnDxBnQx196/++wb4qp0S4LtHT/DDv/o3HD+ySLnhAsL6rb2UvCCohfYG324z/eHnMz6YooFP3/wA7/z7x1gmgdGt0I03VT1CYCUJU4DqoJYLwoPfIjnrHP75V6/mB3ZvkJrhORIMV5DTgCqeuh8N6Jm+nPJpnm2iqGRvsvIPXZJYWEFIjOf5/2KgXgFJ95m/eAJP3vNVFvd+lTRZwumMuYErePcXnkabhGRghLLM4+fE7TMEaU0ZY8B5XFESlKfwjnpb85F37GZLto+Dt93M+t3Px+tz2fyCH8HHnv/ponyfZc+7e12dhR5bv7pmeqWWvs8iN3Sh/L6UCt37bMWIl8TQ6P4W/608AXq8E0FqNMSBVMe/VUXamRQDor0OGg4+/GUOPfH/4DuBwdooy80miemgBqbwapSxifVsPPfVZJNbSLpf4iPeIDtUtT81PVMqkYhBKDs0jz/Mnd/6JKo8yNjYFMOja5ibOczI8DC509RGt7PryncI8qqSvvNYnaozcwDOtFUoXkBIcIefeoA9D3+axuI0W1cNsVA0+IN7t7I8uYuMhIIcYzK0lRaS1pq846SIDxmvG7mTHcNH+OM7h1lUW8WeO61Dawm/uCDXOPLMdGKxg0NMbduIHhyjPjHSvcY+L4VAXY/WwL6UYtAavNbQaTI1s5e37N7Hffc/yq/ccxlDWtAubYxwAYqcssgx1mJtDHRTYiNPWWKCl0VibJcFI9G/GANeYrFdUaKSFOVy8AodckJal4VxYsELskuSYHwcB7xDZ1lsUxqsj60FBMKvpPcEJcOdlwIBFcTkB8AXGAVg5LVQSgojCk2Q//YiT6QsMUbhQ4kPBqyhbDjuf5fj6J7vkQ2P8tgDh7HBFYyMDDI7P8fEhvPx+SFUJhG2DrmYvvBiCRwCFjHNUdbiyxxjDEGlkqhXyonyroPyItMLXpibvpSTGrRYcToj9ASttRQTWkiF1SpaEwQ5KAJKW5QSnwExcIi3p+CWuCwlBIUJHhVyvE8BcAqISEV3GlNimqCVljnFmMjRcjhfduErHck9ibLktfX8w7/exyvO8WxuZbj6iERAelnhqf7JpK8/WFmXDhvL08ePMBQZs7XVw7JvnQ7BBAwGazRJmqF0oNEe5dc+egcf+oXzWecHOVgfI9Eeo+Xcewo0CabsgM553bpbuOqyK7n/5m+RkcHEGi58+X/DY6AP9u8NbtWj3hsU+vvRK/vNvVVr/2Adh4ru4FL1/O8+Os8r3/k3NBdyiqndsG5T97My+ctHPHJtZ+Y7TAwIxPWWF1/ASJbw1pQo2JwAACAASURBVE/fw8LSERheH8lcMQWs2q9qF1xKGExQl91AcfdN/Oif5nzpV1/F9Reu7u5PiLDv6Qe5uO/E4qR/8j/lEys+/SyvhWpqi7ssiEj3nui+Vkm7Tt23k5GC0/X/u69L9QKAUZZzLruBR/MG049/kaHVg2zJ9nLjtkX+as8IBdLqcl7c0HCxV2ikH+uVkItKJyzj1107yOiRf+fI/LwgcfXz2HjRD0IQnsCp/vXf/4q/9/7efVex0rsGOhG+F1zAdM/sKZuvvBbkPOsg/VlNXP3HzhFh5ee7jPq+fTmtMVGfhXUAXDHPzZ//Tcr2AUZHJhkbG2R2YQZT28Dmy36INVtfTFXcJEomc+8chZJcEhE7R0xDCeoid4OgFjYgUjeTkU5dxkt+8lNoSpbmnua7X/4gozVFkijm5mbwxTK3feknueq1Hwc1Go9BTH9W3FvP0QLovge6hEaUuNJt3LGbI0cuIituYzEoEuX44Gs38uv/cYTlgU2kSuNCiSvABkPwDpsYQqkY7Rzgig1LfOaWYabDRrIgUebBtfDtFppoIGQtJgjMPrJlPWF0gmxgAGcDFF6MbYw4w1J6SbNUoIyiLECrgmbTsz6bZqB1iO8tbmEYKFEkaYoxCYUTcqixFoJ4DRilwNpoHaFwcZ5yZY5KahL45h0+L9DaoUqDNlb8CpQWt83CCHptjUz8JkErh3MSWkdSJ/gCH0T67ZWiVJJoqyLnAKMIhSyOg7bCYXMer8WMSHtB173L0VZa3wEjuQAmk9eDkNKl8xCLAWPBBYILBAyH9z5Cko7SLutc/PLrUY/e9idh8cBTZIOKwYl1XPWnCzhdkDiB69EWrJFsACC4QnrzaKlTY8Utq5yAMwmUHdlZLV77IaTxhDhsRWhI4snSIvGQ6FvV7WcFZSKU4WSVrywVW9TFQkR+Q/WsNb1D2yR6rjhJTdJC8tHayBopRHvispRjCiryDVRvpdm3BFFKYYoG46Mlf/eaRaYbKb9x/ArWjkygE0veKQVu9CKtUkp1SUiuKElif2phaZHjN3+bbKCOmlgjmlDnJDfAGExi0TYBAp1Oh3JuiV9+wSyrzt3JXz42js9TSGuAtFOCKyldwvPLJ3nzpUdpzzewAyN4xtn6wjeRDm7qGwD6We4r+6srbEvVGQZAqsnoNBB5HBwDcO+xGV76zr+mdcxTrt0K6zeLzDIg8H/Vn0eIOyw3ufe/X8wFm0awEf5ywC0PPMn1f/EdCj8G41v7Jv5YBFRU/WqlYwKq2SA89h30pjXc+Lx1fPKXrgMiEqVWrlSfbfOhZxiEUkIuW6FsOLMwjV4p0dvneG676FD11u45XTkpnWmyP3k7/Uo7id/k+cbn30/m9pMoxVnnX8Knvr6Pz+9bTT3tsa5d4YXUbqQIKAoJROm0Fdes6/DzLzmCXnSowtFUW3nea99L1Z6r/Pj7V/FybzzXSnMlknSyTJC4/5WHhI8poxXxD06SUPahQ0H1f26l2+KzoROnvrby/gaZVPGOEs/X/u4nsbSYWDVJq9FA5UNcfMN7GRg/u/s9LhpS5dF7xBpJ9QTJr1fKCJMc4SdobbuoKECilUTXBhdVLnKOnVIsHH2Qh27+H6wZ9hw90WBqsk5hh9l9/Z+gSONZLk5/v/ZbCp9cEPTd590ioquegMdu+RtGJ48yv/9Btpy1k7/6xnG+Oncprfog9ZqhUwXPhDzK9kp+9ezvMteEP7t3I0UYwJaOotOUNqwrxTWQgPNeXOmcoz5SY9PVV+Gif4YKwmDy3mN10k0IVQbK0uMCpMpx/MAB3rHmftpHDvC7j57LUhhGJYIUA3HVHLq25yaIHwfWxsj1UlpfJITgIpIdwAjvzReloNfxvnLaYLXckZVjo8IQrNjyCnrt0Sbtud3G90hnMyKvAbzLSZWiVIGgpcVVtaS1sXL/e1AU0gYNiGy+LFBG2gDGapyLpEkvz4OPsn2vNa5VcPtbTrBwYh6VlCw269g8b7F242rarkPRbMtNaDQhlBDJPbr0QC66bQ3axWhNX8aUJRXlDqKzr7T2pVcYJcxJUQkEqbYqiCRCH8FaNDmV3VZVPFSyJ2NqgiBYG6FTYfBHRoKkAAZBCrwLWKNxTlifYtITSYA6XrhYTWllujr0UK1OQ2UCQveiFtoyMzNMyGpcvTNh7G/vI0y8ltK1o2OiEjsDr7ryxRACNhESS6ECoyMThBdcxpF77mcEITyiIEGy1Y0xYh2sRN7iBuvc21zHb4w2+a533K+msEZJDLHSdPIOo+Uc59YfptlIKPQ48ydOMHXBpSRDG3poa1/PvjvABk2I+ej90H93HDhNESAPjV45aXUtfmXivuE3/pbFI23M6h2ENevEQjMS43qb7k3iIUS/7d7rxjuuvfBsfv78B/jUw0sUrRmoTfQGrH4kQHZWaqL6IGy6GPY+wD/4lOsu2ccbrtzeK1y76POzFwLfD5nt9NtK9CD0wcyKCv6Xnn0PaTjNtTlpO9PEdfL7pV1RIvpyzRWvfDsPfOUP0X6W6UOP8crzV/HIcskzixaUDELGSC8xTWq4spSMdW9YW2/whufPMaQymsU0IdvExde8PZY2rgf8nGbyPqPhzmnP10nuh9XtefLhqui5AF31RLdgFRFu961VpO/J5+zk/1+h43/W/e3d46U2fOWv34Sb38f6rZtJySgmd3LJi3+eLF2FsME0hQwwYkoT2dmtdiFGYHEBU7iCMo4vxhi0cyRG7NdDUOTOkyXRLCy2N4wCFTy1tRdy2fW/xcPf/BATYw32Hp5l7brAnjv+lq3Pv3GFwdRpi4Cu98ZJRcBpEYKoJVew5bIbeOqeD1H3KV//0r/zumtfRXh6hn+fWUVetDFGmOfeBdpZynu3P876fJ6/e/J8fDFM4Vro4IQdXxax/aTQiTwTRZGjA5SFwjiFV57UpDjnKIJYVEtfNuC1wxcQlCJRgWZImZzZz1nbnoYXvpbpR6cZ0JrSOZkHIsocIjdHKTFiUloWpN657t/EVVCuuVagQqCMJHUVLfBtCChjYi9eFnAgzH6FF5m582BT0eUHJ4RBZTAoSidOgS6UEp+MwfuYWKlFqux8LGIR1Z2K18yoBFRsHxkrRL9EUXqPMQneBVSiwAkfSmuN8waCuOzWhkY5+NQjJIOTqIdu+VBQywfJW4vU127h2o8sopxDqYCyCh0sFau6J4GRNCTvJcXJBCTe1gspLxR57MsIGmBjT0uZalI3XcjZBoWLvTmtNZYgVYypo7QQ9kqdkKHJq9/tPpSqK8dAqxiPGB90A8rLTVSRKyAyweMiVHdXM7KiNDE4KHgnWlFTMfsdHaXYGDq87bx7MKXlL+z1rFt3LtopJHc1xALGY5E2hrWWsijiDQaduUVmHr6PwpWMrFtHlg0LiTCaEGnk3KoQKPMOzWabDfUlXnvBAEezjdx8PGHQDqGtIl06zLsu2Mv2yZTGkufE9DTZ2t2c96J3RbiypFr5y8PtVgyC4RSWdf+Yd6p2W1Ae1ftbqCDglFzB+W/6GHuemSWs2Q5btnelLv2wf2/yB4KHhTbffe/FXLJtiNQmK3YhAL/7t1/nD7/ToN0JMLpZHC/6kgVXDGjeyXeemEYdfxImM/7mbdfwM1fvQJH00I/+z6z4wdjzY+V5OuMq6llNlHoT/MrzGG+8Fe/rViZU2QXdb/U9NKn7twourybAPuSm2rcKkTn22M089eCnGRsfYHR4gq/d0eRj+wao18bRGEpfxOHdSGHtHSUt/vz1Q4wvP8VTDzxGfXKA573uTxga29m38q8m/H6UQ61AkE5HBqw+081wOBk9WFEAVNK+2MLrK1Rjl797XvuLoRD6kZXT7U8/6hJO+sypmyKJJiwFX/vCB1Gz3+acc3ZzYnGa9RfeyLqtV6GjFXARPKWXFVjhA4V35K7ESbeLREGjEHS0LGTlaozqHlNiNPUsw3sJO8uMlQWUgsRqbFAYK/HBWgGtGb71+fexYRU0GgXaLrD1BW9lZN11GP0cqoDTPUfPsSmlOPD4LRx7+C+Z2rKJxsIMZcvznu9dwHJ9IwOJotMucRS854XzpPvv5huH1vG/nxykZhNBUFwupGyX410hhmZRo6+Vp9Np8cKffzsLizMQ0VGcSDeVDrEzEecRmd3QBuYOHuWN+T9SSzI+8/BZ3NGZQKsSm6TdFbPRmrK61q6M11XFfrmNE7C07JyLqoiykLktTYWnkAjCQtHBJykmkeulAwSro9JICn6dN/ERXVCRPOhj3LFInKXg8Fqs6LMADkewqcwFIaJfRlBsQZWig6ivPivtAXSUFSpJi1WxeCiDkxZ7oum0LV95+R2gE8Y2b2VxZhE7WE85cWSZgfog+XILpcBnVsx1ov2guAPJoBKKHBsCTqnu5B+CQ/lSoIuyFH1k4TAUwj5UIiN0WAwBXE7QBqVNj8Mbe+9BCznP49EqQdsU7QtKFSIPuJKZ6Ag2iNNSF7g1AikFF0isjrK8IAlVrsRFC87e2CWfs9oK89NHS1cdiYBaXKCMLzjoV7H7+Reza2yJ9Ka7+Vh7NavqY3FVKsx8rUyE+FT3JkqShCI4Tjx+P+3Zo9SHhmnMzcL6GmktJeTiOW20Jh2ox4ALqDnHvuY4BzujvGanYs3YEJ97JkUVgdcPPMqOdZOE9jyNPCf3o1x29dvpyf1OeXq7D7HvQuhneNL7s8djCEqVoFUNHgIRSqDKOTd+nGN75rCTZ1NsOzuSWKD3A3HirwbeboSZP2WC69sJ3vdzL0frr/Ontx1msXUAZzaBKiB6N3QHryqNEYVftYYwMAKP3ckv/uWDlJ0ab75uezx2kf2FSEQ8XY/0jCS208L//fD9yZ9bWUDJ67rvfacedyUZ7E7yWvIyqhZGWPF98Vv6VuMV070ixK0792oeeOQmysMP0xpocfXzpmDtAJ+8z1JLlKScRRTGKE+h4b3XrWWsfRdle4ktO9czuf2tDI7tWlE8VftXwdIn78fKSTesONqVagg5L90aVfW1S6oJ3/u+QrVXQFVFQFU49Aisfec+QOgrwnpcgwq1qD7zbNdcoOM7v/R+RjuP42vjzM0tselFv8XaNWcD0A1/DZ52Ie6KuYdmXtD2QsLKY/BZMIK6aS2tmALhBygv4TO5EskaQKcsMAQSo7A5ZFlGUnoSlLQWa6t52c98jG9/8Y9oLn6dHTsv5eijn2d86kXAwEp05jSPmSKJBe/JCwHfXaidvG3Y+WKO7Lmdg3vv5axdl9Foz/PBszbxzq8eo6VW47I6F9mjDEzfxT3Nc/jq03UyU2KMIS9ycI7gBbq3NgMVcB58cISiwLfbPPq1m1h3+cWY1IoFr5FobI8AyLkC66Rt0qakOa+5pvkVrr1shF/+j+3c2jCk9UCgJn35IM6cGEsterT4okBp3UUFXFQEBG1wPq62y1xMeWoZpUqxNp6XopDMmJALEKq0tJ9LmczR0afAJiiFZARoi9MaoxMCBToo0Dq6EYbuYlErscsOroyIBLhosiccwXjPJzWCl3HeKdBeR48qSeeVXBwIJWhjxQTIe9afcyEHHnuUxuwxWp0WFpUzMDyC9yUD4+N4d4RgEjBijhDKQiYDn4gFoqKbvSz9Q43yMaAAJBlQSayi1gEXFC6iCBqZTEQhEDCxTxFKYUAGY8UYBo01UjEGZaT/owQec2i0gyr51SuxbqziioOSBwwjWc6VuxOA1RpvdUTqhGvrlMiOqslag+xLNWjEC6yCQmUNfuofRvnnHwocPfZNFh5LGHr5mxko52gVJQMDAxEZkYhV72OiX95Bac3Q1m20m8ssLLYYKAoW2h1Wbz2LtJahnMckSVeiZWsZeMeEKbh5T8Ed+5tkAw30wBRb1Qw/94OX8Mjdd+CWO0xMrWf39W8DBrqTfxWK0x0I+wdo4iK8O+71eqf98KtMPNUKpTcoVgPyweWCl/zy/2T6SBu/ajPl1m0oFN5Vvf7ql7xcsP5BSEHViOvv21abaLXhvT/7cq5/0TGu/NDXsIvHcaMbCBFq7X2XqA+88lJdD9RgxwtoPvVtbvxMi9I3uPEV52GUjZ+L+3S6IuDk7Vlh0jNN/tXfwhned3rEoBd+E50CfR/60v/u07Rtqn2tioQQi7Tr3/ABHvjqH7Cw/Chq5iCvPv9S/umeo8y7SaxNY3+wxJWO7QNNznKPE/KcpYUmkzuuYu2ul9CvqKhQipNX+RX0fwrKVBUB/ZwIJSv/3p96RUOXTxR05EzEQJUVxx45JLGN1dtWIizd3B1dFV4rr8dpWyt9qEv1+tK+e+jMPUKn7VmzdQMjW1/BmtU7IK7KglI0222KAC0XaBYdcgcBRRkUHe8wQUmqqdd4rbFeOBRSxmhsYqmlllanwOOxRsKYbC2l9HLH+6KgVNHePIFUKUIwvOj17+bBf5tlbu4IZdPz6C0fZ9eLf613TCghUUZzKkk/NFEtETlcqG4mV+8ZOXXTKC57xa9y35c/wLF9j7B4YoaJVfu4ZuA8vl6uYaJ1givOTvmXJzfx1adLBnVOmg6Qlx1qgxm+NLSaOUmSRRKcAitzhbeajRdfwtDUWhI9IGRyLRx3wc/EscEQ8ImlnXfoLDRYd+w7XLV9I/94B3zzeEI2MEjpFbVUUeQlNpH7RSTa0a3VGkGtvEOnNQnSQUGE9o0KuE6cW7xHJ6BMQvAek4IzmhBX2VZrWcwoaYX74CWF1xhJ1VW5ED21xrkSoxWF1mjvJEYZLfkwsVjRPkj7FC3cROOEPF8V3lrgfJNocD66oHpJ3i2E9O11ijNa4upR5N7grGH22EFWrd/IkQPfY9X67ajv3f6hoBvTNBanSbNxXvWXjnw4wziifh7p30cyRCgdJso9lJEH1esEVbTEPAEfV2Sa4EVyRFJD5y2RfySJROJiu7CotiZaCYt7sTLyegZCiogPpdYSRUy0v5TeCOgI1RsPLup6RN4XHddCQMcbrvQl1oj8UCxZBSHo9k40gkz43mQQTMxKr2RAJuNLP6EY4Ag//vUx9PAkA2NjrBkYopak6EzMHSTRCQrfYWl+gcIlzDdaLD90N5QFxpeQWia2bGcwG8ATbS0Fr4KgKdrLaJPglGawPkij9PyvnzAUxx7iyN69OGtZf/5b2LrrlTJQq75Y2hWD5spBcoXUSp1+UpG/qUhUisYncWjYP7fI5b/wCeaP53RWT8GWXSKVcfRVGxH2VireE7LqJ5KLmG9y7/sv5MLNkyJZWVEAVDtTErDc9PDT3PBn91IGC+Pb4g5W76nIS3HgjnkUNBbRj36H+obV/MXbr+Vnrz5bHvCT2wErDvr7IAueCTY97Wf7UYL+v0E/HN2/kj25bKg2H1Ya7qh4Xk8p2uI+Vq0AX7Z48LY/olh4hlTXWMwu5L1fn8VnA+IOhkL5Bn/7hhYjuuTonv3kYYrLf/RDEAlRJ8v9Tq3mVv7+6TgKpx79SZOMX/n/veOqWgC9lf3K1+n+/VQ+i165P+o00s6Trmf3eUDCze7853cQyha1Qcty2MlVr/01QlA4BQWeZqtDu3R0XGDJlTivcAGCDqQqoe09WVRCBWNlgeFE0pbqlNLlJMIxpAiBpXYTqywtXzIxOAjBU7MGU5TUkpTMiuwryzJqsd/fWjjEwe/8Hpkd4Hhnmctf/XGcFs5UcCVz++7myUe/Tq1uUN4wsWo1e/c9zsZzXsjU1ivI6iMYX482tSefoBUXiRA0rr3AM3f9MdYdY2FpgYmpy/j9+9bQLg1HDx4hDxkd5yHP8QRslhJKF+cNjWs0xZEVh80L8rykdtZaahs2kWWDTIwMY4drFMFTCyU2KLy1NEshqraWWrQP72f7/CPceEGT2tQUL/6raahtwpRjDBtNWy2hvcMYhQkImR2i1bVDmQzKjrSItY7xxUr8+4PH+ULa3cYQgsKXeXeO0lqjIlFQBZnMPTHPBrA+qtCSROSC3bkjQvdO5jn5viD7ECPFDdGLwyYoJ2m4wcti1Zq0glfFWt/3E2+DrFd8QTcfM3LpDIZmGbjrzXPs/d4jjA3XaAaLtcpQ5gUYixoeoVBzkMsOaxt984OStLBKphCTqHR04grKC1SmFMFVPX6PolICKEjFuIeyFPOaxCCVisKrFG3L2P/W0TzFUyoV4WeZyJ0T5n6VuocOwpCl0mx6Qi4XSflASBTOeSHmlQ6VGrGgDELoCNHoKAQhXGgApcWyMcQxTymg3ZM7Jg7vS97+2YI/fWnBjqVnSAw03SzH9udMDg2itSa1mtn5kqVcMTw6zInpY+w7Mcu6tdso04ysNoQuHa4zT2v/PpIN2zCDNZK4r0IKDNhanRRNVqux3Gjzcxc63MIJ9u09yNDgGtzABjbveumKQfpkOd/KQVF3Ner9hKr+AbSCd4UsE6v0IOcdpTi8VHLZmz7GfCPA2CbYuDNqdNSKlV71e9UNS2UX63V3pDXBU+oSQ7KS3d3dZBC7fvd2Pv/mgh/+zIP46UOoyU143WP3Bh9Xf0FYtPgAw0OE866h8eRtvPnjN3PPvY/w5+/4QflMfzugf+I+k6Xqc/VMz1g4nAkdqK4TVCvgOOv0dgWoFBMiTV35G5VMrvutfddckhI9igRj6+y+/Fd49Ju/y7Fj+xhf/xBvuewc/uLegrpy4DN+/xpHstTg6SP7GNn8Yp531S8A0e3z5L1f0XfvPxZ1yvv697VLujvDmTpZkdLV7Kt4X/a91v/9/ff5ynNw6i+p/n05w7WsngetLO25vZhymaAVJ07M8tI3vVPURUqIfI1OSaOT0wiBVuHBJNJnNnKPGa0ZTCydALUsw5CQ57NMjqS4peMcPzGPrY8z23KMjm2kozQ+Ef+QgTLQbOeAptP2DOiApo3RGYmCdjvHJ4a6tdTGNlAfvZx24w5q3jFz6FZaC0e5/9YvsG3balrNBVaP1Bgd38pyewbKgi2TgdlnbuLYA58jd4rJDZOodDtnXfJDDNQ3n+E6SZvJ1kcZWPMKmoc/y8T4Wqw6wVvP1vzh3ZP4gSnqbonQbIqfPpInkxiLQ2ESS6vVAecomg2KMkcPDRFyD4tLNNMWreYidiYjzTRjq4bJD0/Tnt7D1Pg4eWuebCHn+IFDnDDT3LLmPP75Xx2k2zGDNcqWYcG1ybSilg7gXEfifUvJT1Faob2hdAU6QsneieuewmAIFGJHG6PtrSgBopOfMZVc1cQIYMkmwMR+f1lSauFvlA5QGm0sRMl7qTQpjjx4tJfnOsSCwPsSVCwuihytooMhhkRbGRO0FiK9A0MJOsN54QIEAx4rToBekgYNniJ4XK7QKmF0fIwsG2J5aQnbaTdoLS8yMj4WHyDwRhFKZMXufExOAmWTnqbf0DX70dpJ3xuwAZQv5IRECUswBlfKASbk0vNClATGOfA5JCZmCThJNDLSw8A7kQDGE+5BYEsLOCUBERrwpchDEtF4qlihaSPWppJZVKB1gg9VEK6SMCMEbZUiI2CCgzSLOv+AcoFG4TC+xXg9MD6Wc+n4EMcW5nnNloKLL4RtG9fyrW98l4su2sFA2mK55RhKPEuujrJ7UelG7nuwyR2HZ/jK3sM07DBmeB3WQMfnlGVJ2W5SHxgiMVESV4heu6RAhYT6YItXbHcUHY3RGUsNz5UvexNVKt0pA201oZ/UYw1BFBGEU9+jAnESV3RXpl0LSo93JS/8xQ8zv7QEY7twG7ehEy0V6+lRQ2JjuvdvdRNXK7r4tqooOd0WQuB1V+7gtV/7T774pEI1p2FwvEdYrFAGFVGGKA8LgwOw8QL8vgf45HfbvOkHj3DJ1vXdwYxTtOxnOob/GmHq+/rKbo+8H56WrZLDKoUQTPt66QpOIQieSb5ZbUltFXpsC2evGuXwY3dx/nidrYPr2FsOsraYYY17lCOHW2TZKDvOeyVGD8T9OP13nmmiPZNq4Yx99tNsIlPsb7vIM17FCff/+dSb7iQFgO+FQK04nme5ll0/AhT33fb31NKEubkZ0lUXQUhRKtDxjmYnZ6FTkqNpuhKnDL70aONpFxaV5eTU0UVgSM1x5IF/Y9vqQLJ8mJl8GVu2WDc5Sk2tY1VnGrV4IWFgC0vtVYTRjSwqISwrl5PajGbeRqNI00AaTZxKFyhUSaITxqbOZ/bJ2ylU4MBdn8Jry7lnrybvtFm7epJWs2Ru5jBLc/MMjpYMjyacvWMXTz1xPxtXb2Lm6H6mNs5x4NY/p+1Ttl/+0wyNn0dPXdK/edZuu4Kb7/o0Q/oYa9duYdtE4IWb6nzz0AiqrRgcH6XZEKtffBC5HZZ2uyWmaO0myiTYwTo6zVDLSyySsz6xZH6W9XqB3duH8PsXqZk6emSGbVOrMGXOqnUbOTw9SmpGGd60jrGzE/Y/M8R9B05w4JkZpkdqmMEUSdWTFbyOq3NXOllURvRE/vV439du89UiSojmLpQix4utZhPDssRiusDYRIY4L+E9IdWETkti5nUKRnclxhpBqq2O7ekQJaBOWqUuWhab4GRxGxfdWlUW4tIWMwFU3DeUIejQawHqJJoJBXzhMYnBKPDlIq3laXSakGQ11L3fel9YOzLJicOPo+sjXPeJNt4KG1+rRGIao299VTUbSkIQn3286yPuBJQFXwTx+C86oG20GpXehdcSGSx/L/ClwyWZyBmCF/KD0SgSvNYoLSQKjaII4uSnlMIFRUgsFJLOFEr5XKCf5CMBQaC7zk4rZHpKi41jdP0LzmP1ECbM0ghj0J5m91jCD18+SNI4zu6tNVZP1mj6wMKhfTQXGhR5u3sjNRttRkZqzB4+xqaduzi0/wDrpoZptVoUCwVqyNKhxvo166mPGvbku/jA5x7i6ELK2NpV2LpmICRQV9SyIay1pDYj0MEsBa6dvJ9XX2A4eqRFy89x0XW/zer1F6+A/VWQBbY6w1xQvafSpZ8Mp1YErO6qFIVDkg9zYNdPf5CDR3OKoXWEsy+U61gNrF3m1ik/unJ1220BYKfdbAAAIABJREFUNHjgfeexc+tasu41cwQMWpUQ7GmXi2/4rb/iX46OgZ2EkVHJFsD2CowuvB8JY9oRjh+D/Y+QbU2553d+inM3jmB0xmkdA0+nj/5+Jv//qvXqCg5CnOBD32sIuqb7J/fqPDnOSKA8nU8DgPMdHvjqr9NuLrBu3RQPLWzj47fM8JEfbTFYOA4/9TjJ5mu49Jq39ybgU9QOqgdBxlV6t2jT+rRFwRkO/tS/hEAXcYjkx2fX85+5WJRXe2RRhY9FPlQxu3LvV3+sECRACerplOFrn34rY7UWKoXtV72NsTVXEkJgueiwlJcsFI524XHG0PElmowkgxASOsUx9tz297zkkg3UGnuZObCEGp9iZqFgcaHJ2Np1rBrdwszyPjpzc3gzw9q1awkhkKSalr2AsP5llIVCuQUWchhJYKhWo24Mw4kmKI9RloHUkGnNbf/rxxkbHIcsx3g4dqJB2wV2Xvwy1my7munjhxhfvZWxsXUsHHucQw9/lTSbp90oSRLLYrPJ6tWrUd7gjWNpocmGXa9hYtNLulSe6lwVwaPIeerWj5LPPMjE5rNYXG7w7jvPo0QzkhpUYjl+fIZ8KRfI2oFbniPP24R2m9rwGMYU7NrY5obd6xmvHWHn5rXMHniQNWu3cOLwftLaBEf3z0I9w+c5w6OjLCzPo5Rifj5nZHKQ8rhGb11m09ZVrPdn8b0DDQ7XN/F7f3cHraFt4vtiIXcam2YoShFK2aS78Ci9E1WaEzRVYbptb5UKVyyEgAmVcZ3HGyFvgulK/axJ8aHEWfmMjpw5eWbk94xROK9IVRCifJC2ufDPxGjLRU6NCR5vFAkWTywKtLQDlYv8A0oRGWsIwQhZ0OWCUmhD6R15C+56yxGa84tMzxwmTTai7v/6fw+mOctC3mLN1C6u/pNDhFRjvfQYlIpkP9cRyYG2aO8odYJx0uMPrmcL6gkoneJVgvJtKgMN0PJ9UboRqt5cZDsqpURCWDF1o/lBiBUXgInEtiKelFDB+bEaVkZ3mftBgVhTaenRGCOJf4GuFTFRg+4sqDJIMlPpKDsFb7lQ8xOXlSzPP00aLPsOzdNoFiSmydCQpZ6lFKXiwsuv4nv33Mn2LZMMT24kGTDccecejK0RtGPHuVu4576j7Dp/K7NHn0YXmieeOERSU2zevIrxNRMcP6746sFN/PPD+6kNjTNWzxgYGEKZhEwHvEnZmR7ifa9N2fP4UyzPdnDpdq74od+M531l31/IPCt7thVZyvetOE+72u633dXCQ5Aq2LPlZ/+YI8csbnAVftNOyLLqB+Q7gz9DAXCyBMlJy2Bmngd/ezc7t06Rxn0LweGw/OstD/KGa84/hYnsCSjveMX7P8HtM2tot2v4sc1SDleTVneV148IAMvz8PBtjG1by3c/+CPsnJrg+24DPNf2f+G7/mzKgm5kcSwAuq/GY3q2AgBOLQIqBYJvHebBm/+Q5vQ+1uy4lBMz86wbCJw4fpSGnuLFP/xHqDMURhXRL4SwYiKuWhnVa6ed/M94rCf9pf8eZuXtdPIqvipQT/mdFVtFTBQuScB1KWXN2T1MH3qExZlD4JcpF+dZdc5lzB55ipF1u5hcez4P/eeHqWcOZVdz7kt/Q8YobWi1c4402jSBohRbZasTFoJnQpdkJ77NutWKw3d8kXLe48Jqpq57BwPjazFCl6YdAmVeYq3BKEUOmKB5+L4vsHDsXnZsHKbtVzF49tuYDyW6WECZDFd0GLGaQatJspRUgwmGWj1FK49eOsijD/0H69efy+qt1+CVwlBSxT9VI0F1forWLEU+T1rOcvfNXyQzM1hr0QYWTsyTjQ7jyHjBK95PSMaFzxsi9yQojj7+bxy4769pLCzRWm6x7Qd/iV/7XIOx8TqtIjC32KRcbNApcsp2G3yBVoFzxzU/elGDczak5IuHWLP+bL725a+xet0a6iMZCyeWGJkYp3B1tmwcZNXGzQRV59vf+E8uunQbZZ5wZP8TWKfYvG2Mo081qY+PcPdDT5MNG1567SWETot88hw+8Hf7uOWoo8wmCcGRoIW8p8WO13vQ2ve6lUHUEdVE37uno2W9j61lwCsnZL/gIU0pvRbOWvA4FFYJqqVdwNlUOFU6gVACQoB3XhBoVXYIaS1KB1XXpwabgC/RNhOZvtEiGfQqti4sKhp8oU1XEqhUj+BelJ673zzD3NEZcJ6mN6jb/+UdQfsGg/UhOvURXvM/m5RWU0MGxS5hgRJ8ibIDcYXl0Xi8yiA4yjLHRplDGdECVbYpo9OfMPMFPpOTHvWsLsdEM4ZgM1xAfJapmJUhTgxVXK9UZ7Y0BIvUPUECgVzl8a+V9FwIlHGlXw1eVklrwUlnB3TAlwUd60mKlJfvgDe+IGUzT7C40GZupsPM9GHWbljF1JZtzB6foaEGeWBfjko2sK/T5oHvnSAdXUurKBmdmGSupZhdWmCo5tg8BE/PdRjKEraPBl528U4Se5RLNw3Qasyy58F9pEMFG6amuOsJxVOL27i1VVJLJxisQTvvkCx1+OiPtjEhZ+ZQk8Wyw4tu+D2UGYqQaOgjkfm+ZWQcOPtc/86EDKzgBEQUQCuNdxZMwbk//Wc8Pe2hNoHfdh46qUsxESvX+NT0DcTxxlWRA1A9P9UqL2iYbXDf717A7k0TK5wANTD8K5/isd/5ATaOrgdV4pQ9xbXg81++mTd+4SAts5owsRZcnzrAV20R4XnI7+Yw34BnbmVg6yiP/tkb2Tw+hsRmFL0VY/cYzsAHON1rqj/o6L+wncFdMHhFlT3fQ1j6flMrqiCck1fdp52E+7IaHr/9I0w//jVqqSXLEuYbOQ7H5O63csHzXncK6W/F1/Rd42r1f/oMiec+xjO1P07+nRV8ltCPCJz592RuEra0itDp3oe+wdEnvsyAn8elirHV6/FLxyCrMTA5RXBtOss5ST3QWliitbTA0Ogq5uZPsOHcNzCx4wcoOg062nCs1aaRB5xOCUVOoUHZDLt4mLGZ/6BeK5mf3UdZu5BNl76JEAJFp0URoJOXEYksMU7cUkunSJKEMuQM1oVAF5YO8Mhtn2XnuROw6UdYKMdwoUld13G+w6rBQbwrqFlDomSRY61nKKnF8yRaeY/uStUkS0UKQgm9keAecVwUCPvem/4a37iTVaNrKJPAiePL1BJPS5VcdO27GRg9RwiSBLwSvs2jt36U1vSdqNJzvLHIl45dzrHRHeg80Oi06SwULM2fINctzh4LvO3CFpsH9nDk0AL12iAbtq4jz5tMd0ZozbTQacLGHc/j0zc9xuHjkI1bjs166iMZrrRsmSxYajtmT5Rcuinl4u3znFMf5ND8fkwrYWYuZ3F+hs3bJxmsl+y+9iUsLxne9YknuX15E9oGkrxNmaZx4al6znsuQGK6CyetjTgSOnEC1K4ng9XWoILMhbKY1GinuqiwQ+SfKjgx/lGJ6D60RocOEirlwYqfgKIUOWJQYrftS4kBjq1KZWuoEOXpPhf7bl+CqUWvABkDVfCUSkiE4uwcaBSG+950iKX5RUlUzNagHvj6e8PSsSNktYSmSvipzw1SGI9xXqDToKJZj0erNCbplQSTCvyf1ORBzJtAPJDSyaRbdggmQnmuIGC7BApMFvtsDq0sQQeqTAAAr010xZIgnyoEAcQoSGsdEQdJwlL0md5EdCFN0271E5zHG7oIgA7gnFRz2mqML/jAKztcMrCPI3sXcApKNCZZRbvjeHCmyX43xYPNNaihNSy1mkysXk+7tUhaSwgqIc3qeGsgeCFzIEmHttPCuYJyrkPZ6bC0cIjV2TxvfMnZrGocYOOqNnfde5D1G7dy7fNG+dZ+y1/ftwYGBlCl5sZt9/OaG17Gnntupt2oMbLl1WzedTWBUsiQFSQbw2yqHnFl3lRNHL2af+W2Mls9FglaE7CUKF78rj/n3idy8mQUNp8LtawrUZPRX/d9++kG5NMgAMGgZua5+wOXcMGWcayRVkKMpWfHr3+Wp+Zzlj7yYwwNmHhNe3teFSyfvul2fuWfnqDlRwjjZ/UqHH/yZO56hIdj+2DvXYydtY7Dn/4l6knlFuieuwCA768l8F9BBE6aIKVe6bsmXq2YBFXV6zuDAuCMffhucFDBvTf9DsX0E4xNrGFxbppObQdXvv63RS72LAVA9f3d76y6PvHCndFE6eQiYEWL4cxIxqkthW4lyWkLgL6Wh2zL3PKlPyEs3s/kqiFG66s5OrvExNgQnWKR9nyBY44sy9DJGvL2fihrlJQkNmCzddTqhmz9S5na9XocBcsdz8F2h0YuoUk+GMkwmX2cyUOfRntPe3mQzVf8InbNdvJCsdxudBnfZbskGBnEdQnBGKyRO7rTKcTxMyhqmSKUisOP3sTSk19g4iXvJxncRl4u4ZSmpgJDxpAo8FajS0+SGjKlMYnEmnsc3YCkOLamVnTqpQtkBqxRGMR6uPROFnGUJEWHJ27+IGk9Z3GxzdTGbTx075288Ac+SDa+MS49pIAoG4e4/2vvYXxiDUtLC0xuu5obv5IzlNaZnl2k3fFMtg/x41coLkzvJ1PjtJtLrN2xi+/d+xh5uoXbDqXcsneRpdoWvLLU6sOYIQVlgs00yiYMDAzg0oxQtHGlQlXcC++oaU1zdh870ibXrV9m6+hBxgfrLLfgxME9rF81xgWvezW/+eGH+LeFdYQyQBBkWPmIVGslCizXC2kiMRKE17VGllW2MSaqObQUgEG4bTZyCUprSQqPS8Wz34cUHTqgjCgNtPT2VRAFXKg4AT6gQyHeO14s8YOLRSNBTIfSNC4KHEonqFLmNxN6Hg5VwJArBUXMO3DbGw+xNN9GYWg0GqiHb31f0AstljqzhPFNvPZjTcg8iUpQWsJCxJFJCBFOIda3vsBjMTaViads4ZEVvqGkqGAQFyjwJHGFF7yRXIDY36hgf42P0jcrJ1JFk08Vw4eCF3Z3KFDBRhKfQ5sUH6F8XAFKC4qNWBpbZfAKkQgGJ25NxOpNJRhd0ilbfPSqGdbYWRYWl9i2ZYLldsHTs2P8/UOKE2PnogZGyeo1QjbEsFG0Ggvic28EJgp5jkpTfFGSJFJ5eZ+j00EIHdK0hmuX2CQjhDZ5EVg4fIKnn7yfF24Z4B0XO7adNcittz/Kzu0bcbX1/M49m7l2dYOr9P9m/dRmpmeXCIPbuOb1f0DorlYD+KifjsbSMulLsdTPYPcrJq2e81qXDxAnGa0SJEDJc/Zb/wdPHyswfgS37XyoRxmKMlHqf/IgHIuBbjFGHyQf3x8kQ4LZZe77wEXs2jLeJT4qr1AanvdbX+Ge1jAc28NX3n8dr9q+lqBkxRH5+0LiBP7xX77FW/51Lx07AUPrQEtDITLo4n5V8sMgPd7DR1EHH2LNztUc/eQvxHZHiIqW/w98gDNNnGdEE0K8Vid9vo8D0J9HcCr0vvK/n01+V32vUoblhb3s/eYfMducY3xkknNf/UdYPYJYrT335H8KCbDbNqoKQ33KsTxXUVTJC3uxwP373n9cJxUBfQqNCuVAldz+pfcyrI8zM3ucs849l+b0HIulZ6lh2XzplUxOXcno0BiFk4VIko5F6mtKIGd55iCNhWd46t4v8rxXvJt0+CzyPKeFYd/iMg2vsTgKV1JqzejTnyDMPUyuNrHtJR+gYwcpGsu0yjY2yShz4SllWYAikGroNBZh+XsURQtURi0bJm+ULOazbN1xOXm6ilwnuNl9HH/4zxm94DdoqIxUK3LvGDQG7UtUUkcpjwNqCAobXImzBuVkQWaMoigKrNUk2pBaTaoMCsdolqGill0WVwrvNcE1efD/fJiNmw0LC/MszS2z0M655sf/Srz04yCShw5H7vgSj3/3o+y65BKWijZHRq7nD293tGZmecXq4/zYCxbI9z9GbWA987NzHNSr+Me7LHvsFuqTUyRDQyTtRbIsw9g6IdF0mo2IloAvSowNlB5sKmRuXwrRzeoErzxJrY7vlFA65g8f5PL1S/zk7v3ohTZjq9Zy763f4fobruBT96zhU/emZMbQ8W3hphlFKAVtThLhnIXCd63avS8jEt2TEos8vUJAJTPABfBaYcsctCUPQQzwdIrG4xTYGCMfkgQToFRCmMeJvb73QmS2OirtfCnjQGpROolycY0q2zgMqbY4xLgo0SK1B/EGCEajfWB52XHX2xc4cfAJBobWsbTcxi7NNfCNE2jVYVh5vNUkqSEUrmt0ID11YcybONB4lckk5zoyAOg0wsYGVxTEwCWU9lgnD6wK4JTvRhgaFaV3wQuk5MWSFCUe6hg5IcoaAqIqEE9nJbCI05Rx8rdaU8Voqgh3hdJRWoX2gZwQkwSVODHGNDMVPM8fPMRk5whODVE3CZ35DrfMbuA/DoyztHaKkeEMkkFyJ9YMrbKELKMMXtQHGAliKHMSk1CWOUaD14kYAwVLq51Ts+ICZYwhQTG1eROjI4EDJ6b5rZvnedGRwI6JndiJcbJWh8liP2+/boqHbxti2Q1gR4ZZf9ZLcFi0clRmPwrJBwhKqj8fon2KqvrbVchSv2aULrmsmkyrAV0In5rHDrbZuwg4i5vagM4ScVSM0rTKj6FL8uuN5PQIeX3/3Y8yaEMIRc/prvt3+bdT9bc3XsCrf/2fWP7sLzNYE2asxLz2PvNTr7uWT/znh7ntcBuSAaiP0Y0S7v/d7j5ZmFxLmDvM8RMJ/37/AW64dIoSYr7E/0/b92Uz3PcSyLX8Pr76uVQBQ6Nb2X9skd3nTLJsLycxIwgf4vv73hWtAOjOyZXRVPfqnM5E6QzH14P1V7YZnpNQ2Df5hxAoO8e56ysfRLnDLPmEwWSU5ekTzLZg4wU/xqW7Xo2tagcgtcIK73eCDMEwsupsRledy7qtL6VUCUXwLATItbDvlVYUXoMZYKL5DPrY4xS6zZaXvxPShGJhiaSe0Cmg3WxjLNT0CEVzFrWwn3b7Dvz8MfLG06zZvJ3pw9NgYWh8EyE/zlPf/godvYGNF7+C2tgVnHXpr7PnwKMkW15MszmDNgnLpSe1FusCPl4bpx1KeWyadN3lrNEURY5XUBQBnUCncJQGUjzNvCBRniRJRJaGxoecYOpc8Kp3s/fuz0E5R5EHRlPFnf/y+7zg9e/tXueaStly/nW0Grfis2H2PnAvl93wQurKc/bYMm++eJmDTz3M4NpNPLq3yecfn+LJYoqB8VE2jgyRZYOUaYpPxymdw1tNkbdjQRkLk8xQFDEUyTlcGchqCXmeE6ygJe2FBlYrbJYysHYtD+er+fBNLV5/0SwXqRnGVk9y30OHecer1vPgMwf5zvw6jK7jfUGOIBoSQGi6pFSlpE0saFsQ5FhX93ro8uS8hjw4jAdtEkBTlh6jex43XnmCB2fEUli8EDzKRtWbQnhyymOiH40yWtRsZRETcRXWWELwBC2Onr6/MNcKCi9q61iQa62xxpHoGoOjGynzDgODI6i7/s97QtpZINQyypDy2r+xBFt2D0xpExdxZXQicoDtDVRewi3F6Uh2vvReIAxl4oo/SK8d+Yz0WlM5gBBk5e/bKJOhg0Ebge1dEOgkhBAzmS06BtiIqiSlLHNh8GsrWeeRaSrxzgXWiLVj0ArnCwYVrBs2jJgWLzh/K0f37uPHzjtEuThLpgr0+vP54ztgz9ilrMk0ZTIsTkyl+P27QjykEyMcBmMSyphYZag8q8TACOcFXrMWVwryoY1HG+n3pGWBUxbfXKLRaLJ/zx7W6zY/c+VGcmVZXJznp144xPi6szhxcA/NhRYXXP8eDDWCLumy9UNcPUVmaIAeRF/19eNEH6d6EJZF/FxPoiJ680CJ5awbP8OB4wswthUmp4hZlnKXVj7actf1jcYRAej2/VXvda+ITkHy//NLPPC+57Fz6zBJnPlVEO+BK377X7mzOY5KRgnL84THb2f5y+9hQK+0mhVIrASV/L+svXe8ZWdd7/9+ylq7nDZ9zvTJTGYmk4SQ3qgBFFAQEVAEBAFpKl4b3svLdn/X60+xXCwoGi4qzYKoKIqilEASCJAO6ZlMb2fOOXP63ms97f7xffY+ZyYzkwm6Xq+8kuyzy9p7r/18n+/n+yk86x0f4KszLRhcDwNr88Qo9bv7fBJ5WhHBzaG/9Q1Wb13NvX/wetaONPOo4AwF6mwpak+zyz0nr+Bcr7fkdXrEoD434PSne4pRAMnK7zic5NZ/+G1uePVvYZZ+Puc5vlh87d6/FzcnPRj+bJyTxZM9xwigh4z073MWcuGS15yePsytn/wFRtqKZhtOnpxk4wXfy9brX41tre3zSEyscKqBVhUuZnQyQDc4YhQUr3YJqy3d6OjERAwBXTaYWvBMdR1zdZdGaWi12pjbfp5l1RHixtey6urXUtUd0JGJqQ5EaA4OEVWXiXv+nJXpMaqFk2ANG3Z+F/se+Q9i3QUzRAqwbLjB3PwUVm9iuN0muYeZig3WXPgWZrr7mS6uJwysZsA2hTulEsONBgtVl2ZR0glOOATB0S4aBNdhoGzilci6ldaYJMXeINypltG0rMEqaBhNWZaQAjGJBj1qxYG7P8DMvm9Bo02tHVfe9FvoZjt/84pE4PjDH2d6/xdoNFbwjYceY2L9a3jw8Bg/MHqEgcGKr+1v8DcPDzOweRdt0ySFCl/I+Th6nI0sr3MSlAMa50Qu3vN0SUk6W4HHQalE2WxQuS62bBM6EjUMntRV4Ba42hzi9ddMMGDg6NRBNm+7jlf83hNs23E5k7Md9s9GOt6gtcIUWiR92du/QBOVyzJpIRBqWxKSGMsBxCAIgFKKaBSxchibpONXpUjlQ00KNUo3ZYyQZJwetXjnmKqLLgwxkxNRBZpEzGOaFAXhTko2EwRPiSUoQ1I5f6YOGJsgGLxGwotILMzBXW+dZb6KLMwdItlBbNGwuKkatzDJ0OgzCMzKLCEkTJb1WKWJucAWWiQ0Yq9r0EYMekxR9mELlURvH0LIKd5iIapVFF2ulYxipZUE/ijhBISUUDriM8irlSLpxVmHxhBDoigKSIHK1Vgrmkjv67zYGUJ0uPzlKed4yRUruWENvPzFz2TyoU+xfNkzOfHE3Ty8/+94zVVDHDgwx+rREU6Ejfz2bWvxa7awvA0VTYrYFWOgIF7MoNBKSDUJLetz8CitiWrReMhaRTKyM4tVpNDiJOWTpoheDCRKQ+0qWs0Gy6ymuXUD87Nz/PXjkXriJL9y3R5KdQMzY3s4/sidbLjmx9GqQcqEM5WZuEnFxRrbk5P01se8Oem57BkQd7+U62DuivvbBaUIHj73wD6mqwgDG2D5qCSSpCXrcB/2yl1+n3zn84bEi3E39DkK4leQ4WIVIbq+FXDPklTOV9GMwhlJdQA7CFtvYPRVv87Y3/0CTZO9tjFZBVGQgNv/4K1s/ck/4kBdiOSotXKx6wd6RkH0iJLNkrjhAo5PnOQX/+oO/u87n7tYVE4fA5zvTP+pCvyZRghngsuX/K1n7dt/iv5IR6GU7nev5887yFtBs5obXv1bQoZV53BHPMuxuBHL44ql19FZGSenPvasG6v+HXvPc/bi39tsdOeO8c3PvJfVa5YxONxk/Mgso5d8NzuuegOF1dlmG0LyuJSo/AIpGbpuHp+gWVh8gpnKo4KiTomO98y7iFGJZc0BprqejlbQHsKQGBkcZn0xy3S9n4VyDRue+RIaeKa6NU3bpImlMTJEd/xB5h76IGuXQzXvWLF+J3sfuJM1KwsuuOqXKQbXMNBYhlIBHQw+dJk//i0eu/eT1J3DLB9oMfv4nxKCZuMz2+yZvoLO8s3ys7SayRAxuk3XOUrboqG7eBQ+SSSsUwrxmBFEFDS4gCotVilx7cujWmHAB+mkM2fLApsvfT233v2TDKxuMlA0ufsLv81VL/llIc/lnd7KC7+fib3fwPrEcmW4dN0M948P8OcPtTlwso0eWM/aLcPQaFD7AKUi+UjMvjEi2c6qrpQ9+pOn1Joai48BXB4hFgmyzC3UFaHQNBoNfN3FWo3zDq0axEbEDqzg6/UK9nzpi/zFuzay8KDlnq9/k7//8QtpDpxg7botTB6bwMY2+5zi/3zyKLcfDHQbbUyzJKmGXGdKkzKfwvtF0znx/ffS1GJI3QpTiIMrWuEiYkKHJpmClJvZmISnoTOzH1uIKZ2vUdqgS4gpoFRBDBGdItFJ6J5WSp5bG2nOixJfd8TjJSqi75KyCZHSBUWZMMOazt4T2LJJHbuob372PWlIN5mceZSBlbt56Z8EXNnBoqSfVarf+MXoMVYkSjrvUBRiQqBDTcKiQp01t0WfqRy87KhwAsP7XixQSqjCEpIkQhkUSYt/GdZIDLHSJGLfmtdoKw5OSApgUsIxsEahaokJTkmxcyTx7u8aYTQ9xEBcYN/hE8xXlhi7NNuG0RWDqFphlWd42PNEdxc/980hVq/bhi4HSGWBUhWRkNP9RETk/JLEQSymVEQn5MVeoFH0AW0NIYinsyADqW8lqZVAqKE0lMpQxkTd7YgsBbBlix3s4T03lowdOczJiScYGH02l9/009n3WeZBfSkOfePHXBTUGWVUKZFZ2+k0qHexuxKLy4IdP/zr7Itb8as3YdstvNifLc79e65Rp8z7FXjPd12+kv/46l5oj8hjEiwxGpf7hwBzC9z3q1dw0eYVlFo2AL3ol+/+pX/m824V6AaEBN0EsycZ7D7GiU+8g6ZKsgHL30XPsCkazQve9j6+Um2H4dVQDrLIVFNLCm0EHMp1MQcPUQ4n5j76o/Q9BM53ln+2wn368XTIhUuLYf5vcdY89fGnEACTdEExLZUsPcWRdB6VOHoZ6Of1npbwEfId+/D96ez9099PL2f+1BGFRrT354mO5HNbSvabGnuc+774PuZOHKHRinTiCC9/+8fluRFtdUTS+WKMVLWnzuS4GKETAoUumHcVnQgBTTdKWMvKwZJWIxVgAAAgAElEQVTawFjdQY89iD/wNUaYoKlheFBx8vG7uWDVSg4MXsfOZ7+b0PXMdBwdV2OalpmH/wl/9NOsXjGKtxNMTa7lwqvextDqS0hEuqkWKWGK+CROnbYsaGooTIGNCXfiQR7+6v+itW4Z8+PTtFbtZM/Q96I2Xoc5/gD68K3YhVmKoTYpzqGbmzCrLsKu3oVNhtCpiCZg0qIyymR4vdCGQitKq7HaoElYBQMNizU96aAgwScP3cvktz/CyY6HmFi1+5VsufiFggADziuO3PkBZg9/nQ2XPZsH7v0Kf/bAKAca22k1WkQj64a1FmULvIt47zPrPYG2oIWjZVKUiFulCF0v5G+VCD43hM0muiyoKkeBmOnEMlvtxpz2h6YoFYVtQIxMjs1xZfsYP33dcU4c3MeJyQ6bNyzj2Mwsx45W7L5gFUoHBoaGWLOqxdCmS7j9Ec97/26MY36IhtZZ/SafiSkNjbJF7aWRLaxI+mJwYuEbIkqXmRsgaiOih6JJCgprhIxp8kZC6mzE6ogOMpLThcXZJtpLeFpSkRQNpfLUMWBMg5hExl54MeXrkRWTLojeUZZNFuYNX/nRx5g6McvyNRuZmTuOHRgcRusGK5rbJTBAO6ySzipqk52OAJXQSNazfFEKoy0qFcTUY5+nTGDwmAikSEiSO453MvdVUhCSMuJiFLzsIDN0bKJBJY/wAJQsyDpLNGIkJvGCjmT7RGUwsUZ5KWwXrwn88Ru3c+SuT5GmW8x1PXceOMkN1+2ie3KMNat3Mz81jrGe/b7kM3fDycHLON7axpoLLB6LTzUWhU4anRRRK1SqcTm/IEZ5bVN4opMEw17RDSqBtQTnJIU4ymeQVBBExQcJV7Sa1I0kHfG1l+SmCJjAQqfiR54xzqFDkXrhBAvVMNdf/8Yl7m960bEqL6CL0Otp62ev08+s+Ug8tXJAf/DeA3CTgpM1+KaBZhsfU67dljw3yPhzOHUMEB1lPcE/v/kKvu/IPj53YBYag4towZJ8BYHla7xL8qOg7K3sqKSIqrOIFqChjDAywpzayeDrbmbqL97JQJOs382Yh1HolLjlQz/Nrp/6Kx6rmijbJGlNH2ZOLKICypBMi6Q9C/M1CynSViFv185cdM7rtvN97Nnuc4Zxguqd/FLCICzZ6OWxwNKiez7nkruupQ5754smLGXmL3oBnAOmz/bEPUOV3m19WWj/iZ96jLJ04ze27xs8fu9H0fUkoxuWszC/hhe+/jchmsyL8bLhjh7nA1WI1N6TotjSOgXzIVJ1O9J9mpJuVZFsouMq7rnt39ne3sPw/F6uvOpCFkaPs2/fAWypWLHsKloXXcUTD97H5me/iW63y0xd4F1AFS1O3P0xis4XMTZSuS6rN/4U6666FqUUdajp1pkMphIOgZBjqIkeZqPCaFE8tVddwq7v/xtOPvyPmO7nqRYOsjt+GmPvII6NUw61OTi7n0G9CtftMmDneeTfPsKJE5qrXvJayoteQRUl8rY0BhVV7mAVMcpgrvYRbZXMnlOidgmDeOmr3LANbric4/v/g2WD04wffIKxxz/HpotvwiAprFbDpmd8H/dOH+TEkQPUJ8b4+Ze9kJ//UqBolHTqCkLEJYPy4rUvM3SFjwmrJdxGhyRrfN6wJCVIhtKRFCSXJXZrXMjfrQZPhAUnzrFaEvZiSlhv6XQ74B1Dg5pHGpfyY/+u+LUbB7liZ8XDB8bZfsEF7NoxgTZDjI3N8JW7xtm6cYprh9ezUx/hX99kqEcv43t+4x5m4jIKIqURIrRzgbJhcc4RfFat2ZIQXZal2/4IPaiENg1pbrUluZoiyXg8KlHpWCWZNxFNaQw+igRRfG68kD5RdFEUhjyqUEQXSIVY9puYhKCeV3UXaiKeRrGSDVt3ML9wjLIYxM5MTzDSajF/8iDNFZvl92UsOvX0tuTFUqOsIsWsDEgBHRUxddEpF8b8I7ZKkwpFDLKrdEHMN7Sy2ZEvoQP9VKYQPUaV9PS6yhYkh6TqWYM2VnaERhGTz8xPDTqgQ4eUDDEs8KFXLmdU3cXDX7yXhahYO9pi92XX4BoPcWyhxe1PdLnry0c5OrALu2wFxfBK0u4RCqVpqRYhzJJ8lWdHQLJo7YgxZSvGSPBCsEsmkYIGo1A+QqGJRhF8pKGTwP9OdmxayabFqyQzyCD/3SPhqdKiqhrTsNR1ZCRMMrpylIcffhhbd9h5zUsxrdVySj2zh7xQ9lLT+nBsIttLnl7CVH/RlsefulCrmDJCLjt5YwbQEaLRiC+0WvKQ056/hwgYuHxzSR0M//yLL+J7fvkT/MeJtWBbYArZiWglzn1K0B0Jokl9pDgzCCgCwsbuPcYYwMCyNaTkWP5jn+IP33ol77hp26nvQymg4NHfeT2rf/yfGUdkmSizZPOS8ixEeAzJWFiYo6mkc9Cq8eTh9dN1AjwXUnA+qMEZi6A6tZtGeBbqfDch53zN08YU53FOKoGXr73/281neZbX7tnJ9jYrRi6jpyuZhP6GY356D1//9P9m3YZBzJBGF8u58Qd+C9Ur/gpCjnutvMcHRdSZVKUTncrTTYn5Tg1FE1cHatVBlYb6xB7s3o/x0m3LmZ6ZoxjRPHHfrRwan2P5up0sNys5vu9xmnaG5gXPoWmHmOrKQpuiYfbAt+gc+wdag8P4umLDc36F1FhDp7OAU0B0hCTZJyZFVAKXx4vKiOd88JGkIlU1h21EBi96BSvX7ObAXf8L5eaJBx6hGwKHD0zTGFjB8f2Ps2F0C/PTk+y84housS0K+yCHb/8ayy9/FwvNbWg8rbLJfAqkKKQyQS9F9u1ioDCayruMABgwAa0URVJsvvgNTDz8u8x2HS09RXf2OO2hdYK1aOi2Rlm36yZm9nyazRdexNThW7lq2TO4c2ZAkvAUqJhlbT6RlMIqi47g65qiKEiFlpyeKAhBjGLSo6KXMbA24m+/IN1tAKL3xNrj6y5Fo0EalPHAzOGDjB84wNod26htm1acJRSr+OmvaC5dPcKDj1WsLDs8c3Ob52xusHXLNm58xgiqNcf4oUe5+/ZDtJe1odjPLe99HofdDv7nn9zPfXOBZoAUu1Qpe8xEsM0GKYnmPKSA8Y5kgyTZkkemyhNiwuoSlzwmy/uIGR2nQmzOdb5eNb4sUPO1kLQxguA4oIwkFyisFRfepAi6t9aDsgoXwOsmc5NHOHLkAYZHCtorVmNHlq0hdWYZHr2Q+ZDwpoPRTSG9qUBSBdqAysCCMSIvSzGPBJR4TGltJECHSEw972WND7LzSYWhThqrkRmJAqU0MQSsLlE61wUNOmlUoUkORI4SUEmiNxUabSPR1wIBGlgRZvjdV1mqJ76C3j7K0MpR6pkpuqHLPfffx+17Hd842YVVlzO/HobWXYhSCqMTISqsQSQUqgQdpE6FiLJkljxCNtFKuomgZNYeI9aqfnqgMlZm/TEQNOhCNgTWCBRkVCLEiDFi8CAWjRHdKDBWUSnPkG2ygQeYm9GUDYWyK6n8OpFaJp0X/LwWKlAq9tnPagnzPsnO7alJWLKaPqm+UwicLyQDs9j19+RemW+xOAJI4DW7V1tCEEnNP/7aG1jxQ39Ed/mFoIfJ0A+ohMqBUpJytXgqEbAKXFOTFgLoIv+hVyQCsdUg1pr3vO9TvON5/03GBEvfDhCKik6Yl1FDkbcVafHzgR6qEdHRi0EKyC78O3H1g/NHA5Ye55IVPun2vHFb8pgzfr39DYYVaP3pntvp3fhSZOK01zZLCvji13jaBrP/mHjK+S1OEM6z+1/Kg5DIFr706fczstxSdxLL1q6GoatRwUJWA0qYmRRX8c3XeOdxIfR11XMhUluD8WS5nMZ1pxmZvp1NO3cxPvFV/HTN1MnlXPTqP+Oixurssw4peXzVpVaGhSTeIoSI684TJm9jaHAFI6sHmPYvxjZG6YSAJ2KVxSOwb11XUvQ8hF7AVZ0oGmXuijWFUoQuqDRDWrGT9ubXM/3IxygGRmmvfTYjz9zF0IodzE8ewnc7TO/9OhP77mbjxmm8Uly0+0K+fefvMHTdbxLtEE47AdiApFNGHiI+BBo5Dl0Qy0S0Pdc7hVZgB0c4tnc/Q+2VkGZ57K5/49LnvxmAkCKlLli37jk8dusnsMkx0Kz5oWcUfPXLFa0StLIyzzZWlFQpyGw/M9brbgWlhOekHBxmctORnNSTuqcG0hofnRROpeg4T6y6ogJTEW0Lpo4dRbuKqePj2FZBfbIgLHTYcd2zmLOWVhhhLiW+dPgYf3vLw7QaxyjCDD9w00p+8MpRdlzhCJXi+KEJ7vn8Z7n0+ufykV+4jHfe/AjfPFBhdY4WbpUyoiAjtRFAg07SxSupbamXw6K92PskxGwoQlQBp6KgoFrhkkbjSbUTC32V0EocdZPLY1kX0Jm8mtBYpUitFtErlAoyvtaGWkeGR0cYm5yhbLdEEjo9M0ZROQoXaQ6tx8QcfVv0pGMBRYnSEpFIErvf1Ava0QYdXb8wCMlBUv1C9KLmLSxBl3KuJKwqSfUCKXkKpYhKgdJomzX8MYopkBViSAwKdBCYKUies1EWXy/w5msKrm8cJe45yqadV3J4/CgnFgL3H6y4e9Iw1Wig1l6F2boBVSSS62JMINQObwuC76J1k+hBG1EWiA1rTXSepCWEISiVJWJeOnljiK4mBIuyCp0iyodMrouy7qYgFp91TRGCGDyUDQHvFfhE3uVDoQtc7fFpjF96+SUcPfwo60dXMGN2c+FlL6PHTk8p9jcBvRnoKRpwJctj3znttL5M0PynmBEn2LxyiMkxT6wraDRlbqXUIvSf8sUNcntVgzX8zMuvyez8QBPF8Y+9g5Ef/SAMXgSm0f+RC6nNUKuUzWcWC3JKhqant8NZxPkDEDpQ1bzzeYkPvP0n6EUULz0Umnf/xUNUjS2iClkqSZSykO9oYGoclGakJfNQpfSTu/QzFKWnktkt3vE8OQKnH2ckCoYn3aa+E9XB+Ry9ov0dPf606+tM76V3z/P9HE87EgEVTrJ6oMbaZdiy4NjhOV70ltfLGpEgJtmchhipA0RtqEOgEzwueEqlqQP4WqJWtXZ4VTAcHPbIv9BoTzJzYB9je9tc9kO/z4rhVaJ0ionxuVmcsUgWWUk3epLJo1BdcnL/J2DyVjasW8/Y0eVc/n1voetcn8vUrTryuzWWVnMZMSaKosqbihZ1qqg6FVgpvFUS07I6OQaTYmDnS1mx/btJhSEGh0megGPZuo0oNOsu2A28hUMP38Zdt32YXWkf69YM8dhtP8cFN/4O2BVE7ftdYgghc5aWcIj6lJ2UeU0ABl00aC5bTVRdirSMhYVJxHdV9e2BaTRZue0mpvb8KydO1qwM32JFcTlzakBcWusOzjm0MrhOJVPrQhz5jC0JKX/LCVLQuQFKKFsQaycmWDHI5xMXrak1imA19cI83bqDqmtS7YnG4GencWMdQoqYQvP4vd8gzM/T7dS0h4eZO7qP5Dp0TUnHt/nw5yo+/OnHuHCd4u0v3sSu7QnvWvzlB/6ZK2/8Bu9/9Q38xZ1D/Nkt4+jmCMrLNaZClDpmLSblxrZ34fZUC8Zics2MGkF6tKAISSEbJGsJMUhSb/Toqs4/muz/qjVKabxRlKqQkL4oBkLee6wWPxchaUKz1nTnEtt3XczB/fdTlsNYIjTbLaqFabyapVaGlpKdrLGlmMyorHsMCTLdw2j6/vpEDXl2YxEYyUdHkZJo+RGdes8hL2owhcD6ESlI0QfQEYxBKyMF0oseXRnhF9ShSyNCKBVq+iQffM1ytnIrfuBixo4aZupJnphOfOQrhwlbr8VvvwirC5SpIM0SK0XZsITaAcgYIorchKiIMVssKllrQ4JCW4L3gkIYmZf1jCk0BbqweVOSSCSMNSgXZEofE86L7t+TMFY2R1FFSlOSYo1PyMbKBIw3XD48hp+dYf+j32bVhh1ceM2NAlXr2Pvu5VgS2n3q3PU0aD833dJ/pXMWf1HMySLzP95wEz/y+7cRT+wnbtgt5Jx+kTZLZH75gSawup14xhpLig4Qs6bSaub+8t0se92H8M31UnSLVi7MoEsFmUORSJJwhZA9bZRYTbLEERtgYpYfv6bB+9/+3Cdp9h2JgsSHbjvCh24/CK31AinFHrkt37G3ofAONXWcxrDhp150KYKnnQG6P0MRPJvxzimPe6rjXN3/Gf/WW5GXzvDPNVL4DpGMJc/VI+2dfvv5PLZ/Xud4n0+7+Pc1/4q/vvk9bFiWmJ2cZnjlCNe94r+TsGidx2RR4FClDBFP5SQOVqOwpmTGO7q1RxtNy1iayROXl0x98WZ2bgkcf/Q+xsLzeOE7fhblKmLyTHVqujFSh0CqA8EoIWfZJtMLc3SqxGBRMLP/FkZXDnD0+B6ufOVnqesK73uupAlNi9aAYXzsAaYP3wrVUaq5fbTbMLMwgG7v4PKrf4oTQTbeRik6VU0jlcx6j/fTxEYTXdV9r3qjFSYaSIEqp+CNXnQ937P5Cr7+Lz/J2o3rueTCER665ze46AW/i6618Hvki+irq2KMlKVIAmXtzZ70CVDS7VKOMHv0GCvWNDg5cSi3GeKkQd7U77729dxz4na2XnwF+x+7jxdvb/APjyuIXdAlMVbEqqbvIhkThERQ2QjOWmJdCcqZZ9nBGIkB91H4aZ2aVJayyTdaCIW1R6GxGBYWFvoBcErlWqYgYpg7cghcB0XB7NxJQncG7T2pWsiBP8KF2DtW8p6PH2XXusT7f+JZXHtTjZuf5uBd97JjfIq/e8dbePuHH+VIatK2gyTl8FEIeEo1MHn99Skrd3LmgNV5tBykNoTsc6PqQJkiLgQsmqRqaVtSRNkSlQzJaqJWUl99yMR4WdfEJyWRfFfGmxSYWFHZFq3hNof3PM7a1VuZmZnBtlvLIM4SCKxatYkiHiUojTXijmV7O2nEUU+bEhOS/H/2Tc7TZaJOAmtpKzGIJFLtwYD28yQtEEnKF3VvsU06d8KuIiIyHa01JhP/VIiEjEQ4kxhYOM4nf2Ydx+76PI90Epc9eyVFdPzq3x5hYs316BvXoHyiSQSVZ/g65BlN/hKSRhmPViXRe8nvjsJPSEpjC4v3UYp/VclMJdps7JOLF4GQPElr2c0Fj4sxh0BA6iz07R6NlSznlBKFKXAhYZRFGYuOXaqqQ0t1eP0lQxw8tJcNG3Yx1mkxvHIHpyzk/Q76VI33kx3g5DtR9Lr2JwGzZzxiELn/K6/eyEiYYDw0iJPHYdUo4Ohb/y7V1mdC3Ymxk8z5FsP9pjzR0BqfIif/7G0MvelmaK6V5yjamdx56gZGZZLokG2Il7vO/8QOTM7yjqsrfv+dz+VJhRookuItH32IT3z+ccLyNWCNIBc9EmIPDcmIE2NHSdayMU7z//3IC4mpRnEWAtwZ5/salDt3UTxff4DzOc57VPCdH4uoUuiPls7rvM6FmPwXnl/vuTyJVYOKorUa152m9isYWnmJ3AX6nXZSUNWBBS+y1Mp5nBKXt9pFMJrKR5zroNtD+Me/xGjrMXQ9wpH5S3nR638W5xxVUiQXmasd812JHk9RMzxcYhsl47NdSluwUM0yN3YnQ+U0IyNb0DMXYLoRj1zrC90u3ita7cS+e/+YZnE/a1dtpzM/TtFo4oFNo+u4/4Gv8shdjzM+3uSqF/9PplObZlkw31nAWcVA1zDZEcOxwlhQSRRF2tMoNaU2JOUxqYBWybUv/VUevfNDhGqMZlUzO/YQrRU7CElUEGSZpEkJXfYCnwJgcqdp6ZOFlcJ3J9lwwXYOHxmj1RzEB48xiZCvF6UUpmgwrUZZOXuEtcsG2T7wbb7V2sIev4zkgnTGhZFxc0YhlDLomAg+4H3AJmkSozboppHuPyf0Ra3wJHRXCl1UYDXUKhK9w9eOotmkdgFdBFLdJbkaBQQt7ngpKaLvEJPPTZLw3oKS8Q4xYaMoJg4etbz85/+J6y8e4k0vvpJD+25lZGgN80/8PZ957+t54x/cx+O1Bd0mxW6WB4rxj1dCZNRETIw4nfIYqkDrRAxI+q0RFCXWOWfD+/4GRjdE7pxikBGqMejKo0xElRYqcdT1WoMSwr2igIzymASTR8fRxuGqmrJZYBcWFmhSsWzNRjrVCWqTGFSyS02Z1aFSLxUwyUwVjSksISf1yW47ZI9yK3OQmGThLpSQGUKJtgUhmzZorYXMoDXBBVRh0Mr2d8kxBlRRkmIgKi/phDYy5Mf40i9dxfHHP8fB8cBFl63h5k/dxqfGVzF00SsogYIGQVfZ4EZ2SSZBXVco58BYCi1dfNB5JuUjuqEFKSZQVWGRQV/mi5KMViSRy7kEVE5IiyhSiIRUoYsGOgaCLsWsIROWejs140q00ahS44PDWkN0La5rPUJnPjKybgOqGmfd5d8nmdFn6eSWarBVnvmfUpMzNw8gJpNJY0vY4r3v7rTFFSWw0Z+/92W8+n1fJo0/TGi0YWiQ/k4C6Ef8CtMEijZr3vUJTnzodQxlGDHl+OaBJoz/1dtZ/wO/QT24DWwboqWlbfaP0BmdkOeMAwZ1fAHVbmONw03O89bLEh/8iZc9aRPTe6+/8g8P8tEv7UUNrQCKRbOi3h16dzYJpqdQUycoRkb45kfejcLJzlrxFF310tftRRfx5A3C09wUnAtNeFIX/lTHWc5dXkNGHWc9tSWvc96v+VQ+B/+Vh4ooCmLnGNp7hlasoqqPsXHHtf1OOCIdpWaJykhp6phwSlFH8d/o1h5TWAqlaQ80QAfKxz/Pym1bOXLoUZ732o/gfBfQVM7jUcx1KzHZQROCI05BN1S4pLHJ0R5YxpF7HmbX1t1Mju1lw5VvxlHjPbKR6Dhagys5dP8HKbq3MT02SamuZ9dlP0unHIAq8NCX/xzDw6jgufLKNdzx729lx9W/QRgZpTUoVrdzVRerC7RVdGNNCpG2LcEI/yYqJaExKfustNezYvmzOHbskwytXsbhx+5i5w27BTI2mSukFCoXm4hwm9KSfAedbZSquUlaJCYmTjAyZJmezKHrKS0awRm53q577s+w947/zfTxcZQa44L5DvdzOS3VoCybdBfmiV5S8bTWoA2h0FhlKaKnxohPhXf4JAih8zU2RupoQJeE5KSYuwpVNlC2SUgdYu0EmfUiTffeS7H1CYsSfkjwsi5GcVbVWn4jKWZjNNOzTasJocKUcOe+Dnd88F7e+6pn48Zup90Y4MjeW/mdV63nQ5+f4XPHDV4V6CKTxnMjojCyKUA+G6s0hCTIpdaYFFAhidtfCERre9GNmEaDYEQlEHWFMhZUAYWgIckakgFvlHggOI9BEWxEuYCyhqg1A8NNukc8PtRUTqzyWT6yiqPHDjA4uJqCgmAURZ7LRjQm27ImrTBJCNkxCvEv5WzkpB0xZI1kshirCN5jjMJjMEZYjyiDtkkKvTZED8Zk72OT8twiz0ZiRBcFwSkqIq/dZXnX8zfw9S/8Hbu2b+Daq4f51C3H+Hf1QlZfsgGvsj+AyraNIYoDnotCwtBJdJmuxgFYg6HAWzENCt1E6mWaeydQSqGJXjqFpGV8YPF5t6nxCVKPLFcYTNCk4IUk2NDEIMTH4DxKJ4wW60rdtMTYFC/xOhK6jh95yToe/dYDtGYrFrTl+ssvXzIbh3SaxrtX9Jf29afLsBJk4kjIntKS0bDUTU+ee7H4SDKY4sWXX8jzttzOl/YYOkcfgOIKaBQIwaE3K0dYe0FBY4gqrWH7uz7CXe9/I5taPcZ2xMfAMmOZ+Pv3MvzDv0fyy0BpSiN+Eyx9FwpGYgvfalOYCjc9zRt2nuTmn3j5WapC4n1f3M9v/NWDhHXrQJUyNiETFZVwV4SFo2GhAwcfprFyBX/zzisZxMvwQGdLWLnYT3uJxaL9pIJ8esd7Lme/s9x21khiJejbOTcBpxfdc8Lt5wO598yHwim39V0Cz7ZB6t1+1g3I09zInOnI19yBBz6Dj4kDD93B0PIRQirRSv7WszCPIYeJ9cY1vRFfCIQogSkaQ7shTpgxBOrJPYwPz1L5TRgMXe/QViTB3aqDS1pMVazFJ0/tHFo1KRDjGmKNq04wNnmYC3dfS43o+kNKzHXnSCiq7mHmj3yNYvUqLnvB/0/XbuT4dE1ys+gSdt30RgaKH+Ob//o+Th68hwtXLOP43b/Ojhe/n8kFaKJZKJr4UBO98GQaqsBHQyd6scVNNc3CIpwajdaJ1Re/lMjtTEycZLB0GKMooqJAURqRsfkQ0YWh0Dr7AeTmDyOGNRjKgSGWb7+JQSqa8TjTs1MoZQjBCbE7RrxSNIylNbySiYkJ1q4aZM++I3zvNVu47WuJ2VRRLSxgTAFaU3sxHjKIjDz4iAoeY0ohf8eADhHnPd45QGFTxDlHVOBTIlY12tdEYwV5dhUxOEnGc5JnQyhIJpK8I/iaFEL2ZZGhATpCAGuzMVlucLSyRJPQMRB9B+UD7//Hh3jZ5du4fvtmHrjjLjZfDO999UpG/iPy1/sjMagcAtQl2QaWjIqnCiKEaLBaUfTCgbwj+AApoqJHubw+a8Q/wUrGjLINJElXXHK11aS6ErdApUleUShQuhCulRFvgOQDndl5lq/bhlIFca7GFqZkZvqkwOSNFkr73rg5S0MgBIUtNIRACDJpJcVFWTgOVJFdppx4UnsHyROjxeokHag1JFdlVZZoNNG9jj/rHPMHnlLKTn6epkmsHk685hkdDj30EM5YQprh23sUn288k8bKbei6S8M0CNGRiMQgmtLQWwyiyyNsg7ZaSC2ZzCiNosyf0EHI7tETkyIFQTB8SJhGkgycWsANlwK6EB9upZTAXz7IrllrgpesZiKSe5BE+2uNyCl1qMX/IEVWr5jGVROMjo4yOTFGa9VO2gMjWSPfW0DPVOif1A9DhrF6f+/xcoBTMuR7MnuVny8hG4x+LkCKfPI338RlbzWkZicAACAASURBVL6Z/ZNdwtheWHshNPJcvo8E5JjFGMA0mQhrePb/+Ch7fu+1KNXEKJVlfIm2htv/4G3c+AufAxpQtIRJTo+jIOc1kxw2ORxtWp0xPvaeHzxjPYgJDsw5fvEPP0dauRvp/PMu9fSjxwc4cgDTbHHDBsvLn31R/tgCvT7nnEfKhKSnezyVEdCZIPR+sX2Kbvy/uOOWa+v0Tcx5kg3P4SFw+ntYHDGcx3jklOc1LFu1iebgIJ3OPI32cjZceGNfydJzWAMNJhGD70uaFSanr1mU6TLSKNCFwTmPnz3M6gt2oVstOt0VMlfVmhShzlHThRao1vtabktaOlCtSTqglWZ4cDmuO0OsZ5mY2s+atZeKm2DRgKBoNgdZ94yfQtthKrMZXy0QtCZpCSibn5+loy2XXfOT3H/HL1DqaYaHLWMPfI6BC19B5R0hRslB8R5lNS5FdCkFwAUp1RhFVAlrNSpEog50O4rhkQHqjsyMG8aK9DXK9W97X2NKaCOka2OyTS1CEHcL4xx+6IuMjK5mtnOSoZFtGJWohbhFiAgnDNnUNptbCX4vmzZtYmC0xfJimqnOkCjAbImyBVYh828DhEjy2fM/1XIuScua6SOlFra/SaBSIIUoY1sSruvAeIgBHx0qW7hrxMZdFnedr4+Iskbc9aInZNdUbWQT2TfV0ovRvyl7FqhCUc9O8pdfm2T7xSt4wc7VzM8f5NZ//Qrvfvk7ueXmvRzvrsPnJEAQSaqKiWSssPiNRjxHAqmu5fXLUhR3LuUAu0gRA6FTQTuRXERFTdSRMkVSEPM0rTXJGJTzonpygaCD2Ohokzcwjm6YJU0F5hdm8WkY260dvp6n2WiLnjgpIeklRYgRnRTGFLmQgrbZmlcnmadYi9I2WzYK1EaUMAqihpjwXmB3HYL82LNsTivZVYaYKIpGP9BA5M2K6CA2NGVc4L3XznDPF7/JyrUt1q9fwUf/aYLPtq5laP0uQpgjEIlBi6e8D+ATXkkhRmkwllB1sVZCA1NKJAdKKwnwiQmVAjEaAkHsE10gIYW7TBFXdYWtajQxKkwhY4REAuexjVJSm7yCUqR/JIUPDmUKjAIbIrEUEl2sPCUenyI3qMN0ZqEcsDS7K1i147ulE88FfTEp7WyFn1Nu7yPzSlzQSDoX/ycjBr3uX2f0IyGfiwaayfPwn76N7a/7fY5OH8YnYP1Ocj5zb7VY7K4bbWIncmByFd/1S//IF37tVTnPujebUFy7doAPvuNy3vVHd+NcQOnIYuGVfxsf0a0Gz3WHueXPfvCMBIYU4XCEXT/8YdKmnUTdop/5LJjk4p11Tkc8vAddjXP1ruX822++Jqft9T6M/wR8fZ7mOed8ndONgPqa9/9k13yex2LQT7aa7nXsZ7MvXvrf3wHH4Tt/X5Hu3HEsMDyyFp8ijfaKjN5k9CJ6sUoNcl6lVrgQ8SlgMvdkqDVIUolOLRB0u2hi28N03Tg+rELpRHCRRlFSBU+37lI2GgTnxckuBFShhT2vFSZpQuUZveilxL0PsveJQxzZt5dtV34P2hqalNROsdCtqdtbGGi0OT42garnWblqOTQFoXQuUSjNbAuKTS+knP0y67Zcx4MPfIVW8QOoGFExiie+FadWXchYUxtZI5wSG+OmVXhX026UKKWZnZqi1Q60BjfSKgqqqsrNQqK0QuiWn7YgXSrH1vY/eaUZe+w2GgNt5qbmaZVtpuscDpU0dXTCKQiJWiUK0+Ci57+Bo3e+j1IXjD/xda5d8yIeeWIBowtcVaOtwUZNVVV4pdCmIGbCnPUyesFAcB3wouAqbEHwNaFTQ7PAeUEvDAlfVaTgJN441aRK1lGTg9qwCnQpDoPR4YPBmAbkmX9MkmtjUIQESou1ekqIta5SaFVAU9OqF3jfh+/nK+um+O9veRb6kOL2z/4lf/Oz7+GNv30/j6sWWhdCZrRS1I1WmUMieTk4h9GJqKww/rUlRtm4iqVxRKeEqWqprbEktJvE5CQ5t2gSfBdUA2UhZglnQAv9KUoD1oia9Vuu5Nj+x9GqSXtwANseWU7RCXQXOmgrO0ad8qg0Ownp3DjphBBCYsSYBkHVhJjHFDGhjBIiqE5iIqN68JMWr3ytSNGitcEoCaYhCk8g5mJFimLxm6LMyTtdfvnFiUE7wzOffz2jO9bwxc8f5JZyI3r5Vtmhlm0UNd45ks5wjkmQZAyhtCQqGVuKfDFJvLC4CYq0QlkZPSiLZHR7J5yHmIi6ICmT60kkhISJEa9KiUl2Xjy5fZALJEV8t6IsGlQErOqNNDw4R1UnyrIUAyAU3WnPK5+/nqNHDjDaMFAOs2HzM9DJ56z1eEoXL4tnzMU9Len2e7wA1e/q+4XzLMYywhWUJ4hJYFFFJCVxLFSqwNjEQ3/702x93Z8wObVHbJ7XbhGSXX+2nscBJGgOg4ZbjkTe/bEv80dveqHMnvsztsRbb9jGHfcc5KSrMWpwyRnJKR+yFZtOfpsv/+EbFv9wWhGYjJqLXnczbtV2khmWc1FqEe7P6Apo2fUd3Q+zx7h66yBfff+bF5Nrn2ZHfyqUfRZo/Ds5Tiu0S1/nO5XLPZ3j9Ofv//85VAdKmVNQqifd/3yPp/rclvw9ETiw5z6ULjBEpiYOc3zPl1i/66VyVyWdsFJK7FojmJQolHiyS9eb6LqKqHQu5oaAojN1jPm5aeoOJFXSUF0KAyOtghAcTaUoWw0q7yibhtpDWRbU4kvOQFuTwnom0gp2PHM1hb6HOz7/DzzzuT/MQtUl5o663RxgvnaooqQzsZeT899k1eaXk2wUtBJHDImNm57N41/8ON3ZDgMqodw8SjUEiVKJGBN1FJ6DLZr0PPwLbUUVQB57xEhhPFu2bKW5fJi4/CZC8BRZcRWT7391RmsKo3PRlLhzk5M/U0qMPfJ1Vm7UTIxPE1OLrde8Gh/Frj1kNNT7XrSwY2DlNrpqFa00wf5H9vCsay7nEw+3SI0gdaLbxQchGMdul1BINK5TCZSY4Djn0CERuh2RCNY1yQk6EDshIzySEoiXjju4Si6YnoOeShhTEg2gNAEDQZwOY0yQzenER02hTJFrQJDOXy9mrEREJRd0QvvE104s5/bxIb7/pc/jiQdu4di3/5VfffEF/Mg/jmPsMlqNgjqrUYwPaBXR4icssnaTpY9eEHRjSwErvBPX3LJAeUGltc5W8lFTFGBiFGVVSj1nFgQFljXDWA3B421gauIQA43lqJHVzCwsYDUFLkSWrVnD1NwcWjexGlSQ3Y/WhoTC5FQ+Qlhk2eoCnRcoa0s8gFEUKeGzMZBPoEyRf4xygYllpPjt6Tz/T1ECbWLMWnedcCrxlmsUN26a5tt3HWZkyyBf+fuv8ZGJq+ms34wOAacSsepmox1Eu5+ldyGKHEiRMLYgBIGtUy7ICtC1xGcmlHgA1MLwtRky0jqPC5oN4QWEkBFmK1BzCOADptUUY4UMBVI5QkiUA03SfEVKCwQS9XwHoxLetyEWBA2r3HEmjuxnoNXm+LFxusPPxyRFxsOAdErxp3/2S0cB6bT/P9P9z0D46z2TEhf+HuFw8XkiShsGEtzxp+/k+rd9gJmTj1EDjG4VkmdUi8U3arARdAtczQdvn+fZu5/gtVdvIGbDHsmXcPz5jz+Xz9x2J2xc3idt9Y59d93P3r/6ubO8l8i9054X/OjH6azZQSqH5P0k5PPqnXtvFOArOPgIpjPBRRs0X//Dty9+DKd3oefj2X/auTwtaVzvNZ7SGfDU5/wvL/7n5U9wlqJ8Cnch5Evr/Iv+d8QFWPI5KQquftF/46Ev/gEnZ06ycvkqbvvCzbxy10sldx1AC4Ip64kUwVLLJreTSVeVMrgQSMozUDQoW5uZ85rR7bvpPPgQhw5/i+1bLqGuI8taTYaMZb6qaTdLusFglRQmZQrmFhYoipLZTpdCOwa2voa77/gdrr7yGh7/9r8w/mjBxt2vxrma2osyqShLQlVTuyeYHLuftRe/mlg7mk3DfLdDERNFawWhWM7AkKbRXkdFxCiNLbTEJ6SEQdxIQynIQEDhosMUFmUFxtdFQaeao1zzPPY/fj/bVg0KG10J/F1oneFihVWSQ9/bSOlMNI4E5qf2M7IWDu0/yqq165mcdexYfoGMRCJE8u8wxL6NR8sWrL7gORy878OsWLeDwe5j3LjpWu44IYFFIUWsNeASPgaMj8RSZxIixNpjkiF4USzolPC1IyohqisfUMaQXJcYHNS1rCcx4omosgAnXgYKpBYojVZytSSXOWM257nmcUjK6aW9MUBSIiEVRDWzhVQDYz1FivzhR+5k7vgFvOY5V/PN277KlVcM8Mk37eaHPrKPYNsoElEllCnRQWGNF5TdWFGJGJEF2kLjXSTZAm0NJiSUEylgGBoiaS1NrEokZUWiqS0paTx5PGskVVEyY/L4K2msGWJuapxYa4htbGES3ag5vO9Rtlz8LJQaQ6OxWuFDLeuqV5B3Y9b24H6BWZOF5MU+VtRVWtj22qKSpmg0CUnkgj2DH2UyuSKzv1MIEDzRaJnnJHFSGk5dtvm93PKlQ6zfvpMj4zU3H1lLd3QjDSKubBJcVyIukXk/REGAc8epDNiyKYz9DIn0iHUxCplPIB1xaIpOUplC7WRUQWb8VzUqOUwQGZ+3BhWk648hSFgOkeSEeesDqO48bnoCpQzGWqI1lM0mLnpCcpQYdJ149/NG2LRlF/PTY3RTg4uuewmJmh703wvxlQW3j1efuj6GJPKYPrGvN/SPT7rvk1fkxZnzk+6ZICmR52wbhs/9nzfzPT//ccbGHyUVBSxbJzb+yZ4KUWChPUKqPD/64W+xc/NKrhpt9N+DUgUoeNmzrjrF04DMSbjzL36GPgW2f0g3/9BczRWv+yBm9UWkxvDitp38T2+voxMEDwcegvkJLt7Y4NYPvEN0jv3ng/9U136243Q04IwFN52h6/8v7vTPEabT//t/lkPQe6/n8zwqcsa3d/rndTb5ZOZgJGU5PvY4g0MrqOua9es2iZ/Gks2fSjKV0toKl0lDoRKVk81Hq2jgTRCb4MpRJ8/w1T/M8Tt+nwsvvZSD93+CiaGfY/2KZcSgMKXFliUqJRpFQUTRaMg60CoGs/nKAF3naQ7vZsMNv8oj9/1fLrx0J2NHPsPtn/x7Nlz0KszgOrZsu4S5uSMc+PZnCAsPcOV3/RFzlfjkRwVF0cD7GmsDddcyMLya8aN7aK9XtBqWbu1oFCUDSjPStFRY6roWF83gaTcbtBslNiWiliI3c3KGVvsCNl26RULJiFhtcSHTcAv5yUjnLiTnHkcjRpHi7bvlg9jlNSPDq5idnqVc9zy08nR8ROW5OUCIAZs0LkKRNCNrLmdhzSXMnjjEA488QXthFZ2whlJZdFHKmDQX4IDGKCWcsQjKRGJ3AR8ko8X7mpSdAJMLRC38reg9VmtBLp00clobMd5B+Gxa0Q9006aQ9D3AREE56uSIXqTnGJU3AfL4pMQBVhsrDWsSh0QX8gqtDH/82cM8/4YbaJivg1as9N/mprUtvnA80ChrisZAXyXhkyHplA1VI9FHjBZHSNsoiS6CyrbytsCS8jhVU2QFko917nnEmh8ViVqkf1pFUva3kRQYRaNsMotDBQPGY33taDWamOVrcN3/R9t7x9t213Xe719ba5fT2z333Jp7c1NuQihJDCGYUNRgaEoRHHVQBwXnxYh1BEcd+6MIz4OCCjODqDSREZQSGZVQYhIIJKb325Lb7+lll7V+Zf74rn3OuTWXyLNer7xy7m5r7bXX+n3bp7SkjdILOVoEeiToUxkOeJGIjAll4yoTDEBVxgzGGHyvCg8BHeMqyE9ph1ICXjBGEWKlqkdEa4uPvqJ9l/zmD49zmVng0Ew/erjB7/7DEdxzXowxEa9krtJrj5dJkpZQdonOYrRDlQUoK4JCiPZMKMXwIimH0XWCbhNLLzQSpLWSvJgrpCwj+IRRBlVU5yYqok2YdleAFSrg52cpTxzD+0BeeYYz3ERVc7SgDSrLZfYTIK81hb+qYSm2mfQPc/s/PsLIho3E5jYmBqckg9Zi99qDWq4P7D108+q6agTYsj4En2FsfubtXMAtJUE3VSIVz56q87f//Q289tc/wuzxh4ntBdi8i8or+eQdGgvZMEVrhWt/7U4e+eOXcEHTnNSlWD9flPfL/kZzt5q5rj/Op4DnvfFjqB3PIagGUrZkq2IiqwdQGTilAw9C5wjXXdLgs3/4NgYbax94xhb3WShtZ6RNnms7bSRw5u7LSd0AIKVKU+00FP66t6zj6p9z/+e7nVfwrkYdZ9vOJ6FYFfE5SwfgVADk2faBdAH660M0G00WV1p0Fp+UDmDveSWLoUFYOMtll6jEwdRoyFKi6GGSjIjnEDS+/zpGLuywePAD5NR56F9+hT0bX8KV1/wADdNXOaNGdM8xxAeMdpCgVJGkAtppaqoky7cw8sL/h8du+yO27LiAHXqaRuNb+HKOww/VKbqL9Jk6F1z/G7R9TozLuCzHFwVlt02yOaqcpa9vEV1OUUaH7RuSvLFSIjXOUsZEu1ihbjNUDAz3Neh3Bp3EaEgpaeP39Q9Sqw+sYn2ouq+ZtWug64q+q7WuQHyCQkoqsO9Lv8XozgH2/ttBaoM1fP8Lefa1P0pneRGfNKaSWQawVsRAUpTAWB/awsjIEM4cpVVO8Auv2sWX/2cLrKGsgHG6KEkmE+xFCCTviWhUKEhlSUyJVhDZXwViZ5wEQJcqmnrhhWufQimW7T0BoBTkEjYZRmtZK7Qi+KoTEKT1rqNCRYjKo7w4ESbEx0Z49QG0xWoBYZYkbCagPsGRKH7yHZ/k3f91Fwf27GN8Yph3vGIzd3/oKeb8FFa15dxEBVrk40UdMILyIrbnjIjQGYMKQczlUJSArfBzXimMUWjvSFnCFCuEZCAX58EU5V7rURtVsmhTMHv4cbpFYmh8G9OzJ7D9g30Us8uEOIdPI6goHFKXJHxE5YlRo1MSnmdPKU8l8BAzgw5V+zlVqFsEIEMApQU9q60RXn30VRYTRVJXG1KUWXcoAzZ06NYcl2303HSB4ebPP8GW513O+z92N+3x68lCSQiOZEr5vJSwzuFTIEYls/qqEyD7gRSCZFpBsermZzQ4CyEXIQWQ95hIwlJ6MNpA7BB1QtsaKnjQwh4IS4sUZSFUkbkFMmNJ9VxUsnTVkiurdrQzFEC9Uk5MaFwG6Mg2bdixezNatVDNQab1hSJIZCTY9ARN1hKAVGHu1vmpV0A2XWWoskCeKfivm9efbXE9ZeHtjfWTQjxBgOsv6eOHXriDj9y6h5WFI8TmMAxvBBMQ34CqCg9RbrR6k3JpkWt+/lM8+CdvZLgGjrMlKGtgQKUEz2kqel5HOa772Y8QRzeRTL+0urSqgr+uRhChgvEm0uH9sHyczZub/J/3/AzNXCG0qPMI4qecozWanj4zMO7pxIPWzubpz51EMVTrKuTT6XhrFrhnCcbPBIh4vqOOc+3vpM86S7LwHQQ1usYEqXYpJ47fytS2azh4YJ7HH/wqF152A2I9JqOphMzc8xIKpWVhVbGywhUnz26Q5D9zBt9Zobb9Og7c/2ku2lljsNvi+PKX+crfP8LQ+DZGRi5heHyMh++7m2L5Hpr9mjI1ue7GX8EmQ5YJJggrjoLawa4X/TJzR/ZSDN3P/OwhUtFkYHgHZd0ydcnVdPUFtDvzqKQwJhK9XNe1WpPHb3k/26d2MDO9yIkV2GxzWp0WRikaroahJKqMmrJkQCO35Eavsh5SjOIPrzTNxgCiirgGJtZaKtveVSXCYbHCdimCipA67L/rE6RyjiOPz1Dri5isn23X/zCdlTY+mUpzoVJ2VVJvGgzWaULy5Mry6L33MDFRY+74PAefuI3+fDdL3RzjXAWmlnEM2oq+fZmIYUX6fjFhQqIkVPgmA7okdgtS8IKHCKlaA6OQgLSR75Mi1lisgm5SIkWsVKUSK+ZNKilCdT7IMrSv9FdSqG4VGcmqSlsmYrBW1nJlIZZJ2F2hSxhu8P5PH+PP334Ne+69h4G+/fzej9zAz37iXlJqksou2maghK2SfEDHCj9mKhZZUZJSJLgcYzJS8sIa81Ek+CvNgGgcIXNkRataemVUkYhoVek6oAS8XfSzcdcNHHjwVtqtaYaHB7BRJVzWgG4/JpVgDApLjAU4jSqtCBNoSQzEzS6Qqna96haiDJuczEl8gdKZVMFRuLXaiumDURW9r2rvqCAjgYQSxL1OlHmT1JnhQ2+/ms995ne44OLnsbLkuLN5DYMTW0lG9LR10sSii7ZOFJWcQynhaVL9l7RYKqI1JgaCVtImLxPaR0FRarlQfIwidOFLlIroWOI7Bm0N8dARAl6oKErJyAKhjDpjSFmN4KikhA0+BGh1yLolwclMKZEorSWv58RuwiWLJ/LCvgc4csiT1Zocnim4/Hu/T2rF1AuPp3L11/6WKkeiRS9m6F7GvnpDn2P7Ntq2vU0kUOBP3/49LCxHbr7vEEuHH8C7OjQH19gBvbZ8EGlQBvuYnots/KnPceIvX8mIOb/uhDbCYChR3PCLn+SpJQcjI0LZtJUkcWWuIdWcdEs48jjMPMzo5Cjf+NO30MjXfBOedjtbS/tsXPvzCrpn+LbrefOVeFCPLbFeo2HN7Ok8uw/nC0b8TqkTnvY532YSokRi69vCESR4wSt/nFs+9jVay7MopZi57yPs3P18DDUxwzJarg8imXVQSns9VOe2L8tY6rRICay1lD6IaUoyXPa6P+HQHR+lc+yTbN6yjYZ6nCw+ycJTX6GutrF1ssB4xdxim4GG5ol7P8fOZ/0ANTTW5rTKgryqgoP3DExsg7gdvVVX5mqOougIpa+7BCScNbQ7JVorXDZI99i9bBh9nPk5TYiL9G97K0W5wor3+OjJjSFicCHRl1maTlPLrAAgtegPWGOFa79u0ycloqdfl71VJgCLT93Lnvs+iV9+lDI6+uoZ6BGmrvpZtLeEJADQkKL0jRVVxQk146qRgmFxdh/PuvZaDu+9n4svv4Syu8C4X2HBNOkV51FbnMopy4IYBLmfkhiHRV/gY8AFjUcEb1LKQBdCMQ8e7QNRI5W9zkjOkULERiVJoXNoEtEXkBLeVABbHFglrA6kkEgmie6BdhUmIFbaMAplssoZV6FdJnbxOuJTQhkD7UUen23w+a/u59KxnJv/+Wt8zwsCr5gM/P3cLpzWlEWJiQrlNCp6UFHMfhB/D50ixITGr1K1k1KYCJaSspq5KxBwZNYvivzK0nM/TdXoJiUv1NisQ2fxKDZrYHRJe6WL9a0Oy9MHcHWLxuA15KEQYZwgFpBKa7k3UyKlWAHrQFUXWjJSqunqpGB0FYRKWZyVCDnEqvXkK3nDHmJTWclUVLECwfP6Z/fRx3F2XHw1cWiMn/rIcRo7vgtNhxhthfZMmKxOCCWOSNnpVJxdLzExJVAWY0VK1nt5XIVA0hq0mPiYblcoiloTesY/SaFcDVuKQUaoqEMxCUfe5Dm+KElOU/ogAkAp4YymVAplLMonupnFaYuKEV16VC1Q+CgXTy2n7C7z3A0ZrfkO8zOzLKQ+RoYvIMUuGmlXUt0EmspoY11ol+5AWm3pnSruc1pVf75B60zz2AozISMiMCrno//t5Xzyln389J/fzMqhe4ibryX1NaQTENMaODAlGcD2DxOXWoz+xGfpfPhVZFKYnHWLFbq5SJGrf/kTPHhsEDU+WQF2et+jZ/erJZ4QYfpJOPJvNMcHuP3/eyNTfT0sxbr28reZ+Jw30O+k83qWNOycUrlx9f8prVX8SvVGPufX9ldJBJtS1arWZ3vfub7XM8EHfDvvWT1f6uTHep9zrreqiDINavVN+M40/f1N4so0X/yfb+bGn/4YJkJZyYnHqsufaw8eTNJ0fMAoL2h3bStr40TNGUKMtFYiE1e9CRVex7EHvsDAxAxLCweJ6iBPPHGMTnuBLMsYb2TMduaw/S2KzvdQawzgUiDPLdpYFsuIjxEVVKUsmog+EpUg1Xs22i5pnHNYq8mzjOLQQxx7/M+JBIwOHPBDXPWsa9BeWEa5lYq/C9TzjP5c09BgdC7U51T5IGjwiMUseFIya+ygqoMm11lcvc9T0qTicR7+2vtZnjmGqec0+sdIqsPykmHbi9+CbW4mpi4aU/nEAiRqmeB8ooZoBIGeKcXRx/+Wg4/fSaOuGNqwjaVjy/zcjcP8zOdBmxJsBu02RbEk82siZfBQCFc/oQXNj4XSQ4j45NFFKaNnIsGATeLGl5xDOCBBmMHWVpAz6RIbVxNqYbdDMnLAKXnpTvmCFCNO6UrwrkrMq9a9qQCEwnJLshcjwPBUFJDVSO0F/urLi/zqD/Zz+bOez2MHDvHqyzby5VvnWQrjONUFJ58VjEcrGceIomFRdW8SxgeoGBgoSNYSyq5U+UljTEB1Rc3QBOk8JXKofhXxcnCUFJjCMb98guGNk8wcO0BReqyrNRgd28rS0iHK1hIp9a9VHikRlKnkaBO6LEhazH5M7LX8grRrbNUjxlYgPAkWGC1GcsYJQt9YrBX516TElYkAIRQULueGzZYffx58+uMfZWr7Tj5xxxLNLc9Fa0/QFiq9AasRxCdUOINUKVFV3P8kfNaYkrTBrCykESNc0lBik8YbsZRRpZd5TAwo7SiTIqvVCCvLuEK0m10Fsos+iAGIEtWsGATd6dAkrSsnJ4MhkYxCG6HtWERq2DpL7M6T2pGdUwsULQO2zsZNN6KwYLqkdWX8eq/19YvlWmeg+inSGsCqNwM9PegnadOvX2xPWlnP8JiKq3LQvc+OBFQMvP7FWzjRuZ53fvhbtA/cRtzxfFKjTg+3sAoMNFYSgmYGK03G3/wZZj90E5b89P0BMRVoZSmj5tV/8AXum7MwMbEqWUoF5Fw7J0rYIwfuhJPAgAAAIABJREFUgvl91EcH+PIf/TQXbhhYO5bz2Z5mfn3OzsC5Wv7ns50hUXtGaHmQViqRWKGF5UFRhlvd19MF6rMyFHrX5HkqE57nMT/tY+s/H4hqgIlLX8fSno/gav20E0z1lTx42we47Lq3YlMkKSvfX0U0jppOuNKTG01ICqOhjIluCNSMld2GhNbS+YwqZ2L3q3EmY6IGoSwwxjG/sMhgvZ/9D/4xfZ09+LLFV2/+OV7ymj/FmIxa0hSuZEBrPDW6XfE/6XQKrLUCcutV6gZsTGT1jJzIHV9+L5uHptlywSUcP/gQC+mFvOBFbyWEkpb3KJVo2AynIi5EGipStw1RtKPKh8MSc9PHeOLuD2NZolZr0J05hDJ1VlpzjE5djs0Ms8cO0T9xCZt3Xcfs0Xs4/OhtGGdJZZsYAs3hQZr1Po4d3UtffZLLXvY7wrqJHqUzQmX3TkrYyvgts+BMVk3lDPf/029QZ4Z63xhDE4MszTzF8RNHGTQPkPzFJJ0Tu4FYdEW61xgoFcp7bOZorwr4SHs7VLbeuqwEdqqxnkiPCzXZVIqyyjhAodHo6AGFspZgZB1ULhN54dTFOleNTHJUZxmdJNYFXVUcGlHFVUb4+jYSjSNhsBWuQKMoyg55XmchJG5/cow3X7+Rxdm9DAzlvPUFTd51u4jPmZjoqiiy9EpLjFIK5buoGEkG4koLVfOYeoMQNVoLONGoyueFBCrgtSXTlqC0AMK1khgcjTA7kkHpxGCzjz0PfYvJzVtFYt9aRTe2oTaOaVpcKTN6ZQzBdzAqgRYan3ZWWjPKkIIXEKDJISlUVAIh1YmYhIqnrEEHi7K9jq3wNGNFGzZKC5fTZKjUQfvIT17douMTu664koNphDvoYyh3eFWB3LQoMUUvaH0VPTFEjMuwwUvCoQA0vqKyqBQrzrASoSJjiB0Bh2j0KusAregWkcwoslhSHJsWg4tKbMP7EocmGo0ySZgGIaGjRmVQGoXpllCW+MyR5znauuoihNDqoOsJrKWW5YzN7KOzGDhweJahgQYTU8+VtS/2YOy9wJZW23aVptVJwV8YeNVMj0oL/ZTF8oxB6ttYqGWsv/64IGmHQvG2m55NKDN+/a/vZOnAPbD1Kqjl1ct6+6+ChTHQV2OpXTL1y1/myHteRmIdML/aNMKLHX/L/2KhGEKN7FidbSml175hz7c0BDi6B9M6Sj6U80+/+UNcdYEApk4KVKcG6fXn4Exc/qc7P6edw3XIhrO24k9BP5wpUXsGyPyEJSpFSIHlDrz7b+7gY5/8FAf+8f2oaCp4RW8UwsnXxtn2eZbjWJWoPte44Uyfeepjz5SBkMQ6/MIrvpc7999FufgQKyuHMHqc1P4Kj6QBdl33erLKnS5WV1lKov+vU8LFRA1LERP1zJCSKH56CyFI9yREGSP6WLK0rNDWiJW4zllGkY28hJl9+5ka7menXeKOT/04G3a/gYt2vxKLqahYDpsnkjY4a8kVq4A7bRNFUXDs8bt48N4PMNBoc9lll1EUNQ4cvIsT4TKuful/JhYlK8EQKdEVLigmTy3LGMglGUjJoHTk0IOf5bHb/4TRDRcyPjrM0hJC09M5RjmmLriIudkT6LamEyODYZpHvvXXzBw5wvjmDfgiMDwyRae7ROqUzGUd4tBVXHTjz1MWGpJaK3QqjQHR8U/keYbD4g1Awf47/5LJbaPMHl1ioLGJfGQnc4f3sHHHxWyYnGT83pLZarQarYIiQvKkIOe64wNWASslwUEICZ28sAy0o6QkEki+EAt7pSBZQqeNreXEpAQUlxIpy4hKC+0xRrQxlD4Ish9VVdpdwQJkDXRKpFiStPjbKG0rxUdJQpwVO96e8VGMkRBLTF4TzNnSIn/1tf382PftIOpBYhrkqolI087R0RtJqY1VAeUjUSnI6pACyVpJ3IPH5pB0oIiJXFuS0iJ1nATZr3zA2QaBAh8S2gSckjGJrjAuQls0RGUouisMNOosHJ+hNBZ137/8dvLH9+JGRhkYGePqP1vGOYNKSVooGoJPZMgPHKLHRuF4pgrVT/KoUKBtTXSbq0VXijUFylXd4EpSMQnfXxFJpSeELsE4Xru9xdtvGuPxR+5nx2XP5wOfe4wvmotp2BoxIDMgY4XPT4Qoyk2ieqRIWjSbTYKoFdGY1fYeIRKNwlongJFWV4wgbM/zIIG26KIgEvCHDqEwoo2pDRQlqexg8obgAKqEpycOoU1OVJ5UlmKVHATZahpNVO5EkKMMBGsJNqGynDdvPchV9glibom2j+/6gT8jRgeqi5i29AIuwJqwA73z2luIV/+dUElV/NsztFV7C/AZFtPTtlNel84gkbu+K0CM/NLffZP3f+IeuimH8Z3QqK+B9FZn770A4GFxmZuuyPm7t11NLauv7SslFkLJtjf+KYsjF0J9HKxlVbIv9c5FrxOgYHYaDj/M2GDiH37/Dbxg5yiorPq8cPZgdz4JwNmC49OOVtYH+t6xm6ffPzwjOmBKBnTgb25/iJ965xeglpN0wKQOfmaWWz7wM1x75a6Tz8k5qvzz3k79Dr3P+k59/ln2t4qNIHLbF/6IYTvP3PxBUpEYGupn/7znhTf9Gv2jW+X1uif7ve7c9qxoq/a81poyJIoU6BYBjyQFKSVC6gmrKAgRjSLLaiwd3cPRh97Nhg19tOaXcAYWo6ZsbeWS7/pBBiYuQGtLu9uiWG6RYpdjhx5i36P/yHDfMgPNEXK3yNDYKMnD3Ilj+Fhnvv5Sdl/5GlIoaSdFx3sKX5KhyI3G4WnUc5omk+IqeVI03POZN9ONmgsvvogH7rqP5oBDB3DZCEWaoZH3kfcNMzd7hP6hCZbn57BWs7y8zNDAIM3+jLnZo7i8H1e7kp3XvRKvhtEx4JPBp7gqspm0krqv8n1TxoAyxFDy2K3vQi/ex8DUc2gvHeXCF72L5SP3sefOP8THJnPHDnF04iY+eJcnakvqlpRll8ysMbeCNvj2CswvEGp1yHJMCIRuQQieWBai8+ELkrXiTptnEoOsFjxaFGZWMhYfAkbLGCVqi4pdsaK3DoPB+wLlO8SyjYqaZDXJOMF/UYj2jbJSMFaxzWSuEmwLpFD50RQlhpLF5Rb/8QVDPLu+yFIxw67duzhc38U7b1Y0rJdRhRc6YTSqAtJDClpibyghWYzTsq4nVmnTJgQpblxDCnKlAI32ntgzMUpVwWhqhLLFP7/hMAvH5zANh6lPYuuNJu3+UVJoEYoloVAYi/GAjvggwhAoabEabYnaSxu8xy+sNJzXTDciwThUCqvzHGKlCuikC1DBF8A6bPDUdOClu/p4+K57WFxeYMfuwDcXNzAwPkRpfGXqsGYZmSrKRpkCVtuqZa5QVmR6e3TEpDVGi9GFVpLZi1KU2B2noiAFDc0cow3dThtTyNxFaY0qA2QG1V4iKJGONFoUAI1z+AoYEkJZyS4a4aNmGaWWMUGGuGTF3KKUo6ZLihB51Ys2Mv/IIn3NjCfn2gRySKGi/q0Fdlmrev+G1Qp8XYAQGo9iffF/qmXwd2I7GZy2vorV/P7rr+ajX3qC40dXSMUy9NUk4CXpDAkgq0KIZzm4LlsvGAa1LvhX+3h4zwkYnIJYeX3HKG/VuqrqYW3MIDoJSkNjuE5dR3zMqKY+VaDg/APRec6hn/Yz1PoW+am/Q3Uezjqa6F0D53MMa6hvMPzmez9JPRp8p6TMNKWtU9+4jS/96yM8/3k7Tn7rmZKe893Olsj0tm+LZfDMNkGtG657xS9y8wfewPBQxvzKcY4fP8bohgnuu/n3GLnwKjZediNDA1ulcAHBLiWZUZdBuolahoFYm8gQEFs3RDpFQVCCWYrJ4CspYK2hXRa4ye2Md36U0L4TVZ+mXo8UCytY9xAPfPUeOq6fgaxJu71CKtr0Dw4zPNbPpqEOMXZo2hYzc0fRxjC/4snzGxm/4sVs6hsmlolWVLQq+d8MqTwdkDtLpqTwiQgAbG7mADYu0xjbxv4DT9FoNKn1NVhqGbY+54cp9Qzz+x9gYXkPy8sLBAU1m9CuQWPAsdxqoxpNlrsTXHn9W6B/Jx0Ege8RB9ikQMRoJCAZW3UfnSUlRXfxIPtv/yuK2fvJmsPkpsV8filaWfonn8Wu3ddxrHOMxW7JcydHKYsTKIfcxynSWVwilQW+26G+YYzuwjSmU5IZR7A5vgRFEPR8Esw3UaG9xlhIpRyj0RlJG7CiC2PRYIUah48YXRKUIeU51mT4ooO1tmI11ImVF0QIMqoOVBL2FkgGXa8Tkkis6wQB6UoEHdG6hveJej3nU189xmt+7Wo67SNccPE1DKxM06cVaBmPRwUqlKhkUc5Kd8sIAyxphQtBNBa0qeKDIXolFskpErtdlFUQrTDWnCKFJGwBJH54uhAz/EoH2+gjKY8vWtgQNc3mCItLLXQYIMQWqhOISmOiEt17L0Y6xllpe7fbmLIDmSPV+9HWEYMH5bHKEWKB0bm0T1ROtEYQk6bSDyiC+C8rwQKY3HDFmKemj3Oi67nwOc/nfR+/m/nmldS0AD6UFf0AQICDFdtMa2nPOZ1XbT6RyESlqssgGZA2CnxEecEJdH2QmdXxaYqlJXRfH6XR6G6HaCxBgU2GWHP4/j4ouqjWokhi1gQjEFEol0snICpUDEAXnWUUwcsF2+2i8hztLL6ELLPQbWNVon38MMuLhzh+pKS+9fsrJOz6wC8V5PqgL/K/kdWOQFSrBj8pgdLrGvVKnV6BPYNRwPoQJaC0XiBf26IKfO9vf5bFIyukwUkY6Ks+M0oAD72vEKVcaM+xaaDLe37wBlz1eatDD6259uINzH/otex4x1fZf/g4DE+eogukq3S4+u5DAxC28+RTB7nqnZ/lG3/wQ1y1fXSVkbj6/c8U8M6WGJxv4DprJ+AMo4DV//veC9ceP232fw7O/Prd98YgRN7whx/lyAGH6TMiAOIhTyW+LPjzW+7mh954HbvGhqqE/TwTnfMdD5zh3K6aUBFPv/aeSWKw7lhStRjKZrjppz/N43e8n076BiPDlpXFOVZWTjA8mnPfp7/E5otfS3PbxQwNjpM3N8p1mUQ2t5Mi2ivmZ/bz8F2fJZULXP+yX6Avb5ArS5mgY2Cl5RH3Oo9RYr1adEvqF1yD62zh4a9+mMX6XlbmSjaMDjE2mTMw0EcKBd2OIaYGgxsvlnu9c5T2iuLovGbnFT+HG76S0foAJokyaccnCu9plyUxBUxUWJVoGoVTiXqWYfVaFy4Cs8f/lW5os+uiF/HYw7eQ+i5n63NeRmhOYlDkSqEHr6FuNbWsjqNDt7XI8aMHGBwZxvRtpF4boCzaJKVRMWFSqmTCKznclLDakAjUrBHqtRKhmT1f/zhm5SuMjoxzvNPAmjb/dv8iN77pd2QpMIonFxVq+iAXbJhAqyOYGCDWKHyXYmEeWm2hnseS9oGnMGWBStCenyWpEmwN2p7kO8RqPU/JSzAMBmMUCkvyCVgiuTqYJIZJRPAB5RQ+IqOg1CGUBdZIgYnNSXRBIeNlC2VKZLUmZRAgbiKSgseaHGIUewHnEMC7xeQK7xWuPki7NsLehYKhtuOBW/8PO6/YxRVjJXefGEa7VLn7iT2x1UkUECsPC2Ms0fTAhsg4uRSmiELGU8YK1ipqJUJIvlztvIZYSDcgGUnUjCestOjr68fXa9huZ5mitUwwisWZo2CauLxG7IYKIZogy1BlgS9KVGYwzoKuEcuuBEZXI2GxWipyYw0helSyWCt61bqiJGiEcx+TaE1rLQ6AV9SOUbRaHDt8gqGRp/iX4xmNzSIiITaOqQJjiFZ1rLJPZzQl0kpJMUKey7yn9DjriD4QY8AowQ+UXuSDs9zRXWwTl9u4PKPoeOqD/XRjJKLRoaRMBVmhKWZmsblBFXW0cjjTpIhB6DyhIMRIiIbcOApdEr0ns5qiKMiMpTu7jG46skadbllQq9XQKx3U0lHqtQGyPLH9OS+GWIAClSrdJtVD6Fac3l67v1pVJbjFVYvfc26ri22v8jz7wrp+IY9n7CKcvnC/7A8+zdfuPITqG4aRQblJe3FrFSScQGnoLjE5Enjw976PHCXfd1WeWfblsdgE+/7gpfzCX9zKn922QLfZhLwm/MsYKmUnEHyBJY1tQhWROH+Ua//bp7nvvf+RSyZyTtPtP9d2WrDrJTFnwAWcFOzS2QPpGVH/pxzLGYPhGhPgXK55MYnX+AkMn/n4P6NHd2G0w8cuxuhKhMsy325y8ff+Bk99+b1sHj3LSONcFf3ZtlXgYaWncSpgMMFJ18zTfO45xx9nwySgQcGO695GX97PA/f/LbaWs33r5ZTdyNiGKeaOfJG5g59nX2cJ8inywWEWZqaxQePMCoFEf32YDc06Bw4+yh2feStXvvxPqA0MEMpEw2SkGix0CnxMlEnmsrhAKBLBDHHRy36FQZeRL0/zjbv+N925e+gERVEmuq05arWt9JeDLKs+4tRWdk2+kOVahi4d3QixK+I2QUm1aa0lMwkTNS43GErqxlFzip7+fW87fPAB5h+6hVpzmGMH7yC1A5PXv5FllzNQCdqQItNP3o1jjk0Xv4Isb9JwTTYNTpBSELGkbiFFXRRPEG3AIIWHNeslggVAvbQ0w7HHbmVh7xcZ3zLAShrgxNFj5AM5M8v9vOxN7wKi/HRJs3R0mcZihydn72dgQ0m7M4ZTFoqAbZeUCpIPdFKBjREVoChLWcOPrECWEU0dlaKUDcmsjoRAi6yu1iibUF5htFgGO+vwpXgCpCiVNqZHFRdKsfSAEmUMiCuKh+hwLqMMAWcUSjmCAm2d2MWXnmQ1qBybGYzLUMZgfYEqA81awe//9W385X95HU88Ns/ikaO8ZNdG7lzIhQkVg8gQV94uMYSKlijPRVUdX6WyqHQl1BcVWkdCMjgVieWKrIsuQ6fa6mt1lRz4EryPZLVBDh3cg81HUA/d+kepP3OcOPogfaM7ue4vWtgkcwwTZOfaOVK3I9mmyyoAHqiyrAQZFCkJ6C/ZOpQdUQMsI8ZWCHatSCYTqd+ykJtcAUXBhfVl3vdTF/DAXf/GZVdcyv7pIX7p9haNvgGZi3hRTIpReLwqJkIpLlK9m6BUBpeScDKVkTmRroQdKtR4SBq6HfzcHH5untReAVXJMXY6UGuAVliTCZgwyiLklAJridaCNSTtyGxFLSwDSiexovQRqxJllE61rjAt9czhnEM1G3Q7LYxOPH+T4yb/t2zediHLZYvx5/0KOy98QbWYx1W+fVytiyvA4hk6+qK2pST7rGZECf3vd7lbX8mJBppoJaw+VqKi5SW/+RFu/eZRzMAk3Y3bwTUk2Keq8l+dtwYIBZNmgYf+5BX0Ib7V60GLJ3GUZSeg4E3v+TQfu98R+segVoPkq/KyF7BkTKBSJC3OwIFHaYwP8eiHfpjNDZHPpBdEn44Cuf77P12Ve6bnn+7xc9AAexX/WmVbveQcCQBJxLd+9n0f5RN/+290VROX1QUMq3vCVxYKT6r1859fsZt3ve16pJHMyRiJ0z77PGb466vyXsX/7cEXvmOb6um7F7Ps/dYnWVl6DDpLjG7awVP7nmBodIqF4wdIlCL+F0owdSYmt6ONYnnuGHUHC8tLxNRluryKV/7Yr1bDmMhSUdD2kZWuGLOIkVDlDlh9Z6VFgc8oRe4MVhvKBColfEwiXJOSAN+iwvaQ7Xrd6DL1TL08TmlqWuGMANqgAlCz1t1KfoX7/ukXqGf9lCkwO3OcZbeNq7//94CutLKjdCCd1tz6mXcyNT5K6ruYS593E0Jmk1za6EpmFiVBlzWsjQIKPLEIzD75dQ4f/CZm8THGp4bQapwnn/gmRWuFDRu3MnDBKxm/+KaTAb6pZHHhCWbvfi9J18kaTd78scR0YWkvzhC9QhUFMZSUoZSqvlpQvfdSwWsrlrwaSsDoOo5SKNjW4LSs6TEKODwQsLYpfgGxGtUiwEWP8Py1QRgEsepMhy6yqgdS8DjnSCJELN/DVv42zkpHoVbDZRmRhLWZsMmMhqIgdNscXu7wuisWef2lG2nN7OWSF34Pr/rgk3TNuFghKy3YAhALmKQJmsrIqop7PgomoWIlGEIFxjVQtjEVRT8YizLirivXUwYaisXIv/zoo8wcPU5Wy3H9m7EpRFbmj9JojNBeWSEzDm1ylO+i213hQpZi0KOcRnW6aKuJyWCVIjiDUgablIx4U0AhN4A2iVI7NKLOp3xV4VpDLDxYjTKO7750hHu/+XW6Ldi7fx8f/DrY4d0E4+SKtJbkq1lT6cVFTzlAxhNWaVImGa5CY7XMqnRSpMJXrk0SurqtFswvYaKirAKqjqIL7UuPsZZAIASPRU5uzDJcllOmJJmg1hSdNq7TFWZVyghlQTSIoJC2qIhQi2q1VRpiSoparUZsQzMd5rLnXsPi4iLa19i262pC8mjdU/87ORBqVCV402v3VyAUkMBPT7KzaqMTTx87n/KJ5y3YgszmzmRI9Lr/99Pcevc0fnCSOLUDXCVzSULFyvERRJM/REz3OA998OU0fAkuW0OTc4bgL7smqchf/eIP0Prdz/K5fYfopg2QN6UTII5VVOgu+bt/DKYKWof2sOPHP8aeD/0EU02x4TwvXN25qG/nCoLrD5q1YL72WC9h6QVM+ftsFe/5UACVMpWTJjx09z5CfRQVO4TqbiAKMDYATitCscIttz1IetsN504qzmc7Q9KgqrxvFbD0/8d2roQ2ikGMzkbYce3PgAqcePxfmXnsHxjoH6G1dILB0XGaI1Pgxlk4+A0GhzZx5NBemg3IG0OEoAkcx7g+dm3p0llZwjX6iQoGs5y6TVhVsNL1hOgJJKHDAdoYQNHpdGjUmlBGCjJK38JpWSvLWI3yYsAYh9GKmjU0rCUkMfvRWq6OkBwhRTItbCYP2FVGkIBhusUy37z51xlyBcEvMrL1e1kODzI5sgPoCpZJa5HNJRJi4Pkv/z2O3f/3jNaXuPvzv02zWWdpcQ5jc4bHtzM/vY9GrknU8DFQy+rEVNDob3Jk312M9vdjlWZyYJgVNrD/vodo9h9jqQU3/NB7yJqXyG8BJ+GGknL0D13KETKycomZA9P8pxdcwe9/LaKyDqq7KMVXcli0gOIo6XQ6KLSg5YuuWAQTiaFL1IuEZKFRxwZHkRQGRWYyYoJcKUJVoNKtjOe0xds6sfQ4bYmV6p/VTmjl1glNFEDpqiMrKnyh9KiyQGciV54ZTbIZSikyI34RPbEplWcYV2csX+Yf7z7OT15lObq/y6Nf/wKTtYvY5wHEMddqGQOkWDk5hoQnSSJQiBlfSg6lhA4flcL6AuIKCiPgeGPQIYJfRhuHchkhBoLSRKtZnlug3hjA9Y8RVMIGHVC+oOiuMLh1Jz4tU7MZUdfwAwoKX/EtFck4QRRqg40B36jJDxR6jlsKQok3NUGHRo9JCGfUykKVQpTWhQHlO/iUc9U28PODtNttHpke5Yjpp1kboEusmAbSZvHeY6y4F1qlxNvbyHzG+IiAy8QnWbIkgzJIpZ7ZisNfiGJSXkMVbQxJPKGVlQTDR4INkgW2VsQhUGuWlxbI8jpFewVncyKB0rcpC0cntNk5kvGczY6t457JYccTBw9z6EiNZQoePNqma7ZidAHG4FXJTVdvYHH6LhYXpsmGL0fhSEoUDNfP/3sCQIIDXFtRz6ZNf1q7/qzo9TPMZHuvPwuffW3UnEAHLv2lT7L//kOYxhh+4wXErCHP9ebyCpEDLkvQng3s5+4/fhN9VkZBVJbGT5enVFYlfOpXX873/MZf89WDBZ7NkDfkoKKQXkiVyZROMLwJfKQ8so9LfuKDHPj4TzLmJHHVp37n087Nmc/bqhzwej792rOsIvxXF+hyXRLW+2N98JJuRA/QuNbqP1PiceZomlKQTpMy7DlegtKSHPe0I5KAYGOEYEUSdO+xGZnrKl8tsOfYzmescQpTopcEnPN952JXPN12NsYBVZqV1tItlWBi1w2M7LoBS6RYOcHi9IOU3Rbj257PxPbrKLqLbHneJKo2APTRAR65+W2EpQXm9z/K8eEvsvWy19OTtci0YqieSasY8bFX1gr1OcpcPM8z8Wo3hrJcRicZXarksUa4/0Zn5NbhFNVMHbJkkLRZxlpageupZSmDq24vUd1TzM09xL7b3kt/XuJTosMGlooN1If2MXdoD/7SgFJgQsLqSgkvSYm28crXUBx9iOGhaZbnHqPPOJpD4/hykXpeUB+YorV4lImRYY4cOUToLNKfbWbbJVcSO8sc2XuApX1fY2zLBYyNjbHlhp/nOYOXoHr3hj7Zbrx3baBg4fiT5EnjTeBb37yLxsA1rHQsRZ5TliXJwgt2Ndh78Di7tw3zyssHODzf5fY7DzM4MsSDj0+zSINHDrUYaI7hKbGdgjIVkjwN9lMmW83JpXsaOh6tHcm3pLCMkDknWBmtIFRqt5VInTFJyGYpoF1dqute1W9kHm+yjBQTrl4DxI8gKKnCBIdloKbJVI2um2J2qcvYxASDm6Z497OGefVHPcYobLTghFKfkFEM+FVxu2SkG6ErW2S0JulY0TGr60RrSqOl+xuoWHeA0kLNTCWDExs5emA/cWkJ2xzD1rMcrxTKJLrzCxLcouRXNs+ISriEKpYEqzFGVZSYiAmyyGhdUSVCICgH2mCiKK8llWF0JHpxb1KVfWxK4Op91DtHGWwOMDsXGd24kb/43AMUU99FruQGMFrEfLBAqfA6iplDDJgIsZr3aCXoglQWaAQwEZRGWUeiQHkRH8hGJggdD92OfLeoq8JMkSL4siNAxtRFZzVKZ1Be6IaoAnybTnuZ0kM9D1x/aZ1X73bUUoutk5puu6TR57lsxNB3bR/HDy0wNNnkK3fv5/bpcR7t9FHLE83FvbRaLazJ6BuZQldt30SQbkul1tWj9J2K+Jf76uQE4TQlwN69KcqbAAAgAElEQVQieY4F87R/n4MDv5p0aMV//5vb2PPgAYLpQ23eCXkmwX7tIKU6D2JnzMIM33zva5hqFPhQ3UDfJkMhacfNv/ufePbPf4R9x56kO7QR6oPViAdWgYFJi0zw2BQszdOaXeSqt36Ub33wJxi16czn4PyPgjVtg/Vz7VOdC8+xnQmU2XtKifZ/SmsAwKejA0YFx+aPsNgJoDwovc7wxZBUpZFeBqyrsTDdISnHKkjjfM/D+mvpbIDK6nUq6TOPA74TjID1o6mU1sDBpzwHvUQgYSMobcmb44w3X7La/XD5EHmqxi5YYvTkyjCx5VlMP3IrQQWO3/s3jG65hKz/Mlx1vzkUQ7WMMsFKDCJHU83NgdUgonwi0wZjRLxM2voGW7XzndYnnSBfLHPkiX9ly6UvORPUhlKJql9RzPKVT/w8mzasULN9tLuRyQt2MbL1pzhW1uk89QhTO0Y4eP+H2XbVzxBLL6ykMpA5h9EJFSO1qd1smbqUtDBHa/oJWiuzzB+6n9a8ZWpqC4/efSczA08xOrCdfKjBiaMHGDd9rCy0aPZvZGTyIiYvey3N0a3rTvg5fuMKoVyffBZmaQ8Lh07w2pfu5tCDGQ+u9NFeaXHjczbw4mf3scvczVD/Bpa7BQ/tOcjVOzbQHxo0s3ne/ppN5Lnj/v1T/Naf38+S6mO2W2BdgxAjtLvUcgvOkYwWobpSfpuoDCl5Mjw+aLRSwnazpsrfI0onIg7jFCZY0QqwAs4T/QYnGCSl0E46j1prCKECcxu0kdGsVgqdPNlwEze1i+U9txD3Psrk9gk0oxgziiLhyy7O5qQKe6Eq/I4JFbvOWJIuUaoSt4uiamsyR/KerjaiqFs5K3otHg0pltVIyrA0PYM2GdoZrFPY5IUz2dfoxzcHUKqNrVyilFKS5ViNTw6LkRm1D2JvW3bQWV3aPL7EG4sKCRPaQr8AdCgAaX2hBDkZjUGL4iJvfO44umgxv1Sw84IhauMbmcVJy6feLyj+HgLVWULpSTpAEh3+IorZR/CgssoEJkQwGoMhRfFYjpUGgck15fIyqtuRLFAbKcSCp/Qe6zLJCJWRdp7OiKmNVpHQWiLYjOVihl99yTDPn+pgmgWd7hJq9BL2LSWeKLbylXs9o8264NWKBX50ywpv+v4BXrEAH/76DPcetPTlljseeIgrr/xusGMABLrVAqHW5olVti9/y9zwbFvPIfAkKeBzzJvPuZ0yl5bHRJf6/Tc/yrs+eicpHydN7SA1+qsqfPVAKoZblL+LFn/3jivZMlrDp0pWOiqS8iKoUeFIeluMkb3zkW0jlvUq5gpxHn7gPT/Gzrd/jMPTRymNA9df/ZZJomGvDHQWtu+G/fdz4Kjnwv/wl8x96sdR9MQx1lWO50uZPDXQn0s06GxJxnn9BmexzT3jpsn0CMpalBJUskIUwKISSW9CCUbmiuODDijQKeOsan5nOv6nY0mc0j152hHAM00G1iW0Z/rNTpXFTiRpEFFW7w3rXiut5F7i1Zu7b9j5cp564A7qdcvy7GG+9Xfv4fIbf5HRyWfJF1MKqw0WyJoZKQm9OSRLCBVrKs9W2/XKSIDQMhvlZBNMBXj8yjEevuOPSCtP8NTDf8rR43NMbXsWNuvH9ivaxz1p6QRlOsroyASbpuqg+sn7M/Ril279GsrmRqY03P5gPyPNGcbGGjx8y2+w84ofoTl2ETaTNVErSzt4sko9NK+P0L/9uxhQiS1XvBQQg54bL3kNAKHVRqlEsBGV9ZFVZ/G0tPdpbqFUvaZvbDdFay8rXc+2kZJB2+GN18Cl3RV2Xmw43Grz1cUXcss35ymiY8PYVXz8jqe4dtMkl22r88VHnuJVN1zC7ku7vOctC6RakxPFML/1vm8w7Zt4pSjDstDq+uqoakKYoiz5IUS6HY/uy9HaiXZMQoTfYkIbg9FWOmyNvKKxJ3Rl7S5xURz5YozEUGBcE5Ro0Gilid0CU8sIMZK5Oqrh+eFf+1986Te/j2PHTtCKNfo7ntIqkdHXjohIOJue1462qJ60OppYjYk08gNoAiFBskZM72LCRC//txleJ7AiUoTW2LyPfjtAMl3mfQubN/vodHK6IWCWlzGqRvBKxs2lRxupgK3VJC+iO8pAdAodHKkswJpKCUqkbsXcN5OAXxbCoSwLgjEkk2EToD26lrGtfoygLY3hAZaWAif0BGZwDDKFXfULkBs4KuSzvKqEHBTovDJ3kPmqOCoZotWEToFVFUIyWYw2dI4eFRqd0eJf4DShE1BFlBlMSpASzmSEboui0yFTMv9uo3jrC3JetXuMbuzw5ImSlF/EbQ8V3NYaRNUmcHWRjFwsFWONPjppgHd+eZ5dbprnbcq4/3Cby7bX6Gsavvv7v5965mjlw5WCm8BM1s/31xbRNS+A3uIm+vZyV60uhMoQ08lgvX8XCHDd+6IyfPpbe3nnh75AN2aw5VJo5hLke6+LsRoCJwgeHSzvuKmPH9y9iVjp9quUSCay1O1wZKHDZRPD9LQAE+B15Op3/CGz/+OdnKkMUgqeeN+PcOOvfoRb9u2F4e2QV+6Aq9S7KhlwDrY8G/bey9JSi61v/igH/sd/EE3w6rjXKyue36YliTgpeCbWeP/q/Frnq2+tAHSnzPzPVwxIofinr9+PSY5gDMpkVQLPKnUrmQzKgMPwihftRsWM1WnDM+6GrDv+f8/7z7I9MzGkkxO5NeZM9YB++nshKo2ub2TLs3+MA3e9F1vrZ8OWSR74yrvZce2PsXn7S096vVEWlADzZN89cOV6I68K2Kl7A7K1LaTIsb3/ysFvvZuh/jrL1Nm682IajRkmt13C/OxTlN0uGyYn6A5q5k50cY0Gs9MncC4nH7yeTd/9FmxuKIMnJM2VN7yeQ3u+zvFDX2bL1ilm9/4dJx5ZwNX70NQxjWE6rTnqtQbEkpXleWouA1WypDK2jj+PoYkryPo2oZSHei5XvRa3vah66qTf3rrSK2Ymt9/AoWNfYtOWCeae3E9jRjO5sUn/9ov4w7snOJaN02cSDG9AazjUalE2t/L56cTfPxUJHcf/vn+eqeF5Xr17B9tdi9Gs4LfecjlPLCbe99d3U+YbUb6LmS9ItYhpNChCAcqTVpblcnCJsn9Uitrqq2jrIBkBXCpLGSM2ywV4XnZRSkbLqqJAmppDK5Ee1i5HJwEjY61goLQwnVxWww/sZGZ2kZr26O4iV4wPcNeyUEtl4i/do+QFYB+jJxhRHATRekixi4oCQlXByyXtRHrex4jRjjKU2CTebMGX2Cyn7IIxiuWlDrNLh+kf24jttldYmJ8mz3NUfyaLkLOYZMQUB4V2mrIIOJ2koiBJgFFg8hqRUjCkSpSTfAz/l7U3j7fsLst8v79p7eHMU82pKZWEhAwkECBhCLbQDqgIdKN46cbG22o7oILzbVtppD8OSIN22+LFqS+IojKIokCQSeaQgYyVVIaqVKXmOuM+e6/1m+4f79r77HPqnCR47/qDFGfvvfZaa6/1e9/3eZ/necWu0rVIaDwJI/gXBsnIlVbk3grl6iIP37fEvkOXk2Z30h3tMN1y+Aw+BLS2OJ1lOlMt0TNNB8GTtJYqJyjJ4EovkE8U0iIqkV1BLg3JQO/YUczyksjOfECFCh8zKVUYrcnKYK0lxogPJTp5NBmvNM3Y5ddfvZ+rZk6RJ2f5u08rPr10iM7oNsYtTExbkilwxlNVFVoZVlZXUBlaYxPM6yluPafwU9NcO3WS1QtPcOLUCVa7JS/7oZ9FwJraz374gZEm2tqCkvNF/dWNwUtlLQvdYCebPKRPtgheZOCSSEnzmYfmee2vfwRCAw5cA63WGiKe6xQaJa0AFSH0+NarLW/93pvEgjNnCZvaEii5+Y3v53Pvej0ytb1/7NIHnR7fQ+MNv035xz9HjKrW9tYPqJJl59a3vY7Lfuz3OL5yltI1wBQMLIfR9ThiI7DB/meQTh/h+OkOz/rh93LXH/4Aa3ZmW1yHLROnoep8Uy19PxHZuGO14fVNvlL1rXqFif2kw3/q92fg8MOnoNEklZUYV9UVBGSyljaetNMSjLWIqqq5EOrp3QtPZ/v/0fCn72r2pOd/ke/C8LPQb5MB/TUnD7UMnkTdIAW+YddV30Ln9IOcPXYr5coq22ammb/zQxy/68vc9L2/QMbV/Xq5Ny96Dod730OqDpUgaY/GkMI8X/mbX6NljtIrFeXENMl0OXtqkeQKjh19hE7nYVpmnDxecf7MMQozxvJym5lDr2P7FS+GYhIbEyFktM5UKVEo2HfoZspLruPUA19lefkf2Dap6XWXyEWPJ+76NAev/ha65QLVwhG6S5Hxg9fyxMO3sfvSZ7F46tMsnPkE3nsmxq7nkutfT5/7ohUojMwDAfq8lnomV31dN78X+owfg6G3eIqcWsxs38/zX7SPDz86wuNntzPRWqUVevRWugSV6xavp0AI4dFFgmrgx0Y4lqZ5+12ZUfUEb7pxEt/9Ov/6sj0c+rEb+eX33MWFzggjLUPZOUO36yhsbZNbOz6q1R5KzWP665NV5GIUrBAxY8oUjYKMqc1IZZ1TsUJZ4Y1la4jGUBSF1D69LlkrlLMo15S2ua/AOPZd+QxW9AqtzjJ+6TwzeILajrUtcXHNgj5no0ihnnUwQGAzuuoKx8IUJMSzQGUFviQqgzIyu8A0G4BBm9q1MFY0bZsUSlpjk7R65yhME3XvZ9+RbVqlWj2Fbk3w8vc3SCMFOqTa2U6CNioJ+YBce+2DyYgoQkvFmYmoaEkNjQ2ekiaogKptCmPOqMrX/RXNtF/if74ycXahx3wn8rWjTW5dGaExvY1icgo9lARovSZrCwQZUWyd/Bg+EhW1BMOSq0BUEWPrSqj2Wq4WLsATxwVV0FbkFaFPDBRrWeectAxSlwz4SnHjQc1Pv0yxZ2aUTz9U8aFH9jDf2oFJPULRoKEzttD1PG/xE+treDUSvFquEDnQ8jLflT/GztYC3bJgx76dPOs73kVSDgjkFC9aPLYKFhttgUEcrzSq1orWn9xK2/1k0q/+W+qF+I6Ty9z4E+8mdxR57/PIUyN15V+T3lL97/pL9fIK117a5fZf/FYUzXpkB7VveOQn/uAI7/7UnXTe93203HDgk4fshjd9kIfbM/DIHTz0//wMc/ZiiD4jMqBn/uDbOcJeGNsh/gNIWwdVJyP9AR5lBScewGXP9ZdN8JV3vGadBG7T9slWJMqNr29ZAdcXpA+LDykDLq5w9bqK8elsfeLgO//mDn7tTz8tjpl1y00pMeASI5CIVZakoNM9RffWX6dgCBb/F7cqvsntm0CjhoPm0x6KdBE/4GKy7Mbrvhn6o3DITRQ5/Pk/YfnYrThjaIxOoEfazF8INHc+n11X3MDM5H5QhaCgT7UlWFp8jN7CUY7e9keUfolmawanu5hmQRmnmbr01ey57GbOnTnC6EjBpz/6Np5z0/eBmiD0IjN7D2Ibo2hVUJYly8vLtKdnJA5nsZX1IWJUomUFWTPG0l1eJBFxzRaGTJUU1iQICa0V3QyrF44yXiSOP/ppVs8eZnxmO0Wh6a6cJ49cysT0NTTcOCMz+7n9q+9n766DrK50WLrQZd+ha5ndfW1dfDzFtciJc1//JS7Mr3Dh+BH83ufz9uM3Uy4vUTgF2pBiifYVVVURqjDgtYQUCSFgZdoCSSUKbShXNK+5PvDc2XnarsP2gzfwnW/4HxzvTGGdQSePbRTEBFlLrKBoomIPHT1udp/07hsFWlm0DvQd+JwrUEbVg+AqmZHTHoFmC+dEOZe0QauI8p6cDRQa07SEIEZBjoLO6RP8wMHzvPAZY4RyCTNzKT/1lwvM2xG0bQzUYlmLsVyuK/pEXWCpREwJF5E1XtUJSZaYRqwt9o2VyYAKabfqjOo2+auXf4OVZc9oK5GaY1gfE00Nq1mhSyE3xNjviSWMNuKgZww5V0JSw8iFAbRSoB05RqxyZKeIUQ7A1gfdH55gdYaiIJZdsImF2GH73gPk4hTTxSX8xZGHMc1xmhNT4i6lwSKIQkpRpunVBCMtdj14FclWNPv9YUMaUD1PxEt3LUb06CiuOUKVDFaDj54AqBhBa5RRaETbr1MkKEhe8x2HPG/8XovPbf74tpIPP76NyblZdA7ohsHWfUOTlBgUoQRejhlfepyzaGsISaYmdnLFtVfvoOFnWF1aZmF1WTSe9TztrRaklIXIdfFCtr4aVQzFJNg6+D+dTSXAcT7AjW96D7FrYPeVMDm61t/vw4C55gAYA0tnGZ2r+PovfDuKou5rZRnqoQ1veu/nePdtXWhtq0lTa0rhfsUWdUlVKnozz2b7q9/Oygd/lsKAZU0j3+cEHP6Tn+XQj/wOx1db+LaTYK/zGlE/KdARGhp2XUE4cZivHe/wvW/9MB/6v76L/kV7MjLZpn9/MmTlos8PzU2of4utgr9chzUk4KncABWK//K776YYv4qohXuZs8JZQyTWbpFG7jNtaLhZPnHHY7z8+t1Pfk88yT2zKTy/xfv7SeSAd/E0t7VE6ZsgWG7BDxhOBDaXXG5sHfTvM82hF/0wZ+7bz/kTX2Hl1J2Y7igN18QtfIHTX/syx6rM+UVob7uaa559C6rRInaXWT7/OEVjlAceuINnPPMyHrnto9hGh7H2GGUvU4zPkRcV5WrJ5GXfxbYbvgdjRlEqkmNmZu5S/NkztEYCQTdptvewc/8cOSuq5Fn1nioEQqyYf+JhJmd2gW3Q7YnuX2nNUq+qGe2GhKUoWvicCbUxUBnqOShJ4aNHjewjtJtccs01VN1HOHPPxzn56CcZmZxkcnyJeO7LrFrLhaMlu9qwevzTFK0xZicip+/9Iuce1Kx0NdN7buTAtf+Ogav5hiUtoTny8GPMzc2x68pr6IWS3DmHNQ6lQSlPipBjhioQVrsUIy10bUKUVFFzfkWaV/pEMQF/czjxF3d1+b1/exlLZ77EB/7gdbzi//wrLgQHWYYiqSRMfpX6qKVGZ0Wls7RIkhcVhnZClqs9RlLK6KIQ+R8J7Yp6YqCFHFE1YV0VBq0tpnCEEET+maFHiZkc58iF0zy7u4jLJYsn76VXTqIaU+QohkXGOEGhtBVFWwpoI8T3iKDA4s9Qu/QmGeBHyqKYc0V93Q0qBqIWVVvpEhOTI3RXFzHNSeYXlrHtdpvO2Sco2m2sGZEAWtj6wsCwXjzXAU4J3iX+x0ogZ5UrAcOSxmgJxCZJO8FnBPqPXiyGbUGgolcWHL/3GEcff5DrX/UyQnwYMzNDoeQCl0kgGRMVJA25r5HXKCOJgdK1FW6iZnPGmk+W8T2PUxBTJJw7Q7W0iKtlIdZaGTCUg7A0lRW1Q1YYleh1K55zQPHm10yxcPoEH3tsjs9f2MHYlEFpGUmcc8bVN2QIgWyMeCYYg9Fq4DcefabUEdsytKvAyOQ0rWaD8/d8kZHR3fQn/Gm5sLWkcn2A0PWM742LWlZCGMxpbWEdEAeVWv/cPa2Ktb9vQ+UhOLj+De/AdSGO7YapmcH9IHerrqt/gWtdtUoo4Gu//K0oZQcmP0opIorTncB//+gZmNwGytfn0wcS16YeGp3QSmMKQ9p5Dbe88d3c9j/fQMhgNwSECHzx997MC3/mfTy8sIKauISsGrJfJSSvwXkXhjyzB04f5u/vqnjwlOfyXRtnET7FtgEhWRdQNgbBvjRQhQGzf+N13vQr6gD0dKyAl1Mg+gKTEz4lVFGgtSXmTM41M7h+nmNto33uTJfoPca5rXf8JMFayHMbAulWLn05s0lOu/l7Vd2v32D5+y/dhgmBw9vw3zblGag1F0aDZ/uV/5qdl97I5/7852kbQ+4uUyUYHd9O2yWMXURzJw994Wt0lxcYn9vN/PnHabiCyeYcj95+L7v2H2Bl/hyN9g56vTMY7en1KiYv+x72P/e1EBLEQNBakuaYMHMzhNVxTtz7h5jWQc7M3szeQ8+naI5hXawrVVhdViwsXGBsYg5nDd5LALVGkXJ/hoomBJEFhhCF36XBVwHXbGC0JeaAr6AbVnDtPey/6UeIKzdz9OvvZvXkE3TKVSYnp/FVCb5Nd3WREDuMTmyjPTWLsYkQnqB3/Et87Yn7uPFlbwFbrFuHElLMbN8xy8q5BRrdESZGWpQBilaDho1472W+So0428IQyko4W0lh6kmvGYVSWXhpSZAOXczx0+95mN997Xam01He8oOX8VN/cATVbuGriE6CJoQIWvXqgsGiuh1MawRt9YDtn7URTxhrxaBHKZlsm0D7kuwMSbWwSg05+lliFvGyzrK6heQleWk2uOeOC7zhxXs4/egpiul9aBlmIARUlaGq6rZdljgTK3KUEcfWGGJO+CQ2RSC8AGIFuiA3CumRKlWr8MC6BiEnHJkzJ84Sk8aHHtaCrXo9Wg1Hp+dhrMTaJqmusFN94E5rfJI+v9EagpdZf8ZhciKGLmhLtlo88XNGhQQ5UemMVk6YyUpmPEcNNltaY0Ar0d51Bcdv+zC2PYN1maATsYb+c1Y1I1/IFCRJSMTuN5FR6NJDiFRlxiotbH7r0C4SfKAomvQ6K1gU3ipyD7SqoWGrAYM1hsp7Qlnh8Yw3K173nExSiQ8dneTjfi8jo4YR16SKXbKq0ZGsqSq5QXKdoBRFQeGES5C0qjkJmqXOKnMZiJHHH7ybJx5fYvfllxOTwmq5bpKPblyw8qCjrGriVs7CVlW6H/DXL17U+1pLLIZee4qtby7jnGH3a3+DFT9JZcdg56XysJAkB9D94B+l+ZcqfO8CnT98Be3+g57kJ1MoPnD3E7z2V/8Kvf0ayeCR3yCqYQygro4LQ0gyuVGPTXH7OcX3v+Nvee+bXzVEfJRPOAU7GvDRn/9Onv+2j7K0fAo1sYeB+99AlpTkaZwYg7iPtHiWZ/3En7DygR9DRCtPg8i2AVHJxKHWfg2lb6a8GLQZhjz+8Zsy/dfzADY5hMHPKe2XAo1qjdOtk9mMBDhtLbEeyBWJ5AzWKhIF+y6ZWgv+T5PEtx6V6JsqrRUIF39gkyD+FKqUAVmvb5SkwiaJxZN854Z9K5XWt8pSzaHJtTGO2gLNqI9VkgAnRUVjihf/h3ezcvowd3/y96C7jC8SyysXSLnH7Nw4XlU029soO6vMzu6mKrvoZptmZ5mlUyfJfoWVcpHC7ESP7WSmOcnS0lE+9eHf5Fte8SZy7c9YpkjMGZ0St3z/O5k/djsnj3yGZvco93z2i2TnmNv9HNqNXYzP7GRm2xyxrMhkeqvzzExsx5PI2UND0fMVFoMnUtgGhWkSspIkvCVzSmKqaDcb+JgJ9ZCZqBKmcQU7X/B2WpQcve8zzB24nM7yCiOT23Apc/rYfbTnxjl+z8fpnLyfie27qXQHVy3zxQ//MNe+7FcYnTzAsNVXInLi8Qvs27uLhx+4B79rD61C4wooV3uQtSCxIdRFhoUUyFVGGQU5UkWRZ2trZDRw8KQgLrNmx17e/qklfvvVoyh/J3/2rlfwg2/+a4yaQBeWEHoYpbHt7WRr8THgtKY6+SjtPQdFqZaz+LI4CxmRmLuGzJBBiHvWNAlGE41Co9EBUkPhqL0EYsbbREM5SuVRUbNt7w6abpwYMhNjkf3bmzzQqciugVFW1GAZmWWgNLp2VlAxEFQhz6GKYlesDco5bC+RbJ+IrdAqCxpdOCIKlxxdHBPbJ1lZSBiVccZgnbMsnlkmNyJNZgk+Q6Eg1DrGLA9lYWoJXkpgRWJnYiQhzlXZGlJIdZAOEhS0xlRisyiOsAlltPhKAzlM0i1LHn/0LmZ3TXNieTfFdIsqeMm4aglT9hGZzNsgKkWqAjkrdIp1mqLBamxVkawYbsQY0UmRUqbyEdtoEqogeuCUhKhXV0VJK3wI5N4q2ULsVLzlNTPo8gJ//c8rfLF3I9NjTUIIlLnEGoNBE2OmygIpQd33bwjvINRSyZgCSmnhUeREXjnG+WNn6Sx3mJy7hO27L8dqgUdlzHAaRLaLq5ShfqZSGFWj8GTpB/XfO6h8GQT/rWlnF28xVxg0r/vVv6STJ6miJV1yEFzBgOynFKShAJVlbOXh330BmYqEQ6MIWkhSH7ntEX7g9x+AnVeRUl0Vp4pcT+pLazRtUFAEeaisUgSjUbPb+OA98L8+dD8/9j1XgAkYGuuO+4pLpnjfT97M//HOW1laUjC+fy1hWVeCZpicI5WLqJB52S++n0/91mtJMaDtBjRg2OBmuBrv/w0nffT+e59sW9efRn6QDYjBRQjPIHhdjASorFFEPvONYxRulKgU2WhJRutnR1lJ2vvkUjEVUZw/t0TK02tqkafgNKwdS9pwLE9yzkNeBk9msLTpptJaVrvuN+ijZJq+dO+ir60Rh43Ig4wO7ifRa/vfiARcxDUZ4myAZnT7FTz/de9k8dRhqpUnaDx+Oyvzj9KZXybrjM4l3e55ytIy2mpTxAsku51u8Mzuvo7pS29hbPo6IHH7Z97CZVfu4YnDX+Ox2/+W3Ve+lNAcFR8Wq0lJE+MKUzuuZmzPNSw++iXC2UeZbFZ0j9/JBf9ZnF1AxQrTHAMzwsKxOxiduxzDPMRRilaFX+zSmp5keWGZEedw7QkuXHiEbPczMnMJ4ztewuj2K8nJ4kMP55yskY1Mp1dSaMMqhva+l9BtNNE20AWCU0wc3EZWcPBbbqZQidMPfIxTD/0ToyMB7SMPfvwdXPHSN9GeOTj4SWM2HLzmeTxx/yc4cNkBZnfvxjywwGqypBCJVBRKYRsF5WpX6gxjBoRLoxTZg7Yy9MpHj7bieR99IndO8qg1vPJtj/GXv/bdfO2fPsYn3vn9fPvP/R1BtUB5jLGoySmUbVIgyXNqt/BLi5iZOVCaHKIgzzlhtYGYiDphmm2xPTEam9dcWPt+ALGeJaBaFl1FAjIczjjFwvwKo7tuYld1gWJiO7PNLrbXIGdp2YEgvg5NlscAACAASURBVCnE2jW3wjiHT2B9CWQxLFJIko8itUeJOBoqE2IJaLHK1xqVknChqy69ec/i4jITkwUxKmxZdZjdsYfT5x+hs7xIMCM0skWbviQOUgxi+mPENIGsiclL9pwyOXli1UOZhjhipYxJnpCL2tc6opKclDIGfAQHUcM3HnmEvTMj+DzBhe4yO3Km1WhQRSGmaK1ru90o5L26os2IZzY+EHIUuEuL81GREyEGQagbjlxFQkwEDVoZ8bguHLkscbaQBKBKWK2hu8y/fcEuLj3k0HkP7/jYFIxbTAZXtPAp0jCa1W4XjKahnMzHrqdyJS+ZYUgKbbJMZ8oZHxNKG+baltXuCionduxskZtjcn0GC1AfEu9r+vUg4FMrAAYyQPpzzKHvqpcHOnhZcBMarQRKelpSrawxSvHAuXN87KEFQq8g7bgMWqNrRj+qn3n01QK1TrXhGIlNRrCUOciADzJ/fvsx/v3v34Fqz9XwVD8YOMnqbTH0/dK+8Nags/ihpShVdpqe5o0ffgwzV/AjL9iPByxrbRFt4LuuPcRX37qPZ77lA8TeIrTG1oLO4BoYCQBT+yiPH+afHyn54Fcf51XP3bbhfVtsG4PZZsTKrKmneVz8vo16eSXuXwq3Lmitr0ol8KYhVnwikkLmz/7+65iRglwCtYeHMaoeZRpqWa8cR1QKtOWP/uoL/JsXHbhYANE/3k2IoHJcZui4tg7CayZGm6AYT0au7G9P0k7oKwO2Ugj2k2Hpg66hAANPgPrD62i2mYvQgP58jTUUY+27wTC54xrgGrZd+m3yp9QDEieO3s7IWJuqTMxuuxTIKDdBn1PTP4acFc960S9x59//NM3RRFM9yLG7H2LHodfQnDkAMaGVJydLSJGCgh2HXsiOS28id89x7PHDtKqShVNfYHxihLKXaLkWbseVdEObZjHB/Ooq1u2mEx8knoVi9BKOnfw6E2OLTE/vp9W6hM65rxDCcR677wQrXMZV3/LLJJo0bKbbrYhokjKEkHGFpdPtYW1Bwyh6IdIoJGlOlccbw/YrX8HuK17OPZ/8H4yOnaZnenzjk7/D8171m6hiFIXCqcTSsmbX3uvodM7z2H33MMn1nNOz5KbD0SB1u8Q+n8EpUorClI8J7yuyysLZchaXpfBpuAKPJ+QWPq7Cviv4b39xjH934wFOHPkSL72yzScfTOiiKXMYfMQWRhDtrGB8BrUyj9ENjBbbYPq/WNGQ8ce1XFzbAhOTmPNEQ3QObEYlsDVyEYIMIeobemWl2DE7xcnH7sUvLZJDIro5os6oHKBKNder3/ZN0hKoKmy7Qa4N7YwrSCqho0JlT7QGrWV90EWTmBJGKVIUtK6vGGhPNDDNUTrdM4yMTGK1Kjh39jGygmbRwkRDZTTNWGf7WuaxR19rpbNGPJNrYpsG26sociRUvdoLG6J14BpkXQ9QyImcsoxXdFaGMuQLvPyW6/j8P93K5c+cZcJ6XKtNKHukVEsgcm3TiCVWQaBapYTJqTKx1qMqLT0PfC1OUQasxvtAYQxVt4szlpB7WDIhq7UpS8GjY2AVw3c8bz//4aUFX/nqQ3z83KXE0Z20UoVPGrL0rHtliU4ZT8Q2LE4JaSPGIAlPPbkppVQnLWCsxkTLXLPHpc+8nHZDc/Z8jxxGUNmSaxOg4YWu///lv2uYd38csCQB9UTFNJRADFdMWqw/EUB880WV9eiAJ/Ff3nUrlRrBT+5Cjc6QY6xX3H7wGsLgcw3Jas1/fM8n+dhPvRJXQ1D/+7P38kN/dgJGdkjfOCdhq2YDLK9JXAYrMWKtmfOgz6y0+KZjHMzM8ePvuYfemR4/86qr2cByAOCK3YaP//hLednvfJncGN8a+mg7UmuUptG88yPf4FXP/bb6Om8I/gPS3vrqXy7Dk8nUhs5tHS+gzwXof09f7iZJHFxc8V/keIfcF9Ya5i+sgHW4hMy8MEL4y6mP/kRSTGidBfXK0LKizFAbg/EmgVfuq/XmOn0LmK0tivsJ4hZBfTMlxfD7NvsNhu/Up0AShgmXebDPvO71PHRO64+bNR4NXHTdB+9lwzlo8YbfdfDm+vW1QC/damm5KIauoym44eW/wpc++qssL9/Djm37ePSrv81y8zKe9+L/hLVNdAbnEiFIEtjzHsUIuy55Ps4l1FXfitYJTVF/n7RP185JrlqZEjpFrnWK4D0+rOK7HVaqVRYXDlMULWY4xYlPvoHxy38Ut+f5YEHnwGrlsVZLoWQtVcqkFNBZo0Imp0jTKkGBjcb7zJUv/QmOfOkd9MJxUMvc/qn/zrXf9os4LS6U2/Y9m8P/+Cu0J3YytXOabacLTlSZ6DtCIk8QlcGXXayW6j9UEUs99EwJwivzFjJF09Y+/obCtgnB0bKKr4ed/KB/kOb0BD/3uv3843/+GtqMU4YunD0lhEAnJEFTeWKMlEfvx+05UBcYFuUsISUKa6CqcEnJxEZryFlLsaMsOmtRleUEIWKdJdXDhgBO3HEnB/aMsbrYoTcfmdi5DR90nYBK0k4K4qBaVYIqK03yXXLH1+630louXINsNMkrbOGEtpdAZXEJBCUteuvQIaDKVaruCgvzXbZdso2F5RKrVMYZaJomyQnb36GJ2QMadEZnWzdpE1GDCyI3G1ReIxP4FKUfWvUI0YuLUs0dKKxUFMbI/Hodo/Qr7DRlHKc1OoOhZM426fS6kEU2qDJYY4VgV1fZKUpgteQB+z+lVEsShTCig4csSYFKmcpXqLotoFIUKRpywYmB7CtCVWFN5tm7E2dPPsLS6CEen99OK/tak9lDHJpqlpIGqzQuQTaKoMQjgT74rTUpRkzhcCnT856YSuYXznL3ly9w5vR5Lr1qF8++4YdlpGNiXS9/K2OaXPe0VRosT4Ophf0Fb11lmfsLp2TIarAY1pAwfbyh/q9KKByfuf+oDN2ZHK373KkukerAlfNaCdZfIEPFPzwAuR7V8c7P38/P/+nDMFZX1gPr2Xq0ZawXwrwG0acsxNJe4dA9mfOQ+y0HlcFpaI/xsx+4i/mVU7zldf/qYvlV1nzrddPosEIUaKheoOvANQjkEcYmiL1l7jqzWMuXnrpRsjE4b0rUexqqi7VKs24l5DiArjeH1of61nVvOgEPn1wg98RHQjtNyGEwIVKTReWiMqmW9uaUObfSWZvt0D/eLY57kIAOXZv1DP3144rXrsdQC2CrJOPp/HtwTE/R+98smalVQ/WNPxTw1/+73oH8b/+23oobsGH/G9GSflI6oIYMEIv194jk0ArMbm76jrdx7+d+g7K3wuTULObCQ3zj79/M+dUZ9l7zYvbvew62NSGDg4yjKNp0g0cbRUyW4KUNmFLCOUunK6PI5Z4SJC4peZ5SVCQdSHoMNdLmwM1vpmEcKi5yx0d+kdGpaXon/zcdKqb23kSKGVPzjkIGEzI+CwHbOIUPlZDqspJiq6po1Ba8lz7/Z7jtr3+KuZ076J07ytH7/pnLn3kLSWlCLti+aztRj7NyYQFbXYByBlTGlCW2GCGXpfjrx4BqNNEJNJoUSlIURnzKCUiEymMLVxMeDUpFsm6iwhJ/9egM/+bSh7n7kcO87No9fOGBVVRjjBjXgixEUijRhcPHkmJ5kdgewWlHUAqbIfqACVEKLl2CbZG1IinEJTeqWpYno9RzjMIXUw2ShbE9e3ngyO3oF16Gagl6fso7UuWxzaasVzGRq65MAgRS8lgMufJkY3EYQvLETiS0R9A5k5aW0VahihapqigaBT5psSmOCadblK1Ia6RJSE3Onj5HszWOjSHQHGnifUlD29pOsBJmYb/nohQhaZEiZEW0ihwi/S5olRPaOciWkA3JBnKjhSxrRsgIRHJMkjhYMe6pqsiRw48yPj3D2NQ0+3c2uItE0zmMcYRQCcSjNSnk2mCuhv5jkEDebGIWO1ShRBcNcookBPpUPqGUuCulGGUinYZsHCpGlEoY4/AWjEpcvX+U/bOK5B1ffyLSbo+LN5NOWFV7ewPBR2lPOEPA1O1KCWIqKWkBIDdE7GYaRYtkwAbYvX2c0XHD2fmSwrQxjUliCOtks8ML1OYLz5MvSkqL/XEfIdh0P1vA3KrefZUahKyhqM11cv1qf8GsVQmDYzFaWgTVNJkunz3W4efeczeMXSK6NFMnD7WkRlLiMMiMB9/fBzF0IiCDUcTOCqCAagGWVnnvj7+Q17xo3xaoRuDXPvBlbGsnUWZr1ufMWjkEKAzZOlxO2NoS9iJz000r4i1g7af4HGyd2MlrtbxR5Yt+4nXcgMFrMrr05NlzFKMiD0sp1dWmJE4pBOFZKC1TPFMgq8Adj50TpnFWF1/Di3rum3MUBqe6KQrSD9YXKxm+6ZHB6xLazY9z05bNVgkB/ZHL/WdjqDUwfIxDKNyTWkWv+24h/D7ptqGtoFQiN+Z4xi2/yNkjn2T++JeZmBpntVOxa5vikXvfx/w3Pkwe2cP2vZdz7uRpDl71Aor2DN5ZTjx8J9Mz4yycOUYMi4xNTHP31z7Gjp37WVxZZKzZpucmmNp+HQcufSGh7agqGS5jjWG1TKQiYM0ol9/0Qxw//B6MarL80IeZ3n0DZIXTjjJ4rLMiEzd6Td5rrfw2CTyZwiRh8KsC5Qouf+53c/7IR1j1HdLpTxGuvoWEYmJmLyu2yfLCPNPbZxh3sNo1xORxxtLpLItSIsB40SLbghgTyVl0Jfdt8JUUQ1GOJYRQt25Es99Nq5ikuPXu07xi7yzNCcsNBzyfuHOZpmvLWt1ZQjsL3ovpULNN0R4jhxJjRsgxooJBqb7/vkjbTex78kOymRgTunaXRzuIHqcMpVKkhiZnRWtmhnjUYFWgKNoce2KB8xcm0FoRywzOiOlZ0YTgh/gssW4HMxh5T84470k5YDUkHwVRdYbQV8oBjooYS5wyxF5FWO2iYuLCwhLW2AZNO4GKq0SE9W61RoWEyaYmNtS9+JRBBxIaa6QnpJ2tNfkQvEcVhVR2KkNSfVNgYuVBKZmZnCLWaeyIY/v+Xdz1xU+R/RKn1Y2owg5xReUmU1myW2cKypzJOdYQi0apWEsRIfkKQsbnhEWRqh4D97wohkQ5ZZJR6KywRRvvPbooiEtLvPLaSbrzD5PHmjySdjOWEqZp8CmTIqiYyEZRNIXolxJiiZyFLJJCwI4W+FSwuryCqVYZCwtMT/RQTDJ/YYW927v0uku0RxyrZUWMYLUF5YVzUS9Ua6S+4QolSw+s/k36zmaDxa2+ZuK0KItMqt83WMio41/fOW14Xaolki5nQuWk2tYNlBZDigHs34fy+1V5qpOJBDQ1/+pdd/PZu8/A2L46ng5XWP3kIUFK6Jwk2eyjFPXuC8YgewkjIUNh0HGVfPIMX/1vt3D9wdmLfMhzCihl+dj9y/zXv3uC3N4lVf+ANt9n7PfP3ZK7PTqFZmdeISCDVrZct2trTkEc1loCQnIbHAXD0P/Gtk5/xoZIIN3Qa5tr3teq0E0SkXo+ubUNmW1v60scoswOV/2KFMhBdNVKtMrdLP7gklAXErQ2+iBkPViANh7jU2nz1wfrGm1SWwd9ea3vhbDG3B8+nr4sb02F8M2gB+v/vTGwbzQMGrbbvjjwb2yabTz5rRKToXvjoiTAYIrtzD7j+9h28Gbu/cr/jVWKM6dPcmDfPla6HtNYhuU7mWhHLjzwXrJK2GIEF0sudJsoPQKhR291kX37DzG7Yxejyx1aDU+5WvLIN/4ct/oF5ucVV7/4J6AxhfcSPLrdEq2hMXcDu0Z+iyOfezOtUc2jX/4tnvGS36BbLoiVt4YUjZCbNeSs5JnJuU75orQclSZHGZLU2PVS7GNfYnr7Nh4/cpj0EoM2mVzMEk2TSw5dyhOP3cvciGLP8lG+//kJv1Ty8PwIX7z/NEurI3Qmx9F6gjHXpud7KCNDlVROEqCVuPZZJUZomoy1hYwyblp623bzoBll8tRxesdOk9UYvZUO1ghpbnRiimDFCdanjGuMkCdmiXXQV6ESHk0SyWHQjlwU5ABN3SMEh222pJ2cDL6AQhWUPqCaYu5jrUVVJZNjUzJBsley48prKL+wSNEcx4dSJPRZk5sNonfoWKGdECMVoMouiYgtI1WjQbMqyToRlMUpCDGRrcQPaQUo0AYTA0s+Y1ybkYkWK6eeYGZmJ9YUltzrsXj+GGNTe7Bukqzq1rgSWZ3WlmwyOlP3FQORhMlRjNZSIvraHamKMhGpMijriBpCFcAHlDHEKJmJ9wHtZQb2wSsO4UZazFWWc91EUEGm+BkZthGjkD96sSsPTJWwOZN0wPcSKnpMBl9WALgomWCqSnQIeO+BTO52wDbIFkKsRztqje8tg25AdYaxyTH++r4eykIsFDZrtJL2Q1biTOh9iTEO7Qqs0lReILBGq0XlAwvzZ7lBneY5+wLPu6zDwZlRUljlvXclWhmMbUDoEbzC2raYXWxcYuqFty9d6g/LkUK8/ndSmyxEa6QVxZrb7WBtGu5fb/i02KVqss6Mtyxl6Qm+IjtTQ//1zvrVf1+B0fdXV1Llf/ZIASM7akXIcFAZRJI6kQgD+H4d5yEDPkhClBBtrU+kCxf4/C88l+ccmL3oegEorXnTn3yG//VPT0B7N/TJheu4Cv0Lo0kqQXcZVzT47ht34HKzvr5bw8wXm8sMcQOAjcOCBtaeQ0xy6T9fvN/NdOlbBX95MXLPqSV0YxRxgHOEnDHKkm1dnZBql0stioAkbTCVxO8ioocC3RZf8024Em7+WQ1DZ7zZuODhxCD3ya59bglsgNn7SMnwHjZJGi46mOHruHb3bxbopXAYQiswrJFr1/gFT/k96xIrtWmSJd8n19hqBc39XH3L21BphUdv/xCd8jTaLfH4gw8xOzdNp6uxxhPKZcZaTfToLjqnH2FsegemOEjOkxx6wU3c98V/YNfBKznz6BFsoZmam2a5VOy74nK+9Kn/yk23/BKtsVm6lTjkhSCmQcVomx37vptu7zbO3Hec88e/xMjcNRibpNo2ddGCJsVA0gKhG6swib5oDa0dShtoKUxjGq1Ltu/ZRfAdmnqEpDV5dZGTS/NcOHeOyeYB3OQ44cIJDu2b44rJx/nJF7V49LGzfP1kyUcOr3Aiz1G0ChqNghQyFlFaRRAX15iIKhNCJClZB1dCxUgxyu9/6ig/c+kSV115EPeV0zSm9tJZOkERA77ryVNjBO9xDUv2/ZH1EFA4Zwm6L8lLqKJJyhkbS6IqyL1Ejh2Mc1QxYFNTOGFaE5XD+EiKmeUL8+xvLWLZSWvHNp7oNQjJoUIXpQwhiJMjKaLIaGtJxmKLlrS6qYsIY0Tyjke7JipEomugYyD7LKifa6DIhJSxrqAdYLW7SKoczVaL5eUONmdx9BsZn4PRSbm1tcBD5FT3fRQpeqwSUwIqT44lJI0yTalGC4uuBLKwRYOQBMZVPtf99vohSxVEjW44lLX86WcO88K5C+yavprq+P30Zl/EuDN4H3EN8DFjjBJpoBKSByqRtSX7ipz6FxlsVsIXUBmCR3lPKEsIUWwlUyT7jB0ZJbVqu9QUaWrLFQcNz7p+HycPP8r9ejfN9ggqKSqTsEmqy6TAGUXOBoKFIklmVxhSyFQp4M+t8L2XHOf1z+mQ8l5+7O8adBr7sIVFZcOzDy2ybdseuqt3MLN728BNMQ8vFhsXFt1fQPu9WFHgDdid6HoQXiJrg6lNuWUKtqqhumEVbn8vmpTXBuEIrybhk+aKXW3On/DQWYSJacR0t+7DqoRS0i4aapjKy078wulr8AeL3XD7QKHqrkKqq8LBO1UWoovJKBJG17/phbN85M1X8+yrd8l9tC51ScSYecvffIPf/cQZYmsOTKNOSFItWzRriYd2kBO2t0zwJSp3eONrfoA1tcXQor3JIr3WotkEgVER8tYGPmuyuD5yMFyVmg1BbL074MYtK83nb38cCkde7ZGDQus+NyahtSHHemR07U6JNoKIWQVK3DqzSpsH/41qh4GXwfrrIsfeD6abnbPcf8NBfjMkYH2b46n4E0/Rhtmo/Bj8pv3nSK37zj7pTym9Rg4cTtOejoLmX/redaRSecaVMmQ1xoHnvH6QnFzxgv4tnPC9RRGzuALDyNDn1xKZZ9/ynwDYeYkML6rKFQ5/5feJ3cOMVI/wxVvfwS2v/G0aVp5Dq4TcZ6PBbbuBM3d9gm27pnjgK3/BC171LFarAEqG5Ehb2NNqOrGUrpFWo0FrJwGsHgNvbcHCyjLT7cjSyiKrnTMUzQNASQTGx8cxzuLTKGce2867V2apHqrQaoZULvOKvZYXbX+Ey16wmx+59SzF2DWYqkfKJaZhSDiKlCVWOCvobJCxx4FAig0SmdTex03f8QwWzx/jBdct8sUTFW58ima7iW+KgqCwDbG6Hx9HDNnA5LXBa7rRwHR75IULWJWg2SBGi1IJgqLSikIXJJOx2pIjmKKBIUOKjIyM8eobDqILx+ryKVairHGkHrgJNCUh15wEZ4QYqOT5tdoSR8fRxhJ8wuoskyfRWBsojcOkCpQDa9ExkGIFrkUOkSpJC7BStpayeywxUXaXwWVYXSHlcYFmI2irISlyFWo5WyJrWWRcdoRUSXtXayGYNcVrXIWEzSXJQ9ZGwkEyEr6SIlsrPV0F88kxPbuDO2/7B970mjfwmvefo7V9AlVYqtr/OWXE2aznSUaBsaRQj2fMWkwclED/qumovAffw4aSaB3GGLRukrVCVYHgGuhmUyYueU9HF+waDRy+46tku41Q7BNrYZXRPpC1+BYY60QrmhLJyOIQUkn2GWMz3RDZER7hppFT/NHtl3PbSYUfOciISliTQVXE1GPh7ONcsn87y0sLGISxLQZH60lOEgvWIEmoEfdULxxKxk7mmjGvtZZuprIokpBggH6XNzO88ArzVAnNZB0akEKP33nTK7j5Z/8Ge+Z+QnEdjI5BDrKTbMnZDwWIOtAqAFuvUkMtA/o7X189Z8IaRD30mtZIW8U4QtCopfP88fdfzvc88yC+/szwllPiXf94H7/5wQdIE7tAF2Ds0LHJ+a4db00aOnYcplt81xVNrtju5AptLE23DERp3e+zdk5qAFcPw+hPZ1tPLFyzed4KblcE8cVAk5pN8dfIuebvRFRMKGtQMcmIU1sfi1FoZehlRzNXdTLyNMYhDydGG67LQCK3yeuD838axMi1re830L8e682RLkqwtlBuDIK+Gk4Y+kgL8vz0eTJq7TX5jqe4Hv9ftifjLjCcbLLuv3JvaWxzDLLakAg/+TEXjVGuuvmNPHT/nzE7dZgDE45Tj93OroPXUNVVo1Zi/kZrksmRKZrTsxw7fy9GFxQ61STCRNNqnNEUSZreWoPKau1xrzkC1hYYpZk/dY5t117C2OgEzo3LfW2aFMUkoSo5f+Y0eWoPOiyTq0AzQ9AalOPTj+3m7OmK77ymw+ufZXjfvcdpTk2itSX4IEVqYjCaN2extBeCeO0VED3NluaDn7iba7ctEc+dRdsZYgRlWzQmZ1BZk6y4ZuZGE1WWoJRI/YKXJCJGlHMoPULMUdqOVNBson2k6JbQdlQBVOFw2deIsQVr8WGe8WbG5Q6NdpO//dz9GLsfnTUBKdw0hlyIz19f0jtoAicp9LSRyX9og0KjrMbGTMwGlzyJJE6StiBEmZ0DkXZrhtVzpwhe05qaxNqiQcya0OuiJhw5BxmwoHVdP8oI4JRCLcdToK1oyxU4nTEpE53wBlxOxBhIdV8oKyOuglYeWpUhhYSxBoicqMbYsadJWR5i4Z77IO/CuIIYopy40pBl8JAvDKkqyUkLklAlcDVHrJRKOFcB21khVRFMQ4iLzTY+eLQroBnIPeEDkMG7Aps1L7hhJ0cPP8ZtnTFUo0fLjRGNwVkzuKms1ZTBo43GZE0IFQlLIym6RmNWKn70uSUnu1fwiTM7GWkZGiQqDUkplLLc+8BJnrG7jWGMTClyx2xZZ3wiPzV9JUR/DHDuk5XMUKDKSRYB3Tc5UeShRUXqiaF+f82y2+gLMLxsNIsG1+8bYW9a5CE/jjlxL3HfddC0sn9CXSkPDnVoB33Il6Gqf/hg5G8px4vgcnmLDI3KzQKChnMP8tZXX87rv+0QAG7IM1B4CPDHnzrBL7z/fkJ7GmWLupzLa99f95UHjoBZwYn7aOhV3Moqf/2ff1T+vA7Kf+pAtdHkJg/Y5mxY2DcJTuv2o+jPpR98/bqkYXN4O6N55x99CM20SCT7KAdgbUHW4qKXTECLoQLaGHyG9sgEb/3Tr/HrP3jd4DODfvgmpLiLj7ef5F2swFiHYm18fV1gZt17NioJ1rYtiJib7au+MoPv2sDwH359cN2V+OEPfrpMvXYNBdQtSLPf1LbZPfW0E6IN78/DnIXhpGjtGvb/Nrwp2+AZ1/wQn7v9/ZjmNr780ffz6p++HqMi3SguesolimYbPTXFufPHaDZGBSGwllxWVFnWw5ZzA06LyhldQ/99cqVShpArlDLM7t5JA0dv5Tzt1ii2nikb6aKMYmpyjmnToZqP2ElLp9MFEoV1LOO5c3Un320e56Xbe3z8cJfFXpuJhsE5RxkjWflaXixW9CkFKdiMIfpEUVhyijxUjfL8Ufj5n/s2XvXWo1hlyU6hgqbQmVRV4Az0ehTRD9pDRjXI1snAnyADegIWnaXNqWuZvFCbkqjDqkAuLEWM0FBUSaGWOlhrWVidZ8fYboq5RD4ubQutMrgGBkUIlQzBU9QogBShFkQlQMRqLV43ORF7HuWMkBkpxBqYJG3ulFCqIqYJympJ1B9Fh3ZjFBtCICldMzkzyeqaCCUwpU+JwlhSFOc9GyI5BKKWXqZKItHIWYv2MEW0sWRnCFXEJBl7GbESBLWCmEhGEXuR48sLPH5c9KnnqWiZQKxKlHUkFMEHNBmjxGEJW5DK/g9TkZb9gLiRC0EGTJZ+UChkEA0pphmrlgAAIABJREFU4XxAQqUQUHQIMrZYW1IV6Myf5Ibrn8ntXx9FmQYxB0DJVCWtyFUpsGrK4q1utAQogIbALcw/wK7ZSb7xeAAVMMmgC0VhZECSTYq9O+eo/HnOnu1RtK1cj7R5T3jdc19Xm8NwfX8d0GkoHxgUMsPw7BYM6S22nBUpl3zuT36S/f/xz/BLHTh/DHZeTra16Y+MXOqXUQy4in2IYVC6De943Qki3bUNFUx97tZlWHyCn37Jdn7h268iYodDf32umocXSn7qfZ8m2l3QHBdpZ1+2Nlj7+weXJEgunoCVJZgY5bf//Y3riGBPt1q/qNLaWB2r9YvwRYTBdRC1SJC22rY6JpXh3PwSZmZKjt8ISme0kQRaycjuHBXaAlHgUXLGNAz3H3kMpa6TORIqDQX2jV+0Eabe2PZ4Gr3w/p/Y4n4E1idAQ0Ofhgl6G5OOLdoUQ2/Y5HvWWmm5HmnblzrK6a9H4tadz780CfhmA33/Y08Hmem/N4U1xG2LTaOIXrN0doXrbt7F3qt2o1IkmlyXewqVCrqrpxmb2oFaPs3eS1+CiTKFTymFM9KaKoMfDLrpG5P15drizaKJ2ZC6kapzhpM+k5VHuwYpV+hsKJqjOO3pLK8w2x4lNypSZTA5kp0llAFrM13teM8/VbzyqgVYDqTRWcpUYYoMKeOMq4nRQ1yalMSXpkgo5N53pmDHwQMcPfwQ1E6yzk2I414OhJwoAuScBIEAmTZrIikZTClkwJAyxmiSkiFyynuSyWRjSSqSfYfCNgjZYY1F+0RTe06dexwfJtGqwLOMX9akXGCcKKQknROlW4oBjBAIVapbjlpauiYrVKiBzqqSVmmf16MVFA0oM5kkSgA3gouSIPY6C8zMTnD67HGsrOOJzuo80+M7aUQ96A+TFE5LBaxVxviAz4nCFQRfYpTGRE2lRKOJD+ggEokKhXINGQsfIyonjGmBteTQBR/RDUeZttNR0DlzhN1XzKEXjrM0sY2xQtfwhyF7TxnKge2jI7LajRA9ptMhaUMcrSEx26Q3pjFlD3qrUjtYgajwntQfPasjVluSM6Qys33Ece7oCcijYimpDC0rTnRRiUzQV1JB2WzkR2gUpAxVrTqYHW1zauEktx/bTmEdgYzKHpsLUoToFDM7RlErmXK1hy0SPivpJfUh46FtI1ksZfF4HurYy0M79MxHwOb/l7n3jJbkPO87f2+oqg43h5k7OWIQBgBBgDmKEinaAq24orJFiZRk0haPrGB7j8+ufdZnJcqKS+mIXEqWeGxRlMRdWitZJEWJmQRBECABkBhggBnMYPKdufn27e6qesN+eKr79g2DGYj7YevLzO1Q4e2qJ/6f/x+pAjyvwdqQtm81FCpl54jiv/z8G/nZ3/s8nYXzRNuAnftB52If+xl15dR6Zf7Bk66yqS2GKW4st/ewCr1tbuEqb70n47ff9jpitNtOf8+udrjnX3+EtWIIpiaFQKMSwpBeFAOBSPX66iJcfBaGh/mRl07xL+6/tb8O13W02wQG66C5rUC17UrXGxxXrMamBoKCmxH9WT8hOV4ZA6E5jAkBAU4I8yQholJLdKFqBRmMNXjjKkwA2ETTLg0REbeK8frXv+X8N29b+uyb12KdQEldrzKw+Ri9NgobKwMQt7+nb+SYB7kvBp3qBmxAFQhExJkMfneb/Vz3OP8fbS/E+QPiQLaAGXv3lICYNQpXLHD7y+/mwtkr7D78VplmAgGfaal0PvPwf+eWyWvMzZfc/qbXoatZf6UEm6MiWK1JjO3jTVR1bK0FfxSiKLR+6R/ex85GyuryeVBDlEQyDI7A3PwSO8ZqqGQE20xwzjM6OkqkZGUtx1sFWHzosjh6G959kXsPTfA/LpYMZSmuLNEaXJCWhNYGXzqpNHvfp1MmKmyiWG0v8YVPPsLUviMEoxkeH0YPDRNcKRNLFdhaowheCNyidoJ+cg6V6kqVV/yQjwpXOeWkDISyRCtD0Jbou0RrCZlBaYdbXOY7j4zSaAwxN3uVC88u8WTrGImpEtUYBaemxVHbUGnd9NZU+PRBSR4TTBUYpCnaeywl0RlINNEVogcQhQshALrQqKAZ3zFFVJE8emzZyTHRiphCWeKShERJNOecI0kSQreD8SXBR3S9jgOMEacWQySpNSgVRKspVSbEI2WJUjImGCqVPZHFDSRJHa89EYVNLU9fvMZr77iLxug0339nm//27CINrYiJFRnixGJRFN2uoO4Lh40OnMebRPovlaPx3pEmBt/1osQUhDjIJanwImsNGnwZiTqSYMh1wqcfu8LtOwpQmppKK4KHiNZRlJ+yjGgclFHKMyYRgIcCpTRFKJgZ6pL7GqtLKcloJGqwSY3ooZFqik4BZUHUjlZ3lebQTkywQvepeqQ9veykR5KjqtG4ShCo94D3VOb6z758zzDgV7c1VGrTv4MWZ9B4CZHFj71mP0f2/SDf8e//lPzSo8RQEPYcrPzeACJ60NHqqkIQeoHBps/0PqcqHesov0mfIS1Edurz/Pk7fgXhodhaBP7UU8/xfe/5OHnYDVMzECvREKgqFL3zqJYTDa1FeO5J9JDljUfr/PEvvZme/uDzOd/10bABZ6Z65U7N5rnvjW0B+Z7qcRpsAvZtnrO/qS0KwU6qAsEb4UhP0ko8qyLG0ppggaBIG8IUGYIWkGCMlOQ8eaYlo7qxUtTsn8/2x9xu2zzhsO1a3MR+NoAuN78WB//e7vy2C2Y3/b3lWan+r7f57sDozLo+5eZz2r6NcbPbzVSbNt4nNxcgSvVv4Fnc8J4DPCe+/H4aqWFhucG9Rw5iiBQlMrJtUxZOP0gjnODClcC+F/08GXWiiRSuqEBxCUpHtAIfXR9jpJSSXnf1f40RnNXqgzQn78T5q4wc+SESIiiDiTA0spvct9k5M8RTzy5TszsJviTRikaa0XI5ZVHitcJ3L7D3wBT7WuMML2WYRJHqumAWqOhFcEICazPKMsc5qUjY1LKW5xw/WGPpWU2uLCNTI2QjwvViYyAGR6oMHqFtV0VJcF5I7dBYLyqKJrEEHemoiNEKU7FrllXbI5QOkyXkZUG6lpMHTZZEltolr3l5wqmT3yBtTPLUyg5c0NhYENMEg6nou+V3FrFVLSqR2oOxaGUq9VuNEDyV8ngoRQwp3oD1Hl9KAIDSBNUm4CizEXQzsnphlsbYGEONJlYnipRRao0Er5QQopQRnVkpw5QFVtmqP6FE8U8J+1RUSojVKoSj6v0KVhOMwmhLGb1EVVrj8y6KAKYORkvEaCxfXNa8oX2Fk6cu0mSKpWsdxnZMYZXFhIiLkWg0USnK4GXWsr2GSofR0zWKvEQ5hy67pKZGEUrpyViDz8EkGluIXn2hrAigxCBqS4mnaQz3f/shyJe5eLbgi50S4xEZy+AxMRHug6xGtFCWOcp5UqtxhadbdOi2c4YnxtHlKTI9ziqeVKW0212a9SG63TVUVEzv3MWFp04w3mgwdfSY8E1TldD6ifJ6JD/YhxRTNdh3jhKM9TPxgX6f8mwwbP+IzEUrS4gFrzhQ589+6S38xK99nNXZb0JtFCYmAbee9StYl5CujJDSm7L/HiJfyfwuBq10P+SJRLTyYDRf+N9/GbUZkFdtj56f5Xve8xna5T7i+IS8aNb73/3ZfwU4L5H98iJceIwsrXP3bsvf/voPQ/QoXNV/763bTQLV+qX7deM82G/tT1cMzK8LJMHTIxvq9WwHFeteyHZybo2kPoRJUhwRo5RUu5yAP7XWaAt5GWUyBFBGaFgTE2lHkVwOWyiHt1n3/r0zkIFvrnjcoJXxgrYNJX0NynH9qtUNnP+NDybf6RMFrWMgNkwrXIdT4FvGBtxw26aacp1tsF0i0zK9N6DMHd/8+19iaCiytLjEsVf8exrRseo0lkBWy5i/epnTj/4pB/YauvpepqaOUaIwGjJtCQghjaruJ6103waYSggHQGmDIfD4Z/6QnTN7uHDxSUxylFuOvUkgTMRKQwVMt82lM5c4sO8OslMWhxLqalUxVyaa6A27p0eZX7rG559YwPgMTU3MSfU8+eiJVaNXqYC1Bm0tJhq6eU4oNNM+5+C9R/nMqYRuJ5ANidSuSgw+igQv3bJKFAUHEkLo+7kkGmLuCAaSqAnB40PEGwVKY7XBxkhR5kLHrJyMz6+tMaq63H7nLTzy0BXuuftW/vqv5zDOohuWMkrLxFR2QqoRleKrqbQBjBUS1qAwwRGsQpsE70uCTVGulIkCD0mWClth3iXaiNOCK6D0JOkQrVYLnWbY6Etai7MoP0c6tQ8XDUmtIaNXRIw1BKVwOkN5CQYiAaMlw8U5kTHRSlSLoiLEgDGWgAAQgrLYCpUZywIV5UZRWuF9h2ev1Sn0LiZHz3Fw3zDf3xniYedxVrj+Y4RY5Jgg7Ga+2yV22ihtYbUURiat8NZS+FKqDUlCmucELeyDwRoIwoWuVUksndzEPgcM/9fXVvnnL4V7J1f5+GOXmZycpPSaGByJEe0B5TxG+SqIkawKm5FFReE6fOLBE7z8rSlvur3Jh84ndNot0ixjafkqk6OTlK0W565cYa01T95p07wwQzgeUCqFWPazM3mQNf0+Ze81EIcSdJWlKMxgz3aDYb5+BnTTWxSBGh8D33PPJL/1c6/m3e/7DMXZrxDDPcTpneLcfdVvHwTdbT9XVlUOIjHKtMBg/BABh8H2kAGbdxEdZ1c8r/q3H6VbO0wcHwGVDCTQPQfcA4hVL7XmUGe/iU0iR6YzHvz9t1eT6esqedcz7tfL0AdL+OsBWtnPzvuXv2mEcCNvgLQPRNlOszGTfp52RHU+X3jyObIxkRWVRRQUtE0NoZTrCiFirQY0OgSCr6YooqXMFEvOM2apKlA3U3JW/WuM+P41D5bs/1HbdYOuWDn/6tjbgvq+xeNual9sO/63Hdhxu//fYBsMEmWptw/+Bu8BtYGz+Tr4hN6pQN/xyyilRmk4/c2/gvkvkiawvLjK8N63MbRzD6VOqFlp0T779EMsP/tRZvY2mV2qcd93vJ1oA7UYyX1AqYjtt7TWK1lai4BYjLIfTIIm8Lm/+Jfsmkqp10ZoDNW57Tt/hSQKJTGII0tHxyjyawRr8Z0OtdFIoSwZgVYRSOs11lYWaRWG6avnmBs2XNITZKnFhVLK4yjK6r42icWXQTAINqFwJaQpaS0hjwWjjRrtzgKf+XpJ1tiLcwGvNMoXgim2CaQBl3exyqK0lckABc47dCUOZFES5EeDy1Ip0ZcFaEVZlOggFe9CpxijaZsah/J5Tj/+MA1XMrdwja90LGktARWrSnI1YaYCGk3UKVZJJVZrIZvTaUISIShbJRlegi4jQnDRWJRV/efZGE0sSzIsZWqpJXUatUh7cYVGcxzb6bSYnNxJd9WRNmfQ3lcVh4C2iHBDiFWpxxDKgiRL8TEQVERZQcSTF/ioREUw98JBTER5RWI8PhcmssRaogrEaFAuYmzKWnCUdcNUcweuO8fbXzTFx/9+nl37d4tTKEs5r/YaCRpdlsSsRoxKAINKkXhDkVqBsXhH8IHCGryLIsERvCBZtcFFi7cRVQZSldDB88WHS+6LZzh28CC7M2inTaGet0nfSRhr8EUEF8FKkKMocToyNDrC4t6XEWsX2eueZKT0LNtplM2ok1CGSH3nTrrBMj09ydpqHWVSHIo0rj+4/Qc5rs+Z96Lq4JFKjK6IftRmCF3PBLAp43/+fv+WbYPRC2hliKT8zBuOcW1+mf/0F49SXH6KmA7B6HDfqYuDV+sgwRCpaAilntXXAqgChM08wKwPOGx3tldKuPWdH4KhuyCry3lqqn5/hTwPg18OsLoE509Aatm/Z5In/uRt1WL3eA16S7S9Ed+Mst6YhUlmGnsOsWo1iDyw2naffYY81aOk3dwSWCe52Tzy1q8YyInx+BOniGUUyWVtCNqLboexWKsouiXELtaklWpaikfInrz3rBQpv/+Rh/l3P/Ii9AAS/7rU0f2THBxz7PE+xJuvnlx3QmC77FZtupdvcB+/0Kz8Jj63vuY34+gHA8eb2Xoqi9uc2naFmCo93MxYuPF48vfi3GnaSyc489jHmNlzmMWFBYw6xPSxH2Lm9ldLsRZPq+s48bU/wrTOsuPADMvLipd+5y8SjCfkEWUrXQk1kOFXx9Va94+vdYKLBQtnPsuFJ/+ByfGU6BQXZy9wy4t/ilQ35OcUqCGZURQLl3DeU3ZLsl11iryOs46u90SvcO0FXIRdo9f4iVcpfv2TCjc0Qj1qcnKoqgm26t27MmBNdW5RU89EGa8sPMOqQdld5s4jh1goT6LrdaJRUjwsHCYi5XsvRDuxBILHuogzSNVaiTCZJ+K0IVUJxntit4sxVrRvjKEMChsD2JQYIVlzvOqWBktLp9h/6A4++7VzmHCcJDUELXa9Z/4Ngv2S67Ayeo5HYdAx4BCpXxNjNXdhJdhL0uo+Ff0HhSIkCdhEtEFyS6vwLC4vMTk5yeJSC5vYBksLFxlq1HDlMoGa5F9Go42lDJDqiApKkIkEfOlEaziKrKogjmV80CuF0h4dFN4ayDRlgFgWGCJlQBx/YoUu2Tlq2vIf/vIkv/HGNqE+TkyXKS+3KCZGUFkmZYz2GrF0gsw0KcYKRoEIuvRS3tANlBGhHIVk/tYK3atSCpNlwhWgghDblVAUBQZYs5qXvuE+Zp99mltGUh7Np1G2jspSqKQV+07XADEKw6AWgaBCB2qZ4y+/WuPd/2Q3bxv2fOChFmumpB400RnylTZnlzsM71B0ui2Gdo8Si8vEbBdS29lYpu8pXvVIKKDK/lQc4Fa7Tvlzg2G7CWPUz356mcOgPakMjPb8m7fex4c/9QhPXKnDlW+AOwrTk3IMj3jvCojWF98JPedA5dlcFRiYDbl1xWKw8Ww9YBxrBF73y39E1Hsok4b0+wMbo4UYK/tbvdBtw+xZ8CV7D4/ymd/4CYhllUFvdGjyfb3x3222deBeb2pArzvmHo5jE7GPZO1ltYfNQU+gZ9A3VhU2UwJvRMRD4Bvnl4mhlJpJYghVu8N7T1k6vDGkwRDQaCtAI+kxRmxiycqcvXt2IsRFz9Mi2oy634QVqd7YxqFv/myVvW4eFdxwjOdrP9zE9kI+OxgsPA9otg8MfL7DDlSKRCWw+k71oEpntUQHi3MrdLoruHyNvLtGoi0rnQU0Urmp1+sUsWTHziMiOFYbq043RceCoNKKvcNDVS/rFssU3UUSpTnz1AMo16Uzd4J0SDMxNs7ipdOYkZdx1xt+lCJkqKjJtGa1dZ4LJz6EWjvPUK3L6qXA8Tf8BiGIrolNFC4ErBa8ix643qi1MPBVQYyi5OrZT3Pxq/+NXUfuAUbIW+eYqR9n4tDrIPoKpUS/UpjnHu8tExMTXLlyldztRRnh/KfM6ZZd5lo5P7X/CqcuzNHKjmOcwykFMfQ5WlBi620IMgJoDEELANZWYm2T7Sc5sivhsWuOoraT0VQIxAJWMu7edRmF96K0CZXksLJEJSJIFoVWKcYouoUnSTJUEikryFPHR7JanR6RnrGQ2UUOZmvEvM6+I3v4xsOrfZp0hZTynXPV79yzLUIApFEYj5wXmlQpfCWop5VBpn3FviotUwMhUtHVe2lnGINWJY2sido5wtUrz9IcH8c2Gg3KrqLVmmNi8gARhwqyJHhxlnnhSKyG0sv4W6KJLqCDq4y9wyuNMRrt1sfndMVLbGwi5Uclgji6uglcEMYrrQNXh26nNtli9uLTtP0ab9q/g8dMHV+WJMagcoeq1UXnODX4PMeUsXoMZAZVu4LgtfAmB0FPeu+wSgIaUYvKcES0UihroFiDRJM4x4MnC+6aSrk/UXz5Gy2Gx+uErgNb9Ze9kE1gRAtAuVCV5wyZyei053hyrsaHP2P5qde0ecexNT584SiLKhED3HHc8aI9zAwvo892WXjmFDN37SLiB0DOWzOYfolZiyXpV/yf3yb9o7Zem2GzkZdOg0XHwNf/4J284ufey+NzCW72KYiHiFP76KMiA5Wj72X8gzgAeU/6rKGPIB58bzCj8Sbgsdz9rvdzsX2EcnS4KhPEqg3Ss7KqlzYDAfIuXHoa8mUOHR3nxAfeiWBhk/XzeoHbxqyr19tfd8ibK7nrnPX0ornqGmV910vNPRR6NX7LYMugt5/NqkmK2dOz+MY4CSmlWz835xy//s9fwm/++adZikMy+lXB2VyMmESjgwQVdivM7YVtvXtlmwmArS2VTU5//Qq5PsDv///b5t/GRY0JOcuLF3DlRc6d+BTRLRBczs79dzN/5Rz4nKnJXeS+RW3iIGvnv8nUjv1Ep3GdLp3lJS5cCMzPPkdjdIxQlHTby2Qj+zE2UBs6zHNP/gNjI+Mk9QlW5meZnNmB62i67UV233IvC50OTs0ws/sV7Lvvbpoj02gdiLFkce4bnD/1WYy7TFrMMZxOs+PWH6e586XSKjWB4Kv7Rlts7yeNcYBdNKKUw4WCZx/6MAvPfoGJmd10C0uxOieA77Hj7L33Z1CItG+PULzHullrplg7RKfs0BieIjk/LIymRU5HJYzVFd87eoEjY4rPXTrGWbWXuipBp+hY4dFKh0orsTalSNMaAY9OLD4v6XoHrTVec2CNbtvxq398gvruwxQuoFKNCQKa81pE6ghVRY1IiBGTWUKIaBJQrI+zR02iS6Jr93USVIjUk4Ru9MQkQbku4VqXX3zjOMeajouXGjz6hS9xZuEojVrAVZULmbRTYtOitCaNcvgofDxByah8UBqUkSChwt0oq4QSR/d+Ew0uBypyOKXwTuxJp9Ni9soCU1PTLK62sZ1OB6tThiZnKFtXcHGUuq4RXElUDh00Rlf65brHvqcIPfIMLzSiWinBhFWl3Vh2UYDOmiInmWTCTkQpSlFR1AV94TClVAQembe8eGyC83Pz/MSLVvnSA6cZ2r8P3ynxiWgyR21Q7TVKYyQAyR3CZGfAeWIinOeiVQ3KVaI9GrR3uHZJrNcwJsX7FtQtFA4VDL/1t6u871/ey+LC53jz7hE+sdhgPG1SRk0oSvFjtRQVI2lSI+qK4yAGbGaZOHg7zz36Vb46e5Tbl17ORO3v+T/un+ODn2vRru3g/FrC+fPnGdoZWVn1DKVdNFZ66JtQ0D0q0l4bAKWqUhBVgWhLg7z6x1zHyL6A7bpI7Qr0Ewse/KN38+Kf+QOeXazRuXgKsBUaH7mJA/Qzvr5jRv6NFXK+inB7zMH0rkpJcOB8oDCWV/zrP+Dyym7ysYlq8LXqmVABkHrOskdUVeRw8WnozLNv3xgnP/BOdI8e+UbOf9O1b+zH99Z1fZxtsEUgX9iIEu/39+mBs3pESeu93HUNAE9vSmCrdOxmkKHmqkoxMaPwRTUFkKAiFB3H9798P7/6wTVcOoIocYKPoQLqKrAWpUpsYgRLM9DL37Ie22XHzzd/vzmA3PyZ/t89oGqvt7/dPb25BfACtxfSCttckbjuyGL1GyEGn+oZXVx+Buaf4rnH/4rhqXFmL19iZu8hanEB25igs2ZoLzyHDZpOscbly6cYHdnPuVOPYoLj3MlvULMppKMEP0/AMr5jDyadxHXa1OrjGGPw3TauM8vBQ8cJuon3dWaOHKe75rEz+zh+8C5cYy8vuUdjjMdGzerqLBfOfoKliw+AWyFtKqabGVYfxI6+mun9b4aeOJUS3pLEaonNVMm1Z7/MM4/+NTqUpJklX1tmbHyIhatXUcaw9+BeJg8dI6zOs/eWwyxfvcSRe36U0b3f1l+1wTApaIHutVsrqDgEqWe5VHRMxBWAK3jLjiVeMXyRsRnF353exafndpPWtVSsquRBWZl86SV3AtwTcGssZZ6+IDDWOo9tX+Orp+p099xCSpBxby/TD1rJfejzguhLlElIskwCDCfvK6VE+8AaKEuUTiEqjHfYzFJ4aYEGO0SGx2mLSQJmfpEjjS6zs2fAeR5a28daOkJTBbSpRg4jKK2JFfOfChofI9ponBduGxTSAogKpY1o8IAECTYSKjIiYiRqU52ztPusllZD0JbRyZ3kpUObgMU74ZVOa4wPH8J4TxlKEqPFocaIVhqvNInWmNKjXI43Bp1kEoVUYAylHEFneCKJ6+BdROUOkxi8MUQfsTohug7Bl2gSqQZkmkwn/O4X2/zNj+zga0+e4OiI5g3pJR5cHsbWmjC9S9CYZUFMmqjEo5IaJl9Ag4D/goxkRCN9Sa2tFFg0hIrVyRYljohPCoyTPnDhPWk9oesNv/LeM7zluOaHv2ORz35hB05bAbnUMlH8q1ilnCskUrRakOwKlDXsvu0uLjz8EH/8iQ6+1eRHXr3KD9x5jrDwHA+YuzHpMGdPPcLo6DjNRo2wdg5T24dSJZF1AzSIARALIw6s1xbYWJMcNKI3uQ3OW3NzuVfPKWmVApGvfeBd/Mf3/Q2/+Q/nKS4/JXLLM3urCkCVmUu4Tx8HoML63z0hILXO7d8n5YmaNaM4/Pb3s1zsI4xNStm/5zcH10ApehMGamWeOHuapFxi94Emp/7wXajQ66s9j/O/if5uLxjYMAqo2Ogkr7tuemA/mzn/q9cEb32dg69XGBSG2faa7NuCTjQuBEplaKYQ8shEfYj/+u9+ju/7nb8Br9BVcGSMHNv7EpVZPvW1U/zQK3ZffxJxO6fY6/33wXkD729Zs4ExQZKNgU0vWH2+wONb2baZ31e9/vl2Y4c3Mdq3Tkks+Jbu6gmunXqQSyc/xszRO8F10CGyODvLyNA4c4sph2/9p6h0ByudFXbteinZ8BC+0yXPcxpj04TQQZWe0heURZfG2BSLly6yunCBq0tn2TE2xpmLn2JqdJroF3GuZCRzOKR/PdQIFGGO8ckDrK0+zenHn8AX80LJXs/Q6iplyKjbnKGxfczNaib2vo7x0WPUdtwm+I8QwKgKne/RVsr7ynW48Mzj4vgQAAAgAElEQVQDFMtfp730HEdvux1ratSz3ay2Pbfvv42yWCIvS4YtXLjcZnz6tdz7Xb9MNEMMBrn9NlYEWwX5eaeg1gQdDVcutXhdc477j19mLF4gWM3T7SP8+VdLTuQHSeoOrRW5A1PJxPuKChitcc5RT7J+hcFYTZF7fKvNv/tndb75SIcnVsawXhGLLnkq/C1ojfMerYT3Jg8Rul2c0ihdYdasoSyFnc9GcM5hLBQhotstyk6BriVo28BnNZTrCmCyVfJDL8v41Ef/jkO3TjN95G4+9egYtbrBaYMVlQBRAQwBa4VXwQPWJhBLSV6QybqgrLRjInhthfsEh3EI1442FCHKyDvgXIk3iugDaEXNGorC4MoFYgRrE4VtjLKycAVthvFmQnjrywCpyIQGHTHe46Kv7J3Gauk9lToK45gPUky0BhOApCZsep01YkihVsMkFkIgBItCCBu0AXzExYI4NMXfPjvPG15xnK8/fJrf+vHjvOb/PEU8+HJMWsO1WyQV4tFmGa7dJgw3sWuraG2FPTAEtPd4lVDGaoQCjc5FFdCqAJ01aGucBdAoY/GtksTkxKbi0N4hHnikRVEbJksztFV93IN2XnqtIWIQh6aR6E1jSIfH2PPi13Dp0S8wMjLBBx9J+MTXjnPH7lWaMzUaSnHnHcdZnl+gvbjA3OWL7Dk8g4+bet8Dbnm9zBz73DuVOdr6+c3jf9fb+mXobfIuFW4oxqJR6FDwv73zflz2Md77yWt0Lz0tzc7de+Xfnn/oqQf2jS5V1V6CshBkik+uVcKg5RwOveO3WW7eB40GKCOWowcwHGwvIDc3q/Oosw+TpSkzB8Y4+YfvwtArQDyPM3nenn+vtD4wYUAvGNjoYAYJgHrruxnRP0jXumWsK+p+Nrn+hYESe+9jyvHoiefw9QY1oygwZI2MbtcRNXRzD9qj7Are5NRUo1p2vU7dqhR1C199dkkyj0Ee/81rs61T3MaBDp7vAA/COlgQtqDYo9702sAduR3y/h+LB9hQsRnY9+bgbZtj9J2+D5QaNC3OPvgBiHN0lufptlvUxsc59c0z3H7fm9n72jcwNr2rP+Lau6pGkZOlqWRk9WHIGgTvMKZGTCM1PUStAZHI1J5DTO05xCFeC8Ch2+8nBC2UGTFSOlAULLVO0zr1BUZGFUvXLrDSOs/kjn0snLnKxNRexvfcycUzj3Ho8OtJJ4/SmDjCYdjw0Au9uJbprcrA6BApyqs887nfJksDJsvYOTPGtQtPU8aCZmOYNGly4dxlavUhZva+Ets4yMt+4BcgDsk+o9+QkvQDYeVwCG3v1Mwurl5dYteBaWZPXWY4WeNLFyOJ3sNnTydczvaQNpo0/RpBgQ8FidYy2aUQFsDECAeAUbjgBQiYyIi2TQ1+WGMTxctf+3I++V+/AfkILnpMIYqj0t6M6CShALRWhFqGi6KnkmpDaLeJ3mOMpV10sI0hOqFBszlMJ0bS0uPbOU4XpM0mPktISGh0L/D6HUtcfOk9jGddPvhwQSdJGdaGXFXHx2N0Ku0777GV1HGMEbwXQiVt0CYBRPtD+YKohAPA2hQK4UFxEdFhcDIdYNJUlHiJJD7Sylu0Vj2NtAYYrCsjy3NXqQ8lmPooSYyoaFAqonwkhlJAbxihzdURHUR4POhAoqzMbAYnSMNuDlaARiZNsNYQoiJ6J2NzWsZGiBqTGJFsTCImaEKI/P5DTfZPHeTwwUVOP3OSlzSG+frKPJ3ZcyRDU7hmnZgl1NIMHRxGgSs9lgqUh0JZhS6DzG4GMdSxLMiio1uVSZTPUUFVo3wJLnrKoPiff+AYQ9c+y7ldr6a51MT7nHLNkWbC+1xGYSc0RkugUwE9tNWEIpAlkE7UGD9yiMtPPcbew/fiApyfuA8VIzPdSywtzTJ3+RIHDuwjGxrZwEO+xYb1nf+gKdnu04MVgOvn9BveUeG6e9q4DZSl+5moBE4qaN7z9rcQOn/D730uUMw+AziY3l+V95UEA5urE5qqhy8lr/75xchit8ut7/4zlut3Q61ZefCwXk3oTxMMlOiXFzDnHsE0hxmbgJMfeJdMf0RPvG56e/NbrwTfc+Axhi3OHdji1OOma9+sALjd1scNwLalaIVmeTWivcJpGRnyPpJohdeR245MoEnYMb6LfDGhPhkqFjEDUfdFUuqNGqeefa4Kzno8FIPjZ+rmHO6NwH9Rsz7K1gscBrUgNrZNrrufF7RtegaeL3h4nhE/pUzFUBmABS585QOEsEZROi7PXmPnzCs58OLXMr3z9uqokYDHhYA2Ae8UqZExslqaSuBckeWYKupVVU89EPunHKqA1ceK3RGFqxRag1LSuiFjavwOpl5yK0oppo5BUnHG89L1q5++9YfY0GdjvdIWY6zkOdbv51QbLp/8GCtXP87Yjp34omDp0mny2ot42f/003RXrlJvTEE6AlHj0RCMcJr0Aj42B7YDOJCo0coRnOP0U0/TbIxx/vRzjOx+JX9+aZjO5Qb779xPMXOZ7NJ5rNEUJoC2GCfVXa9kxBUlM/w2iiIsUZEmRmbofSB6z2Q2ye/+9Rl+6U1rvOP+l/Duj5wlSeqSFARItaEsujgfiBasSVG+JLGWcmWFzuKS/JbR0PUlFk+ZDJHt2Uduh6nv2ElxZZZUpXS7HdSVs5g9hzHNhHtHTnH5uTlGpvYxdfTFPPClBdKhSFsFrJH1MNoIts1IO1kevwq1YxPxX70EKQpviNKaEDUaLxiIigE1+pKIEDL1K4ZVlVJHx8T0QYxeYWXpsoAmlTKMjU9S+JzO2gKFnabpRV1OESUQKAPKCjmD0oA2BOcIThG18P+LGpOucAEOoxNMjNK/yCwBiV4jSvo/xuBKodbVWuF8SZo2wWT8+ifP8pv338bemTrvMGf5j19fIp+aYn6uQxwZoeYKumdPkU5NE/JONVcujsRTyZ46R/Ce4IX21EWPKzwqOGkJVIIWaIsmEHVCUTiOjF2lPnWY3//EVfSRO7GxRMVI2XaYzFZV6yAoWQU2sVL9CAqb9Ea6FNNHjjGz/yjtuWssXjnLmD5IqS2lqTM8OsL05Ku4dvkkWeowAfwmG6SrTv+69GyvzD8YEAw6n8B6l63XU9460rXhr+sZxS1GN2x0SEBv/K2q4vOef/XP+Ltvvp8TeR1/8TyoDHbsFopa1zP6ar387xQ99HtQEU2lW60Vb/ql9zHvjsPIWNUmqEqUUJ1vBcqsOgwUDnPpFDpVTE/V+If//NMkinU8wfNl/y9g26jWt5lzQK9/ZrC8PFgR6K9f3FDSv94x1l8cLL1rIpKRkWrwEHQklg6yOsZ1eevLjwKOWydT6klBLDJh4zQQgxCkeB/JiwIfy+q44jDXKY63v39ubqG2Ou2tojUM/N9f39F/S22ATcDLF7BJL1XWWlEwe/ITXLv4CBRz5GWN/S/+EW5//b1ErPRhg7hopSVRyKrKo63EMfOyRbe7QLM5SXttmUw71tpLhOjIbIbTKbV6E2OaWFtDq0yediWSOQFDVCLKpjFEJdgma7UoPQZHVJoCSXA0Mq0UQsBq0VWJVYbfCzRKQj9gEBS/QqmcE196P1Yvs2vXEc6dfIKi6LD3ru9n+uh3o0ioj03Q47NQSgh/og4bRMhg4P7ptRkHnoEYFXmxwt79+2iteWLSRoU1lpc92i9y6akVyrU2jXomfDJK43xZ8Vqkshsl/okotMPaKnwhY4u+qgIEBd4oztbHWTOrNFpnyXInNLo2IbicIniijmgcMY+4JIIr8WVJLArUyBBqeIJa1iSWLfLlBbQLLJ56gpGJfZQz02LHmk1KIC265JfPUts7xU9+16t47sGPMXXgJfz2Z84QR25BU4JFwHpBIU61WhuRvpWWqBLsjkksWBHCM0rm/UP0aGsgimBQcB4iwlCLJ4SIwhOc4BIUAWygPTdLd00xMjxF4TvYaBzddgdqnvGhXZjo8DUrPangSW2Cjk6Y/iLSL/KeaA02AEGCAo+wIXltqa0WhLqltAmmURP2vlCpKhlDVAaFwiQVwU7UWJOQxxzvS66o3Xz664/xosYJ2m3Fv33VP+FX/r5NVmsSr11Dr1zGL83hajVM0SaqlBiiyKEiYxwxdah2jo6RbunRviR0uyif4zTYpC7tAe9QoY5LPd95Z5O5pcs8eWKBhfB9zOSrxCSh1mhQdAqMVahgcGWOtbYfwUet0EF4Asrg0UaTKo2tpTQOHGRi3wERaSnaLPiULEvQjTrJnOPCudPccc9dqOg2osy5GeM7WBXo/VfTm6e+4fevC3K6wXsDnxF/LuN8j73vX3D3j/8Bz9g6+YWTEBxq9z6pBMA6F0CM6EQTCEgtSREpsBoOv/vPuKBfAuMNxNHLwNMGIOGAM1RFB3X+MWJcY3TPTp77wNupRHmvD/j7R2aW69n9AJhwi/PfdMx+S2bg3GFD8KVIeD5yly3nAfyvf/JXpNlOCh9QNsGVJTZ3eNPke+/ZSxktwUVKA/WkjqLEB4Wxihg8xlrwDpVkFRWwrrLA3rpsuv+269EPlu9vdC/1X6+qGNVaynjkdr/Fera47fFvapW2e/nG93WvyhMULF98gKWn/gcFmmLNcPtrf5n6+CFgvX2miSitKLG05p+CssvytdNcOvdJdo3tZXnpIjump/FJykouCcXa2hpDY1N0u21MViPNGpy5epbJiR3MXr1Ew9Rp+SEmdx8mqe9kdPo4WdrEpKOkVkk7RwFIEqWMJfaR+ZWKKFJtLSoRH6NUVW2UZ6l6GglujdULj/D41z/BzvGc4em9uJUWi6cuEHWNY6/9BRoTx4mxAFWBRavAN7L1WdrMUTCwsPQ4FXT0hLLFysI12muOqd3jLMznNMsUU0+IriQbGkZG2hxaJ1hl0Cl0C4fVRhhhVcQTSJKE6APWGIJyRFfSzT26kdEgUOqd/OVHn+b7Xm+YmZjgUq5xnRwVHcZGfIx4L7P3vnQkRvApOqnByDCqMYr3kNYmUPVxbFbDzF9Gd5ZYevwhcbxDQ4ztOUBbRczqKq+fGudrH/tD5ovd/PF7P8/Xpl9KNl3HOKniOBdI07SahpPxXW2ERVQr6dubJIVQ4juFlPaDI0QjmAHvxU8Y4QogQgilBIAqyORCpSsQqfxsM8V0OpRlIHcBq6JieHyCKxefpTa6gDKjJF6YhnRqiT6gsxo+lNgQKaPwJitd6aebSMRgbASTiDDJcE1mVnU16qQNSWIogyOUoMwAIjl6VOlkvyuX+LUfv4Wj6iTXzq5y+hS87JXHGN2lmb90imx0D6q9QlrLyMZ2YcoCm9TIncdrccQ+aGxwdDttbJ6jI9joyLtdVPCYxMh4Yt5BpQ1pV2gFXrN7l2ZseIzxg+P4MxXfurF4V/Z55oMvUSGiY5RenpVyXpLKQida+JxlhhRCFBVCDQTteHa2xWn3JLsPHKWVe47smiD4alFwbM3sr2fMBkuckk1vMHDbfm673WxjYLcb47reZ1kvj6Pg0Q+9i9t+5vc4pVKYfZoYS9h1ZL2MX5nMoEoImVBXRlgLGXt/9r0smbuh0QSdiMMfLPtrQ8XJWelDd4kXTpLGNXYd3MkT73+bjBnFsGUFt73mm9y2agBcByjWf2/z/uPz/H8Q8S+l8huJ8sRouTjbYmjfLmHgrAy81lCEnHsOTsmuUwWplKLxMjoUo0L16Ke9J23WmWu1mRpO6Y039hjJ1ADb2/W3MBD0qI3/33Tv9YCOcXDd+tiJza2Rrf37bxkUOLhtEwT2qjolDkvOiS98AJtfwdT2sOOON1IbP0qi0gooV5KohKI7x9KlB7n87FcYG2mwtnyZLBtmaGQfu4Z30+nkTIxM0m5lTO27l9mFz1IbPcLoDs380mVcu82Ood10Oi26q2t0Us/M9G3MXztNMylRxSWW5p6kvPoQ167NkzYMC/PzKD3F0Vu/DdMYZnhsnCzbSdasEc0IKgiXfYjijBMlSHfn1qD0pFmdM099mm7nItfOPU1iFjlw6DiHDzVpZmNoV3D+2go77vkp7th/H1pZ6FFY9yAUSMapNtmdwarRdQW0ojzSS7PP0RjewaXLzzC32uJUnEFPjGGioqjUV1WSiuxtIRVb4yC1GoWhVCXBexJdiWtZUcEkRmwtRTtHt7WGsylDQ02O7jrE6A7P/uYCF9ciJmkQygJXSmXVKmmHYA0lYNGoWBIWF2BlFVVr4LIaaEv0BXZkDDUxydjkLjpPP47J11h75hRK5zRmdvP99yW0n7iDuSdO8q9+8AgqP8eHnrjCVziGDZ669hRdj05Solb0OqGmAkwbmxLQ4IuKaVFXOIAIUaF1gCCYgEAha6yqiTwfxF5G4f4IoZdEpdQnG7TXutSzFJt3u7RXnmNi3xGybBSLxylFYhJh0UsSGbJLauAC1mqUd/jYk0PU2Gq2OhDwGpTKAEEeBxf6ioJGW6IVEF1Eo1VAuS4tb7jLXuVXf2yYsZ0rfPnvHmJ0qMm3f/tL+dCXZvmLh75BiHVsPUdPTGKsFvrfIqdQWpy+tcTg0KGk7LawRRcVHd28CxhU6bEJRBKidigTRZLYBZGU9HB4epTJpuPisydpkBOokecdlHcyx++VUAkbLUQVFekQPhC0RHNlWfali72XmzH6KFG6B1sf4Z7X3c/C5TOMDU9x4ssf5TXf+2pUlJGNUFVKeoxbG7fNjqFfX75pu7ftdiPDOliC7v3d+16vLN0vB8LJ9/88P/O7H+fDXz1P58oZaQfs2idi1iWghdOa4VFOLa3x8YfP8+4/+TyMHYf6+HrpXKlqNL4KcHrOSIFaXSNeeRLru+w4tIOTv/uT0vO/3qz58yDU1zOVTQC1gc/0s53tAqoNY2Y3uW1zjn0iod772wUqUaawu4mlGRzEUHF6R8pEY1YLVND9yYopIt1SQJJl6D2LMsarlCLNMn7zIw/xnp9+NT1NhDhoNKq2U09sqjq5bc7/+e/Brep7g22U67QFNq/T4PhgvF7Au912nSC4f+/KWojKuidfPM3ZRz9E4iMjB9/AzNE3o4MSgBjQ7c6xcO7TXD39INMzu2hfvsLo+D4m9ryIEM6y6443UhsaA90gYPC+JNEpUcH4Ld8ltlnDTHUaQufjOBRLFIG1xefIi2HKYpGVlUW6rTWMjwyPpOjSc3jfIcoyp1w9QSwLlmZLspEdXHzuBKbWpOxexuoJ8rJLYjOM8YyM76ebz6FqQ2RVgDcyMsPwbfvQcSfLs5dpz1+h2P9yxmfu447v+TckTvWXrT9B07cBbPx74HfuVwB6wYJab6n0ni9tElqLs0RTsPfIfiZ3HuRTX01QZcBmKdqk+CDHDc5gjSFGR+4rIGEoJes3SgDUSqSwk7Qi1IkekySkwOrKIlfPXWH4dV1iOsKxGcMD8+IvlK2hnKy79wEVLJoombYGFUXwBwKh6KBrmTAjRohOqHhNViMZ24FfnMPoHB8jK+cv8GsfsuyqtXjt7a9mcXaJfK3Nzx5v8Jah3fzx1wouxQlUbAMWq8SHykSDJSKYuYjHIFgFhYeYCtmP8uIzNNgKPyJt+4oOPLHVwgdCdcMp7clbc8zOXmNyzzFa7Q5WJ5b6+D4a9YTlpcuU6W5SlUhv3JR9cgWIYBOs1qKFrCNohVVA6QUUF6UUppQh8ZEyRHRiZIINUR0LvRnq4IjOkueKl0ws82vfrfnE//0Rdh3cw+6ZAyyEyP2/d4al4dsZ3r+TXalBN+rE4PCtVZwGbRP5EQLgHLHbwfuAi57MVeREiUwPWCK+9Cjdo43RffIGrSJKew7ecoA//dM/YmzmKK5IMLZGkXeo2Ypf2Qm5RIxRuBEq8RttpXzqnMOkSTUWqCQA84o0scToqTcarLXrnD3xEKPjQyzMtxjaM1nlShIsKMU2Ijg361i2Cwg2AaH6L29nOG+AwN7y8c2lPwkCtIE/+sV/ytAHPsMf/v0pOpeegCTC5D6wSdUKDjA6xi3/4SnI12D6OJisKmTYCjwoa0JVJdBE4bhemsOcfQxVs9x2cJyHf/9tojAWfb8PeXP9a8nWe053A/iuWqOtyfjgPmO1joMf2oqfoE9/MvD9bQBvW461BVEfiUQW1iJDRrKGonSoErKsTkbk8NGJChshI29/8r/8IG99z6ewQfIEEGMaouB3jFF0QgVkrTK9qNZLuD3sidwZcqeul3h713ODdY490qPKeMf1691CcMTWzHHLeryge7p3jtd7K0CsVNyA01/+E0J5jq5pcu+3/QKeFBcdSkdMsczjn/8dhhtjnDt9gtte/N3sPvYaOF4jJiMoBcN7QDAzscqQA1YbQWxX+JfB2F6IdUBmimoANMdv59gr7xg4yRziGs984wsMJZZL5x9hdfYSk5MdFq/OUUvH8SvLJCaQaI82o6KIZ5TYnO4yzaGU9mqbRq1Gp93C5auYWHJ1/io7Jo8xc/wnGRnbiU6m+3E2dnudgheCDembshA3PTqe+rBCrQyTZIpkcpqrYR4zVEf7CKYGwWOcwIWCApMZVBnxpVSpSDWKpkybqYiNQoKlQ4TEoCKkVeKqVMKpx5/i1rEdfPGpFtj92KApyxJlpa9uq7K7kJnqquQuvABaJaQBfLuNGrKUSmOzBBMD0SYMHbqdtj6JX7gi8bFVfOPERR7Jhri4vMYv/9itXD15lufmV9ifPsF//oFX8xsffpJH1SFM3iGmVcYOgvOo1ldHkV7ugTVN9BI9eo9KUkATQrmuAx9klNEHCfoJVSIeLSiDrTXYf+zFdNsthmo1bJo0GGkOsbh4kfrwJEbJ3CM+9G9UFSWqMCbggpfed3DVAywSow5Aa3TsmQlh+IPKqWFBId/XCrXWphMUP35Ljbe9dIlP/j+Pc/TOVzI0bvnzB3P++2MRVTvKPtvAzoxjbCpIzTUpdVid4IJDlQVKKxxG1P+KgjTIj+iKLsYkRJPgTFWFiBGiUBKpoEi0pvQFWqV88CNf5adeeS86GP7iyZxuWVT6zAmUSjL/EKpStoDYddU7JcSqV6UwmcUVpeAdNHiqng41QjbCoeP30V5ZYWpnm46KqB4wrgJhbW2JbnI6G8qrvTC71/t3UHXW178y4Gyetwf6LVYSBvcU4Xd+9g1kZc57P1+SX3oWVAoTu2XhVBWh1oahPrJuKWLFp9kH0FWlKyWjP2rxMuriVzAjk+zZEXn8D95GBIJ3G6omN2Og+hwL252/WleE2+rkN+zlBke5AbjtRu2IDZgBIHp+9cOfpDk+Sdc5TJIi9NAJ3bbnOw5PVhVCmS9eWF6mZiCYiPEGFWVqABNxoWIUy6vW04CxXycninKNfaW/Xg9/sCKwXeA58N6GLB5unLXf3NrcjKTuttumVlbQBljl/AMfxBUrHH7RD9MYP16dbuTK6U+SX/s6IXgm9r+MA8fu5+irkgqiEFBOlE3jYPVp0221cT23u5hADIPl894bGkGMjXH07u9Bhciu2+8XNlNA+w6la3H2xGegKNhx6DhnHvsEeXuR4eY4y60OSTLK1Std5hdKDozsZHrvi2h1FUfueguHKy4W+ZW99Pk3qIpuBfZtWc7BqZHB19X6b7RF30MZTn79SzTjLBbP/JVLNPzrCUqT1VO6zkNUxAwR4CkCkKBMlfWGgLUJOWDygA85MQruSrkgvBiuwOiEIjiO71Lc/7rbqNU8qmZQLVEetUYAlRFVAQm1kNtZQ1nmfcChrkjHdDXubY1U1FAWGzRYRf2WO6A4TLmwSFxZwFtNubDAk5dy3vHrT/OqfSXv+tGXUKxc5MxnPsrPvepWfuPBK5zuDpHoiLcpGoMxRpRYvUeZVEYFlRYAoHL02mYKAZ9rFDG1kqASqvFFCYCUFpCoUkLgp80kRR5orc6RJBnWFzmz185ibWAtaOq+ga9ZTDCUzgnYLYhT8q4qu0RQJIJ69V4MtK4MSHREDEFBohSlL5GqTSAqhYkBVwaCqVFbPMv3ffsMjz9wksmZHaDb/JcHhvi7J6CWBLQO6N17MI0G5VpHojutCT70MxylFCQpLs8xzqNcKXyDPmBjFJCfMYJlqIKSaBIoc7RBWJWSGl3dxUzvoXDP0J6bZ/VKyvjIKFoV4risPKDaVy2AUAkfVQFRCOsjdTG4SotZpCltb7ZWOVLgqaee48COGqMT4xRzDkIBJiPG9SxwqwPrOatNGIEemcqG/rNad/p957/JEG8zqtV//YZjaptlSddLe/3soKq0/Oo738z/S9ubh0mWneWdv++cc++NiFyrsva9u6tbUkutpbWCJDYhQBgYEJufMRbjYTCDDOZhNXjGeIEB84CxBwtLDwaGAQOyQAxgBEKABGhXtyR6X6u6q6uqq2vPPSLuPcv88d0bW0ZmVTdw/qiszBtx93O+7f3e9y/u/y+cYo6VS4/rx/cdU9IgMQz6+BvU0mCXDS1uVu+6gt4q+dNP0M9bnNiV+MN/84+gRlgYMyJKs12EOHUM78lo2jk1BneqsZpW55+G3RjsGaY5Gs8HiyCRSMCK47OPXkDE4sSo4+0S0QcqKr72jS8FiYRaEGT9ckkKPWJSqVHjLGCIweNMJIiwsHe+ruXWDnsaLt4KJGquTZ/ztKh953tT34MBS2UaNzLAeIeF4kTG2ymT6qCPfecFGH8Ycao02HEIj33816i4yp1f9ENE2iRgs3ed6+c+wsqlsxw4+dXk+TwLiyeHx5dQX8qUljcYi5THBJ+QQZtfc68bYqFJrYhG/Gd4TF33XPM+2Q6Z7XD7q7518JlXvvXum78XKQ3S+7rH7Y1/cz7bqRdu+VvS/evbY8AM9xcw7N6dY1dyTDHDhvdsZhEbHT5FDUSNIFRU3pOLIUiiaLfobfYJuVXp3FCSUtCuB6fcACIGIxpjxOAJpcFV12jZGVJ0PHk1IfM5PkQk6lpnjSBRwYA20xbD3Jn6ubQxAsEZbGdGZ7PNyOuIvZBIJQnRtDSzR44QqgNYJ7TPXWTz6nmq2OPzF13fAoUAACAASURBVCynn7tAa/MKz604Np56jP/tdV/Ib9y/wYMrixQuASXQJoY6gJQIVp+2iKuDkqGEvBBr50q7MWKdncaYOjDQbpBQg0U3V58hpjazxQIrm8u4KIZdB09w7dI5du86QJIO4Ototn5YAuDAeJUgxJGMpvtTCBhxmFoKEdsi+j4mRZ0LYjGZYgEMWgIWk3iJfY7/+K9ezqlP/wkpW2LvrUv8h99Z5v6VPnnM2PfSVxGX5jE2J/WUISn0e4qyb7eJ3b6iWm1bXYFqFTY3lSGpLBHrqEyLRCDD4H2fFCuiWGKKuGi0NSoKxESr53j8c2d41Y/fyXOPn+LOM2tcCx6TtYheuxewqSZlEJwxiv6v7ZcVU2swa9pMrFH2JcBlWfPWA4YiN5x9/AH63oDLByw4w8ViOB23GpX6gM1kHYuusi1p4zFjPiXqHCOvabbdwAkYKtNNtsVFhhz5ek3OCp/5pX/Gl333f+WzVx3d8w8REdh/HGKDkG+MD4M0GDHUq2OEzMHaGvbxT1IVBbfsavPoL39PvaBMgsb+LvAQjbM0acyafW+HzxjNyFhuSMo0eo9vwhmwNZ9hVQW6uSNLObYG9lEYzKrl2GJGApw4qpD4pi89yQ/++sfIZzuQLN5HxDZkQI6WWO57/CngdXUSRq9hqDI3eu3NizLKbDhx3Y0DuiM+Zbusy6RjMVIzNm4cYCbVTd+37YZIgiA89In/m3xmkZfe/b0EAqHc4NMf/SXuevXXMr/0co6c/Dq0AGUAP8BKDHc0PaMxrHtrdN2cexxpSx3dVcO1Mfa9MYCobON81ZkMap7+ONz/mFpgk4WY/DtDZ2X0PLe/b3LD3wdR/zY+mgVyIvlcwdy+A1x84gK9YHF4KCNZ1ka8p6qJq4KxRKsaM1mRqBJ4PHmmvfnitbVcEHXqxFIGSz9ErvS6fP+bbufcqU8TgyOkfeQhKtA4hxgCSSy2iVqsqYHiPfAV1oIrZglzs5AShcnxsY9YizUZvVCS2VbdcilEHyjaLSUpOnYcM9dm4+lH6SXPj/+/5/nmN57gdbddha4nnf0MP/LWV/Mv/3id5/xu2sbSSx6XqQw7CIFAbrJBd0D0yhmQYiARcA1ewghC1hgQxCRSVFBgo12zcPAo1y8s06s22LW0GxdjZP3aZfbsPcLytfNEOVm37CmTkKZVlXwgBKUFhkAS9ZgSylmMWJLVqMlaIUVHwOsLGSLRCCYZQrVJh8TPfdNenvzU77ERZ1g8/iJ+9L1PcPaSIzt8lMMnX4IzQhl6OBFMbin7CVu0SUaIKxvqCVcVPhlccpAX+LSp7eUp4souqUamV0GdGWtyQhWwAikfUaVKkcIGnu0LH/n4ddzmWe7mAL917lkOHtlPy7V0XzU1chBddF1S1qgqVmQmG3QFJNFugCSGJNqLayWRXEI6c3zmtPDKXYZj+3Zx5ulVNlOXNgv15JmWbm6MfrO4jvb71yn/tENU1hiaLfXSoQTlGMVpYmLxH53cw89NW7CHPeRD7noL/OW7voPXfPcv8oRZYu38vZoBOHybRggxDOqjNDUuZ9TzlAQrF3CPPUTIDXfMJx76jXcOjP+WVr8pxDnbj62gv/F7dIOvbzF0I/+XGkCX3GBhR2rneSKC2ppRmT58SCAVp6/3yRZnRmr0lg45aXaVhRbKhUEgs5Z+yFRfpI6gFVcpyuVBIKY+5zdzjMKHSbWK45Ax0NTX1ZxzZFhimjT+k/eGkc80L8a48znt/8O/DTEZW+rO08iHRv++AxB0tJ3z1H2/wv7jd9E++mVIWIdymefOPcBr3vy/UOR76s817I2BMcqumwAgDqLryci5Ltk1eJ9BFmC762ECIzLpoIuydyZRx1lEA5umIMtoSQtINZhUEzvDzwzn/vN3pKeVAhoHR1sPZSS4CHSXLxNnW+zdfSvFPgdXc2yeQfDEunXYGKMNQHV3TOm7GOdoOaFaj/T8Js5lSkaUjK4fCJXvqROyvky+eoFDRWL+5C18+PwsVXadwiRSnpMVLXykBv0lkq+lhY1BMJBV+gxnO9iiA0GzZpgMayIxGIxrkfoVNjOEAFlmKUMkSwlspNi7RDb/BvzaNdaeOcUfP7LBfY+s8v3fcIKwWXL1yYd597d9HW//Tw/QWzpOYSO+7Op9tEZJfUqPiCcZR5blAyfPiSNEIFUKl6rlmVWtl1q4SLvWqiwSV0vK1UvM7T3K2vWLuHa7jXMdnn3mQfafeAlOHF76OklEkcAG0YdAwtcLgzb/l3VbAnUfMYSo7EvBoikVfSNwCCFsEqrI//P1FZeffoArVwPZvll+7r2P8OyVDodedhd23z6SaIos80LwXaI4UgzEGMh8oNcYF+OxPpJCRUxRxRMQgnX4pEjQGKIa/AglEZNZ7f/3AbEKIIwilMUCrdDlN++5xm+9843c9bI1fuc95+kfOkxhBFeLC6lzo9mNlGo52Fg7SXUfh6kisVAAZOhpZsTUGYEWnrlbX8qhXRZLl2x5mfL6Cp3duxlKxo5Ovp2iTgEaAY8bLEbTUv4jWYJBP2+dYtxujArWbLd96CQ00YQBa7j3l76X7/uPv897PhOpLj6mrSpHX6RkUqPtX43KpLNw6n7M8lP4Ts7xReHRX//B+lqGqcuxrMeoozMNQc7oYjx+z5o2tW2uvPkUY89nDI0uI8dp0uXDFHBKGWlkX0NDNPHspiLflejq/R97mPVuya49BaGsCMYgLlJZT9vNI7bAoIYlpMi8jfhMaLuMEBJeV4na4QLnHM9cXsVbi41hUKu1xtaR6mT5YjTyb8ZIRmrLtq2Gf7RzZHhvxh3KaUZInZJtQsrJTpVpY+zdNjz7xG+Rz+1h17EvIvYu8pmP/Gde++U/xLGTXzHmlCWq55lYGp7jMJvXaHvUf69Z85pSi2xzzeMYkG3ek5EswyABFfU9VVzClNOXmpwnUTsKepoviPhpcK2NVkb9ftfOxUB7YSTbVXaXWVhYIPh1zj7yES6uvYjcKg++JCH0ugTvsZkjGUWyhxDI85zoE/0kiKkQlO/eOEdMXknrROiKIcWS82ev8M9en2i7xOp6wXv/5DQz80c0i+xVE8MUBXirtX/T4EIEMzOnBjV6SB6C8g14SeoIIGATGYZgrPJsCKRahrfKC6gC2IRzltaBQ7Tn5ll56mFOre3h/qcuceehAuscT37yj/jZd3wNP/KBa1TBglisaykIMWr2OSUNaH2sSx7WaDdPXZ6zIkiNoVLSPoOpqdXFKEi/rDZo795PMTvL8sYKLmtldK+uc/jky1neuEZyBzDeIlbrCSZpL7t1hpQsKYCTQEyW5DJi0h73lDTKT0TI2piUSCaQxBC8kBmlfnzPNx1g7dTvcG6t4vCLjvNb91oeuhxYeNlLKfYfJ5RdrHh8v6feje9jJBBiwPQqql4PawXvA6HIa0pIkPXrsLFMci3NVkTBBXBiNQNhk5IFpUTs93Sx6fdJrYIoFiMemV3kwXKZB566zNNnzvPdX3qUX7j3LGlfh73HD2LqdAoiZPUCG0LUGmn9omsZzxEqfWGNJDJXywenABY+/vAlvvALIpvLyyy15gn+Eomj9YScMtGpZ+dgTFlgJyb31jEyCUfaqBpVs0E/NtORvzCM+odpwxEDzzACGP3+JAPcL3z/17P5s+/j1z8Xqa4+A6vXsLfdSchyjUTq+0vZg9OPQnWJWMzyij19PveeHwQq0mT0N3rN00oX2xCVjH23MUgy8b3BvZy2ME7gKsaO09SBG4dpNDvCcFuDN5g83ykOm0ii2znC4sFD+H5JZpVmLpYl1lre/sUvAfGaChZHlERVGWJSR93iFWMpFmMDPkCIlqrfrd0eGaG3qZ38G4Ict9s+Wg4xDLItU57P8L2ZzILYMSdpi23a6Vlv4whUyZABIj0kP8rBE29mY+0sZdnjtW/7PxFapBSY2oa4ZWyD7RieIJMZojFdj3Fhjx2Nr0iacqf1+IlAI6Y1mn5v2ERhyjvffHfsfY/j5zQty9KIQG2zTo1F/5pOUCxJSpiR8tqVy48wt38/V8+vUWX7+YuLJdKxUPaJJocUlFsF0bZVEs45qr4nOciSxZdhIG5ljQpiJcCmPrIReO7xMyyZy7z9C05w8alLfODpa6zsOsEuK6xXFVlWIJJwkuGtBoLJAzFhm/JjCpgYse2cVNPaU/ZrdllwAXBxAAYXa6l8SY7B2EASh9Sp+1B5bHuGuTtfz8aj9/Db91h+4Ot285rbbuXDf/Y/eO2++/meV+3lXZ9bpOXWqGoGVTHaRZQEXEhgQo0Zq0jRY02BcqtotkpqR6DJEEpKhLpNMkkPSR36K9eY6+zCra9vMruwwNWzD9HZfUK5/7OGZ7iJYJR5ypmaj9rkNRCwpqQU0XR3SthE7ZXUBsNXOCP0q8itHUd+7g+5trzOXS+/mw/du8qHHtmgc+xFtPfsJ/RWkOioQsCQqJKyToXgEV9RhX4tAGGV7CepQTcx4E0gWavkMHrX8KLkEQaQKEjyeA+2TveQtUhJsEUbRCh9l4I9/LsPbfCvvrjFa4/u470fvJfz5R1Ip2Dfgb1KRUn9QmeOUFb4UoWCslaGj1oGyGy96BklDLIIQSwhdLkSW7Q7t5BV6zx79SnW7/kDvvAf3F1TfG6XCq4XmwHaf8q2qV+bkhIfKxeYwSSdOum3TO7xVGRj4IeOwc7p7AT88g9/E3ve/cf8zJ8/DtERHvkozO6H2SV1AjZXYeMSZBlkM7z9JTnv/8l3ahkmxpuPxl5QfXgkrT1p3LcseDd3IoMSwN/yHAXDBz/2CUqTKFptUrfEuZxkCjZ6ie94yx24mmyheURZJrzulmM8fqVHkoSzUpdPlMo6BjX9xYhBUoa+OiW85Rons0OJm2pz3Mb47zSGGYIRRcGxbIFlS3/6tjvT42ZAFa5w6pFPc9tdX82DH/9P3PHSr2XP7tvrY6ap39t6jBs5RtPejdGyyfOJtKcZ/4lPTDjfQi1F3UTgyWhNeDDXZfzzdZ3YbOl+aQ7QOFbbG//JMVUrA0PCsXb5CRazXczuOc5cZ478Mai8R6jJ1lItkStSI+9zbbM2BqXwj+AEsUrF7qsKai799aurXHzqNP2Vdd79nQd56vQ5nqxexPse7bEwk9isKqzLcAqNI9T8+Q3FMpklxajpGTQNH6KBXlmDaMFHo4gcCYRKO+bEJEqv5HOlRGyvj8lBrKGKkZbN63kVWXjRK7jy8KP8h989x//6lV1ue8ndPPvY/dx6cC+3zL6KRzcdM7Z2HiIY65Tsrs6AGRHV6hFbY1IizmYTpTslDUtJ5ZGLKOSdJaq1Luur60jH4Ip2CxuEYmZRFapMIoVSARIxDQxaU981yACNnzBKBjSiMEaIpKC9i9pfWel+Nit+4MsXuPb0Oq98y9fxqXvv5Z5ruxGXMXPiDloCAQ8mYZLBYEghEJPqOqdQKc4xVeA9IVYYk2m/pyigIyWLRK/PLaqwg4mK/g+hhGZRyzrqFdXkRDV+EieGLBcevT7P2Wslu+af4tu/8iA//Kcb2KuqOHhwaS+FTXgCoSmPGEMkEIJR4qSoDyPV7EtRkpa0KwVvzC4u8rGH7ucLj/SZX5yjNAFBqSx1fd3BoI9FpDdaFnb4fnJDn6JeUKeB+8Yn9NaF+KYP23w3CtjIT33XV3Pp8jq/9tnr0NmFhE3ictRUm8uhswRphX/xxUf46e98C0jS1JrJMDdRL//bDxlf6LYseCMO2ej2KfiD6ajpm6v7j44QKz5z5jozZo5+irr49NfJWzm7s8QtcxkBsKWFvDlLw4sPL/LIs2dwRV7XsCNEJftxGHxNfWsIpDqCGOonTGSeBkj+mxkjhmT0Pj3P7ocxFPxItkDZJ7fLwDD+9/q4EXj4/j/lxMkv5tLZz3L0xFuZWbyNSIXB6vsnI2Wd7cpmNzn/tqb1X3iKfacxRsAzyOpNbq/T2/U5Sf33mBRr0bS+Ti9FNKWqkWzODmN0H3Hk/Y9JMzkXzzyFzKxS+TU25AgX4zF8VZK122QIvc0+xjiMUYr0ppOq8r4G+6lCXj94kg/azl0GVq8us37xMpIMX/jKeXpxnbX+Er/0J08w0zmOI9Fvd2iJqwNH0T6ipBnblLReniUhpj6E5t3TbEkVA0W0BLzyyLgaCI8h9EuEiLEWslzT/75S2d86C5wQMIkqa7H7lhdz7pEun3xIuOUAXFzuURw0vPVwl9NPLOAqiFa1akKMWDKCWOU5SMqJYmvchqo5Ns9stFNHS36IIZhIuX6N7kZkdmEfvVThWnmb3nOnSWGTqn8VW85RtpXxLtaI0ubGgFU0fggaWUdPTIZGzzWJ0cmTVJ3IV0k9uX6XN+wtOdy7zAPPXWH9whPc393FfVdLdt/5ctomQFTinsxkRCp80Dq9ck4rIZH2OQKpApsRvYeUa+rn+kVcfbON99q5EDNEDKHqk6jTRagYhskyrM1V0Q6PwSB5G09gV7bJj95T8LE3LHHn9VN850sj73/KcGl5jbixyb7jJ5DYV13rzOG7FaFfkqpAaAvGWdRdAZGoVJZAu2gpr/PMLB89A6+bX6O3ucLePZbKXyd3C011mHEnII383OlvY1Owfm8j46htJoyWIMajTA4Zo9zsk0Z+si1r7Ggj0dq0MfiuSSjJZuJXf/xb+IWNPv/4p3+Tv37wDNdTixSEmVDyFbcd51f+7T9hMXeoRLAgUpdRmnOfRNDfpHGZ6rwMvjvFqI8t/I3h34bFblLzfnC8UWngePPGvylPoAQ9Vy51OXB0H/1eD9vKoSzJo6E142gb7VJJuR4nQxf93/yrz9Ga31vLVye8DyAa5XgimRRUErFo6lWvf5pCpTDokhhsvYFBG802bfdsdnpu9bVP3ZQm3uvR/U35XYF2JYcO34WkFoePvgxq8h1JNVmRTDnfyc6a4Y5Hz2b6pcnk+U1kSsaOs13XyHbze3snXFcQQ0p+kLkblAmaPdRG2tSCOolh50ei0QwYnQvNvbk5B1Bbo22NL2iega7A/Y1zXOpH8tTlUw+fo2+OULRaRB/I2m1CEYg+4cs+koxme52QfIX3FS53hJBwLiPmhvXeJhvPXGTtyhWyrMXLltb5529cZHW94qOnYWV+D+0ikILFlAlTeCoxZDHiKdUhFkhWDWpwBrzSuqfQrzO44EyOlwAhYUwNV0JIlRp/0CkkvarWagAbFYgrWe1oi4UYKGcy9h0/xGfPPMUdTwl3HjxBtVpyYuE0L527m0dXIs5A6UvE5ojEWvY+KQgwGYIINnPEqsRmBqIZ4DC0LFHPEfEEK8x05umGa6S8xIQcF0KFa83Qbh+gT0SikuxIKjHWEBlGyIlIiKlm81OAnVgFaUAcAgZFpRhNMgQfSKHDj375Hs4//Pvsf/mX8PG/ucj/ePIW2gu7yeb3EILH1FzPKQWVFRbR1owUqYyQTIaNpWYXxFD5QAwVxkdSqNv/JCK+MaGeFCwxehBPJoaYLEZUPznkBWJbZO0OxvcpWzlF3qKykapdkK9v8h2/+Czv/q4jfOehdcKfVvzBqatcfM6xvHY/x08eZ7GYIRFozVi6a5AqT5k2aLVa9EOkleUQIrlk1M0UVGLJipLl3Xew62Ck+1wP11vl+tVn2Lfv5Sjphx+Z5MPpPDrxtxj1ZowtJvXvMuEkSBxfr5r2QdD9NllcYNQZgO2i2WFa9mayAikFBK2nzcwU/N5PfjvDPvQ6MxEhWI/qWEV2rEY/79SyASkZM/aD69AIZ1BzneZkjBxTAU5Dp2k0m6L7HMFajBr9m4lcJy+TnHZrkevXr2NnWkhMVDGytJjTDsOobiAIg5Ci58e/+Uv4+T/4NNXsInldM61iIAbBWYNxlgubcLytDuswetuhvj8NpwDjRmynzpTR8bdo5bvpERRAdeaJP+XWO74CpFAAWNPH+3zOb+AMTDrfo4775L2bNOKj4fm0fU1+tlkfG5rwceM/GmUPXLMGT7MNLkJQzI+Apr7rLICKc2mHV6NUJ5P3YdvSyHCYOl2/dUSOH9rNM08/wcz+w7TlGFywqrcSExvr68r3UqkAXVWLr1V9jfQ9kbJUJ8CXfVYvXGX52jVyA0YKbplZ4Qe+5SDrVy7ycPc4f326zcyCw/t1qqokLxz9vsPmGaHskZKrAXWQ2YwYtAOuEu3ySjhKhMI4Ukz4uiTuCdggEFVgC6NZBUmemBlVjM0czjmiNYrWtypu5MTSMYHe7qO4NMOHH36M/SdXWdqzh6WZJb71lV3+3V+1EDKsA4tTMJ8IKYJt2gKNJYVUS6rXAkB1B8BgHksiRiGPlspDkhn6qxsEE3Gh6iNYNq6dZ+bgSTZcoqh6tRABGAdKZuMG3OBGNJVhMo3OtNaUKRtWqF8oB6nsEULg9besULQy2nsP0osrvO/hCtnfYebAQWJIpCoo+UNKVGVAUtNp4PEIVZX03chbKonY72ut2GWIy7HeEA8vwDNPYuwm/UqlEiVziGSE7jrBWTKX40Mf71oYlyMCPlZkWU4uBSJCEaAMkM/v5ulykf/jt0/zE99Q8mPfcoS7/voq//6ec5T2Ns48eZXqcJ+FpV04MVRVoLW4ADHgOi1CFUkmQRRKemQmoyKSiyU3jq7M8eDpC8xIxpWN5zhQXWf7hWjaQtxMwInFZjKKGJ2coy2GjUc+QKTVqb1UTJzHMN23EzhQfzYlhIkPTAN+SarpLlUaNA2wBer8iLGY1ACcmF6XnFx4tixKoycyurhOGuKR+mlD7rIdMn/iOsTU9dURsNq027Rju+J2xxnt0ogJqEizOcmX6jQbS1scyRt+7NvuHlzDIPVKwpiM7/zKk/zcn9yjWuIpkGUO39c54qPHZfAj7/oQv/PDX6FmaJCpuEE72IRh0ewH2xqE4TBbHaK/q7HNsRXUDEdv/RIiBSYFrFUVRnX6djjn7dD3kwZ7W9DoqPPepNG3G1tfHn2mtQucLFvlrRvnwYz8DoN5O3g+27ss+ouQoui6BQzaBLfLgNzAcWvIjcYotoNjdfkUqbDMzrV40Rvewq+993HSDIReqSVUkUHWuSo9BgiVlnarOr0dQ+TqxWU2rl7GWsWndQn89Dfu5u4jMzx3/hmu21fwnnuXyfM13Aa0shbkGUlUQld8JBqHsQUxejIn+AjOqK3LgjbUkhKmEHwSCErTG0JAikxLzzaRUl7ff0tISkecqe48ZVPHN2h8ZSwxNeRxkU5hOXs+cC3bzYuOHKdcOcdccZEv23uSv1zbjQ0Z0RikFj1qnpzB17w09ZobBefsQBAokiDqmlxgWbcVndYS11dPk7mCZAzOFRa/YbBFQX9zgyztqo1jpCHeGmAhnKnfBU3s+BSVMthZVcyrb0ESIXgP1kFpeOcXHOJjv/8ujr70NXzqyQ2etUdZ3H8bkguEiuhUdRATofLamocn+lpp0CroLzqHGENpBdcPtFotKpvj+qKtLLfexsajD2KyFibWNa8EeTFLMpaYtyBYjBOMy8gyS3QOF6nBFRE7M0MRI7mxlHMFD6zfwQ+87xn++ZtWeN1LLP/52F5++eNX+dzGHp5++gKzyz32LC0wZyxZO6eoAlUVmGu36pZJS15LPBYmJ9ZSk/liwf4Xfx17wwM89uj9PPLJP+HAN38Jju2U7IYLx3iNbqQWvcXojUzzMTDgsHY6XoveuggOuOCfR73/5sZWQzlubHYwjqNj6iJkptyGZpFv0OjbGZ8pqdmbGFNLCjCorU7/Uv1MpjkXIw6azjbhetfjgpBcmypt0g/KV+43eqxteFXYFBky+dUp+8LOcPuuJU5vesQ6ut0SI1rKA00Vr/fXqERZ8QakMDs98ykAyYGi3+hnJh2mwfv2AmvhN8qcbONYxRSVpyybqctcWqqZymexXUZpSivj2M9poNEBaHdI6LP9mO6wioy8X7WDH2Mcob5W4y9ERlsllIjHDPc0zZFJpj6UZhjEyPDYg9PZ5j3YwdGbJBpqflobuXL1FCvXLrH7wAEeu//DnOFVFOzCt3qsra9T5ApgqUqlfQ81H74xju5mn7Xr1yg3KmyRY22HbuoxP59491fmZPE0z5x1fGT15bzvE306HUfIFKRqswyZ2wW+hw2J0mtbYRWC2gCfsCaSjNb7lRIf1b8Ro7QkIrhYC/CERMqBoPkSKzV/jrMkXxFqFk2TtBSS6jZWjaM9VgyFhe5sB7f/dj55/gqvu32Nz3/2E7z2q76Bb3rFEf7iz1ZwbaelvTpPKhGiS4jToJvoQYYaE5IghaB4OmPqtnohOOH68lP4cr1mr81xKdh/G/qb/7q9q0VpAz7zdR1eBu+BSWnAJqQHEO2TxJJqggZjdZkKIeB9wBkh9fp8+2s8vdP3cejFb6bXu8CfPTmD2XMY4yzRVxjlbkSMELzePKpAFEsQRfhbkxGipqZTErLWAlE2qFotvGSISWSiHlh+/CQ8d54qCVl7lpA8MURMVCyBKWY0c5EiYlssHj9IeeEaKVT44BWB6jJ8iFjfxy0UnNm4lX/6wTP8xNcf5Pa5J/juNxuevgi/dm+bK+slz62vsL6Y0S6vcGj3XrLC0YuRTqtN7Ff6sI0lRE9RONarEle0+dgD9/H1r55lfn6GbC4gAx7/ZoEc9+Rh1PiPbtsuJTk5WbdG0VtlWMfHsK9/eo1/MoobV9dr/vg8U7zbLSzbpZ25gSPTlDwkjmybAswaaVO64bltMQYT20YM0Q2dp22AZsNnref1fe9+L851WO13sc7gJCkF9vwu3vaqo8NKj2iJSLA1dqLi5AE484Qo2YnWCWrFv0QmGYf2HiSjEe0BovYRb/tOTT6L0Z9j969OIe9IH/z3P8ZLWENcwfD+jowdsQrDrOeWyDg15TJbO0SjgLkaXzJWImh+TuIC0kiUH5GkSpiNdkWKqr+SopK8yNi7lwZOgNQcAKPPZrQePz4U5D10HkfXFdn6nWktgtNGXSZrMmWIpX/1LGIXaQAAIABJREFUFEvtArKCxQOvQx61BOPpbfYoijZCpLu8hi9LjGvRq0qKLGdjbRURIc9apCLRrXrsdpaf+p/u4K72pzi3ssFq3MMvfa7Dw2slM51SAe3FLCZzeF9h+xvYCNJuk6Wesuw5A9bh+6UGoBiN8iXDiOCdQWyGCx5CIIQKshZiHAnqCNwQYiC3yvVRpaglhuCRmEhGQCyZ09ITSUjWUImyzO5a7PDoqS6//ZHz/O//8Pu4duFvSEuB2dShYjfGOYw4zbyLCkx5MZigGjS2lqEPoaamH7xNmgWIEmiFDCl2cWDpJCur55B+hgup/6+LmVk2ly8ws+cYJhrt4U8oCxHj3twA8R/RiWAsgagXKdR9meBToBsiX3rUMGP28uips8jcPs5VFbsyRwgVkZrQwEd8CFjrCCSSjXqx1mH7pVL7ZjlBtHYrRkhZBtbiYlDRo+QxaL2ljB7TakF7VjWeu5ukmgtZrIOirf3ORuivdsFaxDlFfxZtvCRcBpl1iMnJZgP0Zvip37vMD3/ry3jT4esszXsOzXd58LlN/vx8xkWOEX3BldUSEy8zu3cXIRlaMeKspQqePJshGY+zhpAVPLA6y9eU14mdBVaefpYQNrF2fvpEGqO8Hdbahw7/TkbmJqL3m6xJJyqGQLftnIYXmC14vgjxLWjkHVLLY9mRG6Rut0t37lR+mHq8G2ybVkdNwyzP2E8x/M1T1+jOLSBeyyL9KpJbR55gKatLdDFN3MKIkPGBTz9Ff/EQu6WocToNQyVg4ZMPPAX+i0i2HKDBn1eMvi1QrnFmhgRR23VAjGNIblRGmHL8v/fRpPC182jrW25AqmEZZOCnj5YAmjElET9y/4ZZI9V0FyJiRLtgTd1lJWlgsbdwCtSG/GbGqGzv4HdhfD5ud39vlAVoBI5GTqZoGVavdbj20D1cyDOq/i1EX2ARev0+VIGySmBzAhaisHZ9GZ8iqRKIhjsWNnnLXbO8auZZXrzvWZ6+vEba92Z+8n2X2Oy36Lg+KW+TKnVmTBUgVGQuwxY52Aw3I/iQyI1QiYA4MudJKeB9JFmn4kMElXwPFdaDzRxVBJsJ0u8jLidawWK0Ld4nbOb0YkNEMlXXFWfxaBkOXxGSBaN4Nzszi1k6TH5ojrIsCevXubJ8jS8/9mb+6HLCGW1XFBGcFcWvAIhVcrqUlNyuTts3jIDKaFg/pxLmOjM8e/4xqv4aMd+Di0Fvgs1m6dkOyXis7QyQhNRAEiNpzIsWoz9DXSc0mSX5UCsRaTb/pbsu0Qqz/PXHP8/8YoePng6Uu19MZ88ukhOtxWCI4kl9rWumpHzPIjVnV1ZgRaj6HhGtd5QxYk2G98q9LLW/apNHOguEwydIm5vkrYLKR6SISKYLuxiDyTKMMdiiRRJDvjCLcS1i8mRZRp5SLe3rtGaTOWaW9pL8Bj/3wcgvh01+4Z0v42Trb7j9JQX/cyU89NC9PLGxn8dkgU8/HVntlfiyz0JnkbxVYcwsqVhjcW4XewoDGxuEPSe5+Mwf0e12OXH7bVw6/wRHjr2aaQa7iawNVtt4ktZ4t6KMdxpTVoSbWDjHsgRjqOwXuOhOpk+3O58b9huPZ0bGygqT+95uIZuMYKd9/obnMWW/NzNGAYUTf2vIU9Q0GIgl83v3cX25h7eBd7z1bn75Dz5B1lZ5VyV/iQzbOUdT+YE3veYlfPppT6/frdtkNfLw3oOvuFp5+g5ympRtE/2jP0fb/ybwCdPu21hnRH1OO7WZDh23GoCZNPVrZcg6qTyfwk33/v8djIYcS0+gieybjZPnMCValtFsXpMJmJzf9bax6TksV6URcOfA6TbDWvCQbneYrZlq/MfOtc4myFDEbAsJ2U7G/6bWDbUTg+tNhu7GRTYuP0NncTe7l97Mpx7cxUpVsXzlGpnNabU6+F6fWPVY7RlMeQWHpeivc3wh8sajK3zjK9rs3RU5d/o+2nsP8OGHHR++8Eo+cWUTQ4Fp2UEuK+U5RdGudTQKAk7BehKIUXC5guuyzJHKkhgTmIzMReJmnxhRtltjIGWQKeOsMwJVRc9auq6kHQskRRIOXE2jLw5jBWl1MHmmNsUBZSAGDylhixbW6TkUrVk++9B5Tvq/5OiBDnN55I17TvGhiyfAl0jeAlTdzzoLg3mkDqA6WmlkHtVvRI0PiKZiZfUSs7N76BshmByX5R3K9cu0ihkkJApTEGKp1QZrNXHV9IkaFVwIURH/WEMutnYC1BtNUb1VouGHvvRW1jdOceDgEqXbwzMPR+b37IPc4bKMFLzqCDilJA2+1Og4aJuSQQjOEq2mWkwViZmBrociI/MlVUpgHZkYQq8k+Yqss0BIEKoSaw2mKAg2Q6zBWlWMQhT5mWUZyRjEgmjvICF4iiLHZYU+NBux2Qwm7cKsr+LScb7rV68zFzu847XCFx+bwXGVVxxZ55Vpk7fvNyztNVxd7nP22Ue582UHeO5Cn87sLJeun+ZTq4eI88foXbpCr9PiyB17uHzuGmvthzly7NU08ddkP25KaZCiHdR4m4k2SGVOOgQ3E43XC/yNxg4Rur5sI50Hf9fjBi1/Y0CjaRiAwedHN0ykSLd8lpsz/mybKN/Z4dhmv6m5hnpepbr+uXkt0J6bZW21y8VnVzGSmJlps0DNXDeo+w/rrpGISORr3/xiPvboPRQtwcdAAKL3KlrlwUbHchXYVzNLpwEr3GTZaMr7NOVaJmvrW52AxGi2ZpSgJqVIEMu1ZPip//L7vP1rvpw3Hp9TTNLo89ru3j5PsNroGJSvdspGbXluo/eoMXaNGFQzps3N0TG+TcldRoR56nvc/DrKvXJT0f6Wc64Dou2yWtvesx3KjGPnPyoo1byPieA36G6scu3S0+w/vJ8HywN82S2Gtx/doNVf5/SVZ0mx5NhhuPczK9x1S+La5Wvs3zMH7cjSvr1sXL7IJy7dwqfOv4iHHrJcDyfox4JOHqhaQWvuMSE+URQO41raYRAiubWISURfIVmBxKAsrmWJCQmX55RRFBSYZSSTiFXAJkNygHWkfqklMmu57bY5fuotx3nHrzyKyRX0F8QhWZ2OzzO8ARsgNxZJiVgUmExL1rrsapdTZ36Oy5cLHl7ZzYuP55TlWZZmbuW4vcrTskep0y2IlTr403cqBbBWn4vUnRSDwLAu94mzmBKMbbF86TkWd8+xUUYcVUkrsyQsVVgl2f11S0ENvjCOFCOmTjM0coNGRgySgET1NjJjtTcyrHP13k/RdZ5jRw5wdqPkiZUV5m6ZUT5nhICQWUtVgck9yWSkbolJgWQhJJUyJFntcfSbxGiw7ULbLrKcRs6x7z1S5EjZgwTSamGjgejVM0ux7oN25EU+IDLCQ6oq1PFz6rkllMbXBAoLZRKViTSRufk2m90uC7v3srmW8YsP9HnXJwJ+ZZZ3vm0fb355xplHL5Ktb+CrDU6emIVUsNC6SpEVXHLQdbNEhF6nRS/OcuHUafYeewUPnnqA17wm0ax0o/XJAeVuXWoZnWjDCTcyuaca/m0AgmO/TklPT26fsq3hlr+p790o6r7R30b+PuQfn1xsYQvQb+z3+n5OqeHCiAG4yShzy5I4ud/RiPmGToCp07D6HEUSFSVXQ0Xe77O2eZk9x15N+/MZoYos7Z9TEpu6dXFs0a3X66sXl4km4r2+P7m1RIn4EPEpYCRSBkiuSUVPqgE212VvzjgmxhyycUe2MfpDx2BwPxJ88InzvOMn/pC8s0TRjvzuv/9dwvJzfPaXfohDM+hcNVOOP5Kl2nbb2Dlu9x6PZpaaPuptjP4wfh492AvMTozO22Z/Ro2GVn+3lNeaLG1T9Z9aVrqZ9P1O7/o08ONO+wUmAxcNEAznn3mI/QeP4M0RYqfD5ftbrDzVo39lhr2dTV5xaIYDi7N0u11e+6Y9fOAvT/GmV7+CXrbBxx5x9K8f4pN/M8fZMIsrjtBKAtUmbraDT0JLLL6sKGZalJs9EA3ysIZgK1JVgjhcXmi5uNS2VyOWJJ6YLI5KqeezTCHZog6FEvkYbetLHiRy9olrfNfpsxT5QSUocw5JypaYWwGTyIzgJJIIVAhGRLPLsc7umJrHX/os7t/P3zxyH2/7gtdQLV/Br57jpa7FmXIPqfC1rHeGxIDL84GTEX3QuRoTxmUYcZCCdlOoGhjiAi4rOHjiNp575mHy1j4ceC5fuERrboHZA/sQb0imlhtsAH7GaGRvtS9fMQBpUCaQBJ5Ut094xAvf9MrA8WIPvdk27cVDhM89Sdh1EjvTJhigUhRrWWo/dsotYnOQmmlQMlWAipAL+JhIeaa0j0RsVZFsRdaPpHxG0asxgAjROeh7kq3THCQyaxV80eAYckcmGeJUElhcA0Z0tGcLqhQJm11o5SSbyKIuBjFz5HMLSLlB6nfZtfsAccFiDu/hvac3+fX714h+D+08MOsWWCgq1qUNrZdD7NBZaiHeMVP2yazjoZWCN3Qspx74DM7uZ2PjAu3ZpeHCG6UWDEkDeWEtv0yh2RxQucaxCXhT40YL1k1M+m23J6Mo2GkOyMhivJN86LanteUeDIWIhgvqFivWfHqb63me9w6m35/t7tl2zkVTXhkvmWK8cHr5OlnmKK1hbzbP0/feS96y+NTnjSfv0igjJdJIqS4kj0F7gr/3q+7i3/zOPWSzizjDANBrnUBy2uLUFyiabE6ziE88kJFzHtOBmNq10WhO3Kjjo96HRN71Jw/zs//9s9i4SawC611taTJzi7zkO36G9/3EO3nr7fPDEsNNYle2btvhRZvmsE3LQI19dvQ9GxTRtz+G7gS2GPx6D5KQpCDNZrtm/WrHN7H1Ge00h7Yz8KnRAAk737+x0955DRhlJGx+CkK5scK5Bz+E7T/L3l0dnq32kKU3YNttPrPegV6LD10zdH1Jv1sixtPv7+W/f8iTWSEQybM2bnGRTl/T7FE8qbOLTATxiVD1iVFL0yZ3WuaSgMOoHobkxNAj+kC/qam7jOBrfoWavCiaSBSQJFgxJJOGipnJaDeZ1FLvxQHFlMVEcgaiUS0zyQnWAB6fIMtyMh8wmSEZS4oKELRYJEWcySj2HsJvXGZ2cYnuxiwbVck/eMstfOYPr3O1fUzxCF6wBlJQGyoiNQ7AItJoL3hsVExeCFH5+aJj/fpFNleW2Xv0KOvrHkdm2XP8OJXvUfbWMGaB5NTgW+dUDKjmX68bTRQ8VNf+mwgsN5YqaLoxestblq7x1JPnuf+xi3zZl72S/++Bipldh2mhvaaIijukEGu1JeUszlptpQD2nigOCYkqJaJEUqEeD1VUNaeuajUHZ5SPuShIocSsbCBVDzoz6vlIIBpHwpFZN0i/BBJOYk3WYMjaHUJZUSVt17B5pn2UCZx1SrcYBecgZY6i1aHsrVB0Zghi6XSWEDLyXGUtY0xs5oYiK7BWCL4i9APGJPqlghDPpMN8w0vbhCce5PqVNR5+4KO85g3fqJMsDmeypvyAiT57ddAah2BY+3n+Y4qh3C7SmzRgOywuCoaKQ9T01EMPF7WbGk2dHIvyCIwwFFLVx20cgKnF0MGnp26/kbMzck8SASPaJuSSOqEBO8DMpDSxsN4AHKg1bk3t6f0wBCcQd9GaW+DalXW++20v49wzZ+DKKt01z/d/zYtxQBzgQQyGRBQ1zIKF6MkzwYcSa3KstVRVVWNtDIEua8GPn8fAkZyOHVGUe9jhmhr9+nGBqaHj0HxPfwYsP/Hf3k/ePgS0te0pE4xxhJjIOou84//6VZ799e9Fu2Ve6Nj+RWvOTVX04tBAjrQ4ChkDVrzBuz2sx44a5OG9GS2xTdk+9s6lgUzwmCc40MFIdVBg6m4BGQQMMlpquMmM2k3xMdwIUzMVwMhISSWxuXGZmXZGMos8fvYS98XDuI5gK0GCR6RPNAabInPzLVJKzM7nSPIED9H3iV5pwUxLxa2olCHUlxUGoQpBU/elR3JHMg5nrEpiRzBWHd6QIhaHcVo6dJkheqsU7zXI1qAte0molfW0y83lGRIMxIARRxUD1gpS2zNTKPNfScAaITcOHyORgFgIQbMCHjCu3qcBYywuRdaKA/zGh+/jn7zhIOXy04Tg+ao7DP/tbImzQjKe5LRWZ5JyhDQ6PIgQokdVlA0ZintLXt+r+f3HcO0F8H1iiDhfGYz3bK5eZ2nvbQo0M+pnxqRVXbFGUyCp9rpiAxzRf5u/GSuE0nBo1zmOLWYsd3K+9du+imdOX+TzG7s4fHKhZinSF6L0XmVyo764zlm8B8RSOIPPDP1eoEUk+IAPAibHmRJFGhioAkY8uXNEHzF5Cz8TSV2vlXQRjLXEqGjPKBHXLvBlRW4dPmrbRyrBZ548yzCFZWNjjbx2Egpb4H1J5pQkp+oHxATcTEtbLEhkVij7XSRWKlaREiYqQUQIlWoOWCHUXmQVldb4/KqhvwFL+47S3TxDJhfq+TsaHTQiHSPzMTGs90pTMqhLBLwQPe9tSgHbfnyb2mEzJtPcEretHiYZNXg3OVID85lsY2xSuDtc/2CxeiGO0vhQM2ZZr4Sf/40P8Oa7X8YXv/yI0n3WnxBJWzIVO416jR8eI0b+4OP3E7xHcnj9iQPc99gVYgHCCh2rqcnREeuIpAGLiTgkKoyuqc83tN4+RUw2y9PnrvGS3UsMuAcmT2R0jII4xwzg5Ge2ZmkmSwuClhU+8Mg1xO0iek15m8whQcVgquARY1irCtZjwYLZof6/xciNOhuwk57B4NwmHNZpGYeGLEmPOWLgJ1Pv2znR07aNgWxrAzqI6tWZGm0NlVqEbds0/cS+X/DYrmx3E0N74IXnLpzCZYnlq8/xhjd8EZ+47wjSLTHO0WrlrK6u6xestlo650gE5U5xjiokAp60uaaBT1YQRWrS9Vj3uyelpPd15gjN+OZZTgga1SdnkCRkyRCdUX2jlBCr7ezGGEKVkKDst8ZYvc8CzmZ1q52AWMRacmN0Dpm6ZB0iIbPYGDHek4p8KMRk1JaGUGEGmLRY9/kHrDUsLu3mgWfO8+TlLre3ZqkunuJwz5CvCdXckkokUwd/1kHNwitR2/O1Q0T3HaIyOhpjMMazsbJMv7eJsT0iBc53Vwgbl5iZWWRT1hAzQ4y6QDT18CZdaKyjERGhJjmoYoVgsVFAPCvX+/yrfzjD2Yun2XPsBBfPnuGDD0XCvtvJOxnRWfVaggoJparuW6xKqLEFGKGqAuAwRjMAkmcaqZQ9CJk6xp02MQborUPWIbUyfN9j8oJgHabfxUfA5ThUFtFmtZZBVRKtkBU5WIPLHUnUkXnF8ePc9+ATmMwq50ENpAhlhTiLlUAKQhX7ZFlGZh2+8kAkK1r4EKDy5EVHtZtNwkeNTLMsJ8WoToHNYXE3H/3ox7n90CpznQM88ZlP8JK7/zF5MV/3a4c6KoRRoFCq01P6S4QUSQ3v9vMaO0TBk0Z+Su16O6M+FjXdsJZ+g0Vlu+hj4ncZdZKmLYgjMsg3XdLY5nwaXfn7rgqv/sZ/wa7dS7g84z1//Cgpz7mzWOcjv/JjKhWNMMY+uF06eeIYzWeCEX7+g3/N7v13kUzFnoUOD55+ioUDx1nd6KO5OfQdkMaINSljaMCOd95xlMeeWSMSibFSlHJmsSlhM8M3/+z7WfuNf6po+53uy471fwWUjoL+th9mpD4c+Z6f+K/E6IgEogMJmeqvo3XN2A8sdtr8o5/+EH/0L9+i1N6T92vqGDfkumAOo+bJ92sMkzD6e/23LdoE097H0bLANIO8k8PS4C9GM2MSa70CFDuRFMPUtAfeuCPH3MRnnueYtj5Myw6iIPrVs/ewa2E3C7tfz+qFs9y/Nk87m6MqA9YJCwtz9LulsuzVpVrtcW+kutU4R2uw3uOrPvnsLL7vcUUOkpFjSEYULIclln0wic2kIkIZVgWzTAYhKIVyTDirLXmpqurStxr4zNnBZ8QkxGiruYiQsoSN4PLaubaW4EsQo7izmgk2ln3E5Ao0F0GcwUQlJgopqkEPUdP6KZEvFMTWHj7wyDrf94Utzl24wIte/Xq+OvX5/atQJciCx2S5OilS82yYUHc/JMCQfMIYLYcEEsnnzMy2yF2bjatnsK1FXK+/zlyWs3H9Km13GCM52GHKbsArLg0Ptb6AyQyNUkLwqUu56fnhN6zSf/qTLF8vmJ2/xp8/WPD+JxfZ/doDWJeDREIUxAomCSFG5RFwBVWlClCSDCZX8gsrguQtfIrE9TVsTEinRYqB6Ftk8zls9pTi0apSkmYjLK5V4KqSamOD5HKiTbiQkFhS5OpFBe9xOEK/BLEY57jnoccw1mB8qQQSsU6NWoPNHP2NHiYaisKCMVS9ripUOYvNHI6ICY1HpyxU0YOr0z3WCc4UhKCO0PzJu7nl8LOcPXOFW285yJmn7uf2F79pgGxPdXTctG81UV1KEYypEcMKoBokt7fUxodgpa1qXxNmvKkljkzubQ392D4iTaozUQ03DhYDBSyNORBJ0ayJxql5HliAyYV7QKDUbHOML3qyZWEa/F/i1sVrdNvo7/X+f+737+Wn3/PH7N49TwwQKyEYSx4Cj6wa/ujzD/N1r76z/mK9AO8YqW49BkAKFVIJCzNt+qsXea53mVY2S8d5bLsauY8jUq7NqEGjURJvf9Md/Mxv3qPscEb1wU0yA+Swczk+RVyyN5ccGTt/mfg54gRO+2oaSkhHEqeuaETiU4Wp+dOty4mZSkBnxtE3ntiv+KsHT+HlKyCUtQjZjU93tCNh7P1/QWC9yZ0/TwM/+r2pw9RZiMaw69xOWz5TZwCnHffve0ybKxPzpHkuIpaqus7y5ceZzffS3r3AmXAnyS1h80TVrXBO18m8VdCrSlX+9AFxlmQtIehzyzJLSAXBOLI6ure58pIEX+Kcw3uPcwZf9bXEVWuyZA1+whil5m3nGO9VURah8v1BNjtzyt2vZbSgbXdi8agEN0EZa027oPQl1HK9Uvf/O1+qHcrbGpXnmpXAV3hBMxpVpdl1SYhTkKSKEgX2HD3Ekw8/wkcfW+WL9iYe/6v387Yv/Xo+9rvnWNl1ok7rB5JzSNJGeCGBsSSRmksuEpIhJbDWUFjh8rNPEYNBSk9Ma7jOzBw5uRLrOEsUr79LGHgrqmcPTZ+piChxjzHElFAp3ZxbslVe03qMM2cSL379Ce5/tssfdOdp376XfUsLRAIp1i93jLo0O3DkxFApWjNqijxSp0lSJJWQfJes2yNaR3AJU1UIsa655KTMEvuerCiQslILYiwmyygyR9jsY6zFS6Kd//+0vWe8ZWd15vlfb9j7nHNT3bqVqyShnFHAQgIMIgcbjwPRHsARjGds3DYzPwfc7dRtz9im3abdTo2xPcCY4MYY05YxUQgjCQESklBOJalyvOmcs/d+Q39Y+5x7b9WtksD2/iLVuSfs+K61nvWs5ykVMnGiFXnOOLHqAGUNxjisZKQsWylIRQ9CE4gpUxhHu/cYp0gJUYmTsQmUHY8rHbFWsYaQok6hZJBssUkzee8tjan56L2LfMeWRUxcpl6s2PfYnVxw4YtIVPosZXXmEpGWoC2jZ4yVZWEkuDFCBlamBcaLXdJAYMbEIRl9clxtjAKhtPDt6Idk9QO+ZuHS78kt7KRVyVqp15GzmI6pJpCRyMxKL3707xHqvDoJyKMKd/X6s7raPxGdGO9jWj+Yr4cmrE4CTtxWvV+yIRl48OiQd73nE0xPTNMMasRbjDMUtk1creEHf+fvufO/7uKcLT09ttMFxNXfv1rmVRLLVcB3Jhj0+zz3oo289Lzt/EIOLPYbLtt1ZvvJlmjXTmOMyLkqBqKd4edduotm8BWKXiaGhPVmDPen6GjqIYV4rSGeDpH0FNUecMrjXHPMbSA2CL/yZx+HTgffWPB6DmlHgr1RZTProElCrzvFR255ktdftxNamdgxU/8UAXD1/qw76rdeL/6kyvzUsP2629NJLtb5rORV/yNtm2vlryf8N6+gWk8TBXnK7am4P6v/vc62RlAIQyRxaO8jTHYd1dKQOkU+8fgUZSE0TYMvC0Ld4MQQRSt1k6GqAx7TTmBpizPErIitsxD1uqY46sHrM+aAFFSQyTmDhADe0zQVUhR0pEMwarErWO1iSYZGUUJjDMmBFztu38aQkQLqYWbWC8tZTeWaLNjCY13RcmoygkeKiKlR8Z5Rv97rRJ0TleZ17W0+et6t1dHRDJjJLnOXXczt84/y0vMLOoPjzD9yL6+/cCPvf/BhhhvOwlsI4pQwGnViT5EKMM6QokVyUPJjTtQ5sXHrLkiTDJYPU1WCW15c4tj8QSamS4piblxdjjIhYHxBBGXoQ5vBhIgxHtf0OTvv5Scu2s1ju/dywTPPZu/u43z485HFyYs4e8d2miJjoyBRiWo5RVICV1hiVPgkpIg4A1XEehRGcQV5OMSmTCgsYiyZRjNAZzC0AkIRCqeIgvVWDSVSouMc2auqYB4OKY0hxwApYcuOwkreYcpCJ69jwDmP8+ovLRIJSZmipRNC02B8oR7Q7aynwSJOHwg/6iG1koyxrsckPWO9ElKMWhJnY+k4z/K2y5kfdnDlIsM+TPujhHgca6fIkpR9yslVPawE9xEreKRP1ua6Y5bwOInIpoW4Vv6+RkoUTs7sWanOV6MBqeVyjKKX/lJow3ibGIxfZ5wEjF5fXYlpH1PWxmZZ+/9rUYEWihrt7+r9/pcsyE+xZRPpR8dzvu+XmZjZpAtYd4JkZYw8ZTEEYMZP8V3v+Evu/+v/83Sc85Xdy3pfrIi86DH94SdvopyYZtCvWTw64J4nlvC9kpAaXnrVGWu+W0dzVyV9LTxsUqRpakKu8XRQiVmDc4YmJIwT8AUxGaw0J1eWpz8pT/+9o2NdTS7M8M8PHKJOjiQGgy7wOWec0+rMWq3krEtUg4pf/+sv80PXvv5pndeTdvfE++ap+CxnsHE/AAAgAElEQVRP64DWSYZOTCrXuz9Pd78+nd8bJwItArhmCubb3J4q+J8qqV63lZURMo/c8REM6kl/xrZLeOyhSSwNxpc0TaNrZtYpLEkVZMF7qyBe1lE5LQ4aTWgj2tK1lmwSMWsx1yTt5VvXwcYESUl72Totfowhp4A1mdgozyDkQBO0Cjft1JXx6oIbaXBllyxCGA74j29+LU8+8hAfvO0eRQ6cIdYJM9a90IUq4bBFoS3AdnY/t94bAmPUwo1a0kYIKbXTCnouJ3tT3PdEl396OPPi7Vs5dPQYu7ZO8msvnOQ/3TTPYHoDNlXgPNaXhATilAyYclZ+hHgkGZxJOtK+OM+xIw9hu9N0e5tx4oUdO89kUC/iSo81ECzYJCvBJSl0u3r+tsoJW1dk47DNPK/Zcif9vfMMyw187Y69fObYVr5WbOfss89icqqkzqryN1Yfa2/S2GRcocQKVxakJpE9pFHQS0EdBjuFZjUp44KQcgNDtT9Uk4VGey0iZF9oT0e/oe3ZtJVNVSkE5Fwr09iSjUYZmFPCEVFtFW225BiR3JDE4bNBSk9MDUYMzmVCkzBJId4sOuXQ9co0xXlCaPAtfyKZTOENGCGGTBPASMPnv3mEl11SYq1h6dAT7N93NzvPuBZJK5D4Wuh+FFZH1bCG/5E/Q8oZnYAY+UNrEiJmfbe6U0LdK8/x+O85j3TIW2KyGfUnRt3ok+r18b4CKk4zfucKqjT6l1az7WvpxHbF6KquWPCedByn2k65SD11/zQRseIgN7zop36fNLEZiRlTekKKONfBe4/1hjoGCmtIWA7EIY1kPCcsyqtbHXn9nrviYIZ9y+BjZCkMeMurr+d4FXT0tql51bPOaWWwV7V2ZJRQAe2MeDZCqpYx0oB4Te6NpWkC2pwcEKXAmkTIDRZ/ElnvVNupjINOh3ho6xAgsWeYyWJVhjsEcILvdNv3JWJS3YIQEgaHMYEnDh2hSoGy7X3mLN9aIF0PCXqaFe662zr8mJN+UkZ20yd85l+yjb9j9Gz+GzgsrvmdE7aTYP+1xx4RUo4c2ncXZ2w/j5ADtz12O41/FV2vkr/eOmyGKgaapM+1MZmYs7ZoXQE5t7PuinJiwbQO4r7oIFHboaYd9c45t6Y8ug+FbSv9NjC61W3tqHy2bIQYE9559YSxUHpLMInv2LmT684/mxtu/jKf372PWePxWEzQefyUgurbpDAm2WYL2RmcaGzJNpPaUW5jQMSh44Vti0cE67QNIFjEZs6+4Dw+9OWb2DE9xVndTHfDHGG4m7ddt4s//Odj5I3byLGhbtdLg2CMJYWghEacxlkDwSU6k1uZjl364ThSCI7sWF6ax010aOpEDBbntPkhXnvPKSVMTIhVGcKQBC+ebBboLx/jz990IQduvgXT3US5ZPlKOoObjvbYsGsXsqFLihUiToNmu9irB5CuLrGFdfQmUzgkBA0Co1E4aQI5KCHE5EYvOIaYAza1yYUoa3/ElI3G4DqlQipioKP9JJFWhKh05BRxzrWZoJKljCvwzlAP+oQ20xTXkgRLwWaDOEUZXJMxVoUibBtsjUX7qlmTJ5MUTYkxYr2jrgIYwTmHLwrC0jK3HJrgu2WB+cWDHDo6wD7yVXbues7KA2XWBsO1Sm0rVcBq2D+lEZdDaD0i21jcLtaphYvH9p/rP9SnhPra3xkxk1bU49cGg0Qb2tsgLy17ejU6ofuc1qQKq/kBGiT/FarSp7vorob9RRQmJ/KVh47xyIE+STRxRayKZeWs5CVr1GZWVAfdlp5v7Fvg6q3T6t2dR1yJVdsatvnoGBM5OwRYOB6Zmp3myJ5DmKLmYzc9SConYVgz4WXlGsCYaTyC/kdIiUjmqu1zmDQPTIwThgzkpOe48EJIGTEdRip0ec21OsWpOsWEw1MFo1HK+Mkv3Uv0RqccvMU6x0h/xDgHwxZ1NJbGGGywdMsOdzwZuWZXRMfyRjDU06mozdpb9FRQ/6n+fuJ7nyavY10djNN97+m2U/zmqZKxf7XtW0iKRBQ5HgwW2NVav2/ZvIWF6jzsoaQwuLPEpia2++2ctk6xjqJjWR4OxsdjvIrnGGOUXI1gjSWMih3ae0oytpWTD0HNe2JUV9nMCAVQNUwxMp5CywFc6aibQFF4qlr76jNpmf/j+mfy+X3z3PbNJ3juuTu59qLL+eDXbsYbTx2UDB5zwjptAytaYSic2v6GkHBFgbWeTNQiNKjjLUmV+oSkHBxfQIikLFgPG88/kw/e+yi/cGnF1z/1AS6+6vnMdfbzuvM38bH9Q5ZtjbdOyfJZxwutK0gxkiWCVaVbUwf277mHmelNOKctP1eWHZbnD1GaZUIM+DBHth6TM0RUUEGUtBdjUD9mLBUV1eISv3bpXurbv87Uxl24rnAvs/ztHX06c9vZfOZ5pNQwzJkiJbqlpw6J3CIAptQqw44SgTazk+zIEjGNkG2tAnh1pbaMg2XECSFrciLGIUZlhEdiMyYJOehIn/b6rfIVJIPtYnOG2KhUcMsBAINvRR7EKceh8B2yiTrDmYKKLhQOsZae71AP+uANNgpRAlkcYjLGGYx3lGKINhPMkJzVXjmFhO14LIK3auBSdjsMp88gdgNMDrh461k8cWh/W7EbRu6AJ8/XrvRpR9B6+1doExKyVty0QSIns1I4G2WMntxhZ/3A375mRGGtuCoh0VGf9kEdEe1HfWjR91qztjUw2ledz135DKyg4Bm7SgNhVRsgG7TvG1b+f73A+u1UWWsW1BGpUWiwvOJtf0gxMY0rk9px4lqxjUjMSRNK4zDGElJDT0re+B8/zIP/7SdJNIj4caK7+lhaGiTkFkUREMnU1NzxxB56k7PkwrDdGz70hQe46OLzWK4y3bato6z/qNc7JQ3woOdk1KYJgVdffyX/+I3DkJMiZ+0VMcbQ6U7wMx++nz9+w8U6SpUjIz/3dc/rt1nBrsjbQs41/+Gv/hHf6bVFgI5vpSzkHDC14AuhCQlMJsSsqKNUvPY3PsgTf/qmtWH1qdpAo3My3tr7Zl1+C6d+bV3OCesjC+uehFPwCU71e6f7DlbQln/T4H+Kre0mttvKOG9GiZ5Lj3+V3vQ2bLGJo3tu4XODzVg7AzFAKzpXhwYRi42NKvAJJBF6vkvMOuaWRMbPmrcFwUAcNmAy1hpiUt6PKUpMFDINtrA4U2rbNQsmaYsyNTXSKZFGWfuurfqTEYqyy3K9xL9/+XVcd+45TE4V/OoHPkHpZvnzn/9hSpf4mfd9nFxYYk64wutYYDKQohYAOSIdR2p0esGStZBsW4QmtQhFDeLV2tdYS1MFYmwonSLGwQibz76Y40/O8r57HuJHLt9Kf3CQ8MTdXHb++XR7nvc+vBFrSiJLOFeSQyJZbZVIi7TFZMjWMTW3E2c7yOIBrAu4ukqUZUkYzjOxZZZosz54RiE1mxSOb1qnMRcatbVNR/i9ax9ix/FFDk5YJndt44G9j/Orn3wIf8az2HHFFfjQMGwZrYlAv0otK9MqdCwa4FLO40ojJ0M04BBCR8jLHnwmS0Ea9HVUI2SMJKK1EFspR+OU/JAy2VpK3yW1krrG6E2pc6UoA9Q7zShBL0qOatyQDSGqNrMxhkBUaMYUeKvCMykqTFokIUjWpCC2EowpkmImZTTgmaQtBtHfV1dMwXnfzoI6TB1JhdBfjmzdei4Li0fpuYMszD/MzIZzVgLfCqrL6oRgbZU2Ijit7iOvWhQkral+1pVUXb2d0B9dLQ5jZOVnUhssdCUYCZS008oZbcm0EwwqvbmKJGhWoQctjJjzyAhHJS7HBELWBpCV7dsM/qddbFc+b2Pgp//gf9DpTjC0QuE6iF2x4MwCnU5Hp2NaKN57z3KTOLh3iSWEKVKrzrd+NW1a0H/1KwtDSHgmOlNsm1jkku1bEQtViEhIlLYC2iR2Fao2hv7H6Irw5HzFjbfejXFb2n1vWUgx0+SEI/OVbzxIesMFSJs0fHuiUqffxq0FSQxyoRyZ0XpjLaadtTbYltVdY53B2ALaVlxR1Dx5bEjtHC6tvd31gJ/u9Q+n2dFTo1+nTArWa+WsV5V/u62GU2zrBv5vNcn4FhO6tdyT2D6vRu+9lo8QUsXeR7/Epi1zdDecw9yZF3Hfp/s4GsQKZdmjDgFvHbHRe1kDpRDqISmmcRHnrI45W6v3RQ6B7B3e6qieBbKo5HvKGW+92taLUIdKE2VnFVQuHCZmfFEQm0CVAs4LcRD4uVdfx+U7pzhjahbE8idf/CZ3HFvmwz/zGnYfXOIn3/cx8FYRX+dAEk1QAaKYItYbUpMwUcOvKUsdwxOHkLWtbQzZOKSjU2veGFLIOJOwxpJNQaTBGLBEdp6xg+XZKd5398288/lncaS/wDfv3sN5O/q885nX8fs3LhK3bmCYAqW1REELKzMqwtQ6utvtcfzgbrrdkuwK3OymOVwSBsc9VVjC+O3YrDrCIplsDRIiJtQMQ0MROzznrIP85AUHOGfyIr58/xfpFtfz3v/2ILcfOMjGF15BOvticp0Z5IA1yhBPCbwRmiqROqaFYbSP3NRqY2iknRAQAx1PbhqsQKUrm4rhhEguHLFqKESorcN5VQKMKRKMoWcssdVj9oVDjCc2Fc5ZXIbk9OZNKVGWFo2BOsupQg0RMRYyWAymhXGiCCZlnFOJYukWmNiQk1H2dKsMJZKVmWpUh7ppExxr9XtsgrquMRGyrSmMUE52+NjNA1589oNMFBXzR4c8/MCNXH3t+W1QDArXt+n26vVuNaFqHCRHWbjQtg/0kV3dax8FCG2RyNqH+hT937UBQdbkFohZCewy8gEf77QybU8aQYQRhWAsaCKGJIqYtO8Y75mORMrpF7fTvQ6n/+wJcCqtl/d9x5b5yJf3YHKNL0uMaAsoZ5XgcWWhUJ4F65QXkHOmZxzF7Bxv+/3P8MGfez5WaPvAp+gTr+7ohMhcp4crexxbXqZnFpnPHTaUk+Qc2TAVdD9SxBin7oGrkkIlbebxMT1j4wwvfeal/P3d+ynLjkqEZqMJf0q4ssfsdNmeHxkna+smAd8murLG8jcZ3v2Bz5GLCao6UPRKFeaqG3JZsGliEweP78Z3u/gYSNlhnVDXgWgt0zMd/uIrh/mJazaOnwhtgX0LolKnI7GdqhVwuoC9TjshP9V5OoE8qMeQxs/K6iRufHucdP5PkQCfON56qqTm27mWo4+uIVXGlnckIIF64RB5eJjqUGB49GvcWX0nEnaQPXQ7HXJEi7eYkFGv30ZKW1AtLakbnziK0rVrWYFvcctu1zMcDpUvJhHB4l2pCEGvaAvFjI269hoDLjtSqlr1V0dVNXQmJgihz7O2bObXX/8qbKiAkuf+xvt4cHmJP3nNi/nI236AG+/fzy333kd2us+OTMwNWXS8nRRXWgG+TfNHa74xiG0Ls9iueTlrWysmiKkl/6kcfjQJl8F7o3NVOdGb61BPvpBf/sZu3nruFBdt3sPx2uGW9vF7/9s23vOZe3mkexm5BIwqfBpjNa7R0DcFw+EyM7M7Obb/CSY29HDLC0eo5x+j6E5gZSOwoiGes6qQ1TFi4xLfs+0or9y1TDx4K83j03y1LPnQjbMcDosMZqfYedEMnU0XcU9eZmAsE1H1k0PWixOJGKeVq5rt6I1StKOGxhpC0F4/kslNg6RI0QRqqze1iOhN4wuqGMcugEYEnKXjipYjokFDZYwbaGvMJmn/RbxgkiWlEfwalcQRVcynHg5IoipPdRskyYLNCecKclLJRYvHdoScClJKNLHGtM+faQlyYjSJCpXObEejyZBYWrMlmHAVe6bPYduZHcgNtTvCEw9/lWdd+yOk7FZB/Hl8Q637UI6UwVgZA2ypDYwCtvLE2kmANSgC48oRWdONP+l3RhKkK7+7AuuPpkfGbmBr3tO+b/WiJiujMCNDG5M0cI3NftC8UFGQE5KTU41s5VWciNMFhNMsftnoUOMb3vo72DhJLkud+hDBGaOkTzIh6P1jWy6J9vRAjMElwz99/VGW0vVMmAYr7iQipsgq7/TRbzvPnoVFysmC/Qf7vO2l1/JXn76bcrKDtZ4fef6lLVly5TvW7LusUo3LOvv/3Mt38D/v3T9mXqe2119nsJI5fmBez9sJAWXdROB07PbV71n1+govwJJMw1/edjfQUb2NUCNi8UVJiob/53WX86mvCZ98YJ6cG8QmUhQ6hWFQZbw3/OIff4KffPabyFlHrcaJ76kSl1NtpyLAPp1e/Kng/29lWxOsR2TOUXvvW0RhTsXhOXHfnk5Cs95+nvCZcdIJCoNnAyYhyXF4z9cxacDeffs4OnE5HzhQUvQaGgoaRIului1uUqZqhphoaGSAKzsa5ENDtgaLJYSG7BwxDIl4RY5ixDnbWsEIzlpMigRU+KsymaLTQ2IgJ2GinGIQVZwt9o/y5pe8gu+75Bwikf6w4b2fuY3///Y9HK8H/PJ3X8srrjuXYYB9g8P885O7teWcKrL1qvcfGuUSCCoslyI2J6IYQPfFGLBiCNbiYgBXaGsUHUfPMSDeQ+vx4ltaT6wioS3iZBDxzrH97DP5u+NDzt37AG+4YhuDxvDoI4/w/RdDd8PjfOi+CR5LZ2IKISZFwJ2DvJyYnJjg6ME9TM9NMkxDHNlS2kkNCIMjJNmCx43hP8mRbBKbbOCVOx5ihw2kuTm6W7Zw7PH9vOj55/EPNx7FH2qYnDiL5V0z9Ojjh5bkM1UYttKKDdYYbKnkBOf9+AZKEsho8Lfe0FQRM6ywsaFpGdImJKIpwQYkV4Rk8LYD3uCSJ+WAE0NIGeeFbDWBcVGrzmDU+9pYh7Wq1GScI0Xdr9xCTZkIaSRIEbDWUWRU8jeBKSwpC360RLZ8hLLwQCIPdfzPito0BpQQYoxRzWi0vaGQtmq0i7MYN0Gcs7z3TssPX3Q/h/bv5uqrX8Cex+9i55lXkbMDCapH3QbEkSWoETXbyC2hbrx45LwmAI+f4bzq4QVad6H2b+stnOtCAasy/5XPjAK5VqAtAsBo7G+UfCiGkdqbPLMKJpVViUFuWwAtPJxXoRij40rjdG+EMrCmBzmST10zMfB0SFujQcoM3/OOP+BgmtT9swUWlf4k6NRFkEATEjWJGTuhR2tbJINEtpksQz71jT287qpdrLbEXatSN4rkIxSn4Vc/8wCd3ON4vcDZG7v83Ic/T1nOsqFjOTK/hLp8qBz16mu3wi/Qa5CBP//4p3njq17Ez//lLUxOT+p1yZkkBicZG+F4qBVNSGG8H08rmJ4YGE5HHs1qUPSNI4HmSMJuUFU2RDC2hFDTSOb6S7fzgnO38bF3vV+9OoynIZJjVoXAqmZBaura4YqEwY8TjH8Vwuip/r7ev9cbJTxFUnrSa6u/qp2wGT0TJ74noz4tq1t3J0oHp0iLqCrHZ9SjXzPueyqewimeiZPGcE9I+mTUWrS0cLyHMGB+zy10ZmY46/Lr+U9fgs6GnXS7hlQ1hKyicN1OwfLyIhmh6E3QEcugCRSlJw6XKSZKYlXrWmoy5IaO9TRZJX4rhuOCMoVAWZbEWiXZpyZKKpMJw4pIA2WX48MF3vGK63nBWZuZ7nSAGrA8cTzwmv/+aeaHi1zKMr/9lu/huedtZjBI3PH4Uf7q87fgfIkAzpdj8yBrde133lJHNeGJJJxRTYuMA7EK++dEdiViVOJYRMmJRgwp67pZiBCbGrwlRKHrCwhDglhMzCw1y1RHH2D7rsto6kPc/YXPseO8rczOnU3/wH2c0b2A/bUnpKY1CcqKprqSo4cPMDW7hWZ5HhoduMEWluVqgakNW7GmSw5DZbG3F76D42jazC/ecikvmjnMa59tuPFjH+binVdywVzB5pecyf/49GFuW9zHMDVsK69gauA5LhWlmDF5I8WIJGXM5xR0IS8MOekcvZGgQZaIqQKRCFWtFzYmxEYylpg8vs0eY0rEHLFWHc1MStASx1zhwatAgg1q8mCtSjp6WyIWAp5swIlTU4WEakrXDRuLDsO6BisUnZKmiapNkAKpsFArFASGqhliRXtMIGo05AXTah5EEYwzhKamcJ2WkRow7ZhgzDDZ7SGT2zgUn+TsMy/g8SfvZ/PMVeR4hfq2r37I06pFIY8f85V/n5YMtKrKzKPwrM/vSPb4qeqY1UqRq30K1vyqMWteEVlpXYzRidVIQM46fSKt3zWrqou89vjGa2MGcmr1o/Q9+lnR4Dgaj2oXMFUnG5HYNKk6+eBWjn4pLPHVx47hKMB77aWJ4MjUQft90OH1V87yfa96ET/8ux9iesMU2Tqa2I6wekuZO/zBpx7g+6/ahqVYdczrnVz9/SQNn/n6N9juNmFS5JpLz2BpObJl0wYGSxXPuWQ7nEpYaFX8S23CV0706JaObCpy7KliWEsCzd6RQs3SsCYnrcRHSd5oWmNNIni6/vhTbJI16b/pgd0MOiAx6ySQswgB44UzpnuUVrCTiSJCY/Xe1DadJhDeeyaags89cJRXXjpHkngKdsW/YPu2Kvr2XD1NVARWJVnZrNzb0LZ1Vn0nJ/N2hDaZHKuzto52Of6bcDhOten+t61aEnsfu5nZnlDVmXphP0flQqZmpttpGX1GPYG6rii7PZpqSDJQhYCxiaZaxhBIqaA74tskiGIUaatrjLX0fI+mVjS4MWr81lho8oDluk90iVxaNpqC33vjq6Cu2TW7gdiy87Pt8M3H9vOOv/5H+rlgQ0j86S+8hV7uUw9q/uaOb/KRr92PeIeGRZUKTgmVi8dqYmIMJrccOueQJPr8O1WJJWUkN+RsMFisU02CLEJq+TjWqLJuyhlrLOREnTIdPP3YsLy8yNLePXz/tgWet+lJ+ocOcuFzn009XOSeg12+dngLTxTnEkxDdhY3Wj+t/lZhLMf2PUFKiam5bbhOp0t/cUDR61DXEaFSt6W2cS8CVgRbGIZulhsGs3zh7/fzzpf+exbrr9PZvYTv38c737qRr+w+xHu+EBk+4xiTO0s6oSYXJWGoxjt6cLozAoSQoW4Fc0IgpqRQiRWqyQ70B1gTiU2NGMFkryMOZQ+qSm8EMrb1RVYSRsaIwztLFgvZgySsE1IyY53pHGvKiR64GksmmkzpPLEJRLF0y4ztGppocChJKme1mHRkQhRcaSFknInUMRKNqKtTipRlSR0TMWc6nZIQ1A3K+5ImCRiDpECodUGc6HgKMoUscs+xGS7p30lnwwTHDn2BfOHLEDrjRXe9oKi3JePXn95jPwrijHkApkV+0jrfMVqQRh9SyF4Fl9ZA17oakFbB02t/caUHfhL3YDSZIJDjSgBa0wtVJiWpJSSOJKrTmvOh+uGqi9CSCmXtMeU2+Ms6i/Toe//973ySTjHDUjXAY7FGUY5kVdgpRKFTZ/74V15PJBHTACtT2upwDnGKbBVTXR64by8uddreuqIA499rSVOrUQEBtkztoKkDJGFz19EzE0h0HFtc5voLtiKhUpGrVQnZmm3k2SGJs8/YpdBk0HMiVmVEMzr/LE6Yx1CbguKExGJ1gFp5cS1fYs1vnyY5yFRgDP/l3R/CzmwiCog1mnzGhHEd3v3D3wktUtadGFL3HdF7vHOEDER1O5yZnOXXP/RZnvdrr2XSmpP342luJz1TYzfJ1Ts+qnZPp2/AyudObI2s+u94P8fnsEUuWuJLGt/rrQHQWO2PE7JsRQAyGZImB2JW/ApG7TNGJcIqAu4KWrg+YpFPs4iMuRbjF1YKxlZyjIXlx9joG4bNMlWcxAXD277jHA4uD/mTT9/OZNll09ZNPPzYg+A0ofuhKy5hcbHBdCfYffQIX3n4QQbLUNvA5MQMEoZceuYmbr9vD1ddcA57ju7jycM1mYaNs9PMH11kUFf82HOv4M3feQ2lrRCbmF8UujbRhEBvegpEeHTY57fedxPzRebBIxWDpsNPv/Asfvr652FypEolVSj46B330+12CalRBMa082ZZkcUQAsZGnHQwFpIYFfUpHKktYE1O4Ay2cWAsKdeQpCXb63WwLbE6imDEIkHXwZBq6pAZ3PcgG/1h3n7tJrYX8PDtD7L1nDMxfpYbnjiT25Y3MDW7i+wrbELHjqFNVjI5N+CmcL2SjdNTDFPCBTKTs1sZNAsgKr7gvRL0jORxrzkS6TBBLgJhdhe/+eXMhf5Mfvi5B+g/cjfy2YYrLjuL337xLL96453sccLUji1ItcRo7r5FTPDtKIf1Ro1xhgNMVHc8nCoaWZfJxhC7XVIeYFImGjDWq0ywNxRlQWyU9enLkpQzruMhZxoyNme8F2LdjpB0CnKolYxmHKEeYgs1iBjN209PlTQRUhKWBoFer6PiQQlwFoMhJWVmihiSRCrrMKakMEIdErar39GbmsQ3NcMccbagsYYiNeQQWa6GdK2lHtQUEz0Wjy+yc/MUwwQP9+d4ybnnMFg8zGTcz9e+/Odc/fyfwraOZKOHW0lqKmAxsgFV6H1twFx/MV6D551AK4SRg522gVYWBiPjgbXxNkrsJBtGvDNol8ETVpEsqa3EzRpIUtpFZA3D365FCJBWulPaUTEy5Nga7rAKiTCtxsFov0177uIaKHP9wD8Kyolzv+8dVPYCmibhO2WL5hj9vSTkFOh2O1y4axqXarwx/OL//nz+9IZ71Xa3U5BywogjG6GYMvzEX3ya9/7YC0GKVb95AtGr3b/HjsDj+xbo+MQVF8ywVBXKT1k6TiE6N5ytU8Sj5YiMyX+j+wEdT5SkksJIJDdDjJlWxCdDSiqGFWNkutfl4YPzXLx5sr0eIz7HOhD/qi2RW5h5LTIwgp/1fLfvzcKP/79/xmDDZpIoC9s513IPG4aN47rztlPliMnwq6/9Tn7hw7djG4hOv8QZqBPkUHHnwYoP3/Q4P3H9uYxGz05MsNbbUmubmlMCija5bj9LMb7Jh3WiU7b3lSQCkaXBMjO9aQBiHrLzba0AACAASURBVGJSoVwf0fOZTYTcYEU1FUbPUharBjdZ5dZJgkGRRayDFMFYDNqGsQZiAkTaBHbk0tie85TVedKIHkfrCU+27bkQRU0E1AVR/TEiSYXNJAFtO1YgZ9Wm1+tl2mvXttBGdBJRblfby1uzKYCov3fRVT9Gjg0zzTydosu7nwnTXWX5v+rcV2JNCbkhciX9qs/jh2ou2TlFEouRhOSd1M2ViHf00yK33v4Ec3MTPOuMzSy97Fo6Haf2Z9EgJhBzjUH9WSQKtQ3ccc9uLrvkHKYnNP506XHDfU/wR196gAcfO8bUXMmBJ5a5+pxtfPCtL8KbQMiZX/z/PsGwTDx6YBFT6sSWomJ6LcitLkVKeGvI0ZAL5fGkmCmd0MTWXTBmktTkpNovKYKJLf/B6ki4nuZMyAlrhBDBOvU5HA6WObD7YZ49dZC3v/IcHrrrVvplw66Lnskduxv+frgD2bSLDcUQ2qmgaPLY6wMJiBiM9Szs+yaln+VYXMAUE7iyLFk+foTkCnIY0Akl4jSArmadGmPI1CrT6Ts4Oc59eTPv+VzBzzx7M0x8lcP9hwlL8POvuobf/cQXGcrz6M7OUdpMTGq7KHlICg5xWvVL1LGo5LUV4EgUZJoomGxJKGwRc8SagmQNNGHcZ7bWkWOtamFGSDHii0J9n0PSk+AdVoSQGjUZySDWUaJzxcko2c+4DqGp6JRd6uGAwnvqeoBxJVU1aLPrSE7gnSEkQ6irdl9hemaaDS5y9ZmbmdvW4857j3LvoeNMiud1Lz4Pkwv+/LOf4V3f+1LOm5mmGjZsmOmyvLxMp9fD5IY773+UZ154HfvvOswjD93BZVdfSJGmaAgKHUtaE6xHa1xGR05WoPXUPtArFTRkXexlZVVeqyw4KjBWgvNYMx3NJGXVsNrp6qwRk3kU2PXL46p9b5mJq3rH+pm2smo5DGaV7/qoCso5tkMNhmwUvhi58+nzacctf01M2uA0DggrPfhTqQz+2Se/ymG2041DxJXkqPoQ5EQMgWTAWke92PDx//5GtfQM8H9913N4z0dvp5joatYvaiBlQybbHv905xKVWHysEFuiSZv+aiKuQgIin7jtUWqp2eAnOWPK8MjBGtsrcJMzXLtras0+r/YPWGmRKBlLz4rjJZfvguQQ228rQQMOCKkNmEKnU1CNzK9a98RRIFk5QeskTuP+1MnJ5okEzOwsNz8mRLEMmyG201XdhJjpFhsJqaEQ1N/cOF73HZfxs3/2RcrpDVgSzlpiAm+FlAITvYIP3fp1fvxF547vLxHbns8WCTLupP0yxrHv0BLf+yvv5cn5Y4gIy41l/vgy1BkpPZSZXOt1JBfAMWw9SZTEli1TGDegWrZIWVLaxI++7Fl852U7ufdQw6H5wA8+/1xq6/jG/bs5a9cW5ueP8cjeJW59eD+vuOYsXnH5WTx5bMjtDzzEJeecxeFjR+m5Ddz6+JMsLC+zcWKSnvH0Q2TfgUX2HuuTY0Ms4Py5WTb3MrXv8v5/+DJvuv5Sfv4NL6DqD5icnMRIpLSWGx89zF9/6l52bd3EDbc9yK65aXrTHR7cvY///GPP49rztrMwUNLdXbsP8tWH9vDyay/h1z7wJY4cOcKzr7yIzXbAW7/reXzz8f0cOT7g5VeeQ0yRfUeOs2vzHIfn55mbmsEYqFPEijCsNcGyxQQLw4RzwsJyw0THUImQ6yHGG0oE5wouPGOCGA05NywMB0z0eiQbqfpDxFpefOV5JDKNSZRFYmmwSNd7BrUwqAdsnp7WKl20lettyQXPOANwfOqBR/iND3+FQSpwZZeUlhhkT9k/xufe+b2cvWUGyCwuB5bo82jVp1oWorUYl1WFUswKubx1JfStY66IUVlwo/45uU7YrsXkrEqwXhHpOiTVBLCZFFpkcuSw56yuzQE8iRQapDYcu+shnr3lIK+/yvO1T36UrZefS+lnuGlPl8/XF5I3n0U3Doi+VM+MHDGrDKQijlRHYvBsPucajh45wIYNUwyWA3L7Z383h2OPUPYsdmIDb7n5bFS0RoOGtbb1pFB7w0TGNIz9jesBzNZH+a2X9tj3+BcBw8bZ7RyVrfznzzzJ/PlXMzU9h8lq9ys5jxdrlV7Ufj85auDRs0kKKpQQQiLkAE0cO8URlMEsAXLhsZKoxOBFw5MTg/FeYcXUtKz9oMpTLdtfYqLGUjr1Yu4VnspY5nLioh0zHFtuePTwMlsmJ7n23G285vJnYIzl0MISc9MzzA8WcbbDbGEBq3A0adx3ltaad1hFfCEYcWprmioaDPWwGVfyrhUs8t7TX14g0+Ct0DFCtbSImzmTqhmyoTc5XuBPIuW0C6/2DO34fcoXCG1mrsEgYwi5lVEVSzZq6UwyYw8II21VBISU1WwjA0T9DCvZfh6RGmkwWGIyNAZKfXdrJKX3eJTMkeUl+gGGKbG112OmEHI09MVQSMIZw1cfP8bsTMEFMxN6XC2SqtIOEckqeawLfoNkT5YGVYVLej+JbasiveeyaQgRUmzIucB5BTGN9YrqaGLPoaWaS37w3XhbgFGSXEZ7cyMXL2MMOMNrn30m//Wd37NS3RJ5+5/+HZ+7Z6jjQNaTgFISNQUpeT71H17GeRsdVkYiVGuJgKMWzjv+4T6+cNuDHD4yz6+/7kpuvfcgn3/gAL6c5te+6yLe8Lxz23OTntJBUcyIPJl45e/9HQ/sVf5JTqieec6kKiLW8/63v5AXnD+zAl+fahxu3R9a/73j4xLl58y9+fewnVmiqH+7cwWSMrVY3v3jz+PHrzlbq+IWefiR993AZ+84is0B8YWef2MZVBWERD2sePAP3sLMpG9VDtciACpBEVhcdvzuP3yR933gMyyUc0zYAtMraPqLGFeofHfSazKSo1a1UYV+U1LhGsFhssoWgxZIhTYo8aajSXIWsgSSc3TcijR5FEuTaiyOKgZMFGI2NGmZF57/DHZucXz09kNcsGMTf/jjz+cZs/Dk8SFbt23ik1++g20bNnHFuVtJw2U2TnXBNkQKiIJYiyURsqUOkeU6MIwNGzsdSu+UwCpQxcyB/YfYtn2OnA1VHZguFR1wJhEyGqhEqFKDM4JLnk89dowvPHaEy7dME6LqYWzqwU0P7+WarV2uv+gcbrj/STbMTDFRwI6eZ8oGNvUmOTC/wJbpDYjAMEMd1FytqhqOLy2yfeMsU52CUAeaLJSlZaHfcLAO7Dt8hMt2bSUKfOPhPZy3Y5ZtUyVVv+FIv2H3sQU2FI6Ld2yl9JF7Dkd+8yOf5eFlgbrGYsE1DOpA1QjfsXGW33zLi3nGZl0x9hxboDfR4W/vepSP3HKnemQ0TRuD6naMUMV5YmzH1q1V+fqka3hMjRZbbTs6eyUvGmNoYo23+rwbJ2PUyzirhnbGjNXPsnisqTH9IQ/ddRfP7szz5ud08a5Puek8KobcdPMTfDJdw8zUNHV2+BZlGsntj1RgM4ZIg7WWZgC//4wPMOg7ypmNVJXHdSd6lJ2zOHLom8xMzkFqcKYg25HSXDuzmNT1L7Wjb4glhgpbBA6X23jHJx7mrZdt5oLZxKN3f4Ezn/Vyvu/ynfzxLbfQvfRZ+Lm5MdPXjar/1FaghY7CiYg66ImofkCLDtgEOcU2yFik7EBdkwunftChojBGSSHGMsyJCWeZKie45sxpbnpwN/ON4lW2ilq9BcGbBpEOMUS2dRJv/e6XcPCJg1x/yXbmF/vMTkyAWKqmpsDSVA2zZQdDpkyO6a4+6Al1oTLRgQ0tjKZQvS89JlUqlGNKTO5QGCW9ZIYYnHbwcoFIZnZyTgOCKDGzt3EDCDg3vWpRGrnzrVpn26TKiHb7RmpyujjZ9rM6Qni0iUx2ehgSVUzcdPs+Br0OTx48yMuvvpjFfuTOh57g0nO381sfvIH9R46xefN2Dh08ynzVcORIxUIdGTZDpqY7NE1kmByFj8x1HYtLEIMg3aS9rJxaS89M0e3QxZKCVwKM95QTCRPUhlqki3dCjymGzRCxfZxzDAYDBjEyXKgxpqZblFRVZHEpYOOA83ZOMugfZ7o3xfxSxXOvPp/SOgZpiXf90KuY7CYePHiMSzdvImbDvvkFLty6EZczg5D425vv5hd+9/381e/8JK/76Q/Q6+o8bh1RwlJWs5C6UZnS1DSkoeMP3/lqPb4WcrBieM/bX8NF/+5D2KyOj6MHMYeMpD4/+4HP8Y/veDFafq8lQeY2WRmkyK3fPERODZU4ylTz8c/dxYYdW2lCny1bJsYJnhqpBNbM2K+OyUBOogztAMPDBxHZjGBIJun4oRFcpyT2+zzw2AFecP4sp9IqOG3QX2fsTNGDFXLb29/9F7iZLeRGJzw8iZAF5wyzzTLfe+UuYmpwimkhIvy7lz2XW+74OH0Bn4RMIMdI2cpbd2dm+ak/upG//r9fTCSrb8Nol3KELHzh9kd542/9LbnTJXVnmZREMhWhAqJFpT+kRTw1KY9kbJsYk3VCiByRnEkmQm3wNkOEkFU3JcYlfNnRVlVrPtNkXU9zq+yZs1q5ehzWJcTU1KngroVD3HW4oVN0uffAEV7yWx+nyYnGRHxyTExE6iXHZC+zUNV0rWOApx7WLOdEx3bZ2BE2zW5ksJQ5uFDjuxMs1Qv0Jkua/gITnQmmSq8BzXcY9oeYtMRVlz6DW+98mPmFo7z9ZRdx0dZN/PT7bsRNTjFb9rDJYHsgMfC3TWTKdLXlIYlYDfkbExnkW/GpJovD29YBNVmk57EmUoujMAkjpRYIMarbqihKM59qXItmGuNooqM0ilBhHf2qr+ul6zDlIpPGcrRKbJwoaWwiVJYtnYLj1ZAla5DBEskZBnXB8sI8kyV86EdfyZXnTmBSYtgUeJ/ZOruR3/7kp/ncYwdwxmKpEdFpHxFLjIoo4yAn1d8QEVKTcGWhhUYSNYhLlpASMuzjBBKOsuiqFH5O5EqVOr0ItTiME9WQ8SU2KFGw3zQcPnaIc+U4L77gKMuHGoZpgS3dHjd+Y8D/lKuZnp7QtkKqwLhx+3BEBAU10QJde+sE3c3PhOU+pTcUvlUCzNVROuU0w2aZ0D6oInalwjOiWq0RvCkhJtU7FsHYDr5aZLhlEx87AL+0Y57Ln/sD7HnyMZ65o+TVZ83yzwceIW3cijOBFNHMSkQfuCarX7LKKujJrBrwEIYq8SigLmtRSV8pat85ENmxcYp9e4ck3yCDip997Qtxqc/ufcd44UXncMnmKX7puVewnDz9umHjVIlJkWzG4DJDDCWJFCouu2QXAFO9CSQXRFNRFA5JDucdI5WBxZh58IlDLDUNX7zrYaI4nn3hM8gCx+aPctmF53LX3Q/w7k/fyzN3TXHdZc/ghlsf4eoLduGHA274xpP0Nmzi7K2BTZNd/ukz93NoGXbtmMDlQPaWY8eHFAauu3ITf3fDbs444wze/gOXY4rIF297nG3btzA70WF5uMzisSHz/SVs7PLI3r1csGuGrdtmOb6wxE13HGRxcZmdmyd48uACB4/38EWmN9FQ1ZmF5UhvQufX3/Wnt9L1lqI3STRfwzoIcYrHjh/X8S1x+Okec8ZiaXW1Qd3k2uDVndB5Xeud2s46QwxDjDidjU0B09N2Rmm0h529qI5+StjCAQO6pcHmLgFhomPo5UhVFNisTGCf+5Q9S84djhyPkDZwfCGScPz95/Zic2Q4bPj43/0RsamoG4PkhpnJDvNLNYUkbOkwoQM2YTqbeNPP/Q221yNmgRg1oUpWR+mCCv3koInma19yni5VMqZYKdjeVGyQiqUmQFHoWJ0knBGaSrjnkUBKPfWQWOXeNk4CZMiBesCBpXnmfJfB0j5ede1FvP3PvsSss4QGhv26TQKTCmrJuEG7lngGrcpea5jjDZUptY0ilhRzyxQWmtYb/a7jyyiKtVqy+WkE/9G/12W4o/uQhJsfP4yp5whkLI4gJdZaChLv+onvYdajRQYrOe6VZ8zgfIKhIUuDMcXYcTMFiPUin3+kVtQyKUKVJGFp+NBND/BL7/k0zcwGKDvtdfSEqAm1NREKA9aQQwJDq9wG1ljqqOldtjr/bUXaCQq1m81tcu2swZVW0b7QYJ0nm4wVi/GOlHRKQbyFukBMW/RkIHmcEQb9SBaPYOh01LdxZmoakYrSefYe62MmDAObKaoui4MlupPTzEwLc+KIgwFl0WX+0AAzVbJj2yShjmya3cJS/whmeoY01OFkU2cyCamXKIsuN9/6MLMbJ9g1t4FP3bKPQxdGLtg+S5WFaqnClsJwQVuyAVgwFS5HggGXdF69GJEDraVGtTIoBdOAKwpCNcB0OoD22sVaqhjodAqamJk0qqYaXEluarolpBBwzhJSYKrXJcUBndLwy999Fdfs6PBT77uNI3iaqiGGQCgK6vklMIZ+gsk6cu0W4c2vfjmXbp9g0llC43BGePLIQT7+1Xu57eA8w7qmY5UTkrMmfcYIMdU6gtxC9SajXI1oMFZohhVl6dXxrw5jFdkkSr4zJGKuiDFhC08MCe8sdVKxPZMj0WSkGerz6C1pccjg7gd4+1tfSufQ5+n1DPsODrnhngGfnz+bjTs2tIqzOooco6Kv2TA2HLJWlW8l6vrsXaY+di/VkjA/rCmntyJ33fj7OS3uRkwgd6b40VsuVAJeEgxqhiApj817LBmdQFPIu2n0IGwOxGqWs5uv86YrDuPmF9l3rM/2y6/h/Tcd5PHtz8Zt3KQLXUswTGPEPCPDRpEAIwqbWItJDskNTYYYalwWxGqgst6QqkiSxBVbz+JX3vgitqeKLBBoR8KSkE2JQxcfEdtCfO1DL4ZBjJTW8KVH93Pmllnufmw/E5LYsXmWN/+Xj4KZ4fiwonCWgLCUwJqSTdM9JrsFOTb0m4GmBVFoUoM3Hu89dRoQhpFsOy3bKhDbqkCqCvwkZRoQbEm1uIwxhjopEa6hQTCQJmhCn15XSAECQuo3iM/jBVBCojEBn5x+R2iw1tM0DdZ76joCGZ+zSmWaSFU1iFH3xyYNsEHAWUUYjGa3ox5skxuV3Wz1ErwvdWH3GrysgWwNTpTbkUMEb0khjseTUohqvtS6tsXUqEiOUyXHkBKSM51Oh5iz+j60qJDJev3q0EClWg1Nv6aqBti+LtQxRvUDbxTlyPXItjiMxW5S1AkOW1ia/jK2M6EOkqZACODlf7H2nvGWnPWd5/dJVSfd2LnV3WplqYWEhECAEEHkjEnGMB6SYXbHAc8sY3vxjNMHL/Y6AMZmnBZ7xgYbjAHbGAxYRGEQKAAKLakVWx3U+eZzTlU9YV78n3Pu7SAhe6fedPfpeyudqueffoGmEfWsmES0ybhSEPIKQZ4bRfCKyaLhnk++i9KU4+CvUeO526dveYif+4tvYJXFlEXGaWtC40l14r+95lze/rwrScmh1szYBXNh+OWv3smnbnyAdHzIg3P7ue0338HV/+WjTG/fjD98nL1/+g5MCmOGQxoBH8+05QRALFUj7/nkLXzshvtxrqTK9tcyLpPxS78y3P/+l9DR+swjgMeznZIESKLjgcTWn/hTKlOANjKey0h1XVke+MPXUjiLY43qHXJPX/o7n2D3Qw0hVGhXZGoxhBRpAUtNw8d/8Q1ct73DQDU8sOx4+y//CfsX5FlUXojPMY7Q6oLOlmdM1CdDSGN80WgcJlKtq9TbEJLgCpR0LazSNIhDozMarHR2klY4baXjma/GWkNCujHBSyWojM3rhpERiW/EmVE1RKW5aMcG7OAEtj3D8y/dznB5Ea97XLylwznrO0xOTvK9+49Q9kq+eef9/LtrrmTH+pJji0vMdDucWAkcm1umNdFifcsy2Xb810/fzF17l3nR07dz1+4DvO35T2HjRMHisM9XbnuYh44e51v3n2B5WAPZ5S8qvJIRajUUrXmToNFAE8YtbAyoqKQqzSNdHwMGGadQFCgf6RUFTZJiTmkveBmd0MYTG8SLJVfcKQvamHzPVwYVYGm0oywD1UqD7ZXUgyEpyBpx8cSQD//0m5gxMFG2CaHBmoLb7r2PtGEd+04c4frv3sm9C1HAySGhrNDKfRMEa+Jzy37kX6MVVpu8tlps4XC2wHuPKixaq2xUJzV4jBFnDCmIvHHU2c+g8RStFlEbLOKGqVJAEQhVn+O33s4zp4/yyqdYCrdMKDZz36Eef/jgNO2pdbSsJVpNDEp0CHyThYdiHgGIIZD3fswsqVYUH3nK9SwcW6AOGvQ0tigKycDaXRqjSCYRogCnkkFOPEbRNVGagAChtDYkbTFxSEqia2w7fXb3N3PDCcs7n3U5rdtv5/AD3+fFT7iEP7j1ZvTUS3CmoFENRltSqFBR44cVDsT60Tm0kfZdUh7feJQBq4QxkHyDMRC9wrVKCJ47TxzitR/4K9a12/zX1zyTq2a7AmKMhn69TD95fnDgGIfmPaZl+f7u/Sx5Q4VhzyNH2XXOTu47cBDdLhgOPCZFlhaWmd2wk+HAs352RrKr4NEL89h2l8HyIovLmo4zdFoFKysrYNukWNOYxMpgmaIQ/4Aq1qAMgiFLpCagVcL7PisB/HBAo0Br0do3UVpCiUiqjxP8kOXKYJVwy1UCGk0MdQb/aQIRT4VJyAtgDToEVlY8UZRBBPVrNCt5sdIowXkpI7oGAZQVJa2YA1ZKEa0LIlo4sBZ8CmLRabKFchCL4eRAG50V6JLIYSaogwAxi6JgstNhYWmZ5VqjQqBwgjHRWpOqQFMHTOEgaAwBXShiE2R6ZBxeV6QqkkIEnxdyrcaqkknL6p4YYSUEAAcKrcTXIaQIpZPzLMssqCTOkKRG9pMSRjsRFNEqF7YKhkts2riZf/y9n6ClRwF7NUipPHl51RU7+L//ZwMBhkrTKjQ+BTqtgoEJ/NFXD/L25z0JpTyK/LyP59YNf/T3N3Leth0c0p7zNqzjvf/wL0z1JmnmBky2QKWahBHRmMQasN8o4q6pxLMHgwJUSPza65/EX3zjHnTQFNahjMgJkzShqhkuO+pk6axhafxbA//azWP4yn0PEl0pMq1GkaJYoDYpsm2DpeMkCR1NsNYCNV992bnsfuAecYrLRlraKGIDlU60MbzpvZ9k5zrDfXccxmzciLIWGwYkbdHG0QTBb4wMh7S2uRsySgRS5mCL86nWBp2kSjdaqsKmWRkDLr2P6EJGLEaLJ73PmAynhBWTUsJYg7JZblyJ2ZhzDhD6Y6mdOMZZAUSHus/TL9vMxknLcy8/j7J1GX/2lZs4MjzI/n7ixj2PsH2TYcc6R6oCRw4fYMv0Oh4+3PDQI/dzYlgwqBoGgxV67UmWBn0GfkipFBMtxT5v6WD4x2/Pc2Ch4ug/fYlSe5pacdMDC5KwG0e7NQGxZpC7e4ZE6DfoIhu56UhMGtMSXJPWGpurXx9XhcgMirJ01HWi5VokW4FOlFY6ym3jwCDSvEUbRU1SIfvQGJSJ1HViGGqs9jSxZGVlkU7b4r2iGkRM/wSXr+vxk6+9jmu3TtOecDRNYqGaY7LoEGzBkeVl6vXr+H8+8c9Q6sxGMyIlb8FpTaplZm6R0XNshDopa4ywL0pbEEJN9FCnAGhMNKLalxKlMaTQZFOwCEnWGK0USWsBtjcep5Ngm6wi+AAmsugDV2xe5o0vvYLjd30NZs5mYeEIH7lvmskNG3JiCiqt0pKVVlgjYmkRMdLyTSWsg6QxsaGf6fKF65CQsZKNKWBbXVaqOXrFJlHGs1ZmhjprCeuG0IhBjlC+EgpPiIpkCpnZJDE6aRVtvrJvK0/dc5zJ5ClntrJtXcFTimXuWjpOmtk0zqxVTISqQmklsDljaGLCGS1dByttegn6BT5Jiy8iaknEEXAw0OtZKu35xc98nRc84SJecuV2znMw1W3RjTDdqblh9/c5cGiOoW5z6MgCpjdLGlTcsvseJtodShNRTYUuLVObZgnNkNjRHDs6TxMTVoGz0K9W5GeTJkbPoEqY0lIPl2Ue6z3aGvrDFYxtkYjEELEm0YSI1Y46ZltipQhUpKQxUTMMHp/VvmLy6MJiTJsQpGVmjMF7T8CLi1b0mCTUqhQiQQstrm4qoW4ZTaEUhS3wMeBVBq8gylO2kGtQ0aCdomwV45c2BMbVUDSaZo18c4gyFWq83Iei1NKmqz0YTekMTS1sjdIZBlVgMPR4v0wkUGrp5MSg0VaqKpuR2iEEhk1NYQpckxGyJqF9INWRemm4ikq3hlQ3UrGpJMlPlLFD03gBs2ZRKzJfXsVVauNIeQ0tHSmtLSFJxZF0yDPb3BIO0rL/wgd+grOnV7UMYNXIZ4RCNxauu2SKr+4RQCcwpom2ipKH5yv6WLqZViVMjdFQyrHc1/hqwNLSEm++9lw+t+deYtB0JqbYtW79SYFVGwhRodZqRMRTlNpGwdQY7l2qURTYQiqFGKWT1FSRwrRw7YA1GqnY18T2EZVtLTXzMQL/2vEGOQj86Hv/lk5nE8opjC1IKRCioqUN73r1NagonSkB0K3qRAQafuJFT+H9f/NN5vUkSVs8kTgU/QITxO3TWc1Dh2rcdBsbB4RaqiuIeMSqWacIQUm7NAlty6CIRpFM9rNwJTamrORpCVrT+AZSQGdRF49oufuYSDoRtKIfGvEcUYZkxFhMOYcKgUDCYQWlrg0hg2dHTndYsTt2qqCwLW66dwmi4lO33Eoc1kxMtvnuA3O0CgutLntPRPYtRIJvCIs97lksSZXm3N46ji8f5vyzt9EtNR1VMNUp6LQNNz84x7HlAb3FiqFZ4WgsKNptHlgI2CjYnImOyJU3TcMwZWlzpVAxoJWjcgrlG4JROBRNCISkidZSGoN2CZM00Qd8CmhVYHVE6YjttCB7vNhWQaxrqsZjW47UCBK+qgTJXzVDbOGovKJMA1528Xms2zbNLd/7AT//ppdx4eaSwaDiizfdyauecRVdXdMIqZJH9h1mW3czDwxqvrf7AHq6z199IUlp0AAAIABJREFU4xaS7UCqaZUO72tQEDKrjORpmohREp98FOdW5SMpeLKVD8lHvAWjLQojhm4oovcUqiBmgzDtvTCHlBLWmxMDouhF9tdk9g8oUghYnbDJER/cz7N2VhQLe9i04zL6zYAv3nsOdmY7yiqi1hgPKXhRU60jqsxkQq2xo053th+PKaCNRWmDpsNQeaa2Xcjy8lGsKy06tHE+slL10VaquhAjSmuCTzhlUCrgmwpjxSiIgHgba030DVFJzViUbYIZ8jvf7/Huc/oUTcXeR+7mmisu49vfvJHeNa+mRFFnz+SReYI24vZk8mKrtcyDVWloongDuLKQl4aAUYaotNjINnG8sBfJ8+U7dnPT3oNcfdY6Xv/0y1iaO8GuszbwjG3XEbWF1KCVpo5GaBtEvnDHwwwRF6dBCNy57yFuuecwb3ne89nSqbn63HP48u57uP+h47z8OZezsLDARdu2ccexg3zoY1/kyZdeyMzMFH/4+duhWqBWXaE/Jo81CRshKgngyUdSqompxEaFjlbuuzKymsdAUIYQIr4WUxxrxCc7Zq6/RmZjOiZCzpRV8KioqHJS4JGZq3OWlVrkMgGMM+P23CAHaZ2ZF/2cxSuMiPKkrLYY5TuKUbQYjHHElClZIZCSwdcZiRqhP2xwhaHJftdOC7WtbjJSVgn9xaeKeiimSZXytILLaori4y24+gRemApJGWyuPpwr8f2hgLUGA6zwMFBrkhXWyKZK9Vbllr4h+SScZqPxXgBeAfBRWvI6uMwJF3VJoxVT7cTZ63Kff4STWTsCGMXDqHnfm1/Kk37hk7hoUcoRjcIZRRMauoXibe/7NB99z8twmW0xDrBUtIMneE0YLnPZxRv48Be+RXdiGwtzy6TJmPUYhJYJKasgnrkDID4DwgSIKTLd6aJp0E2BLg0hZaa3iSSV8DFy28MLPGNbm6TsKh00n+Np26MGf08VLKVRmQ3i0b0uIYo7ZMxqoBrFYNnzuidvzfTNESVUqi2NwiQxLfrvv/AG3vHBr1JVFdoanMnunMHL9QePKzTRFTlvlMWcKPxqcW4UVc7QiNsaRhO8waaKKsixTTVkY7fk+MoyUVuqlSGdwhHjIt47vDOEYU1VJibaU/gG2k4Tbe6IFTYfx0n30FisMTShRlHio6xBXesoeprFhQGubJOEoY/tGlTV0JucxC4vMTtT0i4cm2c2MtldR79ZYm6pjzMDnn/+RbzzRReASdx030MsacehE1vp9j26azg2v8CTz13PchP43j0P8+Sdmzh+vOGmBxuWm4Z2E6B09OvA7GSLdrtDbaBV9zm61EcpxbAeYIIAUn0ITHV7DOsBtLu0moYYI4NqSKMLuhZWhp5Wt0MMDRDoujadqS7HTqzQmeiBUlTVHGW7C9az1D9Bzxpe8vRzueGWPVywbROmGvKsJ13OVZdspSRxdq+gnyL7L1jP7ETk6JETzHR7vOKaJxCHKwwKh0+eparirmHkB3c8yEduuo1ClTj20bKOEAREWJOyRXmCvAakRrrdEMHLSMP7WsZUylJnETnjhKsXtRLNHJ1AW7SHGDxJ2uVSrMWIVRCMITYeo8C12/gg47aUNRpUShirWEo126ubuficc7n15t2sP7/AU3Ljcsm6KYulxIdVe3pCQJcGFZXE4JQIUToYKXhQIpMeUoRQQ1EwU25iWB+iKGaxg+WKNH+EqAPtqU0oL/a8xkpAMCmKs5n36NhkAI1GOSsvdSGtWWIQI5+UZP5cTLGy9YW07v8irYktFAQumym58/Be3PotEkTyrFnpNFaQSj6hQiKqRmgTSlGW0lb2PmKMxhAhwUikpCglEwtJUJpFjNSDE3zjgUW+ev+9WO04a3YL58+02bt3L9c94ULO3bieLbOT9KxjsT/k6gs3M1O0CAjrQT35PEjpJA7xG6/aBVchwJl1U0Bk49YtPPfn3pxR+Jp/f9UuJlwElfC141Az5OjRoyyueD51w23sumgHn/vefr5z92Gmu1OUXc/ivKWJiW7bUkdH8v3cHnRo41HKinugdaggDouND7kNJKZEwfs8W6+l4vV58dSafrMqRIIXWpDRVhytnMJ7jTEiSEJShKQwyhKRqsWaApsxBcpIdlsjDCjfJKxL1CGinJUWGgqlo1RGWcLTKkFV61ARCBhr8D5glMYVHVLwtMoOYbBCqDzJK9AwrJaI2jLVnmHQeGo/wCkLBqnIdAF5pMEIC+A9aJ3VrySR0NYQgxZb2dxU8DFk8Q25TyM98VbRJsRITJ5EIqDFuKla4eO/99MSdNdUv+Kce4qyn0qs6xRsakcWmkQ9rCjbLbmjSWFi4OtHFEaNZUDGFfVtRxfo9ApWFubxPtEfKJZiBx2HuKLkV9/y/DHrYPV46qQKfa2gkHCNV6v2s0yDr1cInUmCzxUtYI2MdQJ9hrEYU/DG7IR8fquc/9OD/wjx/3Bd82Pv/TsO9hf4mRdeyrtfdDUv+vW/pqUnhUmB2CXHpPA6sn1a09Uj8SJJasYpwJpE5toLt9KvhlhrpOrKM3rIFMMkz0DpSnxq8E0cu4hGJeZNMQRi9HhV4ApLtXCMVz9xM+949Qu57NwtzC8OOXvzpCzykdVnQyWULrj1vkf4wf37eNOLrgbg6z/Yy3LwXLhtK4dOHOctv/IZrn3iOUzahoPHTvD9g4ep51bYdcFODs4tsbh0hML1MFaxcXKS83Zs4F92P0LbeBIVx5Y15/U0L33eZdx79CjXf2eJLolXXXUe7/6RK/j8TXdy/S17md3Q5udfeS3rp3t87649/OSf3spwtmSqPUunf5wP/6cfYXqixRe/civLtstNd97D086dYMP0JB+44y5qXbBzoss7X3AZPadYN6v43Hd287Gv3U/PtHjhcy7hU1++kUfmjtFys3QmOvyH655AUBVfvnMv+w8NOXqixoZlmgC4LsYfp92b5MjKkOX5JZpY0bclZZMEGxAc67qLtNYpDs95Nqk+L3jmhTxjy6W87unbiYB95dOpgidFR91EoomEBI22tIxh2yaNs5oNEyV7jlZY5XjoyAKT3YJv33YHN91/mEVtQVtc3RBtoMnxDC3KmD74jD1wKCRoBx/EWbaWd6LJhZd4uxu0UdiikMRRWdH6z2MjfCDoTBFNitIZaq/RThGbBpTFFhZ8gpBwzhKqIQrpxiqdO+J33ceLn7CVzjlX4nbfxXnb1/H71y8z2d5OSomqGmCdQRszpunLsFgI3jKO9Sgj5zZeBwwU0ZGCprtuI7YpWVyYw1qXcNPTACytzBHsDgzgGylGfUpo32BNIkaNckZmo8aiQy3iPkYWW+EyammvFQ2f/f4B3nVOhzt27+OiLTvYNbPAt++9k5mtOzFeskaMEtWr0JDIfHOlBS6UktD/rIZocE6q4xhlnhtDRFmLsTJLI0R8EJOfEEBFj80c78NzRzl8XHiSf/m9+0j+XkIc0E1djvbnmG2VTNsWb3rBFRxZrPjKt++gXydeeNXFPHnnZs7asI6kPdPWUHuxgbQmjQFYRsnMcLoAEFW1VMBZRYst3e3YpHn2rnMIBH7qustZRtGv+kwYw20PznPjfQfYu/84Dx/vY8uSm+/eh25bynbJ4TnP0soiE2WJUZF22QJb0AwHolHvI7bTFTOlKLN1WhqVLPgGY2XeZI2VVjEB3WpRREOhLY0OKB0xsSQoaberoo1vaqy1gg5XGtsraSoxSKp9EIaG0QQ89WCJVGsmVUNoNF5HQtJcumWGogV373uY887axtxCn+P9ZWY607S055mXX8CAhq/deg+dYpYt69r8+x95NvsOHGHn1vVYa/nvn/ginZkJdsy0aLU28T8+dTPDQU0yFhVrWqaNafdIoUH5vvD5Y6JOQ3RI41aYyp4SNkn7lTyPFVSvdCkAqqrK6FxI2mOYICXPh3/h9Vx1XqZpMgquMv+TKnm17U1G1j9rR8lndi9hi45QaAsnJkJW4QaWvQcHnLOlJ0qV+Zn//A8ewtUa11IMqiXOOm8jBYImd4Mhl23vyjmslZhd0/4fB2OdTkoKdDZm6teNJFBxQGgUViWsKXFOg7cUZYdOpxyH4JNknuUiswfD6ZX/CBPxlt/8OPcfq+ibks9/by9vf84ubn54gHEdbNnC5yCcosEVmp/+d9eNyKtrtixAldUjAQoiNlVEb4leU3RaVDEKzzspglYQogBGoyRmJINPwrUerNS0O9IOVf0lXn3NLl577XW84LKtjNQZpzojfQYzVplUKkKmFj7p/C086fwt47N84RPPzhcPl67fyLf/v/+TsyayCIwy/Nlnv8mrX/BU1rUMCyuB+X6f9RumIHq62qKJHJh7GjOTEyz4wEev/w7/8WXXMEHEh4pvXn2clRS4dMsUVSjoTWzkrM19nvPUJ7NxWtQIL7vwQr7y/ku5/vb7ufWhRX782c/lnAlRi3zjc5+E9zXXnP10QgzEUKNsyR9//kY+9Z7XMK1GssGKSzZt4LzN25jptXj1lTt41/Ou5OCRJUyv5DNf+Rd+4TVPRNHwUy++mnsOHuHcszZgo2emo1kcBnqugFRz/9F5NmyYZWVlyCe+tJunXbmDnZumue/AfrZunGbzRI8v3XgvO87dzhVnTaNSJCgY1BV6qGgaaHcSpW3wpiTV4GLk3mOLTBSWTq/FH3zma3zrwAK6iGBlbBR9jbUlJknXWBWWuhlIAaJEGS+NlUFzt8cYmqpGBZVHPjJOsraQWKhkrGidqAwmpdFKAOzRe5R10knKBZcymjqPtEdMh5HGiJB1BMOUlNCGo1JYpUjDITxyO5PX7uLhH3ydmY2z3Hv0Ib5Xn0+3q3FFQROD4MhG77Z12CTKjikmok6C1Bi/91L86aRpCCweuZfl5UNsvfBaFhcWUHd964Mpzh8k+MN01p3Hy27YQktbHJrUVJCyBGIWKwhO45QTkFk9kJm8FuSqUhnFahKqrhmuNHzwmUPafi9JtTjwwCE+dPRc7MVPRzc1mKyiNGq5WJOz+dELHcZcWkHRC6WimJ6gf/wY1pQCADOGlAw22wqHKMh031S5lS1tfoUg1I0xBK3HqmuGhFEiLNLEhpZrQVTEWNM2jpnJkvmBJzUJN6w5urzAa6+5ipkpw7ETNVEZnnDuZrx1nF8qNhcjTuZIDwDmm4aOcwRfo1XBYDBgolOgNWgfSVaNwWBj6U0gpFoCuVbMD4cMh47f+PNPc2gx8r6feT3X33gnv/QXn8V6xeWXXcDyYJnv3/0wl52/k9rX3LbnfuLiAIqSdq+kXlnEuR6zmydZXB4Qii4EK3mbr1k/OcFFm3tccMF2br/rIeq65qJtW5mvTvDet72cW+56iO/s3kvhWuycVrzhFS/g777wL7z5lc9kfnmFzRNtnJGqtl9Hui4HR4RHLWD6/EIo+e5D8uKeSELhxu2tEES/X0fPkq+YaHVpgsfoVhYq0hwbDnn1z/45dz54iKqq0d0W7axv32gBi/m6QRctQgo4DNbIKEDsZ0fB0aK0DBGUStRRE1NDqAIf/E+v4W2vfAJ2zffyaFrwa6WEU0pUynDBOz9Mx/UIhRFGQIri4eMrXvXcc3j/K56S5U8l8LzpQ5/kOw9UmEFg/8o+/vRdP8pP/v4NpJS49vKtfP7nX5zPYw1A71Fc5dYmASrlSkEpfvbPv8Hf33VCEM0+0SqF2aGVZbEO/NjV2/nA657I2GluxDZY2wlQ6uQxQxb6ue3APp7zvn9gnZpiThmUtsy2AgsDSbqiEXnapmmwVkNl2P/Hb6DQIxrkavA/6d7mTsuvfOzb/OEX7sQUhXQEUxQMTAJl9fhWRC+CPqHx+JhQzqIYEnFcMjXBDb//WiIBTRvlo+gLszrmWMvMOFVca/U+r3F2TNKRilQYSqIX43elLURP0gYVQ9b5t5KUu4g2oomByjLXeGJ0WdshsdJfZrI3OWZ5KGUIyqCiBy06GzH5PLqTeyeXU57xGZX3K4+xkiPk5FHlCKWQzpevg7wTGQCnYkXAyTUlSNhxYAOICpYG83TbPVyyBO8xpoGU6EfRc6lSoNvqUKVIqbJCrDKgPCeqgPKRjR1Hg+atf/BptuzYzMYJxy179tIq5Lrzg0rUhmppkdQqMAoGVYUtCqraU2QWUhODaMoksT+Xt0aeMR1BWZur5ohVAkIGUIVFZYBsCkHUzKyhZUqir2k0mGzr1QSP1hbnjHiE2Mx2ip6QkjAXtBEMipLvxmQfAGdUlheoaJYGXDr3Dd7+mudx9z9/hp1XP5t//MKtfLn9TNo9xzDKyNyqNZ42SRh1KCUOpch5BVaVfJPSWDTLET7+rD0cPXoY5wxV00bdccNvpxZ9msVjLEfPO+64WqhTmc7gjMF6QbFHM3pBjWh3VxVxRP3QQrsLRkBXum6IdcOu6RXeMnMnh+/bR5zUfMdezu0Tz2Ki3SIoQVDqKK3gUUt2tHg6o8CWQjFJAY0ixIYNW2Y58cgJogh5o6NBl25sjzu6OaHx47ZuURRjtbRQyxw6ZgCOTqwqfDmFCgK0c85goqB1Rf9duh1GaRHDrcXASGaICqOSHNNI9jdTTGKNolQNBwYNu6an+KkXP4VeYfj6A4d40qZpNnY68jJpAZhEFNXKEq32BNVgiXa3LSCktAaQFWX/I217kZMVOqaKigaLxN3EfIC2hUJ5RGBSXgKVF9iVqCl0wqQGlSug1eVtbaW7uvjIIrIqPTtaCE8LSug1i+hqwBT09upPrU7QM5Yj6/3LD58u1ytU93RSGz4og02wAPz6R77Il751N0+56jKu/9oNzM+t0A+GZzzhAh4+eoJeu8XCwhIL/UoAPK6gvzjP1Rfv4NYH99FWlp9964v47Odu5dfe/XKed9lW9Brt/lPV+07dTtagj7z4V/+Y+44UeB8oJruiaImmGgwppya58T0vZ7ZnQSmGoeEZP/fnnBhYgq/xSbOyskDhekStOW/rJr7zvleccsAzn8vIFnZ0zhqVZVI1f/S1W/lvn7idqalpcRtzBUWuMJYGNRt7hjt+7VUZAyFV+Nr9AYwUPVevVLT73/FX3+fzN+6mdAUxaUJRUg8rrNI5ATC5JR9RDClx7P/9N5CSXWMdcXpCY/JIokFzwZs/wCD1sE4+jyP/i/xOg5KRVRLqVhOkY5UIfOG3385Vmyxk1ch/jXnQoyUCj2s/mUonQ99TxJPy/VNKAIaPaqU81nxg/DOnfg8//CJOFmo67b/HXgoyzjnjeaxJfIKKAsQdLLIy91nU9BP5+I1Hcd0pHth/jEEc8M6XPZ+FxUUiBYeOHObWex/GmoIjiwsMleVpl1/Enn1HuPfwAi1dUEVwVpG0GGG5UgChdV3jnKUZVtR1DSrS7/elMhfUMq1OW/BBMeJTgiRjIm2FcRTzfF9bI+D1YFCqyXT3iA2KYDW2bBEEpUnRKkkhgdMknz0WiCgVUMqhk8aqSBDSPcoIJXvkqeKjxiRR3xytndoW6KZBtVokKurv3sFPPKlhtjiBLVvMnTjBnxzYyqB7IVYJZTolsX6ygNJmHLdijgMQc/wzwjhxVsSYEnjf4oM7Ps5Cv2Jhfsjms69E3fH19yWtAp3uFIvHDvDW7+6CUhG8zNlGC7BVOme5awRLkmIUA7QWQRRVliL0kzx6OKBfed6982HO7ZxgeW6JuxcVnxhcxeT5V8ic3zlSBqulEHAKcVfS4rJkXJlbsYkUmkx10JgIXokv+EhG2HsvALEmCO9UyzxQFDr1mMc7kkpUeWwRvBe+pI9ZuAViCBBiHkkYilJmjk3T5Pk82MLgh36Vjx8EmOVaJdE31AG0dQyHfdrG0O5OMVkUJFOwMn+E2U3b6YUhZafk8KF5rr38AnZs6HDFuhk6Bu4+coANM1McPPoI/flDPGl7i8W+Ymr9xVjbgzUdg5RXziZFrJaH3FhL4wOaJA6GWksSlVYz/qS0ADwTYhyBTGHHi8uamfJjLhrZoe9MC9tJiw6jxZPx97F2kyClTvv8MW1NM9BL3oFMXwwRbQrBNYRIY10mA8ZMcTTMDSTh/P79+7hw+0Z2TDvqZLKspiIasIxUFB/j+Ge6H2uSgN/9yN/yOzfPY7IJVWEsGIsfVBStko6JfO+330hSilsPH+f1v/xJ6kr4zinAsPEQE0Mf+dx7X8OzLtx8ysEePRkZJcUkSbDIfPar/+Pvc7C9VTjKyDzRlgVOO6oQWZ5b5tgfvoqULGRqnNKrjAkyL/tUsGFFYPatf8aGddOCWA6Kvl91bXRGqEh+MJDxUeN54I/fwrSWxDOeNPtfk2yMKlRhk/PZG/bw4x/6ArYsMVZwSDohSYcK+ErYBSkKcr9Ojhdeupm/fM9LcNoIMO/ULs6j3cd/kyXwKdu4LbHq17GWUfFovhTyjorBV1qDuRgnYv87zu2xTvuHGSoR0NTs++7vYVPF/ntu40b3DL65sg5bTjJZTjBYWmLRe8F3IaPfouxgbSF4Dtdm6D1l4RjdnGppjk63YJjHkABoqOuaZtDHD4dZPr3EVzUAvlqhqipSiLQmJzHtNpOzU4QkIkxYed4UEasswVkZl+rso5LxJEolYajk7rO2hRR+SUzxjBkVQdk2W6usjyKjaGWQ8WQCTaRJmkIZku8TfEJZg3FCrXZG4QwMl5cxN/8zP3al46Jz13Pk4AHK1kX80j0zlJMTFEWBTpoQmjzOJAOA8/cQIymPOo214/depOBBF45mAH957dc59PAxqqDozJyDJSV07Tl09GZmz7qYygwwTX7wgsIYC1ZAZ8YaaCSdiMrgRou4lqCSlIJqiI5p7INMUOw3M5zHEivDFZ5+5RV86Z/uYW54GROtnFxQCo0mNQQgKXHNMk7Q4kYpGLlloQUXUDhaKdD4gDIQQkNhC0KQ87G5hWxsMRaCkZshL6K1Fp2gDh5dOExKhOAprGR4wScKY4hBfKnr5YTrtCjLMmuNJ4b9StrL1hAbCSztskUzrOS9VAmrNJ22+Eivn+yytLRErJfodHusLB0ntltUx+boTnW44cGHqO7zpGqZKVeypAOzWT+aepnB3pu4aGZA0Nex1H4yMxMyh5RFRIK2zUo00vr12OyoJ+amsrxK00ZmtSoDKk1K42xV8HRq/GAZJWhVcittpCt/+mpxBlW4vJ3eVgWlRoyG0b7ykdcUUqvmRmn8/2v3I78VxPwpe0UosjIhDTEqMAmTalBicxyTQqXItJWX5LpdWwCNz0yKoEfYAEXE52P96xKAcXBJif/89tfxga/+Dtq0sZ1CktmqwRYOmkRfdVGxQRvH4bllCtUipBWaRhFCgiTKdWGlz9Mv2gJrAuMP4+mPgn9i1YhJKfiTX38br/jlz2F7jjpk3I2HsgWxDkzOtgm5vZiSHCfF0YKTXe9I46QRhH/8Z1/fzfpOFzKDqLTigSEJVMwe7HUGSyV8tMysjWFROnaPflUiqfOyay9i8b1/QW/2LFwMWCOJo1ceHwMxNMSqodEN2vX4rbc+n3c+d+e4uh2PNjgZJHnmm3i6uuGjfn7qZ6eOZtTJz+5J4xROfk9GIloq089G+8tokf/twf+xKv7x+Z+aNCXFPd/8n8w/dAvrd5zNzl2X8JvXLzIourQnCubmlygS0OlAc4zSTtA2nhMLB4nW0nGJ4bJHJ81iLAkmkVSJM4lqboWEJ9QDbKeD047B8hBSg6+HKGWo+hWl0fSr4VjMSgErS4u45WX6x47iJqaY2bQBH0TPhiah2hpNDsbG0AwHgFjRW+sISNE78oLQUQuNDwMZgGfrOK6yUwayR8Aoh1PynWntREQN8SbRjjENvtSaqC0pDFk6vMw7rt1ELx3mru/eygXPvpa/+eYxnNskVNOQEKyuFoxWQjQKchGrlBIcmhKBqqREICgkL2O2GEjaEuqASp7zLnsR99y/B9tpT9HnEXq9jcQmYrzGt8BlMx6TkINbRwgeQ0TbEhUaYtIkK4u4zfQ1fIP3ggiP2uGc59MPTvKGZ2/nnjtvY/m732GXmeVbg0XMxHpqX1GalFuNBm00Rgd0kCzKuDzDzUpnSiWsy4pSWgbJgm2yYz10pRRN5UVqOM8UlYjkEyuPLQpS4wnWUJZl9nMW2l2oBthWC6OgrhusUVBYUScMgcZ7kjHESjKxxjfY0GCLFi4lVCOYAGMNJkgVU6JICydYWJzHe8+61pCyWmHLph5Lh1doF475Zc1cZzvWtgT9bgKqGrJoGgpjaaLjC3sCnS2HeHj//+Dy580yWLG0OhsFZ3DqwjF+YR9fe/O0Sn/N5yOr1xwJTtrvo/3e2m1tNnomLnkcz6jPcF5n+Cypk69rtSPlx0Eurb32lI8TAFS2DU4ZOyJVucqXiDGnzbvlz5MX9h/uCZ83bdHAy5+4nX+47Sh+OMSqLHObR01JBX7tb2/kV3/0Wv75u3to+kOC1pggM6sg2tdY1cYxAhs+dkdkbQcnZq1/0uieKCZMoux0IQmF0NcNnZ4VNoePDHzm4MeRXHGenyV9Ejgw5e9I7kfFr370G7S6G1apdsi4RGlHCJJkK6Wok8eg+KU3CpJeHB5VfswSIw+Ak55lFcf6DQrP/n/4DS57w69TFQ6SFvGelBkhWlFrR6zhD372hfz403bmfZ0c+M/098eV3J7p/9bKL6szP7vj50nk8h71Ozv1PE4dN5yZeqke9/t+pt8djRLl32eu/E8dgai0SH/uB2w95xweevB+vhd2Ua2/KI+NI5v8ES5a13Dw0Aq7djju3neAKzcf4pIdS7TbMxxc7HDwRMN02zK7eSN37T9OzUb27DvGsdhjkDqcaBQrjxxHty0RTeGDcPgzi2x5MBRclxfxrjp4dETUGTGkEyc4MH+C9Zu3YLstotMYbWSESyCE3M5PAZ3ceFwQtaj3GQy6NNJ49xmvZjQqY9aMNgIk1gKojVoE1ETdVIloFYmoxYROGY0OnqBB+YZGJTjxEOsuqpnubWNzq82+3QfYXV2Mm5bzsYWT1v5x1EECAAAgAElEQVRILCwljHVCW8wA56CkcJNzyh3vlAg6knxNUh1iZzNaLfLI/tvptXtYrzQMhsRUQ1rC2fW4aMHIIuiVtDdiSpisXRxSRMeAMgLqMVoThjUY0HUlCNsUJBFoGlZUzXeOzbPlvB1Y0+aSp+3k61++naV1z2LCWbTS8rNay4KThD7mnFDPCiWvbbQanSt8nUY+2NmaVgdBb0aPNQZbanzt0UpnWeAkAj0mSbsfMtAPmqV5lucXULVU0d1NGyhMi5gXsdQ04iDoA9F4AolhPcT4hLHCaS5MIEWDdpouBStLx+mYhnZ/gW3uONfsqlhZiBAbOiYxrfoUk9McU3Ps3L6N+XnL+x/owPQWJqxhOKyx2jCsGtEpjw0H0w66k44Wj7Dvxo+x3HkKVz7nLYR0Mgc9ZwQ81lKwGsrXLH7jYDea8Z9hEVAnB6AzLzhr985JWIEzLVKyrzTmfMNqpXTywqxPCcqrBjrj4+ROBRkjMHZATClT9XIAUzCilxHX3KtstzxOSFI+F4ErrlbUjxH8T0pwciv7l/7D6/jHn/kww2qFojWN1UauOEXqpuK3/vx6fu3Vz+av/u4m2r0ZaTfWFck5DJIoTM0UQvVRIsakTo0woyByiovfGAew5p5un11Hf7CEa7dRHrQV4xODwhaGhZV5GZcoAFEJVKPEaU1FuvYUtHL0J9o4BVZJF64JAZ00w+hxSgB7KQo4rkgFP/aU81Z3ECXwjxPKJIJUSpn8O3r13irD1lbg9c/YwefurukPV/ABUpD3ZuAb1ifLX/+/b+OaCybXfDkxJ4J5bJld1E6lYp5xW2Nd/aj/xynB/wy/I8c4c7fstFHbqcnFYyQi/9bgL1t2AdWjZ3c09orj5GB0DCkKAgZY3HsLYeUQfnOXHRdcwkdv3kTR1nS7PVK9zHO3zXPJ9BxfrM7i4UXHPaHH3MEu967ULC1F5ocwTB6zfJxXPCtxzjSo5hGuebLmaD3kjocXKHvTLC82bNw4y5d2P8yDh/ssp8Bkq0Nw7bEZFiEQTSmAXpVEwIcM+vNwfN9+LJHp8y+g0hVOSScwBQmgKC2yTzqJ4Y/WspSZETUVjE0oL8Z4ykgnJgIkEVOzVijCKskM3ppAUpqsDoyxWfwJTWiGlLaNSQWbhkfZNLmD+eMHSSrwoFvHHC2KqhHND2NRwcu+42hspIhKHHZJ4psT0+q6nFLMWgQBY9vUOrBwaB+6dDT1EiSH1UkAcSFA0d7CiMaT8lOsEAGNiATciFT5OmlBTOoEdT2uMIIWQR+vHUqLG1FvJfKxuzy/+5yn8NC9N9ChzZMNfHfvffTOvYioGspSZvkEQ0hZfS7l1ok2EDM/31p8VUn2o1aR/9aIo6A1UnXoZLCW7GRoaVIQHIMpRb861CgM/eV5lh85gg6SGIQYGdYV3XXraU/0sMaxtHAcyNiEdkmnbOH7AwbDFWyrYGk5MjU9y3YX2Hjim0y4mhc9dRuLSxXH59p8/vsPsnfbhdy+F9z6s3hg7zzRKNZv3MgjS56Z+QliaYltTRk9dQj5XgvKswmR0pT0dpzDPz34EK+6tMvS/r2U1U2QfhSj2pz67mutRczpcSwW40V1TSW/NvifFnCR6vDUtr7sWP/QRerU2ed4HymLapzhHJN8cHJ1lDTqDC1WcgXJmjEDICyL3M4+bctBU+WZ/2gBH40gQgxoJXapP2w7PcExnDWRmGqO0qgZqv4KoWwBOrfyhtjONF988BCpdOLlEMmug56kFSa1ePkTziaJaPY4aTrpfp8aLB7ju4j1CiElSqDTbbPcNFLpBEW0llnd4xPfOcDrr9423p+sASprdqymeKPv5P65BdorGjeh0UYLVzmALQ3T3rM0UsPTDusrLtyg2Dq5er9E12RVi/9UJcEz3ds//rk387l79vH2d3+Iqa072f9In8VqhZ5W3POl36CVRs9OFqlCFmBYTXJTyknto40BTq22H+sZT/rM06LHM0I4EzjvTMd+HNvj7lCtAerKfV+rZ3H6749+1iiNr+e4/Za/YedlT8NOdDj44AIPlBP0lKI2BZWb4O/mruDjJ5T4dCiF3dbiaNXnSAqYaQgUxGoI6xMf2QMF6zix7zDreosUgyUmJwwv3dimWnyIl161gYu7SywulXz5nsDXdt/L8sROuu02tjNF0ommqklJdPzJ9HJnLFGFXB1rjuy5n3U7N1NPdDDJYMjPdIDSiqKfLkqRq7ei0Bp8oGg5QhIUkVMyirbakQyYaCVHylV50gpdGmHdNA2Q0M7m709hnKNUimHqs7j3MK86O3Lv7d9mdnaW1Otww4EOnV4X1yrxIax2svO+DVIA6IiooYIooI5KGWOlkFYZV5UCujF01p9FmD9BvXyI6DpY0ykIJzytcoJB/xAds4OhKkE3BF+LKI9WkgUlQ1QG6xRDnygthGooWseuRGmNLsusKpbRkqaNVo4Hj21jevIsis4Ud93+EG962lO5+++/zeL6bWycLUnRy2xWK0LtcZkqpLWmDg0mQVG2qJqALQwoLXM+pTGuEBU8lCAkcz83BUMyYuNqkiy2MXp8EymsGKG4AKbdZjC/RBETzlpUsgyOzDE8NkdrsoOvRR8eLSj74fIK9XCIcQVlf5EnbnJcMXMbm9lP5/xNLLQu55N3zbP70Cy+u57BOU/lwLBFZ5tB6UTrwkAKgb4xTPfEdMYpTds5oh9Sh1oWJ4yY4zSeWkVMk7ir80SeefQWiNDtem783K/wtJf9bn4xR+jdOH6hJR5KFZyXwlwcqzXrVBoviifX7vmz/PuCtD594T95hTgV7Hf6SOHUP2NOOtHq5IPnSk9anlLRn3oslVaD9Gh/J40noiSya8GFKY2oieH0a1BSlY9EcEb7kYRjzTU+7vnrqHJTfPZD/4Xr/q+P4XObejjsIzbSibYteNMvfpzCtogKmhjR+bqtckTdsOms7hjHsfZ8z3hMtcoaOdP3VBQFpgm0y5IYanQT8S5QKEeohuhWw6ZNE/l+5n0oZFyzpkOilLRBtYIf/51P0+pNgQanoE4RayOVSgxREBVF9KQCrC94///xgjyiGPHQU2aHRNSadrRgAgSkpVEnX4+OvOyS7Rz+/G+flpCmFOT5SWEVDAljIORo3DA2sVn7FT/OwKzy3+Oaqv9Mrf8zbv/G4P7Dt9UE6oxJwCjZXdPmX/25k7tbq6OBdPJ9RfPAd/+UpPoszc3Tq4f89cFZ2rpFu3TCbbeW1EqUKQAWhafqzyO4LvGfMDriCmhCQJmIMj0mz2mzOLfM8uAwre5W9vxAEwbncODjj/DS51xKWriNt79E8cZnn8sXb4v80037OeYVvVaZ/T5yl08rVLIMa1GwDSphtMI6w8qxeTZv2EyKmkZFUjMQ626V0ElhdCLZjAEoDJkyhlZGfFes4F8sCm8MXtU4LHXwtLRFpUjlI2iDLSw6SjxLBEyUEZjWFn+8ZnLvd7n2R7bTX26hneWYWc/h9ka6Vt43OwL1gbhLYkg6ibCVls6aR4nOSRQxPu2DvIQhiYRxkjF7dWIfBsPkhh3sP7iMXVlcwrWm0GEAugXJEmxA+wwuIJCUiO0EhfA+E1iTCCmgWi10ylraMaJy10QQ9IbGe5yGzswmfvtb9/HidsPGzZvQg728+3ln8a7bdtMpd1EUotNttSFZRcy/bwBrC5QS4w5rBezQNJ7CWsicex+RByh6CCbPaOJYv128UgIaQ1SJkPWeQ7KopGgZjU9eBFuCACVCUAxXKjGBUQmTDH7YxxuLWpnnWTuWeNOzNnF4zw8YrnsiN+3p8M2HWxxaMGzYdhFTOyYwwTNVtMBX2CgqUSqL7STEyjVGj2s7Bk1N6QwaR2yGaOuoGy+I9pjERtS0+cpCyas3TXLswFEmuhUH93yDsy569mnv+akzztxVPUOBMh4GSIs55Tk4eSEct5RPPcCjg51Gi8dj4gNyp4ccZKS1vGbuyWhBPr3SHwH+8mmf1mJVSsYA0lFQAgY8ZShypvNKURKp0cWehrb+V85eVxdTw7kbusyvHKZ0k9R+FdyqtaZJtfC5G3l2NavYiRg9jTbMdGaQhCIgnNTT74l89mifrz4TDkUVlhkOO1nSW9TyUmkpy5LGRyaTHWMGznTPRgFEK42PiaPDRDVYpjczQUSLEE6Ani74+Veey4f+6WaOYzjwyDGu/823ctXWjgwU1OoYRxK2nPDJzomsZaFwSjDK+IxcycboTzrfSENam9bmMYNWiqgy1mD886c8z2f4zk+d7cdT/j26LyMBFnkWH281/v9nG53j2u//URD8Yx+M0bz/ZHzByc/zqToPcj3LS3uJgwOUrS4H9j5Ea3YHtx3bwmTbMwwOo7zImDsrfhPNUMDbKQPYUsBZIz4CMavz6UgM8rme7uH8CscP3o1tlazf+UTuaxre89H7mOoPeUdrki2zlhft6vPa63bywb8+wpcfgInNZ433b2xBoEEHLfvN7qUpRGzwHLjlB2x95tNpx0R0iroZklLEFY6krBiOGaHfee+pgqewCpUaVAXKOlK7wGlN0yDqgkpJHHElOjXYpGlikA52Zgs0xmGAuvAs3/Ud/vMzt9Ca6bH7tjtZt36Sv9s/ycRsG6yV2f6Y4SQBPWo17tBqY2kCjIy7R6qVghOVcUQ0GuMVzjR0Oj2WjhwGH2m1WljlNUTHsDlKb91WgjE4NEFHFAXKgRlJn6YoUo1e5vAJUTbU2siLpA2pFk/xBMSkKGwJcYg1FV9+ZILXXXM5++/8AmdfcAFnz7R57v0Pc1vcxfbCoJAgbIxBKU3wDdoYmhgoipK6rrFWdNuds8TK5+ouKzMlhTEFjQo4q8EHjFNEDCl5QXZmBGdSGlOJQUVTOMyGacxKTTUYkqJHNaKBEGLuDaVAyqjt8tit/NbbL2JjdZxDR/4XaW8eb9l11Xd+93DOufe+sapezaoqlebJRpIHhGRbNnHADHZjHCANNtD9CQkBmtC0CZ0OiZs0YzqdQAjpJECYCQSMGRywMcaDPMgabGxZ81hVUg2q+U33nnP23it/rH3uve/VK8kO5/ORXr37zj3j3nut9Vu/9Vsn+bMji9z710Pq/lUcunKOmw/1oY1ZIz9BvUZZePAgdauiP4Kq9BUWEuoNExgNg6YqvKVOAW881irvIoy0BOXZ9gb2vupuisf+lDgU7v2zf83br7sbY1qMKXTtNGkM0xuji+yk7O5yiYEuEurg8O5jAyYr5uX8MzJVzjS1AG6VFrisE2A00jYwXphNhuPGxzKTxdl05Kec5zZbRUz57x2qYM0UydDKOP+70XmJ43sfS+by0qmMl9suYXWryDRvuu1qPnXfMVxZklwPE1uanK4oXImxURss5Qg7xkCvrFi7cJ4f+IabdGzmDnZbPs/LbeNSvZQdLyjKyKBfsZPII6uBXVVFGwONTQwKx0MnVrn10BwdEdRsGjddrXgSyxfOrDG8MMTMzGOjUJSGVgyklvXhCt/9upt49aED/Nv3fph3/oO7uPvKOcjiUCpZrRG+ojYZlrYysWUZyky5cZKkzU7A5Hqmn4fJaSIxE8GnlMVTJ2msDlWY6Fh0PJGJ7HGeE1OI0yUUjLz/BEbvkI2pd2UShuJlHYJLzzFt4CefTfgEZoNB7yK+yX6yaR5uKL3YeO7LOLPGCG2sKVzJhcf+mGJpL/vn5rkqrPGLHxHasiIhxBSQ9aANw0xFbFutymojxqpQW1WUNE3AGn1nTYw4YzDeUhQO4xNp904W5+foFyU05xkR2X5gN8OTlp/9ozUOLlr2LKzxbXfv4auufJFveN2r+X9+9wyp1ydUDnKpqXFKmguNtvC1GIYkcHDu8UfZdfV12tUxgSsKXQpMwpc9DRLbgDGJsiwIIbdBNj6XkI/AFjhniMlgowZ40TTKWak8jCKlhyYJ3gpNCFB60iPP8K7rC5b6NZ/4s/dzy6tfy3OjRR4b7GHRVIy7kjqX0QP0XqyuaQ4hpZy6tX7cltp7D504FaKlg86TQh9b7CLY07hALsUs4OLpZ9m150pCM4Q4Q3ARl2V9U65bdWhLXgP6S9ZXt9KViOWSMe/y7NHyskTAuBKRhmpugX9370m+aVDw4pkzXL3nMN9+2PL5z9zD+TvewHxGWiDn7kWNVmEciMUWSuSTFBHRFrjSCEXptVTNGWJMlJUn1q0qikuumbQWkwJCFmNwQjk/RzMUSoRzzz2NTaJlHkA0iWhyN0JXUAfw65E37XiCH/u+uznyxEP89oMNHzo+S+pfSblnOweWFnE20oQRZVEgodbuY1Yb5hAThSTaIKQY8d5rkx1voB1Rh0BhHY0I3mWRiqxWR+Ehthignl3iZ377Ht6+4wSnl89yaMdeHnn4D7nllm/aOJHHE7pLAVzO8G8126cjIJlA8EmhYDGTxXKrbRItbH3O8d878Z88YKcNTVfSd+mXLwPPbkIBlMTUnScjALmGfePxFPEwuaXueFH9EiHZrRbMzZ8JliSR3/qR7+TQt/0k7XCdsmcmksRAE2pFrFMnaqNGKoYRDJe1IuWlyrQ2Q9QvQVYTIl954w0cX6m5ecccTz5zCmOgqipSG1gfJh48dpx33bFfHUhkk4FVowIamLztx36eYnAFBiGKYS1XyaTSw3oi0HDLFQN+6R9NxmjXDEidCLDGb0jLqMpZ/jfdXN6YQgIyJyHquJzmmOQyxhQ7H1afKVGdYkTRizQmHoY8SjreSNyYdsoGfuIUTIz8RmdgM2TeOcVOp9Km3PqWxNhNHBQj6ZLvvNR83gzvd2mczakB3c/SzZOttmleQOF6nHjuUzzz1L3s3LWL+flFPn98yMeba5kvE8E5YtuQsnJs2zaqnxJqXKkCUNZaQgdX59bJBghRa/5HIyWbe6PaFL7o0ZaWoo0wWsenZUgjnj8TeXF9idcu38hrvnoHX/iLj/Mjb97Lf/z4YxxvrsaXfc2Xu5K2rccBarAaZBTesfb8CxxbXmb/jTfROkPbNpSl9sRQMNDm/Hog1YnKWFoRTKHdIMeyu8mCzYFvbImjjlvXqvCXsRirdspIw/D0Ca5de4ZbXz1DVe7g1lfdycLSdn7uowXzs9tIOf3gyG2CUf2acRlpEg2eRKv1Ukpa9ZBpQR2Cpp0rtfGWpSY1Z3ReVVDN7sGLNyztvIaV5SPYwW6s0xPZBFG0DMJGNSI2D0hjDRGngZhB29HmpiJjo5NvlmzEvbdIE3k07ecb5s6y5Nc5+ejHKBau5p9/3UH+2V99Hv+K26l6Du9QqVAEl4TCeGKe0B3ClULSHJO12kM7qOEoTIGEhsIpASMki4vaoEhzQlZZwk1UmKhMrDx9mllTsd6uEYzgfKX1z9ZmLYOWdjnw6isbvufNr+T+ez7AR45v4/3PH6Tp7WTfrt0sbqtIqcYQMOJo21blPUW01Sdo2ZkRrFGv1Fpo26D3gGTblLCi0A9YTIpEWlxrcYXXfLCznBwcpndowLXhKEeefoYzf/ZH3HDLW/EdW7d7D0wGw+TTl3YENPqRSyOcvCgazMaFUV84nR79l8NGHkO/KMPV4saXqUb7UiM2ZuPnhXZiJGxepPNPA0kmud8OCRgjo6mrtdYoUMiLZIc2/I22jRGbTmbPTA9GzQoDP09saqwfaEQatH43xYAxxRgVCRKhKBjQG9/jl+HG5dXgUmfNmpLzF17kxCnhoyvrvO6qgzxw9AJVclgSs/2Sp06eHOffu3vYemtYXXHMDwp6vQrQ5i2GhA8lw3SWGAOFLUlGIOUxlCMZRCF8VYg0yqsWvWbJjpzBbLiWaSg+5TvcTCzVR6hs7TRGFxRO7VCNqTwTYDtOd0Zg1EnoJKuFziDbTrdyw7V0hxobfsLG9MFYPW9z9N+luKYdh+wYX2YqaY+DyR/VwdkI+V/KiVCnYWNqcEIo7T5WgbdpQuB0BQA89tn3s7h9F0t79rF+6mF+7d5FysGQyKzahKxGF+sGU/Xo1OJSSvqqpVWyp7MUrqCO2tXUOaeNyACTAnVMlL6gbtZ1PraCdQXs2M1MuEBYPo0ZrvDvf/8jvOZh+JZX7kKk4Z9+1x381H9+iFPsxRcVbUraJwRDkqgNgJIoedyXjM6e4eQTT7H7pmtIIWYyXUeeE+3hYT3JGlprcUFIzQjf6xFSoig8krTJWEqKFnur41aM6gk458A42tTg2hHhwYd4+9f0aNp1Hnrw07zqrjfwqQef4UT/dWy3jmRKWhqqrEXQiWY57zUosA5rHW1bY8cIp6YLrHQ1C0kFu1Axo8YYRtGw59DtLK88x/LZY3gx9sfbFN+TiPS376HW0Jsk5Bau0BKz560DMiHaCCcCJiHekQJYUeGbIAljLJI70zlBG0yXgvF9/suLh3n3DQ/jRhVy4QgLbeDwaMTRE0vsvfoqXdSLIhOSGkYmUBYVKWgzFZ+065d3DrGGmBJF6QltxDntY59yjajLErkY0bKkuqU10KscoyZw8pFHSI1C61L2sCmqLbN9UtGnblcYpAv85F2Bu199kAceeIBf/2KPz7QHWDSWa2/YgxIM1kESJnm8MVp7mTTKUSUrS2yTIhC5RtObEpME51SD2pbaorYyiXqkYinee6ihTYpo2MJTOgjbD/LRJ5/mzqU19h44yODYaZ767Ae44fa30rHLx3lfOubzpQvAVpvpVr3pzzaI/whTq6Z6t1+izb9c7fWG9MNl9gcwJk65OJN9VZGsO0a3GNuxo6B55I06/YoKqf2xTh2EbpH7mxOypsiQBpha9F9/wwKffDxou2vX6nVb7epokyVZ9XLFgI16v//X974ta7hPwf8vU3Gx4VpyP4ZuXLQ0fN1X38HP/c6HsZXn3X/nLt7xM++n11O9hO3zPS6cXpu6l2lHons2+rONnmpuHhNqJdhWFV50fiENO5jFmj6RwDgdPzaaBnCISSoGlnJ+06Q8xFR0yAgK/28Bu1/ypqZFqzJS5WyHhOW/5ZSMaovkPiFojwZjNfLvDLyVjLx0EL9JG0Ye2EllRE4B6Jy4dAxtBf1PPutSBpfe4yXzK5P4uu8K7SZnb+KAavQ/QSsuPf/mOSZcSgTUY3z2Y38Ia8/xyBMvMjx/nhNuGy8uXs+MT5ksF7GNOnXJGyWyZkKrhIiTRHROS9psSXSCCZPUhUn6zkIDpEhoVMEvxJbCGpoQsNbR27lI3NZn5fkT2HbIpx8veeLpwHu+exFOP8p/+D/u5Hv+zQOcSjNYU6mcu3O6SrQBVzjEWcR7Zmf6iDQqG194RawzuTWFiCu0s6AJtUq/lw5DoRUHtITYw3qIo1o7XBYlbdvqOVKgFUtoW1xPWA4wfPIRvv1WWJqNNNFx222vYuXiMv9t+SC97RXiDBIbisxT6Z6N9cqzU+GzgigJV/hMgVJk01nLmFtl0RL9GDG5YG/nrkWef/YhJLSYYgk/Wmve02tXqco9rJx+ip7cyLDLnaIkOuUTmPFa43P7zWS6NpkTkZckCesstFEndKuiBN0C20/CsXIf733iOO96ww1cfPxx1i8e54ff+Ap++qOPcaKcYfe+3fRcnqTdTQQVDrGFx2G0XaRzpGaknlqUySSP4AshxcxEja3m0KNqF1QinHjkUfUAG4sUlhRarPOYfg+JDTFBI8JgJfLL3+E5//wjnLwY+K2n9vOI7GdxIBy48RBl3RBTixhD4QsiQhuU5W+SUeWpCCk1FN7StjGLQWQ9AjHIKOKdylySDMFHVasylti04DXnKQlSaHEGiJH7hjt57cJOmrMPsOOKeU587r1cd+vX5fbFUxHtFCx6ifHfVF+sC9wmY2y2iPinF4wJ7LPBIL0kAfAy20s5J3oPk4heIySLEuk6mLhjp3e16tkb7gwP0BkVrf/Oi2M2/F3t/8tvly60G+9Dc4HjALPL/dLyB//qn7D/Te8mVgN8nZAiI0RiCQg+GIyDNqripiXx5tsPqv7GJQ/sS3RUZCNyYCTy+pv38lNra9jFWZbPnadODTOpYmFxltCooFf3jF5KCfmhU2cpfEUridKotgYGTEzE9bPc95/+Ad40iGT9AkmIiUzfjclegckkxtQl4wQlH7MVLL7xOsZjzZlxxN9pFmgFi5KaJ9Uh0EX90cTcmCynukQyYbfTf+i6PKYM6XZn9ViZRge6a/sS5sHUmHip9zh25jegCV2KIm2YwxNuxN8UwerO0927Nhwy7UNceettvPaNJU8db/jIw0vMlbNE11IVHhMVOm9dMdblkNgi1pGMIY5GkFACLNri3ZMb2ehEUSJnrvCxpTq8NkFMMkaM2jTCYOgf2I+cX2X99EmOI/zor4z40W97JStfvIef+Y6v4H/9tUcxg71jaN45rRoL9QiipTczgNJTGih8n5hGJJOQoLLVvsw9ZoJWgjnnMkqAdgeMJYhG38Y4UjBEN6leqZuALTxVGrGyFknPHuNtS3DHNQY3M8+5xz/P4Rtu4t9/eMjK0i1KKJQWh9UGT2K1uVBMJAy+8EholZdgBe1YqWkKRRAjxlq816Bn7DAYdRTOHz9K0zTs3H2QZ55exg/68z8+PPf0e/zcTnrbDhC6KN/ImIkvTY1pIyazhachZFtkhn5HDMt/tcYTbUCrHk0mKxjwBbPtMp821zD62Gl+9FvfzPG//hjbFjw/8ZZ5fvrez/PkizvZd9P1+JkBvqwwMeFsMYaJ2yD0vCeKHYs+hKA5HawqA6ZWjQK53WIBWOMYhcCx55/FGe3iFONIu7AZS+E8I6lwxmD7BpZrfvDVZ+mHNUa7voJ//icXeSTspFcGrr3+WlKzRkpg0EERKoWxJAY8luiEIAYXW+JwiBRllo1UDy3GRGmN5qeS5okKhKZOlKVXYgpCyhUZ6nQl2phwDvze6/jlB77A37t5wPKJFyij4/Ev/hE3vOLt3duZguWnjWt+f2Pp3Am5TkwXNSnPQlONbSYudX7AGOzcYsXYgrH/ZWyX5k0nv+t/aEMbEZwYvU6T4crbCycAACAASURBVE2TIE1KgMiL8Lh+fYPBzhCfhbHQzUsY/ktTG2nTz26/rhSzS210hsqOo85ZGyjn11lf6yNplSQlVdVXgq1AkghRcEa5IsNhy01X71JdjE2Esv9RpMJTcseOghv2HsTMlcwMCnbPFUTABW2KSlmirHDHRCrp0vN9+JPPYGdKpA44C9ZEQhtpY2Rvb8AAoWlBJd2T5uG7W+jSPVY25PzNVPWB22zoZeO/NzsnSvbTOdaNDUPnlShiOG5qhSIsVr3HPG6yD0DSOWDNGPnMIuxT503jSoCuwd6Ga30pB1jsmLuw1bZhzG16z5OqiIwE0JX2seW4ENpLz7N57GzxvQnKYHnmCx9k1rYMTMO5F8/whw9XHOUgsz2DpaCuAyVCsgViG0U6HSSLdtwjYZzq+vuUGI2Gyg+IkaIqaa3BhESUhC81hStWMBSac29abNPSNiOcdUQrOAn4XTs4sGMvLz72RVZqw3t+/Yv88Lfdzq37LL/y/V/N//JvP4lfXMSZQp29JBQzM6RGjaW1Xsv+bKAqBgQEUiC2DcF7fFGo4xEioV7FBIubK6ijVvLYAMa3SKFBc1sHyhQZRiWvx5g46zxy7Bm+vjrCN9w4x30PPIRhlbtf//X8zkPLPLLzDhZMQ0wl3vlchdwF2OrUOSPZ+YiKkuWAVrkvCbEF5FRZGyJlkTs9ZnwLI/QXdrN87mnqISwdPIC3vcTc9qs4d+4xFqt5HNs1J2OViS91S0haSxhFbzbZBueKHGUlYszlgV2tbRKijcSg9e3JBCUSWiUM+mqAHwU+3zvAz//Vcd5SXuD40We48tpr+cevED5y3PIbD97H7lfcxeI2T68sqEOrpLkYtIFJFKyrsZXX6L30yij1BRJLQmp1ubeOsihp1oakpmb5yEl8gtYZrFG4p40RV1iSt8wsbMOMVoijxLvuMtx+lScMB/zA7wrD+Rtw1By8+hCkGm88gaA9CmIk1VGdniSYXoGLQaMo0OZFbcB7jUhEHIXXBd5UhrSSoAwM24itCqLpaRTYrGNxYxJT0zRUxmG8Skw2+7+Cp1csr7nKc/LxJ3jyL/+Ea2/4any5/RK40UzVto/LrS5ZdDoY3IFV1CEHRN0eG39+GQZoq+h+I5N7OoTqiFxdxJ+/mwNvayyyFR4MuTHRVJtW2IBwTHbdmBu/nHzr5a5dL3Mzoerlt2CE7/u738jP/ecHCSL4qA2lqnJAiDWpTZm4pTDyMG5Mm3xZjWA2y83mLRrtAHnrgSUeXTvNqROnmF8oWFt1NG2kKYRh2kInYWrrnslHTpzEjiLWl4BVh9UZSIHbX3UzhFY5rONa/K2g8YkWBXQIzuXfx3ifqTz5BmSgG55Rx73KCMukIiSX4KreQB4bqMJoMtkwy+R9agpJMgLlNkX7k+erj3iqc2dHurwEtbBgQk7LbP0etx5znRriZk3+yxlzPQ/IhvvZuA9brgXTW12f5+LRT7J6/gSj4SJn0wKfD9dTlDPUuYRVK108qakhJa119w5Zr3GF6rmIBCXlRXXAjQNntcxOhXIiLsKorXFWlWCtEZx3SN2QjHLUQsjVUraibSNlD7ZffYCjTz2F7c3yi797lPetvY9/9oPfwY+89QD/5oNnMKWh7JdIod+v+iV101DEGr+4QCwHpFDn/gAlqQ5UIqTQkqJREnoUyhQJw4SrKsQ4lYpfXcdVFXUKFIUnDhPSJprQQuwxevZR/qeDq9yxt8fDTz7Fa+96E669wM9+psfReB2z21EVQxxdjKXdMruqq4yXOastjLOAUUDw1uNNVs/IkL9zTtMV1uCNIyaBUGHL3fjBafxgnmFb4kfL67TLp1nYto91n5WDyhJS0vaKaKMNlVBN4B2pVfZhcolkLD4La1jnSBIy6cMgaPmBRCX9aAwLjXXYvqOywn3LOyh6r+E7v3aOWRnx9Oc/y9+943quXrrAv/zkX9B+xavYd8UhbNkjpZaiKJEQcn6p03JXA5mi5pMKb7GVR0yReyU77EyP5ISYRrhqgBlFXFViigKaDA1VfYZ1TWUTbv153rjtHKPTif/vcztJ87sols+x+9Zb6JmWGC1BtHTFIkRnNX+VFHZp1rS5RNeYoTFQhEBaC6SZAWXpiW2DsRBqi6uEUCtT1dWG2FNZehcLJZeIdnkqbNaVFoe0DZWHz6zt4KvKll2HRmxv4aF7/wu3vv77JjB0NqBdm9TJhJ8UdnUL7pg5PyYMGVK0WGMva0wu2S6jejYdtUz2zX+e+rdCo92flQA2jriSjCMn2yWTmfzQboAdHJY0sszH6XK1EyZ3ylQu+5LG/6W2zSp1X0rKw2H48Xd+Pb/wS39Ka3YQsBBbhs0Iay2Fr4gh0MYRxjtmnM6lTeDbpYv2y+gybNzXcV4qfv+x47zu+oM0ZUk4u0zyC5RVn5gSwzAF0W+KtC1d5BG5/6mj2PUebkboeRUECyFojwEZIUWRGf8vc0mic7U738tt3VidbCpfqw5SLg20mQg4RfATMVP41ZQDiFJcdfE16siPo3AdP+PUkTGbHI+UUzR+Mu/Gxr9LGyiMO3ZcsJroMN3Vt5d3BsxkzI4lrLcgd+rOW3BDNhv/br+X2kwCHMY4Lpx6nIVZw5W33M1K3fL/f+wCpiyx9QWk6pOSUFjHaFRTFC73n1DinykcbWxxiEraJgOlh9ASMViXKzHaFhsjKUHlNNgzMWFdJAwjtqmVlV+UuEyYTEBRWoIJmPk5lg5eyfnnnuaCFBy49u8wOHiAwyeO8MZbSj76xTVsaXAEClvgjKV0lrLqUw9HzBIpnSW0EQqLtUlLWddHijKvRlzP07QBVlslPMqQ1oApPTH1iKkhrDZECxJq1k+coHfhKP/kZmGpB6culBw58gKveNVt/Myn+xyb3c9MUYAptWuficRMqC+M034BJpe9WqstibFYD8l4CmcgQRRNnYUQsBgaWkrXU7JqEpzxeAwvPvcJBtUBzp96klQewlvn3zO/bTery8/gsRibSEmFSHxZaD/kmMBoCU7CaBOEHBZ2kLeWPEiuuYyY6PCuUIg8R5MJq2SyzNyOIdKvetx/cSfXfv5FvvJQi6XP6qjlpn2z/NhbZviFex7kzPoqu258JZIjOpOFgix6PklG2cOxwDkhJpsZnNqwqCgttvXYmTlmdi6xdnGNwmoU3TSR3uwcSVrMYJbFQli7KPzPX7XA6OIRHjyzwBeeTNjeeWZ37WB+YUAVa0ajBnAQ1bA5DCFm/WiTqU05n2y8o/WOejTCGY+bt0o48yoxWTiNxm1RaDVDIThJ0CStGEAQ62hGLd5bemVPuz2JRVLNqt/O+x8/wetnL0Ixw9kjD7D66nPM9Hfkhe9ykbfZGgkQVZoyGdLskIMvN58/WUTyYbks2jnZdyxSMkkBKPRvxjnCvDNpmvQkeaHtSH9d1DyGLzqGtWxJWnxZg7OVGhwbEYAJ4eolhIEMGLQW/Yfe+U38v7/zCUzZJ7Yjde5CwNhCUSOj4+Pnf/Q7dSJP8R/+ppszgVlpOLRU4lPigUeeJfULSNpUS8RQSaCrJZ5wKjbdjwiVGUBlMdai7UF0z6YVvu/NNzPhSrxcamh6n0l6akxe7M455axthP8zBJ6vs0sZTSJmmx3bTcexk/el6IEK1mAt0klDb0KqpEt3GpOlx3Nz1iSomqRF8uyji+KMHV9b7lGupXCGnDKaOKLTiMGl/Is0GXcmXUIa1AudzFlBJnPry0gbdSJLw9EZzjxzD+tnz+JnCs6sDXjRHESqHs4YRiFASgSr9x+aFoIQneCtwtBYDQR9fg5tTCAGIxFrLM548ImYFLkLqcWEiDGKnEoIeFHFQI1SjerAFE5F6tC0z8LePYgRVk+d46EXLnJ+reC661/D39/f8sVnPsCynYeihJweKmfm8Es7cKnB1A3iDN4aYtaikKBt7VNShdAoZU4zC2l9qDK8TlEv2qE2kQuaAhueeJzDF47wXXfupmlOEXvbOHr/F7nzzjv5lY+e4cX+G5jxHrHaXMhlQSTtvZXtq7HKMUNRW01VZKTTa3l8cgmPH3fmRVRvQIWxlEycUkAo2HHl9SyfusC2PVdy7qzgS0k/fvbYE+/xMw47GFAbq9BKFzEWDus8iQRJ85LSvQPXqREVOVeRMAaiGIyT3IhAcNYhROUUoP2XxTqMt0QBt1jwm6fm+KvHn+Yf/q1XcPaFB2jrIUUz4BffeRfvveckH7jvo9htu9l+xQGqokfh1IMkCd5lo2sV4kuhxfcKYitYbzVn5DwmQtGrcMvrKptoDGXPMejPUMcAtqVdWWdp5TRfObvCatzGB15YYrA0wMaGA4f3UYaG4TBiC0tbNxiJtG2bOy9F2lGLr7RkK0jXZEKwVQHMISbgjEbx3hYU3pNSIInQmx0QjSeGdWhaJDQYY3FlQWq0RlZSYjQaUfV7+rtYEoH7m/28YclTH7ufQc/x2Y/8O+588z/EltsYY0q5LHNqik8+yrmiScvXvI2N6hR68KVumxwLXZu/NORgunSPZC41qlNSptIZ/1y2NR0Vjp2HlDDjYGvCBdhsXC67QG74bGvi31ba9Rt3yOeViAHe/a7X8ZO//Zf4Gqp+T+HEPI5sSqSYWIuR7/7aa3IEnet57abr+x/gASSxlKbkvT/wzfzUnz/EJ08e4/W3Xcuf3/u8kuV8QfBhij+x6fv5k089fgqXHLYk53ctiMql0hO+8solQmxyTn6jEzAu43MqsW2m0jIyhQJNjH0H1QNM+jJ0xE9sZvaP388krTBOz2wY/1kgS2RyLOOzLlTKBjzle415HDo0L5b3jyYT2rprB5LRxyAR1dbM/JoUMVQIga68zoydHNNd0djRUjKrQsLToj7qaOa0E0VGYib3cMm2VfR/yT7ZOZiSCTYIIdZ8/pO/Q3/lCGdPjgjFUd577EbM/CxzMTDE4AtLUyfCqIWc57fe4qzidykqMmOddpY1We45IljnVflShNhELZaxCQlKeNZ3p+t79Aap23Htu2rgW9ocGBSCtl3fs48Lz5+kaAPf/7P38Avfe4A9VxzgR97xOn7ktx9ndnuJ9R4Q3EANujMFw4sXYWagRpQGscrriFVJO1xX29rUkCLJOm01H0ZYM0O7vo4zhtZZ0nrkNRc/wHffuZe1ixa/GPjCoy2LS4Eb3/AGfumzA07teAWVbVWCxHo6hTKJ6L1J1MoBX+KyEqHSJyySuw9K0MoZZ9TWOO/wdNUrut5FMerMOi2Hb1dWWbt4gZRKrF/Er9fr79m2Zz8XVs8ykD792GNoazqv36bO4VLvPkadZLaj9xlD29VCRpWtlRQonCcmcERS0n1VJMgQU5s9Py33SdZQlouc2vFKfu9zJ7lr+0EW+2sUq0cwZ4/yptfcxgPPGujtoKi8Li4IRaGEEmfy/4xlVAszlSXGBue0+ULlHW2TwEA5O0uxMiKM1qHyVL5P8p6+KTFFyZn1Vb75FTWrYcj7Pi+cGvZxJtAaT/Ql68MaA5rvjxFnhBhU9lN1CYSma0+Zp3LP9DAxah7UlJgmYEvNdzVJ8IXDdm0msRQCfrZHu05eOA2+9HnCq6xlOxqRnMcaj3WGQX8Hf/XYUd5+20FefPpZVo48zOfu/TVec/c/1lHVKQPCRCUvLzomR9fqnCtCQ44cDIyJf50yn/66iZW8Kcd5WRGf6TVnQ852Y6Q3QSamoqZNIj5dBKSkrHwt1inLPBP7ughW0eLuhI7N7X2nr7mDdC/rsHQ6+5J107O3vrGRSt51Q6nWxq3fK/nL//i/843f+68ZjSxFL0sh53y4c46qsrSAy4bLWpsNlqY5vizYf/q6cDy3POTeo8c4X9csX0x8w+0Hee/Hn2ZuZhvOeNpilpVhw+LAjw3+hmNI4hfufYhkW1JVUQSb1dG0AubOpb0YUq5K6XgNMf8+ZdBTp1TXPbN8T5JJesaQwXnGEtBjaWN9tuq+JoWXsyFW5CxmLmiup+4cyXG1QTd2Op5AfmfjkkmtTDDG6NAzQY+fx6FOHRmnI8d19bkF87jawGSiaUfWQ7k2yXT3q+fuUB6N/LteHpNn3xF6J//Oi/3U59PblyRBfNlx43n64b+AZoX+0jw3XLHE54+WHOlfjY3rDMUhxhBiUrU/59CWsIYokGKisOizserbeu9I0hAbFcoRI4SYezVYfYehze/cdoqJQgpa8uYcpECObC2+LECSpl0jVEYrzq+45Xqeu/9e+juv4QvpZubPHmWPLLOvv8aFdYfplZqavXARU7eUZYGrHLFWxMcWHlNVREnIaIjUtXK3jFfVPzRaRzzJQK/oETCklVUk1cyeOs9nP/IoV9/+Js6cXuaOO17Jpx9Z4/dObaM4cK1W0uVGVNaXWtAhaUw4FaOdZcXp8/PeZm0Yxh1xjdNgApQDYCSRjBps5xzOeES0Qi3lwWp7Syzs6GFsACq8d31WLxyjX3iEEeus4ijpxBtMN5FS5jDnsjoRo7WEueuQQgyC9ZrtTwnENIhoSz5fqPKTwoQOl/KxXWbrOoMvBzwsh3nyXGDhqT/he149x5HT5/jlY0PYvhtrEykqARE071EYq9B5dkKiaUlxTdfkpHm12hR4q46DEZidnWFYOB2rrqCpI2UB9YXzvGZwgWtmVnn2+ZM8fP46qBJx1DAYzNCsr1EVJW2WJDYhouiXyhc3zWgcLaegN2i9oiNSt0ipSmfJCCYIwRR4k5Bocb7EiiPGRFH1CUEoikqDiSQY4/WV5NyaE4txRvkZCXy/4ItyLbcce5B+M+SKnTu5ePwpLpx6nG27r1cBDGUS6nMfw/tdtDKVvzaTcruOfd+REHVV2TrivNSQb21gt9w2l6l1DOwciUl2WibHyhH/+Jq6v2j0KJKdGaNOU7c6diI/eu9pDI6Mjzu+j8tcpkl08fAEmp26tg31027TfpsIYcBd1+3gN3767/PtP/5ftfNfDIizeAcLg1ne8eabKCCzoZWw1skbX/Yyt8wBb/rMRB4/dYorD1/Bfb/5KPNzJWfOjWhsgUkN621NCEIoLo8uGGO496P34xcOU0RHKxExjiiJJkR+5Z9+LeQY2nR5c+OZpHc6waUudaJPRbv05QoWYFyzD9ml7qJfRddIU8NABDHt+Pqm0w8ijKNxjI6EmPkBXbwvJk3milXWOEaQqI3KJvoEusWuRFAym990bjMYiYg4JayKMuV13CYVWTNapsjYIbF0Euv6eW7HbDJXgLTBGZhOz1z+JW1KXV0O3Zraz5icwqkvcvyLf8iV+w8zd8UBHnvoMX7/zNX42RIbLCYptynWGZ1sgl6vGIzzFEWPkFqiCA5tNZxCQxSDlCXSRtV2sQVF4Qn1iJhU4C0Oa5WUbxMpCd4aQl0rUTCrOaampSVhnVeDbSDmtHC1OM9g/5WUzvLLv/5BDnxjyWxZ8q2v2cOvfq5VyV9QwvrKReok2mRu1w58vyLWDRICxgg2Jpy3pFbLtVNRYFMiZM4ORaIWwfV6DPrbWV5b5/4b3s7th58hcJrHP/4YXzzj+IvmTqqDV2CbGtMboIJYAhFiVJJ7F4iNO2KiqVhrIcQWY5yi8MZmRV47JrXGpH1zUmyRlAgmO1LGY4nUvsGnwFqzQpKa1s3iJSXKoqKpj+PXZ6jcFUTrSRJIRnCiFzMN3olxStxIlpACJSqoguR+3qiXJFhMUWIkkiRqnqeDuqxos5Ak2KKHMUKMNT623LF/nVfv3UvfnOe3vtBSve5KSgNDUf1jb7O3Iypu0TYRY4UgDT3vCVJBivTE0BohhEjqSmRiYhRahY+SMvZ7/ZLQNIxGDa+6tqUoHE+f28W6G9CjQLZXzO7dDSHQiAoQtW2DpEQMikYk0WZFElolcyDaiEigiS02JLwRnC9oQZWiSEQDPWsIIsTCYp1RxqbPjYNSwkjEpMzuLDyeIkecOmhT0MZP/f4O/vjijbz7kOfkiSdZD5GnP/mr3PbNP4Wqy2k3KrvFgjHNtO/yppPP4TKmJo+HbLBzxLIRBdi4AKVu8TZubIjFXLooTSKfjWZOOuTCmClrnb9hNfICrcslS1QLOY1gBWOmVu8pktZL3ZsefQI/C1klbmygcgQprTpYm+71kmOOnRFVhXzbHdfwqz/6Dr7nX/wn8DP0ZmcxNNzzmz/A3plcVogbR+GKymikO3aENjy8l0cCYjL87auuwNiEmCF1XfDGK7dT1jUyW1BUPYJtubBWs7RYYpmo8HVbSyK2Or+jKXRNiEpyrHyBX4MwW+e85OQdarSvxnnq7WVGv4w1+tWUxhzdq1nc8FIkd4oENdRJUcDusyRRVdLII9tIbkhjc+oro0sm5fmUnbYs6zcu58znG1cqpEkfDIdBRFGBZKxqCUiHDOjiHCSolorJnIp8/nEVFap+p0iWHjdlZz3/RsYd2NyPobuuL2u7HJl3Kq1mJHLfh/4lVkZU22c5f/QpPrl8I/QO4ampSThfaCM4Edom6DPOHUhTG4FWW1obrf6KEkmjBmlHVIs7wTWY1SHB1KRQIlF7u8QUwGr7dWmjQtwGxFliFgrCJaxYUoi5N4ZgrcMX5Xgsze/ZS/viGc4vCw+dv4K33bpOtTxibqmkHpXU9ZDCW3wSktUSu/r8BezMHsDgm5okLRKVvOgKS1sHrItEEYq2RQyElDD9Hu36iKbn6A0q2v48v3RqP+9e+hO++htfx8kXTuM5zQfX99Lre5XPzyJ5IYQp9r7BuzITtjXtam3mzqWkDonRapMUwVpPJGor7yKPb5ymmVBBPk1PJ5J1NO0q6xfOUs3N05/dhk+09OaXYAR2dklrHXPDHJsHVsyNGqwx41KeGNVj7fkCqTUvYsuSKIGiMDRJuyhZEiFq1NRFgDYp8SNZ1eZObaNd/fwMN5lHeePsKub8WZabPi9cdzPb0whjS0rradtaJ57owzCu0JxSm0jdwyxKQt3o8XP0jDesnTrJ+rCmKCptYRwTIQWKoqAZDUn1Ra6YMRw/foR7XtxFbdbxfc/BA9exbhO+MISQCKnFiuZdfKm5vNDqItI2DQaV/00x0QxH2F6JyXkcaVvc7AxtDJigCmTPH3sG5yzlYJYowty2BcrZBepQ44uKaEucTZjcP0BiUtnHGFkdNWyfnaMd1ZRlwdriQR6sa97yVft47MH7iOeO8MH3/p+85R0/rQueGIXSJ7OeiWLaxkVlg976tKQumwVp80Ke9alhAqMnyWIseXHrpHY746zraRcRbrGQdYY+X1Nn4w1suI+uigGrDOwUUvaiJ+GhyXBt1xdA8sI/Dt6zYZ/OP4+jLuMmNevjBVQ5B6pfzzhKS3TtTzfez8Znmg2WA4h8y93X8bX/7SeY6c9w7MwqZ1ZW2TXTy0fIneVsh8d1jshlGiJttW1yCpwVsDqe14fnSMVutlXQ+pYmgDeCBMuf3nOcH3rrNeSirXF+2mI4Eg1xZp6+91rLXRRaxuQNo+GI2fkCHxuiWNJYGGccRkwcTcnOo0VT7cTJO++cK8DYdmJck0fQfgNaOhXzVyb8DnUFQkYfMlEUnw+cZaRtTgR0katYMH4S5XekP1B58Gizw9r1DSCXyopG/PlZa7Mhrc+3xMxTkKx3YNG+7urgOg35MlGwO/G04JBVUjCd87TpnW5Gdy5ThfOSm9jx2IwJnrj/fezuJ2TuWk4cP81oZi8fawoW7BCkR2EDbdQIXpwliVVlPdFSOYcq59WjFUKKpJUhkYDHU6+co11ZxlWVvlvjMKHBE2mXz5OGDXbnNsApKx/BFj6X/jli0PfuCo8JSfk9yWKtiquV1uGtY+fOHZy4sMzOnbv5jQ99gVcuLlH1YO9wjseCY6Zf0bYt0VgKk0WvhkNCVvQLSUXbvHdjkqPzhjQcqcJtikhZYqJ2+6NXEVIktg3WJnxR8V+P7ebb1p4ihZI7tz/DZ58/z9nddzKQhLhK7yNLVXvrMjctz9Fc7mhdRKLNirKTzVldO5WwmnCSwxST8M5l7R2VKDZYimShaZjfcQVt29C2K3hv+qxffJ7S1MSV0zi2K2M/wx5GDKltx/PBGUGcw1pFBxJgCoONhU69rIhkrcHE7MVkpidAlKCdoUQIokzYyjokGtbWT7PPPMPo2EV27t/BMytXsGPHK4hRSG2NMUGb5OS8uyu0FbC3luA04o5tPp/VToUhNij1wFEY8NZhy5JKVMLUWostK4ZElmYT+66+Euoj7N4+T6/uM5pdxA16DEZD1qWLNnSlsl3DpBB0YNQhQ3fQNvmZWVS4gYLm7FkuXjjH3BUHCMurtOcv4hfnKQsHxrJ2YZlev+TCybOIO8vc4gxz23aQUsT7Ht4a6hCpvEogI0mrD0LAGEuv16OQwAdPlWxbvo/BhSE7bjiMvXCRleUXWJg/iDFdC95EF11PAwKTkqcu6ukidg9TUOxW2wYRn67UyeScdU45kBdjMSaTpQxbSaBujnO6yCxlT98QsyOQ86RW1Eyk4wjbsH5W23l2jFkrY8dB6GrBN6YVps/ZmTlIWRtGDcs4kDUpL9i50VBe/A1dnnlCmtxY0aDPUMVp0Fp0q+9jod8HEoeWZrhy2yDnhIM6NXRdDTc/mK2rE7baNmIpk2vbvX03YvusrdZU0oDzrIQhxhh+7/7H+EdvvWb8RKa3z9z7BKlN1EGJ1YiAM4QmkKLwqcfPc+fVA1ySS9jsG0idpiPubWWkMppiwCUBq+V143sxmxyi/J0OQVAlRb02fV0TbkvXA2LcfCrnr5FJgyrlHGiZsT6CiFZfT12h1RRTx8lIImg5YEC7XWpFQDQWK1nlbsqZ6nguxkwT/aaRqdxMRroUgGVc278hfzVF5Ot+/xK3Tu1Pvxe5eOpBLj7711Q7tjMYDPjUuQP0q30MpKWVlpB3jTESIxjraaPBtHU2li0pBFbW11kfriEtpPWLeOtUia+tSU3NoCiITYu3jjqMVPEuJfzJc/hehczP4PpaIgdoz5kspR5yymM95gAAIABJREFUeXnhPbYsaGJLaTzivKI0EmjCiPntPS6u7eHsRcPKc0/zqqvu4tGnNRBJOZdurVaxxSbgYsIWKsPrvRphMRZHQUB1/pPRarhGBFv1EVciIWHTCOo1pL+DtRh5qjnM3K4zPPTR+7DXXcvX7/L8yvmz9HcfxhiVjNa0sA49Zy0hJZwxWmKfjb4i6opq6bLVNc4ip9LUke2aME07iR3ynbBE56j6cwx68zz77Al8045ITUAGHjOYJZiIE50IXcmM9U4HbNQTSsyDzBYggWRdJq/oBGtTpEgO0QxNFtzRKWaiJTkDMWXSiCWIEJzjru0r3L19ls89+BhDW/LhOMPMYoWUQt0qwVDz6+r9FaYAo15fbDUP70tLqmuiFYyt6BU9UoggLXXb6r0WAVN4nB9QFoYkhp5xVMOaJz75lxATy8sjZvbuo+nPIqklWkfpVUIyxUhEtDoyRJzzhLbWOmBnGA0bPBBCxJWe4fkLrNYBWV/DVQX1hfOkWMP8LHWyLF9coW8D++YCc4UlrMONBxY4dvoEp188Rbswy2gwgy9nmO8tIKHGeE/Rq4iN9tMOEknNkKL0zO26hveddLxj/l7OHHuOPQev4eN/8h7e+s5f5dLaaTYuIuMFIe9nsk56yrA6ZosceV68xyztSc015KDGdhBuR4ozmZgnm46DHstqxNQ5JCIqZm3HjOZswEWQsTERkL4u2JDlp7sos9s3R/JTqYOxEc4pkolB6By+3N89ezEmPwCTyVyYqbg2ZcewQ0XEYMRnXsIUP6B7JjJpVyw50rfGkKxsiO4lk3u6v28J+k6XeW1Rfmm4xGRQFo6r9m/jfDSMypKFwTzeGgrjcEXBsIn57U4ia1DH8I+fPMXAzWT9DyE0jUYfCa7eOcsd1y/goiAmdBj/Vlc9htanfKYxWiIS6SQoEla7j45TKJNNMz8Z6pQSa/T5K0ik7VF1DGiUnfLYYUrpLpmEEYXlkwErMTvwU/K6ZhKh2emqBuMQ03ETuvN4EBX7EUFTelbAxPG1SweLpqCkwexk2Jzy6QiBY+SMLqjq3vGmZzoW9olMt7m+ZIx02wYyrDpWR498kl1Lc+zcdivzB2/iQw8c4TP1TgZlzVpUAp6Nwii1NCEoxJwcKdXKVmfA2upZdphlvuuGyLFza9ywc0C9ss7N1xzkQ59+krvuuJ6TF+Fn//gZzoaIK2Hf/F7q0Tr4glC3yMpF1tYvMrOwCGSCqfdYcVjvtH0wEEJLIZ5+bwCFU1Y9gnHC/msOs/bCcRYGJduvGHDrK29nPczwW09exM8O2HnTq7j4whHCiROYNjG7tA+7fQdp9WJ2VDK/IQpN5fCUUI8ocESnksGm8FBa4miIb1pkZYRtzkKvoO6X/IeHZvj+t/89PvH+93HLq/dw+/ozPG6vppKWaIyWehtdX0VEJe+tphasQTlvjiyHr5iSs1nCejw2VbvF+6zBYMBaR0qRlHTNcOKIoSYML2DWV+lVBb6amQW7RH3+KQbl3FRJVBchpLH+cVfjrwQdHeNOHK20SkaT3PjHSK7SURWiRCQmJawJgZg83itxTxmVBrt2hrdcfZSqbHjFK6/no8+uEQ9fRVElRmJxpSM2YJzH2ZSdEp2cLglilIBYNy2+8pg64mxLEItx6i3tPHCQEy8cR1Ki9BXWq9fnSQx6s9yy/Up66XHmtg2Iw5azL15k922HMQZcWdIM1fhbDMlqjwMTc7/oJBRYWlHHph0OCecvMopaLdA0DWWvRxsSTSMQ4Kres/ztQ/Cm187z+OMXwLQcvnoXLxxd5qrDMxx59jQH9nvMvOPE+ci/+v3PMLzuFpr53SxYJSEWRcFIAkVZEAWIDdYWsOswn2ks7zp0jqfv+3P27j7EmbNPsmPHtWrQuwUzLyC68IyXJf1dLMaWWqGSc6bdYgQbI7oxTCtdiiAvil0OdkP0mgmm01HghkUqG3XdiYy/YrpyqikrNk1cJFnEbgM8ktoxCgHkqFEwjNSRkWp8/xuyH1PGdWwwuwU4V8QowGHpRIcml60ktyRpTPwal2yNr0VFtJT8GnOkOnHKNnAvTPf97OVryDsx4i8X4ckEsZgYnJwCyfcuwHe//jZ+5zPHuf/hs5xeGbFkSlzRJ8WWPVWpTPZNpxIRvvDIw4RqDp8CzheaSmsiLYbvevPNNAl6TgiJS97z2IhLxweYOF+TeyUb8klXupQ5Hl0lhsFnh84BhmSh652ej0Cnbqm/dl30Oj5Bp3ZoMsKgFQWWrnw0G2wx43ezwfBPIxcyUegzpmtPbHAU6tzZXBZoBJO6NIW+z2gsRlxOVyjJa9JjIDuTU/oVY/nfzQZ+bNAnia3xWq4PnM1jbfxOSNSrpzn28V9lz5U7mS0r/vpzj/KnL96An4lI0yPZQBQhGaGtGxBLiIHaGML5FQ71Ww7JY3z7V82xvnqa548f4W1X3cATzz3G4f0LHNhX8S1vvJbjJ49xsLD8xNc4FhaWqG3Fv/jDFzjpKxbsDN4GWhwuCeH0Bby30O9jFuYxpTqcDoijhtJ7UtvSAlY8lIx7p9jCcWHY4Biyd75P4eDMyXV8McdgcZ61ixcYzC4gezM3rKowNirD3lqc7xNHDQw8pS9Vp6MoSGWF1CNKL4TRKjb16CMkAmlxGyYNEVsw6Pd4urmZz3zoT+n7RJQed+9d4alzZ0mz8/m5a/pCc/VK+BMxVC5XCXQpTQFjlYCopD/tu2OwmvvPa5Nzk/XVZeTUSSLGEVU5y/LKeSoKjJ3DG7TOsNx3OyNptHbQQNERcWLmx2bYxTiwxiq7PTSQoHRaCpEywcWJktuSgWQiPnUwmcFZzdmHEPEIEhJYy+sWlpn3nqcefZA7vumHeejsI/jZGeoYcc4qZGyzApxVwxKJJGMpS48XQ0zawdBiaW0gBs3x4UDaxCiNWNqzm1PPHSe4Ib7Xx0p2bEZD/K4ZenGB4epxbrn+Zo7Yg6ys1CwsVISojNBkHYQmwyoQUyRKxMZEsirc0Ehi7ejzkIS2KHG2pCwTa0HYN9/yt654grd95X7cSGjLAZ944El68zdw4nzN049uY3lNOC2RK/Yc4MOfOsItr9zDttk+//c3bWfv/sQf3HuUe87vJsz36SdP2e/lQWFpE3gTKb3jSNjFxx/5BHd9xR2srK9w+tHfZuGOH8TZRazdGEWOjcuGD9X4WKfeXhYH3BhzdGppU+lLjVZy5ILq7Wea0wY4XH9O5YK7NdVM4PHp84jNsGyaQKtdpN1V42nklLIh9xgzkWU1YsF2zk+WYDXthrI61VQ30DHMpxjiZpwZyZHpptauE2ckpxvEoS1Buxa0hcLHYrRVdH5uen8TRybm9NJmedwNEPkWxr/LF5ONRzIbDe+4QgXGLzEZyzU7BxxbPUMwfZYqofSGtTbSLxwvtiuITUx6KINgqIOwVG3j3NoQZ3sIlpAjDyGwb26WX/+Dv+R/+9Y3Y3KKJ2WFvO5aVEBHF78OicFMqJPaaz1N9YzPDlQmERqLzr3MT1DzqnB9RAl53TohYiiw4/RPyjLHgiWKjhELGIkZIcj9A5JWMU3edxdxadoimZSvMyMEnUMgBQZ1QhOCcSkjqgWdR21EEQXE4oxymiQ7QJIMYjp6YJeS2IjATGshXDIetiCGampOGOtqbCC2JoSGpz77++zZuUi1bZGnTo74tZN7WevNU7aB1tYUydLERGoTVeGoQ81oFW5duMgPfftuBqN7Wb1Qcd8Df8227XPc9prX8vTR5zhrd/PUcyM+e/4Ijz7Xsn3vgCsHA4r6GPMzltSO+MHXwXo1xx997ARPNKpiZ42hNkKKgTJpeZ6EOO6UGgdCNCpbT0xEtATdOoMtlelfzMxyxXzFc4+dIrQncDd/Df1tBQMpWM8OUuzP0kfr+60vILS0bSQ1NUXhaa3XJm4xEMRQ9HvKNVs+qw3zfEN0BeIqfL8irLV4Sbi2prdtHl71Tu7qrXHPB/+AvYci/Rcj56qvY8ZWJBPAlxSFIzb12NmMUREoYsiVAcoVsIasoVBiJRGIJEl4cTifUdqM1FsHqQ1EEyAM6M0tEu1uhiuPs31uGz6mRH3xDK5w/52zN4/17bru+z5r733O+Q13eve+kW9+nElRFDVPsRTZlpy4cuzYcdDWSeU2Qdu0QBWgTeAUhWIELgLYCBDUrhu0NTzHTgxPkSIPlGRboiyKg0lRHB6nR76BfPO9746/3zl779U/1j6/e8nKQN0LECAu+e67vzOsvdZ3fQeaeoC6A0YgiBm84EIxH6Hsy9VexJw6cheR4Pd0xpCd4KOaNE2cFeYghUkpZRLKJdrQ4XKmE+W9g9d54+IF7v7AD/HU08/RHbifAbbrjljYkA92s7puSvA13geLTEyZUHmzLhYrMj6Y25NLtj5oXECDo67rkjE9JaNUwwFtO8XhSfWYhaWTDJtT3PX4K/zFpSXmT4zwlSd0HROU3EWcE3ynFuIDJtMLgnZKGji2n78A3pEqj8+C99tEmeNv3Kf8dx9e5dbmPv78Gy/zbPV+2H8HFxaHjMZDZAiDUY0T4Y0us3b+Cozu5ttnX+PUPsdoa4O7t2/xzkNTPjEHv3lhjkduwv7qNkQdddVYelU0vfWoGfH5ax/g/ZPX2dq6xPSlc5w799N86u/9czJhxmS3iX8vEmBfbzec+Y6uZG9rJPb+v9/pz/2l3v+GuZYSutd+tdQzoawEYpn2fSFRAZrLRG0Hv8MO4NnfX3azzplCxSpeZ0WRyjgJWkyQXLGT7Q/Tvb/zHgRDynT3VjRDmPnAF8Z5r3Do9cxCQKWjz7jvd81adOmIR+hhPDt4Rd6OoOy9Jrv/vpvtbgf77D7sdbqbHWJ2z6fbU955ZJ5Bc4iF+Zr/+vvew688eplxFZnGKZ2MzbPuLZMjrCfl3K3EIFbkPn3PWTJZ2o58/MGjfOrBo8RuB3Uy41z0KX1GkttFOJBYkBjF9U+BYjvSUnfKhS2xwDZQuD2fWdWmpGziafteMaORDFnKeiX397bngljRzPSOfrZ/VY2oV6t5IqTUGXObwnci707pxkws8HOJFlbLJ4G4x2BrF7K1JjUCoTz+RuiaTfvSH/6+8APyW55D2/y+tQm1S7S7IujfIlWdKWHe0uNT6re2XHjqD0lrr7Dv5O288vQf8vmND7I9XKGSCeICO5OpGatNWpKfsr1WI+kaP/89y8RbT/Hw717l0P4xd9y2yO0nT/E7N5b5D2fvZ03ehe6vqcOIFHeo392wmRKXpGJdpwzOXeW+0TW+5/BFVN7gpz9zhn/6iy/yzM4iA7U6FEn4dopOt2nGc6j3dBnqZmRSzPK8BO9JOSK+JsbEaNywb2WZsPYKd9x3kCe/eoVvP3qDwdIR2v1jXLJ3vXYObWPxsGhJCuIr3NARsUCopGZqJ9OE3lolDSpQKT4zCV8Xn/7JlqlmhhXaJcJkh1//8hvc/fEF7v7YX2fzjSf5wbvm+fUtRbMj1Ht8MLwNJv07b3ZMQqAQaaVXnNkQkgtfwG5vxmVDmFRzQTxrQrDncxomIAeZbj1DM17h0sVzhEFT/eR63PpcFIfbf9i66GiGBDFngji8r3FA1Ij2EY/RiHYuF6at7NnNesoEaAxHcQ4phbGfbPoi2uLYP3mdMw8s89KTl3hz7RoPP/Ic+T13US3YYx4cFhtZ20uRSOWFTYg4gi/WqWHXDVAko8lDk2lyBSXZcHva0rnIwNe0MdFu7+BFCHMVN7enPPr4U4jf5IMfe4jf255nuLJEN5mYDATKqkNodQqqBLHikVIm1BVXXzmHpg6aIbX3IC06Osin39Hy909f5U8fbflCvIv6nv+MabtDE2Fcm+NW5cxbAc0MhgMWFuaRfQ78YV6PmWl1nXNvnuf775jn3OWz/IMP3MmHnu/40hU4F0fMzc0xYEzVDJh2HSKZhaN38MdvbvGxlcuMb69ZTms8+h9/hvf+zZ+gYo/Gf3ZIW8l4iwKgLyJvRxu/80r3O37/7W570qOrQtGq5llR07KvnzUAvi+0VflDagcGRWoqRviyQ7c2otgeklRPGpsZ/cyKb6/fLiQvUXtxxQ470ZJTv7dZyUJyFpFtz/wueUpEbQ1BUUwULkIs19UpJBeNp1XelyBKSyp7v1CsswtyNWsQZPfQoKwayhtgiEzfhJR3cI9MbdcX38309T3aYkloZlldt9f5N392kR976G52tqfsWxiws7nBfh+pCUTVPY2E+V8EIlMcVZFneXLJs8hcu7nNieXavN/J5eD3M35EfyfQbKRileICpzYVZ0hERMyafFf+Zo6jtl6yJwZc0ePLDEJNWCOXi94fb89ALDt5K2OC045+B+T79Up/eDrBa2kOnSvNhJL2kGgThvD4nvhKv5ooiJEGbF2RgVDuoyESllMiJHXmk0+PCMXSqOWyDpHSlPbtsR3w2n/mv8y9sr/K+rZD39kBIUiR7iqP/8mvce3cn7LIhMnhxKuLH+KlndOQlJTNdbV2js02I3TcWp3yX9yrfPL2ZW5ceB7xHd/3/Z/g1/7wGX5z+26qlcO42w5SD8esdDtsbU9I3ZaBI9N1zDitxlUd3aFlnpADvLB2ktOrf8Zfu/YSP/Vf3sXPf+Fl/vilMVXlqXwDwxo2dtC5OVy2aPgu2hCqZQjsMMMg8Y4mBConbK6t8p+85x6UN/nw976bS1dPMd5eok3buGaIpM6e56qmyVPajZs4qeiagGjA5URWwScLfpNaqdWV1XSgw3hzvhDCXYo48bbqTgkJEZ0b8X9/4Syf+YDnma88wYd/cJHBhW+zvf/9xvbQ8n6qGLBjXaU9Nc6TU7bmICczIEJnz4cKxZJ/l8QpLpQmIZss3RmPb7hvP7deusAydzEYjAmxneCdEqoBTWqR5MkDCg/LGYk670FnC8PQSSg+1kYSy87jxeQtSZx1m30hLMWpXyOAM1iDTPSeM9ObXDt7nquXL3Ln6QfYOvohlhYPWVCOpt1oX+yGe28e/FqkJzElgjPnPU+BcsXjQiZlI1RoNGSg25laNrL3xldIUDWCE4/ECYdvG5GzcLNrCMMxxI7oTNeqGSSa06EUtGMv+Wvr2ipxbd2sgL2jS5HB3AIPHg1898LLPPyNCV+qP0I48X4GeUqNMk1TcggFDlW6DD54UkqE2rwKBt6slEcrh9iaP8BvvHyOT+5f4OYbq6yfv8A//cTH+fF/fwnxJ9GqNmKJcwTvCRJ4or6bk9ee58SBxNXrN5lb2mD7xqssLt9hCY6eXYZ0r3R4G3Q8O1D+kkP/r/RVpHZ9gepL1a5krxgAaSlgOZFlUqYVZ2Qxr+UdMR82J8XQ5S28Botb0XK497v4/ihV9dDrZcv3su7ys3ui2F6uQnaKZ1p+fgNoYaiXj1ZWX70rra1BfGlO1JjcziZSFSkhHmUDMIuptQZ5F5X5zql8u6SwPd+bcS52IWt7L3abul0iYUbrEV94YZPxwphzr13k3h/8Lrr8LKqZ+fl5cjtliym1Vmj/7qrHu4BG8IMiGQZ6iKLCcXBphGpxe+tXPG/7XUWFKBRnM1cUG/0eqaSiYUqXXBAZ0dYmcxr64CD/lp9baoyzv1N6Vr7LhXQqM/RDxBmSRJ5NXGD8k6wdTio0y8yMa6b9LxMWfWM2+3zmvGb3Rt/ymcUZCtBHbFujW4FMUbpZZkqeuSPmGeLzlsCpPe/NjETbPxp7CaD/L9mfIR57G0qTUMLO2kXG7hrN8UMMRg23rnb84ZUlGleRnDLViGompExMO2ykIR85do2PHbnCNx95ldOnj9OuL/ALfzzhtfEn0MMrHHA1o6DEbkLfJ8dpSx0sByDi2Zl2TNsdRo2QpxNk7Dg7/12Muye4e3KFH3j3HF9/ZY2W/XRpAtkzqIzrFGrjfngneG+W8iJCqEJZVZvSLFUNc/MVd+5refPFb3Fk6QwvXr1It1yBmHkQocZpJPde+97jxZPqijRtYVIMf5wQkz0j3le22gpmf+2yoC7gSUgIaG7xqUVrD13LsBG29u1nZf887/mBv03KkcN5jZcFqwcUBF0yIZvrn0pxBewHkMJPSkUO7tjzvmDDtRlbKRXFghlMninWOL/w5K9x+LZ3c+3ik8yt3EcYLR1k50aNdC1JB8RgTNtcyAdOvEEf3qNa8oldIKWMVEJOguSEV9u/BaekPk9As8UVUnaP2T6sR4tsZIKbKn/noaN0VzZ5z8fv4PGzr3N9+H5OzI3ZijsEV9PmCQ4hTVtcVaNdkdthN62WYB4FychVuYRIaBaTAGZHqCrayYSdtU1kUOESllNdeSRCG7cZSkeXO86cOchPPtKhZ5aoc2Zr2uF2OrTyBO9pU8JnTH7YqeUCbEzYvPhmQQQisU0wqBiwxWfuXuPaesUX00cIS8vUcY3tqEgxEKnIBIHhcEhFos2JaRtR52l8RadQNRUpRkaVUJ25nS/e2Mfpc6/wvtOOxx77Cv/yEw/w25cTz97YJo5hPNcQk5Klhcbx76u/zf/cPMzi4iYbN9Z58gv/Cx/9e79I5Uzz3B8auwhNqSkFPpe+wLydDfZX/dpTmFzpJvq/rZ9SjXDXw+79PtW6lCzJ4NEcjF0+Izj1UOju93przH6P2u9ue4SoZ/ODkjWATDH4dg/bml5SI5idawUiZDWDGg+4ZPwE03obOhCd4GhRfD+zIVS4Yopl5j691Ky/Ant3vLvSubcf/q4cQL3bQC6HvBPjKiQHTmVGyPQ9k10LDO4cKWe8wNBl3ntmxOBPHOpr9s8pOyQ8DnLH33jfUUZ4unLIqygpJf7Zr/4pwVVMumTuY1FtGkMYjhxjIp3uWuP2+34t0GUQ87Nwoqgzux8vRvKz6bQUNLy5Xmoq03xNxoqu7fJjOZiF3vJU1HThqTR9zgnkjCtogfQ8Cy0YUeFyFL2LNUxak1QJaqun2WGPNZbG3u+th82UzLlIFkOkpHAw+jtqv2Kyx19M1qdZyWpJm4qAlqyVmcOlmQz1vvxgaas9YvZWlUjfFOTZ1D+zFAZ7lmUXyVLMXIZpy2tP/xbXb7xI2lzljg8+yG+9epjOHaRrO6SpkBShrmg31ohdxz84qdwtL3PreuLud9/LHz16hd/3H+X4qbs500S2NZvrq69IMTPd7khtBzHZmqWLHJ0TbmxNcXWDi5G5JrC1E3G18Ki+g5WnHuW7HxzyL37oCP/k85cgLVB1U4JUxexGcZWHaA2blMaNpITK9vVZHN32FoN2lcXhfrrFRVbu/yDrNy9DUkZDgekOeTBExFP5SKLCzy+hrWU/1JVHK0dCqBPGP2rsLBnUNQktCbXGH1DJSB1wKRCmO2StcI2H0QFuqePGoKK9/BrVcD/f975lfu7FdQiLZrPvKaQ9u9/OmfIhi6F0fW30XkixxYfa0LUSee1CWfOoo1PFlYAhS2ZMRBWO3/dxgi4SmiWuXrlAWFtbZ7ywj9WrLzLc2Y+6JbIEI1lg+wZfDB7Mn7kwTF0y1qqzomBpT9bZ+iKjme0yjLVAb31pWRtK44c03YvozTdYObTEjR3l9ekB5o8dYnu6Dq5By4WIqlTeF6jfoFLNHRIV9RYwVNW+pDIp2ZWDxltHqC7h6go/GhjkIokK2910rsKNl6muP8Lh40MkD1gb3sWBOGHbNwQtBrJJaXPJrRaBnHCN0arm5kdsusS0U6p6ntGo4ebWhH/2n57Ar36VXzp7O9x+mkFIljwIBK80tS+8ikyXE1GENFXqgX1GxBPjBFVPVVXkFNHgWF5e4Hr3Tv746gW++/CYl55/jr/77hV+7mbHjUnHrTgkNBYYNKhq0JrfeP0oP3L0Ou7AiJ1ba5z9s/+d+7/rH5cAqd0p0wrrrhVwPwX//wmdsR/YO765WTGUPTvK/ns9oqs9zA+7f2cPeRbpHAWadW5XKrg7qRedvYuGMr+FT9D/9x4p6H+DzFtCU/rTtxCmMh2SLQ8D9Zjpj0HYQNn/l98f25nb75Bt8sPWErs8x77AKw5zp9vLeeyn6r2/e9+g9aTFHnbOkguaZQQyTy89K+RFikLDOzSbG50rMiJUOdpEjq4s8dXntnAhsD2J7AwnDAbzLIxGM58JxNZ6lav4/NcepRkdxbvCBsd26V2r3HPkEOq1HJSgxa8iz9YRRnCSfvdUroMR4PyMB5LIZvkqRvgzL4Rdz34jtSXo70U2wqZzHulJfn1T4L0xwwtCIlnZdaDMdjj3WIJkMh4Us1NFUefLc2O7eHU90TUZRwFPl1sq50m5HNjSH8QOzaH8Psb0lnJv7N0vC44ZMtH3hHn2PZ01pP1ia8/XzEZ7156rtLX0qt+9TeRMyaOeCy/9Ppdf/SpLB/dz+Pb38JVvJB6bHqPyU+q5wPZ2h3MNeXuL1Sz80NHEKXmUA4eWufn6Gv/uiXM8cfq/4R1L63TDCeoCoTOVVo4KbQu5Q8iE4MwUKCWub3ZU9YCubU1ulxIxJ0L0jAcDvrj+Hu649jjLo5t85lO38St/1KKqTNodqu3K0NcYcIMBJKVqajMKCgGXxbhovmLj0re5/MIFNj9+D7q5zvlvPkKjp3GjOaQoVHzMZFHaBIjB+uo6fNeikyneV0Qti2epkC4RKsspSMGhERoJeMllVe6QgSA0JjoZzOPbCaP5ZZ545mXev7Cfc9/+Kqfe8S4GnCAzZ/fIWaqs5mRDipcZD0CcNcEOR4ytSeiLasUFc0JMWZn5kag3Yrh4eztczUA6ZPs6Lzz/Jxw99QC4TBi5zLU3X2K8cJBUeyRWVHWZIMSBWlKdSqYPvBBsb0qKuKYip2Bdr1PU1SjJ3KCcEBBiF5EgxcjCyC4ud6CBd6Ur7ExWufL0ayycuZtL8weRxdtsJ25Vr+RLQ+UdHZkYDYZzJZmr00ycmlrAe0+uQVtPcJkcI6GqiDHSbm2zefUa9dDS+lzd0FQ1kwg1yj37IzdWt/nSq5E8AK1r6qxMnSMG2/s5MP6D2ERVDWo2NzdlwrILAAAgAElEQVRYPf8600mHbxxpc4ftULF/YY7bh6t8/uJHiHfcwz6X2SYhztYPQZWuPEzeOWLxMqgHNZQXpm1b6srTRZNxVFVFnnb4YAly8fAZ/uha4FPHIMXzfHr/Cr/8xhYyPk7XTanrmnaqSIi8vO9BHl+7wgfmbuL2L7P5xld55fm7uf2eT5ZJ1Ipfb+QDu3Ax7IEf/wqNQD+Z7Ob4lB35nkKmhRGtpWgKZffew6c9KowvDOo8C03pGbOzDPa+idEMUuEklmk5zMhlKrbLpY+vJpH7NLrsS6Heo8mXtkjDbJbv7WZEM53YnlhmCMEUkYDmAbsWs2UV4aRMjD3nsW+IDM50WEKaiJ/BgQj2Z4sEI+vU0iStLyvTsh3OJp205QUqBb3LBrHPIG47gJJYgUjOEzJM1i9zM8NS4wm6SeOH1MMBv/fYG/z3H76bHck0pQGIDhxjajJTb4mWqo64Y1D25378IwVlMcjblVQ8RJDCzlRv9zpnwaWEOinwt/0ZM0CiHLRWB1xBbmKiHMoGoyeRMlYU9z3VYrBSduV7LKKDKFGV3DdK3lAH0bDnubeDvV99JRV8TmQs2ChlQXJndqyAz0YsdS5YfesPY+2Kh0FlzUbORjItKEDvgijqzX9ltrrS2XM/86ksz413WI5A/99cyWBRqxna8wR6VA/dve69za94ksDNi09z9cUvcdc7P8JrL32Vsy81/O76O/DN1LT2UuF0grYtO67mI/OrfGzpVZaPHOeJrz/C73V/i63bV7htPjEaL9MhbO9sEjURxOOkJuVsnBQckjrozBumTYE4jbjgaTtLvsso9cDRUeFvW+YXLtzFT3zsCh9e2ub/ii3BZSRO8GtKShE3GOGbGvUO8Z6gggbB13ZeeKf4G1dZuOsu/uXvfJ2f+Z4Vrq/f4Fg6wdV2QjdcoGqErivZADnZ/Wk3ieqoELRkHDSiJkv0CZUBqXG4W1vUoUYGhXCuGa0C9WBE7iYwGlF1Ce2mMKiZauaxc57v/+j3srH2Ck0zz3jjdTYGx3EDD7klu56LUp6FnMCb+6GlBGa8r8owoGbb6MogUp49y48wfkBSW12FGNnMmXq4zL7lU9x88xXwBwmrmzc/Nxgu2v4kTgnB4bMz20NxGNkmIvjie61GqNGEhgptTfdue9nSZaM4SahCdqYesLqzC/9qSuy0Ez79jn2srBzgxDsPcPbla6SVe2naLZI4OonUVVWaBqFtbfp2uQVn3b5mwWkGX3TAsUAiLpmfdtIZa7gaNEioaCeR2LZkt814cRHvKg7KhOPhKuuxoV5cYTEsEjeu0y4dQFLEVUrqbPejswVvIqeWyfXr6MZWsUpWRuMRm9OWD92/zHR6kT94dkw4fp2bw7FN49hL3IqRLKfTlqaqqVxJ18IY5C4pdUkNDN4jUkiVReMac8RXFXrgDA+/+Do/eG/HA/fX/MOlwL969ha4AWt5jYXRPmqFKih/sPFJBu5Z7hw9w8J4js1Xf4c35w9z9Ni7mRGrpIjfZrunvGfK+P/+ZUOx/dl+t2kTryumKYVAp32+I/0sBBpRbXFubgaR9zJEy9CkNBKGDokYbJ1LspwUqDlJbybbT779eGUEqKymld0rT4uFSyIF6qdIzmwitCnWfI08DpsA+4lSc12mv1ygZCksZp3JvlRdQTnsmvSHvhZPb9QKt6hhyDMzJKcIFUkTQpihXK544jtnMGFGys5agYiWwp9szLCpc2Yg4rjV7uDqln3jFS6sbZHjKjI6gaTIsxdu8dzmFifGAVxDzI6rO1PwlV3PnIjZEduOjEXn3lzfQo6uAOalr3tIS7gS9jPjODhSQQK0UAHEKTkHOxwl2bVyZfovh5zRJpk1f6buiPSkTmO9F6142q07uSSuZc1EdbhkaFNWwQmGnSilaTP0hkIYNfWGrR9LrwzemlFnWteCpJXfC0dOtqo0Q8r+M/XKEGsQtKSKWhNrjH/VvOvhoIr3oNkTNeFd+cxidsSWjWHLVmtad//s7N0pKXP919b1V3nmkZ/n9MllLr3+NMOlM/zy82dICyv4gK10NndQH5jkCQfcKp888ArjEw9x6Zkv8vXxD7Gz7wEOA2mhplWFtrPmZ6pWu2u7l4Ir6yGT4Y6bhqQwaXdwUWm7wmavG6ZtJruOSj3bzRFuvvYMO3GNYX0Y6hG0DocSRiPC4hhxAV9WWtXAo6FmGjN1HfCDgN9/lKMn7+DCGytsDV4mnXuM27bHPH2j48C996DOEVww/5gQyG2Ld56QMqnwAagV6SC44oXqMTv2QSAXv5mmsVRZmgpiohrNWx2f3rJnoh4xCgOaM3eztrbD8PB9ZOk4MbfNc3FKTg5xRuTLjlK/1Lxzyj102XpIccY/6ZFxG3y08BCsccmCuflWAYlGJBw3nltr15lbOoIbOFTHhIX5FbbX36Cd3EAWj5GckiXi1Aho3oGKmPOQOjKtFUQcTsRcwIRSZKKxGH1l0BihpBzVheFoPxP7PxnlSN6+zjMvXsDPjzg3uA85vh83bUlEUEeMkSZUJCfGDJ5ODPZQ24/hApQLl7KWB93kRnVdI1Wgm7Zl3yccPn0bLz11llFdM92csDVNbNxcp1ke0d67wFjX2d4QpO4gzMFku8CuZscoRX9u/vaKasVoYR+rV1cJQ4uQbPYfZGd1k/fddYgXr5ynuusBxtU269oYGCtCFQS8xWPWahNdCBaOlMXhvVlktq1NInXlyVnouoRIYlDXaJLCfoXJ6Q/yfHeB7lt/wYljx3hgYZGnb0TqwX7atiWHmiYH6n3w29sP8r/eO2D6yrcYauLWy7/EoSN3EMKC7VnL2N5r92eTRa8fFnh7yM9bvvbs+aU/uHvolT27VHoAXkF9YSeX0dbVeNfYoeW8TWCqBc7suQhGNg1lhypSpnyxtYyWA64voqJ2vUw+ZwdIRskaZ5OmB3zOe2RbVriNlJXQ7PCiM9kWYgSxXvudC6Nb+n3GjHzYNz+2rtKcibOAol1fAfYU6agl4QtrcnuDENECeRfDj/5qaCp+A86bkxggLtiUDdYo7/lKGcRn/vVvfYX/6qMf5Leff4JWHfcePsbWjTUOHT3OytJ+rq5NuGNhwTJBgjIIDRlHPRpZhns2HoSLkUrh9lOLmOSvv8u7U60WNUHORT9f4CFRBQIkQ9cSlnhpqEkquv5i7gR20NumtFwAGwaSuFl0slrbV5ACLRp/u/bOCzkVYlyKiI+oEa1nlIwehjeLolQaM2ZBPZIVj7mtKRaBbJI9kxBaI10knpKJdCUsSBBvsq9UOACGBNjn6jMCyPIWIhgSkSxlBWSNhl3AHr3oZmjdrFnv1xxqhEc85LzNY3/0C9x18gAaPCt3neRz3zjExtwxGu2YtCWSuArEnY4UO/7hO67TXl/l+ivf4GcfU3jffubzNjEEdJIhNMQczSgtMFOMBOcRb1dxOulohg2hrsmTjmHTMG0TgybgnJISdF1nTdo0MWmnXGwb7ji8jzAY0tVD0vYmw2Fjku5qRA4m45XWxHIxdgyaiqpucN6zeM+DTBkwbnb4+T+c8N++5ziH1gew2TDIEINHc2BcV7TTbUP8qMz7Ik7JziElP8JPJkgb8bXSObs3VePJoUKHAzQE48OFQKo9AY8sCwQPnSlEJi7w2DPf4rvedTvXnvs8J+QOnqejCkO6bAQ+4wG42WRvBHgzP3IlNUqynXEBITmT2YsXy5WAQpwtXgI48EI3SfgGdNqyb99Jnn/6LwjT7S0Gi0usXnuTsHmd5A7hfV2gS9DsZpBv79rly1siIgbdxYj4YhZaSb9SI/s0Qw1ExGKEKeSvlGnyKjevXuHwseO0ozFXLxV5jjf3rJgS4hxtagFHFRwpeWMj54Tzji5a4lcub6zD03UdKkoldXmLbb+6ceU66iFtbLDa2bgxyUpVD9iSCdtXt5hbHjEYRHY2NpmfHxmrVCO+CqTOpkgvu5GZzjkm0026doLzxpTuttfQScvF66+zPNlgIJvk4YDaqKp200QIWWijMq4t6KJVb3nQMduOyxaD1M7Z/jYlm9wqT5eUygW6nKidYzAc88LkOKeba3Qh82MfWCT++U2+NemYDzW+ETrNDDpP9PBrf77FZ+71vPHaDtXmJl//8r/ho5/8LF7NtcyKx55DXqBXCFCmG5OhFZi1X+f2X2Vnj7oZI7tHA3ah1gLxF7jWSNgFgihIUh+EYy9iT8jrD2dXJkNrLrK2Bq1iE57Hz4hwPflL6QokXHahZdq0vIZkjYjILvS6d/dapkLws8PUKbvyOu0n/74C90uO2WlizXJJ+urzvb+TS54Usp7MflTvmLdHQTEzO7ADUjyz6d522VoOVL+X0mByRGxl51D++Y/9TS5vblLLhBdfvsJ0eovVdoFljWyvXeK+lfcTY2RY1WhO/I+/9AWW6orJZGK78SRoNEristvi1FCZpGSyqLJ33xvXI9ihlmTXdrm/TlqcQ6UQGqMmxJkhjO3oXVmPdDPHxV4iqXt+kqrOoFDUsgzFOTQb0pK0rPOyoD4YKRKxxkKNmDlz1dVyL53tzVWNQKlihGeVHjUo/AZVG4xyJDjL+0MxYmXZffV7fTeLdduLrznMoXC3G9l1MmR3HZQzzpkGvrBF+Y5fsybdVlIvPvNlhv4KF167hRtVfO3iIW6NF2lyB2r+LTkl0qRlkjq+a7DDir/J9NAZHv+LF+HO72auHhBFwLvCEfElPC7PDGuSJnIy066MMqwbMolp1+EdFhcct6iGYzoiur5tK8vkiBqJbWTBK9ev3WTiDuBIhGx8jNFwzgazGIlq6zgJFRU1KSt18fd34qnzJguLFW9sP0A92OaeQwuEb05Rp6QuGxdABEJlEr5str/JKz53pEk7awNrX2Sf2WSMtjFScjtFKm+SROxcUHF4PyhhepnKObKPvLG+ymvPvErtPEk2yVs3Sc1+XGhmhFZEi+V+IQqXn5mzJQeqY4YGZ92dG9QJTvv/t5cj24pz7D3N8gmunX2M7YvrrBy+h+CrKd1km32H72VjOqXONaJ+lwQWTHuoWSw0gdJBu8JUzea4ZDaGguVfJNQ7nFhoUC4Pn9IXpw4JnoMIt50+wur1LcJgwLRZZjCNUAViUtQZDJ1jJLiKpJmoGUkOkSniGqrATJ+ZukjbdrhUYCd2CHVjuQNOqEdj5g8d5Moz54nbW8RyEMeYeXNtyqEHj/HKzVXu2n+ML73hiaKkGK1QJwiVN1el1M0MGBzCoduOc/OlV2iwxoWYWLzzHVxCuX/pNQ688iSX8z0oI1yA1ifCFHZ8zWBuxE60KU9qj7QZX5UmJto9yGKSx97TXmMyCMdZc+BQXJPRMM8XLx3nb8nXOBIaPnFU+Mbjq9RSQfAMXGDiEyllnh2+iy+dazhw6ctQR0bpSR754s/y1z71WYOi9p5J/V6xZ0IX/FPBiJ7seQAFK9LSU5LMobG4R5c/108lsRjYFCZ8P1khsykxS4XXWCar3V/KCmJn+myEIAbvasHqnYRZ8yeaUMm7BDzNkB3J9ft7R0bIEigu8Xs+kSkCkop5jxcin8MVJnnxKEcLhWxXKeH2cA96WdjbD8Nc9OB9E6Oz60059EvcqZPCf0iFab4LDVqzFQnJfMLt74+FhGvvMt6Kh+B7Xz4sqAmyJJ56cYOuTdx55igfet99/LsvPMPWrUWmzYgrXWI0cIU46Pj8wy+xMN5P105QZ4FeIkqeTDhwZo4Y1fLT0y6RtF9zUGqA9twLtXhTysHcG9OoqCV2iu0wXU7EPrxHfHkW7XOkXBoBTI6Zg5EAPZBT0fBni0iFvrHKJBfRXGK3C/qiatkHNvzLLuIguWQCJJNAqyNLh6RkiFn/XDIBqUv9xCLHXcTpoDxZRflA3n2XZsW7rJvw5e+1xZg9xQVJKCRBw4kDopGUymoLvrNZV3l38R3nnnsY177K0XvvYevyi6wN9vGn5+8idJ5cV8X51ZFSSys7HHfr/PBDnuuX16kGqzw5eoDR4aN4581sjUSdFUmdrSQiRIqboprTq1TmUe+9Nwl2l3A5EOMUUOL6Gi63uMkG4kZ0YQ4JkeHOZeLkFt3ifYTBIiGvMTh6itHKEkkSMUecQjMwSWjMYl4xzhtx3SmTSSRoZGm8xPrKkHr5ECsjoZLExuom1WgRqacgnlRcIOthjfhAtRXpohCkRuLUEMQqIMEb4bS2eliNx8SY0a4lpITWA7IX6p0tCwpyFa7uZaeZ16+t86lTy6wcupvN1x5nYfVNOnebkVXF5NCStV802fdyNGC0ELRrV9BMsMTE3COYlstDtkE1O0O6nFda3zC9folBvUI3rPC6TWinU9qr17nFJn7xGEkUP5PMmOTH0++BFZHK6kuKhpeKQ7Lgc9+JtwahqMEAudhVppQsglQcLgeknXJ6MGW8cpA2b3B1dYMrLjMODomdFfUQINr+O2tCk+K9kJ2lC8Y2zoxNQjAzl9yqwUkx48LAMgNEGNQNVJ7Na29wa/MGfge0t03Mmc2Jcm1rStNtcNexCi4rQQW0z2POtJ35iIt3BGf/aEpoHThy8jSbN2+Wgi/UoeK5657vvf8gH9n3CK+snmft0CdpRytw+SL31S9xSM5y/upJnu5upz18ykhWdUXbdcScqRrbs3onTDvFS6KuK7Ia1NgnL/ZEm0BieuR2Hn/pOc68/ghLB+/itsrTumxs24EjSKAuutOvpAf4zD1XuP8Oz7WzF6jDC/zJF/41H/v0Z9l1IdNdW9KyyzUn0x5A76OBTeaJKwYnuSS5S08G69nMFH93jyUM5j2Hv8FakzilDhVVgUYBRJQudwRX4oUpOln6PTogAV+Y4IYaKOKyTSaqu9VRbVR2xVLK9ZNpgXVVbKb2e0x+vJhrV3bmPpd6fkP/d9NPZoGeSGlufNZ4iBbuhksk8bay0LJKUW/mNnaUkvq1RZYZl2Evw9sVwo8llFmHbyB0P23ncu2ZkQ7tkHzrlCnZDt8pypU6EPyYqzdX+fip4/zi9BmCBNrNm/zC7z3BZ3/wXuYX9uOcp3YB3dlEgwm809SQKRczT3/7Bi44UjQFRM/279cctvM32TA90Thj8jbnSJIhxyKNAwqC2ErvhgeaHN4ZQ78P0DN+AzjtUA1EMlXuGw5rmiwBWcm5rIakoFNaZMZqqFvfiPUmSv298M6TiaUx04KspCJtNr6INam+OBXmonwI5EIqDYVXZUjYxFZarv89e+OphIDVYidIMhUJpcmZhRMVF0Lrq6xBSY5Su/d8SQQqzr/wZ0wuP0LlWjYuv4xffoiffmYR3wxxwwEhKV22hiLnBBp5x+gK5195gTse+uv86u8+yfSB+3HDity5mTdLkg5ixDkI4xpipGuThdeEnnhoE3bbJQZe2Jps4NobfDI8Q0gdR4+dYloLxHVe32x48tXER+68QX3gDL/7zJDlI/vwgwPkzXVi7vDBeBBN05Awt8hB8HQ5Ujc1se3s/nmHd3Ns0VFPbjBZX+dWJ/hqH5s3LzGuITRjfC6hO86j2qKb20iK1GrkT2mqEl9f1hpIn8dLnkyQekBdPAh8XdEhyGieaQGOql4eOhhw6oEPMDg0ZuP8/8mhap479lc8i5TGcBfBeoscu0+cdOVkzjozkuobfO/62G0bhKxGOcs2SJnoJkha481Xn+LIiXvZbq8RxHmWj55iffsWsarxRHw1KHsnjCFLj8zumrNIFWzfo2qhV2Ic5r5KOcXMc7wiSQ2uLB/CMtvhwFzi1W89xaSbpx4N8SuHSBKtyFTmh92R6ErSYJ/opTmRnaOpQyFKBFI0MmKSSNUEdKelbry9pN40xz5mXvgPX6WuA9PUFdtOKzIDnzm/PuSh0yd57GuP08XvIo7HeCbEqVAFg+VC8MXzvBRb75EM46V9bN/aIEbbBY/9FBkO+PWzp3jXvkXqUcst5tBpRA4d48l8lMXNI/zomTf5O803+LlHL3L+9CdwtJDNtRAoPteCy7ZrTQ6q2plRRbLJtg4V0tnZo9Ly5ughfvjB41y7cZ4fm5vysy9ssbS8D1IkiVA7T+wiQTK/ce0h/tHys9x4c4vYbTI6MOH1809w6sR7dh++MpnvOor1ax3777nsYOlT8EpV8jZnFbmK3fs++rKH+g3+7/erRhB0oWYnWSF0lYPU78FKh5ytMBvRK9hE70uDUYqnOC12rgaPm8Y82lTWB7bMCHahFGCDdbOU1UXf1Hg7LMUVBcIeT/Ysufhzm27cDo0yXfe2wNhhKMkjWYheqbIjY4ZHZdwkF4jffq9UVgT2e9jf5Qo8/lZCVyozovEIeglbaTJKi+P2SMz2fnW5Y+CFH75zhZ/I17g1SXzg3qOMxNN1U3aS8J9//CGOzTUkL4QIng5ybc9gBJ+s+eiS8K1f+cdMJ1vUoaLLlN9/F03ZO/X2xkw9gpA0goTScGqpNQGRjlCKYcyCc53NxllQl0uqr4B4Mp6ciwGR+DKARFQLKbhfMWHE0KwBpbamy0HIHYg1FzYABBT7eVl9MUJrEQmlyWQG+wtm22se/jY0GEIsdHs8NkzbX5qQGRmSt3BupKwteqpsX3tnB74Kgq0npeSs2O/Yc1x2n1EViNuvsXbxEXS6yuLRZW7sHOcXntxHPTxMCg7pIluTKaKOIDU5bXFIM5947wLXz91Gii2vHP84Y1HiTgKvZDzeV5Y7MWkN/4pq4Whi3itdigQc7TSR2y2CODbEM954k39029M8s32Cr1V3kiYHyTeu4/2UlJSF42OuDpd47Irj8mDMXD1gMt0kjGu6riPkUMx/bNrPAlJ5vAoSfPGaUbxrILakLnBmdJHJretMc01cGDHvF6lHc4VTnC06WjN5uk0dPNHVaFWjcUIWMbKm85aWq4kqw45A1UWCa4kakcEIdQ1OWnCBIBkXM5OuI4ijShMuv/Y659nh7jOfYWGxZfqFF3FH70WlLmejFpTJbM9TbPHOkm8lK0mMO5Zya4gzZQUVE/iC1JU1kfMOYrJnpg3k6jRHHjjI9uVXyG1L8Em5tXoB/ADvIfiBReaGCrvFUjoLLbC3twczZ5z3NumlFucKyQpAO3twnWUbm1e+x2JaMxqnpC5Sb91gfuEAmze32Zp4hnPHqTShlUn+cmWHbmoz3ttuV9URnM4SCn2vQNAMEZqmQRXqSkjZpiPvAyEEqrkB9fICO7c2kCDE1BISqPcMtOPc2gYnX73F4rhlcGubeFOIiyMWqkDjha6gDb7b7cRS1yHeMThyhGV13HjtRarxkPH+RerckaoDPKsnQSeGTzqBNAHxbC/dw7/dPsO+81/n0++8wC8/+Wdcvu9DHKhH9KQ1l7PZnIaSKqZFAuSyaVGTmZFIZdC7kNk+usTZyy+zP7Ts1zdYTp7NbojvKqqRw9WV7Yq9suVH/NyfH+affFio8y0uX7zG2Yd/hn0/8r+xuLD/bcVK6U32Zx465TBGe8izLJlzstXFWw45I46qFshcs0VVukKWK82m1550agxh7z3TjE382UBs2zkWN7uyIkHEqLL0u3ahZ73vOrMVbwoiYqGeWPdUimXhBuR+4toDz6diLRv6Ha5Y4+BcsXpV2RObDEF7KLiY3aiYRl07Oufx5bLYxGnXVzQVSLffKdv1ldyz6cv3MROcvjPq2eck2+v3evO+WclabIv6w0YshTOIo+sSc43ywKkDPHvlDd57Yj+TvMPN9Q3mcfxP//bL/MZnP8Uod9zamJKcyWjztEXF29qla+lc4vcffZ6//7FTJC+U6PJyyPWTTSoHla0U++dHy7NBThDEUCbJZBFcdmSJVoTLwd4Hpcz4JFkKKmn3JGVrhqVIl5GE9s1FObSNVGrNoMse9Z2FfSUjCWoR5nlxJDJOW0QrVCt25aapvAyeTDVDO+xjWSgT4mxFhaFEMuMXlJ8hHtWukFbtKzozf5lxqFzZ95IKx6UsrpxxEvqmqve57NctqorTHR7/6q/hphc4dvQ065uX+f2tU1yrFvA+U7vANPZIBuTpNtE5DsbXee1PnmJhcZmvPPEm7siDVou0PPdAjq2ZwzUmvdOUyyFmCEvwhlR2CZpBxTRtU196nc/e9k3OTo/yqLyXagxtp/jxEjG2RCKrSVlb30+rjvl6wjTtMKiDSaVFjWuWsJ14aGiC5TOEprbVs1DQpwzTTFy/yQcHN9l/+BC/+RTMHXJs4GhGI1PMDKCKCU1T2maACPhoQ0MQR1KhCgFxpngJ4oyI6MyAJ7UdfjSPD0M0ALlGNaPtlBQTlavAB7w07AwPc9vSOjdfeZg0v8ndd72Tl7YzlSRwwRIvnQ0RzgUSnUn5CiJZO08sGn+LHw/lXpshUiQTnLeJpq+vCkEjO1vnuPTyt7n/oU9w9Y03CMO5uZ/cWcufawaLuFGADnxd7cJJzpWiZv+eYkLqqrB2ldTrEnMkZyOm9Rc+qVD7QEvE91NkVuqqQaotlkYDpnGLixcuc+SeFcajeVy3hVbWYbmY8FXNpDdjSQ68I7hETBlfVTRVZV0wrmi6hdxOAGFQ15YYlRLBBRwJP/D4TaFOju3cQRgSu0zyic9/M/N9f3eFSy+8yI/e7vjVazBMSkfHMDTUPjDtitd3KTyhGpByB+0284dXGMy/kzdeuMgoOLSrMGv6DlcnYsyF4VkTJBfW+5hLh76Hy5Nn+dF7HueXnhd44Adw1Y6xPL2xisUbCGzbl1QmZSF7h3YFWtVELcIwjPjd8wf52M0/5daW472n7uXh1RYZmNPZtGvBZVIbEfVsrpzkV89O+IETnkPHx8yNr/HkH/wUH/rhn2LgR2jvXCd+D9Vq9yCynWOH0DA7fWdKgAxqiWpGzGvog3iyq8mpo4sGnVauYidNCL4hxYgrxcOgU1+uh03OSSNBmNnq+tIg5B4qUIejK5O8yRD7QJmkZY2gkSwVvX2rFePKeAEzpMBId0nAZzvIElqUEJ1B9gW6xaVdhEIDipYIWGeWy6+3dEQAACAASURBVC6ZWkaDrR2KsiJLf/xjMGNWoqgRzbKA1HiXykFmbGClkIQ1l1VKwqyEa5JkOxTKcZBy7ym/e996RnHMaqYieA65jqwNK4sNKVWMx4tcWm9ZUTg4btAofP+/+A0qAjsacRGidLjkCWSGeO47c4CcTLv8FuY/PazOzJ3OWPgZ50x3n7PHiTP4uaAF/We1G2eTbupJpcWxNONt9eOMOJrUXDrRRJdavG8wiNzkUyhkp7PI5hwTKp25prmEhJI9EG2CT04MQSrkOO8qzOHFYsYlz9IYSBqLp0MokmhhFjZVDm/z38+2ysx2yKjrLY17/ki5XsVOcGbqJJBLfVUoje/s4bUpsSdUKqQ84VsP/x8cOlBRdYd5/tkXeXnu3Tx/8yCj2lnss4APiYFWtJ3SeGWyM+VHHjxCo0qi4pvPNtTHGoRELHbsZiNeW30IHtdmGARy1yKhQvGQOhLKXDMibm/TxciPHnyd9cFJ/uO101Qnluy6p1XLXIkV4pTkhel0gncDQlXRhEyKHTrpqGu7Rt572koITghNcavsg6PUzg5tt4lOuH/yAvec9IwGwupttzOgYVOnJJSQE3maybQQHaEKxhlygvdz5NjgtcNPWtQHO9idrSErEXKoyeMBOl40YmoC50E0IFUDGpHGFE2ZCk4c5dbqRfY1+/HSwsZley9EyrsqZbbS2QrNiRJzZ0ZTscW5YIh34Tk5BzHbwtG53lmyDAd9Q5Y6FkYHccfvYvXaNaq6IWxH+Vw9XiGzhs/7aJsOjwUbONWZoYICEiqCS/bAqiLBUops6ispWjmjzvTPihC1aBELuYcsxG5KUwdG8wPmuwEPvv8hrm21TNpb+JRwUmOad5sKmkFgZxoJ3iCRmKzLrVzv/OWoGk/MmJaTooUuU3rOFiwSsufku+7j7Je+ySROC7HGPguq+Ll5Xnj5Ck2lfPd9Hb/3sKNth0zmYNAEqi5ZLnWoCjk877KLpSKlxGhhgXs+8C4jiHnbj7fdDk4CKQo5T4w8EyqCVLgKxs7xtdWD/MA48H33V3wx79CoiT67nPFBqFxNwIxrVJVQGQPelx2qqlJ5EyimlNCF4+A+yHvfucZavc2XNxds2mtbIx07swIdVIHKRZ7dvI363Ku8X57l4HLDWBIvPfGbPPC+H6ffKqacZ8WmNxrpDzF8VeRJhXPvehtStd1oYddnOtS2dsTY2oTlPTHaNOucp8tKCFaYB1Vdfo65bpEUfKSnvNhk6WfEJ+kledi0P5uMC3TvFFz5d2tn0qzo2iGV6Ap47rDD3kjaUkw1TBWTXTaFVSoNULFmVXUElEgiFXlbEgpvwaa/Xm8eipyvV5T0hjUz9jwUxGRKdMZH2V3FOdSXWFvNxZHTzLayGncgJ8FLWYfQ28lS7o9DUwQNZsPrMnfeeYzV6zfwmvnoySOsSovsTNiiQuMOT124zDOXL7DYHECTyRS9NKQ8pZt2JO9p/BBxVVln9CjG7r9bXHMsSISWz2LGJ+KSfa6yJkxlOs9SkbFr6VRJajtx1RbzgrCj1ZCaQv6LCfHm9a4pouKKN0m519F27DmrcXk0z/wccgkb8q6QcBGSgnPebFi1LdyKtkxXeUbqVFWT+4n5S2hpbsysp39IU//0zqA0+Q4s/rc0DQVC6V38tG+oiloCobx/ZR1k1qu88sTvs3P1OW6sTtn/wL2cHZ/hj66MqEcOcRUxWT2IqVhU58i2Jsayg7/252yEIWFpke3TdzJf2QpIfanlzuGCtyYmCVXAiJtVhTpf1qNCnCZSVCZ1zdKbZ6nqszy++S7SvuMM222mCWrxTEWIrjMiZ1SCq1HtmGzt4HKi25ngUyLlEioVlEE9h4SK6Fwhp4PPtgqZ6g7Desi1tTd514Fr7Dv5TrSOvPD1dRYPH2Tp4DHanJnmzsh7OeOHRmgXPPhg7+lgAHlAzNt4jVTiCMGihlPKyNwiVQg2lDpPDoZiau4QHCnYU29eknZAHzw4R2DAzfNPsDEZUK2U98P73TySWcNank3xJOysbbwUpNCRs/FeKu+IsdRlr0gJEEoRgmRyJWzdeo7LL1/ijvd/muvXLhLmFvb95M1bFz83GlVUg0P4HNCQjcHrPa50oVlyYbTagWNhIg6CEWFIpsk3fo2QEjgXcGJ6fpFMbm0KqqQitOvMjQPVdITb2WDJOSbXrrJw4KCZOgQ304/X3hGamjjtCh9ArHh2tiPLAnWo8JWSUqYaDcg5UzkxVKIO1GX/d+cdZ7h0/gIbr19Gd1pSkahUmgma+INLJ/gfPryP5x59jINvLvF4PMy+wweZnxsyVxmbvo3dbIzxYjC2Ok/thJSmhMZCIXqWfsaiiqvadlMpZXJIdGSqMERE2Jnbz2T4LobXH2f18gpH73sQ8QnpKJaosRQUJfgayZ7UtYa+lIRCUeg0UlWOfYcHPPLyMd7Z3KBdv8YoH6AVR+Ucmjqcd1TV/8PVmwfZld33fZ/fOefe+14vABrLYBkAg2U2DmfhTkqkpaFELZGTSJYSly3vKctVsR07imK7UnFKkcvliu1YUlyJVYoSObJiy3Ikl6yNi0rkUNw05JBDzr5iMAAGM9jR3eju9+495/zyx+93H0Djn9kw6O733j3n9/uuLbVU5rmwa2WVF+eP8MA+4aGTA/H1M8R8kctvfZG1ox8hEheRwWPs7biZmcUzMK7YY4GU+vsuolR6Fsr1GKDYBTxy6CnZwd9Kx7z2xt02maJGOdkW2VFjb0i/x/aGMe+/qj8g6kyqUSfWN+AHec0m7XNYPatlBQRGiuP2Vq0yCsKMZ9Zq8OhQDYITBK3RwoekOpdsApwy0hGjJ1eNCjENRSCpIskdJncqwasiIfjlKYthSsXcAvavvBtcjecfcxV01FIGR2qqOTHsOrAEsXrHZWyiXIfTGXjfX/0F/vZf+wFe3NhFFeE99015YXvKM2evcPnaTSR0/PK/f5alnVWyOwwolVznNnyGxJzAdE/HPM+ZNh01u1vIf4XI7TIwcWRIQaW4f9+2dBGjFuuI/tj/vUBiVA1VERdclmp9C4Ts6ahiWiK1JETGi90/F/hiMF6mZRROafBFxRCSIgHL73eXQMlo8GVmvJQ9z19CdddFWrzvo9alOCdfBRbpE+q2zlpAEnf+sqGp3vGE3fHr20p+3BYrI9ESb2//ApfPfo2td75KEVi++25eP1v5zI0H6FKFkMi1knNmZ2MbbSMhB/+Sme87eJ21Uw+S1m/xlVe32Hv/EfJg/Q6NVDJCColSLc0vhIjmCqUQpUFSy5DNMdN1HTofmG/t8CePXOLk3hP81pm7me6ZkvsZJW9RtysxJUR7miawNR/Is55Jaiy0LQ+IVrNvZmhXJlbSVitdCmhRUmevY46VIFOmvVK7yqPDBg+fOsCNl77Fa7MDbGwdYG15QlmZ0uU5dUyTTEKNCdnZsI4NWlLXeZteIi4tU/o5acksppqmRgWIECTRxWoaIq0Q/AKm8YH+9rMQr11lSHNqyhy4973c2NiD3LIzo6jb78WdU2FExbx3IpogeaiWZGnnrdrZVjz4O3rPRLBAsCaaYLItiTQ5zclH72Xe32Tz1k3SjUsXfjrVwuz6ZbIsgRwm1EQINqVmrXSxhTIg1Q4SAUKM5BgtkjFaWp2qEKtSUqJRpa9mvysle+xppQzZDp7Qcv7MeVbqOnff9y5ef/Mc6zfehtVlupiIYeLQh8FeKShp2iBFYZ6pjbglsJCiUKOSshAbaIhoSvS5EMUOwjHfvmjm8R/8Xs4/9yrP/uGXASGkyNAL7dKUV/OcP765wQ+d2M3fvmcvf/53rzK/oaxnZeneo7Rq9opc5laZrELbTqg522ZfIv1sZ8EFpq4jtBFwvj4GJl5TGWLHUAYCdnk/8aXXeehuZU+nFI00FDRVmtCQAkhMhGThDjoMoGrVw2q8/qhMLrmQiTR3v5uzZ7/CwQNwZLLJxaFD45LpJ/rKrMxoo3HRfR6Q2PDb7xxEbz7NAb3FZPtZ1t85y9nXnuSDj/+knQ0O75t9b+STjee0E9bWFPV/b5eOW/iKq5g9h18kUGpYQNIxWhNWF1sqMK8VlcEGKDEOq4boQj+7KKq4LXVUmYvDoqMgVT1gtYxQaV2o9u2wLp4UaVGeReyhG/Pmg/vFAUe2WIjXBKi1p0YBEmNQknHX43mtGPk0NvApWcVDhMZL3gFkGcWVgSKDDyOJ0WNt/828+GMvQFYlibpYrqLuBygIQQOy2HqDRYcyXsI+VDAgIfCpn/sJ1pYqj//h7xB4P5dvZl6++g5TGl5/6xIqt3j6hTeISy1DFWoeoIDWis7n5CYwoeHP/PV/zhd/5b+2WuuYyB78Zegf/r7L4jyoFRMKO2cu4t9fdPoD7wTAtnLrFyiA++vFjuoBC0MJwSgipXra34gKGaoTJRiq5kjQKBYEEO2JntQ4vk4hNEb3lEyNSqH3uOGxXEqtQqKIf+aab6NaxvdUPRnV9nUPetE6Yhf++cGgZ7HMgNtm0fGzcUcrpA8JI00ynjdj3saZM8/wztf/NUeOHWR5T+TpczN+bf0Iqc1IbAkKfVFCSLSTjvl8zlAGRIw2uG9tg+e/8jRrDz3AUxxEuxW6+YyM0SoaE8UxtBiFoVQkNmbpjJFSBkI0RKvWyk6eMd3ZYfbmU1w4fhjZex/D5iZ0HSlO6dn2DRhohEmcErvE1o1Ns59LMG2aw/w5VovcDZGh763nxRtngxYromqgXNrge09sEzrh4MOn+Zlfu8bqsiArS9D3hgROOyjeIji+P6mx7JVoupmgFVJCUqAO9vppjE4XYed/jIhGUvTUz6YFEUKNjqZXQgzkvEHOt9i6foalU6d59eJF8trtgc8Eu8FKsETJxfotUgoUBopG00F5IiTYax5cnD5a+JMEBrVSo4CiCW5cv4Bsb9C3+9l94Chp1979XD/3Dm27l1A72yBCoZRAUM/yr+ZFlpItBlgCNVrgQBLIeSBrJUmCaG9S0WDCOa3E1BoPHxtkEPJ8IKPsO3ac6fZNrp47g7BEqg2kCV0KdK2HSVQTw7XJDv6JWATq1uDcW2iYpsBQBWlsOx5h5ZbblxRA1zUmTBp6uuWJCR5LT0wNS5NlShnYLS2/9pU9fMfBzM47z/F33vsufv6PN7m0MeParWu898Pvp62V0NrPVAVyLkQXKMUoNM0SRENOSs3EagrjGu0hDhUkCt0k0g8geU5JgR98/CD788BLr93gqoz+aPdRa0BqReduNSpCaKx1UYaB2ltmg0GpgTZndkKBtI/XXnuW48MuXmv2MEmDDQChUOaZIRZKEENAAuR0kP9v4zv5q4+d4fD8DS6+fp1845ucvfsz3H36+0jRqi7v9KEbF2mBMypQpC7iaW0YyCOhiXG7HnkZq9V5+gW5uJ4r1Kg0NAaP+8angvtjYVRPi47hK6PuwJreRMQ9sVgRlPpnIdg2Nl4KjLGqanrrSlkk/AEUcfpDjbwIqL3XXkqjIS7mnsBi+XMoGYRAlsyYRW8XhKEeRQJJb2/D4/cd1FrTRgQlaFhcOKqjwKtQpHgfxqgkt021eLGN3TiuNA9qFA74928ISFBIMdAkWO8HnvrSOQCSzLhx5RZds8yt6YT5vOWZdwq7p4EhD66BYUEF1hAYdi7zpV/9GeqwSY1T26xH+uMO9MHSF72QKJjgT6WQQmOfmTgWPxm9eLtXwCgLESGPF2otfqEa3GHPyuCfEONBPYvK7auYKh81axbx2zboUsUOcscLxkGwehQ3/t4EF5Sa/thQF/O9ZBZuB0B9lxwPd9PR4Je52iWpwp3RvxHxRGNDLQueVyHybQMBd/y98caRitLfusqtV/4dJ+6/l531i8w2NviDW+9n0q1ASGiKDFmNTy7mtInaEIvSz7fRQdg1bHJ+a+Cdl7bpD51mkuf0PqCH0Bo6kisaMlU6GndRFEmUko0SVsHES0JMQp5vcfT4SWIoXLt6mX3H72I2m7HUtehSpGpk2OoZ+kwtO5axMWlpCeSaaCeNBfdka44EiE0iVkGS5cSoN8K2IhSB4fUvsP/ADXI5ys9+bpv5iY+yPM1I2yIpEHujKMmD9QmEBtopuW1gmKEl0zZTQi1OgUZSUmq/Y9qSqjaEtgHN5gpJFEpV0ytVo7hEoGkaolROHjnBrl09m/Uau/bex7S5ZgPHqJNT9SZei1CO/tkzs28ixBFVHOunPRwrCCEmdMi+8GKvv7uscq2s7T9G3rzK6vGHOHfmNdL65g57D5/kxuUXWN6zG9UdAlOL01UPE3G8rIgxmbHaFl5SwAJaiqdHVYIWmCdSHMgjbKn2UJVq6EHXtPTzOZtDy9HDB7m4vU7MPftXtunahs4tgCm25o92bypVCcnqTVeXpuhcyZ65noIrf8k0MXn6ktoWkqsnvlVyyUyaCcdOneAr3R9Rtga6bMpJlYCkxIED+/jnn32L79izwXd/6Bonl1e4lnYzzHd49alv8fD7PoDSM1Tbwrqlxq0vxr2WYnWnMYrRIAFyrrQpLARJpMB8PrfBqmmJBW5efJMj93Tk1suKgqm4G7FNqOZh8SGRoKbADZGuMXWzBawYpVHbjqUYef2m8t5jh/joQyf53G9dRdNhCgYBq1aGPtNMJmgp5KrkUGGl4Ve/tcpPvWsvYWWTY3sPcPOVf0PTLnH4+Hd66cltpfpiyPqPioRGKPv2YSgLJMby2PGEN8G6YcQ2fEzkaBcMiz+7eMyubbfi3HlFqgGrY+89CpkBVVPCygLet9pWGIEMq4AtUkmYstaO6wA1g5ifW9SO8eLHc9ZKCHUxfUfGnHvcfx8JWhaV2LXGBc9PzRbso8aDG6KhBC1INOzPdF+2JZqN0TlksY2qUBZwYtWM0hhNEpVao/VjWFmBC9CMpgL80Dc7YPSZpJRC18Ab14R9u3dRtef4u++l/+Ifsnr3CvlaobYDe5YnlGoDUHYxbC0Gxufc8+v/11+n0RmaOjtUx/deWYg5TRGe7RL1zAXx93zQwS/k2wJGpSDSMNYJQyWPFIBGlMGh+3FYqwthlI9RxsMW690ovjmJBHJV0EwolpVeVGkC9CXTRNcvjduTFKQmE/H6L9WxkcCRCRkHzHobhRpNmp7QVlDERcsFn3dMEWPKFfGLMxSvcR0/t7ezKRl5f/+1gP4rbM13+MK/+ilO39Ny7fwmG6Xn966cZrM9QBsrMTTM82DD2VAoZHKFtpsgpTLojIOywerqCh9+/ON87rwwOXyM2ldSgRgyRazPRFqItTG6uEkWnFZ7QlQ7i2OECkMptN2UOk2EBu7Zs8XqLej7zCQlZrlA6kgB6g70FbrQ0Bd7TaIWGgI9dolqyHbeUmg6IYsPsTnTh4DEQtNMuPK1r/MzPzih21zhV95e5muHTrN7KsS7jgJKHXxYq4PFQZMpgzU6kgttbO19zXO0bY0KChUKhK6zAb4IKVkHTA32WTGEzaKNjSKojg5YNPXw6gtsHTvL7j37qVF5a3A6Xf2U9DOSEMxpB6YhK6YrM6W/UV54pLahrBXN5fb/75+n6gMFKE2XmTT3cu3cS2xcu0qSYcb6tTdYPXyMnZtXmdZ7mKVK7BqYz8lUWvFNQuwLGlxl1qSsFusoRSyEoza0abQy2WYmKKX0FrXYJOazjErL69eVtZvP0c8GHnjkUV49F7nYTci5x4wApurVIDRilovBYdFWldzalBNFSMmDTYJXtmKTfq1K18jCbta1Fi6UyxY/8hN/li/820+zc/0GIbbULjH0W1CEvjvGa0H4/l1b/Ln3rvIvn7nKZlhlvrHJc888zYmH7qMJxoONoiUFUmgWb5Y6dQGRyWRCCKZA1zJQsqEFFWGYz5gVOLC0h0vvXOSVS0c4cszKJ3JtrRaS4urSxrYSEYLJocmIFcOMaYHVEupynjG7532sTp5k5/w5rt3ay+5JockWhRqBYXuGznr60iNNy8reNfpZZWd6kp99ruUvnL5Ct6Sc+dJFrl74BXb/+WMsL5/wi8XU5zIW/YzbyNhyp7c3YsUsXeLCKB3/B/AJ2atWQyWqCcDGiKGgbnEUg89RRXWgjhGZHrISxy2Qkcs1URwa3OdtXRSmirW8b1G7CAcqKSRy7amh2GsoFjTk96QdvGpbX9FqrXy1WJmNp1ZKCEhWCGoDokIVRaMSi23NRe3gMXvR+HtwCuFO1Oo/si6qFb0Y4pERaayVsoIGswSND7393uL6FE+XA0pRNKhrCkwXEVHa1DBNc/6r/+K7ERE+cmANuokVUknkhUszrm9sspJ2U2TMYChIVkIShiLcNUTa2rCNbefiCEhBndtUxNpM7O9j9DYzD4aqt5EXdCw6icYzh2DiXs83CGqiN0tvNGqmVKdzRBaDYwi3tygVT6V0zh8s/GUoGc2VEDHoWMRqYkU8Kvj2VlZUFs+f5a1XSxMMuohoTosfwjUgRC+VwsK0/P02IPc2Qjl+3yNackfcxGLLH90A36YOkNHmWXn+M/+YIyfWyNMlDhw4ym8903JG1qhi2SnqEdMpWEaH9kZHqUf3ttLw3sNLvPrqMxw+8hAXto4Qi6CNLXpDrRCLbaAa0NShYYLKAHlOkI4glSrFLiyi1bQPmbxyF088m9j1wNu0188TT52g9JvmOCvmYulWV5nEytbmNmGuxFwZ+hm1JuKksV4XUcJkgnQdEGgnHYMoObYsdYmOzJlvPcMPds+xNsx4PX0Xz0zvYqldYm1XR991iM4JA0hQcjakQUr24RGaobdOhmBph2TLXqm5UKIhmSE2dhlrJUTPI/H7Sqo3Mnp+g7mjB5IK+/coS/uOwbRj8/JbbE8eBC12tgexuzQqFTu7CEqpAykEq4OPwQbfGu3uUyG7y8nQb6OmVa27xJIvhRjhwtNPQttx4PRjTG5uk5amu1BdIVXYjsoQZiRpjbsJXkvq3EIoSmi8bjNa/rPUcfItLg60TV0iiCixmkWhuPAnV6VpYKiBi7OBe7/j/Tzz1DfoQyDcusIw26abNJSsNE1YiMylGgwXMVqgekNYjJEUbPtNKdkPLTaFh+hhtAtb1x1WGlFkNufQ6aO8vnkLQqRNAWSPiSpC4aUbU574xhYfOn2Jh5aWea7uIYYlNi9dY+PAXvYfOgT+taNYXn+plRSFGFtHHTKiQq7VOuKD1VVCQKs9JG07Id/Y4NDdPdeGQ8T9hwzMk0gUr8UtY6JcoXG4y3qgIxK8StcqoGyLHZQmRbZmA5v9dThwkIMrkX6eYRINugrmJpht3qRWmOy2fPdpXKLPM25M9vLpl1bZdd9bHH/kMDs3tnnza/+edz3+U97cZhe3wVx3HmQsMqtHWJZxZ9Hi8GBygdV46FcqgVDt543e6FZlDGUxSiGqWT0JmPhP7eJz3axtDAuaVG4PIJINJQH/c5VQI0j2w9yohiKm2K0aqAEasTsKcbteLUSH27xl1/65OpMr9pMUU7D6IGTBQtV3NRUlulFBXPineMb3HRovdVX3mMUwuhcswyFY+RW2edgmYDqF6g2ZItaLrq6eZ0yMU5xScDV1VXKuHN+b+O3PPMn/+KdOc9+pw5azMfRUWeIHfuJXSGGZoW45ZeK5H1opgynuT963n6FaumLyaNJaPQBXvFrZx7PgoruKEtWEUyEEcsVFdtWzD+xnHbJlLUi0xkew995Cm27rKRjFeZjIrvoQpaUySGVURpqbo1LKAM62G2MSCNUaBWvBtlk1k6agi4TCMeo3aHTUyQuiqiGmVc3qF9TcBgYDYEMeJh7W6pl9AtWRq+CPw52isTu1BHd+NgImEBvtht/8/Z8l3XqZu971EZqlxBefXeep2Ql2xQS5MqjSdQmJiWG2Y69hMA87rjtQrSxxi+Mn72Vt32EurTekRqjzTIkem1yL0SJim6tEKDtzQh3QqFbcFmxBWaAWwTQq8/37OXzyER69tsWX16+RJDOdLpuOYLDQt6lYbgsEuokiMw9Dm0wIYQvNhTSdUGLj1m+jfGMKlNAyJ3Lo5pP8yQ+1bNcl/u0bmX4qrKw00C3ROkRPzV4l7PkuwRxsQ19YbkzInmtPTBN7/l13Y7es2UxrsJ4Nslkf/Vj111ZMgxKEmCGkRC2RE7sCN956g/379vH8+fPcmj5MkmRE0YhUqVqIz3hmgeXoBKtTjposswIsj6TMqTEQRRg8KdIE/abP19pTiRz/4A9w/oVvcOHFr3P0xCOk2c4Ws6vXaSdXWN1/2NqixBS7gkFGjBG4jUO/WskVQrStqQAlJpoEMnhgUNPQ54E2Cn1VQrTtX7TA1g5NrLy2vcLXv/gEe3bv5+2XX2JvPM45EqHYJakOHYoazKJkV/dbKUhTi08GwSA8Co146MhiC7KDqImtURoClEpDopK5/5H7edf7HuHzv/d50s6cWRLmpTJFWdp9kD+6dpx7Dz/Fn/7ECh9+Z4df/Eph99purr/5Nm3bsrq2yyw/3nhoQ4jZ2Epxta97u9uutW2oFAsaCZFYMvOsHH7nSc5tvcGlsp/mwElPAvQLJNuf07S2JeVaiKEjhkopas4IDV5IkaghUT0s6e2+EpaWieUtji/dxwvbha4GSp6zfeM6w60tkEq3vMLWrVtM2pY8hYZE2ul5bfoxfvXF5/nvPvA6+QbsvPU051/4FY499JcYTzULqyiwyH6/nXo2wgDqmffFt0I87IIYoWb64oUoEhAad5yAxeQavEvpieNDFauJClVQaZwnLkZPCcxrIca59UL4BasxwdBAHFAGs5MFq9EMYmFXARiq8cNaMjk14JelJQlaVG9Vv9hFKGJFOFozQ7GBNyoMogyKDzP2c4+wrinEMxqF3lJvYAzGwy84caV4GOkUdxIEs10FcT2Ap9wVR1HsonV+muw6AadrhDs47HoHVKj0tKxfL/yrTz7PD3/kPtqCZelvbbNr7Qjrly9Rhkzq2oXl00KcQErmJ//pv+f//js/ynYe/HuxAeXODokot+/TvQAAIABJREFUwbhazKI4Bi4F384HzPoU1XMQGAWCCRH1xr3sJFFZZAoMapdo8K+b60AUK3mqGk0orBWpNqQPUuli8EHMNrhcC7lWJkFMbBwNoYkxGG2CURKIXTgj1GuUlQ0f7ohG1Hhwyp02yNsAR9YK5kkx5Mt1CLYpjpRZxbeZxet4W+sRFkVIFeHiy59Edr5BXLmL/sJX+dXND/DV9VPGr3cThDl1yMyHHaftKtImilakae01G2YggbNv3OD93TZv9heJfAjmcxq/3CCQ1LQ6kisic2BOKTOS91UMNSDJY3VxfVCMTCYNr2+vsH3ldY4Nb1EuvYvm+F5SSrYYpkgtPbdyZdIskZpCFmF5114vHBKa2FKqUBvThVSglcaOkdihl1/h1Duf5Mc/so7s/Qj/y7d2cWXlNO3Ni7R7V8h5TqOC1uLlckLTCP1Q6Yjk2jPtIttDzyR2RsPGBIhTsfYeJY9iz/ZgWe6BLwTj4G3noT+jwSi/eOENDk+uEvccYGd2nZ3uOPO0iyKZRCKFwKDmnAulekV8ay4qLQvUUzTQqDAo9GGwgLEANY/hUEqNUD2YiRiJfUC2r9C0kS6e5s2zr5FqUCary0TJSLtGS0VjaxapYLazGLzPXTEhWinGheVCiYpEmxJVIqUF8gAp0oh9AyFCSFajKgTCSsewPbCRVlg+9m52Lp1hViL3PyA8deNtuv1HGINnRMxFoNJRc6FWqCkwWsJtcvL2sAyhDYh1apggqFrPcy49aCCKDS+qvcGCuTLM1nnvhx7mC597isceuY/UdVy/eImdazcIXeI3XzjFX1q5zN71l/ihE3fz717ZRpp9XHr1LP3RI+w5coBWIrFJt/3vY/BMbFAVUmOwYmqTi3kCiUxIDecv3OKvnbjEtXyYT34r0h2fMGkiQx2oYpC4FYLb1m1bVc/g92uIBjfFrqVo9OraSs2Z2c1ttvtLvPZ6Yc5R8nZDv7lNLVC3NqCqpye6OntM4NNA0yaaUjm3fB+//Ar8+P0X4PplLn/1k8xmPfe+7ycI1aJII5Hqh9joZ78TivVbxo61saXKt25CdLdI8dhm9ep0FxFqdatVY19DlKoNIsV0BY4q2LWCP4i2wbWu+oZkehKnEZKY8Ky6WK9i1EUMlTRCrGKWzxRuByAVdf2Br+p55GO1QDBbY6zCMAr3ggIdteyARHMRSLAijxjc1aWLZMVRMW7RxSzSswULPCpRGbR4ImdBNRE1YX3w7rMXG05sZrDiEg2jnsI5xuJJYmKDfq4JAvz4993LP/u1P+Sv/MDDbO0MzIfrMBR27QlcfwdCigt9jVajphIdmnve3shkKYx7nxrBb5RHNQSwqmU9SM1oMWqnFDXuPAiUQLFbA8t5tE3f+g5sw1ZX/heH4A36LE4TFBsoQvL5OfjlLw6n2tCSxHhqY+Wt0yOrFf0MavSbVL/Uq70vvVNKTTAoOCTf/lQ916GgtIQi7iy5va1rKJYiOOpbFDuYx884xTUOYFBNWfBnwjhM+/A8UgkiVA2sv/U1rr3yHyjDFmsnjvLsxmM88fZ+VlujhPqdGagtJ6UfKNl0VA2meRoGD5iJU3TY4D/53ncj17ZZmXb0Gxt0zVFqsUK45DhbjtG6XcjoXBdImbSJUP2lr0oJ4/BcISmceIR/8QdP8rf+1FE+fv5pntj6GCtNosnCkAIpWsaKAk1oTf+A/bllMN0ZMZl4NZieKiRlVgL1W7/Pj7Tf4rves8LV5e/mH32659rBu5DNq+w7cZJ29xrzcoNSgmk9CIRoMesxCn1MxKoMudC0E4bQGKWsNqgWPx+TYoJgR5qC2M95G/0xFCAs3BCBUC2ud2/puXnpKj07PPCBj/Da184RllvLD1CjL2PoTGhdlRKKZ/GIYaQhEaoNAgMVSSC1IQR1esDunxE9aoIlfqKBUqHvb5GaKd3h+9h7aSCFECzhrPbQbxC5lyJCQ4PGAVVlMumY58FUsKE1lQZQyoB0kaDB8vj9oSU0BhVFQUMiBhNS1TwQYkSJtMurECe88tYZ7l+p9Fe3SFvXObB+kdmBwyDJU9MKTWOhCzEK2SegopEUDBKM2bi8GIqTa2b5SbH1B6cukIMYR6uRIDGRgqJR2JtafuQ//zihCZQycPDwKs995WXYucnlIvzSZ5f4mz/0AT7ev8zR4/v43z61zvrQsXPmLDeuXOXd3/lBmmSBNsGnQJpEwiFk1FT6avxljEoeKpfmgT8z+Q+weY4/OP8B3rznO/nwskXJaLHISWL06OMeER9+SkGiDR1ka1+sxcJLa1CLM01C38858PApVg7d4pvf6FHvbyi50kyX0JLpFdqUSCiz9Vs2fUboi9hBkRJP5/vpntnix9+TWNs35/wLf8gL820e+Y6/4buPHbpZx/z7O7lsg6bHnjXbWm5j3YYoBWvwqpYaWaqF1+BWrSiA0wABXKBqqucQlFwz8zwwbTsCMPW44Yz1a1c1v3aQau95kdtDhFjuRRtb48yj5dpHr6vtSyVFpRmjPNzxOHYjxIo5PkI0/61ClEKPEKoLEt1NkEMgVlMqW3SnUMlWq1uNq76wrcQIB7tg0dgSPP759utptkdLoiOMwkr/nqrV51pRl6FHRW/b8dRRkupbqmCc47lLm3z4xG5+/reFjo751lXCdB+1DKxfXV9A2qN3XgLIMLAden79Z/8Cf/LRvVRtMFMejCS2oSZ1geYZ7RP9vXEjnN+F6lC8CXrNbSRaXOjk67438wV/Tytmi6zVtA4SPE/BbV0mqBIX/QlZXTzqQry0QEWCBycFSi2Ltk+pZYH82J3tvSPFhieDjxuj/9QoK9Nrj9Y8RdSkfsWHI6v69Qt/HMxIjgbU26iJ/xoRFHEdTRBDXvvtl9m89AX23H0PmvfQb97N//lkZv/dSwxqdelN1yH9ADHS00OC0HZUIAQb8qtmew7ilLef/RIP3dMQy4SV3XehoWWuM6RpIKuHvUUPR0po6M2XLko/DrKefEmt1Gifd6nK/rXES8e/h6ffOcOfeyDy8pNf4Er7OEvLHUigSkOikFHmasJDDeoun4gkE1eLI2s5duQy49hrv8n37Xqej37Xo3z6pT38wmevkw+9myO77qbumRH3LEPZpmmXyNsz0ESTEkUHNE1sm87eg2PGGcyya0tEUCGmQC4KIRHqgNS8WFJNcJyxjggTbxPsvDFtQYXYcdfWWdZ3rnP02Em216/x9vRRQhzzPIIP8j77JfuMiNhnVrCcjIgt5sbqjbHHNhQa/VcgJhQrBFJ3IsSY0LCHQyfu49awyfUSSW27RC+gRdlcv4y0SpYCavn7oSqzMieGAERqycRk3HsoSiWRQiXfyQN7CE/GvcfOq43qREshg7atnGmOc3/7NsfvO8J0qbL37Ld47rUpex58iJQSMblorB+jGaNnyFsgSpQEyfS+yfI0F1kZ5vhWxIVMSqUMJhgc6zNDNXgqaKaGimZLaptKw8pdq1x48nVWD+1np5nyL377DB++fx8fOnaBf/Lj9/KPf/0Cr1xp6ZqWP/r0Z/nQd3yQlbXddgi7ZVLc5pWiQdtgoTcbfeHC+R1+pPwm7zmufP61vTyx5338iZN7DfoNRmuoKjHJAn4WESQ2SDLIvVElpkSmWBqW6u1DUAOnTp/g2vmv0C6tMrmro54xWDFGO9BEK00Mxq+1E4Or+xnznJlMp8x3MhJMffuV7iGOvPY8H3+gsmslMr/4PJ//rb/Lx37knxLu5FvvsHxlNSEM7tG2dN3iufbR4Fwx7krUBDVFrJCkUNCabCDwBEErvBW0erStFoeTE13CVfs4LG9xpSojfGtphqNQLI7bnxaimPqboKbslZHgkEUM81DHCFajAKK/P9nharsM7OkdodyKUQF+pnhHAQ4N48iCw+j+mh1ZasjiPnDnAO21tZ8vUG6jKJ4KaAOFUwZSqTWgYmLDUUOgY5Igt6HkWoxn15r5+//PV7m60TPf7nn27CbNfIvS7iHGyI0r65hv3ocOWHCoQZVLF6+Q33+Unfk26vY1iwO3C6MZe0PEUBNLOzOREiP/fgdapMEoNMvTxzTywflVR4hKhqzZHCQiEMyKRRX6MngqqNghrBagUqptZjYUFU8LtcFBxWJ81fU2OUTaPEC03IKxUjqPyIHExTBa3YlRJVIRYgxQR2Go/RyWPmnOk1qLix/FPxneQGlCGbtc1ZxJcTE0CBpkUTB95a2n+ebv/ywrk4zUHXTtAP/72RN0R44ycyVFiuY26mKkDANdaky05mexDoMNX9memdTPef/DS7z6+gUevKfjylDYXeYkpzhzCIgEb3ZtELyKNiXIPW0wUXIJhuw0KTFUWx5DTJQq7H/0EX71869w6+3n+cuPneCPLn2VP75+lPbQfUxa04fE6HQZ2GIpispglHNISDNhvjNjzxtf5sTNJ/ie0y33njjN3/rtwtmwl+Gug0zywC29yoE99zCvvVtKfZiLbumlmMpfG7qU6J2+1epaIgMzSf7wxhioZTCXTrBnXrVgUSiyWFikQiATaoCQqbTo9hb3T6+wvO80sUu8deMmO6t3YTJDO/+odaFJGGdDrdgZ5px/RpBaacMdTaTudorBPqtDKYwaWwnq582c9VsXePvt19l31z2s7T1Amu9sUOa32H/stOXa34zEJlLFUpdMfW8b6Kw32LxxVaw1Qdlml/wBFFWGYU6RSBC30PhEE7uJtQeqxXeGIjyz3vDjH/lulvprnH3jW5xanXJu/RopTbBQA5C+0ESDPGq2kplSLJY31Eqsmb6YJ7RWU/y3IZKqP6xiX9/sWyNHb0KT2cwP08bV2xHbUhDufeAkK2u7Of/K63z8B36YinDh7Fscm3+a9zSX+en/bAq73sf/8Vtf4Ot5LxfOXmJl/Rb7D60ZMoEJO5Lz/qUp3JoLev0Su66+yN/b9zQnj7R85WXhV8snePej+2hjpMeqjxuvl1R3MCTfGisstryKQjFrU/SDrc+FLjTMSyZvbrJ//y5e+OYrzPXdaA2k6ZTUTex72tqk9D0MGcnbDLM5aWlCSon5lhXxSEyU3NNR+I3th1k9+zXevbvh6LE1+pfP8PSnfob3/eA/MIoF8UpK3NfunOZYZJPswvWsRLtQqrkYzMscULxECkXFoDfb/MYMf/NPa7GDwS4QGwLMie1hvq4ezSQvZbFDO5YKoZBLuB3C5mpbVV04RqpEL2GxvIeF1ctvK3UV4EibLOJvF+E7ClWN3gCGIKTq7gYR3/rHchwvHap2MbbBIqoLIwdgSvkxo6CoZSuIC7MoutDCaRUvkzEqQxmLtIxfz+rBwItBzZ7Rv/lnHuVv/7NPkvI2P//vnmBGYKlkNGdSaIztrtU2VMXKaypMovA3f/b3ee97HuO+Y9H84aaoAx9aSzZX0O0cA1dSj3He1YbeoZYFfBw9uyBJA2RKVn+9FbC8gxqVMJhgdqiFzp+Z4PbNWjI1NhQyMdhGXB0ZacQy04fiIktxhMLl1OI01qDQeIbFqKMwJCUj0UJeSy20wVABu8BtwBXUuhGCGocbqiFZYURHbAge1QHFab6xGCm5pqEKJIlEjKK4cvHLXHn+33D01CFqf53NnSP84rmT9Kt3sVQqfYrUAG2xiNxSBnMmBfNL78xmpGTV5RqDByDBVhQuvl3Ze+go22kfu9p9pFQYNFmvS1ZqCh6IZRRrjBaeIwJD9iI5NWdJrmpWZ8QU6yESZY4+9t186vknWHn+Ff7LU0c5fWuDL527yeXD76bu2seqGP2ZG0g1eAbNEqEJ1Hde5NDl5zg6u8h3PtAR9lYm+07xV35vldn+Y/TVGviaXUvsue8k/TB3ii6YQDpGD9EZoFZSnKCt2WMTbreOZjO19whHvMTyV9xNEctARgjS2OauRmOOORLqCbqxFrJGjr75FLv2wfV3LrIz7zm78n44uGuRSCkyOosMsRI1NErEsnjUh+kRXQpFKKmgwTRL1Y/JjInPg1hvQXR0QQfYd+xDTK5d4dKbT7P7wF2krJUUE5tX3mRp7yohnFhM5DE0UNVUpsEzs8W26HHjSD7xje5tkTEu2FKdDPoUFN9mXRcgItQUmO4+wO987st84vSMujVjsqdh9c1Xma9/lLo8hdYHZLE8+SbAoJWmaQg1WGKh28r6DCRlGu3DrDERGAwCrg5f+mE3FBMURiIqvfv1KyHY781+SZ04cohTR49S+k2iwl0Hd/Opp46xq2u4d/U8F68/wd/4qPLk2/DJpz/PW2sPcPnKMsura7RLid2ru0jNMrd2NpgAa7OLvG/yMo8/tsP22zOef3XOz7/5UY4//hD7p8m8o0QTyOlgsNBo8Qt32ISCItLYphXtAxrAt9EAdaBLLTu159yFsxy9935+98UNZNc9zlXah66ZTsiihHlPr9UqIttA7jPtpKGWDG5VC9OWySTxm1cf4OCel7grtlSZov0VLp75LAdPPW4HQcgIiVLH+RR/kOw6GoN7Rh49qFIZe9p9M/aVfeQA7eLAffzVrEuuMQjKoilv0LooebFdN5LGrUusWQ7fPFOIZMmmsRChQchBqSLufCkLrrbUgojp17PfbWSvXvUegMX26oJACYFs5QNWYVCVHQmG2oRk3ytCxobiLloQDVTaGhh0gNhYt4Bn/dowHW0jEEvijK5GtjtEKVS3xVkOhUah+iVXqq82deSmfVCq8JGTB3n40GHeeeUav/m5rxPDBC3V88brYsCgGjsf1Db8TOQj7z3Krr075GwPrEUoqwV5iboFzyyDqGlXshZKdJsclVx6clVCaqxqPDrVQllcvFaT3DCGJFEMVUg+JOacPQ3O4PosdqFLySQ6mhgtiluFpgrS2Hs/cqbBsyWCO1J6qT48BRoTabg9F0OsciZG2+JrHgghmevH0ayJ75m2HDZondthXO158MxMcLoTzHWVxAZ9Gxdt6BkdUYGe88/8S9p2FweOHGfa7uOXPtOx3tzFRDoIc0MlsvUR1GFgEOuEL/3tL1XoIbWeoR+INIQ8sN0OrDXL7FvpuXbmNQ6tPUBE6Ml4jRGAQcpqA5UNQw1VextelIVTqKg6TZXtQkyR1cMHuCHfx2+8IEwvbfKRhwbe05/hd84Vnr+2ytXJXazuXyNGhVkhNZFwbYN46Vs8qK/x0P6e/XGDd33sh/m9332Of/vSGsOxU6StdSRnumGLPceP0vdzQ3mx575UkEYIpVI0QYxGmaoJeaMoKUQG3JJbrPjHEuT8kyEuEpVKip3BnMFegzA6ZEKyc0oStc4hr/NIvMKRBx6lW3mJWxW+dPlB2joWc1kORUAXLgAShmiJB8wRydHifQuFItE+c7Wl1940RVRCiiRJiKp/NpUaBlKTuPH8Z9BwgL13HaHM1Wzq7XQV2GR7Y5uSEuI5/qP3lWgpQhJBNBIbHAEI7sNXa6gL9karREK8QwGPlSNU3OzlorygiRgrX5V9/MX9sHHtIocOneCD2zf5zDuvsfKuR00tLS7MSMl4xCKufFcr9WijQffRJneNwWXBvQvKgg0MxQpwDM6LlDo3P2wJ6FCJwRTCRXUh8AnDQGgDs6GYDVGUB9/3Uf71y99EP/sCP/0X38vs0kt8/31X+fhJ5fL621yqu7lVrnBhO7F9OfLhh4/w4htf4xMfXGEtXKO/uMqNy5f4/IXj/MrGQ7zvT3+ce2abbJeEkGlE0VytYUvNPlKy4aNNEy20IiTnkAOSbAMcrZFQybREnbO8u+WePQ+z6+AD5OevUuoG2kyNMyqVGBMxtQz9zKbIaYeK0LSRjNBKoAw9pQn020rslCxTfu7ZY/zQU5/jnruUSZnz0ud+EZXAkeOPU+LYqOehKX6wfZsq3PHe6jHCglMFRLfRZKoEV/9XGomjztrhbD+YxS1c1R7UQDD06Y6Gv6p3WKi0kIN5dmsZLG8gBA8FsoIdKWpWqaqu6Pb+g0UMsdmuzAqkDP7gmj3QFbgoxWFoUWjVewqcIplX88YvxQhq3KEF49iwMiCmcdAZmc64xlLJFDtYcUhfoLplsoh514MHMFW/YGqp4DHHyTeLoVq8qDptEZqGrX6Hxz98P5/6wgvk3LC8MmE+H8wjH8Ji+LT30qkVreQs/NjjJziy1LClFU9kXoQPmQPEhG1ahCKDhfHQkGvBXAx48MrAkDMhus4Atc5F1YVQal4qjVRDAIhMJHjwUHDRoCFE2ZvUypBJqVvkAQT/HBGEuQ4Esc9cwvMKsKXDPqMWK9zXQg32Go8Wz0plGkwhbgOKq8LF0IPgaItET+hcUCfVER1QDR6Z68+I4BY7wN9XkUSkoQTIw2Ve/IP/FTY22H36CP36Nr/x8pwvpntZrTuUAjPMG15QBirZi9Bm8xlQrWsYEOnIjmYNuRBaq8Q9ffgAN66t8+VnrrB///30MVB7g71VsA4IwQbZ2Nh5KZUslgsQJJiQtgyY+NaRptSYJqCaMPzAoTVmqz/GLz/5BF86d5Y/+wH40VPP8T3XB5691tKtH+Sty1d57MFDXLl5hUneZu1QZe3AKudeuMLbaYVf+pfP8PauR8mSGfpbaD+HScfex96PTlpCMX1IXtgqx+yYSAiG6qAFkc4DfezuCzjCFwsMtgA3WPNsqdVU/2XJLOAx2/ISzNps1kynOWtP1yxz+OyzpI13ePFr55l2S8xY4p29+5hW8XPMnumiVvwTHMFUsUHDXCf2aTQHtS8K3RSlEIulajaN9eCECahGewZiQGpkCMr06H3EMrWa5d2R1LbxZ3beufjTbTdl5e5HiRu2XSRgrgOIWfdiSM5NR2opFkoQBCkW2WnhEoG+qvMlxna1RenJC2tCrNVgrujNbDWQDjzAzto693/04zz9yU/x0EPHOPTM57l+8gHaSUcIjUNMBaKVpUiurohXyIWllOyDXA3wHHRAivFxtn3VBdxo98BgvLM4pyqFvibnfZRAIOdCipG+9IQkaB7IIUAcuP/BB+kffJh/+NWvsnLjGN91Pzy4ouj8Ah89vcP6+RtsLQ9M9x9g9sYT3Hvqbl796hts33M3v/X8Nd5Y/THWPvZRfqS5ST9sUtopy9WmulKKRUuOcKuYKK+oLuI14+hDd9XqmEMvYq4MKRDihH3DdS6+9BKvfuMVrmy9h3bpAHk2JzUNVTJDFmJqiO4cCKrUbCKS0DbUqsTUmfgzzynzHat67db4bPwT/LenNjiwNuHq+TM8+el/zKMf3ua+937C7CqqCxjVktxYXAgGt49easvzrzLCbbdDUEIt6H8kutM6ctr+zyqQzJeOmt7AuN8BDUbDoNUfbsVDd61IScekLCuWwdW61ad9qg2GVS3lspTiWd2RLPjgYoExA6DFHvxqMY7kWulIDMUe3AYPmsEyB4JCrkIOIy9r32MRE4otgnDULi6NyVrsiongen8tI+KxuAbpjmJTx7IBc4d4ea6phtURGUxTPwyR3/vkl4jdFJ1v0m/vuF1xVMLf0ZxYqlEdVYkJ7j1xgmEne+VxZ6+dc/1jIVNRXyKq37C1eoBOoORs1Sa10rWGPG5WZZqgK8LMUYNWTNWcwfURytw3ZYP4K5tlYFc7MYvnyJiXwVEp+2mDRLok5N7ExVKVITm1RiV5fkFUWQT2FB0FlNmdBIYWxhg9hMqGhTGQSvy9Doy2RxcthtvaBrC7f/y8m9jP/oNUE1JLHeuqZnzpN36SXe2U4/e+h3fe+ia/d/lB/nj2IKFTardC6bdBIjVbTXuu1hVSSjH1eIVaLQ48M9AGE6sZ1Fxo0pRff7LwXSe2uOfYIVZ3euaizFKHaEbVDNQ2mBs9J+qZBLgKXpJ/rrxHgeDWObOBSlCkDtSYaFcTa9/7Cc5uz/gHzz/DiflFfuzuy5xamrG98QInD0+5duYKy3WDOjnMlap86cwevr76HsrycW7Wy3Q5IDmzeelVTn/wcSYH9piffza3cB01LYSWOTHYpajBBpgheDR5nkOcmvMjGtIXowIN2plIvlDcYQOS56b+r+KLy22kO1BdCGx5D1vDFt+z/Tz33LvGs8+9woe+6zF+59wKqSTDvqRDxGlcadDslGNWQoNFQvc+BIQxM0No8Opv+fao8CgmciZYJs2CUpBI0D3osMFkaY2bG5eRF7/wc//zfOv8T690U27trPNTG59YKE1LGQgaaBZqXttyCMEmIQmkcbvyTPUWmI9wo1jDlzhcG2Nc9BtbYl2FWgg06Fvf4O/fvwnpFlt1oN2c8GvlXSw/+kEi7gKoBgeaqCTSEek9yawhoE1DikJHoM/ZvyfT3U6aCSEEZn1Pm4K7b+qCm/bThyjj5mqIxbipNk0ygVo1Xjc2yeDypWXyrOfcxQvU69e5dv5FTu9Z4kC/xd60xauX1zl1+jhX12/xxM37ae55F/c8doS7Yk8YtpjJhDYUduam5tZi9b/mTy4LYZSqbeshBPrB/M8jDROdJyzDYLnsGs3rqsrpS5/mg/s3uXHjBn/3sycIXUOzPEVCoJ/PmaTIUHrbVP0iSxXoAhqT/dlil2+oxSDnaL72Rjrq1lX++vuv8d5Te3njuVeZE7j/Y/8New89igbj4qsXwtyGkmXxebK/2mZtGRO34Xy74E1EGdwaZfoHU8EyCiPpHIq0z4jVxns7myMBRRJa5yjm57fcecvSLlLs90qkqP230R+v1frn48ifY6K8oMbFhZDI1QudRJhVg/3wKOC+ZCapcRSiIMka6mo1qK4pJkobMFtckoDrxxaJc1T11Dncx28XZUDYqSPgbtkWKpWBSqyYz9mfGesOs9d7YSYQp5awGtX59sCFusz3/+g/sp9foqNKCaligV7FLvMgSskDoWmQ7Q1utcv85F9+jL//l7+PGQEtrj8IeUGP5DvEbFbFMJbxwE4ZaNSg+F6VraqQImWYs7dJ44JMO4qcqKYlUoXUMJRi2yxQo9CqBarImKSmQhhuRyiLQi+ZKMmRkUCtmaJCI9C4bkUFoqoXrfhVOYbhAAAgAElEQVRZARb76haxMgppXfBrIT3iFs4RHYBkawwWZW2XxuIZGF0xYXy/zc4ZQiBLQrcu88wf/EPa2RZ77z3G/ukq/9MXp7xSl9griVnqzKaWeyhCLYVKoWmnllbZz9Ght+VJZHHBxBgJnVlmNVSaknns0AZ/onmF1ZWWf3PmHrYe+xCVMbI6IKGSRS2DnwZhoIigxapyswbffkcUTkAzpIaoLao7JgR2GjA2hmbOc0Ro2XnzTWbXXue+fbsJsXLl7Du0+1aZ7tvP2+sDux94F4RCP6/cuvAWW9dusHbfSZYOHrAE71IWguSaB0KKdwywjvSIO2mqIKFQQ4OExp+rert0TGywsbMom8NFsbA8DKkRR2RH2ydBTLOAgZ97X3+S/7R5kbX9e9A2sV2UX9z8bmKa2sIZbLwzp5ci0XNdajWhrdiyUt0lJNXEoBQWrqsQgtlTfWFRMV3M+LypFmQ28N+v/jKX33qN+x//W1y+ep5EqEwYuH7lPNMDjxA3GoqYsjZIAIdVq1jRgqWhmWwoYF8kaIXQWEyiixYIQitmS5CQvOBEoIkEI7cM5qtQZZt06P28Kk9x/9ZVtB8oK8rh57/FtbsfhX2JDsyGUjNBlxHZQYjEaN9PkUrjfPB2HVh2kdtQbJvMtS6CHIZhoFBZDq13mtuGXSXQhBYpA9VCwReK4VzN15sAmmiiptRQhzkSCsfvPowcPcKJ9zxKrrClkTcuXWLlI/s4s7RKNwz8QBfRvudmXWfIEJsVYu3pM3TNmFFvIjkVaMT88X3xuFmUfrDyh+o/Tw3mIa7R+L7iQ9VQLKY3XDrH2+tX2H9shaG1S7ds3WIyWSJJIPcDlIHsQw3JurxNTF5oCfTaI21DrYl2mtDeEKGaFF1e45+9fJA/ff7LPBDPsl0Tf/zbf4+1Ux/jO77/f3DVLUBcQMKLD6R73e1iv50Ux8IwZeIfSdF5cjtYazDR32K/81Q2qSbyk6pIUlNa1+gQZIaRWwv2EPUMVmrFHQ9+rQzVHBwm4TLxkF2kYra0YbBL0Tl1IVLElPoqpgoPjNt88NxuQQrsFJ/eJRCyV9QW39xTIBc7NUxdrEAkSktftyE2SPbLQoynrHVgwLaEhAldUzROva8eT1vvyGjQUSwoLiS1M2somaVpw/1ty9Z8m6V2Ssmj7sE2mmHwP1tNXZxUyLGyk4X/9+f+HD/8sXu4tpMtOwTPIVALbnKznlnjNI5Od4/v/v+petNgy67zPO/51lp7n3Pv7b6NHgA0MTRGEqRIQAA4SBRIkTZFTfEo24lsR45TFTuVUux4iOPYZZfkoaw4rvIQW6WoXHZ5lmVHMi2KkklKJEWCIimTEAiS4IB5Bho9d997z9lryo/32+dS4C8WUN33nrP3Wt/wvs/bGSxR+kRuxro1WhL2dNtGrAYSmT4M8jJTCa1TouxPoekzrVU6CppYD0KIN+kqSqEno5jpDAkD3RKBwFTXtDAQXQ8hynxjCJ1QItkkIDSnByrQJ9OccorTMDXUaCSnxTVkybWqy6TgO30rm7VNnFcqcyHQpSbX+bokWOe5r/4K+eWPM51/njfc/wBDWPMXPg2Xxhs5aolS9rEYSK175x9pacnWYqBkce4JRosjVjIlZwiaevVWaFMhbi2oWUXatfNrXh8PqFf3+eCb7+I/HFzFltfJOdXapuuHTjMJGJur13N366QX6zMwqYVEqIU+BHrRVMB8zbHOKqa2rQArwl03snPHaS4AIXWWtz9I7sZ+n9i9sQKFmgVG273zVnbvulNamqliXdb1mZKH4Q6qqOcNrdxaazSfQsfOYahUhNCD6xzkKBIZNhFCpKwro0ELjWAjscuO3d1+lhpUiwypUEtkXa/ylpe+yPUPneFLD3+WW+97F4+8foR4w3FCmNzTZAxda3SiM0JoOqcs6qx1nVCunaVDh4KuQ2YxrXIzdPkHSyKlfttzdo3Esbu+j+tu/91cPvsNtsfjpGm19xPb41FivEqrB/Tgns1qWFi4IC5DhyHOeNZDP2yvDVLYgDGav7yxz1/wQEg+qq+VSNLpEeXojsNIy9DSin/39DF++vd8gPHlz5P3T/DW08/w6W99hnD/B+jLBPWA3gbSWGnZQxZIEBsWk+ZoU9XIPsCRtEMIsgv2CtM0acYcdfhOQTQla4UQB0D2oUin5nqYq4wul1lBHarbQZr42fqnu184MaCC5JabTkl5XfZo0TjImdYbAwssVmpdYV3ozNw7Q/fXxmDRE61NHBgsUiK0tjncO9B6orWMlJaB6FCWQPSktH2yjdx5/T6XLy35yMdeY7B3EsKaUjpTLSQ607TPgLrN3rX66SauQBhGVsGIfYseIA6dkjOhN9ahYesVQ1qwNSZ+ubyb775rl+0r32BVFlz65qf4xLXK+//gX9NF32cx2aaJ+jYgkEJcYH75+iEzPUjlHqyhAXqjNoXGyB4m/7F2pj7On/ecBkSj9Mn3ciLMSYGvlUFDn7MFcwV2oPuBPmEMwQRNMmOwrgMwRAoeHdq7I2wVcKP4ae2SGfTcFbetJoJGy17o9BB90hM1RXBXQfWY41YqKXSMsrmwNVuOrFvRoT8EkgsUV21iiEF7dWcDRP9uDx0U5quWw8kRBrVUXlgn3vX9f5Ehm0S3JidDKxr9m39n8/eWI9iq8rUP/3luuGHJpdUe1dd1wvSouohdHZW46RIOa4Vg7PciC5XJxWF+Cw4dVkS2B8PaBDFhZU2MkVxFgaNBtsCiF7oXZHkzoTLWjnZ2WhatFHpSY9Na3oxokwVqaS4S1WSmIgBZdI56J4FHj/euqWXFhcnzSJwkQqVbWVuvBLRjT/Gwo6QfPvuV2UUSNor/TsNConS48sKjpEufIa+vsnXiOGNr/J0vnOTi8q2MYY+pTEqxo4MFJovUPjIOnXWpJLONsDkOJusqK0peUynCLSd9P8O4pOWJ5+pR/uj1R9i9+SQvPfMiz794hdu+5wNi9ru+IZphQdkswbUtMykwmGKezTqTQ6sMFTZ67j2FMkR6MT3jvZGtqzBqRfwTgKzzUcSPLsFyV9ecW/XVl5L8glUf7xthTq4NRmuBIajwtF5pQxSYr5k3fgtmhRo9aW3TOwRR9VqViBQnhBKqP7/ZwT8a+8eoRgD0Z5dx5OQXf53vec89PP/MV7nnHe9jf3WFL+4+wCKsCZu1aDwUUtYCQcwIUPOcTMRSCwsXIcodNa+fAqjZIYrfUiqLQbJHHVkqLreIrPYuwTSxe+J2nnvuOVKwyP7eVca0YDx6gnpWe9Tm47lgWlB1Dzg/tCwYbfYrioihcXU0rAZGAjkXbJgV1UYYDjPT5118a41EIvdCPn2Gz3zpYd5x+82cf+lr3HzLTZz8/GMcXP1dsEiaSMTialrDoqw8ZuaCLcESBlswdt/blOopTXGzM661k1IkFHn/UxodvKUde+udkDSObb0xDlE0uTbnb7sitEvRah1KmbRXdrFSbZXJU7+MghXlIRTz6GBpm1lYEGmZRh8DKbvVLxShYXvQxY8xhEjuwv+20DVV650UFzTWtMymuwvDgiuvn2VcGG+69wx7/QT5iQOGq5m+DOS8JsQgGph1ahUWJfSEFY3jKxNxkO82lEqrlbhQjGZfZREjQ8Qs0eKCf/zc3fzldwykMjBdfQybvslLT32GW+94j8RCm7AaPdxzR8q8OTO8L/SLyUdqG3KdnwmpRybTMi66Qnyzm3M8KCYP7tzx9+bGM4N1V5Fbi0iE1gPZNHffjolmMESp1qemQKdoRnZxXZD52ykT3R0CXdAdDGcDcq1UplY1mg+d0BrLJGpiqFX0sO4HWRywVl2EpkJPjoSkZy+IVjdbkAhGrrLH0ofNKH1dhVtKXYCS2FQQNi88gkUXTWoiFzF1djHw0hOX2FlNHMQtWdcMzxLQZzsXFaB0wYAxWePWm2/i2uoCBzaqeO5S0bttQ6CTVoghMfXKupZDDVGXC2Khv4Bgxhhgy/3vrWVmTv4Qgg7b4M9CN0LVpWO1swzR1fn4exiYPB0NAiGpM+9uIbaujjeZj/KD3oHaO7k1wpDkGMBYmDIXqsGcL9yQ5iDOCu4gfkoLXVS4HghhIthAb1mape7O/+R5HP4OKAdCn0EMgy7C1Vmeffw/088/x5gq19/9Zj78zWM8N5xmp5+nTaN+xulAYtg4krYW1GjUrgK5+wTNshwKPU2k5pHKHRZJl0+I0cO6jGv7gZ00Us6/SmtHuePELq0nsAlDJLwK0ocxx5OLJxEs+P65Ug3GbMQkF4yeo+KTY2TDDUE00Z6pSfAaMz0TumwF3yr+7EffZ8/rwmpyhUxdBachJX4IIyq/jCEGWj2gVWMckyBfMTAWwaFscFsjAoYJTqX7ptXu+hJpOSx1rA2aU25WzIGeXGxr0lIQjHT5LLddfIFib6ZeO8+p03fxuadfpC+OEAowRBee66izGDa24Divk7wojF16g5lN0DfZI5rKRLe0Wu9q1E3TrGoai6t4mzgSGy+8+jW2r93MzrHrSYXIYuc4w7HruPLatyB9B6MfYmYuLnK4SAgemaq3TgdZglIk7uhF47wYYIoaz+u8qFoDtEBPDUtC8NostkO+3aMx8nPnTnN6d4/Td76Ny5cv8nt+7w/yC7/0s6x+4MdYbO3qKw2RHrMIe6EQa2IcJG5ZWcUGWayagwHNL50WIefCYlRVlYIUtrJ5yaJYzKTwzJnJOkMoTJNGM4TgiFAHqsSwUaPHOGDVgTBmXvG7oMzkB5X/XbkGrUnM162yDJB7okyFBfosJzTWjWaE+eUKgTpVpzsVuQNqA6Tu7WYS6NWJVZs4fvZJxtNLVq8/zi8/cwPrktW9lM5yuXR/bMNyYRxHDIWuhHF0Fn51KtqkAzsXYUPHUZdRhJYzZo00jpxt1/FXPg1/7a1f4sY3bGFhwXOf/WnWqz3ufNsPMxgU767VlRTXA1SyN7cxSEEb/bKdFf46KbVTLH6RC94ijYEEOH6hh4aRNt99U7i6Wwc7sRtT8326HyyGLpV1UzyqgoAiIeBsbqmDa60skW+61OoiRIluUlTWw9VanDhpDF0UZ9ClMX+uNco4Wyxs7HRSywdamyCoy13XTAiIU26VyXeCCWFZ11num9C8yw+J2BulelFkzssP6thqcdOu5xPkDqE2Ekvuv3+X4cRNTJevbKx+HvoBrarO90IjBI0Yhz7wzh/923zy3/wfhHKVYFtkF/xRFaY0d7uhyUpsXXbNXlSsjJhcPoNQWdGk+k+9MvkiprRGDp1UMy1EBRCZ+Q5eq5eJSrHO0nQV5KZButYcHhTVAy3CfnX2epTOp/rSCV+1NZtBQzrog0/6SnMmvDtaiIEa8D2xhJGpdp9pdV0q+HNbXRhG9Pd27v67r0L0zDYLtIOz/PaH/jJDvMCxM2/h0vPP8eHfrnxy/ww7C/nPF0Og50IKEarIoWEZ6HWgHmjqmCyqOw6BkleymwUIcYFNE5nGcjFSS8e6RJxpWPDszoIzLXDiSOPt5RKP1ol1Eua6DAM2rWk9e/GDsxmkA6jeKQYibaFmKKB3KoRBegy/6HrX+rI1uWBS1MQt+JmpKZKfNf7/BYSUJ8g2dl3Dor5Da/4OxS0JausaCxLF9m6ElnXvBDW75uAnRtc1lE6PE70nzHA2wEQPs6UzKrq4d0IY1eKVoilpgJALqwhv+MIv8cAbd7j48jd463t+hHPnHueX8ts5Mg6eUeOpuV1ZJymav5dqLsyZI3PgmqYNlVZ0fsZ5pRpV7OecCVFsB6VeusnUQXfEBRcuPsVNdz7Euu0zXU2k5Zi49vIr2MUnOXbTm+FyIZvJh9qagCJhOBRQhEhtEz0FdrKxNrDkSvsUiVYozdwG5h1uGuglEK0oLWzeE1Upl81xpC1n0s5b+Nmnvs6fu/oocWeHJz7x7/hd97+VT33xk0wP/SEWEUpdEeNAsioSmAXhRDHG6CAFyTwJ7qtupRDTSE+H4p0xGJMZPevDzeiCoKqKmiwzFefcl7Wsd61jw0ibigTRvTv5TDsZC4FWZEOKReuR4HtfxkQoE70lJSvaimqjMr9zZZEGt6TI6RC6wyUsOIxFIT0hgZVEaWtsiIRm5ACpdSaHtlxn13Hm2BWefvpphnCUL52/hWPHryPXCxCM9XpNLitiKSwXOnB7LoQUCa3ToiN3vRNad1MVXCs5Z8YQsbhksdyij/o+h2HBehr5yc/dwU//+LvZ/+1/zptuv4nHPvfP6G3FPff9AYzgwTva+4sn66Q1lHBHDBS3rs3CK01eXPxiAvbUliXSilGRrKYCoLekqr3p2WxoP6xBpGhsQ5MCOCKVemlS4VcCcYDsxWwrstFE024uhYEVhVYrlcqCgWiJ/TBpDNcDU8scCQu0+lcUbPfxRfULTCsjIyR55VvXHhwaNUZa1RgepD+JqBvSdME/lz6wTFLadzRmrqUzdfl/W9Nn0Xqn9MrYnZxJo80FghMZGzAc7PMD77qbD338y+SasWGUK8QPGo2zZ5F6Byqr9T5/6U//EfZaxgisNlMedFmYW4iDRrXRBbalajI3ojF4TAPrKqqjCojMkASQwWCBOsZkmUIkDiPrmklRU57anK5n+MqusXAKXa6iOer71253EcbDzqgFLGlE1Bse6FW0vnPRoGzPKoSin/S9ZYwugSgL6QhwvU7TPjlalS0yJCJZCY7e8YPEntH3vvNzXg/O85kP/QTXpQPuescPc+nCM3x5vI9PXbuNRcrUUIjjrlDgfZ9sgRQSY22UtSZ3w1LOk1YbbZWx2LEifkh0O9vggsMyVTUQHYgD45HGf/iNgf/5was88fRF7rrzCL+12he+vUtsOQwBWvCpUqOF4GdtpRdhz4NaVehGDzOboqiDteiC56oiKyVs7rYtABLWVZ+wzGEZjcAQmrsZRAwsXTbclnVJYxKeprKiD4O7gEZCKM4fyfQ+ShcU9GcP+ijk/ol9sxoJNdBRBHGtlTgsMKBQGPD1Uu+MPbE2Tc63F0t2H/4Y//27T3L1wqvcdNd7yKvLfOnicXa3zmDtgDZubZJQW5Ro0BwCZAESC5Eq0XulkCmdXxaTVtLx8NmstShB8dus4OYFZvO1GHuF48fP8Pqr34Bl5ezLI2mVDzhx/RkuXX2aq+cueMWsfW2tWW1SL74jiY4cjFA6OXRwoRMlY3GghFHwgbKmpJGQRAmcKJ4HYgwhYR7PaWnwnU4TpjVNtJP38OtXLvBQeJ2bbj/NketP8cDrL/Dl5x/n2s23s7Pc0i9qkcGkmFfoUFD6myVKqKSsUT5O6+q9s0xSyJcuuGwrXUETrW0uJ2sKORrCSCjCw3YbNI4pxa1eakOjagCJ3dDFHRG0Jgzz6ErTFBHxErk0kiubE16ZOn88pUTJwtVWkqwzoWl90LvbEdWZR4vKYNDgjAKMSd3swaXneefxy7xw9XqO7S44+fIWJXVqXtCmfcLBHvRKWA6se2BhgRgCMS0IafYfqyOdP9c6JL0oo4cHDdBHRQrHsKRMmbAITKdu4c/83Nf5Q6eO8Z6bMqFMlGd/ga/nxt1v/30Mlpg2qyT93jPf3YDmzIM+77FjpDVzTQaauHSoEejVMQPyZQfmzrv7dMBtlPMlj+l79B0aLkRUQp0IKaFICR56JJngSuvWDkfSQaLE2t0y2yutB9dvdEaECq5Vwqi6qtiozna/GbTKECFZpzR1LN2qSyEr2CCHiqcVli41cHLuvcVBufVBl8/kTIFU+2aPjHeU1T38iaSiyia9v25FA3mPgwno8wd/8J384sce1eU0rb0jnv9RlzuLNWM37Mgu3//+N3NtWtFR9kXWqEAdU1c1MO9rc6l6zgbZsaqvIXpvjBghSY2fW9Df1wojgRLwJEkdcpO5x78DVdTAiP6/VnPJBXmyo04m5eIizp4iWOdOTkaJEhUOBJp19ou0FK37xKAXoW39M6U1zHe+1pT4aDSsVbe5aRecmizQ0bvWhjlNrm/er0gn1EANRrXEpRcf5emH/x6ntrfY25t4/Ymv8C9ffivPXD3FzjJTY6PXSCxyJAUGpxQWrQdLYxFh/2rGXIPQwwCLgRBHWq6EvtYEJXhgUfNVUHKuRoFz19/IffceZ12eZr1/mbT/LcLOgxSfPpZgtIBDxyq9al3aq9vQmo++WgdrXqwnQs4SUXdNSSsqQq11WpJlE89VCKaMF2g4pBVMBbE4NQrzimb02Gk9bVT11l2/VTPJEoRGLxmGgNmC2iMLmhIEuzRb1CZoFigcqTYV765fGjFqqXTrjK4zAZ9iDMaCgWZr4vOP8AMnXufo9bdy4dXHuXrxGzz20nE+cfw9LKkkBoKDhOaU0RADuU6i61aj2oEE2V08/9Y6vXQX9vXN+6cslCCHGJrOWXAbkSERoXWhjUNjdeU5Lp97nRtv+w62jhyQYtxhWp0V4jdpZBp6oGbZzmpvtJ41JnWv9hiNkiXIGIN2iD0umVqG2Mk1OK2rUy2TnLBUSQyexhcHI9a42SvWXFmMiZo1Mn98eID768OcvvsMV86d4+57TvHylz7Osn4/l956P4uDFY1J1Y57OckVBnH+Qwnk1BlDoBRceDSJVhgSvQXWZNGsii7vFGC/+zg1axe7MF041io5GcvYNfoKgVqMHiXA6LNfuBVx3FuDoL3kVJvnDYgVPiQpU9c1sxy26L3QWmcIEuHFZOTSCD0RQiV1YxwiU9FFQNTFWQpMUyEN2oU2izSPubz7yhe4MLxI44Cf+eQ1FjccVXc/HiWvXEAIxGEghUDtEy0siIZ24wtdDoSwITcu48A6BYYIvQRsKuS6R9/aIiyU+2BxZFhErO7wny6d4vY7XuGhH34j5559jEsvfZhHX32U+37wr2JBoT2tH9pDuxeCwT30Wu+6cKgrBnkDI+lulTHQNlYj2Zm/P5njgaNBqYLi+IWU0TNopnEfgz7PqVUf9Q5SAffiUhxp1qdaPI9eOo7BJwvdVH6U1jb7fu3cOy034qigpVkDMaZErlU+8q4mszYVkRGJ3ipxk6oYfCIne6RRSt10jc1XQ+5rpWwKlUrtvnLwjjN3raiGEJjqnFtQnZFvlGgcPX0D/aDQx+L7E8946MFXdlHFdiv0AY7kzm9+60Xefdeb2K8rrfNCYKK5JgLHKHenF/rKrxgLL6QCsN9Vxo6lEOgsovCnGo+pwCcGnR1dMCR1wNCoRBu1Nw6Qa9NuPkAz903XziImEhLchjjQw1oFS9ceNaPPNbW50JRSJ5gx0UgGqTpLtHZ6jPqefEphzF+DnglPqZCY1Pe0ze2JG9BaEOwqBOP5xz/Ea9/4NXaO7XDLmTu5sneNf/T567mcdjiyFVjFQC8DQ8i64KzRujpTVkUag2isru1JrNoKjEewAeqqYL72XJeABXeqmLJGQhwouZEWI6lP5HySn/n5/8L9txdu2t7mnVfP8Vv5gBxHgnP6BVGbmHHSZoYleeHx59lCV1Pm67zIKLtrqFrtdYhJvIXcVDRSKkOSVkXku0MMeqjuu69Fzp0IzZI+6RQ2ECprDUuOVAboiSjCHT0kp49KGxPdbh1i8KJOa9ZUO6UW4qBisKWA9cpggxMypWnrUfqu2Crx5Re48+WXueONnavPfYXTZx6krCq/vngHi9VAWugdjlGx2JjIpVoFaYInH3aEkhmTUi2NSI8SLqv3dByx83V0Puru2CSxmlv0TdkBfRnZs+vYuW7g6vmXWC5uJ9X1RL10jq2Tp8gxaUfUCima9pDzfoRGbIkQqzqjgY0qufeucTviKS9Mg4MlMDG6aE4Rnm0zluibHbl1+XC7V+ClF1gs+IWrb+GHv/ZZHrz3LXz5o7/AB9/3/Tz8uY+w2m6U0/cyRNmh4oyLTS4qy3owDKO3SPLRWwoeL9xl1SlNO98hSFFsBUIoFJNIsE2FGpWznLpsNrVJaNabHvb58+mx+xcavfMQpS/TCKOup9bRg4t2qGYuxnK9W+iJYnbISogd2kDrcg80OmlIpNppEh3TmjEV+YaTqQq+/PpZfv91e6yvLrhh9xgHN5/hICxYhsS4COyVyrS9y2AOUypVGI9RYqbFImGe1kYQgW6RogImECNCvIGgCORaaVMmLUaNc7sRl4Ewwj969BT/7W2v8947buXy609z9rmHecT+Jm//ob9OsB2lkG1S3HDxqUZx0p2ZK2S0DZRbwUQJ9APW/wNab5QgDz5Nqm66uSgzq+iJA8mJQxMQYlMcqCWtasykmu8a71kM5JoZLBBTYC8XYkyH2gGbLxShY3Ob3HIVCEV6FzCmpkCc0Cq5ChZTNs4IH//6wdqaCiHzCXTsTpRrM7iqa99LpBRdKPp8AiE0QXK6RrClz92m1lJY8FAjCdJE65RXvpfMW29NvP/3PMCv//LDxMXWZsQ4r2JqUzOg8MLMeGSLv/33v8iv/OPbWJWJlCT2jHEg96ZVYFA3PzXpGUYiNXJ4cEUjNXO3BB6k0+VOacgWCCqGSiWmQaS1KtJotkBuhdHhU9GkE1EGlVYNHY1Ct6Iy1+dQmAHZpyTu1HcWUpJ4M3iYVJCjaSYwmkOjWmuuSfL9txc5h9kL0ibMAq3mgKtZNwIqRscw8MRn/yntwmOM7TK3vvV9XHrlMv/wsTNcOnqcxZDINav2H6DaQtODYaT3Na0oSbM08efTMLBfOz1D7Cus72giaYVcJZq1LoJoW090y5C8QF01wnKg2cTDe9fzDl5l/8hJvnt3h49deIajN38H0oXPIDjv4Akuho0+OWyUJs5CD0EQpdqoQ4c2QUjelWq3X4OSR3udsGFwwE5gpNJC0IovBk2jc6YVX//kKhJq0pkcktiRIS1F8AxJLIgILSRaDYzJ3xEGYjQig6Qug+zB4MSRGAhNU+vQZXlMSSmMFo1aJ4hLFowMjIRnPsUdrz3B73vXgsuXKrvX3cKla43/eGGbvHuMBTrXFOJlEkU4JbE3U3hVa/SqBJPHOksAACAASURBVNyG+dRyFpoKf63HTU4bmgddxYEanKUS9dwG2GDNuwliVfdeJecFJ259M2dfzqSQhr9hR47/RF5dY3H0OmKVl7oHqLWwcLtbs+A7Vh0gaQiCTQyBISQJt4L7GaPEUnUcnI0MpKoxcm9Eg+TRuXPwSgiBUop0AxV66uwvz/DpF5/ijbfvcc8Db6cfuZXvfv8xyiOf5bUjt7I6dpRlCFiVhU2hilHkJIPYRJ3ChVe4eMnmJMEYNyNNEckioRuL4GPFIUlw6OpOXLlvVQe71aKJQgze7XQXAJrvZcTpb+7zDrNFLAzUUhijiF19hKEYYUBhJdWFY1V+zqAmVqOf5vn1vgYwM03achF4xFZcfORzrO55hbR9Pc++eo4LdpLtIycIcY21wHL3CGnUeK6v96mtaE9UEvSJPo6EYBrVulCn1k5MkVpcvDR4BzMkbDXRmyw4cUgukEKv2NYu//7re9izj3PTeMA9b3kTu8f2+ObDP8M97/nznpBmyCUN1qMuyKSurPfDZCxZBF1535sXA2AMUt/O4q0mMMtIpFSx8YcYmbpGZ7LuwdCk/G4tUGoh00gtUszzCHqjVe0dzTUQ23GQCDFqbeQ/NOtc9dwFJXFZlQ0xT2sWw6CR+Pz34/YfM2pXbkKYFfZ9dsjIo187PnGYd8Zz/oB0F/NnokmdICczcEfhIFIw900hYJuiQ2jdTm5aU6UUKSHwd//Gj/Kdv/gx4jCisKZOmEFNzcmBXvSspz3a6nn2+6R1x7cVwaXrM7QWmIOYplnM5DvckCJ1KiyisbRAD5XcO7SmNFREtmzVY7ajdAbRd6KNtvlsDLQa8Xc6mYS7rTUWJmEzQfqD7Dv9yYO0xhg5qFnOplY38CvmQ7t37+C1ptJBPMB86KKmp3Yptfvmv/MubFNEya4lUI0mEVdf/k0uvPgFrr/hBLfcsCRfOce/feQolxYniYgjkf3voGSG5bZcLUWFZLdOGAJ20N36tmRBJWwN5Kw1S2iFWoqmZX3O49DnGVonDiMUeetD6ySDevJubrzjOMvFxPbRXR54ZZ+ncwTLKmZQ1Hth/l2Dr46lXQk4ZMdH5UPs5DYReiP25G+9ioceBmotDDF6MxdIFaqpWInR7cFmtDbJ/VPFAaltRnMLY95zIcQ1LYx+2Ypf0z1GGdohb79LM5CCO90aDK5YtKCJQfNVZWrdF1Z6rjuBhVs+t19/klvOfZbvufMUcfkGbn/TLs999WGeWt/Oua13EoPWIyENro3wBsJTW2doHSZBOVUXOI7bDyI3Sd0fo1YtDvGwMK86NU6ci2U2oX1R0C5bcuzmt9PPPs/6YM3W9jbpxA03cXB+jzIV1geXBBEIQUrM4GMXBoxGtVlYoIo6hMqqKJFrSOJchRRlyYiRqXWJnzsMBGpo9OID1TqLhTTq27zEZjRn4LexcP72h/jNr/8Wbzt+ia39z7B7+m7e++77+MSn/xPnHvxjcCQyEIgpeWcTqNm9wEweuiHRTslZlXBXJ5NSYrCkUV9rNArJY44tBEqvuvxLoY1R3WQcaLHSc2c6NDMSeyCk7p2BspdbK5TsXWUSApkYWZdMnQShGaK4CMshUmsg9soUxVfYjgO9rLXjmUfYzVi3wmiaIEzzhZyW1LbmYP8af/iOsxi77L36LJ+69DY4dooUEP0uBqwLApTXkzKuI/TpQLv25VLRwB110a2QFoM8870zLrfoeaKXzrC1pJaJHqPv2V2kktR1N8BiZXFil59r381PvX+LxeXfop2/zPqlT/KldeXtv/sv63ty7URz0lurndkO2H28qkCcw5FyCrqEWxPyF8Tf10UrZDXdw5JyJ8TkPmRzVrtWEAXDYiIi/rc0BxIMSf+gkWCpncGkPz7onQutMZqxi3IxwKmHG+FNYGsYuForKQzsl0JIRsoTDCO5FnZi0oSsmCOH3erXoNF+x/i+9qb9tUXXlohYZ1EOHD2zEFwIFDEVPX22E+GrE1/tuzrfPNNgTjL7xV/6PL0NbtFzf7Tv6aXrmkiLbVqrfPAPfJD/+3/7HkozqNk7Iz2T6rR1cM9irmiytVpQ4TzlSgiRdS+MFhhNmpYJ7XnXrTC0yoRhvUr1HeSSpnVnqKtgmkysNusKOMulMiYVZal36YxqlhAsxg3V0mqhu1Oi2TyFCt+WGKjOXweUJkuGqhjFpIu6Rz/MJIgm8SntUEZRUaCLtA1GjXDw9Oe5+NRHSFZY9MtcabfwM5+KnFueIg5iikxZMbiNTM6VFCcJQqcK1kkxUFrCktYjCoNqrG1gsRiZehZeNnQoKqQqgSFtsa4HjJaYVgdO5AsclMzO1pIYd/joC/De7a/ytYtP8N433MnT51+iX3c9IWkaN3VVPoOp0Ci9eTHQpc8p7sSySCNAV+haqxKNpzSPsJtDcDI9doamdYbE3CYvvhnEQBq2YFoJuBUHpR2WTNjaIcaRoV+D1R572yfBdQBxSFga1ZT1QAuiVcQIFSfmtUKKSZPNKKdWXCSGahQKcRwFG7JOxlh0yDYR8hVue+rn+UPf9z5e/frXmF7/Js9e2OFb9Xp+JX4X45CIRAhZU/B2uAbordDM44RTlEOoV2KIEBKlKIG3geKAuxcyQZCv2jsmcrvWGDZbdVGxE5rWkAHa1Gh5zeXXXuTYyTPkbqRzr776E+3KKyx2FsSdI6SLhsTr5klfneRjBY2mO0MYaLlACoyOlqQEejT2u/ZoVmXpmIqDP7w7S0lqnhn9GpNhOSqByZpGlnQWIdFCYpWMT+5+NyEc5eZzn2a9/xRHtp/le++9i4/82v/D3kN/isX1RzQ9iL7XjV68VFVQ3Ylmc6AJUTTCVvWzl+49U23aI3aTQBE7jODNHRBIhNrIFpmauv1WDKyRkMiG0ChFQRhSsDZ6DYoOLVX74BioORP8c9prYFaIJMaeyKEwOVqzuw6h+YgrFIUWhWpYUsHSesZsizdefoK77ryB6dJVLqxO8Hh5IyeORFa9MjXBnIZRP0/aGmgrY2u5S+kRBiNtLeldgsIADN7ptgCLOOqB+zb1aYhRpL68xrISp8os4sMr2nHBTl3wkx+7wntP3sZ7T77A1m5leP1h/ut/usI7f+QnVZw0sdI2nAnvduezV/azw4O3uk3RbzN1On6511o17emZWsV+xwtSkySc3LUDlNXQqOb0SokRCEH2Hl3MXZypZlxthYtdtLFVqaQY2O6dOIsYHdhUe2Vdja0Q2GtVymsGhhiYzLhqiculciIlBporrDUFCA2PTpa9s7ZCj5HcBE0JIZJNK6lYysbSCDCaVjnKV+j+4c2TA42K8ZUY3aFFQAzGVFf8xue/xVZc0fNCq4yQqK148a+xZS6NKUT+5p94B1Ya1UYwvJi3zWRhxv6KX6AfJbrLpRpuexOdsOdGTuqWc9BlwIzk7YVuI41CaN4NOyGtVy/Dgy8rTfRMZZNo0mApardvwvpUtAZct8LYA9HhNLMoUSsokTWVByLLG8hNYAUsdmec4N29uAbA5jNNPqWj61KsljCTs+SbH/tZUn6c3e1j3HXXHfzqs7t8/ItL2snrGIZtCSKBkYGcsyYGg+idYTuRhkTOWY4ki4Qxkfck3DRbEGOnlJV+phRJDBDQ/jo36npFNGOaVlgyvbdbgeW4YO9gRUqBX3v1CMdueQffd/8FnvzKw9x2ufHsyR+ihkPPOjRqD67p0V6790AKg4rKzXefiMNcJBstGJA8S6bQaqTVFbHo3u9ESIMw0EHFVEyJsjgmqiG6L8yiyLJdIt1VC7A4gjFgSe6a6uuRaKYCrhcIiVonWogbVxhN51voEEnSHZlpDVeKHFi5sogjNhjx4rPc/di/4k/8vh/j+a99nGl9lnjLfZx7NfGx+iDsHsGyEyGbu3+YeTKT4sZp0LsyITpyP3RpUIQAbgzBtIIyTco1HdOzFpPsg8bhWi2mSOsF65EwCM1NNPYuX+LETW+iXDvQefDYp/9BX7SLdArrOvGXXn+flIbNSEn5ybGL7x+Cc8qrg1KQEp+5Qg4eDdyVazzva1NQl9/MfcFV7os54S74CxOiJgNKUI3gYqpgSxbXzvH+/ggf/P73cfXRD3HLmx7i0vkn+Re/8C3qD/05FieXDEPALGGl0UlYmwRg8TOQ3ohpkPcyeFW+roTRXE2qCj5Gjf0luggby475HrbFzqpoA70ulZg83d6FQxZxlHJiYcKPxij4Sw+ivmU/FFNrJEusnMTXZyuKj8aNRuxdGNHG77B+pLmbapXQjMtfeYx3rX6d645E4tEb+Nknj3H2+ns5VdwnkCJ1Ui54opFzpreirrcX9wcPPnKT91VJakkWRlewt9YYtpd6UGtlHEda1W44DXIIpFGApBrE52+t0eNInxpvy1/hv7ntGxzZvoH93HjhhYs8+EN/i8Xxmwgte4c/HyyH9ijw8aKrpxtC8XYfcZuZcxfm0av+jDmDXp9rYzBxItY+kp/vSHz1UDyFKzmkx1zIiavfaZ0DOsOM9O0w45trrVJj93Zoy7HI1VaIw8CyZIY4ctALrx9kbtzeYTdqpdO84eneLWcauVXGMEKvG+3KvG9W8l0kmhcNc5PaI6UXYbvBXzZ1WFbnnbyP4IO0FPPFVsLEEy/AI49e5p/8rb9LW+xqf+7ToNCB1PlT/+Mf5rm98/zk//JetoaRVTWqi6pCx1XZkWiIZYCEZitTdzqGSGlBjAX/EQcStRcq/XA3b5Hk33nrkWY+GnUqXcL87HFNkRcfs/ixBwkoaxU6u7hmKcZIasa6e3ywB3E1d4oUZ6AMyB1T/VyIVXqR1LVrNldfS+Wvsb75uw2+Pw7BA5EgVGNdL/LbH/p77PSLXH/6OFtHj/LpZyc+ev7NtOU2YRxYmK+vatWZWzI1r7UOKYW0vU2uzmmZDrwAlv5AIDHZcqf9Pe2ITdHFiiyWJqOgvXMpEzWLjBiWS4Y4wkLMke1xyauvv8j/+4MXmQ4CLz35LP96fQfhbe/Xi5acY7ChdbKZWvVpHkvbhku/ubBKdvS6cLd6fyLUNV1lAaSI0nB98B41mTZTCTefgXrufO0yx/A2j+4Ns5hZxW/sXQyKXr3pUBR8NClx9R3rXOgJfa5FVmELSX9PmxgorC9+lR989dPcf+/buXr1HMvtkbQ4wq9+5Is8escfhWOnfL9fNmtMwO2k83opq+EJgyZIVZjmISY/vyT2VHR6UiHgZao/YCqEXStgjiTufl7SNMOLZkxtiz8T/ynTFLjhprs4fyljj3zsp3psl9m7+iRHj7+Rv3DhIWD2TPsLNh8YpXokcCAmARuKVUYbfCcbGaO6qcmlg9shsK46DGtujKGT3RZkJshN6IHSZa8LlmQZ6bLERdP+0MIA+y/ye0/B/evPsLXc5cTbPsj63Et89rHneGw6Sb/3Iba2d1k0Iwwjra8otTJ6uEt1StQQE913QLJMZR/ZqzPSCwutu9c3RHqYA2N06axLYeoQYnfrpQ64OmUdOg3ZtIbEkRT1u6eB3LNQpk2+FtkijbVrGNZVY3DNTJCoie5FCcLUugBp9jXXaqzyivdd/Q3uPmk8/9hX+NC17+SZ8Y3clM7y0rlXWFx/nyt9s3aiQF5PmMGUV8TgEZdFQIpcJ0a300wlk5aCV2iK6IfmuHDPdN88G2ncIlA3l2/c2sKqNAZjGgk9sK6JM9OT/K8fMGy94unPfYrzdcnbPvBnOXHre2hNVAcfgm/WRSoEPJvBD/JkQeAUKnhoTt7shQPVlH7XHZQz9ariax75zmSxzei/MfnkYfThcmW2DEof0FrjWq4cG4JPi/pGwNZaJo0jrRSyT8e6CbjTEQky1MB2RONp9Kw05KVOfnkXbCNYpXXGFFg10Q07ChWKXePrbMYYpOge3GJUTPvCAAJUJYVZzR3CHAojIImeX7NOKY3tBWyNR/nOd//vlGpiIpj5VrcSQ+Of/MyP8eN/+p/wD/7+n+fBd91K6DLhzHHKU+hYgTTIrTCT79ZB/IM4F3lenU9FI+XNQdmk2i+lkFIQsS2ZBLA4/rkVxrTwy7dSWt0IIufpUYraJQfX1CgBsnt4jcS6865fKaKOap7XTN0vDj3OLJw8Kg2G5mSCHHlXxyFiWXqL9DsK03TtPI/+6v9FXT/DW9/1Q1x88cs8fO4Wfu3CGdg9wkgixEbL8rLHFsgtSzjXZf1LaaQFrVtzzlheKZ8+Gi0E6lqi7FbkYrAqRGwpwtmSxFFo66wsFA+aAUjDgnG5IK8nfuS2Z/n8pVt46vIO7+Zr3GuPce+Db+Oli5H/sH8PF2+8kbTwt6QcBjuhb2gzip7fK5sDuxxnPlhyyJnRrVBakIivm7MVgl9eatiaizBnLYA5S6An6KVC9gjewaDqpxiD9Ba1d4iVWNwGHCqpR3rNpLhU0Tk3EqETzUO+QpAFPE/KlQgL2v5Zrnv2C/z+Y09y+szd3HjPD/Hq13+e5ZE38tiTZ/m5eh+L4boNQ2S+N+afey6SdKYXP9mc4c8crhdJ3TY8f9kjDy968RAO82OCL+sOeRUe4W0OKTLg2jb/5+2/zPryFYrtkNkl5XJA6mvWdckyr7TbNxdH4Pt+YYXU0bt9qudOHAKxBCbrWJCwYtK8RqEhrVF7FJ+cTks6JEotSi6qjTatZcnyzra2rBGnzR+cRiK9N9pwB7987oBn997Ij96/4oXf/Fnyhas89Lb3ct3Lr/Lxz3+U6e3fx4nrThIQ3CLGgal2WQNxfnzTmiKEQC5rdaq1koJoa7UpmtS6YUE+6+Qiv7lb6kOk54oIYKpqrWbt+M1Z4DVjpRBrIVliXTKT73jVVUBR9qyiZZsoitihNa64vUu2G3c9EpQnH6EzMoWJ7a9+lLveNnLhyaeIbzjDc48vWW8F3nv7Dr957RJnr16hHT3KEEZqXzPVCsnDbEytZ6/6PULXzqi6bWkYIj7npNIZx5GpFsYQVYB0Y9xaaCdbCz1FgV+6UfZXjKNyGiwk/S51j2eXb+WvfPQL/NUPHKHHwCn2WD/3//HEa6/zlrf/Qe0WrfjzppQ+CXo0VZpfJO0c+7f9TyjV3godsecNrQwm37+pZzCNyqP5hW+bEI4xSaxW3f7YzIU0UuSxVwslwqr7+LcHIp0hudq7NYINDEGZC8Vmoaiq8p1lZMwKsWqG43bD5nLGoqZV2EaBPhXJJBdm9JCYSt0k1hHMtSGdgzgxuO6mOdxo4Ze/EvS6Ph/TyFGIVkGPktokDrJR99f8kT/+Xfz7f/MVrK9oEXqeIC0Zc+Ff/fxX+PCv/F1OHNlh5Sl7jUIr/gw3YYJL8X+XJ00H3bXRG0xN70VrOGyw+6hXwt1qQJDPvlujZokMLUlTYDGwXwrLeZpHFzzFwib2NQQfx1dxM6Yidb/VBgG5MwjEIHslwRy9HUjOdqi+csHEq49drhlMVMNWMyTBtMK8LiIQ5gh0jFzh2oVvcXr9Ferey+we3+bahSf5Mm/lE/kkR3eWTHEk1sp6tXaegJFb1jSum0etyzY4jIM0PN3oKdFCJaWBkjsMldgqZVJ3awuB0tI40lcZGwPrnBlSJHWJm9M4MDXZNPPe6xxbP8a2vYFw/AZu3I488dodXL96hresXmH9+hXesX2Ez9QTHEwDaRB2WR7i5kWPnts5O0LVhfgxczdfW6WYkVzoN3jQVKS5PRhFcJuEfhEFZsU+p1J2Qiy0FsFkk1NsujRI0ZyE5+p5VbqRYPqOmXk3SFtS3ZJsBpOvsmhG7AX6AZlj7Fz5Bt/18kd56P67qDvfix2c5+sf+wdcvLLm0QN4/NQH2do+SvPpkM4sgPg7JiQpREVpe/FlXhB3/9515zZ2LbPHQnt/nyZZbwquImqN0J0Lo1mHh3w5droHOdI6rHeM8y8+w851d1FqJ8ROWmztUC6f48jRXbqN8jZ+2xg8t+pRmV4lBz0wHfNsdLd99ECpEyVGFq1rVGydEhTM0KK6/jEOlKZqvbeCpYERMQWsQBicv1xUndfmHs0OQzygp8Rj7W2cfvqrvO+GO9k6XknXneD+M3dx+Vd/lWeeepS9u+8jnjzJMgt36qA+PSRuewuu0nWANXQR7iy6pSVAqDNi0qB6GhjqLFpXxbhBeXYdYGGAVmWB0STBWJuYAsGUmr0uheLVWyldKWWl0lJkqbmTqjag+XgxOG9B418F09SyZmrX2Hv+Ze6ZzvL6K8bx48f5lScW1J3buCFmfu4L5/iLb7/Ck889xkfX76KMzsGvRZdMCDQfm8U4W5f0sNYmotzMkJ/XJg1IYYuCyJBDjBTHHM/PSK2a4LTanW5lTEV7TI0dL5GX9/EfP/wI7z5+ifsffIizZ19kuvoZnvpK5fb7foTGCMjf3JtPaGyu0j3jPMyYzARWoSPojCGwUDCPipUqXRGraaNqr63SvGoWZyCQp4INStBrNDKdWNXVmHWWIbBEhLt1APPoXyUJCkc7NgUO9UFK88vrzFZMHBsXLD0HoLjVsBV9JtRM5jAsqHTxCvBZyHw5TaWCix6tZSyO6rrMNsLbET/0LIop4QWnEMwSFM6OALr+/OprFaOTFxM/9sd/lH/9rx6hjgsGndlc2Zs4fWLgiw8/xeIvbJNtIkdXlc+2PAC3OAqb3SANzJm+xXeAEjfq9avVaYnd/NCurKvHXqOi15zMpwZi7qqMVSlEk0tjdoFEt/yWpndnVQtbw4j1KnBWwMfyojw2fDUSRDCc13FEjY3n9cL8bMdg1CYc86xX0Xuq70UHvXmRUUnXXmZ8+cOsjh3njluOU3eP8F+fPsYn+xkWW5GhCcM9lTU9S7BXTe9f7n3TeFlH8dFuhTMzwjjQexQGZRHpPdJWc1GmjIo0DprrjvpdBp94pjQKdFQ642KLygHbVyf+uzcf8IVyJ2n3BEfLVb780ivc+8a7GbYu8OY3HeWGaY8vfvVztPt+t56a6NCpaL/z8/CONiY1EGnQ5xYrpJDo7qIwCQgQ9C/SU3N0slahxb8zwaMcENQUb6zvxOmgpRPHgVYaROG8JdD0LrtX1ydIfCsnTPPQpCRXUZMPP/ZMJVMsMQ1HufXsF7njyY/z4AffQxhPkF97nBdfeI5h9xS/9Y3Mt976QUI6TrcVpSukx7oCh1QMsWlc5vTTOVipNAl1I0YtmZRGQpgYrXOldL1Pyadb1Qi+lgseCb8JVjNllah5URiSVa1ix2nFkeMnIUROHT/BuQtXSQf7hd2t61iZ1NQ1NIbCZvfUfQ86+5Fps8hOHWrrTdGI3fyAlDe+D7owrE4wJqUDBuRx9NFf8WLCuljFwyKKbjWOxNTkTx9EZEphUBdYC313i1/bu5enHi/82Hc2zr/6FPWJx3jH976Dm17e4yvf/DBnT91LPvMAYdgisaKU5mFB0V8MiabmzmMOdMCCXkAkmBMcRiNT2bL0u2KwNKXAGUbNHQZZiabSWQwOtwna59eGcMQW6SFQfO9oDmVbpIV2eBGqj7Kq77+Si5JKF5AI7wQO4pJLj3yZP3nHWfbWkeOnjvMvP7fPFxen2bGrHDt+muOnT7I4eh0feMtv8O/+7VcZ33gnR3a3dUHKN6hxuKnYSDESklFKZEyRUmTvarnSI8TlqG4qSoCoVURzAaVe2Jr1sOackRIz0bO8rXTI00Qa5NL4ysn7eOV84XTeY/vUGe47/QCf+y8/z2uvvcZ3ffDHIVZKaT5q7T62V+iF1jHzi+08Ad97d3SodP/dDNl6QrNDBwq6fWKV5VX5DFWW167LZQiHe+pSCgwRMwUyKbFQK4A2CwBDpDetgVqQYGs5BMJghDTQ65p1CIwe0mO4BdVXDATNM9qsT/DufsLotZMJdEsIY6KiNmZ1Uq1VJgq1JyLmz5pwvLh4szVziI507TNzohNdwyKj5UGuXL9zhb/+t3+UKwcDv/jPPsL5ly7yU3/1R/mf/th38hP/8JeIxxOtNKpB9AlN653cBeBS0Fd3Qp2nEXqhogPLVc8cdvC9NeeIaJpo1mUHCxrHa6PrJMiiLqZZoIfG5MVS8DVNNHWJ1d956SkGei9MJhuotcrkFMHNz+DTuCJFJ6O/J4YEdOYXTsAdAe6DN9gcxGYRi4IM5Qvforz4CV5+/Lc5893v43La5unn4EP5Tk4ePUKyxrplhqhJwRCj+/UrIj0ZMRm1wrSeCCEwDIPsYF27fa3cCq0kwrjAbE0YF+5OAQqkEaYpC3IWZEkDA0tYmEjsk6/t8+Nvf5LPP3uci3ffxdFF4tr2klO33cxHvvktypWB0/kF3vPOI/yJB4/zLz7/n7n8rj/MGFZE0mZFNxdB5iwZs6Ri0MynZnI6zZZWM90PCrVrSskM84WXVUD4pC0ErUFVrQVyk9hynsJYFacCGqWuXcelNYAiqYvOJHfIaCboNu4mkuGSSqlGGTrHp/O85ev/kQfetGDnXd/DkbjktSd/HbaOsd+2eeHVYzz15u+ljwtCXVGrA8i8GKUdakJUGFaf2slpFnxCGFwoKidNhmZcCjO3snkCoVDAsRs1aU0tCYy/R/MUEX3Os/4g9syUdsjrEQtXePnF1xgXN2Ff+vjf6+Xqs5R6lZM3fwd/5pUHCX2CihTurTkWsbpIzhWnHAqvJNbTTjX6q7DuGrPuRCO3ILxsbSxMI+PixDpy939XyF1ihS6fHnXKxJSwqA45JY1vapZvufbG1hPf5E++6TXe+cAtnH/lKnX9FOGGh/jGVx/nyXaCq0dvot5yF+PyFNFjZDVO9kKg1PnUoHchQSWOss2OeCNCSYl1UTBODCP0iVAaNRpXJ3UWBVlGFhZZEH2ndegJni+t3iUIDFUAjOo77YDsYKVWXRjzZ1zUAUbT/vNgBeGbX+A9xx7ngbtP8eTXXuSFdjP//KkbWe4mbrn7DqKH57C/5n3TwyxPdv7pI9ez3rmRNCpTehxHpvW+xCQmm1aIs4iuOnxGrfOwSK6Ybd8mslOVX32/HGNkGBay3ny+uAAAIABJREFU0WXtb3s3FtHtmcuRXMoGpAOQFtvY5cv8D2e+Cq98llNvuIfOCV4vJ3jgB/4sPQz0NhEsseoTvUlYM4++566sGc4UOPS8V5u1AoO/8II7zVWzgmR0cckvHpmCBKyLVqkF1jNm1lQENN375A7JNQTARjSYUmK/ZaIFFlFCwIYgKd0vFXOnTI9GrJ6PERK0iW5xk1hYJqGHW4DSpHmYamENjAaDP1PRVFA2a9Qm7U70kJCx+WeSgmdQ+OoH6RJmEaWwy+ZwLj0HI5Url9f89M9/ik/8+y/8/1S9aZBl533e93u3c+69vfdMz4pZgJnBMtjBfRFJkWK0UmVbkWQ7slKS7FIsx4lUdmIl+UBWJWWnnJSclCKnKlIcyXacRAttbRRFCRJJENxAEOtgAAxm36dner197z3n3fLh/57bEL8AIDmN7tvnvMvzf57fw/xDh/n3v/F3abQn+Bm8j2SdSLnFBzDO0ngvqZjyvXacjzi9AYkq0D03PufpZ2iywuXIWIFzjtgErM7ELARKVeb2c8rR6lww0KnEAWUG3ZkbjbKoomaSYvl889S3U+eysGqBbaEs4wLK6StBlgdVOiWUHF6s3sXb6pin77RIs51/yBJUpDaa8dkvkIdvsn77Fe576OOsvv06v3vzcc7bFfJMHxcjteuJKhpafBOmPBQ/HsnXtYbQtFKA5RyVGwga2cszplHoSuN9lJhfVZH8BKWEKGq1IRUvV1ftHFJDDHKw0BraXFNHz8/f/1WOLO3hX258kEH/IJFIVp7VmzfYvL6Jjp73Dd7h7/7gcV56/jmOnnicf3GmZfTkZ9AqYKxsWDkJowC1y2jRmGmKqjP+iQjT+czKDV13zyAoI8hfyvoZoxfXv2QOyt8jSZkoG6uKxciZmoISZopiTpQq9xwwPoEz6NBKj0Mx/pI9Xg84sPY6By+9xA8/odlUy8wt3s9o/Tz7T74Py4iXvvCbPLfwt7laHSIaIwbmQsCtlIyMKK1+nSryVw4CMUw9Kd3PSDc2UpA6T0Ts1LrSAaAiSdviUJIRqcq762nnabFZlaKlhIqelln+m33Pcv3iBWYX+rjeUayPLdZVzC+d4u6di+j81LtmNB2ruGAsyWhld6VTMjlJyQ4UVjMZtMXkIg9HBSoXbnUiINlqV2Z7gnyMYIV7n32AsjnoqhL5zxqMsYQ2EnXG2AqtMjoEhg+e4l9NDvOVvzjDL3/6Id78zmtUOy9y3/wm73v8Q9y7fp0/+/ZvMdz3GOHQ0/h6hto6cQm3sdDwIHjZyLFGyiyIpGSKsztNZ/JaG7CC9fVJjFttzoyKccuiqEyF0xmTpc1NGYUJ8tNjbFlQED2aRIsukY5UnP1gu8yqkQOVSNSJYBM7bSK98EU+ve8W98/NcvnsGV5OD/E7Fyx7D+1j39wAV9z0GE2em+EPbz/Nj9z+C37g4ISv3BxzK51kZlDhc1tewJJPJole5JTMinVEKVvMf1BVmSAAdjGi2Upa3aydegli9FOjYAihUOHkdBtbT+0coZPwM+jQ0PZ7/Nbtx/jBwRZH9i9x/ex3WZo7wHf+8Jc59f6fZWH/Y6RSOCP/GksomNacc0GKyfMns7QMnSu88ARCikIlK6VHKoNVYhBMWtMQuA28PW6IyfNUf4Y5I16O1BlWDbSl1U1gIkHc6SmQlAWj2M7ClqtyIkWPx2ALb0JlIcsRDVmFaVOfzrqYjkyZxcoYLRs9NaSpnGhKexoRxlkxiZJ17xcXetkBEUaEGIuyEnOb8qq448UhU9MZHMVwJs2Pcs3WKjAJCqxiaf8Mt27s4Fc3eOavfT8pwiRaOYQlmZEbJN899u3UL+FTQe6WiJNW8v2KxyGW26AiKRm/WC1FRxNE4Zm0kYERBoLSSjDZ2jJJibuqxUSReIWqKIyGaf0zgiLWWsk81yiho6nS+pczXktDYcwRnQXKVAa2ZFW4E6qYSpENXsZERc81uuC/u1uezGWzBdOM2Xr1S6jtV7hz7TL7jy5x7cpFfnP4OKPFk8wiZr7gWnIEHYLEpV1XLx6KvN8Xo2IQfw1Z41XGmkoibSmgtCEEYa8IQEJSP9oKwyLHiOvPytduGxofMa6HsTKZaXxmYecaP3rwLCf2z/CbZw+TDi4x8juoJKO1mf4sN5rrVMby8mgvr53b4ZEPfJSdexv8gyfn+K03/5I7D34Mrb0kv2xJR3SKgEpCVewUx87YXBI6YqqUVbA7KCalUN4L56IcnI0pbYK6kC4TqJxLTLfjCYjKJZurHHBCBoehl1p0tngS0JKDg9ygiCgPdRyxcvO7HFu9zMnD4I7N0PYeYOfKC9x3+H7WL73NrTM3eeXGHv5g+e8wbw4KkTZBwlKV0dBUBeksALA7rlTdxfndhwI1hU91BllJlIjSqrIuXQWmHNtlRJGNK6q7wJdyEp1NGVGQdVHNrKkI0bB2/R3mZpcZb93GuRXUC8/+Slaj6/jxbXrLR/nljY9hVRJDWMdoR3j0uxJGR5ISg4dTmmwsqhiNtLL0dSJqoRh1v+hpEUuUBVi43kmkLzm0iMQf5VYVKZt96k46BZNLlPl05bDBk1SFaSxu/Sw/tHyGH/zo+zn39d9nvBVYOnWKww/8MG+e+TK5t4ezV15iY/FhRjPHMb0VVN+CnaEyfbbWLtEbLBBtT+YogWlMqq8NISecExJcjoE2RUY5EkOR+ZGq2Eo5SmmtOPZR1GU+48strktB2CyRI5BEQGVd2aiURKDIqFjmRlazvX6XI+e+xMf2r7J55x73H97PF+8e5PcuLjC3d57FAwfZvzCgaRr5vDRU5fMbXrrK9y+/ThiP+OrdB3gjz1HNzFNZJ3IbudSLKlRV6IxNKzcpg/gFOkVEO7RVspiGojQoASXpEjnSxohCEiPaKowXIl8us7xsDFXtUCFjVEVVaSaM+Yh6he9/1JJu3WI7ZtYmirljn2L/6R+F0JCTmca+ktLk4Mm6ixmlqbO/i9p49S61CpnJ7qpXuvQQZCZasa0UN/yYUdDMO80DpsIkLwtvytPFRJUTtldZQCtlBJZyZqLF3FarPG15C0pumVXfUIeCkibRlkMhPpYbu2ESfPE/A9oyCqJ2+PJeZMXUpJuUqBCqdAMYVd4pZYjGMPYeV9oMxa0epxu01aV3XJYqQu7GCkWJUnLj1ilzYDEzo/axlTe5tZWwRkyVPicoip9NuaSD1NR5HZK4rbWS29bIe7SpRUkxuXgp5Ef1pN02T2SzMEpw3T3jMDmLkhQzSWtcljiyyQof5TPqDss6xSlhDcTUaug2nCzdCsUbIT4eyZSjxAMhICCZlccuAo0uylW3cCMI6axk9k0g2x7V9l2Gr/0r3ACajcssHXkPr77+Jr+/+SHqlRV8kvWjU66il3jnpG3xOdO2LamVEiE918c3ogjE4RhlFVWvjx0MaNtWuBw5k9sgNMDYljW3rM8hk1qPW5gXVHcbmYzGEtkto55DzZv8wvvW8CP43cvHGR56PzmMia7ClR3ZVJb19Q02Ll+Q92Uj8Kn3a/7Wo4c5/+pXWDnxAL/znYbXj72Xes+SzNhTmoJ+UhJ+Q85xmm3PWuG0o6MlqgwphWkBUKccdOAuUWSLGtPdqim0V+mG31UQkviSZF3VGHbIVhPp4ybrHNi6jtpeZbEGffcOy/019idN30bmDh1l9sAJah+5deEv2fPA4yL3je/wp2/N8vzio/TsCronCpOUgMoz1/WYZC2XY6b5/PhXDjqSCJA/k1Ux/xVFKudclA859Cvl5DBQkjAaafkUeq04ZFQOpHLUMGrXJN3t1w5NEwz/sPd/s7E+xpjMxM+jXnr217LTq4yHq5hqhn+y/XGhZiHfUO7ALClL8YYqMNOcZb6rBKLQKpG/VAl/1yrTOgXZUkGR3UWO0SiikXmfMQaTmJ5mI5k4kVuELoUQpsgz3ntSimgtD4hSCqsNOiWCynjr6MXE/Vef4xODtzn95DHa9i7DO2Oq3jL1qfcxozT3bt9hvHGTG+tD5uYzd2+OmZ819Aaer7/Z4h7+KKMjH5NubKWYILNhEDAOiCpgrWGcI42P07x6bazAfpQ0uamkShaZwh/Q0+gKUR7YVDYvnSLoahqx1AgAgpgYV33y+Td4dPVLnFryzCxkZk8+zT///67x6t0Fog889sH3s2ffTJFdBRIy2Zkw6NXy8EfPZP0Oz4Q3+N7TmhdeN/y7W8vE2WXmBz25Jecksn3JP+cgo43amjI7l5igMWYaJVOqVIqW+uVOeo7lgJeUdL/XlSPHXEA1EVtXoqbGhAXpHuj3sVmxeP11fuiBq3zwwx/h7ef/A3fvNKjDn+ThT/99dJqUE7aeHhzFRNZR7kp8LuvdUhalivSoCnOhyNGlZStb2NCK6+1EFpqoOeV6mOQJRepNRja6nOO0TKgro0nowohQeATL3IvlM9KZTSXRxTpr9nR5ZpdJsfseI7oc9LqNrIs7hpQZFq56FwHSZaEYFok6K/FfVEpuAcaIFDpEMLhOCaSmLmCprMQdL7K/hRSnv7cOfW1iwllx44dGFtYMqMpAqdBO5NI9UGiIbSBoaN810kpk6ZFQkk/3UQ5OKneHENGeWsTl77SiYfdgIzl4OThXiGpI3I009or02TEnlMpShGSkf6RTNI0Y/ylnHGGSaFEDVJL4rSnGNSjekVzSOaa7yeaiQilyilTKYo0hROkG8bdfwF35Itv3LtNmx5GHDvFnby3wZ1v7MfVe5pRCVzWoRPBpur42rfQK+BwZjSa734NxaKsJoS113RXaZmw1IBY4UNM01LVk/qt+Dz9pplnzZDJhR2idtleLQa7N5HZCSolDO1f46SdukGcX+Z0ze9k59KhI98j7q5BDZQL6/T7f/cKfkH2DSo7eIPJrv/gxrrzy59x46wIf+tiHePalHZ6dfYR86BiDWtpjrU8EJ+RSFWXj78YA3YFtNyIncVpFKDX0qtwtyu9od1+bvivdSC3nLv4pCk0u72fUFqUrGN7g6e/8v3zieM2OSdz38PvZvLvNwv77ubu5zrETj3H90mss7t3DN3//1/nID/04O1u3uX3hBTbik/xuOIiePUXWLehK6oC1IWcvKo4RWqgue+G0gwNFzqbEvmPZ7HfHAl2YJyddUiQecU7ZcrAPOKOF70GkMomQK1kDNCjs9ICR8y5IrfNJFZcvPll+wf4bQqOYnZ9h2A6wbTtktHkFWxtUvYTODqX8u8xTqpD0MgmHbz3GSStT0kx/IT3jCJ18aOSWRVvhdItHoiu1zpgkr6BPUCtx6adivlBKDFS2spCK4UYuaTKvjRGloAmNmOZ8xPQMo+AxlcPFiHaWd458hBu3Fvlbd27w6NGT3H/sKM2tt7j0nd9BH3qSzXvvUNVLHNs/w/aO5+TJJfY/9F78eELPfp2z55/npp5n9MDj+CDOcF1uJjlLwYjU8Sp0EPCPDkrc8EV2TFCcu7LBhWLyiLwrliC5OzlFFtkskiEbaqdo28gka1S1SL16jqfCs3zgCcXOtmbvg8/wz/7gNmdu70GlITWW5ZV5vG/R1hKiGBedsWyPJxhn6VlDvbyPS7cTG+077B3c5EN2zEvbmh23B5UTVVWRtWBYUEqY/+Wzz7qMgzIlYmWn3hBtDWjhJmQoszmPcpbsZW4XysVVaTmVW+uK6SoSQiAqhQ2ynW4efB/fyYe5/+JzXD1/kSNHH+b2pS9x9cVljjzz48B4WkYFBWaTVXGNFylWi+NcPKeKbERxGaBIxjAJQWKEtcH7SF8p5pVmnDSLRkEc0eYSb0oJ7zPeiCM9K3n5SBqfI00M9J0V6lpM+JipbCW3MMSwpkrsKJcmTbJCpUBlqqkxqPMlmCwpA6wlFpiKJxbiWcQ6UdBSkoZLa7TMaLTFGCW5eV0kRLVrTvNKYo+mHJ5TdzuOWmhnUbLLbfDT0pycMtjC+dcaGxOtlmOIYH8zUUPrpd8i5sQkdEmiUKKKprj9iz+jjJBCENNmNPK1jNJMYqRRQiO1MePi7kEzJ2iCNNm5csvxpOlt2pWZry4eloxkoaUS1IqpjgQ5SZY+JyqZeZRaahl1ys0RGaFBMUJL5DdnGV0pK1FmbxLB9Flsb3Dr279Jyya9GcWxRz7Kt755hz8b30c9N0+l5DP0RGg9RlnaovxkBT4EJpMJRle0sZUUTWiIURZzU4x/2mnatsUZRduMUDEyHgeqrGiaRjo7ksJYSwwNgUTP1MTJBB8lmVXlxKnwJn/76QnDrQmfv3s/fv8DVDqgnJgD43hSHPWZqsSmmbFwc4zpRbYnkZ/5Z89yemmbv//9H2D12m3et6dB3fwW3751ju3HP4ybmUVVUo6UUkYrUw5kptO4Cj2SAhaT+b3Wnf9Jfh9GFhUZ/+U8hU3lLEpRLiMZpQwxBIlgFpWmjmPmd65y/9t/zoP7tmnnDjK/coytjSEHTn2IbPu019/i4itfYu++FS595/d56KEj3HvzeXbGA75w4zAbB58hzTmMBmUquQyZXaKttiU9p8RsLMmDjFJWNrBOofgrBxhZRwC6loGkFTkqrLbitUrdXD+iVKEf0lXIG3SO5fDk5CJA3AWhUT4zWSLRITM3N8swBsbjHTwW9c0v/g95VkeanTUm2vPZ5kem1Kpds1eRrb3HuWJaiAml8/SUmI0lJ0NPCwktYamdgbYlaNAYaqsIShjH0piXwCtxQyuFzSXXaOWXngvpSmUkpxoDRKkkVkmMabkzmVQOpx3eNygrG7b3mfrOFQ5sf52PHfIc3Tvg2JGHGa5e4cADT7B+6wqmdrx15g32LO/Dzi/wxqtnePy9H+a73/oql/Z9lO0HP8CAPiSDp8EWV7gxBo1hHFOZMQoEKGoZiUwNf1lumIqEc7WQzrIoA9ao6Saa6YxbMibQqkInT9y+zfKFl/jA0g0W1S0WjhzlrVt9/sevtuz4PdhCkiK07Dt+iJNPPM5OOwKlRKDRchDIGZkN54xzjp3tLR5ZfZ4f/eg875wf839+27Mxux9WDlBpQ89BVr2ytRaDGRoVA9o6QttQ95wwGsphMMauJAqyDsxowyhmNAGja5ySzL6UM5WO7dphtJUFT1U04wmuMhLJyol9/hY/XJ3lsacOsXbtDe5cXWW48gke/o9+iRwSWTr9pOCFJM8FlFtGiaWV57hXyInGiMyeyvHBty25II+rCmKQ0/skSeFQMEpO9lEiPT1tacrGFsri1JQTeEiJntYMc8QkRaXLS54NKUdqDNnEqTrRGdf8lEsvxsBO6gzFn5CjSHwuyQLotcCPooImK0yxbgi6W7Lttph2ExSKoGG+zNA7idGUDH7MsphVViTvLmJnY0ZZLX6mnGmVzFR1EnVikqAuBM9oFN5LYqgp7XxJaekByQGfsiCvE1hXJNBWNtYJWep9VcZnMQlmJc2ozgmQaibJriwx1OK77wxmWrjqEqeUM1vnxjdZPA7JiMkrFwe5SVraTZP4X6SqfDda2t2idVnAxX0uRtNc8LSGvpTB3HuOW9/4FXS2nHrvR9hpWv6PL93j0r4PMjNYxCmNdRJvRitJyCRF27ZTpSHnSNuADzu4esBoe4zu1Tgr8U5tjYDUMvSVEgy1NoTYkpTDpkj0LbpXkSYTqAakthFTanTYtEacwHyzwSeOrfHIzDoXJ/N8zbwPNbOPARmso/UTcpRxZ4wBV9YopRR3tte58EdfpDc/S133ZJTbeua4xy//xCnSzTNUeQeqGd66u5+/TIfwDz+DrkW1keRQwOC6m51MH1NRnU1CJYc25aBYfFJAiW/uloN14CGBuclzEJSYdW0CbWQccvDqK3xm/hoqw8ETj3PlzNeYnZ1j6cBRrl94kxk7g6ojSytHuXb+LKPRmBfXF3l78CB+8SGitVS5RI/zLtVPY4rHSDZ8iYp2UP6MKsphF3NMRXWUdkhR2WS8LfFbi3BJBILUjdmLpI9BJQ9WEXKFVaH81YsHBrlY6SxsD5PFOxdDBhUxOeGj5h8P/gCPYzweMxxn1At/+T99rh7f/exwdImllQ/yD64/iHYekpTsoMqi+i4OQEhiVKA0GWUFsZgdaroZa+Hka5lROAMxS3dAKg57spYu5pSmH55G4iHWWtpWuphDmdWhNTF5UEaMXAZyKHlztDQ6SZYCcqJnKhKZjRhxvmVhNGbu7os8ODtm7+gCi3M95ivHa9sD9oVNZvqRvXOao498nBs717j09hpvV6doH/qkAEB6ltSMwUiJUAvU1jDx4gd4NwXMlJNX7hzO3cakIAWPcRVGaXyAuuoy7kJ2a7V0Sx849132bPwFT52yLM0c5ux33ybp+/ifL9QM/TzaCl447AxR2eNT5rFPfg9ze/YUAIuMVULIOGOEjd5xpI3DDz3P5K/z4QOZZmMV29vHn14Z8LVVxXB2hdyfwRUGunOOtgkS5QuebAJWVfg2TU+hcWe7dCkYTG+ANkqig1pjerPvOqx4HFD3B7LAWnkedFRTN7Szhr6t5BDqMz8285c88uHjnP+Tr3Ls2DHO3tzm+Kd+kWr+FDF6tOnMiQUIM3XOirchKtmkEmDp4DtiTvVlTq2Mpo1S8dQCLVKG02QlnRcp4HVmBmHQO2NlXm8obHtDjq3UTOeEswafIm3U7GiKXB05bHoFaybvkhgS5R3oYC8NklQhJnQEnKaJEUIkOwMNxMoQC8PeKM3YB0kVkOkXCRcjB8uMps2ROsNYQ531FEctIr381VJaxpSih4B25FAQ5abeHQzE0sqYTNVFj7KmLfhuiTHK9+J0KVdCsV1AYSaLQuYqkfejhgZTeg40qhhuB1AuFIoZCzkZ6tI3EnMqUr6YqFx557oZcUegkyx4ptK7yZUO2Vt+Ddgc0aVRpRt5JkWJZnUsDjHD+rzre1rQgbVX/w36xp+jqNl/+hEuvj3h924f5c7iSQaqxScnVE2VcUZUIe8bglIEn0it1CTHwpIYDYdMcpTfXbKEyU7ZJA3abzNudxgM9mB7PWFCIOtvZWSBaZTHmj6unsWv3yKHzCBbjtjz/M1Hh5w6sMi5i3c5kx7m64Mnma1myXFCKuZLhRG4kexyUC5h2hpun3+Hc88+S39pGTsYiNm7V1M3Lfc2bvKrv/SfMD7/v7I8e4j1ixeZPfYgf379MG8tHKQ9fJJAppct2erpzLpcVMXLoJT0J+TduBzBy2iUQuTsoo2wu0kaQ4qNpLyMQWOZSZmFl/41P7B3xKiBZv0G+06epNef5fJLLxJm9nLu2iphYT8zaZ7h3j1cn/RpDr8HzACVCyo9i5oivo/dw1DOJVmSBTrXMQmmReWivE+3d5CRFmn3YNCNCnY9AYGspPI7aYsV7n6popbaKaPlkKtcmj7PwkqgsBeKfy8U86UGlxIpGn5e/Tb77n+cGzdeZ2tjAfXtL/3TbCY3qef3srOzzn+3/QMYFXZPKlkc8TrLi4oWMlIsp0VimhqdZCWyOIpTdRLIlSIZO1UVesUApK184yGDKQjEmIQopQrlK+eEMhVdqUxKCd+2oBw6+cJNFwJWzlJN66qKFCNOa9pQNpckop5Tmia0GNsnhgnZe6yqxKAWE0+MvstPntKsbZ3D6nnm+pGb6xu8dHue4YFn2Fp5iOTkBl1lR7aB4CF1N0IQNK6XW5czCpLcEitTEfyYnBWV7uFNoF+kmRigVZ5ITWo3mb10lo+487z3PQuMNzbZuTdhuL7Fq73j/Nqf7FDP7KVWhvFoiMoBPRkX+Uuh9szx1Mc+QZUUrZObhs4K3zRY67CVeBRylkrmJhjatcuc2vo6P/H+FcJok9Ek8O+eT5jDBzlzN3Hg0INsbN2myTULKvDEngmn9zdcOneZvYvLzNdjtrY2OLY8y8xgjXEYcPbyFu95aD8Xr23y4OPHefXmMs9fgzt+jh1lMEvL6GxYVImgoTJ9xG8tka+q47KbjEYzDpkH157nbxx4jcHhE4xWNxn7ZexT/ykLhx8hhRaNoH674qqMSMrtVL4tcBdKrbLVJB/I2WBMZugjGzGgTaY2Ne+MRuzUEl/day37tIHg6SNO/dYmZlVd1ACB6+gk5riAZqQi45DJxtCGFqU0A+CA1kVJSihXMYrStbFU2AFN8tRoGsSY1tOWFAJKCVGzTV2RSSQWgFFlDTHJAdgUkyM6o5JloCS73sQMJIZlHt5H+gaMlkRDlTLaKNoyS3XFV5ljxmpXoozyz8laom/wGsgiVzbl35mjyOveexk7KYcnEHNg5GUGLHHcLI18TqifTU4oqzFtEmocml5uMVbGUDYbMp7aVWWD1syojI2CTM1dwqbEUVUOxKylMlzJexhzwCgxwFVUhJIAr5UprI9Y0iOikDhF4SeUw4Z2kBSxMgyG19l85VeottdRgwX27jvJ9dEG/8vZR3BLK/SdJbYNURWPQiwxYyeVu34yJmQgO5p2C1RNE1vmwxaPLY3Yaz0HZoZ85GjNm29uEsf3OP7gfpqmx5nr1zl+eD+zeoYbq2scPnWK1994Gz23zPWbkRvrI2ac573HFStzievnz/PMY4e4dmmNm2aBP4vvwS8+yqy1jFOL1dCElsq4v3JZUdGTlUVrzcVXXuXOC9/Ah0C9tJdqMEA5S2oLJwbP8myfPeEcP/k99zHQ15mbu59mOCL09vLt646zepHhoYfwcwuY0KBNhdKSzsjFP5RCK2br0MrhtZjgpIdDSKVaa6Lygs5WUWK6GkwUh//yxnXu/86/55MfOsRWo1i67zSWTW5cPsM33jG8/cCP0RazatYKV/UlQqkTDkmtBJOm6Zh3Q3y6uN20h0UJG4ckJFJyRGmLzkIWlQ/SyS2cIGkVpXFK4Fydr2TaS6JNYRUYgbDlFmwNWWGUeCSycZjsy4HICm7duNL7oMoouqglKaLLReQX3O+xtbHNvgMrrO3UqBe+9E9z3rqA682hTcN/sfoZeq7U6RazgtWa0IqrPIVQTBbicu8ytk3yKHr0a2gVCD/4AAAgAElEQVTKnE9Hj1Y1pu8KVCgTlMZZC1EWXkukDQlXC0cuhICtLCEaXA4kxPUbmxGq6tr1DNm3Mu+JHmsNKiuyKyAiEHiPUhLx0YIBldlRltuCVTTNGKsdGmSuEjMnr3yZ73t8nsPLmuHFr9L6Hmn2EOPNe1y+m3h77jHqJz+O7dXspD7Kb5Ndf2o66TjOOsVym5NTdUoJZ8V1HbXGpER0ipgMTHaIF17m/WqVI4ubHF6o8DtbbPsWZyrO3PQM69P861c8zfaOIDIBYpBa4bbB9WopohmNeP9//KM0OeP6A2ptxVVc5LbOzGSKa1wpSwYmPpB3Nom33+Kn3qM4lK8QmsDFm1s88ehpLpx9idubjn2HlugNr7GyYmjUMb7x5hqPHJ9hfTOztJx56dVtfuKv78frGV791i2qgWfJReYWDJPGMvEV/cV9nLs64YY7wcvXN9lZfoBBbwaFwSi5Ifosp+CYPDkp3KBHaDZ4eHiBzzxmWKzXuP7K15mERRae/GssP/VTpdzIA6XRzxQiYbnth9LcZtBiGg2SDNbGMYqeUZKSjZwzDZ53UiIaQ53FfNYncgDHRhKTVVVc6lP3sRIpvSVxL0Zi1oxSxBnNMjCjVIkuRQKZeetoQ+RqUqxqy8M6ivHTSUV0yIkmRpyxVEnk/azETxDJElvVBlUSJb7c4Ejyv9UwdWBn7UhAj4RXYrJTSkYKc0bjciIpjaejlBWmQokfhRzI1oLP9J1mUhaYlBITZFwYM3il6flItKJ6RYX0P6RWKrkz8jOxW7KjtaZCsxNLzNFaqhAZAMEKtnfWGhqlcHhUEkhVDEE+084xrSTmmIKkjAYUL06JgiWkwVHIkZl+krFATvI5SD97pErCqs8IcVFnUbEEDhSwZobB7e+wcfa3IK5y6MT34Me3ef1cj9/Wp6l6+6gIDKOmZxKqzdh+zU4zQRUQVTMZ4rMmhsyc32BRTfihE+tUW1fYvLXJTD/w0BMnuXx5k1t3NskM0AsDmp1NFpdXuHpzyPHHjrN+Zx29NWTPwpCFpfuYC7dYX400do2ZhaOM1q5hjryPq/cU313rs7n8OLqq6TtZS3MSkJPI8qXVs8z7TdJolVB1xcbdu7z55a/S3ruJchXG9iSm7awkf0g0m5s8eHQvyw+fQk88H5rdZrn5Nvc98Shz1Lz9xgscOv0Ily5n/vzShMmjn2a0tDw15watsYVd0qkulgyqoL2N7BtJJ6pcwD4abHYYB/21exydnOORu+c4enIfi/cdZ+PqOd568UVOfej7WbvwDV4c7uXl+/4O/fYewdRTg7DYW2yJgpa5e8nxmy5fz66XppNH5M+GkrIpJM0srqRUyK0qI94dJ8+7/LcakhyupmOCcsk1rhKPDF0TbMYqMzX1ZcQzllTAqpoEqHd930rJ5Vm6AAo6OEMKjr9X/TajHU9oI2Z2D+q1r/yLz43Xr32250Z4Z/mv1n6QnhE5o2vUSiDgi1xy3akllIIDVBJ5pPXCU06AU/g2Y50gSaNTKFtTISfvFkHQdieUmBIUKT9kKcLQzpCLEzoqjRpPqHp9knXSFzBp0L3CHzBO3PQxooySgpYQprdincW1n7VII1LEYyBG+f6znL80mRGG/uWX+enDt4g33uHYQ8ts3h5y6KM/wL0b9zi+2PLqixf45s5eVucfY/b4CUJdE21CZYWtLD5qKq1ofItzBt+02MoRR5uo3hyz1QKT1fO49Yssb17l6UOL+PWXeOyxx1i9dRWje1y6PeH6RsO2X+ZCfYrTD+3huRduceGdm9OKYcYC++gik1qDjoq7420+87M/xyTsoJxEfzS6HEgoD5kTV3bIBa6hMM6SoiaMPe32VfY3qzxwNKK3d0hqhg09w73LN9mauw+7tI9R6hNdjyZYBsazEwMz1Sw5BYabt6j6y+Tg8WHCEXOXE71tbl+8wEefnuHhAwmtZvjGizfZ0sd5NQzYMkeJgxqVM5VyU4hMiFLRbIxhGAJz65f4udN3OXTsBFtn/4D1uw0zJz/B7FN/D681JpaXTCnhMChNSiL/RwWucwsjyGcfEo2Wz6HtGs585GZKeGcYJ2iMZiUnjivLZm4JSjEL6HIzsHQY3owncSt4rLLsKbJeVFIH3RLxMZFjZMHV+JwYAVsJDhpNVFmY9EiuvIkRX/wkFkXMClSYqmcdKDVlw4hMrRRWw7iJGGcJOeCcwXoYK4rKJmUnKoFWUrjUs4YKaFNHEhPJ1xWMqEqRoC11Fj9T0qV5LAkYySuZ105I9EoZWMySz5dEUVueW0XroSHRloYcUcoixtTk1NKmihqPkS8vjZpWOhlsjMyXDofZkkIJSRIzqkj+nT+gLj8H1uGyIqeWrJ009HUc+AxaRQwGXTaDLgnQUepqJR0iDT1meg13n/uXzLfnWZ5dZGP9FssHFvmdczO8Vn8vMz3DsA30ayfOcKvQHkLyjENLu+MJ1uKblh6JH95/npOT59DmAPvnM9+8CtfbPi/f3oM/fJxsFxnZPr16AEbAOdYo8JGeqwjRo12PHBoWGHPhynlWepp9/URTzXF7rDGLhxjYqviWSvun2z00UTY228ncCJ5UBUW2mZtXLvLOX/yFeGBKhM32ZjDakiuDrXpiimsnrF++wqc+fh97T7yXdu/DvPrs7/HjJxIP1xdw8xXaDJhbeZLJ2nnWxrA9aXnhYkM89QE29z+Atyu0A7AtYCOuTqSmosotrZJnfWIy/WRxCnrjTebH2wwufoUPL22y58hxFo4+SnvzIneun8XNHWBm7xHGb7/K/3V9hZsPfAJnhFOTYyhlPR08R8vnEkOZvSMVOwU21o0NVVcYp7W4++MElChkLktfQXeAcFHGjYEkpVwKGWFkhdIQQ0lZlGeNLEhtpyNGO6KWtIRC44rnQWVIJovXJeZCnJR5X8wy7s05QdKC3MjFXBvglxb+CB9nCXGbjS2NOvPcr33Or7312cgGerCPf7z2fRjTYLLDFhnPFJpd8gllZT7mo2wmWSsxgiWJqcSQsX1HHHpMbdG2kIhceQAnjUSWeo4URarTWuPbtlSNGrKX6lHV62GjLMzRB+q5Odoo+ViCzKYF1mFwzhC8F9OgNSTvpalKOTKB2IZ3lVWIYQi6mUnpC1fS/BSalrm3vszjc7f45MM1bV5h4lseed/3cuHNr+HvXqefWpib5ey9AefGFXfmH6Lesx/6i6i+QTeBkBvJoGaRx9i8hRtucahqWWluc3TxHuO1MUfvP8zG6l1mV5a5evESC/uO8sadOX7/wl2G6jAfO77Iex9a5nO/8XIpqdAyhy8bd1VV+MJZTznjUmI8HLP86Anuf/opZubniJNI0NJqlmMELTjR0LalBENB2I1ytsFTZY2rLGF7iHIRtXCYnbvXiT6wsLKCzwaXoFGZKgWSFj9E3a9QkwZT1SQi1lSk8Yhbq6tsjyf0Jts8c8hzVN2gcrDPDllbTVypH+SNsA9fz8uL5ipyFhmsp2Xz8znB2HM0vM2Pn2yx/m1mqwVGG3fwez/N4nt+jCY7bGpJlLl5WeB8lH4F00nCXsYPwximGNFQnvGezuxEMa2+5XeYRDhd9VgCdgiMU2LRyK2asjB45JBM8gSVS71tmhIixQAGkxSpXUX0HhCDrbKK0MpioVQusUihlw1DQGnJ8qpCFhtHL5l5pLK7BTZLidOsTtRUbHvPSCdmtcNFmaM3SkZuqWC7hRugsCqKubGQMCksfacSNolCFpKnMpqY9JQ70JldJ8HTZo/TDpPKuMVqxoWcaHJp09SZNiu2ImRLAfEoaQ0MsRgGDUHLhaLugE5aS6lREBCPJjNvYFaJc1wZxSh1Y0ZFnRTOigGxSUHy5jmJf8mUzT6LQdOWW5or1DRTJHulLbZgoJPqUaFY//ZvsGf8DerZZagXmJld4utvR76oTlC7Jbp+A5UjOQnfJPtQLjaJUYo86EacXtnizsVzfHr5OndCj5dvzLCz8gQvX9/A7HmYlQPLZBupVI/hzj2cNfR6PZpmjFIGZwfTDdyoiKotNsEkJGz26NhH6UhQEZ9Cobl2NbHdBbZg23PG1NV0lKutxPPa4DE58/wf/jHm9nWRrZ0TOdxV2EG/wMIUThvGWxuMtid86KTnviPH2Lr/U+TeHKP12+Tv/B4fO7bFB548wbWzlxi2Ew4dOUAKfeYPnaI2O9y8cYO3RppVdR/jgQW7yNbcfagYoJplEhr2xG1M3GB+fI2lvM3Szh0ePvUIw0bj2g22b13j4KMPsXH9GvsffJzhpYusD+/y+VuPsH70g9TJC0VRmUIHjNMYIZ1aNM3pixkXJWbtDshlEC9Jig26cqiYplwIjSrufKl5DzkVaX+XAihj9aLGBknD5HLgNErMzzqnKUzNYlDOicJMQinx2OksMKRpRZ1HGiER9VN1qpaCFKQv5Wea/wc9s4fZ+TlWV7dQrz3/q59j8/ZnY7iEmbuPf3TrE2jjMcbJ5hpDUQIUygvQZVIKDHIMcstIoHwrH0Lf0fpI7bPMt3oGVwwQIWVoW6qqkuY0LdnIXJQB38iS1+YoFanOMej1JWvceqkAVZCNyJLWGHIIxVBocN1HYTTZe3GWAKZyEgMrDvCUAzl4tLKFsR0LC1w2P+UsxB7++ht8LL3J0/c3nHzwEV5/+RU2760y319m/319Vk58kMm920S/Sd/28W1kY2eTq3c2iKaml4fs2bNCcuCSYblWLB3Zw0tfeQHjFpjZ02N2piZORiwcfpyr51/jyuY8f3Kjotn3DMunTrC+fo8f3PgCi73If/sfEhUR26tlnJHitGmrOwT4XNDNox0a3zKzd4mHPvhhFlcO43UgJaistIFpOTFgnKUNMgfOyKaksWgj5DBTyeIQjZjlIuLBoOpJW1lsAGleDCjIkdr+1bSISprsKrxvBbNaD9jZiexce52ne2/ynhOzrOQx72w4Pn9lCb94gux6KOPICgZ9x2inpXaG1jtGm5uE9ho/++gdDgzfYd4t4tt73F4LHPrUP6K/72kmviWRpgCdEOXzSu+Sr7XWtG1gCxhmz4LtU0ePdaXGunKMYgNRY62WBVMZcf+rDj8qtLpJ9liUjF0KIMRqKY1NJf+bSISUBC5T9dBBDtjBK6xWBJNpWklcJGSsMCo12XXOYqwt0mcMecqQyAp2fMtmzuyrK+piNPIx4xVUKJTRTFJmUMYUUYPL0CuYbqd0uU1Ia6dRIsEmp+glhUuJNiq8Fd+BMxqbwKeMsZEqKXYCTEymjgLzUUoOMNoadNJok1jzgVZbBmRmtWYnC7dhwcisNSrFdo7kCAe0YpzBWyWlNllTK0NlwMQoVcFB2BXSDCnPZmXFQFVXlVxcxMVGjhGfFMaKOhnI1ElP/zmr3RsfUwd3Jlx7kd6FPyXtXOfIY0/S2B5f/+YZnh0/jFl+itkBbOfyZ51ltLNdkgKZMPZgLM0k8NHFbWZvP8f7Dia+trnIO81BblbHsXPLLM3O4BmjkqdyM7Reyp4kbwEzM/OMxzuQE47SG5ETVWVpY8AWFZDgiFYLRS8JmbADM6kOuEMC7eTW74MYda0lxYh1Mk5s05iM4c1nn2Pj4uvSx6LEv6J7MgKwRlTYqDSpGTFa3eSTpyIf/8AhXln6DDtYTAqsDj363hrL6jaLq9/i+54+zuxA1iO/vsHC7Bxz+wbcvXKN+fm9bN6+gdk3g20XuNfewLKA14GdsebAgf1sD+8xqBfZ/+CjtKMGpcZcOfNdlpYOUc0tc+H8GdrJFi+uHeTGygdIi3vR2kryWsmBrJTsCncjyQFZIn3mXUa/Up2NHM47U6g2pYsCU6BEsul3+HijEjk7HAFvFIaETnKjt+zG57uaaIVGZ022IvnLIQGsMRCzNDuahDU9spVxlFaiuGvdKRhCCRSPl4wLjZFyKqsN4wD/Zf0HtBPN5tYa2c6hzr7wv39ucvvGZ/tzEKLjF+9+ABdHZFW20yzYyRwyxsoXl4ieGPWUlUpY7YVgpXVGWUvKudCxNDopUmzxbaLX66FrmbGJczNirEBraOVAERWYEn9SVY1CFu0qK9qO3mWQB9dotHNSH6ml1CUEUQlSlLy+69USuSh5aKsRLn2J+UyBH4WYhpbF0qZEwuHPvcDspW/yE5/cQ9aOpw4/waUr32JhdpmtnVUG83sw/Rq/PYQ2MRqu0RvsI7FDxnLw2CluXb/E6M419hzeKxRABiJN9vdw/dZdboR5vnJvAbtyjNEk4uYWsb0ZhqNt/uHcF9kZB/6zXx8yqBTK9eQl1GJE0bp4Mcp/OpJaCp5mZ4e52WXe+zN/k4QjTVpAFuQUIrFpi+zVPUhSfdrlbadphmLUBFlMjHHFzGmZEthUnvoypsAjJKqUcy4HNfGb96uakKQSlgAM15m8/AV+/of2kX3L169XvNY8xM7sPiyRRtfUmumN07dyM6vCkBPXv8BP//UnCZurbK9eRoXEaO/fYOHpHxH2f/Q0hVaYlEYXgqXVjjY0KOsYxch28CIroqiNZZhlnqbwaCt56DZFjM1UWRaHprhus860JRI6q10B3gSaTnHKsrEqAz5mJlmxaRKtj6xUhrkoh9ftmInGlluFxNrGOaFywinZbFMWyT5mUzwzMiMla5KS20mNHDgmMdIATmccRiBISVFZ+f105D1fjIQFAUWpRhEFsFfRSwVApAVv3Vfi4tZFGcg509eaUYy0RsYwOssobJLl70WONwyjZ4QSYiiBSgt23BaDHsayERJ1ztQKFipDaBNjNNaB9x6rpGnTlAx0SkmwzUhngtbia3CuQhcEcIgCDdolpskB2BVFwCLlX9ZabEoyk1aW/MYXUNc/T2Uq9hzcz+bqZb69fYRvhffg5hbB9ajMAK8aJmNPaAJtDMzM9QijMWjNh+15TqeXGFjLn6zt50rYT7PnMZSW988UIp5CmBsxStIhFQULpbFQoGJ694aHPFMd/S9TyHRZibGuA7TnRE7FzFhZqS5HkllKKTABY2vQFdde/S7OzrJw7D5Wz73DjW9+k5RGKG3xMdOrKrCOVNadrkkzjidEH/je05mf/OSAPz5zmLsnP4oNkBFlsBmOuPTSWzxxsmZ29AY/8MgKZnKThcX9bK3eIDDDZHuHvbOZZmaJxf1HOP/yNxnMLOIGNf3eLAtL85z59jfZu3eZ2ZWjLOw7zvDeVeygx7Ubtzn75i2G86c4swb59PdQZwHlxCxmcOkpkLgcuRBL0dPLlMB9QpmlS/+AMRqUJUUvaRBdap+VgL6E86GK62TXOGqVkthzkpRJTC2Vqgq/QIh/nedGZxlzgRwITIm4R1XG5dmgfSHhmjzFyqMCZDuNxAuCfVedU1FUzTZa/sneP2b19oReX7Ex7qNe+8avfq4e3vzs5tZ55vee5hdvfRBtc8GjRsG/tqBUC9nS+AlGIy5ZH0pdLPgU6LkaP4FsC2ik1zUZyfykq9K1UW4agAwygVwV2XDSopIsdk0CNz+D8ZqkhTCmvXw97ZK4jE1F1jLj11pJgZDW2ErqMVVHGzRGDjQFNtLNvEKKJe/amQX1LpkqG3GU65om7mCGE9L2NQ4pz4Gd8xyabXAhc+C+inphiaP797N25R027t1jea7HzN4jaJ0YbVxhz9FHuHz5LqFRjILn2k6Pz79yj1QfwGrL8dOPMJmfw+XM7c2RrJUWfEz8/MyXqcMav/hvxwxbh1VIdaeGylgpYTJGZrIqTXnTpIjJinZ7m+UnH+f0Bz8iJhojfAI5fsutWFlxQRviVCYUbGWJVeksLHwt8StBP5c1XRe4Svn/kjJVVUntaylO6WKeqTAUxNsvclVKiWw8Js2TVq/woH+WD59eROf7+PXXB2yoZfTsLNDKJophtldjVKRpJ7hqgeWrf8TPPbPF5s019h48yah5i7v3HmDx+/5rgulDajFa03o/lX5Dljy4z3IUT0R5Nkm0Jbrpy7OgkzjCpexJkLpWG4ahIZhMHwFhTbJnrpgYjVEMY0BpTY7SUZBUy5UUOdtEDpiatdCy1yhOVBVtiGQtLWTWWkZkbjaeHQWzKFaMoq93I1BiatWM8fRMLQ5zlTBZqk6zUrQxoisZ27VJJMZJggppFksq4bBYnaXOunx9bTKhm322cqNWStGW39c8AhUyCuElxERU0t3e15pR1qXFUsZU0mYp1rqB0tzNkJNi1mSqYkazEbyBymSaIFCwGA11HUlJE5SiUhmdDJVShByo0Wid6GeBp8iRU95t66VStzbCpdfFo5GLIdgpqLSsE8YpXCi99sqACuicWP/y/8b+8BZufg+9StEMenz+7BI3q6dQM7NMTCRFDWEHshworXao7Bk3nkeXE0+7O9gbX2TDHeS54SMMV56hsi1ZRbStp76cXKRklcuYjhIzK5WvWuvpDVQgThlbW2KbMFpu/23wVMqRjSPFVsywCMFVR4tSQoAESUuoyqKN5e1vf5f1d95hePMSvdlFqZiOpZVUZVQzkbVFlR4VZ0haEl9JJXQqBrmU+alPLnNq/grXzEO8sPRx+kH4DpGMCRmbGm7evcne+WXCCNqNm+h8l9N6yGJ+nfd+6JOsXz3LkVPz1NURNm+fZ8/RR4hGc+fMqygdUHqe4fY699aGjNU8X7vaUh96is3qEJO5A/T7y2hGKO0LdVIzpeXFVCLs8j0nFNaK9C6KT1cUl8EKkC5HiY7G8rUgyuWg0PfkEiSXYYuS5IcSiB5GY3MkGo3yBUiVExKEK/N6U1DTKf4V+Z4QoO4M7EYK83Tx6IwDxil8pbGtQltPDEoUcsqIzshhJuPJwfGft/+WTRzaGaj3o85949c+t3nj7GcHB+4nkfmla49LNaQqZQ4GogcTW7xvRHJsA8p1FDjZfHxqSRl6dUVs5XSZtcZpuZVoYzC2nECxmOCJRpELxIPC+HblJGZUltlVvy/NhGSa0JKzbC6tNriUCN5PzSuxaYSp3rNlfiyOpZQSrldjrS3xoSSnIiONYbDLj+8qjUNoMcbhnClHbJFmhtowHEX++73Pc//sFX7pj2eoDpxga3OdA2pMM1qnUvH/Z+pNg247z/LM63mHtfbe33jmUcORdKx5RJItIw+xjS1mG2KqgYSE0AN0VyWd7hRUpypFOtWkIOmEpipNQgdC4zQJwYYUxmDAGDxItmXJsmZZ8zk68/iNe1jrnfrH8+5P+qWhzvDtvdd+h/u57+vmyIpw0/GjvHLqMidevsi03cP5fsD6LHF07xH2HFzlYp9Y3r4E08ss3fEh1kRrVYfD4U6GfZoM33Xmt/iBe1b54rcN/+qPzzMYDsloNn8+s3eDoaoxVXotKF3PFYWWmDRle+0K7/vpn6XsXlWJ2BRmk2l9YICYaL0jpIxr3M6M11amvRGveOM6NslFuwtKPTxJdYK3jVGXaj18paBmG2+0nWwOpXlnrCbmpPM2Z8ljWH3jc7znwEmOHb+bR18vfJnrGDR7CWiEqtjqii0FbwJlsMD+08/xcx/YgtmES689xd6Dt3H65GXkzp9k+YaH6EKvhxZvmaXu7ZxsvdmGoDFEV9230WS6xE5zn6M6lbPezo0xRISOtJPhhsxIHNtZyYId0MVAqIa1nHoEw/kusGELITuODgxLKbOO6OZsLJeSKlU9mXG9BN5k50tMIr7DFGTFYJLmjVUSjxTraXJgXCBq3SS+aDxxzlEH6GNmwTmyzGNIyhXIVg1Frub4Y1F0rkqieq/MIjQh0HmLyQobilWOLOIYALOsZty26Cy+WINn/v1WOmhXGQJSs9SexILxbKEAJYPihkWEEWpUbIBcdFrb+No5XxsGF5ynzzrScKIgmTl4a/5MliyazS+mJgT0v21R8JPbvsLgxF+yz7xCt77JYFfLRjzAp95Y4PLSnYyaARTDLPR0YYanzntzpgs9xnrexQU+3H6V0dJRPvuG4WR7F+XQQUaVohmrv0Dmh+T09g2O2CPiiDkzbB0pZGgcrVi6lBj4AckVJEQt5Yp6aDU5M2haZsFAGev4ImSM8bgYCV6VBpJ+D1782qNc+ebjlMESbiB0V69iFxbBawkR5B01j1xjc0UZGHPvS0lRv48ibI0Lv/TDwsLwHC/Jh3nO38yC9eCsIsQpOiIUYfPcFa5M1rj21mOsNi0XthZh+zwX1i+z4AYsyBbN+Cr7TGF9+irHDx7k1OUtpNnN4NBtTDvDhVee4KfuCzTL1/Gb49vxdhcpTjWOV2u258hoY3j7lo/Z+W+N471DCRZbR0Flh9w3//8xhx2/AFkUWFbhVLZQLxdajqYgtkjKepEqpdAYS5+zRh+x2jg5x/caPQyImKrCaezWlFDTSVW5qqAw0PWEFBUyR9khYlrjd9oR56O4rnf8wsofMgtLbG1exC/cgJvNNllYXuXyuZfZtfsojVhijSspmlSwEhBvdOMGZOix1hBSQXDaBle0gKGEnoyjGTpyF7GNzjBaFIGqznx1oZpS6EMAr0YKVwziUENUctpmlQvFOWIsWOe1ua3LFFcwFEpMipiNtVqyccrct1njS32kaRrmLPhIwYvDNRCTIm2lPuTzRjDn3I45cY4fzkYPK24C39f/Nd3p7/Bo6kjX/Th5YYF2dJTzKVJ6IUrkFJ6vXbSUQWTz2Db+8ibbZ15mVoQzYYPLfQd+ge+/cYOvf+siFy+8yejoLUqKqyf01CngZnD4QbauPMmXvn2OlHfRzwLGJHJj8Y1+0DkpESpXY6ARj1DZ2U2hhBF2FZ784ud56Id+jMlsnWZlN5PZhGGzpBCl1hJrWRvFKk6zJBIO47TYJaVAWxpcZfrmPug4Ievi670jp6ILvaggZpyt8+iAb7zWKmTlZ2STa5Obw7hMzJv40SLrt3ycr5x5mr3dBT52717st07z5auCW1rE2IYuqVRrcsKIJ02mrO19kP/j6y9wvLzIhw7uZevqeQ4cu4ET3/gVxuOfYfXWT4AJpNBh5hHWErTNrmj+fSaFodUERy+3TvoAACAASURBVK5jo5QzCDhRx3gRoTdCINAah2RHH7WpMgqV35+ZGqoMbgmhkLPgGsO4n3F9O+RrkwmQONW1mNQzobBMZrcdYMTSR53Vx5IYlZbsUCyvdUjqCckQvcHkjlYabJYqUer3ZCYZCoz7RGOs4ofrzDDVUVoxloAqZaF6ZJJAHxRFG4qWXMVcMKLNl0WkmtwKqbH1wGGJQW/4DsFZmMWIM14Rt1ad9pOUwGiNcUqZbZTfP7B69JqkTPENs5QY0RCIehuyOkrIyTC0hr5EnBOY3+JKoXWKaI2h4J3ovL82XRojeuAzGm9UY1TBe4OUQCMNsfoiZq9+k11vfZal4YS1jQvsufMj/MZXx5z0xxnsP8CyNEwIpBjVOWQcpEKeTkmuwRTP9y18B3f6Oc4duYGvvr7K9PoHaIzBloA4r2jh6tNw3tN1nZLUcqRkjWA3Vbnsc6E0DW0pdHq3YzZbZ/vsFRYO7WWwskLxDtsXxPRI48j0OPGk3uKcjkWDtYQ4w7qG4WiVQORd97+bx555lhK2iV1D45a0JthqCoXiKFbVGPVxBFJSzwkp1xpw/f7kWeLuo4Ebbnk3r7y8xcn2NpaHXsuhSt5hcGCEkjzN/n2kE5cJ6xMWDuxnb9Pzmcee4pEf/FFS2SblTDaLXG4Ss/5v8DJCd8AR+i0WFnereW/xCE9ufJlHVi7z/unrfHV0D0EsiqsqOwqmSKljFbuzeZekGf6Itk0yT40AUtWPuQ+gCJoYM+pXMeIRo4eJArU/pypnBVLItC4Rst1BwoMyTozTvdJYIe94pHI1EAqmJChRyYAmY6RRMJNtqrm5PvdFlXQxTfUMBEj1Umiq36OC+HL1KnWb24xjol3aTXEGZ5vBL842zrJn116muaEzHU3JGG93Nr+SMlSiW9oxUKmxoGSBxhJT1m576xXqM+u1Oas4cJbYF5xz+JKIWUhONJMfei1tcPr7Yp3bF5IaILJKz6koMjMizCcLEcEPGiiWknu6pAtdSVo+k1PCWNHOZ2PJMdZMZyEm0cXKaa1pqtjYeZGMUNG2puIeU2axCCmf4NjG4zy1vosnlz5IXrWk0OtGNpvVcptSxw1CsZlGWravXiD2+uVLecq4M+wOa6zEU2yYvSzv2kdjHK2BUKq5wxmaknjurY57bl7kZ37g3Tz9a88Rd+bttZVM1OhRytuFLjFFnJ1nngV8wdkBeXPCY5/6TRKWa+68h7XzZ9k8d4Eb3vdejt5xCzMDA+ORrB31tvF6IpjOWBwssjm+TOeF0mecTbjhABN6pbotDClxynC0QB87Yu7BNXja6icwdZ7mFdxitJedLARbMBm8XUbEEkpg7dAt/NEb8FDXsRq/xcO24+vjw/TtboxvSUlwzhOL1oiOw3kY7ed5u5/t577Cx9+9zZ4DS+y9dC3Wn+bSo/+Mpfv/B4xv8aatJTwNkaDdFUZxnzoWUiiLFYOi8K0aHrEwh2MZR5+LRnycEGIBESY5M7SWjW5KNpZFI3oowhAjxOw5FbRBsHOwFQMhRGJO7FtcoCmFAxY2JfJWhmkyHKk96hFth3TGaVVwjpoRFhCjxTelNozloH3vToQgCvAxptAmhYUUyZRUCKXOukWRxLqAuFp9CzkJvqiDPRvwWbsUXM5M07xSNzKVgsv6dzUhgRR1qLt5xwAMUlFDbtZFOadS2fW6mTQWckqKUE4diMWKborO6q1uRqJkcHWa76vTWTHEBrQsEuObGvcs5Jh3HOyp+je8t4RcQUipp3MLXH38t9j/6hcIS0PafddRaPitb6zzwu772WNGelsUIBrIWpSVuinWjjQxUzJ3DU8ir/8Zq8e/my+/OWXrxg8wtCq9i1hC6vWmaCw5BoWk1SIrgyMXsOhnnUvAhQjtkC6rpHvp9Tc5/+QTGn+0jnb3KmIM/XRGmI4JZCZXrrKyssLo0F7u/NAjDBaXiLNtnvrsn3H5rbcY7drP0u5FLp07j59FxChMSbypF61E6OqzYAUjb2+cBtQLFmo6xWp1ecTxyMPXUErHyuIeLnnYGxNBCkOjsVPrLX0IRJfxwC033crLz32bY7s99x1Y4rHrrmFr7TQHDq6yOS0UNikRWqMSuQ1jsJY43cRbw/LQ8PL6jex+/VH22EcZNdew5Rc0+h1NLct52zukfS4aPU2pKgK6JdRbeHXa78CfdCQgFHLdFxrTElNXvQIaOUa0bCtm0bG5FHLSWmpnpFaAg5SekjQSnFLCG0sxyuqkelOKmUfVHTb1mkIoWXtWiiLyJQvWJmLSWGgRIEByYGvFtfod5rRPECvkac/iwl4ihm46xs1mPQtLu5hOr9A2HkODNZm+n5dRJFy94QGYnAlRpcHijcqCzuGdstRL32MGljJxeGNIfcQ2DXghSX4HD7reBAYLRMnkKpuYrOSlgdTsvtOFRgzELHgpeuLOmezVsiwmE8UoFzsU5dHHjKn1i5LfbvuSimucmw/nCF7r9IATY9TTYSmgsUxKUl9Bj+En5Cuk5QW+PL6Lhf034U2jpTFbE+W1JwUnWUBSxLqG7uKrmDihNA22HeJaz7Qz/OzDY55/teWa9/0UnbtILp0uTlQwa9YFdfO6+zi5vJc7lr7Du28J/PVLTuedXSBUfoJrlYAozhH6Hudb/cI6qVKVOlHLsFGzX+w4/8qLpFSwDt584nFOP/Mch48fo6TMyZde5NC1x9hz/RHOvfAyW2fPkJdGvOeHPkG3tcWefXvpxlt0k21e/eZjjC9dwi6v4jIKz/GOPgYOHr2G5QO7mWxucfzOO+lzwfuGWegpWUlbphqVmsYzDWpStBZGBbZ3X89fbbQcY4uP3tuy8Y3XeL59mJAtrdE5finahd7UhUh6w+lbfpDffONl/uaVp7jm0CJlfJprVqY8+R9+jPt+9o/pnCYYYugxrSf2MzAGW9t5JerGWoqe+iOZaSoYE6u07OthUZiWAIXaO2DwRMZJEBqcCNthRmMc0WRy6kjW8uY0EL2hSYXWgS0NIWmK41yILEvBlcJ+MWwasCYTjbq9jFRJU0qds2sbpxMhFsOEDo9DvGESMjOJ5GRpRSNM45IUsJIUbZqLMIk9WB0/kIuqHtYQkjIM7DsMoE3JjKP6dHoEVxR/ikAUYWQttsKJ+qho4wZDitCIZZIzsxIxVpHCXU0zWIFGMiINlEgnCvCxMWOdcjuytXpARnPOrffkpBCUZC059STxO/PUufTqK84YqyAm6rjM2ELCIN0me5/8dxzOrxMWYe/B/ayNt/jXb91GO7yZRTyptfQxk0vQGteQySiBMopuELen17nurT/iJXsLrz55hd33/wTtHHsftWzI1eRG13W0zkN+R4ulFBadsHZhg+2NCeunztJtb9W5v5DClIQQ2wWl1QmwPWMymTEYNIhpkRBohyP6aYa3LvPYv//NKoOrIW1lcYU0m7J1YoOBheINFK8VwvVOW7ImYOYSuDaYGl2j69w7pYyRTIgdWBh6wa+fY9O+zsnuQRoDMUdkoIf0Ute0RKE1eiCdGLg0zqydWuNg+yb7i+Otk+fxw4bhUM2dKeuGp9RKxXfHoH0WMSfcrr28fPXdfM/CV/ie7k/5cvg4a21bq3P1Zl+qhK9pJVO7eSxGqgcJNfxSKkTOiBL+RC+KFFWNqqaph6SiakbV43VcaiwmBT2Ai15yJWljoHMNgl6CTIGyc4nTMaMpWjrlXQOSSLkHYxWHbnVMV3KFbgkQMt5ATp0Cq9xAP6vS61hTHPOCsWILJKFd2sPGdIvh4ghbLPKNz/1i8eEifT9lsHyAX5h+iKa2080z/yVENTqgzv1YXbihEoaapqFPERHwxjILAW8MMabaGFx2ql+9s9hUoHFa5uJETzSCZiFrppTQYdtaUZuyttKVjEGdq7YkUgQrhS7qyUh5VEKfA40xtKMhsfYKqFQnO74AI2qWMJXwRY1dpKimLUGjHTlnTFvIXcsD23/Ke8obPFlu4anhQ5A7ihtQUs9ka5vYR0olJwoOjKM3hYuPfw3pI9Mi+KVVUu7Z2Jzy2V9Y4Ve+tMjuYw8yy5E+qmLhRJuy5lCTPsPq9jofbT4Hfh8/969fIDctw6bFCLjFIe1oCSlGq4Szak62qdjlMv/cOjU7VpWAdxjzQp/wjUZZUojkFPFtQ9d1NO0A71tCN9thWeO90sPaAZKFZnFExKoptBRiLXlvjSOZzLTvWBgMNde6tMh3f+Bhoi/0s8DAN4QQSEUwzmpBSso0TuekOYGMN7l/8gUcmafWjnDlyP2IFIbDJSazGaUuXa6OcRpvMcWQ01X+zuFT7G4mDLIwPvsi0gz49oll7vhb/4JJWidWhz5kLZwSoS1SCYJCnxNTw46jP/URcaqGRWNxdZXcLIkuR0bSEEomxCnnxXJ+e6ZEu5DY3VouTmeURhsbB1aRvEOjVcPjGBkYRWe7ZFjylpFzbBfNyC9U051zhmExavBpLLOooxCXM5NU1LRJpkN/zixGPTPZkKwWBjWVkT83d84zy8Xo6/FG+0DGWWX/xqj3o6k3lGwL46RRxRF1bCWOUQUHtQhBLEkKTVZUMtYwSxkk0xZVr0o1HjoRXM6Mc9Y8cy6MAIplYAupWJITSsUJ2zovX861jbBAY/TA67wixa3XRrzWeFUQiorDrQiOyLYMWXzrSUbP/l/ccNMtrE02WMwd54Y38RvP7mZz/7XsKpbUDkixJwUdESpcrKhZUCKhwL6NM3xy1x/wQnov32jvgdFRHFFHTKJ10a76oPqU8bbQ1wijL8Lpp19gvLnFbHMbnLYqOtvSd1NyTqqSxhl90PFBjNo74bK2tcZe64G1l0HX5pTCzjqXUkKM3u6lJMT6GkNTfoVIvbmWWibTOnWw1+9Czhm8RXbUm0ia9YgTSoRPfGCVuxbPEZoBTww+TlhZ1WSYbVWun/dEhIjxjqbesrc2rzLc3uLjhx/nK6cf5JXJItPZGrfefxclq/nb1nixmlQNoVNF2FgPJZFkkZsvfI53H7nM5e2j/L5/D963O2u7qtZxJwZsrcdaKMXsvJYyT4eYecufgNRWPoFQ5/+uWFIBsW7n/VYvgbZwAjhTiGouQYzDinoBNF2mnqF5q8acpotzpFhZNqLPtJYcWSUhAqYe4pN4islIUKR99kN95rOu56SI+IH+nEZDxV1c4u+b30FkgVm4yHD1OG5p3yrh9FWcjQxsiw0Z8YKgbUbGaMyu6/LOHEVd4dQRgJb/2AzFFULODL3X5GpWWclbV81Lpba1CbGrxTBJZ/NiDOLVbJJFJcocokZ9jFT3vqhcE3VBk9gxNhY/arG9HlpKyjTDAUPfQNJClpyVVig5g1N3JiJaG1nYiXNYA3ijtLXazewM5N4yGJ/hZnuOa+57P7/x55FJ0zNyjkKiDxGTtAcACjmkSuhKmGzI402itPjFZaK00FjuvW7E5pWOXdfczFYJtEYxuDlDrBWRmUIXdcFZX9jNY6eP8pEjl/jx9y/zn754gVlewVmDdI5p2GA4HFLsYMdlT8pqjDKG0M/0ICRC6BNW1I+BVeNj6zP9dLpjKnPtUOOY7ZBSNHEh7VC/GKZQ7IDR0gJdN8M02vDoay6+iKFpaj44Z4qxjNoR2TZ6sBnP+PwffJaF3avc++67tObUaex0EhKCI0pgmrQ21TiHWV7k6e5DHF/7M+4Zvsnjl/Zz9cD1xOkEqf3bZKG4jEc54pHC4mAv//HiCvdtfpX7DnQcuulepuuX+a53jTn5hX/Mgff9PJeMxuJMD61pGMdMNpk+aqQq28KgGCYkctTNxxmt453kzLCmL1qr/pPN0tOnyKI4wiToM1ejaWdDpIjDJT1QpGzIpjDLgRXb0gosiSZWBo2ChLZzYZILq42hRw12XUlIzrTW0mRBkdnaS2ad/tmlNvYNitCL5pat17bJaYGuBLyxiGQk6vMQBRxaZ9JljeF1JYAx9EGwQE/AlUyKjqi9pPROaJMlkRnHhCuC8frdtsYQa4x0FjVZpOA1RywgIeOc1hRnUTm/T/q2NcWxLpmAkgVt0pvTLAuOgkuq3Jmi8JaYwUkhBuVdpBRw1qOCR6GIUiWDLRQii1/7NY6l08jSkMnaOVg6ztOzZX7n5AF2HzzMqoHedLis3HlNM9aOTMm1rbHh0ORVfubW53nq4vt4vNyPGa2SPJCKjkFLZtB6ul6JpE3TqPegcay9dZYzz72km3SNPxsEMvSzLRAh9xPCRLtLRAohzkc1mRASYgrFWLxk+tCpKuEM4gZIyYQ+qg+kmp0pTmNnVKhTpm7SAlkd7rq5W43DJdT7EahZd83xGO8IocO2nptGPcXBS5vXsbFrDwspKDLYaIlNiGr+tY0a00rOiC8s71rkzdcvcezha/jSmyfY2rqW2G3x1ree5MgD92HFYpOqJyFGDFbJqjW+2toBUgKv7foAh0/8W44fyqxs3cV0daD7mDE70CSNkPsat5y3Rpaduvd5VFyw1SQYKQZydljTULLK+UZq9bkkEFdHQ0UleAwxa+zSiiYOUhGMER2DVG5IgyCSVa02WoDlRL8bsZQada3pHNtQStSxtlioP6fDKo2xFKgQL2NBrCeUUqOMFR0uGetGSjsNhdmkw002pqyurjLDEeKM7AxFouYQ66mxSI1J1BuytQYxdocrH2NEGkvJqc7XM1mKYnkx2gqXC4NK8qK1mKDZUILOmMr8zaEGNJ3VTHnO2JqL7qNmNlurxQ9FPK7rkZluOqDyf1Pdvo1TkmHsVbFwTmd+OeuMp/UanetiwBsQa3H1y5ol70QDPQ3fbZ7invc+xJ+/lAmrN+LtHN0IkvTXSqOvz7WVDkWh9UKzsldvTE2DaRyy1vHAbVOefHqNjQMzRruGECvMJ2V8PRmHotAZU6Cxnst7H2Dx2Iv83H27+MYTv81zWw1LjaefCNY4Znp+wfu25lilZkKVdBeqack6wWKUHpiUmBhjxLTt2yaZYpSWXCw1A0M/GStdsbHEbsx6ingrxC6zzISjh3ZxZb0jkNm/vMhmF7i6VdjMBusXGYoDyUqUW1jCmYZv/9VTrOxd4cZ3Xc/KwX00RJSE65h1Pbb1pJi0dnp1kReaj/Ke/ovcvf4CX5m1xMWj+KgeDmt1DlxLAWmaOdpUeHLlw3z7zWf5B8f2UNJrjBZXuWWYufCNX8Lc9IOYw/cxLZFhNowWGiazHkohmAhFOypa8WQpbOfMet+j260jS4dj3m9RUaFZyAMYOKHvIxG7QyJMFLoEfbF0aORLEDpJNGLrzV0jhANnEYksiH7PKCo3O+cIEhiahpJhmiNJhGF5R49CyWSjpMaQs/4sKe44+Geih4GcM84bbC7ElOicLi4xF3pbb12dju4SEZMNZSdKafCl0PfCpGimfcFojKnLBVc0PTNNacc9ro5rQx8TDcrdUCOhY1K0eMxLIYTMuglaNY5KoYh6cuaysCuZbfSGPbCKUZWifhgXHc6ZSnfTRVtSJo0MTLZY/sKvsH95i9Vb3sf2pVeYHDzKL//pGuHgu1hZHRJjwBtBks6Lra0skRT0efAWiY6Ds4v83TtO8Nb5IY/G6zCLy5RcsCGRc0Hk7XGjtYJph+R+yuWzZzj9/Otq4s0Fm6NS4KRlGsaE4DB9z96FhrU+YySR+032HRjx5vkeyEgMZPGMjEHilA7IJSFF8994TymGtm3JOamiW8cNGR1NxOrqUy6LMkJCLjSNJ+bKIyhz2EyGiL4e1P8SgUduW+LAwQFXJp4rB7+btiSycUgRUgx6ezW19trUtrqUkaQY+aPX78P7MfuWhuS1DjscsbK8ol4dU8h9qjXZGvdGrErqIdL1E72FN0Peau/g4Po3WDzzdcbLH6vgN6kRv7yjBCA6EhDRkQI1i1+o70NRxp6pqRYxGnEs8+RDiYirCLtcxybVdCcpK3dGv2j6PPJ25FQ394LUv0sc2niI6AHYGkzOSnq1A3LJmp6wBkPl+8cZRU8mOOu1FwRD01RUvnHYFEhVyaY4HRf6CeFqZnFhgeQs8u0v/POy3E6ZZcizGf9w+hHa1MO8PEcEV4QQOwpq0LFW5SJX52q5/rpSdG6UZn3dfOoDZee5Sp3h5KynyFRlPxEhlprdFUWCGiIMRvW0KjUbqXKOtWrEKSlgxGs3QZ0je69xibyTl5wfYjTK4YyaIgxqxjFzH0CNH2plp/bFS4REYrHb4uf2PcVLJ87wF4s/ii+CaVooUalsIRFnnS6489hJbUTbOPka/aa2tqVU6Lc36Uj8q5+6GenW+Gv7AWWET2dKMSyCb5TTjdX8uBWjD5Eb0px7nL998Hl2HbqFf/DLn+OZE0Udqd7ijMUvLNCMFvBtgzU6N3JOF9mc9LCCVZNXrnEwU/S1p/oQt8Zpx3iIO2OIWptDRkgu8F37Mv/Nx25munWRJmXuvXsXl85cZnOaaBaGHL7uRi6ePUs/zew7vJ8//PyLDPfu46WLgcdPJobtIohDGv18Qwgcvv4gd915D0GEWd/pgXOeRU46t04p8d5mwgODP+PFU9fwucGDpHrK9W1D7GY7UU9jUCKcMTQ5QhqQ1k7z3tHT3HvNXhaaS3QbPdPseWtthcFDn6Qb7mFkUfIWwngOO8hlh39xpURmGDU6IjpfjqrYaG6+x/oBISee3dpkM2WiNzsVzSkURtawVVsxS9KbvEdNn6OmJZfA0Hi2s45ChqUwQPADowZM5xjkRGs1VjQ2umE3gIkevL5XIUWCUXNaDHWRs4pInpuhqqVYUaMihJQxrgJkUgQcVqDPPUUs7XwjzBlspQg6YVjAo+oEsIPcljo+6ObeGnSOueA9UhIRwWVdaDujz+CSdaQMU6Pz8bY4Fi3MKJioUnRIGiszqPxKUuRtW29z3ulIqBRh5BoQYVGG9N/6PfZsfotD+wxXL15k9YbbeOPykN+/dISN0SEGpSMZtwMNy/3cQJh3RmrSGCQU7OQUP7LvNforF/jG9r1s3HgHuVgdU3qn7zGmztcLIoV+vMXl10+zcWWT2WxGmnZkgTjZZGQzH7l9gTuODbhuFLn+uiVkY5Pz4y0G7TJiOvrOsBVGiFni5JnTxPYa/sXvf5mNbU/ra6VxLuSqjHlfN3IxONEirHk5msJo1KSac8bmrDl10ec6FFUa5mYAW9NQOQRSLuS+55f//vtZ6F7l4to6zw8/weWVFQYUpRPWeKxvVIntO72ENHUsYbyjMUIDHD/x//KVM0e4ZI6SXGF65RLX33Yd+65/l3pnUiHHUN38XuV/qk+rAsaa6SYf5KvYbo1PL/wIpVneYT7k+PY+gCk1w6/dGIghxZqgqn4eql+s1LixSK6foVXQXM6IHSClrzXZytZoE2TnoLaQxhzVX1REN2/JCLUMr1L95k27WQs6VG2qB2UxQIo70UCAhD5XMU3AtXjT6Fi8Kh4JoSmF2TwCaS3dbMDP7/4vzDYT4iJb0wEu5MT2xjrGR8xgL2ypIz8JO5zoIsrPLlYUOpT1IGBMddJXNK9QlOgnGqPIolW8uRSsdSoVd1Ed6o2vGV3lBTiZz6D0hlqSRWJCWk8Wpfo1TmVXrfqNeqq3BbENvs7M9Q0TbC6QCuIKzhlC1DfBVHldP7C6mPraBiWaPohZ85zOQ0nC0XSKlh5/9Bh+uoCZTehzoLWW3AWKVGnROboQKZVEaGNidfd+Lk7OY9sGYsGlIaUfc/b1F7nj+D7itKePU805h0y2qLu9LjjKJIi03oD0bKzexoVRy017Mv/tB1f5L99a4bHnzpK7gDQZM51q/XCzSgraLV2wmKalZM25WzIphbcXtRAqjUxVnq7r1cDoW8p0m2gNMRkW28z1R1d56NrMLdcGDu26wMK1i3z1iau8fMEwHa9weT2R1rcZLEx56+yYW24+Qpqt84F7FzmwGvk7w2X+4okZf/jCRU6V/SAtMfYsDUdcOneFs8tnOXjssHoWagVuQeWwkvV9faaznHhixn1HX2N1so9z/lqadqhfbBFCSUr6qnQ9J5loLabN9AcO8dhapHv6MR68/RDtyj6atUtct3uTU0/9CYN7f4I4NMq5kKS+DlRiJhuMF0oPQmRkWjoCJRksGpMEpXtt58TJfsJUDMUmYtSDbyjKsu9TfBuGhRpeB94RU2YrKS500RiMTeQcCRiWnNE5L77Wfxo6K4xjAGnIuWdSGoa2p+sN0RUW0RuwQoqKGhpjokdd9DnNuwd0g8pBx2Rd7CjZVm5+oGC1jQ3UYVycmqay/pk5K4FvYNU81RP1yFjnxyYpP4DKSU8UJkFjlCYH+rl1v1qy52hTnws9ao6aWijR1k4PiFKIITFoVHFo/UBnqcoDpOSWTIvkMal0+Oxonvk99stpdh3dw/bWGqt7d/HSmW1++8Ru/IFdtFkz89TUSuiDmvfgbaBYTIoaz54HR1P6Sy8z3XsvV0Y3MUgtdsEz7fo6b9Z5MNXc22B586WX2F6fMZsGcsiMY+AWu8HP/vT1sHmBI8uXWD50K6+98jwnLh/j0oVN+j6zbyUyGCRy7NmzuEw3OcsDx5fIMuOf/927ef2U4/cffZFzGxqJ9mIpXUcyqnxgIBZdA4oI2o5mNO6b1eyaY6ZMxsigITrReX+djYvVpsVkBUkdMVgevvso3bnHafYf5GxzO5d2LWMr08MUlcXJKrcbY/CNHhhTjejlENmerLN+6hSP3LXEs5vLnFrv8Vjadsja2cusHD2OTyBGPUIY0ZGVCVX5Fag8mdlwhaenB/mxmwL7X7vKBbuoKQtjdzZ9siZwdBKcAT0kemO1wa+misSoco0GPjSfL4WUMhZPlghFLyoGdA1AAyKulmT1ovukT4Vs9eCBCA2KTRdFhyBNLQTOFiNG/70uEIKQxaqpPQWysThUhXdmoR4IMqYoJTAnV5NWyjRJkpSHYAoEVX58SSy0A5xzDa14trbHLMcNlfeqJKI56ULKGikLOer8oUofMYYdQ8xO3rvOeYx1CjwQfKnFggAAIABJREFUjUXYRvGJydZ4X53BO+/nIckqV2t7m1inJ5lqzhoaSyz6M6WSaVGXpS6epZ62oRUtCIop0TgFtUgB70wtZrFYU9S5WgreNeQ6sgBw4uhiwFqhj1Hls5OvUXZnzlxZpLcTRl7IfU9X852pEqRiTAwaT1e0B9ouDFjas8iF85cVGEGq0u2Ik8Fxb1jHba5jR0uIU5KarTPQUuOWxhg1CAISAguN4w9OHcbJd/jox97H8q6XyXGFJ145T0oNUXrKDGRji2wszaBFcJj6WZSscVepak7MiZITyYyURR2TPuQCRQIzaTnSCD/5wQHH95/nusMt335lxma8hi+/uZu3rlgut9/FwimnGFUGkAKffSZhzLvIX+twboafbHHT4jqH2wnvOTrjVz9wO08/NeV3vvkGJ+QgxbW41PLi889z+fJljt93m5Zk5Lwz23JOOwmmKTC7+W/ilr7ODa88x6V9RylEYqyteY0nzDq8ETU+GiWV+TLE5o68tI8nBp/k5LNf5Cc+eISVG4+zduLzXLd7mTNP/zpy84+R9h4m5AnONfRBwUPjFCH2euADcok0xjPNiSRS3zONSb24vonYBgOYbFSZyhCi3kZI82pP3Wj6kojdjMZZ7fkuhfNhypL3mpwQvVENG+W0Z9QB3YdAsI6S+npTTxAV6jPNam6MKSiLwxmmpdAXbSWLmVoLHSr8ISvvIiWsWMRq6Ve2eruRqkZhNKRmkl6n+vkFQGA9TwlF//5VsYxLZhYi0TimKWFSZuQaeqBD6YsGqYwFQaIeQMYBrAlghNZ6XewTNA76lAkauyBbZYmIdZTYaVNeEaV45oDzEO0QM73KgWd+myPXLbPxxqsU9uIb+PQrN/LM8Fq6vcIgJ3rTUfpEa33dJJTKaNGDuFhdm4JpyOdeJI8/R7d8jG+Or8eu7MEORQ/QYmmsRUoiFYsbtNBtc/Lxb7KxpcraZGvCx65d5/Bgk0/+yM28+vyTzPqD/GV/K6+96Dk/+GGmayO6OMEmz4Gl/UwurSGhJ5wGv32F3U3PXeZ1fuihwyzH5/jQ/3Iz//mzl3j0lfNc2AyUxpPfYV4kR0JKONfUyKiQoh5swqzHU4hdUNR6VuW15FLXBm1MLTONCP7oB3fxgRvWWF69lhfX4KVdDzEME7LxWFeQBDEWhdikQiYrMtcoyyDGTNs4ymCRlbTFyCSmRc2Bg+EC437G9mSGT5pQkRCJdQ1z9WI0r8/1zYC+18bJjaWbuPTKX7I43suF5Wt176qRXoBi9Qav7v2qVKNjhfnaK5o4pZjaGVI7OEz18ujBxtTDhRIHTDZYKUo9TIJ1dWxVilJsxeDqGMFbT8mBCDRS6nHZYcy8H8DVCLcWaSGJviRNGRjF68es6qghUm3u6q+JkZIT2bqKC7YUjTfQb10Au0SmMAuCfOfRXy391RdxzQJdTPzT7gdIJoJRap59Bz3J1ugCWZ39KdWGr5qvFFFEKs5Xt2dSl7r3OzLufI7ixajbHJVznLF6UhFLYx2SE7kYzNDr6S1qEsH65m0yVZ3HtCJkY+s4Ajxaj/jOwpciVfrPSTOsOeMaS58M1kg9BebKsdeCDGMsMUz4W+mLpG6dR/OdnGtuRZiSS8EZhwO60KtKXA9OGEsKgSyFsy99BxOsNvFZDynSi6W//B1+73+6ns9cvJWL5jAp94SYKCXTNk09FKnpcU7kc1VW62KGPvBLH7+J2fOfYrvPvHRiiV/91F9xfs1QrDBoWkzjcU2LcQ25mjZ3Gqnqn1nqoao0rd5WcoTWMRn3LC84Pnh94aP3L9JOX8CvvI9PPTPmjcG7aHdfg20GmoQogQXnCEF773JMiLE6d6sPJhZysZgIdnKZu5vz/I8/cJSzz36bz59Y5i9fG3NFdjEwKgmv7lvmtrvvpECNpDY7nxtGiMDy1VN84thLfOXc7TxfDuNKUNBT2xD7UF3DQIy1O8HQOEsfg6JUu8zg4pt8/NqTHNxvGK7egRkt8eazn+dUdye7P/K36coYJoXGG9arglKKaMVnVtkxlMw0JbIxdH0GX7gaMyOEtZS40CskKGclJe6v3RdbVl3CrS1shkgAhkVoHDgaEJVQGyPssS0ziSyKx6E+h4W2YaNTNExXNG8/yMI0FryJxNLQFVW0GjJdKXSx0Ftw9X3ss7AghlCpdNZaXH1NOaMjihzpk6gCWNTs2ORCtOCqmpbivGVPb5LM565SvTJ6TaklQo62IlXbOicd7lSamgpDgQGWrpoHm6rclaz8glRURu5TZmCUk++tgqG8KOWNXGj9iF1rr7Drtc+wb/8iJQ9YPrTKrDnGr//xY7y2+h5GqTADwnSCFI0+DtuG0eKC8kFqS54qUoXWDBjHwj+8/WX2DGY89kzh0YXbaNwyYuc9GtR/FqxpmKXA5WeeYv3KJle3C3Zjjb/38CIPvOsMUznKV16KvFBuZuob/MoRMsqrF5PI/YwELDhbHftOPRMlEIzHpUhrIken53jkhi22zr3MDMGM7uL//t0nOLMJ3gQSlWtf3/tsRDkSrlEZukSlhlqrJl6rvSykrC701BGN512rnu+5vef99+yl2b2fpy6u8Gh7B9YM1dNB1qrqenkD9Y4hgnU1jpjr+MZEYnTcvPUMj9w54R99RojNboajReJ0i9nGGm404Nb3PrgTlez72Y6pj1QTLgM1KItYYhrz343+K199eonnbvp+kqihz85plzXdJUU3WAX1iG7y832s1J8b7bNBiqaeEOb431IhOztjgzq21QdVLwJUSqgWTanqEHPBWO3HmNcAW4RsHDnpM6bdGbn6XdgxOqtBkbdH9MZiUkeyQo6qiPgiOiowjR5q6vs2xvPz9nfZWF/H+EU6u4TrQv+/OzP4RTNcYtfyYfIbGgeyRe1KIo45nrIUdSTO3zQw1fk+N4jU27hobtc5Twkdfd/jva/1pYliDakykr2ztTVLKLG29QVtBTQOco3J4CwlVRNIfdOpJreSglLWnEZtYlGlQtFCytP3ztU/yxJNQsSTUkAMZNRMYZzFomQ95/XPXdo4w0MPrzBlL3/y9SX6EmlFHf8hRFI9WJQC3qu8qvKRhcaStjbpU0u7OFIzUylYG2H5ehZGu1n70qcwH/tHpGi0xzmlHVOK927HsFhSIRmDMU5/fzvk5z9zgmvCfj6+5xWuW1zj1//JD/NT//gzbOcFzZBGbQALoSYumoFmjVNAxO6UisQYKeMJprVMM4w6y997eC8/+eE9OC5y5bzwb15+iBOrN7N0bJldOGzuwRSygVk3JfSaMLBSiKIqQpjP1Kwnh8TAOrLLlNVdPJv28LO/d5b7FxOfeNDyI/cf5v/803M83+8hdoFLb52n3HYnbiD01tD36itJKIuicYbZ7mO8dPp1bo1P8O3xu5Fd+/QLEzKh72kaU01YugyJaMPfoG2JoaO3Qjl0Db+7tpsj22O+d/gkh64bccPKIn7zFNMX/4CtXXcQ9x8hprzTGzENUQ1oajQhp4yXzBSYON38t/ueG73lXuN4c+h5fTJmO/XgPNOUaAWWgUkJjEM1ZhlDL/rlNhXIY6xjSYS+dDR1I5l/F0M9NFhRZaEvmXEuLIvFl4ZEUhVLwBXDJOtnkyNko7QyMYZJrUPWQ2HGpqJmNaO8jj4LxhpyCirclsTEGVwpzIqqBRjd3J2x5Kjmw5QyjqJKTlRIlXMNKYbqidE5qJfEOOrrV9ezNn2mohFFrNQNZX6Yt/iScbFgxGKAxjhyr56KlBLRtezpLnPs6pOUF/8TR+79MGunn6RdeBf/32dP8i3ncHsf0hsTmbA9IcaMUToM4zyhCz3OeLz3uEbnzX0foU0sbJxn7dtf4cnpYd488AjDdkVnvaXgrSeEnuIcFkOKHeOTb3L+/HmcW+LuwVl+4SevZWvjVZ46eTN/nG+kXR5QRKNprnTaZRJUSRBrcUmTEN55PdxayF2gMQVLwYrjTHOIf/vyfhbCEW5feIVPvm+F/60v7Dryfn71P/wRX3trRI4zvBSseMIs6GF51ukYyCm0rRghZL1t5qAbd9d33HT0Oh64pvCx+yN7hoUr647Xwi6+ZR9AbFSSKgmTBGcNMcWdWPBO3wpOgTopYz1YcfSXzrDiX+b5F5eZzPZg04zN0NOIesrapQVVUPsIjds5UFrvCLnHt031BQiUgIjj5Mlt9u8yCA3GqPdiBwNdY9ElqZJXpFTfxPzAYpUCagw2RaT2hhijVVm5FIzx6AA8krIWU83js1Il9t5YfHF6iWFeI5wxVm/wxujhQkflBVcZCaV6bgqJWJNcAIW3X7vML7q50xRb9jROFbskYO1gx7QZpeCKRcTTd2OkdIwWD5BnS8hLj//Lf5qvXPzFWX+J1cV9/M9bH6bYQslqEFIDhEo2+v7knRORFHV2qoFOHdCmmMoEkJpvjCj1uLonc94xPmGEInrjKFAxwRXdSXp7RuVkR47bubVWOQejsR5jPSEH6npRZ+dFN/wYmUWVEwfOqyGEihBF+59LLDXelYlUfn3qObr2PA9u/hHfmD3IK4cfZNF6JewVqjmm0teqk5l3tL85Y9g4dZJL5zf05NkMSQgD65nNZvzcXa+yb89evjz8KL0MMTnTJZXo3i6qyAyaAdZbUlAyIzV3mijMsmdpc5MfPH6W+xY7Xj7xIidPe/7jX3yHw9fezte/8xoh1dYutAHQjjySTSVVJYwpWpkrju+//zA//ZEBu3wgF8+vPbPCaQ5gVvZhUs+wGWIHbuc2nqojWqqSoAc07SX3VshRb/Sta+stqmfe/QA6crixf4PvPnyK+259kF/69EmeWxsgpmcy3uThH/4o2BZJmS7oLdUZoYQeawXXB753+9/zRHyYZ4b34ZjivG7wxlpy3+GdMsxtRReLqKzdiKXyMcjdhOFsnR8/lrl+6RS2m+L3NLxx0nF+8QZOX/swSwurtCExSakijGtxS2WJZ4SrseOtPrJoDNd6yxBtaPO24c0+0IvggtYP7zaZkzGxnsHkxKxANhYTI0uuIaC322VjGDQNgxxJVapckMwEW30HmVjHC8kJLipQKKLUM2sFcmGWqzKGaKQ262dDXbjA1AOq/vpMwRlPLn0dYUHKlkYSoSiBzKVEsQ0iiVnOhGJoa4qlodZrF+V1gN72tXglkgp4LL5A49WR7ZPZWUgHFbqSjd4aW6PVrPPvv63rQVONt66+lsYUDl98g9Xzf8mRw8ucfPyvOf7gx1ibnOY/v7jCd5ZvYdjuZtAHolMWwmQyYTqeVeXPYBuvOfyi9b7OqSkRiUSGfK9/ksXxm3y5eYSysldNt17XDe90fKlqEfTbW7zxpS/RL+7m2nSRf/O/3sVXn3yVT5+9he12pcrzvo4YdP1TzoGugWIKA++Y1QZTmxJ9ZZ8YY/D1EG+dIXY9YhvCdMywL9wzeoUfvify5hsnuXRphTvuvZt/9+kn+KNvnmVgB1gr+Fo2hMSdzgEp+jxlSVgin/zQQxxbucQ9R9YZLB/lmTcu89yB76Vf2KtO96zPRMnaMKm/v2PeVYLRg/m8hEdEwVR97ll98ff43jtGvFFu4f/5yoylYasI89mEkjJ3/I2HddMTldol9fqMzKuwgaYZaHOl0yjo96XPc/v1i/yz79wD7VJNgqiZj6oIS71lW11U1feGJtGK1D2uKtY5xx1WAihnQ7KqtEnAk7UPRESTVaINhEUcxiq8bm4ujDHqGFCEMi8eyrqPYOsY1qgBvRTB9H1dswaIs3oolsrmybmaGrXgzaLjHOUAzucJ+jpmrPDfb/4KfniUrowRexTnzIBx6HB+ATdcwW44io1U/aLOjatRIiWKUaCOqQsE1BmisXqyc+gPgVSAkjBwDSn2Sm6KkZwKTtSFbqxg5W3Xu9461AAhczkm1Zt+nY9HqYaQGMlFP4AQ683IJM1fYvA2kUvCNR6fq8O9wGwuSaKLoFhPpiNnBfDEpD6FlOGOXZl7br6Lrz69wqIZkUpHyUqYmmMZi2jUSSFDhUDCGkeXI/7QIfq3LjFYWKQrmlGWkhgMG/78rUP8k9sW+ObXvkC67xPkiHoSYtjhJFj0YdWsaO2nrmMVh2JZzZ4V/uvlAV989gXuHky5+5hj/yMtNz+wRN66hQvpEM++vsWn/+zrnNlagL7nhmsPkPoJki0PHF/kkQ8c5+rZV7jnphFxcpFvXDjEn1y+ne1dDf8/U28aa1l2nuc937fW2vucO9Xc1VXVE3vi0CSbpDiJgyZQFmXKcixHloMgjp0ECTIgAewkP4wECRAkCALDDhIDCYxAsiXLShQpgS1LlhxLlERJpCSKQ3ezySZ7nqqqa+iqO52z91rrW/nxrXNJ/mSjqu49Z+81fO/7Pu9WNjQYVYVVPkQtEiSiGFaKHw0b/UbnD+MQldaMkAI2Vcr66KTVTGKilT6FiIGXw2O8fOMBnrr2Iv/hp3b55W83/ui6cmp3l6svXOfSw/eRWzeBNmMqlXGxIJgxh8rupcc4//RztK3HaTKQ68wwDM55ECFnd25XrU6UU/XIlTrCOkhE4oL51L387AtrPh1f4XOf+wx291ne+c7E3jNfIx++yt3H/xKrU/ew3YwUR25PR0hIpCbM1fXHUzGyVTJzy6wkcJwnTuuSuzazbN5Mt9LGsil7cSBMB2zHwKoGdgMclkYR5bg3rOVivB2MnRzYr6WzHGa2U2JdCgdlQqsnPdatUitghSYjrYGJ8xG0NUwyuRlboqxqYegjztb9BNJvOXPtY3cNvUI10qx6JK4vlNa8tXARBz+0dloZKkzVpZGqoB1Fuqq1A7I8WbClkUWPkFXxtEcSWHQexFQLx90bMNBZIBni6BHAZo0NM9PMzYY1CbvrFTvf+kXe9+7Hqeks8+1r3Pt9n+LZ517mVw8fYn3qXWzLjFUjR789WzPGcaRm9yuAVw63UrEYGIfINLsPqtbAqXbIEzvf5A9ev0B5z3m200ipRp6ym1drPZl4ALz0lT8j757ivYt9/p0feYK//UvXuH76SWpc0nJGm5Dz7BHZqbFYLLH1RNbGOI7uM6IiPZ2lMSC1eayvX4jG5YLWjNXxmnHAS9SWwtfko3zt977Nz3z4Mg9vf5XBvsnP/GDjP//rn+Z/+vtf5XjY4WtPvcbu3oKdsXGYjb/6qYexZeZDD52l2AGhZM6cPWJ18xpHl36cX755jv2zja1xl2COLvdWGH8GnLjoSa2wiaz2iZaZp8KGfqA8h/JXP77DAffxC//Pa+jyHt8jgoOeas28+I1v8a4Pvp95nv2JjcnRxbXHGVsh56lPogHLXD82Hr/xKturxzkad/uN38uoFDeqWtfxwQ/vXtnrsUHpB2vpUUYhULAOBfJbQwvuR/B3wt38FXNKqygJqF0KDZ0dIeAkXBxmJ82ggqr74ixPfdLpRtcgQIodehShCTU0QhuQZjSdKLURoe+pdGJgQUJzzkMzVBTKzPapLY4Oj9DtJYd3J2Ipa8+fyyE371ylSO5ZUR+dphCpQD8Q+U2gY3yDBGqdHLThjD5a9YW/BdfMUndza990Y1IfPQYgJMdKinjtoXbDSHMMaw3uXrXoL33shLuU1HPAQicrQQ3unBT1v8+aFzSEoNRiLKNy2N3PCxVyJ1wJePOTRqTfrP307kaZ+cYdhgeXPPTgJV5+44it7YUbu6SPkcR/Tz+VgEa//ZsZqcF85wbbw5YvuHFJbYU6BEQj33h7SSHzsUcav/H6qwxXHoAyM0QghxOogw+mzGMlXSYwU//ItZLSglaM/Qc+wh+u3sVTL3+Zn/7oQ3zr65/ngz/yGS6/+E3OX7rLT/53P8ad1RbXX/0a9z1wP8mE1954ngcvn+fOrT/jyv2XuV3X/Nbr7+QLh2fZXS7ZNdDl4CP4oAiKViG3yU/T/bM4kWNaIw4D2OZnVDTX7ovw2GXNRhqjv1TNjUWMiWfLY3z2zIqf/pDy9K/dgL0FV1+/ys75bc6eu+DNa3Nvf8wVi0JuCxanRnYvHDAc3SKPFwjqeneQSJfZfZTaio+VXZ4mhUamUevaR98icG6Xf3b9ndz79Et8dOeA/XDA7jse4uPzbX7n6/+c8ZN/DWOPFceYinML1JGpM0Zsxl4MSEvstcQyNu4CNQ2sVxMrMtbBNtfnzJndPdbTXVZF2K9GCwmaMXXdOcWRQRvH8+TavICWzI3iunWLgR0z1taYyIgldprSgnK0XjFFdxsve+NYwOuMR/GWPWtuqitdU41UTJRQldp8aqaqhOZ1vqZ4xbAploS7fRKjolQr1NrNkK2xqspZVQrexS5NGHAeQMG58DJnPwDg9cGHtRC0OP+iCiFu0j2exdYWkaZU9dux677K1DLnW+CJm18kltepd3eh3GX/eOJ4Mv7B2+9BTl0m1YlhWCBWqLi5MrnTqmey/RbvJjhDzderpgI2Y7rgg7tXGcdTXFu8053j5syP2AmbGx3ZMGyuHB4esreIfO7DkE+f5rWtewj5CGXdQTseAx8k0shO3Gy9e6U/79M0oTljZWaOydfTzYWgGbV4qme5tWBazyzHgXnOhAHSA0/yq1dh780D7t+5xQNbia2bL/Pv/dRpzp15kFffnNk5e5nLu7u8dfsWZm9y8ey7ufHKV4npIlmhbi34wvEH+dYb9xB2k/P/0X7o796CPsXwZlBfHzeD2qiBuVbGmBCtqAZmnRlf/CL7j1R2z93L9XaHM6ublOVpYnPjXs4zn3jy/VSJDMGYe/WuT6XFJZ/ZR/g0xTpi+o31RY4OXkX2Fn5ZtdxhPX2KYJ4wQs39KiqEHiutBFR9+uTSQb8s4hNvEaVaJjD26F/vGfDHCKOxEKG1wMKgBkc8D4WT/hMBvEuk++Twi6QfGl1mo5nL5STvF6i+nznCGloTWouoVpo0NCS0dwBol/RUcBk/VMQG5qlylO9yb9xjXg7EYbGgpMhsS+658B7KaxHV2V3AZlSTTifyX7TnOdi0LKgOTpci9/NNoUlvTNo8CKnf/IIiTci1oUF7LrXnY5P65k9xNCyG4HWLmxGJDxUUKRVrhiZFq2eRo9jJBkRtbn6KAdVI04xJYAzOUl/PxeMe+CGh5UoYErm27gANMK/IdWZ17QZf3b/GU8N9DKcuIr0tTxBy9QOOqDKoA05qM1p1wIm1ijByfHCTqRq2t4sudnwDTJXloPz3v3KT/+LH12z96ec5vOevkMaFUw+Tu6wtKRSjzO7MFdUTQ1wz5x5MeSZoI5HR5YLDBz7FP3wVjtJj/PaX3uQdqz2Wxys+svM6Yfte3nztdcL2yPzWLXS5y+e/ecT14QluHzzKK2VJTAMXL2Ty3KgaKVZcw2sbP0JnrNNlEBq1+UEoqjJNforVGPpzQydFeiGIiOOGdQiEJmj0GIsF+Pt/OvNv3fcW/8ZH38E//OYxOxcv8PI3nmPxidOIOeTIjUuJOc9IEv7JNx7jE+Nr7Mw32d++TNg0ZpWpj4/9jG9N0H5gk1JZFZ8OERRpypwLUTPnz1/k51855l/depP/+Ifew+27T7Ozqjy5taI9/U/5fDnD+OTHGWVEY2B/WjvJssG6CZckcKcJz0+HnB63eH5acXRkXBwi9xUhDQPX5jU7y23KnFnaHudPN/5k/4BJCmbOzAc4yp5JPz+4yTWXiTgM7GdH8U5zoaiSrLDL6BXE2rAycW500ND19cwcvZshijJK8UhgzxoX/P0Qa5T+zU741CRVmMpEimOPOvb0QvDWvRiC37677p+iV9KaBFa1sWoFqf3G1QpFIsFgahO1RoI0/PrQbz3N0Obwqxa7EVEj2qz7B6q3hLbQD8WNIwncV475+K1/yYUrO1w/2kHzXZ574SbPTA/zpXgZPX+GhVSmakwlM8bgBk6h89od0jOOI9b16pPylVaBgdYq6+O7vP/Sbc7f/wh5/35f0PH1oDZz8l8MVHOT15uvf5sQt/jhi3c4c+8H+TtfqizHiWllFDHaNBNiJIXYR9nRdeBSHbndhMrs3fExdB3aR9at32Tp757VxhAjOrrWPG5v+V4yHzHXxtGDn+DpMPLMPPPEMPHGd17ic4vGrdvHPLZIfPmll9naKujp09z41iscPvoT/N5XrvLarT1O1fewdW5kq5cW5c2UBEdUWy5MpZKGodeFN5cCRBB3yJFQByq1wlSNrbdv89nHr1KW7+O//rmn2dVd4pablkMIlPURy3HBN576Oo88+QSwSc641OAAqXZibI5DwEyQsibunSGP5ymv3IZLp/v19Hum2qIn8q93xHgTbe2GwIp0KWATHxRCaT0V4Jq/mVM9HR+kqJjX3hs0KTRNnt4S93BpUO+3wPs0alMQn15JaFgLHhdVUAJEv6DGNtOKgCZanYnSyOaFYGLiUb8gPcmjngTq0UGAahPafVvWMtuLJdduvEnYfpQ4r9es7l5DlgMHh68xyoNOIzLP7tdaHcDQWQBe8FE8bmPu8vbP33Uf6SYE2xgEq8MzUgquFYmSgpOKwE/ZQf1kpn2cVauBVAKRZhkkugkJ/CQXImruKl8gzLlQkhJn/3dmbY4HFbBeeFLVSMUPEXPwL1BVmW1mDEOfSrjBw5/SSJ0b735X5NF7HuR333iIuSbCop40mbVi5DkjDUpsyJjQqj6m6w9oOneGeXVAWO5RJ0NCgVKYszCOkZfX9zCPZ/nxD32DP7r1Ki+efjdkI8SZrbhgNfX4ivoLn6dCjO7OFpRsLinkIs6Grr1TfVQWcZu78d18efEY7ClfOhTs5kx94OPUVcJ2JpJG9N5IyX5DPDsfclSNuUZkwA+BVQjii3RDKOKRFvMTQO8xr6TgEopWQ1JwuAUeD7Mg3lGdvXls4+ANyUdT5IZGaOkiP/dN+GsfFk7lY9oyEM+e4+DggPOnzzJbhlmQkJwqWSfunjmPrQsXhhvso6xrhjwTaSdwnroZEzej1fnE1DOvjTS4wSaKF+GIGOMicu2BD/NfPX3Mn9t0VIQWAAAgAElEQVS9zE989DLXX/hjbr7ya/zMez/Cd/74BZ7/0F/lVh2QWjg9jOxXZ04cm3CUK9dK5c15xdZW5BKZSxqJWqmz94K/vp4Ya0VSY39aMyQ3y9UUsNkRxLlVSjFiGDilbnrKuFkvVde/qwZCZ2Ic1sx6bZCE29lriYvCVAs7vldgLVBq5kCya/Lat5MmhF6Z2sQ3tipCIWC1ErWxNq91TX0tyK37OkLwRcsKWKBpIQJrE5IIA81hK+Kti14tvIlaBaJ4Rp4yMaeBJCBZKBEkT5BGSsksNBIN1rVDVcaR+575Td4rL3H64jmuPvN/c/bKJ/jqq0f83PR+xq0HODMMrFtmzqCSvFkti6dkpFGrTyhjEqQXSnn5Teose49RtWGb+1rm1gvP8OXn7mX/wmPs1OYdHsk139AcVCQpkdcrim3xkYd2efjRU/zvf6rI1gi1MSy8IVGzL9aIj49FI1oLrRgWnXCYUnJPkAjWvKrX/VF9CtqEFLwb0fxqeHIZOrh5h2aZM/fcC+ppgVlnnno9o2eu8I+uRebx36ddPyLFkaUusP1KDcZwbSDd/wiXrlSvog3VR9cxIqtM6m56s0wMDRBP7PQo5jq732cYBqgZqe7/EkmE20f81IU/5sVv7vMrb93hpXya89uR3FMUNWfScou8OuLe07so/kyKecFaaa0X1bk0bL39FWuE0Siyw8GtGwxbymrTiyAuTzv0Co/wNU+y2Em8sO9p4tt66WVgrZTOnzCC+B7Q6jEaF5Tml0DEJ0EqkaEGavSWzCALmmYmVZ8QSMXEp4ahRZ9Am5AaVGmOtNPg1EoBJLlhsG0OO4XY6Hj8hg0LyGuqTN6t0aFNItY9Pd7uOltje3GRqzfe5MzF+7l1WIhmxt6Ze7hzuE/KGTOnPVkQTFzvFxGSY3Oo2ImjE+y7hRJ9sY1Bvaq0VHyQ7k1ttYUuKUDQkY0BzKWPRsI51ZtDRjRxpOFmU7Hii3g3dI3dcDPHRG2bqGJjyi4LgE8LajNS89SBBXcMuyCcKcVLITY1EEpzhnKthAZpGai3I4fz64TxiGC7BGYyzVWjngaoNbu2VRQkElslU93rgMsbMni0EZthsXS+Qq0ENf6HX3mD//YnGz9gL3Dt6W9z9MRfhjqz6hQuFe+PDlER/wD7aFAQsx7d8RewiRCa+GfVHfGxZZo1WhvRJAgzO0sv4FmXmSW7TJaRGLiVZ7QYMai7+IkkPN0QQgANJ6YhK3aSL95goQWh2kxEUXUMZesTgo0LF5zbYGZYaWhMqDZaKWRZUS+cZ6UH/NSnH+Vnv/gGO2fPo9J1REBCYF3WntYIiZVFws7AE/EtXpgyio/jrPZnuWvahhdIWXYeey29STA7t95UIAamMhGCjwSHvTP87rzFC795lT//wJIP/MR/yvH1r3Lf8nnSV36eP7z4JFsPfYaqM2JrVlUoVtjbjtzPwB0L3DdEqvpivaqO5W04lOpQhWnOrOjtdap4EtM/szkoSmQyuJ5nRGG9WpM0YVZ9crLKoI3dCjsSOFJo1py+17zCN3YMbmmVEhrr5qjpELw0KW/Mm7j+6ed7I0oEqdB76Wut6JC+K8FZbyEsRgz+/TeBuXb+uRX3IURh3HiDjH5L7Kmf2g3GoWN/zdwsi5PoJCXnyANVNpPBRrz1Ku955bf48CO7HLz5Im0euXn7Av9yP/F0fi+7ly5CyUzr+WS8WoqbbE1BJm9W9O4McDNzrzkXJQsEHbAKwyKRrXKhPce7332Jr9z4YbZ2zlFa7u2mXePuHpdsjakYN+5OfHrrTV6/ew/r7bMsU+Qwr5DZ0bKIQ5RiilgpiE3M6wntrZkheQJmsVgQgldVI8rQ6X6lZKdL4r4INxM6WS4fHWHHx+zs7YK6aXPOlcUwImkkl5nQGjvbA2aB1P+OEIWaEq1WTyL19JYOI5iRS6GZT6pUOvzNPDoeQqLMtafDFKo/GwElBI/sWWt8+s4/Yvf0Fk+vP8bLx2t2TgVqXp2s1RuTHK3x0gsv8+Qjj3dcrk8eYvTuCyM4Vwaw1khJkTpg119j58Ft6usLvwjil0JHxApiTuTrVxRfB8KGO9Po27A78Lv3TUQ7/M5v+BoHqqgDl2JDWuyTzsoc3PQnm6bT1rr8IJ40awCViJzAg6T5M9Edd2Txi2bofQBulleaOuzOutlcanGyawcY0U34BHXqrlSiCCkKh/s32N3awTSwtbNHVN1hXl1le7HHrekORP/n4+Y2fhKd6N3Z0Z3TU2cDpJ7zJDTXwbW3BIZKbdEJdLUgzR/cYr1iNYiPZ8VHXqGPsozmGUwVTLtj37rDkup5yVI9pjIkLGeiQmmb2sPIprKx9fanSaPHF9vcK0iD61W0zsN3GajkgkHvV2+0lviz4x0eOLUDb++je5e9F2FQ6ipj80RLXgsr4LSzaBADqXrmtSDsXL6EhYV7A1CfIKidyAa3Vfnf/nCPv/WJI/61Rw74ze/8Mw7e+RdBVq4xl7lTuBppVNedyNTsURjDX0pNQz8lBvJ0hMaEdUBRCpEyZ8blQAgDR/MxQRJma45XB27gmjJxnrFaaW3oyOeGmrq3oY86pRboMZkWuxEHQZNCExZtpKghLZxogrrJhHc3cOslR0GUkr1fQmPPgNeZX38h8FMXvsPl5Snu5szR7WNUGjt7O9RaKN2F3lrz9rntx3jHmW8RXziiaITaud0hYDb1BIlCc39L6xW0akY2A/OYmamblsxgERd+o0iR185c4X99MfCvH/8OH3z8AW5U4f6Hz/Fjr32BZ+4Wrr3vI6ynxPauQo7czcblYUSscP34mJ3lgqPaGCTQQiPLzLKMZJtYVz8IhwirIi4xmaCpcY8tmMSYp4okp0SaJo6b99yjG0Mq3K6NW/W7jXBBhGVQ10DF0dRmlTt5Jlt12SIba6xLMUJtldi8r7z4SA+1xmzeCRIEbPbbvQXxfHPz6FRrlf5fPIVgzjCozfeHph4vTkGhNDIFsc1Y21Bx9oE1P8geWSZW15cXKTKsvWFtpYGH336eD1z7fc6drZS7L3PpsSf49jNv8H8cvZvDs+/g3GIPJm9tXEujTPMJ7Y1+qaDhh64Q/HnASGEEbZQyeXY8eMTMaZyJTz9yjvFC4mB9mmKldwR0t3aXxDQUbF24s3/IO/M1hrMX+OPpfhahcrSuyDx3B3chaHICaalYXkOpdHcGrTRkCIQYeseBx5jpN8QxRY9d0jxnlYy5ZpbjiKpyHJW6OsDmibpa+TqC0ognDZFbQ/IegugSxIY10mpGkyOkRRKx452leJ1uAY/44Wu7hciAHyRl44vC0JRoYkyMSIjsvPwNPrnzJZ5434N84fYev3MNFgalTuj2ghgVnTyezVwQzbzrBz5DqkY+Kf1yGWJTOKa1IR1L36pz/u89u+bo6j66s3TKa4y++auzLNpGTujrwebK2DCC9YlrN6ZL9QlC82rbDv+JNE1+0cH3NmniB/0mpM7Dcd4BTKpghUVT53C05H+f+n7UzAudLPg6q836ocFQIoRKsUxq/lyUuDlsKEN1GJ10ab4FIAC5EQWf4IlRm7F96V6uvvoWgxxSYiQOWwtuvPQ2lx55FMsLuKFIaph4h7zfMP0vD52g1PDboJob9giJWLxAR7QRDFRH/3PeHOGbRwPotwrzmFzrxiSRvkFYv0W0Rkh9wxQ3n0UNtN4GJSG681K9ktHNDsGLh1r05rBm8D0kpyCBkstJrJAOHKkb404UFhqY59J/1sLbu1c4cznwRH2b35bCMgRywxvs4CQ25XFJhwpZc9OQ9cPKO77/47zw5afR7oEQwfWbNHTiX+Sb+8rPfSnyVz57iZ9eXOfXnvt1rp1/nHz6UarcheA9BpsNNaRlryR11GSMkZLnkwInTYPrg6XH3npGeSqBZRSGFKnzRKR5ZK5mH8+LkJaeIQ39wWmxIragRZxqtaEKqk8vWwid4urfD4uAlP5KZW/Q6waGTu5yOAVmvazC17RsFa1uPD1uA6/tH/G+B+7hj64buQmHh8eEccEYlFh7eqNmqJXX3kgcH73INCoSldh8ilV7XDEl18CLQZnyiVN5A/GQCKn5KM6ohJTItUD0rPKWBOyee/jlG4HXD67yoStnCMuRt67d4Ce+f5/nnv1Z/ui+v8i6PEirmYHGcX+mzy63uDu5oc5awcJAqwtCM/YSFFHmCpMJoxgzUNUPKcdMDJLQCFNxbnszf9YQr0qezd87ETfppdA/X5Taik/GSuVYg+vwBkiglEYIzoowUUJxMl9VYc6eqrHAd2ODbeNe6tPB5mjjoN2AK+6AR70y1W+3vgiFnuVvSL/5QquBWaqPamJiNo82+fg6OF64FRbm/IdDy8R5zcdu/AEfGl6H7Qk9fYWjt4Svf2fg7958D3r2EksVmrpPZb3u7H5142jBfTpR/SLCZkqWFIq3Opa5ENIAmxFqb/lsMvDKt5/jjaeuUR79LCmu/OYfvUyrmVDFWFuEqNyZE//J4wf87nA/Sc9AKd6MWH1TkU7Hk+SFaLFFv0DVBlW90jn28X6pqI4nkU0rlVKqG1HDwKa+fBEcIlbMiIstts6dp6yPiMOSOAbqNHvFbjHCkJhbZRh9ylFtcvP0MJJ7hjyECNqopWHTmg3ZVZNr6ORISAaKg9tac7e9RqI0ZlEqcGW+wSf4Ig+fu8ULb97lt1bv5JdfGrHjq6TtPbYXp9BQaS3TOvI6Ac0Cw9Y2Nq9oGrvps4+4m/qGHl3ako5kX1fjI3tvcO3uJVZthxDVE2rdnOoHWW/scw5EN7h7rKDLA31N74b4k0UK/z2b9rUf5yRo/a7XQRVa87p7Ce6rUfUJcA2O/xWd2fQrNBVi7fIOmwuVaxNqTmtUDX7jlwhdapKWsVyZNJCkk3OrT0n8rBJc0u6HnKFTDHfOnufwxm3a1imXAITAjavf5tz5h0kbSnP1274FRarf/cApRn5idJeqmbfKBQQNMFfxEVJ27aRap3L10zFWsE080ZsUuxsTpPUYxuz5h6DKXBpDdIwqGqlByAYLMWyeUAKmPtYp5jJNax5dFGlEbVirVCJFXTdUa/QKkl5Y0c0qZl1jC6hU5ty4E87x+qtf5Pq1beT+jzk2GPtuVrhWP3Sg/cDjdarZnF4nUX3jOzxEd7c9NhKTjyNxw1AIUObK790NXP2NA37owlv8Bz/wIL/+h3/At/ePODh3HktLUownpRrZPNoRmvpYVJXQvOZSU/R4YvNuBNXonfWDgLiWlHOGtuE19MaqBtblkxACSYMT4AjOpJcBGV1jMis0M5IGplpYDCPgGeBa3Okd+qGxVTyKFlp3bvfRZ29b3Jh4NhwB37CVw3GXS8t96rqxfe4+54DnhuAbK+pRmclmyt4W54ZHWaydXO/TCL9ta42UYn57MSOvK3N1b8nWcsDwjvuF9nIrcU5FC3RDViEMSpgry51t/iQ/wOtXT/NvX25sxUP2S+TM2W0+9uw/5xvnPs61+58kywqncY0O0An9pqaRO3nFqJFzyQ2x9y0GbufMnTWU6Ll4bYW50dsAPeYTJLJfKlPNTnc0IVmg9NSM1S5/FPdj5FqpiBv6MEq17l/piRVwqIz26Q2hA1E8ItVqBgJWXYtXA8RdxkFdO1X1eNOCxHHJIP47ecW5O/WrBlKvEUd8YmHVD5gSnTlSa6V0d7dvugLWqJqwkH0acHCdD7/1NT7xQGWuC8IY2D+6xefnx/j9txpsnWeQRI0w1cxYeqYbYfYZvz/n1UmCngIHImRzwluts08FiL22uJGLodHZ66fO7JBX56jrY9JOcOZ6l8dqq1AK1Sr7R8ec1mPe98CS37y+596pgCcbQqDOpYPBxG/1QfsBPxOs0JJ/T6FruhpGcn/Pcp4QFQZNVPFJF3XTO6AQHVizGAJt5xSHcUBC55QEMEsIK6JlxDzuLNqQqk4e7O+1DBGlOZeEfpnqwBxVn9hNff3DwCSclC/VBlNraM6ceeOrfPbUc5xarDi88AB/9Nw2X3x1yWIo2Ljl2XnbIIL7FNmMOs8MwcmvkgbImT4A8Ft7qyeoXpHkBFczMpnXvvoqZ+9/3BNXPeEifRcT6XKJVvcWdJnb5n5YjKkfRP1P1NaIwf8/lzkrWoM30rLRGhtumhIg932kMGMkvHqZ1tH0CuV7DtVKoTZFgzevbiiHrZl342CYudxZqcQArbhMFsSNiZhfBv3P9cTCZgpRJ59wBnj72iugp4hj5GiCqGYsd0+TRuXt1Yoce9RO3HUcRKADXU4Wauk41Oa38YX621RMiTipr6bWmwMDZs073SV0XcMnARI7qc1qz2p511EN7iyt04wITCWQiEjwU5zQHZPFc50+gVQWAuvSkFi7RwGkJR9v56kr/UZBaNXJZhL9iQoh+XjVG2Wopgwxsto+zzMvCZ989AFefPtN5uV9hOjkQY9NGRoSxXd2qBUNkVC9qGQIA1WFdOYsUgu6CEzzTEZppTEuBuajibgcGVvhzWnBL776GPnMIX/pz30/h6//CT//e9dY7X2A/YsP0s5eQcYlybyQpEbXd3OFFKM/NGbUfpOSJicHMFMnsZUyEVpxnSvIiYnPBJJAjIksQtVAq5mQ1AuSRMizjwbrDLTMVLN/NyKg0f97ULRVr/HtOrMEpWVfHMNmeuCnwo6LNTeEiZycZL/2xsS/++Sa5XjGyywaMCpTse4+B2JELfH2ressrxzRbgoSIjFE5tyBSlS/NYdIHHu1yc01EhohLdhbLIhDopFhds1PrRJ1y6OEoxuQFstdJ9Xlwn69wN/9wqv89Sc/SLhyBvvmd9jd2ucHdv+ErzzzTb71+I+yjrssR+XOWpn6hjrEgQtxwX4p3LVGbgNhNTNRWS4Cd9eNLN1olwItN9Y0z+CLf08qvXGvNJwb5q7rKgqlskwDSYxcMivxFI5VJYqXkwQ65IUGyV3LViq5t0OKFjeZaS/8iTDX2cmRfTxfq2eMF62xVmFN/p4F1hsFNwe6UgrWk0CtGkW9YTSFSmx+wBh6vSwNhgDHnR66lY2MEK6/zN8I3+DeS28x3TxCd5e8cHiB//PVgZeW25zaWrIbEoVKKl5qUzRQmqOkS/P1qMXB5T6rLKJLcBlDTUjjwDS5h8g6EtzjrYAI0SqDHDFsb7M6OmDSRBi3gMaowlwEQkIssB0OeeeZNS8evsVdWzDPK8K4g5EdIjMmZCrothMGgxm1NUQTIXl6SaN7Uqw1JEBKySFNYSSvJ5r45aEZSEehS+pAmCEw5UYMkXG5QMWo2Y3LcTQ0pl72hNf1dmMxOKsltQYVLCYkOCsD8CkhRkipH6IatfgEcm6BVZzYWsOFVDh+/Tl+9PR3+L6PXeGV/bP8v18b+NqfBK6FM4yLStMBPXWKaBkoPsGVSM0TQQUZEx/47GcJ8+QNhqG7/L8n8dWqnUxoqlWGFJm0cW5Zef3oFPMgLL6ndAtxJkZTxYgEEW+XjILF4KU75uU5ISVqhXEYKNk5KA7Cc4Rw0thRvpFiTpFMkZ6cKxiOvLbmxXNJPLllYr0l0bs4DIc9WZtpJid7rNBOyo5EosPPYuixRP++rCUkVy/6EU5SKNYj895OG4gBihq6dQmr20xJGYpH6Dl78Qo33voWcdxiGWDq9buUPv7fVDf2DzI2h604BtfjRLPWjjhsnZjlMT/V0PsD3I2svRMgqpcrtBCwPJPC0G9/QnLXhp9eineKa3NTUW2lb2iJIJEsirRKqA0kIa0QzLOWrTZUZ0xDx0R24AN+exwIzKX6lGMznmuF4O3LPjbXJXuX38d862n25iU3dh/ozYXWa3oHTy00c01a3AQmqqTRi4aSweMffi/PfvHLLIelG12ytwnmnBkW/SbQFjTWkHb4lWfhX3z7Le6xNX/vP/oZ9PBF3nj+9/jNr9/izvJdjI9+mGvhHNIKGf9Zajd/pDQQyBTzUqNaA0GDH3863rSKx1Jq9c1XxEtqVHF6Fdb9BO6oCOMWxRxgM9fpu93hGpEYewujY11Lq2ABkdzxrw6acfONnGTLXXirWPUplFMv6NrbgC4u86dP/QkHx5XzFx+lkbEpQ3Lt3uUPEJTdZlx/y9ifKts7XjzTSnFT6tbCn63m+NvtnQXDeI5FGhiDo2VjKxRZsre1RT6cXKqIyTPW88wwLr1StYk7taXCuSv8g+fP88mrr/GB8Yh7rzwGofDJh4849ft/j6c/8jd5e3mBraFxd7XqcB3hoBQWsU+fmi80qfjmup2UViaQwJSNWQO1ZKIkDsrsRD1tmAktNcgehxUTshk7i8hQZvIshKSoQZn9kJA3ZhcFX3bcRIV6np7OwfDxZyGG2BkKTnLs645Dt/B4cOmj54oXIzlm2g/HtVaGmKgyd3NddNOiuBxg/vUzamKqmSKNZIF1MQbVHjMzHn7pq3yOpzl1tnEwz+w+8im+8vRz/M9vLDm3dR/jkJhLoU5HroaLG4SnUDqtEqzLHfPkGX9VYTYjphEpjmfNXfYo1S1gtc6Ipj72hhnlWM6zrGtk5xyLncaUHd7aWkA7dc0oDEReeu0Nnr10hZISi0E4zGuC9RtazSAFJCAkasnOzBAjjF6cloZFR9L61zaEZb/YZIbtbedqiKPbl8OIhEzJStqKCAkR5/eHkqn5iLSREDZT3DHSghIlUsvamyLNIVetHSPia1rNPo01vGcjNPCAj984h+jj9CiBz9hLrJ7+F/zYey4wv3OX57e+n7/922/w2sEZ1lXZGiOnVZmPbhDjlu8ni5EWPQ0yhMZ0sI+tJnZ3d1DLSG4+EekTRev6/UbD96KwSESJpXJuXbnwDuNXn6rsXRRK81SCteqFU3191xCoPUlQq3tTCnTKYKJVQS3TJIE2x+MHoenghEgfpLnjrMtexWYag09FmjMFRIVAdZ5OCN3ol7op0vsFqmvRfdIiVBOvPO4j/CouY5biv6v0vy9IpMXsbAEJEKxzGarLN/39rfiUUI72uXvwPKcuf4hbq7eIt67f+G/04FXmcofTly+R14J5BLFv8H1kh49vAWorSAyM4vMzM+9qFwkUUVJozOZmqtn6FKAU+B4ppfabKl3Lrc08298MZKDgJDRvb5y7FOEjj2CKae3OyV74kgKrUju+2G1y3QIA1ahxoz8rLc8QItb8oOHj6j7x0NDpTv5wqWR+//bM51jxUHmVm+EjtObktVKcmOhNZE5V01qIScjFgNm/vBDIIfHIJz/Jd77weRaLHWL0h49mZFGGONKC0WrE8kxV4XZWbvIIP/2/PMfj52d+8APv40c/eZOH77/AM1/5dX5h9ecpezsMacQiqLnhbzPeb3g3g4+Uuq+1myk3L08UsK0FdbVylCleKqPNM7FxsaAdrUDcZbsyh/lAdcNl6HHA6ofBGiNmSui3V5FCmbOzBET9BbLvcrkh9JfFHbgupwClUdqaDz008MyNc5hkFmFkyhWKMTUhiJEbrA/WfPTKPl+58wG2lnuUsnau98bkI5HlVvLbZzQ0V8boDW3z7Mxx0ciovUt9OaCtEVOgdR56az6OFW09GmYsFwN7y4EvHT7It24U/vL2NR46veT48IDdnVv8xPX/i19bfR/XL32MRZxQDbydi/tfYqMWYzeNtFwZB+FW9mRK1ESRSqjKikqKkf1pzSGwFQeiwKoWTISkxpkUWc8zR61wNFWyNe+yEJfXRMyfA3GD4VSKQ0JUT6Sytolo4fqn+/8MkvaoGVCrx6KCa7FFnE5prTrbfHCTL33zh02Bjl8Cpua6vLNXxBsRtfvvXThl0F6MUhU92ucnj3+XK2eucf9D38fdN17k1Bj4rS9/m3986zTjqUsEFeJUHRik0Y28DSR4EsZKI+cJ00QsQtBGKwFR506Uvuk3ce06akLwGLAagNHCAM0LzK4dNj51RdDV7DqvgM1G0cmlxyYQIpMojz/yIPtzZjEGjqZ8MuaOVSBGGNyHsUhQ4+ZQ7LXLtRawSoyCavIpXK5I8Jv5apoY1N3rYz9M1grDEKjrGVIfI8fRS8hipARljMnTVzYTunmN2IFHzddsjWC2ODFRh5B8DQmBVjIluA4dVSElas7ERUSO9/mR9Hl+4XDmb3/jCnfZZXn/PXDpEiG/yK5N0CpmlcXOKdCAzbOPuauArbl7eEiYjjm1e5r7P/lJ8jRD6Bj0GEHDyWRJ2ncTX0ZjiMIs57n3zX/M8YOX2b3/Ca72VJsbKX0yGiQxiFBoII1G7WklJVnDUmBTF4wGhxwhEAdMOtTOmm/SSvdKOQnH7zkTVn2aIZop1mvr6bf+Bi04lCwRaD2KW4AWoh/IbE3t0pJ0Db+qdX+Bw7q0FFoHVm0KikJPNISe4hNpQENLRUpjPHuJvcU5bl57njKfJu6d2aLoBa7c+328fecaidhf4B4RskoUpaovWDEp2lJ/uWcIpbdLOeEtxP4hBEeVqvlGxMal381fJnLCNa7VtRxNkVYaNRdC1/0bRhtivzniD6U0RL3tSGtjtoxORhiEKZsvSKqQhNwa0QRy6xMJH2eH2FuWBmcVbD60bIXQlNZLiqrC26ffyTseOOBKPc1zN+EoCQUjjp2Jr94kFQiEUZhrhbmgxZ2XZXBJQLcC7/mBH+PLv/gPuee++5gWCSmOB262dtet4MmJXEhm6NYOK2k8s6889YURpvOcvva7/M0f3+P2rRucPXOaGCKrnB2MZObFQcXc5Gbi4/AyEeLAEBstO9O6iZexWG0M45I5ryEM/j2LklJkNWXGxZK5rVlXH91O63lzkYBiXuhk1lHNjWEYaATX7daHFHPnrYjQsj8PMcYTrQtx/laK0UdgYugYiLLFteOBuzKyJx61GlJj7maPKEKZG+fbTcayz8vDp1ACxdyMliS4eTIEovb4ZJ0oCaL5AS7G6FJWCrQaGIdurjvKyKzU5JuTF+Uoc8nu0pdALmCxsUyRg3Pv5eeffZZPnL3N+5dXefBdH+Dt29f56QjWlAIAACAASURBVPrr/NLv/AHzD/4tLEKtxwzROJgmtoaRt1YrZmBZjKMul1QBmjKGRiqB26UwqZJNuT3NDEE7XKnSJHGwLhw5ZgMzkJY5niJjiljLQDf25gwFpG7Gh754DCl4fLN1obziC4y4TBUC5FZQIikJVoURIWMn0pC3LDqhTM0PktbDdaXMhHEkAnMxhuiJnxaUyToJMje2hwXHlqGtOf/y1/kpnuFdF3eQy09wdPUpXtpXfvXVU3x9epRzW4ksgf1Wu/6doB/arXqyx3oV7agLcvPLhOpADVBCQ4oSU2KuxVHJBnNz5K9ZLySqFdfXXOt98c3Exfo62zvHrMezqBq6UKzOvtH2d26uUNbHbCVYrQuKOh67Fo9niTJoIy4UiN7NIW5OnLIxxERI7vOw2c2LrTU0Ox43qCdskgbWUhnE69Fz9qkfmtxYOHtM0MTbSE/a7gZvaG0VYlZCGiml+E2zH+CxyFQzYXBTLRKxUE8Iks0MHQbfhOeCjRd4dvEJnvz0Mb/1pSWn77mHwztXieUuMWdCHJFhm2qTXz40+AGieXOnHRyRb9/g4ns+yKn7H2RR/Pdeh0pKo2/K3ain+ETaD25+N5VaGI6+zI8+1nj2W7u8shVYyID0SLZqdF+L+ThfVBFV2kkkcPICpxJo6k+vbFIHISDSPQMt0DBiMKQW79wIEW0ZjQootbp3Z+Olo/UNWv0ShnmRlXUjqssfRqvFp7OqJ6P+rJHQBWwf87uRvdctun+jv2tOMWh4KtyQ5tKmQ/hAckXHxPbWHkcqxHmd2R4Drz33u2xduA9LRjMf3WtzcIb0WGCIjVI7CznYCdu9heAmgyiU1vov6FliL+nxVidqdT1LfAizafdz+lGlFt+gJQi1zK47iRO/6VGVqs5KD8WIyagSCHFA+1i9meGQWY8jtuZOWjNDSmMta2c1987refaVQTpQZdNR0IrXAStwvDjHW6+tOLv7PFfyGb6zfJ9v/FTGsKBIJWc3ghTnQSDBKHnlOmL2nz9GYS4T7//Lf4EbV29Sv/kMO6fPMOGj9jJnd5/njMZIizBPK1JKvipHWIfGD/+Fv8ip5R/xqJzlzrhk2ji2S4Xo5UlFCmJ+SAHQ4ukAJNDE+gburu+EonFgYMlcZloSrDfqFRRd3eT+6QZPLN9mwQGn9yrffv0ui9MXef1u5tohvJHew+L8WRj3aApWXCuzuPAxZHM/gEfsDFXnQvj4ToGBQiMGCDEgzVhuDfzGwbsY9s47Fa5CrDgDojVv5YqNHzn1FH/49mWu6i6TrIjRrV9TrT22lFitC1V7xSrCKs8ojW1RVg3mGYax0Yq71FsQJPpmkotncVMaSNEjW7W6S9qyT5uGRaXe9z4+f3TMc7cK/9k7YHdsvPXaXT53PvOlL/8dnt39NEfveoJajbmmrrt3AFZQWq7k5g7xhMdNp1wpGLW5F8fH7cYegXMR3jLj7BCZ12sqA8VmZnE1PteZJD7eb8WdyvRlguK3F5HNDUpPXMx0g99m5O9uZ6GpI7hDH/tvqb9XswhHtRHxnxu8CGruN2gJ8aTNcZNQiJspIG7MHWXNKgdOHd/koWt/zE+eL+ycupfV9BbhtWd5uYz8j68+QEpnOLUMrOtMqqETKA0LGRGHhQ3DwFzNDaBBqM09BjX7jcnTEYntMXo5U0oecIjiG5FGVBqTVYbFFm2eHY6mQnzv4zx6X+XlL/4rXj73b9Kyx21LZ8ovB4/O6XLJi7f22Dl3DHHE5hWSC6rNb/GDd3m05hE191R4LHYLj3fV1twYFsx593Nz6aZWjsjsrjNy9G3C8RH3Xtzl5kHizJmzvHRgjGfuQ7cXSNqg2J22Pqq/g03cwDaoeHlbU9IY+yEgI8Vv2mNauOG4VaayJgyjr/WqSPSYONUIiwjTIW998ymev1XRxUdZzQc0CdS0S9CZeb1C5yMfuZP9Rg1onqmlUY8Oeej9HyGcP41KxdS9Q70MxcfHGz9RNZwR54eZOk0cDNs8MV9n/+prPHf3EovLl1D1qvbQ3MDepE+VrRIwEO2XgJlmCUNc8rbcezK+e1mxTvMbzMi9vjrG6ICjZoQKJa+QtKBpo6IMiP/o0WPIlYa25nK69f2JyZ080ltBKT054O9nbK3L1v2Ajq+bLuEp0jz6vhEaTpJgLZwkWUzUUcrHL7M6UlLYoawKkVJ5++6b7J19EN3eQ9aROATI7kDcGPn6soEmR336BTO5ca9WUq95DD1TGwRKM4q40cFjL9Z1dqNunGk9eyklusJgHSkkoReUCCaVpQRqbv7vi0cxaonE5ICF2TJBa29no292/oZlLVhVxihoiZt5NdaUpO4tsCB+skojtWY2LWpmsKeBX3rtPJ+evsql01/nhe0PIUl673LDSoeM1OwueK00jaRhp39qfSmdDYmNLR25cOUKVy7ewxvfeo6jmzfZGQYs9qilNdcc5+w5/7l0l+oxQ0z88Ve+wWc+NXDPnT/lxvZ5NKaTHKhHNgNxsYXUSq7Fz2qinuGuimr1mKT4qTCK99iLGkmbL2b5Ng9e+zP+3DvPE1dvc+riKV5/41VWEnnl1X3OLRKXFzd52O7y+JOXmOQF/tH/90/5zpkfo557BILrWIoQlwvmOZLM3FzV+e3u4p+pCEMIGIWksWvchfecbfxG3iM0Q+cDdDhNDIVSG0NQRDN6cJtXbwhfOPWRTvdbeu7Z3NTYZmO/FcQqGv2lcNkoUafG8daCsjpgGAY0wzBGVvNEaMIRoHPFWmEcF6ymTEzaYVWQLYOp69pZKKxIe3A1/BD/5W9/lb9yf+LDn/oUt5/+Az62qLz/xi/x+9fu49VP/Q0s7DDlYxaDmxVLVk+DIG7g61McSZVFw6OXFZIqowTOSeHOnKlRuLk2Nm1uMUEt7l0I4Bq9NWfrK2S84U4EihjOT/dDiG5gJa1Ru/QXxA+vTaT76f1/RSGaMSQH3khrmASCeQ3xxlAacBmuIKjE3tQJc4VlcvPWymAg8I6rX+EH7Rs8trvD2289TZKLyJn7+Ocv7fIHN0+z3NnmNMqhNlbNvTaKEtVlqNaM2CeJQ3J9PoaBbJl1qaSY/CCUvKr4sDS2txdMh/sMi5GSjbQYmVZrYoykMJDXBVLyKWccODo+zT95+cOsLgj/P1NvGmPZeZ93/t7tnHtv1a2tq3qp3heS3dxXUbR2WbbkWJJjJ1a8ZDLJYGIDY3gwQAaGncnAnoyRGINg4swXIxPFcjyJ4yiJJduyLcmyRItSxFVcmmSTzd6X6q6lu9a7nHPeZT7833tLBAQIpFSsvvec9/0vz/N76vVV3MREZppoolZjamfLQVg4zKu9bToTGm/kIiiMQWFkAorsdZuQsIXDe9ESYSxOF7nAlJTVmIW1zWCDffE2ny3f5sm9fYZNDWUbdEn7WAs3t8ztm302m+9xYbXgrH6IwdQRbGsa5SyqGVInRdvJ9NK0LLqJEAMpT25HHHytCnxsQAnxNMUhyYviPGqDHdlorcL6SDf2MKrhmj4jyXnOYhOopiKGnOGhJdfB1gGtglh2Wx3ai0for6+QWg6XEnX0MjU1jsJZuReyNT3fgIToIcgZFkPA97Z5VF1mav4Ig+2DSOS5WElRRorO0BB0QhcWHVxejzXSWqso2Tc5wdRpmZaQNHW2ewcFjVKk2GB1QDWSLBoIYAuaIMJIrURJ5pMEHzW+L5MeZ1EqELzNtvoBEUvM4WiQ19pJEU3CZnt5VBEdJC47KIkSjrFEpQaT7bZRZdE+ZD5ElAIt37VRlQy2K6YO3EdFh4nqNracmCT0CsruNJtbN9F4Gi8CCWLI9KmRH1ahgihViQGjk/CMdfZzx2wfNHqMWpUHSRObBh0TKXnJmR5ZM6wgY1MMskuJErUIAWMdKUcrNsjlqbUlRS8rAx3wslLFaEi5IgwJMAYXPSH7fAujaULEZTpSiDk/GrJFSiw0QUpynNZ4L2lNtUr05k+Tim0+dGSO15feY23yuACBGi8WqigJh6MxatIK3RIVvVKWiEWGfZGgJITETJQc+cAzdG/eYPm572C7UzRqB6ULmsFQ8KpR/LaqsNikib7mUtXhzvoSi0XBhZWb1AcXkSQKSa6KMeeGR+Gsi7jIELwiugg+jXkJyib6PmFsIiknos2N20y98Ud86kOHuXXnKq9e16x3Z+lPfZC1nmYrWvapNu76DtPb1/nAYIlFe4UHWp4nTt7iz194h80THyN1HDa1aJLBlZowrNFlSagr0VqwO5HwOgpKOCmcgRgKXlzepjStbJXsklKiqkWjoAhUdaJuHM9Nvp9aTYCC0AwIKdKEgA8VquoRtyrmjSb27zA7M0na7jO7x7J1ZwXqedY2KprJBYatGfppDqsbfKPQIYjyVln8pCU1wncfBk9RWHSFqL5DTdDQMi0RZrlEf/9pfv+2o/3eTe5ZPEnYXKfsOj6wuUz35T/n1cd/gmQdpAHJlEJUqyUwRztN7WtUVGPCIqQsVgqQoLYKZRXDqiHYXZhJyHbcFAI+ZSuZVjlrIVFgBX7FLkOdhPiVQ0RrlxkCWT+BCADEey0OH52L+CYlUhDkNtqSQqSXhYpaixJfOeluNQqVAikTQa020EgQynTydAfX+XT7dQ7seZSJfR12vn+Ju9sFf3y+x+vto8x02/SDY0cHNJL2abTspn1MObFU/mqIoBxJiQdboE4m+xQqhj0v496UcL6kWr9KOTGJqiVUpVdXdFsz9Foz6PYEYejpaNGtNKbN0FvS7DxFiAzr7XF66EiLVHlP8NLpq1DRDDdAa4wrCLGhKCU8ibjrlgheol0xFmsl30PgWkaQ41WFqbf5hH+Djx6/Qq+n+a56hHdurhM7+1m9dYGTc13m2gPmU8PCXM0zeyNH7nybr106w/CeD+JjhQWKVkkMHlOUxASFdaRg8DGhs8NLWy1uISNnvncG3ciEIFkrNs8cpqaNQ2k4uPkuc3u6XL+tMUWUdZ/SJG3E+dPUgkiPog8pZmbkwvM1w60N2q4kNENSDbqxpJkZrDMZFCYNYZEEh+4Ki9EFTROk6VKBQzvX2Hf/Am+//g4rs4/SpsEnNY6bjyrK6tcnoQqaHPObC5mU9A+EGWk0SdgDPsjnopQkMmqNDhJwRrQoLT/DhyRZJX4IvgIrRZzPz6VOEd0MhB6oNSEGEVPqzFxBdvYxiavKBkE8qVyIKGStoDOLxTiF9jqDs3anA+IkEEu6zneaCYkmNjhnWL/2Ku0DT9DQoF577v9OZmeFzbVLTM7O85v2bxLzCzZCk6qs6A850hE9Gt2HXWhBvgCJgZCFd8aYsfholF2dMqhAFZbg5WBIWgSB0p0lsaQ0uzvlpAwYYT8bW2BjJGZfa2ld9j9mel+G+8SRdTGne43ymbPLQoBDSi69lO0s+EqCiTLSUiklO7sY8X7I9PXz/PLjW5y7XfJXnU+h2zWkWvzzjRd6VZQgD6VUDscx+UDOO3AlXtcYZdWijKIoStZvrHDnzirrK0toH2m7Al/3qQcDWnv2gStRpsSVmp0q8aufOsSp7a9ztTnGX3Q+mtX+AreJlainsQZdiwuizDSxhGCL8aBdGwgEX+MI6JSo7ixDvcLdm0vEvfczfc9D+FqKMVU1bO9s0g9RAil0iWsZQt3D7dTY/hIfm7zME3sjt9Qiz16bYnPvaRor+68mSvxqaoSEZjE5SQ5sWVAoCQlRSlEN+/jWjLC+qwpdOlQtz4byERUbhv0Bw5CIrkPTBAb1gP2qoRnsoOs1fuWJwH0nD/DOa9/h6OJe6qTob/RRJnDr5ioP/dgv8No3/l+mZw/TryJ3Nnuo/ffz6q0N3r49xVbQdOf20Wp1sEVBYRLBlRQpg1ZyzGnKRZ9SKqeBQROHhMbSDDd5IrzOz3zgAN16m1ee+wbHHn6M71yGN878HW5OttG6Q0MQprxRklmAB61oanHPbDaeZpxfrilVpG0j6wPhBWiMdMIxEk0geEWRLy2nZIwfRtHAZmSNzN5oLTG9UpQbAVoZM4auKJ3QKScCEseFwy5xUIpyk3fmhZEj13uPikKmlBhjGXmbJFHD4hkfcPrOVT61+RVOHN3P6q2LFK1ZwpFn+J3vbbBsj2IMaFvKkRZl3WaVxlkBgfWGA+nsGgE9KWNxzlH3t1G2Q9N4ol/naFjngZmbHNpZ5cnHHmTQXGNu6iB3165yd21IZ26GvYefYPXGa5x59Ed57dW/YKc/xXJ/kzWzj/N3HNf0LHriBMXMNLoego7UlVyUk5NTKCXnikVG6wwGNDphskfdWouJmiaKQ0bOxCBY2Ww9bEbMgpwI2R9u0+3f4BcPnOX20k1uHvgcX1s7QLF3iiIa6jQgDCOkxMTEhGjcdYHb3mLn9mu01JC1tbss3vMQTO3HlWXW0Gii9pgk4/4mCp2wZQt8ysjdnN+gghJUc8wBa4AhZV2BiAV/fPuPiAp+6/WTdCxoZ/NEAXzdJ+1skZoaZyyt+Xl5T4uScmIS3WlLR5zvCbTGGUthDZRyFlvjJIFUW+EBZG5ASJFB3efj177M4uwOL2+e5uKpH0GpJOp+LFE1YwaGPP8AFh2bfEmKwE4jXISU8vuj8ruS2SdWG1IsREQaY6b25ecuF8oRlV1nVs4DEyBzJlRq5OzTThgCZjSQlmcCFTGYLIDP3ACV8tqDjO7OQKMkItqIxCybkSsCYUqkIJHnITcHJrb4qe3foex2qasWw36NevM7v53i1i12BjdotRf45+pTNEbjVCFUN8grgHzpk8ZjdqUTNimCkihPiOKHz/ADH0eViiXEhpBy8IhnbEexOaVspEpXWWFpszUpKtkT2uxBtMoSmhqsQ8cg1X5O8sJotHUoHzPCMnsqoyZljzM5TlEObXnQNDImSj5kQlQjlbgSfKRSQg/zw4oHr3+VD+7t8d+K93F97kHaphTVuZXDLzaeGGoBSiglQqIciqGMpbAlkYagNKGOhHpIVAZfVWAMRWuSbrfLS//t26i7dylDpLal6BxaHbGIaGjuXOP/fGaJxYU9/Mflp9g8cBKlRNDnUx7peQEhCRnQipIViDpCE2h8xJnERL1Bs72B1o6d7j6KzizBBKxXaBUYVo0oy61lu7dFNajxvpaRHoqi1cIkaChQlSYtvcEz88vMDS9x0T/IrSMfGifUJVrZv9tQaEGdWi2FkU2y/RIsao1tzbLjK2wpItCOLaibHs12HxWH3B1WNEzg+jt85JDn3tYSHz4EV65eYHbuEO9evERyhuj3ELRH2S4bm9vs9CWq876TLe4srTIsErPlHAvziX1H7uHcC9/kvofP0NupKIr7+evLt/j26j76rQ5T0xMUyWDKEp8ChZFLdbx2YkRnFH1MPfQkn7ineoMHzGU+8PFHGV49z1R3gj/78zf53gc/x539jxKDobYmT8my1S+rgH0M9EKgRjNoaoE0KU0RA8MYCcZJdx6DFLBRlMAYjctCr5RjeCV8RxTyRpN5HilbiATZbFLeP48mBCrKGsnITjEmUU8r9JivPooaTilmQJiIm0b7Yk0iJIszMtpt6RkG+jY/fPXb/MTsFcpihuXV27SOPsn331zjy2tThOn7aJVihwKBvTRNI+JjMhkzisjQY1BVH9801KagX9UcmVSorbf4tYfahK0rLC/fpIWj6SaWrmrue3Afcfo427eXuHhLsTBf4qZL0vo22727HNnfYu3GKg+dOsyBB55i+eLrzHXbFN05vnK2x5/d1NzuHiX6Dt2pDk7JhY4RHVFhLaka5HG5wUTRQ2hNtmmJHkK4HXKZKWNz1G1D4y294QY/5V7gft7ibDXDl4c/TGvxIEXq0NtZxba7Ai0bVkxOTuXnr8GaFihPqS1OO3qDFXZWV9DDHba3t5mZmWH64AlU0cY4mQppZdF4NA6UAN18EyUbIgsjjZNCJSiLjR6lE8G3OXz7m3x87gZfeLPD+eYErhAXNzER64ZY9VBNhcn2Pd2ZpNUpUaagaWpcaXHtCQSNG1FW9Fhl6UitEmtchorlvbuROHfvaxqv+VuHeyys/ilfen2H7UM/Rb3nEHX0aCVkPpVEnK7UrtUuZdeDSuKM0ohAQCLKPSDrBbR03zE02TmVPy+bm8wk98cIwqNUItoCEw0FCT+KkM08B6JMWazNmG4tAueURaCxAWu16BIyx0VrKxC10e9NIqF383J85v+P3lnf5AZaimarHTE5fvLWPydNzNOdnWF9tUadfe63k25W6W2tMNma4J+mz1DZiPGCO1Sj+E+tcVl5KrQmJcWAUqSMtBQ2eyBELf5RL2IHscl7KRoS0pUnEVtFLzzk0c+UqirgbCl7FS/BjKNkt6gNTkV8kqCGoGQsaqIGaxBeRQRtKfLB1jSNVEn5SxKmQVYNV8N8OWvqJA+BUoJfNLkYiYhX1NYNg9V1fuXwO9RbK3zZP8j6/ONYJwWFSlJ1Cec7JwZisPlnmNJgksnYVunYq96AYa+WC9o6GY9aC8mxubHGytlzUFgBYbgWyjpUSPSS4rc+c5h9d75ITx/mP218mHpunjo12W0h6Xcmk6WwYJKRC0IJzpks6DTK4pWj0IbGBNkRR2GC2wxoqaoKEbU29Lf6oATwoowDrei4Dq3OFFUzJMQaP3QcHrzGTx67zduXal4xj7E+cxRJ45HC0lqNsqPD3eCcJkWbCzuPyOsMJE9RdoSHvn2bzZ2Gnbsb3LM38On9mo/e6/jLr/0p+w/ey7nLy1Qp0vR3ULOnWTvyETZ7iaWlS7iJCeYWT+GtdBSFNihfM1Fq7NYG29df4cxsSaRD3HiRx0446jjJ1sYmJw7dw8vX7vKN9YNsz9zDlDUy4lVWDhejpIDMB+WIzjaaDlS15u6ty/zyYwPe313m+oV3mT96nOXVTf5s+xTnnvyb9IORg0ipfMlGcuIKdYzUHjZihTEOE1KOgpYQk9FETvb5CRfF+ioZqDLTSzTjC1/LySYdS0rZ5pix2TnvY4RNJUOadN6TjkJvTD5sBBimsSoncMZckAeyKl4SPo12lKoh2ZI9gyv86Pmv8jc+8QSr515l5t4PcPbVN/hPN0uut+9ltuwStQi0rFaopBhG8LWM7mMTxcETE6kZ0gRPb1ChgufH7xly6M4LPHVoir9+/kUeevB+BqHFhWurtPceYcd1eeEybBQT1K5N2liFyf1M7pkn+R5s9FDNXU5PalTvNse7kaJZx0502N9RzO0xrKzWqKm9THe6nA0tvvJ2JMyeZkc7ChRl24pFzDiSb/KKxqCtnKEj5HFGpEhuh6+yZRKGtefp9CpPTF5hrlvxn985xPk97yMxQd30SPUQazXdyRmhoIaaQpcozbiZapqKdqsQR4lS1MnIP4+JZALOtmXqkKdKRCXdftLZZ5/y2SwOiYQEkxkdaTL6NoWCmZW3+MzUC3zjQpe/XN9Lp9WSorh0ctZWPej3xb1gW0zMyu+srUG3ClLjIXjKsiRYR2kyndSU4tAp27TLFhLpDdYZgs82YuWIS5d4+u4X2NzQvHzvz9DZ+xBKe5ooe+HSltltFBnFOyul5J1QcvYI00DidNMIAa0E35vyynr0XqaYdTUID8NjSKnJDawULsmM1mtBBJdRGCBKOUKoyJF/mLQ7GR5NKFK2d9pcoAvMTH4fWTN1ZBWRxGnjY0T7zNnJawClZLoetRHbO2Lt/IXii6zeeJeymCLY/ahzz/2rtLNylrIsMfPT/JP1j8iXb+x4bO20iFZC8BB2R4AYI1naow83KqEoKbFRxCbtjryTJBaNupRMK5TxPrKHVxhCFL+sNUX+UORlsbbIow/5QlAGFxpqI+OPiMZlseKoI0k+yEGcpxixanJGfZDUqgha1fKwRoVxEpijrZE/w2hdodS4MAghMHv+WX7psXXWBnv4wsZp7IHjtGxAISuQOgYKlW1uOuZiQInnfhS3mhLe14TG0+z0qZXBFJKs2Oz0ScawvX6HcHuVXpLpge20MsoYlO+xtHGHf/TMQT54/Dwvvr3Ot6d/Gj27IBVukhQxQPDBlVSsVsvIbjQ+0ikLtLQdT3aSUuLt1SYXP5ZhX8JRfKgZ7PQoioJq2GRUbpKduCtwzuFsMf6s7MXn+eyJZcqNNZa7j/D8+hTvNm3KqTkmyhZlrppLB7p0NFGq4WHOLrDWogYJWzT0htvc3aj49PQOPzp9k6KzzcU3LjF54n7eunSNrTDJysQJYujQr25jFh7AHD5FERWVVuicr64041wKk0TvEvMlllJgUNW0naa+8S5zGzf40FMzhOsv4PAcOvoor6zt8PsvKSZPPokLEluKsaQoY1OVMdYj66vsEmUcuXVngw/tucYP77tKN1m2l5aZ23eEz7+2yps/9D/TTLTRqqBhKLZSDU2QEasyjvWmwWdcMpA7ISk+R6jtUfTCSDRss4Vs9C7IhZT1N6PuP47mznFMI5MpXEPKjiCj9PhyEXKZQueAGgHciPhXOlz596lsE3TKEFODSQUPb73Kz5qLVPUWCzOT3Km7bO6s8/lX5+gdPQPWUSaxXI1Jkvn7qhpJobPWEqo+AP2BAn+XJ9Ib/MP7Iv/1W8/xQ4/fw6W7fXzrCJhJXi7v4cr2LMXkXkxbRHulkj9vbKQAT6MDmWz/SolITVpdo2UDfmOL2eE6xzo3mR7e5uTRRbZWb0I15PSZ+1nRBb/9bKQ+8T46E3uIhYZYYwtDqiNt26KhFitiqEhWk+qcsho9SjuGwz6T65f5pce2GSyd5aW1ad488vNMULCxc4ftYT9rpxQTnRmcbeOsJNt773H57A7NkMZICl3toVM4qhBxWjp7W7So65rkA0VpiXmlLYE6USaOSi6imMFwNnnqzIKxqaZfecydt/n7+64SNu/yz87uZ8fOM2kKIWgWpYy1mx70e2htcW3H9H1nGO5s49dWKDpdyu6EdKzGCpXPiUixioqi3cJou0uhLQwecQM5Y9gebvLf2WeZ7WzxB+/dy8qpXM0MjwAAIABJREFUD9LO+O2IiIkL63ZFhEkE0E7pXGzl/XqSAkep/M7KYZcJe0aSVYNMbk0ckfsSKq8AgyZbnYUnoLU8S/LuRHxmbThXkkJFikZEuzmkaLSGGI3rZQ0i+gM7CjrSAiZSZSkC9AgpNYQ8bQ6+QpEnSFZJHHtuNlMMxNThH+jfpYoLDO6cx+qjqHPP/8tUrV3AdWYYbq/xTzt/Ox8YZle4o2QFYBiNORXGSMiDTgJSANA5qECqWyteXJD9fcw2LiMxp1prkpfRpNIWZU3uFOQBlDs+jxdjwitJUpOI4qxcjgGvEpqEtQVViJRAHYSuRO6MZD+eMjgjEYMclFGLqtlaeQEiSdCIVsau4gKQL1X2dRmAslPx8MWv88zsVeojT/Ps2kHWj5xGU41FkCYqEhFfDUlaUQBNTDgrAo/Q1NIpyvJ190tsspo/Rog1733neXSrQ6ucJBQWYwuZlAyHeBKTUfHTe8/y9MOzXOhP8Y3eU/iJGSrlSTqRQg3KUGpHDKIHUMETtHDSbZKJSMjKX2LCZwW90zI9UdmnmpJ4kOU7gphqfEioTKfSTrjdWmvaTh5aE0oGocG/9yJPTV/hsWOayXKKdbuPL50N9M0EQ99jZt8izcxBUihI2tPUgWQKdO8Od4cbbDclj1VX+F/fV7J16SUurw0oZ2apy2mub0zw5zuO/Q/8GKElo0kTEip5nIqEnLwlRafU7E6bMYwoZs2GiJqkkzZGMaxBmRa+t467dI579SvM2zscP3GI9tQJvvryu3xj/RQHTj4pNjRN5u3ndDClxg4aC1RZ0d3UCn31Rf7efQPOHGvjpk9TrZzj3O0tvtR9mtsHH82dhxofSCQpLH3O2xjm33lkJYpawq9UGvEdRhV2kARCpSUgJ8l3HDQ/gAvNquGRR1zLaNEqK7YiRpe7zl2ShA9pZXEqkULmuKeY8abyvxGrpHziTmnK2vLhzT/jx2e2uPTeNWanSgb9DZb0Gf5wax9MHGXSOZnqaUllSykQfcrgrUgTPC571k2MbG9s8pN7XuP04D2c05xb2ubk8cM8t7mft9v3sR4PMbHQpUw1Wjui7+UVRUC5Ug77kNAuQp6QlW63+RHct6IKHm0K8XEPe6TlNfYN3+W4usDB6WmOLSi2BxU6zVG1O/yH85a7s/dgJhYkuTL2sXWDmp4jVAMptIMnBsPeYkC9vcMjxVWOTazy+D0TPPf8K3x17aOY0x+SqNkg6O6twQ4peFp2gqJjUNqJ3ievXQxarJ/GU0fR2xTG5mnO7jNvkG7fKiFhpqwJsRqsdjRJ8gAMCq9l8meTyTtmIa8eu/USP3H8BhvDbf6vZ/ez4vZS4glGYVttYdHXQ1Ije29nLY337Lv3lCjpb92GlsO1OwQt57AJOXzJOtrG4a0E4WBdLi51xopXbBvHR+5+hYe7S3zjwgSXz/w99GRXiomoUWTgWA6cUkbnIl/E5CFWsm/XSFy90aJPVFESAzM3Rs6HPJ3LKy+il8YppPHax6OwOopbzjdSVDlNopDpGlLUkob4CGXOexAIpyB8fV6ZSUFUYJBpXRNqtLYUQJ3XyZaEryXptM7Fq9yrtbjQjBBYk1JYEiZM8LeH/5pYr6D1HI2fwkoV6GhZTT1RSMIfjUAD8qgvxUhh5cOxVoJmYkw5+S6JgyLv24MCFcUuoUxCh0QTBKRgMvtTCGTis9Ze0YSARmgO2jCCHMrIGUlA0xH8CMQQFUk18mIBXsmuypjMNxdfQN55xty9Sw59iKIENeTgooQk5tkSrRWh9hjAWVF1yk4nEhpFNDXKGiam21yYf4DHWps8sthwd/UlvnSjw/ziYh4LyyEaFeOuHjSFzWIxZA1C7QlodE6XMkncFEKKMuN/P9YxVJGOyznsUZK8VAxUseb3Lkzx8R85zOL557lvmHir9SiudYDoh6RYELQUSipnrWszEmJI5GthNORR5GhHV+RRtnZ2/PuPMs/rkKM+lcXZQJMkyjIl8cc7Z8QCpDUTEwrHJDunH+PV1Sneem2ddrzCxx6CUwYO7+th8QS7w4Wr57gxcT+bU4vguvjeCl5VNKbLL7qrnJp4jQsvbmJnFtETjvN3urxUHmX6+NMcbFtS4ymbmsTuDtonuQRHf6lsFRPfmN7tpJXs2qKXTh3lsCYBFarTJT3wPs7dnOSBwUVOTWsWFjo8fqykKLb41up12nsPkOIQohwYttjtllNKkgWgEsYIFax//BG+svk2xcUl9u+/Q9hY54HFk1x7/S94dXKa63P3MdFUDBQkLe/QKPyosHpM0tRaUSdxD6gsEkxBajlRLmt55gEVsn1I5fhaeXUha1wUOecjd0BJJXTIoBFFzlNQGAlHF21AkrljjNl+auVsUElhjBSZjY8UaYsfWn2ZT+wt2Lizw/F77+PNl14g7DnGnyxPw94jtMuS0CSUlvEsZNa7ye6HjFs1ydNLgWL7Jr925Ab1+lU6nT5X1y1mz0P8m94+duYeo7AlE1ZjkoQhpTAkKcFgq1RnSqEgk72P2Z0Qc7JfJsgpTczvtNKS4KdaE4TDkyxV+1m6vpfpa5f5JH0W5ye5u7rGvI78zP5JXu7v8NbWE2xNT6K2N4nr1wn9AyyYAZN+lXsPTDC8cZZPPnmQRMXVC1doxQn+68uJP7vxKN2HP8aMjqRQZaFmot1u01S1jMhjymsyWRWpHACldCB6JeemFVubsgZ8RDuDHj0TWhC3vs6R3QZQMgmBjJRF4mcLI8mv1hUMG8PBref42Ow1+lXiCy/OseTbODMgKU1hJ0QYHcX6rawiRbkgW60WUTs6KlHPTMrUxRi0ElGhLkpMWdDUQ5okVsSkkdwWo4k+0oqw6dvcV19geus837vR4sbRp9FFW5wGarQwlmmUVqJpUQh7wikttkAlSbMphTFbQOemU8BJctc4jXT+WUybjEbniOSQEGF1DmYDKEgEJYF5pCQrBRpUjKgcXShTrUgICmsUJgqnwCgJpNNGY7Sg+CMCMlNJwrFMiui4u85OSgS6JPnOtDJoZwhK4r9H1t1e6hN2LlP3e3jboT09i3r92d9KpneHrZ232Tt3hl+Jnwa1K2KSEabC6Rw0oyJkMUWKXnYMKdBSObPaCBdcKUEtmpCyXiDmiMJMJFJqfIgZLbGu2jhi8rJ3zLt/UyC7qSBqzZFiUquMAs7jy6BE0SkKArFVlEqyAyJW8gXyJRbz3sdpg28qEftZCfQxZNGctuNLI8ZRKlNCWYcloIKjdeltftR+mzOHLP3u+/i3a/uIe0/goohdkjGkIElzIwHWaPye8hhXBxkPK2OpejuonE41GjtdeukVie5sl1hTgs2fldYS1Zwg2Eh5+wK/9vGKBWe5OZjjP2/N4uceIHanBNMaeiJMQbIadD60NTIrNlkcRhJRZMy73qYexemKAGtYV/L5x0ATZPqjtYYm4UpLDI3oHKyhLEumOm2qqqKp+9S1Z+CVgJ8GQ2KoMCkyqRraRWJpa4PWgQeojFTA28CRjav83fYl/Pp36cycZnltmyX28f3qMO7Dn6Xy27RjRCf9A0IcCc9Jeeo0WlGNxojSKanxMz4W75Fw+UDyYddRQhbd1DERmgJ79yrbr/8XfvFTJ7HNFpfXO/zB0iHsviMQE85YknOQVcMhV+YahY8Bqw21b6h6A/TmKp9duMIzCxX9YUXRmWD1juf/6TzI1pFncCoyhNx5idsmaqjzi93UgaBE32LibiEeEZZECAGn8zRPp7EDpVEqa0AUku83EkgZrN4VMgZFtkRJ8YTOu9EEzihIwhUYdZajTtJZja2HBCx7qrt8dPlZPnSyxZXXLrJncY49Cyf4+stbfL04Rn9yL9MqMUiiNbBjvkaQnA9j8Ciidqj+Bn1VsjC8wS8tvsTlN5d4+LF5TPdh/pc3Z5iYv5e6SBiVPfm+ESSrgdT47KOW0LIUBKYi4uFS9Ate9qrW2vHodTQJBPkONdLZUWvxgKcGtbbM4vqrHA/XefjeWQ4dPsrZ7z6Hdvv5mj9Cs/gM3cJzc2Wbwq+z4FeZt3ewvdvszJ1gabVma88T6Ik5fHuaMkQCVUasC3NChJaGKmsKnHMSbFRL5Le2DrJ+Y2RHVimvtnKTppSMhovCjvUphEjIf2anDVWMWXcR8mS2IagCv7XM3PJFfmj6PEc6m7x38yCff0+zU+6nCH2iLikLaQC1LYipRgUJwCk1QuL0nrl7T+LyHdAMhhgrE56ExXRaoApKBVX02LIkVIFCK4LNjZEq+Kz+DnvXvkM/HuavwuOsnnoU18hzHkMYK/JTkt2GU5CiNAcWyWyJyVO4DqEZkEyBGoOp8to4gU7CdxgF32llqZPoJnTMsCKl8uRN/p68gEGKiygXfMxrwBRNxtWn8T0okfJZG6CRCz9K4JCI2nTWKIx0O0lWzVLiyHoterzWmIRMvKOcY40fZBFtIA1n+O/N77K5eQtTHCAoi3r1W/8iHVw8ytLFZ3Fli1/nM6TocwUexyNw5SPaZTVkLgJQ8hIlhUTyRoPDEOKQjEOQn6V3VfgpZcFfrjCF9JR3KnkEmaIaC/ZEPJMtD0YOo5QEliLiqAy0icJKjmiKJCsDkwEBPgaK/MFJJW/HUbQ+i+KcK4lNlC8pJRnlp0jUZnxAWrUbmmKM7I/W332Fj5k1fvzwCuvmMP/fxj1UC0eYardzB63RtahQQ5K9NvlAVwmhymWHBLk4MGWL0MilMRgOWbtwmWYoKXy6bKNGKxcrugZjDJguW8vn+T8+02W2vs3K5essnnqQL5+7y+Xpp1D7jpN0oghDktGEKIWYKQoJ9WG3Wx0J2cj6C1VY6kGgampA4fAY7aiyuyEpiw1ehHBZI6KMUMbQlrZKaGcZViFX5GK1HHpRkovVVBGtpZUK5lueb964ySebc3wofIsD3QOcr6bYrBNf31pAP/pJknF0U+6OvSCoU4iCjAbp8LN4TVlD8qKKH6nVx3s+UbpSNWEMvbHa5BCWEVchkFS2/cRIg8YGi77yPf7OmVVc9CxfC3z+1nHsgUWKQoKt2p1y/JmOY3izKDMGjcGzM6yo1td5uniZ/+H9R7l6+Sx79x/m7bdu8nz7NG+c/gn6rSZPg1IWasnBHskFTJID3KTcPQSFsYFhSnksKFMca0YiWz2ODvWRsRbEWjt+1kl6V3iLls+GLC5SCp0MTss7JvhRKSajihRKbLyhVJy59hYfK5Y50q1wAa6+d56ZY/fwby951uxpQtEhIer5Io96Vebgh8Q4hVQSBj2uqWhvX+IfP3KXW9cvs9zfz5/Howz3nKLfmqKVQCuHRy7JIkfuptRgkkZFaTSSijJ1bKRDQ9tdZ5IGtCVqsnbB7wqDjRFbcIzYzFIYWbS8KuHam3zQvcNRt0Ydh5w6MM31S1u82Jzg7MxDhKkDYAtMIwmLxkasLQH5DpzVqEYAYCkJi87KspWmqbC2IAH9uo+xhazmgpffIdZE06YojOyvszWzaRpKU9Jkx5Mzgj+PJn9/ubNFy3drraXyUMcaOxzSUZ49G29yT7zIY3sbBne3ecU+zu+9bCmMIqSawpbyHI3ivwFnJIp9pJ9yRUnwFQuHFzNsLY0pe67dkTsjBWyrA0nWGclofFPTcpa+00ztXOLhq69wbN8dbm/P8mbnfWwffVxIjcRxnLQUN3nal+8XKQYsNtb5z+sAec5HkEz5+1mXFoN4841ouzxZC6NlnB99k4Wu8r8x2RlRa4H3kO8+Rs6enNJnssAyojEhTx4Rq59OTnQiMchkZ2TBz8WCjhGDI1GTlAi0kwJCQ+McJnMMQEvoW6ikSEmBEFv83M6/ZOgLJvfuo7dcoS6/8u9+Y/m9r/96u9C0W11+tfU5efF9GnuBRx2xGoEilJDJdJTuQ/ZLYJMZ7w9JglNsolxomrjb2ecxC3nEZlBUuRIld5+jPQ0hjoWAo/2yyqKJqMBR0FCTFDRBEu0cltogo/1cBTrtcEpTpwajLIUy1CmgnCU2UV6srBAVDUHu0rUQnZIWoZwEGHmhdSlAOe7eWuX0yvf4+dObHNp3nN97YZOXJ08yf/x+OmUrK6pjFkWl8Uja141gOGOQtYn3klClxF6ltUYFzfe//qdMTO2Bsk1n3340nqY/lM68sNAobKsQcdfmkAcXd3gknOfpTzwKl86xFix/cb3F6swZ1meP0Og2WldM2g56WNEQ0LlLTEm+p6QSjW6TetvYps/00ps8NL9D7Acutua5VhwXFbHS+HqYLWQirjPG4JyTtDjvKZ3KRCqx/I1EVkMvSmBnLFVTY1yL5BNqsM3jG1/kZ56c4vw7m6S1Df7d7VOsPPp+JvYfYjZIGFAKHpf1G6PiarTbj1nAWRQFPojocxxprXYv/5h8dnzIJCB6eVnLVosQgqQlWqh9kIOTSF0Ja15jmLhzjk+2XyTGTW6uL/LHtydpn3gAW06KFz3Kwd7knTqZvicKanFr1E2fYQ+OrbzDL3zcU24s0Zo6wt21q3x1ew/P3fM3GLQX8Bkp4n2dizTp9CLiV9b5OYpATJ7s+cPlQ2Sk1RmtSNIPFKNa2+zEGUF/8uRNi+J5VBRqJT+z0EghEM14RSCTlUQZGhpX8oFbZzl45evcs3eaqXaPyb2n+cI3l7g88xSbc3vkch4O8FoxUXRwTv5M/f5OFv3prMUxxLqiGQRa4Rb/2/GztLTmlbd6fK3zcVaPHKdMmhaWJtVif83QpJSSCL7wkg9hLck6LEl87kaPhcs6yiWILdBaJpwSOe3ySFtCz0buCWIQWqlSuCxg86bAD9Zp3zzHh9uX2csV5hePs7ES+X61h7OHPsnk/F7wgcGwIcZGxMomjCE0BtE7+eRRaRf5OlrZxOzqiSGPr1OgVopy7SoL6++wceAp+tP78UFRtjSpt0XR6aKMQ2dvvyYSbb6csHib8MrAcIDpb7CwdYO5/qu8//g0W+tLnNw7izaRW/Eov/9yzbmdOUqbRLTXEku29h6fZFpIkGc1BIE9KaMprGP6wAEKq4gmEPsDlFK0JibxrsBqg/GeWErGizGWKjtR7HCNp+I5Hp+7ytLNxHeuWDj+CdbveQgX/LiwFkGdFeFdniiNJlOy10ecUTneOI1G+wQkTRZQAnKyWmi2WlnASqH4A4K9H3RyKGPHjraRzmAUwoZviEaho5UiPOuuUCIA9THlc1ONNTQRaRK0ylkeo7snVpiiRaoqks201fw7JEVOsxXrbCRrN5SGFGniND+7+Zs4s5eV2xeYnL0X9ea3fzuFu+8KaW7fYf73radFvTj6A6SRyjgnyIVIzPsHQFYASnanhjwqtOLPTU32igv4mKQ0FtkTi70MiOJ9JIvMUhJikbainJUxlqj1PQmMpQgZXqIUTbbYjT+EPBqrvYxMXPYqhwxYCDHbNTCYjN0MSvgCSil8I/u2lG1YOhi0jjKCVBBRtEZWrySXudaWfl2x+dLz/E+nlnnqHsNmOMw3rk/zqjpAd2GeVmF2O6wQx4dlRLykIUVilQsWY1E52jdpg0+J1cvX0IWDskWqguzIqj66DthWKQCWoiAglLbUH/Dw/CZPTrc5NXmZaniDdvcUZ69uMLX3KG8sbcLi/Wz0I3VRoFyLQTR0k+foxJDb197iAyfnMSvvcHDKo5stvFpAm2021nus2of5qj9DnF1kGNYxaoKYRFwngpc07nhtAFuYXSWvlge69rlQdAXeFAQ/ZHBnmU81f8FPP3KE737rW/S7T/EfdgyTz/wM3aqmUpoyyXNhjNDkvEpj5ftovB9Dk1988dD6JAXr6LlNcvPJd+KFsR4V1L2BCOyCiDEnJyYIRhEbcEZTR7FMjVLu6mGf+txr/IP7d7BbF6hmnuF3Lk7TXdyD9zFnrGfxrJaYZa0s1mmapiYEweg2TaRKDeHqq/zcnuucfmA/k9rQMvBHz9/mqw9/DuaPUTdDvM3q7Ai1F2BQVKIhIf3A4TNSACfhdSQle/6UxZ6jsJ7RaHj83/NhorWQLS0yZcBoOZi1JKDJuoPxXzqBSTXJGT5y/nl+anGVd95d5uHHT6H6K/zxuYIvpWPMTR1jqixpTKRqhmPAychy3DQNvq4E/hMjKnliM0TvbPE5910O7mvz9tIGfzLzaVqd/eKdV2JVi8joNmolufI04KVAMVZJyp8S+qhxsldPKIyXlaKzsh8OMWHyaoyiGBdAYTDIIse8KvI1KXoKXcgzZs34zPTbd3hk9S95qLWNau5y6NAiX7l6hLNHP0arPY2hYSdGjBJuh9gBFbGpmW6VDBsv2oycbloog3aW4BH4ljM0SdOoDofuvszPz77I1ERNLOZ459KA5cayHidZHk6xYSYxc8fwRUndKKzToCMq1Dg8MztXWXB3WIzrzLLBg2f2c/f2kHKyw5vXFa+sd/mrc5qqsLTKLuDloleJFCp5H/MzGFV2oPgaFROtAwewdaA1O0FnckI+UytBc97Xov7XFmOTBM21CooIQUeqquLI2ns83H6L/a2GV65Nc3n/caqDHxbXlcmrZTUKChIRnoqy2rLICmD3PE0o4aNilIRpkRfHOmmichAGeSJkxnchuiDGGk8W2/7AzxGBscahRWuFB0qsCsQAyerxaiAiY3rBAuyuATLzT/gEIcoKOEWCCqToMFqeBR0h5PfVpETUI8dBwidN0gKhCkrnVVBFCBLYVvuCz638M3o7m0wdeoztzR7q3e/+q9/YWbv8693ZDpHEP/Y/IjCSbN8jyj5duOeRZDQmiFLcZJ57zDijmDQmRJLkaOKjwDBGoj8z0hDYUgRvaWTNSBiyYtGEcSKciFwsRJ/HIJ5Aoq0s0Rh0Fvz5DBbSQfzYI0uUYBN3R1wmK1t93oeqHOOo4m5VP8qYH3VHOgaJc8wHubKOuglYk8aTCCkUEioVbK1tceL61/hHT2+jDpziV1/Yz8Sx+5jpdIgBfGww2aLhkSoz1PkEDQNqL79PVMgYsGpQpcPYghe//lccvvcB/HAgD10MhGGNLUuJ8NQFoa5otToEr6iqmkHbYDbWeaizxmcf3MPDC3dZXl1hcbZgY1hye+kWnZkp9szNcP7iXebnDAtzE/hK8403r1GpSZaH81zZcajuPB+9d5bH5le4deUCtLt880rBzcPvkx1W3Qh/oShkTOpl1FYWFotFK6nSBSaSMyaSpsm7tLB5l0/0/oSPnPSsXg6stOb4gv4Qcwfvx9Q9VAGxrvJDXgDCxkYZqhzlGmIjF4lVKFx+sWV/m1Ii++ryQU0m1xXy3CjF+u1VtrZ6clk2AR8j+47sF3KdKagIAuhxlro3EOV4E2lffZF/eOY6Fy5c5+W793Lh6A/Rarfz6HEE97G7XI3snhlpPkwKDAcDUu3ZXtvhl59Y4b5Zxfb1N9Hd/Vy94/hdcz/bxx+mTpJAORr/y0ouz3Ihrz6EHz6CP40Kael6pLtOwY//2WjMPiqsRMAfx6p/+T/Kd+aQkbfOvmMNKCI21piQ+MyFL/P48ZKOa3Hx1Zd58PFH+cLrQ15vv5+i0wXlcbY9djj4phrrYUauE53JlSrUhOAJWxV/d/93cdfOE2dO80XzY/T3ODrK4qMoro3WuZFQOOcY7qyjfI7VVVoOYlvmUX/EOJfPlSj+6cLJJRwDloj3kaKwUBSkIMx4G3OR6WS1YDJxVJ5rO546lEYCtno7Ncde/wP+xx85QDXsMdWd5V//9TqvTz1Emj/E1OSkFC1Kpo86CYxpemKCzf4WSWU6aoiU1kiWgy2IoaLBMLWzxOPLf8LR/YHV5ijPXjScOaI57Jc5cMCwujSktIEj+ydZ2Ryw2TPs2dvl5mrD3IJmuBFYPDDN9tot9kx16W1Evrs5x/pwwFtrLVYGEwyTRbs2rpSkQO8jRtdEL4JfEapJYSifm8fk1L3uiQeYP36UW2+8zuKxQ6jYYAt5/2Pygv52ZjyFEupdgVEwRNFurnP0/DdIQ8/SsR9DHztDiI5GyzQmZk1YCCJE9nm1p6I4erQdqezlncUHibnHSDok0nUrZbAEvLKkWGc7XyO6BJWnRGZXNDz6K6mRNiSP2VWegmY9TRpFr4uIjBihlaBWIsSyyJRdXkKFCrIeCLmpMXnfnzLWW40LEslsULoghoDNa++YKrQpZAWRNQcacWGEOMHf17/P5upVOnNHuL20g92pPXsXH2Bz/S3KuYOobYMynhjSuEsKKuTDSrzUI+p4TaSkEDGaEUgDmvE4PfqKpGQnWSv5AJ1y1CFKEEQSoYkUEQGUF98wCZ1G/GaPcppUKwxRYDlaZcWjrNQNCR8SQimUaioksSU5xMlQGEsM0snrvNPzyaJCkJ+f5D8qfxkmaRpq0RcYTbK5M6o9xgQIajejG9DOEWKgtXeWyxM/xtt3voRducDU9HG67S5onz2eWp6CKJQ+cVSM4olLjAvZVmfwCYpOWxTKyXDk2DF6Vy9I9zDXpQGUbmcalVyATluGocLpRFEWuHaH5GvO2TmG/X384RtXeHhuL4eXl1i/ucT7HzqIb03yyltLRKU4ODfFuzd6vNJb5PnhApu+C0XB1OE5ylaX/3LxEi/cLPjo5B5Otm7y8U7kT286tuafJrQdpdGonJ5HUmK1jAllE846QvI0TSWXHop2p6Re7+E3d/hg8RYPzd/lzuYhegvwxdVFpg8dZTL02daRIlkcEsyRUFgTs3o9QkJyIzTUBHS0aC1jdw+0kiYouWyTlZ25jiKqakLEV57Lb7+FdS3KTot64PMYOXH94lWsh1a7ZM+ReWJyNL3dtEhbTLJz/INc3Pomx09rJlcjby8v0+4cxygRxfoYUb4e+3wF9gRRB1KDBJQ4iw+J8sAEv/delyfcW3z6oQdpbr3NvQtdfuLiy/zh1BR25ih9VROTCL60tiSTRLipEniXEa/ZvplJmSnv9E3K/mctdteRQFGRgST5d5TI6ASIC0cph0qyznEKyUMnQtsSBn0UbT58+Vk+fnKKvh6nvrNlAAAgAElEQVQQY6Tcu4d//813efXkz9F1ezAqErA0TYMzlhjFVqpDoPE+i2XFDmWNwifFsPIc3L7J8Qe79Mz9/Jt3NYMzLdpNwBuF0ZaEFxy3DRjdpqoGpGwBS0pR64TNHm1lLSbWOYFRzpxgItrr7IpQ+KrBqEQTjAQaJfL4X3ghGkW0SuzDRmFT3rtaIf75BE30FG3L2yc/ze07rzMZN7l+Y4knzZBL76xw88QnUfvnmJ7bT8sAVYUqDXVds1P18jkkOfFFoUg+YmyLQTOk02gm40U+3n6ZkmXeMZ/gua0j3N03x7nbq8y0j1E/v8L8ZOCJA5rlpVUWyoYTBx2KxKbRpPW7TKQu6zdWmXvoEb7+l5d4u1rgajPF2prFlSXGRsJgh1ao0KlDMAalA76ucArqoWBnnZVzLfpG0MZlm9QpWDh4kOrGVVYuXeHAsf2SVBojSnlSTFgjOjGFk127EVYKSpL0jpXwgQ88yflbfS7ufZR2qIi6wSaX9ShS+MraXmyMKkWS1hiVZ6za5t9NigwXA0GJZkVFhYpREhejRynh1SSlMFERrDhvkkV4CNrkBtVnLZaQC/GJVFpUdlnpKAmDLuutsCO2RoPPhbohEKO4zEySnx+13DMmCYApkO3w4rknxISLkMguPKPRWCyRqDyxUqA9JllxQNmRyEOs4L0rr2Nsh+2lK+yZOo26+voXfmNn+e1ftxNt+uvr/Gb3b9HUQ6lE8yhVpxEgwaNtwUiskRRjtT6IfU8bMMnJ2DQEGRNF6dSVsdgsQtJKIA0+BoqiNcZ7xhglCyCMSE2I2EIbbBJ7Roy1dOxG4CR1VnKP/K42ykvcZBiKjRBNxGGIyaCV+G+tEztM0ODyBCDmSYPxiqR9PjyN4FZjQiXpNkQ8bxkRswJi2Su0ItXwT2a+yI2bA/6k+QTu5EmcckSlBaGrpINCRep6OHYyjAlyIyGeTyhrs9o/odst7iwvc+n5lzh46igx5fQopVDBC8xEFdQqoTNTQfmIazmGDQQ/5N5HH2NnOGBrp4epA264jbGBnUaPO9SkFdqUuEKh4oCApXAijFNR4nG3t7d4IF7jZx/vsHLur+gXj/BcdZS70wukiVl8dLSpSUogNjOdqTESUxFlv2VEhTtYucZT+hVO73yf/Ucf5c7KbT6//iEm/n+q3jTI0vM8z7ued/m+c05v07NvAGYGwGAhAALgIlIURVE7rYhRJFO2ZNlOquwqVUVSkoqdin/JTlUqVY7jSlKKKpaUlCyrFJUiWpJFaiHFRYQICQRBgtj3ZYDZZ3qme7r7nPO9y5Mfz3sazg8UqrB2n+X9nvd+7vu6H/ggnjlDLVjBBHufQ6IZU0OtZA9Zvcn2omS126mI/czdeBnpAjJL3Lp0jdGBFcutY4UyaGFz4wbnnnnOPB/jUeu+sCtz5yzK5n0kdpUjJw6xubWL90ss7ZtAtUNBNt/lP0ufYzyC5+cf4Ev9GZZ9x1AGas42qCEQ3J4J0TnB+0BqSYSarXsCqchshU8e/BY/dGiLa2+/yIE77uRvnlc+v+9Brp95lJlUW4s1NcCJNp7Fordc0VIIrrmQtbSK7Qoa9sBHe5+hdiNXvzDqth1z+3sLo2j0res8F4IIiBB2r/G9bz3Op87MOf/KFeJaZH5jyu9u3cfs4D241RVGzpGKtXGWmvbAXjnntlqsiDfUrJZq6pjAbKvyz459Ae2X+evHn+WLD/8TjgTI3qPVdrFkU0Vc7XC+NTUOc6RYEVgJ7VBvGXMnraugGOXTGAHZuCctchm83eLoQpNTTa10IRDbmmvRcwIYu7+xG5x4qseYG+rYevdJPrP5JQ6ujDlwaJ3Qjfm/3rifjRN3si3K6vohRjqQswHCnLMuka4bMzRVRNNALZkDssNDPM/3rc/5wycvcP7gh7nU38W+MbjxmO3Nm+zMB0ahI4xX2d25QTfqGK5cZz9b5LTLzuYW+5bHXK89XTzEPM5xEvG+590XnoMG0smDDWghBJgsW24+OjQnJqvrDKkw8lDylDzMkJSIYczhe+6kW15lngbeff4Zzr7/UUoUxqORfc7m8z0VdqFAuW6EpEyNUFoB0GjjJU6e+ytmK4d5+30/Z8oKDZ27UG0bz38Bs1rQMKUVG2l7wIrSPF2mMNf2PTDFt5FbxZ49VWorETKFV/eeLUaftc+qKQmLVRptxRiqI3kzJAZH2+WXPfVNmwfAaaE2fPRi3Z7zzNz/uki3KT4rEiGrGZQXRkVppXghmOnYUvYDNSf6MDKgm5hx2aHU3POfl19hPo/szuZUOYi8/Pi/1nzlOfK+o9TJKv9862N4dqjV7e06rRGKPShIxYxFxsy3HDvqQQq1C9ShMEqFOdX21vYWMxJPwowtpQFSXG6I4NCmMa1tX6qgHU7NxahO8KmiwTVJ0hFSZt6wid7HduBlvI8kst3+UXofrLtZvU19rrlmizSVw2BEi+HCYyahWS74TvC+J88H678uxpb22QyCeLdHK9Ni/4+5E37yxV8hjAvfPPH3CIdOmyKi2prYILTd/wJ/nAeTro3Ypna7i/ahWyBaQcy0uLnDuVdfsTiJ6wjLDqG3naSaQz9NZ0AlO0ceKj5U8mzKnQ+939DItTKdTm1PJg7vMsPQ8JptBbRw0mqLgu0dBOqQkpnNtyEpHzxS+C55ilAvMer289zVg5yb38bVfavcciswWaICS0sTJkNhfuMqsjy2QeXdC9xRXuXR1Wc4e/sD7Ix7/tWzBzhw//ejKTVAkfk39nLbXlqmt62GJJDKQPA2SDoRdMjEMOLajWu8+viT9gXJymRpiVlJLB1cQ6cFoiP2I4sjqSLOo61MxrU9HeqsCbNN6abWKWHU40YjxksT+r6nzgvL05f4T3f+kKNnv4f//q+XWLrtbhuO82ADmRdULRUi3ltPvRr5Eoy0qNWMqjF0DLMdvre/xMduv8r00pt0fpkyPsC/u7jKa2c/Th6vMa3TvUprHfLCxGyJiIYsVYxP4MXy3gtamcP//x7yKhY5WhxKqq0FFJOiF2uCgBpbQGeMNjb4mekz3LuyydUbl1ldP8grL27w7+VB9NADLMeIarKyI2dngag1c6ZaSEMmzectGmx70KKCyzPyuOMHrj3F3/mxVZ5/9k1+Y+tBytr9dDSvUGNnWCDbPB2+mzCb71KHmXlBXIf3jtD3djbUstdMZ4YrcM6Thyl46w5x7WBVVYjveSRi+85rFfNzYA9q8wTIHqPePAnveanwjqvfeIJ//ehl1k6f4PybL7K9PeJ3zq9y54k1Lu7u54IG3OiwrS/Uo04ZOWXsHSvpMneVlzisN1jmEqce+hE+9+ImX7hxAhcmrAbPgfXVhng242DJuhd5Bkv1LI+WUS1MZ7u46gm93Y676HD9Ck8+9lXK5i3rCYkds9mUkjKjyZjqgqWOgpmFXR+biVsZdpXbH7iHlQMHwRfKfGarkKVlhlkCV5h0nSVyVKnD3AyneIie3nXN72GKB77is3A4XOUH+re4lIXPl4+zPOoBS7tUMf+MqJ0FC/+Kb1FPw1u3VIAYKAdANVOJSIND4UJLfIlFGJ1x+CuhDb4VNOM0GG7XdXsGPxX2dv5SB+uuUU+vMDQPSXCepO+tJkKFFAukBjtTcNq8PNWi4qUUXHDGDahlL47vBejMG9NJMv+SC6Z4B2+JvWZ2lOzwnafUgaoDQ+r5Lydf5NxrX6UfH4buMCH0S/8ih6Vfnl+/yD4SQ0j07ba1mGy01j3jlrkjHbU9dFNRQoBa1LKfQ0GcYx4zqDeDTrbikVk7NLJzFsMTyz8mNQnFiUmQNkU7lExWtQmPQJAGHkLJWiAGSsl06tFq6X8Ry10rQnbCqBryV73sfUBKNWJZwDKcRTzBqfVFLwaJLiLZ44c5Q5kRPJTaak4RfPQ4daTB4nmiDnHGQh8n4eRDpziw8S5P39omrw8mGzYJu5YEwh6aleBhSAyN2paHDN764EtWNDYIk/fU+RSZ9NzxgYcpFG6+/Cbbl28SlwaGzrM0mbAzm9F3niELaWebMJpQtnfQWpntTlleXWFrZ5uuC7aHy7ntTU0iVTHOexoGfIgMs0Tw+p75rXksfBzj45wnbgjP7j7E+0/cx5np89y7fp5HJue4eilx9MyDbF6/xOYsIPMxJ1eFnaUx3+Z2nnpnlw9PLnDGX+PWzQN857lXeJ4PceK7fpSd2a5VjhYbAARp5TW1yWaCSmReEl5nbF7c5Ju/9TvEkwd45OPfw9qZswy+snt5gzqbUZ0Qut4yvF1kd3OXUQjovDIru834ZikF51rpRoXgbbjIyUxfC2OdBGM8uCIMs0TJQhz1XPXv4zs3vkU4/xw/cOcn+avdal/C9rk2qphVZGsVUlqY+OzW3417hrkZWlPJSOz58q2jvPrENb57xfHoA0fY3tzml+5d4zdf+g88ffrTTJdHBu3RalKjWsOcOFvjLWKvhnk2lU0QlIy6inOdqSrYLh+xHgyFhklueeUGBovSZFZg7cKr/OLoLfYfT3zz60/wvT/897ly/lX+ID7K+MADZDdjVip9iPZ+1oxzCgqz2YwqUFpjmQd8q+v2oQfN6HbmTn2ab33hOo+Xv8XstntZLpW5GGTG3riKiGs3LG3ZZ4PgVCOa2f4XMwc6HIhDXMvXY7E5a+6Udsh7Q3oHZ0jVtqpMAevYkGq75GhhSTMYV0JTU3Cemmc2yHjBF+XABz/Er731J/z0xa8z1x0OHj7BydDxI3c/yrln/pxTD60zbJ3j0q0drl27xl13rhFr4alvX+J9pxwF5cb0AP/bd46ztL1CWTrB8qRShxm5FlKa00VPF0z+9n0k54HZbEbRyqjr2yBQGUV74DpvChSi+DAwbG8h80w/mVideD+ij0oqGR8c2jlcCOh8oA9jurFjZWWNw2fvog4DaTbDacGXivSd4Yk7CGKeGx/iXnTNlfe6M4Y8M7iZMxaBNbkq+do5wuEN1qOzwUvbw9CBLMx/3jXIVTC12Jtq6rHPmS1eFa0JddFKj6QFAFsiQqUlA4IjV8GLJ0glVyAISociaFUgU+oU5zuoHeJsIC6uw9UBEShOLGYqwXwOqqhmsmCx12TgploLvoKGhZJkt/so4HEWjPOtZMg5pDoYCl0ANBCDUvB0IhQvaLL3VGvFh0xKNhhF1zMO8MrffI7R+kFGy8eoYUQAmE8HJiur7MQxk23QzlH3UJjaYAjYLkEME6tguxPUmrhUqXmwP6u36EOF2HdkCk48wVcoQi+O6itZDQbkRcEValW0gVIMRqGIWpmOL86kwegRccRqB6evFQ29rRMoTERaYZDtZgZJeBeRWun6vsn3HT4rKoXqYzMKOeYGVETJDDOjguEFM7N7Ogy+IM7iSTVlQh+oLFQLi5NJV/naO6v85L7K8sYL3AwPMa9TotpDv9Dy8u1GledmOvHeyoOQOWVoX46cSTVaj0DrUQi9McTVw9F77ya113F34xY7b7/B7s0LzFaWGS/tJ3jzanQTR533vPncsxw4fpzDJ28jZ2tWqy7vITApkMpAlB7fMrpGSmv0Px9xJe8R/2odMaHC6ognbsLn3kkcXJ1wz+g67z8MXE8cPrnGuW9ssX5wzvn5hMcuFC7NM6cOVX78I2e59PoOabTLN/QD3DzyCWR+C+cipcnkpdhqKZcM1ToVXBghRSgkJAbyVGEUyVe3efnPv8aw/jRL4zG712/hxvaAG2YVvxTQaoUnQ1GkC/h5RaOzG6EbIyOHZqVEgVLaA7A9+FUJ0WqMc7t5jPsJqGOYzvDjwMYdH+PI5A+4a+N1vri7Qpc7Qmd9GtJiiooNthJtsE21EH3bPbdaXddAUrUT3ly+DzeFk3NlqQu8/OSX+KHxfpZf+EMev/fH2RyPIbYIoAcwzr9vZL4QQoPc2ELTDi3bB4vSpNjaugHeq++mFrzzqBiBUnGExlI4+Pa3+KXDm/h0k+vnb/Hg+z/MV771LH84PIhfOwq+oNURY6DkBEnx3Xu/v6gZCFWz3YrEbp2GZq1UFznNC7z/+x7gxbd3efn6WUIeKASkcRmq2FrFOTs7yYp31dYgIUJtZtpi/emak21to0ez4jW221xFg2eodmMrVFwIpFLxGNCpmrGomXgzoYtoLoxELI7pbHiJUYx+GjyhYA8NZ6moC8c+zu986xL/6COnuXbxdT60WvjVP3+TFH+Y8Nk32bfvAvfeu49zlyOb/Rq6cYUvXTjJF7iNvjvMaP0Yaw/tcuDQ/lYj7JnPp3R9oHcdOU3bg9aUvD6O7PdZNFRiUrF3jlEfycmUxTgeUVUI2VODxekkO6QzpbPrIzGOOXXXndy8eI7VY8cYry7jvQNnJWbUahePoRDGkYpjFBwJA+w4VxaBRnwX0BLeG0j6aD4uB3UYiJ2V7Mhsh9deeYknd47Sf3iJordwjerq2qC2gGvVZvoT1UY19NQh4X2l0uN9sTWm5hbtw9bKDtR5JKcWEbTPTK4WAXdqr1nRhG9xQR9a9bd7L2puMefWUogQGaEkWwXVznDHOeOcrc3UebwWXHTMSyE6owFKM+7OaqZzgdQuf+JAXEsy1ECi4j0IzpSzrHSORmY18+Oo6xhKopREZpnbH/0Uu7e22b7yIq4/QBiGGePlHulXWZtMKNsGZ1kceAZqaLWHZHPLYi9uCM5IT81skBECngDEMGK3pr1K0+qUoI1HjQIBtGJVNM0XZ80hNpVpRbLJr7UmarSpzMhtyth7klrxRa3ZyipKJreWQqMPmpKAE0IR5im1N4gm3YPLCYdnXhZv5IBznqKJImYAEvFkSaiPe7fCKvaBLgpalBDsQ54KuOA4t/YAN3Xgu+RNvrBzg25s2EtV2xs558k5vVfQ0m4Ow3xGmdvUlkrjsOeEhrDH4yZYpNKXykDai8Pt27fM+qFHKPIIeXfKWy8/g9vZQsZGC/TdmMn4IBuXNzh8+x3mDG0rANf20hIq4vs9cM3C9erb54AG0/C0DG10iLMozvIoMjlzglw8bwwrvHGjZ2frKgdurLJ85BjTYZe4G+hPr8DVdzk0f5Xzz1wnDbcYr36Iy/U0a9FRZERq0VPb5QVKsRt/jPbl+saXv8yrf/E493z8I6xP9vHCXz9OFHChcmtnThmuMosdfTcmb25RfcO6ThVdnhh10iVInqB2IEmI1Kik2YAPHX53xlwWcrDdon2023keirmZc2E+nTFemhh/OwVeT4e4Pj3KbPcibn4XcXyQUg2aZV8dZzXZPqLty+5FGVp+XZKZGovAaDTBISRxvOPex5+99CZ3+nd59OxpxuMxnzh/jfz87/GXD/w0KSxbFkvfMyjmPJjBr2I34tq8FNoGPlozpNDkXPMQ1Ko44t5nQBZ9IFqZ18zxd57inx65BuUaWzcuEJfv5ulX53x2+ZOsrI1xDmZljqczsFcFNOGKfYdEzDg7T8VKt5wnLpz/IjgtDDnz4d3nmG0c5pKMyJMlJl3XSlg8EgoUA+bYWnTR6+DN1FvM+W37UW3M/87SKsUSEsnGCTS4PTiYLRg7e8hogjKQ1T4H5GAthV1vyGdnBS4q3pJC6hhm8/f2wpjikrOph8vdiMsP/gRPXX+S8eaMlcmcj6xd5du3fYQrW7ex2yVeeOccV24d5aMnfpDr4QLrRx2jSWAlFrwfM6QeFxWKIcTHoyWoVggUO2viMzf9wrNge/tatK2qUkuhCF1vPIzlyTLf/OJXiU5IvqMgGJ+oJ3cDH/jE9yNpRkVZ238fc1UctlIqdW61wpOeNLdqX9uRV4b5QD8aWSmOD6Biw4m4pqbanr7U2mLSWL1xAZzj0PQ8x44dIG2+D9WpNe2J8RBEzWBs1EIzaNoKwQy+YNl6EY+rpvCZyVRQry1eB8JAVTOHahWcWJU9gPONGOlMNRPpbaCTEaIVXwR1iep6Y01oJWhHUCsSMr+CIJoR7UyJsInbDOi66MaB1Mx9wSueHifZzLKhw9dKKpXi1eBUUinDQFHHuLP1YcGewb4aBlpb86QXAW+X4N3N15HuJMvHH0A0EroucOXqBktLG0S/hHMfJdddnFpFojaznaURmktetbUjmcNWS8F7JWvARdBcyD7QpQQ9BJxlFL3JHfN2M3HVk4dqaF0HQW1nn6g4EXKp9nByjtLgNIJFhHIZDH2IN353ocmy4C0sSXat3KRJf6mYsWPREiU+UJxSq9hg4F2bSTx9hHm1PHiIgjkzHFWGveKIUhSfir30tcEgtOIELsiEL5+/yfeEy9z4xt9w+BM/RGpxKhFDYqpY7teLo2RBU27xPtnLidLyrTm1QUoqoZqjxbLKhZQsxpS1oDPLZvnQs3rsDLNnv8aPf/Awv/vCiKVxYHprm26yRmo76egFrcZKUFW8s9VGaWYV1WJO22C1ki5Ek5eaNFxrInir8s0oIS4RpODHS+Q6MB6tM1neR3CFcRcIGulDZHVd+KE77uaVv3yF1cOn+erryvjRkwxq73N05lRPiCkjrrB7dYfrNzaJ4zFbT7zKsX1rbHznOa7UwLg3KIYJbwNODeU6qIFIgnrUwyBCSBkpgnaOvJuIMZDTnN2qHF1dsmhRro0gaHRIAwcpOVlCw3bkFaeeMp8xhI5R15N8oowCL2wd5eFT11l5uWd3aCsgZ0PWXhe82A0jp2J7dmkV1Y2DIc7+mThZo+5sMZ3v8trqI1zZGHF28xWG+TWWj67x4ytzrr3whzz3/r+HjoyfvogGRm9tY8E7GyjtUm/DXFsH7BmoYov9eo+g7YHoCSKUUnGhw9UZh65v8pn8Bv3KSS59+2/wq0f5y9d2eNI/xHK/Tim3mBexz4W35rrakixaCo6Il8KsGOQkhECSYkwEJzZ8FAXpePDh23n5O8/wZd7P5FQ0JSpYuNFy+BnvWmKotjx9y+iXZLKA3QhlMbta30YIaJ7vRRmTOlzzv7jQyqNqpUOoaqknWkteacRDETWJX4WqlVCNeFrABuXGhtdiuXHvHMl7un6Nr906yD86czuXzr/BmWOFl19N6J370bDN+tl7OHka1rvEyskDpAySbtF1PbN5ou8MSuOD4bldNRlfhRYsXQx5Zv7C2brD0M2N+KhtVlQ7e3eu32TjxjbeB5y3M9OaX2dQHLM8x83nRh8VIXQRWny5Eygtrmh599ze184uWzjEebp+ZHwEUWSoNnRX6yLRZoAO6nCxp0wHXN1grSu8dekis2OfYewyWSO92llnLHwjdTpo3TXB1IgyID7aeKeYX8NBqaEl1goRBTySIcRGotWIMrdhuTiKetAp3nVUHZlvpk6p2vDKwVYJpTaypBh7BCf4BuJy1SGuSf1+EcttHpIFREudrdKrGt8A2+l7p/Yc9A4ZDI7U17ZmCt6u5DnZOsL7RQbRJuz2z1WPmczVc+D0R3jrW7/HpD9Ot3qcIDL65SOn72Jn5zK7u5CcxcmkOb75j1CGSm04USEzNHXAdhnqCn2brga1D5obRcuwYnGNnE0jQCqaPU6FLjiyC+ZSLBBLMQesA7qOVCtSwVeby6vzRApzH4mqVCAVk8cXuWVRmy5V7cugFYo3jOesNu61KlJN3o3O/hq1tt1JpdSMa7WR84awLY3xX9IMP+rs7uYdTu2wpB3YDND3kZeWP8DPnr7GD17wPFUj1ZspSLyYAlEtCokGXBRKbUCNGCgl2U1MTG2RUltngCOJEqNFqdLc4mpDw4dCsfVAGRjNM8OhMyzNXuFIuputLUUrdPsm9KGjCkbJ67xRCKWZe3zEeccwzFoLYtsbh44i79Uua8k4HxGxB1rAI73FhKQKI3pUekI3ggJROvqRZ+v6VX60vMzWhU38kTP8xjMzjn7vR8hJqKGiuVrBjSH0eOGxr/Du02/hdq4awyF05GD+DdThejX2uWmfCCNQR57OCaMxBWW2u2OyXdeT0kCdZVgZE5dW2E2ZsjsjTQfOAytHDrOyskRNmCnMG3991Nk+bz4f8N4RnSFlvURKHhicRzojG7528waTa99m3d3Gjt4GOIpaZDT6YHW5vpCaMa4kwceEFvMX2ORufhY0041HiFuj1IGb++7m165m/otjb3NovkvRzGfWZsRnf583Tn0vW4eOMfgOh5k9aZI60Kp+TT7VJuWb/GQZai9i9E1o9E+o4ghjqPNKvPEOn7nxdY6MXqOv+9l34ChP3lrli2uPsu4PUmWw5ra2QrBGUUfXTchM7WdIA/NSmkW6UkToRj3T6bxFtRzaC7I5pZueZ7z/GNd2TrE0JMJoxJDslpiGAbU2FpxzzIeBANRioJ4YA/Nk6kaQztInLc6Yg0FsyInibK1Rm3KYNROqfaZKCKiL5hovmUptXHlBF4yTkpGGwM7VBgWHkUqNEmiNdloVzcW+Wwcf5Atvv8LDaYlRvs6d67/JZvgHhKXbiDplshYZhjl9iFATuesYSib2jWDXzIUxBGMRmAPK1oqx6bRqOXcR+3PvjLgpMRDU1KG+73Hjjj/7k88y9r09sLP5Q2RpzPW33uTUvfcSpEIfLYqoBZ2ZP0VCu7yUTGhcChFvTAbnkMmEkgaCVNLifCNAbPwFb0ksFyJOPJpmaPCkDu5/56944M4zfPGFHeL+I0SxB72K2nAjESXhvfkZtJoxz87l2PgyBfUBX60XpHNWwCbiERowJwRyg9SJF7QMtt5elF6FCMXhdIaKa3F3R9E5IhHVQGweOatVtjhr1kAsGRcWl08zqzoXWoJrZvp3rW2d7ghEclVUE4pvirE953znKSWTQsBj50QngqvOYrNoMxm3mHRDW9fWI+BlYOvKm4yXjhNGRyEuEUT5F7mkX47diNG4Q3cEafEyFaWmbLeCGC0rqYq05iNFic3NnLNSnFLEcrI1227Fq8MHT0LMeCEOybbHxbOHa7SRh7ajgY6OrHOKNw+4gQ0ctH1WL0KhUMUkOalqX3wt1K7VmTohixK1bfZLNbBGzWasy84GJcF2vQRGrjeFQic+y7MAACAASURBVO2Gt6uKD55MAQJOrIFt7+AsleJNfrToSjTXZajMD57g9e3bePDku7ywdY2tfftMZrWEFZ13zeRGo2CNoQp5Om9I0FZIJGJ1qGUAB04tBmNYSY9TbRRAtV+mVKSvrB48yNXNi3zu3CF+5oOOX3nG9kf55hbXlsYcWt8HbkZpxDrpPHXu2urHU2vYm4qlHTKdr5AdEoTeQ1JzxXrBeg+a/GoqRDPrIXTBKpV9DZzMT7E0fZoX3oV9p+/n0Kd+is20TB+x/6AX4pD4g1/7N4TNbcgJ/Ijc9YQS0N4jJUGxW5W0alztGi4Tu01oEXS6i6Zs4KksDG29EgpMr9wiLxmEps4GEkLamXLz3RssHz3IypEVVpeXKWpfriFnRCLj0Rjartx5g0n10e8ZRbua2XfiFA+vbPDcS7t4WZTlOBDIxV5fvLPPojpLloizAWexh24wJS8BooIL1DKnAsPqWX7ttR3+4YkL3H3/7ayENf6JeP7Dk3/Fn4Uf4cb6ftSZ+cniu3YjqOLpQouY4awZT1rkryTEW2oniqMUA3V5UcK25/C5v+RH/AWOTC6xvHQbl159kqfLB/nc/P306z1FB3sALd6DbGoeJZtpK4ipHTGQ54mueop5HxlyoqB03qJPOpszSEKWj3P1jTeR0YgsBU0JweFUbCgudjguHOSpgiRrr8sYEpU6sxiXWK7aLSqaQ8CVShZs76rGUVC1gzM6R1VnN+IQqdVWd06clZ4toCyqSLXXVLxDOvMchLqAL1vRlPPWqVCrGa0vHvlpPjT7tzgPn7zzGFtvfIcX0wr9as/O9sBk1JFqIfTGK0mmD9kC1RbGlOb6FwEn0ZSOZm7WVFAyXeztskC1OG8xg3e3tMT82ibf+Nxf0MUlEyxyxqHE9aOsnbmHydpxDtx5G04rmgczcNZqcnmMJocHUyprBCdjJNj6ZBFnjpiRfPFcCSi5emL0huNXw3aXovTRMy2KbGyxvnuejZu3uHrmM6jLzFPGB+uhEGkAtgpa58aCaM2ti9uuD9YeqNXeUx8i1LmpFO3ZJJLQ6vE+4nSXlOf40FFLJZCoEhHGqFjdt0pAKdQ0w0dnnJtacUEp2uGDveZCj9eeFIc9VU1rpXqLo7qcIXRoSTjxRG8qihOLHc+TNAVGCNHvAe06Z3FyZ7IBC80zem8xfPXG11kIDcEMrqIF5zvGYT+yCpP1O9gdIqF2Dp0nrl96hv0nbsdrYV5nGO/LiHmhSWIL8o7zgHrUK1SThLsutIYyc9PXCCkLLljpRVWhbzJktOe03X6CFTJ4zXYj1WrAHy1ICC0dgO2zKpRijPOkGVc9LjQDD87KJ2qAZA18ObAnZ+eh0gXaCyOUoeJGAckZFde6wUtza0OtgiYFlyg+4NwIrwb4EG9Z9JozrrNox2KHr1rAB3wVulHk1984yn+9+QWW3/ksVx79WSZ9x6DSGugcMbbdexG6vkOdUGcz1CnUNvO05i5XDNbis/EEqrcdUxKI3uPxiHNm+shKkilHTp/hyrs3ef2d7/BLH/0I//vX32E0Wubi66/TP/gAK+MRzlk1qqoQu2g3JbV94TzbvlQdjIIRvDSqmVKaI9r5iGjCN5LaSAQVjw9Cypnge3oqaRSZXt7iH75vnRX9EKsXrvMbzx1ifHKVrtGtfAdI5ff+239KHHcUP8b3HXgjQtIrOp/u4UQtwmb7P9tvV6IXZrkQqjngi1QzA4mDYru5nSHhfM9sYwftAoox4ktNlDJj5+oG081tdg+dZLJcWd23ggalCzArCR8dveubiw3SbE7tKqHrSQoP3n2MfmeJS7s7zOItuvEKRe3w7cUzpBmSZY8qB8JQ1TjpzWga1FHSYLvUYumEPgTm186hQyWc+jj/9/Vn+Pl3z3F633XeufAm9/s1Lrz2pzx9z08yXe1IrQa2LnrLpVq/gVgWWloiwOpJXVs5ObJY5Ch4kFw4+NYT/MLa86xMxmyce5vUHeGvth/gK8sP4WtBNzdw+9Zhbp8Vc1KZ14FsjXreR5Nsi/HKVc1kW0uBnOkbydEqYkHKFpdeeomTd9/H+q19JIntZtV6RUSoNdlNUO1mtSg8omaIKySfCTqy9U0I+IRJpDlRu44cGoFvNIZhjpsnqldq8+b4CsE7ymxOjAF8QMWD2GdfaiNNelMFSs32YPK2Ll0kZmqtaM6UhlGXDobO8+zVs3xy/yVe/Na3uPnGlMv7C+H7PoVPM6J2RHXttqjESGMvQM6t8VAx2BZ2Jo4yqCu42EFUUjK0smvve4yB4ANFHG+9/jpvfONJgh/bhrNz9voVGK2sUS6+zPz8u3S3rcDyflzaIdOBd+3900ZfVNvtEywJ1Y3QkshphhaBYHG6rh9RivEwQm8AoDxVQtdRWzZ/XhTNwpnLX+XR9x3nDy8f4tahO+nqAN5u7dJaW0FQF5CaUM0o5sVAzcGvWAotiMDCQO0dmh3emeFaawZvPIjsnSkGNRj+XT2uVvBza5C0vSzeCbl6tDY1zxujwYe5kSRdZys0X6zsxxtdEBWkJmqxJF2qhQgGHMMuwlkLJWdLZlRTxZMWuhjoKgzSEinZEPghBMTH5olYrKZtfbUgB9qKJeA0sX3rPN4tc/Hcl9h/6PsIUNm4ucW+kw/jl1eJW7YXcfIesa5ifeM+OHx1JDUJVKozqcJFhmp7H1czEsfGH/auyUIRgtovLsGkms6qgj0FKq1trTmfq4dsnG23mJwKBGc1r/PSJvZYcdXZsNm+ZC7aDjmLUEomRkesggYli8kpwXdUzYTZHPWOIMq0VlyGEiu5JLrao2GOpB5iJaW55YwFqmuRRO/sTW0gkOBMKhYf6PGW+T/yId6YX+YHH97ii+88x+WzH0XEfANeMBBSg0GUJg+NDqyRplYSsuh8BpBO7aamhVAKtdhrYyKBJ9eE1X8atKSPPaNakIMrPHb9JP2FZ3g4Vr55bYcDJ+/n5vUN4voKo9EI7yLROYoUMxFVW6F0DdtZiu4ZAmPsTbnxhvg1KR7S3KhbbmLNWI5MiAHnhETH7PI29wzPMXvpz6jrhzg/PYn76A+2YdIm9QJUCYzX9uFiTy72eobgGKo5i51UJNoNVVpbG1RCSVRRyrzFhATKYLJujZ6iBYaE7hYD0Dgzh6Em2Q1FGLkpKx7izgzv5xzhCJevLHGtP8GBMyc4fGiE9w5nsQSTGsUy5mAAE/GVx7/2Ko9+co04m+AOLiMSTJKUdmtrJUHm/yjQdURxaG4lKt61XaB9/1y1ne4MRzh8knT5ImE0kA49wv/5zn5+IT9JTY4LG9f59Nllwsuf5YkHfpw6WbZ9OAXN2qq8G3ecVpSilVIyIZjpb9CFNRHy4Lnn3GP87NHL5I1NNq6/iT/+3fzJ1j28GO7gkaVN+rrJX9xao89K74R5miMOalsxSFPM7EbaGvSCRbDKYMZi7wOlLrgDHqrHyxIpZbaee4584CzD5HADqonRJFMidpE0FAQzrxbF/loxTkm3uUs+/wLrodK5Jaa+Y3u0ju/H1KUEnREHS1aW4hID29TcWi4LVF8YsqkBqopLjWXgDP7VOSvxwnVo83LUYh2KddHGl42bXxc4Wu8ggdPK2/vvY+PiS+w7cYyf/sAp7rwc+co0cXhljee/9mXePv86H/vUT5GuX2O0MubIHXcxbFxhroXx8tiARLXaLVsVOtAMaT7be39drTh6pLMY9awOPPf/foGpgB+PIZua2s8LYWnCyY9+gOnNm0yv73Lqu74HGXnSsEsXRmZc846SMk7nZCcEH/HR1p+hN9Uv44ix3+NLlJTJqRXY+kVUMkKw+uVSakMCO1YvfpNPf2ydbz/+Cu888BMslSnFhfcM6DgzkAeHtMFWAaozmJN3RqwE65FQLBYp2QYVZ6SERQLNi/H1Xa0YE8ajNNNwCJSUGtHPvATqBImd+dVqItKZidSB5ooUhWCDaN8IuaqKC5gqGcQi5UYYIBUbZkpN5AYGK7lQQ6DzhitPycBM+GBrhBgI4gySpnMDt4GtGloywkuD2ylQMoUJ/YFjMOtZH08oufsXgTzh8OGD3Lxx0bCizBE3ojYCnrSSneC97cG8ItVbZCSIye7FDnoDX1j9ZHRGXSpq6FUtSqbSNQfmwu0bpMPXzOACHsNoVqloF4nFN2xk220UT5FK7Ew6rNVIeSUN+Grk5VQgODPJuCKUVKnSYlC1UouQZI5QqNGTE01qAVylqMcTocvUufmESUJY7PRwSEkkcRa1UEWcIZILxeJeuZJdtsNtlPmL+ft5ZN83+PTqO/z2uX1s3navvZ4u4Bp5LQ/2e7p2AwuTnjJPFrfzFjOy1YGHKlTn0F5NZm38ce8FCEi1ogiphaEMrOxbYbT6IF/ZuMT33rfNHdfP8fitXbZL4bp0LK3BeNLRtRbCiplknF/U5gY676y5UBopUB1eLTedquKcx4+t/W6WleVOwBkbfTqbUiSzunuO7z5zA797Fufhz6bvYzyKJgEP5kFwTrjy8vO4rjMehAvG4Fb7e2QzLeVWPgW5ldy0CuPoKHtmGsE7x3x7F/GQU2q9D1BEKcMWLoxgZ5sf/sghfuThdV5/4xJ3njrC6xcu88iZdQ4dPMrxA54vPfE2/+5b17gyu5fjp4/bpccugnhncUCHp+scrgqPnK1ceecNri99EFczWnxTLKyQh5LR2BkMCtCckc5TWFD4WgojK1W0/XuOGBzVjemWV6jvvEJ/8C7K8Xv4lxe2+MeTLe677TpSp/zdB8e45/6Abz7waab9EviI95ZDru0WtZARHUbIqw1W1dFwAkU4vPEaP732MnL5XVjtGZ94hD+9fJa/Kkc5XS5yYusiL+5ss3rwh5AyY6oDVexB6atF4xCH2f2cxbVqpopF6XzNLb1nWf4YI/NSCFqI4zFH7v4ebl17F7/RIqtqRjeaijAfkj14Yk+plW48Qqtw8Mp3+AH/LHeszbjzB9ap012Wj6/wyuMX2Xf7GZ469y6/98RtbJ++m8n+O4jLiW1MqeiwLguLW9EigsGokY0DQs5ElOzM/FtKous8pSST6as1f1bXbuk5tTSFVcBWKrFz6OgoLw2n+OTRwHR3l/cdFf7Z//S/MF5eYX3q8PUWX/mNXydQSaKM11bQnRl9N+LMRz/MiTvP8Ddf/HO+78c+zY2b1zlw5Cg7N66zur4fxdoK+958L/OdzAvf+CYbl94lhjFd6Gx1URNd9LgQuO27v4udq5fIt7bYf/IIzlXqYETXiiVJShpMqRQDmqlrxVLSQEma7Q8xd78ZjO1W6qoNUlUKcTJhPsvNy+AYUiFvXed7+Evm55d57PQnCX1nKm5ZrKpqO3cNeuWDa7vybOew2CqnSnvAOvMCOGdZ/soMJwFPah4Ej6stgy9qZUC1CXsi+BoIwd5XUzswyU9MbveAc5WhCkFtxYY3hTeIrZBqzSClxbmtrj7R2v+KIjVDG4y1KdKda2umUui9J+eCOk9ATJVTW+MEWZRSGThIiw3Z5jOqbRVj61k/7FA3Nrh57VVE4eDdP05YXT3I22/cZGltP+P9t6NXKyrVon+10jlvXwCB4CJVM10j6+VWUBCCIy1uos727RbXa7AfFSSY07NgESeh0jWkoxF4xOQXsXhZrQkfPC67vZ9HpOJ8pWY7xHqBWR4QqYjLTTIPkAe7GTdISA0OaygWy0XnCm0n7Jy5fK1TxiTkqpV5dngcEpSaBmoI+HbiL8pS3gv6WC2rTaIO7x0q2XrZcyZ1t/OnL3yLj4/f4NQt5eWdNfLoECVXfMAQrqLv3fS9J+siO2s7PpvmsH1jKzoS35k85GOTj6wxKriOeZ7jvDAZLxEJhKIcX7mdp95+hftGHT/38C7/z9evcG2po+7C7mzK8mTCpLf9oQsBLdbrkGuCRjsE+ywo2I3arEc4MmkwTGodZmzLohq24H1ge7dy/NrzTA7vkOvATXeW4fRZRqmQxRFHPWU+5+WvP84bf/EFm7CLsbYXZDtVJXgx4xdWmCQLj0ZSm9JTNgOrtKKcmswXMisWcSvZsNMSiKN19vmbfOj+ET/5oTGTNfjyc2t88SvbuPFxntpYYXPzKmdPLXNmueN//MwKX3n+Cp+9rBw+foq+7fb7GOygqUoZrEN8/OqTzM+cYcpak18HpBpC13tPcJH5UG2PWCsRab0GBg3yKrafX9wenG9DDlDnpMl+bou73DFRvrx1nenyQ/z2uSv83G3C/rLFxoWn+clHPs2tlx/j5ft/lJm4dqsRXDWoCNUObdeQwMICciP4UuhmW3zy0r/nzP33cHl6Ac3LfOnlQzzml6jLy/TubXa3LvDC1u0srQ2ItBSLtgdfUYoWVAo+RlvlqdWyQnPmJ9tqO4SSC+pN2nZi8drXz9/gUDnPSj7BJsdMPVPLsddaiSFYbKthx6UKR19/jJ86+g6yssp1v8Jbz9xgNDnCsbTGxWGb2fZN3v/gCie7Ga/uvMnnL+4y3H4X/WiCeCOp1WZCXRRJuaKAeUBwjbRXDafkAFEhpwSS7Qzy1iGS1VaiuZWMuXYra191pBbOuXs4/8ZXuXH5EjeHEScPHOeWTIkTSDenrNQDDOMBlwu6ZYmSYTrj1S8/xvNf/DKdUz7/q7+CqjJaWuXjf/vT1OgJODonhDjmjW89zWvPvWwMDYnGXRjmhL4zOmQR4oE13LDLkovsLi0hocf5Qskg0VN3rYI2tPSUJS0qHbGtRCqqDSLdJDin/5HBC0O5i1O0ZtJ8wLlMVU/JAznPeHD+FQ6fOMbXnj2I+8CDeCYUndvw33w3pRgS1wjq9t/yLcYp4qgUFvRDqd6Y+TpQWyzPid3KgzcZv9Ahbr4X9RQSVQNRPKIZdR3WEVD3BpFFz4CTaL6BrjN+v1NSheAj5Exp1jUhWrpFG97XLdbA9lxSbRHAYPH4VBVJiUXJlCXA2uWrYb4XKzCSXXSGWhqrAzPaa7Vzwxl6HRF2hxnLB+6xn8WNCLPgOHz7CXa2b7I7vcCKHudGF5FSW1zIHOeLbnQf7IvpTM+w6lwgVsWhDO0XWphAmmeVWhctVu3zIBnEm4lOK13w1OqYacFLjyeTam3rB7s9gLUigf2/Ukq2ilCFoiSS4YK9w8VoN/5aWzcAODWjiaiZyLyDTKSIlQWVNrhIm858LtTqkK5jcd9UVZv2nEBjTmtz6lvkiAYyMTe/L4rv5ry0//tZvvUlHj3yLmHj8zxX76We/C68BIaU6NrPKyK4WoyG5QulFkpzbo9iZ27nlPChs1dEnblrfST4gBSl1GJyMovWwUwXI0PMyKm7eGrrEMNrX+d/+NsP82/++Js8uXWCfv02klZSXmK5q/TBIEkmnwVoxTC1Cp0PDCWBsxy7ilKdSZzT2ZTp7g7+/GUOvvsKHz17BPfAx/jj5y7zt+7bz+70Em+9fIE/vnmc1Z9YopextVhN5wx5zvlnv2PTfc4s6C612jpp4d9QF5us6SllALUHq4p9AVXM/OOdqVGWwbd9bK1KoGcmifsPbvI///wjvLMNv/r5q1zadCQ/Rvats280ZrZvjc0h8vRG4Pkbp7jEDj9w6Bqfe/kdru/CkTMnCXEM3m4ptfP0Hpa23uJ99y3xm1/bJq8Ivnq6rjO3OJboyKrE2EFNqBoIaLFOCeJbLtiAHuY16cDbg8b7jqwDVzcv83duu8DXdz6E65Ubpz7F729+m/9q6atMThzGbb3KD5YRN944xoXbHkZHPYTCrAw2LLdhakEg8wjBWS+Bq7f4sUt/xPc9fC/PP/WnHDv1Cb50c4U/mx0gLo3h1pTvPrqFu3SLlaXT0M2ZT63+VbA2tOQMw51bv4GWgox64xxUG7jV2aFVGgTMudY5IIE+wu+/2PGLj3j49neoD91OiRNUqzFAqHgJVJQ+WqPj4bee4EceEB7f+hgX5ysw2o8/3pO9INnD8pwDV1/hzhuvks6/yJ137+MXV+f8+mtztk9/gDiyyJYsnP5IK/gx1SmQ0Wxqpg8eV6o5+501xlVRakpIFyxuiOC8ycJOpd0izcwsCiEo6ejtXD23yqPvX+drjz3F3QfWeH16mOHiTQYZGOob6PYKMfZUVYpZJ5gruOiZpYG+H5mBs4+cu3iNk+NlLr38IueefclMtTG2NQQE56xWuJRWxFMZH1jn+Jk7DLS1MmE8D/hq350+dOTUVF7XhkjvLY4tiRq1McQUcqGLsT2cajNNQpZqt1hNdP0Y9dHSWtWRyMyz8Inrf8GZ2Ss8sX0vz3/0M0x0ACm27a9CCJFcBjPQ1kKV9uB0jTqLFcSJsxgrYgmJ0oY4cxDYusG1s8V7M3g7NR9VqQoEvI/kaoqn04K6QqneDKQl2TMEI9d6L2geqH5k52NbZ9NeK4PEWRJD3UIJwVoQFkyQZtzMOVtkuHXSqFpMGA8rITLkShbzkThx+BDRamtQqWo/X7uM2qBl/owgAyMvTDzc2LzMkdtPwahDNq9/+5+/8qV/9cuj5TVyv8T/kT7I1f6Ildo0OE4gIL4hbGGvZ12rdaKLyJ6MrgWyqNUkNnOcw9YH0naCi/iZw3LCUPdgIwvUo7X1mfNxsQtf7DykWffFZXPptnRArQOiHd5ZyZA4i0uUYjJhKQnxrTs5FcsPtx5yAAmxTeVKdR5X5ggWU+wAaqZC+z2Mu79YLbA4uNqLn0vCu9A8D7bX7YrjQxf+iO+/e4eL15Wn00neOvzd0K0Sve10jBsezAk6nxuAybd611oJXdf41872kGK7d81WiBG8J4lSdhNZbGjoYuubbjAfj+fmxsDqrRdZu/JVPvToPXztuS3ue+R+fve1GWH1bsajyJJvbHW1m/bQbt02rA2g0Whn6rm1s8Xa7Ao7N26wunuF/+TwOcarp/lKfR83/YR05Rz/3UMvceGN11m97Sy/OvxdyvIYYUTa3ua5L32Btx97zHLjfY9KaJnr9/jzi2rbRYWz7RqTmUHF6pVp7w+5GJp0PqAKNS2cxhZZ/PCZZf7lL9zFb33hAp9/ZUydHKJzSmWOi2M7VLLdJvJQCJOAqmcUAy4Gar+KXxpx8NghxqGz26cI7CT+Qfe/cvfZ0/zjPz9GdscZTXqyM3XJxYDM53Z7EojFVl6lCqHrGrUONIr1BCQ7BKTzuOrR4BAKUgvT65f4b1af4PfTJ3hn6Qx5mBHDhPWdZ/mZ2efwMeGXVuHQ7fzR9WO8fucPwcTbKmdxMWs3CVeNEeBrYDRM+eC7f8kn/HdY2X+Y7d053969j3+7sZ/R2mnGbkB2dvh5+S1uHjzLb+9+3AiJ3nLgWi0+W+pgD7psefQgoDFSi9IFT0rWkmhJBYVczYzWalc9ynBzyt+Pf8ooCJ+7fpy3/z+y3jTWsuw8z3u+b6219znnTlV1a+zqqup5ZJOi2CSbpDmJEiWbgiwZtmwHNhwbMAIkMZIAQZDkj60kBgI4PyMjsRCPsiIpsiTLGk2NNGc22d1sNrvZ81DVNY93OOfsvdb68uNb57YB81ez0VV1a5+z1/qG933esx9DtPM97jigKbYppRCGgQ/qm9wZEjfWzpCmhxjzvL3/Qmyq8RTXyWPlyPwSn974DmtlZG9/xi+8uc7ysac8ma9ZIjsRpOuA7FyE4vhyCTAOHgtuY17p4LCasdDS2UxJYuSDpsjDpyysRJc+/cvFOPXm1/iJMy+xfeYMA8f5L//JLe7cucF45yqTo3dx59YNQou8tmYv9Mmj73yDOoNeOr/oJmszt7epEtXP76RuuYtd8njhoEg/4f6nPkTUxDguXagdhcXtXVjM3e7cuf89dL63j63gTn1HrRwkXEKzOduKNeCuK2v3hmBt5dW4+AFGncHLf8JH8wu879Q+/+6FDW5/8r8gpymSl0AlrtZ77c8Q86nwili5evauBfb/Y3VE4oRVrsXBF75l1tACeSri4XC5YHjwHbH3HA0p7Sz3d9fzZsTb3HFs4WvKKjejFiNERTwFyguPhqhe5bkY1W361Zq1VLGm0xgaRyIE53JK8LRZVXefbaTA/ujQu65WxurTpIQxUNu+3wvw2KBGq3s7IEz3b/LU9X9ONz3C7dtv8fAP/9c/JwAv/N5/Y2m2xWLc4Zfix3hNj9G0ee4tFHmvO9VVZGZgFaKjtZDNO/rYrnzf6bmiVKx4qIv5RVraGMykUtvL6dsU3wW6JAIXLjS7B9ZEONE1BxWvhFWhQxkluMISI4lQJfrhRm2dqwsaPXDEWpeB70BD8gtDmkBK3Tda2kZW1acDyWeYWPMqV/Mv0kGSGtIYDHJw2ajqQYhKShEWI/dc+G1++uhFNo5NePr8Ot8KT5LPvM8Z66ViofOfo3jCmwvLFGkgIQrvZWoj3p2YF1FKZZoimcJo/myUSsZDT/q+p46VuSmjBYbbtwmvfIn3T7/L53/yLzJef4Nf/Gpkvp5gGljUNapsU2JlIR1dmFGTMCt7nIkXsBuX+PDWHlcuvMHDdx2hyBHWtze4NM54bnk337+dqN2Ez9bn+dSDhcWdt/m1P7rKy5/6n1gjMT28zZf/xT/h+vPPIl2H0OxbKbp3WrzTII8Hn59DNtJB6l+ttFAYH/15x5lh6arrXLwYlbwgh0rXZf7Gn9tm1iu/884hBu4idqV18gOl6oGtzMVlynK5RLueXGDsJzx8/wPEbmR26DhrXWA+3+XOtVv8mP0JD5Zv8mz9SX5t9yTr65skDUifDn42qYVJTB5g1HWMJdON5sAO9fenm0wdGU1pq5f3/ue72MBif+Tvpud4ee8Qfzp5BJ2uUcuSRR14Yv85/qv3v85k4zTnn/smQ3+I//vqI9z66BfQMHE0L+89v0ihK0oadvmJi3/Ihw7vMuk3efn559kNm/xft36Iycn7kDijaubw8iL//fZX+UdfmrD7kZ9sAkccE90macm8YPQEQUWLA7lszL6rNGtrN3x0W0cHeYlDm6Qatthn8+YL/K1z3+LS+cP89uIMNx74NwpBVAAAIABJREFUPKEOngipyjR1ruSfz5leeovJ0bNMDq97YSXCMAyMuTJNHeO4dECNBFIwujLno5d/j5Pbe7z6es+vbjzJ+pH72EiBUStRnVHg+R0N0lrqgRV5LEY1tzmWYq1I9ejnIBHRQtGAqBfLqtEFtK3j81VeJF69yF/f/BKd7XLhhZf5Z/knuJGOcuzYMT79mb/AlmX++OlnePbXfpW63HO632TC+toGtXfUckIZ8hJCJPURDR5a06fEMLiwsQ4jVSqn7j7N5voWR594BCmZWjLjkD0JUiNCYbhxizCZYmsTVMQLiFKbwNjtr7WxCCwXWk/iY2fx9W42d5rUdodMagQZseho9+Nv/AqfO3QFicI/e+UIPPm3mYZEF9XF3uaQsyBK0dqawRZ4Y/7sqK5Xwjz4xim2gVI934QqrtGpuHCw1sYJcKFkrasG1z9Hqn+OJoMXBJIoCiU3rHQdvflVbRqIqS+xtKDj4Hh59fAxk45g+34P1eC00VUtUkeieEy5lErW5uLObrHWpjmr1QXwQVrThzATFzEWwVdtQYhNR1DbfeAr6YCUJZnAyb0LfHbtRW5d/gESA/d/6uc1AvR9x5VLb3D8zD2cmg+8WYWqTjyj1AMsrAR1OIKBqkdgNCoCotE/9GHAxPeJVXw/axY8z5iK1/W+23XhQkQQGkfHI3ADYBG6iFl25bJKcx248xFReh3JElr2gEH0MUuptEQ1GqazEmpqL9/ygCCmoo6ErUAwQsVjW6WycvCKxpYwqI7/tUTUkdJ24emgmPEVgNVyMAXwSUmzWYliQ4EgvH3Pn+f/uXibn9j9Eo+vvcuR8ct87aUX2T37KUo64roJWe3RAvEAB+DgmSo+0jLzqrTa6NqLoCRrI58UPOoUYRh8nN53DRjSJbaqcme+R5gluo/+Vb579ZM8+ycvc5oJd/KSp7jC537kbi5+52kuXr3J2qzn7F0PQezY37vCePsO62c2uGJ77MwHwskP8AfLwwyHHqYMRxnFiGuJ04c7rr5zjc/em/j+l3+dk4+9j4vHP0tYFLbPHuXtH7zG+e9+j/XOL7xSMyFN3NMco1/utbhKNwWoLYHNXJxY/cuBhITm0tTJBcvVCzoNvrJYjGSUxb7xa//wC5Q7L/Ir3z3BvgiTSSC2sBhK73nnuR7sMkUjYRiRnOnUuPvMCWbTQhcU3b3Cshg5bPL5yR9zH8+y99Bf59d/MzE9PvXxXx5d99IZSXFPd2mdSxA6SVRGci6kliQ3ljbmiyuHiDPeJAoU//ksVs7fuMgH78n88c2RmDOihXVNvMxH+cPzPT9z9jXWwoSj2yf523vv8IsvPs31Bz5DlzwGu9ba1NFg+9f50Wtf5XMnBs7fuMJyZ49w7sP8wg+UdOws2iW0U8pY2bl1k7ne4OEnPsy3gcW4Tx+iky2zF8B5GIjJsa/FXCynFPJqROlqTrfhBjxMTEZnXJTGV+h7Lm0+wjfevcjH75nz4R+8wbNvfJ0rZz9ClECKLvIS7bBeGPsp+d1X0M3H3fddKl2IzgGpldRPXYcQwcZKZYM/SZ/gZ7s/5aMfOoleX/Bru7dgc4PO+z7qsPRJH22smitJhSFnAk7PzHnwEfnSswI0JGpZkkwwSwfdt0mhj503WNEFYkqmbhzh4m3l0HCTJz7zOT57fpt/+2pkfv1dzr/+HMutkzxx/zlO/3d/h6/+zu9x6tQpzjz2OC89+xw3X3mZPA7I9mHqrT02p5vM8wKkTShqIE2nJBG2z53j7BOPMZmtMV8skDwyrqx5kw6qT4NyLvTrG+QmdLXlQO07YnSBpG8lldisuGhEtImDcHa+hEQsI56rB1ZGxpix0di4+B0+1b9IP3mTb7x5L19Nn+DkJ55C8gJlyWirpt1ZFsUqdXROg4/SvQFdjfJrHpyVL84JqKJEGTFTrJpjiGXAqv+shtI195moOYsjeLicirp4FScJUs1ZA3GC5exiO2mphNpyJtShciW4bqCOLWKa3LJzYgvpAaSFE5kymmGS22xTCZaIUhwX3BIhVZ0RQPUCq0tC9q2HhxA50tE5I6bE6C4JEWMcvIHpq3Cu22W53CF0G9y+dh5VtQhw584OR07ey+3Ll5htraHhPoxlOxzExxahWQuCe9GrtZCRIG0d0Pb+0dXyQUGKUqvvcGIQcnXffx4LUbXZxwpGAilUW8VpGkZBitcXgdoEFCClh4bxNfEoy2Ij7m9eoX8bAEV6UA+QKRRqixoWIJpguUJqu8iiZBsJTXEmtBIMD04xM2QsEFtggwgxaIMU1Tbmd0pebtMSgGAelDGOC2JMdBooKsxPn+Y37Gc58eaf8dm1l/kbD8H+8rf52isL3lx7CrvrQ5Q+NstZh2XPLbdi0HUs55lu0jHmPUw7tPm2u25CtQEZMkYgCITUu3iy+ohVzMh1RKOvLWq+yfTIjLL9JDfECDXydIXvPrNP2TvNsHuB6aisDetMZpF3L88YysCD/cPsFOX8ZODIxmmWKvRWiEEIVHKZU3cXTOcvcuWtp1kMPW+8tIs9+hHu3t7m9//lv+TqV7/CdGMDJBBioI6ubhUKpUbvLojoinzG4Cls6tWwg4fEpzHRv0dkjyoFJS8HyuCrH9XAdjL+6It/Rjr0AF8+b0zWJ24RaolbxQo2eJeXK43972un5f6cE+sLHr15iXu2DnN0fZvvX8vknRt8Yvsq586NfPv2X+Pn/9VFJkfvwYYFtesJweNGtWYH/bREuj4qeeFI5qg+DiYEDIM8QAyU+ZISFA0dagVEnDzWBcaFce/9D9GNb2HDPjqZkKKz7nWz8Nvjw7zzlVf4a/cdI+9d567DlR+/+W1+Y+chbPtuGOeNF58oceSxy89zr7zNt7/9Dvff9yivkvinL83QY6eY9DN/T6h0qkzWt7h2c8Erw0A9a3SS3NdvgbEUovi7po1EFkJ0T74K4cCr7MEoWis2GtLAUV4cOLBrQJhOp3xj+Am661/moXvfYXv+Aq+8c4E31+7h4vQsm5ubRBO25ld4f3qZtzSwU9xeW1pXRDDILkUTjShKUd9NT06e4mvff4SfefQNwltvMov3stz8NGuhYZHNV3hmRlkufDLU8L65eseY8GlnCA47Sl0glg7qgHXKYI6CDSE6gTT4SjKFSAyBsNHz3LP7fOa08tpzX+Gu7nHy4hSaAm+88RbzIzucvPsUkcCP/cxfYTGfY2Y8+fGPc/Weu5j162zd8yDzW5cYR3ekhPUpb3/t68yO38WRk8fpJs6oII8M+zuuLxl8UhG7ANEoy+zdefXkPlUfpEYNjLlQk4+wkyaKqKO6DUQKnaQ2ulXGOhBJVBYU6Sh1pL/xOseGt/nkqXeZ6DWev3aTf3/xKQ7/+Z/m7rJOKPvkZi+n+MqvtmICjUTNlNF7Q6tjm7qU1ix5syhSQRLNGOiXcwiYSIM6uUXQcMtytiXBRho02ddUIu7b164VBu3eMXfSSFvHSjDMkodl2dxFsFXaeiJ50I/AiK+Cq/m0G/HdvCqePFjdTeLr6iVRE6UWLAQmQYnWUNyraVlzlxxMzq1S1ZkB2u4qM9dlxBgRq4hEdLjK3u5llsvAkRNnANffs3XoKLfv3GBt+zAnQ3CUc3DZnZWKRsdY+ijSbWIq0i67plSMzTmcs1crGVT8yzI2qp5oZBwKqqvxfQQbqVbb2N67e1npAFTdWmHml6AVdxG0TrfQdkGrv3BDHzqgyEBbl9VGp2Yu5bOmrEaMkgcIXbOKKLk4kCEGdcqgGSIdioeq5KbcjC0uFm2jKHFhYK6rUTy+p2/0xC4kiomH3JTOR1Yh8c65z/IbV07zsctX+ORsh7/88aPsLq7ypa/+Ai/GQyxP/TB1csI9od2E5bCD1I487rA4fwkd95G1dfrTH0SjMB8c+tFppObKPqPbZrKLzmr1BD1N6gekwZgHYpfQuqAU6FKFsVA3JtjsEabHH8XqyDwm9srAZCp0Aa7HSp5UDhWAzJp4olfVjAegZGbTTcabVyn9Pk9+5lM8+8oNNiabvPncS048nM4oFohdolSIk3UHjahLPRFpnUUby40ZCwHy4JV+iM5BN20XiudGqLhYrpr/WjXYXVT+sw8lfvRDh/k/v2XMZof8gE4upsnNg2+ymrg02EkIkCJdH7l8K/D5Hwv8uc+eYDhvfH4M1LrB7337Hf7ZH5zm3ZuX0LtO426iQkel5CUqCWpqCZDeJWULhJIpUtzWGJLnkrcCmBJIMTKMg49ALcPS36cgE3pd8PrLz3PX4RPk3B0IPmNQ+iDMcsf30ueJR7/HZr9Ap8d46s1n+PpLf8SFj/9lUgyMZIrB2i48tPsCx050HHvyo9y5PueFC8fZnx5ls59A8sK81EpUx38/9NBJHru9w1fMCJMpeb6DFG8SylgO4Cu55Zl30pFbMqHnE7j6u1YjhY5astvLrHqeBOIxzqLYYeOru09x8+phPnPkDc7dN5LWrvIH33mRhw7dw9Ub1zmchFsZrsYfYpJ6dstIl6JPLCVSpTJkD50ZcqFP3kDUsuC1u+6hPzry2R+bML50ni/KhEly0bFG3CVRaM4JL5xLsdawCLU42KXXSBdXeFvQQRAyoWqLrfX8lBjCQTSzqivW96ZnKJORo4c6Dq9vsPVq5sbOFSTCG9cvs3F0k0makZf7zmywTM6Zo6fOuU/85hVC9aK4mFF259z9yKNkTeRxwSryuTbnQowTT34VHMxjRpzh4mpRX0AN2d1KqaNLijStQJ0oszsXmQ1z3t2HsH6Y2CcqPaojgQnVbrO8eZHtm+/wxNErPH52wfL6JbZ05HvpMb7SneHuL3yOkAcWuiSgaB0ouAvGwxvae1gHpAkPVWnncPLnqYBKc7L4BO09WWtx772W1mW3d3ultI9TtIwIkG2BWmp5Cs4RoLllJChW9xHxRFlT37VLLZhWqi0I0vuztLaslUyV6MAoc8tewRyc1dbksU2nfEVZ0BT8+x8imgsd0ff76vHgIXiok4jnA1AEbXe1BncHWKkerDVmaqgEMwaDY1PDcs+hM4+wc+PSewXAznzB1tY2dB2bedfH7CthXBM4rMahpRQIyjhmYihIeG9NsILShAqBwlj8Uk8Uz40whRbQU/G9vjOZ28C9CNrStfyBO9KwZt/FBlNURt93mwsjcm0HRevuo8TmPQ0weFqFe0JdSuD/org1LCQXr2T3LlPtgDCXxwFJfvhQB2iHkVaQ6N2iBo+QLeq2KicbBpqbkBBobGxPGxNPCSFoZllBzBPQ9k48zp/aI3zxxnmOPf00f/1zPRt6nb/zgRm3rn2Vo9unyAg19uwPS3av7JImC44+8SBXXn+aS3fWeWb/NLZ+vKVXCUMwpFc0u4e+1tFpf1IRKeTstrJYKxJphYvbq0ophCTosGjUR/XqtRSH34iPr3L2rqdLwpArY1mSUiLnwmiVSafs3Bn4q+/fplyZ8vU//Q+UEx8nhczxe86Q/3CHrp+SEYZaSN3Mvz/dBBMFxhYi08aBWrGUnBeAT4A8h8H32TWPbUXgP7NVF2lm6xnm+2g38vlPPsq//967vJYfoJ/0lAo5ZwZVktG8sy4IdaS6YrnlLExnxM0N/uffvc3yn7/IJOzSx44yW2c+fZhuY5P+aEen6ra0oNT5QOjdsiSj21NdSJm8eBZzL3FMaIjIuHTFsAgafXLVhQgl++8/m1JI7N+6hmbl7Mktzh5K6Bv7VOvp6Dw6OWeiKOt3bfG/PXOcvxa+yeahFzh34gh/6/3CL732NK8++BHMlDVRPnPpV/nYfSe5dPEi19/8Fi9vfoo/Cttsrh/y4sg8+CYIDHmJdh1Xr7zLqXyIcTKyc+MWYRhJ7ZRV4eC99NGkMQ7De+9JMWqsjfLpo1inxBtJG7OjZpDk04QKrE14NX6YV26d5czu2zx66BaPH4WT5V1uXF3wztqDvDB2pHvvIhSjlspQfbqCempgKUYxB/Qsl4WkCU0zppsTfun3b/OJM1/jgekRvrS8xBgPudiwFfUAvRnz4iERMo5YxUe96o6AmpcEbc2TKCRBR9eCxVopKTU72UifvGC2lma6duZe+v46h+5+jPXpjPd/+Bh7m/cQcyaoEVOHkX3SmbNPwppuKCZhyKVBYBzFHFVQ7UCUUBJFhLrIxC6QJpGhDMSpBzQN40jfwFslD+9NPAW32Kk7OxgqNttkfXiHj974fc6dTKyf2aIbBi7f2Gcn7zC/M9BPC0fW1jhyXPjOhcus3drie1eUZ27dxztHHufkfe/j0JkpQQpIpcPXIcE8uKi2hk6oPoIobnH2DtdV+oKCesS1mPi13fRe0oShBxZXaYwZv/1bMI9HZo/VA+UcCOT8GAniq5nsDqShWnMdFY8GqE5o7LRQLKJMkVq8kVU5mEibBAIVldxEgcHvEfNUP0fCGckqozSLvHRo9nXxoM06jKOyiwSm2qKdi2GMlAaNr0ijFI6ePhmglhHVyiImYtiixgk33nyBofH3ffGZAju37zDk2+TZBmEKoxnOHm8ivbaPBVoEo1egiJORApGq2Tt7MeeQK9SqZFGsLg98nCag1T2xdTVeA9RGh2w0Nb3V4irL6PVYNQfc+K8TujJ6yt+Br7lQTInA2BLQXKC/sqT4LinS0L3miXpqrXpqlrJa7eByd+u/UlpHFgNYbT7zUrzTtNVIRw8iX4lCzq7QRd1+FlKAsTBkt4gIRihCMAe86LF7uX70AX7+zpJ45GGefv0Od65fZPrCBR44u03orqO3Rq7eyRxau8FseR8vvHiUn7rvMvMbv8xr/d9jvw/42sqQYq5RUFd+awyeTFY8uYtoDFLapEWYDwu31lTBkjJJrsKvln31U4sr4KvjmkWUoIUhN2eE+ucZUmSxWLIYE9PZPiem19hd2+CRD3+Y33hlg4SxkzO7V66ARNLMUa01CP1khpmvi1IF6dKBqrzaQMa53qbRxUplaIEiSuyUcRwRa37dXCH4gRC6nr7c5v5Ta/z6l48zWz/Csu4Su94tS+aOCgBNEQ/yMuroE6dS/O8eENKRU4S1Yy5s7aaEXNhcU4JW8jJTRyFEIS88VWwSJ65tOTicDCQ04E9pnWTEGKmdO1EChlgCCjpxFXQ3m3mgUDC66YSuZvrdW3zncqbb3PI9c54T04wuxCZAzZQT9/HzF+Hv7n+JY7twfP0OP3vqOv9yvMKtdJIPXPg9PrF+iVwOUxYLvi2f5Ou3z7C+vYUl74I6YKhuvU2h48blW+xNE9f298mxQD9DxjvQxGZGwdSdEXksjbtv1LxEQyDE6OdD8XdXolMtTbx7DimSqlA0MYzzRiqMjgxfO8rFjbO8Pb/B1VdeYXs90m0dRY9sEycTpklYlGUTn7lqvBZr2FQ8Mrgl9RVKO+Th5iMf4NT6ZcZB2XvrDab3fKDlwweSik8zsmsKxnH0CO1hcJy3lJaB0KBcscfIZOlIxdegVT0BTkogdM6sMJq2SgJ7aZ1nv3+DcusK71zYYXH8Z4ibRohAU5GPpbjfvEX9eiivEYprjbIV1yLkkZILucV8xz7RacLi4II8q0w0sGzpikkc0SxVmPYzhjCSl+6vV/WJTqmVKks257s89vIvc22Y8Mo7a+wxkneucu4uY2Mt8M6bI8ky6+dO8+bFyquc5vi9n0COnSRk5aTNUYVYR2rFL2cymcyoHhLn78p7E5YQmr23Zv9nc5peTMFV95Yx8XWyCH5ftPNbw8Q1BCEcrGbzanVBQbrYXGldYzxkqkvqUK2eTqvB6aiy9AKMDqGtq3XEqkJNjvSVhf+3mgjVQUGGoqH3qY1Vvzdr9KIDZdTSjO7enAqBFAJWBxSPQ9cYsLxEktN0szqIKeHFLdJir6UFWxFcD5BHIsZ4/s8gBiaHz1L3998rAHZvzTl0aJNA4ejWScbdsY29fNfg9K6W8iQ+ulpdbrX4qCtnFy5YragtGfC9i4g4ucvUKVplZeeqDpgB78apmLolT2pGgnvvV+NQq/5lH1uYTq3+ZRGp3kHURoMzc/+mKmYJJXt8r3hspI/DR2re95jGuEYI2myDPUhbFFYf+9Eq0VCkXeQVC4FU3XeeG6zFK9UWo9liN03ExR7SYEqlNkR6y6UOwT3QwS12zodyf3HePs678TT52D3cHIXrqfcv+dTY1QtsbE6xdAx7/5M889a/5qmttzj/zK8w/+hfQTFC6ClmnvYX3VpSK2CGBaWLEYvQx951EY0YVooLM1NojHQUQaBWUkg4g0dZ7t9GNTnghTYS00boNpj1HfNi5G99A34kUGPkxmuvIif/BrVm/sU/+t85Np1illz7EaOr7JsFpOs6ZKj49zpT1G1+sfGurVlqpI28tOuow/Jgf1zriKZEXi78EqwKOzss8i1en5yihpFpv4apuVIYWO7ssuJnm3rgSJoE8rKlYWb3HmsYiBE6q2hZYsGIpUcnM1+vDHPKkAkEUu8vZ4qJXIWuCwyLJUbGojtVevGs7jEbKUlL1/SUsvWjJ1jrJsz391kuBkoZyGWX1Alx7w7bd28xtSMMby1JiGdgDCOivmMGiH3k1JnH+P9e3uW/nb3J9Ttvc+TINT67e5v12XEeu8u4daNnAfxg/XG+XE9ydOsMKRVMfdRdsgGuhZAKk+0TlDtzzm22dDiEGqThqMWJcPiOtguuEh/N/EBa2YGrIJO25qmuLLfqv4+/bK4nkQrZlJoLfhwKGvapEY5+4DFmaxtYzUw7o5TMshWkORdX3ncRNX/HVZt6uqzSTAMhKItxQVc6Dp98jGef/WOSPELOlY2p++U1JIII2QZKznSqLHP2MCrM9+QrNHi7ZGIB0eyus4nTQo3cQtb8c+5jcFJgHbG0xs7maU6c6zj9oHH5uy/y1uJhNiexkRo93tnqysa2uii9QFBxwVduMebuhQ9M+o5afJQaY2QcstPqcnGUsVU68WCoXFxZvnKwWXXSqDsjK6wlnnj9N3ns3spvXHg/ex/4OAuW2I1b3JEpopnykZ4QAt10i/IgnKij20CH+cGdYFbIFp0NUwe/I9SBZaYB8x1yc/4417/gq8GmIXcqbrN4Y+KOAFpckmiD6szb8/F/57vxhAZffQkg4z6iAaT3kLFm3QMvTqTsozqhWOM3HEwVJtS645+FCaI9UQuF2H4d7gaoGYsTas4k7zahNIFfXTkcMmoVsZ4MpKkjfztJLM2LTTFBQ9cE+dV1N3VxYJ0v6pkycUUEFGmAu0IYKoce+gR7165w89rbrJ+6570CYPv0I0zDgrdfep4tmVJ1B6m91xBt/2/mqWB+QQSivhefWSughSATLOwzLLN/YcUtE7l6/nZQx0m6MLA2hX1F2xrAzEEzELBxbI4oa4QnD1WoFEquRHESXbGW990egoYV7OK9A1BsaOMer/qszEmhw8rgD06EKP1BXKUng7ngykVM5gIzW2F/s3vL8emAqLshVpY/Ky39SSqjVRjaqsRWFsFmRxyzB1yUBUU8eEnxRDmREcmjV+YTw+oeIXZICqzdfRaRQrQBCSPfOfVTDK/+K+7u3mL+6tPIgx8no5j46LpiaHBWvQuv29rCAtJWKMX8iyMiWC5kgz6mg8/EVA+U6aIuZnL1TfAOoY4H+8wshZKFDTOO59e5dn7BxpZyiQ10/SSlCzz6oY9w/fnn3XaE+LM2X6+4gro0SxItNKc939I6OqmIdBBpYA072Nlb9eCZUkaqgNIRMA6vbXHpxsBgiuUlyxSYqCd6zedz3xuar49qKVAyEpNjm1HGYeHe6mF0IleMWIDUTygGdT64SrnZzIL6GiuGgI0FrBWAVqlZmJ4+yXDzKkUjNszpKtRSmaxtsX7kkBfdFYalFzYpuf88EDCJHJld5OK7+zyzfJTZdM13i0k8Ja7F/3Z9pI4VY870gQ/xj5+7xj/4wv3o4g6PcYm333mT9OCPcP53/hX7j3yB//fWKda276LUOVq79vk7VTOP2ceMKRIqHDl+jsVbF8hylXz4KF3saIHfLuSsuYWTjC1WOiDia6ZsqzMhNAuWF5aOEvPPMYmSF4uD3XmM0UeHtbAcq4uz6hIpTXPQr5G6njwsqGNphy+MOTOdrhHMuQqhXQ4Vd8vkXEkpMUwyX//D3+fus5tMlhMWVBgjKcQDOmeQiAV3GiV18W+ptWHCfFqkY0V0oKgCwUN8zJCSXcukbT3VJTRXrItoHWFrip68h+H2S7z69kvc1X2AC7PONSPtjBEJrsEKitYWTBOFkoUombE0OJKVpo1Sh8vgqaGlmMfKjgMlD8ikp28TwpqrR5WPmdB4JGZCHvcg9VQJnL7zA566+zzff6tn775PE/rMhHX01ITS0v5SdQV6zXNErRmQ8aIW8yK6gqpncgSrbZDddGD1PTubi/wbzh2h2njwLKhuq3SluF/KfraaY6ilrZjUg5hMA5DQ0HRh5uQQlSVSPaa+ipItkUSwsmhj9dZ4Bi9UxXwNWWxEm4Ddb4PSxPC+nkZK06NVH+nTkOEloOqXd8VdddTaWBF+KY/t/tOohBqpjHQSPdgOSFVcNKuxPbniGiJ1u2FohV01J+RuVmN58Xli2kCJbGw+8HMHBcD6kXM/d/nFf/v3t47exa26zyTMyTL1FzH7iNizrnMjk7WdijYvPX7Q1TL6F3Oy3ka1zuWPtbjq17M4cSu3Yhli9NAcERf5mTjrnYpXok08KA0y4UnH9SBmU8wOQhiCBMQTf1q6XW3ikIxUnEMt1uYPfsFUqYQqjLpsl5uLsKp0fpA1YmE0YVSBRsDzIr/grMfGSqB1wXVE6+hfMk0uZKku/jqwCAp+SVtD+9amibCK/+aNvRC0EezAf0V1UUQrMEqNsBb5/pnP8rPyTfqdr/PdVyL1/qeI0RPXYtNc+DrEFe8UV7cO1XfQEn1q0ceItfxqa0JMVVenr1wbiFCmU2dxN9gHK3++VaiKMbIY7vDwI/dy8Y1v8Mr1C6R7Hqfb2Ob8xRu/zOAcAAAgAElEQVT82F/+i/zi62+TxgEdRzDxL2sBy4bEhr7F2k48oXVoII7mBW4pgM7M9+mOtGfnKGAhph4zYZjf5uHHTzLO5w4qmU3o+ql/96oxm83IQRn3/DtHaeCPaoxNPKXqK4aUwsEIv5oyjv4Kau80R8bsauMUsXFgnEMKnnuhnSF9Ynb0GKSetVN3EXJh5+JlZofW0M11Upy20J73FL2ARzbXwBQlZ+W+8TxH7jnCpbc2SHWPQsSKY0qdwNYuhqioVWpdsPfIJ/nVp/+EHz11i4ce/gDd9BZvv/ZnzD74l/hHrx/n1PHTZBG07wgiLPbnB2u7LnqU6bCYU1LPd797gxPH93k43eAH4zZBCtPTdyNlYHn5qk+FRnNLEzjJEDl4n1UKZt6dp847NDVvPJSMDf49SNEP39yEw3WYe5GWCylEFsvseovqtDk1Iav70VchPsOw8PfJn2TTuXSAus02F5IKH/3pv8ntYZe1F7awECEFch0IWdqkS5qQ06cUOUTXxdQFBOcFpKSEHJFYKCH5JFAMSc4TcQFedO2UCFr88LacGRbGYrpk+8xDrKcNpjojTZSaB1Lq/fxYWY6DMmAkR6x4BG4D3KR+ylgGgvYkFZ8tiq/6Gm0JaWE93hV7lsgyNxy7CtRISqC1Z79W1tnliZd/ndePnOWLm5+kmwrt8G2x0W5PpfmwgowHXTY4Fc+5K6UVedJWu2ND42YvsMSL+qDC2NJftfAeBlcCSc3fXev9TIKDdbUiVI3NvaMUU1/J5AqhUMtACc0tptXftWq+pw8TBKOWBUohafT1YioHQDrq4A2VCUh2e7p2YL4qDuJ5ENUq5NhYBd7oFpKP/YufEbVoe1c9h2aV0WF1le2C8wXEu3of8bf3wKw9JwV9T9wuYh48FZRsgSod/fgGOo3sXH2Dre0PQNx8bwJw5uEv/IO3vvW//P35slDqLtt15GJTK68gQGatAvdCHavOPLca2l7GRUu10qYFiuF0JAkJqo+kVnnW1dy+YLbytDslSlu0rzVVp2py4WEFZOmiwOoqZCvVWc3j2C7ggsmkCQpcoUmpLee8UkObaqj4z6/RFUgSoHnpvdtZ7YlCi7tt1r7aqE94FSYSiV5KetcexTnTtBG1eCVsox/ePjXwsXUuBY09tWZKKQf2weAuEc9eiLEd/g7SwP+psfiLd+ahopph6z7++O3r/OSh17n62pd5eTZjcuJRuuTlrq7UseI2RsU7ZTWf8qxETiIGFoniivraqrHQJh4WlNBEJ1kdKhIssMoxsOAQEavOBf/eW1e5lzmPPfkE318c4fpyj61ZZOfOgmRGzvm9JLNlJnbi+9TctAfSUYthsfoPENqUoizdjlorrJ6VKFXzwRRDJEIe0eqj03GoHNnYZissuJO2WY7FhXbieuEQEkyFYTn3rt+Mkn0KwOogov0928UcFIfqJCef1eKs+6AeESrmICYlUmQkbW1T+w6Z9NTlAq1KXSw4fOIkaWsdzf6SI++NkleELxMIkhjqkjzf5UMnCvs37vDu0pht9nQrwa4otVqbsvm6aSiVrk8c6oVvXH6CTx/teenZF7n9/PM88Ml7+K13l0zO3Eekc/UqmXFZ/iOHS/DDuMU8RwLxg09y9uY3+PjyXV6dPU43XWOyveXpertz6nyf2LtmRPqetD6j7u5gK0FbawR8beMFv5hrh7ywDnQxkBUYPLmtZiejScD5C9U8i0EqeRyJqWu0RznoIrvQubK8S9QxH4iVV6CuiiAB+t3LvPvMH9CdOs3O7iOkWQctujt0rmewYWy7d19VaMG7SzzkLARx0Jkqyf9wp9+pUkIg5oLTEFoD0yacMQiWl9y5s0s8vMZk/RhH+ik7r7xIeuh9aJwc7HlXWKhSSnuv2+5Y8Pjg6sLnqgmR6pn2bc1QNRFaxyztjLUQSckbsR5lWbMX0dWnrWMKbO7v8lP8LmX7JL9z+QzxE49geQ+akNrMMbw+zStYcUw7xe1sfkG7Jc+BOxFR/9ywyFgyUSKQKUCv7lAKGqmSG8DPix4zt8/5A/SCxQFEvk6ydjZ7jkYFHHDkK2qf2AYxP8+KX4MSVnTT1qkrmAUgeDM3DP6zeP3o50+7P0zl4CKPlAa5cqs6Vttky7CyJETBrPN7rgoqvmauqkgRgjo5Upt7zWOX2wZDvCVCoNSMaoIWPZyLW9StQLLaOALS7qvI4Wkmdmfpt48x3TzM0TOf+wcHBQDAa89/g5NnHqXGwA+Ha/x2OUsIUBmb0KEp3y1jVDzpLYO615xqLC2Tmjo+V0glk1UdekKlBiXk4F96RkIQxuzj8moDmsBqJFdlIiMZB2w4H9/HkLVmT4crBa1CrUvS6H+Oxgm1LH2kSERtQV1melWvTMMSjY5zdIzuKhTVHzgiqCTEBtAeiQk1r7xUvRut6pey4xyhhpYkhbTUKi8IkIrSUYcRTUalI5i6sKwKsUtINky8YzGzNkT0VUtd+TlLpUT3jLqY0b3pNlpL2RqxbIQOrp77KL/48j5/54NLTl/8I7557QLLx3/cA4e6TFdc+auqmECpS3/pXOrsD8IjD31MixGsInX0CGVxNXvOHk4Up2tOA2tjVUphUTITUaaxY77Rc/b0Ue6bnKbbSNh4ko21Q5y/foHf++e/QLeEkHzUs3JV2GiEvlIVYlXquPC/99ItPqaePqbinIYggdolV72qoiMtOTBCzRSUGiv9JPAfnnuXv/fJwg+tJ740QjdLjMPgotAQ/XmGyKxLLPOSUPwiJihqPg63cXArXPL9o809VQzt0SqkaFgpsJd9hBrN47LNHSqWR7qhsCyF9fVNigip7wjFLY6ete4XDFWxlqomIiRHoDPtNhhkj7y8xoV6htJtE2JiqG5nikGhZkJoCNvq0x6qYKUyO3OC/+Nbu/yP7xfu/cIDvH3b+HL3AIdqJCcfaa9G/4qvqmIQ+tT5uzNZZ7m/wy+/bDy8bdQ7P2BTP8jOZJ1+ObLsOmanTlIuXsT6SCAiqSNNpgdIZlN3y1hMMAzYpCfVgOiIp7aaY7oxj6AFZrFnkRpjIxesM7cOCqTkLgovmJqFlHbJBehT7/HcNJqbORq7mDkD3nrObczRnciFS9e4zhGOjktCCvSqDbFaURtZjJkkkZIXvrZSxSSSSjnYW5sOlNT7dEuUkKK7D/qJ61JC8nz55hioGHQTDt/7ENfefZnx9gvM1zY4feo/59Zin9B3RKUhwPXAZiwlU9vr6w2jQHCAUaiC1qWfKdUx4cTg7jrx9RISKGVJxVM5qxnrQZlLotqcEid0117k2Pd+G+4/zp+Op8l/7i/Ql5GR4DkI4qS9lc5LbaXjcIGntUIL9RG+amwtlBKc1uVT2aCQeyIVi4KMhsaE5FWB4+FSwQQ0ob7/c0w6DQZl/t9V7wrc2lhdo6ZS3ManUyi7dCiDjGCJLBCZNfFtJWsC9XTZ1GBr7yGPO4yxTWP9Z+jNI6VVCzUoNXvz6J9Iu5BTgJpcnxRoK+mVJgYsuBMmUIj+L1xgXz3dtpjSq6evWlCsCBIMVnoyAsboaGEKJRckVrL0HLv6AjcWrzBZu5crN7+yuvbfKwDuvu8R9m7PkX7O1m4mbr2fyghdB4Izvhmp0vyRFN/d2wgkqg1EEe8+rKV7icc4BqVVm+o7EdzaVVbVIr4/XqnrQyNBFWnpUSUj0QNequC0KOmoMWBlwmBuvSnmsZ1VFTVljGuILdmvS0KaOF/A/PKq2qHao1IaZyA5MzkA5qNBy/73FfXLRqpnfwVzctoqDrhiBw9S1e0/btHIrjomIrX6ZXqQdxB8HyTqPlJ8R6Y0bUNZpaZBtOSM8daBWmmRuJYdLALkIsQwsnzoc/zKxef4S7OL/OTyBb74rRvsPfYj2OZR5sEQ8xVJNMHEL7XlYmyVqXm3KpFam4ARI0twRwYV0URFXZXfnBnOjDCMwERqC0qZEV9/hnHvLbafeoJnvvK7zM+9j0rhpa8+TdpdUNWwGiniqmgAC0YeK7HvfKTVJjK+TmnhS+2g9UmS24RCl8jDoh2MrlgmuA0LSeRSWGweY/30ffzNUwv+/ZcWTIOhXWS5WFKWmUnqfD86NMpgdl96UPdwM3oxivhFamNxcmGXqIuB0ENetBjt/1gQNq545JXlnX1kGolDYHn1KuOdHZYIG2fuJk02W+yzOh1PV3vO0Ky4gcw+gxmP2nm6Hv7NGyfpNgbGZWHS9weeewegjFho7PgiZAopBmYhYvc9yhdfe4m/cv+7/Nb+p5lu30MO2QV2xbtL0TYK1kipIKXl2zd89uTU47z19rf56Cc+znPfeIcfHHvYBU15QRZFN9ax6vnqXd9DTOihw85wyJVgLVo3ptZ4ZQSlBiNI56ueIZMa4WTs9CB9LXYRWYxMpjM0GMux0JkHjhEDeRjQUgktZGu1Rkmpb1oVaYWiW2ALgR+6/Qz9xhrf/f5t5MwWs0mkFENDB40Wh0aiVMaS0dBRaoZxXN2+YJEaxKdaAsREZxWrRl8Ui5nUR3dZ1YEyiAfjiOfd7+wPEDJ33fcAy+WcnfEV3tibsZ4O01uii66hWq1lJAbf96t696wjWpVIRWWKxdAE1u0yzm2dVP2sdnuyMg65iYeFvRwgKhbXOXv7y9yz+xznnjzDb7y5zfwDfwHMJ39RfWxT25RohUzHHElurFIV5eD5izqEx2rAcm4x8+rF8ujibVEl5xGiUrILhN1+rMSG711djkZwuJkaFEG0YDWgISPN9pyBqBNK9alDYKDawIjzQkQdfERKbWVhiI3+e4tHr1c87Enc39lw2gskNJt3g/tkBCnOtXGOQCGXlT0zYloJ1YtcVQGZIqJQXOdj5mdgsA5jQKpSrDnGdCCbI8WF0eFGBMRaSF4wOmlx7ijqhCb64RrHZhVm93Pjre8TNtf+0wJgb4iE2YzFrRt87Mkf4999f87OtPdOOwqijtWstXin1GwRKw9/wMdyQ6nN/7sE88Qja+ITFdBqDDa20YTvL2oBrbmxpVuakWRC9S+UULAxo9FHONatUVd2OxXoOiclgSspC+4rDkrtpsiIX9EasNwUn6btAnGRVi1GkBlqSw9pER+XUb0+rwRMMlpX+1hfQahV9y07L4KId+0rD6tnVRcCgdr1PhqLnfu7Uao6BjlYPZj7qMKKMOiK9jaeZ7WScbV4KeqhFcFJizULKQ7Mz36QX7w05YE73+FTp/e5eeXX+cq796AP/EhLEXQvdDUhRSF59UFhhdakQZ+a8KksGUoldlPnUjd7ikNyXGwyLHFIRYTF9/6Yh7qRx9ffZHcoyNpRwvoWG1n5/T97hje++TWKQZokRM2FR6X6CkkVtUgdB+/gDCdgWQtoqsXZ1zG06ZNQx7GlAwqhU8b54oCDnfrIuByIfcdhKfzr33mdo+VVTkzh8ngf0Rx05SWtIU2sI+IimzCZYeNIGTMpBGTmavRxLPRTpWSfNnW9j+oCHTG2tVl0xY5q8cOyuli1LAVb7CLRGBY7MM8cuv+c8/RVfdtlPqKUGDCUqu5p7xYL9vcyD+Yf8Nqlc9wJU45PEor7wMUqISrEwHKEKNX1FFL9nQm+RthaD/wgf57/9Z2LLA/dxawsQVIT0gby6AEiRVx2LSWjKbIY5njoFAwSePv0p+if/Tf86OQRLr/zZW7c/STT6JY3Dm21rjj6zzT4Aa9pAjFTFpkQ3SeNOgMhVp8OUAaKS+uR5LNNbdO3WefQpq5LnpIoRq9GUsd1R4nUXqnDormDYL6374LYlTVYlarFV1uhI9y8wCMPrvP1F27wjSOf5vDEVxNaC6ELyJhRMUYb2ipI0OXScwAs+tRBjEqhs9YoiI/lTSMhGkXbCDx7wmqtmaAOtrGxuCtHYOvoYQ5tz9i/eYP7r36dB6aBZy+MvBofZfPUvUQbfU2TPXjIzCd2WgKaI6UTpsAij1gXWpBYdnKrqa8Hgr/347BEJDDVyqCRypJiyvTqK3x+7WvYnQtcmz3ML908wvDDP8rakJu7QPGM9Xbx10IR7+p9ejQ6S0Z9mqUyaah3vxRFFaWNtHSlufGpgZW5n4dDIVrHWFrKZ+iQEjE1bBzbtCxgskCW7qoxi96UZjAbSGHqK9M8R+LEl3F5D8VXwhRBih0AdnyfsXQnUGtoU82edaPBT+G2/vNE2EKxkcrEd/ptR1AkEFhieWgH9xSt1c9rC23kDDVYmz4nMgtQJTIFcTohoj4RruYuteJaN6tzbzBqQSyRtUIuThSsbdUsAjlz73ALqjAOdzh6/+Ncu3btPy0A1o+97+eGG9/7+5uzNW6++EXOzT7Li/kcNbri3Rc8Lnyp+EVu3iL4YVsr1Eooxbt2XHCHGLV1QEZxbjHBf725q8CkiefsvYhEKz6qj+J+4qp+2QYJmFVHIaJEy07Xi45+LXlJFGOsI6LJ9zRNiEPofdxWFoQ4QeuIhN739+ode5XQIn7bBa80f2bLDmirA1vxCFY3Mz5Ws+IWxmIeKapNYGNSKOMOQXsfZzWBn3MDzF0CraOWqq5fCKnxDXITiros1rUKdnBZSzUsahttekEgdz3KG0fu5erFb/PjJy7zd+UVXrka+NZig8XGSeToaQgdY9knIPQx+BK2gZ0KjpaMKSAyxeE/QhecdiiNf14sYCWT9m5w6PKbfPzEG5w4d4NhgLevr2ESuPD8H7GZlBvLO9xceGW9tuY2QSX6iA1DqiuVrboF6CAZrrjrIJexBTBVBCWIMtRKFyM5JH/PKnSdCzlRV812/dS/e8PIb33vNr/5P3yMx29u8A+fr4Toe06/8D2hrtY2QI7J94lBSdq5QEcjZdx3U0gF0cikd0aGJy76GK+iJA1Y8r/HsrrIrFQjSCUkoSzn1AwpdZSsdFP/XBuo9CAop1WqJCL73Qke2/ldfujsNf7xDz5Ct3aYIhxMtla6iFIKfUiUklshKcTqKZIVo8NIaxvUySazKE00CyUXxyGbx6YGz+KmFn9XJ33P/0/Ym8Zalp3nec/3rbX2PufeW/fWPA9dxR45dIstUqKaalPiIJKKlEh2FER28iMCAghOYAc24h8RDErILwcxYMMIJMcBHMu2LEuWrIGm5BYpcRbnoXqeq7u6q6u65rrDOWfvtdaXH986tylTRvoPh+qqunfffdb6hvd93lwKVpWVtOAz1w/wVw7fS99nfvbSC/xafZDpdC+x1qb89+K11kIMYRcR7Gr06F3QdiGkhXf5uBJdW2GONnCK9m0KZ1B9HRT6Zdi4i3eJ0a1XIo6DblbEXApdnPoUSQISzPHYtVLLDsP2nL8aHufaxdd47PLbGI6f5cBkgjASYoTRHQ1ZDDWfHlip5D4ggwuKU4Yy6YjDjqvdk4+oFUN1cLGjdIi4gr82vLRICyMTQyVCD9Mw5ZWXXuPCK3PetP08FF/gQ4fgI/oaj795gCflQWYH76KGRNRMHBdNPFl8jGyJmY0OcCoZ0Z4EjFRMfRcvYiyKIFEpCHMzdHaH7s0X+J/v+gqL9YHvnN/hPCexcx9ATxxhwggJZw6oUk3bqsqnBzWPnvcQFUoE2kokK0R3GlUZCdXcRdSs39UMiQp1StUZjPOmNUnM80hsAj6ftkafAIbaVobzNkUuUIOffWWE5ORNP9M7RKvv8nWpL4uEMWPBJ8nYiLKAsXXOOEhKFbL457yWoYmiE1BBMoWE4BMcyZkktWnL1JWZwTVuUn1KoTW3KWWgBGni8IIEoVb//CqeshstuGvCBnfQlAElkfEwKdUJZjNfIRheSKHUIIgkpGRGVjiUL2AKk/XjzGeb7D/60K98XwFwz7v/+1/+7id/8RPznNm/vsHJO5d48sBZf0kJSIMsULWNWfxSq6V4V4P5g1DfdwRro6Hidh1KbcIfo1ShRvWJQl7guyLv8IoJSYQsgsnYADARGBoYAsge7TmGpnLXiY9O8BFtRujMGK0gJYD2MN5C6wzCalPLFuAtb7B31y2JUJRcvKP1j7e39xYMqdFpe80GqdXJT9LAOyrtRYk+dYhWdu1A0rzMMXlVPK+QzIlNuxqA6oWmRPUY0brwg6GNK5eWuVKyrytwS1GywFiMLlTEWuc2Tdw6++P81rVXOfzsH/BD+77ABw4E4rzn+WfPcXPjQW6vHaCsr7OYF6Sv2JhdeCKJEIvHVYphauSiuNPHGGYz4vU3eNfGHR7au8lQz9MdK9TB+JM3T7ATj7FYP8Zfv+t1Knt44qu/zWzFeP+HP84wT1z78ufoU08RZRjnpG7iaw4RSi0EkjcZ4tdpyc6Xz+ZhQVYKJRYSSg3LFEqoUTzOE18JaW72mlrp11bYjhP+4MI+fnT/Vd6/V/jK7BCx60lNhBW6jrKYY7GjX01MJ3uY79z2KOrN2zCOpCDk7IVK6nx8XcYFISllNKw0D/JYvLDUNSZR6XRKlZEhj5ROqfOBtdSzEwxdX3cVc0PEakudlC6iczAy27nyvp3P8zNn3+AL14/zXenZCOr5ErVpWYuriLuud9tXre63T0oXlEUDQi0WxiQlxqUIre+oi3E3KEtyda2JOVMBwKq4PUnV1dQo6cBe/uDScX4kfoNzd5/io699hs/Gj9Fv7CeWOVVGErF1wkauLSRLMmEYYBRSErf9TjpK8P2xhQlWC8mczpkFUuiQkJtVeOFiMSKFgoREtULsIkHd8pql+Jk0jizKgMREZ0rXR494jh3blrhv/l3ecfIyn3t+g2fkbZyOA51kX5MxuPZEfLKI+BquCzCrRqkDnRSyJTo6z7WoU7Lc8RFtc3+IVegNDw8QYuxagqUXE9L26P18xhbXOXzgOCv7lWdePswX1u/h4Mtf53S6xF0bt3n3ymW+8WLHS3KWzYNvQ9bOssMIU2Oy8FQ4IZKLMNHIqAuCdIzj6AVzn5xFYYW9t6+yNtzgXWcyZ8NFPnvtWR67KOxM9/LN9Q9y9P776eMeYh6oMbZ3QX1lY77eqQhWcrNzZ4QVVBzmJWKIliaLisSy8MYxz5CoiE0wHfzyZoc4Li/fTKlCoEPKSCUTq4vKCR0iHTVnB+Wan98moGVZWCUEx8zHkqkpQvF4n2yuF1A8NS+1FTQiSPSpMCT/unHQUqweYycMLLs+jYZZBwwYI0F7nxygBB2xcUFQF54TPFcgyIikTM3Zbcy4ELs05XqU1P4+basWXNAuBtn8TlShCJTylqOGGj0YqEGHhEC0QiZwRO5Qhm22rz5Nt2eDU+/7pV/+vgIAoGjkwMET3Nm8yA8ePcunzIiNjUzxsU5okA6Jjv512l/dtaYInpBXlvY9n2cj6pMBzEffpamUfSXtoxYRlz8VDA1eMeZcCcFHIGZegddG/SO3caW4lSNEF0vYOLgIpUrTpQimDpyQWIlhxUFAITQ7kriABdkVS70V6+s1mWlFSqVG8X1dGX0H514tH83L93w/xf+cUYqr7JtIEHX1vTX1vY1zQjYylSKBqJ0H9ai2EVp7vq3rRx0kpC2QIgSPRB2LEbVFqtLGaghBRzh0gkv6M3zmje/wfp5jbx748dPXeO3avyetnuPi68e5ONnLzdkahQOESc9YBuii78hCIOU5cecCOgjr42XefWTGyvQ1VvNV9pQTPP3mjKOn9/PF19Z59cCjlJV97O+Nm9e/zb5Da+zbt49xZcqrO1vc/c4HuPzHn6SuFHQyaZz85g5RNxFJcRGdFNvlSOQlwa22vVup1BCbEOt79ozB1bmhZtdkqUDtycNAFwr//NMvcfq9W7wt3+Sbd4Rx32HMEhqnPrVZXUG7njjtGFVYXT9CrbBx9ABXn36WKL7bLNLUvxFCFfffplbMxcB8yHR7pv5+DZUdGZuVL2EzFx/OZeTo3XfT4e9yMWm7dwVtmRhdoFSlXHmVu+Q5zj93mU/Lf8U0TkBnVNsD4msJqtF3ydnwKrtjc/B9fmrdi1hgEHctgFDnHlzi1srawpFcdNsFZWxuoBQjUj3DHpSVWHhmej/vXXsOwhofOz3l4oXzXAjvJvVC7FewWlwAu0xvsyURtMFrmt6ijJU0nTJCI3AKZfSOsQ/JR7/SEcQLqzI2XUx1aFIpns9RbCT1HVaclS/Rv+9SW9z4CJ1mV5JfvsDHT17mjYuZb9s9HDpzkn590jz02dknOEdDyIzZc07cUucTH5VEb0pnA2NYo59OiItFawJbmNU4x4YRs0DXr/h4N7j916wg1Tv0+e3bTA+scOfqRdbP3M3BI/u5cuQeLk/3cufC1xg2L3BwuEO/eZkPHN+hS68yn32TJ7cjV7oHmadD2MQFgjUWKh2drrAYdxhnOz5xGAcObF3l2PgMP3T/CWZXnqW+Oedrr17k+duB4fCj7Bx7F2cPnMRShrzwi6iUdhs1YVvNrvEwRbSDBlzL5lS7EBzOU3Oh1uxEPGlEu+pAtqBzpPaILPx9swJhL0UzUgZCqFDmRPEwOgTUnMMhNrY7oTkBJFBqQWLynXnXQ2kXdvaY4Fp71/eUytgGnjYOSIi78fKOqBd3qVFI1uh8Qf0zvmS91xUUP6vHUrHgjZ1g2DjHLY4ZDRMgo+Yat1qARsnUSktWHNtlrIhU12U3l5wQWmfYmr8WvKct+MiYYxLI4o22qHq+iBhZK3UcCWsH6WJgsf3W+P/7CoCbW3fYk/zimdx6k8l6ZG6jj36TYmO74qtQGVzt2QAGFoNXWBLagdO8uyYNguO/rsHFf1L88AkNcWm2VLa6ziB6G4xI9f0fLa9ZfJxUJbqKvoAkt+DU1j5LTC7AqOYCEfylsKxozo7oAlfqV2lj+9RgEopKIFIZzXULdQlzEWs5Ay2tsNEO1TzRqar7i6saoQYXoJVAyZmY3KbmwRbj7n/WMpJrE18BWZpVpMUi2xKVWqAyuHBJJn4ANdAMKkSaQNJcPBYkNJuQd3WToyfYOXIPX5AZ0ysvsXHhK8TXH+eDq5G3r97gkZMTXn/+FS7PjtEfOsSFNwb2rkFXM+Ptm5w70330cQMAACAASURBVLGaRibB6DbWuLZ5m83FKq/MTnHtxoQL4/soO/cyObdOwt/Va1n4zpO3Oa6/xWjCzpGb1L3ZOdxHjpHmO5Tiu7pcFmg/ITFx6EqdIbm4W0KEMrj/XlPXxseJWgtd6j39cBzRmLyQEyGmxDgCtRCkZbDHCVGNXKacL/fwN39ynQe+/QS/+vwNXpZTSJyysjLFkrCyvkKfIrkWz4MANESO/cB7KTrn+vMvM1y7SkxKHSsrx07RH9zg+jPPsyow3xm4+5EfRqdTuq4jloxNOp747J+xFiKHzt1Nf+gwUoU6zFA1agnEBLUIuVRi49ePFrhz7Q1+bvyPnDmzxh9c/DEu2Tore1boxDxutDTFvlWGcfQOzKAzcR6EKkOpqFZibpqCRYPiSEBjZMxzcnEPczHBSuv2My60XMJWbBmWUjzI5NAhfv3l9/E/9Rfh8nf56ZVT/PNnMuM7HoXgYjGjhSpVgyUWOwRsvu0ugxgZYvBiyhp5tBZq6JC+QNeOxwwWfU8qDG7zDIqEvn3Wswe0mEGBaZyQa2FhlaiOXa1ibM5hculP+N8eTsyuXOZfvXSai3tO8Laj+zGZuRO44oevOXs/qHqaaR2xGBATbyY0ou0C78fMmO/QpSkE54RYcJu0qfv4/R31IyhoolomSULrSNm5wmx1k5imvPrCS+ja/azWgbqxQnn3h3lyZ5t0+SLIeQ69/AzH99zh6PFr/OA4p4vPsb7/CF95/Crn3vEwl199GVk9xM0rM6Le5sPv2CAuNqmx4zvPPcXrb2zx1OwAt7oTvLZ1jBsrj5IevZu+32BqW1Rx6mFVP6/9QHLUrBXHHefaaKm1IMHpeM548TG21ECMboWsJbeIZqXKiIbOJ62dUnOP5W0f2dcZIa1hUrz4NwEKkbiLipa63Yr9xt6oGcuGanVPf4hI8bvLor8LxUCia010ObW1RJYlYt4LeRFHyleCryCrN4haSnMWtPu487uwWCQkfKoBnlGiYEzbCrOSxFAZGjMlQpy0KW5EfcbpLqsyJ2nndvrY+dda273hYgZ351lAywhq1Jp8elGro9otEKqvK9a2Cl2cM84z8/mcUpYm0nYFfu//eOXxf/PLLC594sbl51g/cZZ/cPshbsUVRJzuFtp42nUbDhzY9dI2P++yS98VrFn7JOEdcZamWKQy5rZTVXYZ+tq4AEjGsnfMWq0hSQta34LP7NrvZEYZK5I60N6v5jqHvHDhiEasDt4tFx+R1G5Cmm8S88xFRxIYujU0JO9UxHxf33QHEnxP2kBrDvMJgZrb6KtZBX2NniCPlCbE8OkIdOBkwJjRGgmmjVaolLKgiz1Vgx8IDb/s6MvQPnv+LFJKlOo70xAcpRvbjzKE9pyaglUDZAvOjNbAID5StZBgNidfeZW1689ybuMyq51QN9/g/tMHCWunKbee5OY149ZWz74zUy7e6Xjj5i3S/ndyRaeEyQnCvpOkNIGyw2jQB19z5FrQaeL9Vx/jgT2b3Ll1nRe39/H8fT+PdpFPP/YFnv+zLxMw+r5nsVgQJ1N/b1RbDrYS4sSfQxR3g4ig/YrzzxGqBvedl4J2vU8OTLEuNBuba1UU72jLuCB2HTtj4MdP7PCxuy9zcjrlWy9v8a1rA+fLwyzWJhw4cS97Dm+QxKNqQ1KSOGFSQiSIcv3SBep8TrHKyXsecFBJqMx2Fk5RjEqnXgTWIGxev8qtF58lrKxx6F3vohu8IwU/nFqVga+dhE5hZzbAtYv81MrX2Tt7nW/Uh/ijVw+zdmoP05V9XiiXjJk5qbABm2Jsq4SujVArpBDRSU/NpYX6tJS+GH3NlBoRsYG7xJf/Xri2Pa17lP1ZlDYBG8eRYUyEa6/xt99+lY3FFS7fqPza7DTTex8lTiKaM7VmL8rbztLEkGyEhbt4bDpxcRW262SIFFLoKCmyNO2Gpd0ODwMTa+dR6rwrbdqirkVFb1cBm7GzPaB1xuq1J/nQym0ePvA6r5XEr397PxfPPsIDRw6SrE1BlmCWAAyDg55Sx9CEdKUOLnSOHtUdxFNMLShRAxpWHI5TZ60mFbqQGI12CVQvhCO+ppSMRWHfc1/mp84Z/dFTbF5+lj9dvJ9r68fptHEdRChNbW+zSmJg5+nPsb7zFPuTcmi9Y5LusLIT0OkOew7ezYUXn2G0FYatGdd2Njn94Ad44doVtvrj2NGHmawcQya+6hHY9ZyX3XfT44XhLTeFNzDanEHannvx0buIe+rBhaWluJaiDq7n6SZYHbFx3rgvruR3dxQso3z9smkNQB0dLFXd217q3AXXdD5lqNUZJHXhDozglMWQAk4MCU3UWghlhoUOkwgWnQRYBkoTNNZGsJTqBFATL66NgaqJTiKOdMZTHtuXW9rKJ+QCklHpmp6prccNjODcFiaAkwcDgWozhOhaFnOIFxJ83V4KYv78RQFRRP33lzwHSUizVQqBqpFYjbFuc9/8DY7f+SP2rJ2gzGbUlXXOvOd/3b33/0IBcPX1r/7yi1/6tU+s9cZO7Hhm4yN8Mhx1tX90P66ZutVB3DJm3n74pe23PNFC63YbJz9ExlK8SlNXLlZpyYIxeSCI+QFhDSkbgotmSlOTuo2ieACLZaQoQoGyQJawBhVXU1oTWuTqsI6loCr03iGLXyZTnZOrdzuUGbXbj6XUQC4AE4p6jjvVbTcppGa5c/CFg1KcyqeqHkDTRGqmI7EqRSd0LS7ZsZyF0ERl1mA4EtxqaAbBCrtxDur0LpHAYCNBm3K+QWK0tFhVIkkrtagzFlR9b10GYuqp+S08cS/iY8nUUcpI1oCUkSgT8tYWmy9/mXOn7mHeCZvXNrH1NfqVfaiuUlUJKSCzHayLdBTGVqB4YJJ/kMUgEnjXpd/m0bv3c2PzKunAaT51853M9h6mT4Evf/lxvvOpT3lUZlHn5lM9frRLXkiZIp3u2iu1S1RNrtzPLba0jRWXhZkqPkExxSLNf+xFJKM1+9SUBSPHyk1++uw2G3KRjaN38cN3H+b8s69w5NA5PjW/i2fCSU8sLAOhusc+BBfnoAnpInWYo6b0MbgVNXjnLtqgSs11kXd2uLm5w5GjR73CLx7esZyiSYVRlSj+nkhaobvyMv/1yic5vB747vX9/F+vvIuNPRO6lUBME8cKqwsxqU4rIwRWuhU0FGYiJDFY+M9fJxNymVEypC5SdsltLiwyYFEH79LbOLcW98rn7GFd7rkXxnbxaXsWW9s98cJj/I1zVzmzGnl1O/J7iw8gZ05R4ujWxBQRU0/oG92zTTZH+qYONSUGYzQXIMYCVhSmHlKVbKlHcmeAmeuQJAa0up4kxAhE8rBgEXoOPf3H/Mw9N1hceYH7zpzj4muXmVvHxXCCf/KtKWfe8yMcPLDOpNxhDD3B2pCwtlUi7E4qoyhFIsKAlYGcK31MYG4FK13nl0LsXdE83iaE3gXMOiEjkALBauNsuBI8mpB35tx94+s82F1kJRmXpeOL9SPY0TPelAR5C13uZJwmcIvUEkhhwezN1+kWdxgXM2rd4tDZd3H9xhZxbYNJ6pi1M0wMhjwSQoFmTXbHkeOKxd18vpJr53sVmk7Hn09pgB8f3Q9ETWSU0MTQZgs/p2PyeOTvIbpWPBES8Uu9qEe1V3G0e6huc9YwocoE0UoeZ0RpLpHsYTaiPRKmDpyLvrIKTazra6bU/r8G5qmFUofWMFV3epUMMjrrRXsXNNbmBEJBg6+B6uBcAqvexUsh1q6BlzJJe0abN7iaUUf170sKal17Vj2i2adnBqIdYoGRGVFiYyTQ7lS3v2pV/xlpdmQxgDhojuIQtmoDQu+NYi4Udd7Oh25/hvH2eVb6CVXgzCP/WFV12W78xQIA4Pxj/4vlravs6Te4mU7xD9c/sOt1p3HjBWeNq7jqXJclEB7bmRo9zsMk/AVhmZtd81tMfjOKNLpSmVHz2MhPNCFDs79Vg6yIbJHzAvcyTb1PatqAEATy6KOomCjqVZHlhft4Td1vbN5ZxjLj0ErkVl5jYQXyAmJqKMqKmTPPgUbyMlQSoZiracXH7DpWLPoPCJbiLc9xXqQZq3SMte1dm/K1Fo9qxVrCoVb35wZtI35zuwfuvEhx6l9THVxJ3J6LiV+2LlptRDV1IaKIuMK2Vn8hq1vKlLo7NpMG9tnNMahGiB7YZDhww6vvBYKPKgO+dtFGDwwhtINBmKiwWE5y8Bz4d17/Ih+6bx/svM6bNwf++NI56rsfhtGFcl/+ytd44ZN/ikX1CloDHf7nFgKp87hSYkcQQzv3wSLekdWaXdATfM6kacKSXim1UPPgH6IlkKSfkJswUENgUQy25vz8j5zi448e5aWvfoqy+QLd0PHaG4kXzn6ErbsfcUCNQWw8CKpfPm6HLQ65qW6BtebacGZAbROclrsu6jGh2fkBOefmuPBkM0pGZcpcBf325/lv7/s6Z979P/D4536bX7/4bm4cO8FqFwnV959Tia1btd3xXOoiKsFttrsWFS8w+5VVxlt3GC0Tu76hjZMXSUtC3mKxS78rrWOPSPs7xPUa7b871tonBRIDdxDi45/hb5zdZH12nTfG/Xz2jYHy4V8kJCXnoRUc5mCkpiCXNjWkOHY5dD2GEmUEG5DSJgC7Wg8v/Mo47GoKlnnoZYQgI4NO0AIfvPTP2BjeQPcf4vYd5fnFPp7dOcrrk9OcOXWUVR2h60mtC825uprbBLURYvCLouWNdGb4bElRG7CaafFG0K35DlrMra55E9GIdhP3tKtP8GpD24oVf3bV2fM/Nvsaxw8p8zm89PLzPHXPL1KWRNDGil9eTKVNS11WIb5mqCNj9obJsbtNV265fc7BqhKiFwCicZcDVs181y1vkT0rxc9Oc5X/rmW2jASJ/jVZwBhc3FcGNEx9V53n7gqz0qYqjQq5PDsI2Djzu4Hga5wyIAxk64gxerFlEMqMgk9LESfp1RqRzkmhXUvaXCYuOqbbTeraznFnW3TEvL27wq0aCYxNh2E4Wz81jkfFKkRVsjUXjylBl9Cj1BxiXowK8112i8qqa5pECZL999HotbE5v1p2glvS/WexFDAGYTcpdzmRkTb1dgSwFyNeBLWphSSk+Oq4aKaWyAcv/CrTI/fC/A47ize578f+0V+48/+CBgBAu561/ScYcmDfXmXvbM6N1DdqlPi+WhUVJVfv9qtVkgqZSAylqbiFWhwJXKV5Qc0wJk5LKl7F1Do4xKdV0dVzWL0KFCimiAUszKk1Yjans9CQr9o25yNU/IOiK4B4Fy0dpU94uM/ofkrzS7oS2NnaomhPnPau/F8COi2RMEe8Smhpfx4aIilRygAEF6sFH+vHpSfVCnQT/u6p8zxxacKnx7uwriKD21OK0ux/jePcuPwhqHe+OCWxEumikotR6sI5I+IhNSm4kERFdlG9S0wzuaDB/Jlnv9CtgiSlNNSyxAkSPKc9Dy0wqDShYcEPVCqQ3BJWXbUtTdmb2ghS27PRKlhQ5i1HPKTeD0URbsgZZDVy6anPs3HsbRyfBl5vaMyhZB5533t5+ZvfZnHpOhqbwEYCtZ84pVACKRRKHQmpQ4q4u6ZLzanRt+S+QqjFD5DgDoLlQQzQtwhX30M6QTBGYRI7wmTK7z5zm3/xjVfobZ0fv/dn+ckf2MfRI1/ndHmKP7p1D3Vjnz/XYsTkHmaH2tWGIQZUyOb7R9TFQIwK6kIv2tSmUJEUKGOhKruFmMfSBu4stjj97H/kkZO3WJ8e4pnHfp9/fPMB1o/ey549HZNhRlYodSSLeEpYBYKH2jSJkGNYrWLq4KZxWLCoQonFtRfFJ2XDuGgpY8YwDP7sJJBHT0osjagoIaJJGYaBldAxlBGqkaU4fVAiGyVT7v44//crX+Xvv/8u3nnrFU4c3cfnnvkOl0/eDxurVFs0gWshqjVFuSvkpY3LLRdCSlAHh1dVg2BOdFO3mEUJTo8rLqB0J7IRUiLmTNkZ+OHwMgcnlaeHh/nSrQe5ZT0E5cDZfdw3KX5JBaevlaLECixhZgHE3Arql2eHlm0sdb5nzttYEF894DtY1yQUahY0OV56NLA8+nsSPN5ag6EqPj1TqLHSfefLHHjbJrev3iJ2+5ms72dHIwkPIaOWXQHbshhwJDWI2Vt2VnGBpCZtSX7BiaMt3Mco5FHQFiNbm9Tcx86KWXXOgiS3DdZK0IilCtUve23o2mWyiiGuale8OwZfG3TB81OsuhPAX1SitDXGZM2L6RAhe3CQSiXYDliHSQKL1NRBbmwU9WayyEAaCzFE1wpoT5DsKN4oIBGlQ4ZZ4x5UTwVl8DsFczeYmTeezWESmmuoiueBOLCuUtT1YdUUswVROqoZoQ5U7RBLFBWijRQthBrwpZk0r7+iaWgDc1fyh9rE77Jorop+t1hBrJH+gp9/4loBjYFaXFwqdYHV4pbIuhTZzYmWWR8us//gWW7cfpnYHaCkjf/0uv/+AiCtn2W9Vy5ffAK7fpNDeoitdA+jeGqamLTEI/e4I64ozuYZ8bVV9svQGLRx8htLQDRTsldQ3q22MAqDGB2xWLNTz2opoGAyUKtSNVK6PQwt/7ndzKh03uXJW0pwGq8gtepIpXMPp+E54UGZZ0M6cWFfwG0W6jn31ckeu0+pIMQEY/FtUkXJVZBOXGBSimcBIPQ251efO+nUMZxiVdQFI0tmp6dMQS3eyVRdilWyd/BWXKWcUkvxqqAVTUKu0qKExzaabR1Z7Kk0OEkDM0mDRtTBI4KtQM6Dawzy6ALJgpPXqlGqY1/NnD/gKUo0YU8Dm4giObvnNkRqaYjMJlrL2X+fApfX9zLbvMzhM/fz3JPfYr55hfG+dxC0I5iP7H/hb/9dXnrxWVb27OUP/5/fYFIXzKqysdJxOwUWw8i0jC7Im0z952neTUkZUEmY+qjR8G4lpEQphrRxfI6C9D0aIjH1vvpRpesmWMlMo9CH/dB1fONW5St/comVIfALZ17n+OTrXNh4FK1TuuhTrFK8+/J31mmENJ6E4N1Dcb4Nqh02Dq169zHyWCqShM5gGLPv4UMkxTXWv/XP+NDbE5NhzvX5Qf7l1Qn15D2ktQ6GzGCFyWRKnvslbuqix4K1UJbo3YPg+NJaWdSZT1XGhe+ka+tYo1IzlMXgCuhqWAVN0ac97XBcolxz8eJ+bMbf2Fj3MSSfrKUeJsLOve/hn3z+i/zskcykvsZPnjvOP/3Sv2b+wf+Ozno01mYlDkhwWzHqqxKpSuqSO1m0d8U4QNPPLQEwpZEJjRYsE8RtgWXkzmSFvTe/xdH4HboEl20fe44f4HBcARupZe4Tka7DQ4QyIs1SiIFWcjamsWvFrrpEPEb/92xwW7MVPxMpZCJ9F5oDKpGsUrRzi2lpu93l8WTq6Njg65echSPriobMYhN0FS7fiXSnFIp3hzSroKBvHfrUXbCRW+n8SiYaVly4aGJI1Zaj0Fa1Yru0SiVQDVevC8050qzd4rHDTk8PFCpRIpmKdQLZNRO6TCCU0KZjrj8q1cfc7a9ExgVVY1s45cYpaJ/ZGJHieGa1Aclzt4iSqKO7prSan7vJXRglZ4JJ8/dbcxMNbsENPdYEdkpHkYDKsnAB39EIItnXcE3T4l39SJRExpDQNfZEdK1XCJTQIWYgoYHbKkIlSPJgIAKiAakzisQm2K5NE+CIa23PqzC6QyCIM2pC9EGHLtdcRhCf0mltgV+qvvYcg+u93KmONfHfIFNO3P4u2wm6fh/CDqsrJ///C4D9xx76lVe/9Ruf2LtxkKtvXuADa9d4Tt9JHWeYKDEkz0VvqFXX4dXWMTod0H3jvtP0UU/LlFdP9AptVFe/Z/RcmtJTUC8s1GlaHpjgR07EKV+juD2NMmIsmiBwQlBBKVQcKqTiKYBSRyRN/CBRAfWo1iIb1DonpdVmtWsCtEZMw5Zq/9i6jI7EADLBMCadkIeRGNTVl9Wtd8XWuN0nonhHom3qYCKe8oRQRKA6Qczpa47aLQYpguT2OS0DhUSMnXO/M2hUam2pXaM7CGh0qhAnSBl8T9bEXEH81/I4IyanxhUBCz5ByTkTOk/rik3+XKvv52KrWTxKcyS2nTvRqFTPedBlTHRsP69KHhuGtezl4rN/xumTEw4fPcy+0+f4vetb9PsPEpI/v6B3OH3yGN3aCh/9+Y/ytc//OR/6L3+aP/vN3+GRv/4LrIYpf/5r/weEjhqig0jaRUdYdhTB1eHqe0yJiYD7j5Hox/o0ktTpcSkXx0vjvHFVIxDpU0fWSBrnbO6sMl/bxwObX2d8ZcEbpz+Gls7zytXFnsVqm0TRLLEG5lSyKL6fx4TSRuXWIDJdDMytkqhN+V/prr/Je+qXeeQnjnPh1Wd4YzjMv3r5GJvn3sPB6QhjISZxb3HJPuYMMO2nrsbOXjznSEuylHbYFKxYo2U2Fa95wthiMWKinihW/SBM3fJdhhQ7ahmInSvYpUpDfYdGPPRLpTRhnnY90Qonb7/M2+67i3/3VOLR43eYXPgWf+9jD/PVp36fL04eZDh+DwGh6yM2goiCjEhUtLTudsxt5eMx2FYHZMhNYe0/t2y14a1bCpx4nv3Gtat8KLzISrnBk1tHeWIncSooxoKlKNlFWUYMPUIhS3Gtj1VEEpNOGFXRXH0tVws19q47qbgfvTQdkCqdCHVcYFq9MBLfNHuKaZsK5QppOZUTbzqsUiTy/jOJjdX9rBz9AW5deopr3VEXRbbgGpHWSTaAWK1113bmvCUDc72C7+zbIeJjz13LISgaqgeSqXpGgfjFu0wAdWEfflk204LgIT4V8RwDG8miBAeZELStZkILo7LGfGiXmMncV6njiEwi1TpXrtcRT9UrVOldSyHZA4HK3P/uIBQiRRJR3T5Ztfdsg7HQBSPnWQPn+PWu4oAxWty8KlQbqcGBUe46W0CI7m4wV9Nn8UCtbLjmoI6NzOkBadkgSAAZ2qK6rU3EXWQmrsI39C29ljUNU5j4Ks18PUMFqV5U1OIR47RG1qoXFGCNQ+F3lDUrec1vRdDXDCIFDYlSFoS6yuF0jTs3XmZ14wRJMqd+4Be/b+X/fQXAoWM/8stPfO7vf2JnPmfvwaNMtl4ljzvNq+/KUA3+RrhwxB8eeIO7FGWZFTKGqqsvx1p2/dq12vd421vlVVvYgilR3PvttL2WaWwKZeFKTVn4BCFWDw5BCWqUNhbHFqhm9+KH5B1Y9YxmbR+mYIrEFcLy8xESOQ8EcK92AWvuBiyQwoDJnJ1hwf954t+wsfU6v7H1Hr7Q/wR7GMijEKKPaqqUdrH76E79Bm1jqUAZ8u7lY22Kwuj44BSM2rCjEJwZPXFFt4lS67CbaU6IFCmer10qkncw8eo9iMOAgnjFjHjsb8lO2Qup8/1WjIxWMBvbaMtQscafB1gGGFXfOYm0QCVfHEaEcWyph7inXAm7WgidrPPMDO4hcXvzDtNjV9GXnkAPfpA8y2jntL4+JmabO5w+fZajv3A/X/vCl8i3tvjOv/w1dGUPtevfcl6o+oseAlF8+mLaOojY+141RudUZAipI7bdZVN3oik0P7K6q6J4seREPIfS7Fvf4PdvrfC3zt3hPZe+wWsXZ3ytv4+V4293VbjCYnS9gheLtWVSNCR0U6NLlCZQEMpgdCoUhQkLMj7JOfn87/Ho/i10I7FdDvDp53ueLme4c/Qd3H/9z7k8n7C9fpC9hw+2IlOJKVIGYyxuMyP49K2MufEqhIBCEbfwqZCzi4tEA4thQIJ3D6Xtd02NsXWKGoQazCOPF4ML+ETa+NlFwLW4/VQV8jCyY4XNnZG/c+J1nnvtJuOZD/HNAOOtL3D81gv8+MMnOPHEl3jswmWubZymHnqATkYsRHLLsJcIY8X38EvhHf5OS/Rpo1khaqSa0kel5IHaTRjzgsmVF/lI/20efug4X/nKHfKxR9m3d4NFHpmkDqvqkxgVX2VaJk0Smn2KoE1fgTipUGQEmewWHm43djtYCS62lTynoKSkMFbKYk7X95hOfT+vnhU/1oyM4qu50bNR1IR+6xp7Dwo7c2V+6Ulu7lxjfvIjBBVqi4n1FFC8GVEP9FrqcDCfispyFy4+EXWnzDLOvXElbKSSiJqoeBTxsuDT6GKapYZFxcFvY3ZhtNhINaEGR3ZrqM3VNWLDjHZgOTpeArUsCFLdAZLnXpSGQl3MkG4NrT7qtuq3kZB9AqXKYB77i3lmiIaABcg101VxrkAtSDCyDS2lMTQ9hlEtULU6C6U0yBvezKh64eWVYHKWgNY29fWAIWkZLUHbuN382UbFyy7zqUdofIpitQkml8LRTLaWlyMJDbnZ+d3r78OAzm19tXp4lzlY3//O0e8Qybux8EZ7B6QSNJCrj8U8WjhTyYhmJF6nyhb7Dt9LyQNbW5v/6VX/lxcAAPTHWF+/zfatLUKsnN6+wut7TvtoWT0Yxi/5RtALASuhjRAL41Jg1tCdPkmvTTBlLCN1S3WVu1UhR3Y5+zWDMDQVtaDSU6JT5oxKMPc+l2wEmRBkoJbGhUeI4qMgxLOcdckCEBfLCD7WFnMvsrRiI8bYRoEtJAJPa8rqCErZNn730O+w9fgzyOnD/NU7v8HZychvrv0UKRl5uUevzi0IzelQJUEdcTh78k7HQPJSHOlsbGcsNBSsuT9bpFDy4EIYWaZj1TZNcIGPimKxerJWm5441z8iRekkUDRgeSRZcALZYu67VHHssErvVjBtYiECJKU0pXYM4l9vjE1MEx20Yi7KVJyOl4LvHcE75LFscyncx2zzGwxVeOM73+QDp/fzrTszWJsy5gwYQx2ZqEci62i8/O3vEPbt81HpmEn9Hmre8eKnmzqnX53hEKPv0Rh8LaHa+Z5MJ1gumAgxRGrJzSMcyFZcFd9FXzlJcAqyuhd4MMN2tlgx4Z8+d5x/+HM/xl3n/z3vTRf47adeY+f0D1PXDrsS8EYFjQAAIABJREFURNskrE2YBCOjzVdslHFAcF5AIFMjzHZ2WL95iXtuPM27T2+ip+5w4N4P8+qLz/IvHrvOc/s+ymq3F6nb/Bf3bDFuX+c3X1gQT96F6cz3jlVIkx4KSBTy9uAjbDWsQVms+MVRxJCxtB2v0IWIqa/pSvU8hNoOr66JzkwFGzywJZgboUQMic12ZQHVoe2WHWedKpwK2xyN2/zW5SPEg4FZCHz1wId54cVv8vEbT3PtyhX+x/cd4sU3v8Tnn3iCneM/yHzfMU9fVN9NI+bvb4iU0TstEwfyAD7BKA3HHQDtqM9/nff2V3nPvtfZc/ocjz9xmfP5Ec7fKOzZq0gZyaO7OcQKpp2v/1IiD6PblztF8eQ+MyMZjhFXX+EoPq0IqCcZZv/3BLfg1irUGN0mWcwvtBZrnmkCQMy7t1gheyf3wOI8MxSkcG3rBtfyQWR6CmFBcSCI31VtdeoibCWIr9dDNGquy17MvxeRtgLyaR3L5oa4K87WoLurglIrVpRQHWBD7Blq9uhnhWwLopq7szIOoim+GhERSkMxu9ZFEYmEUKl5wEyIaQXNxiCejSEEsixcfR97tAxI2SHGHqynBA8csxFUC6VNoCR4kFqpbgG2ZqWWoH71mwEdaCFYbltXAcmo9YxxSs1zB0ohlOyI5OUdFZcqf4MQ2pqnRufN1JmnQMaESt9+voIyYpLQ6M2UhqmLp+MUrdve5Fna/QxRAxq8aKsijq0uO74zlOXofykGVP+5L6skDVAHcl24EFV98uAiwZGokXvKTVLYy+a1Z5DpHlYOPfyXXvXfNxIAqLXKN//ob9X9B05w9fLLvHTkPfyWvp2Ym4rUmpWqXUoe1uXdfGqrbrOlTsAxh8tfV6tkfIdRd7t8H48Ni5mr+EWw4tAbFze7HmDpU/Xfk4h1zhgcxRpScr9zKzaU0XdzocOIBK2IdrvVsNbaqmWv+pdK+PYEkODFQAzJ9QYox4Zv8Uvjb7LQnq2tykaszA90/MqtX2B7712Eom0fZL4aiJGujezGceH+5uVeVfCXWQJiC7JE39Fm7w6goqUhkmvenayIhN2RPvgURmOHFQfeLDkAXdeBuQ6g1kq2SmdCCt4JCJWu2+P+Wit0cbkzp017XPmstbTgH7eYuZApIpJQ8a4ZvAsPVT3Qp2aqOvpYVQl1k4+//m956JEPcfn1pxkWlU++ZCwe+lkwowuBIRtaC72u8Dv/7l8ze2MLjYL2yXeXXfJo1ZS8mVYHR2n0D0SMESE3PUeCyQqh63zdUQztwy6nIs8WpDYRkBTQht+ESh1b59PG2qoV4pTh5hX+m9PX+fC7QO7c5PXtFX735gm2j76TlTQldxukYERqU9QPiCSiRIYWGCKjIW9eZX9+jR/c8xKn41UWusKesGBncobPPn6bzy0eQPeegInRExjTlAdm5/nY5Dxfu3KY82d+msnUd8Eh+uUREHZmmzRVIqBoUqRUoib2bfS8eesOWGxTgNx2vUrNI3cfmfLKlTuUuoIl2+3AfKLhzAP3XjtGeKnZ0aapMRUkRWwcGAflo7PHmCye4d/y86Q9+6EOTPesYybcfOJZPtw9yXsfgNX1zCQr55+7yXNxgzf7M2yu3I1sHEdJhFR3UzRTELesNkGuRSXkOaBM5rfYe+08j0wvcGQVrt28zNcvHeMPy12cPfl2VlYm5CikEN19VCpig4ckVc8RkZIJUqhEYnRhrQYXszodbuEixaBU6drePULDxZIHP6vS1N8rtbd24UuhZ+OiLN8vq9kLzht3+JnuMY6dfjfPn/8C1za3eM7eweKH/hqMi93PuT/zSM7DLnHUv4a2UlCaPmBsmgj1ePTGBHENisdLh6oQmpOgrSlrrf75GmZ+hseJa40UynygYwelUuQgVZ2rr02h7k1BbgVKj1nGaiZqwMqisV78Zyea24SlQ6q7vyw4RlfKHI2TZu9L1DxvlsQ5pc7fmnboxHfgLZwqhdAskhExz2ORXH3lE/v2Mx+9UdB1YO6dubX4bVlerobQucjfXF8RQnR2Q/UURBHZ5REss2mW8dI5Z1Syf28i3jjWbaiO7XUdnbnqn4nfQe2uDHXYDf8y8+ms6z2bxsiaXi7EJm5uxRu9rwXUoFQWBH7izT9geuQ01179OkPO/OBH/9FfsP8t//lLJwCqal/85N9jmO+w7+hJfnTvKn941cipetedljuT4lWNOA7SnfnOHo84irDacv/URtCiJJqlaMlwplDG0sQkUGsLxTF8NDN4LK2gIJXUHlC2jFWhF20vUWyUPbAWvFFrbYE2Pr4O+J/rF6i9ddCF2HYBLZKxjcd9xxnQnLlqD3N19TzdzZfZs7GfwTa5NjvO7bCHUDuQ0v59oYsB04ploeQGIaqGLDG2TWlfm9ZQsJaI1blaltFFk+YKbqvi4+uaXaVcvesTXIQYNbhYh+YoKD46CvhlPcWoCqMomtwHPAIae4LCmAtdp1AytUAVryRLHaAKIUwpacCqud3EIJv6s8Gtghprs8n4nlCaQGqu+3hqts7JN19gvn0N28qc3B64MMyo/Zqr85tl7Y8e+w/MLl2nimIlQEmenrjIaO8VsYrCZIKNLVNc1IVdtO4/dMSud4FOn4gBbD66HqRLPiQMgcVsTpLkXbK5jUabCJRAC/7wPe7q3sP8/s1DLJ64xl973xHWXn2dv/P2GXd2vsA3nnqV+amzvHRnHSYHiNM9jPkWaWfGigpdvk13/XnuP7nGyaNHuHPlCc6eupfZ7CA7O0f502ev8JlhlTK5Dzm4zjT0xIkSY6Iu7vBiPsEnn/g2547e4Mj8IjfjSU+fzMtoa48QHkVbJoKz4DUYNfj0qw+JsUTvvmJbg4SOXAOv38pYN3FdLQpRPFJWwYJbl4paEwB719CFCEFRqwwlY9lN43s3n+fWxW/ywt6fJB/cQKSQQiDWgg0Ljtx3ms9fP8x3n/s6P7y2YH3zOX74wWM8aGtsDpe5ef0Zbt8eubQ9Ia+scHOR0LXDLObbhEkk395mbVJYCxP2LK5x7/6R44c2mB+8yZ2hcOXGnC/efBvP2EOcfftxLwoxD0KSkWxK6oJPa4orwiMRgqu7vVFxcS11IKiLblOYULsmugxuSQX88DZxZwDBx7Hi5aSJ75Arsb1fnTtvrEL1CVmwwN31C+w9fI4b17/LZP9+8o4wPvBhGGe7jday4PLUzIaRLYUiOP5VxNXvjbqooaHT1VX9Bm6DDQmpRlX/GjQoxZzHQvZdfU4rrncsxmiJfhjIUZnNI6nuUPpbJF1xEZz3S8QY3DWFFwKOZneLXogT11XE2ixs/u5RhYLTH2m2SI0uygy2Rc0tlK2xDtSiv6MBBzAVX2U2erV35Or3j5WIS4SUWgNRawsSS4jtsEyXzGK7ugizES0B6xSrLkKV5a8vp9+mLjonI1Ka9TARbE4tA2BU6XyarcXvPDNq8Ihmd7T5CtXTY3HRLgWLrh8Qgiv+c24x7e5Y8NWstrAuUImONxLzwiR7TND+ccGkv832jZdY3XMC2an8ZZf/f7YAADh07KFf2bz0jU90tWP/iQ1WL9/iZlxF0nJf1BjFwBJagzRFKPiu3k8Z2gK0iWWWQhNxhf9SvBYCFHOtgAjukXcBB+KlhUnb69jQdknRMZHVdQGDLwAAZw1IU1vWaq7ybx8QL5WXf2ZtFiNapV29VG1QHmGZ2AcaK79z435+8bAybr7GvDvAP9v8K/Qb+73iBY/4texCMQpFhCSJIiNGRBkouA0uamA0j1oOGLmG3X1ZaLayNhV1S0r7wJWKCy8NqE4ptKXq3GeUvsIQa4VAcSCSdk1AoqTgUxpf5ySiGEOudPjOr5ZKGWc+1VHxF1Mj1UZC9YOkZvdgZ21BReL56e1kJKWeUhaoGVfsLK++8BVkmHHr1py3v+NBXrjwDeTcjzINgZKmDPMdPvozP8f/+7//A7ouUHLBZMSS7UbsSgjE1DPWZZR0ddqeKVmhSwmSuwG6PkIQ4soKpc48OyIGigh9t0pcXSXngbo9ONau86mMuWeHLqUmKHJxTqTwp/PDPP0nV5ncgL/5s/s4tTfz5ptv8vA7jnLp8g7z+bMIO6wfeBud3uSl51/h8PGj6ANnWVsNTOIJjh3vufz0k/yH10/w1XIY6Y8xpimTYMToLPvJAIudLVIfmew7QNVHePjcRa6f/yLX+Ahh30FSdO3KYmxUshQp2VX6IUW0iSFvLSoET6ZbXZ0w3p75SyVC7JXRlCBCmHoOu5oRe3VBZM5NAArVrTzE1CHqOh23AAeq3WFL9vKTp29xZ/IgL13eoK+Zztw2OKuVtZSoIqzs69lZ+RE+9eZrrL16nSPHMvc8cJZORrY2n+agdNxz/ADXr1xjW2fs2xBqv0D6xPGH3s5Lzz7O2x44R7VTXPzunxD74wy3Z5RZ5dNXj/Dn4QT3nDriXa6oCzEp1OyMBCsOm+oCaPO8j7XQJe/8rQQUV1SXEtxhYU55U0ve/QVXdQfrqDq6zqJzzogtkeUSKcVjgbNW1+VgBAK0/X289Qanb7zCePAkK5MD3Lh2jRs5UdQtibmtIq1x5RF10aO5piOaF/a7YmxzRoZk8zWnBLfeleoKHStY8DVLJSPZ98fDEnktPp1U86Yi1JGSFCmBTgolrvj7oNEFrzgbo4Brg/KcOs7cSVV7/z4tuwIex7xrHdFilNjG2mbta1xQQ4c2MFnFCNI1UFm7aQKkuOINpIxthK27aPRSByx0dFYx7d0BIOYsEfPOWczHERXPqICWWdOSRmutPg1arqTb/bQUYkpxup810qjWpR6ua/HoseF6F06SDe5SKgW3GC7pAYr/LBtVwuXyDbcc1GOGa/AVS0vytKXQsiHykcpIQcryfVD2l+vEyUHG668Swh5Wjzz4K/+5e/4vXQEs/3nis79kt958jYnc5NmDH+Z30w+hceFXv3hWdrEl0KMJKmj7/2qu0G3e52XXa1Z2lazLy2JXDAhYXriHtRZfFQTfOTf1hP95eXSFZ523PcpuCfj/sfamMZNm133f75x77/NUvVv3TE/3zHBWzkJyhhzuu0iFIrXBNr0oTgzogwwEMAIEiRMHiAEjsSwhGxwYCeLEn4wEcQLFcGI7iiURiiyJEsVV1JDUcJkZzkIOZzg9a29vv29VPc+95+TDuVVNAbFFCWmAAIec7n6r6ql7z/L///4YGe1vVFRvQsqRuhQs876OIBCxWcJSsy1CtuuN1ME+5t0KI4BUskE6fi1oZjfdzhWf0JoZEswtLmmXQBWLKOK1h01EhS0JkndwS6+/tt5dVGKdIS3WIiaEne7GyD9Jfw/osKIU2QDeL+FtN5BTonpiUMF8AhmRUgIraRHzq5IQ2/QExh8sxgT1GmN575Q6STEynXu1nPpkwmNqYnWCXNAmsRpw60WgMeTCpq742LO/xNsfuZ+qZzl+7Sm+/Z0NT7zzZxnKHl/+yqO8+d638H/8w/+ZcdxnnmfyMOzQ07mExUxyioOhtR39L/bZEcAzDAtaGWI33jUTOhRKdXRZyIsFSDAd1A3xWGNs1sEQ8JQDXZoSzYw8Bp5W+0GVS8FTZij7TFcv8YB+n7ccHvPgTa8xLEZeePFV7jy/z1sffgePfuE3eNODH+Yb3/oSd77hIX77y0/xynzIq/v38erenaTlXrznmwkf95A2sTjYD7uiNWY3hjSwN+7RVsd8PH+O+8ZTnj69iU/Lu9CbbiPnwEnP84x5DVeF9MObvpZbhIvFrXLh8CzPX3s98hREQ5mcM3uLBddOruHW3SCaqNMphwdnON2s2eZsjF0YO3tEm4YoqrKaGp/gSYbLX+TRq+/ke294H6XNpHGgbiaSRKEgHemcEFpV5uTIyUUOL1/mVv8+bz+fkSvHLI7WnLvlAq+/8jz3P/IOShae/uLn0KN97nnLm7n4+Hc4ObnMcbqDV0k88fIezyzeyPm7HyTnSh4S3ogphge4J9cJzZkyDojMSJOYQKbc1d4TocSJkW5JW8R5AY0Ov3lYDwWjtXmHoQ0bnqBpwG2zO++QaARCCa4h7pWgtIkrN3/5H/KR205ZrVZc55CTuuEb9/4sdnRXPxt67Lq13bmsdJCVxXN/A84Uky3zWJ9ml+48tigOdupy2YkIvfVYcpRaIyFxtkAf+zCSDA6nl+D6KetxyXE6x5DX0cxoIHe0iwtVGjadUsZFj3kfeqx5ptm6RylnXAa8rcHDVeTu3R1WepiNM9Ua9knpsfCpYAToSHeTXol1QFF0u4b2eYf+bpLIto5iiba7mzDp3IFNqOj7HWWdXRKhdAXXBW5rsjptu86U7XXj4dxq1qfLG1p3W6gvesRziwaOuAuThpAwUGcnISwUjaIyEXv/Rvf+e2RleKTMunswJ+YJSoppyHYCg+7uupYHPvzUP2R57ibm02vkfJYHP/q3/pX3/L+2APj8r/1tv+XmM6yvP8dwcJ7/zP4NFgqTlt0e26z2MYTEWJqexb69ON0iR5uOLJzDStH6yJsebMDWS92M2jYxaovcERTF2zq6avfw2LYJk9jRHOlEpbCyvMtQ3yaPbS98ekJc2CZi92sEMChY54Z0gl7XWYaQy223JpBtdLAW3GtPOPNu6fNYPbS5C5ZibGfEhai9la8GiQkY4/3pe0LRvp/qlX3qis8IQurvnVWyZExioqIdmiESF+OWRa62naikLaAQkRIecbfuAlgE7CNZZ5nHg6TibKMpB2BT16iWfrBIr3Rj6pJLrCaCzFdpNZFkxggu+vbBFIdW4PBLn+LPPLzijgfeweUXnuXqK5f4nXqW1+/7GV597Rpf+Rf/DyevvIgPieWw9wOK88hVqilRNMb6TFOMMyW6o7LcQ1RJ4yJWHEko48BQRjxHmIkuS7zGUrBVDW1AiYNHOr9gquFsqEQbJBW0xDMlFmO4lAppzMwUbNowWKVWY318mWXJHC4y8+oaGx8ZlwNVD+N17O0zizPWDU5mOS6oq+tspDFizHP4vW+9/QJpb8G1a6e0qTIMUbhcf+5FfmL5KG86OOafPTazfs9fgZvvZF4fo2psWnDbc43126AaiWvjMlT+FlO12WfqbH3FFc/HsAgnhLsw1UrW2DGHaC2mIiHYdqRWWs4Un6imrI9f58+nr/Cuu6/z+efP88tX3szhLbci8wZwhlJoUySJtloB250FZUhMFcBYZGFPMqfXX0cuv865Aa6+9ixvuedW1qsrHB9DyyMnp69wrd6C3vZG8plbWJy7lfV6Yp5OGboepNLIkknNqWwwCSDNOBacxJiks0u2bokar009ujq9QS5NwxJSECa9rpA0hBaqrsILYXFRp3IQane06wliXGxd+BUA49BsnOTE7c99ix+78A1QI5WzXH7xOT7/nT1Of/znkEmgI56zxAVmKh0cExd5yuH0cZtIPmIS6vXaNUvx3etTT3qBj0YGAY0mYWITHSKd1Q3VxNQ2tOy87eJ3eJv+MvvrNdNNZ5mvX+LK5l5+/45/i+vDApnnEHbTp5HSI6I8OK4QLt2mCnUd02BNMT3cHCMe6DX1bt+l9tH2EM0ja9yCGNr8hobHrPbpspJlCDTyTkxdULNQx0ckK8kylrprhZ5LkSK6Xlr9gQl26V31AJr5I0NzMcw3ocViATKjUnseQhAG3aMgSKQoMPrPKzZByhESRNwL8eOHI27X2LZg/8dJHFqvGsvhGxd1171IZ/JIUhpBBq2q7M3H/JnFd3n14ndxrnB93ufdH//5P10BYGby6K/+Dau+4cJtd/LPNw/x1XJXVDYpBfK0RehD6hXuVhFLB1Q4dOxvx6bKNkks4l8j4CY68IiSjDGRWFiTkkPddv89DMY0RbeWFW3OLalyMhurFICJ7S/VHJVsi9FvGK7jSx5M7zj8vStpt8MZl/DJb79EuSuQY/zT/yUiRthrVOjSvbnYjLQpDoKUIS1Ra12JG1+YDgamSUZbI2sJWE9XdG6Rj9tQpYh4SMHaxyi9ANsKBNEcaYKqeMq7Qw2LC7mlBUVDfKkeVk1POUKV2mZ3CKR+IHQ+cP+yddGLDvh00i1f2oupIdTO/bMLl0jQBJUbwURbEZmtLiOf/Uf8xfcecvam80g+xzMvXeXR1VleXL6DT/3T/wudg6WN5hAceqjBk3gIzTySAJm706CLz/LRIcPeAZJT4D1yphzuIQ5DF/zlxRh1ZlIGT0xa8ZleoEZxsxgGjAjKmdbB594GXuXSSYklGAStNdp0wt64x1wSdWp4KXHo0RjGRFsJixwTlVaNuSxYSGN/f4/T9SrEZU2pKbGXCjZN7B/tkfaXDIslrTqr01PGXCiT8b0XnuR9i+f55Bszz790iV/f3M/xXR8gLZfIdBrvd1LmuTKWsAQ6McFSazSDydbx/HscfUqPaG3R5RuAVUrKzK2POVPsZttcWY6ZNl/nqg7ccunb/I1bP8/J4f185qsr/u+TR3jDvbdRC6gZo0nYIOM8wecaIKoSIVbWNvhcKUkpZYw1RpuxHMrn7WRO5saYl3gJUeg0nzLqgEllTBkGZTUHBQ5gGAbm5mA9iW/2OD+SMAzDbuqWcnDfx5KhrSPuVYnzhrS7KIfU/djupDJQ2xxrr52eSEHHnUg6EQE2RoydTQvZNh1H3jj7+su8e/OrXLjtbi49/03yeBNffu4KL77vr3M4DEwEUEg7lyQO/MAtS4sVH1Sq3jjvAhrXXTrSz+EtydSjIAmAQRfumXUFewougKX+e4Wj1dN87PX/jlTu5HQVWQ2LvVsZFq/z2ssTv/Pwz8frtjiP1bYHo0FbI2no0bmhpWh1heZxF9CGtRvTjbohLIzhJGss/whERzXfsGbm8keCe2LRr52RkWgm/b0y8A1BvojzzFIU9NHhhwAQ6Sp+yWCKSsXyEOcOFfMSdxuRdwCQGOPypyGU+My3DjNxvGkIDHOJAkFusG/ErLtmouGkF0/bpNigIoLPXczcEd1be6cifQoRq23vxaAmobLgw69+hqP8DIuzb+PV7z/KuTf95V+8/a4f+YU/VQEA8I1P/4LvnbmDzcnr1LOJv3/1PRwPGWTAaHGhtrobK23H8dFZWIRdbNuMzoDWnLBZul2pj7ZaXDjerV2YY62rml27f7WF3UxajNHpfHiL6jg66YZLCh8ndmO3gwYzXm1HjFMF9I/apSRMmSGq8i3EiP6BaVfj08EQQiE8yj0eHduckgmbnAkII6ItEJQWUB62ZLOUu9CoxP7Ha38g2q4C3YKStgeA9XGfQs8tqLtxYE4xBncZwab4MywgFVnonT0IhVwU5plWN5SUojp1Q3tsaTzUgbz1eYJktFbJPVzD08CgiaQGjc58iMlOrgKJG0rzaUayYDJir36fj176FR544xtYba5w673v4Vu//5v8ylPC7169h/0ycvHJJ7Axs1juk0SptXtvt12UZBZDoS1HZAp71uLoiGFcIiWThlgBaMlka7QSBZIbjHvLQL8ux7B8VjANh8NUG0OOIvK2O2/l5OSEq5evsDk+jZWAGyUNYenMiaQDtU1oHphW6ygshyCEtVYJVngIdhapF204eRBKg7R3Bk+VdW0sVZmuX2OxOCAfHaLJemGVaOtKbVPfRSsnr77KB6av8aGHCq985wWekdt5bHwzdv5BhrJE5zXjQpnnFtS1aY2pkFuLAttrt+cmSuoK/ha72madq+CNJAOSetiPRdiLb2ZOc2H/+Jj7nvvf+eQH9rh0/YB//LUFz519C8s33Mn+sIiDfVqBzwyLkeLO9dMVPtUAqRBI5baZo5gehuCYi3dRY+rZCx3FJYEizv3CW9eZxTAy1TnilofC6brGeLxH14r21aA5vomfo7YVqYwsKfgQOpxI04yOem5d5NwvtKyOWwhjJYGK9MmTxqVAdOrS5jhOc+qru9Snd3E2JAtb2lyM+q0v8eaLn+Ghh++k7I9UX/DMt7/O0w/8Vezme0M8qIXW+f3bOOo4C72Pi/vaqwuJpUUmh1KjedmO+bcrzZ6gui3Svc5YEsRjEkPaRos7rSrvvvhf8oAUVifOXE5Zy30MB9dZXn2ScSx8/txf4+Lew9F1dythTHx7qJtkBknUXkRpvY7bHCNyKaEhIMV3xKZOPqWjvDMuBfEZJ8TVWXTnLtN8o1CJ7IBwheDxzMS0smE2gdzIw4hZ4RgIaZsjMdCnnb0whY89JtKa+mQzITZ1RT8xKbXtR7FiSDnosHnEwg7XBZrBqiEPbHNtttwBEQWf8G3mgIUIfUt0NJt7gUcITLtebbv2xaVzIaK4yN5C8yTX+PBLn+Lya6+zODqiqfHIJ/7bf+0d/68UAW5/LW958Bcvf/c3/s7R+Xcxv/I0P1bO8Cv+TqrNfbwcysWtOEG9hRUjVcKg2yNxVWjNsB5N+oP7djwiFyP3vmsBOj2qf3KxH4/Ue5J1tbv0UI7eYYRtoz/4KqG49G3kopC8xkXcZrIX0IanoHhBHLbiHgI4aYFqdA0ITY9ojJccO28VoXX/J62CbQEdoRYVerqWWfw+DyEMDDtmQiIyFVQiiCJ59/J6TB/6TAw8JhPagcvaZ0lCAgkLiKSMeAT+NM1dQBlq3Gqx78pdgBlrkEB0tr4zptKjJysuhZwirCZJpbWOSnVh7OP51ub4TL1brMQj/zzHDpmO5mQonQg5MZ6/g9+58gEuXP0a+zeNkCp3vPl9/JvnL/LWS7fzT/7wVfJ+Ri3gM6TY00rni0s10gCzw+H588yXriK5C59yjAk1x+dPM3IZIlmwFHwOceheLkxm7I8jPjiTNTa+4bAMuMBwsMcoAouRgze8gSsXX+Fks6Y4WI2LZKoNUaNN8bnnRASveAXJHXPcaFMDn2m5cXBwM1qcNOxxevUKtsgsm1CnU+YawUeSneoVaQmvxlBi7pNyRktGauPM2fM8evJBvvflr/MX7j/kZx6+hY8++zSffvwPuXT2Tp5uR5x90/tAJgaia1yFaRQGAAAgAElEQVRZsDNyKeEWtFgJOArJunK89Lkc3e0RI805BbHR54k718/zvuMv86P3HTPedcjnvn3EP3/ldjYPvo+zhwvwmXleo81JPTCprubgLohSkzJg1KnSNhJ6mWb4ZkMpWysYaCF0P0jgsfMCaxPVEpQQ985zpF6qGevrp+SizFNXbltFWyjjTRytBjh5WKCamYBijqcuYmsVs4GUAtolPodGRgQIXHF4wnskbgechaVLogBuq+CSDIcx7agBdYmk0g0TmfHZR/kxvsB9P/0eNm3g5e8/z+b4Eq/uv51rb3gzh5t+rsSusAuBb8yipQeghZYi08RxC1qgdtFwFyxF3kIv+121n6kdBgRI7ZHORcCIgqlCGlacXjvHtHyKvZvOc/1qY7l/mWzn0WGEMjJc/QYs3oPoyQ1NgXUvTy7oNtVVM00EL3vRqNUI+zFP5Dx2aYNGPkmtSLL4cqeKMyAakyRTxTxT3G5A4lR3wWZ4WNQjWjd4F2FTNaCAz8HZTzkYBrl0nHdBvQagzj0cHn3NaR4sgDiLc7jKmgX4pxcFYfsD6xycgNZlVCrNpXOFBLQgZJJGHg0yIBCXvfYQOO2CQI0Ya+mT85jabAXuHmdii3VOthB4T77Hu178FK0IB7c/yPHr32D//Pv/uOv9j58AADz5G/+er+aB8cyIH76b/3x+GPcTrLb+Ar37zWtEAZuhNExjNKPd+9gA77nFblHVbn372woy1J0WI14TsBrdfYrdjpkx1Jk5C7k5NQ8kBa/zTtATawfbiXMi1ENDdOEWu91tha6hEpbdziUKmRgbRmyk5ZGWhDEF/Us8Rouxt+oCEatRxHgAXzxtsYxOahuQkcQU47LW1x1ZutdfkToHmleCtpgMRo1ddAB7u7DQYswkuu3mG54SKplSRkpPhZr6ykLnGfISt1NAYy+6Lb5UaAaDOsZA8Ya3mZwHqk8Ujb2iz5tYl7ggw3KXmChYdy9kslbq1GI/3+hjKkGS0eaYrixL3+VtJu58/Dd59wMz+2ePOLjtfl775q/y6mXl2TM/zi999SLf/dIXKAdnyC2j2WGqeEnd7gJlHGIUPxwwHizQ1cywv6Qc7pEXS5JoeMdLYRi2n19CxkLRQEpvPfFbAU3JA3uHi/D+WyJnZW6V+TTEgXjjymuvk9PANE0kaazn0GW4t0hIQ2B5QJ1W+HrN4M65O+/ARoW8j1+7xBqltMaUBoqt8bmQbzpgfXLMYpoYj85iY4Y6x4jVImI459ynXVEcHF+6xtFr3+Bjd7zEmy4sSbaB+Zg/fCnzpUv3cf2h91AWh+Q80ayQpom5QU7zToCbc0yqkqdA4Xqsqlo7wNsx1RMLn0nfeoKffPP3uXD2Gjdf/S4vvLzPNxcP8itPneHCQ4+wXC7iGhz2ySpMJ8ckNzY2kT3SELfj7DbNERbV5uiQ5piipPB4xrrCO0FzLNgmAquSE7663WQlLjpVZZ4nXIVOsI6zZZoDIStC9kZOI2Us5LGvktwoLniRG1Q7EVJe0NbXe3x2gGesr9VCWBdiskwUwZasq7QntGVscRhdI4lWJ3JObOaJ/c0l3vrCFzjKz4XjZHmWZkc8cfEKr7/vr7HRCCGLlNUtLyQEZNoLYCcU9JGWuUTyHGcI4R6yITzvAxEpFjn0c4zSSfh8iqY4Y3ybGuotJqYVLEXs8NmTZ/nxq/8Tl6+vkcW9zMcvUY7uZ9CrtPmUz73hz3K5fCByCnrmiPRcii3rIFtolSzFZYU5YiukriEfhCbAY0XVPCElIfMMvu5C7lh9zjb3Mf52CthH7WIIC6yt4/LXxQ1tmirUinR8r3uj6aJ32HFubpuvtG1EMVyG0ElJ2rlfwikmZAGk9Yt5TdIlVk+QnKFmug4UdETadUiKWSH1wqRK6LmchGlkdERoWrdWa4nJgHvPfsi7dEzxCjqyHT94iylLYkP1gTQ4H3n+n7BeXWNx/m7SfMq9H/jb/5/e/z9xAfD7v/mf+H65iXblaW46POJ/LT/JY8O5qE5bjCvaPMULsVCgt05nou+UpdVdRx/pgCEeqZsaH0aJfWOGCE7pnnazCBiSNESH3ypZ5gjRoe6U/6mPz5GyS8hLhAp2+/B4fy+yRCa5pRnI5DQEKc3peoEY6wH98r1haXQXhhzdh2ommVHZYhot6E8SaWZShthVdQWvxmgjulViYkEPqwldROgj8LmPhqL7T30MdObwLKvrx8zdNrJ1BIgIWSP5Ln5fDxcSGJoheZ/kp9S8iA+9VUaNQJrZLcBDraDJ+pc2uqVUCuoFbxH90uZTynjAkHLPbqCPxkInodaoGhOI2C12DrZ0foR0uyCJtlrxxou/y33Dk+ypMx1f4ba3fYxnv/Mi37zzp3iN2/nsb/0OFx/7asRil+D5YyEqc0074WJeFvZuPsOwPCLnhAyZMox4Vsa9BWcPz7DxhtXKOI5Iq2gJUMhms0FSpBAOy4Fh0XMXqpFx1m1mMg9xYVc7O8r62jV8rnhSVqfX8XVD90acxs0338zJlWtoyQyaII1YEtbrU2QdUKO61c6kRDk4YPbEmMA2J/093/QDhJ1DJufYh87zhjSMJDeurdbMl055m77IBX2cN92SOaNw9qDyzRdf4XceP8fVN76VxV3vRfcKzTM6r6kpfMakEGGFOF2pFimNi9y4+dLz3Hn8GG+/5QUuLM/wtc98lTve+Ta+8D3n06/dyuqWN3Hbww9xVCdMZmyeaC2TS6RMahmYT05u+JdbFJg7W20Xy2oX1+oQWezeKsMwhq96G7ZikBHSOEZn5SHyM5/7Ra1s2txdEAqaAu3tYUnOJZTki1woSSF3PVIOe5hqBRtDvNeicPAtaW8Ll9kmm3rkBwQQaSInYSOZYXZUNswMHd6ScCrVFasb7v3KP+LBu4W3ffxnee3l73Lxice4+OJlnvjgf0TSPfAamgxjp0zfnqFbzU/yRE2gFm4hb2A5x7vphpgGaEeiOQkGS9vB2raNANuocBm6ODDcWXU74WDBA8/8Eu8ZvkJdXKAdv4aXRF4Kr9S7+d27/xZDuxJaLgt0ecQxB7Y4yHe6O/c0RWOfe3DSbo6Ogke4V+vIZ+oU3Jie8EiOFMOYmAa90vt6bDsGl67P0E7uiyFI0EqzeuetxHNurt1ZJahHU7bVbbjkEA+6RKyxgUvDfRPr4P7nZOkCWqm4BK45qSEeiN+kM2iiiZJdQzc3T2hOqCzBGubR/dO9J8Ec2cSEnG3zp11oCdLmXbMi3VJakjPZyP0vfYoHDhun1y9RFrdxsnqBR3707/2x9/sPVQA8/8zv/cLqe7/2d+zwYdrLX8TPvZ2f9w+BXicbN+wkvfR2CQb7dqdce9e6e8BqQ4eRZqGYrxYPsrrhW7Ti9s9NKch1te+nm4HPPV7RupgkbIdbkMJOOOHskgklxUEwqICMVK/k7atPue/jYwcZvPmALGiKaM2UBGbii91H6NsL0Ekxpa+NtVQEGCxQydUMYxO2EIusA7COOVbSFtnZBXjqMZIVD+dEE6JLcSF11T3eA35EUA/md17u7S533CELzZSlNJoEEQ8VUvfXRjcWa4BCg2ZYJMggkkjM0HJ02ZZB51Dmakb7yE8kuA1DFy3GZ9+dIBpY2Mh6kN0eckdBS0p9/Rr3v/5l3nbvyPkL93P9xS9zy4VzfOGxF3nynr/IZjjLo5/+HN967OssTdBWmXyF6IJhEdV+XZ0iCfbOHnDTXffjOpPLkv39fY7OnmPYG8Ea6/Uat8yw1wWOpohCtbmLFDM+r/HqjDcfBLthR0Z01uu6E33lvUX4b9fOcn9kXm84PV2zWCzw1czJtGLv6JDVZtMTM8OXv379FdqkeFvRmjOOy2BXLAZSHhiqYykgWCOxupomQws3XDYlVi15CKtVSSFWmx3miy9z8tI3uW95wt3pJd75plu4cOYMr19+jCe/fyufObkX3voxfGlINcZWaaodyW3Mc6GuLnPnxSf56Te/wr2H3+fJ31deO32Nw3fcx6eeupknr9/ENb+J+x+6j4WsGRf7eA22RdL4rgS9zJnnDTZtQg8wB33SJ8MXcbCrhabH25qclhHLnZTUws5YhtjPp6HEntrDHqtjiSlaKdQ29wmpU61SvaKeYg3XJuoqRrU5KboY2B8zw95+kARFkanCIlEaVIRBWlxQnqiEHkB9RH0dq79uFc2ecaYOH4s1gjv9/PGI5c4L2nRMY+TmF77I246/yN6Rcu3kGsLIE1fPcvqRf5cpD+FNJ1aB27TV3ZjbwxIaRX5CbYNpiQKlNz7JMk1jdWdeY6LZCwr7AQ2BWKNhYW30jLQ1llJfe7T+9zZmh6YL7n35D3j7yaeQ+XVKHnnm8GN87dY/S5k3SBljX1/XYIH7FRJSIvxo54aie+s9RvGUFNAziaYsCNUxFVt7I4mhTfEOotIW6GPJCZ9ncNk50MjDrlNXB2kbsA2aFsxpCPRxF5NmUayddjV+NKH0lZ1UIsaZ0lksjqQSin6miI3OS9Qiv0E8yH/NBWwmKTEBDTgHyWrXpBXEVvi8CV2BDt1qPAf/xT2mFRLk1Pier3vjFCtxlYwnQ2pMKlzBmlNE2Di0ZeGnXvjf4OA8p899DfYOOLjno794z4N/5Rf+fykAAJ7+7F/30+NL3Ly8gB3dyj9YvY3v5lswr932F/vy5LWzx6PaSqZIq1TpbzSRatQkOo4AZ8RFvh17+a76ld2/Yy1sN1EZK2Kd/6y6Gz0Buw5YPS5Z69YO9cgdQILEJG3TAxhKPDx9n9Q83thMY1aNceNW5W4B80gponQhdknewlPeuugGLJKd6PapOoeFjBQ7z+SohSJ3+8UXkUj1kxKwHm9k4sEvfbTlYrtxMyq9MAg/vKQR6RaFrYUwDYVUK+iAt7BheTMooVlIKYEO8WW0DRWhZO2io/iPWVdsd2W7u4SfWyQU5gKLXHb8/7joYVZ2o8qtm6CkLWLXGXKiiDIdX2Hx5D/jfH2Jm45f5u0//dMcHd3Kf/MVZe+N72LMwsqUL/7W5/neH3yRxhiWtWmOSYo6A4qXxLn77+ORj34QqRvmuVFKYnN92hWFU22IGykJMmTmTbek5cQ4lqB3tS4eK07SgmtBqMyWGIsybTYozmYyhpLCJ048G9NmwzCEpar1eOw2NTardbhQTk/wMnJ6fIXxprPUy5fxIZH39ikMaJtoSXb47JSCVyAS8c/e6P8dyhjJi5IFaqOUwNnONYqvkysn5Nef4j1vMOanfpP7bt3n6mnl6eu38dzt72a4/4Po5lrs06uxSYU3Xv8mP6qf5/ah8Z2nXuD8A2/nt146x2cuHnB1PmC4/Sz72bmwn+HwHGVrGZ2JXagKbqFMz3PFpxXNouhX8xiX15k0juHLtx4SI04Ebkm3Rhk5dbGdh2UtOva0ozhC8ArmPiJ1b7Q5igDrltygi0bxZcBhFvLyINwlIuScGJiY3GEYYlXRkao6t7Bs9e+Ie3zftxM38d6N27SLvVXt0BYP7ULFyd7YGOz/3v/Iz/zE+2jTMd/51jP84UsZ++R/gM1519VtV4i7f/aGYkhPYAXIaevciLNk6/NXyTtFe/IEYuGVT4p56RY43bl1RCO0KvWJjEuM8avXcAQZFJwpDTQZSHZKTiOVU2zugu9t5+yV1nfionuYT/HzhAQixMtiO3yue7ABpMYZtAVYS5tp5qSsNI+JYWux8hBzWpIe793j5bcWPgF02HFNRC1ofB6fx9ZKLN2u7VTUQ7AsSdHZY8UHu0bLardnp/i5kLrLSwkoGzGxkTAhOAWxGoWQjEDt6PlMWV/FbY2WPcBoaYzJBYnBIlo74XgqbCc+1uL9VBk7GM4wHVCc2qIIyuqIZG69/ge8dTimXnmF4eBmXnv5u7zjp/77H+pu/2NFgNtfl6Y72Suv0bKyefWr/PkR/oF/CARMM6php7EUpC1FUA/msedEavGlixCL+HC93shgDnUjXcAW428X0GqkkqnueB5CaIciKcRn5krKJciCrcblX/Luz8tutKQgwuwRd6tiEeShqWv4A7XoZpQCTmISJQuIhOc8fKTEB9ig0MfsLS4UmwVtINqoppScdsWMlAGf+kFnrZPAEtKCytVtBTQrZDfEKrVXqOLWR2Y9srUHSTSf0DQwDAvmyVlWpybDtAUhzxM2b5CcWYgzJaU2pUiL/ZNnTCTG4kXACtmEUiu+UOYKpZOxZnOyC4veuc9zt7hIjOatVVLWHQlwKCDNacl2NsIAGg2RlKfQ5gpZkYMjVm/7OZ67+AwffOS7TMcvszk4y9l1KKxPplgdfejjH+La9SusvneRdrKi1g2lFMZxyd0PPMy9H34nC5876bFQhi7G3Bc2c3j8sUpeLNlsNqRVDWa6Rsa4OJSSaNqY1jM5F5rN/bNuDEPi9PgaHK9Ii4xXYzMpw8EB8zSzvn5CGTPTVJmvr5FBWV++znC0jy4L2pR5KOQzZzg4OmBar9D1hroWdD1jY8HGZayABFILtkIw5LsSvVuA2hRj0FyUaXLGnluhGgduEjg4uySdew+PzY12+92Yf4t3vfOQD1044qWnvsm//MaKF9/yfuo0wd4R733t6/zo/qe5cnHNH8rAl+zDfPXZ+xgOLnDbOw65qU0shz0yxmThhvC6QutMzUNMhXymzpvY6ariQ8JWK6iClkITAxqsZ4as1BYEOK9O3huwTVxYZTnC3CI7vQyxUrJYH2URNm2K9ZsDPsez3g92EQ0M+Vw7yjj82IssaFmgGJricBYqlhJLLEh1Jb4TSkLShCfrr8u6Dz/1UXq4OVwiPChMRkJqAUaSvAj7WW0MKdEU7rn9Dl5+4isMi0OeveMT1Pd/AGplSBK0P2uYxYhJmuDJu6jOyDEeDd2QxvjfmYAOISLCx9QjDE1cQRuWCiGTrj/gV8ohup4rY9+VV1GSWeh/VGjmiMIaIdkGZUZyYrYN4uEoqkQQEzhOAaZdIZYlMO1bb34UmSXEphIcfW8W3X+feor0uN3uyBo80XzuF5+G9qGG+r3VSLFsrZGykqRgbUJNkSxsNJE73a/ZFCvEtCA1o6WYaLoLSVoIATUyDao0FikxNSX5TOuI4pwz1ELVGfVY39J5BNDr1zKiacRmxVNCrCASnAEbRpoHmnxhDRyah0W76iJWmRJOHFEHGQMURQuxbhFajWfEO5gtmgQBLzwwvcrJ9x/n6K73cnL6HAd3veeHvdZ/+ALg/R//m/LY7/6HXtMe63Q7d55Vbn3lBb53eHe/rBOqP6DcJ7pQ8xiPtz5WUwvvZ7PoCpKG5z4sKYIjUOvO/uZ9D7pNG0NLBL4QWcnikfYmEiOnEPdJF847rjn8s9pfrHRFJ13Mp4mk4YFWjZG6SWCOxYwmc6zMemxodid7/LxbX6driUpXwGKOjs1TdPoadrPcHZIx/gndsKQgKKYU64AsjS1CIyNdRd+7IJ+Zm5PTgIoy+gjqzDWcBbVoWJKMeEC62LLOcL00Bo94Vc0JZkglYkirVuoUD7kkqCn3g0uY3Ql2duCCZ4vdWM49RbCAWfikqY5kR3N02k7DLAA+Ud9Eh5OaBIl56Glb7uiY4d6H+Mo3P8+P3L3iyrcf5eDVAy7e+24Yg17YfObH/txP8sLjzzGkxG1vfpDkja9/6fO86aE3YbmCJ5IbE30a0e2cdbNCNWMpUiiTQVrE3y8i7Gskc01mqCTyXop1jaYe3qjUzZqxGW3MMBaGPY0RL8Lm5DKsT7CpaxNyouwdIWnEhwxmtGvXIpPAZqQa+6WwOnuEHV9DWqPJiLpTJ0OHkSwVr6nHHIdt08yCNZByJJLJGLtTYroTskzf5b6rJwZ16u2384zdztNPPcv7vvFp9vUSD47PceXpmcWdH+GeF/4XfnR5ke89U/jqtdv5THqEc3c/wP1nE00zoyTWm0rKME8ziIbI0So+z7s0zdp6ZC/g04RljZQ3bfhmRVnuszHDx8BWezJ8jpWaNyMPGRBctavcG4LSqpCzxph1noCGFu2dYw/gmmasxTqwuZM0EgWHJGhRxsViJwjW3GN+CRU2OkQWgBCW3E7KbKZ4BjPBugA39xq8KZGFoAONWEk2XeBUUk67SXfVhPkJNw1wdP4enn7iBa7cvaaZkoCpr05FEpoi9tyZw0suMZls3qLBIZNaWOncCuKVrD2BUHQ3OXVVEBBP/aybo7MXwX1GsuLVaSRMAgfeUoKutSj9fdEc1EzMuuDb8LamsSCrUWtMHxshzESCDSOaQuCWOse+hqMKGXCLJoiueE8WQkSxhusYDaLVsJh7Q/KCiC2YYvUa5kHcjaGf2y2F2JASerBxY3he0dIy3lcq7hPWqY1YFNZuNTIJuiBa3NlY0A3PtFc4nE441sYVfYRhTOgcNmxxp6miDDHh3P15m3Bj1do7+njO8D1KCrHjLApsaa4hKo+BUbBmUgsHRLWG2Cb+d9sDCSGlu5CtRYMowl0nT6J+iuynWFFI5v6Hf+6Hnuz/0AUAwMm8T63f5/yt9+PXX+dndeK/mu4MIhw3CFVbi5j26EqI8Z1ZUAKDz29oEbyFYC5ljf8vKcn7TlmjQ01FUPGO5Y1qXHLCq3fxUmTXB5rSItxjqwNIsduSzlh2987939otYj0g9AuwV2HuQXQqYWYPjniKB48UgrvQAsTh11ojaTxMTUNdnCUztUb2nn/Qx4dIQ0VpXhnTwA0oRQu0hEZhENGalUaQ7ZKE1UZzpNfp5KQ8I2lkbmtECu4xIUndwiQIuULTiuaBjRm5C14qvetAg8VNZFy7edhozJBMCIZaTAFqjlhYmkEWRGB2YelEulm7IUwsEpvAlqKrtRrQo0bdpYiZyu7ve+XqwCuvXeTc/jnqlSvo+jq+uDl86iZom7jr4btpmwltG+Y68dB73kurFbcVoe0l9vnu/QAliGnVWA4DjtNK2DOXUmjmWIlxciJWOEXCn17LGpsKpRTSkJhZIFNlPj0NBG9xSkmUknAbqa6My0NsiL+4lJgsSU7UEirrOoXPpCrko0PmzYp0eITuh7siayT9DfMi9tQ2U/aXXazVmE9PaOspCliJ0WhyDfsmsddtSWBqIdzU3klbotz+EL/3nPHJO77H7etv4JeeYn7qBf7tn7mHL3/9dT515QLPprfzxvc8Ehdzoqu0jeIe0CopTG0DNgERPjTXdUxeXGlZ4xluNaxKkmnSGFxoqxP2Unj4m0csrejEOBzEz7wYwunTKkMZo5BQSFpJaQzhbVKK6q5BiHFxoiUjpxK72c4d0SGRslDIIfxMCWGJEACinAp5R8h06rzBhq7IJjIxUrciRg5GBP20eUZwZFxitYE4BaWKkTzyKUQzmmGahXztKjdfuIULb/0Ei4Pf5+kX1qgkLEFyZaaS+pQDQrAWWQJ0XoPHRV+3nvAtnlx73LliPepWOgcgSQh5xb13+Dd21To15j46j7hwoQK0ORw+3rG5DrVZRPdK7a/PYCByNaxSvDD5hsSIpJ6CqSVWwC2S9KyFk0u1/wxIj06/cbeIReDbMgszCrWRmGkeK5jMIp5jjAh2AZNEa7Fq1KzdZ98gRRx2lhqrTonMitZAcyJJZhalZGW2REqt54QskGYc1kv8xPjrnFlfxHWPf7G6jUuLWzqLICFWyRox1CF6dtQr2YXZIxE1UhZjeg0N9eCniM4kL6F1sxAfR3xTFO5bfoqIQB4jHbdJz+EgUOhtAxbPxx2bi5y75SFefv6Yyxe/xuKmC3+SK/2H1wBsf339M/+xX3n+KfakctnP8mvnPsn3D85TZdyBJ+JS7HY1b53apAGUsbBRoB4510Qnvi0cQjRGCPJ8W9HHbl/mGuhDh+Qtqreg70Sbqalfkn2/LtYpfxWVoQc6dCiQx8PQTZlkLcxtQjv4Y4sCzSkAD7mjeOPn7QRBBOtwom2ilGpYx7BIm+om0QAd9RWBag6Hg9Bzw0MNqhZMAoEbdhYaWxoeMvac76hYi/ZxGg1JceEPLqzdGVIOZa6HFmDqGotMZMGrt1iraCIFAI4kSiaEPBtvFNHewYfiFJGeZxD7ZtMtG70EmKlFXLDV1n22czDlzSkpkgW1F4Kxy5aYKCSleeboqU/xlx5K1NNrvPDiis/sfZjTm+8GLNL7ahd/cmNHuPuzbKbyg0mP7J4ngHmzIefMus49pKhDrJL2rIEetuhBL5ttxuZKW22odWJ55szOirdZBSud0rUQmzXzpjKMI7JI1HWofamN6WSDjRnZrPqESqiqXWiadrx20bBilZLYtNAXuHURleYYjbpjtWHThrlNIQr0re6lO3CyYin0GUUTc3/vpBp5zNQK5s6F736Fn77nq1x97rvocp/fOH0vz9z7Ce44OOzo1il89ikxt5h8he0uVnitdrtSm/HKzhJrNlPdKZrwOsX3iMSE4qs1YhusEUVWEnSxJJVC2lR87M4Xt10YjZeMTpt4tgoYmaJh4d3CthBhtsY0xSGci1JbY1wUFGdIwbtwGnlY7JL8clrsRtRWt4rsTEmOSaSPqtfYuCt4n6u5zcg87yYK5ukHfhbt2pxAoCeEN3zjH/Mj99/Ga689xnMXr/D4hb9AefNH48LtMbZbFTqEl9wlRYhQL5RVFQk8aX9PY6/uFv+eicYInBorBQlHUawhU6eGGtI6EjqViPuuEaEWTqeZJimU/a1G6mpZUh10XvVuPwLZcp+yzeYB8inL/ucHPRMIF8ju54vvLR4I823jpPiOXVDEmbWg87rjjcNibXmI12IVt0jcA9npb25AdgzN+1SHknpeiK9D5Z+OcNGdY8ndgtOvQYDUFDC2Zso909f4xNX/gc3GyYeNJ+3P8cVb/xKjKXgm0Ve3Ht81aXM/lwUkM5mQ1UjttEsIBzTvxwVqJx1SB0iiSerOl6mfA+POVr8lkHp3XCWBuYL6FIdVe4FPPPsp8sGI75/DNHHXu/7mH2v9+8Fff6IJAMBbP/L39PHP/F3bO2ebwr0AACAASURBVPcGblpd4q9evsh/wX2IzLtLXBBEYsenWmO0GcNJSoqIXSP2GGo1gl/wsLNIjEydGBO1FoE3c90w4KEA9ajorSTcM0WhaSbjuEfH57S+F+1MbO0ozFAQkFIghkUkRkluERZkE8VHmMBy0O8U65SmGO9HuEhoArzViIPUHKjXPmpDC16niJi2GD1rjgsvEqqEVGcsKSUFHSFwfd7HQeHTtR665B68ciRh1ljkKIRMHREN8YyEcnkYMnWaKHlEiANaHFJO7Iv3iljJJTHVyCAYNTFbQENEjTEJ1mL/LxIktmqZIs6GfkF1jHHsL1NP7IOUldksbGwe+QMR4jH0KUBcFpE7Hy4QxDi2m1j5Hnvn7ma/Ps6Fxz7H4+MtLPaWYelKmWbWZ2aRnhUUx8rsQfC3bTGZ2NmIUhZEwgK5yCkQxXPsWzebFa4j4k7OOVYqzRhyZiaRykiZJ9pqwzAI89wjOukHLFG1l4ODoCdajMHnbuHJywgPUp+xeY4pig4xQvRAj5YyUK2AgHZNiegQ65FEWCgzVIecFU8LbCPIetVxy9H1DTkKFzTU9FNzsnQ4iybWU1DzZgqvPfAT/PI3rvPew5l/efk2rt77SW7bLxgrMJj6+qZu1vHd5MaZ0qyroDFmSRRpuG26yCyzTILliFqlgqVCaRUWhXnqAr9xj0SBZUaaUYrFXlSNVusNm12b8VGRCawqaQgtkQdpKS46tyhbOypaNDOOi6ANdhEneURlAyXWhFZbjGvHMVgde4pXJeW4VPFIEK0UUpswHUJvJIYwUDXj7RQsaJzkgqZggMyqlByxuwcvP8Fbzu1x/dK3WM2OHD3A8MBHwGpc4H1KKt7Xon2S2bBYrfk2f97xfnFa013GB10IiIdGqG5RuKQOcwp3UWsS52kSTAvSGrn2UbzGYL3tbHsRuNOqkVpUmTHV7XbmBFZrKNwFpIw4iooiwwF1njosh67fmJG6iWdHMpoPAnyTABqpdRZHS8gWsSsSKw1dxmp1Xt14Xb3ALwjuNZJhdYwdqykLmdB6ihA/l7eAnzWi229z5CuY0sOHQrkvrVFwLut9zAd3084JPr/Cc/MjKMGLKZ3kKlt3jwEoVQeSNZI1xrSI71GHpOXS3WmEIDvcO9sgoShnENtFCCOCt2j6QhAa38X1FMJAErR2hp+6/CssHnw3i2lidfVx2q3v5E9y+cOfYgIA8OTv/deu/jKXn/02t7z9/fz9yw/x3Hgh+OjJwSravfcByOnJf1sAD9YT/+Kid+ucf0ByCTKeta7M7B20b8K2ouEaSDkUltuXm1LqosOugE3SRS0FY0Z1QIgFntVeeXdRVaSGRXUPDtswHQucq3glbaEZEp1JrVOICAMQgNcguJGDeUCXDLo7uVf40pPtpOe3R1RkQmd6qENwCYoGRzx5ii/WVmXcv4i4kqxbG2kghdxjJscUQIpaK7NEeM2CgN9IUnKCPidHRFm1wIUc5BIWRG8hNCKCR7YTDVUYNAU/vtuMsnpQ2/KI2cTUcxaSEWjOufVYWnYXSKx24tFLsp0YgUmlra/wl+V5vFxm//CIl77zLJ9+5YirD7wfLfshzKvS44rjfaHVHUIz0qPCF2xtJktYs0yie1NVUovLzPprqdMp9XRNzpl0MGItCrLZPNTHQw6iWi5hVZ1nmm2YNxWrjfHMQfAe5krpkaFmRnOLvXTXF7RpQ67xe3y52Hl7VVrAnbYdRAlxU5bcUdUdWkOBEpqP7fs4rzfY+jgwrh7Wq63CvU5TFNt1wojnS3Mw8GnKUJyJBVdfvcjB7Xcx0EE6ZohHUdhqrK58nmgSVt/ixtwaaZGZZmcpwQ1I9HWaGKQFVkaY16TNhrlHzVpOVB9hiO/ScO1KBDWNi93Zojjm4fBJFXIRNj3gyhFKjnVUUBfj95StyruFq0C6OwScnEsX9W3/gkixi+jbFolxWKdJ3khYK24Y0LKSvGGtOy5cYkphc594jdFNElkVUlMUBDogmw0PP/tPeeubb+aWuz/By898mf/za0+QP/LvU7z2LHqPs8Ui0x0LR9MW/01fagI7RPjWricS0yM17StSwdMNW/T2926Rua137Z1qEmdU99Zb7Pqo0sgQTH3mjm4PBLWI9Mz5ngQ57MdnIBboXuvCyD6lcw9qIbqKAJ5u7U7a7YNtIg0jNKe5RGPSNv2OIGyMaWD2RPKZzqverYfjMw8apPcL2dIS8Q3ZTsEXtO6QSmno7BJDferNqRKxyN5BceDFMdvj8PhFzp0+yma4hVdv+iCDzDSJcyPikrtroAeGIYZp1zfURNZYwbkMwQeg/9ySo6i1uCuSaRARVKE726oHgyQGI5Ej0apR+vd8Y5nzVx/lI/UJrlx6nOHmu6l15IGP/d0/8X3+pyoAAJ767X/HD8+9lVee/ir56N38/PB+kjpzIgww3ce+HS9hE4Z24pL20dP2Ugj8bWtTfBlSQueJug3FYY7qXyNAouVlt3QYORe2YRwlgdSMaUU0unNPufP9g/fdhLDpWPfCS++OfRtqE1V+tbC30R/MAESEvcubxQ7YI/BmbjfG0fQMaUFjn1NjzOU/8KWNL32BFLjIlBKpTTjRidK7SrUQBwZgpwfMpEUEkIhF8psmUt8Pp5JhdkomqvourhpyZs8FUuy6UWVdJ9RCVSwpc9TjLtfeOojCycREIadwdMydG5CqoSk6j+wdP9rBHk0gW1w4tesorK9UkgothhjBD0jdK9xZAhOOfvuz/NT5K+wvnFmE778887nrZ5jf+vHYh20tUijWZrzO5BTj8rRlRkgcqrVNiEDOhdq7l4xQa3duWPzUq9WGIWXSQrHqIdrLwewaNCyOnrUTDpWqvZDpoCZ3gdUaLRE1u5lbgHzMkbJAc0w5bFaqr6FarCF8mxynSJt6Jxbrge0hTwIkRW65K03mEGh57FltWtFqcMylGpNvbtit1PEaz6OqUpME5EgS4hvQgSQHWNoEudKJAms6jcupBhdj621vtaJtewA7qQlNG9atf4MEw70INGZkE6uSLarVPSJSdVgwr46jUF5E3kOwezLiMHuIqJI4XlNoNFoELXmLWOFmG5KWwD97jJubB5BGqu3Wkako2gNbWj9Yk8S+vuThxlNuKfgbElz5NINr6wCgjHv3dXehnbHVO5VwCNkEtWCpwbCA9Yo7n/4sH3nkYa6/9NucvfUePv/ZX+fZD/yn7C3OMe3Ip0aOSLxO0au98O+6JeIz1x/4jtHPligaejFjLaZKVrudDNQyzVZRHLdTxCw2LOn/5e3Ngm/NzrO+37vW+r69/8OZT4863S2pB81SS1bb1oAxGGILxQSSkIRKQS5SlVAhRVWKSsFFqoCkqJAKleKKoqC4SEhRxpRDMIYQCyRb2May3LIlO2p1t6Sex9N9xv+w9/et9b65eNa3T3OTKiwp/yu7dYZ99v72Wu/wPL9njdkKJzOUyrY20jwLIJQLxcVEcOLOKrPb33Shj3q+yx6pNU23bMDwntMykMy6xbOJ0hoTREfcZsfHM5RW9RosMUcl0fCYyGlFdYFvPQpmW1pUrbu6K0Y5MT3nwMHyCClTI/Vgukm6mZJIJseSVU0lrc3SdXkTXM6kZvEMyTOJTLWZSHsMdYsXncVa6aqw9HfcPeEZzfy6/Tul3oAiVC8BnfUQ5mIVWMVY6d8UrTd/CYYD2cajolN4g5V9rQNaJQ2H1GnF56a/x/bqc5x/9D/ixkv/jHd/9m/8W43+l59/6xXA8tPKY8ybm5y78hHOXn6AP/TC1/nS+BjZxi4sW8aGot/Lfxo7T706Fl38Eo1BHjqpjqClDHVDGkY8RsElgi427Hux3s2XUsT8biHRmoVEUSl6JTyTU/eFRlVBYHp92TRR1oRM1pPBGntpT+Nka5iVPmrtI7gu0E+InCabSMMouIkAFc13Y8Zlz5tNeMs21x0+M0dAg0ZhML0Yy7lHeupHsB496OEz5KxCJYb+KzQ6tHBsMGrVjixHZS8LzTsn4SwtF1a9u5l7PsM6GTVr/ZBIpG5/qc0FY2mJGsE4Zqa6hTxw0mSeLHnoWgX9G2kwJpN1MCVac0pSkE5zSEXdx9BJZJDJuTCFMiLKY5/lyW9+kR+6+B2uXzvi4Q9/Gn/+TX71pWdoDzxGji2eJOaLpolRBIQ1iXxMXVoNcQJYRpexkMUMilH7ZMrdWe+vtNu0JA2ISbCkACUk9pRrkW0Tx9z6c6uCr2JjwnPq471gstx39BP4qutenBKZed5Qm5P3VvouLSJYdynIXSr2GpUBZZNXvAs1s7IrmgRZLY/aYfduMc2m586bns1RtlzHsWZYbHAglUHQGTvqY9WCtab0SOshWAO0ORRxXbLU+Si0JU9Ve9A+WVnri4unIEph2GyhjMyG3DTTTC5BKgOVxjiORKyIoVPOSMKId3RrCet7fwGaWgR0rcwUA7lo+5tcf1bFBfnCSEPu2puQtbhf7EOfpmAqXqzJTeCesKGDfGhQA0/aKefUC1lbckVQF2cCU0XbklOmVijFyB5EnTj8zq9zsT5NHK0pp8dce/0q3977ccr+JZLbLtzGCE1BnM4K6d/5PskkwJYkIu4wQ2gC0sg2ZyKZIv+7hSYInivZNFFKZQ9v3f9uWSz7DLWqzJDtsJFijeeMzVuJJkvpAmetbBfUug0jyRWkI+90Ira3KRZQ+iYToAVWBjwG7doXLksL7c/r1DVddJhUgixmvsbgcy9Es3RvfbphSah4azPkkZZGEmIXhDmNfcJaRyinHX7dEaXQGCh5TeVUwsYwFU9RtLzzWfdSFnuipdCz0LZ9FeHU+YSh7OMWWlWnO6TA8J7pkFakmFRoALk16cZCNuls0oM110rR2izaYRowNO0K19o68pqtVR47+gJ+6wUc4+bLv0xth//Wo//l5/dcALz/x/6ifftX/rsYSuM7v/V/8AcvfZyXbr/JM8O92Fi6Yr/nIHUqZDGDplQ2+kFH/2Cyw9wk8ouqII5IqHosKzxkh4oWWN3qQbSBhC4+7198RQn3vRlDx1NKWSxQR4fhpL5vH7RGiGR4m/jUOWNzuuXpmiGt8EiYi3kPssCpagtylnOhzrOsiDJn3hlRdQukJ2f0pD1bgtx98lH0lbaU+vTgjuBuEfFYytp7k8TEjz4iTgonSokeagGlIy5rFgefOTh1oX4HrWOp2w3bnElZ/vghGUFlM8OQRwaC7Szh05hgmmdylvhwnqWTmDwEnpmqOuYicI337swxcpZ9KSWorhS6scM2cMNKIXUvba2BJRPVLoK3Hvg4Rzev8dgPPYGvzvOeD1zgxS9/hVcPL7E9d0aFDtolay+Zdozv1Nc0FtbDmzSWb65VE+Z4a7vpxhIlah2Iw/L7+++c3PtI1vtEK1F0EiEmhOBCXkaKlGKEV8aUdfk1aWJav4wEfAoln00zS/wzi7J7kp/aEQ2ScU1LmljsHLZJaZILNjb1jsSbYqfTONC2jbFkWjTcg2GlmGOfTgHpYlrI7lqCXVALS26GOXPXaKQkq9PyXmaMXBK1oS49FcyV1Nc6AjYNIzgMJl2GJScssDRS+mVmtUoMtluTbMjhOgBjJBejRiOtR3DDT45kES4zmYEYV5gpJAaficwdZn6bsazCPQcsXm9PYvnnPGhHO7tEgz0AJqEzwppIjBEKlIkOlEnhhDW89phiunUuZ2oXwe7dvMoHhpd46IH3Yv4263d9iG8/823OfPxP4j7jIStY/zChj4e1xrrT/fdwbowBFuGfW0fLVjIJbw03FeF0TZBInYr/VsSuxJlmRTqrbnsDvYzS15Eq/4O5zeQiC6HqZcNqMKUg1YmSSifziaDZauibUUyZHVbBdDYOJhFbTnt9cmbkJg2W4pKl3/C+ZoWivIKUNHWIUPETGz3bWfoWrQKNlFaQtf+PLpZ0d4pNtO6kailYJeWuzCGMujHTJ/cE0SFCCPVsExZKBY0alCKh3uxNwmpD4r3IeJUzrWRkeewVXKo92bXbSz22pCiE9VVFDFox97OmdHAeZjuLaIu5B7d1kB0zd528wYPtVdL+ZTi6wbVXvsmVH/ov/srv9R7/PRcAALdPD9m+8TXe/eFP88YbL/EnxuB/SpeoniWKC+0VtbeOHtSx7HAVk1q6CpacyWE7D6/SllQB5QCzJFFcMYamh0aBDdaJUOpCrXd9qecBtC6qyeiBlIsk6wG1psuUjCUn18Szt08oUUhpTxu0BCUEZSkMeHRMb8q6SMpAGTObKhFkySusbTWOy1umOhJ5K1hIjFCTfMj9/SgWfb9veq8w/R30kJPutQV6ulbaFSFSwGc9VC7IhxliiQcMZcU2N6JKQTuOK2q/SKbaGIZC8WBIha1XLAXz5ORBgpZkBdGuKmNKnLZGMYFZfK4MpehAbTMDSeFH0Thxic8ignG54ExZ9xRNQgxn6q6KMXc5Xf+ypnP38I2XL3H3yS249QKxbfzhT3+Yn/ulX2T7kZ8k7V8Ebx0BqmS01pzcvcWQenGUxLtPhVQMrzrsRyu9iELCq2Egu/whdNqiZ5i6zTS3IFJiNukohpDqfPGrMyfGFGQacyRKWnUdSKOWPm2alUw4GJweHDIkw6eqAKF6pNdR7oTOiAsOm6PbDPtrfadYYqt7THPuUsiQiGssidaQGK9VphBkZRy0AlGmuCJ2axXeOvXJg2XtM/vikXBBsxaew5iLbHhITNq8kLJ0EmDYGMxNQs0Ss4qioWBzIq8GLPIdfUk4ZRiEoE39u51l47J5EgTINlgvSs0zc0i0WVImtkfAGcYhUBx2InUxnNFIDkMZu1W4EYPgOLpUKu5aR81Zoi6tXdLOMeKkblnrWXopyXo2t11XW3p6nGSzidGcVcDGr/Hga/+YD33qc9x+/Vtsjm9ydOOIb9z/B8h7iWHWlS6QvGslwgh9raS9vr7PWpdqOqpxV+5wMhHgWpt7Qdnw0FmYQ7qS6otleiCnFTgqtKJDeixDaCLi0ZRRbz2PpAPHwkMTSm9EGRSu1cFc1ma0UJE2SG6rFb7qkB0GsplirLPAZSVrBRiDULjRNpgVsEHUTUPrLmtdECo6agyZ5BLPYTpvctLq2FMmQY+JDqZojEmTvlJK13Pp7/XehIZEUpp89ZVwYyb3HBP1p4XSnJajTzNc+RDeSJIfSh+Tdz4EzDSva75VsUja3X0RwodHiBlAHkRQbLO4KL1yaHXqc/NBRaU7zYJCYWuN913/Wc6tHibd/xjj8eu0cZ97Hv38X/693uG/Zw3A8vPNf/afx6V73sPxyYZIma/5ZX4mfZDSGnPHNirTuigHgEo4d3bmBLmTzABwx+osmlQ3ii578qhgY8Ja612m1OTJtGtebF0a9ejLbdY7UdMlI5FKFyh2fncvyhDNq8m+k/UQD4BXefvDEusktW7DWNGZ9h76PQbeDI8tMR3zwfWL/JGzV/mW382/vHqFtjpLpExgtCrqWa5BGmLXUSgFSwKQHEJ/1tZ2h4OiQqUOX7qG6B9ktsRq6OKtFF1PoH3egQlycm5/zWaz4bhNWB6JOjOuBtapMNXKafMeluTqFupMHgcOI7NFHIdVgtk1ojQL1qWQ5qC+4zWl6I6MkMp46oFHEiRFt+SpQJSPNzMmhXeQwWfn3JP/kJ/8IBxc+Shzc6Le5Ge/+Aw3H/tj1LNnJaoM2ZVqSCkbtSuIk0nhW3pORD+wLdK/QSckxGOQvazhLVOSswl9BvtofTE34XbnWQI570ply4NcHW5diKmJx2CJqU0sQ92I6B7eRBkH2nYjL7yf4tNMTBPdjc2Q852wJQ9Nuvb3dUnmbrMEWRXdGcb1zkq2Ux0fH1EdUtSdwEsTub6aimBcj30lkkll3L0fiwrbJnn9G01dyRKG7kbziViKldYjZ3NmKJnUIFD08lCKgFKt7brOHJXWu+uyWPQMUtvimxMqAhhZE1I8gLxe4+1UyXf1BPYPKYyscqJadAaIsjXS0q0jke5ik1SP24V3oewQS9IHLamjQ8l4yPJbljVVWs4W+tmTdwAy7575jLE+PeXBV/5PPnblbjanVzm8/xHm41N+9rePsR/9jxmtUVPP4OgW3WYSrooA+W/qDCzoRcCddVMgi3PrKnq9/9L7JBy8UbvoMcc7iwqgotG5hUbLNuyAY3Wx0aEpZrGRmUnddJJ6ucbCVdFaYkHT3rGwDWpy/Jb+rFgRw4jVDSmtxbgvKwkLYyL685vyiNmeVlJxSlB2a6A51Oglc2rbdPvnqJFyEvxI6ay+C7OSa6mLg62Q8lpWSJ/0/CaDtmURauvyXtHhwJ2P0C3C9HRGrwRVQVM2YuYQM2YDrW2xFCQvciNY6zqvJkAe3nUCpa+4cv+e1Z1uLBfDW8ayQHkpEq1ud5OQmhIPX/9nfHRMlAuP8eY3f4bV2RVXPv23v6c7/HuaAACcefQ//Ct+/JW/5NtjtqcTT5yHr26u8fRwnqJSBiuZ1pTXHE17VXkcVZkvF7z+W6bZTMsKAnGCMsgZsFoV5lbJKe/ifiFIQ6LWYEzQlzDkAuFGDchd/d9qIw+q2LQiaCJhhXbSeMXGwugmNWfqGNys/fySlFVK0QOCqWPqcmTxpWcYK3/x3t/h4fw6Lz5/jc/f8ybvurDl7x59jGKmVKxxwKswya1KUFJUoggigaYl0zyz8wG7RuXaBcv2VyLQ/KOPCGvqD5PtDvKMDrStV9K8ISchlL3DUeYeH6r1SyNQQIVNE3uDdsPbaMoWILNK2p/OCExkHrsRerbYKeE1vctdlKM1Cx7Q40hzZxcsezMJ+IBm2DBw9JHP8+Vf+3s8Eb/JvQ99AD98kD/+GecXfvWf8uJDnyXdd69AQyGIRs1JnQxCu+psU/Z5KYOif/v0tXkjU8iDQRugNWoTXUziRU2nNvOkmOUkTNowDKKVNaPkQjaoJLxAuN7vVdZ+tzDqQArAnLlKLDbPysMoSda+tNpjODyvPIW2Zd6cKs1wXGF5oDIxn27JruIi5cw2EmlujO5dBZVYZUmRKsGYlShYPSjJ8ZLIw5q5bhncoQmDGskkvE2BN/HFlb0R2DB2bYsx4oT3EXo2iovgCZqiZQbyqqNph0z2DH2/m5I6sdSLrVwGsonn3+iivlZJqx5wlOgMAulYkknwmCJRkhOrAyg6H6acWHXtRcpQW2MoXeCV+jxIOx053pJCVzxmXa6tR3/ngrVJgl6yRJNdZ2RNuiFvXURnTetMnxmsAJly/Dzvf/Xn+NgnfgLfO+T4mVNeeOrX+e1rh9hn/iyDB966Nyp5dwMJeubJ1dXqOtZ3Jfp6qq/JunNcBYsFJRRoRbdD5ggwTQlSUoERTYCv6OP9wbo7xQqpFIJGtAmaLaJ6vWGmWHS5KaCaLmyx8PsqquS+nqyUKBCbDi5zLK1UEHiGeSZi29ceMz63bm/LfWQ/d3HdSg6ASJhVDCPSnrC9pqlDzgP+DseMBrpak6Y+8i9Jnx0+kfKaBNR2SklF7gYECVoySbK1HaU0Yu7TtUHC3R4VbrnIjdM/f0tV0z5XAJb5lmIrakzkNEALcuqaDQ8irTuZtsLCyOnnUs6mlZKb4qi9qN50Zyj7JDslWWJ/usrFG9/k8GN/kref/xUuPfQEp6ffc//+vU8AAL75pT8fY7vFxSs/wu3Tm2wm+KvHjzMV6yNn7WrNervd8+Gtj/9zQOvhNAK01N0DYpbkW7Xov1bivuh+1xQzmJKxIChJnXDzDprprHcP+d8DwAoZdY+5jKTFDjPKb5eiSB07S6gy1k53ag2yqvWCEvyAnmilcau78xPtFX54+CcYaw7P3k8eThjOned/+M5nObHA0p4U4B105DSiJlaDxHOYkXsFOrvEdnim5L77jbqDu6QuUkoJzI1xyOyVkeNtJZtGlLW/L6XHGS+iwdw55JooONnh1CXiW+eBdTY5Efq/89TVUa8alFXmdG6Ks51nPA+UBFS/Iw7LjVY7h4HAUsZayH+7PIC22AE7TKlnQKgzKfjRa5z59lf4zCMVu3WVi/c9yIkd8oV//TQvn38/8e4fJmeBN5bOXuJKRR1738v2D0ojVxtU9aPiZQFVecii0FpjlQu4MYcip6UChtqtTCmp24Q+Ou4FAugQCpP/uBLKFKgBKbOyYNv0y5vPomDmDCsFjfS3kAWiJTtVYNZot26Rh8QcYPvnqEdH6k5WCWtZVqcMtR2RNrNstN2zT0p4ERyKzanyLSIUi1wKqYzkYexseX0G0hVs9FnipGFN4NSpipXeP8hoWwm9yKQipMzQR5/NjDyog47ao3YDrAyAifSnJSktZ8kdZxcdL4FNW1pekYuRZsXEcrhHpk8OQpGoFql3clJrR6uyTpbcw4MmxBgJFu9ww1i5nEEtJaxtyXnQ8+FCdS/PY/Sws0WEt7xPuR1z9qVneMy/yiOf+QlW5T6uvf5tjq49z69/a8vNT/5npLOFYTvvpkGanBm4Vi1us/6+MuxszRodV0InlQq1WcQ/W9wzJJo1uWMYhI+2xdam17fAiRpGaY2GwF1S84sbYf2iSrB7ZpwmdkdKurzbBu8TUiXaSQGffZJNzRWihocU+2WAqiYr2IJrraXLXB3w7jvn0acAGc0Z066ZKt3hJD1DgpgIGintizHSmSbNOrGwwWz676QB874cthlMlmSQI8Ry0ut32SWzLdbztX5PbPQ5pxF8grqBshYx0IHcA+LaMTXt93+PIFfurU+ouyVzyAo7opHTGlwxwmnWneIoxTXZSj1lCqi1a8tWfOLq3+Fdj/xxXvuNv824f0DJezz4Y//z93x/f18KAIDv/Ks/F7UWzh6e4/jqy/zK3o/y88MDijNMazyUFtYC6F54R1a9lDJtngV6aXVnzdNYJ0NKEpqkABcGNXLp0bQz0VXZSgyTLUZRMglQlea9qNBOzXul3Xc0ywE/JFX/yMKSsqYI1uM5TTSdXX65u4RtEcYmBNyJnPjo8CyfX/8W5XAQygAAIABJREFUXKtcedeKzfEN0rl7+GsvfZrr4yF1LqzGIgvbkNi4YoodIYWLwyoVjsPJTeMhoueph3j7NE0tqkmEtlAHzYz9MI5CDISF2IeraMiuFcPyM/aCZnYldG1q02ojmbK7o+3ETnlUtG5BX/apr0IGEmNJTD2ZLaMvew3R6KgOxfAKQ049cSz3Q0GHXe3JYHjHRKfUu+tC3p5y6al/yvvPvsTdj36Ci/e+h3b1d/nqN17k5996kMuf+AzDao9qjdZCMc+hgz1FdwYgsY3XytAnSpY03lOlr72sJzEpZHHMmoq40aatoE6pUJDNR2mS8r+3nnxogcbwfcpR1YIy92Q6FTmmcT5tp18hrxSQtXMrdFqa6Rmd51N8uyW3rVjkw4pWIZ05j2ejzsEwBLY5JWbZ2ixV5pQxsvz7XdnMtBVlM7RSSIMuSroFkZ506Z1kZ2HYkg1h0QWDDUvKhzBzfO6+9RyUQR3PMi5Wp+a7LtYX4M2gQp0IUjJ8bv276ixkzYWYmOsJsw/s9QKoJLEtPPe1giWizSz2XvdKHkYVSDlgnjtmNTGa9sZ1sVqGtB2EE737p8532PqGzg5vWh2Yhv4+3+KRV/8V69d/lQ/82H9A3V7j4NIjvPz0L/PVty9x8/2f40ze61n0Om8AuZe6fkfnUnRfvAqN1MVyi5XR0dh+8Z7vaKYWOzdKMJJs1njfC8XEGSB6Kqn1P9NrJ53qn96sEBglMjXVPgUyaptJy4g6jVjMpBTS2lgRcyB6pkk56OLqJAHgdFM6gOHMLtWOPk2hbWSpZgUhx5SZCqGcNCFKZHIZoE7UGMlZFjnv4CyVKn1y6D2AKTXM1hADlhQTXKszJu30o08NcigzZSlu8FN9n23J0igClnmFmOS7aGA+EUwwHBIMfSK77YVMlVg8r7TezoqP9gg89ii5wiLbXVY8sjB19HK/n3IvoJrOP+/n+UNv/zyPX7zM0VuvMKwvUVZHXPzAX/i+3N3f8wpg+Wl776HefpYNl9mcznzu3jf59at38eaBIhC9uR6e3JWQkfE27bQAuXt8x1GBEF7Vu1okolapIr1BVRLYUAo9K0uHDa6DCok93Jc9vqor6Z2R5zZrt6g+tY+R+kHv3oicpM501d+1j99TSrSqPdHcL1SvDVJmGAa2VLIHL5w8xLmDF8jvepM2HsCtyroYp74WTCbpSzxY6rupRs6wrcF+yaxCnvOCwZjxpgdoiYL1uBObulqPtHlL6dhXgKEUyqSHbUR5BHkQC6D1nemCF3af2R9GqjeidVV2v4C8FJonZkuMyYh+UQ4GYYWcKhYSG1VX4TUniOq7Ay6ad6WrMaauMctFYjRj53AAuoVuBPqEI4JcJ2w1cv3dn+V3nv5H/KH3Vo5fe4aj69d54kd+lL1vfYtf/NoXmH/kD2CxZo1WTAa7CGgz5U20aJScqb2yJsTgHnKfNpUi0WB/FkjvKEZWioquvcukGbnk/r9nBTohO6nyzzWJMOu78DzqQGUkkvLWMxnrtkhdRmV3eS2sdzEPUOG5X4iTgGkiTyIrbjanlP1DYXK3p9jUJPiythOStup4zgw4bTuTcqbWkN2z6yUS9Iunyao5O6thpFaBosTdz30EbLTcHQjJRHdbBUME2+1MZWZcj1R3CtYVzoVq9Y4o19XBZsE1tecfrXemjYJyNTJSVrcsbrqnzJDlOVewV9pNLHZ6Dzdd/gkV86aJQ/jMyvX/b1Jjlca+bqvdKSA0sERxynHAZUGz6A6R3lqsp+tceuYLPP7hu3nr4HFyW3H9tdc52sw8/Vzm9g9/jqEcYNZ6g6LpkD7Pfpa8gw1CF13Si1dPxhItDrIoLy4SnXId52M6xhe8Oqi5qiEEc17gNC7VPDlheZQextVQYd3j1HUsHg2LmSgrlsyT2FYRICnMfZ3g1sjsARAC7fcLeNBqARXdOUlXEXGCxUz2LW6mlFSXK2wwo8UMdPutty44lX21pQahz1yulEbzSuoW7WgzpNZR6ro/hpSIgMRApKpCdRGtxgxNJMM5FKccIbtj86riolWaz6S8xtI+YSNmuvybaz2V857G935K8y3FCk2seFLINaKnW0WjrhbfiX29Tw1Td/aE6fuimUdwpp3wfpt4+re+wD0Pfoj1cMIbb59+L1f1v/HzfZsAALzwtb8Zm5vf4MyFhxjHzNW4yF9+9S6snKGWpbL3LqjR5Zm0mMNM/vjc93mAsgOG3Ml1uaswhXFslru1LXakvCEWH7cqOkU39v18SrvuICJ2qV6eNBUYenSlWc8TiMaY7uyqvUlB3KoOkDHpcK1NX9JkhqXSAytGHvdX+MS5N3n0wjUOYsNff+khXkkfJrVTaiSGYWAvwXHnnu+NK6al86qN5sj6G4LOOrEL0KnhEMq7T00WGlJPusqyNVp2vBpjliLevHFhPXBzmoWUNdHD9ocVt+tWNKvBmOdGygOrFGxqMI4jVislBlrS2OywDGzaVvyC1Ni3oYuSVFgMHQBV30FALDmTa1fU5iCloX/O3t9ztCaQZKbnJmg/HE16grj1Bhe++c953/2JK49+kDP7mW/9xpe46Yc821Zcvfj7iPvuJc8aw6Us4elONLmMYD0keDPTaqVffC1MmQ/mNE+sQq+tdmXwQrHE/Q7AyaJrEBa06fIj4U/KKlKrN7JrrGk2gE0074pzlo5XmgJ1XdLHZGRbawF1c4xvjzEyLWeJicqKOs3SXvQJRs5S3CcTCRA0hBlLodEklKSRnd5B9067BTbmzjqR9qbfSP2eKfL0RyLqKW0YiOpatc0o5CklJncJQ4tyJtxMq7UewqRAmx6CEqGPgrbTCYHjniglaSWT6JnwSqTLg8b/CU3OwnoOQW27zyCj/66ciI4V96nv94sYCg6Ruwc8icZnaG1jWdNDfOncFr7Bdcanv8xHL9/mvkt34eMFbh1d5d4r7+ObX/uXPPt6Y/r0n8HLHkNMuuCSdZGjddqixJVLsTfkjreNXg3BTrgX3U69xPxm6+mby69j2An9IrZ40vjcXLqOliRQzE4v/DVNiFY0pXJ58xe+CVWjcksTtS2R6ab9dtO6tZmR20mfViRSZGrp3Xc9UjoiBpF77HLPL6mnJCa8TZAPieEs0Ro5FzJbSfA6cMdtxGgQ3eUUKkQHFN6kiYoWeSkPWpd4xS3tQtmkYbjj7hD3Ajmx2LIEwwV97G5brDnRf3/qz5W83AYxsYRg5bQi6rEAP2kfi6oCIhA11CtuIysS1USUxXsj17VRy2eekyB4upt090SIV/DR67/A/WfvZT5+i3l7laPrx3zo83/z+3Zvf18LAIDf+uf/dZy/fIFVTmxf+i7/z30/yt++fR9DPt9FJ8sYu8ektgZFu0+xkXXggFGrDjbrX+QlNCK3KgVvk51H3PxecSWpKy2PqnA1kxXIQ5MoQKOjoay6Vc2YXCERe6OS9poroW8vpR5k4VK4WlVgTFQJDItGyEMeqT4zUmiWGefGJgeJRpqNtDcwtQ1jylAGqisox+bGehjZelXEo/xA5G4zoR+eeu224+ivcmK/Jd72aVdJyvai7IQhBwMjp7MerLU3przsMDXaLt5YpYHbPjFEV8lbplbHipFa7tS+eRemhDmrlimDszGBLQJZ4ywtY/dEyXpPpz76HlOwN4wCIrVlbydk8f44SMRE94SbAmgWUd3QL6iozmk75uDl3+Xx9Abnz55y4cr7OTxzP7de/Od887nKU+2Qq/d8nHL5QUpVUzTtDnE9H3rwexiJFTKZliTsA7Sn7m6SFrZbIzjq3EFAn1J6amN3Pyx/npvvsK3Zu9jKnG1OtHli2CFnl4yJxZrVGRM59QCr7o7po8B2esq8uU1YpuaRMk0Kfc6mjjUPnZY6aX1TUndFAGmgdpS0nZ7qoDUJSIfVSOvFcUqJPA5A4B6yTfUuRRjUkCAqGktISd3O5AJTAysLFEge8twPOhXvCtVp0XonpgmNu0SX7k4Me8z1lDH6Z5R7nHcelEnQCy9jKZJ0sFM1AVCHPe8mN6VflhEmuma885xJNNN3oy0HclKSabY+jaExl8z+rescvPUM99z8KlcuHXDXh/8d2rTl7ee/Qa03uXmr8Sv2OBc+8lliamQ/xctAaotVUEV3jV7Ye+t24iS2P7UnDqqYX2aTyyrE3LBBzyzveH4ksNy1OSwaBWKxEboskL2IJS///rizZnAp4VMP27GchGrP+x1zrUuPOAUTvMrrrLF7b0q8jKSmoqy12sOtJq0tGaUPCrEkWhTCbxHlHLkobM0yeA2StW5L7QhjQWP0LPVJlJvrg3Qj5e6A6c6IQRU0i+ozdXcYfeVmy14wKviE26onFqYun627ottskOgzvP8aFQBK5hTgiPkG5H0SGfeJPBSM1W7EL/V/3eWSkCrJTQVB//7f0ZXIcxOWGKxx5e0vcN/xd7DVecp6D49THvrkX/2+3tnf9wIA4Ftf/POx2l+xf+ZuTq+9wlM8yN+ZPsmYr+FWqN7V/SnRZu2BluheJevpA3RCtC6kOE4uJOuCI01l6G9cVUKd3xHPWBq0NzONizSmTT272SQWal0gZBORR7Jr1E/uY7Ra2bNRnW8su+1Es8IYTaz9pMCb4omqo4cxGUPIvrdcmuGGZTjoWdwnoS98ydotziYPr9dGLRIBYka14GyV5WjTv+BjEtq01sqEUqKGDs1QNrdypVeld6y5sGpSgi+JfbU1xqF0KFJiZTDNgodsOus/N4OkiOKUVayUcVA8JTPjkBk8MYcKBprj2UgzpBxMLqUzIY//OhmeoguXk8aR7hRLDCSGUZnrczjbuepia71oE58YLGORGd9+mrvf+h3ed/+Ke+85xxwnrA/v562XnuGZb3ydb48f5PX7n2C8+CDJm1wjNmEMO+sbyw7YTGz+qtcv5HDuwUWaJine03Zj1mWfnc1gl1sB1hQBOgcUGiWvSRnmmjl+5bdp3/wC88EVzv7oT+syYIB2KoRyLK4IOTgilKo3tztCtOnkRMCfpB2wd9SvvPvI+paD1mZaWUnL0RrhmTaok6ZtWOD4KUNU092RM2PO+FBkS8tdXe5Kp1OapCyB5G6hCvB5Q3hiGEovSIIBxT7TmQu547hJGqLDIqzTeza3ibuOXsTqdU7OPsK8/xBtui4sbwvKsNrt0Us2vX4THjalheuQuxDQ+hpmuejZTffMYzfhi76KLUWqdJu3UBKRHGIFJbN3/BpnXvoyZ49f48pdmfPv+UlOrj3PmbsucvTGy9y6eYNvPXedtx//o+Rzj1Bs7mu96G4SA+vecrL2wtaVaF3shtW+Awf3viOM0sOCGgsbX2YGpaAuGRoWjUhSjyseWmPmihC0OanwKqmHn+VCWlJNTTHSnpJWeQjrHKG1pjeUFopWlR7zjokRueyKk8xInW+rEANNOJZiGHEK8vY6Fo1qaxgOyPMN5tVdpKylXTcfUGyi0oXBlnbagMB2zrEUW1o91XShHPZJLkBAnybJkljFCmkKCsNCLiFvHRaU8DRhse727Ib5pHyTRY9g4x0RY46uIV1BO4Vhv2ukuqA16o4NkJp1q7ZoreGC3KX+GdAgktbiMqktwUIT07jPB699mUcPTzk93XJ07S1IM4/8/r/+e8L9/n/9fN80AO/8OffQj/+V15/6mb9UMFb7mQ/7Lf5wepr/uz7E4BIDRlNaHxHErAopzARwyEUzfZIwiwnl2xO0hrr/6rQIUjSya3cUqSNRLTOQhapcBDgo7zsTGguZLDQWk3al4bQW3Q4o8td6GElpgDZTUmJqEo7hMzWl7isPcpgY2KiLdo+dxgDEVy9jZg7n9nZmNRRWfTTY3DmbMtdrxcrI3gq2dcaHUZeJG+dHdUFXXbahgzJwOldqC8YyMtdTpiFJI1EGolZSWXHSKiVBqpV1kZc2khjbQymYw2RQQhhcoMNcRoXsZI1Lh3CiVvbHQrHAV3Ba9X5Ua9goFPKaxHahlkbnxvVsBE/Gtus0anOGZKxdQCXgDrWrSrSYRenBk9jeQ9bqw5szZoi738fL597L6Qu/yifiiMsPniHGy7zrPRdI5ZRP3vc5nv71v8+zzydevfej2KUPMI0rzMSHqHEH1NF6sZWT4Z3331qTsr2TJaUWkC7D3KTmzbl3CnQthGF5RfKZcRhoeeT4+BaHV5/loVu/wmOXz7P36Xv48rMbXp8hSiFnx01BVql3ajW0vxRvou/BM9Qw8mqFzZvuMEgYE7F3VtkCdZKGYzMz9MDWpcOTCrnnE6RBqurkYAPjSsQ9a46VgaG//14bqYkf4QYTS+qjCkfLiUojciYPA5ixQiCbFo71LjqZdWVzZ6Fbf039ezf7KfunR5x5+Yt88tF38eKzv8ZbBw/w2uUnOLr4Qep4SpmbxtolyTI4FnII6AULWe5OBkAg4SzeSENRJkcvqOmJneFZqWxeKQPU1YjlgTxd58yrv8H6xne4/6xz4fyKCx/7aW68+Q3OXr7AuXuv8MJv/hxvvnqTp8q7mH/48wx7l4WPLUIxt9yhXnQwFWJo6CdpqrG4Afr+Prp/v0WgnZxIe4DeNzeKrfA6qbCGXqwsoWQGVgVNykGiaExuUEOrrtqcRiLloHYHSia6YM3wvCJ19oH5LMJgq4QFgTgGuc0az9sI3cU0FAknvc5EmhhsRYugDAdQj8FyF8cZqR0zWyFM4U25ryPNlAipYCNNiC0ZQSZMe3KiSfc1HPZVr5q+3Jp0E8m7WyAIBnBkr7MEbe5WzIYRVGukWgmE9ybmPlmS8NR8hv75yfWgojjVGfJKqw4z6rzdaQ/Mcm/eJtxzj5PelwXQdT7UKnG0BxL+SSRFZUvLB3zg9rd5z/6GV5/+KuPZ93D28mWOtuf4fl/+/Yn5wfw899W/FcFrnNx4ETu9zeWHnuCv3byP7/IAQ9Rd5ek1iNL3LQ45vI/tUq+UA4UiAFF7SqBGlBYNorHabphJ+PqAMKnHFSJkSOKnzkf2EUh5RZiALyyK92ow2C4spIXvLH94Y4w1UZTuttjv5oCxH/zC9w6sLJSKZ7YbG49lRXN1JFIA106UCyYSOTlz00hyvzj7w4prW5EF3WB0ZwSR9pDNZp57MpgrrGexlkUEe0mjzRqVggRqKTQqHjxRVsNOb1CbszeOnNSZ1IyhJI1yQ1+ESrf+mFYkh3vSGpx6YtUcxsI0VVpyXTrRO55+2A1hzPJcSlOBRvoJ1wRiuTijp7q50froL/dLf1H2J7P+d/TOKAsFzZvP88FbX+G994+sL93F7RsvcObKH2B76yXqFm68/gqbeeLrz32XzbmH2Vz8EPPZy0zjxX4BzJSyok1iwzP3PWsy7c6TVhKFoIYshlaEizWLLmBK5FWmMZK8cfLqkxzMr/DB9BYfunKRYb3iwuWPc1RXPPP1f8q/eO1+8hN/kDEqtYN5iEJi1sjYkg4MM5aNr3fnQZsa9fgGLE6NM2cJCla3WllsT2QzLNJZOIVhb8W8OSXPk7DERdAec43p82pN+IyYGKmjmkXLBPAeg+wkrQZQ1GkN1wUQmehchxTqEpcxvLvvsLCV6OQzHT/ZHI637D37izzmz/C+H/tjTDde5fz5izz1tSd54+y7eWqzxs7fx+rcFXxODKMuzhUrMCm1p6xpilUVuQvvPfyI7JoauFci7el9rFvSONI2lXUO0rVXOHv8HfZvv8J+vs7dd7+bvXlDWe+xd8+97J95kBsvf43b169x6wieee414rN/hluHh4xd0S4C3jJx0CQxd4X7stgUijopeCi6YNEKwR3A1CKL1fDizhpKzqk+5pdnr/99k5gAybuGofPrVVIQVrrOpONyd6d0Fw1agqhKABQPV0mrSC8k7VH/NQwUv0WbKz5ekEjQmy7OupWsxiVSy/kAz3skc9J0TExHlFJoUWB1qO9SiT6F7KP6JKeM+SBtSWjf77HFQlMOt8XrvwCgNA0J32JMGAXyfqdmRu/+B30/8h4pVcGJbCDahshaa6R+blnIdr4gwVuf/Co4KHV0+IrUjrCsJNRFPI1b15I0KKNgZHlF+Kk+1x5LPlhi6tMegakatay4e7rGD82/RuxfwW++QvWJzVx47NP/7Q/krv6BFQAAT//ynwqOV6zO38V67xLX7Tx/4cb9rGIgslO7rUUCP4SKdY3yAvn3wUmjdvXzdCqRVh9TCVk5YPVUF8e4t6PNLYcPrZFiq1GrOSlnSlrJflUyDEqSG5tBrjhLpK46/NxH7TkPLKCI0nPLPSQY9Kh6sGf58aOr2xeLx/5QOOlirJylol/mA9vF/05i3VXlgxunSBCVyWxDCNLBYG7BmDLbtlDjDK8hJWtK6lBT0e6/ZEqqrELjulIKF1cD01TZYFjJbLdb1sMIDU5pDLVJnRvRwTy2EyRZZ4yPJvLYmDJrjBNvTE3/7twaq3FkO+n9LS3YsLw2QThyr9ojgrEkikn5K4uMphHLjrp1T3wkuSUG05g5QtCeVp00FPKNqxx+42f5wCONB+77JHN7m9UwcOP4hHs+/J9y+uYzHL/8S0zTIU/+9pe4PtzL7Xsex88/yO3Ds6TxMq0fToktJTIJpdm1DodxE8BlzNJqRDKSF8bcaHVL2Uy04xus3nySj9u3WV1c88C7P0DK9zCfHnH9ze9y8f73Md16m1/5xgs89Z4/yPq+RxkiNPHKQviKjrakXHLHxtUzH5rPzPPUR6KJYdyjOnhUdYZ11rO4GhTlmwblc2xO9L62LtIiieuwv0/3VElk1wtwo9DpLmTX7l5ERRhSUKeGhyiLS7gNyJ6VQvbIKAa7C8+6ra1LHyPIzHBywodf/AecXQ986Ef/E9LBivntZzk8cx91O/Ot3/q/+M7Nwq18gVuHdxFnL+GHd1PW+1oJWGXeNspqZIkM99rwUihtplkFXzEMjebBapqJ02NWfkK+8TxnN0fkt77Oex9+iNWZAw72Vlx49Kc5evbn2DYYDy5gac0rTz3F7evXuXb/7+fqXQ9T9i4x14248N2JgCu6OUKCRF8CqgD6uaSxem/mIjSp6D71iJ6boI6n48FTL8YS+NTFjfo+eDZdsNROlgw8qfO3mNUk9KL0DlVQn5P+b5Um4ggFkWY8JDDdhR+1JRGxFwzzDRFLe0MiDU2GeqzCvWtnIq2I1EOnPJH8RGvaYaTaID5Fp09a6pc4iWBLjkSkVac4Gt5O9FptkIDONV+B6Jeok9oGrPXo4j25kMwx79OU2OC2Rq4Pnd/mp9iwwp0dlyZ5dFGtRMqkAUtrvGlNE0jgl+IETyusTcrEsAELIZLpK90IRQiHb3QfhSK5U8rUOpOSvucpHIbEj934BciF9eocR7dfZkjBA5/8yz+we/oHWgAAPPel/ypO5i3nLzzA/NYrvP7wT/A3Xr+bZiPElgmEIo1EqxtZ33qHouHeALXhpo44eSN8IuIdwre0B/Ox9vjRhUN9xSuBkOwZlAHKsBOulI6k9Rw7hXdCH1yxpMu8GzL66aZONBWGzt0G59SdvTzg7mz7/h3rQSGd021UogzYLMiMm3K1B4NsI3MXKx4YbJIxeWWMwhSNFQNbl5ivJAgXTdDbTCmJ7IVs2jmWUpi8j/Niw2gaXZWsLnOVM+uSCctMtYrX7U4uhU0X+2SMgzyy6elrJzZjLTOaQxRKVOYkAdcqS508ETBrGuENrQZSYXQlW1Vv5ATJikbH85ZxHBncwCR6NOs8cp8oNtDaxGoQNMNT1r93Ebd52inmU+rxpS0Tbz/H+be+xUPtKc4cNN710L2ce/hP88KTf4sz9z7C+r4/yvz6b1BOr3N8dJtN3vLyc7/JzaPKzYN38+rxPmeufIRjO4D1OeYRsu1zfPwGh8OBSHZ1S/MNhzXwa9/m/OqE++JZ3n33Y5ycvMy7H/txhnNXKD7z2rVnuHz/Jzm9+jZvf/ernLkwcu59f4Jv/OYXefKtLUeP/BTkiRx1N/FJUUhdiCrdikbnKoyWTrbzKTK72F6fZoJJIKE0QBrxegI+QJrxVqne2CeUz753SF6tKFld/ZDZdZvL02tZh1nth7+y4p1G04g2Epgtd7zG+4IAKLmyqav0tBQVXX2fnL2Aqd7m7Le/xE8+/l7uvfsTHL3yRW6cHHHXwx9jb3WJ45uvcXTtZdZ5RZTC+f3zPP3kl7gxG2W8yMuxx3a4iJWR2xPEmfNdqFZZTxNR3ya9+TqH997H9torXDk8xU5PObuu1O0JkbZcfvAJBnMufuRPc+13/y4nt67yvk/9KV5/+SucvH6VaT7muWdf5ZWjPdrj/x7c+yCYRtfmi1p/IdxpLahJiTMYWgNEljK9j+5VUMdOmb5gu+FOGJXEqMFSjDUrEFs8pLBY1gUSWRap1GNxPnShnBZxuz9fMB/bjayXokBgIwlIFZEsLoi37ihJRvMZS4O0Ag2yncouS2ZOI8lPYLqti3DYw1lRzFScmLRStkC3HE0betc9EBgjzeQQUsoffVVn0E70PpQ96MVjIuMxdfdVZ2CG7LfyEynoLPksq2pMelbpLpGWsOxkV3CPR+48hqbJTb2tP9MSns5QhrO9ThevJdkp5gNkXfJEYUlibCWR2m1yOuzv/yyNASscWWAHg9q2TCT24pDHp3/M2ahMJz31st7g0c/8j9/3vf87f37gBYC723Nf/e99c3Sb9eEZ/O3rvPCuz/C/nNzFag4iq1ocLFF9qw/bo+fWL1oAREuaNn2kJoqZIeGUrw5pNNL2hFwUNFEsdfFN6d+DJNpU0IFEGscvCvNFIDSM2h0u5DcFN8BcFcSjQy7jzOSkbIBtczpjkDmcVRnIVZfx1pdKf95FBw8mQY47jEXhQNvtjBuszeQANRSJihT9rYu9LDSaDmbm6JOGvpf2IvpcMlnvEiJjqQnrhVFT6tbeYBQymyYgTC4wV+ktvDaKJcacsJyY5sYUjdKr1Zzlq8/jAHPre2apZyeSLEXZsOr6Yg8FLMuO1YWoaoOnAAAgAElEQVRglmDsw8hAQqxVD3yRGlbuDtwoabHL3VlNhCXmVtX9ROqq5u6lz3uc3niTS1d/lf3jb/MTT7yfmvYYzz1Omm/xxtf/V1Z3f4y9B36KNF7E5zdpbz3F+bs+wtWXf4nNyZYL93ycF579ZVaxz4k71176Xa488l7G1VnOXrqP1194mgcf/hTD+Qtce+Er3P3QBzm59hqroXDr+G1W93wUIlitD3n+yX/BM8+9wI2b1/jpn/ojXL/+Gu/62L/PP/nf/gbPPPrvku57mNa23a6pQk543Jno0xOj7CZbSye2oyf2IsANok3Uacs4nCGGTKuddHZ6ImdHJHx7pJCm/XPkcWSX3bAEd9E7Q+/58L3YJmfZAN/B9fe5SqS1rHLobP7OW4AevsU77FheSQGr6QaHL3+ZJ869zoOf+i+J7W1O33ySF595mrK/x7sfewKzQ8azZ3ntxec4d5C5+txvUQjOXroP37vM/Y9+nhee/PvsnTvD8QmMbeL6a89y6fLdmoKcPSANBzBd5/q129z3/p/i3H2fBY64+sK/5PTms6wsc/vkKne976eJ699ib+8cb3zri9w4nfidF43b938GHvkEaW9fkcSusKPWNzV50ZLUUCeLBJMNWdp2nXilX8qJUOujztsWOIyU6okucoyK06FjrN55qnZ417z7+z3EmVAEeiGYaGmEaCKguoiqybX6U1ZI96BTiE7GW0KHIjSaXyx8bfe/qwCYXPkduc0SLKKLkWlDjGua5Z3+pyC+ii332JKGGC7BoInSkiIpKM6U8iidhhw0yecuBu+8/e6CsL7uFQem4aQ+iTGSb+nYyZ2dMjpZNfJKjQ8Za7f0umzo0xPheK1tNeWbTnTmpwMYD8FnPCYSso+m0CcSVLTkWmNpDe0tIh+q+AMVxOZgpRdk+l5Nwx6fOvkK968r1954ib0zZ7GcuO9Df/YHevnD/w8FAKgIePaX/hufxstcvHiR7Wsv8ZUzn+B/nw4Y7Twltgr96B8mHuRW8SJyHVmUL2uzWNG+2SltU0pEj5pMm5vkooe+2Z1umZykGA1IuGxM5lLgA6tIZBMUQkrNGRtGpdylzD5BpIGTudKyiFapLXak2hnVzuGwwuvMph90c5MoZyxSuc9o3FWZ8NAI/QAVEFEEHGqzePpzzjB53+ejIA4TcngsmYOc2dTGtluaFkZAuC4PMmyqWAFnW9AGOGnOKmeSG2MYURQ/Ew2Rr1JnGTQhdL2AddFXo8EcpKIRffZEMFMx9grUmiiDMc3OhZIhZabtzCYZYw2sQ17GXAiDUfsMdfaoq12ngpe0UzcnK6SK9oQo/awUjULVFSv+1o0+EfDdKN0NZgr5+IT1zecYXv5XPHbvAZfWp9x7/yc5uv0cew/8IYYz7+HqK1/lrvPn2MyJxG2uPf+LnL/8KW7XEy5cviIrXbvN6VuvM5y7j7205eb1Nzh7+QpTNFLaEFMhNq9zcNeHef27X+HcXR/i67/6j3htc5nXrvw+5ns/SHz3ST7bfo2PfO7PEWEcT2/xD3/mH/Dm5U+S3/1+9vfX2pE3p8Y7rEP0hEITunhhQ5AkQJIzAlIZmKouDeaJXMaOOU3ktmW72ZDGUW6W/X1SkxhJliZBdawJpqLzSXvtJWK3wa6DtdY63rtbFH3uTpyl00w7ayQR8mq7sY3GMBrlzatceP5LfPDcERfuPuQSN5kOLnDz+Ca/dvQjzPc9TH71d1m/8GU++dDdjOcf4O5HPsD+eIDv38vJi/+am28/zf7B/RyfvkUtZ3ngsT/M9Vd+m6Pbr3B4eDdjGVjd/XEOhsz1V79KPbnBsD7HrPxv0pl7OCgHvP7Sr3H09lucP3uBZ77yi5zsv5dX9t6LP/gE5dK9EkP2JiKio25DoU1LwUQkppgpS+dpXcxH6t/NDiiIuSvoo4+IK2adfWHdZkl0oeSdPA/vfw4hUJnHgDHtnhGNkbVuaNbPOZbXgAq/BXcbsbuMLZbVxbIayHh2zDsxDeG8S3FabDFGzIpQtwlligCjC5IVJangqSrUhd1WIRFt7Jd91zsEsvomNWu7kKR0Z/20Iw6aCZLjDS/DDjmerezIkUbTVCxmLBVh1K2CF3KRU8RTIftGQKoykqfbSvlMgzQkXbuFT0Qa+/s6Sx/jRrYBt023Eq6wcvCO6Q0km8DW/L/UvVmsZWd23/db6/v2PufcoeYiWSySTbI5NdUke6bkdttSWpIVOHYQJIicvAQK4CQIkqcgQBIYiCxED4ZtIEGQxAmSOAbsBHISBVZbaslSWtbQk6TuZrPZA2cWxyKrWPO955y9v+9beVhr71v9kJcA6eE8dLNu1b33DHt/a63/+g9Gh9kaazlq0hgrhSAtjiMHCsmWPDG8zp3vf45rWzh26g529hacefw//v+9+MMPqAEAeOflz/3yzbf/8D9Hesq111n053j/kc/yq2/t0ak5IYJp/+IyHY/qJfZPNcwWBDVnwOeUPJ+762h5h3R4JRKciF1RnidiJIUXvu+dUlNy76QN6xI7iO9q6pbdlNlUhVRRjONdz4bKdjQ67WKPJyw1s6NuvtJX2GblcLPBPd99x2rgNrt4J7ythZx9mu2SOr+g67FaGCyMhDKMTVmZuie6t9de2K0y1sKi6+cm6WDrEFbO2XkTQaTZ0cxq4UYx6wQrE9alUERYqrJUYZUTN7YjYwqtMY1SXapkeEDKYtkzbpWuC/MR86nu1uDwm9aBPndsy4ip0I9Cv/IOfj3WkHYaq64ja6OMXiB6EZaRl02QKy0m0U7D70w8SXIoofsOjXNtOMcgDgjliHhFbUeFqeB7aE2kumV4+wJnb71Ke/vPeOpsQVfCsl9y/OGfZlu2HD/7E7z53T/g3GN/iU09pF1/g+WyZzsWunKTfOJ+1tff4sSZBxmlJy9XXPzmP2a1WPLG975G0hXPHJ5kOPEhDu94kt1jpzA6attQTTn27N/nz917F6d/8t9kfOf3qXIPX/rSP+PZ9WnkwUdJp+5GSB5AE8Eu5iwoLzxRcKams5TQaMdEZpPMrFUmupcEslJbAevINtL6jlwbTcKBLukso23iBSjFtSsiYdZjQX49akQsqXsIxDrGYW2hap4/g2LemKXkboqLg/f5wIXf5p7VO3z0F/593r/8Jvu7mcsXnuebby15+76fI8uGMXn4FIeXKBee4ditl/ngiQW7aY3aNXaOnfe11omznL3nw9jOfTC8RxmWpFXhnee+zr0f/jiXXvgSx+79IO+99C3OPfAptmXLrWtvc3Dx67z+zgG6d5Z3FvfTdj/E5tRpuu64q1VkQ2qNwSy4Ry4nbnETSGNWHThZzBArXviAoHlTmaR8bf765MJZxXNFMFceTft59y31FaRnAmjYQoe3fGRUNFVoycl40883J1BPO+jJm8M/28aUhugJNf57JBoNSL5vT9ntbWe+gGHVyX3WOjS5DHMqztTsvvxa3DE0J8wW8/eiGnyIhrVCJQyrQqIn6qsh0cm10GPVWwpENiZ7YUpGnRQgPkljjqggvas8WqxO2toHBF1gdL6CHK85ciCKWgE8OVB0gXU73vzULSaJKtmtxcvoDQlubtTqmj71OMbp2RgSibXkHTx2qJJIFO3Rcuh8Ce2xcaSpsGGXz6x/l8WlZ6j7p6EtOL634ubBDg9/+j/4gdTmH1gDAPDSN/4H28mXufjaK+zvnWS5XHL5+Ef4G1d3WXCKlA+pQ3UjipgutJmTilBKcblfF1GjJuq588UnSQ1ziyQubylpSarmOQQhSfJO0neVyTzFTNhActOGvs/oOHrimSxYAofJ0GZBVHNbz5FGznAidQzV3QkPq0X6oLCbj6C9bbh/LBIMVinDdk4drOrogFDZViN1Pm0N20JLMut9T3ULboVbFEBXKikrW8mMVrB1wxauSmgCq65ntxa2STm0xrhu7C/h+mho37GHN1WLXBmGwromVn3HreIxmSk576FHKWNDOucdaKuUJHTNHeDMDEoj9z21Fo/vpIXjGnNML+KujCcXS8bS2IQD4l6XQ6eBx/qKkRosRJyEGHG7zoDOLAiNbnVuRmpC7nwlUMeN72WndDhSaJrDY19cHTE0YqIu9Ncvctf6FZbjIXn9BvnqRWq9iqpy5yNPs9steP35L3Hi7MPUZWY1Vm5s3mGzTbz77k3Gsw9xSU6wOPEBNmfuBz1Bl6rHyg7bMHfznWtple16wyMv/C98+P7zLFZGvv9nYX2Lb37jD/nSi1do9/4kiwc/hPVKw10wWytoF0mNZu4DIHk2emnivA1tRpkg40ChumiQxghk8gLmORnSRloxulgDNIns+TaEpnvpaMo4RqHDGxF1pzwpLdLVvO8qpcRu24lekx6/VN+Pq2Z2r11m74Vf50N3FZ781L/Mt778j3joo5/mnTff4spbmWcf/jk0nUV0YKyFVedy060Zy9TT6kC9/hb7VpA3n0Xe+x733nOGbJlS32fRhGG9oVvukhaZcuUauttDTozLU1x975Bri5PcXBsnn/os14+dQtl118nJ4THWSSMRjGTe+CRzn48U83USmeWQrU0F1OHuHGY+7l9SqFPjJiA1CJPiSXjOszSQKZVOw9p38tsfXT3Ewi2sm1vXVinuc1KrN40aslvpaVLQ+KwS3qSg7gHQkqDVTY4mWyyw2zz13e7ZtQnZ/fcjurfROVqqk7eJy6YJc55WXbNVmocGTWRnax60hRSsKlDA1qAn49oqIf8bQDrmnJZ4qHiCqTDS6k2S7Lm6IdxHAWhbsA4X1peJagqWmTwjCkYfd0Bphaw+NBmFljpMnHCe4/X5vVuDv+BIhdgINtDYc3dNU1ob3V+leWAdwd2ZclHGFpHZtkWlo9TEJ289yz7fo6Fsrl8n91tWpz7GvU/80g+sLv9AGwCA73zxl23FwNV3L7DUzJl7H+PXbp3mNxaPsV9bWIUC1uis8zCJpMEgjh3ibc5J1MHZ8sE81Zg8prSpeaccLHSSotL50FRHxHs0qsASN21I6t7jucFCjI25Zn8pntaXOqWrsOx9ii41pk8xDsbJyQl66Vj0yjAMDvsVZ+KP0WBUc0Z/bhVTpVbv0DelojmxKSOrfoWUNUpimTqMytAqnXZgfmGCF+NFuOsB9Kmjs5FtM27UkWVesa+N6yHrUTPXbg9bdrrMNbfAZ2iV0rwIqxijOfLgaWVuE1uGEevlyJAp3u8aiXyT+1sOb4GJ8S/AZOSiqizFi8py4dwEz2+PAJT4uUNzQ6PUfDfZVCJPwQuqhkTHRAIC9OlgMoGZ7EqP/hzvFwnTLbUtsCz0kqnbNdvxBtx8F9kWhKu0G1c5WG9ZZEN1j+NnzvPm9css9s+z3D/HsVN3UMpILW6uY0LkyENOQml+jZXqaIlIYvun/xcfs6/w6NM/z+r0UxwMt9Cdu3j29/5Pnr14wMVzj7N731Ok3V3fz0ymNnPQTbg5xgE5yb38696sTtdBsgkRm/aluOQIP+BbmDVNPvreCMTPry0KkpPapkKo5r+TiBMW0Xn/XdsUuhLeTUmw5Nny/eVXuePCb/LUnfukk+d56Imf5srrf0a+9Q4X37nMlx/8RWo+x4INQ50mU2fXFHOZaHZbFn9IQbYb+uwGUsO1d9Bhy5CFnW6HinD14issjp9jdfIMpV+x2+0zEIVbwPXazndxngLOJ/JR3U2MbitEbbqeYw/f4gSpUjx22LyZbwHjT9e/NwghwGveQFkE35ipE+JUZih+GlLM2rxvdpKcEw39M4ghKbgDFvdZDtKyJcOs4CQRDwHTMMs5yv81xA9cavP8eQnugJijgM0KWg+QJpS8iitnIKcVU0KrqVAofu5ac2/+JCA9ph3UjX+WrYszcI0wQDqBAMmcA0VzUzatEil507tsbnSVDKsb0AVGeExMKwKrYeTmKqJmBcXQtPIAslgTuGRSXAlAIGziMibR5XzNTbJtok0am9DnjI3XsbYhdfuoLPw5xr3lwXJex9zS2FFdj5HvaeWArXV8cPsyH1o/w3U6uq6ja431rfd59LN/5wdak3/gDQDAm9/4e1ZuvcM4blmcPMXm8it8fudf4Yttn6bVmfPNneBSAxsqGgUzSURcjk5Go27dua8oWaB1C5ooXcS6Au77H0ErcZQ5U7SMpOyxviJCj0PbXoTCHGh6i8Sn4aR++O10ipbmDm4qcy68KG5CMgb0GauAhVY0LdiWERE3HNq2gdTClANlcl4/qNUPlpB2Lbol1Qr70dyMIelpZgy1eR56yOV2uo518VUJVmnJkwVTHDYHxaexvlNqS+R2yCr33Bwb62pkCQOmhsOI0uhShtGtf1XxDPU45FrsebN2PnUQaW2iSHX3w1GNpF04HY7kfkESUDpK25KysCMBGbfCql+gzUlO19Yb+r5jv+/ptKOUIYpfqDOYHPycOOh6Z7dDnoI2/AbWeQIQc9+JwoiM1VMVlUiZSzQZEVuSfa5iKK54KJhL/sJBUKfwlIBu13VLMuiS7xtN2rz/1ZBUlTIwSEf5+j/lX3rYWK2Mt958l4c+9YuM4wYx5f/+J/8rl3Y/wHr/JJvTD6EnzrpqZZpGJYe7YAGy0++nkKnmr6GaywkdgHAkaiqpIn4Na4vPEJebajdp93NkmjtEPLa176ebUNNU3L2Aely1N57JwtPNEhK/f6iVfjjg3Ju/wwPyHmfPPcSpex9h1SvX336G46dP8dwzF3juvr9C2b0f0UKTLYua3I2z+aSaJIeyYGA0WFhHXibK6AWyUw8IqsVc2jsUz3TnqEnqRMlDhB9lWLctERocTHe97XppM9ScxFnfxPlBjfhtEcQip0PVMyGi+akWqxODosl9E5rFpF6i6OODTTjo6cTHkDjr4hMr1sI+OJQfUkCDFCsNK53zNUg+4NiA2crvX7aYxd9HA8eUBBlrAGtu4+2TtK+exDxC2M3NQMoh1SopGiufsLPf5wxQe4QNxfqwfR68eTVPWEVGKoRBkBtBNEZovhpJUmh0oBWxPDe0pr6fp4VUPIh0ahkk5HNMNr6u6CJWk1XBivO4XCkwIG3EYk3gqIBSrSOlBUXGcFJsDM0ih8Sbg2qDX4MV4NC5YjVj2qNaabrEmjd/qJLahkJy5GBqKPCV1v03n+VBXsV2T8CgrA/fQ8rAo3/hV37g9fiH0gAAfPef/2emt97DVoq1XY6f/SC/tjnDP8tnWKyZDR4SMbG26pDPtIursQ8N0tc0Jalmuq6jVU/MM5zAI8WJdh7rGbrzkLNIJyTt5j2dNKPvutljOklmmROMlYGG5MSOhgKhuWGNCmyasRvEoJoy28HzArpksyf4IncO5YaUJPUr6rClC+lirQ4zFoQ+Xpu2yk7uyKJsW0FSopRK7gQbCgeWWKrLB/etscqJEp7XB9WnmWXAlqMYh8Xcb0GUndxTm/sCTA3TFEssKZFrRdSLyqY4vCe0cMqa4lQtHAhHutQzxZXCtAaZiGCLMIDx8CQkzWFLKSSRS/VimbUDNbat0eeOPpQWLRnUCYTFn0ccyNN0b8318CJTPG9himKdXp+Ii3K0jVhyuLqZhRueR+JW3EClSvI1jXhSWorYToBJ7O1ELWdOTwjIFCdtIckq1ebpr/VCf+HPeHL9Ve577Gfozv8Et17/Ha68+jbnPvLXeO/N1/je136Hq+OGa2f+POXsOcr+PqMsyN1uaPUbmlrEVcch2FwmST1i53umlDGpCJJ6UfXnEu+bhU12gqQLPG3P+Rm1joHoRHRyTg7xxnqhV6VtR4oKTaqT0kZlMbzGfW/9LiflBmdO3s0DP/XX2dntGa98i9Qf59rLf8x3v/cGb973i9w6e54+edEdq0TD6hkfoLf5RPhnXIyZcDhdZ3AbGiIwRel666NgvsqojZlcp+FNEZs1RxdJfs3EvtndNdwJskWX1cRXgkLv8DECZGeBS3jYh9OlP48piCwyKJB5RehKAKKDMxoeHiPzZDuZJzukbMlT7RyZsFn6N1mOw4DLEdUtbptPwr4yCs6COtrZaqALUyJgjLKOsyyxUEtVYvXUBnJK1OZcHVJ20rYuaXWDaI/ZAVbstuItWA0dfAPLK3S8Gbv/noEeESOZUmQkp55aXJkkdaDlfrZiL+aTNTEwWIuVpSm1rmd0RqWjSQ9Sj64Tq2hSoPOmylzN4X4EIyYdpiuoh0H63KEapLql2i1UlvNZhu55LUpC2l4D+rkB0eBeSNpB6kh1tiQF4YHtyzyZX8F2H+LSS18g5T102PDwz//tH0ot/qE1AADf+O1fsZ3xNdpqRWLF/sMf4LeeP8lv7dznRhnivljeVbvcC3OHK61rJ7bQEFtStJCk0tmSJvgHkTyVaQoFbqXSdR05il1TcR1pUpJkRHu60OpuW2GhGaGxl3o3WekypRpFjCWJjLHoNGA7tzs9HN0tMOO7e3LHUtzmdRPZ1SkJpQrLvrAZenY6kLEySo+lSlajjG4329RlcLlYkEhctpgaDHWkNWFvBbeGsPctjVGdk7CTOg6aP18dlTXu6JdE2ElQi2HmcclDGCclg635Lk+A1JSWXKffkvnw0ZRBhphsmYuF76NzdOXejEnu3IchPBpS7yhIFqU3Y1ANroGx6DJ9lynb0T2/1fkDFoeoms4wp4b1q0iOvTW0VumS8zC0VbewZTJa4ujmbRIrBlc0NHXb0S4JY3UIU7RQyGSgyOjriUjqSpNEyfyQ9b3lFFgVu/dpbRJfH8YRy+506QhLD7pE33+B82/+Afd94JDdvcexw6tsb7zGXY//a+jphxk3PXrjeT73f/wKh/2j3No7Trr3aW7l49jxfV+n2DSxRoGMwi44+cvZVzFtBsbsJrVHkrVJQSJ6ZGxl4vdNNYkmQJ38VSKfwxwFaE3cp2NbWV55hdXBc5y79jpnTp3j5PkPct+jT3LppT/h2N2P0YbLdIsFb37jt/jWpX0ufeSXWHSnIF1HSdF4EhOqYHMKXHjPJ51fb5Op6cOTAtUnVk/c86810cijqIHqKc3WkMMsp/ak5PfIpBKq5ghTa4086fZnBvdtjaQY2hKS/bNOpkxNAxrXV01uYQthSlNBlv55RZOiGh4YRZHs7qa+uY88lInZ33yPLzY16jgZsXp6n0CgJMXXBJqpNaFaMBuZnCVFOneuVIumNYjXnq3qz71uww0wQXMHQGH0c7AZKgVp4gUzN1rrUdswpdhJDGjNOlcGtOk+NEx9remkQTdvau0Qcia1HcRuhFJikhQvZ2a+kwihJYfqJ6fDZiNSB/dDaBLrgREbDxHdcR8CLa4qs46WQMJd0BjwFL4NneyAdIx1MxuiZcmU5hkWmpI3L7ag73co0pDxJq25F0HLCWHniDfCIaOt2A6Zp+sLnFu9xvXLb7PUPWTVMWyNh37qP/mh1eEfagMA8PK3/6FtL36HJJWb773MyXuepN79OH/znbMOoav7lCciYKQF/FVLkCqM3C88KjoCdrDqh0QobzLuKJex2S1LEx5wUgxNTqqh65BSaNrcxIawf9TkkH8VcufynJHG0Kqz6SVxqw40jKVmqiVy9hnYmlC1kZviAYiu/99QOd0StevYUuljQp0O46TKQGMcR1YCXe7ZjC77GcdKXmQnvJtRq/MmejxC9WAcWXQLchnpuo7tWDkEtvjkkyzRW2W/X7C1xlgKO3h2eO7g6uHIuknIcfBcAAnzjLiwS8SpaoKuifsFVI+D7dQPGQsmu8Xq4Fh2A6Wrg+vDd/qOZfKDrk43GA7f+8wVDV4cfEDAng74Td4DHr6hNK0e5BMyL5hS65wQCL5bteYQpDPUh0hpC+KiNWpeoG2A5h/i7dCo4h4Q08+D2FNP8KocKU1E3KVRJIyZWqPLEdpUndFcUqZIY/XKn/KUfpOdvdOcPHmOnTMP89q3f4OHPvHvMqyv0WzDtVdfYBwLL7z4Za6MypXTDzDe8xexYyd93RFQrrQjKNoSqAUhynytoy1c18ztsefnzBHyJkY0db6/rgqJjnGspA4oXnAN0Gtvc/LlL3Li4CUe/MB93P/4Z6l9x3LvLqzd5OZ7L9LKFe544JO887Vf49sXtrz5gV/A7vowyEiXZM5lcmKacxOyBB8kCmWWyUDG11vEBD25yU33zwTdT+jF5Kc/EcuaTVn17tzmVt5OHq4TwzyWIxr58SFziCk6Jm9N3iDGdTBZkAstuDlxDzU3/VKpGNmLbKxiXNsu87QPHEnzcKY6bQp/UirZkQzAE2U8dyRZ3GuxIjJG5xXq5KYZKEHz5zA1MmZTHsGEaHk2AuZk2lbcW0OkhtNkjl2+O5pW8VwDEw/TmT4Dn4JbNBHOvZm4W6UpyQaMwVn7skLadn7NyUaqJF8xNB8GqoifAc3JfJIyjRxNQQ6Uw6V6iLgZUd0isqFZB2npaYvBSynjGnf77oJQ3tAy0MguCbQNrW5p2pHTAizP11pr3miIQc4rat1QqoS8sJBY0HIPw4Yx9ezYlsc3X+bssVO8+cLXufOeh9AysLl1k8d++pd/qDX4h94AAHz18/+pndjt0eWd2Ppdsgzsnvs4/9Ebp7GFUqPpzuYO10Ud+k7qxJWUd1DLdFopzW/OHAe3s3R9h+sTY+f74TpS6m3kkZzoRKlNfadvkFOPmLHJjd6MJZ2b00wHD7DAsws8Mc8jWLatsco9OylxWCvbcpv+MwltbHRd8nCh0midB/KQfAdrhJ1pa4g1jqUVg41oTkitdCZcKxtyyA0TySdiM48ZTomB7Cqf2jiumZHClWJsSiVZj6gzrFtrFBG6Whkb1DJQRdHUzalzZkaplS7nmQCWJ6mmNpQOaeP8noC6qsL88G0YfU1UGelTJvcek5pro18uvMsnLE9bTJ9mYfsb7P02YujR9C0+TVdz7bqmRrFEh096Dtem2HPXKNwTDA4puapg0kWXpmgCrUZJcfCnTC3mBWoqkGJY7C29TiQnukXhsaPNqadEhhJhtInk5VILN64AACAASURBVD/HYm2irXpCmyoU4do//wd87Pw7PPoTP0O1THfXp7Abz3L46jfYvesx0rmnWG8yur3Gd//wv+PNKwfcOP8z1DMf5taJ00gt9GqMzegk0staI3d+mE9xuhaEQS/27qzmDGdvkqgKCkMx17tXo2ZvLrZJwQb2X3+JOy58nlM58eTTn+JQEqvj50nH72V3dQdXv/M/sth/lBtXX4HDt3jxnTXfKfez9/S/zmaEXR0ZcVfPyX7Y9/0+2U+JhDY0z7WPGiWhApkMhhw2P7pWJ6e5OZZ5stHFyY1M60MyVaOghLSuyejQfVp6mp2NWHUmPkHmsn6PJC3aAJ1XTu6h48S1ZO6PP4VsTXwA/+8ca7IKtRB5WLhL3NFZ0aKQopMvvbuY1qSRWz8V22lB4Np5IYG4PFRmvkY0F2Ej7OeMuGQuKVYLzQpJO47c9GBy17N26CiBrvz6mNYXLQfC4MgaMrgpWcj2/D6KdW41RyI0BYH4ADRh7Pj6rXc79Sw4IkNmCm5SmqMNrWJayc7GnJsOxb1EMHNPfxZUadEwZKC5LwYCbQ2If70Wd50VN/Kpo0Ju6DjQZI3KDpp2nfQayEzOfv9QB08ClC5swtdO9mwaapklVoyfHX+PtN1w6+Amy1PHQQp1e5KHP/0f/tDr7w/9CUyPZ7/4N+3k6gyWdxjGm/TbC1w68ZP8N9fvoDRAeidpBOQoNtDqCK2yyLtB3XGTH2d3mjObi8t0TMW1nPjNpZKpbfTdpwDNfLofY/9vYXiT3cq3Q1loWGiKa9STwG6D0rljYRGbM9y7rPRhiTo2I7XGplayQNc7XW3cFvJqxVgH+mboJAEcCkMcVF6UXB3QqdCpsswdt4YtCux3nU/DdWRUpYzGqpeQJDZWTV0C1Xxvuo0ddVcqRYy+z7RhJKXEdhhoyR28juxIfdKyFomNxWZkxf3JHWp1JD/g/7jhtRqrxZIxdPnFfGLv1ImWK6KQB0QqqDvUxT7QdCqq6kl36i6KJmkmLQkxeYjQaqWbdpxJKc0JoJN7ngSjV8So1Sc1TS4bcokTvsM1L/7T7lA1fCjEAl4MgtdEq4vDddZEB6GsNr/BREIWNdPwGpOue9oFT7yI1iXae1dYvPl73DW8w/Hzx3j48X+R9997l739Bc2U1O8j41XGw5FD2eFPvvS/s905w427P824/0HGnOgmF0wGEt4YZ//QfEUgaV6NgEsNpwz2GvvbCcquRclWqSwYUyFvL3Hqu5/n7LXXePipJzl976cYRuPkyZOM9SYX/vRznH/yr1LWb7K9+RpvvPQmLx/ucHj+F6gPfpC+CdTbEu1iak7pKEY3R6Kbhj97xWLdhCscaotwouzrKSvfB5mbdL4WMPNz4jbVBBEy1mqC1GK143KvUjwRLuVFTJO+I661oubnjfU7CG7MlG9TmPj14/oAbUZOUMyC7EcoVRJJGjUcMVsbHcWqG8i9G51pdsKgtiMb29QzxaT7VicQJ5TEGMUvh1zQXUyt+rWuNM+l1+o+AC2RtKfUERGP/pXmMkK3Nm5zExUXOK0dusohrebrd5LHqR1Jc11h4/87xbExrZtixdLwVaOTAA2ki4Z5RCVRxV0NnViZ5tWdTYisNEcIzWXfE0HSrCLaaGMF7Z0UKsRrc0RYmpFsCKfCiZ9UaJKcW5QzrW6BSis3Ee2osgyL8+aJhtLR2oDmPPt1VCqtDFBcskgyGks+tv0We9uXuHFrREO23mzgiZ/9wbL9/98ePxJPYno884f/lR1fGY2bUA+58e532H343+a/vnSKa11zAlhY4WpVZDzA8rTTN1L4Zk92s4RWGfGJG0kR2BMyEY3CgB8WkwVrE2bPAKSxkswWOKbOKlaEkoU6FnZyDmauH2ANdbaxGYO5hG2ITtGJU81tda1jLwubYCf3eUHZDi6lqzBmRwoIToIArSrSKrWD3rzjTeoGMLl5DrWJpwxuEI5ld9K7aiMHg9FLYzSlJmNRYdX5RF1KQZLzIobWqC2QCJPZDllwop1WY2tHaYdqUKyEdXEY16iT0pxmpBSJ/WuwrHe1c0lS8wN+IYkuZdQKoznynJo3AFmy65En5EEbah0e5BiFQZl1ula3c+HwFUAchjbByi2CSBy49ejzDGwYmoR00aljSuSBS77NNlUCUejCw73NcL8YMwfAVwT+31OD6Y3G0Z7VYcs0B//kJBTz37JcwHDtGjdf/BpnDl7gWHuDRz7xWe594DHW165y7eIrHD/3EdLqJNqEl57/Ci+9+zYHbYer934S270XZcCyIMVIyXUbYvW2SVSY7IS9ATKypmhaK1k6t7xVqGSOr19j8eIz3K+vsnfyNPc98nH6nX0O3v4uMq6xpBxee58mxpVrF3jv4Cyv9efh9FPYBx5idyu01MCmRnwyuzmaNCd/hlrdKU90agT9WoNoGGbL2xoMOqKwM8PgFYvdvP+GphNfIlQhUl1KNxnpWETKWhhL1cpk3SvRBIu4KyUcaeAnGN0bOpgkyBM5cGG+snJIThEZ59ftHvwpGgg3wfGQM280vahlR2nUGfeO2HjxclhfQVtcTxJrg6kRanPDhwQZVhrasseRW3EOD4EwkGm2dfK09LPN9mgxOEWxhRLNlj/31BLFXKCZRBirhyFpy0xmUBJcqIq4N74IRg45qt9HU1OqMViIZP9MZOFwv+q8zpqet1sRu/GOy/8MpMfs0BtwelpakOyAWhtJF9AOMPXXW8stki4x7ako2jb+HHQVGRYlzpUGktG8ROOya/XQuTKl+XnUhKYdKyt8cvtFMpXFsbu5fvMt0uYWi517uP+j/86PTN39kXki0+Obf/B3bS9f4dp6y4l+F+NttL+b//bwI7y7PMEiZWwojN0CzIloKQ5dJ9h5Etd0A3hRDr/7lGKicba0pvgeS1jgi54x7j8va+c++jFVdAKLmJJKc9i6pyHaU6ywm5JzCWJfeaCNOo7sdAvq6FDWMilFHbJ02ay6G1411lJAHKo1/Od0wFidDV3aGPt3JxRl/Dnvpp5OYk/YhC7D1aGwyr7b3lSjkFh1kVswurxmpYpoo9dMaaMfuDlxsNmyLU6mkhqSwmiGOnydMBW81iBn9+VfqB+6PtW7iiJHY5FzplajU2G/7/1rfYbRVwtWjKzRJCQ/cLXV4B2IQ4XWnJ0tMeGGvwPEuiccEGe4PgxVHFYNL/0yorljbFtEe59E6tbheGszXBgbYLLCFATlkHkwvDVY1qKxs27z2kbVJ/vJp2BK8pN0ZI+rqtRxQHMXdq7u5Oir7VhhpCk4pTFcvkTaXub021/lgf4Gd33sk3CQOXbmDC8++wVOnX4E2z/Hay98jW+/9D3W5z+O3ftRxv2TKJle3Udj0vpjNWJYQy45TfxhWpSbK0YUhXHNyW//Bk+c2XDm7vtYrfbpVz3vPv9n3PFT/xbt6rMcvPksw+5p/uz3n2E4+RTv3/Mx5MR50nKJtiEilFNM1cXX1+okP4egmdUTjrb4fd00zWun26N2Z1/5FjyEuJctlA4a93ttI6hD5m1uQv2aKRYF3Zxz0jjiAHhRqnPevBmoik/m4u+lSUDL4kJKDd7KdC1O0HWriqYav0tBRp/II2JXpXM1zFz0I1chGptmU6FVb0pk2tsPjghFdLWfgQSZt7kNcPjstwlpimZgIk3OfA8maZ0jCS4h9Ca2mKNDvorbgnSzcmCSAftAUKnVQkbquQQWYUlHKFnIq9vWi7x2oVzAs0poUA+ZkkGdK5PmJt4/OndE9QFNEOuobe0rxNzRSpxXtqUOa3Je0GSJtFtIXvl7ZBvnENStRwan3uu7ZOcctMGzY4KY2tqGrtt19YmNZHNORmuHmC7QKoGCVhbjIT9VnkEo3Lz2LiLK7umTjGWPhz7+w4f9b3/8SD2Z6dFakwvf+Lvt+nvf4+T+WS69c5mzZ87w6+MjvLB8nDEbVT0hUMeAdCMJz9nJEUKiGuSNOPTCzKZW3wtOsrHpkI+yMXfWKkaPsgVW6mz01Cql78jFWPYuHu/77JG2WNhnOkw31MoQB5mExbEfSgOlwrJzF68qEqlvfhhQBgYE6TJdbYy1odkd7MbRD5Ia7m+tNXoVmlb2pKfP0ySTaNIjNjA243qBRYHVyg/6asp6bOyp45MZD/jYVGOIeGK/yY3WHDEpKXLCYjLqTanmyEzWRCkB44rNsGifeobqRbsndredEwUTPu30KZFFXU9eC8tFRy1O1FRrztqVoE7J5ORQ54lwOtAbkMMfoMY6YIrIbY0gD03ohiMD7vMwBQrFRCyZLANtskmN6RARpjjjZmUOpEoRkmSM8WxSNC1xONp0XYm74iWHYa15ZLNT9FPsnuOgiwIgeLNXWsPSElUYD27QvfonfHR8Fmlr7v34X+Hme2/Qr45z4q7HuHr1Kpvtu3zhma9wcO6zcOejWJeQKKJOeAwiHUerC8+Dx68f6SlidN/9Mo8ffpmnPvEUafcM64NbnLnvSa5f+CYyHLJdv8Sl68azl/Zo9/0LXD95F/u6oGn18CfpqBpW1U2Prg3NzLbF6pbOwNzEOcPcQgEQn28UEqmN6cO3Jr4KqMSEHkda6NunhlkNkK1zRqYJ3wBslvZ50cVDfuI9aVIhmjINMmBznSOmkSOfBGs40iCZ6nOle4RE+IvVaQ9vcU0pYFHwO7JWqhV/z7QPdAmYyHXxXvo3O+nR2EbGyRj/7kiB00RjQm6I9UCbP+epCE/vKbG8cL3+FjNifdRo0iFBc2yiwcZ3mM7rsYDUWGlNU7s3GI6uTCuFHPdpDBR4IfUI7DTfw6I1QnNyGLtpMHdd7kczaFsk9Z7epx7wM2vta0/OgpUo8FqZwn2sjWBBuExLavVJ31Lv10cbEU0xfI2+WrAM0hi3W1LqMXPuidWR1mzSCbkfAFvOHb7F/ellyuGG5bEzrA/eZSk9uv8I93/4r/3I1dsfuSd0++Plr/4XJhzSbMV46zI5wzW9i/9tuIcrJ+5hZw2HndvWVmukEq5wDgz7oZJ01mVODP7ZYKId2UiKCF3ObIcByYmET+s5JqNcq+/Hc0IKbNV3a0kyKpVd7TwmdWzkVRf2kl5gCsZ+SmRJHI5bdkNe0gy2ZWQM8llSoYs4ypwzY21hh9q5/3o4rnk0rDfrDfFr1BorUfrsZLeqjWFr7CtoSrw3FN+dh8PXfuoYKQxFGG3gWNczGhwGYdEd0JQsOvvBj8X3+70JLTk60aXeE+dEnSijRleVU6tMq3CtTgY4jZy9kai41/9eXlCt0Ad5a5F6n6aK32Sp7yYFGxDTIOJkJdI83Zsaam70gUyHSZmCzXwqweHQOZEu5IeT3XIOlEGseTBVELTcQjjjOQQG1iHqLmzZEsbozzHFc2zMjZM3ExMBzGHdGmlsSMLqoeek52629k1BeHV4eJo+I8lsmrayWwSvD28wPvd5/sKZjmN39Zx94pforr+Gbr5B2v0YLz37D3nxrZ6X9Dw89DHYOYG16jz0aIRv15lPjnKjNdJwk92v/y4fO3mRMw8/wIkTj3H5/bc4e+5DjIcv8PbLz3HhUuPizkcY7/8YpdthURuae6xuA7b33avGLn56cXl6f01DsjcluREIXjjdKZhVenHd9kTy86JmM3Ji4k2nmE+cFb/GZ9+D5GQ1C319skZpBZDQ7N/usIjv8AN+n1ZXFmsECV5EiyFDpZ/PD/97As6P4kuJLIYU7H9XxNAmciBzQ6F402Sp8+S+CLpx2D0ke7EScELa0ZrSSXDOQbhd2TEX/JjmZxdHcMvjFsZIkR9wxAtRklRKmyzUXcmiIr6nt+qvNzw/qg0IHYlCsy44MIOvdGwIY6MOaBGq5A2yJySmMBbza6KKBnfGm3PDjZQKgUi2wd/PSry/3jR4w7aLaJjvmCC1QnabcmYPD2jiDbHZGN7+g18zqff43wh80iBDVnWTMquxFrTm6prWSKLs1QMeuPZPWW4H9s8+xvrwIlmMm+vKkz/7t34gwT7/Xx4/0g0AwItf+S+tHDxPZcnZez7Jxed/h+MnH+T321N8tbuDlpq7nmkX2vtoCGqdL3CSk04sbhTUiU7TjdBpYurNpwNpagC6+N5FTmDGYWv06uz+irESIavvwaZiOZqnt+WUqDawkB12pbC2xqDGQhK5+bTgcKCyNUPNmfjSQV9df100ocUJMX1OHuZjjd2up7TGaC5r2QtnsBtjY0yNPcmskrKujUThoAlDC8QDYy87UckkcXPYOuFNkicWavgktNtY4TqFBTkkWXGL1JQSC4MxjEFMYJWUvZw52A4MLtiHdESKc1vmyn7uaUkog0/px3IO+DwxBRoJ0JGdAErnRCTxFEInCtYo4Glu/Kz6PpF5xx2abJsQjThcbMTESJIw+lhZhOFLmLq0Wmfpk4ZRy3SNqCyC2D9guJueWQ19/LQ2ELIlCj7NTryAJEotm7AO7pxwqlCqBRTusiuTFCqToz14ax6DXNybisXa4I0v8cTOazzy2KNY6enu+Hm0v8Hmwtd5+cKrfPWV91k/+lkWp8+DHHneA/PnLJppdOgrX+f0+1/gMw8e5+bmkHse/Vl273iM15/7J7x7+QI3bu3yQj0LD/w06fhZUtkibUNLYM2JrMkmtYyvW7JComfIZYZLaQ1T18RPUsrJSlqDVO5oSHBQbOKXEBp9owSk7X83rWhgahLcyGZaCy1n1MGFeD59H3EHwhlOPNqntTJ/ho5YHDV2378WKIA6iTKIxb6iCJe6uYmbOAAx/Xv19+k01ASTIZGT9iYhbJ3/zHROBfveGSMpOCsSjcl0zoUFcCAdQqFZRiV8O8JmeiJBOsLi75WX5Gn1YPNrlzpgWbHWHb0uDTTCfJKuIj6Vy9F6YIrqTWKY+H3cZpMeJxTW+V7tUBlptsAoZEm+jjFzVYcEgbI4Alercw/chdWRtD5FsmaLACOJ10gEGZUNkjK1FDoVah0wVahTN5/nVExRddv4QORKHef01VqMu+Vt7r/6ZRYnzjNeeperF7/H6viddItdHv9Lf+dHtvjDj0EDAPDiF/+WjfUWlvZI63dpacWCwm+VD/PMyfOsyoixwJIyVplT0SafeN8JOmybVRzazY6qtTCASZKpNjmpOQmtR+k7v3irJWeUqye1tbCXzHVLSp3784dErQosQ0e7LgOr5MeNJkcAliRWnZMCG7Bqies2kKe40Wae0AaewT66DhsRNmOhxf5+lV1xsCEKQ3LZY9PEHtCrsGmw7OCwwGE1+qycoDFKYj2OHF/4bn5tsB0KSeEwGo7vg8qLcyDMLNYLDtdRIcXeW0IOsxAozU0zsnaU4iRBC73TUj26d7/rkVoo6oV/GQS4eeJSCUjUE7eM8LZXobMjEyMVozYndYn59DCKkcztQQlf8CmMBOtpbXD2bzSBWZakzuHiPMugJDzefQICPzM9VGhEtfedqk6HE/PznnX20qB2vqOmBiztRXIKKjpyFZzg1ShIME/OEk/fmgdhidqcJVEQahH23voWq0vP8aknH0LrO3R7d7F/90cZ1m/z/B/9Nl9Y38ny4Z9Gdo4xNt9dTxOwWKOQ6K9c4bErv8c9Jw/ZOfZBXn3pq9z36FMsFj3fe+ZPuXBlQfnUX0d2TqHBPreqIIMjB7H+SFq98MgCYxvkuA7ps7/3GiuPMPVx2Vfs/SWaqXDL9M+tkZsXLjftCQY+IE0ityKu14DkAfdlp4bzZPZ31VLAzIVmE6rk5DwJuSg4BF/rQThViq8P8mJGD+fmOB5HOn7/uorFZxi2vRq/W/wa8u+14GK4jey0D5cUEH6ke06SwEnhYpHcaVIwS6E+8N23UqJhKBjdrOpRzPf34etAq8HKzzO/In59NEyen1KDGAsgbR1++xnVHS+yeMNbQ5ngBkzRgInMqgA1fw8qmeRaUyc5i6OkTibUWckxySld+zAy5VZMbpZ1UimE/t+vhQE1c0heBNpAqUPwNTp3LhRB6waRnVgRFmjegLhs1LkJXV5SW0VUqGXr5lHbEWkDNfVISnzg8A3uXH+FY8uTXHrvTU7cdQ/b99/ENiM/8Vf/3o908YcfkwYA4J1XPm/X3/oqh+9d5NjDT7G59Dq9DbyuD/G5xRNs+o6MH6otfODVjxTAIX+lUUqZf6ZKnlcATRuddG5HSUU6QauwEKMa0GdSw9cGeIdvZBbqcGOniZaS/3zt3fHLKqtugvESVWEzDlgTek10Aoet0VkNWcqRLGu3WyACw9josjCElTBqlMEJf4uAVFvI1nZiaj5sMeUmDyva08TVYaAJ9EEGGpvHnNIqe7njVhkdbCtuJTvZAk/wc2vOtE/ZpxhrTi5yUyWXGOYcUH52rfFQBywY6KaJPiDZPU3csoEdjL1+yRCw5oIuyEyNpJCqe89P04pEclc1hzmzZb95zQ+NJjF5mjKWrUOMdLQ6uqxzblQkPv/gfYTsCc2oOQs9yzTxua95Nm96pnCc6dpRkVkuZlLi3/vzdRmTX4e+th6D6JSOIPCpGLSBWj2VTJrDllg+ambn3flRY5ZTCjRGSHWEtIRaKK/8CR89c4U7zz3CqTMPcvHF3+XuB5/m+pU1v/2lL3H50aeR3fMe4lIqkoVqsLr8Nk+t/5jzd97NzqkPgG7Y3TnBc3/w97nw1sDNJ/5V7N6fYmc8pFli2w7nydXzZLxoTXkLWVPA1o40TVOTQ7VgpaJdEEKzQvXdtUu9nMg2kyHbtDJImN3max+ku2nKnHb4Kd7jKYRnsshVyYSEHGggBWv9TOyr5vJez0sEa2ssYoA1dSB9ZJLA5IDpzZ4iWqikuIaCHBjI1PehAC1UGQG3J9H5HDoiy4HHBAaKgJsyTY2wIx7JEx3jPXPeQ/Kd/TzJR/KguTX2vE6KZmNaEbiD4sTdSbc93zDHotKakrX46giDtJxRmSmm2KzeJt8NQ7Y4ayu+PlCqW/oG4RbtQNxtlDBZmyW7rc6OjwnxhWodMF1wu2WzZwqA2dbNn2QRf44m25i5B6066iK6pLbi+TINHziMeE8J5M8bcSmNxkAyZa0dywYfXv82p025eusqabzOql9RmmLdHk989ld/LGrrj8WTnB6vP/eP7OY7z3OwPuTE/pJihRMPfYZLF77GG8Mj/Ob++YBcOwYdAxb2h6nvX9UaOS2ji5wYxT3bsqVLMjN5mxW6lNlvguaONXU2H2nBls5JWEljr18i5lrrpsI6iucqKblVBoSdnEJKU1mbJwMuMIfLBMbRXfuGZmScMU5xe9zDgL9WKWMRwVrMzTIasACWfSIXJ9yklNhWYSuNVkb62Pce6xcMQ2Ut3ggtu55anGNwcxz88GvOaxhxpz+skk1cChZ7WAZvBIp4AtlkyQzM7Phl5/BaSomsiWFwN8EscMdqh+vDmqbZzZesklPHUjTifrPvcUlu/qLVY5Ytu/mTlTj8jqD92TCl+v+XWGGkKJjVF/ck9cbFY4cVzW5aAqCxs0U6P4Ca+xU023ihi5yC2XLXYi0h/r7L5J9gR/vLak6vaiSwQ9pY0LyYSXCT1NIid6LVgTIc0vV7SF6QZtMYZnSgBqttaiISyW1mp+ZAE3LrEqdf/CM+8cQZ9o6dZdxe4Morz7Gze45ffz4zfOIXWXZumrI2o79+kT93+BUefvgJblx9H7gOzbj47jt8yx5E7/kMY+dytCyVsUBOLimszddS7n3f+YGJIwATc1txprqQ5oZBBEx6kgQ8bFBEcUwjuWOcjq78bV5Iy6zCCOlrnGANaFbdxa2Oswc/QGujs7fFA7ZuR5ho+L7dGoYjfTMMb77msnDZa4EoTtO2mQsCmRnx2/DCiB8gTgeUILJYND9q5gFNdnS9+L+PXX7wDibUSmie92Qa3ILgsMgRQjD9jCYaRDwvoH59TdyXfNvXRxIp9v6BOjTDZBOM+GgC2vS51WjkgvhHQODTqlU659vp6Oszw9cCdJhkf8eiqfDUvTgu1EG5Aog6glTw+9qqm39pqABKmbIBXYlgtUIbaJpI1d+PJhHYZIIUPyd8y5Cgjr46aAVJPUKmlS2kziGbOvh9hAbpN8d1W+M5jli/w0+sv8fx97/A3rFHuXHrIrY9oNs5AZst3ekP8ehP/ns/NnX1x+aJ3v54/o//ezu89j1IhZPLXS699SrH7nuYm5s9vrD6MK/uHUNaHyzkFGlat9nKNiOljlpHVv2CzVjmSVBywkbXZGdR9rpEqn6TVXF43BOeYF9zTI8SE2oXkJ+EP8DI0MzjSqsHVGwpbMSNTobiaWydiO8yk7pDXudduZiwrqMfrilj1XeNJlBNOCbCXqwc1rXR9x1JlD5n1uPArWA259D0H+861nVkO/nRA0uFWto8VXY504pRlCMZW6kzWU5VXYdcgyAb2ukUme+G0kubU9hWyY2Lbg7+OnJWFgZ97liPA6uuZ5F8Oslm4cGQWcRk13BdMc2bpY5GCf+G6aBNPjzOe8r5YV6o5oSzgEbdzbGCJSR3XpRMyerEL6wjSY/IduaJeLBQi8Q7i32pHUXohpRukkaqOn2pmc/7zmAeGNtA0qVDqLGrnpQIWTKmaQ7fadLc/TKUCxOTe9qT13BqFDzlMOvUfLgB1iiJ1evf4BP9c9zz4T/PanWa5778jzl+z9N87ttvcuPJn0MRFgcHPHzxc3zkTiegbmzB5uaGa+MNvmNPkx58ml5GT6EMd8U5X0Gzu6LRsFYpsQNXTW5gE6RHM3MnNjkyc2lNZ+Mon1Ydyq/JneJag6SVwKZYGQxzcbb5/zsRUFeQTOFMQOjhGxYGNzNS4MC2T9XiHvkWCISJztPstIqBI/KlTfwRYIoEVs9cxKWBgRyYf79apmk0RBMYbupsc2tRUJ0TMBH7JjOfyVHSC7YXJMz/RhjjegsTo+SfvZ9NhdulrxMnAjT0993856kBdW5scz9/Uqziet+pa4kExHyEIJgEXyB4LRVnyRN2us1ABrcIjrCiqXlmagam7YuF9AAAIABJREFUiTuu32nl0JrHs0t1V9SJhGjmNs6+SuixtqGOY5zdEp91Cn+IBhi1OvOmigd/1TY6koi5zt9KrA58OCuteRPZ/PszisnIqEvu0kMeuPxFdvUq9cYVqjaMs+heRx12efLn/8aPXT39sXvC06O1Jq/+wa+21Busdli//xbd8hRjfZ+39dN8TU7x8v4ey6F4wYj9szadIdUj2VdzSE8kiFqwg6A5k0ogBVnAPJ9eb/MYkHJEmtPO99dUXwlkdfe7/bzi1rBhlTqaCts20HBPf1PjGIlBYSvCyoycM62MVFGu10IXha00Y1sH169jwaBPnFp0lGocWEgNBf9d4h4AuR0VrYlxbzUg89YYzUjJtfylCTnek8oU4OFQtpC8Mzdxj/kI1ZkMVJamjExsbZ88apDaUhIPMwF2FwtKa9Ta2EmZPfWJO4lSgq0PE8TakQOWbIx446JkGRFJjLE3VmuMMWEkBJqgKCZelJqA1Fj/NIHshwOypO8a0jJVEsI69oXqXgPTtN/cYMV9ITxkpov3qdXkISWhubYgj03GL5Nd6dF+uREWit+3u/2+iNapmQnjniNLWWNsHluqoWVThKJeWNyxTGd0S6ksL36FM+9/i09++jPIzgmaPMA3/uh/4k/3/hy2/xCnX/mf+cuP3Q17d3Pz8iuMh4e8/t513jr3F2lnnyK1wb3tJ4a4+A58sliuTDHFQg0TFZEFEwGu1ZEWjYCqG9rM7opNSKlzIqU1Rw1E6Ke0OjOaVmoTkhqMnlKpCKP6BNwFCbfWIw29fzMhIWmUKQhHcSKpuVGP4HLP261yzSDhay1XhvgkiUlwExyKx4SsnvCHTcXagleBNxfSBT9EYr0VEtsm3hPCUZGeyYoTSlHn93BazmsU2MnRMdFR5Mg+2NvNcVYNZCSKsM3fI9LNsP70++YkQwa/TrX3JkwTau6J73ycHA3upNxwiW2n7niq7tDF5PjnhX/ycfBrxeXSFj4TvgqVCiV5U99amXkWEydh8mmY8xxKDRLe4GsHMmYbxLpYywhjLf4ZWIvI3wTDjfmzhEwVP++a+aqBZr7ewBNjt13HjjU+dO1bnKzPk1dnuXXzCnv7J6nbm/SLYwzLB3js4//Gj2Ut/bF80rc/XvmTv23l5tuxk4Wxjpy843Hee+ObfG3vaZ7Z+wBNFg4NxV7W+QFt3r1JUpeXyFFEpxunJBbBZNXkIhdEGJuxEGGobnQzmpLw3ffCoKqybaP38MHOr0BuvorYtDI3GkkymYFMoqmH4gxWEFGSmZOZOqWOle1EMGtuwdmJspPFG4SJQKjZIUagM/zgzGC1sG7CcuGrhRqEvmlHDY1mHuiTJTPUIVzxpukzVFyWGaTMGl2Nvd+UB6+pYwzDohwcDJUaEr4aByFgiaROuDu5WKHi1sGqkzVzsJpljGNMaTqSm1JNURwelJRps6lH6K7x3r0xzgXBQ5g2wdDuHLJUJZvvbVMSSoMkNUxlKkIfppItiIWeVT5FSbtzWpvNbZr5523VrVKzNecw2G176mm36kyTmQTlToZ+TTccobJasHrT95269OuXye7WZqSBJu4tgH9eQjv6dyQvzFff49zl3+QzT3yEG5tLdMu7+foz3+BwbXz0wY7jdz/Krc01bl18necu7/Dug3+Znb1dbLu9bXccyozgXKiGh3zwSgyltsNZ4uZsKk9naxzAdF2nXSejKUc2v/iuvrTmlq3FkOQNU7KpOQfEIvjLr/GsSlaNf+NZFzWan0SQMan/T3tvEmtbmt15/dbX7L1Pc+99974mXvQRGZnpTFfhJm3KrnLZVRIgl+UqjBCeYJCZwAAkJCZMUBEvB0gIMWGAxAAGhYUMiBIqIXAVUJRdtivlSjttZzoz7ciM5kWTL+LFa257zm6+71sM1rfPeWkVtssu3ETFnrz23nuafb611n/9G8u3sM1dtd5VcKYWkdm3AZjZ/dYQ1FwJN+eJGhqVVcymV+0+Nl+aunP3M+t+hsrn121+TWySn/kDllJoMkDxYeddwDxpy9zI+fqctDaDVU8/E04FpHiKWmNsz2VGSWZkzPGkCkY178iBpdSGo3LWfLFhZlLwDGRaA+elEmRr4Jo6jyOZ7bbsEYLfrX5Iauilp07yUuH/OlAVZ39nCixrbrPW0CCZsysELTVoSSfAo/kKzRYqlFPG+YY81ehht2SaTGmz40zoxN4+2l6DXO8xpUoySZTiWHp4un+bWw9+EaYB/CGXZ29ycvMVXOtpmo7l8//q55//1A/d+aPWsT+p6898AwBw9xf/Mx3P36S9/WmmaWJ79hi/WrN9cJ9t9wm+0HwfXz2OtCXWqd3sL0NoSMUOOK+mJw6umC1tEYacaKXuV0XonBFxBs0siiNXGBZvN7Z3Qiu+ygzN8jfGgGQj3HWxYRgG1EVUjdWaHbSmJ6IJgayFvlSWszgixSSC4rlU6+zbIozeSFIHXnbM+IVz9PWmLjgIjjwkXLBpdlLbbUl2+NahKTPksjv0XH0+/WRpad57XMKaHhKESJONIDVWlr0teOsHXotNU5XDENTii+fwlug8B97WAeoN7lv4yMpXlrFrUUacCwQNpJKQIEYkVEF9RjSiYuRFraTDQLbnRiHWgzyVGqWMorkGFzFYS+JDNRHJFEKdAAacdhB6SjEfcaeR7IWglhBpvuJNzRdIu8PN1QNYa5jOfECKVuljKEiKlja3I6j6HQw9T2e29rFAHKnvVUlXaOjw3kKTUpkMKaimQ+LCrqgZy9walMI+TEqi7dPbN36V74pf4/ia5+QzP82jN/8u1w7XnN17k7MH79Ktb/PhdstXnvu3acMacXnXDFoB1iq/89XSOFQUIFNKMFlVHuzxZNt7lzJ7c4xPyA0jEpud/j9TbE2iNVRFJ5xEI+NJwam3fVNFmgxe3k+9FHDBVbLnk8XFmuW5oVSd0BjRBI03cm+qkykY+WtO5jHbYEN28qxsmB34nrhmz4JZFSM0aC547+y5SyHNzoLMZEWHSCHhqlwyU9JUg2UCkifLothJV82GuGI9zIE+zLI5r5Ar/uDMZdDXtaEV1CrRLXWoqD4iOEFS2UHxWs2LfHG7ewop1ogSbIUmWM6CqDUclUxp/BnPLiikrsSKGIozk1gNIQURh3O6K+zmMTBRXESyrVYStXEpQpaMV/BqJEFXrHBr7u28yxC88K99+l984t2ZKXzz7+t7Vv+USuZnv/wrlCz8h3/xrwrAz37li3cebk5fXZUrPvXwN1hO79Mtb/H43m9Slk9zfPMp8rBlOvuQz/3kf/ennuX/+10fiQZgvt7/7f9Wrx69wfmjhzhXeOp7/k1cuuL+V3+B99w1fvXwR3i/DXgJVTaSUW+2vaLQuUCjSnYwaaGrUHYqxlL2WWldoC9GoJumjHMG2TutawBfN4MiOB2JLhKyZ9BEr5U1TCYl4ydMzohYh74DMpPCpJlWPIlMQYjiaZxwNhmnwNdDKAZhufPyN1lhAkJtbvKUaIJjwrHCYMXNOBBCw6SlmlgoqU4EO5Z8gW2eYXNL0ZpKpkwjIQS6Rcswlap3t4jlVq2Yb6aEC/PBZDA8pXDYLizQpxrztL5FvCEAZi4Sdu/jvD+1Ha2Z/tgUWaebOqlYIdx9kaWA1QKcNSGl1H2vFcxSzC/cu84OgeB3ng+ULU4WKCMqTSX8OfakKZM2+eJ2ccMTyXb0Tne7VzNdqR+r6rXun3huuZSdm5rW3XGtT1YcAerjB56Y5sRsastITlt0LrR+SdMs6iqmTps57Qx1vDeHRrOX9yze+b954dE/4uXP/SuEfMHV1Yccf+JHuP/1n+fhww1fufljcP1FYsH8NdT28js5WkWDdoQuMc6C97EyyNW4AppN+kbc8wVqYzQrcqotvckqNe8/NyXZOqaY5e+s3JjDcEopRvouRrIzlN8SA23KdHWdYEe9YGRNxYJ1fGHfcNVJeFfwqjZeaXaT//xA905+e8dAX+9VpMryiq+SQ3mCp2AEN9TtCKMmlcRkx5UYyLyGMEaHfZ+ZXIuz1djcxBNA9vt4nV2v5iZU827Xv1PyoNXqGkoZ8SIVmavvoWgl39r6JYgjVTkhueB0rOsPqU3A7PExIy77e3XmsOysp3GV+Q+ibud4aYZBZd80Q8WDFC953/ipVvIn5hJa3RWRzDRNtm2Twk+88t217s8nw/51tbdu5lvAVAp/+yu/ShMc/973/8gfuBaWUuTPeuGfr49UAwD25vzW3/+PSru4gWhis31Mc/ACqy5yeu9tzuPT/KP1D/LetYDfQINJv3I7UZzpqmN25gLnPFmMZe+dwYa2Qsiosw9zp8Fg2MpkHtNEIzWLfD6EXMSjDGmkVO7ATLrJOVMaT5sU8ZCKTSaL6IlqXXDjTIc8lUyvhQEIObMMMOErs9XIfJOHmGszI0qKjn6YKN4oRa0oXYicjzblNzgIEYo1BJMortgRmJJBzn0xX4C5e3+uW3CRE+ei6DjSLSINZltMgO1UUG/mHaHAQYiUykQeKxR61EZcNq23iOwOjwI7DgDFPNonybhUveIr9O+cGTmIyySMNCbOZIzFG7lyKBOu+JoaZ+uKLAULQPPMIUdWlAulCOKVyJLkwDPazyqzLSqITowOPLHaywquCOrMAEhldqSs5kUzfF6TE51kcnFEZ0V+tm9VjLSmeeZQ1JQ2MU27VrickvAykqfBGjfNSFzjfcRhMbBzEzI3LzP0a3BypP2d/4u/fPg+156/zYNv/AohLHmsgS8s/wbh1ks0mq1p8KZZL3lC1AhysCfBPUm20zJZj+BCVWUkknO4XNcjmIWzr0U+6QiSiUT7bBUoGB/FhQhpwovUhM1YC5p1SVKUURytJtu9i+V9qM7ysTlzoPrdK9ZUYNP6vAb0PpqrXLV7lao+MWOpUHf2WjkhBqmLKmBRtUmy7aaLrbZEbL2Vs91P4iw0yNV72lY2FiBkRVF2jRVg7aBYndLKr9jLBGbJYeUtVaTMeiLdSScNqam7cmBeFezKlZgixhVrEGY1QC6DyUKdUFihpN1UX8RcAUt2YK4j7JC/4ndrg0KoMeFK8Yoka5REnDWvriorlLoTrauEWRZbWQt2U2VDDhFcUsSrmXIVIclE1JapOj4WVUq2ZMUmdtbuK+RpMBKqtGTqaqiY34KngTQxph5x4+f/gx/40Tt/lLrzZ/X6yDUA8/XB3Z+788Ebv/Tq1dk5y4Ob+JB58MZv8sr3/CVKD+gV/1P5i7x77ZCVerJaPLB3LXHuXtV2/fONGFSIwUh2Wa2DlaL44AhZKMF2/xTMcKiGh5RkyMGoIxmYvbhbXxneVXzsRRhrtK7xUcyGNs5Z5qpsKplvHEcWIbDy0WQtRRmAi2xdfKg7+uj3O3wjxCe6GGh8oJTEwi/oSzLtrAv0yYIuMgW8xQGX2k2vmsZyCbwyTAX10PjAy67j/WHDEODYd7TAVkceF5NinjQd28mm0Fm+lcXyAHbEN0mW0oXsYkktLWwCbQk61BS/cRcyMk9lpkuuBb1CjerU7IedEqXZFWeAWYdfZpWDj1WjbrGeTtlnzavHl9E00up3h/U8rc/MblTrtM8T+2QzKJrlXTvb26pIQMOe0a/mzhckV9jX77kXNaJ5ZncXtV2oVBa5uLCb+GGPMMzYtN1jIN5Z2BVw/Bt/ixdW73L75e9Fuoaf+23P9Mm/UkVY7Jqjnf3wtzngzZPt/ldHbTDYBx7t/KolWqBMlW2KC2j1+nWi84K2hs7scxtM1lnM2CdlxJvELmOxry6HSuA1K3DTuwtKqYWoIicUJJvVLZ5q71oqiU4qQa0G9VTCppGG59CdiJ9zEwRUAq5UEyk38yP8zodg9ziqTFBncqo4W1/V+wf2O3ypaxuH4FXI7F0I51/nfATU7k0lIZKr2mF2KdwPpk/+fm/1a03Qzo6XmbSXkDxRdAS/tCbBuZ01iXnpO1BbRfgam+2c2/kJ7JEyI+3NkddK2a1JXDHGx0zua+rnascXUHsd5qk/VKlimcmdWtGzusoQIE/272kcWa0W/PjLn6mf87oAqL/R3QrG3pO/9atf4nr/Bk9/+GWuXz9he/Y6Ooxs85YgHY6Wq9P3efq7/3W+54f/nY9krfxIPqknr3vf+Ht3Hr/5D1998PgB64Mjbn/2+3j49S/guCSGFXnxFL8Q/2W+cq3jaFKibtHcmfmIZOuO3YQvgg8OVGhx4GquNY6kmUWFsKa6Dx5LNjObUt0Bi6KhJv2JQcEW++lZ+MyQBBeMSNd6x1Slh/NB2peRUB3JZgixKaZnn4oFVxzFhqsxc+WE1PcU7zmWSKr9taseAV5NyzxSSMUOndYbAz9rTZFPiVwLUOcNrlzGlpTNRKivrO4snrWz1LzGO4aUwcPam8PgWJTG2SE7FTvQ29iY1j9nmjk1rXiyJLxklBZXiVapMvzznL1dakSx053hTnECJaFiSMsMxVqxTHgXa0E1p0ML+TEWtPE/7KAwSDbDXHCr05/zpdoYWzRNqhamRvhjl1SmdR+qNjYjElEzOzeUwSuuWBmPEilqDOgRmxOVQi5byAM+rg2uddXhTM1Yam8Z6yrzOVfuimMOTJkP0SczCXCyI5IVgTKNfOf9/4OXV5d86Z2etz/707QuWCZRzYGY5V3ZlX1DIrI7NErGCjyKiD0W02TnWhwrXI+DYmsqj2cqg+33XagIh5G65sfsiiJ+bmJctX2ewC2gjIaC18nXCiOoFoq3IinOkjpdvc/xjpw9TkdS9LgsphyhBmM5Y9srgksZoreGweXd+4IT3M4FEmDflNuqyiZMl9WkhDvSJzvkUJhtpM3p0+R8889mB99rTUBERrzGnQLEEHA1VDzttfSlpHoufLuh0L4BKDsEQCt/w1cPkZmsZzLJDDKh0oB6nEygwZ6vmBeBqla1TK5kRY86i1R26ig14AdMbTGbJs2k59lhUMpgvhW2ZAFmTw+tCL51RQ5PLpmi5uZY1NZHWS1KGzylH0li6FhcrPjxF16xCPVa6AWtq0JFd01W5tf/n/+KLl0Qhnt8/0/+979nLbx79+6dF1988c7vW3D+jF3h9/8vf7avpz/1o3eAOx+++b/feftrP//q6e98gavNOdeOb+CDcPnodf7q4hE/0XT88vYv8OX1U6TocGwoY6AEqaEQdhO3QPEmK6K6b3mFEANTMtKSSLWqrexoXzMBSsp7yWDdfXUxGE8gVKKdYKY1zlQKU0moh+gjXqEBmtiQSiaXTJ8sQjgBp/1IjJ4bOIa2oc82hWpRQjBplc/KpJmx2pS6yloH4xK44JjGRGgDcbIJOYTAxbDlTAeW4oni6JwjOYjqGHRiqDpg58BJYEhzalZiTDZNbIcRxOG9snCChEBWY/9LlCq1qwRJ98Q+kYgrCS9uNx1Thm+TNCn2s8qsLxY7rEVtn2mHmxWGINhIkwHMx0EVeyzeGwFPTNuOoxLLLHBImNUczhCaCuULpj9XakKZDxQtuFwoTqmOBgZyilSpkxk6OfEUrFGo/G4LMfEWCe0rBKxi95w5lNnBlpxNsVqsjVCsMbF1uJDmQCN1JCk4CbaCCmveys/y2i//z2z+pf+Ele8oLu1jeXPdt9dJ2QJ2QKV6v6sao7/GPM/TmyuZLIr4aPth55A8IRLMNGgnv60IxrwjFgsRopLTkprlTaPO1jOYf7vOfNEq16MkigS7r0pGJRgvQKwwFmeBMJ6CSCROSmKiBLNPds4Z2c/Vwh6pWv9pv2enjvVOyMxsfrtMxmevlcuGCLgasGP2vXuEx9f33VY81vwDZkPs7P4wVHEyxjrtbmoHKqcEW0NUaL1U3bqZBknNPNmb4eAMEck407QrIN7eR0xyJ+JRL5Sq0w86GlE5e0SKJaB6TwlmYOarTNU+V4ovHnVmCOX8nARY66lkSnWBLNgKXgCpyYauuvIVtSRV40uwu59SGes9Gy3tEewzVkCDVCmvrWcVVwkX1nj+ndd+i6LOGkAa1vmcpz/8JX74B/8tNCWW/T1UB/zy+u9ZQ+7evXvnD1Rs/hlcf9yNxke+AZivmy//+B3gzuu/+F/ozYMDNpsNsr3EXzum3zwm3VN++PYXeO7RwKl+ml9Zfo6xa/FisbJdgGF0hMZxNY21+zVzDCFyuR1xsSrcqLtsFCeQNdN6yFiARqr/HmLEF9P3+8YjxSZlSbaHTM78zV2xCb1xnj5PpGSH6DglKOCj9cJZlZIdo6vmPPUDb3rxiUmFjCAhVlMh6DDftZIrXKlCjJGsRsRyamzZJjQ0uRAbT04F542UlFCONTI4g1EbV6VMEklaSYzBCle3bMmTHUzqhH7oCc7T+miGHWLwvCuzF0DB0bAnTjqCCClP5pVQjBDlxZG8Ay9m81mkWvRayIhU/4HibK2Qy5x1XhugUqz0VrMfrXK1ecWjkg1FwFwbqXCnqCJOAHOnUyeQ694/2T5YvFWU4KSywtU4Y35BpgcNxvAuiRjWJLdAXAfYYV4UtAZRodlQI2yq3MVc62iHeZrMTIp5fWINlKuTdpkSGjKaCoFI//zncCfP4Vc3kMrkdzIvaAGqU2LlA5S8t6recxW0cjLsvZ5yNk+NKoUUUYpYEp4ZuGTAV5i48rKKR2W2ctVdfPPMhXAUkgQaPwfTAhVBS84jxdWJtiIK6gmYX4NizRs68wnMW65kZ5JRLbaXR5Gs1mB4ULW/m13rpJIstSIjT8o6pcpazV6XOt3PU6x9/qWO6w7j/9hzz/ZzZbBGqCYLUol5ts4wJElKtgbVgar52WdNO2jeJJW5tmyhfnZkZ5stlRhZq+sO+zWW/Wiy2KIU78n1671olbGawqQkyztJ5J3DpogpHSwPqQYLuRan2SyU66pRJFoza3eaoS2Y1DOXbG6PWmrjprt7K/iGgqkFSjFp5U7ynLK9L0GQ4mqDIDvcf7sZUCkcbi55Znyd47Ov0SzNBKg4mDaXjNOGwxuv7O7rb3z9798J3Sdeffnll78NEZjXcb/f9UclCP5xowwf+RXA/9f13td/5s752196tVt2Zvt78BJX/SVN2MDZW6zXa+7pK3zV/Qu8tniRJp4RcUx0ZJdYFsH5QJ8U782hbqo3uABjSQZuie6m7J3F6BwalIwaFcI+crcN9kHMOaPegmzGNKDi8WKNQuPMgOhyHInBpuvL7YQPex8D85k357pUYNl6hrGY14AWKObchxN0ynhvgSCjmt+AzRDKzSCMU2GQgHilwREq8fByGsjec91X6Zk4Ulb6UiglsW46opTKgrfpuzBHAisEh1cjJ+6u4uqOciaaFVxdBYiYw7v9tZGegiu7ABVU0WoLKMVIlXvymZm3WMBIsUncN3YIz57o2Mw7T2a770mVayZDZ4rfm0HVIdeaiKqLV3FGoFPdBaTYyqGS0PBIBomJlAJIIuexTtQNUzFGtYozYhajTdLYnl+d6ZZnAtnsbiiu+uVr9VVnLyWjSg3Bmqz5ec4acZtQ60phNoiZv/+38QD2k5ax9yvxrgbEJK0Tbqp+82J7azEoBXNrAydxP7HNsL6a3LUUS7icC0zRXO/p2RUxWXFzmFxWZw25qR/mhk99JOlUoft5N7/f7asYZuJUdtOprcW10vzqw3PzvTi/l/uVj0nm9sXBVjGVz1BXFc7X8KBdE1ARkLpqUlJdT1UOjMzooq0Xdhr4+nPdDoGpXg+KkQMFYzSINWi7zAsT4uxSOedQnW+/5nXEE3+jE5nGPkdJa/P5ZPNjzoh7zkX9BM08hyckk4Z6UvMCxAKuiplgeWG33rK9RN3v13vZkK+ZdKN2FlDloMUaLE0KecIfrvnrL3ySpoyEvCWKGr+ilGpDZOuWnCZ+4x/850xXW269/AN85of+/d2Dfeutt/Sll17a/fnu3bt3nn/++c9/VJj/T17/3DYA8/XOF//rO4W7r17cf8Dq8ClO+4np9HVu3P5u9OybdAcHjH3m7vIzvLf8ft5aHCKyZBkL/ZSqM9zsJuhqQTCmqajtm6Zpsim9JoBNWUEKjQ+kVKrW2dG1Qprs66dpghBxFPoxM2Xb87diBjpzwJCRZTzee7bjlqKero02xHnMVpZA8EosBnP2KeOC+XLlJLhgXgIzOjHUREFyz/OSSAgP85LiJ9R71niaAAkhFSF60CkZ81ZtxeBwLJuGQ1cDP4B51+nEhE5mA1r3y1qDdXQ2OwFXIs6LxX36ANngynl3izf9r7GIpx1BT4vHh9pEFTPn2e0WqVMYed8sVU91F/yOYITEmnboq2SsfvaLTUMmyTKJkuAry7uaENXD3CSLE1KUydmuvpGWKSd8yEiuzmfOAyNlGsm+ylRxFmgicyxtQWjqtDnYLtRDyWZdSw2AoRKqpJg7mtR9aXCxzl0mh3OVXDW7YVKLrOAp2YycUrLXO+fJXhuK2e1KqNHFQgyGEFH1/lmnWmRtwjVgO1Kk+ibU6a0UaKpNN9Tsi+J3z9W5gGjaoWNQkMnMgyaZbCqVWrS0RtNWdz5j3Quzoe58vxRvuve5cDpn0bhS2BlZ2RpIdhwDZYbVZXcPz5eU+j1nhL6SDk3+JlXGZyQRQwa9PUasCYC9Uc6OUyDs77VqJWxwPTs/Deeticu5EIIhM7ZuZNe8zdzKIvvHLDqRnyD+AftC/gSiMRPuXM0gcb6QKwG2FJPCqpvjqet6bG6M6ubBdvqya+qUwiwHBSM+h5rFYE2d3bvmhmhfXwTSmPA+GIGv2ApLnaBpxCGmfkIoZeJ4e8qz6Tf43u/6KUQNpQRPSleEuDQmQKlNEvDbX/pfuPbij/PCC5/4PevgR0n297uvf+4bgPl6/M7fufP+7/yfr7auYworjm99hre//Le5fvvPkcYPQScWZUsvHY/Ldd559kd4130HkzeSVCqTmdBUaaw5cykuGCN23AXjmCQmOGpyYIBi/9aIJdd579lOI7kW+nEyl7BYSTVZEzEEIs4kbqUw1eCLYRxpGvNKGNyZAAAZ90lEQVTXX7jARTF5Wlen1SyGQIQ6VeQ6/di+PCGxZbMdDDT0kSzQ1MIWg1okcHH4YHwEEc8w2YR6ORWW3rHJieAdx67d+YI4dVVtuN9p2q65TgXiK9ltb+XqK6HSMgEMMrSc8/0hq5qr1n3cFXMjls2NUtpJ00ophMiucNtV/cYrFVsr1FuqOYrD18dQnd5kLqp2GJUC4q34J519FOqBXRuNXbCLWrAJYoeh0UmFUuVRuVrL5oqJiCa0jLhqlWvKg2qqKoFBlcZVo6NqRRyq7wH18VoGRv16MR24I1WTlRk5sck/V3c7s1qdd/XWrObaFFDf8x3q4vZ20UB1fAMvRjD11MQ253DS1cdRTYWSfU/vW2tUhZq3oDUcBizNTs3RsnJKZtnfzm+hFs/gjJC787PAVea81MbC/q81GxXBqeukWeZoO/WZY7A37wmIEc0yO/RgJlXaazIXc61NUzb768q+F9XKATDlRnA1pponyILKnmchM4ltnvr374XxQcBpxACLfaiQqhoHL5ddit6MeDxprWuuqM2ObAfWuIbQmCqp8k6MrLtv6gzNMCvs3QpI7YEGTPn0pPum333v2rCWQqn8Awc7PlQRtaZVZ3ssI0t67xjyYNHiySHJMYREKA7Vkacff4PD8WusUwa9pLDm6sPX+Us/9bMC8I//t/9YyYqGhhC7z3/fj/7NO3+I8vCRvT5uAP4J18U7/+udt9/8wqv54oLl03+Ba8dr3v/azzFe3SeI46lXfphpegh95CIXNotneCM+x4PwGU5bs8aNwUEaIdQ44OCR+WbPSqq2xCoQg0GmIpnOGcGPumPLWujzwJQMxmxcxLcBVzLjmOialiYYc3ubJ/rJDrt1tyJU22FVR+MK20nNfUtt6peROUWz5g8UVNRgTxWyeiYMioxS6Jzn2EWuisUcb1XN2dALHYFYJwHz9E+7Dj24aqSq9pxCsCKqSSweULM1Tc4TC8b8LqYQyNUVTXXCaYO4ESigLbO0ymBoqVOmGFmvHmBJkxkJz0UGi+z1EmH+f7WIFU27PezOGKZOedYMyK4RKdRCU6dw4xJUCV1NRxyB4KzRyGoNGzIHOk1IDubchmnCzUNedwfo/rR2NmnOeuky0hLJ4kx6yIIive1ZazaFD9YouuIq7Gk6a+dqumARkFjfo2RwuqiRvGQ2i6nIjTPPdeMTOEsj9OZWaJr6ZASxXKd5ESOUuvr6ViVA8ULM5gs/Q/laJsRZI0Q2Jv/8PefXQHFmdZwL2ZlBjZYavqUZtODV8hvUZahS0BkNmSdXM/aZLZSdmfb4NPsx7hjqUKB4vJ/Nc1wl0yWCVrvi6HfNgMwhNzXK2oiUs/TPmnac4LMpWJIUXDUMyjWHRMtsjrM37hGscDKHjVVWfFFFmfC0TGKMdlwNUqqNm6+clFwNv+ZEPdudWyE3kUVtLGaUQrEG2Wfb1mdwNbioegGiqkRxTCoEJ+SK+FnRx14/iWYBXl8/azZLPdsqsToL6vc+BaXMUj8j1UqxVUrxFhlNKTy9vceN6be5dn6KTm/SNdd5/OGbtDc+w9Vwj7h6geHiHj/wE/+NAHzx7/5N3Z4/5tpT3813/ZV/9+N697uuj1+Q3+c6vfs/6rfe/GXSpXL9xkuMvmez2dCosji+RX/vNymypn3lr3H15i9RBs+jW7d45L+TNxcHlHidsYxIMdh91vymlFi1DUMukBVpWwuRmQlrtWkYx4HQRPreDDiC9+ScqplQMpdCcSwWBvtfTZkmRPMfqAQZkhKikfeCyK7Ax6YmkuW6V3NUpr0ZfRSxdfjQG7mo6wKSM21skZwtVbBOMdEH1rGhn8aqoS9QbWNnKWPTNGbikkdQT/SOnI3t7bwVAGA3WQB28LmAyw518+HocFX6lwoEV30O1HLgrdyNNR/CDnVzXgtk2Sebgak25p8365593XX76rFQJNk6R1uUyeSBQJGEy0ayyzqLqrQGJwWQCTD2O9VzXMTvCpxzYYdcqJvh0ogrheLcjoHvnLFPUg3OyToZ4clFIo6iGcxYdp9nXwrqzcCIGlPs0V0srsy/SlWoiEOys8IwrzKMZr/bxc9/V+r3mqF8F02dUfJUXaFblLRbi8yHvxZbVemsoa8MbVf2TU8h7/oe25vvESF1/tsL+BPTd8GS7uamQeq0KWpNdpmhdTXCoJsdD6oyQnI17pG0m1YtG0J3vApxlgUxP85ZA69UImrJ1bPBnq97gsxoHvRP3GfFAsOSGkFu34BgK6ZZplgVE2YgNIvYCgW7fyzTALz4uuI3Hsq8TneI8VBQs9auTnhiP2hviKR2XjjnCC6S9dJWTgrqjCBqvJQJmKf7/Roh1TWfqDOuVEUvnDzhQihimQmChSGxE0CSZwVDtntLXKLbjBzrXdzFBzyd3mDZeC4258g4ElbPc/X4t+lTJC4OSP3EanHIZ3/sv/y4pv1TXB+/WH/A68Ov/sydi7N7r16df5V48AwhVUhSt6SUSM3LhPED0sUDVrdvc3bvXVZPv8K904ecnvwgZ82KK3fMZTy0nGvxSBtpc8JpovgWkUxWs1Sd9d/DNNF6z5SNuObFMeWJNjaMNWJ3vVgyZStSUzZUYEipMnTZ7dlyUtrOJn3nhGlKzJGizsGUE23bMvQZoqkTXA1z8WJe/nN8a9ZC6yq6UZS2iUzTUPfD1S60FiVRSwujspJnctQMu87QKOwJalqnplAyyXl8LvsdfyXCfXu4Sz1wc0aCGc94yyu2N7BkUzXsINf9rT+HISm+spENTy1QYeWx2gLvzXn+SYEnVhBt326bhIJK1SsXQb2gabJdriugEVe9CDSnWrRsGsTLbtp30uwamKIZsqNECCWDNFAGkJojIGIWyL66CWpEXNmR2+bXbwfvOyFVyNyBwb9QX5HCk1bIs+XsPlBLdmS4XDkJv9skaL6suFRGuL2ANuE+SfZS41aoEyTvp1gRC+GauRoqe4KZvb1WiEp1hrM4X0OEDG1hF7IzQ+IWG7uftOd7b/fz6/OkZCzOdn6/Z18F3fEeNM0wdiWg12ndlCZWhjNqseLe7QKmzLnPiMMlqe32pa4rZuKhup0Vs8y5JMq+oNbX2ZnDUU3smz0lqvpe95+v3XtTYfid0aCTecFWn2u9D6qxkjjLBTEljd1LjgyVe5Bn/o44zIjw29czrnJutIy1YbAAsCSRNl3SuoIfNqxzz8H4FbrL1ziYNpQidC/+ZTZf/4cMvqseEQMlnqDjFepakI5p+zY5O77/3/iZj2vaP8X18Yv1h7g++MY/uDNevPbq2f0vsjh8jovzU05e/hynb3+VRjPD9pxlt6bfFo6eucY4eJbHC9IHb1GKoqsVF5tThuVLjN117ucl2+Y622ZF7xYgKxKFNGayc0aAA5BIKaOR0pwnZ5Pp+CS0tryld4lY5VAlBySPaAmWUuZ6YnaUYEV9lJEgBtNKFkY/4cqS6B1p2NRCWsguEXMDOtC4aIU7eqiRxa3rdmEjUrb4sCLpRAdkKQSNNkmEjCSPuAk7mpw1GDpZkcqNTQe+Q2VjcPM04vwCegt6wUP0nuIGXFaCtAwy4KuTowj4rKiPZg2KI4uCRooOqGspXmjU1WnZoZIoBJQBpwFc2B+M2uOdMpWVGZHUpEOzSY2o9ng8SSaCWkhSTJEhBIKLpHRJ54zoKbmxgCA3QMoQF6Q04sM1NA+MOhJcRHRCy5yDLkyVI5LLQOMWTLJFiPgygF/jphH1kyEH0liD4EYCHRZdvETKRY103ev4d571mI11LhZopVIgZaKaRK2okDSYyY4MKMLkHE2ue38ZIWW07fAp2T5XAr0TuiwWYBQiczDNPHVP4xYfFmYMRMRMaBxeCjkZOuBHC33y3jgs6hNeO+Y8iKzefBEqzCxiSFJyg73WOuJLte3VWE2ToJRLsi4qoTMR/BJhROQKNFrDJhZL64sDlhQdCFo19iEwlbrK0kwjkcnZa2b/w4NL5NJRtKctEfyIlJbJjTRJGYOz7HqXcBJqloVDZALsfsnOJIShGOkW8UQCJZzjpgU+9EzVujxWEyYNgk4JgvFqphSs8ZjK7n0I9bMgmB9DYckYt7RqHhteG8ZQI5yzt/AuqQ6EydL3upKYYqZLDVu5T2CB5sagf60rvLIh1uLf5YG8echJvODy9Tf5xLMt4ew1SneDZnVA8gP64Vu48BRaHLkMIB3bizNWNz/J+cMvwfoTyOacknt8XNJvNjSLZ/jzf+0//biW/SGuj1+0fwbXxd2/d+dbb3zx1dXRIY8evgOu5drJ05ydfQvvlnQehrO3cN0t3HBKF9doEDZp5MbxCuccV6dvE5e36K8eoWOgWxZyaki50BzfYNw8JE8dU9nShhUXU2K1WpDyYEZCzjOlgXRxyfLmi1y8/02agxVl6nHtgnFzRSOR4IW0vaJpDslxQ9AVqZzj/Rr8ijJd0PmWSc20J7MliCO7SJCe3Fwjpg06ePzxDaarK5aHN7l4+FWuXf80/eY+cA3hCvxtpvRNFsvvYJMu8eV9cl6RS2BF5qp4sLMLfxQZzx4iocNfPqa7/X2Mj97CH99gePwazeFzyPQtcjlEfQPbc/LiKaQfcPEB09UC8Q9w3GTKj1gePk8/XLI8fJHLe79GXD3LmM5ossJ4icQ1hIZGMqebwuHJDdLp1ylyQji6Rbl4m9heww2XTL6hiQvGvCGEwDBlmuYa09m3COtnkeGSMbRIuaJxA0NY46XQAwdjz2aKRHfFMIKc3ICLd1F/gLhbML6G6ov45gJJE+QNLG4j0zlZFgTNxtlvhKlEuumCqTmg9JfItU8R+rcYLiPNKlCiw/WXeNdT2kO03yDNdXw8JA9vo6OtLpIbobRoGGmKJ4sntsfENLBdHhLOPkQPTigX71FWa7h8hBZPd/gS/fnbuIOnkc19trQ4v2YxvY22L7PNDwjlCJFTc9kcRvLhmjhcMAwTzeoa4epdUjiiOG9o0+YM8UeUNBJPPkF58DWkAd++SO5fozQv4coFU5/p/CVJnmMo91k2txg376HtEjaXuPaIGAp5O4FrQEZDU5zgXCGPW8RFvIykvMBLjzLi/Am9G2naFUM/cXhwwGZzjnONrVKG94jr50Ezw9k7+PULkD1TvqDVwPl4yfHhCSk9JqxeIizWxIu3SIunGR++Rru+wdXlWzTrTzCcv0mzuA5TRg6ex118DQ0tuKfBn5P0JaYYiR/+FsWt8IsFZXOf9uiIcdqgcUXbX1J8Jk0rcpnousiYR7qDm4xpYNF2lPER0l5DyGwvTmnXt8jDQ1p3g6QPkBTNOlfBNxNt+xTn93+N4+u32U4tZRHQKdAePMv23leR7lmmy7t0156n9yvCcMG4vaRdHlJyj7rr5PweC1kTbzzN9OgNI931l2xoaWVFlp5xmwg3bjA8uEc8eYr07mtweIhPDtdB0ZUldE5bci7k5JHY0i07th/e42roKc0Jhzc+zc2Xvvfz15/+oTt/kuf+R+H6uAH4/+E6u/crd+6/8YuvPnrzH3N8+wUmVyhbz/HTL7Et4OUchi0yKvH6Ma44rt76NaQ9Agrd8pjz07ss16+QJdBfvcXB+nl6r5TNQNGekrYcPfUCw9kDYrvm8uxbtKs12l+SS6FtW8akOOnAKSVZ/GYZM8qGuHiKcTqjW9+mXL5b2fQrio749sQmrJzRkug392m6E5DC6uQZ0uacq4v3aY+fh6Kk7FmERNIGpvssTl7E3OMOKI+/xphHYliStg9x7THh4Dr9B68jx7eR5hYiW4aHdzm4/iLJPYNe/DopnRBCTxo2lrDYHMLlPcL1TzJNmXF7CcvrOMls3vsqx899J5urxzSHz6FX76Mpw8kLkHv85UODZ3OiCQ0X4yWr1U3EH3L14a9zsDzg6mpisQzExU3GdEYMyvbiklV3RC49fvkM/dmHuGaDb15gurhHXB6RUiY0gauLK1brNUP/LZYn30MazmmiMty/iz96lvOzBxzc+A7SxTcJLrIZC4vlIWk4x1//TvIHv4xvbhmKUSZSmVhde4WrB7/O+tYP8PjDL7M++QTDxV1Kt8b3CX/4MunBV1jc+AzD5V28rAnr24zjKcErya2R9IiweIrp6j7ZB9i8hwsnNOsXmM6+RtKGrutoD1+gHy4R8aSzd1isnmZIg02nzTHTo/dwh9eh3+IWR/Rnb+Kbp2hXh/Qf/BZudYL3R5T2hO39LxGvf4rGt/SX7+OrO2TTdIyX92hOXmLabMjDOd3J0+T+ATkp45hZX3+F/vJ38FNPyiPN+hMUvcDLGjn/BqM7wvkVdBb8NAxbXNPihivc6hq5h3G6pI2QJuOdjOM5vr0Gq1v07/8a7eExhUMY3yZpoGsPGMeR9tqz9A/fNFfFuCR2J+R0xfrwKVQazj/4MmhLWB7Z/j5vkMVt3NQzbE/plsfEay9Qtq+h20jygzlvbjfE1W2YThmnLXHxDCW9RXv0WcZ0hpQj0vlv4jnCXXueNLyPlsiYlXZ5DRdas4L2LWzfJ5XMyad/ig/u/Tzx4nWCW9EefZJ26Xn0xhdYXXuFtDhmdXLA6WtfxDURKS2x86RxwospUEJJ9HpKE9f4o+9gU5S4fZ3h/D0Wh5+CxRF5+yH54hwzNutouo4hL/Brj3v8JkMP6hoWDbi4QtNDXHuAX91mePQ1cMdMw4aC0K5uk6fC6Xvf5OT2LdQ7Ymzpzx7iOyjTwAg0PhpC6Bd0B7dZH37H569/9ifv/Mme6h/N6+MG4I/x+uDr/8OdtL161ZV3GNIV+eIc3CHLm89z9f5dQrdk2GyBgF+t2Zw/YrG4DmzIWSFvCOtjaNaEPHJx+ZjrJ09xlZTSn8JkBJsyFprjmwxTom0cev4B0hwybe/TXf80+fIx49Vj1osVQ06obomLG4z9A2J7DGLkn6m/IKyuk4ZTNA1Eb/adPnT4bs00nOKKEhsozTXyNLFoO7b336Y5uGlEqSbSP75PPDjBayRXa2WJkXGzwYdIGS4gLMjtIQcnL/H49V9gub6JW93g8t7X6Y6O6fuRyEgZEr45IMVDptPXSAW69S0mERYnTzFdPUa354TFAtVMygMuBZpuwbg9Iyxvki8+sGk6Nri4ZnP1Hl27Ytqc0j7znej524hvcEVxzRFpOMXH66j2pOGMENaM2zP88gbBJ/rz9wir62zOz1ne+iTD2Ts044Z2cUDqjpiuNkjMhHidNF6Shsesbnyaq8u7NKsXGU/fZbG4yfTomzSHzzLohPMLuuURl+9+kRLWxPVzlT1+BhppupZUAqHx9P0prRQmWdM1C8SN6LilbB+bdfLRyzZhSyFdnTKR6I6uo5szC9iJS9RFckoEN5HGTMkD7dHzXLz/m8TDF2ldw+Xp6ywOX0Bdx/T4Lm5xQu43uKaxXXUlQ3oG+qsHxO4AiQ1aCtPlfWI8pLv2PJvT9/GLY5zrSZf36Y5f4OrRN2hWr1DyBikjkzZ03ZJcelPKLG6j6QqGx9AdkR58E22vsbz+AmcffJPV+gbb0/fBL4nrIzSN5PES5xaUrqMMD3HVW8OvXyadf4O4fg6P0J9/E9ElLDKEI1NPnF+iPGJx/bNcnb9Ot34Ohg1lHKBd47oFeehx4RoldrQOhtMPcMsDNGXa9U0Y7jFstuZu54S2W7G9uE/sDvGuI5Uz0uaK7uafZ3r0LtkLbv0MMm7pr97Gu45mfZu+f4N1fJbSLZgu3sYvj5lG5fqt57m4OKNMG+MSuEKaIkV6/DQxTo7uYME0CaFb4VLCNQt83lDCgunyAe3ymJI/xPmMH3pG3xGuf45ycZf0+E2Wt76Lh5szFq6lpHNc9xyxU7Q09Gdv0C2ep99+i1Ub2VxesFwsGC4+RNoDsighj4zbU7r1TcbNQ/p+Y/eFCFo25O2ArK+zWDxFc/T855/6cz/9kTTc+dN6fdwA/Cm6Lj749Tvl8l3Gck7jGs4+fOvV2CwpAtvzD1iv12zP71uRTSPr9ZrH997m8OQW2XvKuCXni2qSsyTGQ4bxiqZdkCVS+i3qI03TQTmlTEpoWqQfLHDFmw9BLr3J2YJn018BsD44AQ342KHpMcEtGPJEuzgiDWd4fwDqkOkM0UumZGSqRTxkO25xwROaE7wrbIdTlt11kMCw3VKGU0pYEsRBE8jDKQu/QptASQMlT8QYGRFEF0QmtlkJsVj+wlhYLNf0my3eN8Q2cPb4MbFzXDt6kYuLD9CczXthzIh3BG+St2oJw5hg1S3RYHa2rrQgIzlNhK5F9IAhv0cTb1CSomVDCI7Ly3Pa5QLJATQxjecsrz1H35+ThpGjoyO2ddftUmZsoh2KY08TjthcfchB1zIyEUMgTZng10hsGYYNOp4R4sFOkeB8w+byA9rFmpKjZTdgkbbBL/CuYcyPiG5hKoVwjORtfZ49LvUUPCE0eLdgyr0hTpffYrl6hqlMpl0fzkjFERcdZVIzGUoD/RRolivG/gHer8jjQBsDxStUWaOwxvnMlAOqyexjU0/wAELRLdFFSmgpY0Jp0NKTxzNciKQ00i6eNs24bmkXCwuOWh8xbrY0yxX9+X18c4BOxZqw4RwvjoCSckQaxzj2eAlMY8HFxki7rvr/cwmpQ91E2ZwxOY9XJRPBN6aiGB4z5EIXVrhmQUqZdtHi4xLUERtPf/GQ4BKL7oiswrCx5zltT5m4ZLF+haurc7oQISoue8QXXOgoDrxr6IcNAMF3jP0ZiqPpWkKIZDlCy4Y2JyZ1OFcg92guhNghXWDMFjusw4Yyqzgk08SVvZbtgqF/xMKfIGGiv3pMqGmHhYL4Blwk5Q1NOEJcYpwyvjkg0wKjuWsGReSA4eo+68WaPmVWi5ucX76F6IrYrUF7xnHLwdFzjBo+3ywPcaHh+Nkfu/Mncqh+fP2e1/8LxTJFc5nmHNEAAAAASUVORK5CYII=
-"""
@@ -0,0 +1,368 @@
+from PyQt5 import sip
+from PyQt5.QtCore import QObject
+from array import array
+from bisect import bisect_left
+import time
+from func.session_store import SessionStore
+from func.frame_clock import FrameClock
+from .polyline import value_to_y_table
+from .sliding_window import SlidingWindowExtrema
+
+
+class DynamicChartModel(QObject):
+    """
+    动态折线图的数据模型：滚动状态、Y轴范围和各点的Y坐标只计算一次，由任意数量的视图（DynamicLineChart）共享
+    X轴由样本的接收时间决定：每个点对应一个REFRESH_INTERVAL长的时间片，刷新时补齐所有已结束的时间片，
+    同一时间片内的多个样本合并为一个点（取平均值），没有样本的时间片沿用上一个值，
+    数据中断（会话存储中记录的中断）期间的时间片标记为空点，折线在此断开，
+    因此无论采样率多高或界面卡顿多久，最右侧的点始终对应当前时刻
+    
+    模型保存最宽视图所需的点数，Y轴范围按这些点计算；各点的Y坐标按视图高度分别缓存，
+    相同高度的视图共用同一份坐标，视图绘制时只需取最新的若干个点
+    所有视图都暂停时模型也停止刷新，恢复时一次性补齐
+    """
+    
+    def __init__(self, store=None, parent=None):
+        super().__init__(parent)
+        
+        # 会话数据存储（未指定时使用独立的存储）
+        self.store = store if store is not None else SessionStore(self)
+        # 下一个待显示样本在存储中的索引（从创建时刻开始显示）
+        self.read_index = len(self.store)
+        
+        # 常量定义
+        self.REFRESH_INTERVAL = 0.5  # 刷新间隔（秒）
+        self.COLUMN_NS = int(self.REFRESH_INTERVAL * 1_000_000_000)  # 每个点对应的时间片长度（纳秒）
+        self.GRID_SPACE = 10  # 网格间隔
+        self.MOVE_STEP = 1    # 移动步长（能够被间隔整除）
+        self.MAX_Y = 200      # Y轴最大值（心率最大刻度）
+        self.MIN_Y = 0        # Y轴最小值
+        
+        # 变量初始化
+        # 各点的原始值环形缓冲区（容量为最宽视图的宽/步长+1），head指向最旧的点
+        # 每次滚动只覆盖最旧的一个值
+        self.point_values = array("H")
+        self.head = 0
+        # 与point_values一一对应的空点标记（1表示数据中断期间的时间片），及其中空点的个数
+        self.point_gaps = bytearray()
+        self.gap_count = 0
+        # 各视图高度下各点的Y坐标（高度 -> 与point_values一一对应的环形缓冲区），
+        # 只有取整后的MAX_Y变化时才整体重新计算
+        self.point_y = {}
+        self.y_scale = None     # 计算point_y时使用的MAX_Y
+        self.visible_extrema = SlidingWindowExtrema(0)  # 所有点的滑动窗口最大/最小值
+        self.window_sum = 0     # 所有点之和
+        self.x_offset = 0       # 网格偏移量
+        self.current_value = 0  # 当前数值
+        # 最右侧的点对应的时间片序号（monotonic纳秒 // COLUMN_NS），从创建时刻开始
+        self.last_column = time.monotonic_ns() // self.COLUMN_NS - 1
+        
+        # 自动调节Y轴范围的变量
+        self.auto_adjust_enabled = True        # 是否启用自动调节
+        self.min_range = 30                     # 最小范围，确保变化明显
+        self.padding_ratio = 0.10               # 上余量比例
+        
+        # 移除平滑过渡，直接更新
+        self.target_max_y = 200                 # 目标MAX_Y
+        
+        # 共享此模型的视图，以及其中未暂停的视图
+        self.views = []
+        self.active_views = []
+        
+        # 有未暂停的视图时订阅共享帧时钟，500ms 刷新一次，约 2fps
+        self.frame_clock = FrameClock.shared()
+    
+    def attach(self, view):
+        """添加视图，并按视图尺寸调整模型容量"""
+        self.views.append(view)
+        view.destroyed.connect(lambda _=None, view=view: self.detach(view))
+        self.update_geometry()
+        if not view.suspended:
+            self.view_resumed(view)
+    
+    def detach(self, view):
+        """移除视图（视图销毁时自动调用）"""
+        if view in self.views:
+            self.views.remove(view)
+        self.view_suspended(view)
+    
+    def view_suspended(self, view):
+        """视图暂停刷新；所有视图都暂停时模型停止刷新"""
+        if view in self.active_views:
+            self.active_views.remove(view)
+        if not self.active_views:
+            self.frame_clock.unsubscribe(self.refresh)
+    
+    def view_resumed(self, view):
+        """视图恢复刷新；模型从空闲恢复时一次性补齐暂停期间错过的时间片"""
+        if view in self.active_views:
+            return
+        self.active_views.append(view)
+        if len(self.active_views) == 1:
+            self.refresh()
+            self.frame_clock.subscribe(self.refresh, self.REFRESH_INTERVAL)
+        else:
+            self.frame_clock.mark_dirty(view)
+    
+    def update_geometry(self):
+        """视图尺寸改变时调用：容量按最宽的视图扩大（已有的点保留），并为新的高度计算Y坐标"""
+        views = [view for view in self.views if not sip.isdeleted(view)]
+        point_count = max((view.width() // self.MOVE_STEP + 1 for view in views), default=0)
+        if point_count > len(self.point_values):
+            self._init_data(point_count)
+        
+        # 只保留仍在使用的高度
+        heights = {view.height() for view in views}
+        self.point_y = {height: self.point_y[height] for height in heights if height in self.point_y}
+        for height in heights:
+            if height not in self.point_y:
+                self._recalculate_point_y(height)
+    
+    def _init_data(self, point_count):
+        """扩大环形缓冲区，新增的点作为最旧的点，初始值为0（X轴基线位置）"""
+        values = array("H", bytes((point_count - len(self.point_values)) * self.point_values.itemsize))
+        values += self.ordered_values()
+        self.point_gaps = bytearray(point_count - len(self.point_values)) + self.ordered_gaps()
+        self.point_values = values
+        self.head = 0
+        
+        # 所有点的滑动窗口统计
+        self.visible_extrema = SlidingWindowExtrema(point_count)
+        for value in self.point_values:
+            self.visible_extrema.push(value)
+        self.window_sum = sum(self.point_values)
+        
+        # 重新计算所有高度下的Y坐标
+        for height in self.point_y:
+            self._recalculate_point_y(height)
+    
+    def ordered_values(self, count=None):
+        """按从旧到新的顺序返回最新的count个点的原始值（环形缓冲区的两段拼接），默认返回所有点"""
+        values = self.point_values[self.head:] + self.point_values[:self.head]
+        return values if count is None else values[len(values) - count:]
+    
+    def ordered_gaps(self, count=None):
+        """按从旧到新的顺序返回最新的count个点的空点标记"""
+        gaps = self.point_gaps[self.head:] + self.point_gaps[:self.head]
+        return gaps if count is None else gaps[len(gaps) - count:]
+    
+    def segments(self, count):
+        """最新的count个点中连续有数据的区段[(起点, 终点), ...]，没有空点时返回None（整条折线一次绘制）"""
+        if not self.gap_count:
+            return None
+        gaps = self.ordered_gaps(count)
+        segments = []
+        start = gaps.find(0)
+        while start >= 0:
+            stop = gaps.find(1, start)
+            if stop < 0:
+                stop = len(gaps)
+            segments.append((start, stop))
+            start = gaps.find(0, stop)
+        return segments
+    
+    def ordered_y(self, height, count=None):
+        """按从旧到新的顺序返回最新的count个点在指定视图高度下的Y坐标"""
+        if height not in self.point_y:
+            self._recalculate_point_y(height)
+        point_y = self.point_y[height]
+        values = point_y[self.head:] + point_y[:self.head]
+        return values if count is None else values[len(values) - count:]
+    
+    @property
+    def average_heart_rate(self):
+        """当前平均心率（由会话存储维护）"""
+        return self.store.average_heart_rate
+    
+    def _update_y_range(self):
+        """根据所有数据点更新Y轴范围，确保所有点都不冲顶"""
+        if not self.auto_adjust_enabled:
+            self.target_max_y = 200
+            self.MAX_Y = self.target_max_y
+            return
+        
+        # 数据点：模型中的所有点（滑动窗口增量维护）+ 正在进行的时间片内已收到的值
+        point_count = len(self.point_values)
+        max_val = self.visible_extrema.max
+        if self.read_index < len(self.store):
+            with self.store.bpm_view(self.read_index) as pending:
+                max_val = max(max_val, max(pending))
+        
+        # 如果数据点不足，使用默认范围
+        if point_count < 5:
+            self.target_max_y = 200
+            self.MAX_Y = self.target_max_y
+            return
+        
+        # 平均值优先使用会话存储维护的平均心率
+        if self.average_heart_rate > 0:
+            avg_val = self.average_heart_rate
+        else:
+            avg_val = self.window_sum / point_count
+        
+        # 黄金比例（0.618）：平均线应该在总高度的0.618位置
+        golden_ratio = 0.618
+        golden_based_max = avg_val / golden_ratio
+        
+        # 确保目标最大值至少比实际最大值大5%，避免点冲顶
+        # 增加安全余量到10%，确保所有点都不会冲顶
+        safe_padding = max_val * 0.10  # 10%的安全余量
+        safe_max = max_val + safe_padding
+        
+        # 取两者的最大值
+        self.target_max_y = max(golden_based_max, safe_max)
+        
+        # 边界检查：确保范围在合理范围内
+        self._check_range_bounds()
+        
+        # 四舍五入到最近的10（如144->150）
+        self.target_max_y = round(self.target_max_y / 10) * 10
+        
+        # 最终边界检查
+        self._check_range_bounds()
+        
+        # 直接更新MAX_Y，不使用平滑过渡
+        self.MAX_Y = self.target_max_y
+    
+    def _update_point_y(self, index):
+        """更新第index个点在各高度下的Y坐标；取整后的MAX_Y变化时重新计算所有点"""
+        if self.MAX_Y == self.y_scale:
+            value = self.point_values[index]
+            for height, point_y in self.point_y.items():
+                point_y[index] = self.normalize_value_to_y(value, height)
+            return
+        
+        # 比例变化：通过查找表一次性重新计算所有点的Y坐标
+        for height in self.point_y:
+            self._recalculate_point_y(height)
+        self.y_scale = self.MAX_Y
+    
+    def _recalculate_point_y(self, height):
+        """通过查找表计算所有点在指定高度下的Y坐标"""
+        y_table = value_to_y_table(lambda value: self.normalize_value_to_y(value, height), self.visible_extrema.max)
+        self.point_y[height] = array("i", map(y_table.__getitem__, self.point_values))
+    
+    def _check_range_bounds(self):
+        """边界检查机制，防止极端缩放比例"""
+        # 确保MIN_Y固定为0
+        self.MIN_Y = 0
+        
+        # 确保MAX_Y至少为min_range
+        if self.MAX_Y < self.min_range:
+            self.MAX_Y = self.min_range
+        
+        if self.target_max_y < self.min_range:
+            self.target_max_y = self.min_range
+        
+        # 确保MAX_Y不超过生理极限（心率一般不超过250）
+        max_limit = 250
+        if self.MAX_Y > max_limit:
+            self.MAX_Y = max_limit
+        
+        if self.target_max_y > max_limit:
+            self.target_max_y = max_limit
+    
+    def normalize_value_to_y(self, value, height):
+        """将数值归一化并转换为指定高度下的Y坐标（等比例缩放，MIN_Y固定为0）"""
+        range_y = self.MAX_Y - self.MIN_Y
+        
+        # 边界检查：防止除零错误
+        if range_y <= 0:
+            range_y = self.min_range
+        
+        # 归一化到0-1范围
+        normalized_value = (value - self.MIN_Y) / range_y
+        
+        # 限制在0-1范围内（防止超出边界）
+        normalized_value = max(0.0, min(1.0, normalized_value))
+        
+        # 转换为Y坐标（垂直方向等比例）
+        y_pos = height - int(normalized_value * height)
+        
+        # 边界检查：确保Y坐标在可视区域内
+        y_pos = max(0, min(height, y_pos))
+        
+        return y_pos
+    
+    def refresh(self, now_ns=None):
+        """
+        按当前时间刷新模型：补齐自上次刷新以来所有已结束的时间片，并通知未暂停的视图重绘
+        now_ns为monotonic纳秒时间，默认取当前时间
+        """
+        if len(self.point_values) == 0:
+            return
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        
+        # 最新的已结束时间片
+        column = now_ns // self.COLUMN_NS - 1
+        steps = column - self.last_column
+        if steps <= 0:
+            return
+        index = self._advance(column)
+        
+        # 重新计算Y轴范围，确保所有点都不冲顶
+        # 当最大值点离开视线时，Y轴范围会相应缩小
+        self._update_y_range()
+        
+        # 更新新点的Y坐标（Y轴范围变化或一次滚动多步时更新所有点）
+        if steps > 1:
+            self.y_scale = None
+        self._update_point_y(index)
+        
+        # 标记重绘，由帧时钟在本帧结束时统一刷新
+        for view in self.active_views:
+            self.frame_clock.mark_dirty(view)
+    
+    def _advance(self, column):
+        """
+        滚动到第column个时间片，返回最新点在环形缓冲区中的位置
+        超出容量的时间片会直接滚出视线，只需跳过其中的样本（按接收时间二分查找），
+        因此每次刷新的工作量与积压的样本数无关
+        """
+        capacity = len(self.point_values)
+        timestamps = self.store.timestamps
+        first = max(self.last_column + 1, column - capacity + 1)
+        
+        # 跳过滚出视线的时间片及其中的样本，只推进读取位置和网格偏移量
+        skipped = first - self.last_column - 1
+        skip_to = bisect_left(timestamps, first * self.COLUMN_NS, self.read_index)
+        if skip_to > self.read_index:
+            self.read_index = skip_to
+            self.current_value = self.store.bpm[skip_to - 1]
+        self.x_offset = (self.x_offset + skipped) % (self.GRID_SPACE // self.MOVE_STEP)
+        
+        index = self.head
+        for current in range(first, column + 1):
+            # 合并同一时间片内的所有样本
+            stop = bisect_left(timestamps, (current + 1) * self.COLUMN_NS, self.read_index)
+            if stop > self.read_index:
+                with self.store.bpm_view(self.read_index, stop) as values:
+                    self.current_value = round(sum(values) / len(values))
+                self.read_index = stop
+                gap = False
+            else:
+                # 没有样本的时间片：下一个样本之前有数据中断时为空点，否则沿用上一个值
+                gap = self.store.is_gap_start(self.read_index)
+            index = self._scroll(gap)
+        
+        self.last_column = column
+        return index
+    
+    def _scroll(self, gap=False):
+        """以当前数值（空点为0，不影响Y轴范围）滚动一步，返回新点在环形缓冲区中的位置"""
+        # 偏移量计算
+        self.x_offset += 1
+        if self.x_offset == self.GRID_SPACE // self.MOVE_STEP:
+            self.x_offset = 0
+        
+        # 所有点向前移动一位：覆盖环形缓冲区中最旧的值并移动head（O(1)）
+        index = self.head
+        value = 0 if gap else self.current_value
+        self.window_sum += value - self.point_values[index]
+        self.point_values[index] = value
+        self.gap_count += gap - self.point_gaps[index]
+        self.point_gaps[index] = gap
+        self.visible_extrema.push(value)
+        self.head = (index + 1) % len(self.point_values)
+        return index
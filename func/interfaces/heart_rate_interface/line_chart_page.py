@@ -7,8 +7,10 @@ from .dynamic_line_chart import DynamicLineChart
 class LineChartPage(QWidget):
     """折线图页面"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store=None, chart_model=None):
         super().__init__(parent)
+        self.store = store
+        self.chart_model = chart_model  # 动态折线图的数据模型（为None时图表使用独立的模型）
         self.setup_ui()
     
     def setup_ui(self):
@@ -68,7 +70,7 @@ class LineChartPage(QWidget):
         self.chart_layout.addLayout(self.second_row_layout)
         
         # 创建动态折线图
-        self.chart = DynamicLineChart()
+        self.chart = DynamicLineChart(store=self.store, model=self.chart_model)
         self.chart.setFixedHeight(160)  # 与其他卡片显示区域高度一致
         self.chart_layout.addWidget(self.chart)
         
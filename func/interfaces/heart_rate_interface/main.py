@@ -6,22 +6,34 @@ from .line_chart_page import LineChartPage
 from .big_number_page import BigNumberPage
 from .dashboard_page import DashboardPage
 from .trend_chart_page import TrendChartPage
+from .dynamic_chart_model import DynamicChartModel
+from func.session_store import SessionStore
+from func.render_scheduler import RenderScheduler
+from func.frame_clock import FrameClock
+from func.label_text import set_label_text
 
 
 class HeartRateInterface(QWidget):
     """心率界面 - 集成动态折线图"""
     
-    def __init__(self, parent=None, settings_manager=None):
+    def __init__(self, parent=None, settings_manager=None, session_store=None, render_scheduler=None, chart_model=None):
         super().__init__(parent)
         self.setObjectName("heart_rate_interface")
         self.parent = parent
         self.settings_manager = settings_manager
-        self.setup_ui()
+        # 会话数据存储（所有页面共享，最高/最低/平均心率由存储维护）
+        self.session_store = session_store if session_store is not None else SessionStore(self)
+        # 渲染调度器（图表不可见或无数据源连接时暂停刷新）
+        self.render_scheduler = render_scheduler if render_scheduler is not None else RenderScheduler(self)
+        # 动态折线图的数据模型（可与独立心率窗口等其他视图共享）
+        self.chart_model = chart_model if chart_model is not None else DynamicChartModel(self.session_store, self)
         self.current_device_name = None  # 存储当前连接的设备名称
+        self.device_label_text = "请先连接设备"  # 设备名称标签的文本（页面创建时恢复）
         # 心率统计变量
         self.current_heart_rate = 0
-        self.highest_heart_rate = 0
-        self.lowest_heart_rate = float('inf')
+        # 标签在共享帧时钟的帧边界上更新，同一帧内的多个样本只更新一次
+        self.frame_clock = FrameClock.shared()
+        self.setup_ui()
     
     def setup_ui(self):
         # 主布局
@@ -41,82 +53,107 @@ class HeartRateInterface(QWidget):
         # 将分段控制器添加到主布局
         self.main_layout.addWidget(self.segmented_widget)
         
-        # 创建四个子页面
-        self.line_chart_page = LineChartPage(self)
-        self.big_number_page = BigNumberPage(self, self.settings_manager)
-        self.dashboard_page = DashboardPage(self)
-        self.trend_chart_page = TrendChartPage(self)
-        
-        # 连接大数字页面的字体选择按钮信号
-        self.big_number_page.font_select_button.clicked.connect(self.select_font)
-        
-        # 将四个页面添加到主布局
-        self.main_layout.addWidget(self.line_chart_page)
-        self.main_layout.addWidget(self.big_number_page)
-        self.main_layout.addWidget(self.dashboard_page)
-        self.main_layout.addWidget(self.trend_chart_page)
-        
-        # 初始化只显示第一个页面
-        self.big_number_page.hide()
-        self.dashboard_page.hide()
-        self.trend_chart_page.hide()
+        # 子页面在首次显示时才创建，启动时只创建默认显示的折线图页面
+        self.pages = {}  # 页面名称 -> 已创建的页面
+        self.line_chart_page = None
+        self.big_number_page = None
+        self.dashboard_page = None
+        self.trend_chart_page = None
+        self.current_page = None
+        self._show_page("line_chart")
+    
+    def _create_page(self, name):
+        """创建子页面"""
+        if name == "line_chart":
+            page = self.line_chart_page = LineChartPage(self, self.session_store, self.chart_model)
+        elif name == "big_number":
+            page = self.big_number_page = BigNumberPage(self, self.settings_manager)
+            # 连接大数字页面的字体选择按钮信号
+            page.font_select_button.clicked.connect(self.select_font)
+        elif name == "dashboard":
+            page = self.dashboard_page = DashboardPage(self)
+        else:
+            page = self.trend_chart_page = TrendChartPage(self, self.session_store)
+        self.pages[name] = page
+        self.main_layout.addWidget(page)
+        
+        # 图表只在所在页面可见时刷新
+        if name == "line_chart":
+            self.render_scheduler.register(page.chart)
+        elif name == "trend_chart":
+            self.render_scheduler.register(page.trend_chart)
+        
+        # 恢复设备名称
+        if name in ("line_chart", "trend_chart"):
+            page.right_label.setText(self.device_label_text)
+        return page
+    
+    def _show_page(self, name):
+        """显示指定页面（首次显示时创建），隐藏其他已创建的页面"""
+        for page_name, page in self.pages.items():
+            if page_name != name:
+                page.hide()
+        page = self.pages.get(name) or self._create_page(name)
+        page.show()
+        self.current_page = name
+        self._refresh_page(name)
+    
+    def _refresh_page(self, name):
+        """用会话存储中的最新数据恢复页面显示（页面隐藏期间不更新）"""
+        if len(self.session_store):
+            self._update_page(name, self.session_store.bpm[-1])
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 界面隐藏期间（切换到其他界面、隐藏到托盘）不更新页面，重新显示时恢复
+        self._refresh_page(self.current_page)
     
     def on_segmented_changed(self, current_item):
         """分段控制器切换事件"""
-        # 隐藏所有页面
-        self.line_chart_page.hide()
-        self.big_number_page.hide()
-        self.dashboard_page.hide()
-        self.trend_chart_page.hide()
-        
-        # 显示当前选中的页面
-        if current_item == "line_chart":
-            self.line_chart_page.show()
-        elif current_item == "big_number":
-            self.big_number_page.show()
-        elif current_item == "dashboard":
-            self.dashboard_page.show()
-        elif current_item == "trend_chart":
-            self.trend_chart_page.show()
+        self._show_page(current_item)
     
-    def update_heart_rate(self, heart_rate):
+    def update_heart_rate(self, sample):
         """更新心率数值"""
-        # 添加到折线图，包括0值
-        self.line_chart_page.chart.add_value(heart_rate)
-        # 更新HR显示（HR后面空两格显示数字）
-        self.line_chart_page.left_label.setText(f"HR  {heart_rate}")
-        # 更新右上角显示MAX_Y值
-        self.line_chart_page.top_right_label.setText(f"{int(self.line_chart_page.chart.MAX_Y)}")
-        # 右下角始终显示0
-        self.line_chart_page.bottom_right_label.setText("0")
-        
+        # 样本已由主窗口写入会话存储，折线图在刷新时读取
         # 更新心率统计
-        self.current_heart_rate = heart_rate
-        
-        # 更新最高心率
-        if heart_rate > self.highest_heart_rate:
-            self.highest_heart_rate = heart_rate
-        
-        # 更新最低心率
-        if heart_rate < self.lowest_heart_rate and heart_rate > 0:
-            self.lowest_heart_rate = heart_rate
-        
-        # 更新大数字卡片显示
-        self.big_number_page.current_hr_label.setText(str(heart_rate))
-        
-        # 更新平均心率显示
-        avg_hr = self.line_chart_page.chart.average_heart_rate
-        self.big_number_page.average_hr_label.setText(f"平均: {round(avg_hr) if avg_hr > 0 else 0} BPM")
+        self.current_heart_rate = sample.bpm
         
-        # 更新最高/最低心率显示
-        self.big_number_page.minmax_hr_label.setText(f"最高: {self.highest_heart_rate} BPM | 最低: {self.lowest_heart_rate if self.lowest_heart_rate != float('inf') else 0} BPM")
-        
-        # 更新仪表盘卡片显示
-        self.dashboard_page.dashboard_gauge.set_value(heart_rate)
-        self.dashboard_page.dashboard_gauge.set_average_value(round(avg_hr) if avg_hr > 0 else 0)
-        
-        # 更新趋势折线图显示
-        self.trend_chart_page.update_heart_rate(heart_rate)
+        # 界面隐藏期间不更新，重新显示时从会话存储恢复；否则在下一帧统一更新
+        if self.isVisible():
+            self.frame_clock.subscribe(self._update_visible_pages)
+    
+    def _update_visible_pages(self):
+        """帧回调：用最新心率更新可见的页面（每帧最多一次），然后取消订阅"""
+        self.frame_clock.unsubscribe(self._update_visible_pages)
+        for name, page in self.pages.items():
+            if page.isVisible():
+                self._update_page(name, self.current_heart_rate)
+    
+    def _update_page(self, name, heart_rate):
+        """用最新心率和会话统计更新一个页面"""
+        avg_hr = self.session_store.average_heart_rate
+        if name == "line_chart":
+            # 更新HR显示（HR后面空两格显示数字）
+            set_label_text(self.line_chart_page.left_label, f"HR  {heart_rate}")
+            # 更新右上角显示MAX_Y值
+            set_label_text(self.line_chart_page.top_right_label, f"{int(self.line_chart_page.chart.MAX_Y)}")
+            # 右下角始终显示0
+            set_label_text(self.line_chart_page.bottom_right_label, "0")
+        elif name == "big_number":
+            # 更新大数字卡片显示
+            set_label_text(self.big_number_page.current_hr_label, str(heart_rate))
+            # 更新平均心率显示
+            set_label_text(self.big_number_page.average_hr_label, f"平均: {round(avg_hr) if avg_hr > 0 else 0} BPM")
+            # 更新最高/最低心率显示
+            set_label_text(self.big_number_page.minmax_hr_label,
+                           f"最高: {self.session_store.max_bpm} BPM | 最低: {self.session_store.min_bpm} BPM")
+        elif name == "dashboard":
+            # 更新仪表盘卡片显示
+            self.dashboard_page.dashboard_gauge.set_value(heart_rate)
+            self.dashboard_page.dashboard_gauge.set_average_value(round(avg_hr) if avg_hr > 0 else 0)
+        elif name == "trend_chart":
+            # 更新趋势折线图显示
+            self.trend_chart_page.update_range_label()
     
     def select_font(self):
         """打开字体选择对话框"""
@@ -174,15 +211,18 @@ class HeartRateInterface(QWidget):
                 device_name = self.parent.core.selected_device.name
                 if device_name:
                     self.current_device_name = device_name
-                    self.line_chart_page.right_label.setText(device_name)
-                    self.trend_chart_page.right_label.setText(device_name)
+                    self._set_device_label(device_name)
                 else:
-                    self.line_chart_page.right_label.setText("未知设备")
-                    self.trend_chart_page.right_label.setText("未知设备")
+                    self._set_device_label("未知设备")
             else:
-                self.line_chart_page.right_label.setText("未知设备")
-                self.trend_chart_page.right_label.setText("未知设备")
+                self._set_device_label("未知设备")
         elif "已断开连接" in status or "请先连接设备" in status:
             self.current_device_name = None
-            self.line_chart_page.right_label.setText("请先连接设备")
-            self.trend_chart_page.right_label.setText("请先连接设备")
\ No newline at end of file
+            self._set_device_label("请先连接设备")
+    
+    def _set_device_label(self, text):
+        """更新已创建的折线图和趋势图页面右上角的设备名称"""
+        self.device_label_text = text
+        for name in ("line_chart", "trend_chart"):
+            if name in self.pages:
+                self.pages[name].right_label.setText(text)
\ No newline at end of file
@@ -0,0 +1,115 @@
+from array import array
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPolygon, QPen, QColor, QBrush
+
+
+def value_to_y_table(normalize, max_value):
+    """生成心率值到Y坐标的查找表（0..max_value），每帧每个不同的心率值只归一化一次"""
+    return array("i", map(normalize, range(max_value + 1)))
+
+
+def interleave_coordinates(x_coordinates, y_coordinates):
+    """将X坐标和Y坐标交错写入连续的坐标缓冲区 [x0, y0, x1, y1, ...]"""
+    coordinates = array("i", bytes(2 * len(x_coordinates) * array("i").itemsize))
+    coordinates[0::2] = x_coordinates
+    coordinates[1::2] = y_coordinates
+    return coordinates
+
+
+def build_coordinates(x_coordinates, values, y_table):
+    """将X坐标和按查找表换算的Y坐标交错写入连续的坐标缓冲区"""
+    return interleave_coordinates(x_coordinates, array("i", map(y_table.__getitem__, values)))
+
+
+def polygon_from_coordinates(coordinates, extra_points=0):
+    """将坐标缓冲区整块拷贝到QPolygon中，可在末尾预留额外的点（用于闭合填充区域）"""
+    polygon = QPolygon(len(coordinates) // 2 + extra_points)
+    pointer = polygon.data()
+    pointer.setsize(len(coordinates) * coordinates.itemsize)
+    memoryview(pointer).cast("B").cast("i")[:] = coordinates
+    return polygon
+
+
+def draw_filled_polyline(painter, coordinates, width, height, segments=None):
+    """
+    绘制折线和下方的填充区域（由连续的坐标缓冲区一次性绘制），折线图和趋势图共用同一配色
+    segments为连续有数据的点区段[(起点, 终点), ...]，折线和填充区域在数据中断处断开；为None时整条绘制
+    """
+    if segments is None:
+        _draw_segment(painter, coordinates, 0, width, height)
+        return
+    for start, stop in segments:
+        if stop - start >= 2:
+            segment = coordinates[2 * start:2 * stop]
+            _draw_segment(painter, segment, segment[0], segment[-2], height)
+
+
+def _draw_segment(painter, coordinates, left, right, height):
+    """绘制一段折线及其下方从left到right的填充区域"""
+    count = len(coordinates) // 2
+    if count < 2:
+        return
+    
+    # 填充区域：折线各点 + 右下角和左下角
+    fill_polygon = polygon_from_coordinates(coordinates, extra_points=2)
+    fill_polygon.setPoint(count, right, height)
+    fill_polygon.setPoint(count + 1, left, height)
+    
+    # 设置填充颜色（半透明红色）
+    fill_brush = QBrush(QColor(255, 143, 143, 50))  # 50表示透明度
+    painter.setBrush(fill_brush)
+    painter.setPen(Qt.NoPen)  # 不绘制边框
+    painter.drawPolygon(fill_polygon)
+    
+    # 设置折线颜色（深红色）
+    pen = QPen(QColor(220, 9, 9))
+    pen.setWidth(1)
+    painter.setPen(pen)
+    
+    # 一次调用绘制整条折线
+    painter.drawPolyline(polygon_from_coordinates(coordinates))
+
+
+def draw_average_line(painter, average_heart_rate, average_y, width):
+    """绘制平均心率线，1px深蓝色横线，并在右端显示数值"""
+    if average_heart_rate == 0:
+        return
+    
+    # 深蓝色
+    deep_blue = QColor(0, 60, 135)
+    
+    # 设置深蓝色1px线
+    average_pen = QPen(deep_blue)
+    average_pen.setWidth(1)
+    painter.setPen(average_pen)
+    
+    # 绘制横线
+    painter.drawLine(0, average_y, width, average_y)
+    
+    # 绘制平均心率数值（线的上方，右对齐）
+    painter.setPen(deep_blue)
+    font = painter.font()
+    font.setPointSize(10)
+    painter.setFont(font)
+    
+    # 格式化平均心率数值（添加前缀"平均 "，四舍五入为整数）
+    avg_text = f"平均 {round(average_heart_rate)}"
+    
+    # 获取文本宽度
+    text_rect = painter.boundingRect(0, 0, 100, 20, Qt.AlignRight, avg_text)
+    text_width = text_rect.width()
+    
+    # 计算文本位置：线的上方，右边缘与线的右边缘平齐
+    text_x = width - text_width - 5  # 右对齐，距离边缘5px
+    text_y = average_y - 5  # 线的上方，距离线5px
+    
+    painter.drawText(text_x, text_y, avg_text)
+
+
+def draw_border(painter, width, height):
+    """绘制1px黑色边框"""
+    border_pen = QPen(QColor(0, 0, 0))
+    border_pen.setWidth(1)
+    painter.setPen(border_pen)
+    painter.setBrush(Qt.NoBrush)
+    painter.drawRect(0, 0, width - 1, height - 1)
@@ -1,7 +1,22 @@
-from PyQt5.QtCore import Qt, QPoint, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt5.QtGui import QPainter, QPen, QColor, QFont, QBrush, QPolygon, QLinearGradient, QPainterPath
+from PyQt5.QtCore import Qt, QPointF, QRect, QEasingCurve
+from PyQt5.QtGui import (QPainter, QPen, QColor, QFont, QBrush, QPolygonF, QLinearGradient, QPainterPath,
+                         QImage, QTransform)
 from PyQt5.QtWidgets import QWidget
+from collections import namedtuple
 import math
+import time
+from func.frame_clock import FrameClock
+from func.raster_renderer import paint_view
+
+
+# 绘制一帧所需的全部数据（不可变，可交给后台渲染线程）；画笔、字体等Qt值类型为隐式共享，只读使用
+RadialGaugeSnapshot = namedtuple("RadialGaugeSnapshot", [
+    "width", "height", "ratio",
+    "static_layer",                       # 背景圆环和单位图层
+    "arc_rect", "progress_pen", "angle",  # 进度圆环
+    "value_font", "value_text",           # 当前值
+    "arrow", "arrow_pen", "arrow_brush",  # 平均心率箭头（不绘制时为None）
+])
 
 
 class RadialGauge(QWidget):
@@ -17,10 +32,25 @@ class RadialGauge(QWidget):
         # 放大图形：从240x240放大到280x280
         self.setFixedSize(280, 280)
         
-        # 创建动画
-        self.animation = QPropertyAnimation(self, b"animated_value")
-        self.animation.setDuration(500)  # 动画持续时间
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)  # 缓动曲线
+        # 动画由共享帧时钟驱动，动画期间每帧更新一次
+        self.frame_clock = FrameClock.shared()
+        self.animation_duration = 0.5  # 动画持续时间（秒）
+        self.easing_curve = QEasingCurve(QEasingCurve.OutCubic)  # 缓动曲线
+        self._animation_start_time = 0.0
+        self._animation_start_value = 0
+        
+        # 缓存的绘制资源：字体和箭头画笔只创建一次
+        # 等比例缩小字体：数值从40缩小到30，单位从18缩小到14
+        self.value_font = QFont("Segoe UI", 30, QFont.Bold)
+        self.unit_font = QFont("Segoe UI", 14, QFont.Medium)
+        self.arrow_pen = QPen(QColor(255, 100, 100), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self.arrow_brush = QBrush(QColor(255, 100, 100))
+        # 背景圆环和单位的缓存图层（QImage，后台渲染线程也可以读取），以及与尺寸相关的几何缓存，尺寸或DPI变化时重建
+        self.static_image = None
+        self.raster_frame = None  # 后台渲染好的最新一帧（未启用后台渲染时为None）
+        self.arc_rect = QRect()
+        self.progress_pen = QPen()
+        self.arrow_polygons = []  # 每个整数心率对应的箭头三角形（不可见时为None）
     
     @property
     def current_value(self):
@@ -30,193 +60,191 @@ class RadialGauge(QWidget):
     def current_value(self, value):
         self._current_value = value
     
-    @pyqtProperty(float)
+    @property
     def animated_value(self):
         return self._animated_value
     
     @animated_value.setter
     def animated_value(self, value):
         self._animated_value = value
-        self.update()
+        self.frame_clock.mark_dirty(self)
     
     def set_value(self, value):
         """设置当前值（带动画）"""
         self.current_value = max(self.min_value, min(self.max_value, value))
         
-        # 启动动画
-        self.animation.stop()
-        self.animation.setStartValue(self._animated_value)
-        self.animation.setEndValue(self.current_value)
-        self.animation.start()
+        # 不可见时直接跳到目标值，不占用帧时钟
+        if not self.isVisible():
+            self.frame_clock.unsubscribe(self._animate)
+            self._animated_value = self.current_value
+            return
+        
+        # 从当前显示值开始新的动画
+        self._animation_start_time = time.monotonic()
+        self._animation_start_value = self._animated_value
+        self.frame_clock.subscribe(self._animate)
+    
+    def _animate(self):
+        """帧回调：按缓动曲线更新显示值，动画结束后取消订阅"""
+        progress = min(1.0, (time.monotonic() - self._animation_start_time) / self.animation_duration)
+        eased = self.easing_curve.valueForProgress(progress)
+        self.animated_value = self._animation_start_value + (self.current_value - self._animation_start_value) * eased
+        if progress >= 1.0:
+            self.frame_clock.unsubscribe(self._animate)
     
     def set_average_value(self, value):
-        """设置平均心率值"""
-        self.average_value = max(self.min_value, min(self.max_value, value))
-        self.update()
+        """设置平均心率值（未变化时不重绘）"""
+        value = max(self.min_value, min(self.max_value, value))
+        if value == self.average_value:
+            return
+        self.average_value = value
+        self.frame_clock.mark_dirty(self)
     
     def paintEvent(self, event):
-        """绘制Fluent风格仪表盘"""
-        painter = QPainter(self)
+        """绘制事件：贴上后台渲染好的帧，或在GUI线程直接绘制当前快照"""
+        paint_view(self)
+    
+    def snapshot(self):
+        """生成绘制当前帧所需数据的不可变快照"""
+        static_layer = self._static_layer()
+        
+        # 计算当前值对应的角度（正半圆，从180度开始逆时针绘制，负角度）
+        value_range = self.max_value - self.min_value
+        angle = -int((self._animated_value / value_range) * 180 * 16)
+        
+        # 平均心率指示箭头（按整数心率预先计算的三角形）
+        arrow = None
+        if self.average_value > 0:
+            arrow = self.arrow_polygons[round(self.average_value) - self.min_value]
+        
+        return RadialGaugeSnapshot(
+            self.width(), self.height(), self.devicePixelRatioF(),
+            static_layer,
+            self.arc_rect, self.progress_pen, angle,
+            self.value_font, str(int(self._animated_value)),
+            arrow, self.arrow_pen, self.arrow_brush,
+        )
+    
+    @staticmethod
+    def paint_snapshot(painter, snapshot):
+        """绘制Fluent风格仪表盘：静态图层直接贴图，每帧只绘制进度圆环、当前值和平均心率箭头"""
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.HighQualityAntialiasing)
         
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-        radius = min(center_x, center_y) - 30
+        # 绘制背景圆环和单位（缓存图层）
+        painter.drawImage(0, 0, snapshot.static_layer)
         
-        # 绘制背景圆环（正半圆）
-        background_pen = QPen(QColor(230, 230, 230))
-        # 等比例缩小线宽：从24缩小到18
-        background_pen.setWidth(18)
-        background_pen.setCapStyle(Qt.RoundCap)  # 圆角笔触
-        painter.setPen(background_pen)
+        # 绘制进度圆环（正半圆）
+        painter.setPen(snapshot.progress_pen)
+        painter.drawArc(snapshot.arc_rect, 180 * 16, snapshot.angle)
         
+        # 绘制当前值
+        painter.setPen(QColor(32, 32, 32))
+        painter.setFont(snapshot.value_font)
+        painter.drawText(0, 0, snapshot.width, snapshot.height, Qt.AlignCenter, snapshot.value_text)
+        
+        # 绘制平均心率指示箭头
+        if snapshot.arrow is not None:
+            painter.setPen(snapshot.arrow_pen)
+            painter.setBrush(snapshot.arrow_brush)
+            painter.drawPolygon(snapshot.arrow)
+    
+    def resizeEvent(self, event):
+        """尺寸改变时重建静态图层和几何缓存"""
+        super().resizeEvent(event)
+        self.static_image = None
+    
+    def _static_layer(self):
+        """获取背景圆环和单位的缓存图层，不存在或DPI变化时重新计算几何并绘制"""
+        ratio = self.devicePixelRatioF()
+        if self.static_image is None or self.static_image.devicePixelRatio() != ratio:
+            self._update_geometry()
+            self.static_image = self._render_static(ratio)
+        return self.static_image
+    
+    def _update_geometry(self):
+        """计算与尺寸相关的绘制资源：圆环位置、渐变画笔和每个整数心率对应的箭头"""
         # 正半圆设置：宽度=高度，居中显示
         diameter = min(self.width(), self.height()) - 60
         x = (self.width() - diameter) // 2
         y = (self.height() - diameter) // 2 + 30  # 向下偏移30px，使半圆居中
+        self.arc_rect = QRect(x, y, diameter, diameter)
         
-        # 绘制正半圆：从180度到0度（逆时针）
-        painter.drawArc(x, y, diameter, diameter, 180 * 16, -180 * 16)
-        
-        # 计算当前值对应的角度（正半圆）
-        angle_range = 180  # 180度（从左到右）
-        value_range = self.max_value - self.min_value
-        # 从180度开始，逆时针绘制（负角度）
-        angle = -int((self._animated_value / value_range) * angle_range * 16)
-        
-        # 创建渐变进度颜色（从蓝到红，对应0-200值）
-        gradient = QLinearGradient(x, y, x + diameter, y)  # 水平渐变
+        # 渐变进度颜色（从蓝到红，对应0-200值，水平渐变）
+        gradient = QLinearGradient(x, y, x + diameter, y)
         gradient.setColorAt(0.0, QColor(0, 180, 255))  # 0值为蓝色
         gradient.setColorAt(0.5, QColor(255, 255, 0))  # 100值为黄色
         gradient.setColorAt(1.0, QColor(255, 80, 80))   # 200值为红色
+        self.progress_pen = QPen(gradient, 18, Qt.SolidLine, Qt.RoundCap)
         
-        # 绘制进度圆环（正半圆）
-        # 等比例缩小线宽：从24缩小到18
-        progress_pen = QPen(gradient, 18, Qt.SolidLine, Qt.RoundCap)
-        painter.setPen(progress_pen)
-        painter.drawArc(x, y, diameter, diameter, 180 * 16, angle)
-        
-        # 绘制当前值（Fluent风格字体）
-        painter.setPen(QColor(32, 32, 32))
-        # 等比例缩小字体：从40缩小到30
-        font = QFont("Segoe UI", 30, QFont.Bold)
-        painter.setFont(font)
-        
-        # 绘制当前值并计算其位置
-        value_text = str(int(self._animated_value))
-        # 计算文本尺寸
-        text_rect = painter.boundingRect(0, 0, self.width(), self.height(), Qt.AlignCenter, value_text)
-        painter.drawText(0, 0, self.width(), self.height(), Qt.AlignCenter, value_text)
-        
-        # 绘制单位（Fluent风格的灰色），移到数字下边缘处
-        # 等比例缩小字体：从18缩小到14
-        font = QFont("Segoe UI", 14, QFont.Medium)
-        painter.setFont(font)
-        painter.setPen(QColor(100, 100, 100))
-        
-        # 计算BPM位置：数字下边缘处
-        # text_rect.bottom() 是数字的下边缘位置
-        bpm_y = text_rect.bottom()
-        painter.drawText(0, bpm_y - 5, self.width(), 20, Qt.AlignCenter, "BPM")
-        
-        # 绘制透明半圆导轨（用于计算箭头位置）
-        
-        # 计算圆心和半径（与实际绘制的半圆完全一致）
+        # 平均心率箭头：外侧同心圆导轨（比半圆大20px）上的小三角，尖端指向圆心
+        center_x = self.width() // 2
+        center_y = self.height() // 2
+        radius = min(center_x, center_y) - 30
         arc_center_x = center_x
-        arc_center_y = center_y + 30  # 与arc绘制的y偏移一致
-        
-        # 绘制平均心率指示箭头
-        if self.average_value > 0:
-            # 创建外侧同心圆导轨（半径更大）
-            outer_radius = radius + 20  # 外侧同心圆半径，比半圆大20px
-            
-            # 绘制外侧同心圆路径
-            outer_path = QPainterPath()
-            outer_path.moveTo(arc_center_x - outer_radius, arc_center_y)
-            outer_path.arcTo(
-                arc_center_x - outer_radius, arc_center_y - outer_radius, 
-                outer_radius * 2, outer_radius * 2, 
-                180, -180  # 从180度开始，逆时针绘制180度
-            )
-            
-            # 计算平均心率对应的比例
-            value_ratio = self.average_value / (self.max_value - self.min_value)
-            
-            # 获取箭头根部位置（外侧同心圆上）
-            root_point = outer_path.pointAtPercent(value_ratio)
+        arc_center_y = center_y + 30  # 与圆环绘制的y偏移一致
+        outer_radius = radius + 20
+        outer_path = QPainterPath()
+        outer_path.moveTo(arc_center_x - outer_radius, arc_center_y)
+        outer_path.arcTo(
+            arc_center_x - outer_radius, arc_center_y - outer_radius,
+            outer_radius * 2, outer_radius * 2,
+            180, -180  # 从180度开始，逆时针绘制180度
+        )
+        
+        # 等比例缩小三角形大小：从10缩小到7
+        triangle_size = 7
+        triangle = QPolygonF([
+            QPointF(0, -triangle_size),              # 尖端（指向圆心）
+            QPointF(-triangle_size, triangle_size),  # 左底角
+            QPointF(triangle_size, triangle_size)    # 右底角
+        ])
+        value_range = self.max_value - self.min_value
+        self.arrow_polygons = []
+        for value in range(self.min_value, self.max_value + 1):
+            root_point = outer_path.pointAtPercent(value / value_range)
             root_x = int(root_point.x())
             root_y = int(root_point.y())
             
-            # 计算箭头尖端位置（同样在外侧同心圆上，向前延伸）
-            # 计算前进方向
-            delta = 0.02  # 箭头长度对应的路径比例
-            if value_ratio < 1.0 - delta:
-                # 正常情况下，箭头尖端在外侧同心圆上向前延伸
-                tip_point = outer_path.pointAtPercent(value_ratio + delta)
-                tip_x = int(tip_point.x())
-                tip_y = int(tip_point.y())
-            else:
-                # 到达终点时，箭头向前延伸
-                # 计算切线方向
-                prev_point = outer_path.pointAtPercent(value_ratio - delta)
-                curr_point = outer_path.pointAtPercent(value_ratio)
-                
-                # 切线方向
-                tangent_x = curr_point.x() - prev_point.x()
-                tangent_y = curr_point.y() - prev_point.y()
-                
-                # 归一化切线向量
-                tangent_length = math.sqrt(tangent_x * tangent_x + tangent_y * tangent_y)
-                if tangent_length > 0:
-                    tangent_x /= tangent_length
-                    tangent_y /= tangent_length
-                
-                # 计算尖端位置
-                tip_x = int(curr_point.x() + tangent_x * 30)
-                tip_y = int(curr_point.y() + tangent_y * 30)
+            # 确保三角始终可见（修复0和200时消失的问题），超出控件范围时不绘制
+            if not (0 < root_x < self.width() and 0 < root_y < self.height()):
+                self.arrow_polygons.append(None)
+                continue
             
-            # 绘制旋转的小三角（删除箭头线）
-            # 确保三角始终可见（修复0和200时消失的问题）
-            if root_x > 0 and root_x < self.width() and root_y > 0 and root_y < self.height():
-                # 保存当前绘图状态
-                painter.save()
-                
-                # 移动到三角位置
-                painter.translate(root_x, root_y)
-                
-                # 计算旋转角度（指向圆心）
-                dx = arc_center_x - root_x
-                dy = arc_center_y - root_y
-                
-                # 避免除零错误
-                if dx == 0 and dy == 0:
-                    rotation_angle = 0
-                else:
-                    # 计算从三角位置到圆心的角度
-                    rotation_angle = math.atan2(dy, dx) * 180 / math.pi
-                
-                # 顺时针旋转90°（根据用户要求）
-                rotation_angle += 90
-                
-                # 旋转坐标系
-                painter.rotate(rotation_angle)
-                
-                # 绘制小三角
-                triangle_pen = QPen(QColor(255, 100, 100), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-                triangle_brush = QBrush(QColor(255, 100, 100))
-                painter.setPen(triangle_pen)
-                painter.setBrush(triangle_brush)
-                
-                # 绘制三角形（尖端指向圆心）
-                # 等比例缩小三角形大小：从10缩小到7
-                triangle_size = 7
-                triangle_points = [
-                    QPoint(0, -triangle_size),     # 尖端（指向圆心）
-                    QPoint(-triangle_size, triangle_size),  # 左底角
-                    QPoint(triangle_size, triangle_size)    # 右底角
-                ]
-                painter.drawPolygon(triangle_points)
-                
-                # 恢复绘图状态
-                painter.restore()
\ No newline at end of file
+            # 计算从三角位置到圆心的角度，再顺时针旋转90°
+            dx = arc_center_x - root_x
+            dy = arc_center_y - root_y
+            rotation_angle = 0 if dx == 0 and dy == 0 else math.atan2(dy, dx) * 180 / math.pi
+            rotation_angle += 90
+            self.arrow_polygons.append(QTransform().translate(root_x, root_y).rotate(rotation_angle).map(triangle))
+    
+    def _render_static(self, ratio):
+        """将背景圆环和单位绘制到图层中"""
+        image = QImage(math.ceil(self.width() * ratio), math.ceil(self.height() * ratio),
+                       QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+        
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.HighQualityAntialiasing)
+        
+        # 绘制背景圆环（正半圆，从180度到0度）
+        background_pen = QPen(QColor(230, 230, 230))
+        # 等比例缩小线宽：从24缩小到18
+        background_pen.setWidth(18)
+        background_pen.setCapStyle(Qt.RoundCap)  # 圆角笔触
+        painter.setPen(background_pen)
+        painter.drawArc(self.arc_rect, 180 * 16, -180 * 16)
+        
+        # 绘制单位（Fluent风格的灰色），位于数字下边缘处
+        # 数字居中绘制，其下边缘只取决于字体，与具体数值无关
+        painter.setFont(self.value_font)
+        text_rect = painter.boundingRect(self.rect(), Qt.AlignCenter, "0")
+        bpm_y = text_rect.bottom()
+        painter.setFont(self.unit_font)
+        painter.setPen(QColor(100, 100, 100))
+        painter.drawText(0, bpm_y - 5, self.width(), 20, Qt.AlignCenter, "BPM")
+        
+        painter.end()
+        return image
@@ -0,0 +1,43 @@
+from collections import deque
+
+
+class SlidingWindowExtrema:
+    """
+    滑动窗口最大值/最小值（单调队列），每个样本均摊O(1)
+    窗口为最近加入的size个值
+    """
+    
+    def __init__(self, size):
+        self.size = size
+        self.count = 0        # 已加入的值的总数
+        self._max = deque()   # (序号, 值)，值单调递减
+        self._min = deque()   # (序号, 值)，值单调递增
+    
+    def push(self, value):
+        """加入一个值，同时移出离开窗口的最旧值"""
+        index = self.count
+        self.count += 1
+        
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        
+        # 每次只有一个值离开窗口，且只可能位于队首
+        oldest = index - self.size
+        if self._max[0][0] <= oldest:
+            self._max.popleft()
+        if self._min[0][0] <= oldest:
+            self._min.popleft()
+    
+    @property
+    def max(self):
+        """窗口内的最大值，窗口为空时为0"""
+        return self._max[0][1] if self._max else 0
+    
+    @property
+    def min(self):
+        """窗口内的最小值，窗口为空时为0"""
+        return self._min[0][1] if self._min else 0
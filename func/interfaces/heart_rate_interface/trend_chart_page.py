@@ -2,13 +2,15 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from qfluentwidgets import CardWidget
 from .trend_line_chart import TrendLineChart
+from func.label_text import set_label_text
 
 
 class TrendChartPage(QWidget):
     """趋势折线图页面"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store=None):
         super().__init__(parent)
+        self.store = store
         self.setup_ui()
     
     def setup_ui(self):
@@ -68,7 +70,7 @@ class TrendChartPage(QWidget):
         self.chart_layout.addLayout(self.second_row_layout)
         
         # 创建动态折线图
-        self.trend_chart = TrendLineChart()
+        self.trend_chart = TrendLineChart(store=self.store)
         self.trend_chart.setFixedHeight(160)  # 与其他卡片显示区域高度一致
         self.chart_layout.addWidget(self.trend_chart)
         
@@ -95,12 +97,14 @@ class TrendChartPage(QWidget):
         # 将卡片添加到趋势折线图页面
         self.trend_chart_layout.addWidget(self.chart_card)
         
-    def update_heart_rate(self, heart_rate):
-        """更新心率数据"""
-        self.trend_chart.add_value(heart_rate)
+    def update_heart_rate(self, sample):
+        """更新心率数据（样本已写入会话存储，这里只更新标签）"""
         # 更新HR显示（HR后面空两格显示数字）
         #self.left_label.setText(f"HR  {heart_rate}")
-        # 更新右上角显示MAX_Y值
-        self.top_right_label.setText(f"{int(self.trend_chart.MAX_Y)}")
+        self.update_range_label()
         # 右下角始终显示0
         #self.bottom_right_label.setText("0")
+    
+    def update_range_label(self):
+        """更新右上角显示MAX_Y值"""
+        set_label_text(self.top_right_label, f"{int(self.trend_chart.MAX_Y)}")
@@ -1,43 +1,59 @@
-from PyQt5.QtCore import Qt, QTimer, QPoint
-from PyQt5.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath
+from PyQt5.QtGui import QPainter, QColor
 from PyQt5.QtWidgets import QWidget
-from collections import deque
+from array import array
+from collections import namedtuple
+from func.session_store import SessionStore
+from func.frame_clock import FrameClock
+from func.raster_renderer import paint_view
+from .polyline import (value_to_y_table, interleave_coordinates, build_coordinates, draw_filled_polyline,
+                       draw_average_line, draw_border)
+from .decimation import MinMaxPyramid
+
+
+# 绘制一帧所需的全部数据（不可变，可交给后台渲染线程）
+TrendChartSnapshot = namedtuple("TrendChartSnapshot", [
+    "width", "height", "ratio",
+    "coordinates",                  # 点坐标 [x0, y0, x1, y1, ...]
+    "segments",                     # 连续有数据的点区段，没有数据中断时为None
+    "average_heart_rate", "average_y",
+])
 
 
 class TrendLineChart(QWidget):
-    """趋势折线图组件，数据添加时会逐渐被左右压扁"""
+    """趋势折线图组件，数据添加时会逐渐被左右压扁，数据读取自共享的会话存储"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store=None):
         super().__init__(parent)
         
+        # 会话数据存储（未指定时使用独立的存储）
+        self.store = store if store is not None else SessionStore(self)
+        # 最小/最大值金字塔，长时间会话按像素列抽稀，绘制耗时与会话长度无关
+        self.pyramid = MinMaxPyramid(self.store)
+        
         # 常量定义
+        self.REFRESH_INTERVAL = 0.5  # 刷新间隔（秒）
         self.MAX_Y = 200      # Y轴最大值（心率最大刻度）
         self.MIN_Y = 0        # Y轴最小值
         
         # 变量初始化
-        self.point_lst = []     # 点坐标数组
-        self.point_values = []  # 每个点对应的原始值
-        self.yp_queue = deque() # 数值队列
+        self.coordinates = array("i")  # 点坐标缓冲区 [x0, y0, x1, y1, ...]（每次整体重建，不原地修改）
+        self.segments = None  # 连续有数据的点区段（数据中断处断开），没有中断时为None
         self.current_value = 0  # 当前数值
+        self.suspended = False  # 是否已被渲染调度器暂停
+        self.raster_frame = None  # 后台渲染好的最新一帧（未启用后台渲染时为None）
         
         # 自动调节Y轴范围的变量
         self.auto_adjust_enabled = True        # 是否启用自动调节
         self.min_range = 30                     # 最小范围，确保变化明显
         self.padding_ratio = 0.10               # 上余量比例
         
-        # 所有历史值（不限制长度，用于趋势显示）
-        self.all_history_values = []           # 保存所有历史值
+        # 实际显示的历史值来自会话存储
         self.display_points_count = 0           # 实际显示的点数
         self.max_display_points = 100           # 初始最大显示点数
         
         # 目标值和边界检查
         self.target_max_y = 200                 # 目标MAX_Y
         
-        # 平均心率相关变量
-        self.average_heart_rate = 0             # 当前平均心率
-        self.average_data_points = deque(maxlen=100)  # 用于计算平均值的数据点
-        self.MIN_POINTS_FOR_AVERAGE = 5         # 计算平均值所需的最小点数
-        
         # 初始化Y轴范围
         self.MIN_Y = 0
         self.MAX_Y = 200
@@ -48,37 +64,21 @@ class TrendLineChart(QWidget):
         # 初始化数据
         self._init_data()
         
-        # 设置定时器
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.draw_chart)
-        self.timer.start(500)  # 500ms 刷新一次，约 2fps
+        # 订阅共享帧时钟，500ms 刷新一次，约 2fps
+        self.frame_clock = FrameClock.shared()
+        self.frame_clock.subscribe(self.draw_chart, self.REFRESH_INTERVAL)
     
     def _init_data(self):
         """初始化数据结构"""
         # 初始化为空
-        self.point_lst = []
-        self.point_values = []
-        self.all_history_values = []
+        self.coordinates = array("i")
+        self.segments = None
         self.display_points_count = 0
     
-    def add_value(self, value):
-        """添加新的数值到队列"""
-        self.yp_queue.append(value)
-        # 保存到所有历史值中（不限制长度）
-        self.all_history_values.append(value)
-        # 添加到平均心率计算队列
-        self.average_data_points.append(value)
-        # 计算平均心率
-        self._calculate_average_heart_rate()
-    
-    def _calculate_average_heart_rate(self):
-        """计算平均心率，从5个点开始计算"""
-        if len(self.average_data_points) < self.MIN_POINTS_FOR_AVERAGE:
-            self.average_heart_rate = 0
-            return
-        
-        # 计算平均值
-        self.average_heart_rate = sum(self.average_data_points) / len(self.average_data_points)
+    @property
+    def average_heart_rate(self):
+        """当前平均心率（由会话存储维护）"""
+        return self.store.average_heart_rate
     
     def _update_y_range(self):
         """根据所有历史数据更新Y轴范围，确保所有点都不冲顶"""
@@ -87,18 +87,19 @@ class TrendLineChart(QWidget):
             self.MAX_Y = self.target_max_y
             return
         
-        # 获取所有历史数据
-        all_values = self.all_history_values.copy()
-        
         # 如果数据点不足，使用默认范围
-        if len(all_values) < 5:
+        if len(self.store) < 5:
             self.target_max_y = 200
             self.MAX_Y = self.target_max_y
             return
         
-        # 计算所有数据点的最大值和平均值
-        max_val = max(all_values)
-        avg_val = self.average_heart_rate if self.average_heart_rate > 0 else sum(all_values) / len(all_values)
+        # 所有数据点的最大值由存储增量维护，无需复制历史数据
+        max_val = self.store.max_bpm
+        if self.average_heart_rate > 0:
+            avg_val = self.average_heart_rate
+        else:
+            with self.store.bpm_view() as all_values:
+                avg_val = sum(all_values) / len(all_values)
         
         # 黄金比例（0.618）：平均线应该在总高度的0.618位置
         golden_ratio = 0.618
@@ -168,9 +169,9 @@ class TrendLineChart(QWidget):
     def draw_chart(self):
         """绘制趋势折线图，数据添加时会逐渐被左右压扁"""
         
-        # 如果队列中有新的Y坐标点，则处理
-        if len(self.yp_queue) > 0:
-            self.current_value = self.yp_queue.popleft()
+        # 记录最新的数值
+        if len(self.store) > 0:
+            self.current_value = self.store.bpm[-1]
         
         # 更新Y轴范围
         self._update_y_range()
@@ -178,51 +179,102 @@ class TrendLineChart(QWidget):
         # 重新计算所有点的坐标
         self._recalculate_all_points()
         
-        # 触发重绘
-        self.update()
+        # 标记重绘，由帧时钟在本帧结束时统一刷新
+        self.frame_clock.mark_dirty(self)
+    
+    def suspend(self):
+        """暂停刷新（图表不可见或无数据源连接时由渲染调度器调用）"""
+        self.frame_clock.unsubscribe(self.draw_chart)
+        self.suspended = True
+    
+    def resume(self):
+        """恢复刷新：坐标始终由会话存储全部重新计算，刷新一次即可补齐"""
+        self.suspended = False
+        self.draw_chart()
+        self.frame_clock.subscribe(self.draw_chart, self.REFRESH_INTERVAL)
     
     def _recalculate_all_points(self):
         """重新计算所有点的坐标，实现数据压缩效果"""
-        if not self.all_history_values:
+        if len(self.store) == 0:
             return
         
         width = self.width()
         height = self.height()
         
         # 计算当前需要显示的点数
-        total_points = len(self.all_history_values)
+        total_points = len(self.store)
         self.display_points_count = total_points
         
-        # 清空现有点
-        self.point_lst = []
-        self.point_values = []
+        # 数据点超过每像素列2个时按列抽稀（每列保留最小值和最大值）
+        decimated = self.pyramid.decimate(width)
+        if decimated is not None:
+            self._build_decimated_points(decimated, width)
+            # 中断起点所在的列开始新的一段
+            columns = len(decimated) // 2
+            self.segments = self._segments_from_breaks(
+                (2 * (index * columns // total_points) for index in self.store.gap_starts), 2 * columns)
+            return
         
         # 生成所有点的坐标
-        for i in range(total_points):
-            value = self.all_history_values[i]
-            
-            # 计算X坐标，确保两端贴到边缘
-            if total_points == 1:
-                # 只有一个点时，居中显示
-                x_pos = width / 2
-            else:
-                # 线性映射：将0到total_points-1映射到0到width
-                x_pos = (i / (total_points - 1)) * width
-            
-            # 计算Y坐标
-            y_pos = self._normalize_value_to_y(value)
-            
-            self.point_lst.append(QPoint(int(x_pos), y_pos))
-            self.point_values.append(value)
+        with self.store.bpm_view() as all_values:
+            self._build_points(all_values, total_points, width)
+        self.segments = self._segments_from_breaks(self.store.gap_starts, total_points)
+    
+    @staticmethod
+    def _segments_from_breaks(breaks, point_count):
+        """按各段的起点（递增）划分点区段，没有中断时返回None"""
+        segments = []
+        start = 0
+        for point in breaks:
+            if start < point < point_count:
+                segments.append((start, point))
+                start = point
+        if not segments:
+            return None
+        segments.append((start, point_count))
+        return segments
+    
+    def _build_points(self, all_values, total_points, width):
+        """根据历史值生成所有点的坐标"""
+        # 计算X坐标，确保两端贴到边缘
+        if total_points == 1:
+            # 只有一个点时，居中显示
+            x_coordinates = array("i", [width // 2])
+        else:
+            # 线性映射：将0到total_points-1映射到0到width
+            x_coordinates = array("i", (i * width // (total_points - 1) for i in range(total_points)))
+        
+        # 计算Y坐标
+        y_table = value_to_y_table(self._normalize_value_to_y, max(all_values))
+        self.coordinates = build_coordinates(x_coordinates, all_values, y_table)
+    
+    def _build_decimated_points(self, values, width):
+        """根据抽稀后的值生成坐标，每列的两个点位于同一X坐标"""
+        columns = len(values) // 2
+        column_x = array("i", (column * width // (columns - 1) for column in range(columns)))
+        x_coordinates = interleave_coordinates(column_x, column_x)
+        y_table = value_to_y_table(self._normalize_value_to_y, self.store.max_bpm)
+        self.coordinates = build_coordinates(x_coordinates, values, y_table)
     
     def paintEvent(self, event):
-        """绘制事件（双缓冲绘图）"""
-        painter = QPainter(self)
+        """绘制事件：贴上后台渲染好的帧，或在GUI线程直接绘制当前快照"""
+        paint_view(self)
+    
+    def snapshot(self):
+        """生成绘制当前帧所需数据的不可变快照"""
+        average_y = self._normalize_value_to_y(self.average_heart_rate) if self.average_heart_rate else 0
+        return TrendChartSnapshot(
+            self.width(), self.height(), self.devicePixelRatioF(),
+            self.coordinates, self.segments,
+            self.average_heart_rate, average_y,
+        )
+    
+    @staticmethod
+    def paint_snapshot(painter, snapshot):
+        """根据快照绘制一帧（只读取快照，可在后台渲染线程中调用）"""
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # 获取画布尺寸
-        width = self.width()
-        height = self.height()
+        width = snapshot.width
+        height = snapshot.height
         
         # 设置裁剪区域，限制在卡片范围内
         painter.setClipRect(0, 0, width, height)
@@ -230,92 +282,14 @@ class TrendLineChart(QWidget):
         # 绘制浅红色背景
         painter.fillRect(0, 0, width, height, QColor(255, 255, 255))
         
-        # 绘制折线
-        self._draw_line(painter, width, height)
+        # 绘制折线和填充区域，与折线图配色保持一致
+        draw_filled_polyline(painter, snapshot.coordinates, width, height, snapshot.segments)
         
         # 绘制平均心率线
-        self._draw_average_line(painter, width, height)
+        draw_average_line(painter, snapshot.average_heart_rate, snapshot.average_y, width)
         
         # 绘制1px黑色边框
-        border_pen = QPen(QColor(0, 0, 0))
-        border_pen.setWidth(1)
-        painter.setPen(border_pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRect(0, 0, width - 1, height - 1)
-    
-    def _draw_average_line(self, painter, width, height):
-        """绘制平均心率线，1px深蓝色横线，并在右端显示数值"""
-        if self.average_heart_rate == 0:
-            return
-        
-        # 计算平均线的Y坐标
-        average_y = self._normalize_value_to_y(self.average_heart_rate)
-        
-        # 深蓝色
-        deep_blue = QColor(0, 60, 135)
-        
-        # 设置深蓝色1px线
-        average_pen = QPen(deep_blue)
-        average_pen.setWidth(1)
-        painter.setPen(average_pen)
-        
-        # 绘制横线
-        painter.drawLine(0, average_y, width, average_y)
-        
-        # 绘制平均心率数值（线的上方，右对齐）
-        painter.setPen(deep_blue)
-        font = painter.font()
-        font.setPointSize(10)
-        painter.setFont(font)
-        
-        # 格式化平均心率数值（添加前缀"平均 "，四舍五入为整数）
-        avg_text = f"平均 {round(self.average_heart_rate)}"
-        
-        # 获取文本宽度
-        text_rect = painter.boundingRect(0, 0, 100, 20, Qt.AlignRight, avg_text)
-        text_width = text_rect.width()
-        
-        # 计算文本位置：线的上方，右边缘与线的右边缘平齐
-        text_x = width - text_width - 5  # 右对齐，距离边缘5px
-        text_y = average_y - 5  # 线的上方，距离线5px
-        
-        painter.drawText(text_x, text_y, avg_text)
-    
-    def _draw_line(self, painter, width, height):
-        """绘制折线和填充区域，与折线图配色保持一致"""
-        if len(self.point_lst) < 2:
-            return
-        
-        # 先绘制填充区域（半透明红色）
-        # 创建填充路径
-        fill_path = QPainterPath()
-        fill_path.moveTo(self.point_lst[0])
-        
-        # 添加所有折线点
-        for i in range(1, len(self.point_lst)):
-            fill_path.lineTo(self.point_lst[i])
-        
-        # 闭合路径到底部
-        fill_path.lineTo(width, height)
-        fill_path.lineTo(0, height)
-        fill_path.closeSubpath()
-        
-        # 设置填充颜色（半透明红色），与折线图保持一致
-        fill_brush = QBrush(QColor(255, 143, 143, 50))  # 50表示透明度
-        painter.setBrush(fill_brush)
-        painter.setPen(Qt.NoPen)  # 不绘制边框
-        painter.drawPath(fill_path)
-        
-        # 设置折线颜色（深红色），与折线图保持一致
-        pen = QPen(QColor(220, 9, 9))
-        pen.setWidth(1)
-        painter.setPen(pen)
-        
-        # 连线各个点
-        for i in range(len(self.point_lst) - 1):
-            p1 = self.point_lst[i]
-            p2 = self.point_lst[i + 1]
-            painter.drawLine(p1, p2)
+        draw_border(painter, width, height)
 
     def resizeEvent(self, event):
         """窗口大小改变时重新计算所有点的坐标"""
@@ -5,16 +5,22 @@ from collections import deque
 from qfluentwidgets import CardWidget
 from func.interfaces.heart_rate_interface import DynamicLineChart
 from func.settings_manager import SettingsManager
+from func.label_text import set_label_text
+from func.frame_clock import FrameClock
 
 
 class HeartRateWindow(QMainWindow):
     """独立的心率显示窗口"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, session_store=None, render_scheduler=None, chart_model=None):
         super().__init__(parent)
         self.setObjectName("heart_rate_window")
         self.parent_window = parent
+        self.session_store = session_store
+        self.render_scheduler = render_scheduler
+        self.chart_model = chart_model  # 与主窗口共享的动态折线图数据模型（为None时使用独立的模型）
         self.current_device_name = None
+        self.current_heart_rate = 0  # 最新心率（标签在下一帧更新）
         
         # 初始化设置管理器
         self.settings_manager = SettingsManager()
@@ -112,8 +118,10 @@ class HeartRateWindow(QMainWindow):
         self.chart_layout.addLayout(self.second_row_layout)
         
         # 创建动态折线图
-        self.chart = DynamicLineChart()
+        self.chart = DynamicLineChart(store=self.session_store, model=self.chart_model)
         self.chart_layout.addWidget(self.chart)
+        if self.render_scheduler is not None:
+            self.render_scheduler.register(self.chart)
         
         # 将卡片添加到主布局
         self.main_layout.addWidget(self.chart_card)
@@ -231,16 +239,31 @@ class HeartRateWindow(QMainWindow):
         # 输出调试信息
         print(f"悬浮窗设置已更新：拖动功能={'启用' if self.drag_enabled else '禁用'}，拖动方式={self.drag_type}，始终置顶={'是' if self.always_on_top else '否'}")
     
-    def update_heart_rate(self, heart_rate):
+    def update_heart_rate(self, sample):
         """更新心率数值"""
-        # 添加到折线图，包括0值
-        self.chart.add_value(heart_rate)
+        # 样本已由主窗口写入会话存储，折线图在刷新时读取
+        # 窗口隐藏期间不更新标签，重新显示时从会话存储恢复；否则在下一帧统一更新
+        self.current_heart_rate = sample.bpm
+        if self.isVisible():
+            FrameClock.shared().subscribe(self._update_labels_on_frame)
+    
+    def _update_labels_on_frame(self):
+        """帧回调：用最新心率更新标签（同一帧内的多个样本只更新一次），然后取消订阅"""
+        FrameClock.shared().unsubscribe(self._update_labels_on_frame)
+        self._update_labels(self.current_heart_rate)
+    
+    def _update_labels(self, heart_rate):
         # 更新HR显示（HR后面空两格显示数字）
-        self.left_label.setText(f"HR  {heart_rate}")
+        set_label_text(self.left_label, f"HR  {heart_rate}")
         # 更新右上角显示MAX_Y值
-        self.top_right_label.setText(f"{int(self.chart.MAX_Y)}")
+        set_label_text(self.top_right_label, f"{int(self.chart.MAX_Y)}")
         # 右下角始终显示0
-        self.bottom_right_label.setText("0")
+        set_label_text(self.bottom_right_label, "0")
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.session_store is not None and len(self.session_store):
+            self._update_labels(self.session_store.bpm[-1])
 
     def update_status(self, status):
         """更新状态信息"""
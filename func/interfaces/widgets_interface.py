@@ -1,8 +1,7 @@
-from PyQt5.QtCore import Qt, QTimer, QByteArray
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMenu
-from PyQt5.QtGui import QPixmap
 from qfluentwidgets import TitleLabel, CardWidget, BodyLabel
-from ..resources import CP2_IMAGE
+from ..assets import get_pixmap
 class WidgetsInterface(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -64,24 +63,33 @@ class WidgetsInterface(QWidget):
         card2_text = BodyLabel("<b>实时心率波动图<br>点击启动</b><br><span style='color: red;'>关闭在右键菜单里<br>主窗口关闭时小窗口不关闭</span>")
         card2_text.setWordWrap(True)
         
-        card2_image = QLabel()
-        card2_image.setFixedSize(130, 98)
-        
-        # 使用Base64编码的图片
-        pixmap = QPixmap()
-        pixmap.loadFromData(QByteArray.fromBase64(CP2_IMAGE.encode()))
-        if not pixmap.isNull():
-            card2_image.setPixmap(pixmap.scaled(130, 98, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        card2_image.setAlignment(Qt.AlignCenter)
+        # 预览图片在界面首次显示时才解码和缩放
+        self.card2_image = QLabel()
+        self.card2_image.setFixedSize(130, 98)
+        self.card2_image.setAlignment(Qt.AlignCenter)
+        self.card2_image_loaded = False
         
         card2_layout.addWidget(card2_text, 1)
-        card2_layout.addWidget(card2_image, 0, Qt.AlignCenter)
+        card2_layout.addWidget(self.card2_image, 0, Qt.AlignCenter)
         
         self.main_layout.addWidget(self.title_label)
         self.main_layout.addWidget(self.card1)
         self.main_layout.addWidget(self.card2)
         self.main_layout.addStretch()
     
+    def showEvent(self, event):
+        """首次显示时加载预览图片"""
+        super().showEvent(event)
+        if not self.card2_image_loaded:
+            self.card2_image_loaded = True
+            self._load_card2_image()
+    
+    def _load_card2_image(self):
+        """从资源包加载预览图片并缩放到卡片尺寸"""
+        pixmap = get_pixmap("cp2.png")
+        if not pixmap.isNull():
+            self.card2_image.setPixmap(pixmap.scaled(130, 98, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    
     def eventFilter(self, obj, event):
         """事件过滤器，用于处理卡片的点击和右键菜单"""
         if obj == self.card1:
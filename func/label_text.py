@@ -0,0 +1,4 @@
+def set_label_text(label, text):
+    """设置标签文本，与当前文本相同时跳过（避免重复的文本排版和重新布局）"""
+    if label.text() != text:
+        label.setText(text)
@@ -1,7 +1,6 @@
 import mmap
 import struct
 import os
-import time
 
 
 class MemoryShareManager:
@@ -15,11 +14,23 @@ class MemoryShareManager:
     DATA_FORMAT = "if"
     # 数据大小
     DATA_SIZE = struct.calcsize(DATA_FORMAT)
+    # 多设备区域：起始偏移、槽位数量头（uint32），每个设备槽（设备ID: 64字节UTF-8, BPM: int, timestamp: double）
+    # 设备ID为空的槽位是已释放的空槽；ID超长时截断（读取时按errors="replace"解码）
+    DEVICE_TABLE_OFFSET = 64
+    DEVICE_COUNT_FORMAT = "I"
+    DEVICE_SLOT_FORMAT = "64sid"
+    DEVICE_BPM_OFFSET = struct.calcsize("64s")  # 槽位内BPM字段的偏移
+    BPM_FORMAT = "i"
+    DEVICE_SLOT_SIZE = struct.calcsize(DEVICE_SLOT_FORMAT)
+    DEVICE_SLOTS_OFFSET = DEVICE_TABLE_OFFSET + struct.calcsize(DEVICE_COUNT_FORMAT)
+    MAX_DEVICES = (SHARED_MEM_SIZE - DEVICE_SLOTS_OFFSET) // DEVICE_SLOT_SIZE
     
     def __init__(self):
         self.shared_memory = None
         self.mmap_obj = None
         self.is_initialized = False
+        self.device_slots = {}  # 设备ID -> 槽位索引
+        self.slot_count = 0     # 已写入头部的槽位数量（包括中间已释放的空槽）
     
     def initialize(self):
         """初始化共享内存"""
@@ -37,17 +48,14 @@ class MemoryShareManager:
             print(f"[MemoryShare] 初始化共享内存失败: {e}")
             self.is_initialized = False
     
-    def update_heart_rate(self, heart_rate):
-        """更新共享内存中的心率数据"""
+    def update_heart_rate(self, sample):
+        """更新共享内存中的心率数据（时间戳使用样本的接收时间）"""
         if not self.is_initialized:
             return
         
         try:
-            # 获取当前时间戳
-            timestamp = time.time()
-            
             # 打包数据
-            data = struct.pack(self.DATA_FORMAT, heart_rate, timestamp)
+            data = struct.pack(self.DATA_FORMAT, sample.bpm, sample.wall_time)
             
             # 写入共享内存
             self.shared_memory.seek(0)
@@ -57,6 +65,74 @@ class MemoryShareManager:
         except Exception as e:
             print(f"[MemoryShare] 更新心率数据失败: {e}")
     
+    def invalidate_heart_rate(self):
+        """
+        数据流中断时将心率标记为无效：BPM写为0，时间戳保留为最后一个有效样本的时间，
+        读取方不会把中断前的心率当作当前值
+        """
+        if not self.is_initialized:
+            return
+        try:
+            struct.pack_into(self.BPM_FORMAT, self.shared_memory, 0, 0)
+        except Exception as e:
+            print(f"[MemoryShare] 标记心率数据无效失败: {e}")
+    
+    def invalidate_device_heart_rate(self, device_id):
+        """数据流中断时将指定设备的心率标记为无效（BPM写为0，保留时间戳）"""
+        slot = self.device_slots.get(device_id)
+        if slot is None or not self.is_initialized:
+            return
+        try:
+            offset = self.DEVICE_SLOTS_OFFSET + slot * self.DEVICE_SLOT_SIZE + self.DEVICE_BPM_OFFSET
+            struct.pack_into(self.BPM_FORMAT, self.shared_memory, offset, 0)
+        except Exception as e:
+            print(f"[MemoryShare] 标记设备心率数据无效失败: {e}")
+    
+    def update_device_heart_rate(self, sample):
+        """更新共享内存中指定设备的心率数据（多设备区域）"""
+        if not self.is_initialized:
+            return
+        
+        try:
+            device_id = sample.device_id
+            slot = self.device_slots.get(device_id)
+            if slot is None:
+                slot = self._allocate_slot(device_id)
+                if slot is None:
+                    return
+            
+            offset = self.DEVICE_SLOTS_OFFSET + slot * self.DEVICE_SLOT_SIZE
+            struct.pack_into(self.DEVICE_SLOT_FORMAT, self.shared_memory, offset,
+                             device_id.encode("utf-8"), sample.bpm, sample.wall_time)
+            
+        except Exception as e:
+            print(f"[MemoryShare] 更新设备心率数据失败: {e}")
+    
+    def _allocate_slot(self, device_id):
+        """为设备分配槽位：优先复用已释放的空槽，没有空槽且已满时返回None"""
+        used = set(self.device_slots.values())
+        slot = next((index for index in range(self.slot_count) if index not in used), self.slot_count)
+        if slot >= self.MAX_DEVICES:
+            return None
+        self.device_slots[device_id] = slot
+        if slot == self.slot_count:
+            # 更新槽位数量头
+            self.slot_count += 1
+            struct.pack_into(self.DEVICE_COUNT_FORMAT, self.shared_memory,
+                             self.DEVICE_TABLE_OFFSET, self.slot_count)
+        return slot
+    
+    def remove_device(self, device_id):
+        """释放设备的槽位（设备断开或被移除时调用），读取方不再看到该设备"""
+        slot = self.device_slots.pop(device_id, None)
+        if slot is None or not self.is_initialized:
+            return
+        try:
+            offset = self.DEVICE_SLOTS_OFFSET + slot * self.DEVICE_SLOT_SIZE
+            self.shared_memory[offset:offset + self.DEVICE_SLOT_SIZE] = bytes(self.DEVICE_SLOT_SIZE)
+        except Exception as e:
+            print(f"[MemoryShare] 释放设备槽位失败: {e}")
+    
     def close(self):
         """关闭共享内存"""
         if self.shared_memory:
@@ -95,4 +171,36 @@ def read_heart_rate_from_memory():
             return None
     except Exception as e:
         print(f"[MemoryShare] 读取心率数据失败: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def read_device_heart_rates_from_memory():
+    """从共享内存中读取所有设备的心率数据
+    
+    Returns:
+        dict: {设备ID: (heart_rate, timestamp)} 或 None
+    """
+    try:
+        with mmap.mmap(
+            -1,
+            MemoryShareManager.SHARED_MEM_SIZE,
+            MemoryShareManager.SHARED_MEM_NAME,
+            mmap.ACCESS_READ
+        ) as shared_memory:
+            count = struct.unpack_from(MemoryShareManager.DEVICE_COUNT_FORMAT, shared_memory,
+                                       MemoryShareManager.DEVICE_TABLE_OFFSET)[0]
+            count = min(count, MemoryShareManager.MAX_DEVICES)
+            result = {}
+            for slot in range(count):
+                offset = MemoryShareManager.DEVICE_SLOTS_OFFSET + slot * MemoryShareManager.DEVICE_SLOT_SIZE
+                device_id, heart_rate, timestamp = struct.unpack_from(
+                    MemoryShareManager.DEVICE_SLOT_FORMAT, shared_memory, offset)
+                device_id = device_id.rstrip(b"\0")
+                if not device_id:
+                    continue  # 已释放的空槽
+                # 截断的ID可能以不完整的多字节字符结尾，只替换该字符，不影响其他设备
+                result[device_id.decode("utf-8", errors="replace")] = (heart_rate, timestamp)
+            return result
+    except Exception as e:
+        print(f"[MemoryShare] 读取设备心率数据失败: {e}")
+        return None
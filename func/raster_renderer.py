@@ -0,0 +1,129 @@
+import math
+import threading
+import time
+from PyQt5 import sip
+from PyQt5.QtCore import QThread, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter
+
+
+class RenderStats:
+    """后台渲染统计：每帧的渲染耗时，以及从生成快照到GUI线程拿到渲染结果的排队延迟"""
+    
+    def __init__(self):
+        self.frame_count = 0             # 已渲染的帧数
+        self.superseded = 0              # 尚未渲染就被新快照替换的快照数
+        self.total_render_time = 0.0     # 累计渲染耗时（秒）
+        self.max_render_time = 0.0       # 最长单帧渲染耗时（秒）
+        self.total_queue_latency = 0.0   # 累计排队延迟（秒）
+        self.max_queue_latency = 0.0     # 最长排队延迟（秒）
+    
+    def record(self, render_time, queue_latency):
+        self.frame_count += 1
+        self.total_render_time += render_time
+        self.max_render_time = max(self.max_render_time, render_time)
+        self.total_queue_latency += queue_latency
+        self.max_queue_latency = max(self.max_queue_latency, queue_latency)
+    
+    def as_dict(self):
+        count = self.frame_count or 1
+        return {
+            "frame_count": self.frame_count,
+            "superseded": self.superseded,
+            "average_render_time": self.total_render_time / count,
+            "max_render_time": self.max_render_time,
+            "average_queue_latency": self.total_queue_latency / count,
+            "max_queue_latency": self.max_queue_latency,
+        }
+
+
+def frame_size(view):
+    """图表当前尺寸对应的图像像素尺寸"""
+    ratio = view.devicePixelRatioF()
+    return QSize(math.ceil(view.width() * ratio), math.ceil(view.height() * ratio))
+
+
+def paint_view(view):
+    """
+    图表的绘制入口：已有尺寸匹配的后台渲染帧时只贴图，
+    否则（直接绘制模式、尚未渲染出第一帧或尺寸刚改变）在GUI线程直接绘制当前快照
+    """
+    painter = QPainter(view)
+    frame = view.raster_frame
+    if frame is not None and frame.size() == frame_size(view):
+        painter.drawImage(0, 0, frame)
+        return
+    
+    view.paint_snapshot(painter, view.snapshot())
+    if frame is not None:
+        # 尺寸已改变，后台按新尺寸重新渲染
+        view.frame_clock.mark_dirty(view)
+
+
+class RasterRenderer(QThread):
+    """
+    可选的后台栅格渲染：帧时钟在帧结束时为需要重绘的图表生成不可变快照，
+    工作线程将快照绘制到QImage中，GUI线程只负责贴图
+    
+    图表需要提供raster_frame属性、snapshot()方法（返回包含width、height、ratio的快照）
+    以及只读取快照的静态方法paint_snapshot(painter, snapshot)
+    每个图表最多只有一个待渲染的快照，新快照直接替换尚未开始渲染的旧快照
+    
+    注意：PyQt的绘图调用不释放GIL，工作线程执行单个绘图调用期间GUI线程的Python代码仍需等待，
+    后台渲染只能把GUI线程的停顿从整帧缩短到最长的单个绘图调用
+    """
+    frame_ready = pyqtSignal(object, object, float, float)  # (图表, 图像, 快照时刻, 渲染耗时)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pending = {}  # 图表 -> (绘制函数, 快照, 快照时刻)，按提交顺序渲染
+        self.condition = threading.Condition()
+        self.stopping = False
+        self.stats = RenderStats()
+        self.frame_ready.connect(self._on_frame_ready)
+    
+    def submit(self, view):
+        """在GUI线程生成图表的快照并提交到工作线程"""
+        job = (type(view).paint_snapshot, view.snapshot(), time.perf_counter())
+        with self.condition:
+            if view in self.pending:
+                self.stats.superseded += 1
+            self.pending[view] = job
+            self.condition.notify()
+        if not self.isRunning():
+            self.start()
+    
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if self.stopping:
+                    return
+                view = next(iter(self.pending))
+                paint, snapshot, submitted_at = self.pending.pop(view)
+            
+            start = time.perf_counter()
+            image = QImage(math.ceil(snapshot.width * snapshot.ratio), math.ceil(snapshot.height * snapshot.ratio),
+                           QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(snapshot.ratio)
+            image.fill(Qt.transparent)
+            painter = QPainter(image)
+            paint(painter, snapshot)
+            painter.end()
+            self.frame_ready.emit(view, image, submitted_at, time.perf_counter() - start)
+    
+    def _on_frame_ready(self, view, image, submitted_at, render_time):
+        """GUI线程：保存渲染好的帧并请求贴图"""
+        self.stats.record(render_time, time.perf_counter() - submitted_at)
+        if sip.isdeleted(view):
+            return
+        view.raster_frame = image
+        view.update()
+    
+    def shutdown(self):
+        """停止工作线程并等待其退出"""
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        if self.isRunning():
+            self.wait()
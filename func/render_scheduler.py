@@ -0,0 +1,55 @@
+from PyQt5.QtCore import QObject, QEvent
+
+
+class RenderScheduler(QObject):
+    """
+    图表刷新调度：只有可见且有数据源连接时图表才定时刷新
+    页面切换、窗口最小化或隐藏到托盘、断开连接时暂停刷新，图表只通过会话存储继续接收数据，
+    恢复时由图表一次性补齐暂停期间错过的刷新
+    
+    注册的图表需要提供suspended属性以及suspend()和resume()方法
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.views = []
+        self.connected = False  # 是否有数据源连接
+    
+    def register(self, view):
+        """注册图表，并根据当前状态立即暂停或恢复"""
+        self.views.append(view)
+        view.installEventFilter(self)
+        view.destroyed.connect(lambda _=None, view=view: self._unregister(view))
+        self._refresh(view)
+    
+    def _unregister(self, view):
+        if view in self.views:
+            self.views.remove(view)
+    
+    def set_connected(self, connected):
+        """数据源连接或断开时调用，断开后所有图表空闲"""
+        if self.connected == connected:
+            return
+        self.connected = connected
+        for view in self.views:
+            self._refresh(view)
+    
+    @staticmethod
+    def is_view_visible(view):
+        """图表是否实际可见：自身及所有父控件可见、窗口未最小化且未被完全遮挡"""
+        return (view.isVisible()
+                and not view.window().isMinimized()
+                and not view.visibleRegion().isEmpty())
+    
+    def eventFilter(self, obj, event):
+        # 父页面隐藏、窗口最小化或隐藏到托盘时，图表都会收到隐藏事件；布局调整尺寸后重新判断可见区域
+        if event.type() in (QEvent.Show, QEvent.Hide, QEvent.Resize) and obj in self.views:
+            self._refresh(obj)
+        return False
+    
+    def _refresh(self, view):
+        active = self.connected and self.is_view_visible(view)
+        if active and view.suspended:
+            view.resume()
+        elif not active and not view.suspended:
+            view.suspend()
@@ -0,0 +1,105 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class SessionStore(QObject):
+    """
+    会话心率数据存储：所有图表、统计和输出共享的唯一数据源
+    按列保存在定长类型数组中（BPM: uint16，接收时间: int64纳秒，RR间期单独成列），
+    追加为均摊O(1)，读取方通过memoryview零拷贝访问
+    
+    注意：memoryview存在期间数组无法扩容，读取方应使用with语句及时释放，例如
+        with store.bpm_view(start) as values:
+            peak = max(values)
+    """
+    sample_appended = pyqtSignal(int)  # 新样本的索引
+    cleared = pyqtSignal()
+    
+    # 平均心率窗口大小和计算平均值所需的最小点数
+    AVERAGE_WINDOW = 100
+    MIN_POINTS_FOR_AVERAGE = 5
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._reset()
+    
+    def _reset(self):
+        self.bpm = array("H")          # 心率
+        self.timestamps = array("q")   # 接收时间（monotonic纳秒）
+        self.rr_sample_index = array("I")  # 每个RR间期所属的样本索引
+        self.rr_values = array("H")    # RR间期（单位1/1024秒）
+        self.gap_starts = array("I")   # 数据中断后第一个样本的索引（递增），图表在此断开折线
+        self.start_wall_time = None    # 会话开始的墙上时间
+        self.max_bpm = 0               # 会话最高心率
+        self.min_bpm = 0               # 会话最低心率（不含0）
+        self._window_sum = 0           # 平均窗口内心率之和
+    
+    def __len__(self):
+        return len(self.bpm)
+    
+    def append(self, sample):
+        """追加一个样本，返回其索引"""
+        bpm = max(0, min(0xFFFF, sample.bpm))
+        index = len(self.bpm)
+        if self.start_wall_time is None:
+            self.start_wall_time = sample.wall_time
+        
+        self.bpm.append(bpm)
+        self.timestamps.append(sample.recv_ns)
+        for rr in sample.rr_intervals:
+            self.rr_sample_index.append(index)
+            self.rr_values.append(rr)
+        
+        # 增量更新统计值
+        if bpm > self.max_bpm:
+            self.max_bpm = bpm
+        if bpm > 0 and (self.min_bpm == 0 or bpm < self.min_bpm):
+            self.min_bpm = bpm
+        self._window_sum += bpm
+        if index >= self.AVERAGE_WINDOW:
+            self._window_sum -= self.bpm[index - self.AVERAGE_WINDOW]
+        
+        self.sample_appended.emit(index)
+        return index
+    
+    def mark_gap(self):
+        """记录数据中断：下一个样本开始新的一段，中断期间不再沿用中断前的心率"""
+        index = len(self.bpm)
+        if index and (not self.gap_starts or self.gap_starts[-1] != index):
+            self.gap_starts.append(index)
+    
+    def is_gap_start(self, index):
+        """第index个样本（可以是尚未收到的下一个样本）之前是否有数据中断"""
+        position = bisect_left(self.gap_starts, index)
+        return position < len(self.gap_starts) and self.gap_starts[position] == index
+    
+    def gaps_between(self, start, stop):
+        """索引在(start, stop)之间的中断起点"""
+        return self.gap_starts[bisect_right(self.gap_starts, start):bisect_left(self.gap_starts, stop)]
+    
+    def clear(self):
+        """清空会话数据"""
+        self._reset()
+        self.cleared.emit()
+    
+    @property
+    def average_heart_rate(self):
+        """最近AVERAGE_WINDOW个样本的平均心率，样本不足时为0"""
+        count = min(len(self.bpm), self.AVERAGE_WINDOW)
+        if count < self.MIN_POINTS_FOR_AVERAGE:
+            return 0
+        return self._window_sum / count
+    
+    def bpm_view(self, start=0, stop=None):
+        """心率列的零拷贝视图"""
+        return memoryview(self.bpm)[start:stop]
+    
+    def timestamp_view(self, start=0, stop=None):
+        """接收时间列的零拷贝视图"""
+        return memoryview(self.timestamps)[start:stop]
+    
+    def memory_usage(self):
+        """各列占用的字节数"""
+        return sum(column.buffer_info()[1] * column.itemsize
+                   for column in (self.bpm, self.timestamps, self.rr_sample_index, self.rr_values, self.gap_starts))
@@ -20,7 +20,14 @@ class SettingsManager:
             "floating_window_pos": {"x": 100, "y": 100},  # 悬浮窗上次位置
             # 大数字卡片设置
             "big_number_font_family": "Segoe UI",  # 大数字卡片字体家族
-            "big_number_font_color": "#333"  # 大数字卡片字体颜色
+            "big_number_font_color": "#333",  # 大数字卡片字体颜色
+            # 设备连接设置
+            "auto_connect_last_device": True,  # 启动时是否直接连接上次使用的设备
+            "last_device_address": None,  # 上次成功连接的设备地址
+            "last_device_name": None,  # 上次成功连接的设备名称
+            # 渲染设置
+            "render_fps": 30,  # 图表和仪表盘的目标帧率
+            "threaded_rendering": False  # 是否在后台线程中渲染图表和仪表盘（GUI线程只贴图）
         }
         
         # 确保设置目录存在
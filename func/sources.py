@@ -0,0 +1,249 @@
+import abc
+import asyncio
+import concurrent.futures
+import csv
+import math
+import random
+import time
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+# 心率样本
+class HeartRateSample:
+    """
+    心率样本：在采集时创建一次，随信号传递给所有消费者
+    recv_ns为接收时的monotonic纳秒时间戳（用于计算端到端延迟），wall_time为墙上时间，
+    seq为数据源内递增的序号（用于发现丢失的样本）
+    """
+    __slots__ = ("recv_ns", "wall_time", "seq", "device_id", "bpm", "rr_intervals")
+    
+    def __init__(self, recv_ns, wall_time, seq, device_id, bpm, rr_intervals=()):
+        self.recv_ns = recv_ns
+        self.wall_time = wall_time
+        self.seq = seq
+        self.device_id = device_id
+        self.bpm = bpm
+        self.rr_intervals = rr_intervals
+    
+    @classmethod
+    def now(cls, device_id, seq, bpm, rr_intervals=()):
+        """以当前时间创建样本"""
+        return cls(time.monotonic_ns(), time.time(), seq, device_id, bpm, rr_intervals)
+    
+    def latency_ns(self):
+        """从接收到现在经过的时间（纳秒）"""
+        return time.monotonic_ns() - self.recv_ns
+    
+    def __repr__(self):
+        return (f"HeartRateSample(device_id={self.device_id!r}, seq={self.seq}, bpm={self.bpm}, "
+                f"rr_intervals={self.rr_intervals!r}, wall_time={self.wall_time:.3f})")
+
+
+# QObject和abc.ABC的元类不同，合并后数据源基类才能同时是QObject和抽象基类
+class _AbstractSourceMeta(type(QObject), abc.ABCMeta):
+    pass
+
+
+# 心率数据源基类
+class HeartRateSource(QObject, abc.ABC, metaclass=_AbstractSourceMeta):
+    """
+    心率数据源接口：蓝牙设备、合成数据和会话回放都实现该接口，
+    在BLE服务事件循环中运行，界面和各输出通过相同的信号接收数据
+    """
+    sample_received = pyqtSignal(object)  # HeartRateSample
+    monitoring_started = pyqtSignal(object)  # 开始产生数据后发送（设备）
+    stream_interrupted = pyqtSignal(str)  # 数据流中断（设备ID）
+    data_gap = pyqtSignal(str, float)  # 数据恢复，报告缺失时段（设备ID, 缺失时长秒）
+    connection_status = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    
+    # 是否为真实蓝牙设备（成功连接后会被记住，用于下次启动直接连接）
+    is_bluetooth = False
+    
+    def __init__(self, service, device_id, name=None):
+        super().__init__()
+        self.service = service
+        self.device_id = device_id
+        self.name = name
+        self.future = None
+        self.sequence = 0  # 本数据源的样本序号
+        self._wake_event = None
+        self._stop_requested = False
+    
+    def start(self):
+        self._stop_requested = False
+        self.future = self.service.submit(self.monitor_heart_rate())
+    
+    def isRunning(self):
+        return self.future is not None and not self.future.done()
+    
+    def stop(self):
+        """请求停止数据源（线程安全）"""
+        self.service.call_soon(self._request_stop)
+    
+    def _request_stop(self):
+        self._stop_requested = True
+        if self._wake_event is not None:
+            self._wake_event.set()
+    
+    def wait(self, timeout=None):
+        """等待数据源结束，返回是否已结束（超时返回False）"""
+        if self.future:
+            done, _ = concurrent.futures.wait([self.future], timeout=timeout)
+            return bool(done)
+        return True
+    
+    def cancel(self):
+        """强制取消数据源（停止请求超时未结束时使用）"""
+        if self.future:
+            self.future.cancel()
+    
+    async def _sleep(self, delay):
+        """可被停止请求打断的等待，返回是否已请求停止"""
+        # 已请求停止时不再等待，也不能清除唤醒事件（否则停止请求会丢失）
+        if self._stop_requested:
+            return True
+        self._wake_event.clear()
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        return self._stop_requested
+    
+    def _publish(self, bpm, rr_intervals=(), recv_ns=None):
+        """创建心率样本（打上时间戳和序号）并分发给所有订阅者，recv_ns为接收时间（默认为当前时间）"""
+        if recv_ns is None:
+            sample = HeartRateSample.now(self.device_id, self.sequence, bpm, rr_intervals)
+        else:
+            sample = HeartRateSample(recv_ns, time.time(), self.sequence, self.device_id, bpm, rr_intervals)
+        self.sequence += 1
+        self.sample_received.emit(sample)
+    
+    @abc.abstractmethod
+    async def monitor_heart_rate(self):
+        """数据源主循环，由子类实现（未实现的子类在创建时即报错）"""
+
+
+# 合成心率数据源
+class SyntheticHeartRateSource(HeartRateSource):
+    """
+    合成心率数据源，用于无蓝牙环境下的压力测试和长时间运行测试
+    支持可配置的发送频率、RR间期抖动、数据中断和异常值
+    """
+    
+    def __init__(self, service, device_id="SYNTHETIC", rate_hz=1.0, base_bpm=70,
+                 bpm_swing=15, rr_jitter_ms=30, dropout_probability=0.0,
+                 dropout_duration=5.0, artifact_probability=0.0, seed=None):
+        super().__init__(service, device_id, "合成数据")
+        self.rate_hz = rate_hz
+        self.base_bpm = base_bpm
+        self.bpm_swing = bpm_swing                      # 心率缓慢波动的幅度
+        self.rr_jitter_ms = rr_jitter_ms                # RR间期的高斯抖动（毫秒）
+        self.dropout_probability = dropout_probability  # 每个样本开始一次数据中断的概率
+        self.dropout_duration = dropout_duration        # 中断时长（秒）
+        self.artifact_probability = artifact_probability  # 每个样本变为异常值的概率
+        self.random = random.Random(seed)
+    
+    def next_sample(self, elapsed):
+        """生成一个样本：返回(心率, RR间期列表，单位1/1024秒)"""
+        bpm = self.base_bpm + self.bpm_swing * math.sin(elapsed / 60 * 2 * math.pi)
+        rr_ms = 60000 / bpm + self.random.gauss(0, self.rr_jitter_ms)
+        bpm = round(60000 / rr_ms)
+        if self.random.random() < self.artifact_probability:
+            # 异常值：模拟接触不良导致的跳变
+            bpm = self.random.choice((0, 30, 220, 255))
+        return bpm, [round(rr_ms * 1024 / 1000)]
+    
+    async def monitor_heart_rate(self):
+        self._wake_event = asyncio.Event()
+        self.connection_status.emit("设备连接成功")
+        self.connection_status.emit("开始心率监测")
+        self.monitoring_started.emit(self)
+        
+        interval = 1 / self.rate_hz
+        elapsed = 0.0
+        while not self._stop_requested:
+            if self.random.random() < self.dropout_probability:
+                self.stream_interrupted.emit(self.device_id)
+                if await self._sleep(self.dropout_duration):
+                    return
+                elapsed += self.dropout_duration
+                self.data_gap.emit(self.device_id, self.dropout_duration)
+            
+            bpm, rr_intervals = self.next_sample(elapsed)
+            self._publish(bpm, tuple(rr_intervals))
+            if await self._sleep(interval):
+                return
+            elapsed += interval
+
+
+# 会话回放数据源
+class ReplayHeartRateSource(HeartRateSource):
+    """
+    按原始时间间隔回放已记录的会话，支持1×到1000×速度
+    会话文件为CSV：每行 "相对时间(秒),心率,RR间期(以;分隔，可为空)"
+    """
+    MIN_SPEED = 1.0
+    MAX_SPEED = 1000.0
+    
+    def __init__(self, service, path, speed=1.0, loop=False):
+        super().__init__(service, f"REPLAY:{path}", "会话回放")
+        self.path = path
+        self.speed = max(self.MIN_SPEED, min(self.MAX_SPEED, speed))
+        self.loop = loop
+    
+    @staticmethod
+    def load_session(path):
+        """读取会话文件，返回[(相对时间, 心率, RR间期列表)]"""
+        samples = []
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                if not row or row[0].startswith("#"):
+                    continue
+                rr_intervals = [int(rr) for rr in row[2].split(";") if rr] if len(row) > 2 else []
+                samples.append((float(row[0]), int(row[1]), rr_intervals))
+        return samples
+    
+    async def monitor_heart_rate(self):
+        self._wake_event = asyncio.Event()
+        try:
+            samples = self.load_session(self.path)
+        except Exception as e:
+            self.error_occurred.emit(f"读取会话文件失败: {e}")
+            return
+        if not samples:
+            self.error_occurred.emit("会话文件为空")
+            return
+        
+        self.connection_status.emit("设备连接成功")
+        self.connection_status.emit("开始心率监测")
+        self.monitoring_started.emit(self)
+        
+        while True:
+            previous_time = samples[0][0]
+            for timestamp, bpm, rr_intervals in samples:
+                if await self._sleep((timestamp - previous_time) / self.speed):
+                    return
+                previous_time = timestamp
+                self._publish(bpm, tuple(rr_intervals))
+            if not self.loop:
+                break
+        self.connection_status.emit("回放结束")
+
+
+# 会话记录器
+class SessionRecorder:
+    """将心率样本按回放数据源的格式写入会话文件"""
+    
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.writer(self.file)
+        self.start_time = None
+    
+    def record(self, timestamp, bpm, rr_intervals=()):
+        if self.start_time is None:
+            self.start_time = timestamp
+        self.writer.writerow([f"{timestamp - self.start_time:.3f}", bpm, ";".join(str(rr) for rr in rr_intervals)])
+    
+    def close(self):
+        self.file.close()
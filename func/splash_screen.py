@@ -1,19 +1,22 @@
-import base64
 from io import BytesIO
-import win32gui
-import win32api
-import win32con
-import win32ui
-from PIL import Image, ImageWin
 
-# 从resources模块导入base64编码的资源
-from func.resources import STARTUP_PNG
+# 从资源包读取闪屏图片（不依赖Qt）
+from func.assets import read_asset
 
 def show_system_splash():
-    """创建win32gui系统级轻量闪屏（无QApp依赖，立即显示）"""
+    """创建win32gui系统级轻量闪屏（无QApp依赖，立即显示）；没有pywin32/PIL的平台上不显示闪屏"""
     try:
-        # 解码base64字符串
-        image_data = base64.b64decode(STARTUP_PNG)
+        import win32gui
+        import win32api
+        import win32con
+        import win32ui
+        from PIL import Image, ImageWin
+    except ImportError:
+        return None
+    
+    try:
+        # 读取资源包中的图片数据
+        image_data = read_asset("startup.png")
         # 创建BytesIO对象
         image_stream = BytesIO(image_data)
         # 加载图片
@@ -91,4 +94,5 @@ def show_system_splash():
 def close_system_splash(hwnd):
     """关闭系统级闪屏"""
     if hwnd:
+        import win32gui
         win32gui.DestroyWindow(hwnd)
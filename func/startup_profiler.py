@@ -0,0 +1,179 @@
+import builtins
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# 启用方式：命令行 --profile-startup=<输出文件> 优先，其次环境变量 HEARTRATE_PROFILE_STARTUP
+PROFILE_ARG = "--profile-startup="
+PROFILE_ENV = "HEARTRATE_PROFILE_STARTUP"
+
+
+def get_profile_path():
+    """读取启动时间线的输出文件路径，未启用时返回None"""
+    for arg in sys.argv[1:]:
+        if arg.startswith(PROFILE_ARG):
+            return arg[len(PROFILE_ARG):]
+    return os.environ.get(PROFILE_ENV) or None
+
+
+class StartupProfiler:
+    """
+    启动性能分析：记录模块导入、资源解码、控件创建、首次绘制和首个心率样本的时间线，
+    以Chrome Trace格式（chrome://tracing、Perfetto可直接打开）写入JSON文件
+    
+    模块导入通过替换builtins.__import__记录，只记录实际加载了新模块的导入（嵌套导入形成调用栈）；
+    收到首个心率样本后停止记录
+    """
+    
+    def __init__(self, output_path, start_time=None):
+        self.output_path = output_path
+        self.start_time = time.perf_counter() if start_time is None else start_time  # 时间线零点（进程启动）
+        self.events = []
+        self.milestones = {}  # 里程碑名称 -> 距启动的秒数
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.original_import = None
+        self.first_paint_filter = None
+    
+    def _timestamp(self, moment):
+        """perf_counter时刻 -> Chrome Trace时间戳（微秒）"""
+        return (moment - self.start_time) * 1e6
+    
+    def add_span(self, name, category, start, end, args=None):
+        """记录一段已完成的区间"""
+        event = {"name": name, "cat": category, "ph": "X", "pid": self.pid, "tid": threading.get_ident(),
+                 "ts": self._timestamp(start), "dur": (end - start) * 1e6}
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+    
+    @contextmanager
+    def span(self, name, category):
+        """记录with块的耗时"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, category, start, time.perf_counter())
+    
+    def mark(self, name, category="milestone"):
+        """记录里程碑（只记录第一次），返回距启动的秒数"""
+        now = time.perf_counter()
+        with self.lock:
+            if name in self.milestones:
+                return self.milestones[name]
+            self.milestones[name] = now - self.start_time
+            self.events.append({"name": name, "cat": category, "ph": "i", "s": "g", "pid": self.pid,
+                                "tid": threading.get_ident(), "ts": self._timestamp(now)})
+        return self.milestones[name]
+    
+    def install_import_hook(self):
+        """开始记录模块导入"""
+        if self.original_import is not None:
+            return
+        original_import = self.original_import = builtins.__import__
+        modules = sys.modules
+        
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level == 0 and name in modules:
+                return original_import(name, globals, locals, fromlist, level)
+            loaded = len(modules)
+            start = time.perf_counter()
+            try:
+                return original_import(name, globals, locals, fromlist, level)
+            finally:
+                if len(modules) != loaded:
+                    if level:
+                        # 相对导入记录为完整的模块名
+                        name = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+                    self.add_span(name, "import", start, time.perf_counter(), {"modules": len(modules) - loaded})
+        
+        builtins.__import__ = timed_import
+    
+    def uninstall_import_hook(self):
+        """停止记录模块导入"""
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+    
+    def watch_first_paint(self, widget):
+        """在控件第一次完成绘制时记录里程碑并写出时间线"""
+        from PyQt5.QtCore import QObject, QEvent, QTimer
+        
+        profiler = self
+        
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    # 绘制事件处理完毕后再记录
+                    QTimer.singleShot(0, profiler._on_first_paint)
+                return False
+        
+        self.first_paint_filter = FirstPaintFilter(widget)
+        widget.installEventFilter(self.first_paint_filter)
+    
+    def _on_first_paint(self):
+        elapsed = self.mark("first paint")
+        print(f"[Startup] 启动到主窗口首次绘制耗时: {elapsed:.3f} 秒")
+        self.dump()
+    
+    def finish(self):
+        """停止记录并写出时间线"""
+        self.uninstall_import_hook()
+        self.dump()
+    
+    def dump(self):
+        """将当前时间线写入输出文件（先写临时文件再替换，读取方不会读到写了一半的文件）"""
+        with self.lock:
+            trace = {
+                "traceEvents": list(self.events),
+                "displayTimeUnit": "ms",
+                "otherData": {"milestones": dict(self.milestones)},
+            }
+        temp_path = f"{self.output_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(trace, f, ensure_ascii=False)
+            os.replace(temp_path, self.output_path)
+        except OSError as e:
+            print(f"[Startup] 写入启动时间线失败: {e}")
+
+
+# 进程内的启动分析器（未启用时为None，以下函数均不做任何事）
+_profiler = None
+
+
+def start(output_path, start_time=None):
+    """启用启动分析并开始记录模块导入"""
+    global _profiler
+    _profiler = StartupProfiler(output_path, start_time)
+    _profiler.install_import_hook()
+    return _profiler
+
+
+def span(name, category):
+    """记录with块的耗时（未启用时不记录）"""
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.span(name, category)
+
+
+def mark(name, category="milestone"):
+    if _profiler is not None:
+        _profiler.mark(name, category)
+
+
+def watch_first_paint(widget):
+    if _profiler is not None:
+        _profiler.watch_first_paint(widget)
+
+
+def finish():
+    if _profiler is not None:
+        _profiler.finish()
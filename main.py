@@ -1,44 +1,44 @@
+import time
+
+# 记录进程启动时间，用于统计启动到首个心率样本的耗时
+APP_START_TIME = time.perf_counter()
+
+# 启动性能分析（--profile-startup=<输出文件> 或环境变量 HEARTRATE_PROFILE_STARTUP），需在导入其他模块之前启用
+from func import startup_profiler
+
+startup_profile_path = startup_profiler.get_profile_path()
+if startup_profile_path:
+    startup_profiler.start(startup_profile_path, APP_START_TIME)
+
 # 导入系统级闪屏模块
 from func.splash_screen import show_system_splash, close_system_splash
 
-system_splash_hwnd = show_system_splash()
+with startup_profiler.span("show_system_splash", "startup"):
+    system_splash_hwnd = show_system_splash()
 
 # 导入其他模块
+import os
 import sys
-import base64
-from io import BytesIO
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction
-from PyQt5.QtGui import QIcon, QPixmap
 from qfluentwidgets import (InfoBar, InfoBarPosition,FluentWindow, NavigationItemPosition,FluentIcon)
 
-# 导入base64编码的图标
-from func.icon import ICON_ICO
-
-# 从base64数据创建QIcon
-def get_icon_from_base64(base64_data):
-    """从base64编码数据创建QIcon"""
-    try:
-        # 解码base64字符串
-        icon_data = base64.b64decode(base64_data)
-        # 创建BytesIO对象
-        icon_stream = BytesIO(icon_data)
-        # 创建QPixmap
-        pixmap = QPixmap()
-        pixmap.loadFromData(icon_stream.getvalue())
-        # 创建QIcon
-        return QIcon(pixmap)
-    except Exception as e:
-        print(f"Error creating icon from base64: {e}")
-        return QIcon()
+# 资源包中的图标（首次使用时解码，窗口和托盘共用同一个QIcon）
+from func.assets import get_icon
 
-from func.core import HeartRateMonitorCore, DeviceScanThread, HeartRateMonitorThread
+from func.core import HeartRateMonitorCore, KnownDevice
+from func.sources import HeartRateSample
 from func.interfaces import HomeInterface, HeartRateInterface, WidgetsInterface, SettingsInterface
 from func.interfaces.heart_rate_window import HeartRateWindow
 from func.interfaces.close_confirmation_dialog import CloseConfirmationDialog
 from func.http_server import HeartRateHTTPServer
 from func.settings_manager import SettingsManager
 from func.memory_share import MemoryShareManager
+from func.session_store import SessionStore
+from func.render_scheduler import RenderScheduler
+from func.frame_clock import FrameClock
+from func.raster_renderer import RasterRenderer
+from func.interfaces.heart_rate_interface.dynamic_chart_model import DynamicChartModel
 
 # 主窗口类
 class HeartRateMonitorWindow(FluentWindow):
@@ -47,14 +47,18 @@ class HeartRateMonitorWindow(FluentWindow):
         self.setWindowTitle("心率监测器")
         self.resize(500, 400)  # 紧凑窗口大小
         self.setFixedSize(self.size())  # 固定窗口大小，使其不可调整
-        # 设置窗口图标（从base64资源）
-        self.setWindowIcon(get_icon_from_base64(ICON_ICO))
+        # 设置窗口图标（从资源包）
+        self.setWindowIcon(get_icon("icon.ico"))
         
         # 初始化设置管理器
         self.settings_manager = SettingsManager()
         
         # 初始化核心功能类
         self.core = HeartRateMonitorCore()
+        self.first_sample_received = False  # 是否已收到启动后的首个心率样本
+        self.last_sample_latency_ms = 0.0  # 最近一个样本从接收到界面处理完成的延迟
+        self.last_sequences = {}  # 设备ID -> 最近处理的样本序号（用于发现丢失的样本）
+        self.last_statuses = {}   # 设备ID -> 最近的连接状态（设备接替为主设备时恢复界面状态）
         self.user_disconnecting = False  # 标记用户是否正在主动断开连接
         self.is_disconnecting = False  # 标记是否正在执行断开连接操作，防止重复调用
         
@@ -65,11 +69,30 @@ class HeartRateMonitorWindow(FluentWindow):
         self.memory_share_manager = MemoryShareManager()
         self.memory_share_manager.initialize()
         
+        # 会话数据存储：主设备的所有样本只保存一份，供各图表和统计读取
+        self.session_store = SessionStore(self)
+        # 所有图表和仪表盘共用的帧时钟
+        FrameClock.shared().set_fps(self.settings_manager.get("render_fps", FrameClock.DEFAULT_FPS))
+        # 可选的后台栅格渲染：图表在工作线程中绘制到图像，GUI线程只贴图
+        self.raster_renderer = None
+        if self.settings_manager.get("threaded_rendering", False):
+            self.raster_renderer = RasterRenderer(self)
+            FrameClock.shared().set_raster_renderer(self.raster_renderer)
+        # 渲染调度器：图表不可见（切换页面、最小化、隐藏到托盘）或未连接设备时暂停刷新
+        self.render_scheduler = RenderScheduler(self)
+        # 动态折线图的数据模型：主窗口和独立心率窗口的折线图共享同一份滚动状态、Y轴范围和坐标
+        self.chart_model = DynamicChartModel(self.session_store, self)
+        
         # 创建界面实例
-        self.home_interface = HomeInterface(self)
-        self.heart_rate_interface = HeartRateInterface(self, self.settings_manager)
-        self.widgets_interface = WidgetsInterface(self)
-        self.settings_interface = SettingsInterface(self)
+        with startup_profiler.span("HomeInterface", "widget"):
+            self.home_interface = HomeInterface(self)
+        with startup_profiler.span("HeartRateInterface", "widget"):
+            self.heart_rate_interface = HeartRateInterface(self, self.settings_manager, self.session_store,
+                                                           self.render_scheduler, self.chart_model)
+        with startup_profiler.span("WidgetsInterface", "widget"):
+            self.widgets_interface = WidgetsInterface(self)
+        with startup_profiler.span("SettingsInterface", "widget"):
+            self.settings_interface = SettingsInterface(self)
         
         # 添加到导航栏
         self.addSubInterface(self.home_interface, FluentIcon.BLUETOOTH, "设备连接", NavigationItemPosition.TOP)
@@ -85,13 +108,20 @@ class HeartRateMonitorWindow(FluentWindow):
         # 初始化系统托盘图标
         self.init_tray_icon()
         
-        # 软件启动时自动执行一次设备扫描
-        QTimer.singleShot(600, self.start_scan)
+        # 指定了非蓝牙数据源（合成数据/会话回放）时直接使用该数据源，
+        # 否则软件启动时直接连接上次使用的设备（与后台扫描并行）
+        source_spec = get_source_spec()
+        if source_spec:
+            QTimer.singleShot(0, lambda: self.connect_source_spec(source_spec))
+        else:
+            QTimer.singleShot(0, self.connect_last_device)
+            # 软件启动时自动执行一次设备扫描
+            QTimer.singleShot(600, self.start_scan)
     
     def open_heart_rate_window(self):
         """打开独立的心率显示窗口"""
         if self.heart_rate_window is None:
-            self.heart_rate_window = HeartRateWindow(None)
+            self.heart_rate_window = HeartRateWindow(None, self.session_store, self.render_scheduler, self.chart_model)
             self.heart_rate_window.parent_window = self
         else:
             # 如果悬浮窗已存在，重新加载设置
@@ -115,19 +145,24 @@ class HeartRateMonitorWindow(FluentWindow):
         self.home_interface.progress_bar.hide()
         self.home_interface.indeterminate_bar.show()
         self.home_interface.indeterminate_bar.start()
-        self.core.scan_thread = DeviceScanThread()
-        self.core.scan_thread.scan_finished.connect(self.on_scan_finished)
-        self.core.scan_thread.scan_error.connect(self.on_scan_error)
-        self.core.scan_thread.start()
-        
-    def on_scan_finished(self, devices):        
-        self.core.devices = devices
+        # 清空上次的结果，扫描过程中逐个添加发现的设备
+        self.core.devices = []
         self.home_interface.combo_box.clear()
-        
+        scan_task = self.core.create_scan_task()
+        scan_task.device_found.connect(self.on_device_found)
+        scan_task.scan_finished.connect(self.on_scan_finished)
+        scan_task.scan_error.connect(self.on_scan_error)
+        scan_task.start()
+        
+    def on_device_found(self, device, rssi):
+        """扫描过程中发现心率设备时立即加入设备列表"""
+        self.core.devices.append(device)
+        device_name = device.name if device.name else "未知设备"
+        self.home_interface.combo_box.addItem(f"{device_name} ({device.address}) {rssi} dBm")
+        self.home_interface.connect_button.setEnabled(True)
+    
+    def on_scan_finished(self, devices):        
         if devices:
-            for device in devices:
-                device_name = device.name if device.name else "未知设备"
-                self.home_interface.combo_box.addItem(f"{device_name} ({device.address})")
             self.home_interface.connect_button.setEnabled(True)
             InfoBar.success(
                 title="扫描完成",
@@ -148,7 +183,7 @@ class HeartRateMonitorWindow(FluentWindow):
             self.home_interface.connect_button.setEnabled(False)
             InfoBar.warning(
                 title="未发现设备",
-                content="没有扫描到任何设备",
+                content="没有扫描到心率设备",
                 orient=Qt.Horizontal,
                 isClosable=True,
                 position=InfoBarPosition.TOP,
@@ -204,10 +239,10 @@ class HeartRateMonitorWindow(FluentWindow):
             return
         
         index = self.home_interface.combo_box.currentIndex()
-        self.core.selected_device = self.core.devices[index]
+        device = self.core.devices[index]
         
         # 检查设备是否支持
-        if not self.core.is_device_supported(self.core.selected_device):
+        if not self.core.is_device_supported(device):
             InfoBar.warning(
                 title="设备不支持",
                 content="请重新选择",
@@ -219,19 +254,157 @@ class HeartRateMonitorWindow(FluentWindow):
             )
             return
         
-        self.core.monitor_thread = HeartRateMonitorThread(self.core.selected_device)
-        self.core.monitor_thread.heart_rate_updated.connect(self.update_heart_rate)
-        self.core.monitor_thread.connection_status.connect(self.update_status)
-        self.core.monitor_thread.error_occurred.connect(self.on_monitor_error)
-        self.core.monitor_thread.start()
+        # 检查设备是否已连接
+        if self.core.is_device_monitored(device):
+            InfoBar.warning(
+                title="设备已连接",
+                content="该设备已在监测中",
+                orient=Qt.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=3000,
+                parent=self
+            )
+            return
         
-        self.home_interface.connect_button.setEnabled(False)
+        self.start_monitoring(device)
+    
+    def connect_last_device(self):
+        """按保存的地址直接连接上次使用的设备，跳过扫描和手动选择"""
+        if not self.settings_manager.get("auto_connect_last_device", True):
+            return
+        address = self.settings_manager.get("last_device_address")
+        if not address or self.core.monitor_task is not None:
+            return
+        device = KnownDevice(address, self.settings_manager.get("last_device_name"))
+        # 扫描到该设备时提前结束扫描
+        self.core.preferred_addresses.add(address.upper())
+        self.start_monitoring(device)
+    
+    def connect_source_spec(self, spec):
+        """按描述启动非蓝牙数据源（见HeartRateMonitorCore.create_source_from_spec）"""
+        try:
+            is_primary = self.core.monitor_task is None
+            source = self.core.create_source_from_spec(spec)
+        except Exception as e:
+            InfoBar.error(
+                title="数据源错误",
+                content=f"{e}",
+                orient=Qt.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=5000,
+                parent=self
+            )
+            return
+        self.attach_source(source, is_primary, KnownDevice(source.device_id, source.name))
+    
+    def start_monitoring(self, device):
+        """为蓝牙设备创建监测任务"""
+        is_primary = self.core.monitor_task is None
+        monitor_task = self.core.create_monitor_task(device)
+        self.attach_source(monitor_task, is_primary, device)
+    
+    def attach_source(self, monitor_task, is_primary, device):
+        """将数据源连接到各个输出并启动"""
+        # 主设备（core.monitor_task，最先连接且仍在监测的数据源）驱动界面显示和会话存储，其余设备只输出到HTTP和共享内存
+        # 所有数据源的信号连接相同，按设备ID分发，主设备被移除时下一个设备无需重新连接信号即可接替
+        device_id = monitor_task.device_id
+        monitor_task.sample_received.connect(self.on_sample_received)
+        if monitor_task.is_bluetooth:
+            monitor_task.monitoring_started.connect(self.on_monitoring_started)
+            monitor_task.device_not_found.connect(self.on_device_not_found)
+        monitor_task.stream_interrupted.connect(self.on_stream_interrupted)
+        monitor_task.data_gap.connect(self.on_data_gap)
+        monitor_task.connection_status.connect(
+            lambda status, device_id=device_id: self.on_connection_status(device_id, status))
+        monitor_task.error_occurred.connect(lambda error, device_id=device_id: self.on_task_error(device_id, error))
+        if is_primary:
+            self.core.selected_device = device
+        monitor_task.start()
+        
+        # 保持连接按钮可用，以便继续连接其他设备
         self.home_interface.disconnect_button.setEnabled(True)
         self.home_interface.scan_button.setEnabled(False)
         
         # 自动切换到心率显示界面
-        self.stackedWidget.setCurrentWidget(self.heart_rate_interface)
+        if is_primary:
+            self.stackedWidget.setCurrentWidget(self.heart_rate_interface)
+    
+    def on_monitoring_started(self, device):
+        """设备开始推送心率后记住该设备，下次启动直接连接"""
+        self.settings_manager.set("last_device_address", device.address)
+        if device.name:
+            self.settings_manager.set("last_device_name", device.name)
 
+    def is_primary(self, device_id):
+        """设备是否为当前的主设备"""
+        task = self.core.monitor_task
+        return task is not None and task.device_id == device_id
+    
+    def on_sample_received(self, sample):
+        """分发一个样本：所有设备输出到HTTP和共享内存，主设备同时更新界面和会话存储"""
+        # 设备移除后仍在队列中的样本直接丢弃，不再重新写入各输出
+        if sample.device_id not in self.core.monitor_tasks:
+            return
+        self.update_device_heart_rate(sample)
+        if self.is_primary(sample.device_id):
+            self.update_heart_rate(sample)
+    
+    def on_connection_status(self, device_id, status):
+        self.last_statuses[device_id] = status
+        if self.is_primary(device_id):
+            self.update_status(status)
+    
+    def on_task_error(self, device_id, error):
+        """数据源出现不可恢复的错误：只移除出错的设备，其他设备继续监测（主设备出错时由下一个设备接替）"""
+        if device_id not in self.core.monitor_tasks:
+            return
+        if len(self.core.monitor_tasks) == 1:
+            # 唯一的设备出错：按断开连接处理，回到设备连接界面
+            self.on_monitor_error(error)
+        else:
+            self.on_device_error(device_id, error)
+    
+    def remove_monitor_task(self, device_id):
+        """
+        停止并移除一个设备，其他设备继续监测
+        移除的是主设备时由下一个设备接替：界面和会话存储改为显示该设备，没有其他设备时恢复为未连接状态
+        """
+        was_primary = self.is_primary(device_id)
+        self.core.stop_monitor_task(device_id)
+        self.http_server.remove_device(device_id)
+        self.memory_share_manager.remove_device(device_id)
+        self.last_sequences.pop(device_id, None)
+        self.last_statuses.pop(device_id, None)
+        if was_primary:
+            self._promote_primary()
+    
+    def _promote_primary(self):
+        """主设备被移除后，由下一个设备接替为主设备"""
+        task = self.core.monitor_task
+        if task is None:
+            self.core.selected_device = None
+            self.home_interface.disconnect_button.setEnabled(False)
+            # 启动扫描仍在进行时由扫描结束恢复扫描按钮
+            if self.core.scan_task is None or not self.core.scan_task.isRunning():
+                self.home_interface.scan_button.setEnabled(True)
+            self.update_status("已断开连接")
+            return
+        
+        self.core.selected_device = getattr(task, "device", None) or KnownDevice(task.device_id, task.name)
+        # 会话存储中换为另一个设备的数据流，图表在此断开折线
+        self.session_store.mark_gap()
+        # 恢复新主设备的连接状态（已在推送数据时按连接成功处理，以更新设备名称并恢复图表刷新）
+        status = self.last_statuses.get(task.device_id)
+        if status in ("设备连接成功", "开始心率监测"):
+            self.update_status("设备连接成功")
+        else:
+            self.update_status("已断开连接")
+            if status:
+                self.update_status(status)
+        print(f"[Monitor] 主设备已切换为 {task.device_id}")
+    
     def on_monitor_error(self, error):
         # 如果是用户主动断开连接，不显示提示
         if not self.user_disconnecting:
@@ -246,18 +419,94 @@ class HeartRateMonitorWindow(FluentWindow):
             )
         self.disconnect_device()
     
-    # 更新心率数值
-    def update_heart_rate(self, heart_rate):
-        self.heart_rate_interface.update_heart_rate(heart_rate)
+    def on_device_not_found(self, device_id):
+        """按保存的地址未找到设备：放弃该设备，回到设备列表由用户从扫描结果中选择"""
+        if device_id not in self.core.monitor_tasks:
+            return
+        self.remove_monitor_task(device_id)
+        InfoBar.warning(
+            title="未找到设备",
+            content="未找到上次使用的设备，请从扫描结果中选择设备",
+            orient=Qt.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP,
+            duration=5000,
+            parent=self
+        )
+        # 其他设备仍在监测时停留在当前界面；否则回到设备列表，列表为空且未在扫描时重新扫描
+        if self.core.monitor_tasks:
+            return
+        self.stackedWidget.setCurrentWidget(self.home_interface)
+        if not self.core.devices and (self.core.scan_task is None or not self.core.scan_task.isRunning()):
+            self.start_scan()
+    
+    def on_stream_interrupted(self, device_id):
+        """
+        数据流中断（正在自动重连）：输出标记为缺失数据，而不是写入0或保留中断前的心率；
+        主设备的中断记录到会话存储，图表在此断开折线，不再沿用中断前的值
+        """
+        if self.is_primary(device_id):
+            self.session_store.mark_gap()
+            self.http_server.update_heart_rate(None)
+            self.memory_share_manager.invalidate_heart_rate()
+        self.http_server.update_device_heart_rate(device_id, None)
+        self.memory_share_manager.invalidate_device_heart_rate(device_id)
+    
+    def on_data_gap(self, device_id, downtime):
+        """数据恢复，打印缺失时段（中断已在on_stream_interrupted中记录到会话存储和各输出）"""
+        print(f"[Supervisor] {device_id} 缺失数据 {downtime:.1f} 秒，重连统计: {self.core.get_reconnect_metrics().get(device_id)}")
+    
+    def on_device_error(self, device_id, error):
+        """设备出错时只移除该设备，不影响其他设备"""
+        if device_id not in self.core.monitor_tasks:
+            return
+        self.remove_monitor_task(device_id)
+        InfoBar.info(
+            title="设备已断开",
+            content=f"{device_id}: {error}",
+            orient=Qt.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP,
+            duration=4000,
+            parent=self
+        )
+    
+    # 更新心率数值（主设备样本）
+    def update_heart_rate(self, sample):
+        if not self.first_sample_received and sample.bpm > 0:
+            self.first_sample_received = True
+            print(f"[Startup] 启动到首个心率样本耗时: {time.perf_counter() - APP_START_TIME:.3f} 秒")
+            startup_profiler.mark("first sample")
+            startup_profiler.finish()
+        # 写入会话存储（包括0值），各图表在刷新时读取
+        self.session_store.append(sample)
+        self.heart_rate_interface.update_heart_rate(sample)
         if self.heart_rate_window:
-            self.heart_rate_window.update_heart_rate(heart_rate)
+            self.heart_rate_window.update_heart_rate(sample)
         # 更新 HTTP 服务器的心率数据
-        self.http_server.update_heart_rate(heart_rate)
+        self.http_server.update_heart_rate(sample.bpm)
         # 更新共享内存的心率数据
-        self.memory_share_manager.update_heart_rate(heart_rate)
+        self.memory_share_manager.update_heart_rate(sample)
+        # 端到端延迟：从采集到界面处理完成
+        self.last_sample_latency_ms = sample.latency_ns() / 1e6
+    
+    # 更新指定设备的心率数值（多设备输出）
+    def update_device_heart_rate(self, sample):
+        # 序号不连续说明中间有样本丢失
+        last_seq = self.last_sequences.get(sample.device_id)
+        if last_seq is not None and sample.seq != last_seq + 1:
+            print(f"[Pipeline] {sample.device_id} 丢失 {sample.seq - last_seq - 1} 个样本（序号 {last_seq} -> {sample.seq}）")
+        self.last_sequences[sample.device_id] = sample.seq
+        self.http_server.update_device_heart_rate(sample.device_id, sample.bpm)
+        self.memory_share_manager.update_device_heart_rate(sample)
 
     # 更新状态信息
     def update_status(self, status):
+        # 连接成功后图表开始刷新，断开后空闲
+        if "设备连接成功" in status:
+            self.render_scheduler.set_connected(True)
+        elif "已断开连接" in status:
+            self.render_scheduler.set_connected(False)
         # 同时更新两个界面的状态显示
         self.heart_rate_interface.update_status(status)
         if self.heart_rate_window:
@@ -273,7 +522,7 @@ class HeartRateMonitorWindow(FluentWindow):
             return
         
         # 如果已经断开连接且没有正在断开，直接返回
-        if not self.core.monitor_thread and not self.user_disconnecting:
+        if not self.core.monitor_task and not self.user_disconnecting:
             print("[DEBUG] Already disconnected, skipping")
             return
             
@@ -281,16 +530,19 @@ class HeartRateMonitorWindow(FluentWindow):
         self.is_disconnecting = True
         self.user_disconnecting = True
         
-        if self.core.monitor_thread:
-            self.core.monitor_thread.stop()
-            self.core.monitor_thread.wait()
-            self.core.monitor_thread = None
+        # 停止所有设备的监测
+        for device_id in list(self.core.monitor_tasks):
+            self.http_server.remove_device(device_id)
+            self.memory_share_manager.remove_device(device_id)
+        self.core.stop_all_monitor_tasks()
         
         self.home_interface.connect_button.setEnabled(True)
         self.home_interface.disconnect_button.setEnabled(False)
         self.home_interface.scan_button.setEnabled(True)
         self.update_status("已断开连接")
-        self.update_heart_rate(0)
+        self.last_sequences.clear()
+        self.last_statuses.clear()
+        self.update_heart_rate(HeartRateSample.now(None, -1, 0))
         
         # 显示友好的断开连接提示
         InfoBar.info(
@@ -315,8 +567,8 @@ class HeartRateMonitorWindow(FluentWindow):
         # 创建托盘图标
         self.tray_icon = QSystemTrayIcon(self)
         
-        # 设置托盘图标（从base64资源）
-        self.tray_icon.setIcon(get_icon_from_base64(ICON_ICO))
+        # 设置托盘图标（从资源包，与窗口图标共用缓存）
+        self.tray_icon.setIcon(get_icon("icon.ico"))
         
         # 创建菜单
         self.tray_menu = QMenu(self)
@@ -356,10 +608,17 @@ class HeartRateMonitorWindow(FluentWindow):
         if self.heart_rate_window:
             self.close_heart_rate_window()
         
-        if self.core.monitor_thread:
-            self.core.monitor_thread.stop()
-            self.core.monitor_thread.wait()
-            self.core.monitor_thread = None
+        # 停止所有设备的监测和BLE服务线程
+        self.core.cleanup()
+        
+        # 输出帧时钟统计（迟到帧和丢帧）
+        print(f"[FrameClock] {FrameClock.shared().stats.as_dict()}")
+        
+        # 停止后台渲染线程并输出渲染统计（渲染耗时和排队延迟）
+        if self.raster_renderer is not None:
+            FrameClock.shared().set_raster_renderer(None)
+            self.raster_renderer.shutdown()
+            print(f"[RasterRenderer] {self.raster_renderer.stats.as_dict()}")
         
         self.http_server.stop()
         
@@ -441,12 +700,23 @@ class HeartRateMonitorWindow(FluentWindow):
             parent=self
         )
 
+def get_source_spec():
+    """读取非蓝牙数据源描述：命令行 --source=<描述> 优先，其次环境变量 HEARTRATE_SOURCE"""
+    for arg in sys.argv[1:]:
+        if arg.startswith("--source="):
+            return arg[len("--source="):]
+    return os.environ.get("HEARTRATE_SOURCE")
+
 # 主函数
 def main():
-    app = QApplication(sys.argv)
+    with startup_profiler.span("QApplication", "startup"):
+        app = QApplication(sys.argv)
     # 创建并显示主窗口
-    window = HeartRateMonitorWindow()
-    window.show()
+    with startup_profiler.span("HeartRateMonitorWindow", "widget"):
+        window = HeartRateMonitorWindow()
+    startup_profiler.watch_first_paint(window)
+    with startup_profiler.span("show", "widget"):
+        window.show()
     
     # 关闭系统闪屏
     close_system_splash(system_splash_hwnd)